@@ -75,14 +75,43 @@ WSGI_APPLICATION = 'aokeri.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/1.10/ref/settings/#databases
 
+# aokeri.sqlite is the sqlite3 backend with BEGIN IMMEDIATE transactions,
+# so concurrent actions on a game run one at a time
 DATABASES = {
     'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
+        'ENGINE': 'aokeri.sqlite',
         'NAME': os.path.join(BASE_DIR, 'db.sqlite3'),
+        'OPTIONS': {
+            # seconds to wait for another transaction's write lock
+            'timeout': 20,
+        },
     }
 }
 
 
+
+# Caches
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+
+# main.snapshots keeps the /player_info/ responses in "snapshots", which
+# has to be shared by every worker process serving the app. Files are,
+# for workers on one host like the sqlite database. A memcached or redis
+# backend shared by every host works as well.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'snapshots': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.path.join(BASE_DIR, 'snapshots'),
+        # seconds a snapshot is kept, whatever the game's version
+        'TIMEOUT': 300,
+        'OPTIONS': {
+            'MAX_ENTRIES': 10000,
+        },
+    },
+}
+
 # Password validation
 # https://docs.djangoproject.com/en/1.10/ref/settings/#auth-password-validators
 
@@ -111,8 +140,6 @@ TIME_ZONE = 'UTC'
 
 USE_I18N = True
 
-USE_L10N = True
-
 USE_TZ = True
 
 
@@ -120,3 +147,5 @@ USE_TZ = True
 # https://docs.djangoproject.com/en/1.10/howto/static-files/
 
 STATIC_URL = '/static/'
+
+DEFAULT_AUTO_FIELD = 'django.db.models.AutoField'
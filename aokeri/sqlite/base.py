@@ -0,0 +1,16 @@
+"""
+SQLite with transactions that take the write lock as they begin.
+
+SQLite has no row locks, so select_for_update does nothing on it, and
+two transactions that read before they write can both read the same
+Game. BEGIN IMMEDIATE takes the database write lock up front, so
+atomic blocks run one at a time, as if every row they read had been
+locked with select_for_update. (Django 5.1 has this built in as the
+"transaction_mode" option.)
+"""
+from django.db.backends.sqlite3 import base
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    def _start_transaction_under_autocommit(self):
+        self.cursor().execute("BEGIN IMMEDIATE")
@@ -1,7 +1,7 @@
-from django.conf.urls import url, include
 from django.contrib import admin
+from django.urls import include, re_path
 
 urlpatterns = [
-    url(r'^foo/', admin.site.urls),
-    url(r'^', include('main.urls')),
+    re_path(r'^foo/', admin.site.urls),
+    re_path(r'^', include('main.urls')),
 ]
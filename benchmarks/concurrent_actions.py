@@ -0,0 +1,113 @@
+"""
+Load test of the action endpoints: many games played at once, each by
+two bots per seat sending the same actions concurrently, like a bot
+that retries. WORKERS requests are served at a time, as by a server's
+worker pool.
+
+Every action that succeeds passes the turn, so for each game the
+number of successful actions has to match the turn it ends on, and
+the chips have to add up to what the game started with. A lost update
+(two requests acting on the same state) breaks one or the other.
+
+Runs against a fresh SQLite database and snapshot cache in a temporary
+directory, not db.sqlite3. Run from the repository root:
+    python -m benchmarks.concurrent_actions [games] [attempts]
+"""
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "aokeri.settings")
+
+BOTS_PER_SEAT = 2
+WORKERS = 16
+STACK = 1000
+BET_SIZE = 10
+
+
+def bot(game_id, player_id, attempts, successes, lock, workers):
+    """
+    Call if there's a bet to call, otherwise bet, attempts times.
+    """
+    from django.db import connection
+    from django.test import Client
+    client = Client()
+    query = "?game_id=%d&player_id=%d" % (game_id, player_id)
+
+    def get(path, extra=""):
+        with workers:
+            return client.get(path + query + extra).json()
+
+    try:
+        for _ in range(attempts):
+            data = get("/call/")
+            if data.get("no_bet_to_call"):
+                data = get("/bet/", "&bet_size=%d" % BET_SIZE)
+            if "new_pot_size" in data or data.get("end_hand"):
+                with lock:
+                    successes[game_id] += 1
+            else:
+                # not our turn, let the other seat act
+                time.sleep(0.001)
+    finally:
+        connection.close()
+
+
+def main():
+    games = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    attempts = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+
+    directory = tempfile.mkdtemp()
+    try:
+        from django.conf import settings
+        settings.DATABASES["default"]["NAME"] = os.path.join(directory, "load_test.sqlite3")
+        settings.CACHES["snapshots"]["LOCATION"] = os.path.join(directory, "snapshots")
+        import django
+        django.setup()
+        from django.core.management import call_command
+        from django.test.utils import setup_test_environment
+        setup_test_environment()
+        call_command("migrate", verbosity=0)
+
+        from django.test import Client
+        from main.models import Game, Player
+        client = Client()
+        seats = {}
+        for _ in range(games):
+            data = client.get("/start/").json()
+            seats[data["game_id"]] = (data["player_one_id"], data["player_two_id"])
+
+        successes = dict((game_id, 0) for game_id in seats)
+        lock = threading.Lock()
+        workers = threading.BoundedSemaphore(WORKERS)
+        threads = [
+            threading.Thread(target=bot, args=(game_id, player_id, attempts, successes, lock, workers))
+            for game_id, player_ids in seats.items()
+            for player_id in player_ids
+            for _ in range(BOTS_PER_SEAT)]
+        start = time.time()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        seconds = time.time() - start
+
+        lost = 0
+        for game in Game.objects.filter(id__in=seats):
+            stacks = sum(player.stack for player in Player.objects.filter(current_game=game))
+            turn = 1 + successes[game.id] % 2
+            if stacks + game.current_pot != 2 * STACK or game.players_turn != turn:
+                lost += 1
+        actions = sum(successes.values())
+        print("%d games, %d bots, %d workers, %d actions in %.1fs (%.0f actions/s)" % (
+            games, len(threads), WORKERS, actions, seconds, actions / seconds))
+        print("games with lost updates: %d" % lost)
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
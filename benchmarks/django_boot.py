@@ -0,0 +1,62 @@
+"""
+Time and peak memory of booting the Django app (django.setup() plus
+importing the URLconf, which imports the views, models and evaluator)
+in a fresh process, with the lookup tables left lazy, with all of them
+loaded eagerly, and with only what a river showdown needs.
+
+Run from the repository root:
+    python -m benchmarks.django_boot [runs]
+"""
+import json
+import subprocess
+import sys
+
+BOOT = """
+import json, os, resource, sys, time
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'aokeri.settings')
+start = time.time()
+import django
+django.setup()
+import aokeri.urls
+from pokereval.lookup_tables import LookupTables
+%s
+seconds = time.time() - start
+sys.stdout.write(json.dumps({
+    'seconds': seconds,
+    'maxrss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    'loaded': sorted(name for name in ('Two', 'Five', 'Six', 'Seven') if name in vars(LookupTables)),
+}))
+"""
+
+CASES = (
+    ("lazy", ""),
+    ("eager", "LookupTables.load_all()"),
+    ("lazy + river showdown", """
+from pokereval.card import Card
+from pokereval.hand_evaluator import HandEvaluator
+HandEvaluator.evaluate_showdown(
+    [[Card(14, 1), Card(14, 2)], [Card(13, 1), Card(13, 2)]],
+    [Card(2, 3), Card(7, 4), Card(9, 1), Card(11, 2), Card(4, 4)])
+"""),
+)
+
+
+def boot(code):
+    output = subprocess.check_output([sys.executable, "-c", BOOT % code])
+    return json.loads(output.decode("ascii"))
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    print("%-24s %9s %12s  %s" % ("", "boot ms", "max RSS", "tables loaded"))
+    for name, code in CASES:
+        results = [boot(code) for _ in range(runs)]
+        print("%-24s %9.1f %9d kB  %s" % (
+            name,
+            min(result["seconds"] for result in results) * 1000,
+            min(result["maxrss_kb"] for result in results),
+            ", ".join(results[0]["loaded"]) or "-"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,245 @@
+"""
+Hands per second of the HandEvaluator entry points over fixed-seed
+corpora of each hand category, as JSON so runs can be compared across
+commits. The categories take different branches (flush table, unique
+ranks, the popcount cases for pairs), so each category gets its own
+corpus of 5, 6 and 7-card hands and its own result.
+
+Timed:
+- Five/Six/Seven.evaluate_rank, one hand at a time
+- Five/Six/Seven.evaluate_batch and classify_batch, when numpy is installed
+- SevenCardRankTable evaluate_rank and evaluate_batch, when the table is built
+- evaluate_showdown, the hand as hole cards and board against a second
+  pair of hole cards
+- main.cards.winning_hand, the same showdowns with the cards encoded
+  as the app stores them
+- evaluate_hand, on a smaller corpus as it ranks every opponent hand
+
+Run from the repository root:
+    python -m benchmarks.evaluator [--hands N] [--output results.json]
+"""
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import timeit
+
+from pokereval.classify import (CATEGORY_NAMES, FLUSH, FOUR_OF_A_KIND, FULL_HOUSE, RANK_TO_CATEGORY,
+                                STRAIGHT, STRAIGHT_FLUSH, THREE_OF_A_KIND, classify_batch)
+from pokereval.hand_evaluator import HandEvaluator
+from pokereval.lookup_tables import LookupTables
+from pokereval.rank_table import DEFAULT_PATH, SevenCardRankTable
+from main.cards import CODE_CARDS, encode_cards, winning_hand
+
+SEED = 2017
+HANDS = 2000
+# evaluate_hand ranks every opponent hand, so takes milliseconds a call
+EVALUATE_HAND_HANDS = 20
+REPEAT = 3
+LENGTHS = (5, 6, 7)
+
+
+def seed_cards(category, rng):
+    """
+    Card values that make the category, to deal the rest of a hand
+    around. Categories common enough to deal at random get none.
+    """
+    suit = rng.randrange(4)
+    if category in (STRAIGHT_FLUSH, STRAIGHT):
+        # low 0 is the wheel, A2345
+        low = rng.randrange(10)
+        ranks = [(low - 1 + i) % 13 for i in range(5)]
+        if category == STRAIGHT_FLUSH:
+            return [rank * 4 + suit for rank in ranks]
+        return [rank * 4 + rng.randrange(4) for rank in ranks]
+    if category == FOUR_OF_A_KIND:
+        rank = rng.randrange(13)
+        return [rank * 4 + s for s in range(4)]
+    if category == FULL_HOUSE:
+        trips, pair = rng.sample(range(13), 2)
+        return ([trips * 4 + s for s in rng.sample(range(4), 3)] +
+                [pair * 4 + s for s in rng.sample(range(4), 2)])
+    if category == FLUSH:
+        return [rank * 4 + suit for rank in rng.sample(range(13), 5)]
+    if category == THREE_OF_A_KIND:
+        rank = rng.randrange(13)
+        return [rank * 4 + s for s in rng.sample(range(4), 3)]
+    return []
+
+
+def corpus(length, category, count, seed=SEED):
+    """
+    Return count hands of length cards whose best 5 cards are of this
+    category, the same hands for the same arguments.
+    """
+    rng = random.Random("%d-%d-%d" % (seed, length, category))
+    deck = sorted(LookupTables.deck)
+    evaluate_rank = HandEvaluator.evaluator_for_length(length).evaluate_rank
+    hands = []
+    while len(hands) < count:
+        values = seed_cards(category, rng)
+        values += rng.sample(sorted(set(range(52)) - set(values)), length - len(values))
+        rng.shuffle(values)
+        hand = [deck[value] for value in values]
+        if RANK_TO_CATEGORY[evaluate_rank(hand)] == category:
+            hands.append(hand)
+    return hands
+
+
+def opponents(hands, seed=SEED):
+    """
+    A second pair of hole cards for each hand, from the cards left.
+    """
+    rng = random.Random(seed)
+    deck = sorted(LookupTables.deck)
+    return [rng.sample([card for card in deck if card not in hand], 2) for hand in hands]
+
+
+def timed(run):
+    return min(timeit.repeat(run, repeat=REPEAT, number=1))
+
+
+def scalar(evaluate):
+    def bench(hands):
+        def run():
+            for hand in hands:
+                evaluate(hand)
+        return timed(run)
+    return bench
+
+
+def batch(evaluate_batch):
+    def bench(hands):
+        import numpy as np
+        cards = np.array(hands, dtype=np.intp)
+        return timed(lambda: evaluate_batch(cards))
+    return bench
+
+
+def showdown(hands):
+    others = opponents(hands)
+    def run():
+        for hand, other in zip(hands, others):
+            HandEvaluator.evaluate_showdown([hand[:2], other], hand[2:])
+    return timed(run)
+
+
+def app_showdown(hands):
+    def encode(cards):
+        return encode_cards([CODE_CARDS[int(card) + 1] for card in cards])
+    showdowns = [(encode(hand[:2]), encode(other), encode(hand[2:]))
+                 for hand, other in zip(hands, opponents(hands))]
+    def run():
+        for hand_one, hand_two, board in showdowns:
+            winning_hand(hand_one, hand_two, board)
+    return timed(run)
+
+
+def evaluate_hand(hands):
+    def run():
+        for hand in hands:
+            HandEvaluator.evaluate_hand(hand[:2], hand[2:])
+    return timed(run)
+
+
+def classify(hands):
+    import numpy as np
+    cards = np.array(hands, dtype=np.intp)
+    return timed(lambda: classify_batch(cards[:, :2], cards[:, 2:]))
+
+
+def cases(count, has_numpy, rank_table):
+    """
+    Return (name, lengths, bench, hands per category) for each entry point.
+    """
+    found = []
+    for length in LENGTHS:
+        evaluator = HandEvaluator.evaluator_for_length(length)
+        name = evaluator.__name__
+        found.append(("%s.evaluate_rank" % name, (length,), scalar(evaluator.evaluate_rank), count))
+        if has_numpy:
+            found.append(("%s.evaluate_batch" % name, (length,), batch(evaluator.evaluate_batch), count))
+    if rank_table is not None:
+        found.append(("SevenCardRankTable.evaluate_rank", (7,), scalar(rank_table.evaluate_rank), count))
+        if has_numpy:
+            found.append(("SevenCardRankTable.evaluate_batch", (7,), batch(rank_table.evaluate_batch), count))
+    found.append(("evaluate_showdown", LENGTHS, showdown, count))
+    found.append(("winning_hand", LENGTHS, app_showdown, count))
+    found.append(("evaluate_hand", LENGTHS, evaluate_hand, min(count, EVALUATE_HAND_HANDS)))
+    if has_numpy:
+        found.append(("classify_batch", LENGTHS, classify, count))
+    return found
+
+
+def git_commit():
+    try:
+        with open(os.devnull, "w") as devnull:
+            return subprocess.check_output(["git", "rev-parse", "HEAD"], stderr=devnull).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    args = sys.argv[1:]
+    count = HANDS
+    output = None
+    if "--hands" in args:
+        position = args.index("--hands")
+        count = int(args[position + 1])
+        del args[position:position + 2]
+    if "--output" in args:
+        position = args.index("--output")
+        output = args[position + 1]
+        del args[position:position + 2]
+
+    LookupTables.load_all()
+    try:
+        import numpy
+        numpy_version = numpy.__version__
+    except ImportError:
+        numpy_version = None
+    rank_table = SevenCardRankTable(DEFAULT_PATH) if os.path.exists(DEFAULT_PATH) else None
+
+    corpora = {}
+    for length in LENGTHS:
+        for category in range(len(CATEGORY_NAMES)):
+            corpora[length, category] = corpus(length, category, count)
+
+    results = []
+    for name, lengths, bench, case_count in cases(count, numpy_version is not None, rank_table):
+        for length in lengths:
+            for category, category_name in enumerate(CATEGORY_NAMES):
+                hands = corpora[length, category][:case_count]
+                seconds = bench(hands)
+                results.append({
+                    "function": name,
+                    "cards": length,
+                    "category": category_name,
+                    "hands": len(hands),
+                    "seconds": seconds,
+                    "hands_per_second": len(hands) / seconds,
+                })
+            sys.stderr.write("%s, %d cards\n" % (name, length))
+
+    report = {
+        "commit": git_commit(),
+        "date": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "python": "%s %s" % (platform.python_implementation(), platform.python_version()),
+        "numpy": numpy_version,
+        "seed": SEED,
+        "repeat": REPEAT,
+        "results": results,
+    }
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if output:
+        with open(output, "w") as out:
+            out.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
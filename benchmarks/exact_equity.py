@@ -0,0 +1,28 @@
+"""
+Time exact heads-up equity of all 1,326 hole card pairs on a fixed
+turn board and on a fixed river board.
+
+Run from the repository root:
+    python -m benchmarks.exact_equity
+"""
+import timeit
+from itertools import combinations
+
+from pokereval.card import Card
+from pokereval.equity import enumerate_equities
+
+TURN = [Card(14, 1), Card(9, 2), Card(6, 1), Card(2, 3)]
+RIVER = TURN + [Card(13, 4)]
+
+
+def main():
+    for name, board in (("turn", TURN), ("river", RIVER)):
+        seconds = min(timeit.repeat(lambda: enumerate_equities(board), repeat=3, number=1))
+        equities = enumerate_equities(board)
+        hands = [hand for hand in combinations(range(52), 2) if not set(hand) & set(board)]
+        showdowns = sum(equities.result(hand).iterations for hand in hands)
+        print("%-5s %s: %d hands, %d showdowns in %.3fs" % (name, board, len(hands), showdowns, seconds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Time the pure Python evaluator loops, to compare interpreters on the
+same code. Runs on Python 2.7 and 3, prints one line per loop.
+
+Run from the repository root with each interpreter:
+    python -m benchmarks.interpreter
+"""
+import platform
+import random
+import timeit
+
+from pokereval.hand_evaluator import HandEvaluator
+from pokereval.lookup_tables import LookupTables
+from pokereval.popcount import PopCount
+
+SEED = 2017
+HANDS = 20000
+
+
+def sample(rng, deck, length):
+    """
+    random.sample picks differently on Python 2 and 3, but random() is
+    the same, so draw with it to time the same hands on both.
+    """
+    deck = list(deck)
+    for i in range(length):
+        j = i + int(rng.random() * (len(deck) - i))
+        deck[i], deck[j] = deck[j], deck[i]
+    return deck[:length]
+
+
+def deals(length, count=HANDS, seed=SEED):
+    rng = random.Random(seed)
+    deck = sorted(LookupTables.deck)
+    return [sample(rng, deck, length) for _ in range(count)]
+
+
+def per_call(run, calls):
+    return min(timeit.repeat(run, repeat=5, number=1)) / calls
+
+
+def main():
+    LookupTables.load_all()
+    loops = []
+    for length, evaluator in ((5, HandEvaluator.Five), (6, HandEvaluator.Six), (7, HandEvaluator.Seven)):
+        hands = deals(length)
+
+        def run(hands=hands, evaluate_rank=evaluator.evaluate_rank):
+            for hand in hands:
+                evaluate_rank(hand)
+        loops.append(("%s.evaluate_rank" % evaluator.__name__, per_call(run, len(hands))))
+
+    showdowns = deals(9, 5000)
+
+    def run_showdowns():
+        for cards in showdowns:
+            HandEvaluator.evaluate_showdown([cards[:2], cards[2:4]], cards[4:])
+    loops.append(("evaluate_showdown", per_call(run_showdowns, len(showdowns))))
+
+    flops = deals(5, 20)
+
+    def run_evaluate_hand():
+        for cards in flops:
+            HandEvaluator.evaluate_hand(cards[:2], cards[2:])
+    loops.append(("evaluate_hand (flop)", per_call(run_evaluate_hand, len(flops))))
+
+    rng = random.Random(SEED)
+    values = [int(rng.random() * 8192) for _ in range(HANDS)]
+
+    def run_popcount():
+        for value in values:
+            PopCount.popcount(value)
+    loops.append(("PopCount.popcount", per_call(run_popcount, len(values))))
+
+    print("%s %s" % (platform.python_implementation(), platform.python_version()))
+    for name, seconds in loops:
+        print("%-24s %10.2f us" % (name, seconds * 1e6))
+
+
+if __name__ == "__main__":
+    main()
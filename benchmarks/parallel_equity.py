@@ -0,0 +1,42 @@
+"""
+Time EquityPool.equity with 1 to N worker processes on the same
+seeded problem, against plain equity in this process, to see how it
+scales with cores. Every pool line must print the same equity.
+
+Run from the repository root:
+    python -m benchmarks.parallel_equity [iterations]
+"""
+import multiprocessing
+import sys
+import time
+
+from pokereval.card import Card
+from pokereval.equity import EquityPool, equity
+
+HOLE_CARDS = [Card(14, 1), Card(13, 1)]
+BOARD = [Card(12, 1), Card(7, 2), Card(2, 3)]
+N_OPPONENTS = 2
+SEED = 1234
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000000
+    start = time.time()
+    result = equity(HOLE_CARDS, BOARD, N_OPPONENTS, iterations, seed=SEED)
+    single = time.time() - start
+    print("in process:  %.2fs  %.0f trials/s  equity %.5f" % (single, iterations / single, result.equity))
+
+    for processes in range(1, multiprocessing.cpu_count() + 1):
+        pool = EquityPool(processes)
+        # the first call pays for starting the workers
+        pool.equity(HOLE_CARDS, BOARD, N_OPPONENTS, 10000, seed=SEED)
+        start = time.time()
+        result = pool.equity(HOLE_CARDS, BOARD, N_OPPONENTS, iterations, seed=SEED)
+        seconds = time.time() - start
+        pool.close()
+        print("%2d processes: %.2fs  %.0f trials/s  equity %.5f  speedup %.2fx" % (
+            processes, seconds, iterations / seconds, result.equity, single / seconds))
+
+
+if __name__ == "__main__":
+    main()
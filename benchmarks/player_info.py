@@ -0,0 +1,63 @@
+"""
+Time /player_info/ polls served from the snapshot cache against polls
+that rebuild the response from the database, as after every action.
+
+Runs against a fresh SQLite database and snapshot cache in a temporary
+directory. Run from the repository root:
+    python -m benchmarks.player_info [polls]
+"""
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "aokeri.settings")
+
+
+def time_polls(client, path, polls, before_poll=None):
+    start = time.time()
+    for _ in range(polls):
+        if before_poll:
+            before_poll()
+        client.get(path)
+    return (time.time() - start) / polls
+
+
+def main():
+    polls = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+    directory = tempfile.mkdtemp()
+    try:
+        from django.conf import settings
+        settings.DATABASES["default"]["NAME"] = os.path.join(directory, "benchmark.sqlite3")
+        settings.CACHES["snapshots"]["LOCATION"] = os.path.join(directory, "snapshots")
+        import django
+        django.setup()
+        from django.core.cache import caches
+        from django.core.management import call_command
+        from django.test.utils import setup_test_environment
+        setup_test_environment()
+        call_command("migrate", verbosity=0)
+
+        from django.test import Client
+        from main import snapshots
+        client = Client()
+        data = client.get("/start/").json()
+        path = "/player_info/?game_id=%d&player_id=%d" % (data["game_id"], data["player_one_id"])
+        cache = caches[snapshots.CACHE_ALIAS]
+
+        def changed():
+            cache.set(snapshots.version_key(data["game_id"]), snapshots.new_version(), timeout=None)
+
+        rebuilt = time_polls(client, path, polls, changed)
+        cached = time_polls(client, path, polls)
+        print("%s backend, %d polls" % (cache.__class__.__name__, polls))
+        print("rebuilt: %7.1fus per poll" % (rebuilt * 1e6))
+        print("cached:  %7.1fus per poll" % (cached * 1e6))
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+The PopCount variants: int.bit_count (Python 3.10+), the 16 bit table
+and bin(v).count("1"). Times each per call on the 13 bit rank masks
+the evaluators pass it and on 32 bit values, and through
+Six/Seven.evaluate_rank with PopCount.popcount swapped for each
+variant. Also reports what building the table costs.
+
+Run from the repository root:
+    python -m benchmarks.popcount
+"""
+import random
+import sys
+import timeit
+
+from pokereval.hand_evaluator import HandEvaluator
+from pokereval.lookup_tables import LookupTables
+from pokereval.popcount import PopCount
+
+SEED = 1234
+VALUES = 20000
+HANDS = 20000
+
+
+def variants():
+    found = []
+    if hasattr(int, "bit_count"):
+        found.append(("int.bit_count", int.bit_count))
+    found.append(("table16", PopCount.popcount32_table16))
+    found.append(("bin count", PopCount.popcount_bin))
+    return found
+
+
+def per_call(popcount, values):
+    def run():
+        for value in values:
+            popcount(value)
+    return min(timeit.repeat(run, repeat=5, number=1)) / len(values)
+
+
+def per_evaluation(evaluator, popcount, hands):
+    evaluate_rank = evaluator.evaluate_rank
+    def run():
+        for hand in hands:
+            evaluate_rank(hand)
+    original = PopCount.popcount
+    PopCount.popcount = staticmethod(popcount)
+    try:
+        return min(timeit.repeat(run, repeat=5, number=1)) / len(hands)
+    finally:
+        PopCount.popcount = staticmethod(original)
+
+
+def main():
+    rng = random.Random(SEED)
+    LookupTables.load_all()
+
+    built = PopCount.POPCOUNT_TABLE16 is not None
+    PopCount.POPCOUNT_TABLE16 = None
+    build_seconds = min(timeit.repeat(PopCount.load_table16, repeat=1, number=1))
+    table = PopCount.POPCOUNT_TABLE16
+    print("selected:      %s" % ("table16" if PopCount.popcount is PopCount.popcount32_table16 else "int.bit_count"))
+    print("table built at import: %s" % built)
+    print("table build:   %.1f ms, %d bytes" % (build_seconds * 1e3, sys.getsizeof(table)))
+
+    masks = [rng.getrandbits(13) for _ in range(VALUES)]
+    words = [rng.getrandbits(32) for _ in range(VALUES)]
+    deck = sorted(LookupTables.deck)
+    six = [rng.sample(deck, 6) for _ in range(HANDS)]
+    seven = [rng.sample(deck, 7) for _ in range(HANDS)]
+
+    print("%-14s %10s %10s %12s %12s" % ("", "13 bit ns", "32 bit ns", "Six eval ns", "Seven eval ns"))
+    for name, popcount in variants():
+        print("%-14s %10.0f %10.0f %12.0f %12.0f" % (
+            name, per_call(popcount, masks) * 1e9, per_call(popcount, words) * 1e9,
+            per_evaluation(HandEvaluator.Six, popcount, six) * 1e9,
+            per_evaluation(HandEvaluator.Seven, popcount, seven) * 1e9))
+
+
+if __name__ == "__main__":
+    main()
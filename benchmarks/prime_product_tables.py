@@ -0,0 +1,110 @@
+"""
+Lookup latency and memory of the PerfectHash prime product tables
+against the dicts LookupTables expands them to, both per lookup and
+through evaluate_rank on paired hands, which are the ones that can take
+the prime product path.
+
+Run from the repository root:
+    python -m benchmarks.prime_product_tables
+"""
+import importlib
+import random
+import sys
+import timeit
+
+try:
+    from importlib import reload
+except ImportError:
+    pass  # Python 2, reload is a builtin
+
+from pokereval.hand_evaluator import HandEvaluator
+from pokereval.lookup_tables import LookupTables
+
+SEED = 1234
+LOOKUPS = 10000
+
+TABLES = (
+    ("Five", "pairs", HandEvaluator.Five, 5),
+    ("Six", "prime_products_to_rank", HandEvaluator.Six, 6),
+    ("Seven", "prime_products_to_rank", HandEvaluator.Seven, 7),
+)
+
+
+def compact_table(name, attribute):
+    """
+    The PerfectHash literal, from a fresh copy of the table module since
+    LookupTables expanded the loaded one to a dict.
+    """
+    module = importlib.import_module("pokereval.lookup_tables_" + name.lower())
+    return getattr(getattr(reload(module), name), attribute)
+
+
+def dict_bytes(table):
+    """
+    Size of the dict and of the distinct int objects it holds.
+    """
+    objects = dict((id(item), item) for pair in table.items() for item in pair)
+    return sys.getsizeof(table) + sum(sys.getsizeof(item) for item in objects.values())
+
+
+def perfect_hash_bytes(table):
+    return sys.getsizeof(table) + sum(
+        sys.getsizeof(array) for array in (table.displacements, table.keys, table.values))
+
+
+def per_lookup(table, keys):
+    def run():
+        for key in keys:
+            table[key]
+    return min(timeit.repeat(run, repeat=5, number=1)) / len(keys)
+
+
+def per_evaluation(evaluator, hands):
+    evaluate_rank = evaluator.evaluate_rank
+    def run():
+        for hand in hands:
+            evaluate_rank(hand)
+    return min(timeit.repeat(run, repeat=5, number=1)) / len(hands)
+
+
+def paired_hands(length, rng):
+    """
+    Random hands with at least a pair, which are the hands that can
+    take the prime product path.
+    """
+    hands = []
+    while len(hands) < 2000:
+        hand = rng.sample(range(52), length)
+        hand_ranks = [card // 4 for card in hand]
+        if len(set(hand_ranks)) == length:
+            continue
+        hands.append(hand)
+    return hands
+
+
+def main():
+    rng = random.Random(SEED)
+    print("%-30s %12s %12s %10s %10s %14s %14s" % (
+        "", "dict bytes", "phash bytes", "dict ns", "phash ns", "eval dict ns", "eval phash ns"))
+    for name, attribute, evaluator, length in TABLES:
+        namespace = getattr(LookupTables, name)
+        as_dict = getattr(namespace, attribute)
+        perfect_hash = compact_table(name, attribute)
+        keys = [rng.choice(perfect_hash.keys) for _ in range(LOOKUPS)]
+        hands = paired_hands(length, rng)
+
+        dict_eval = per_evaluation(evaluator, hands)
+        setattr(namespace, attribute, perfect_hash)
+        try:
+            phash_eval = per_evaluation(evaluator, hands)
+        finally:
+            setattr(namespace, attribute, as_dict)
+
+        print("%-30s %12d %12d %10.0f %10.0f %14.0f %14.0f" % (
+            name + "." + attribute, dict_bytes(as_dict), perfect_hash_bytes(perfect_hash),
+            per_lookup(as_dict, keys) * 1e9, per_lookup(perfect_hash, keys) * 1e9,
+            dict_eval * 1e9, phash_eval * 1e9))
+
+
+if __name__ == "__main__":
+    main()
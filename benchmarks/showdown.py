@@ -0,0 +1,63 @@
+"""
+Compare picking a showdown winner with two evaluate_hand percentiles
+against evaluate_showdown on the same river deals. Disagreements are split pots that the
+percentile comparison awarded to one player, since each percentile
+removes a different pair of hole cards from the opponent range.
+
+Run from the repository root:
+    python -m benchmarks.showdown
+"""
+import random
+import timeit
+
+from pokereval.hand_evaluator import HandEvaluator
+from pokereval.lookup_tables import LookupTables
+
+SEED = 1234
+DEALS = 200
+
+
+def random_deals(count, seed=SEED):
+    rng = random.Random(seed)
+    deck = sorted(LookupTables.deck, key=lambda card: (card.rank, card.suit))
+    deals = []
+    for _ in range(count):
+        cards = rng.sample(deck, 9)
+        deals.append(([cards[0:2], cards[2:4]], cards[4:]))
+    return deals
+
+
+def percentile_showdown(hands, board):
+    """ The previous winning_hand approach, comparing percentiles. """
+    scores = [HandEvaluator.evaluate_hand(hand, board) for hand in hands]
+    best_score = max(scores)
+    return [index for index, score in enumerate(scores) if score == best_score]
+
+
+def rank_showdown(hands, board):
+    return HandEvaluator.evaluate_showdown(hands, board)
+
+
+def time_per_showdown(showdown, deals):
+    def run():
+        for hands, board in deals:
+            showdown(hands, board)
+    return min(timeit.repeat(run, repeat=3, number=1)) / len(deals)
+
+
+def main():
+    deals = random_deals(DEALS)
+    disagreements = sum(
+        1 for hands, board in deals
+        if percentile_showdown(hands, board) != rank_showdown(hands, board))
+    percentile_time = time_per_showdown(percentile_showdown, deals)
+    rank_time = time_per_showdown(rank_showdown, deals)
+    print("deals:                %d" % len(deals))
+    print("percentile showdown:  %.1f us" % (percentile_time * 1e6))
+    print("rank showdown:        %.1f us" % (rank_time * 1e6))
+    print("speedup:              %.0fx" % (percentile_time / rank_time))
+    print("disagreements:        %d" % disagreements)
+
+
+if __name__ == "__main__":
+    main()
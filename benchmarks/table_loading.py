@@ -0,0 +1,89 @@
+"""
+Startup time and memory of loading the lookup tables from
+lookup_tables.py against the mapped lookup_tables.bin, each in a fresh
+process. Pss is the process' proportional share of the pages it maps,
+so pages of lookup_tables.bin shared by several processes only count
+once in total.
+
+Run from the repository root, after python -m pokereval.table_file:
+    python -m benchmarks.table_loading [processes]
+"""
+import json
+import subprocess
+import sys
+
+# Each snippet loads the tables, reports, then waits so that several
+# copies are alive at once when their Pss is read.
+PRELUDE = """
+import json, sys, time
+start = time.time()
+"""
+REPORT = """
+seconds = time.time() - start
+sys.stdout.write(json.dumps({'seconds': seconds}) + '\\n')
+sys.stdout.flush()
+sys.stdin.readline()
+pss = sum(int(line.split()[1]) for line in open('/proc/self/smaps') if line.startswith('Pss:'))
+sys.stdout.write(json.dumps({'pss_kb': pss}) + '\\n')
+sys.stdout.flush()
+sys.stdin.readline()
+"""
+
+CASES = (
+    ("import lookup_tables.py", """
+from pokereval.lookup_tables import LookupTables
+# the table modules are imported lazily, load them all to time it
+LookupTables.load_all()
+"""),
+    ("rebuild LookupTables from .bin", """
+from pokereval.table_file import TableFile
+tables = TableFile()
+loaded = [tables.table(name) for name in tables.names()]
+"""),
+    ("batch tables from lookup_tables.py", """
+import numpy
+from pokereval.table_file import PackedTables
+from pokereval.batch import BatchTables
+BatchTables.tables = PackedTables()
+BatchTables.load_five(); BatchTables.load_six(); BatchTables.load_seven()
+"""),
+    ("batch tables mapped from .bin", """
+import numpy
+from pokereval.table_file import TableFile
+from pokereval.batch import BatchTables
+BatchTables.tables = TableFile()
+BatchTables.load_five(); BatchTables.load_six(); BatchTables.load_seven()
+"""),
+    ("baseline (numpy only)", """
+import numpy
+"""),
+)
+
+
+def run(code, processes):
+    children = [subprocess.Popen([sys.executable, "-c", PRELUDE + code + REPORT],
+                                 stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+                for _ in range(processes)]
+    seconds = [json.loads(child.stdout.readline())["seconds"] for child in children]
+    # read Pss while every child is still alive, then let them exit
+    for child in children:
+        child.stdin.write(b"\n")
+        child.stdin.flush()
+    pss = [json.loads(child.stdout.readline())["pss_kb"] for child in children]
+    for child in children:
+        child.stdin.write(b"\n")
+        child.stdin.flush()
+        child.wait()
+    return min(seconds), sum(pss)
+
+
+def main():
+    processes = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    print("%-36s %10s %18s" % ("", "load ms", "Pss of %d procs" % processes))
+    for name, code in CASES:
+        seconds, pss = run(code, processes)
+        print("%-36s %10.1f %15d kB" % (name, seconds * 1000, pss))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Check that the batch evaluators give bit-exact the same ranks as the
+scalar evaluate_rank. Every 5-card hand is checked; 6 and 7-card hands
+are checked exhaustively only with --exhaustive, since C(52,6) and
+C(52,7) take hours with the scalar evaluators.
+
+Run from the repository root:
+    python -m benchmarks.validate_batch [--exhaustive]
+"""
+import sys
+from itertools import combinations, islice
+
+import numpy as np
+
+from pokereval.hand_evaluator import HandEvaluator
+
+CHUNK = 100000
+SAMPLE = 500000
+SEED = 1234
+
+
+def chunks(hands, size=CHUNK):
+    while True:
+        chunk = list(islice(hands, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def check(evaluator, hands):
+    checked = 0
+    for chunk in chunks(hands):
+        batch_ranks = evaluator.evaluate_batch(np.array(chunk)).tolist()
+        for hand, batch_rank in zip(chunk, batch_ranks):
+            rank = evaluator.evaluate_rank(hand)
+            if rank != batch_rank:
+                raise AssertionError("%s: evaluate_rank %d != evaluate_batch %d" % (hand, rank, batch_rank))
+        checked += len(chunk)
+    return checked
+
+
+def sample_hands(length, count=SAMPLE, seed=SEED):
+    rng = np.random.RandomState(seed)
+    for _ in range(count // CHUNK):
+        for hand in np.argsort(rng.rand(CHUNK, 52), axis=1)[:, :length].tolist():
+            yield hand
+
+
+def main():
+    exhaustive = "--exhaustive" in sys.argv[1:]
+    for length, evaluator in ((5, HandEvaluator.Five), (6, HandEvaluator.Six), (7, HandEvaluator.Seven)):
+        if length == 5 or exhaustive:
+            hands = combinations(range(52), length)
+        else:
+            hands = sample_hands(length)
+        print("%d cards: %d hands agree" % (length, check(evaluator, hands)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Check that a 7-card rank table (see pokereval.rank_table) gives the
+same rank as Seven.evaluate_rank for every one of the C(52,7) hands,
+and time both. Takes about 20 minutes in one process, so hands are split
+into shards of their highest card that run in parallel.
+
+Run from the repository root after building the table:
+    python -m benchmarks.validate_rank_table [path] [--processes N]
+"""
+import multiprocessing
+import sys
+import time
+from itertools import combinations
+
+from pokereval.hand_evaluator import HandEvaluator
+from pokereval.rank_table import DEFAULT_PATH, HAND_COUNT, SevenCardRankTable
+
+TIMED = 200000
+
+
+def check_shard(args):
+    """
+    Check every hand whose highest card is top_card.
+    """
+    path, top_card = args
+    table = SevenCardRankTable(path)
+    evaluate_rank = HandEvaluator.Seven.evaluate_rank
+    checked = 0
+    for low in combinations(range(top_card), 6):
+        hand = low + (top_card,)
+        rank = evaluate_rank(hand)
+        table_rank = table.evaluate_rank(hand)
+        if rank != table_rank:
+            raise AssertionError("%s: evaluate_rank %d != rank table %d" % (hand, rank, table_rank))
+        checked += 1
+    return checked
+
+
+def timing(evaluate_rank, hands):
+    start = time.time()
+    for hand in hands:
+        evaluate_rank(hand)
+    return (time.time() - start) / len(hands) * 1e9
+
+
+def main():
+    args = sys.argv[1:]
+    processes = None
+    if "--processes" in args:
+        position = args.index("--processes")
+        processes = int(args[position + 1])
+        del args[position:position + 2]
+    path = args[0] if args else DEFAULT_PATH
+
+    table = SevenCardRankTable(path)
+    hands = [hand for _, hand in zip(range(TIMED), combinations(range(52), 7))]
+    # Touch every page the timed hands use first
+    timing(table.evaluate_rank, hands)
+    print("Seven.evaluate_rank: %.0f ns/hand" % timing(HandEvaluator.Seven.evaluate_rank, hands))
+    print("rank table:          %.0f ns/hand" % timing(table.evaluate_rank, hands))
+
+    pool = multiprocessing.Pool(processes)
+    start = time.time()
+    # Largest shards first so the pool finishes together
+    checked = sum(pool.imap_unordered(check_shard, [(path, top_card) for top_card in range(51, 5, -1)]))
+    pool.close()
+    pool.join()
+    assert checked == HAND_COUNT
+    print("%d hands agree (%.0fs)" % (checked, time.time() - start))
+
+
+if __name__ == "__main__":
+    main()
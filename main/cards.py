@@ -0,0 +1,153 @@
+"""
+Cards as the app uses them, two character strings like "AS", and
+dealing and showdowns on them. Plain Python, no Django.
+
+The models store a list of cards as one integer, CARD_BITS per card
+with the first card in the lowest bits, see encode_cards.
+"""
+import random
+
+from pokereval.card import Card
+from pokereval.hand_evaluator import HandEvaluator
+
+card_numbers = [
+    "A",
+    "K",
+    "Q",
+    "J",
+    "T",
+    "9",
+    "8",
+    "7",
+    "6",
+    "5",
+    "4",
+    "3",
+    "2"
+]
+
+suits = [
+    "C",
+    "S",
+    "H",
+    "D"
+]
+
+suits_to_num = {
+    "C": 4,
+    "S": 1,
+    "H": 2,
+    "D": 3,
+}
+
+card_numbers_to_num = {
+    "A": 14,
+    "K": 13,
+    "Q": 12,
+    "J": 11,
+    "T": 10,
+    "9": 9,
+    "8": 8,
+    "7": 7,
+    "6": 6,
+    "5": 5,
+    "4": 4,
+    "3": 3,
+    "2": 2,
+}
+
+
+def all_cards():
+    deck = []
+    for num in card_numbers:
+        for suit in suits:
+            deck.append(num + suit)
+    return deck
+
+def pop_card_off_deck(deck):
+    card = deck.pop(random.randint(0, len(deck) - 1))
+    return deck, card
+
+def generate_cards():
+    cards_in_play = []
+    deck = all_cards()
+    # generate hole cards
+    for player in range(2):
+        for _ in range(2):
+            deck, card = pop_card_off_deck(deck)
+            cards_in_play.append(card)
+    # generate community cards
+    for _ in range(5):
+        deck, card = pop_card_off_deck(deck)
+        cards_in_play.append(card)
+    # ensure no duplicate cards
+    assert sorted(list(set(cards_in_play))) == sorted(cards_in_play)
+    return divide_cards(cards_in_play)
+
+def divide_cards(cards_in_play):
+    """
+    Divide the generated cards to give easier return values.
+    Will be used at the start of each hand.
+    """
+    cards = cards_in_play
+    cards_on_board = cards[4:]
+    player_one_hole_cards = cards[:2]
+    player_two_hole_cards = cards[2:4]
+    return cards, cards_on_board, player_one_hole_cards, player_two_hole_cards
+
+def to_card(card):
+    """ "AS" to the pokereval Card. """
+    return Card(card_numbers_to_num[card[0]], suits_to_num[card[1]])
+
+def showdown_winner(hand_one, hand_two, community_cards):
+    """
+    "player_one", "player_two" or "tie" for two lists of hole cards
+    and the five community cards.
+    """
+    winners = HandEvaluator.evaluate_showdown(
+        [[to_card(card) for card in hand_one], [to_card(card) for card in hand_two]],
+        [to_card(card) for card in community_cards])
+    if len(winners) == 2:
+        return "tie"
+    elif winners[0] == 0:
+        return "player_one"
+    return "player_two"
+
+def winning_hand(hand_one, hand_two, community_cards):
+    """
+    winning hand must have only five cards.
+    winning hand can use 0 or more of their hole cards.
+    The cards are encoded as stored on the models.
+    """
+    return showdown_winner(
+        decode_cards(hand_one),
+        decode_cards(hand_two),
+        decode_cards(community_cards))
+
+CARD_BITS = 6
+CARD_MASK = (1 << CARD_BITS) - 1
+
+# A card's code is its pokereval Card plus one, 0 ends the list
+CARD_CODES = dict((card, int(to_card(card)) + 1) for card in all_cards())
+CODE_CARDS = [None] * (CARD_MASK + 1)
+for card, code in CARD_CODES.items():
+    CODE_CARDS[code] = card
+del card, code
+
+def encode_cards(cards):
+    """
+    ["AS", "2C"] to one integer, the codes of the cards CARD_BITS
+    apart. The nine cards of a hand take 54 bits.
+    """
+    encoded = 0
+    for card in reversed(cards):
+        encoded = encoded << CARD_BITS | CARD_CODES[card]
+    return encoded
+
+def decode_cards(encoded):
+    """ The list of cards encode_cards made encoded from. """
+    cards = []
+    while encoded:
+        cards.append(CODE_CARDS[encoded & CARD_MASK])
+        encoded >>= CARD_BITS
+    return cards
@@ -0,0 +1,213 @@
+"""
+Heads up game state, applied in memory.
+
+A TableState is the Game and its two Players as plain Python: stacks,
+and the HandState of the hand being played. The actions check whose
+turn it is and what the bet allows, move chips, and go on to the next
+street or the next hand. Nothing here touches the database:
+main.models.load_table builds a TableState from one query and
+main.models.save_table writes back only the fields that changed.
+
+Players are numbered 1 and 2 and take turns, every action passes the
+turn to the other player. A street ends when a bet is called or when
+both players have checked. While a bet is active, last_bet_size is
+what the player to act has to put in to call it.
+"""
+from main.cards import generate_cards, showdown_winner
+
+PREFLOP = 1
+FLOP = 2
+TURN = 3
+RIVER = 4
+
+PLAYER_NAMES = {
+    1: "player_one",
+    2: "player_two",
+}
+
+
+class ActionError(Exception):
+    """
+    The action isn't allowed. reason is the flag the views answer with,
+    like "not_your_turn".
+    """
+    def __init__(self, reason):
+        Exception.__init__(self, reason)
+        self.reason = reason
+
+
+class HandState:
+    """
+    The cards, pot and betting of one hand.
+    """
+    def __init__(self, cards_used, board, hole_cards, phase=PREFLOP, pot=0, players_turn=1,
+                 bet_active=False, last_bet_size=None, checked=False):
+        self.cards_used = cards_used
+        self.board = board
+        # {number: [card, card]}
+        self.hole_cards = hole_cards
+        self.phase = phase
+        self.pot = pot
+        self.players_turn = players_turn
+        self.bet_active = bet_active
+        self.last_bet_size = last_bet_size
+        # the first player to act on this street checked
+        self.checked = checked
+
+    def deal(deal=generate_cards, players_turn=1):
+        """
+        Return a new preflop HandState with cards from deal().
+        """
+        cards, board, hole_cards_one, hole_cards_two = deal()
+        return HandState(cards, board, {1: hole_cards_one, 2: hole_cards_two}, players_turn=players_turn)
+
+    deal = staticmethod(deal)
+
+
+class HandResult:
+    """
+    How a hand ended, kept after the next hand is dealt. winner is
+    "player_one", "player_two" or "tie".
+    """
+    def __init__(self, winner, hand, showdown):
+        self.winner = winner
+        self.hand = hand
+        self.showdown = showdown
+
+
+class TableState:
+    """
+    Stacks and the current hand of one game. Each action returns the
+    HandResult when it ends the hand, None otherwise.
+    """
+    def __init__(self, game_id, player_ids, stacks, hand, deal=generate_cards):
+        self.game_id = game_id
+        # {number: Player id}
+        self.player_ids = player_ids
+        # {number: chips}
+        self.stacks = stacks
+        self.hand = hand
+        self.deal = deal
+
+    def number_of(self, player_id):
+        """
+        Return the number of the player with this id, None if they
+        aren't playing this game.
+        """
+        for number, seat_id in self.player_ids.items():
+            if seat_id == player_id:
+                return number
+
+    def bet(self, number, amount):
+        self.check_turn(number)
+        if self.hand.bet_active:
+            raise ActionError("bet_active")
+        self.check_amount(number, amount)
+        self.put_in(number, amount)
+        self.hand.bet_active = True
+        self.hand.last_bet_size = amount
+        self.pass_turn()
+
+    def raise_bet(self, number, amount):
+        """
+        Put amount in, more than it takes to call the bet.
+        """
+        self.check_turn(number)
+        if not self.hand.bet_active:
+            raise ActionError("no_bet_active")
+        self.check_amount(number, amount)
+        if amount <= self.hand.last_bet_size:
+            raise ActionError("raise_too_small")
+        self.put_in(number, amount)
+        self.hand.last_bet_size = amount - self.hand.last_bet_size
+        self.pass_turn()
+
+    def call(self, number):
+        """
+        Match the bet and end the street, the hand after the river.
+        A player who can't cover the bet calls all in and the part of
+        the bet they can't match goes back.
+        """
+        self.check_turn(number)
+        if not self.hand.bet_active:
+            raise ActionError("no_bet_to_call")
+        to_call = self.hand.last_bet_size
+        paid = min(to_call, self.stacks[number])
+        self.put_in(number, paid)
+        if paid < to_call:
+            self.take_back(other(number), to_call - paid)
+        self.pass_turn()
+        return self.end_street()
+
+    def check(self, number):
+        """
+        Pass without a bet. The second check ends the street, the hand
+        after the river.
+        """
+        self.check_turn(number)
+        if self.hand.bet_active:
+            raise ActionError("bet_active")
+        self.pass_turn()
+        if not self.hand.checked:
+            self.hand.checked = True
+            return None
+        return self.end_street()
+
+    def fold(self, number):
+        """
+        Give up the hand to a bet, the other player takes the pot.
+        """
+        self.check_turn(number)
+        if not self.hand.bet_active:
+            raise ActionError("no_bet_active")
+        self.pass_turn()
+        return self.end_hand(PLAYER_NAMES[other(number)], showdown=False)
+
+    def check_turn(self, number):
+        if number != self.hand.players_turn:
+            raise ActionError("not_your_turn")
+
+    def check_amount(self, number, amount):
+        if amount <= 0:
+            raise ActionError("invalid_amount")
+        if amount > self.stacks[number]:
+            raise ActionError("not_enough_chips")
+
+    def put_in(self, number, amount):
+        self.stacks[number] -= amount
+        self.hand.pot += amount
+
+    def take_back(self, number, amount):
+        self.stacks[number] += amount
+        self.hand.pot -= amount
+
+    def pass_turn(self):
+        self.hand.players_turn = other(self.hand.players_turn)
+
+    def end_street(self):
+        hand = self.hand
+        if hand.phase == RIVER:
+            return self.end_hand(showdown_winner(hand.hole_cards[1], hand.hole_cards[2], hand.board))
+        hand.phase += 1
+        hand.bet_active = False
+        hand.checked = False
+
+    def end_hand(self, winner, showdown=True):
+        """
+        Pay the pot to the winner, split on a tie with the odd chip to
+        player one, and deal the next hand.
+        """
+        hand = self.hand
+        if winner == "tie":
+            self.stacks[2] += hand.pot // 2
+            self.stacks[1] += hand.pot - hand.pot // 2
+        else:
+            self.stacks[1 if winner == PLAYER_NAMES[1] else 2] += hand.pot
+        self.hand = HandState.deal(self.deal, players_turn=hand.players_turn)
+        # the last bet is shown until the next one
+        self.hand.last_bet_size = hand.last_bet_size
+        return HandResult(winner, hand, showdown)
+
+
+def other(number):
+    return 3 - number
@@ -0,0 +1,134 @@
+"""
+Store the card columns as encode_cards integers instead of the str()
+of their lists. The existing rows are converted both ways.
+"""
+import ast
+
+from django.db import migrations, models
+
+# The packing as of this migration, kept here rather than imported from
+# main.cards so later changes there don't change what this migration
+# writes: 6 bits per card, first card in the lowest bits, each card's
+# code is (rank - 2) * 4 + (suit - 1) + 1 in pokereval's numbering and
+# 0 ends the list.
+CARD_BITS = 6
+CARD_MASK = (1 << CARD_BITS) - 1
+RANKS = "23456789TJQKA"
+# spades, hearts, diamonds, clubs
+SUITS = "SHDC"
+CODE_CARDS = [None] + [rank + suit for rank in RANKS for suit in SUITS]
+CARD_CODES = dict((card, code) for code, card in enumerate(CODE_CARDS) if card)
+
+
+def encode_cards(cards):
+    encoded = 0
+    for card in reversed(cards):
+        encoded = encoded << CARD_BITS | CARD_CODES[card]
+    return encoded
+
+
+def decode_cards(encoded):
+    cards = []
+    while encoded:
+        cards.append(CODE_CARDS[encoded & CARD_MASK])
+        encoded >>= CARD_BITS
+    return cards
+
+# model: the card columns
+CARD_FIELDS = {
+    "game": ("cards_used", "cards_on_board"),
+    "player": ("hole_cards",),
+}
+
+
+def encode(apps, schema_editor):
+    for model_name, names in CARD_FIELDS.items():
+        model = apps.get_model("main", model_name)
+        for instance in model.objects.all():
+            for name in names:
+                value = getattr(instance, name)
+                setattr(instance, name + "_encoded", encode_cards(ast.literal_eval(value) if value else []))
+            instance.save(update_fields=[name + "_encoded" for name in names])
+
+
+def decode(apps, schema_editor):
+    for model_name, names in CARD_FIELDS.items():
+        model = apps.get_model("main", model_name)
+        for instance in model.objects.all():
+            for name in names:
+                setattr(instance, name, str(decode_cards(getattr(instance, name + "_encoded") or 0)))
+            instance.save(update_fields=list(names))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='game',
+            name='cards_used_encoded',
+            field=models.PositiveBigIntegerField(null=True),
+        ),
+        migrations.AddField(
+            model_name='game',
+            name='cards_on_board_encoded',
+            field=models.PositiveIntegerField(null=True),
+        ),
+        migrations.AddField(
+            model_name='player',
+            name='hole_cards_encoded',
+            field=models.PositiveIntegerField(null=True),
+        ),
+        # nullable while both columns exist, so this can be reversed
+        migrations.AlterField(
+            model_name='game',
+            name='cards_on_board',
+            field=models.CharField(max_length=1000, null=True),
+        ),
+        migrations.AlterField(
+            model_name='player',
+            name='hole_cards',
+            field=models.CharField(max_length=1000, null=True),
+        ),
+        migrations.RunPython(encode, decode),
+        migrations.RemoveField(
+            model_name='game',
+            name='cards_used',
+        ),
+        migrations.RemoveField(
+            model_name='game',
+            name='cards_on_board',
+        ),
+        migrations.RemoveField(
+            model_name='player',
+            name='hole_cards',
+        ),
+        migrations.RenameField(
+            model_name='game',
+            old_name='cards_used_encoded',
+            new_name='cards_used',
+        ),
+        migrations.RenameField(
+            model_name='game',
+            old_name='cards_on_board_encoded',
+            new_name='cards_on_board',
+        ),
+        migrations.RenameField(
+            model_name='player',
+            old_name='hole_cards_encoded',
+            new_name='hole_cards',
+        ),
+        migrations.AlterField(
+            model_name='game',
+            name='cards_on_board',
+            field=models.PositiveIntegerField(),
+        ),
+        migrations.AlterField(
+            model_name='player',
+            name='hole_cards',
+            field=models.PositiveIntegerField(),
+        ),
+    ]
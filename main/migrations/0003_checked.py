@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-18 08:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0002_encode_cards'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='game',
+            name='checked',
+            field=models.BooleanField(default=False),
+        ),
+    ]
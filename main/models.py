@@ -11,170 +11,36 @@ routine:
 8. collect bets
 9. (muck one) deal river
 """
-import random
-import ast
-
 from django.db import models
-from django.db.models import Model
-
-from pokereval.card import Card
-from pokereval.hand_evaluator import HandEvaluator
-
-card_numbers = [
-    "A",
-    "K",
-    "Q",
-    "J",
-    "T",
-    "9",
-    "8",
-    "7",
-    "6",
-    "5",
-    "4",
-    "3",
-    "2"
-]
-
-suits = [
-    "C",
-    "S",
-    "H",
-    "D"
-]
-
-suits_to_num = {
-    "C": 4,
-    "S": 1,
-    "H": 2,
-    "D": 3,
-}
-
-card_numbers_to_num = {
-    "A": 14,
-    "K": 13,
-    "Q": 12,
-    "J": 11,
-    "T": 10,
-    "9": 9,
-    "8": 8,
-    "7": 7,
-    "6": 6,
-    "5": 5,
-    "4": 4,
-    "3": 3,
-    "2": 2,
-}
-
-
-def all_cards():
-    deck = []
-    for num in card_numbers:
-        for suit in suits:
-            deck.append(num + suit)
-    return deck
-
-def pop_card_off_deck(deck):
-    card = deck.pop(random.randint(0, len(deck) - 1))
-    return deck, card
-
-def generate_cards():
-    cards_in_play = []
-    deck = all_cards()
-    # generate hole cards
-    for player in xrange(2):
-        for _ in xrange(2):
-            deck, card = pop_card_off_deck(deck)
-            cards_in_play.append(card)
-    # generate community cards
-    for _ in xrange(5):
-        deck, card = pop_card_off_deck(deck)
-        cards_in_play.append(card)
-    # ensure no duplicate cards
-    assert sorted(list(set(cards_in_play))) == sorted(cards_in_play)
-    return divide_cards(cards_in_play)
-
-def divide_cards(cards_in_play):
-    """
-    Divide the generated cards to give easier return values.
-    Will be used at the start of each hand.
-    """
-    cards = cards_in_play
-    cards_on_board = cards[4:]
-    player_one_hole_cards = cards[:2]
-    player_two_hole_cards = cards[2:4]
-    return cards, cards_on_board, player_one_hole_cards, player_two_hole_cards
-
-def winning_hand(hand_one, hand_two, community_cards):
-    """
-    winning hand must have only five cards.
-    winning hand can use 0 or more of their hole cards.
+from django.db.models import Case, F, Model, Value, When
 
-    """
-    hand_one = ast.literal_eval(hand_one)
-    hand_one =  [
-        Card(card_numbers_to_num[hand_one[0][0]], suits_to_num[hand_one[0][1]]),
-        Card(card_numbers_to_num[hand_one[1][0]], suits_to_num[hand_one[1][1]])
-    ]
-    hand_two = ast.literal_eval(hand_two)
-    hand_two = [
-        Card(card_numbers_to_num[hand_two[0][0]], suits_to_num[hand_two[0][1]]),
-        Card(card_numbers_to_num[hand_two[1][0]], suits_to_num[hand_two[1][1]])
-    ]
-    community_cards = ast.literal_eval(community_cards)
-    community_cards = [
-        Card(card_numbers_to_num[community_cards[0][0]], suits_to_num[community_cards[0][1]]),
-        Card(card_numbers_to_num[community_cards[1][0]], suits_to_num[community_cards[1][1]]),
-        Card(card_numbers_to_num[community_cards[2][0]], suits_to_num[community_cards[2][1]]),
-        Card(card_numbers_to_num[community_cards[3][0]], suits_to_num[community_cards[3][1]]),
-        Card(card_numbers_to_num[community_cards[4][0]], suits_to_num[community_cards[4][1]])
-    ]
-    hand_one_score = HandEvaluator.evaluate_hand(hand_one, community_cards)
-    hand_two_score = HandEvaluator.evaluate_hand(hand_two, community_cards)
-    best_hand = ""
-    if hand_one_score > hand_two_score:
-        best_hand = "player_one"
-    elif hand_one_score == hand_two_score:
-        best_hand = "tie"
-    else:
-        best_hand = "player_two"
-    return best_hand
+from main.cards import (
+    all_cards,
+    decode_cards,
+    divide_cards,
+    encode_cards,
+    generate_cards,
+    pop_card_off_deck,
+    winning_hand
+)
+from main.engine import HandState, TableState
 
-def players_from_game_id(game_id):
-    players = Player.objects.filter(current_game__id=game_id)
-    if players:
-        if players.count() == 2:
-            player_one, player_two = players
-            return player_one, player_two
 
 class Player(Model):
     stack = models.PositiveIntegerField(null=True)
     wins = models.IntegerField(null=True)
     loses = models.IntegerField(null=True)
-    hole_cards = models.CharField(max_length=1000, null=False)
-    current_game = models.ForeignKey("Game")
+    # encode_cards of the two hole cards
+    hole_cards = models.PositiveIntegerField(null=False)
+    current_game = models.ForeignKey("Game", on_delete=models.CASCADE)
     # used to determine if it's their turn to move.
     number = models.PositiveIntegerField(null=False)
     current_bet_size = models.PositiveIntegerField(null=True)
 
-    def update_stack(self, amount=0, bet=True, _raise=True, win=False):
-        """
-        Updates the players stack if they
-        win a hand or bet a certain amount.
-        Defaults to bet unless win is True.
-        """
-        if bet or _raise:
-            if amount:
-                self.stack = self.stack - int(amount)
-        if win:
-            self.stack = self.stack + self.current_game.current_pot
-        self.save()
-
-
 
 class Game(Model):
-    # list of all cards being played
-    cards_used = models.CharField(max_length=1000, null=True)
+    # list of all cards being played, encoded like the others
+    cards_used = models.PositiveBigIntegerField(null=True)
     current_pot = models.IntegerField(null=True)
     big_blind = models.IntegerField(null=True)
     small_blind = models.IntegerField(null=True)
@@ -184,16 +50,18 @@ class Game(Model):
     players_turn = models.IntegerField(null=False)
     # historical game or current game
     archived = models.BooleanField(default=False)
-    cards_on_board = models.CharField(max_length=1000, null=False)
+    cards_on_board = models.PositiveIntegerField(null=False)
     # 1 = preflop, 2 = postflop, 3 = turn, 4 = river
     phase_of_hand = models.PositiveIntegerField(null=True)
     # to keep track of what player 1 bet when it's player 2's turn
     last_bet_size = models.PositiveIntegerField(null=True)
     # is there a bet active?
     bet_active = models.BooleanField()
+    # has the first player to act on this street checked?
+    checked = models.BooleanField(default=False)
 
     def cards_shown_on_board(self):
-        cards = ast.literal_eval(self.cards_on_board)
+        cards = decode_cards(self.cards_on_board)
         cards_returned = []
         # preflop
         if self.phase_of_hand == 1:
@@ -224,59 +92,112 @@ class Game(Model):
             phase = "river"
         return phase
 
-    def update_players_turn(self):
-        if self.players_turn == 1:
-            self.players_turn = 2
-        else:
-            self.players_turn = 1
-        self.save()
-
-    def update_pot(self, bet_size):
-        bet_size = int(bet_size)
-        self.current_pot = self.current_pot + bet_size
-        self.save()
-        self.update_last_bet_size(bet_size)
 
-    def update_last_bet_size(self, bet_size):
-        self.last_bet_size = bet_size
-        self.bet_active = True
-        self.save()
-
-    def update_phase_of_hand(self, end=False):
-        if self.phase_of_hand == 4:
-            self.phase_of_hand = 1
-        else:
-            self.phase_of_hand = self.phase_of_hand + 1
-        self.bet_active = False
-        if end:
-            self.phase_of_hand = 1
-        print self.phase_of_hand_str()
-        self.save()
+def load_game(game_id, lock=False):
+    """
+    Return the Game and its two Players by number, all from one query,
+    or None for both if there's no such game. With lock, the Game row
+    stays locked until the transaction ends.
+    """
+    players = Player.objects.select_related("current_game").filter(current_game__id=game_id)
+    if lock:
+        players = players.select_for_update(of=("current_game",))
+    players = dict((player.number, player) for player in players)
+    if sorted(players) != [1, 2]:
+        return None, None
+    game = players[1].current_game
+    # both rows joined their own copy of the game, keep one
+    players[2].current_game = game
+    return game, players
+
+def load_table(game_id, lock=False):
+    """
+    Return the Game, its Players by number and the TableState built from
+    them, see load_game. None for all three if there's no such game.
+    """
+    game, players = load_game(game_id, lock)
+    if game is None:
+        return None, None, None
+    hand = HandState(
+        decode_cards(game.cards_used or 0),
+        decode_cards(game.cards_on_board),
+        dict((number, decode_cards(player.hole_cards)) for number, player in players.items()),
+        phase=game.phase_of_hand,
+        pot=game.current_pot or 0,
+        players_turn=game.players_turn,
+        bet_active=game.bet_active,
+        checked=game.checked,
+        last_bet_size=game.last_bet_size)
+    table = TableState(
+        game.id,
+        dict((number, player.id) for number, player in players.items()),
+        dict((number, player.stack) for number, player in players.items()),
+        hand)
+    return game, players, table
+
+def save_table(game, players, table):
+    """
+    Write back the fields of game and players that table changed, one
+    UPDATE for the game and one for the players at most. The pot and
+    stacks are written as F() increments on what was loaded.
+    """
+    hand = table.hand
+    updates = changes(game, {
+        "cards_used": encode_cards(hand.cards_used),
+        "cards_on_board": encode_cards(hand.board),
+        "phase_of_hand": hand.phase,
+        "current_pot": hand.pot,
+        "players_turn": hand.players_turn,
+        "bet_active": hand.bet_active,
+        "checked": hand.checked,
+        "last_bet_size": hand.last_bet_size,
+    })
+    if updates:
+        Game.objects.filter(id=game.id).update(**increments(game, updates, "current_pot"))
+        set_fields(game, updates)
+
+    player_updates = {}
+    for number, player in players.items():
+        updates = changes(player, {
+            "stack": table.stacks[number],
+            "hole_cards": encode_cards(hand.hole_cards[number]),
+        })
+        if updates:
+            player_updates[player] = updates
+    if len(player_updates) == 1:
+        (player, updates), = player_updates.items()
+        Player.objects.filter(id=player.id).update(**increments(player, updates, "stack"))
+    elif player_updates:
+        # One UPDATE for both, bulk_update would wrap it in a transaction of its own
+        names = set(name for updates in player_updates.values() for name in updates)
+        Player.objects.filter(id__in=[player.id for player in player_updates]).update(**dict(
+            (name, Case(
+                *[When(id=player.id, then=as_expression(increments(player, updates, "stack")[name]))
+                  for player, updates in player_updates.items() if name in updates],
+                default=F(name), output_field=Player._meta.get_field(name)))
+            for name in names))
+    for player, updates in player_updates.items():
+        set_fields(player, updates)
+
+def changes(instance, values):
+    """
+    Return the values that differ from the instance's fields.
+    """
+    return dict((name, value) for name, value in values.items() if getattr(instance, name) != value)
 
-    def clear_pot(self):
-        self.current_pot = 0
-        self.save()
+def increments(instance, updates, name):
+    """
+    updates with the field name written as an F() increment of the
+    instance's value, so it adds to the row rather than overwriting it.
+    """
+    updates = dict(updates)
+    if name in updates:
+        updates[name] = F(name) + Value(updates[name] - (getattr(instance, name) or 0))
+    return updates
 
-    def end_hand(self, winner_id):
-        """
-        give winner the pot
-        clear pot
-        start next hand with the correct player deciding first
-        """
-        player = Player.objects.get(id=winner_id)
-        if player:
-            player.stack = player.stack + self.current_pot
-            player.save()
-        self.current_pot = 0
-        self.save()
-        self.deal_new_cards()
+def as_expression(value):
+    return value if hasattr(value, "resolve_expression") else Value(value)
 
-    def deal_new_cards(self):
-        cards, cards_on_board, player_one_hole_cards, player_two_hole_cards = generate_cards()
-        self.cards_on_board = cards_on_board
-        self.save()
-        player_one, player_two = players_from_game_id(self.id)
-        player_one.hole_cards = player_one_hole_cards
-        player_two.hole_cards = player_two_hole_cards
-        player_one.save()
-        player_two.save()
+def set_fields(instance, updates):
+    for name, value in updates.items():
+        setattr(instance, name, value)
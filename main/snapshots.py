@@ -0,0 +1,55 @@
+"""
+Pre-serialized /player_info/ responses, kept in the "snapshots" cache
+so a poll between moves is a cache read instead of a query.
+
+Each game has a version in the cache, a random token that changed()
+replaces once a write to the game commits. A snapshot is stored with
+the version read before the game was loaded and only served while
+that is still the game's version. A snapshot built from a read that
+raced with a write is never served after the write. Versions are
+never reused, so this holds for any number of worker processes
+sharing the cache, and a lost or evicted version only costs a rebuild.
+"""
+import uuid
+
+from django.core.cache import caches
+from django.db import transaction
+
+CACHE_ALIAS = "snapshots"
+
+
+def version_key(game_id):
+    return "game:%d:version" % game_id
+
+def snapshot_key(game_id, player_id):
+    return "game:%d:player_info:%d" % (game_id, player_id)
+
+def new_version():
+    return uuid.uuid4().hex
+
+def lookup(game_id, player_id):
+    """
+    Return the game's version and the snapshot stored for it, None if
+    there isn't one. Give the version to store() with the new snapshot.
+    """
+    cache = caches[CACHE_ALIAS]
+    values = cache.get_many([version_key(game_id), snapshot_key(game_id, player_id)])
+    version = values.get(version_key(game_id))
+    if version is None:
+        version = new_version()
+        cache.add(version_key(game_id), version, timeout=None)
+        return version, None
+    snapshot = values.get(snapshot_key(game_id, player_id))
+    if snapshot is not None and snapshot[0] == version:
+        return version, snapshot[1]
+    return version, None
+
+def store(game_id, player_id, version, content):
+    caches[CACHE_ALIAS].set(snapshot_key(game_id, player_id), (version, content))
+
+def changed(game_id):
+    """
+    Drop the game's snapshots once the current transaction commits.
+    """
+    transaction.on_commit(
+        lambda: caches[CACHE_ALIAS].set(version_key(game_id), new_version(), timeout=None))
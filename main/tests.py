@@ -1,3 +1,484 @@
-from django.test import TestCase
+import ast
+import importlib
 
-# Create your tests here.
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from main import snapshots
+from main.cards import all_cards, decode_cards, encode_cards
+from main.engine import ActionError, FLOP, HandState, PREFLOP, RIVER, TableState
+from main.models import Player
+from main.views import update_player
+from pokereval.card import Card
+from pokereval.hand_evaluator import HandEvaluator
+from pokereval.classify import (FLUSH, HIGH_CARD, RANK_TO_CATEGORY, STRAIGHT, STRAIGHT_FLUSH,
+                                WORST_RANKS, classify, classify_batch)
+from pokereval.popcount import PopCount
+from pokereval.board_cache import BoardRanks, BoardRanksCache
+from pokereval.isomorphism import FlopIndex, canonical_flops, canonicalize, inverse, permute
+from pokereval.lookup_tables import LookupTables
+from pokereval.perfect_hash import PerfectHash
+from pokereval.hand_range import Range, RangeParseException, parse_classes, range_equity
+
+
+def fixed_deal(hole_cards_one, hole_cards_two, board):
+    def deal():
+        return hole_cards_one + hole_cards_two + board, board, hole_cards_one, hole_cards_two
+    return deal
+
+
+# player one makes a flush, player two a pair of kings
+FLUSH_BEATS_PAIR = fixed_deal(["AS", "2S"], ["KH", "KD"], ["9S", "7S", "4S", "KC", "3D"])
+# the board plays for both
+BOARD_PLAYS = fixed_deal(["2C", "3D"], ["2H", "3S"], ["AS", "KS", "QS", "JS", "TS"])
+
+
+def table(deal=FLUSH_BEATS_PAIR, stacks=None):
+    return TableState(1, {1: 11, 2: 12}, stacks or {1: 1000, 2: 1000}, HandState.deal(deal), deal=deal)
+
+
+class TableStateTests(SimpleTestCase):
+    def test_turn_order(self):
+        state = table()
+        with self.assertRaises(ActionError) as raised:
+            state.bet(2, 25)
+        self.assertEqual(raised.exception.reason, "not_your_turn")
+        state.bet(1, 25)
+        self.assertEqual(state.hand.players_turn, 2)
+
+    def test_bets_are_checked(self):
+        state = table(stacks={1: 100, 2: 1000})
+        for action, amount, reason in (
+                (state.bet, 0, "invalid_amount"),
+                (state.bet, 101, "not_enough_chips"),
+                (state.raise_bet, 25, "no_bet_active")):
+            with self.assertRaises(ActionError) as raised:
+                action(1, amount)
+            self.assertEqual(raised.exception.reason, reason)
+        state.bet(1, 25)
+        with self.assertRaises(ActionError) as raised:
+            state.raise_bet(2, 25)
+        self.assertEqual(raised.exception.reason, "raise_too_small")
+
+    def test_call_pays_the_difference_and_ends_the_street(self):
+        state = table()
+        state.bet(1, 25)
+        state.raise_bet(2, 45)
+        self.assertEqual(state.hand.last_bet_size, 20)
+        self.assertIsNone(state.call(1))
+        self.assertEqual(state.stacks, {1: 955, 2: 955})
+        self.assertEqual(state.hand.pot, 90)
+        self.assertEqual(state.hand.phase, FLOP)
+        self.assertFalse(state.hand.bet_active)
+
+    def test_short_call_gives_back_what_it_cannot_match(self):
+        state = table(stacks={1: 1000, 2: 30})
+        state.bet(1, 100)
+        state.call(2)
+        self.assertEqual(state.stacks, {1: 970, 2: 0})
+        self.assertEqual(state.hand.pot, 60)
+
+    def test_street_ends_after_both_players_check(self):
+        state = table()
+        self.assertIsNone(state.check(1))
+        self.assertEqual(state.hand.phase, PREFLOP)
+        self.assertEqual(state.hand.players_turn, 2)
+        self.assertIsNone(state.check(2))
+        self.assertEqual(state.hand.phase, FLOP)
+        self.assertFalse(state.hand.checked)
+
+    def test_bet_after_a_check_is_called_to_end_the_street(self):
+        state = table()
+        state.check(1)
+        state.bet(2, 25)
+        self.assertEqual(state.hand.phase, PREFLOP)
+        state.call(1)
+        self.assertEqual(state.hand.phase, FLOP)
+        # the next street needs two checks again
+        state.check(2)
+        self.assertEqual(state.hand.phase, FLOP)
+
+    def test_fold_pays_the_pot_and_deals(self):
+        state = table()
+        state.bet(1, 25)
+        result = state.fold(2)
+        self.assertEqual(result.winner, "player_one")
+        self.assertFalse(result.showdown)
+        self.assertEqual(state.stacks, {1: 1000, 2: 1000})
+        self.assertEqual((state.hand.phase, state.hand.pot), (PREFLOP, 0))
+
+    def test_river_call_shows_down_once(self):
+        state = table()
+        # both players check the preflop, flop and turn
+        for _ in range(2 * (RIVER - 1)):
+            state.check(state.hand.players_turn)
+        state.bet(state.hand.players_turn, 50)
+        result = state.call(state.hand.players_turn)
+        self.assertEqual(result.winner, "player_one")
+        self.assertTrue(result.showdown)
+        self.assertEqual(state.stacks, {1: 1050, 2: 950})
+
+    def test_tie_splits_the_pot(self):
+        state = table(BOARD_PLAYS)
+        # both players check the preflop, flop and turn
+        for _ in range(2 * (RIVER - 1)):
+            state.check(state.hand.players_turn)
+        state.bet(state.hand.players_turn, 51)
+        self.assertEqual(state.call(state.hand.players_turn).winner, "tie")
+        self.assertEqual(state.stacks, {1: 1000, 2: 1000})
+
+
+class CardEncodingTests(SimpleTestCase):
+    def test_round_trip(self):
+        deck = all_cards()
+        self.assertEqual(decode_cards(encode_cards(deck[:9])), deck[:9])
+        self.assertEqual(decode_cards(encode_cards(deck[-2:])), deck[-2:])
+        self.assertEqual(decode_cards(encode_cards([])), [])
+
+    def test_fits_the_columns(self):
+        # nine cards in a 64 bit column, five and two in 32 bit ones
+        deck = all_cards()
+        self.assertLess(encode_cards(deck[-9:]), 2 ** 63)
+        self.assertLess(encode_cards(deck[-5:]), 2 ** 31)
+
+
+class HoleCardsTests(SimpleTestCase):
+    def test_plain_ints_without_a_board(self):
+        hand = [Card(14, 1), Card(13, 1)]
+        percentile = HandEvaluator.evaluate_hand(hand)
+        for evaluate in (HandEvaluator.evaluate_hand,
+                         HandEvaluator.evaluate_hand_exact,
+                         HandEvaluator.evaluate_hand_approximate):
+            self.assertEqual(evaluate([int(card) for card in hand]), percentile)
+        self.assertEqual(HandEvaluator.evaluate_hand([0, 5]),
+                         HandEvaluator.evaluate_hand([Card.from_int(0), Card.from_int(5)]))
+
+
+class PopCountTests(SimpleTestCase):
+    def test_table16_builds_its_table(self):
+        PopCount.POPCOUNT_TABLE16 = None
+        for v in (0, 1, 0xffff, 0x10000, 0xffffffff, 0x12345678):
+            self.assertEqual(PopCount.popcount32_table16(v), bin(v).count("1"))
+            self.assertEqual(PopCount.popcount(v), bin(v).count("1"))
+
+
+class PrimeProductTableTests(SimpleTestCase):
+    def test_tables_are_expanded_to_dicts(self):
+        from pokereval import lookup_tables_five, lookup_tables_six, lookup_tables_seven
+        for module, name, attribute in ((lookup_tables_five, "Five", "pairs"),
+                                        (lookup_tables_six, "Six", "prime_products_to_rank"),
+                                        (lookup_tables_seven, "Seven", "prime_products_to_rank")):
+            table = getattr(getattr(LookupTables, name), attribute)
+            self.assertIs(type(table), dict)
+            # the literal as generated, before LookupTables expanded it
+            compact = getattr(getattr(importlib.reload(module), name), attribute)
+            self.assertIsInstance(compact, PerfectHash)
+            self.assertEqual(table, dict(compact.items()))
+
+
+def card(text):
+    """ "As" to pokereval's card value. """
+    return "23456789TJQKA".index(text[0]) * 4 + "shdc".index(text[1])
+
+
+def rename_suits(values, suits):
+    return [value - value % 4 + suits[value % 4] for value in values]
+
+
+class BoardRanksCacheTests(SimpleTestCase):
+    def test_counters_and_memory_cap(self):
+        flop_one, flop_two, flop_three = cards("Ah7d2s"), cards("KcQc3h"), cards("9s8s7s")
+        evaluator = HandEvaluator.Five
+        # room for two flops
+        cache = BoardRanksCache(max_bytes=2 * BoardRanks(flop_one, evaluator).nbytes())
+        first = cache.get(flop_one, evaluator)
+        # the same board in another order is a hit
+        self.assertIs(cache.get(flop_one[::-1], evaluator), first)
+        cache.get(flop_two, evaluator)
+        # evicts flop_one, the least recently used
+        cache.get(flop_three, evaluator)
+        cache.get(flop_one, evaluator)
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["evictions"], stats["boards"]), (1, 4, 2, 2))
+        self.assertLessEqual(stats["bytes"], stats["max_bytes"])
+
+        cache.clear()
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["evictions"], stats["boards"], stats["bytes"]),
+                         (0, 0, 0, 0, 0))
+
+
+class IsomorphismTests(SimpleTestCase):
+    def test_canonical_flops(self):
+        flops, counts = canonical_flops()
+        self.assertEqual(len(flops), 1755)
+        self.assertEqual(sum(counts), 22100)
+        self.assertEqual(flops, [tuple(flop) for flop in LookupTables.Flops.canonical_flops])
+
+    def test_round_trip_and_suit_renaming(self):
+        import random
+        rng = random.Random(14)
+        for board_length in (0, 3, 4, 5):
+            for _ in range(50):
+                values = rng.sample(range(52), 2 + board_length)
+                hole_cards, board = values[:2], values[2:]
+                canonical_hole_cards, canonical_board, permutation = canonicalize(hole_cards, board)
+                undo = inverse(permutation)
+                self.assertEqual(sorted(permute(canonical_hole_cards, undo)), sorted(hole_cards))
+                self.assertEqual(sorted(permute(canonical_board, undo)), sorted(board))
+                # any renaming of the suits has the same canonical form
+                suits = rng.sample(range(4), 4)
+                renamed = canonicalize(rename_suits(hole_cards, suits), rename_suits(board, suits))
+                self.assertEqual(renamed[:2], (canonical_hole_cards, canonical_board))
+
+    def test_flop_index(self):
+        flop = cards("Ah7d2s")
+        index = FlopIndex.index(flop)
+        self.assertEqual(FlopIndex.index(cards("As7c2h")), index)
+        self.assertNotEqual(FlopIndex.index(cards("Ah7h2s")), index)
+
+    def test_exact_percentiles_match_evaluate_hand(self):
+        for hand, board in (("AhKh", "Qh7h2c"), ("AdKd", "Qd7d2s"), ("9s8s", "7c6d2s"),
+                            ("9s8s", "7c6d2sKs"), ("QcJd", "Tc9h2dAsAd"), ("2c2d", "Tc9h2hAs5h")):
+            hand, board = cards(hand), cards(board)
+            self.assertEqual(HandEvaluator.evaluate_hand_exact(hand, board),
+                             HandEvaluator.evaluate_hand(hand, board), (hand, board))
+
+
+class HandRangeTests(SimpleTestCase):
+    def test_combo_counts(self):
+        for text, combos in (("AKs, TT+, 76s-54s", 4 + 5 * 6 + 3 * 4),
+                             ("A5s-A2s", 4 * 4),
+                             ("K9o+", 4 * 12),
+                             ("AsKh", 1),
+                             ("AKo:0.5", 12 * 0.5)):
+            self.assertEqual(Range.parse(text).combos(), combos, text)
+
+    def test_classes(self):
+        self.assertEqual(parse_classes("K9o+"), [(11, low, "o") for low in range(7, 11)])
+        self.assertEqual(parse_classes("76s-54s"), [(high, high - 1, "s") for high in range(3, 6)])
+        self.assertEqual(parse_classes("99-77"), [(rank, rank, "pair") for rank in range(5, 8)])
+        hand = Range.parse("AsKh").hands()
+        self.assertEqual(hand, [(card("Kh"), card("As"), 1.0)])
+
+    def test_bad_tokens(self):
+        for text in ("AKx", "1A", "AKQ", "AAs", "AKs-72s", "AKs-AQo", "AsAs", "AK:x"):
+            with self.assertRaises(RangeParseException, msg=text):
+                Range.parse(text)
+
+    def test_turn_equity_matches_every_showdown(self):
+        hero, villain = Range.parse("AA, 98s"), Range.parse("KK:0.5, AKs, 22")
+        board = [card(text) for text in ("9s", "8h", "2d", "3c")]
+        expected = range_equity(hero, villain, board).equity
+
+        evaluate = HandEvaluator.Seven.evaluate_rank
+        shares = met = 0.0
+        for a, b, hero_weight in hero.hands():
+            for c, d, villain_weight in villain.hands():
+                cards = set([a, b, c, d] + board)
+                if len(cards) < 8:
+                    continue
+                for river in range(52):
+                    if river in cards:
+                        continue
+                    ours = evaluate([a, b] + board + [river])
+                    theirs = evaluate([c, d] + board + [river])
+                    weight = hero_weight * villain_weight
+                    # lower ranks are better
+                    shares += weight * ((ours < theirs) + 0.5 * (ours == theirs))
+                    met += weight
+        self.assertAlmostEqual(expected, shares / met)
+
+
+def cards(text):
+    return [card(text[i:i + 2]) for i in range(0, len(text), 2)]
+
+
+class ClassifyTests(SimpleTestCase):
+    def test_category_boundaries(self):
+        self.assertEqual(len(RANK_TO_CATEGORY), 7463)
+        # each category runs from one past the worst rank of the better one
+        best_rank = 1
+        for worst_rank, category in WORST_RANKS:
+            self.assertEqual(RANK_TO_CATEGORY[best_rank], category)
+            self.assertEqual(RANK_TO_CATEGORY[worst_rank], category)
+            best_rank = worst_rank + 1
+        evaluate = HandEvaluator.Five.evaluate_rank
+        self.assertEqual(evaluate(cards("AsKsQsJsTs")), 1)
+        # the worst flush and the worst straight, the wheel
+        self.assertEqual(evaluate(cards("7s5s4s3s2s")), 1599)
+        self.assertEqual(RANK_TO_CATEGORY[1599], FLUSH)
+        self.assertEqual(evaluate(cards("5s4h3d2cAs")), 1609)
+        self.assertEqual(RANK_TO_CATEGORY[1609], STRAIGHT)
+        self.assertEqual(RANK_TO_CATEGORY[evaluate(cards("7s5h4s3s2s"))], HIGH_CARD)
+
+    def test_flush_draw_and_open_ended(self):
+        hand_class = classify(cards("9h8h"), cards("7h6c2h"))
+        self.assertEqual(hand_class.category, HIGH_CARD)
+        self.assertTrue(hand_class.flush_draw)
+        self.assertTrue(hand_class.open_ended)
+        self.assertFalse(hand_class.gutshot)
+        self.assertEqual(hand_class.overcards, 2)
+
+    def test_gutshot(self):
+        hand_class = classify(cards("9h8c"), cards("6d5s2h"))
+        self.assertTrue(hand_class.gutshot)
+        self.assertFalse(hand_class.open_ended or hand_class.flush_draw)
+
+    def test_draws_on_the_board_alone_do_not_count(self):
+        hand_class = classify(cards("AsKd"), cards("5h6c7d8s"))
+        self.assertFalse(hand_class.open_ended or hand_class.gutshot or hand_class.flush_draw)
+        self.assertFalse(classify(cards("9c8d"), cards("2h5hJhKh")).flush_draw)
+
+    def test_no_draws_on_the_river_or_a_made_straight(self):
+        hand_class = classify(cards("9h8h"), cards("7h6c2hKd3s"))
+        self.assertFalse(hand_class.flush_draw or hand_class.open_ended or hand_class.gutshot)
+        hand_class = classify(cards("9h8h"), cards("7h6c5d"))
+        self.assertEqual(hand_class.category, STRAIGHT)
+        self.assertFalse(hand_class.flush_draw or hand_class.open_ended or hand_class.gutshot)
+        self.assertEqual(classify(cards("9h8h"), cards("7h6h5h")).category, STRAIGHT_FLUSH)
+
+    def test_batch_agrees(self):
+        import random
+        rng = random.Random(17)
+        for board_length in (3, 4, 5):
+            deals = [rng.sample(range(52), 2 + board_length) for _ in range(300)]
+            result = classify_batch([deal[:2] for deal in deals], [deal[2:] for deal in deals])
+            for i, deal in enumerate(deals):
+                expected = classify(deal[:2], deal[2:]).as_dict()
+                expected["category"] = RANK_TO_CATEGORY[expected["rank"]]
+                self.assertEqual(dict((key, result[key][i]) for key in expected), expected, deal)
+
+
+# the snapshots of each test to themselves
+SNAPSHOTS_IN_MEMORY = override_settings(CACHES={
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    "snapshots": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "tests"},
+})
+
+
+@SNAPSHOTS_IN_MEMORY
+class GameTestCase(TestCase):
+    """
+    A started game, and get() to send its players' requests.
+    """
+    def setUp(self):
+        snapshots.caches[snapshots.CACHE_ALIAS].clear()
+        data = self.client.get("/start/").json()
+        self.game_id = data["game_id"]
+        self.query = "?game_id=%d&player_id=%%d" % self.game_id
+        self.player_ids = data["player_one_id"], data["player_two_id"]
+
+    def get(self, path, number, extra=""):
+        return self.client.get(path + self.query % self.player_ids[number - 1] + extra).json()
+
+
+class QueryCountTests(GameTestCase):
+    """
+    Each request loads the game and both players with one query.
+    """
+    def test_start(self):
+        # the game and two players, in a savepoint
+        with self.assertNumQueries(5):
+            self.client.get("/start/")
+
+    def test_player_info(self):
+        with self.assertNumQueries(1):
+            data = self.get("/player_info/", 2)
+        self.assertEqual((data["player_number"], data["opponents_stack"]), (2, 1000))
+        self.assertEqual(len(ast.literal_eval(data["hole_cards"])), 2)
+        with self.assertNumQueries(1):
+            data = self.client.get("/player_info/?game_id=%d&player_id=%d" % (self.game_id, sum(self.player_ids))).json()
+        self.assertTrue(data["no_player_id"])
+
+    def test_action(self):
+        # the locked load, one update for the game and one for the player, in a savepoint
+        with self.assertNumQueries(5):
+            data = self.get("/bet/", 1, "&bet_size=25")
+        self.assertEqual(data["new_stack_size"], 975)
+        # the call ends the street and moves both stacks with one update
+        with self.assertNumQueries(5):
+            self.get("/call/", 2)
+
+    def test_rejected_action(self):
+        # the locked load, in a savepoint rolled back
+        with self.assertNumQueries(4):
+            data = self.get("/bet/", 2, "&bet_size=25")
+        self.assertTrue(data["not_your_turn"])
+
+
+class PlayerInfoTests(GameTestCase):
+    """
+    Only the parameter that is missing, or names nothing in the game, is flagged.
+    """
+    def info(self, query):
+        return self.client.get("/player_info/" + query).json()
+
+    def test_missing_player_id(self):
+        self.assertEqual(self.info("?game_id=%d" % self.game_id), {"no_player_id": True})
+
+    def test_missing_game_id(self):
+        self.assertEqual(self.info("?player_id=%d" % self.player_ids[0]), {"no_game_id": True})
+
+    def test_player_not_in_the_game(self):
+        other_game = self.client.get("/start/").json()
+        self.assertEqual(self.info("?game_id=%d&player_id=%d" % (self.game_id, other_game["player_one_id"])),
+                         {"no_player_id": True})
+
+    def test_game_that_does_not_exist(self):
+        self.assertEqual(self.info("?game_id=%d&player_id=%d" % (self.game_id + 100, self.player_ids[0])),
+                         {"no_game_id": True})
+
+
+class CheckTests(GameTestCase):
+    def test_first_check_is_saved_for_the_next_request(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.get("/check/", 1)
+        self.assertEqual(self.get("/player_info/", 2)["phase_of_hand"], "preflop")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.get("/check/", 2)
+        self.assertEqual(self.get("/player_info/", 1)["phase_of_hand"], "postflop")
+
+
+class SnapshotTests(GameTestCase):
+    """
+    player_info is served from the cache until an action changes the game.
+    """
+    def test_polls_are_served_from_the_cache(self):
+        first = self.get("/player_info/", 1)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.get("/player_info/", 1), first)
+        with self.assertNumQueries(1):
+            self.get("/player_info/", 2)
+
+    def test_actions_invalidate_both_players(self):
+        self.get("/player_info/", 1)
+        self.get("/player_info/", 2)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.get("/bet/", 1, "&bet_size=25")
+        with self.assertNumQueries(1):
+            self.assertEqual(self.get("/player_info/", 1)["pot_size"], 25)
+        with self.assertNumQueries(1):
+            self.assertTrue(self.get("/player_info/", 2)["is_your_turn"])
+
+    def test_rejected_actions_keep_the_snapshot(self):
+        self.get("/player_info/", 2)
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            self.get("/bet/", 2, "&bet_size=25")
+        self.assertEqual(callbacks, [])
+
+    def test_snapshot_of_a_raced_read_is_not_served(self):
+        player_id = self.player_ids[0]
+        # a poll reads the version, then an action commits before it stores
+        version, content = snapshots.lookup(self.game_id, player_id)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.get("/bet/", 1, "&bet_size=25")
+        snapshots.store(self.game_id, player_id, version, b'{"pot_size": 0}')
+        with self.assertNumQueries(1):
+            self.assertEqual(self.get("/player_info/", 1)["pot_size"], 25)
+
+
+class UpdateTests(GameTestCase):
+    def test_update_player_encodes_hole_cards(self):
+        update_player(self.player_ids[0], hole_cards=["AS", "KS"])
+        self.assertEqual(decode_cards(Player.objects.get(id=self.player_ids[0]).hole_cards), ["AS", "KS"])
+        self.assertEqual(self.get("/player_info/", 1)["hole_cards"], str(["AS", "KS"]))
@@ -1,4 +1,4 @@
-from django.conf.urls import url
+from django.urls import re_path
 
 from main.views import (
     start,
@@ -7,15 +7,17 @@ from main.views import (
     fold,
     bet,
     _raise,
+    check,
     bar
 )
 
 urlpatterns = [
-    url(r'^start/$', start),
-    url(r'^player_info/$', players_game_info),
-    url(r'^call/$', call),
-    url(r'^fold/$', fold),
-    url(r'^bet/$', bet),
-    url(r'^raise/$', _raise),
-    url(r'^bar/$', bar),
+    re_path(r'^start/$', start),
+    re_path(r'^player_info/$', players_game_info),
+    re_path(r'^call/$', call),
+    re_path(r'^fold/$', fold),
+    re_path(r'^bet/$', bet),
+    re_path(r'^raise/$', _raise),
+    re_path(r'^check/$', check),
+    re_path(r'^bar/$', bar),
 ]
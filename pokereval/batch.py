@@ -0,0 +1,271 @@
+"""
+Array versions of the rank evaluators, for ranking many hands at once.
+Requires numpy, which the rest of pokereval does not.
+
+Hands are int arrays of shape [N, cards] holding Card values (0-51).
+The tables come from the packed arrays of pokereval.table_file, on
+first use. Dicts keyed on rank bits (< 2**13) are expanded into dense
+arrays; the others stay sorted key/value arrays searched with
+numpy.searchsorted, which share memory with the mapped table file.
+"""
+import numpy as np
+
+from .table_file import open_tables
+
+# Rank bits use 13 bits, one per rank
+RANK_BITS = 1 << 13
+
+POPCOUNT = np.array([bin(index).count("1") for index in range(RANK_BITS)], dtype=np.int8)
+
+
+def dense_table(keys, values, size=RANK_BITS):
+    """
+    Return a dict with small int keys as an array indexed by key.
+    Missing keys are 0, which is never a valid rank.
+    """
+    dense = np.zeros(size, dtype=np.int32)
+    dense[keys] = values
+    return dense
+
+
+class SortedTable:
+    """
+    A dict with large int keys as sorted key and value arrays.
+    """
+    def __init__(self, keys, values):
+        self.keys = keys
+        self.values = values
+
+    def lookup(self, keys):
+        """
+        Return the value of every key. All keys must be in the table.
+        """
+        return self.values[np.searchsorted(self.keys, keys)]
+
+
+class Tables:
+    """
+    Reads the tables of one evaluator out of a table file (see
+    pokereval.table_file). Sorted tables are views of the file.
+    """
+    def __init__(self, tables, group):
+        self.tables = tables
+        self.group = group
+
+    def array(self, name):
+        return self.tables.numpy("%s.%s" % (self.group, name))
+
+    def dense(self, name):
+        name = "%s.%s" % (self.group, name)
+        return dense_table(self.tables.numpy(name, "keys"), self.tables.numpy(name))
+
+    def sorted(self, name):
+        name = "%s.%s" % (self.group, name)
+        return SortedTable(self.tables.numpy(name, "keys"), self.tables.numpy(name))
+
+    def card_to_binary(self):
+        # int64 so prime products can't overflow
+        return self.array("card_index_to_binary").astype(np.int64)
+
+
+class FiveTables(Tables):
+    """
+    Arrays for the batch Five evaluator
+    """
+    def __init__(self, tables):
+        Tables.__init__(self, tables, "Five")
+        self.card_to_binary = self.card_to_binary()
+        self.flushes = self.array("flushes")
+        self.unique5 = self.array("unique5")
+        self.pairs = self.sorted("pairs")
+
+
+class SixTables(Tables):
+    """
+    Arrays for the batch Six evaluator
+    """
+    def __init__(self, tables):
+        Tables.__init__(self, tables, "Six")
+        self.card_to_binary = self.card_to_binary()
+        self.prime_products_to_flush = self.sorted("prime_products_to_flush")
+        self.flush_rank_bits_to_rank = self.dense("flush_rank_bits_to_rank")
+        self.prime_products_to_rank = self.sorted("prime_products_to_rank")
+        self.odd_xors_to_rank = self.dense("odd_xors_to_rank")
+        self.even_xors_to_rank = self.dense("even_xors_to_rank")
+        self.even_xors_to_odd_xors_to_rank = self.sorted("even_xors_to_odd_xors_to_rank")
+
+
+class SevenTables(Tables):
+    """
+    Arrays for the batch Seven evaluator
+    """
+    def __init__(self, tables):
+        Tables.__init__(self, tables, "Seven")
+        self.card_to_binary = self.card_to_binary()
+        self.prime_products_to_flush = self.sorted("prime_products_to_flush")
+        self.flush_rank_bits_to_rank = self.dense("flush_rank_bits_to_rank")
+        self.odd_xors_to_rank = self.dense("odd_xors_to_rank")
+        self.prime_products_to_rank = self.sorted("prime_products_to_rank")
+        self.even_xors_to_odd_xors_to_rank = self.sorted("even_xors_to_odd_xors_to_rank")
+
+
+class BatchTables:
+    """
+    Tables for each batch evaluator, built the first time they're needed
+    from lookup_tables.bin, or from LookupTables if it hasn't been built.
+    """
+    tables = None
+    five = None
+    six = None
+    seven = None
+
+    def open():
+        if BatchTables.tables is None:
+            BatchTables.tables = open_tables()
+        return BatchTables.tables
+
+    def load_five():
+        if BatchTables.five is None:
+            BatchTables.five = FiveTables(BatchTables.open())
+        return BatchTables.five
+
+    def load_six():
+        if BatchTables.six is None:
+            BatchTables.six = SixTables(BatchTables.open())
+        return BatchTables.six
+
+    def load_seven():
+        if BatchTables.seven is None:
+            BatchTables.seven = SevenTables(BatchTables.open())
+        return BatchTables.seven
+
+    open = staticmethod(open)
+    load_five = staticmethod(load_five)
+    load_six = staticmethod(load_six)
+    load_seven = staticmethod(load_seven)
+
+
+def flush_suits(bh, prime_products_to_flush):
+    """
+    Return the suit prime of the flush in each binary hand, or 0.
+    """
+    flush_prime = np.prod((bh >> 12) & 0xF, axis=1)
+    table = prime_products_to_flush
+    index = np.minimum(np.searchsorted(table.keys, flush_prime), len(table.keys) - 1)
+    return np.where(table.keys[index] == flush_prime, table.values[index], 0)
+
+
+def flush_rank_bits(bh, flush_suit):
+    """
+    Return the rank bits of the cards in the flush suit of each hand.
+    """
+    in_suit = ((bh >> 12) & 0xF) == flush_suit[:, np.newaxis]
+    return np.bitwise_or.reduce(np.where(in_suit, bh >> 16, 0), axis=1)
+
+
+def evaluate_five(hands):
+    """
+    Return the rank of every 5-card hand, same as Five.evaluate_rank.
+    """
+    tables = BatchTables.load_five()
+    bh = tables.card_to_binary[hands]
+    has_flush = (np.bitwise_and.reduce(bh, axis=1) & 0xF000) != 0
+    q = np.bitwise_or.reduce(bh, axis=1) >> 16
+
+    # Flushes, then 5 unique ranks, then pairs and up by prime product
+    ranks = np.where(has_flush, tables.flushes[q], tables.unique5[q])
+    by_prime_product = ranks == 0
+    prime_product = np.prod(bh[by_prime_product] & 0xFF, axis=1)
+    ranks[by_prime_product] = tables.pairs.lookup(prime_product)
+    return ranks
+
+
+def evaluate_six(hands):
+    """
+    Return the rank of every 6-card hand, same as Six.evaluate_rank.
+    """
+    tables = BatchTables.load_six()
+    bh = tables.card_to_binary[hands]
+    ranks = np.zeros(len(bh), dtype=np.int32)
+
+    # Flushes, see evaluate_seven
+    flush_suit = flush_suits(bh, tables.prime_products_to_flush)
+    is_flush = flush_suit != 0
+    if is_flush.any():
+        bits = flush_rank_bits(bh[is_flush], flush_suit[is_flush])
+        ranks[is_flush] = tables.flush_rank_bits_to_rank[bits]
+
+    # Odd-even XOR on the rest, see Six.evaluate_rank
+    rest = ~is_flush
+    bh = bh[rest]
+    odd_xor = np.bitwise_xor.reduce(bh, axis=1) >> 16
+    even_xor = (np.bitwise_or.reduce(bh, axis=1) >> 16) ^ odd_xor
+    odd_popcount = POPCOUNT[odd_xor]
+    even_popcount = POPCOUNT[even_xor]
+
+    # 6-0, 2-0 => odd_xor
+    by_odd_xor = (even_xor == 0) & (odd_popcount != 4)
+    # 0-3 => even_xor
+    by_even_xor = (odd_xor == 0) & (even_popcount != 2)
+    # 4-0, 0-2, 2-1 => prime product
+    by_prime_product = (
+        ((even_xor == 0) & (odd_popcount == 4)) |
+        ((odd_xor == 0) & (even_popcount == 2)) |
+        ((odd_popcount == 2) & (even_popcount == 1)))
+    # 4-1, 2-2 => even_xor then odd_xor
+    by_xors = ~(by_odd_xor | by_even_xor | by_prime_product)
+
+    rest_ranks = np.zeros(len(bh), dtype=np.int32)
+    rest_ranks[by_odd_xor] = tables.odd_xors_to_rank[odd_xor[by_odd_xor]]
+    rest_ranks[by_even_xor] = tables.even_xors_to_rank[even_xor[by_even_xor]]
+    prime_product = np.prod(bh[by_prime_product] & 0xFF, axis=1)
+    rest_ranks[by_prime_product] = tables.prime_products_to_rank.lookup(prime_product)
+    rest_ranks[by_xors] = tables.even_xors_to_odd_xors_to_rank.lookup(
+        even_xor[by_xors] * RANK_BITS + odd_xor[by_xors])
+    ranks[rest] = rest_ranks
+    return ranks
+
+
+def evaluate_seven(hands):
+    """
+    Return the rank of every 7-card hand, same as Seven.evaluate_rank.
+    """
+    tables = BatchTables.load_seven()
+    bh = tables.card_to_binary[hands]
+    ranks = np.zeros(len(bh), dtype=np.int32)
+
+    # Flushes, see Seven.evaluate_rank. Using the rank bits of the cards
+    # in the flush suit is always right, the xor shortcut is only faster
+    # for single hands.
+    flush_suit = flush_suits(bh, tables.prime_products_to_flush)
+    is_flush = flush_suit != 0
+    if is_flush.any():
+        bits = flush_rank_bits(bh[is_flush], flush_suit[is_flush])
+        ranks[is_flush] = tables.flush_rank_bits_to_rank[bits]
+
+    # Odd-even XOR on the rest
+    rest = ~is_flush
+    bh = bh[rest]
+    odd_xor = np.bitwise_xor.reduce(bh, axis=1) >> 16
+    even_xor = (np.bitwise_or.reduce(bh, axis=1) >> 16) ^ odd_xor
+    odd_popcount = POPCOUNT[odd_xor]
+    even_popcount = POPCOUNT[even_xor]
+
+    # 7-0 => odd_xor
+    by_odd_xor = (even_xor == 0) & (odd_popcount == 7)
+    # 5-0, 3-0, 3-1, 1-2 => prime product
+    by_prime_product = (
+        ((even_xor == 0) & (odd_popcount != 7)) |
+        ((odd_popcount == 3) & (even_popcount == 1)) |
+        ((odd_popcount == 1) & (even_popcount == 2)))
+    # 5-1, 3-2, 1-3, 1-1 => even_xor then odd_xor
+    by_xors = ~(by_odd_xor | by_prime_product)
+
+    rest_ranks = np.zeros(len(bh), dtype=np.int32)
+    rest_ranks[by_odd_xor] = tables.odd_xors_to_rank[odd_xor[by_odd_xor]]
+    prime_product = np.prod(bh[by_prime_product] & 0xFF, axis=1)
+    rest_ranks[by_prime_product] = tables.prime_products_to_rank.lookup(prime_product)
+    rest_ranks[by_xors] = tables.even_xors_to_odd_xors_to_rank.lookup(
+        even_xor[by_xors] * RANK_BITS + odd_xor[by_xors])
+    ranks[rest] = rest_ranks
+    return ranks
@@ -0,0 +1,142 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from itertools import combinations
+from threading import Lock
+
+from .lookup_tables import LookupTables
+
+
+class BoardRanks:
+    """
+    The ranks of every pair of hole cards left in the deck on one board.
+    sorted_ranks lets a percentile be found by binary search, and
+    pair_ranks[a * 52 + b] is the rank of the pair of cards a and b
+    (0 if either card is on the board), so pairs that contain our own
+    cards can be taken back out.
+    """
+    def __init__(self, board, evaluator):
+        board = list(board)
+        self.pair_ranks = array('H', [0]) * (52 * 52)
+        ranks = []
+        for h in combinations(LookupTables.deck - set(board), 2):
+            rank = evaluator.evaluate_rank(list(h) + board)
+            a, b = h
+            self.pair_ranks[a * 52 + b] = rank
+            self.pair_ranks[b * 52 + a] = rank
+            ranks.append(rank)
+        ranks.sort()
+        self.sorted_ranks = array('H', ranks)
+
+    def nbytes(self):
+        return (len(self.pair_ranks) * self.pair_ranks.itemsize +
+                len(self.sorted_ranks) * self.sorted_ranks.itemsize)
+
+    def percentile(self, rank, hand):
+        """
+        Return the fraction of opponent hands beaten by this rank,
+        counting ties as half, where opponents can't hold our cards.
+        """
+        sorted_ranks = self.sorted_ranks
+        # Lower ranks are better, so we beat everything to the right
+        first_tied = bisect_left(sorted_ranks, rank)
+        first_beaten = bisect_right(sorted_ranks, rank)
+        hands_beaten = len(sorted_ranks) - first_beaten + 0.5 * (first_beaten - first_tied)
+        possible_opponent_hands = len(sorted_ranks)
+
+        # Take back out every pair holding one or both of our cards
+        pair_ranks = self.pair_ranks
+        a, b = hand
+        for index in range(52):
+            for row in (a * 52, b * 52):
+                if index == a or index == b:
+                    continue
+                possible_opponent_rank = pair_ranks[row + index]
+                if possible_opponent_rank == 0:
+                    # on the board
+                    continue
+                possible_opponent_hands -= 1
+                if rank < possible_opponent_rank:
+                    hands_beaten -= 1
+                elif rank == possible_opponent_rank:
+                    hands_beaten -= 0.5
+        # and the pair made of both our cards
+        possible_opponent_rank = pair_ranks[a * 52 + b]
+        possible_opponent_hands -= 1
+        if rank < possible_opponent_rank:
+            hands_beaten -= 1
+        elif rank == possible_opponent_rank:
+            hands_beaten -= 0.5
+        return float(hands_beaten) / possible_opponent_hands
+
+
+class BoardRanksCache:
+    """
+    Least recently used cache of BoardRanks keyed on the board, bounded
+    by the bytes held in the rank arrays.
+    """
+    def __init__(self, max_bytes=8 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.boards = OrderedDict()
+        self.lock = Lock()
+
+    def board_key(board):
+        """
+        Return the same key for a board whatever order the cards came in.
+        """
+        return tuple(sorted(int(card) for card in board))
+
+    board_key = staticmethod(board_key)
+
+    def get(self, board, evaluator):
+        """
+        Return the BoardRanks of this board, building it with the
+        evaluator if it isn't cached yet.
+        """
+        key = self.board_key(board)
+        with self.lock:
+            board_ranks = self.boards.pop(key, None)
+            if board_ranks is not None:
+                self.hits += 1
+                # re-insert to mark as most recently used
+                self.boards[key] = board_ranks
+                return board_ranks
+            self.misses += 1
+
+        # Build outside the lock, another thread may build it too
+        board_ranks = BoardRanks(board, evaluator)
+
+        with self.lock:
+            if key not in self.boards:
+                self.boards[key] = board_ranks
+                self.nbytes += board_ranks.nbytes()
+                while self.nbytes > self.max_bytes and len(self.boards) > 1:
+                    _, evicted = self.boards.popitem(last=False)
+                    self.nbytes -= evicted.nbytes()
+                    self.evictions += 1
+        return board_ranks
+
+    def clear(self):
+        """
+        Drop every board and reset the counters of stats().
+        """
+        with self.lock:
+            self.boards.clear()
+            self.nbytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "boards": len(self.boards),
+            "bytes": self.nbytes,
+            "max_bytes": self.max_bytes,
+        }
@@ -1,6 +1,14 @@
 import re
 
-class Card:
+class Card(int):
+    """
+    A card is stored as a single integer 0-51, (rank - 2) * 4 + (suit - 1),
+    so evaluators can use it directly as an index into their lookup
+    tables and plain ints can be passed anywhere a Card is expected.
+    Card only adds rank, suit and a readable repr on top of the int.
+    """
+    __slots__ = ()
+
     SUIT_TO_STRING = {
         1: "s",
         2: "h",
@@ -24,26 +32,37 @@ class Card:
         14: "A"
     }
     
-    STRING_TO_SUIT = dict([(v, k) for k, v in SUIT_TO_STRING.iteritems()])
-    STRING_TO_RANK = dict([(v, k) for k, v in RANK_TO_STRING.iteritems()])
+    STRING_TO_SUIT = dict([(v, k) for k, v in SUIT_TO_STRING.items()])
+    STRING_TO_RANK = dict([(v, k) for k, v in RANK_TO_STRING.items()])
     
     REPR_RE = re.compile(r'\((.*?)\)')
     
-    def __init__(self, rank, suit):
+    def __new__(cls, rank, suit):
         """Create a card. Rank is 2-14, representing 2-A,
         while suit is 1-4 representing spades, hearts, diamonds, clubs"""
-        self.rank = rank
-        self.suit = suit
-    
+        return int.__new__(cls, (rank - 2) * 4 + suit - 1)
+
+    def __getnewargs__(self):
+        return (self.rank, self.suit)
+
+    @property
+    def rank(self):
+        return int(self) // 4 + 2
+
+    @property
+    def suit(self):
+        return int(self) % 4 + 1
+
     def __repr__(self):
         return "<Card(%s%s)>" % (self.RANK_TO_STRING[self.rank], self.SUIT_TO_STRING[self.suit])
-    
-    def __eq__(self, other):
-        return (isinstance(other, self.__class__) and self.rank == other.rank and self.suit == other.suit)
-    
-    def __hash__(self):
-        return hash((self.rank, self.suit))
-    
+
+    __str__ = __repr__
+
+    @classmethod
+    def from_int(cls, index):
+        """Return a card instance from its integer encoding."""
+        return int.__new__(cls, index)
+
     @classmethod
     def from_repr(cls, repr):
         """Return a card instance from repr.
@@ -0,0 +1,213 @@
+"""
+Hand categories and draws for hole cards plus a board.
+
+The category comes from the rank by a table of the 7462 ranks, and
+straight draws from a table of the ranks that complete a straight for
+each set of rank bits, so classifying a hand costs a rank lookup and
+a few table reads. classify_batch does the same for arrays of hands.
+
+Draws only count when the hole cards play a part in them: a flush
+draw is four cards of a suit, one of them in our hand, and a straight
+draw needs ranks that complete a straight with our cards but not with
+the board alone. Both only count before the river, and only when the
+hand isn't a straight or better already.
+"""
+from .hand_evaluator import HandEvaluator, HandLengthException
+from .popcount import PopCount
+
+HIGH_CARD = 0
+ONE_PAIR = 1
+TWO_PAIR = 2
+THREE_OF_A_KIND = 3
+STRAIGHT = 4
+FLUSH = 5
+FULL_HOUSE = 6
+FOUR_OF_A_KIND = 7
+STRAIGHT_FLUSH = 8
+
+CATEGORY_NAMES = [
+    "High Card",
+    "One Pair",
+    "Two Pair",
+    "Three of a Kind",
+    "Straight",
+    "Flush",
+    "Full House",
+    "Four of a Kind",
+    "Straight Flush",
+]
+
+# The worst rank of each category, best category first
+WORST_RANKS = [
+    (10, STRAIGHT_FLUSH),
+    (166, FOUR_OF_A_KIND),
+    (322, FULL_HOUSE),
+    (1599, FLUSH),
+    (1609, STRAIGHT),
+    (2467, THREE_OF_A_KIND),
+    (3325, TWO_PAIR),
+    (6185, ONE_PAIR),
+    (7462, HIGH_CARD),
+]
+
+# RANK_TO_CATEGORY[rank] for ranks 1-7462
+RANK_TO_CATEGORY = [None]
+for worst_rank, category in WORST_RANKS:
+    RANK_TO_CATEGORY.extend([category] * (worst_rank - len(RANK_TO_CATEGORY) + 1))
+
+# Rank bits of the 10 straights, the wheel as A2345
+STRAIGHTS = [0x1F << low for low in range(9)] + [0x100F]
+
+
+def straight_outs(rank_bits):
+    """
+    Return the bits of the ranks that would make a straight with these
+    rank bits, or 0 if they already make one.
+    """
+    if any(rank_bits & straight == straight for straight in STRAIGHTS):
+        return 0
+    outs = 0
+    for rank in range(13):
+        with_rank = rank_bits | (1 << rank)
+        if any(with_rank & straight == straight for straight in STRAIGHTS):
+            outs |= 1 << rank
+    return outs
+
+
+class DrawTables:
+    """
+    straight_outs for every 13-bit set of ranks, built on first use,
+    as a list and as a numpy array for classify_batch.
+    """
+    straight_outs = None
+    straight_outs_array = None
+
+    def load():
+        if DrawTables.straight_outs is None:
+            DrawTables.straight_outs = [straight_outs(rank_bits) for rank_bits in range(1 << 13)]
+        return DrawTables.straight_outs
+
+    def load_array():
+        if DrawTables.straight_outs_array is None:
+            import numpy as np
+            DrawTables.straight_outs_array = np.array(DrawTables.load(), dtype=np.int32)
+        return DrawTables.straight_outs_array
+
+    load = staticmethod(load)
+    load_array = staticmethod(load_array)
+
+
+class HandClass:
+    """
+    The category of a hand and the draws it has.
+    rank is the usual 1-7462 rank of the best 5 cards.
+    """
+    def __init__(self, rank, flush_draw=False, open_ended=False, gutshot=False, overcards=0):
+        self.rank = rank
+        self.category = RANK_TO_CATEGORY[rank]
+        self.flush_draw = flush_draw
+        self.open_ended = open_ended
+        self.gutshot = gutshot
+        self.overcards = overcards
+
+    def name(self):
+        return CATEGORY_NAMES[self.category]
+
+    def __repr__(self):
+        draws = [name for name, has in (("flush draw", self.flush_draw),
+                                        ("open-ended", self.open_ended),
+                                        ("gutshot", self.gutshot)) if has]
+        if self.overcards:
+            draws.append("%d overcard%s" % (self.overcards, "s" if self.overcards > 1 else ""))
+        return "<HandClass(%s%s)>" % (self.name(), "".join(", " + draw for draw in draws))
+
+    def as_dict(self):
+        return {
+            "rank": self.rank,
+            "category": self.name(),
+            "flush_draw": self.flush_draw,
+            "open_ended": self.open_ended,
+            "gutshot": self.gutshot,
+            "overcards": self.overcards,
+        }
+
+
+def classify(hand, board):
+    """
+    Return the HandClass of 2 hole cards on a 3, 4 or 5-card board.
+    """
+    if len(hand) != 2:
+        raise HandLengthException("Only 2 hole cards are supported")
+    if len(board) not in (3, 4, 5):
+        raise HandLengthException("Only 3, 4, 5 board cards are supported")
+    cards = list(hand) + list(board)
+    rank = HandEvaluator.evaluator_for_length(len(cards)).evaluate_rank(cards)
+    hand_class = HandClass(rank)
+
+    board_bits = 0
+    top_board_rank = 0
+    suit_counts = [0, 0, 0, 0]
+    for card in board:
+        card = int(card)
+        board_bits |= 1 << (card >> 2)
+        top_board_rank = max(top_board_rank, card >> 2)
+        suit_counts[card & 3] += 1
+    all_bits = board_bits
+    for card in hand:
+        card = int(card)
+        all_bits |= 1 << (card >> 2)
+        suit_counts[card & 3] += 1
+        if card >> 2 > top_board_rank:
+            hand_class.overcards += 1
+
+    if len(board) == 5 or hand_class.category >= STRAIGHT:
+        return hand_class
+
+    hand_class.flush_draw = suit_counts[int(hand[0]) & 3] == 4 or suit_counts[int(hand[1]) & 3] == 4
+    outs_table = DrawTables.load()
+    outs = PopCount.popcount(outs_table[all_bits] & ~outs_table[board_bits])
+    hand_class.open_ended = outs >= 2
+    hand_class.gutshot = outs == 1
+    return hand_class
+
+
+def classify_batch(hands, boards):
+    """
+    Classify many hands at once: hands is an int array [N, 2] of hole
+    card values and boards [N, 3-5]. Returns a dict of arrays with the
+    keys of HandClass.as_dict, with categories as numbers. Requires numpy.
+    """
+    import numpy as np
+    from .batch import POPCOUNT
+    hands = np.asarray(hands, dtype=np.intp)
+    boards = np.asarray(boards, dtype=np.intp)
+    if hands.ndim != 2 or hands.shape[1] != 2:
+        raise HandLengthException("Only 2 hole cards are supported")
+    if boards.ndim != 2 or boards.shape[1] not in (3, 4, 5) or len(boards) != len(hands):
+        raise HandLengthException("Only 3, 4, 5 board cards are supported")
+    cards = np.hstack([hands, boards])
+    ranks = HandEvaluator.evaluator_for_length(cards.shape[1]).evaluate_batch(cards)
+    categories = np.array(RANK_TO_CATEGORY[1:], dtype=np.int8)[ranks - 1]
+
+    overcards = (hands >> 2 > (boards >> 2).max(axis=1)[:, np.newaxis]).sum(axis=1)
+    drawing = np.zeros(len(hands), dtype=bool) if boards.shape[1] == 5 else categories < STRAIGHT
+
+    # Four of a suit, with one of our cards in it
+    suit_counts = np.zeros((len(hands), 4), dtype=np.int8)
+    for column in range(cards.shape[1]):
+        suit_counts[np.arange(len(hands)), cards[:, column] & 3] += 1
+    flush_draw = (suit_counts[np.arange(len(hands))[:, np.newaxis], hands & 3] == 4).any(axis=1)
+
+    outs_table = DrawTables.load_array()
+    board_bits = np.bitwise_or.reduce(1 << (boards >> 2), axis=1)
+    all_bits = board_bits | np.bitwise_or.reduce(1 << (hands >> 2), axis=1)
+    outs = POPCOUNT[outs_table[all_bits] & ~outs_table[board_bits]]
+
+    return {
+        "rank": ranks,
+        "category": categories,
+        "flush_draw": flush_draw & drawing,
+        "open_ended": (outs >= 2) & drawing,
+        "gutshot": (outs == 1) & drawing,
+        "overcards": overcards,
+    }
@@ -0,0 +1,330 @@
+"""
+Win probability of hole cards against random opponent hands and the
+board cards still to come. Requires numpy, like pokereval.batch.
+"""
+import multiprocessing
+from collections import OrderedDict
+from itertools import combinations
+from threading import Lock
+
+import numpy as np
+
+from .batch import BatchTables, evaluate_seven
+from .hand_evaluator import HandLengthException
+from .isomorphism import canonical_board, permute
+
+
+class EquityResult:
+    """
+    Fractions of trials won, tied and lost, and the equity (wins plus
+    our share of split pots) with its standard error.
+    """
+    def __init__(self, wins, ties, losses, equity_sum, equity_square_sum, iterations):
+        self.iterations = iterations
+        self.win = float(wins) / iterations
+        self.tie = float(ties) / iterations
+        self.loss = float(losses) / iterations
+        self.equity = equity_sum / iterations
+        variance = max(equity_square_sum / iterations - self.equity ** 2, 0.0)
+        if iterations > 1:
+            variance *= float(iterations) / (iterations - 1)
+        self.stderr = (variance / iterations) ** 0.5
+
+    def __repr__(self):
+        return "<EquityResult(equity=%.4f +- %.4f, win=%.4f, tie=%.4f, loss=%.4f, iterations=%d)>" % (
+            self.equity, self.stderr, self.win, self.tie, self.loss, self.iterations)
+
+    def as_dict(self):
+        return {
+            "equity": self.equity,
+            "stderr": self.stderr,
+            "win": self.win,
+            "tie": self.tie,
+            "loss": self.loss,
+            "iterations": self.iterations,
+        }
+
+
+def check_cards(hole_cards, board):
+    if len(hole_cards) != 2:
+        raise HandLengthException("Only 2 hole cards are supported")
+    if len(board) not in (0, 3, 4, 5):
+        raise HandLengthException("Only 0, 3, 4, 5 board cards are supported")
+    known = [int(card) for card in hole_cards] + [int(card) for card in board]
+    if len(set(known)) != len(known):
+        raise ValueError("The same card is dealt twice: %s" % (list(hole_cards) + list(board)))
+    return known
+
+
+def showdown_equity(hero_ranks, opponent_ranks):
+    """
+    Return our share of the pot in each trial, given our ranks [N]
+    and the opponents' ranks [N, n_opponents].
+    """
+    best_opponent = opponent_ranks.min(axis=1)
+    tied = (opponent_ranks == hero_ranks[:, np.newaxis]).sum(axis=1)
+    return np.where(hero_ranks < best_opponent, 1.0,
+                    np.where(hero_ranks == best_opponent, 1.0 / (tied + 1), 0.0))
+
+
+def simulate(hole_cards, board, deck, n_opponents, trials, rng):
+    """
+    Deal the rest of the board and opponent hole cards from deck for a
+    batch of trials and return our share of the pot in each one.
+    """
+    runout_length = 5 - len(board)
+    dealt = runout_length + 2 * n_opponents
+
+    # A random permutation of the remaining deck per trial, keep the top
+    deals = deck[np.argsort(rng.rand(trials, len(deck)), axis=1)[:, :dealt]]
+    board = np.hstack([np.tile(np.array(board, dtype=np.intp), (trials, 1)), deals[:, :runout_length]])
+
+    hero_ranks = evaluate_seven(np.hstack([np.tile(np.array(hole_cards, dtype=np.intp), (trials, 1)), board]))
+    opponent_ranks = np.empty((trials, n_opponents), dtype=np.int32)
+    for opponent in range(n_opponents):
+        start = runout_length + 2 * opponent
+        opponent_ranks[:, opponent] = evaluate_seven(np.hstack([deals[:, start:start + 2], board]))
+    return showdown_equity(hero_ranks, opponent_ranks)
+
+
+def check_equity_args(hole_cards, board, n_opponents):
+    """
+    Return the cards left in the deck after hole_cards and board.
+    """
+    if n_opponents < 1:
+        raise ValueError("At least one opponent is needed")
+    if 2 * (n_opponents + 1) + 5 > 52:
+        raise ValueError("Not enough cards for %d opponents" % n_opponents)
+    known = check_cards(hole_cards, board)
+    return np.array([card for card in range(52) if card not in known])
+
+
+def run_trials(hole_cards, board, deck, n_opponents, iterations, rng, target_stderr, batch_size):
+    """
+    Simulate up to iterations trials, batch_size at a time, and return
+    the totals (wins, ties, losses, equity_sum, equity_square_sum, trials)
+    that EquityResult takes.
+    """
+    wins = ties = losses = done = 0
+    equity_sum = equity_square_sum = 0.0
+    while done < iterations:
+        trials = min(batch_size, iterations - done)
+        shares = simulate(hole_cards, board, deck, n_opponents, trials, rng)
+        won = int((shares == 1.0).sum())
+        lost = int((shares == 0.0).sum())
+        wins += won
+        losses += lost
+        ties += trials - won - lost
+        equity_sum += float(shares.sum())
+        equity_square_sum += float((shares * shares).sum())
+        done += trials
+        if target_stderr is not None:
+            result = EquityResult(wins, ties, losses, equity_sum, equity_square_sum, done)
+            if result.stderr <= target_stderr:
+                break
+    return wins, ties, losses, equity_sum, equity_square_sum, done
+
+
+def equity(hole_cards, board=[], n_opponents=1, iterations=100000, seed=None,
+           target_stderr=None, batch_size=10000):
+    """
+    Estimate the equity of hole_cards on board against n_opponents
+    random hands by Monte Carlo, dealing batch_size trials at a time.
+    Stops after iterations trials, or as soon as the standard error of
+    the equity is at most target_stderr. The same seed always gives the
+    same result.
+    """
+    deck = check_equity_args(hole_cards, board, n_opponents)
+    rng = np.random.RandomState(seed)
+    return EquityResult(*run_trials(
+        hole_cards, board, deck, n_opponents, iterations, rng, target_stderr, batch_size))
+
+
+def run_shard(args):
+    """
+    Run one shard of EquityPool.equity in a worker process. Each shard
+    has its own random stream seeded from (seed, shard).
+    """
+    hole_cards, board, n_opponents, iterations, seed, shard, batch_size = args
+    deck = check_equity_args(hole_cards, board, n_opponents)
+    rng = np.random.RandomState([seed, shard])
+    return run_trials(hole_cards, board, deck, n_opponents, iterations, rng, None, batch_size)
+
+
+def warm_up():
+    """
+    Build the batch evaluator tables, once per process.
+    """
+    BatchTables.load_seven()
+
+
+class EquityPool:
+    """
+    Worker processes for running equity over several cores. The lookup
+    tables are built before the workers start, so forked workers share
+    them, and the initializer builds them once in any worker that didn't
+    inherit them. Keep one pool around; starting it costs far more than
+    one equity call.
+    """
+    def __init__(self, processes=None):
+        warm_up()
+        self.pool = multiprocessing.Pool(processes, initializer=warm_up)
+
+    def equity(self, hole_cards, board=[], n_opponents=1, iterations=1000000, seed=0,
+               shards=32, batch_size=10000):
+        """
+        Same as equity, with the trials split into shards that run in
+        parallel. The result depends on seed, shards and iterations but
+        not on the number of processes, so it can be reproduced on any
+        machine.
+        """
+        check_equity_args(hole_cards, board, n_opponents)
+        if seed is None:
+            seed = np.random.randint(2 ** 31)
+        hole_cards = [int(card) for card in hole_cards]
+        board = [int(card) for card in board]
+        jobs = []
+        for shard in range(shards):
+            # Spread the remainder over the first shards
+            shard_iterations = iterations // shards + (1 if shard < iterations % shards else 0)
+            if shard_iterations:
+                jobs.append((hole_cards, board, n_opponents, shard_iterations, seed, shard, batch_size))
+        totals = self.pool.map(run_shard, jobs)
+        return EquityResult(*[sum(values) for values in zip(*totals)])
+
+    def close(self):
+        self.pool.close()
+        self.pool.join()
+
+
+class BoardEquities:
+    """
+    Exact heads-up win, tie and loss counts for every pair of hole cards
+    on a board, summed over every runout and every opponent hand.
+    Counts are indexed by a * 52 + b for hole cards a < b.
+    """
+    def __init__(self, board):
+        self.board = [int(card) for card in board]
+        self.wins = np.zeros(52 * 52, dtype=np.int64)
+        self.ties = np.zeros(52 * 52, dtype=np.int64)
+        self.losses = np.zeros(52 * 52, dtype=np.int64)
+
+    def add_runout(self, board):
+        """
+        Add the showdowns of every hole card pair against every
+        opponent pair on this complete 5-card board. Opponent ranks are
+        evaluated once and shared by all our hands.
+        """
+        deck = [card for card in range(52) if card not in board]
+        pairs = np.array(list(combinations(deck, 2)), dtype=np.intp)
+        ranks = evaluate_seven(np.hstack([pairs, np.tile(np.array(board, dtype=np.intp), (len(pairs), 1))]))
+
+        # Count worse and equal opponents against the whole deck...
+        sorted_ranks = np.sort(ranks)
+        first_tied = np.searchsorted(sorted_ranks, ranks, side="left")
+        first_worse = np.searchsorted(sorted_ranks, ranks, side="right")
+        worse = len(ranks) - first_worse
+        # (counting our own pair as a tie)
+        equal = first_worse - first_tied
+
+        # ...then take back out the opponent pairs holding our cards
+        pair_ranks = np.zeros((52, 52), dtype=np.int32)
+        a, b = pairs[:, 0], pairs[:, 1]
+        pair_ranks[a, b] = ranks
+        pair_ranks[b, a] = ranks
+        ours = ranks[:, np.newaxis]
+        worse -= (pair_ranks[a] > ours).sum(axis=1) + (pair_ranks[b] > ours).sum(axis=1)
+        # our own pair shows up in both rows
+        equal -= (pair_ranks[a] == ours).sum(axis=1) + (pair_ranks[b] == ours).sum(axis=1) - 1
+
+        # Opponents can't hold the board or either of our cards
+        opponents = (len(deck) - 2) * (len(deck) - 3) // 2
+        index = a * 52 + b
+        self.wins[index] += worse
+        self.ties[index] += equal
+        self.losses[index] += opponents - worse - equal
+
+    def result(self, hole_cards):
+        """
+        Return the EquityResult of these hole cards on the board.
+        """
+        a, b = sorted(int(card) for card in hole_cards)
+        index = a * 52 + b
+        wins, ties, losses = int(self.wins[index]), int(self.ties[index]), int(self.losses[index])
+        iterations = wins + ties + losses
+        result = EquityResult(wins, ties, losses, wins + 0.5 * ties, wins + 0.25 * ties, iterations)
+        # Nothing was sampled
+        result.stderr = 0.0
+        return result
+
+
+def enumerate_equities(board):
+    """
+    Return the exact heads-up BoardEquities of every pair of hole cards
+    on a 3, 4 or 5-card board. Every runout is dealt, so a flop takes
+    C(47,2) times as long as a river, and a turn 46 times as long.
+    """
+    if len(board) not in (3, 4, 5):
+        raise HandLengthException("Only 3, 4, 5 board cards are supported")
+    equities = BoardEquities(board)
+    board = equities.board
+    deck = [card for card in range(52) if card not in board]
+    for runout in combinations(deck, 5 - len(board)):
+        equities.add_runout(board + list(runout))
+    return equities
+
+
+class BoardEquitiesCache:
+    """
+    Least recently used cache of BoardEquities keyed on the canonical
+    board, so every hand on a board, and on the boards that only differ
+    from it by suits, share one enumeration. Each board holds three
+    52 * 52 int64 arrays, about 65KB.
+    """
+    def __init__(self, max_boards=64):
+        self.max_boards = max_boards
+        self.boards = OrderedDict()
+        self.lock = Lock()
+
+    def get(self, board):
+        """
+        Return the BoardEquities of the canonical form of board and the
+        permutation that takes hole cards on board to it.
+        """
+        canonical, permutation = canonical_board(board)
+        key = tuple(int(card) for card in canonical)
+        with self.lock:
+            equities = self.boards.pop(key, None)
+            if equities is not None:
+                # re-insert to mark as most recently used
+                self.boards[key] = equities
+                return equities, permutation
+
+        # Enumerate outside the lock, another thread may do it too
+        equities = enumerate_equities(canonical)
+
+        with self.lock:
+            self.boards[key] = equities
+            while len(self.boards) > self.max_boards:
+                self.boards.popitem(last=False)
+        return equities, permutation
+
+    def clear(self):
+        with self.lock:
+            self.boards.clear()
+
+
+# Replace with a BoardEquitiesCache(max_boards=...) to change the size.
+board_equities_cache = BoardEquitiesCache()
+
+
+def exact_equity(hole_cards, board):
+    """
+    Return the exact heads-up equity of hole_cards on a 3, 4 or 5-card
+    board, enumerating every runout and every opponent hand. The
+    enumeration is cached, so other hands on the same board, or one
+    isomorphic to it, only look up their counts.
+    """
+    check_cards(hole_cards, board)
+    equities, permutation = board_equities_cache.get(board)
+    return equities.result(permute(hole_cards, permutation))
@@ -1,11 +1,24 @@
-from lookup_tables import LookupTables
-from popcount import PopCount
+from .board_cache import BoardRanksCache
+from .isomorphism import canonical_board, permute
+from .lookup_tables import LookupTables
+from .popcount import PopCount
+from functools import reduce
 from itertools import combinations
 from operator import mul, __or__, __and__, __xor__
 
 class HandLengthException(Exception):
     pass
 
+def batch_hands(hands, length):
+    """
+    Return hands as an int array of shape [N, length] for the batch evaluators.
+    """
+    import numpy as np
+    hands = np.asarray(hands, dtype=np.intp)
+    if hands.ndim != 2 or hands.shape[1] != length:
+        raise HandLengthException("Only [N, %d] arrays of cards are supported by this batch evaluator" % length)
+    return hands
+
 class HandEvaluator:
     
     class Two:
@@ -16,14 +29,33 @@ class HandEvaluator:
             if len(hand) != 2:
                 raise HandLengthException("Only 2-card hands are supported by the Two evaluator")
             
-            if hand[0].suit == hand[1].suit:
-                if hand[0].rank < hand[1].rank:
-                    return LookupTables.Two.suited_ranks_to_percentile[hand[0].rank][hand[1].rank]
+            # rank and suit from the integer value, so plain ints work too
+            rank_one, suit_one = int(hand[0]) // 4 + 2, int(hand[0]) % 4 + 1
+            rank_two, suit_two = int(hand[1]) // 4 + 2, int(hand[1]) % 4 + 1
+            if suit_one == suit_two:
+                if rank_one < rank_two:
+                    return LookupTables.Two.suited_ranks_to_percentile[rank_one][rank_two]
                 else:
-                    return LookupTables.Two.suited_ranks_to_percentile[hand[1].rank][hand[0].rank]
+                    return LookupTables.Two.suited_ranks_to_percentile[rank_two][rank_one]
             else:
-                return LookupTables.Two.unsuited_ranks_to_percentile[hand[0].rank][hand[1].rank]
+                return LookupTables.Two.unsuited_ranks_to_percentile[rank_one][rank_two]
+
+        # The PreflopEquity table, mapped on first use
+        preflop_equity = None
+
+        def evaluate_equity(hand, opponent_hand=None):
+            """
+            Return the heads-up all-in equity of hand against
+            opponent_hand, or against a random hand, from the preflop
+            equity table (see pokereval.preflop).
+            """
+            if HandEvaluator.Two.preflop_equity is None:
+                from .preflop import PreflopEquity
+                HandEvaluator.Two.preflop_equity = PreflopEquity()
+            return HandEvaluator.Two.preflop_equity.equity(hand, opponent_hand)
+
         evaluate_percentile = staticmethod(evaluate_percentile)
+        evaluate_equity = staticmethod(evaluate_equity)
             
     class Five:
         def card_to_binary(card):
@@ -53,10 +85,9 @@ class HandEvaluator:
             return b_mask | r_mask | p_mask | cdhs_mask
 
         def card_to_binary_lookup(card):
-            return LookupTables.Five.card_to_binary[card.rank][card.suit]
+            return LookupTables.Five.card_index_to_binary[card]
 
-        # TODO: Return a class of hand too? Would be useful to see if we can make
-        # a draw or something.
+        # For the class of hand and draws, see HandEvaluator.classify_hand
         def evaluate_rank(hand):
             """
             Return the rank of this 5-card hand amongst all 5-card hands.
@@ -65,11 +96,11 @@ class HandEvaluator:
                 raise HandLengthException("Only 5-card hands are supported by the Five evaluator")
             
             # This implementation uses the binary representation from
-            # card_to_binary
-            card_to_binary = HandEvaluator.Five.card_to_binary_lookup
+            # card_to_binary, indexed by the integer value of each card
+            card_to_binary = LookupTables.Five.card_index_to_binary
 
             # bh stands for binary hand
-            bh = map(card_to_binary, hand)
+            bh = [card_to_binary[card] for card in hand]
             has_flush = reduce(__and__, bh, 0xF000)
             # This is a unique number based on the ranks if your cards,
             # assuming your cards are all different
@@ -93,9 +124,19 @@ class HandEvaluator:
                     # shouldn't be terrible
                     return LookupTables.Five.pairs.get(q)
 
+
+        def evaluate_batch(hands):
+            """
+            Return an array with the rank of every hand in an int array
+            of shape [N, 5] holding card values. Requires numpy.
+            """
+            from .batch import evaluate_five
+            return evaluate_five(batch_hands(hands, 5))
+
         card_to_binary = staticmethod(card_to_binary)
         card_to_binary_lookup = staticmethod(card_to_binary_lookup)
         evaluate_rank = staticmethod(evaluate_rank)
+        evaluate_batch = staticmethod(evaluate_batch)
     
     class Six:
         def card_to_binary(card):
@@ -125,7 +166,7 @@ class HandEvaluator:
             return b_mask | q_mask | r_mask | p_mask
         
         def card_to_binary_lookup(card):
-            return LookupTables.Six.card_to_binary[card.rank][card.suit]
+            return LookupTables.Six.card_index_to_binary[card]
     
         def evaluate_rank(hand):
             """
@@ -136,8 +177,8 @@ class HandEvaluator:
                 raise HandLengthException("Only 6-card hands are supported by the Six evaluator")
             
             # bh stands for binary hand, map to that representation
-            card_to_binary = HandEvaluator.Six.card_to_binary_lookup
-            bh = map(card_to_binary, hand)
+            card_to_binary = LookupTables.Six.card_index_to_binary
+            bh = [card_to_binary[card] for card in hand]
         
             # We can determine if it's a flush using a lookup table.
             # Basically use prime number trick but map to bool instead of rank
@@ -220,9 +261,19 @@ class HandEvaluator:
                         prime_product = reduce(mul, map(lambda card: card & 0xFF, bh))
                         return LookupTables.Six.prime_products_to_rank[prime_product]
 
+
+        def evaluate_batch(hands):
+            """
+            Return an array with the rank of every hand in an int array
+            of shape [N, 6] holding card values. Requires numpy.
+            """
+            from .batch import evaluate_six
+            return evaluate_six(batch_hands(hands, 6))
+
         card_to_binary = staticmethod(card_to_binary)
         card_to_binary_lookup = staticmethod(card_to_binary_lookup)
         evaluate_rank = staticmethod(evaluate_rank)
+        evaluate_batch = staticmethod(evaluate_batch)
     
     class Seven:
         def card_to_binary(card):
@@ -238,7 +289,7 @@ class HandEvaluator:
             return b_mask | q_mask | r_mask | p_mask
 
         def card_to_binary_lookup(card):
-            return LookupTables.Seven.card_to_binary[card.rank][card.suit]
+            return LookupTables.Seven.card_index_to_binary[card]
         
         def evaluate_rank(hand):
             """
@@ -249,8 +300,8 @@ class HandEvaluator:
                 raise HandLengthException("Only 7-card hands are supported by the Seven evaluator")
             
             # bh stands for binary hand, map to that representation
-            card_to_binary = HandEvaluator.Seven.card_to_binary_lookup
-            bh = map(card_to_binary, hand)
+            card_to_binary = LookupTables.Seven.card_index_to_binary
+            bh = [card_to_binary[card] for card in hand]
         
             # Use a lookup table to determine if it's a flush as with 6 cards
             flush_prime = reduce(mul, map(lambda card: (card >> 12) & 0xF, bh))
@@ -321,9 +372,19 @@ class HandEvaluator:
                         return LookupTables.Seven.prime_products_to_rank[prime_product]
                     else: # 1-1
                         return LookupTables.Seven.even_xors_to_odd_xors_to_rank[even_xor][odd_xor]
+
+        def evaluate_batch(hands):
+            """
+            Return an array with the rank of every hand in an int array
+            of shape [N, 7] holding card values. Requires numpy.
+            """
+            from .batch import evaluate_seven
+            return evaluate_seven(batch_hands(hands, 7))
+
         card_to_binary = staticmethod(card_to_binary)
         card_to_binary_lookup = staticmethod(card_to_binary_lookup)
         evaluate_rank = staticmethod(evaluate_rank)
+        evaluate_batch = staticmethod(evaluate_batch)
 
     # These are the main functions
     def evaluate_hand(hand, board=[]):
@@ -344,7 +405,7 @@ class HandEvaluator:
         elif len(cards) == 6:
             evaluator = HandEvaluator.Six
         elif len(cards) == 7:
-            evaluator = HandEvaluator.Seven
+            evaluator = HandEvaluator.seven_card_evaluator
         else:
             # wrong number of cards
             raise HandLengthException("Only 2, 5, 6, 7 cards total are supported by evaluate_hand")
@@ -366,4 +427,132 @@ class HandEvaluator:
                 hands_beaten += 0.5
         return float(hands_beaten) / len(list(possible_opponent_hands))
 
-    evaluate_hand = staticmethod(evaluate_hand)
\ No newline at end of file
+    evaluate_hand = staticmethod(evaluate_hand)
+
+    def evaluate_showdown(hands, board):
+        """
+        Return the indexes of the winning hands amongst hands sharing
+        this board. More than one index means the pot is split.
+        Ranks are compared directly, so no opponent hands are enumerated.
+        """
+        hand_lengths = [2]
+
+        for hand in hands:
+            if len(hand) not in hand_lengths:
+                raise HandLengthException("Only %s hole cards are supported" % ", ".join(map(str, hand_lengths)))
+
+        evaluator = HandEvaluator.evaluator_for_length(len(board) + 2)
+        ranks = [evaluator.evaluate_rank(list(hand) + list(board)) for hand in hands]
+        # Lower rank is the better hand
+        best_rank = min(ranks)
+        return [index for index, rank in enumerate(ranks) if rank == best_rank]
+
+    evaluate_showdown = staticmethod(evaluate_showdown)
+
+    def evaluator_for_length(length):
+        """
+        Return the rank evaluator for hands of this many cards.
+        """
+        if length == 5:
+            return HandEvaluator.Five
+        elif length == 6:
+            return HandEvaluator.Six
+        elif length == 7:
+            return HandEvaluator.seven_card_evaluator
+        # wrong number of cards
+        raise HandLengthException("Only 5, 6, 7 cards total are supported by the rank evaluators")
+
+    evaluator_for_length = staticmethod(evaluator_for_length)
+
+    def classify_hand(hand, board):
+        """
+        Return the category of the best 5 cards made from these hole
+        cards and board, and the draws they have, as a HandClass (see
+        pokereval.classify).
+        """
+        from .classify import classify
+        return classify(hand, board)
+
+    classify_hand = staticmethod(classify_hand)
+
+    # The 7-card evaluator used by evaluate_hand, evaluate_showdown and
+    # the percentile functions. Seven, or a SevenCardRankTable once
+    # use_seven_card_table is called.
+    seven_card_evaluator = Seven
+
+    def use_seven_card_table(path=None):
+        """
+        Evaluate 7-card hands with the rank table file at path (see
+        pokereval.rank_table), or with the Seven evaluator if path is
+        False. The file has to be built first.
+        """
+        from .rank_table import DEFAULT_PATH, SevenCardRankTable
+        if path is False:
+            HandEvaluator.seven_card_evaluator = HandEvaluator.Seven
+        else:
+            HandEvaluator.seven_card_evaluator = SevenCardRankTable(path or DEFAULT_PATH)
+
+    use_seven_card_table = staticmethod(use_seven_card_table)
+
+    def evaluate_hand_approximate(hand, board=[]):
+        """
+        Return the percentile of the best 5 card hand made from these
+        cards against all other hands with as many cards, from a lookup table.
+        The shared board is not taken into account, so this is only an
+        approximation of evaluate_hand, but it needs a single rank lookup.
+        """
+        hand_lengths = [2]
+
+        if len(hand) not in hand_lengths:
+            raise HandLengthException("Only %s hole cards are supported" % ", ".join(map(str, hand_lengths)))
+
+        cards = list(hand) + list(board)
+        if len(cards) == 2:
+            return HandEvaluator.Two.evaluate_percentile(hand)
+        elif len(cards) == 5:
+            rank_to_percentile = LookupTables.Five.rank_to_percentile_5
+        elif len(cards) == 6:
+            rank_to_percentile = LookupTables.Five.rank_to_percentile_6
+        elif len(cards) == 7:
+            rank_to_percentile = LookupTables.Five.rank_to_percentile_7
+        else:
+            # wrong number of cards
+            raise HandLengthException("Only 2, 5, 6, 7 cards total are supported by evaluate_hand_approximate")
+
+        rank = HandEvaluator.evaluator_for_length(len(cards)).evaluate_rank(cards)
+        # Ranks start at 1 for a royal flush
+        return rank_to_percentile[rank - 1]
+
+    evaluate_hand_approximate = staticmethod(evaluate_hand_approximate)
+
+    # Opponent ranks per board for evaluate_hand_exact.
+    # Replace with a BoardRanksCache(max_bytes=...) to change the memory cap.
+    board_ranks_cache = BoardRanksCache()
+
+    def evaluate_hand_exact(hand, board=[]):
+        """
+        Return the same percentile as evaluate_hand, but look it up by
+        binary search in the sorted opponent ranks of the board, which
+        are computed once and kept in board_ranks_cache.
+        """
+        hand_lengths = [2]
+
+        if len(hand) not in hand_lengths:
+            raise HandLengthException("Only %s hole cards are supported" % ", ".join(map(str, hand_lengths)))
+
+        cards = list(hand) + list(board)
+        if len(cards) == 2:
+            return HandEvaluator.Two.evaluate_percentile(hand)
+        elif len(cards) not in (5, 6, 7):
+            # wrong number of cards
+            raise HandLengthException("Only 2, 5, 6, 7 cards total are supported by evaluate_hand_exact")
+
+        evaluator = HandEvaluator.evaluator_for_length(len(cards))
+        rank = evaluator.evaluate_rank(cards)
+        # Boards that only differ by suits share one cache entry, our
+        # cards are renamed the same way to look up their percentile
+        board, permutation = canonical_board(board)
+        board_ranks = HandEvaluator.board_ranks_cache.get(board, evaluator)
+        return board_ranks.percentile(rank, permute(hand, permutation))
+
+    evaluate_hand_exact = staticmethod(evaluate_hand_exact)
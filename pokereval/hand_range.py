@@ -0,0 +1,367 @@
+"""
+Ranges of hole cards: a weight 0-1 for each of the 1326 hands, indexed
+like pokereval.preflop, and the equity of one range against another.
+Requires numpy, like pokereval.batch.
+
+Ranges are parsed from the usual notation, separated by commas:
+    AA, TT+, 99-66      pairs
+    AK, AKs, AKo        all, suited or offsuit combos of two ranks
+    ATs+, K9o+          raise the kicker up to one below the high card
+    A5s-A2s, 76s-54s    kicker ranges, or connected ranges that keep
+                        the gap between the ranks
+    AsKh                one combo
+and an optional weight after a colon, e.g. "AKo:0.5, QQ+".
+"""
+import os
+from itertools import combinations
+
+import numpy as np
+
+from .batch import evaluate_seven
+from .hand_evaluator import HandLengthException
+from .preflop import DEFAULT_PATH, HAND_COUNT, PreflopEquity, hand_index, hands
+
+RANKS = "23456789TJQKA"
+SUITS = "shdc"
+
+HANDS = np.array(hands(), dtype=np.intp)
+
+# CARD_HANDS[card] holds the 51 hands containing card, and a hand is
+# CARD_HANDS[a][HAND_POSITIONS[hand, 0]] and CARD_HANDS[b][HAND_POSITIONS[hand, 1]]
+CARD_HANDS = np.array([[hand for hand, cards in enumerate(hands()) if card in cards] for card in range(52)],
+                      dtype=np.intp)
+HAND_POSITIONS = np.array([[list(CARD_HANDS[card]).index(hand) for card in cards]
+                           for hand, cards in enumerate(hands())], dtype=np.intp)
+
+# Runouts evaluated together by range_equity
+CHUNK = 32
+
+
+class RangeParseException(Exception):
+    pass
+
+
+def card_value(rank, suit):
+    return rank * 4 + suit
+
+
+def parse_rank(text, token):
+    if text.upper() not in RANKS:
+        raise RangeParseException("Bad rank %r in %r" % (text, token))
+    return RANKS.index(text.upper())
+
+
+def parse_classes(token):
+    """
+    Return (high, low, kind) for each class in a token without its
+    weight, ranks 0-12 and kind one of "pair", "s", "o" or "".
+    """
+    def one(text):
+        if len(text) not in (2, 3) or (len(text) == 3 and text[2] not in "so"):
+            raise RangeParseException("Bad hand %r in %r" % (text, token))
+        high, low = parse_rank(text[0], token), parse_rank(text[1], token)
+        if high < low:
+            high, low = low, high
+        kind = text[2] if len(text) == 3 else ""
+        if high == low:
+            if kind:
+                raise RangeParseException("Pairs can't be suited or offsuit in %r" % token)
+            kind = "pair"
+        return high, low, kind
+
+    if "-" in token:
+        first, last = [one(text.strip()) for text in token.split("-")]
+        if first[2] != last[2]:
+            raise RangeParseException("Both ends of %r must be the same kind" % token)
+        if first < last:
+            first, last = last, first
+        if first[2] == "pair":
+            return [(rank, rank, "pair") for rank in range(last[0], first[0] + 1)]
+        if first[0] == last[0]:
+            return [(first[0], low, first[2]) for low in range(last[1], first[1] + 1)]
+        if first[0] - first[1] == last[0] - last[1]:
+            gap = first[0] - first[1]
+            return [(high, high - gap, first[2]) for high in range(last[0], first[0] + 1)]
+        raise RangeParseException("%r must share the high card or the gap" % token)
+
+    if token.endswith("+"):
+        high, low, kind = one(token[:-1])
+        if kind == "pair":
+            return [(rank, rank, kind) for rank in range(high, 13)]
+        return [(high, kicker, kind) for kicker in range(low, high)]
+    return [one(token)]
+
+
+def class_hands(high, low, kind):
+    """
+    Return the hand indexes of every combo of a class.
+    """
+    combos = []
+    for high_suit in range(4):
+        for low_suit in range(4):
+            if kind == "pair" and low_suit <= high_suit:
+                continue
+            if kind == "s" and low_suit != high_suit:
+                continue
+            if kind == "o" and low_suit == high_suit:
+                continue
+            combos.append(hand_index([card_value(high, high_suit), card_value(low, low_suit)]))
+    return combos
+
+
+def parse_hands(token):
+    """
+    Return the hand indexes of one token of a range.
+    """
+    if len(token) == 4 and token[1] in SUITS and token[3] in SUITS:
+        cards = [card_value(parse_rank(token[0], token), SUITS.index(token[1])),
+                 card_value(parse_rank(token[2], token), SUITS.index(token[3]))]
+        if cards[0] == cards[1]:
+            raise RangeParseException("The same card is dealt twice in %r" % token)
+        return [hand_index(cards)]
+    combos = []
+    for high, low, kind in parse_classes(token):
+        combos.extend(class_hands(high, low, kind))
+    return combos
+
+
+class Range(object):
+    """
+    A weight for each of the 1326 hands, in a numpy array.
+    """
+    def __init__(self, weights=None):
+        if weights is None:
+            weights = np.zeros(HAND_COUNT)
+        self.weights = np.array(weights, dtype=np.float64)
+        if self.weights.shape != (HAND_COUNT,):
+            raise ValueError("A range has %d weights, not %s" % (HAND_COUNT, self.weights.shape))
+
+    def parse(text):
+        """
+        Return the Range of a string like "AKs, TT+, 76s-54s:0.5".
+        Later tokens overwrite the weights of earlier ones.
+        """
+        weights = np.zeros(HAND_COUNT)
+        for token in text.split(","):
+            token = token.strip()
+            if not token:
+                continue
+            weight = 1.0
+            if ":" in token:
+                token, weight = token.split(":", 1)
+                token = token.strip()
+                try:
+                    weight = float(weight)
+                except ValueError:
+                    raise RangeParseException("Bad weight %r" % weight)
+            weights[parse_hands(token)] = weight
+        return Range(weights)
+
+    parse = staticmethod(parse)
+
+    def full():
+        """
+        Return the range of every hand.
+        """
+        return Range(np.ones(HAND_COUNT))
+
+    full = staticmethod(full)
+
+    def set(self, hole_cards, weight=1.0):
+        self.weights[hand_index(hole_cards)] = weight
+
+    def weight(self, hole_cards):
+        return float(self.weights[hand_index(hole_cards)])
+
+    def remove_cards(self, cards):
+        """
+        Return a copy without the hands holding any of these cards,
+        e.g. the board or our own hole cards.
+        """
+        weights = self.weights.copy()
+        for card in cards:
+            weights[CARD_HANDS[int(card)]] = 0.0
+        return Range(weights)
+
+    def combos(self):
+        """
+        Return the number of combos, counting each by its weight.
+        """
+        return float(self.weights.sum())
+
+    def hands(self):
+        """
+        Return [(card, card, weight)] for every hand with a weight.
+        """
+        return [(int(HANDS[hand, 0]), int(HANDS[hand, 1]), float(self.weights[hand]))
+                for hand in np.flatnonzero(self.weights)]
+
+    def __repr__(self):
+        return "<Range(%.1f combos)>" % self.combos()
+
+
+class RangeEquity:
+    """
+    The equity of a range against another, and of each of its hands
+    against the other range (nan for hands that never meet it).
+    """
+    def __init__(self, equity, hand_equities):
+        self.equity = equity
+        self.hand_equities = hand_equities
+
+    def hand_equity(self, hole_cards):
+        return float(self.hand_equities[hand_index(hole_cards)])
+
+    def __repr__(self):
+        return "<RangeEquity(equity=%.4f)>" % self.equity
+
+    def as_dict(self):
+        return {"equity": self.equity}
+
+
+def ranked_weights(ranks, weights):
+    """
+    Return the weight of the worse and of the equal ranks in the same
+    row for each entry of ranks [..., k], found by sorting each row.
+    """
+    last = ranks.shape[-1] - 1
+    order = np.argsort(ranks, axis=-1)
+    ranks = np.take_along_axis(ranks, order, axis=-1)
+    weights = np.take_along_axis(weights, order, axis=-1)
+    weight_up_to = np.cumsum(weights, axis=-1)
+
+    # First and last position of each run of equal ranks
+    positions = np.arange(last + 1)
+    starts = np.ones(ranks.shape, dtype=bool)
+    starts[..., 1:] = ranks[..., 1:] != ranks[..., :-1]
+    ends = np.ones(ranks.shape, dtype=bool)
+    ends[..., :-1] = starts[..., 1:]
+    first = np.maximum.accumulate(np.where(starts, positions, 0), axis=-1)
+    end = np.minimum.accumulate(np.where(ends, positions, last)[..., ::-1], axis=-1)[..., ::-1]
+
+    better_or_equal = np.take_along_axis(weight_up_to, end, axis=-1)
+    better = np.take_along_axis(weight_up_to - weights, first, axis=-1)
+    worse = np.empty(ranks.shape)
+    equal = np.empty(ranks.shape)
+    np.put_along_axis(worse, order, weight_up_to[..., -1:] - better_or_equal, axis=-1)
+    np.put_along_axis(equal, order, better_or_equal - better, axis=-1)
+    return worse, equal
+
+
+def runout_shares(board, runouts, villain_weights):
+    """
+    Return (shares, totals) summed over the runouts: for each hand,
+    the villain weight it beats plus half the weight it ties, and the
+    villain weight it can meet, without hands that share its cards.
+    """
+    n = len(runouts)
+    boards = np.hstack([np.tile(np.array(board, dtype=np.intp), (n, 1)), runouts])
+
+    # Hands left in the deck on each board
+    used = np.zeros((n, 52), dtype=bool)
+    used[np.arange(n)[:, np.newaxis], boards] = True
+    valid = ~(used[:, HANDS[:, 0]] | used[:, HANDS[:, 1]])
+
+    runout_index, hand = np.nonzero(valid)
+    ranks = np.zeros((n, HAND_COUNT), dtype=np.intp)
+    ranks[runout_index, hand] = evaluate_seven(np.hstack([HANDS[hand], boards[runout_index]]))
+    weights = np.where(valid, villain_weights, 0.0)
+
+    # Worse and equal villain weight than each hand against the whole
+    # deck...
+    worse, equal = ranked_weights(ranks, weights)
+    total = weights.sum(axis=1)[:, np.newaxis]
+
+    # ...and take back out the villain hands holding one of our cards
+    card_worse, card_equal = ranked_weights(ranks[:, CARD_HANDS], weights[:, CARD_HANDS])
+    card_total = weights[:, CARD_HANDS].sum(axis=2)
+    a, b = HANDS[:, 0], HANDS[:, 1]
+    position_a, position_b = HAND_POSITIONS[:, 0], HAND_POSITIONS[:, 1]
+    worse = worse - card_worse[:, a, position_a] - card_worse[:, b, position_b]
+    # our own hand is in both card groups
+    equal = equal - card_equal[:, a, position_a] - card_equal[:, b, position_b] + weights
+    totals = total - card_total[:, a] - card_total[:, b] + weights
+
+    shares = np.where(valid, worse + 0.5 * equal, 0.0).sum(axis=0)
+    return shares, np.where(valid, totals, 0.0).sum(axis=0)
+
+
+def all_runouts(board):
+    deck = [card for card in range(52) if card not in board]
+    length = 5 - len(board)
+    if length == 0:
+        return np.zeros((1, 0), dtype=np.intp)
+    return np.array(list(combinations(deck, length)), dtype=np.intp)
+
+
+def preflop_shares(villain_weights, path=DEFAULT_PATH):
+    """
+    Return (shares, totals) for every hand from the preflop table.
+    """
+    _, _, equities = PreflopTable.load(path).numpy()
+    disjoint = PreflopTable.disjoint()
+    met = disjoint * villain_weights
+    return (equities * met).sum(axis=1), met.sum(axis=1)
+
+
+class PreflopTable:
+    """
+    The preflop equity table and which hands can meet, on first use.
+    """
+    table = None
+    disjoint_hands = None
+
+    def load(path=DEFAULT_PATH):
+        if PreflopTable.table is None:
+            PreflopTable.table = PreflopEquity(path)
+        return PreflopTable.table
+
+    def disjoint():
+        if PreflopTable.disjoint_hands is None:
+            shared = np.zeros((HAND_COUNT, HAND_COUNT), dtype=bool)
+            for card in range(52):
+                shared[np.ix_(CARD_HANDS[card], CARD_HANDS[card])] = True
+            PreflopTable.disjoint_hands = ~shared
+        return PreflopTable.disjoint_hands
+
+    load = staticmethod(load)
+    disjoint = staticmethod(disjoint)
+
+
+def range_equity(hero, villain, board=[], samples=2000, seed=None):
+    """
+    Return the RangeEquity of hero against villain on board, with
+    both ranges' weights as the odds of holding each hand. Every runout
+    of a 3 or 4-card board is dealt. Preflop the equities come from the
+    preflop table if it has been built (see pokereval.preflop), or from
+    that many sampled boards otherwise.
+    """
+    if len(board) not in (0, 3, 4, 5):
+        raise HandLengthException("Only 0, 3, 4, 5 board cards are supported")
+    board = [int(card) for card in board]
+    if len(set(board)) != len(board):
+        raise ValueError("The same card is dealt twice: %s" % board)
+    hero = hero.remove_cards(board)
+    villain = villain.remove_cards(board)
+
+    if not board and os.path.exists(DEFAULT_PATH):
+        shares, totals = preflop_shares(villain.weights)
+    else:
+        if board:
+            runouts = all_runouts(board)
+        else:
+            rng = np.random.RandomState(seed)
+            runouts = np.argsort(rng.rand(samples, 52), axis=1)[:, :5]
+        shares = np.zeros(HAND_COUNT)
+        totals = np.zeros(HAND_COUNT)
+        for start in range(0, len(runouts), CHUNK):
+            chunk_shares, chunk_totals = runout_shares(board, runouts[start:start + CHUNK], villain.weights)
+            shares += chunk_shares
+            totals += chunk_totals
+
+    met = hero.weights * totals
+    if not met.sum():
+        raise ValueError("The ranges never meet on this board")
+    with np.errstate(invalid="ignore", divide="ignore"):
+        hand_equities = np.where(hero.weights * totals > 0, shares / totals, np.nan)
+    return RangeEquity(float((hero.weights * shares).sum() / met.sum()), hand_equities)
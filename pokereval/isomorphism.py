@@ -0,0 +1,122 @@
+"""
+Suit isomorphism: hands that only differ by a renaming of suits have
+the same ranks, percentiles and equities, so caches can key them on
+one canonical form and get up to 24 times as many hits.
+
+A permutation is a tuple of 4 suit indexes (suit - 1, i.e. card % 4):
+card c becomes c - c % 4 + permutation[c % 4]. Suits are renamed in
+order of the ranks they hold on the board, then in the hole cards, so
+any two isomorphic (hole cards, board) give the same canonical cards.
+
+The 1,755 canonical flops are in LookupTables.Flops, numbered by
+FlopIndex.index. The table was generated with:
+    python -m pokereval.isomorphism
+"""
+from itertools import combinations
+
+from .card import Card
+from .lookup_tables import LookupTables
+
+def suit_permutation(hole_cards, board=[]):
+    """
+    Return the permutation that takes hole_cards and board to their
+    canonical form.
+    """
+    signatures = []
+    for suit in range(4):
+        board_ranks = sorted([int(card) >> 2 for card in board if int(card) & 3 == suit], reverse=True)
+        hole_ranks = sorted([int(card) >> 2 for card in hole_cards if int(card) & 3 == suit], reverse=True)
+        signatures.append((len(board_ranks), board_ranks, len(hole_ranks), hole_ranks))
+    # Suits with equal signatures hold the same ranks, either order will do
+    order = sorted(range(4), key=lambda suit: signatures[suit], reverse=True)
+    permutation = [0] * 4
+    for new_suit, suit in enumerate(order):
+        permutation[suit] = new_suit
+    return tuple(permutation)
+
+
+def permute(cards, permutation):
+    """
+    Return the cards with their suits renamed by permutation.
+    """
+    return [Card.from_int(int(card) - int(card) % 4 + permutation[int(card) % 4]) for card in cards]
+
+
+def inverse(permutation):
+    """
+    Return the permutation that undoes permutation.
+    """
+    undo = [0] * 4
+    for suit, new_suit in enumerate(permutation):
+        undo[new_suit] = suit
+    return tuple(undo)
+
+
+def canonicalize(hole_cards, board=[]):
+    """
+    Return (hole cards, board, permutation): the canonical hole cards
+    and board as sorted tuples of Cards, and the permutation that gave
+    them. permute(canonical cards, inverse(permutation)) gives back the
+    original cards.
+    """
+    permutation = suit_permutation(hole_cards, board)
+    return (tuple(sorted(permute(hole_cards, permutation))),
+            tuple(sorted(permute(board, permutation))),
+            permutation)
+
+
+def canonical_board(board):
+    """
+    Return (board, permutation) for a board alone. Hole cards put
+    through the same permutation keep their ranks against the board.
+    """
+    _, board, permutation = canonicalize([], board)
+    return board, permutation
+
+
+class FlopIndex:
+    """
+    Index of each canonical flop in LookupTables.Flops.canonical_flops,
+    built on first use.
+    """
+    indexes = None
+
+    def index(flop):
+        """
+        Return the index of the canonical form of a 3-card flop.
+        """
+        if FlopIndex.indexes is None:
+            FlopIndex.indexes = dict(
+                (flop, index) for index, flop in enumerate(LookupTables.Flops.canonical_flops))
+        board, _ = canonical_board(flop)
+        return FlopIndex.indexes[tuple(int(card) for card in board)]
+
+    index = staticmethod(index)
+
+
+def canonical_flops():
+    """
+    Return every canonical flop as a sorted tuple of card values, and
+    the number of flops isomorphic to each.
+    """
+    counts = {}
+    for flop in combinations(range(52), 3):
+        board, _ = canonical_board(flop)
+        key = tuple(int(card) for card in board)
+        counts[key] = counts.get(key, 0) + 1
+    flops = sorted(counts)
+    return flops, [counts[flop] for flop in flops]
+
+
+if __name__ == "__main__":
+    flops, counts = canonical_flops()
+    print('"""\nThe canonical flops for pokereval.isomorphism, imported by LookupTables on first use.\n"""\n')
+    print("class Flops:")
+    print('    """')
+    print("    canonical_flops holds the %d flops up to suit isomorphism as sorted" % len(flops))
+    print("    card values, flop_counts how many of the 22100 flops are each one.")
+    print('    """')
+    for name, values in (("canonical_flops", flops), ("flop_counts", counts)):
+        rows = [", ".join(str(value) for value in values[start:start + 8])
+                for start in range(0, len(values), 8)]
+        print("    %s = [\n        %s\n    ]" % (name, ",\n        ".join(rows)))
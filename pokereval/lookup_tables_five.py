@@ -0,0 +1,7404 @@
+"""
+Lookup tables for the 5-card evaluator, imported by LookupTables on first use.
+"""
+from .perfect_hash import PerfectHash
+
+class Five:
+    """
+    Lookup tables for 5-card evaluator
+    """
+    # Map card rank and suit to our binary representation
+    # card_to_binary[rank][suit]
+    card_to_binary = [[], [],
+        [0, 69634, 73730, 81922, 98306], 
+        [0, 135427, 139523, 147715, 164099],
+        [0, 266757, 270853, 279045, 295429],
+        [0, 529159, 533255, 541447, 557831],
+        [0, 1053707, 1057803, 1065995, 1082379],
+        [0, 2102541, 2106637, 2114829, 2131213],
+        [0, 4199953, 4204049, 4212241, 4228625],
+        [0, 8394515, 8398611, 8406803, 8423187],
+        [0, 16783383, 16787479, 16795671, 16812055],
+        [0, 33560861, 33564957, 33573149, 33589533],
+        [0, 67115551, 67119647, 67127839, 67144223],
+        [0, 134224677, 134228773, 134236965, 134253349],
+        [0, 268442665, 268446761, 268454953, 268471337]
+    ]
+    # Map flush AND value to rank of flushes in 5-card hands
+    flushes = [
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 9, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 1599, 0, 0, 0, 0, 0, 0, 0, 1598, 0, 0, 0, 1597, 0, 1596,
+        8, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1595, 0, 0, 0,
+        0, 0, 0, 0, 1594, 0, 0, 0, 1593, 0, 1592, 1591, 0, 0, 0, 0, 0, 0,
+        0,  0,  1590,  0, 0, 0, 1589, 0, 1588, 1587, 0, 0, 0, 0, 1586, 0,
+        1585, 1584, 0, 0, 1583, 1582, 0, 7, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 1581, 0, 0, 0, 0, 0, 0, 0, 1580, 0, 0, 0,
+        1579, 0, 1578, 1577, 0, 0, 0, 0, 0, 0, 0, 0, 1576, 0, 0, 0, 1575,
+        0, 1574, 1573, 0, 0, 0, 0, 1572, 0, 1571, 1570, 0, 0, 1569, 1568,
+        0, 1567, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1566, 0, 0,  0,  1565,  0,
+        1564, 1563, 0, 0, 0, 0, 1562, 0, 1561, 1560, 0, 0, 1559, 1558, 0,
+        1557, 0, 0, 0, 0, 0, 0, 1556, 0, 1555, 1554, 0, 0, 1553, 1552, 0,
+        1551, 0, 0, 0, 0, 1550, 1549, 0, 1548, 0, 0, 0, 6, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1547, 0, 0, 0,
+        0, 0, 0, 0, 1546, 0, 0, 0, 1545, 0, 1544, 1543, 0, 0, 0, 0, 0, 0,
+        0, 0, 1542, 0, 0, 0, 1541, 0, 1540, 1539, 0, 0, 0,  0,  1538,  0,
+        1537, 1536, 0, 0, 1535, 1534, 0, 1533, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 1532, 0, 0, 0, 1531, 0, 1530, 1529, 0, 0, 0, 0, 1528, 0, 1527,
+        1526, 0, 0, 1525, 1524, 0, 1523, 0, 0, 0, 0, 0, 0, 1522, 0, 1521,
+        1520, 0, 0, 1519, 1518, 0, 1517, 0, 0, 0, 0, 1516, 1515, 0, 1514,
+        0, 0, 0, 1513, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1512, 0,
+        0, 0, 1511, 0, 1510, 1509, 0, 0, 0, 0, 1508, 0, 1507, 1506, 0, 0,
+        1505, 1504, 0, 1503, 0, 0, 0, 0, 0, 0, 1502, 0, 1501, 1500, 0, 0,
+        1499, 1498, 0, 1497, 0, 0, 0, 0, 1496, 1495, 0, 1494,  0,  0,  0,
+        1493,  0,  0,  0, 0, 0, 0, 0, 0, 0, 0, 1492, 0, 1491, 1490, 0, 0,
+        1489, 1488, 0, 1487, 0, 0, 0, 0, 1486, 1485, 0, 1484,  0,  0,  0,
+        1483, 0, 0, 0, 0, 0, 0, 0, 0, 1482, 1481, 0, 1480, 0, 0, 0, 1479,
+        0, 0, 0, 0, 0, 0, 0, 5, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1478, 0, 0, 0, 0,
+        0, 0, 0, 1477, 0, 0, 0, 1476, 0, 1475, 1474, 0, 0, 0, 0, 0, 0, 0,
+        0, 1473, 0, 0, 0, 1472, 0, 1471, 1470, 0, 0, 0, 0, 1469, 0, 1468,
+        1467, 0, 0, 1466, 1465, 0, 1464, 0, 0, 0, 0, 0, 0, 0,  0,  0,  0,
+        1463,  0,  0,  0, 1462, 0, 1461, 1460, 0, 0, 0, 0, 1459, 0, 1458,
+        1457, 0, 0, 1456, 1455, 0, 1454, 0, 0, 0, 0, 0, 0, 1453, 0, 1452,
+        1451, 0, 0, 1450, 1449, 0, 1448, 0, 0, 0, 0, 1447, 1446, 0, 1445,
+        0, 0, 0, 1444, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1443, 0,
+        0, 0, 1442, 0, 1441, 1440, 0, 0, 0, 0, 1439, 0, 1438, 1437, 0, 0,
+        1436, 1435, 0, 1434, 0, 0, 0, 0, 0, 0, 1433, 0, 1432, 1431, 0, 0,
+        1430,  1429,  0,  1428, 0, 0, 0, 0, 1427, 1426, 0, 1425, 0, 0, 0,
+        1424, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1423, 0, 1422,  1421,  0,  0,
+        1420,  1419,  0,  1418, 0, 0, 0, 0, 1417, 1416, 0, 1415, 0, 0, 0,
+        1414, 0, 0, 0, 0, 0, 0, 0, 0, 1413, 1412, 0, 1411, 0, 0, 0, 1410,
+        0, 0, 0, 0, 0, 0, 0, 1409, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 1408, 0, 0, 0, 1407, 0, 1406, 1405, 0,
+        0, 0, 0, 1404, 0, 1403, 1402, 0, 0, 1401, 1400, 0, 1399, 0, 0, 0,
+        0, 0, 0, 1398, 0, 1397, 1396, 0, 0, 1395, 1394, 0, 1393, 0, 0, 0,
+        0, 1392, 1391, 0, 1390, 0, 0, 0, 1389, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 1388, 0, 1387, 1386, 0, 0, 1385, 1384, 0, 1383, 0,  0,  0,  0,
+        1382, 1381, 0, 1380, 0, 0, 0, 1379, 0, 0, 0, 0, 0, 0, 0, 0, 1378,
+        1377, 0, 1376, 0, 0, 0, 1375, 0, 0, 0, 0, 0, 0, 0, 1374, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1373, 0, 1372, 1371,
+        0, 0, 1370, 1369, 0, 1368, 0, 0, 0, 0, 1367, 1366, 0, 1365, 0, 0,
+        0,  1364,  0,  0, 0, 0, 0, 0, 0, 0, 1363, 1362, 0, 1361, 0, 0, 0,
+        1360, 0, 0, 0, 0, 0, 0, 0, 1359, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 1358, 1357, 0, 1356, 0, 0, 0, 1355, 0, 0, 0, 0, 0,
+        0, 0, 1354, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 4, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        1353, 0, 0, 0, 0, 0, 0, 0, 1352, 0, 0, 0, 1351, 0, 1350, 1349, 0,
+        0, 0, 0, 0, 0, 0, 0, 1348, 0, 0, 0, 1347, 0, 1346, 1345, 0, 0, 0,
+        0, 1344, 0, 1343, 1342, 0, 0, 1341, 1340, 0, 1339, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 1338, 0, 0, 0, 1337, 0, 1336, 1335, 0,  0,  0,  0,
+        1334, 0, 1333, 1332, 0, 0, 1331, 1330, 0, 1329, 0, 0, 0, 0, 0, 0,
+        1328, 0, 1327, 1326, 0, 0, 1325, 1324, 0, 1323, 0, 0, 0, 0, 1322,
+        1321, 0, 1320, 0, 0, 0, 1319, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 1318, 0, 0, 0, 1317, 0, 1316, 1315, 0, 0, 0,  0,  1314,  0,
+        1313, 1312, 0, 0, 1311, 1310, 0, 1309, 0, 0, 0, 0, 0, 0, 1308, 0,
+        1307, 1306, 0, 0, 1305, 1304, 0, 1303, 0, 0, 0, 0, 1302, 1301, 0,
+        1300, 0, 0, 0, 1299, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1298, 0, 1297,
+        1296, 0, 0, 1295, 1294, 0, 1293, 0, 0, 0, 0, 1292, 1291, 0, 1290,
+        0, 0, 0, 1289, 0, 0, 0, 0, 0, 0, 0, 0, 1288, 1287, 0, 1286, 0, 0,
+        0, 1285, 0, 0, 0, 0, 0, 0, 0, 1284, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1283, 0, 0, 0, 1282, 0, 1281,
+        1280, 0, 0, 0, 0, 1279, 0, 1278, 1277, 0, 0, 1276, 1275, 0, 1274,
+        0, 0, 0, 0, 0, 0, 1273, 0, 1272, 1271, 0, 0, 1270, 1269, 0, 1268,
+        0, 0, 0, 0, 1267, 1266, 0, 1265, 0, 0, 0, 1264, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 1263, 0, 1262, 1261, 0, 0, 1260, 1259, 0, 1258, 0, 0,
+        0, 0, 1257, 1256, 0, 1255, 0, 0, 0, 1254, 0, 0, 0, 0, 0, 0, 0, 0,
+        1253, 1252, 0, 1251, 0, 0, 0, 1250, 0, 0, 0, 0, 0, 0, 0, 1249, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1248, 0, 1247,
+        1246, 0, 0, 1245, 1244, 0, 1243, 0, 0, 0, 0, 1242, 1241, 0, 1240,
+        0, 0, 0, 1239, 0, 0, 0, 0, 0, 0, 0, 0, 1238, 1237, 0, 1236, 0, 0,
+        0, 1235, 0, 0, 0, 0, 0, 0, 0, 1234, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 1233, 1232, 0, 1231, 0, 0, 0, 1230, 0, 0, 0, 0,
+        0, 0, 0, 1229, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1228,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0,  0,  0,  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1227, 0, 0, 0,
+        1226, 0, 1225, 1224, 0, 0, 0, 0, 1223, 0, 1222, 1221, 0, 0, 1220,
+        1219, 0, 1218, 0, 0, 0, 0, 0, 0, 1217, 0, 1216, 1215, 0, 0, 1214,
+        1213, 0, 1212, 0, 0, 0, 0, 1211, 1210, 0, 1209, 0, 0, 0, 1208, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 1207, 0, 1206, 1205, 0, 0, 1204, 1203,
+        0, 1202, 0, 0, 0, 0, 1201, 1200, 0, 1199, 0, 0, 0, 1198, 0, 0, 0,
+        0, 0, 0, 0, 0, 1197, 1196, 0, 1195, 0, 0, 0, 1194, 0, 0, 0, 0, 0,
+        0, 0, 1193, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        1192, 0, 1191, 1190, 0, 0, 1189, 1188, 0, 1187, 0, 0, 0, 0, 1186,
+        1185, 0, 1184, 0, 0, 0, 1183, 0, 0, 0, 0, 0, 0, 0, 0, 1182, 1181,
+        0, 1180, 0, 0, 0, 1179, 0, 0, 0, 0, 0, 0, 0, 1178, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1177, 1176, 0, 1175,  0,  0,  0,
+        1174, 0, 0, 0, 0, 0, 0, 0, 1173, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 1172, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0,  0,  0,  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1171, 0,
+        1170, 1169, 0, 0, 1168, 1167, 0, 1166, 0, 0, 0, 0, 1165, 1164, 0,
+        1163, 0, 0, 0, 1162, 0, 0, 0, 0, 0, 0, 0, 0, 1161, 1160, 0, 1159,
+        0, 0, 0, 1158, 0, 0, 0, 0, 0, 0, 0, 1157, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 1156, 1155, 0, 1154, 0, 0, 0, 1153, 0, 0,
+        0, 0, 0, 0, 0, 1152, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        1151, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1150, 1149, 0, 1148, 0, 0, 0,
+        1147, 0, 0, 0, 0, 0, 0, 0, 1146, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 1145, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 1144, 0, 0, 0, 0, 0, 0, 0, 1143, 0, 0, 0, 1142,
+        0, 1141, 1140, 0, 0, 0, 0, 0, 0, 0, 0, 1139, 0, 0,  0,  1138,  0,
+        1137, 1136, 0, 0, 0, 0, 1135, 0, 1134, 1133, 0, 0, 1132, 1131, 0,
+        1130, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1129, 0, 0, 0, 1128, 0, 1127,
+        1126, 0, 0, 0, 0, 1125, 0, 1124, 1123, 0, 0, 1122, 1121, 0, 1120,
+        0, 0, 0, 0, 0, 0, 1119, 0, 1118, 1117, 0, 0, 1116, 1115, 0, 1114,
+        0, 0, 0, 0, 1113, 1112, 0, 1111, 0, 0, 0, 1110, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 1109, 0, 0, 0, 1108, 0, 1107, 1106, 0, 0,
+        0, 0, 1105, 0, 1104, 1103, 0, 0, 1102, 1101, 0, 1100, 0, 0, 0, 0,
+        0, 0, 1099, 0, 1098, 1097, 0, 0, 1096, 1095, 0, 1094, 0, 0, 0, 0,
+        1093, 1092, 0, 1091, 0, 0, 0, 1090, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        1089, 0, 1088, 1087, 0, 0, 1086, 1085, 0, 1084, 0, 0, 0, 0, 1083,
+        1082, 0, 1081, 0, 0, 0, 1080, 0, 0, 0, 0, 0, 0, 0, 0, 1079, 1078,
+        0, 1077, 0, 0, 0, 1076, 0, 0, 0, 0, 0, 0, 0, 1075, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1074, 0, 0, 0,
+        1073, 0, 1072, 1071, 0, 0, 0, 0, 1070, 0, 1069, 1068, 0, 0, 1067,
+        1066, 0, 1065, 0, 0, 0, 0, 0, 0, 1064, 0, 1063, 1062, 0, 0, 1061,
+        1060, 0, 1059, 0, 0, 0, 0, 1058, 1057, 0, 1056, 0, 0, 0, 1055, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 1054, 0, 1053, 1052, 0, 0, 1051, 1050,
+        0, 1049, 0, 0, 0, 0, 1048, 1047, 0, 1046, 0, 0, 0, 1045, 0, 0, 0,
+        0, 0, 0, 0, 0, 1044, 1043, 0, 1042, 0, 0, 0, 1041, 0, 0, 0, 0, 0,
+        0, 0, 1040, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        1039, 0, 1038, 1037, 0, 0, 1036, 1035, 0, 1034, 0, 0, 0, 0, 1033,
+        1032, 0, 1031, 0, 0, 0, 1030, 0, 0, 0, 0, 0, 0, 0, 0, 1029, 1028,
+        0, 1027, 0, 0, 0, 1026, 0, 0, 0, 0, 0, 0, 0, 1025, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1024, 1023, 0, 1022,  0,  0,  0,
+        1021, 0, 0, 0, 0, 0, 0, 0, 1020, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 1019, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        1018, 0, 0, 0, 1017, 0, 1016, 1015, 0, 0, 0, 0,  1014,  0,  1013,
+        1012, 0, 0, 1011, 1010, 0, 1009, 0, 0, 0, 0, 0, 0, 1008, 0, 1007,
+        1006, 0, 0, 1005, 1004, 0, 1003, 0, 0, 0, 0, 1002, 1001, 0, 1000,
+        0,  0, 0, 999, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 998, 0, 997, 996, 0,
+        0, 995, 994, 0, 993, 0, 0, 0, 0, 992, 991, 0, 990, 0, 0, 0,  989,
+        0,  0, 0, 0, 0, 0, 0, 0, 988, 987, 0, 986, 0, 0, 0, 985, 0, 0, 0,
+        0, 0, 0, 0, 984, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,  0,
+        0,  0, 983, 0, 982, 981, 0, 0, 980, 979, 0, 978, 0, 0, 0, 0, 977,
+        976, 0, 975, 0, 0, 0, 974, 0, 0, 0, 0, 0, 0, 0, 0, 973,  972,  0,
+        971, 0, 0, 0, 970, 0, 0, 0, 0, 0, 0, 0, 969, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 968, 967, 0, 966, 0, 0, 0, 965, 0,  0,
+        0,  0, 0, 0, 0, 964, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        963, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,  0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 962, 0, 961, 960, 0, 0,
+        959, 958, 0, 957, 0, 0, 0, 0, 956, 955, 0, 954, 0, 0, 0, 953,  0,
+        0,  0, 0, 0, 0, 0, 0, 952, 951, 0, 950, 0, 0, 0, 949, 0, 0, 0, 0,
+        0, 0, 0, 948, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,  0,  0,  0,  0,
+        947,  946,  0, 945, 0, 0, 0, 944, 0, 0, 0, 0, 0, 0, 0, 943, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 942, 0, 0, 0, 0, 0, 0,  0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 941, 940, 0, 939, 0, 0, 0, 938, 0, 0, 0,  0,  0,  0,  0,
+        937,  0,  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 936, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0,  0, 0, 0, 0, 0, 935, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 934, 0, 0, 0,  933,  0,  932,
+        931,  0, 0, 0, 0, 930, 0, 929, 928, 0, 0, 927, 926, 0, 925, 0, 0,
+        0, 0, 0, 0, 924, 0, 923, 922, 0, 0, 921, 920, 0, 919, 0, 0, 0, 0,
+        918,  917,  0,  916,  0, 0, 0, 915, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        914, 0, 913, 912, 0, 0, 911, 910, 0, 909, 0, 0, 0, 0,  908,  907,
+        0,  906,  0, 0, 0, 905, 0, 0, 0, 0, 0, 0, 0, 0, 904, 903, 0, 902,
+        0, 0, 0, 901, 0, 0, 0, 0, 0, 0, 0, 900, 0, 0, 0, 0, 0, 0,  0,  0,
+        0,  0,  0, 0, 0, 0, 0, 0, 0, 0, 899, 0, 898, 897, 0, 0, 896, 895,
+        0, 894, 0, 0, 0, 0, 893, 892, 0, 891, 0, 0, 0, 890, 0, 0,  0,  0,
+        0,  0, 0, 0, 889, 888, 0, 887, 0, 0, 0, 886, 0, 0, 0, 0, 0, 0, 0,
+        885, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 884, 883, 0,
+        882, 0, 0, 0, 881, 0, 0, 0, 0, 0, 0, 0, 880, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 879, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,  0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        878, 0, 877, 876, 0, 0, 875, 874, 0, 873, 0, 0, 0, 0,  872,  871,
+        0,  870,  0, 0, 0, 869, 0, 0, 0, 0, 0, 0, 0, 0, 868, 867, 0, 866,
+        0, 0, 0, 865, 0, 0, 0, 0, 0, 0, 0, 864, 0, 0, 0, 0, 0, 0,  0,  0,
+        0,  0, 0, 0, 0, 0, 0, 0, 863, 862, 0, 861, 0, 0, 0, 860, 0, 0, 0,
+        0, 0, 0, 0, 859, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,  0,  0,  0,  0,
+        858,  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 857, 856, 0, 855,  0,  0,  0,
+        854,  0,  0, 0, 0, 0, 0, 0, 853, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 852, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,  0,
+        0,  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 851, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 850,  0,  849,
+        848,  0, 0, 847, 846, 0, 845, 0, 0, 0, 0, 844, 843, 0, 842, 0, 0,
+        0, 841, 0, 0, 0, 0, 0, 0, 0, 0, 840, 839, 0, 838, 0, 0,  0,  837,
+        0,  0, 0, 0, 0, 0, 0, 836, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 835, 834, 0, 833, 0, 0, 0, 832, 0, 0, 0,  0,  0,  0,  0,
+        831,  0,  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 830, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0,  0, 0, 0, 0, 0, 0, 829, 828, 0, 827, 0, 0, 0, 826, 0, 0, 0, 0,
+        0, 0, 0, 825, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,  0,  824,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 823, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,  0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0,  0, 0, 0, 0, 0, 0, 0, 0, 822, 821, 0, 820, 0, 0, 0, 819, 0, 0,
+        0, 0, 0, 0, 0, 818, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,  0,
+        817,  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 816, 0, 0, 0, 0, 0, 0, 0, 0,  0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0,  0,  0,  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        10, 0, 0, 0, 0, 0, 0, 0, 815, 0, 0, 0, 814, 0, 813, 812, 0, 0, 0,
+        0,  0,  0, 0, 0, 811, 0, 0, 0, 810, 0, 809, 808, 0, 0, 0, 0, 807,
+        0, 806, 805, 0, 0, 804, 803, 0, 802, 0, 0, 0, 0, 0, 0, 0,  0,  0,
+        0,  801, 0, 0, 0, 800, 0, 799, 798, 0, 0, 0, 0, 797, 0, 796, 795,
+        0, 0, 794, 793, 0, 792, 0, 0, 0, 0, 0, 0, 791, 0, 790, 789, 0, 0,
+        788,  787, 0, 786, 0, 0, 0, 0, 785, 784, 0, 783, 0, 0, 0, 782, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 781, 0, 0, 0, 780, 0, 779,
+        778,  0, 0, 0, 0, 777, 0, 776, 775, 0, 0, 774, 773, 0, 772, 0, 0,
+        0, 0, 0, 0, 771, 0, 770, 769, 0, 0, 768, 767, 0, 766, 0, 0, 0, 0,
+        765,  764,  0,  763,  0, 0, 0, 762, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        761, 0, 760, 759, 0, 0, 758, 757, 0, 756, 0, 0, 0, 0,  755,  754,
+        0,  753,  0, 0, 0, 752, 0, 0, 0, 0, 0, 0, 0, 0, 751, 750, 0, 749,
+        0, 0, 0, 748, 0, 0, 0, 0, 0, 0, 0, 747, 0, 0, 0, 0, 0, 0,  0,  0,
+        0,  0,  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 746, 0, 0, 0, 745, 0,
+        744, 743, 0, 0, 0, 0, 742, 0, 741, 740, 0, 0, 739, 738,  0,  737,
+        0, 0, 0, 0, 0, 0, 736, 0, 735, 734, 0, 0, 733, 732, 0, 731, 0, 0,
+        0, 0, 730, 729, 0, 728, 0, 0, 0, 727, 0, 0, 0, 0, 0, 0, 0, 0,  0,
+        0,  726,  0,  725,  724, 0, 0, 723, 722, 0, 721, 0, 0, 0, 0, 720,
+        719, 0, 718, 0, 0, 0, 717, 0, 0, 0, 0, 0, 0, 0, 0, 716,  715,  0,
+        714, 0, 0, 0, 713, 0, 0, 0, 0, 0, 0, 0, 712, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 711, 0, 710,  709,  0,  0,  708,
+        707, 0, 706, 0, 0, 0, 0, 705, 704, 0, 703, 0, 0, 0, 702, 0, 0, 0,
+        0, 0, 0, 0, 0, 701, 700, 0, 699, 0, 0, 0, 698, 0, 0, 0, 0, 0,  0,
+        0, 697, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 696, 695,
+        0, 694, 0, 0, 0, 693, 0, 0, 0, 0, 0, 0, 0, 692, 0, 0, 0, 0, 0, 0,
+        0,  0, 0, 0, 0, 0, 0, 0, 0, 691, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0,  0,  0, 0, 0, 690, 0, 0, 0, 689, 0, 688, 687, 0, 0, 0, 0, 686,
+        0, 685, 684, 0, 0, 683, 682, 0, 681, 0, 0, 0, 0, 0,  0,  680,  0,
+        679,  678,  0, 0, 677, 676, 0, 675, 0, 0, 0, 0, 674, 673, 0, 672,
+        0, 0, 0, 671, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 670, 0, 669, 668,  0,
+        0,  667, 666, 0, 665, 0, 0, 0, 0, 664, 663, 0, 662, 0, 0, 0, 661,
+        0, 0, 0, 0, 0, 0, 0, 0, 660, 659, 0, 658, 0, 0, 0, 657, 0, 0,  0,
+        0,  0, 0, 0, 656, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 655, 0, 654, 653, 0, 0, 652, 651, 0, 650, 0, 0, 0, 0,  649,
+        648,  0,  647, 0, 0, 0, 646, 0, 0, 0, 0, 0, 0, 0, 0, 645, 644, 0,
+        643, 0, 0, 0, 642, 0, 0, 0, 0, 0, 0, 0, 641, 0, 0, 0, 0, 0, 0, 0,
+        0,  0, 0, 0, 0, 0, 0, 0, 0, 640, 639, 0, 638, 0, 0, 0, 637, 0, 0,
+        0, 0, 0, 0, 0, 636, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,  0,
+        635,  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 634, 0, 633, 632, 0, 0,
+        631,  630, 0, 629, 0, 0, 0, 0, 628, 627, 0, 626, 0, 0, 0, 625, 0,
+        0, 0, 0, 0, 0, 0, 0, 624, 623, 0, 622, 0, 0, 0, 621, 0, 0, 0,  0,
+        0,  0,  0,  620,  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        619, 618, 0, 617, 0, 0, 0, 616, 0, 0, 0, 0, 0, 0, 0, 615,  0,  0,
+        0,  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 614, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0,  0,  0,  613,  612, 0, 611, 0, 0, 0, 610, 0, 0, 0, 0, 0, 0, 0,
+        609, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 608, 0,  0,  0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 607, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,  0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0,  0,  0,  0, 0, 0, 0, 0, 0, 0, 0, 0, 606, 0, 0, 0, 605, 0, 604,
+        603, 0, 0, 0, 0, 602, 0, 601, 600, 0, 0, 599, 598, 0, 597, 0,  0,
+        0, 0, 0, 0, 596, 0, 595, 594, 0, 0, 593, 592, 0, 591, 0, 0, 0, 0,
+        590, 589, 0, 588, 0, 0, 0, 587, 0, 0, 0, 0, 0, 0,  0,  0,  0,  0,
+        586,  0,  585, 584, 0, 0, 583, 582, 0, 581, 0, 0, 0, 0, 580, 579,
+        0, 578, 0, 0, 0, 577, 0, 0, 0, 0, 0, 0, 0, 0, 576, 575,  0,  574,
+        0,  0,  0, 573, 0, 0, 0, 0, 0, 0, 0, 572, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 571, 0, 570, 569, 0, 0,  568,  567,
+        0,  566,  0, 0, 0, 0, 565, 564, 0, 563, 0, 0, 0, 562, 0, 0, 0, 0,
+        0, 0, 0, 0, 561, 560, 0, 559, 0, 0, 0, 558, 0, 0, 0, 0, 0, 0,  0,
+        557, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 556, 555, 0,
+        554, 0, 0, 0, 553, 0, 0, 0, 0, 0, 0, 0, 552, 0, 0, 0, 0, 0, 0, 0,
+        0,  0, 0, 0, 0, 0, 0, 0, 551, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        550,  0,  549, 548, 0, 0, 547, 546, 0, 545, 0, 0, 0, 0, 544, 543,
+        0, 542, 0, 0, 0, 541, 0, 0, 0, 0, 0, 0, 0, 0, 540, 539,  0,  538,
+        0,  0,  0, 537, 0, 0, 0, 0, 0, 0, 0, 536, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 535, 534, 0, 533, 0, 0, 0, 532, 0, 0,  0,
+        0,  0,  0,  0,  531, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        530, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,  0,
+        0,  0,  0,  0, 0, 0, 0, 0, 0, 0, 0, 0, 529, 528, 0, 527, 0, 0, 0,
+        526, 0, 0, 0, 0, 0, 0, 0, 525, 0, 0, 0, 0, 0, 0, 0, 0, 0,  0,  0,
+        0,  0, 0, 0, 524, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 523, 0, 0, 0, 0,  0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0,  0,  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 522, 0, 521,
+        520, 0, 0, 519, 518, 0, 517, 0, 0, 0, 0, 516, 515, 0, 514, 0,  0,
+        0,  513,  0, 0, 0, 0, 0, 0, 0, 0, 512, 511, 0, 510, 0, 0, 0, 509,
+        0, 0, 0, 0, 0, 0, 0, 508, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,  0,
+        0,  0,  0,  507,  506, 0, 505, 0, 0, 0, 504, 0, 0, 0, 0, 0, 0, 0,
+        503, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 502, 0,  0,  0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 501, 500, 0, 499, 0, 0, 0, 498, 0, 0, 0,  0,
+        0,  0,  0, 497, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 496,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0,  0, 0, 0, 0, 0, 0, 0, 0, 495, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 494, 493, 0, 492, 0, 0, 0, 491, 0,  0,
+        0,  0, 0, 0, 0, 490, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        489, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,  0,
+        0,  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 488, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 487, 0, 0, 0, 0, 0, 0, 0, 0, 0,  0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 486, 0, 0, 0,  485,  0,
+        484,  483,  0, 0, 0, 0, 482, 0, 481, 480, 0, 0, 479, 478, 0, 477,
+        0, 0, 0, 0, 0, 0, 476, 0, 475, 474, 0, 0, 473, 472, 0, 471, 0, 0,
+        0,  0, 470, 469, 0, 468, 0, 0, 0, 467, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 466, 0, 465, 464, 0, 0, 463, 462, 0, 461, 0,  0,  0,  0,  460,
+        459,  0,  458, 0, 0, 0, 457, 0, 0, 0, 0, 0, 0, 0, 0, 456, 455, 0,
+        454, 0, 0, 0, 453, 0, 0, 0, 0, 0, 0, 0, 452, 0, 0, 0, 0, 0, 0, 0,
+        0,  0,  0,  0,  0, 0, 0, 0, 0, 0, 0, 451, 0, 450, 449, 0, 0, 448,
+        447, 0, 446, 0, 0, 0, 0, 445, 444, 0, 443, 0, 0, 0, 442, 0, 0, 0,
+        0,  0, 0, 0, 0, 441, 440, 0, 439, 0, 0, 0, 438, 0, 0, 0, 0, 0, 0,
+        0, 437, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 436, 435,
+        0, 434, 0, 0, 0, 433, 0, 0, 0, 0, 0, 0, 0, 432, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 431, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,  0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 430, 0, 429, 428, 0, 0, 427, 426, 0, 425, 0,  0,  0,  0,  424,
+        423,  0,  422, 0, 0, 0, 421, 0, 0, 0, 0, 0, 0, 0, 0, 420, 419, 0,
+        418, 0, 0, 0, 417, 0, 0, 0, 0, 0, 0, 0, 416, 0, 0, 0, 0, 0, 0, 0,
+        0,  0, 0, 0, 0, 0, 0, 0, 0, 415, 414, 0, 413, 0, 0, 0, 412, 0, 0,
+        0, 0, 0, 0, 0, 411, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,  0,
+        410,  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 409, 408, 0, 407,  0,  0,  0,
+        406,  0,  0, 0, 0, 0, 0, 0, 405, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 404, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,  0,
+        0,  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 403, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 402,  0,  401,
+        400,  0, 0, 399, 398, 0, 397, 0, 0, 0, 0, 396, 395, 0, 394, 0, 0,
+        0, 393, 0, 0, 0, 0, 0, 0, 0, 0, 392, 391, 0, 390, 0, 0,  0,  389,
+        0,  0, 0, 0, 0, 0, 0, 388, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 387, 386, 0, 385, 0, 0, 0, 384, 0, 0, 0,  0,  0,  0,  0,
+        383,  0,  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 382, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0,  0, 0, 0, 0, 0, 0, 381, 380, 0, 379, 0, 0, 0, 378, 0, 0, 0, 0,
+        0, 0, 0, 377, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,  0,  376,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 375, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,  0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0,  0, 0, 0, 0, 0, 0, 0, 0, 374, 373, 0, 372, 0, 0, 0, 371, 0, 0,
+        0, 0, 0, 0, 0, 370, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,  0,
+        369,  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 368, 0, 0, 0, 0, 0, 0, 0, 0,  0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0,  0, 0, 0, 0, 0, 0, 0, 0, 0, 367, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0,  0,  0, 0, 0, 0, 0, 0, 0, 0, 366, 0, 365, 364, 0, 0, 363, 362,
+        0, 361, 0, 0, 0, 0, 360, 359, 0, 358, 0, 0, 0, 357, 0, 0,  0,  0,
+        0,  0, 0, 0, 356, 355, 0, 354, 0, 0, 0, 353, 0, 0, 0, 0, 0, 0, 0,
+        352, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 351, 350, 0,
+        349, 0, 0, 0, 348, 0, 0, 0, 0, 0, 0, 0, 347, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 346, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,  0,
+        0,  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 345,
+        344, 0, 343, 0, 0, 0, 342, 0, 0, 0, 0, 0, 0, 0, 341, 0, 0, 0,  0,
+        0,  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 340, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        339,  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        338, 337, 0, 336, 0, 0, 0, 335, 0, 0, 0, 0, 0, 0, 0, 334,  0,  0,
+        0,  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 333, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0,  0, 332, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 331, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,  0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0,  0,  0,  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        330, 329, 0, 328, 0, 0, 0, 327, 0, 0, 0, 0, 0, 0, 0, 326,  0,  0,
+        0,  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 325, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0,  0, 324, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 323, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,  0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1]
+        # Map binary representation of ranks having popcount of 5 to rank
+    unique5 = [
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 1608, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 7462, 0, 0, 0, 0, 0, 0, 0, 7461, 0, 0,  0,  7460,  0,
+        7459, 1607, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 7458,
+        0, 0, 0, 0, 0, 0, 0, 7457, 0, 0, 0, 7456, 0, 7455, 7454, 0, 0, 0,
+        0,  0,  0,  0, 0, 7453, 0, 0, 0, 7452, 0, 7451, 7450, 0, 0, 0, 0,
+        7449, 0, 7448, 7447, 0, 0, 7446, 7445, 0, 1606, 0, 0, 0, 0, 0, 0,
+        0,  0,  0,  0, 0, 0, 0, 0, 0, 0, 0, 0, 7444, 0, 0, 0, 0, 0, 0, 0,
+        7443, 0, 0, 0, 7442, 0, 7441, 7440, 0, 0, 0, 0, 0, 0, 0, 0, 7439,
+        0, 0, 0, 7438, 0, 7437, 7436, 0, 0, 0, 0, 7435, 0, 7434, 7433, 0,
+        0, 7432, 7431, 0, 7430, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 7429, 0, 0,
+        0,  7428,  0,  7427, 7426, 0, 0, 0, 0, 7425, 0, 7424, 7423, 0, 0,
+        7422, 7421, 0, 7420, 0, 0, 0, 0, 0, 0, 7419, 0, 7418, 7417, 0, 0,
+        7416,  7415,  0,  7414, 0, 0, 0, 0, 7413, 7412, 0, 7411, 0, 0, 0,
+        1605, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0,  0,  7410,  0, 0, 0, 0, 0, 0, 0, 7409, 0, 0, 0, 7408, 0, 7407,
+        7406, 0, 0, 0, 0, 0, 0, 0, 0, 7405, 0, 0, 0, 7404, 0, 7403, 7402,
+        0, 0, 0, 0, 7401, 0, 7400, 7399, 0, 0, 7398, 7397, 0, 7396, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 7395, 0, 0, 0, 7394, 0, 7393, 7392, 0, 0,
+        0, 0, 7391, 0, 7390, 7389, 0, 0, 7388, 7387, 0, 7386, 0, 0, 0, 0,
+        0, 0, 7385, 0, 7384, 7383, 0, 0, 7382, 7381, 0, 7380, 0, 0, 0, 0,
+        7379, 7378, 0, 7377, 0, 0, 0, 7376, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 7375, 0, 0, 0, 7374, 0, 7373, 7372, 0, 0, 0, 0, 7371,
+        0, 7370, 7369, 0, 0, 7368, 7367, 0, 7366, 0, 0, 0, 0, 0, 0, 7365,
+        0, 7364, 7363, 0, 0, 7362, 7361, 0, 7360, 0, 0, 0, 0, 7359, 7358,
+        0,  7357,  0,  0, 0, 7356, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 7355, 0,
+        7354, 7353, 0, 0, 7352, 7351, 0, 7350, 0, 0, 0, 0, 7349, 7348, 0,
+        7347, 0, 0, 0, 7346, 0, 0, 0, 0, 0, 0, 0, 0, 7345, 7344, 0, 7343,
+        0, 0, 0, 7342, 0, 0, 0, 0, 0, 0, 0, 1604, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        7341, 0, 0, 0, 0, 0, 0, 0, 7340, 0, 0, 0, 7339, 0, 7338, 7337, 0,
+        0, 0, 0, 0, 0, 0, 0, 7336, 0, 0, 0, 7335, 0, 7334, 7333, 0, 0, 0,
+        0, 7332, 0, 7331, 7330, 0, 0, 7329, 7328, 0, 7327, 0, 0, 0, 0, 0,
+        0,  0,  0,  0, 0, 7326, 0, 0, 0, 7325, 0, 7324, 7323, 0, 0, 0, 0,
+        7322, 0, 7321, 7320, 0, 0, 7319, 7318, 0, 7317, 0, 0, 0, 0, 0, 0,
+        7316, 0, 7315, 7314, 0, 0, 7313, 7312, 0, 7311, 0, 0, 0, 0, 7310,
+        7309, 0, 7308, 0, 0, 0, 7307, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0,  0,  7306,  0, 0, 0, 7305, 0, 7304, 7303, 0, 0, 0, 0, 7302, 0,
+        7301, 7300, 0, 0, 7299, 7298, 0, 7297, 0, 0, 0, 0, 0, 0, 7296, 0,
+        7295, 7294, 0, 0, 7293, 7292, 0, 7291, 0, 0, 0, 0, 7290, 7289, 0,
+        7288, 0, 0, 0, 7287, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 7286, 0, 7285,
+        7284, 0, 0, 7283, 7282, 0, 7281, 0, 0, 0, 0, 7280, 7279, 0, 7278,
+        0, 0, 0, 7277, 0, 0, 0, 0, 0, 0, 0, 0, 7276, 7275, 0, 7274, 0, 0,
+        0, 7273, 0, 0, 0, 0, 0, 0, 0, 7272, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 7271, 0, 0, 0, 7270, 0, 7269,
+        7268, 0, 0, 0, 0, 7267, 0, 7266, 7265, 0, 0, 7264, 7263, 0, 7262,
+        0, 0, 0, 0, 0, 0, 7261, 0, 7260, 7259, 0, 0, 7258, 7257, 0, 7256,
+        0, 0, 0, 0, 7255, 7254, 0, 7253, 0, 0, 0, 7252, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 7251, 0, 7250, 7249, 0, 0, 7248, 7247, 0, 7246, 0, 0,
+        0, 0, 7245, 7244, 0, 7243, 0, 0, 0, 7242, 0, 0, 0, 0, 0, 0, 0, 0,
+        7241, 7240, 0, 7239, 0, 0, 0, 7238, 0, 0, 0, 0, 0, 0, 0, 7237, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 7236, 0, 7235,
+        7234, 0, 0, 7233, 7232, 0, 7231, 0, 0, 0, 0, 7230, 7229, 0, 7228,
+        0, 0, 0, 7227, 0, 0, 0, 0, 0, 0, 0, 0, 7226, 7225, 0, 7224, 0, 0,
+        0, 7223, 0, 0, 0, 0, 0, 0, 0, 7222, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 7221, 7220, 0, 7219, 0, 0, 0, 7218, 0, 0, 0, 0,
+        0, 0, 0, 7217, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1603,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0,  0,  7216,  0, 0, 0, 0, 0, 0, 0, 7215, 0, 0, 0, 7214, 0, 7213,
+        7212, 0, 0, 0, 0, 0, 0, 0, 0, 7211, 0, 0, 0, 7210, 0, 7209, 7208,
+        0, 0, 0, 0, 7207, 0, 7206, 7205, 0, 0, 7204, 7203, 0, 7202, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 7201, 0, 0, 0, 7200, 0, 7199, 7198, 0, 0,
+        0, 0, 7197, 0, 7196, 7195, 0, 0, 7194, 7193, 0, 7192, 0, 0, 0, 0,
+        0, 0, 7191, 0, 7190, 7189, 0, 0, 7188, 7187, 0, 7186, 0, 0, 0, 0,
+        7185, 7184, 0, 7183, 0, 0, 0, 7182, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 7181, 0, 0, 0, 7180, 0, 7179, 7178, 0, 0, 0, 0, 7177,
+        0, 7176, 7175, 0, 0, 7174, 7173, 0, 7172, 0, 0, 0, 0, 0, 0, 7171,
+        0, 7170, 7169, 0, 0, 7168, 7167, 0, 7166, 0, 0, 0, 0, 7165, 7164,
+        0,  7163,  0,  0, 0, 7162, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 7161, 0,
+        7160, 7159, 0, 0, 7158, 7157, 0, 7156, 0, 0, 0, 0, 7155, 7154, 0,
+        7153, 0, 0, 0, 7152, 0, 0, 0, 0, 0, 0, 0, 0, 7151, 7150, 0, 7149,
+        0, 0, 0, 7148, 0, 0, 0, 0, 0, 0, 0, 7147, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 7146, 0, 0, 0, 7145, 0,
+        7144, 7143, 0, 0, 0, 0, 7142, 0, 7141, 7140, 0, 0, 7139, 7138, 0,
+        7137, 0, 0, 0, 0, 0, 0, 7136, 0, 7135, 7134, 0, 0, 7133, 7132, 0,
+        7131, 0, 0, 0, 0, 7130, 7129, 0, 7128, 0, 0, 0, 7127, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 7126, 0, 7125, 7124, 0, 0, 7123, 7122, 0, 7121,
+        0, 0, 0, 0, 7120, 7119, 0, 7118, 0, 0, 0, 7117, 0, 0, 0, 0, 0, 0,
+        0,  0,  7116,  7115, 0, 7114, 0, 0, 0, 7113, 0, 0, 0, 0, 0, 0, 0,
+        7112, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 7111,
+        0, 7110, 7109, 0, 0, 7108, 7107, 0, 7106, 0, 0, 0, 0, 7105, 7104,
+        0, 7103, 0, 0, 0, 7102, 0, 0, 0, 0, 0, 0, 0, 0,  7101,  7100,  0,
+        7099, 0, 0, 0, 7098, 0, 0, 0, 0, 0, 0, 0, 7097, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 7096, 7095, 0, 7094, 0, 0, 0, 7093,
+        0, 0, 0, 0, 0, 0, 0, 7092, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 7091, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 7090,
+        0, 0, 0, 7089, 0, 7088, 7087, 0, 0, 0, 0, 7086, 0, 7085, 7084, 0,
+        0, 7083, 7082, 0, 7081, 0, 0, 0, 0, 0, 0, 7080, 0, 7079, 7078, 0,
+        0, 7077, 7076, 0, 7075, 0, 0, 0, 0, 7074, 7073, 0, 7072, 0, 0, 0,
+        7071,  0,  0,  0, 0, 0, 0, 0, 0, 0, 0, 7070, 0, 7069, 7068, 0, 0,
+        7067, 7066, 0, 7065, 0, 0, 0, 0, 7064, 7063, 0, 7062,  0,  0,  0,
+        7061, 0, 0, 0, 0, 0, 0, 0, 0, 7060, 7059, 0, 7058, 0, 0, 0, 7057,
+        0, 0, 0, 0, 0, 0, 0, 7056, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 7055, 0, 7054, 7053, 0, 0, 7052, 7051, 0, 7050, 0,
+        0, 0, 0, 7049, 7048, 0, 7047, 0, 0, 0, 7046, 0, 0, 0, 0, 0, 0, 0,
+        0, 7045, 7044, 0, 7043, 0, 0, 0, 7042, 0, 0, 0, 0, 0, 0, 0, 7041,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,  7040,  7039,  0,
+        7038, 0, 0, 0, 7037, 0, 0, 0, 0, 0, 0, 0, 7036, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 7035, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 7034, 0, 7033, 7032, 0, 0, 7031, 7030, 0, 7029, 0,  0,  0,  0,
+        7028, 7027, 0, 7026, 0, 0, 0, 7025, 0, 0, 0, 0, 0, 0, 0, 0, 7024,
+        7023, 0, 7022, 0, 0, 0, 7021, 0, 0, 0, 0, 0, 0, 0, 7020, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 7019, 7018, 0, 7017, 0, 0,
+        0, 7016, 0, 0, 0, 0, 0, 0, 0, 7015, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 7014, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 7013, 7012, 0,
+        7011, 0, 0, 0, 7010, 0, 0, 0, 0, 0, 0, 0, 7009, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 7008, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1602,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0,  0,  0,  0, 0, 0, 0, 0, 0, 0, 0, 0, 7007, 0, 0, 0, 0, 0, 0, 0,
+        7006, 0, 0, 0, 7005, 0, 7004, 7003, 0, 0, 0, 0, 0, 0, 0, 0, 7002,
+        0, 0, 0, 7001, 0, 7000, 6999, 0, 0, 0, 0, 6998, 0, 6997, 6996, 0,
+        0, 6995, 6994, 0, 6993, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6992, 0, 0,
+        0,  6991,  0,  6990, 6989, 0, 0, 0, 0, 6988, 0, 6987, 6986, 0, 0,
+        6985, 6984, 0, 6983, 0, 0, 0, 0, 0, 0, 6982, 0, 6981, 6980, 0, 0,
+        6979,  6978,  0,  6977, 0, 0, 0, 0, 6976, 6975, 0, 6974, 0, 0, 0,
+        6973, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6972,  0,  0,  0,
+        6971, 0, 6970, 6969, 0, 0, 0, 0, 6968, 0, 6967, 6966, 0, 0, 6965,
+        6964, 0, 6963, 0, 0, 0, 0, 0, 0, 6962, 0, 6961, 6960, 0, 0, 6959,
+        6958, 0, 6957, 0, 0, 0, 0, 6956, 6955, 0, 6954, 0, 0, 0, 6953, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 6952, 0, 6951, 6950, 0, 0, 6949, 6948,
+        0, 6947, 0, 0, 0, 0, 6946, 6945, 0, 6944, 0, 0, 0, 6943, 0, 0, 0,
+        0, 0, 0, 0, 0, 6942, 6941, 0, 6940, 0, 0, 0, 6939, 0, 0, 0, 0, 0,
+        0, 0, 6938, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 6937, 0, 0, 0, 6936, 0, 6935, 6934, 0, 0, 0, 0, 6933,
+        0, 6932, 6931, 0, 0, 6930, 6929, 0, 6928, 0, 0, 0, 0, 0, 0, 6927,
+        0, 6926, 6925, 0, 0, 6924, 6923, 0, 6922, 0, 0, 0, 0, 6921, 6920,
+        0,  6919,  0,  0, 0, 6918, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6917, 0,
+        6916, 6915, 0, 0, 6914, 6913, 0, 6912, 0, 0, 0, 0, 6911, 6910, 0,
+        6909, 0, 0, 0, 6908, 0, 0, 0, 0, 0, 0, 0, 0, 6907, 6906, 0, 6905,
+        0, 0, 0, 6904, 0, 0, 0, 0, 0, 0, 0, 6903, 0, 0, 0, 0, 0, 0, 0, 0,
+        0,  0,  0,  0, 0, 0, 0, 0, 0, 0, 6902, 0, 6901, 6900, 0, 0, 6899,
+        6898, 0, 6897, 0, 0, 0, 0, 6896, 6895, 0, 6894, 0, 0, 0, 6893, 0,
+        0, 0, 0, 0, 0, 0, 0, 6892, 6891, 0, 6890, 0, 0, 0, 6889, 0, 0, 0,
+        0, 0, 0, 0, 6888, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        6887, 6886, 0, 6885, 0, 0, 0, 6884, 0, 0, 0, 0, 0, 0, 0, 6883, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6882, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6881, 0, 0, 0, 6880, 0, 6879, 6878,
+        0, 0, 0, 0, 6877, 0, 6876, 6875, 0, 0, 6874, 6873, 0, 6872, 0, 0,
+        0, 0, 0, 0, 6871, 0, 6870, 6869, 0, 0, 6868, 6867, 0, 6866, 0, 0,
+        0, 0, 6865, 6864, 0, 6863, 0, 0, 0, 6862, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 6861, 0, 6860, 6859, 0, 0, 6858, 6857, 0, 6856, 0, 0, 0, 0,
+        6855, 6854, 0, 6853, 0, 0, 0, 6852, 0, 0, 0, 0, 0, 0, 0, 0, 6851,
+        6850, 0, 6849, 0, 0, 0, 6848, 0, 0, 0, 0, 0, 0, 0, 6847, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6846, 0, 6845, 6844,
+        0, 0, 6843, 6842, 0, 6841, 0, 0, 0, 0, 6840, 6839, 0, 6838, 0, 0,
+        0,  6837,  0,  0, 0, 0, 0, 0, 0, 0, 6836, 6835, 0, 6834, 0, 0, 0,
+        6833, 0, 0, 0, 0, 0, 0, 0, 6832, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 6831, 6830, 0, 6829, 0, 0, 0, 6828, 0, 0, 0, 0, 0,
+        0, 0, 6827, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6826, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6825, 0, 6824, 6823, 0, 0, 6822,
+        6821, 0, 6820, 0, 0, 0, 0, 6819, 6818, 0, 6817, 0, 0, 0, 6816, 0,
+        0, 0, 0, 0, 0, 0, 0, 6815, 6814, 0, 6813, 0, 0, 0, 6812, 0, 0, 0,
+        0, 0, 0, 0, 6811, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        6810, 6809, 0, 6808, 0, 0, 0, 6807, 0, 0, 0, 0, 0, 0, 0, 6806, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6805, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 6804, 6803, 0, 6802, 0, 0, 0, 6801, 0, 0, 0, 0, 0, 0,
+        0, 6800, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6799, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 6798, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0,  0,  0,  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6797, 0, 0, 0, 6796, 0,
+        6795, 6794, 0, 0, 0, 0, 6793, 0, 6792, 6791, 0, 0, 6790, 6789, 0,
+        6788, 0, 0, 0, 0, 0, 0, 6787, 0, 6786, 6785, 0, 0, 6784, 6783, 0,
+        6782, 0, 0, 0, 0, 6781, 6780, 0, 6779, 0, 0, 0, 6778, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 6777, 0, 6776, 6775, 0, 0, 6774, 6773, 0, 6772,
+        0, 0, 0, 0, 6771, 6770, 0, 6769, 0, 0, 0, 6768, 0, 0, 0, 0, 0, 0,
+        0,  0,  6767,  6766, 0, 6765, 0, 0, 0, 6764, 0, 0, 0, 0, 0, 0, 0,
+        6763, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6762,
+        0, 6761, 6760, 0, 0, 6759, 6758, 0, 6757, 0, 0, 0, 0, 6756, 6755,
+        0, 6754, 0, 0, 0, 6753, 0, 0, 0, 0, 0, 0, 0, 0,  6752,  6751,  0,
+        6750, 0, 0, 0, 6749, 0, 0, 0, 0, 0, 0, 0, 6748, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6747, 6746, 0, 6745, 0, 0, 0, 6744,
+        0, 0, 0, 0, 0, 0, 0, 6743, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 6742, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0,  0,  0,  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6741, 0, 6740,
+        6739, 0, 0, 6738, 6737, 0, 6736, 0, 0, 0, 0, 6735, 6734, 0, 6733,
+        0, 0, 0, 6732, 0, 0, 0, 0, 0, 0, 0, 0, 6731, 6730, 0, 6729, 0, 0,
+        0, 6728, 0, 0, 0, 0, 0, 0, 0, 6727, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 6726, 6725, 0, 6724, 0, 0, 0, 6723, 0, 0, 0, 0,
+        0, 0, 0, 6722, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6721,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6720, 6719, 0, 6718, 0, 0, 0, 6717,
+        0, 0, 0, 0, 0, 0, 0, 6716, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 6715, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6714, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6713, 0, 6712, 6711,
+        0, 0, 6710, 6709, 0, 6708, 0, 0, 0, 0, 6707, 6706, 0, 6705, 0, 0,
+        0, 6704, 0, 0, 0, 0, 0, 0, 0, 0, 6703, 6702, 0, 6701,  0,  0,  0,
+        6700, 0, 0, 0, 0, 0, 0, 0, 6699, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 6698, 6697, 0, 6696, 0, 0, 0, 6695, 0, 0, 0, 0, 0,
+        0, 0, 6694, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6693, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 6692, 6691, 0, 6690, 0, 0, 0, 6689, 0,
+        0, 0, 0, 0, 0, 0, 6688, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 6687, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6686, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6685, 6684, 0, 6683, 0, 0, 0,
+        6682, 0, 0, 0, 0, 0, 0, 0, 6681, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 6680, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6679, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1601, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 1609, 0, 0, 0, 0, 0, 0, 0, 6678, 0, 0,  0,  6677,  0,
+        6676, 6675, 0, 0, 0, 0, 0, 0, 0, 0, 6674, 0, 0, 0, 6673, 0, 6672,
+        6671, 0, 0, 0, 0, 6670, 0, 6669, 6668, 0, 0, 6667, 6666, 0, 6665,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6664, 0, 0, 0, 6663, 0, 6662, 6661,
+        0, 0, 0, 0, 6660, 0, 6659, 6658, 0, 0, 6657, 6656, 0, 6655, 0, 0,
+        0, 0, 0, 0, 6654, 0, 6653, 6652, 0, 0, 6651, 6650, 0, 6649, 0, 0,
+        0, 0, 6648, 6647, 0, 6646, 0, 0, 0, 6645, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 6644, 0, 0, 0, 6643, 0, 6642, 6641, 0, 0, 0, 0,
+        6640, 0, 6639, 6638, 0, 0, 6637, 6636, 0, 6635, 0, 0, 0, 0, 0, 0,
+        6634, 0, 6633, 6632, 0, 0, 6631, 6630, 0, 6629, 0, 0, 0, 0, 6628,
+        6627, 0, 6626, 0, 0, 0, 6625, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6624,
+        0, 6623, 6622, 0, 0, 6621, 6620, 0, 6619, 0, 0, 0, 0, 6618, 6617,
+        0, 6616, 0, 0, 0, 6615, 0, 0, 0, 0, 0, 0, 0, 0,  6614,  6613,  0,
+        6612, 0, 0, 0, 6611, 0, 0, 0, 0, 0, 0, 0, 6610, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6609,  0,  0,  0,
+        6608, 0, 6607, 6606, 0, 0, 0, 0, 6605, 0, 6604, 6603, 0, 0, 6602,
+        6601, 0, 6600, 0, 0, 0, 0, 0, 0, 6599, 0, 6598, 6597, 0, 0, 6596,
+        6595, 0, 6594, 0, 0, 0, 0, 6593, 6592, 0, 6591, 0, 0, 0, 6590, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 6589, 0, 6588, 6587, 0, 0, 6586, 6585,
+        0, 6584, 0, 0, 0, 0, 6583, 6582, 0, 6581, 0, 0, 0, 6580, 0, 0, 0,
+        0, 0, 0, 0, 0, 6579, 6578, 0, 6577, 0, 0, 0, 6576, 0, 0, 0, 0, 0,
+        0, 0, 6575, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        6574, 0, 6573, 6572, 0, 0, 6571, 6570, 0, 6569, 0, 0, 0, 0, 6568,
+        6567, 0, 6566, 0, 0, 0, 6565, 0, 0, 0, 0, 0, 0, 0, 0, 6564, 6563,
+        0, 6562, 0, 0, 0, 6561, 0, 0, 0, 0, 0, 0, 0, 6560, 0, 0, 0, 0, 0,
+        0,  0,  0,  0, 0, 0, 0, 0, 0, 0, 0, 6559, 6558, 0, 6557, 0, 0, 0,
+        6556, 0, 0, 0, 0, 0, 0, 0, 6555, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 6554, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        6553,  0,  0,  0, 6552, 0, 6551, 6550, 0, 0, 0, 0, 6549, 0, 6548,
+        6547, 0, 0, 6546, 6545, 0, 6544, 0, 0, 0, 0, 0, 0, 6543, 0, 6542,
+        6541, 0, 0, 6540, 6539, 0, 6538, 0, 0, 0, 0, 6537, 6536, 0, 6535,
+        0, 0, 0, 6534, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6533, 0, 6532, 6531,
+        0, 0, 6530, 6529, 0, 6528, 0, 0, 0, 0, 6527, 6526, 0, 6525, 0, 0,
+        0, 6524, 0, 0, 0, 0, 0, 0, 0, 0, 6523, 6522, 0, 6521,  0,  0,  0,
+        6520, 0, 0, 0, 0, 0, 0, 0, 6519, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 6518, 0, 6517, 6516, 0, 0,  6515,  6514,  0,
+        6513, 0, 0, 0, 0, 6512, 6511, 0, 6510, 0, 0, 0, 6509, 0, 0, 0, 0,
+        0, 0, 0, 0, 6508, 6507, 0, 6506, 0, 0, 0, 6505, 0, 0, 0, 0, 0, 0,
+        0,  6504,  0,  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6503,
+        6502, 0, 6501, 0, 0, 0, 6500, 0, 0, 0, 0, 0, 0, 0, 6499, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6498, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 6497, 0, 6496, 6495, 0, 0, 6494, 6493, 0, 6492, 0, 0,
+        0, 0, 6491, 6490, 0, 6489, 0, 0, 0, 6488, 0, 0, 0, 0, 0, 0, 0, 0,
+        6487, 6486, 0, 6485, 0, 0, 0, 6484, 0, 0, 0, 0, 0, 0, 0, 6483, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6482, 6481, 0, 6480,
+        0, 0, 0, 6479, 0, 0, 0, 0, 0, 0, 0, 6478, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 6477, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0,  0,  0,  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6476,
+        6475, 0, 6474, 0, 0, 0, 6473, 0, 0, 0, 0, 0, 0, 0, 6472, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6471, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 6470, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 6469, 0, 0, 0, 6468, 0, 6467, 6466, 0, 0, 0,
+        0, 6465, 0, 6464, 6463, 0, 0, 6462, 6461, 0, 6460, 0, 0, 0, 0, 0,
+        0, 6459, 0, 6458, 6457, 0, 0, 6456, 6455, 0, 6454, 0,  0,  0,  0,
+        6453, 6452, 0, 6451, 0, 0, 0, 6450, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        6449, 0, 6448, 6447, 0, 0, 6446, 6445, 0, 6444, 0, 0, 0, 0, 6443,
+        6442, 0, 6441, 0, 0, 0, 6440, 0, 0, 0, 0, 0, 0, 0, 0, 6439, 6438,
+        0, 6437, 0, 0, 0, 6436, 0, 0, 0, 0, 0, 0, 0, 6435, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6434, 0, 6433, 6432, 0, 0,
+        6431, 6430, 0, 6429, 0, 0, 0, 0, 6428, 6427, 0, 6426,  0,  0,  0,
+        6425, 0, 0, 0, 0, 0, 0, 0, 0, 6424, 6423, 0, 6422, 0, 0, 0, 6421,
+        0, 0, 0, 0, 0, 0, 0, 6420, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 6419, 6418, 0, 6417, 0, 0, 0, 6416, 0, 0, 0, 0, 0, 0, 0,
+        6415, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6414, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 6413, 0, 6412, 6411, 0, 0, 6410, 6409,
+        0, 6408, 0, 0, 0, 0, 6407, 6406, 0, 6405, 0, 0, 0, 6404, 0, 0, 0,
+        0, 0, 0, 0, 0, 6403, 6402, 0, 6401, 0, 0, 0, 6400, 0, 0, 0, 0, 0,
+        0, 0, 6399, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6398,
+        6397, 0, 6396, 0, 0, 0, 6395, 0, 0, 0, 0, 0, 0, 0, 6394, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6393, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0,  0,  6392,  6391, 0, 6390, 0, 0, 0, 6389, 0, 0, 0, 0, 0, 0, 0,
+        6388, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6387, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 6386, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 6385, 0, 6384, 6383, 0, 0, 6382, 6381, 0,
+        6380, 0, 0, 0, 0, 6379, 6378, 0, 6377, 0, 0, 0, 6376, 0, 0, 0, 0,
+        0, 0, 0, 0, 6375, 6374, 0, 6373, 0, 0, 0, 6372, 0, 0, 0, 0, 0, 0,
+        0, 6371, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,  0,  0,  6370,
+        6369, 0, 6368, 0, 0, 0, 6367, 0, 0, 0, 0, 0, 0, 0, 6366, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6365, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 6364, 6363, 0, 6362, 0, 0, 0, 6361, 0, 0, 0, 0,  0,  0,  0,
+        6360, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6359, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 6358, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 6357, 6356, 0, 6355, 0, 0, 0, 6354, 0, 0, 0, 0,
+        0, 0, 0, 6353, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6352,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 6351, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 6350, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6349, 0, 0, 0, 6348, 0, 6347,
+        6346, 0, 0, 0, 0, 6345, 0, 6344, 6343, 0, 0, 6342, 6341, 0, 6340,
+        0, 0, 0, 0, 0, 0, 6339, 0, 6338, 6337, 0, 0, 6336, 6335, 0, 6334,
+        0, 0, 0, 0, 6333, 6332, 0, 6331, 0, 0, 0, 6330, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 6329, 0, 6328, 6327, 0, 0, 6326, 6325, 0, 6324, 0, 0,
+        0, 0, 6323, 6322, 0, 6321, 0, 0, 0, 6320, 0, 0, 0, 0, 0, 0, 0, 0,
+        6319, 6318, 0, 6317, 0, 0, 0, 6316, 0, 0, 0, 0, 0, 0, 0, 6315, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6314, 0, 6313,
+        6312, 0, 0, 6311, 6310, 0, 6309, 0, 0, 0, 0, 6308, 6307, 0, 6306,
+        0, 0, 0, 6305, 0, 0, 0, 0, 0, 0, 0, 0, 6304, 6303, 0, 6302, 0, 0,
+        0, 6301, 0, 0, 0, 0, 0, 0, 0, 6300, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 6299, 6298, 0, 6297, 0, 0, 0, 6296, 0, 0, 0, 0,
+        0, 0, 0, 6295, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6294,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6293, 0, 6292,  6291,  0,  0,
+        6290,  6289,  0,  6288, 0, 0, 0, 0, 6287, 6286, 0, 6285, 0, 0, 0,
+        6284, 0, 0, 0, 0, 0, 0, 0, 0, 6283, 6282, 0, 6281, 0, 0, 0, 6280,
+        0, 0, 0, 0, 0, 0, 0, 6279, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 6278, 6277, 0, 6276, 0, 0, 0, 6275, 0, 0, 0, 0, 0, 0, 0,
+        6274, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6273, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 6272, 6271, 0, 6270, 0, 0, 0, 6269, 0, 0, 0,
+        0, 0, 0, 0, 6268, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,  0,  0,  0,
+        6267, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6266, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6265, 0, 6264, 6263, 0, 0,
+        6262, 6261, 0, 6260, 0, 0, 0, 0, 6259, 6258, 0, 6257,  0,  0,  0,
+        6256, 0, 0, 0, 0, 0, 0, 0, 0, 6255, 6254, 0, 6253, 0, 0, 0, 6252,
+        0, 0, 0, 0, 0, 0, 0, 6251, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 6250, 6249, 0, 6248, 0, 0, 0, 6247, 0, 0, 0, 0, 0, 0, 0,
+        6246, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6245, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 6244, 6243, 0, 6242, 0, 0, 0, 6241, 0, 0, 0,
+        0,  0,  0,  0, 6240, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        6239, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6238, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6237, 6236, 0, 6235,  0,  0,  0,
+        6234, 0, 0, 0, 0, 0, 0, 0, 6233, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 6232, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6231, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6230, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6229, 0, 6228, 6227, 0,
+        0, 6226, 6225, 0, 6224, 0, 0, 0, 0, 6223, 6222, 0, 6221, 0, 0, 0,
+        6220, 0, 0, 0, 0, 0, 0, 0, 0, 6219, 6218, 0, 6217, 0, 0, 0, 6216,
+        0, 0, 0, 0, 0, 0, 0, 6215, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 6214, 6213, 0, 6212, 0, 0, 0, 6211, 0, 0, 0, 0, 0, 0, 0,
+        6210, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6209, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 6208, 6207, 0, 6206, 0, 0, 0, 6205, 0, 0, 0,
+        0, 0, 0, 0, 6204, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,  0,  0,  0,
+        6203, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6202, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0,  0,  0,  0, 0, 0, 0, 0, 0, 0, 0, 6201, 6200, 0, 6199, 0, 0, 0,
+        6198, 0, 0, 0, 0, 0, 0, 0, 6197, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 6196, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6195, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6194, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6193, 6192, 0, 6191, 0, 0, 0,
+        6190, 0, 0, 0, 0, 0, 0, 0, 6189, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 6188, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6187, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6186, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0,  0,  0,  0,  0, 0, 0, 0, 0, 0, 0, 1600]
+    # Map products of primes from 5-card hands to hand ranks
+    # All of these hands have at least a pair
+    pairs = PerfectHash(1223,
+        [
+            0, 8, 43, 2, 1, 11, 1, 4, 75, 3, 15, 71,
+            8, 79, 22, 26, 1, 1, 9, 2, 8, 10, 15, 23,
+            377, 9, 4, 123, 45, 8, 5, 3, 26, 74, 8, 3,
+            30, 4, 35, 4, 12, 16, 27, 2, 25, 121, 1, 15,
+            37, 198, 67, 210, 10, 9, 524, 222, 210, 105, 38, 2,
+            12, 41, 2, 86, 1, 6, 164, 28, 15, 616, 17, 136,
+            1, 3, 23, 203, 46, 529, 1, 560, 2, 518, 4, 18,
+            21, 3, 9, 69, 143, 192, 123, 8, 471, 17, 42, 1,
+            40, 37, 19, 12, 30, 16, 4, 3, 9, 28, 1, 239,
+            2, 14, 22, 4, 18, 57, 3, 60, 7, 6, 47, 11,
+            77, 37, 47, 177, 5, 335, 74, 209, 278, 2, 1, 161,
+            6, 142, 39, 556, 4, 98, 3, 250, 98, 11, 9, 64,
+            129, 63, 148, 296, 16, 7, 52, 1030, 1, 9, 108, 313,
+            2, 1, 16, 210, 15, 6, 37, 6, 7, 1, 13, 6,
+            2, 15, 29, 45, 4, 334, 7, 7, 1, 29, 31, 1,
+            59, 5, 3, 3, 5, 50, 2, 921, 10, 3, 1, 1,
+            1, 1, 50, 31, 22, 39, 2, 1, 13, 21, 148, 91,
+            4, 125, 1, 27, 1, 24, 170, 22, 14, 4, 4, 19,
+            25, 4, 22, 9, 196, 90, 13, 179, 13, 430, 14, 1,
+            53, 3, 255, 93, 8, 3, 43, 10, 83, 23, 49, 1076,
+            188, 620, 15, 77, 24, 1, 7, 35, 429, 8, 1, 37,
+            14, 7, 46, 16, 1, 2, 231, 96, 1, 12, 44, 36,
+            1, 134, 73, 3, 514, 422, 6, 71, 4, 12, 13, 3,
+            287, 275, 1059, 408, 3, 27, 2, 87, 1, 2, 21, 19,
+            69, 64, 63, 8, 8, 50, 8, 204, 108, 85, 12, 4,
+            3, 1112, 7, 54, 1, 19, 2, 21, 324, 1, 154, 14,
+            5, 33, 13, 3, 16, 139, 4, 37, 51, 24, 20, 53,
+            16, 4, 97, 43, 3, 152, 271, 50, 157, 295, 2, 130,
+            8, 75, 614, 123, 1160, 8, 2, 1, 137, 201, 190, 126,
+            726, 60, 1, 20, 1, 2, 23, 244, 153, 1, 15, 298,
+            143, 62, 593, 4, 478, 94, 11, 159, 68, 4, 153, 1,
+            543, 2, 1189, 50, 128, 145, 33, 4, 296, 2, 5, 231,
+            2, 22, 289, 103, 219, 27, 4, 47, 4, 9, 2, 53,
+            45, 5, 33, 145, 52, 1, 45, 274, 278, 1, 56, 71,
+            2, 2, 181, 30, 1, 637, 35, 29, 1055, 66, 99, 30,
+            3, 12, 19, 31, 18, 1, 125, 198, 103, 8, 1, 208,
+            57, 301, 44, 42, 29, 413, 58, 126, 5, 195, 1, 40,
+            42, 41, 286, 285, 59, 1, 330, 24, 114, 112, 8, 9,
+            1, 59, 7, 131, 135, 43, 551, 409, 336, 5, 36, 770,
+            4, 769, 37, 12, 78, 8, 12, 1, 58, 4, 2, 59,
+            39, 252, 128, 3, 625, 222, 2, 147, 74, 1034, 3, 12,
+            2, 149, 7, 440, 1, 42, 4, 2, 78, 1010, 161, 124,
+            31, 25, 31, 530, 26, 2, 187, 2, 221, 1, 6, 6,
+            180, 460, 75, 10, 1, 140, 1220, 138, 271, 7, 512, 2454,
+            2, 1, 4, 54, 11, 8, 8, 169, 476, 777, 925, 1,
+            13, 12, 176, 6, 532, 6, 1362, 2, 201, 22, 8, 562,
+            12, 876, 2, 3, 1, 96, 8, 734, 108, 981, 52, 4,
+            6, 7, 1, 66, 146, 12, 247, 649, 20, 28, 32, 499,
+            19, 4, 1, 226, 1, 6, 2, 1, 116, 20, 32, 78,
+            61, 10, 28, 891, 12, 19, 5, 24, 4, 139, 94, 6,
+            32, 4, 34, 214, 1, 86, 95, 39, 177, 19, 198, 596,
+            1172, 29, 3, 1, 4, 4, 3, 1442, 317, 582, 33, 102,
+            38, 10, 209, 60, 32, 249, 62, 923, 485, 527, 1932, 1,
+            8, 5, 117, 44, 3, 11, 1, 7, 112, 612, 1, 6,
+            8, 348, 69, 52, 24, 9, 2, 13, 2, 134, 2, 50,
+            12, 35, 39, 24, 6, 91, 724, 6, 262, 14, 2, 4,
+            10, 538, 256, 46, 656, 7, 610, 808, 64, 103, 388, 408,
+            36, 4, 8, 110, 5, 2, 1575, 1161, 1, 4, 3, 41,
+            1454, 71, 1045, 33, 103, 327, 3, 115, 219, 1, 3, 167,
+            1308, 9, 436, 92, 20, 22, 9, 4, 4, 71, 394, 16,
+            49, 9, 53, 17, 747, 15, 1, 399, 2, 149, 18, 1153,
+            2, 1572, 72, 3, 63, 1063, 2, 5, 79, 7, 26, 821,
+            4, 17, 111, 14, 2, 54, 224, 2, 22, 2, 1, 52,
+            1, 17, 6, 1549, 13, 41, 583, 403, 135, 1336, 2, 112,
+            2, 27, 1, 39, 87, 3, 1, 6, 25, 20, 2, 209,
+            232, 15, 11, 1107, 124, 462, 2, 2, 345, 149, 2, 21,
+            1, 67, 1277, 765, 1, 21, 5, 143, 108, 6, 14, 81,
+            35, 4, 2, 11, 193, 237, 2, 7, 126, 151, 175, 95,
+            198, 124, 2, 1, 402, 954, 2058, 160, 135, 0, 6, 124,
+            111, 302, 4, 7, 18, 181, 751, 28, 81, 326, 1, 9,
+            38, 52, 32, 85, 279, 1, 3, 254, 332, 3, 284, 64,
+            12, 1, 2, 2, 2, 21, 8, 2192, 1009, 345, 629, 33,
+            2, 19, 113, 15, 199, 43, 4, 364, 11, 5, 529, 3,
+            20, 33, 200, 1104, 1, 477, 291, 1, 1, 12, 35, 37,
+            3, 30, 57, 2, 4, 283, 477, 454, 193, 314, 13, 342,
+            331, 99, 74, 212, 47, 322, 27, 2711, 165, 57, 19, 1490,
+            0, 6, 50, 2283, 13, 542, 28, 66, 1476, 11, 1, 26,
+            57, 218, 2, 31, 184, 238, 238, 18, 87, 1677, 56, 19,
+            411, 2, 66, 1, 2328, 1, 450, 1, 1, 9, 8, 20,
+            2, 723, 269, 662, 102, 119, 618, 85, 3, 459, 73, 731,
+            179, 592, 8, 161, 1218, 317, 126, 185, 4, 1, 4045, 24,
+            4, 1087, 3628, 1404, 2060, 1335, 393, 1934, 3, 4, 1, 37,
+            28, 370, 4, 34, 318, 3410, 453, 5, 746, 19, 118, 2205,
+            535, 1, 1622, 83, 4, 38, 105, 264, 99, 13, 2471, 336,
+            121, 716, 108, 36, 482, 4636, 749, 225, 1745, 7528, 1985, 12,
+            14, 178, 20, 262, 76, 24, 95, 2110, 9, 77, 3, 2562,
+            67, 206, 458, 21, 644, 31, 108, 1382, 2, 21, 83, 1,
+            2108, 25, 17, 2820, 11, 295, 2, 1374, 21, 48, 15, 913,
+            15, 3159, 186, 80, 3, 84, 37, 55, 1, 6112, 4, 867,
+            43, 2, 8, 3481, 2856, 42, 484, 3, 29, 19, 3, 8,
+            10, 61, 1, 194, 32, 32, 1311, 118, 4, 6, 9984, 83,
+            2, 1056, 3882, 5992, 9, 9, 4, 252, 2818, 3, 17, 277,
+            2814, 7, 6, 458, 2, 1532, 5654, 32, 247, 26, 855, 19,
+            542, 21, 21, 12, 1100, 122, 146, 233, 1270, 29, 104, 3,
+            5, 4273, 518, 196, 15422, 64, 121, 1123, 1694, 3205, 7681, 9,
+            1140, 19635, 38, 399, 9, 3306, 237, 15, 59, 1826, 577, 88,
+            9, 1224, 72, 14, 110, 39, 7, 286, 3991, 9, 212, 32,
+            6200, 77, 2212, 949, 4, 24, 4, 224, 3106, 16, 23, 136,
+            123, 562, 89, 1, 12, 203, 7, 67, 348, 343, 1162, 2084,
+            8, 759, 1, 5835, 167, 14, 4866, 2055, 2493, 1, 238, 4826,
+            377, 52794, 859, 2147, 29, 3, 57, 290, 6, 159, 1745, 573,
+            8424, 170, 272, 2, 304, 292, 59, 78, 21, 2918, 151
+        ],
+        [
+            1140, 108086, 361675, 2482597, 151525, 12689261, 19551, 3617141, 9765, 312987, 1173381, 3055019,
+            497705, 156426, 997165, 454597, 107559, 743002, 581647, 146575, 112437, 48, 176001, 860343,
+            2316955, 49010, 4875, 293335, 1300233, 3328997, 234639, 9732047, 5034679, 547491, 2571233, 1016738,
+            889778, 2116543, 1114503, 24225, 171125, 5985, 19604, 2204534, 1094951, 5142179, 15060079, 620806,
+            933658, 3827391, 2424499, 425315, 3827227, 120, 2145913, 1525107, 6999643, 479085, 4692, 19844,
+            796835, 1735327, 102459, 3651583, 1016769, 2146145, 3255482, 259325, 1857505, 5411139, 175972, 5592059,
+            278690, 72, 53958, 5992765, 298265, 2541845, 850586, 356915, 49130, 4940, 80, 381938,
+            2580991, 38962, 34276, 44649, 21209177, 2600507, 29348, 1486047, 78292, 93092, 14756, 542659,
+            1275879, 13759819, 112, 3558583, 20764327, 6608797, 34317, 2585843, 4995, 9918, 31581, 64379963,
+            24244, 122199, 108, 4998, 293595, 19652, 1119371, 273885, 2678741, 1798899, 11506445, 88102,
+            1999283, 708883, 9860, 117438, 19516, 107653, 552575, 9389971, 464, 308074, 4433549, 19684,
+            1945349, 10143, 1354111, 162, 450, 29450, 259259, 4086511, 19498411, 625807, 10631543, 180,
+            14812, 3495057, 2268177, 6378985, 19665, 762671, 1310133, 342309, 244559, 1007083, 68590, 49036,
+            1886943, 2893881, 54145, 2424603, 5049, 132158, 83259, 6159049, 29575, 2977051, 14967277, 229957,
+            2830145, 11648281, 168, 49049, 147436, 2732561, 5060, 9945, 27974183, 176, 5032, 141933,
+            7434817, 259233, 3206733, 1994707, 371665, 5070, 1192895, 2126465, 12836077, 5748431, 997339, 782254,
+            14877, 498883, 489325, 5082, 49077, 200, 9975, 17905151, 8930579, 24642, 3881273, 9018565,
+            93058, 787175, 410839, 2937874, 1114673, 208, 14875, 24650, 620977, 4247887, 733381, 81947069,
+            8138705, 6315517, 347282, 58870, 29478, 4565615, 39325, 425546, 19773, 24795, 44217, 44198,
+            53998, 1007165, 102487, 811923, 1432417, 1916291, 18457339, 166419, 528143, 2405347, 4560743, 3993743,
+            1466641, 2532235, 252, 190855, 102885, 845871, 5621447, 49126, 44275, 44252, 421685, 47765779,
+            68614, 889865, 582335, 992525, 273999, 9478093, 4780723, 156674, 176157, 98022, 5145, 5827289,
+            270, 264, 93925, 5166, 9209263, 386425, 4770965, 9194653, 142025, 195730, 102921, 11394187,
+            272, 73593, 2219399, 7058519, 1618211, 29601, 63825, 280, 107822, 32515583, 3817879, 210125,
+            1999591, 83375, 8642273, 14950, 54188, 12713977, 83391, 12625991, 327795, 13955549, 132275, 220255,
+            1017005, 4042687, 1706215, 300, 73625, 304, 9522, 4834531, 368, 44289, 11560237, 274022,
+            469567, 98049, 186093, 1818677, 10108, 312, 1872431, 1070797, 9659011, 352869, 9414613, 1339634,
+            200725, 8026447, 1979939, 83421, 5175, 88305, 117670, 1701343, 1266325, 557566, 595515, 1310278,
+            68770, 4511965, 1403207, 10212, 39445, 83398, 68782, 15004, 78585, 572242, 181203, 378,
+            1065935, 973063, 16585361, 58098991, 24794, 5180, 581825, 142228, 67146, 5244, 157339, 63916,
+            1095274, 1315239, 557583, 15881473, 269059, 15028, 4619527, 29645, 73689, 19964, 83486, 562438,
+            73695, 3192101, 709142, 19894, 161733, 127426, 230115, 171475, 244783, 10150, 1657415, 1681691,
+            1026817, 171462, 7464397, 2928291, 2170679, 147033, 2048449, 24528373, 3211817, 39494, 10168, 1403225,
+            392, 171275, 9512, 5841557, 6027707, 7395949, 1295723, 655402, 405, 1955635, 10773529, 28306813,
+            19965, 1183301, 408, 308357, 235011, 13745537, 2302658, 137275, 11692487, 396, 7039139, 78625,
+            239685, 411033, 14537411, 420, 93275, 14332061, 103075, 5240333, 264275, 792281, 284053, 4042805,
+            5202, 298623, 288827, 45537047, 205751, 264385, 88445, 87598591, 166634, 117711, 500, 3578455,
+            127534, 440, 39525, 3744653, 19840843, 508805, 4951969, 83545, 171535, 3197207, 10179, 39556,
+            1388645, 456, 2121843, 254634, 15125, 1691701, 552805, 44175, 468, 34684, 21160633, 16360919,
+            63550, 29766, 68894, 5690267, 430606, 7777289, 5336, 122525, 85147693, 5324, 577239, 14742701,
+            68913, 2009451, 5528809, 1281137, 357309, 5236, 1447341, 93357, 176605, 391534, 59204, 4277489,
+            186238, 5382, 103156, 3861949, 15162, 496, 5390, 4864057, 103155, 406203, 259407, 836349,
+            6271811, 2688907, 1026861, 386630, 9370805, 1344718, 10250, 24633, 44506, 23272297, 12166747, 689843,
+            7650231, 1760213, 367114, 39627, 15190, 520, 2630257, 1965417, 1642911, 5412, 750, 191139,
+            176505, 15231541, 2289443, 23448269, 1975103, 88412, 1285999, 4458389, 2644945, 49419, 1066121, 990,
+            68875, 640871, 196075, 1554925, 20097, 25047, 11096281, 508898, 552, 2674463, 5069407, 15225,
+            240065, 7166363, 147175, 2073065, 210749, 1804231, 7068605, 15759439, 73964, 78771, 3114223, 1104299,
+            450262, 225446, 26948111, 1442399, 5343161, 30303, 39675, 445315, 293854, 69003, 2737889, 15252,
+            25012, 5768419, 929305, 9649489, 230318, 31083371, 64124, 1980218, 630, 768009, 914641, 5481,
+            303646, 33151001, 25025, 2816033, 103246, 882, 196137, 64141, 20150, 1036849, 88806, 594,
+            357425, 1750507, 5355, 298775, 592, 98397, 259666, 435638, 831575, 122815, 1379035, 885391,
+            37975471, 2459303, 11233237, 157035, 20295, 3612791, 406334, 1608717, 616, 20172, 39886, 235246,
+            24240143, 588, 64158, 44109, 24843, 567, 122825, 181447, 98394, 1085773, 132618, 66233081,
+            1711435, 381951, 39710, 1515839, 5535, 391685, 533355, 12005, 205942, 4903301, 245055, 64467,
+            684, 98735, 2092717, 1242201, 59771317, 675, 484561, 15318, 57962561, 1823885, 656, 7132231,
+            5550, 1711463, 4219007, 30015, 660, 14924, 127756, 6447947, 191301, 20125, 161975, 924482,
+            988057, 215747, 137566, 131495, 39549707, 709423, 724101, 210826, 29343331, 450385, 2791613, 1344759,
+            474734, 98441, 1794611, 5920039, 64239, 1340003, 831649, 152218, 645909, 870758, 2494235, 15345,
+            34914, 5586, 20755039, 78897, 30927079, 702, 8080567, 30663121, 919677, 20230, 2640239, 20413159,
+            78925, 54418, 103341, 2513095, 25172, 132153, 7229981, 83810, 235445, 30044, 103173, 1099825,
+            1999898, 381997, 16976747, 543286, 5576, 34850, 533533, 665482, 685055, 313565, 728, 700,
+            98494, 10891199, 650275, 1975467, 5837009, 4742101, 5624, 719345, 279357, 39882, 15375, 406445,
+            680, 587301, 782391, 206045, 744, 3591, 685069, 319390, 59409, 5643, 318478, 1496541,
+            1266749, 760, 5998331, 26782109, 777925, 1349834, 34983, 572663, 2884637, 10540, 1486667, 112651,
+            11516531, 2739369, 27671597, 274846, 1139677, 408425, 39875, 1936415, 714425, 34270547, 15428, 44764,
+            58651771, 1457395, 10557, 98553, 142538, 5445, 20349, 1804786, 249951, 20350, 22998827, 25230,
+            2141737, 19870597, 1843565, 4502641, 191425, 5684, 5704, 743774, 44770, 19591907, 949003, 269555,
+            675393, 10580, 35035, 3349085, 49735, 382075, 4678223, 1085926, 763347, 4429435, 303862, 1393915,
+            39897, 3363681, 88825, 2200429, 117334, 59450, 23502061, 6971107, 10602, 5733, 29716, 10556,
+            25270, 162129, 240149, 3295331, 35055, 9781739, 5859, 2611037, 18545843, 382109, 123025, 201243,
+            401511, 12005773, 5436299, 11194313, 171925, 323449, 1178709, 567853, 440657, 37438043, 5724677, 828,
+            69290, 1472207, 2655037, 5852, 215878, 318565, 88837, 167042, 1794759, 303918, 782971, 709631,
+            16414841, 33136241, 1428163, 12264871, 171941, 6585001, 5750, 7563113, 171955, 35090, 1325467, 93775,
+            1032226, 416361, 39975, 15548, 401698, 1589483, 294175, 211071, 455469, 5772, 5775, 963815,
+            2396009, 891, 4893779, 888, 5211503, 15561, 111265, 5780, 10660, 3427391, 157325, 2386241,
+            30225, 10625, 10647, 10578533, 117845, 1701931, 918, 20332, 152438, 53939969, 548359, 8544523,
+            343077, 3735407, 11780899, 8329847, 631465, 754377, 347967, 973617, 250325, 30258, 758582, 1721573,
+            6247789, 44919, 435953, 5814, 983411, 21875251, 289289, 10754551, 128018, 924, 1354886, 49818,
+            98716, 2738185, 333355, 15580, 523957, 35150, 41485399, 25382, 147591, 5035589, 42277273, 186694,
+            10725, 5050241, 1056757, 695045, 945, 40052, 5231281, 4302397, 186702, 9806147, 79135, 44950,
+            44954, 812383, 13306099, 235586, 984, 3271021, 1169311, 1037153, 6076, 1877953, 19645847, 2210351,
+            968, 2718669, 191607, 440781, 20482, 2997383, 3246473, 20570, 13496749, 93795, 10450, 980,
+            7005547, 84050, 20691, 25461, 1550485, 167214, 952, 2295, 69454, 744107, 172235, 59675,
+            780, 206305, 5651522, 14200637, 19572593, 191634, 186745, 142766, 836969, 377377, 54625, 108537,
+            89001, 255189, 1020, 54350669, 240526, 572907, 191675, 318734, 10875, 117325, 10309819, 7401443,
+            2181067, 50127, 4273102, 440818, 1447873, 3789227, 103675, 11132, 959077, 4375681, 3765157, 680485,
+            5740, 6047573, 30345, 445835, 225885, 4585973, 308913, 2444923, 377245, 206349, 1389223, 841841,
+            748867, 4829513, 499681, 10788, 1050, 5280233, 29282, 28713161, 80465, 983103, 470327, 142805,
+            15675, 670719, 147706, 181917, 10868, 494615, 137924, 221030, 401882, 1064, 20843129, 2581934,
+            24783229, 1053, 47204489, 10830, 133052, 49972, 1100869, 15999503, 5967, 15730, 10850, 1012894,
+            5916, 988418, 10050791, 13184083, 397010, 7851215, 616975, 998223, 5980, 1227993, 1702115, 729399,
+            186837, 20646, 1092, 607202, 406802, 147741, 6468037, 25389, 391989, 18951881, 299299, 16267463,
+            1115569, 35322, 74415, 84175, 50078671, 1159543, 59774, 2024751, 10881, 318835, 5742, 24880481,
+            1936765, 1026, 2733511, 426374, 225998, 69575, 2542903, 26860699, 1638505, 2132273, 113553, 40204,
+            5084651, 1682841, 1105819, 15778, 5950, 5617451, 934743, 8804429, 406847, 1144, 54910, 636585,
+            45125, 279775, 64676, 89125, 1125, 2146981, 299367, 94017, 25575, 240695, 50025, 50459971,
+            1076515, 832117, 40293, 59823, 196677, 1257295, 5143333, 25420, 59829, 4321933, 11154, 221122,
+            1628889, 6050, 1159171, 54925, 1951481, 568178, 2831323, 724594, 240737, 318903, 1170, 128271,
+            2767787, 1250, 2591817, 118490, 10952, 30525, 445991, 323785, 5656597, 84249, 558467, 35378,
+            52307677, 7465157, 6736849, 157604, 2215457, 3095309, 656183, 89175, 46847789, 841935, 84303, 1115661,
+            323817, 314019, 621970, 142970, 5382871, 7289185, 1682681, 3965315, 2367001, 900358, 1301027, 10060709,
+            133209, 37155143, 10989, 1281865, 3004603, 1061905, 15884, 4796351, 1267474, 1213563, 1536055, 5783557,
+            4121741, 910385, 6125, 1516262, 1076537, 997694, 314041, 31860737, 793117, 465595, 438741, 17529601,
+            59565, 6138, 15903, 186998, 1242, 1240, 128877, 729554, 25625, 1536639, 328757, 2425683,
+            221221, 13438339, 372775, 128986, 1399205, 671099, 602485, 25636, 40362, 15925, 1956449, 18809653,
+            45254, 6150, 431365, 4170751, 2904739, 20825, 3047653, 231035, 1511653, 55915103, 40375, 3833459,
+            11050, 978835, 11473481, 4757297, 294151, 1135234, 3168685, 55055, 8550017, 817581, 5622483, 612157,
+            582958, 13482071, 2044471, 15939, 10314971, 270193, 10652251, 10188541, 1692197, 1377, 1288, 2709239,
+            6658769, 76840601, 280053, 11020, 4688719, 231275, 455877, 6188, 235543, 7250, 1907689, 773605,
+            162578, 30628, 94178, 1125655, 1281974, 8115389, 137547, 1448161, 1389535, 113135, 12871417, 1497067,
+            1856261, 417027, 30340, 13902787, 602547, 1058529, 543895, 578289, 1135345, 117875, 3545129, 20452727,
+            10354117, 1323, 817663, 5397691, 661227, 11115, 1332, 35525, 1531309, 6883643, 50286, 2117843,
+            583015, 837199, 45325, 13642381, 1433531, 50225, 6232, 338169, 1257962, 113775, 1352, 1213511,
+            1013173, 30668, 10158731, 270231, 138229, 1272245, 6380, 888925, 15950, 133342, 99127, 954845,
+            45356, 2357381, 1657466, 1372, 11473589, 436449, 27775163, 28092913, 1350537, 270215, 22990, 74698,
+            60226417, 1380, 3779831, 382655, 15735841, 969215, 25641, 5852327, 1386, 1423807, 21402, 40455,
+            2274393, 6292, 192027, 304175, 9640535, 143143, 362674, 45387, 338675, 35588, 74727, 40508,
+            1414127, 20956, 680846, 455793, 10432409, 148010, 3427887, 30723, 15320479, 3662497, 94221, 539121,
+            13707797, 1286965, 123627, 1448402, 1213526, 147994, 25857, 861707, 280041, 1242989, 158015, 1203935,
+            6324, 30758, 1213682, 431607, 1731785, 35650, 3085771, 10999439, 240994, 1470, 10275973, 734638,
+            2293907, 1096381, 133133, 456025, 69874, 731235, 368039, 734635, 255626, 1106139, 66737381, 5964803,
+            187187, 353379, 6316751, 1452, 2997797, 284954, 514786, 2469901, 104044, 55223, 6975, 6348,
+            480491, 172546, 21054, 55233, 8560357, 1140377, 2572619, 60125, 4131833, 759115, 563615, 1476,
+            2631218, 1492309, 21033, 25916, 2215763, 872053, 1480, 16275, 9855703, 7172191, 6375, 6396,
+            13863863, 8477283, 74958, 1497238, 1496, 6649159, 128673, 9166493, 3628411, 3339611, 6370, 206635,
+            651605, 177489, 519622, 50375, 2988073, 1485, 25947, 69938, 3706577, 99275, 749177, 13990963,
+            10496123, 1428, 2831647, 16150, 21315, 309442, 17437013, 1530, 544011, 8907509, 11270, 2416193,
+            30855, 387686, 65065, 35739, 6435, 314171, 1442926, 11375, 250821, 50430, 6580783, 480766,
+            153065, 8452891, 11319, 104181, 333925, 11316, 265475, 1042685, 30875, 11322, 11492, 1433729,
+            1457427, 6409653, 4395859, 3124979, 588115, 1950, 866723, 1539, 245985, 314534, 192185, 1849243,
+            446369, 16182, 255507, 33978053, 3022345, 3007693, 109089, 1566, 700553, 1716, 1834963, 593021,
+            930291, 9968453, 1575, 21125, 11385, 221559, 1640, 2861062, 2132902, 60236, 123783, 1482627,
+            50468, 1272467, 74907, 26026, 17598389, 197098, 36734893, 206886, 319319, 417074, 55545, 6650,
+            1619527, 1710, 1596, 3286355, 891219, 1208938, 1116, 1526657, 3872901, 30932, 754354, 1507121,
+            89590, 1218725, 5178013, 202027, 1722202, 109174, 21164, 260678, 35836, 49140673, 773927, 241129,
+            123823, 21175, 143375, 529529, 485537, 1624, 2313649, 84721, 920, 21303313, 133570, 285131,
+            319345, 910803, 412269, 4884763, 637143, 114057, 1761319, 1326561, 578347, 26998049, 260642, 30969,
+            7206529, 6498, 2176895, 11396, 7431413, 55419, 5896579, 30693379, 64992503, 60333, 60306, 3022438,
+            260710, 35875, 2641171, 1638, 17974933, 1687829, 651775, 29916757, 348725, 460955, 21021, 16245,
+            167865, 602823, 22261483, 651695, 89661, 1672, 109142, 226525, 1018381, 24319027, 886414, 1540,
+            2294155, 12136, 1674, 73952233, 26125, 12823423, 16317, 153062, 373182, 417175, 7998403, 3569929,
+            573562, 1262723, 295075, 45619, 1700, 15247367, 3926629, 505161, 769119, 2758535, 216775, 15745927,
+            4449731, 1277479, 145509, 1199266, 866822, 4180963, 6268121, 1433905, 6525, 681207, 36075, 21266,
+            1650, 3379321, 40817, 407407, 246123, 9523541, 4767521, 798475, 8272201, 1512118, 94622, 65219,
+            651833, 10383865, 182590, 338997, 1257949, 119119, 50575, 4352051, 50578, 1736, 172822, 27462497,
+            104284, 2866105, 138621, 676286, 1755, 4621643, 1370369, 1644155, 1086891, 343915, 55506, 11284,
+            3692193, 862017, 45747, 11532, 451451, 6460, 339031, 2137822, 133705, 290145, 1878755, 1306877,
+            6170417, 16428, 6612, 265727, 397822, 260110, 7367987, 427025, 2216035, 6009133, 1768, 1751629,
+            612, 431457, 123981, 353717, 2372461, 35972, 38152661, 6669, 1663705, 12333497, 20922427, 411845,
+            3516263, 36998113, 4459939, 1756645, 1740, 109330, 10784723, 40898, 216890, 1300, 563914, 862025,
+            31213, 788785, 3467443, 60775, 705686, 65348, 246202, 1604986, 99567, 500395, 13018667, 177735,
+            20262569, 2167055, 696, 729147, 5784321, 45815, 6229171, 3154591, 65366, 2019719, 32902213, 40959,
+            17349337, 2998165, 50692, 5891843, 1639187, 4533001, 26588, 9230371, 363562, 490637, 246235, 852267,
+            7358377, 8516807, 725249, 827421, 109388, 3066613, 18129667, 1365581, 119164, 172887, 1585285, 16492,
+            127738, 1258085, 11625, 505325, 427063, 6728, 60515, 12568919, 378235, 1860, 700843, 2553439,
+            1863, 109554, 348843, 4425499, 80073, 1702851, 3374585, 1875, 8448337, 177023, 705755, 2582827,
+            764405, 6424717, 119187, 11662, 6762, 876826, 783959, 3130231, 280497, 710645, 70315, 60543,
+            172975, 8609599, 16796, 11655, 114308, 3779309, 16562, 6322079, 94809, 4567277, 1971813, 232101,
+            3491929, 236406, 461373, 1900, 138765, 735034, 6786, 1952194, 26350, 153425, 41070, 803551,
+            3780295, 4405999, 656903, 36125, 1790921, 416585, 21460, 1209271, 182666, 21000733, 1781143, 432055,
+            124025, 3120469, 37864361, 1370386, 6808, 1932, 16588, 378301, 80142, 40019977, 21483, 1414562,
+            187395, 6820, 109417, 70395, 3648385, 474513, 8155133, 6831, 158389, 3144905, 2362789, 1820,
+            99705, 168175, 5100154, 1698087, 872275, 7979183, 3056977, 403403, 17389357, 1132058, 964894, 11430103,
+            1820289, 598299, 275684, 647185, 16625, 314755, 26450, 2343314, 226347, 109503, 1565011, 148925,
+            270802, 26411, 17769851, 1698619, 35421499, 26404, 14088461, 182819, 1922961, 1575917, 1976, 99715,
+            1390173, 798721, 6875, 456475, 148625, 6903867, 720575, 730303, 231725, 6024007, 2397106, 2592629,
+            1998, 50875, 1859435, 143745, 129115, 896506, 89930, 221991, 8995921, 12041003, 6024083, 177970,
+            11781, 55796, 4586959, 11780, 36244, 3276971, 5344555, 759655, 569023, 80223, 539695, 2939699,
+            31262, 1028489, 11858, 96425, 119306, 3159637, 11799, 1409785, 2028, 7685899, 6916, 1976777,
+            3457817, 187775, 2024, 222015, 65596, 960089, 2234837, 6595963, 13404989, 2147073, 989417, 31365,
+            6439537, 104690, 471295, 80275, 2612233, 21525, 397969, 6107155, 402866, 16731, 349095, 153410,
+            5657407, 6825, 559265, 8389871, 828134, 31372, 5222587, 55825, 6752389, 8707621, 305045, 720797,
+            1062761, 336091, 818363, 613118, 16782571, 7152655, 2058, 1282633, 1600313, 10232447, 2304323, 2072,
+            2142, 2079, 304606, 251275, 2284997, 3672985, 2040353, 456665, 4875277, 226941, 9303983, 183027,
+            114513, 417571, 10511293, 715737, 446865, 1908386, 2714815, 21645, 202612, 2079511, 754851, 789061,
+            573965, 21658, 935693, 300237, 559773, 1316978, 143811, 75429, 979693, 600457, 163415, 236555,
+            202521, 1341395, 46137, 1544491, 5818879, 719095, 7534519, 24877283, 486098, 31450, 21675, 138985,
+            7038, 36309, 6791609, 1566461, 8155351, 2221271, 148666, 41325, 90117, 15340681, 6483617, 329623,
+            1023729, 8036, 173225, 134113, 11308087, 1776481, 163370, 70587, 158565, 6674393, 55924, 265837,
+            744775, 222111, 11830, 134125, 1057978, 8316649, 1820523, 18135, 3637933, 16698, 759795, 65702,
+            12999337, 104811, 1742293, 20375401, 11875, 1101957, 2244, 16820, 70602, 417605, 3624179, 178126,
+            383439, 3809927, 427431, 21692, 828245, 6993, 70525, 823361, 2827442, 12006, 26694131, 7098,
+            134162, 828269, 4631155, 1060975, 3771595, 8238581, 10657993, 1038635, 70642, 544765, 31059, 324818,
+            3946813, 7084, 1331729, 5343899, 426387, 15550931, 520331, 153729, 2205, 994449, 11366807, 11979,
+            29325, 7125, 3946827, 2214, 290605, 158631, 129514, 3531359, 4103239, 66033, 21850, 134199,
+            1287687, 2220, 15145247, 344379, 4729081, 768955, 305283, 1121549, 8077205, 104907, 9411631, 65598,
+            1004245, 407827, 261326, 139113, 373737, 544825, 17020, 102675, 2192065, 4812035, 26480567, 833187,
+            779433, 231978, 75645, 1629887, 950521, 4777721, 1243839, 3604711, 15870, 51129, 217217, 13590803,
+            12075, 4880485, 2296, 7068, 383525, 138069, 2153437, 2178, 80475, 217341, 1102045, 168674,
+            6918791, 285770, 1067857, 95139, 2705329, 2245857, 3366, 7150, 207575, 124468, 447083, 16575,
+            2070, 144305, 618171, 168609, 41405, 144039, 2377855, 2300, 764855, 11630839, 994555, 7192,
+            520421, 320045, 1292669, 320013, 1155865, 16965, 2445773, 31625, 10506613, 49610, 4846323, 2700451,
+            31635, 2778693, 4821877, 1356277, 2275229, 16974, 3027973, 364021, 1400273, 104975, 1771774, 2865317,
+            622895, 510663, 2312, 7203, 2636953, 774566, 1825579, 21879, 1483339, 7050857, 1014101, 197846,
+            2172603, 610203, 12901781, 7220, 6243787, 730639, 31654, 437255, 447146, 40997909, 36556, 3316411,
+            65875, 21709951, 21812, 456909, 314870, 339521, 618233, 26650, 90364, 388531, 2436, 16983,
+            51205, 486266, 349401, 7119281, 637887, 36575, 955451, 3683017, 148707, 3536405, 41262, 10193761,
+            2011373, 124545, 1336783, 818662, 2392, 90354, 310329, 124558, 1512745, 2349, 52929647, 7254,
+            696787, 15878603, 261443, 158804, 393421, 95325, 6224743, 623162, 295647, 11758021, 2363153, 447005,
+            1195061, 188139, 41503, 192995, 2792387, 466697, 466755, 5271649, 161414, 281015, 1106959, 4260113,
+            774706, 2915674, 1131531, 3585491, 906685, 12177, 588965, 22186421, 30259007, 2382961, 134385, 2380,
+            1454089, 178334, 129311, 3140486, 364154, 85514, 1806091, 21970, 2241265, 2420, 163713, 26862,
+            412114, 74431, 17050, 1586126, 21964, 12540151, 12138, 41154, 217558, 5858285, 388311, 9503329,
+            1723025, 3487583, 6244423, 2997, 163761, 1786499, 2460, 1507857, 422807, 12774821, 1063145, 135014,
+            466735, 2338919, 12853003, 2450, 41492, 677005, 3790655, 701437, 4479865, 158875, 4039951, 1488403,
+            31790, 12236, 33059981, 3614693, 7925915, 65975, 985025, 2475, 41574, 4890467, 2070107, 90459,
+            9993545, 105125, 16831853, 46475, 2583303, 6166241, 8615117, 61132, 593929, 3487627, 5448839, 7867273,
+            8717789, 559682, 6547495, 545054, 2412235, 481481, 2394, 2368333, 14128805, 6591499, 2764177, 26908,
+            22135361, 638319, 5135119, 378879, 222425, 56265, 931209, 603725, 1107197, 2511, 413075, 1869647,
+            11137363, 540175, 2508, 56277, 1072478, 10682755, 730825, 2363486, 129605, 906059, 1400487, 1727878,
+            408291, 22453117, 951142, 2329187, 105183, 11342683, 2457, 4803821, 110075, 11870599, 921475, 75867,
+            61226, 5511335, 7451873, 144279, 17204, 2422109, 1552015, 13791559, 55594, 22022, 6679351, 4533657,
+            2548, 471801, 300713, 51425, 12342, 813967, 2172821, 183425, 916487, 2552, 1263661, 31899,
+            901945, 290966, 56355, 2550, 921557, 2285258, 29692241, 838409, 1302775, 481574, 809042, 7436,
+            6704017, 17238, 8297509, 2167957, 476749, 344729, 2565, 2681195, 8470, 378917, 3306801, 1957703,
+            26280467, 154105, 2407479, 124775, 85683, 12495, 594035, 2584, 1468987, 359414, 5975653, 10482433,
+            4274803, 44346461, 4709861, 11528497, 22185, 46585, 2862579, 66125, 36822, 56375, 2334145, 721149,
+            15355819, 2519959, 1605837, 3199353, 242121, 10316297, 222999, 3414433, 2850, 2610, 1982251, 66092,
+            105154, 2471045, 2055579, 4035239, 2604, 4724419, 1004663, 3267803, 2625, 1014429, 85918, 12350,
+            696725, 2060455, 804287, 1346891, 1004705, 24364093, 2207161, 17298, 4871087, 462111, 994903, 369265,
+            3101527, 649165, 182505, 39458687, 27075, 344810, 1146442, 41745, 31977, 21240983, 814055, 564775,
+            2250895, 2652, 61370, 2676395, 2660, 7544, 100719, 7546, 61347, 623181, 14329471, 261725,
+            4172201, 71094, 144417, 975415, 16895731, 291005, 22218, 2790, 564949, 926497, 6454835, 80852,
+            212602, 1718105, 359513, 12750385, 8004, 183483, 85782, 603911, 163990, 193325, 4089055, 120213,
+            3346109, 623441, 496223, 7497, 27125, 139564, 95571, 7065853, 921633, 1518005, 163995, 2070335,
+            6298177, 574678, 29579983, 594146, 61364, 144925, 3087095, 369303, 1571735, 6464647, 305767, 1933459,
+            951171, 198237, 305762, 403535, 173635, 5897657, 7605, 1024309, 80937, 4406811, 139587, 824182,
+            5047141, 843479, 325335, 51615, 877591, 1459354, 2728, 36946, 22295, 7623, 9896047, 124930,
+            139601, 66297, 2603209, 100510, 6068777, 12124937, 32085, 1033815, 17218237, 46748, 247107, 1058743,
+            509675, 1171001, 7548, 2750, 22365353, 833721, 12178753, 6982823, 10013717, 36975, 56525, 36963,
+            7540, 3702923, 349809, 75850, 3800741, 51646, 374255, 139638, 178746, 32186, 5677243, 2886689,
+            70707, 545343, 3746953, 188518, 193430, 37004, 208075, 32110, 41876, 770185, 18171487, 1102551,
+            32116, 71225, 12546, 9116063, 32103, 19060859, 7139269, 110331, 149435, 80631, 71188, 1469194,
+            2461462, 12447641, 1083047, 179075, 520923, 7688, 18327913, 237429, 7820, 12580, 1229695, 1063517,
+            9001687, 3545229, 75803, 1039071, 1121894, 1420445, 48677533, 7525837, 5286745, 2999847, 276575, 27195,
+            755573, 5579977, 1870297, 3292445, 247225, 37107, 178802, 232562, 17493, 9035849, 462275, 2860,
+            18738539, 47619, 21925711, 1894487, 1024426, 4739311, 1034195, 4024823, 2574, 203203, 276573, 27180089,
+            217906, 506253, 193479, 1160, 2898, 418035, 3444, 4600897, 2099785, 354609, 27306, 22425,
+            4392287, 134895, 247247, 115311, 291305, 105963, 115258, 7750, 462346, 56637, 18081, 7245,
+            7936093, 13957343, 267189, 120175, 423243, 12650, 120125, 1083121, 310821, 1879537, 2769487, 3016,
+            125541, 151593, 164169, 7749, 200355, 12628, 22844503, 305942, 4793269, 2888, 1396031, 12511291,
+            12654, 20943073, 584545, 125948, 3962203, 4133261, 1078259, 183799, 9622493, 8894171, 2925, 828971,
+            70725, 14212, 7715869, 46893, 2900, 1552661, 232645, 169099, 1811485, 330395, 2710981, 687242,
+            8869751, 125097, 7803, 5888069, 1356901, 1694173, 95795, 17595, 1987453, 1268915, 926782, 535717,
+            12705, 42476, 3537193, 4416787, 36115589, 5276851, 877933, 413526, 398866, 601315, 12675, 46930,
+            86025, 7872601, 12716, 3170366, 27380, 444925, 583219, 95830, 12999173, 164255, 42050, 17612,
+            22506, 66470, 398905, 7326, 61605, 100555, 110495, 18596903, 27404, 858363, 105524, 1801751,
+            521110, 3424361, 1376493, 2224445, 61625, 2930885, 3453839, 42021, 5824621, 15464257, 394010, 1791946,
+            7866, 296225, 4602578, 1532795, 5487317, 2906449, 584647, 3595659, 61642, 3243737, 6503453, 2114698,
+            22542, 21001829, 178959, 237614, 27436, 4822543, 1088153, 266955, 169169, 980837, 11484911, 1372019,
+            6958627, 61659, 447811, 335405, 4574953, 25352141, 6230319, 2798939, 3036, 1127253, 4309279, 174087,
+            1244495, 843657, 12007943, 325622, 51842, 843755, 10737067, 1063713, 1655121, 257193, 134995, 1215245,
+            594473, 868205, 164331, 51909, 477158, 242515, 125229, 628694, 17787, 14466563, 1635622, 1826246,
+            564995, 95874, 27508, 2964, 2486199, 384307, 22743, 32375, 1175675, 18812071, 3042, 130134,
+            27489, 462553, 2838085, 27885, 3390361, 105710, 4446245, 17745, 472305, 1234838, 7379021, 12834,
+            682486, 12726523, 990437, 149702, 887777, 3453987, 2188021, 506530, 2026749, 7858097, 16109023, 12844,
+            662966, 47068, 20615771, 3108, 3087, 61731, 7877647, 9309829, 66625, 27531, 7344685, 1405943,
+            3502969, 9485801, 491878, 413678, 912247, 105754, 10282559, 3105, 579945, 4314311, 3933137, 1053987,
+            447925, 86515, 76342, 809627, 1103414, 12876, 3100, 2237411, 812045, 325703, 7986, 3160729,
+            1792021, 29834617, 31965743, 188853, 1044, 91091, 42189, 115292, 130203, 232730, 1459759, 2476441,
+            42237, 8060, 785213, 3033877, 2007467, 6709469, 154652, 96026, 3610477, 1322893, 17732, 1542863,
+            4358341, 6675251, 467495, 1753037, 1000195, 9099743, 15581189, 555458, 208444, 203522, 8118, 12915,
+            66759, 47125, 86247, 213342, 47138, 37076, 8050, 814555, 47151, 47481, 5321303, 37375,
+            34170277, 32487, 1616197, 22707, 829226, 4231283, 125426, 1694407, 91143, 1049191, 159562, 3664293,
+            1406095, 604299, 1063865, 13538041, 5296877, 2330038, 1689569, 16656623, 692461, 340442, 24584953, 188922,
+            71668, 8909119, 2647555, 42284, 10692677, 325822, 8073, 1582009, 16221281, 154693, 27550, 12950,
+            232934, 174097, 12987, 1567247, 25375, 80997, 9613007, 912373, 1005238, 27625, 228085, 8085,
+            62361, 8092, 804837, 66748, 653315, 17875, 501787, 208495, 1410031, 1059022, 448063, 1210547,
+            79475, 3250, 25054231, 653429, 2017077, 3220, 47212, 550671, 311170, 13034, 3224, 13005,
+            335559, 37444, 7780091, 6201209, 47685, 8806759, 184093, 936859, 103935, 27676, 68425, 8125,
+            105903, 22619987, 8140, 39121913, 267197, 1156805, 17908, 1670053, 91234, 3033815, 10170301, 14471699,
+            1215487, 71687, 37468, 149891, 81466, 496947, 3256, 32585, 17145467, 2505919, 7359707, 203665,
+            86275, 423453, 687401, 340535, 658255, 110789, 22785, 555611, 1586967, 687115, 9965009, 517215,
+            10948, 110825, 27716, 2544971, 42483, 4436159, 4509973, 27566719, 1181257, 2466827, 52173, 4241163,
+            2002481, 16460893, 252586, 40783879, 43105703, 2681869, 775489, 364994, 252655, 3234199, 3082729, 853615,
+            2887221, 188993, 1239953, 677846, 13182, 472549, 154869, 487227, 17980, 4617605, 2970327, 3864619,
+            96237, 1430605, 18050, 966329, 66861, 990698, 6528799, 8339441, 4138561, 7653043, 3321, 12789,
+            22878, 3213, 3388, 101062, 22977, 3204935, 42435, 3330, 1279091, 8228, 86428, 389499,
+            81548, 927707, 81549, 306397, 3380, 37191, 712101, 45192947, 22724, 428655, 2857921, 873422,
+            174363, 462722, 27698903, 27830, 57122, 3450, 52275, 37570, 228206, 61985, 2388701, 272194,
+            208658, 115797, 907647, 1616402, 5634343, 1269359, 633919, 3332, 47175, 36634033, 1694615, 653457,
+            350727, 2359379, 1225367, 824551, 2056223, 3151253, 726869, 3377915, 18009, 18240449, 13156, 1929254,
+            570515, 37518, 32725, 2589151, 10405103, 13167, 22940, 233206, 5389969, 17272673, 159790, 71825,
+            912485, 1772855, 384659, 32708, 12311417, 198927, 10938133, 1117865, 7218071, 47396, 316239, 96278,
+            404225, 267325, 14686963, 596733, 306475, 9872267, 1508638, 5155765, 8234809, 218405, 1386723, 7848589,
+            4260883, 511819, 5306917, 208715, 4050553, 57195, 81627, 18130, 2476745, 369985, 110946, 8176753,
+            164738, 4940377, 22550, 5996127, 37510, 785519, 11231207, 624169, 296769, 86756, 42550, 1215665,
+            614422, 1586899, 315425, 316342, 335699, 311395, 3430, 1293853, 2046655, 2598977, 1978205, 76475,
+            33530251, 4221811, 57188, 120785, 12888227, 3465, 453299, 17023487, 16158307, 19139989, 3102449, 990847,
+            2320381, 1489411, 521594, 8325, 370139, 2657661, 13311, 9744757, 228327, 19780327, 8379, 3005249,
+            3468, 2266627, 555814, 541167, 5570917, 130585, 3400663, 580601, 120802, 1503593, 3816131, 3928497,
+            28050847, 8723693, 33388541, 3518333, 3728153, 605098, 3496, 25983217, 291893, 9549761, 52371, 555841,
+            224825, 36321367, 16036207, 692714, 8415, 10991701, 1161849, 5825095, 267501, 4041005, 125715, 521645,
+            3128, 2711471, 27951, 814929, 42625, 174603, 2076035, 29903437, 13310, 135531, 4197431, 120835,
+            331177, 384826, 1807117, 100793, 73036, 2212873, 1230383, 399475, 61893, 961961, 4143665, 218530,
+            18999031, 18204, 1073995, 702559, 8436, 76874, 4031261, 8364, 3307837, 52234, 9114, 2618629,
+            45970307, 5551441, 1132681, 3860173, 1968533, 19096181, 15117233, 16999133, 48037937, 199082, 243089, 1196069,
+            4823135, 169756, 1944103, 125829, 3034205, 184382, 487475, 712327, 37791, 76895, 7887919, 18207,
+            6485011, 32946, 52390, 3234, 57350, 2183555, 1557905, 238206, 531505, 5517163, 4710729, 477717,
+            585249, 4319695, 135575, 859027, 331075, 174685, 634114, 2951069, 32955, 8054141, 4955143, 5292413,
+            1836595, 67155, 8675071, 2501369, 3740, 23125, 541282, 917662, 194271, 609725, 213807, 1162059,
+            37323, 1294033, 13377, 71995, 609501, 536393, 3588, 23188, 6391861, 62271, 3828, 30998419,
+            5761691, 52514, 228475, 116058, 648907, 2379189, 8526, 712385, 3078251, 1406587, 4187771, 37845,
+            213785, 487490, 966575, 751502, 1719663, 370025, 79052387, 639065, 5644387, 18315, 3459463, 8556,
+            3654, 604877, 1259871, 18326, 1675333, 5316979, 2002847, 512006, 125902, 575795, 1514071, 86779,
+            546231, 4617931, 337535, 4402867, 6534047, 8575, 3724, 28126, 8332831, 42772, 13468, 1198483,
+            702658, 4055843, 3675, 4930783, 164983, 839523, 2926703, 1255133, 3690, 52316, 174783, 4153546,
+            516925, 1958887, 8372, 6578045, 23275, 2902291, 9926323, 37905, 2648657, 15523091, 345477, 5756645,
+            12404509, 33033, 492499, 15068197, 13455, 482734, 15405791, 3700, 2345057, 2100659, 761349, 47804,
+            13475, 18125, 28158, 7453021, 42826, 4373511, 1582559, 13448, 1381913, 52598, 37030, 8584,
+            23276, 267674, 8782579, 5898629, 277365, 785806, 106375, 746697, 2442862, 1910051, 145475, 57498,
+            1299055, 67270, 28175, 8613, 8625, 1548339, 756613, 104553157, 657662, 326337, 3361795, 8992813,
+            516971, 1758531, 360778, 3762, 5713145, 7517179, 1709659, 3268967, 7800127, 1162213, 52635, 10896779,
+            375193, 37975, 9036769, 7795229, 12815209, 253011, 546325, 6343561, 174845, 32777819, 2956115, 536558,
+            8670, 23322, 2271773, 3743095, 1533433, 800513, 761515, 1362635, 287287, 2481997, 1303985, 57477,
+            292175, 7966211, 61828, 16593649, 2155657, 2667747, 253253, 6979061, 3608, 262885, 218855, 2242454,
+            77077, 951235, 590359, 971618, 8420933, 492745, 1421319, 1030285, 77121, 1822139, 1147619, 761453,
+            106227, 8450, 331298, 8658, 228657, 2156, 292201, 2032329, 722361, 2125207, 47150, 3822,
+            92055, 160225, 1191547, 10204859, 23375, 1812446, 160173, 7482377, 349525, 2050841, 13340, 3825,
+            1084039, 570741, 194463, 3621005, 121121, 355570, 33201, 1196506, 72261, 277574, 8890211, 1973699,
+            6412009, 52725, 302005, 1924814, 282302, 9472111, 8721, 751709, 854335, 3848, 829939, 18513,
+            91839, 8740, 38073, 3850, 52767, 2022605, 1137873, 2210935, 3861, 649078, 165025, 815269,
+            28305, 253175, 2804735, 52972, 24033257, 21688549, 18525, 228718, 727415, 77198, 126075, 62530,
+            8059303, 189625, 4004, 209209, 917785, 12023777, 9828767, 28322, 130975, 33212, 1465399, 23452,
+            4950545, 174902, 67431, 6226319, 3381487, 106641, 67425, 2922029, 1196569, 478101, 790855, 14014,
+            512169, 8788, 8258753, 3876, 1750, 13671, 18634, 35691199, 3660151, 33275, 394953, 96596,
+            8330, 527065, 585599, 204321, 3915, 2618998, 1100, 140777, 3997418, 663803, 262353, 116242,
+            57681, 3906, 2501917, 18590, 971509, 2120393, 2193763, 600117, 170126, 2551594, 4031705, 228781,
+            17546899, 258115, 3542851, 72358, 1186835, 4148947, 10610897, 111476, 150590, 1216171, 287451, 3944,
+            26169397, 287738, 595441, 28275, 131043, 986493, 3630, 8874, 830297, 272855, 10586477, 2770563,
+            214149, 3267, 5801131, 296989, 360789, 1089095, 18676, 2164389, 2257333, 9747, 4095, 8401553,
+            28413, 1274539, 5908715, 6182423, 160395, 639331, 23207189, 3978, 233818, 600281, 116402, 1392377,
+            438991, 7292311, 23548, 14638717, 194579, 12179993, 316825, 203319, 11393027, 2707063, 13764, 145521,
+            7296893, 33327, 2428447, 57475, 258874, 77372, 1015835, 355946, 6387767, 62678, 5097301, 1885885,
+            43095, 2066801, 790993, 4554737, 38675, 4632959, 1334667, 48451463, 82225, 1136863, 223975, 962065,
+            204425, 424390, 390166, 25788221, 1431382, 473271, 13794, 33292, 131118, 24971929, 898535, 8918,
+            263097, 1446071, 1245621, 331545, 23595, 87125, 1186923, 1602403, 13804, 35305141, 72471, 28611,
+            183365, 8932, 52325, 1519341, 390165, 858458, 615043, 2707179, 214225, 67599, 1685509, 1353205,
+            48050, 3693157, 19805323, 7829729, 59644, 136045, 3411067, 2189031, 341341, 184910, 458643, 4092,
+            1416389, 365585, 92046, 4305505, 2340503, 443989, 38295, 8925, 350987, 11529979, 28652, 87285,
+            13875, 48807, 9009, 4060, 414715, 24273, 1988623, 1529099, 33524, 43197, 38332, 107525,
+            507566, 541717, 272935, 33418, 952679, 512981, 1617122, 7424087, 1939751, 52983, 3973319, 38318,
+            458689, 6832679, 497798, 26505, 536935, 380494, 4563, 23805, 3748322, 3068891, 23667, 131313,
+            25314179, 150765, 13923, 639561, 2760953, 2687919, 43225, 4550, 4125, 1201915, 3332849, 157731,
+            13965, 292494, 3420835, 13739417, 106782, 287638, 7556095, 410669, 43245, 156695, 927979, 365835,
+            2311205, 97006, 551614, 82365, 2071771, 209457, 1563419, 102051, 561290, 13895843, 77469, 400078,
+            43263, 116522, 170338, 1778498, 1583023, 3415997, 1255501, 9044, 282777, 23715, 12595651, 947546,
+            1338623, 268119, 932955, 18819, 380545, 48165, 18772, 1172354, 453871, 341446, 33350, 18837,
+            1773669, 82251, 214291, 2536079, 5258773, 14365121, 4180, 131285, 180154, 53067, 331683, 2203791,
+            620194, 9075, 2614447, 92225, 3093409, 23751, 18860, 57868, 1773593, 57967, 3328039, 87172,
+            18865, 839914, 884051, 1764215, 72501, 893809, 375683, 70805, 502918, 17596127, 27909803, 18850,
+            34758037, 38870, 82418, 9135, 16623409, 13055191, 4216, 2624369, 424589, 62814, 1123343, 126445,
+            21946439, 209525, 23780, 493025, 2368865, 1284899, 683501, 786335, 22772507, 644397, 683675, 1358215,
+            4232, 12488149, 737426, 263302, 268203, 3093459, 8699995, 33579, 4999745, 3445403, 1245811, 331731,
+            7243379, 4350, 14022, 14060, 4250, 385526, 512601, 326859, 72075, 6129013, 13435741, 4706513,
+            336743, 14036, 1280015, 9020, 234025, 409975, 28998521, 87362, 11386889, 14025, 214455, 1847042,
+            4264, 7903283, 1734605, 4950967, 1306137, 136214, 5459441, 13940, 23826, 8553401, 371722, 106930,
+            1211573, 48279, 1133407, 737817, 111925, 9176, 33620, 3090277, 7624109, 243815, 28730, 278018,
+            48285, 4012465, 1485365, 356345, 219373, 25690723, 53165, 19074, 116725, 7252, 1094331, 92575,
+            4100, 9196, 693519, 97175, 20089631, 18975, 1964515, 219351, 82522, 5972593, 9207, 5590127,
+            92510, 248829, 791282, 326975, 3377129, 18981, 48314, 26795437, 1426713, 110019, 2766049, 15538409,
+            4275, 4185, 4467073, 1641809, 4340, 527307, 429598, 48334, 4332, 67881, 2419023, 9225,
+            28798, 219501, 12054, 9350, 796195, 16398659, 87412, 3665441, 243867, 600691, 1690715, 830414,
+            234099, 24050, 1901501, 3147331, 9250, 136325, 1351166, 634933, 11950639, 194996, 57722, 3425965,
+            23925, 6876857, 111910, 1891279, 4375, 121670, 1030863, 874437, 5161217, 347633, 3494413, 243890,
+            18378373, 2868767, 92365, 654493, 36459209, 67925, 140714, 29841, 136367, 73346, 188108, 336774,
+            424762, 644725, 71339959, 512746, 458913, 4093379, 248788, 5606135, 458983, 14854177, 2238067, 63206,
+            898909, 419881, 199927, 1671241, 2052501, 2986159, 4755549, 542087, 4090757, 4408, 58305, 58190,
+            63075, 8201599, 10044353, 4936409, 947807, 669185, 4420, 107065, 82654, 155771, 4446, 43825351,
+            92414, 33759, 3172047, 1182446, 9310, 4836, 141267, 23985, 2951897, 234175, 376475, 9536099,
+            18588623, 175491, 29406, 454138, 14229, 1187329, 20607379, 11647649, 514855, 17850539, 77763, 14210,
+            620289, 591015, 14157, 87542, 4775147, 2062306, 28899, 278179, 6930763, 19424693, 9348, 2399567,
+            86583, 894691, 33825, 200158, 4721393, 224939, 20090, 3856214, 1729937, 1519817, 102245, 781665,
+            537251, 92463, 454181, 239071, 742577, 273325, 14404489, 806113, 33813, 30118477, 19918169, 356421,
+            15699857, 24996571, 9379019, 200013, 38709, 10083499, 48484, 14260, 1236273, 97375, 250563, 28971,
+            322161, 4508, 5219997, 5635211, 757393, 5659927, 312325, 424879, 3655847, 307582, 112047, 14283,
+            20309309, 615505, 116932, 150898, 918731, 5009837, 3900281, 664411, 488433, 63175, 361361, 100905,
+            40594469, 4247341, 4524, 146289, 1612682, 248897, 341734, 14268, 459173, 851105, 659525, 73515,
+            214774, 116963, 1661569, 58311, 542225, 6153655, 908831, 72964, 2453433, 5332255, 1157819, 943041,
+            483575, 146234, 4554, 21985799, 2301817, 884374, 53689459, 156066, 1314542, 53428, 69629, 19220,
+            53475, 7947563, 15362659, 146334, 1021269, 19228, 1524733, 78351, 1368334, 165886, 3137771, 73002,
+            1070167, 195201, 894179, 170765, 19251, 61959979, 22450231, 2111317, 82708, 336973, 33785551, 9438,
+            4081181, 69597, 244205, 23383889, 7888933, 43351309, 2580565, 190333, 1852257, 1040763, 4721519, 2429045,
+            3753673, 224553, 14375, 1437293, 684574, 8480399, 1349341, 2336191, 4486909, 68450, 6583811, 508079,
+            121923, 19266, 214795, 2820103, 42599173, 341887, 25065391, 97526, 34713, 18285733, 704099, 43732,
+            337502, 9555, 13119127, 23828, 2644213, 87725, 3479998, 1984279, 620517, 1837585, 317471, 3206269,
+            908905, 315514, 2785915, 693842, 53505, 151294, 14223761, 297910, 207214, 258819, 2561065, 278369,
+            8827423, 4662, 4325633, 1739881, 1422169, 14355, 581405, 19314, 48668, 11730961, 4650, 24206,
+            58425, 53613, 429913, 468999, 503234, 1901211, 13598129, 5107739, 361491, 3299179, 121975, 58443,
+            10878, 2150477, 249067, 8740667, 94352849, 4609423, 54549, 14450, 29155, 14391, 517979, 11173607,
+            78884, 34485, 3915083, 4732, 6725897, 97556, 284258, 322465, 77996, 1006733, 464163, 12664619,
+            3719573, 24453, 9548, 576583, 59241, 40222, 2991265, 1852201, 97405, 366415, 223706, 14033767,
+            737891, 28830, 190463, 122018, 19375, 2019127, 16905, 239343, 180895, 4712, 7537123, 224516,
+            30135, 3387215, 288145, 39039, 693935, 256711, 4531115, 3235687, 312666, 68265, 195415, 1671549,
+            87875, 273581, 2673539, 3372149, 68324, 596183, 219849, 4789169, 9625, 2750321, 4802, 1070558,
+            395937, 381095, 5787191, 239575, 581529, 3646313, 43724491, 161161, 3308987, 229593, 229586, 68306,
+            2473211, 38950, 9405, 351538, 1436695, 1412327, 14535, 23437829, 1852462, 4347, 2262957, 283383,
+            9594, 14955857, 1622695, 400673, 32775, 640211, 2898469, 19425, 1769261, 3275695, 998963, 146523,
+            249158, 1329621, 78039, 17102917, 9620, 351785, 73205, 5357183, 3025541, 571795, 1114366, 4750,
+            878845, 4040509, 102557, 4883223, 518035, 391065, 180761, 1896455, 9486, 1930649, 63455, 772179,
+            150183, 43911, 97682, 3230882, 9724, 4672841, 43923, 53754, 4291593, 7048421, 43953, 10553113,
+            11731109, 390963, 2771431, 508277, 83030, 659813, 63426, 73255, 488733, 15138, 53650, 645337,
+            117249, 7620301, 48875, 78166, 23716519, 1588533, 156325, 2893757, 14575951, 625611, 31434, 3514971,
+            1813407, 78155, 112375, 161253, 1206835, 4012547, 816221, 415454, 8084707, 400775, 29302, 34606,
+            185725, 3377543, 5699369, 112385, 4851, 3607426, 533919, 2209339, 303025, 689210, 8773921, 425258,
+            112406, 532763, 3607315, 166175, 391017, 53482, 35609059, 283475, 14350, 288463, 2497759, 3985267,
+            630539, 425845, 694083, 24548, 3929941, 127075, 6305431, 136851, 10092, 1847677, 1920983, 146566,
+            5538101, 19550, 4884, 5323153
+        ],
+        [
+            6165, 2065, 5599, 2935, 5671, 3612, 2253, 4130, 5879, 3027, 3858, 2760,
+            4984, 4121, 4357, 3112, 5825, 3515, 2176, 5571, 2815, 166, 4805, 4114,
+            1850, 5028, 2328, 4804, 3813, 4310, 2910, 3794, 197, 4117, 4661, 2742,
+            2841, 4466, 3514, 5714, 288, 5943, 3208, 1762, 4982, 3465, 2524, 3935,
+            3639, 3994, 3700, 5168, 2010, 2467, 3892, 2741, 1815, 3508, 6140, 3249,
+            4897, 1980, 5349, 4879, 4110, 4450, 3564, 5556, 3513, 3343, 5967, 2738,
+            3900, 322, 4405, 3395, 5237, 2740, 3483, 4833, 2070, 6158, 165, 2940,
+            4242, 5267, 6002, 3238, 3331, 3512, 6105, 4099, 3008, 2715, 6089, 100,
+            3482, 2625, 164, 2739, 1746, 2737, 2337, 1972, 2355, 5894, 3241, 1676,
+            6111, 4417, 310, 5515, 4303, 250, 266, 3948, 4755, 4092, 2476, 5413,
+            5100, 5379, 6118, 4305, 6008, 259, 2801, 228, 158, 4690, 2944, 6048,
+            2679, 3275, 3042, 154, 3303, 5646, 5396, 3511, 4216, 2959, 3832, 3325,
+            3015, 1712, 1836, 3993, 5914, 4796, 3674, 5118, 2226, 5109, 2004, 5995,
+            4231, 4048, 5507, 2730, 2388, 5040, 2915, 3881, 3191, 3480, 2616, 3057,
+            1784, 1773, 2466, 2260, 5976, 4938, 6146, 5948, 1819, 163, 2417, 5259,
+            4867, 4819, 4003, 4933, 5313, 5085, 4252, 3481, 2744, 3710, 2040, 3859,
+            2367, 5203, 2986, 5304, 5783, 321, 5723, 3560, 3992, 2709, 1907, 3342,
+            4827, 2691, 2123, 1705, 4791, 162, 2323, 5679, 5442, 2519, 2169, 13,
+            3562, 2528, 4515, 4203, 2071, 3651, 3234, 4143, 261, 5893, 249, 5357,
+            5454, 2014, 115, 3485, 5317, 5003, 1874, 2585, 1996, 4669, 1854, 4499,
+            5195, 1790, 3324, 5343, 2003, 4249, 4921, 5246, 5705, 6040, 5128, 1678,
+            5026, 4572, 4769, 2690, 4603, 1877, 1944, 4558, 2997, 3965, 2267, 2864,
+            2401, 2464, 3134, 5799, 2607, 5548, 3583, 53, 5691, 4304, 5025, 3561,
+            161, 5831, 1860, 3490, 1915, 5921, 5603, 2465, 5023, 2492, 4886, 287,
+            2022, 2300, 2736, 5704, 6074, 4647, 4637, 3341, 3533, 1885, 5616, 5411,
+            2553, 4124, 3456, 3314, 2293, 160, 3006, 4279, 159, 5828, 2506, 4302,
+            276, 5447, 5846, 4750, 3092, 2461, 4762, 2562, 2735, 4738, 2627, 3805,
+            5587, 3586, 2030, 5856, 3297, 4202, 3543, 2860, 188, 4326, 3679, 4019,
+            4414, 1826, 3033, 6044, 2246, 5384, 2068, 3251, 4999, 3724, 4838, 2400,
+            4329, 4732, 3990, 24, 5487, 6063, 2693, 2821, 4561, 6135, 3177, 2923,
+            4435, 4654, 4174, 4427, 3122, 3156, 3904, 3224, 5245, 6078, 2122, 1950,
+            2069, 5142, 1738, 2241, 5022, 2109, 4367, 236, 3113, 5688, 4707, 2947,
+            2052, 3525, 4526, 3616, 4714, 2814, 4975, 3565, 4441, 5435, 2403, 2688,
+            320, 5647, 2404, 2008, 1723, 4220, 4906, 1801, 153, 3857, 3441, 3601,
+            2201, 5318, 2457, 2225, 4557, 3360, 2621, 3133, 217, 3323, 4483, 2285,
+            4168, 4301, 1683, 6185, 5572, 2635, 5644, 3796, 2805, 5378, 5428, 3368,
+            3149, 4985, 2164, 1687, 5491, 5253, 3059, 12, 5019, 5769, 298, 4055,
+            5211, 2463, 5650, 4455, 3340, 2883, 1890, 5436, 5024, 4719, 2369, 6070,
+            2762, 2452, 57, 3645, 295, 2139, 4382, 5645, 3322, 6104, 3559, 1714,
+            5544, 5140, 5390, 5086, 4299, 3683, 2432, 3186, 179, 274, 4469, 2734,
+            5862, 3804, 3475, 4767, 2701, 6170, 1671, 5776, 5057, 3749, 3084, 3018,
+            5014, 5924, 5970, 3632, 4644, 157, 5523, 3711, 4413, 4145, 5749, 4325,
+            1662, 1919, 4078, 3488, 32, 4224, 2280, 5918, 4858, 4207, 4051, 4772,
+            1619, 4136, 5095, 5833, 5440, 2460, 3911, 4018, 4434, 6017, 2335, 2108,
+            3542, 1655, 4974, 3339, 2093, 2823, 4391, 4922, 4068, 3144, 2032, 5964,
+            2301, 5329, 5637, 2567, 5904, 3242, 1644, 4295, 2446, 2779, 2629, 5687,
+            2000, 1896, 2905, 1856, 5477, 5145, 2498, 194, 2596, 5217, 2838, 1981,
+            4685, 5008, 1641, 4757, 71, 5837, 2994, 4989, 4519, 5787, 3856, 5984,
+            3206, 230, 4173, 4271, 4583, 18, 5994, 3404, 5965, 3738, 4377, 2371,
+            4257, 1615, 5736, 2671, 4629, 3281, 5803, 2256, 5655, 2142, 4480, 2398,
+            2902, 5159, 5953, 5605, 156, 2914, 5157, 4082, 5581, 5244, 3815, 97,
+            1632, 3501, 2843, 4587, 5796, 3668, 4730, 3454, 2462, 2599, 5402, 4739,
+            3988, 3292, 4745, 3197, 3181, 152, 248, 279, 4341, 89, 3929, 168,
+            4077, 2700, 4640, 1985, 2345, 4556, 3863, 128, 5164, 1898, 3963, 5890,
+            3320, 5433, 4542, 4488, 2479, 309, 5410, 5824, 169, 3420, 155, 4710,
+            5625, 2076, 4528, 5887, 6184, 6012, 2593, 4021, 5210, 2312, 5643, 3855,
+            4592, 2219, 4959, 4850, 3986, 2144, 4036, 3758, 3987, 2080, 1956, 4029,
+            3940, 119, 4872, 2932, 5474, 5325, 4947, 5175, 4298, 3377, 1882, 5877,
+            4421, 5505, 1820, 4851, 3557, 2395, 3464, 3338, 3894, 4863, 1900, 1691,
+            5575, 5047, 5389, 3477, 6071, 5412, 3470, 4808, 2795, 6035, 2067, 5527,
+            1818, 2145, 4426, 4155, 2407, 5570, 4911, 4290, 4300, 4776, 2459, 3313,
+            2158, 3400, 2692, 1730, 1953, 3412, 2416, 5110, 5013, 4830, 2279, 2090,
+            2456, 3748, 4353, 2894, 2431, 2384, 5321, 3509, 5777, 2383, 4794, 1883,
+            3043, 2451, 1905, 37, 2898, 3666, 3198, 5409, 4236, 6090, 3952, 3221,
+            3405, 3652, 3558, 3969, 4471, 2803, 2304, 1795, 2572, 3337, 6112, 3086,
+            1612, 4346, 2375, 4631, 5206, 3247, 5933, 1828, 5018, 5622, 1810, 4205,
+            5002, 1763, 4243, 3695, 5642, 3285, 2424, 4284, 5184, 3822, 2160, 5021,
+            4684, 3016, 5516, 3803, 2239, 5628, 2548, 3495, 4294, 3408, 4973, 4324,
+            5872, 3432, 5712, 3516, 4806, 5552, 1626, 3447, 5866, 3278, 6130, 6121,
+            4643, 2064, 3175, 4924, 5784, 2507, 2363, 3936, 3610, 5052, 5608, 2686,
+            1932, 41, 2639, 1721, 2991, 2207, 3596, 3046, 2979, 3556, 3834, 3319,
+            4919, 222, 4031, 6160, 4600, 2107, 120, 94, 3687, 1741, 2890, 2117,
+            1764, 2721, 2150, 2645, 3219, 4491, 2314, 2835, 2066, 5248, 4976, 3229,
+            3671, 5148, 5573, 3209, 3944, 4507, 2575, 4386, 4256, 6059, 5742, 4786,
+            4076, 151, 2837, 2422, 3882, 5937, 4856, 3159, 6013, 4316, 5631, 5091,
+            5654, 137, 3202, 3386, 5397, 3920, 2391, 6136, 4914, 2600, 3053, 3469,
+            3961, 2768, 3787, 4649, 4813, 4138, 2581, 4532, 5641, 2588, 4034, 4721,
+            4122, 5858, 2205, 5935, 2958, 2614, 4846, 195, 2973, 6183, 3415, 4610,
+            6030, 4433, 5232, 6004, 3118, 5610, 3336, 2224, 2998, 4492, 3766, 2056,
+            5737, 3627, 96, 4733, 2399, 6081, 4309, 2777, 4085, 3655, 5493, 5633,
+            5062, 5031, 4436, 4910, 2412, 4460, 4951, 3034, 3284, 1864, 3384, 4888,
+            319, 3791, 2060, 4518, 5502, 75, 2934, 5294, 3332, 4963, 5722, 3291,
+            4233, 2577, 3243, 2339, 4715, 3901, 2455, 2390, 5137, 4952, 5388, 5656,
+            6181, 2165, 22, 3568, 2615, 3510, 2125, 4835, 5407, 5020, 2308, 5263,
+            5850, 5169, 6175, 25, 4189, 2939, 5567, 4899, 2306, 3068, 4007, 3362,
+            4317, 5437, 1630, 3706, 1921, 4343, 5680, 3253, 2975, 4534, 2876, 4577,
+            6018, 1768, 4862, 1993, 3759, 4016, 5163, 4939, 1997, 4958, 4811, 4186,
+            5408, 2539, 4832, 6073, 5745, 3657, 118, 3382, 5280, 1800, 3165, 104,
+            5721, 3506, 5035, 5767, 6156, 4397, 2919, 3928, 4892, 2450, 2732, 3572,
+            3769, 150, 2611, 4645, 6021, 2826, 4176, 3604, 2387, 5300, 5660, 1792,
+            6119, 2643, 4058, 3393, 3680, 1694, 5590, 4289, 6143, 3698, 4457, 3922,
+            5323, 5809, 6180, 2852, 2555, 2157, 1943, 5873, 4379, 3770, 5041, 50,
+            4896, 4204, 5138, 5617, 191, 2673, 5279, 3665, 2361, 5209, 5906, 171,
+            4495, 2386, 5106, 4331, 2050, 3231, 1914, 2493, 1799, 4925, 5806, 3011,
+            3851, 1844, 5166, 2248, 5734, 4212, 4319, 207, 3055, 2458, 4844, 3643,
+            292, 3064, 6038, 2292, 297, 2044, 5801, 5181, 5657, 4410, 5667, 3546,
+            4297, 2969, 3239, 3143, 2584, 4137, 2649, 5983, 5401, 3591, 5081, 4384,
+            3494, 3237, 233, 260, 4323, 2544, 4536, 3891, 247, 4954, 5961, 5043,
+            4461, 142, 1770, 4699, 312, 5621, 2106, 4196, 2942, 5821, 4612, 3061,
+            2490, 3576, 1717, 2820, 76, 3712, 2170, 5551, 2480, 3598, 5889, 4283,
+            4599, 5748, 3379, 4184, 4484, 3773, 3526, 4010, 3717, 1894, 4172, 2745,
+            3073, 2481, 2353, 4873, 4449, 3953, 3091, 1776, 3451, 4074, 4502, 2836,
+            209, 3725, 296, 1669, 5101, 1884, 5455, 28, 256, 5012, 2580, 3823,
+            4639, 5878, 2359, 4522, 2380, 2430, 4621, 3422, 131, 3809, 2184, 3369,
+            5066, 51, 5585, 5134, 68, 3035, 4978, 6115, 3984, 3267, 5158, 2733,
+            2193, 5580, 5198, 4930, 2945, 3266, 2556, 5337, 2782, 3326, 2315, 4432,
+            5729, 3747, 59, 64, 2189, 4277, 3449, 5296, 1749, 4678, 33, 2793,
+            4348, 4006, 4171, 5925, 4263, 2172, 4656, 3436, 4981, 149, 2444, 4894,
+            2765, 23, 2909, 6113, 3802, 2904, 189, 6167, 5472, 2307, 4676, 3924,
+            2092, 6082, 2797, 4683, 3873, 62, 5848, 4901, 3676, 2191, 3399, 4575,
+            2966, 4734, 5974, 3831, 3943, 1910, 5191, 4787, 4508, 2273, 1789, 215,
+            60, 308, 5312, 2538, 3705, 5938, 3316, 3263, 2077, 3875, 4809, 3732,
+            1988, 2153, 3261, 4209, 78, 3260, 2406, 5007, 4232, 5534, 318, 2051,
+            5406, 6007, 42, 2081, 2229, 4293, 6125, 2799, 5686, 5234, 281, 2938,
+            6103, 2084, 3446, 286, 2646, 4550, 1625, 1744, 1893, 2063, 5284, 2127,
+            1677, 6150, 4668, 4190, 3348, 4927, 5840, 1889, 5963, 2552, 5772, 5852,
+            1668, 3256, 2972, 224, 3333, 3168, 4937, 299, 5634, 5982, 3077, 6001,
+            5189, 3207, 4459, 4972, 4210, 4479, 3783, 5501, 2634, 4782, 3076, 3958,
+            3618, 4538, 2895, 2632, 4269, 3978, 3200, 4552, 2055, 2046, 5067, 4566,
+            6091, 2134, 2522, 5111, 3701, 5640, 2769, 1814, 4980, 5525, 2755, 4664,
+            1798, 5126, 5496, 5592, 5420, 3459, 2216, 4517, 3947, 4244, 2469, 4439,
+            5286, 4909, 1825, 3259, 4675, 2043, 4540, 1908, 2714, 123, 3295, 3017,
+            268, 5200, 5249, 3078, 185, 2682, 4125, 2286, 242, 4255, 5006, 3315,
+            2610, 4328, 2340, 6083, 2012, 2683, 2421, 5659, 1661, 2656, 2324, 6014,
+            3574, 21, 3975, 3799, 2454, 3846, 2913, 1651, 231, 2848, 5520, 4847,
+            80, 5751, 4753, 2295, 4151, 2397, 301, 3116, 3877, 3069, 2097, 1636,
+            3581, 6174, 4072, 5715, 5467, 3926, 1643, 5955, 4936, 1774, 5489, 2869,
+            5293, 4929, 5076, 3080, 5957, 102, 3630, 2327, 2811, 3545, 3684, 3529,
+            2180, 2834, 2265, 5136, 3063, 5999, 5533, 1802, 2316, 5835, 3211, 3106,
+            2532, 1629, 2659, 2540, 4737, 5741, 5230, 148, 4339, 4179, 4840, 5188,
+            5208, 5853, 1935, 1633, 3848, 252, 5855, 2373, 2891, 6178, 4590, 3164,
+            4716, 3788, 3302, 294, 5926, 5034, 2411, 3352, 3579, 2717, 2166, 2642,
+            6026, 2023, 5770, 5078, 2514, 4775, 17, 4040, 5240, 1804, 4422, 5724,
+            2662, 5945, 6164, 3472, 3641, 3850, 3317, 2149, 3571, 6047, 1903, 4296,
+            4780, 2569, 4673, 2227, 1726, 5055, 6056, 4694, 3152, 1622, 4381, 2218,
+            280, 3235, 2281, 4406, 101, 2437, 4569, 2250, 2445, 3426, 4524, 2981,
+            2059, 2851, 3968, 3909, 3954, 5882, 4462, 3714, 5374, 1681, 82, 2347,
+            4015, 3083, 3375, 6060, 3840, 5462, 4868, 2482, 14, 5071, 4390, 3389,
+            4120, 2278, 4725, 5960, 2523, 5153, 2899, 2473, 5593, 4801, 5517, 3082,
+            4559, 4891, 1648, 4692, 5278, 2449, 2148, 5566, 4548, 3346, 4106, 6182,
+            4442, 2402, 2365, 1611, 2317, 3654, 3272, 4192, 3380, 5532, 3781, 4529,
+            4115, 4332, 5594, 124, 3310, 4208, 1842, 2699, 4874, 3633, 5664, 3434,
+            4071, 2888, 4916, 4093, 3814, 2019, 2941, 4113, 3296, 4509, 5618, 2233,
+            5744, 4500, 125, 5176, 5765, 4482, 2776, 2571, 3356, 1837, 5260, 271,
+            5011, 1684, 3949, 2049, 3956, 5506, 3136, 2650, 2188, 2429, 4820, 2483,
+            2921, 3417, 5338, 3720, 2394, 4885, 3746, 4132, 3890, 4957, 4201, 6093,
+            3608, 3918, 5916, 2830, 5131, 6154, 5392, 4004, 5287, 4147, 3912, 4946,
+            1841, 2720, 6114, 5456, 1977, 3729, 3801, 5627, 4104, 2766, 2453, 4790,
+            3321, 4943, 4848, 2113, 4108, 3012, 2601, 2382, 4288, 3429, 3603, 2564,
+            220, 1808, 5096, 3502, 6129, 4194, 4270, 3171, 4259, 3311, 4250, 2897,
+            126, 1982, 4097, 5726, 1911, 2825, 4555, 4215, 5820, 4180, 1772, 4698,
+            2633, 3812, 2439, 2862, 3334, 5510, 4876, 2877, 5448, 4945, 2501, 2336,
+            3646, 4091, 6102, 4711, 5194, 4235, 3154, 2527, 2026, 5421, 2156, 2543,
+            1781, 4014, 3051, 3816, 5985, 4322, 3573, 2789, 202, 4994, 1861, 6084,
+            2061, 4463, 2298, 5547, 3036, 314, 5497, 3780, 4407, 6101, 2105, 2557,
+            147, 3950, 2785, 4454, 5762, 4276, 3664, 141, 4657, 2185, 4593, 4968,
+            2949, 2638, 5780, 2259, 5490, 4655, 2161, 4563, 4521, 2872, 2212, 2817,
+            5612, 196, 6151, 5843, 2594, 74, 3182, 4278, 5068, 3496, 3473, 5750,
+            1881, 3820, 5103, 3309, 4199, 4128, 5903, 3617, 5651, 3067, 3765, 2976,
+            1835, 2866, 99, 293, 3040, 5017, 6036, 5370, 4604, 2484, 4292, 4818,
+            3227, 5090, 35, 1779, 2415, 6149, 6120, 2062, 4525, 3547, 5876, 58,
+            3973, 6097, 2238, 4633, 3588, 1928, 1710, 2377, 2190, 4230, 4880, 6179,
+            4828, 2806, 1620, 1785, 5528, 2746, 3672, 4992, 1829, 1786, 1672, 4218,
+            4268, 4358, 178, 3536, 2318, 4400, 2995, 1660, 1998, 225, 2560, 5602,
+            4146, 127, 2485, 2956, 1743, 5997, 2525, 2210, 3872, 4682, 2448, 5400,
+            1851, 5116, 139, 2802, 2272, 2477, 5529, 3025, 5636, 4431, 3397, 2955,
+            2356, 2287, 4282, 3762, 5429, 4030, 4404, 3977, 3833, 3435, 1847, 3754,
+            5950, 6033, 1906, 6085, 6006, 2036, 4002, 4971, 2089, 5288, 4598, 3905,
+            5466, 4516, 3226, 5672, 5239, 2858, 2374, 4248, 3215, 4059, 6157, 2781,
+            2550, 5595, 2443, 4478, 3009, 2110, 4726, 4089, 3824, 4056, 5171, 5789,
+            4095, 4588, 5123, 3188, 2074, 5578, 2178, 1750, 2016, 3201, 3743, 4368,
+            2728, 5739, 4165, 3394, 4489, 6077, 4498, 5684, 4046, 3800, 3037, 5161,
+            2974, 235, 4392, 3895, 3567, 3350, 2269, 1986, 4547, 218, 5306, 2420,
+            5954, 2396, 2035, 2989, 4156, 3466, 4345, 4602, 4102, 4408, 4052, 3038,
+            5344, 5236, 2534, 4253, 1805, 3585, 3493, 5838, 190, 2678, 4464, 5005,
+            4336, 5509, 2152, 4181, 2578, 1731, 2912, 3142, 4987, 5051, 5446, 5258,
+            4618, 1865, 2133, 2086, 4066, 4942, 2855, 4206, 2863, 5615, 3137, 4636,
+            5920, 5498, 2666, 2094, 1942, 4370, 5315, 5673, 5861, 1822, 3437, 277,
+            3457, 3282, 3183, 2243, 2486, 1957, 3964, 5857, 3979, 4265, 5981, 258,
+            200, 5810, 5083, 2282, 4070, 1833, 2521, 5874, 65, 5270, 1739, 4632,
+            1813, 5419, 2788, 3391, 136, 4663, 6172, 2928, 3544, 92, 4321, 4991,
+            3946, 2669, 2042, 6116, 2674, 2354, 5653, 4736, 2500, 5888, 1690, 5084,
+            2687, 98, 3438, 2689, 3658, 2536, 1838, 4158, 5059, 4797, 5897, 2775,
+            2847, 6145, 4543, 2529, 2873, 2496, 2204, 5847, 3280, 4708, 2636, 273,
+            5699, 2319, 2609, 2346, 4605, 5254, 4198, 4150, 4022, 5885, 5695, 5805,
+            4451, 6065, 1708, 4337, 3841, 5102, 2884, 5196, 2487, 3115, 2844, 4195,
+            3942, 2206, 4380, 5768, 3751, 5583, 6043, 2697, 4653, 1718, 2613, 2763,
+            4752, 3489, 2587, 5361, 4816, 4123, 1857, 198, 4425, 5911, 5432, 4646,
+            5708, 3615, 2410, 6086, 2988, 2999, 2672, 3248, 5596, 5758, 3704, 5130,
+            4228, 3524, 5363, 2816, 4720, 3798, 5952, 5738, 3066, 2920, 2058, 5728,
+            5930, 5424, 4759, 5368, 3180, 2001, 4311, 3308, 3530, 3361, 1975, 2423,
+            2177, 2971, 5362, 2810, 1916, 5902, 5107, 2311, 2726, 5139, 2488, 2868,
+            5829, 3439, 72, 3023, 1920, 5779, 4893, 5470, 2561, 5711, 3410, 3696,
+            3750, 4765, 317, 129, 5143, 1797, 4351, 5946, 5115, 3869, 3109, 4399,
+            2631, 2554, 206, 3093, 4273, 5365, 5495, 3970, 3507, 203, 6046, 3883,
+            2294, 3777, 6003, 2034, 3708, 3172, 5366, 5574, 5986, 3166, 6128, 2351,
+            5500, 3923, 4770, 4430, 1968, 5720, 5364, 4923, 5760, 56, 4415, 4087,
+            3916, 4608, 2937, 3699, 2442, 3761, 2908, 5324, 3733, 146, 2470, 5875,
+            4983, 1747, 2124, 2712, 2215, 5543, 2508, 4320, 4774, 4000, 2021, 2960,
+            211, 4777, 283, 2173, 2073, 5231, 4083, 2018, 5228, 5367, 5326, 1793,
+            4497, 3775, 1902, 3807, 4935, 2343, 4908, 4041, 2602, 4456, 4779, 6173,
+            4157, 1995, 2237, 1696, 3727, 5044, 5316, 2136, 4028, 3258, 2147, 5185,
+            4760, 121, 5658, 4012, 3155, 4044, 4864, 2005, 5193, 1658, 3537, 1767,
+            176, 5089, 2007, 144, 5054, 2771, 6020, 3478, 4836, 4217, 1967, 4619,
+            2054, 1965, 1831, 3270, 5996, 4144, 1667, 2162, 1663, 2271, 73, 1966,
+            4860, 6133, 3548, 1963, 1645, 5681, 2798, 3301, 4920, 1962, 4789, 3000,
+            1637, 290, 3398, 3190, 1725, 1961, 3606, 6068, 5415, 1859, 4096, 1951,
+            1941, 70, 1652, 4679, 1670, 4956, 5944, 2964, 20, 229, 1964, 2828,
+            1706, 4142, 2667, 4814, 5542, 5219, 3934, 5538, 1926, 145, 5540, 2085,
+            4013, 5539, 6162, 3195, 3455, 1628, 5537, 3359, 2982, 2563, 3638, 1771,
+            4578, 2512, 4313, 4287, 5849, 3825, 2393, 2668, 5613, 3648, 5536, 2187,
+            2182, 1760, 3411, 5774, 6137, 86, 3933, 2833, 4638, 5298, 3582, 3388,
+            3289, 4178, 3056, 3233, 5295, 2783, 3932, 5665, 5015, 2436, 5310, 2232,
+            4333, 4551, 4853, 5735, 4902, 3784, 2622, 3161, 2568, 4568, 4075, 3212,
+            1904, 5075, 3656, 5113, 2098, 2155, 2385, 3453, 5303, 5387, 1761, 4570,
+            3776, 5393, 4214, 5638, 105, 5513, 4948, 2447, 2045, 3959, 4746, 3619,
+            4129, 3327, 2767, 4262, 5898, 2198, 3584, 291, 4625, 2277, 3637, 3528,
+            2724, 2083, 3693, 3578, 5227, 2516, 5314, 3931, 5725, 5909, 232, 5980,
+            5377, 2641, 1778, 3930, 6100, 3663, 3044, 3636, 2333, 3719, 4622, 5719,
+            2800, 4237, 3110, 4467, 4890, 29, 5152, 2819, 4869, 4689, 2871, 5033,
+            4246, 5155, 1937, 1679, 3071, 4039, 3419, 5268, 5932, 38, 4472, 5546,
+            1892, 6169, 4624, 3692, 6163, 2405, 3075, 2266, 3170, 4159, 1757, 3065,
+            2875, 4700, 4411, 3896, 2504, 5177, 4424, 5881, 5225, 5202, 3570, 5987,
+            4955, 4670, 5445, 1618, 6108, 5811, 4185, 5197, 4340, 5607, 3835, 3074,
+            4535, 4988, 5341, 3277, 2297, 5968, 5753, 2931, 4503, 2850, 4193, 4487,
+            4703, 3919, 3549, 3642, 3010, 5648, 3592, 4554, 3517, 43, 3047, 2879,
+            1862, 5039, 2951, 5226, 5135, 2747, 3203, 5010, 3001, 1704, 4826, 4239,
+            4440, 4977, 4258, 5808, 4611, 3590, 2428, 5463, 2261, 3246, 2497, 3974,
+            2221, 5356, 4281, 4389, 3631, 1758, 5859, 1673, 3785, 6069, 2565, 5319,
+            5591, 95, 6055, 2332, 2604, 3677, 3866, 2845, 3349, 5678, 5713, 300,
+            6122, 4067, 1989, 5535, 3492, 5431, 4740, 3745, 1807, 5282, 3667, 4967,
+            5398, 2025, 3691, 5125, 4148, 2926, 5550, 5064, 3087, 4688, 3998, 4127,
+            6027, 5620, 5790, 3442, 2338, 3427, 3902, 5775, 5277, 3141, 2716, 3468,
+            3609, 2842, 2790, 5670, 4514, 313, 4042, 5802, 6139, 6054, 4722, 4970,
+            3874, 3358, 2255, 3702, 1845, 2542, 180, 2545, 3363, 1817, 5600, 5403,
+            4597, 4447, 5108, 1729, 5630, 5864, 2962, 2786, 2258, 4306, 2574, 6177,
+            1756, 5836, 49, 2559, 3810, 2943, 1922, 5141, 5958, 5460, 4802, 3345,
+            4799, 4362, 5133, 2438, 5929, 3899, 6019, 3471, 3906, 2809, 5755, 5703,
+            219, 4403, 5056, 4841, 5330, 5058, 4995, 2299, 1918, 5851, 3271, 5928,
+            3626, 2515, 4990, 5692, 5746, 5707, 289, 2104, 4476, 4371, 2651, 2435,
+            5813, 2115, 5812, 2344, 4523, 6015, 1682, 3532, 4240, 316, 4356, 1715,
+            5830, 1755, 4393, 2713, 1783, 3910, 4687, 3218, 1780, 3366, 3300, 5207,
+            5558, 6152, 1759, 5465, 3307, 4591, 4825, 2236, 3889, 5038, 1794, 4672,
+            3620, 5383, 305, 3690, 4926, 77, 5478, 5919, 2946, 1958, 1852, 2892,
+            5302, 5973, 5097, 2027, 1688, 2758, 5333, 1675, 4359, 4187, 3192, 4634,
+            5588, 4053, 3157, 1647, 2719, 2694, 5016, 3763, 3355, 4630, 2907, 6053,
+            5221, 4829, 4613, 5842, 2708, 5070, 5355, 3347, 6087, 3723, 6022, 4537,
+            3424, 83, 4443, 2839, 2302, 4023, 2020, 5886, 3876, 1875, 3819, 1665,
+            5915, 3128, 2478, 3893, 1880, 3497, 91, 3396, 5395, 1849, 4060, 3365,
+            4855, 2624, 5238, 4950, 238, 4651, 2968, 3753, 2128, 1991, 3838, 5223,
+            3689, 5867, 5386, 2685, 1970, 1754, 1685, 4291, 6147, 3913, 4704, 2911,
+            3860, 1949, 4481, 4474, 2984, 4361, 3613, 1737, 3634, 2583, 5452, 2861,
+            246, 4513, 2813, 2196, 4254, 4915, 2121, 3519, 3225, 1876, 3837, 3653,
+            2048, 4170, 3013, 6159, 3445, 5417, 3081, 2288, 5526, 2513, 3204, 4260,
+            5511, 5037, 4275, 5079, 4349, 3980, 2509, 5082, 3707, 3594, 4272, 5860,
+            3458, 3793, 5327, 4742, 2168, 2620, 1973, 1740, 3843, 3845, 2475, 3210,
+            4709, 2597, 30, 6064, 285, 237, 1846, 4429, 2276, 5913, 1703, 3941,
+            2028, 2655, 4724, 1924, 79, 5255, 1702, 2379, 3487, 1954, 2660, 3503,
+            5553, 2195, 5345, 5320, 3635, 6037, 3306, 263, 2773, 3121, 2203, 3915,
+            3736, 1689, 1753, 4401, 3318, 3179, 2213, 5969, 5819, 3744, 199, 4681,
+            3079, 6094, 4831, 3811, 4112, 2657, 2592, 2002, 2759, 2881, 6092, 2680,
+            4870, 2518, 4520, 4895, 3520, 2647, 3392, 2764, 2590, 2885, 5797, 5798,
+            4857, 2303, 2707, 3865, 5399, 6076, 5709, 3740, 3196, 5494, 2658, 2310,
+            36, 5508, 3041, 302, 1858, 3847, 4778, 4686, 5781, 5224, 4615, 1751,
+            1948, 2015, 4141, 3605, 4314, 1713, 2886, 216, 4396, 4766, 3996, 3709,
+            5993, 4490, 3878, 2827, 4226, 3742, 2376, 4940, 2644, 2211, 5674, 5624,
+            4771, 5492, 2352, 2039, 2305, 5453, 4701, 4691, 3479, 2321, 5241, 5522,
+            3194, 3158, 1866, 5972, 4378, 2326, 2171, 5382, 2013, 3880, 2970, 2103,
+            3135, 2329, 193, 2053, 4223, 6148, 6034, 5094, 4084, 2254, 2427, 3148,
+            4166, 6041, 54, 3407, 4859, 2535, 3123, 1930, 4918, 6052, 5698, 138,
+            2586, 3550, 6061, 2472, 2208, 2663, 3250, 4251, 5243, 4267, 3682, 2606,
+            4512, 2251, 6109, 2242, 4418, 2675, 2419, 2252, 1821, 4783, 1952, 4416,
+            5677, 4594, 5251, 2099, 4903, 2249, 5439, 5443, 4069, 3967, 2853, 4038,
+            6138, 5652, 3205, 2661, 3126, 3448, 2748, 2502, 4360, 5151, 5868, 2499,
+            3095, 2832, 4815, 192, 26, 1978, 5235, 4118, 2114, 3020, 4932, 1868,
+            1719, 2235, 5004, 4111, 2137, 4616, 4628, 2774, 6072, 44, 3403, 2549,
+            3140, 3722, 3072, 5311, 5910, 4100, 4666, 174, 4061, 1888, 143, 3274,
+            5764, 2389, 3257, 2116, 2349, 3871, 5778, 5845, 265, 3255, 5979, 5156,
+            6031, 2143, 5786, 3173, 3214, 5486, 3939, 1742, 6131, 3523, 4749, 3675,
+            4606, 2665, 3768, 5269, 106, 5710, 5569, 4854, 5119, 5485, 2558, 4579,
+            3028, 2174, 3734, 2731, 3806, 4934, 3163, 3288, 5614, 3328, 4109, 4081,
+            4394, 5144, 5121, 4907, 221, 1891, 5036, 3842, 2366, 2831, 6141, 4049,
+            5117, 4965, 5730, 85, 1940, 5940, 6028, 1990, 1853, 1692, 4169, 3189,
+            4116, 1736, 269, 6051, 2626, 2812, 1895, 3505, 3826, 3150, 3757, 4412,
+            5598, 3129, 1765, 1976, 5555, 4445, 3660, 3827, 3795, 3048, 3854, 3430,
+            4493, 4821, 1666, 2120, 4315, 5763, 5046, 5404, 4098, 3976, 3541, 4227,
+            2566, 4877, 5577, 1638, 5220, 5334, 1766, 1992, 4398, 3007, 5604, 3921,
+            4504, 88, 5586, 1929, 5427, 5322, 2268, 3107, 3697, 243, 2652, 5693,
+            3767, 5088, 2924, 5457, 1656, 5962, 2893, 1649, 1701, 3551, 4103, 2078,
+            4706, 4140, 4354, 3294, 5252, 3409, 2368, 3406, 5174, 19, 3276, 1913,
+            3160, 4756, 3678, 4334, 1788, 5352, 2530, 3117, 4839, 4881, 2749, 1653,
+            1616, 4008, 204, 3476, 4107, 3735, 2440, 1634, 2217, 3463, 3003, 2112,
+            2990, 1624, 3771, 3703, 5951, 1693, 1796, 1711, 1994, 2729, 4807, 3026,
+            2441, 4494, 2199, 4154, 2296, 5178, 3498, 2722, 2202, 2706, 4090, 2129,
+            5257, 4470, 3096, 3222, 2824, 4761, 4161, 2901, 3002, 3966, 3444, 3534,
+            1811, 5975, 4882, 2057, 6050, 4842, 4712, 6010, 2953, 5354, 5441, 2011,
+            1631, 4009, 2151, 3019, 1947, 1700, 2505, 1812, 16, 4986, 3216, 4372,
+            4047, 2711, 2761, 5761, 2520, 4803, 5584, 2882, 5931, 2132, 4264, 3147,
+            1879, 4845, 5000, 5524, 5589, 3673, 4318, 3681, 4953, 4527, 1695, 4793,
+            3897, 1769, 5676, 2111, 5560, 5418, 1863, 210, 2135, 2756, 4342, 1834,
+            4662, 5183, 61, 3029, 6171, 132, 3486, 4444, 4197, 212, 5205, 4496,
+            5900, 2095, 2262, 5290, 4729, 2163, 6144, 6088, 3650, 5832, 6126, 1809,
+            4101, 5218, 5606, 4149, 5340, 4011, 5469, 2041, 66, 4889, 3685, 2917,
+            5042, 3460, 2570, 3914, 3418, 3062, 1610, 3945, 3621, 5841, 2640, 6080,
+            5908, 4817, 3907, 5512, 2031, 63, 3721, 3739, 4402, 4581, 3097, 2245,
+            3726, 2857, 4617, 4229, 2537, 284, 3287, 2214, 3868, 3151, 6057, 4795,
+            3504, 4241, 3269, 4026, 2220, 69, 4680, 2141, 5800, 5989, 5331, 1686,
+            5626, 67, 6142, 2608, 3265, 1855, 1824, 4642, 4564, 3647, 4582, 2619,
+            3580, 5297, 2978, 4005, 5923, 4037, 3786, 3305, 4327, 2936, 1959, 6045,
+            3268, 134, 4635, 2006, 5475, 3774, 2140, 311, 2087, 4852, 4423, 2414,
+            3014, 1933, 3839, 2547, 3539, 3597, 2283, 3861, 1752, 4511, 2992, 3764,
+            4751, 3983, 3264, 2370, 2313, 3670, 3162, 11, 4134, 5192, 4222, 2854,
+            5032, 4024, 4335, 5942, 3782, 2648, 5308, 2867, 4438, 255, 5247, 3867,
+            5422, 3262, 3569, 4088, 1709, 5129, 2573, 3789, 3114, 3329, 4062, 1867,
+            4865, 5050, 4530, 3797, 5222, 2792, 2033, 4677, 5351, 187, 4352, 5479,
+            5629, 2628, 5988, 3611, 5307, 2510, 5261, 4658, 2409, 5375, 4960, 3433,
+            3223, 4544, 5127, 2533, 4094, 4773, 3885, 4758, 5782, 264, 3024, 5190,
+            5814, 3193, 2676, 5839, 4913, 3290, 2119, 3414, 4567, 2849, 5559, 5521,
+            4623, 5675, 4763, 3772, 2322, 3792, 2705, 4001, 5541, 1979, 6107, 3299,
+            3108, 4545, 5759, 2630, 2194, 3864, 5869, 3688, 5807, 5149, 2727, 4247,
+            1897, 5609, 4837, 1720, 4595, 1722, 2381, 2977, 4373, 2418, 234, 3244,
+            2181, 6134, 2223, 5743, 5791, 4073, 4033, 3713, 2392, 4533, 5557, 4768,
+            5834, 5561, 1843, 6000, 2494, 3989, 5718, 3962, 4549, 2175, 2576, 4964,
+            2618, 2270, 6176, 5276, 5093, 52, 1832, 3127, 3185, 3088, 2102, 6011,
+            3402, 3972, 5061, 1782, 1971, 3139, 5632, 5098, 2159, 4898, 1927, 5518,
+            1869, 262, 239, 6155, 2334, 3273, 2200, 2612, 4286, 272, 4904, 5978,
+            5514, 3756, 5385, 2100, 2372, 1654, 3312, 3178, 1639, 5414, 3971, 4607,
+            5895, 5880, 5186, 5080, 5146, 4784, 4355, 3521, 5170, 3995, 3622, 2234,
+            39, 4627, 4674, 5264, 3938, 1899, 4045, 2822, 3760, 2967, 2582, 2434,
+            48, 5112, 5167, 5682, 3049, 4133, 5305, 5899, 245, 2146, 1716, 45,
+            4834, 307, 3443, 5451, 4188, 4080, 6106, 3629, 3030, 304, 5959, 2637,
+            5795, 2681, 3357, 4308, 4743, 4601, 1745, 5949, 4395, 107, 5179, 1974,
+            3119, 1840, 2927, 184, 3058, 3552, 5662, 5766, 4086, 2037, 6029, 5818,
+            4446, 3004, 2750, 3232, 3538, 2922, 4728, 4574, 2757, 5182, 1848, 1901,
+            5073, 5187, 2047, 4485, 5727, 2009, 2840, 1613, 5701, 2772, 3130, 4468,
+            5611, 3644, 3898, 2503, 4057, 1983, 5285, 5990, 3535, 1699, 3957, 2263,
+            5757, 5165, 3499, 3927, 5299, 2275, 2653, 5120, 6117, 1680, 5458, 3146,
+            4996, 6124, 5702, 1791, 3728, 4452, 5256, 1827, 5562, 5815, 4565, 3484,
+            2808, 251, 1707, 2930, 6025, 5045, 4713, 3589, 5212, 3540, 2950, 6098,
+            3098, 4822, 4369, 1724, 2878, 5346, 5823, 5733, 5450, 227, 6110, 4419,
+            2289, 5896, 5956, 6127, 4695, 2357, 2541, 4731, 3153, 5291, 2718, 5697,
+            1960, 108, 5053, 5438, 4576, 3054, 3370, 3662, 5114, 2916, 4274, 5480,
+            5381, 3614, 3862, 5865, 4364, 4546, 306, 3005, 34, 4652, 2247, 4961,
+            2474, 4388, 5947, 4330, 2770, 1664, 5717, 5740, 2331, 3527, 2072, 5376,
+            5503, 3461, 3372, 2725, 3755, 4944, 3387, 3120, 2818, 5180, 3100, 1871,
+            3853, 4917, 3817, 4843, 2075, 2704, 2870, 5883, 3599, 3999, 5430, 3522,
+            5912, 5332, 1936, 2511, 5009, 4887, 5030, 6153, 5124, 5870, 4428, 3886,
+            5160, 201, 3378, 2341, 5173, 5063, 3090, 4025, 109, 1870, 5668, 5922,
+            4063, 5826, 2179, 3888, 2865, 1830, 6161, 5216, 2082, 3060, 4383, 3467,
+            4717, 3236, 5099, 5649, 1946, 5901, 5998, 6039, 244, 282, 3731, 6023,
+            2264, 3908, 4812, 1909, 2130, 5372, 5347, 3125, 4139, 4261, 1698, 5683,
+            3381, 5049, 2896, 5907, 3385, 1886, 2426, 2963, 110, 4589, 3099, 2186,
+            3566, 3131, 5991, 5531, 3884, 5092, 5373, 4177, 3390, 4883, 5545, 4153,
+            315, 3462, 4245, 4905, 2961, 3828, 3553, 5792, 1816, 4931, 4571, 5756,
+            1727, 5689, 5785, 6049, 2325, 4788, 4374, 4798, 2807, 186, 1748, 4221,
+            111, 3252, 3737, 6016, 5601, 2987, 47, 3050, 2754, 5731, 4183, 46,
+            2408, 4665, 2751, 55, 3376, 2101, 3903, 6009, 4641, 1887, 4175, 4744,
+            5201, 5281, 5229, 4723, 3228, 2413, 2598, 84, 4702, 5213, 5074, 4735,
+            5816, 4213, 3640, 5204, 3217, 3383, 2231, 4861, 5666, 3283, 3421, 2993,
+            3304, 3254, 1917, 3187, 3353, 5706, 3595, 4823, 2167, 3491, 2362, 2856,
+            4200, 4696, 2654, 5549, 175, 2350, 5459, 182, 4312, 4997, 4135, 3830,
+            3298, 2364, 4667, 4810, 6099, 4163, 4884, 2131, 3094, 2192, 3623, 3293,
+            5292, 213, 5360, 5732, 4792, 4043, 2595, 2952, 2091, 5335, 3718, 3500,
+            2703, 5619, 4152, 2670, 2290, 5563, 3844, 257, 4225, 2591, 5426, 1777,
+            5685, 4065, 4560, 3031, 140, 1938, 4671, 4347, 2846, 3167, 4966, 1872,
+            2495, 4350, 5461, 3052, 170, 5716, 4387, 2240, 3220, 4998, 5966, 3600,
+            3955, 5530, 2468, 4875, 3531, 4562, 2589, 3431, 5449, 3779, 4900, 5069,
+            5250, 5342, 103, 4969, 3373, 5150, 1646, 5380, 4280, 2433, 5048, 4420,
+            2906, 1657, 3649, 4747, 2889, 1931, 6168, 5473, 4849, 3124, 5939, 2491,
+            5339, 3240, 3364, 4064, 5504, 6095, 2796, 5793, 4505, 5669, 2695, 1839,
+            2723, 5804, 5029, 4510, 2360, 4596, 1642, 173, 5162, 1617, 2983, 5468,
+            177, 3818, 3245, 4962, 4659, 3829, 3199, 112, 3401, 3778, 6005, 3022,
+            5425, 2791, 5576, 4182, 241, 270, 5359, 3335, 2880, 2957, 3169, 3423,
+            3101, 5394, 5416, 2209, 3045, 2903, 1650, 4580, 3145, 1640, 172, 4949,
+            40, 2603, 3625, 5233, 5917, 4648, 6075, 6079, 4238, 2274, 93, 2348,
+            4365, 3286, 3554, 2017, 5328, 3367, 2804, 5444, 1945, 5104, 2126, 303,
+            3997, 4553, 5977, 1999, 90, 4054, 1732, 3111, 4473, 3070, 4626, 3982,
+            1623, 4266, 6123, 5214, 3624, 113, 4375, 5992, 2118, 4764, 5582, 5027,
+            4366, 2230, 3937, 5863, 2985, 3607, 5154, 6032, 3836, 3577, 2096, 3518,
+            2900, 4824, 5927, 1635, 4131, 3715, 15, 3730, 3474, 3085, 122, 2829,
+            5639, 4866, 3354, 1873, 4458, 6132, 2887, 5353, 3374, 4697, 4027, 1939,
+            2948, 2996, 2088, 5348, 2358, 1621, 2623, 253, 6066, 2980, 1697, 5301,
+            4878, 5827, 3103, 3602, 2517, 1614, 3669, 114, 3593, 2752, 4448, 2531,
+            3452, 4741, 135, 4376, 4079, 1878, 4785, 3951, 3870, 2698, 1787, 5271,
+            5854, 5065, 4620, 4871, 181, 3102, 3330, 5215, 5892, 183, 267, 2925,
+            4363, 5519, 31, 6042, 2551, 3230, 3555, 2965, 1923, 4126, 5423, 4344,
+            2024, 1984, 1733, 2753, 5771, 4409, 2743, 1806, 4477, 5199, 3808, 5471,
+            4211, 5844, 4285, 1925, 4727, 5905, 2784, 5817, 226, 3575, 5661, 5499,
+            5564, 5822, 2183, 2579, 4465, 3450, 4050, 3587, 4979, 1955, 5568, 5266,
+            5405, 4501, 5476, 4219, 167, 1728, 5891, 3138, 2257, 2342, 2794, 2526,
+            5971, 5283, 4754, 3213, 240, 214, 2874, 5132, 6024, 4941, 3925, 2617,
+            3716, 5936, 6096, 275, 5434, 5072, 3686, 2038, 5265, 4584, 4167, 3991,
+            2684, 3985, 3176, 3039, 133, 2138, 5488, 4614, 5262, 2425, 1775, 2710,
+            5358, 3413, 4993, 5077, 5147, 3174, 3790, 3852, 3425, 5754, 5273, 1734,
+            2284, 5272, 2859, 2778, 6067, 223, 4585, 3371, 2330, 2677, 130, 3694,
+            5747, 4912, 4453, 2696, 4928, 4705, 2471, 5481, 5105, 4191, 4338, 5350,
+            4541, 5565, 5941, 4164, 3917, 5309, 5934, 205, 3440, 2378, 3659, 2702,
+            5794, 1627, 4531, 5391, 5694, 2154, 4486, 5623, 3032, 4017, 5371, 3104,
+            3752, 4105, 5884, 2605, 6058, 4385, 116, 4234, 3021, 3960, 1735, 2320,
+            4162, 4660, 2244, 3563, 4475, 4119, 2228, 4032, 5871, 2787, 2222, 4539,
+            5752, 5788, 3105, 2489, 6166, 4718, 117, 4781, 3351, 208, 5483, 4437,
+            1823, 81, 2954, 5336, 4609, 5122, 3981, 5482, 3741, 2918, 5597, 4800,
+            5274, 4020, 2309, 5275, 3821, 3879, 3184, 2029, 3428, 1803, 5001, 1659,
+            3849, 5464, 2291, 5773, 4035, 3416, 1987, 4160, 4307, 5554, 5484, 2197,
+            5690, 4748, 4650, 5060, 3279, 3344, 4573, 2780, 5635, 1674, 3661, 1969,
+            5369, 5172, 3628, 3132, 4693, 5289, 27, 5663, 5579, 278, 4506, 3887,
+            2079, 1934, 2664, 3089, 1912, 5696, 2546, 5242, 2929, 254, 87, 4586,
+            2933, 5700, 6062, 5087
+        ])
+    # Map rank of 5-card hands to percentile against all other 5-card hands.
+    # Warning, the shared board is not taken into account.
+    rank_to_percentile_5 = [
+        0.999998460922831,0.999996921845661,0.999995382768492,0.999993843691323,
+        0.999992304614153,0.999990765536984,0.999989226459815,0.999987687382645,
+        0.999986148305476,0.999984609228307,0.999983070151137,0.999981531073968,
+        0.999979991996799,0.999978452919629,0.99997691384246,0.999975374765291,
+        0.999973835688121,0.999972296610952,0.999970757533783,0.999969218456613,
+        0.999967679379444,0.999966140302275,0.999964601225105,0.999963062147936,
+        0.999961523070767,0.999959983993597,0.999958444916428,0.999956905839259,
+        0.999955366762089,0.99995382768492,0.999952288607751,0.999950749530581,
+        0.999949210453412,0.999947671376243,0.999946132299073,0.999944593221904,
+        0.999943054144735,0.999941515067565,0.999939975990396,0.999938436913227,
+        0.999936897836058,0.999935358758888,0.999933819681719,0.99993228060455,
+        0.99993074152738,0.999929202450211,0.999927663373042,0.999926124295872,
+        0.999924585218703,0.999923046141533,0.999921507064364,0.999919967987195,
+        0.999918428910026,0.999916889832856,0.999915350755687,0.999913811678518,
+        0.999912272601348,0.999910733524179,0.99990919444701,0.99990765536984,
+        0.999906116292671,0.999904577215502,0.999903038138332,0.999901499061163,
+        0.999899959983994,0.999898420906824,0.999896881829655,0.999895342752486,
+        0.999893803675316,0.999892264598147,0.999890725520978,0.999889186443808,
+        0.999887647366639,0.99988610828947,0.9998845692123,0.999883030135131,
+        0.999881491057962,0.999879951980792,0.999878412903623,0.999876873826454,
+        0.999875334749284,0.999873795672115,0.999872256594946,0.999870717517776,
+        0.999869178440607,0.999867639363438,0.999866100286268,0.999864561209099,
+        0.99986302213193,0.99986148305476,0.999859943977591,0.999858404900422,
+        0.999856865823252,0.999855326746083,0.999853787668914,0.999852248591744,
+        0.999850709514575,0.999849170437406,0.999847631360236,0.999846092283067,
+        0.999844553205898,0.999843014128728,0.999841475051559,0.99983993597439,
+        0.99983839689722,0.999836857820051,0.999835318742882,0.999833779665712,
+        0.999832240588543,0.999830701511374,0.999829162434204,0.999827623357035,
+        0.999826084279866,0.999824545202696,0.999823006125527,0.999821467048358,
+        0.999819927971188,0.999818388894019,0.99981684981685,0.99981531073968,
+        0.999813771662511,0.999812232585342,0.999810693508173,0.999809154431003,
+        0.999807615353834,0.999806076276665,0.999804537199495,0.999802998122326,
+        0.999801459045156,0.999799919967987,0.999798380890818,0.999796841813649,
+        0.999795302736479,0.99979376365931,0.999792224582141,0.999790685504971,
+        0.999789146427802,0.999787607350633,0.999786068273463,0.999784529196294,
+        0.999782990119125,0.999781451041955,0.999779911964786,0.999778372887617,
+        0.999776833810447,0.999775294733278,0.999773755656109,0.999772216578939,
+        0.99977067750177,0.999769138424601,0.999767599347431,0.999766060270262,
+        0.999764521193093,0.999762982115923,0.999761443038754,0.999759903961585,
+        0.999758364884415,0.999756825807246,0.999755286730077,0.999753747652907,
+        0.999752208575738,0.999750669498569,0.999749130421399,0.99974759134423,
+        0.999746052267061,0.999744513189891,0.999735278726875,0.999726044263859,
+        0.999716809800843,0.999707575337827,0.999698340874811,0.999689106411796,
+        0.999679871948779,0.999670637485764,0.999661403022748,0.999652168559732,
+        0.999642934096716,0.9996336996337,0.999624465170684,0.999615230707668,
+        0.999605996244652,0.999596761781636,0.99958752731862,0.999578292855604,
+        0.999569058392588,0.999559823929572,0.999550589466556,0.99954135500354,
+        0.999532120540524,0.999522886077508,0.999513651614492,0.999504417151476,
+        0.99949518268846,0.999485948225444,0.999476713762428,0.999467479299412,
+        0.999458244836396,0.99944901037338,0.999439775910364,0.999430541447348,
+        0.999421306984332,0.999412072521316,0.9994028380583,0.999393603595284,
+        0.999384369132268,0.999375134669252,0.999365900206236,0.99935666574322,
+        0.999347431280204,0.999338196817188,0.999328962354172,0.999319727891156,
+        0.99931049342814,0.999301258965125,0.999292024502109,0.999282790039093,
+        0.999273555576077,0.999264321113061,0.999255086650045,0.999245852187029,
+        0.999236617724013,0.999227383260997,0.999218148797981,0.999208914334965,
+        0.999199679871949,0.999190445408933,0.999181210945917,0.999171976482901,
+        0.999162742019885,0.999153507556869,0.999144273093853,0.999135038630837,
+        0.999125804167821,0.999116569704805,0.999107335241789,0.999098100778773,
+        0.999088866315757,0.999079631852741,0.999070397389725,0.999061162926709,
+        0.999051928463693,0.999042694000677,0.999033459537661,0.999024225074645,
+        0.999014990611629,0.999005756148613,0.998996521685597,0.998987287222581,
+        0.998978052759565,0.998968818296549,0.998959583833533,0.998950349370517,
+        0.998941114907501,0.998931880444485,0.99892264598147,0.998913411518454,
+        0.998904177055438,0.998894942592422,0.998885708129406,0.99887647366639,
+        0.998867239203374,0.998858004740358,0.998848770277342,0.998839535814326,
+        0.99883030135131,0.998821066888294,0.998811832425278,0.998802597962262,
+        0.998793363499246,0.99878412903623,0.998774894573214,0.998765660110198,
+        0.998756425647182,0.998747191184166,0.99873795672115,0.998728722258134,
+        0.998719487795118,0.998710253332102,0.998701018869086,0.99869178440607,
+        0.998682549943054,0.998673315480038,0.998664081017022,0.998654846554006,
+        0.99864561209099,0.998636377627974,0.998627143164958,0.998617908701942,
+        0.998608674238926,0.99859943977591,0.998590205312894,0.998580970849878,
+        0.998571736386862,0.998562501923846,0.998553267460831,0.998544032997814,
+        0.998534798534799,0.998525564071783,0.998516329608767,0.998507095145751,
+        0.998497860682735,0.998488626219719,0.998479391756703,0.998470157293687,
+        0.998460922830671,0.998451688367655,0.998442453904639,0.998433219441623,
+        0.998423984978607,0.998414750515591,0.998405516052575,0.998396281589559,
+        0.998387047126543,0.998377812663527,0.998368578200511,0.998359343737495,
+        0.998350109274479,0.998340874811463,0.998331640348447,0.998322405885431,
+        0.998313171422415,0.998303936959399,0.99830239788223,0.99830085880506,
+        0.998299319727891,0.998297780650722,0.998296241573552,0.998294702496383,
+        0.998293163419214,0.998291624342045,0.998290085264875,0.998288546187706,
+        0.998287007110537,0.998285468033367,0.998283928956198,0.998282389879029,
+        0.998280850801859,0.99827931172469,0.998277772647521,0.998276233570351,
+        0.998274694493182,0.998273155416013,0.998271616338843,0.998270077261674,
+        0.998268538184505,0.998266999107335,0.998265460030166,0.998263920952997,
+        0.998262381875827,0.998260842798658,0.998259303721489,0.998257764644319,
+        0.99825622556715,0.998254686489981,0.998253147412811,0.998251608335642,
+        0.998250069258473,0.998248530181303,0.998246991104134,0.998245452026965,
+        0.998243912949795,0.998242373872626,0.998240834795457,0.998239295718287,
+        0.998237756641118,0.998236217563949,0.998234678486779,0.99823313940961,
+        0.998231600332441,0.998230061255271,0.998228522178102,0.998226983100933,
+        0.998225444023763,0.998223904946594,0.998222365869425,0.998220826792255,
+        0.998219287715086,0.998217748637917,0.998216209560747,0.998214670483578,
+        0.998213131406409,0.998211592329239,0.99821005325207,0.998208514174901,
+        0.998206975097731,0.998205436020562,0.998203896943393,0.998202357866223,
+        0.998200818789054,0.998199279711885,0.998197740634715,0.998196201557546,
+        0.998194662480377,0.998193123403207,0.998191584326038,0.998190045248869,
+        0.998188506171699,0.99818696709453,0.998185428017361,0.998183888940191,
+        0.998182349863022,0.998180810785853,0.998179271708683,0.998177732631514,
+        0.998176193554345,0.998174654477175,0.998173115400006,0.998171576322837,
+        0.998170037245668,0.998168498168498,0.998166959091329,0.99816542001416,
+        0.99816388093699,0.998162341859821,0.998160802782652,0.998159263705482,
+        0.998157724628313,0.998156185551143,0.998154646473974,0.998153107396805,
+        0.998151568319636,0.998150029242466,0.998148490165297,0.998146951088128,
+        0.998145412010958,0.998143872933789,0.99814233385662,0.99814079477945,
+        0.998139255702281,0.998137716625112,0.998136177547942,0.998134638470773,
+        0.998133099393604,0.998131560316434,0.998130021239265,0.998128482162096,
+        0.998126943084926,0.998125404007757,0.998123864930588,0.998122325853418,
+        0.998120786776249,0.99811924769908,0.99811770862191,0.998116169544741,
+        0.998114630467572,0.998113091390402,0.998111552313233,0.998110013236064,
+        0.998108474158894,0.998106935081725,0.998105396004556,0.998103856927386,
+        0.998102317850217,0.998100778773048,0.998099239695878,0.998097700618709,
+        0.99809616154154,0.99809462246437,0.998093083387201,0.998091544310032,
+        0.998090005232862,0.998088466155693,0.998086927078524,0.998085388001354,
+        0.998083848924185,0.998082309847016,0.998080770769846,0.998079231692677,
+        0.998077692615508,0.998076153538338,0.998074614461169,0.998073075384,
+        0.99807153630683,0.998069997229661,0.998068458152492,0.998066919075322,
+        0.998065379998153,0.998063840920984,0.998062301843815,0.998060762766645,
+        0.998059223689476,0.998057684612306,0.998056145535137,0.998054606457968,
+        0.998053067380798,0.998051528303629,0.99804998922646,0.99804845014929,
+        0.998046911072121,0.998045371994952,0.998043832917783,0.998042293840613,
+        0.998040754763444,0.998039215686275,0.998037676609105,0.998036137531936,
+        0.998034598454766,0.998033059377597,0.998031520300428,0.998029981223259,
+        0.998028442146089,0.99802690306892,0.998025363991751,0.998023824914581,
+        0.998022285837412,0.998020746760243,0.998019207683073,0.998017668605904,
+        0.998016129528735,0.998014590451565,0.998013051374396,0.998011512297227,
+        0.998009973220057,0.998008434142888,0.998006895065719,0.998005355988549,
+        0.99800381691138,0.998002277834211,0.998000738757041,0.997999199679872,
+        0.997997660602703,0.997996121525533,0.997994582448364,0.997993043371195,
+        0.997991504294025,0.997989965216856,0.997988426139687,0.997986887062517,
+        0.997985347985348,0.997983808908179,0.997982269831009,0.99798073075384,
+        0.997979191676671,0.997977652599501,0.997976113522332,0.997974574445163,
+        0.997973035367993,0.997971496290824,0.997969957213655,0.997968418136485,
+        0.997966879059316,0.997965339982147,0.997963800904977,0.997962261827808,
+        0.997960722750639,0.997959183673469,0.9979576445963,0.997956105519131,
+        0.997954566441961,0.997953027364792,0.997951488287623,0.997949949210453,
+        0.997948410133284,0.997946871056115,0.997945331978945,0.997943792901776,
+        0.997942253824607,0.997940714747437,0.997939175670268,0.997937636593099,
+        0.997936097515929,0.99793455843876,0.997933019361591,0.997931480284421,
+        0.997929941207252,0.997928402130083,0.997926863052913,0.997925323975744,
+        0.997923784898575,0.997922245821406,0.997920706744236,0.997919167667067,
+        0.997917628589898,0.997916089512728,0.997914550435559,0.99791301135839,
+        0.99791147228122,0.997909933204051,0.997908394126881,0.997906855049712,
+        0.997905315972543,0.997903776895374,0.997902237818204,0.997900698741035,
+        0.997899159663866,0.997897620586696,0.997896081509527,0.997894542432358,
+        0.997893003355188,0.997891464278019,0.99788992520085,0.99788838612368,
+        0.997886847046511,0.997885307969342,0.997883768892172,0.997882229815003,
+        0.997880690737834,0.997879151660664,0.997877612583495,0.997876073506326,
+        0.997874534429156,0.997872995351987,0.997871456274818,0.997869917197648,
+        0.997868378120479,0.99786683904331,0.99786529996614,0.997863760888971,
+        0.997862221811802,0.997860682734632,0.997859143657463,0.997857604580294,
+        0.997856065503124,0.997854526425955,0.997852987348786,0.997851448271616,
+        0.997849909194447,0.997848370117278,0.997846831040108,0.997845291962939,
+        0.99784375288577,0.9978422138086,0.997840674731431,0.997839135654262,
+        0.997837596577092,0.997836057499923,0.997834518422754,0.997832979345584,
+        0.997831440268415,0.997829901191246,0.997828362114076,0.997826823036907,
+        0.997825283959738,0.997823744882568,0.997822205805399,0.99782066672823,
+        0.99781912765106,0.997817588573891,0.997816049496722,0.997814510419552,
+        0.997812971342383,0.997811432265214,0.997809893188044,0.997808354110875,
+        0.997806815033706,0.997805275956536,0.997803736879367,0.997802197802198,
+        0.997800658725028,0.997799119647859,0.99779758057069,0.997796041493521,
+        0.997794502416351,0.997792963339182,0.997791424262013,0.997789885184843,
+        0.997788346107674,0.997786807030504,0.997785267953335,0.997783728876166,
+        0.997782189798997,0.997780650721827,0.997779111644658,0.997777572567489,
+        0.997776033490319,0.99777449441315,0.997772955335981,0.997771416258811,
+        0.997769877181642,0.997768338104473,0.997766799027303,0.997765259950134,
+        0.997763720872965,0.997762181795795,0.997760642718626,0.997759103641457,
+        0.997757564564287,0.997756025487118,0.997754486409949,0.997752947332779,
+        0.99775140825561,0.997749869178441,0.997748330101271,0.997746791024102,
+        0.997745251946933,0.997743712869763,0.997742173792594,0.997740634715425,
+        0.997739095638255,0.997737556561086,0.997736017483917,0.997734478406747,
+        0.997732939329578,0.997731400252409,0.997729861175239,0.99772832209807,
+        0.997726783020901,0.997725243943731,0.997723704866562,0.997722165789393,
+        0.997720626712223,0.997719087635054,0.997717548557885,0.997716009480715,
+        0.997714470403546,0.997712931326377,0.997711392249207,0.997709853172038,
+        0.997708314094869,0.997706775017699,0.99770523594053,0.997703696863361,
+        0.997702157786191,0.997700618709022,0.997699079631853,0.997697540554683,
+        0.997696001477514,0.997694462400345,0.997692923323175,0.997691384246006,
+        0.997689845168837,0.997688306091667,0.997686767014498,0.997685227937329,
+        0.997683688860159,0.99768214978299,0.997680610705821,0.997679071628651,
+        0.997677532551482,0.997675993474313,0.997674454397143,0.997672915319974,
+        0.997671376242805,0.997669837165636,0.997668298088466,0.997666759011297,
+        0.997665219934127,0.997663680856958,0.997662141779789,0.997660602702619,
+        0.99765906362545,0.997657524548281,0.997655985471112,0.997654446393942,
+        0.997652907316773,0.997651368239604,0.997649829162434,0.997648290085265,
+        0.997646751008096,0.997645211930926,0.997643672853757,0.997642133776588,
+        0.997640594699418,0.997639055622249,0.99763751654508,0.99763597746791,
+        0.997634438390741,0.997632899313572,0.997631360236402,0.997629821159233,
+        0.997628282082064,0.997626743004894,0.997625203927725,0.997623664850556,
+        0.997622125773386,0.997620586696217,0.997619047619048,0.997617508541878,
+        0.997615969464709,0.99761443038754,0.99761289131037,0.997611352233201,
+        0.997609813156032,0.997608274078862,0.997606735001693,0.997605195924524,
+        0.997603656847354,0.997602117770185,0.997600578693016,0.997599039615846,
+        0.997597500538677,0.997595961461508,0.997594422384338,0.997592883307169,
+        0.99759134423,0.99758980515283,0.997588266075661,0.997586726998492,
+        0.997585187921322,0.997583648844153,0.997582109766984,0.997580570689814,
+        0.997579031612645,0.997577492535476,0.997575953458306,0.997574414381137,
+        0.997572875303968,0.997571336226798,0.997569797149629,0.99756825807246,
+        0.99756671899529,0.997565179918121,0.997563640840952,0.997562101763782,
+        0.997560562686613,0.997559023609444,0.997557484532274,0.997555945455105,
+        0.997554406377936,0.997552867300766,0.997551328223597,0.997549789146428,
+        0.997548250069259,0.997546710992089,0.99754517191492,0.99754363283775,
+        0.997542093760581,0.997540554683412,0.997539015606242,0.997537476529073,
+        0.997535937451904,0.997534398374734,0.997532859297565,0.997531320220396,
+        0.997529781143227,0.997528242066057,0.997526702988888,0.997525163911719,
+        0.997523624834549,0.99752208575738,0.997520546680211,0.997519007603041,
+        0.997517468525872,0.997515929448703,0.997514390371533,0.997512851294364,
+        0.997511312217195,0.997509773140025,0.997508234062856,0.997506694985687,
+        0.997505155908517,0.997503616831348,0.997502077754179,0.997500538677009,
+        0.99749899959984,0.997497460522671,0.997495921445501,0.997494382368332,
+        0.997492843291163,0.997491304213993,0.997489765136824,0.997488226059655,
+        0.997486686982485,0.997485147905316,0.997483608828147,0.997482069750977,
+        0.997480530673808,0.997478991596639,0.997477452519469,0.9974759134423,
+        0.997474374365131,0.997472835287961,0.997471296210792,0.997469757133623,
+        0.997468218056453,0.997466678979284,0.997465139902115,0.997463600824945,
+        0.997462061747776,0.997460522670607,0.997458983593437,0.997457444516268,
+        0.997455905439099,0.997454366361929,0.99745282728476,0.997451288207591,
+        0.997449749130421,0.997448210053252,0.997446670976083,0.997445131898913,
+        0.997443592821744,0.997442053744575,0.997440514667405,0.997438975590236,
+        0.997437436513067,0.997435897435897,0.997434358358728,0.997432819281559,
+        0.997431280204389,0.99742974112722,0.997428202050051,0.997426662972881,
+        0.997425123895712,0.997423584818543,0.997422045741373,0.997420506664204,
+        0.997418967587035,0.997417428509865,0.997415889432696,0.997414350355527,
+        0.997412811278357,0.997411272201188,0.997409733124019,0.99740819404685,
+        0.99740665496968,0.997405115892511,0.997403576815342,0.997402037738172,
+        0.997400498661003,0.997398959583834,0.997397420506664,0.997395881429495,
+        0.997394342352325,0.997392803275156,0.997391264197987,0.997389725120818,
+        0.997388186043648,0.997386646966479,0.99738510788931,0.99738356881214,
+        0.997382029734971,0.997380490657802,0.997378951580632,0.997377412503463,
+        0.997375873426294,0.997374334349124,0.997372795271955,0.997371256194786,
+        0.997369717117616,0.997368178040447,0.997366638963278,0.997365099886108,
+        0.997363560808939,0.99736202173177,0.9973604826546,0.997358943577431,
+        0.997357404500262,0.997355865423092,0.997354326345923,0.997352787268754,
+        0.997351248191584,0.997349709114415,0.997348170037246,0.997346630960076,
+        0.997345091882907,0.997343552805738,0.997342013728568,0.997340474651399,
+        0.99733893557423,0.99733739649706,0.997335857419891,0.997334318342722,
+        0.997332779265552,0.997331240188383,0.997329701111214,0.997328162034044,
+        0.997326622956875,0.997325083879706,0.997323544802536,0.997322005725367,
+        0.997320466648198,0.997318927571028,0.997317388493859,0.99731584941669,
+        0.99731431033952,0.997312771262351,0.997311232185182,0.997309693108012,
+        0.997308154030843,0.997306614953674,0.997305075876504,0.997303536799335,
+        0.997301997722166,0.997300458644997,0.997298919567827,0.997297380490658,
+        0.997295841413488,0.997294302336319,0.99729276325915,0.99729122418198,
+        0.997289685104811,0.997288146027642,0.997286606950472,0.997285067873303,
+        0.997283528796134,0.997281989718965,0.997280450641795,0.997278911564626,
+        0.997277372487457,0.997275833410287,0.997274294333118,0.997272755255948,
+        0.997271216178779,0.99726967710161,0.997268138024441,0.997266598947271,
+        0.997265059870102,0.997263520792933,0.997261981715763,0.997260442638594,
+        0.997258903561425,0.997257364484255,0.997255825407086,0.997254286329917,
+        0.997252747252747,0.997251208175578,0.997249669098409,0.997248130021239,
+        0.99724659094407,0.997245051866901,0.997243512789731,0.997241973712562,
+        0.997240434635393,0.997238895558223,0.997237356481054,0.997235817403885,
+        0.997234278326715,0.997232739249546,0.997231200172377,0.997229661095207,
+        0.997228122018038,0.997226582940869,0.997225043863699,0.99722350478653,
+        0.997221965709361,0.997220426632191,0.997218887555022,0.997217348477853,
+        0.997215809400683,0.997214270323514,0.997212731246345,0.997211192169175,
+        0.997209653092006,0.997208114014837,0.997206574937667,0.997205035860498,
+        0.997203496783329,0.997201957706159,0.99720041862899,0.997198879551821,
+        0.997197340474651,0.997195801397482,0.997194262320313,0.997192723243143,
+        0.997191184165974,0.997189645088805,0.997188106011635,0.997186566934466,
+        0.997185027857297,0.997183488780127,0.997181949702958,0.997180410625789,
+        0.997178871548619,0.99717733247145,0.997175793394281,0.997174254317111,
+        0.997172715239942,0.997171176162773,0.997169637085603,0.997168098008434,
+        0.997166558931265,0.997165019854095,0.997163480776926,0.997161941699757,
+        0.997160402622588,0.997158863545418,0.997157324468249,0.99715578539108,
+        0.99715424631391,0.997152707236741,0.997151168159571,0.997149629082402,
+        0.997148090005233,0.997146550928063,0.997145011850894,0.997143472773725,
+        0.997141933696556,0.997140394619386,0.997138855542217,0.997137316465048,
+        0.997135777387878,0.997134238310709,0.99713269923354,0.99713116015637,
+        0.997129621079201,0.997128082002032,0.997126542924862,0.997125003847693,
+        0.997123464770524,0.997121925693354,0.997120386616185,0.997118847539016,
+        0.997117308461846,0.997115769384677,0.997114230307508,0.997112691230338,
+        0.997111152153169,0.997109613076,0.99710807399883,0.997106534921661,
+        0.997104995844492,0.997103456767322,0.997101917690153,0.997100378612984,
+        0.997098839535814,0.997097300458645,0.997095761381476,0.997094222304306,
+        0.997092683227137,0.997091144149968,0.997089605072798,0.997088065995629,
+        0.99708652691846,0.99708498784129,0.997083448764121,0.997081909686952,
+        0.997080370609782,0.997078831532613,0.997077292455444,0.997075753378274,
+        0.997074214301105,0.997072675223936,0.997071136146766,0.997069597069597,
+        0.997068057992428,0.997066518915258,0.997064979838089,0.99706344076092,
+        0.99706190168375,0.997060362606581,0.997058823529412,0.997057284452242,
+        0.997055745375073,0.997054206297904,0.997052667220734,0.997051128143565,
+        0.997049589066396,0.997048049989226,0.997046510912057,0.997044971834888,
+        0.997043432757718,0.997041893680549,0.99704035460338,0.99703881552621,
+        0.997037276449041,0.997035737371872,0.997034198294703,0.997032659217533,
+        0.997031120140364,0.997029581063195,0.997028041986025,0.997026502908856,
+        0.997024963831686,0.997023424754517,0.997021885677348,0.997020346600179,
+        0.997018807523009,0.99701726844584,0.997015729368671,0.997014190291501,
+        0.997012651214332,0.997011112137163,0.997009573059993,0.997008033982824,
+        0.997006494905655,0.997004955828485,0.997003416751316,0.997001877674147,
+        0.997000338596977,0.996998799519808,0.996997260442639,0.996995721365469,
+        0.9969941822883,0.996992643211131,0.996991104133961,0.996989565056792,
+        0.996988025979623,0.996986486902453,0.996984947825284,0.996983408748115,
+        0.996981869670945,0.996980330593776,0.996978791516607,0.996977252439437,
+        0.996975713362268,0.996974174285099,0.996972635207929,0.99697109613076,
+        0.996969557053591,0.996968017976421,0.996966478899252,0.996964939822083,
+        0.996963400744913,0.996961861667744,0.996960322590575,0.996958783513405,
+        0.996957244436236,0.996955705359067,0.996954166281897,0.996952627204728,
+        0.996951088127559,0.996949549050389,0.99694800997322,0.996946470896051,
+        0.996944931818881,0.996943392741712,0.996941853664543,0.996940314587373,
+        0.996938775510204,0.996937236433035,0.996935697355865,0.996934158278696,
+        0.996932619201527,0.996931080124357,0.996929541047188,0.996928001970019,
+        0.996926462892849,0.99692492381568,0.996923384738511,0.996921845661341,
+        0.996920306584172,0.996918767507003,0.996917228429833,0.996915689352664,
+        0.996914150275495,0.996912611198326,0.996911072121156,0.996909533043987,
+        0.996907993966818,0.996906454889648,0.996904915812479,0.996903376735309,
+        0.99690183765814,0.996900298580971,0.996898759503801,0.996897220426632,
+        0.996895681349463,0.996894142272294,0.996892603195124,0.996891064117955,
+        0.996889525040786,0.996887985963616,0.996886446886447,0.996884907809278,
+        0.996883368732108,0.996881829654939,0.99688029057777,0.9968787515006,
+        0.996877212423431,0.996875673346262,0.996874134269092,0.996872595191923,
+        0.996871056114754,0.996869517037584,0.996867977960415,0.996866438883246,
+        0.996864899806076,0.996863360728907,0.996861821651738,0.996860282574568,
+        0.996858743497399,0.99685720442023,0.99685566534306,0.996854126265891,
+        0.996852587188722,0.996851048111552,0.996849509034383,0.996847969957214,
+        0.996846430880044,0.996844891802875,0.996843352725706,0.996841813648536,
+        0.996840274571367,0.996838735494198,0.996837196417028,0.996835657339859,
+        0.99683411826269,0.99683257918552,0.996831040108351,0.996829501031182,
+        0.996827961954012,0.996826422876843,0.996824883799674,0.996823344722504,
+        0.996821805645335,0.996820266568166,0.996818727490996,0.996817188413827,
+        0.996815649336658,0.996814110259488,0.996812571182319,0.99681103210515,
+        0.99680949302798,0.996807953950811,0.996806414873642,0.996804875796472,
+        0.996803336719303,0.996801797642134,0.996800258564964,0.996798719487795,
+        0.996797180410626,0.996795641333456,0.996794102256287,0.996792563179118,
+        0.996791024101948,0.996789485024779,0.99678794594761,0.996786406870441,
+        0.996784867793271,0.996783328716102,0.996781789638932,0.996780250561763,
+        0.996778711484594,0.996777172407424,0.996775633330255,0.996774094253086,
+        0.996772555175917,0.996771016098747,0.996769477021578,0.996767937944409,
+        0.996766398867239,0.99676485979007,0.996763320712901,0.996761781635731,
+        0.996760242558562,0.996758703481393,0.996757164404223,0.996755625327054,
+        0.996754086249885,0.996752547172715,0.996751008095546,0.996749469018377,
+        0.996747929941207,0.996746390864038,0.996744851786869,0.996743312709699,
+        0.99674177363253,0.996740234555361,0.996738695478191,0.996737156401022,
+        0.996735617323853,0.996734078246683,0.996732539169514,0.996731000092345,
+        0.996729461015175,0.996727921938006,0.996726382860837,0.996724843783667,
+        0.996723304706498,0.996721765629329,0.996720226552159,0.99671868747499,
+        0.996717148397821,0.996715609320651,0.996714070243482,0.996712531166313,
+        0.996710992089143,0.996709453011974,0.996707913934805,0.996706374857635,
+        0.996704835780466,0.996703296703297,0.996701757626127,0.996700218548958,
+        0.996698679471789,0.996697140394619,0.99669560131745,0.996694062240281,
+        0.996692523163111,0.996690984085942,0.996689445008773,0.996687905931603,
+        0.996686366854434,0.996684827777265,0.996683288700095,0.996681749622926,
+        0.996680210545757,0.996678671468587,0.996677132391418,0.996675593314249,
+        0.996674054237079,0.99667251515991,0.996670976082741,0.996669437005571,
+        0.996667897928402,0.996666358851233,0.996664819774064,0.996663280696894,
+        0.996661741619725,0.996660202542555,0.996658663465386,0.996657124388217,
+        0.996655585311047,0.996654046233878,0.996652507156709,0.996650968079539,
+        0.99664942900237,0.996647889925201,0.996646350848032,0.996644811770862,
+        0.996643272693693,0.996641733616524,0.996640194539354,0.996638655462185,
+        0.996637116385016,0.996635577307846,0.996634038230677,0.996632499153508,
+        0.996630960076338,0.996629420999169,0.996627881922,0.99662634284483,
+        0.996624803767661,0.996623264690492,0.996621725613322,0.996620186536153,
+        0.996618647458984,0.996617108381814,0.996615569304645,0.996614030227476,
+        0.996612491150306,0.996610952073137,0.996609412995968,0.996607873918798,
+        0.996606334841629,0.99660479576446,0.99660325668729,0.996601717610121,
+        0.996600178532952,0.996598639455782,0.996597100378613,0.996595561301444,
+        0.996594022224274,0.996592483147105,0.996590944069936,0.996589404992766,
+        0.996587865915597,0.996586326838428,0.996584787761258,0.996583248684089,
+        0.99658170960692,0.99658017052975,0.996578631452581,0.996577092375412,
+        0.996575553298242,0.996574014221073,0.996572475143904,0.996570936066734,
+        0.996569396989565,0.996567857912396,0.996566318835226,0.996564779758057,
+        0.996563240680888,0.996561701603718,0.996560162526549,0.99655862344938,
+        0.99655708437221,0.996555545295041,0.996554006217872,0.996552467140702,
+        0.996550928063533,0.996549388986364,0.996547849909194,0.996546310832025,
+        0.996544771754856,0.996543232677686,0.996541693600517,0.996540154523348,
+        0.996538615446178,0.996537076369009,0.99653553729184,0.99653399821467,
+        0.996532459137501,0.996530920060332,0.996529380983162,0.996527841905993,
+        0.996526302828824,0.996524763751655,0.996523224674485,0.996521685597316,
+        0.996520146520147,0.996518607442977,0.996517068365808,0.996515529288639,
+        0.996513990211469,0.9965124511343,0.99651091205713,0.996509372979961,
+        0.996507833902792,0.996506294825623,0.996504755748453,0.996503216671284,
+        0.996501677594115,0.996500138516945,0.996498599439776,0.996497060362607,
+        0.996495521285437,0.996493982208268,0.996492443131099,0.996490904053929,
+        0.99648936497676,0.996487825899591,0.996486286822421,0.996484747745252,
+        0.996483208668083,0.996481669590913,0.996480130513744,0.996478591436575,
+        0.996477052359405,0.996475513282236,0.996473974205067,0.996472435127897,
+        0.996470896050728,0.996469356973559,0.996467817896389,0.99646627881922,
+        0.996464739742051,0.996463200664881,0.996461661587712,0.996460122510543,
+        0.996458583433373,0.996457044356204,0.996455505279035,0.996453966201865,
+        0.996452427124696,0.996450888047527,0.996449348970357,0.996447809893188,
+        0.996446270816019,0.996444731738849,0.99644319266168,0.996441653584511,
+        0.996440114507341,0.996438575430172,0.996437036353003,0.996435497275833,
+        0.996433958198664,0.996432419121495,0.996430880044325,0.996429340967156,
+        0.996427801889987,0.996426262812817,0.996424723735648,0.996423184658479,
+        0.996421645581309,0.99642010650414,0.996418567426971,0.996417028349802,
+        0.996415489272632,0.996413950195463,0.996412411118293,0.996410872041124,
+        0.996409332963955,0.996407793886785,0.996406254809616,0.996404715732447,
+        0.996403176655277,0.996401637578108,0.996400098500939,0.99639855942377,
+        0.9963970203466,0.996395481269431,0.996393942192262,0.996392403115092,
+        0.996390864037923,0.996389324960753,0.996387785883584,0.996386246806415,
+        0.996384707729246,0.996383168652076,0.996381629574907,0.996380090497738,
+        0.996378551420568,0.996377012343399,0.99637547326623,0.99637393418906,
+        0.996372395111891,0.996370856034722,0.996369316957552,0.996367777880383,
+        0.996366238803214,0.996364699726044,0.996363160648875,0.996361621571706,
+        0.996360082494536,0.996358543417367,0.996357004340198,0.996355465263028,
+        0.996353926185859,0.99635238710869,0.99635084803152,0.996349308954351,
+        0.996347769877182,0.996346230800012,0.996344691722843,0.996343152645674,
+        0.996341613568504,0.996340074491335,0.996338535414166,0.995946070735987,
+        0.995553606057808,0.995161141379629,0.99476867670145,0.994376212023271,
+        0.993983747345092,0.993591282666913,0.993198817988734,0.992806353310555,
+        0.992413888632376,0.992389263397667,0.992364638162958,0.992340012928248,
+        0.992315387693539,0.99229076245883,0.99226613722412,0.992241511989411,
+        0.992216886754702,0.992192261519993,0.992167636285283,0.992143011050574,
+        0.992118385815865,0.992093760581156,0.992069135346446,0.992044510111737,
+        0.992019884877028,0.991995259642318,0.991970634407609,0.9919460091729,
+        0.991921383938191,0.991896758703481,0.991872133468772,0.991847508234063,
+        0.991822882999354,0.991798257764644,0.991773632529935,0.991749007295226,
+        0.991724382060516,0.991699756825807,0.991675131591098,0.991650506356389,
+        0.991625881121679,0.99160125588697,0.991576630652261,0.991552005417552,
+        0.991527380182842,0.991502754948133,0.991478129713424,0.991453504478715,
+        0.991428879244005,0.991404254009296,0.991379628774587,0.991355003539877,
+        0.991330378305168,0.991305753070459,0.99128112783575,0.99125650260104,
+        0.991231877366331,0.991207252131622,0.991182626896913,0.991158001662203,
+        0.991133376427494,0.991108751192785,0.991084125958075,0.991059500723366,
+        0.991034875488657,0.991010250253948,0.990985625019238,0.990960999784529,
+        0.99093637454982,0.990911749315111,0.990887124080401,0.990862498845692,
+        0.990837873610983,0.990813248376274,0.990788623141564,0.990763997906855,
+        0.990739372672146,0.990714747437436,0.990690122202727,0.990665496968018,
+        0.990640871733309,0.990616246498599,0.99059162126389,0.990566996029181,
+        0.990542370794472,0.990517745559762,0.990493120325053,0.990468495090344,
+        0.990443869855635,0.990419244620925,0.990394619386216,0.990369994151507,
+        0.990345368916797,0.990320743682088,0.990296118447379,0.99027149321267,
+        0.99024686797796,0.990222242743251,0.990197617508542,0.990172992273833,
+        0.990148367039123,0.990123741804414,0.990099116569705,0.990074491334996,
+        0.990049866100286,0.990025240865577,0.990000615630868,0.989975990396158,
+        0.989951365161449,0.98992673992674,0.989902114692031,0.989877489457321,
+        0.989852864222612,0.989828238987903,0.989803613753194,0.989778988518484,
+        0.989754363283775,0.989729738049066,0.989705112814356,0.989680487579647,
+        0.989655862344938,0.989631237110229,0.989606611875519,0.98958198664081,
+        0.989557361406101,0.989532736171392,0.989508110936682,0.989483485701973,
+        0.989458860467264,0.989434235232555,0.989409609997845,0.989384984763136,
+        0.989360359528427,0.989335734293717,0.989311109059008,0.989286483824299,
+        0.98926185858959,0.98923723335488,0.989212608120171,0.989187982885462,
+        0.989163357650753,0.989138732416043,0.989114107181334,0.989089481946625,
+        0.989064856711916,0.989040231477206,0.989015606242497,0.988990981007788,
+        0.988966355773078,0.988941730538369,0.98891710530366,0.988892480068951,
+        0.988867854834241,0.988843229599532,0.988818604364823,0.988793979130114,
+        0.988769353895404,0.988744728660695,0.988720103425986,0.988695478191276,
+        0.988670852956567,0.988646227721858,0.988621602487149,0.988596977252439,
+        0.98857235201773,0.988547726783021,0.988523101548312,0.988498476313602,
+        0.988473851078893,0.988449225844184,0.988424600609475,0.988399975374765,
+        0.988375350140056,0.988350724905347,0.988326099670637,0.988301474435928,
+        0.988276849201219,0.98825222396651,0.9882275987318,0.988202973497091,
+        0.988178348262382,0.988153723027673,0.988129097792963,0.988104472558254,
+        0.988079847323545,0.988055222088836,0.988030596854126,0.988005971619417,
+        0.987981346384708,0.987956721149998,0.987932095915289,0.98790747068058,
+        0.987882845445871,0.987858220211161,0.987833594976452,0.987808969741743,
+        0.987784344507034,0.987759719272324,0.987735094037615,0.987710468802906,
+        0.987685843568197,0.987661218333487,0.987636593098778,0.987611967864069,
+        0.987587342629359,0.98756271739465,0.987538092159941,0.987513466925232,
+        0.987488841690522,0.987464216455813,0.987439591221104,0.987414965986395,
+        0.987390340751685,0.987365715516976,0.987341090282267,0.987316465047557,
+        0.987291839812848,0.987267214578139,0.98724258934343,0.98721796410872,
+        0.987193338874011,0.987168713639302,0.987144088404593,0.987119463169883,
+        0.987094837935174,0.987070212700465,0.987045587465756,0.987020962231046,
+        0.986996336996337,0.986971711761628,0.986947086526918,0.986922461292209,
+        0.9868978360575,0.986873210822791,0.986848585588081,0.986823960353372,
+        0.986799335118663,0.986774709883954,0.986750084649244,0.986725459414535,
+        0.986700834179826,0.986676208945117,0.986651583710407,0.986626958475698,
+        0.986602333240989,0.986577708006279,0.98655308277157,0.986528457536861,
+        0.986503832302152,0.986479207067442,0.986454581832733,0.986429956598024,
+        0.986405331363315,0.986380706128605,0.986356080893896,0.986331455659187,
+        0.986306830424478,0.986282205189768,0.986257579955059,0.98623295472035,
+        0.98620832948564,0.986183704250931,0.986159079016222,0.986134453781513,
+        0.986109828546803,0.986085203312094,0.986060578077385,0.986035952842676,
+        0.986011327607966,0.985986702373257,0.985962077138548,0.985937451903838,
+        0.985912826669129,0.98588820143442,0.985863576199711,0.985838950965001,
+        0.985814325730292,0.985789700495583,0.985765075260874,0.985740450026164,
+        0.985715824791455,0.985691199556746,0.985666574322037,0.985641949087327,
+        0.985617323852618,0.985592698617909,0.985568073383199,0.98554344814849,
+        0.985518822913781,0.985494197679072,0.985469572444362,0.985444947209653,
+        0.985420321974944,0.985395696740235,0.985371071505525,0.985346446270816,
+        0.985321821036107,0.985297195801398,0.985272570566688,0.985247945331979,
+        0.98522332009727,0.98519869486256,0.985174069627851,0.985149444393142,
+        0.985124819158433,0.985100193923723,0.985075568689014,0.985050943454305,
+        0.985026318219596,0.985001692984886,0.984977067750177,0.984952442515468,
+        0.984927817280759,0.984903192046049,0.98487856681134,0.984853941576631,
+        0.984829316341921,0.984804691107212,0.984780065872503,0.984755440637794,
+        0.984730815403084,0.984706190168375,0.984681564933666,0.984656939698957,
+        0.984632314464247,0.984607689229538,0.984583063994829,0.984558438760119,
+        0.98453381352541,0.984509188290701,0.984484563055992,0.984459937821282,
+        0.984435312586573,0.984410687351864,0.984386062117155,0.984361436882445,
+        0.984336811647736,0.984312186413027,0.984287561178318,0.984262935943608,
+        0.984238310708899,0.98421368547419,0.98418906023948,0.984164435004771,
+        0.984139809770062,0.984115184535353,0.984090559300643,0.984065934065934,
+        0.984041308831225,0.984016683596516,0.983992058361806,0.983967433127097,
+        0.983942807892388,0.983918182657678,0.983893557422969,0.98386893218826,
+        0.983844306953551,0.983819681718841,0.983795056484132,0.983770431249423,
+        0.983745806014714,0.983721180780004,0.983696555545295,0.983671930310586,
+        0.983647305075876,0.983622679841167,0.983598054606458,0.983573429371749,
+        0.983548804137039,0.98352417890233,0.983499553667621,0.983474928432912,
+        0.983450303198202,0.983425677963493,0.983401052728784,0.983376427494075,
+        0.983351802259365,0.983327177024656,0.983302551789947,0.983277926555237,
+        0.983253301320528,0.983228676085819,0.98320405085111,0.9831794256164,
+        0.983154800381691,0.983130175146982,0.983105549912273,0.983080924677563,
+        0.983056299442854,0.983031674208145,0.983007048973435,0.982982423738726,
+        0.982957798504017,0.982933173269308,0.982908548034598,0.982883922799889,
+        0.98285929756518,0.982834672330471,0.982810047095761,0.982785421861052,
+        0.982760796626343,0.982736171391634,0.982711546156924,0.982686920922215,
+        0.982662295687506,0.982637670452796,0.982613045218087,0.982588419983378,
+        0.982563794748669,0.982539169513959,0.98251454427925,0.982489919044541,
+        0.982465293809832,0.982440668575122,0.982416043340413,0.982391418105704,
+        0.982366792870995,0.982342167636285,0.982317542401576,0.982292917166867,
+        0.982268291932157,0.982243666697448,0.982219041462739,0.98219441622803,
+        0.98216979099332,0.982145165758611,0.982120540523902,0.982095915289193,
+        0.982071290054483,0.982046664819774,0.982022039585065,0.981997414350355,
+        0.981972789115646,0.981948163880937,0.981923538646228,0.981898913411518,
+        0.981874288176809,0.9818496629421,0.981825037707391,0.981800412472681,
+        0.981775787237972,0.981751162003263,0.981726536768554,0.981701911533844,
+        0.981677286299135,0.981652661064426,0.981628035829716,0.981603410595007,
+        0.981578785360298,0.981554160125589,0.981529534890879,0.98150490965617,
+        0.981480284421461,0.981455659186752,0.981431033952042,0.981406408717333,
+        0.981381783482624,0.981357158247915,0.981332533013205,0.981307907778496,
+        0.981283282543787,0.981258657309077,0.981234032074368,0.981209406839659,
+        0.98118478160495,0.98116015637024,0.981135531135531,0.981110905900822,
+        0.981086280666113,0.981061655431403,0.981037030196694,0.981012404961985,
+        0.980987779727276,0.980963154492566,0.980938529257857,0.980913904023148,
+        0.980889278788438,0.980864653553729,0.98084002831902,0.980815403084311,
+        0.980790777849601,0.980766152614892,0.980741527380183,0.980716902145474,
+        0.980692276910764,0.980667651676055,0.980643026441346,0.980618401206636,
+        0.980593775971927,0.980569150737218,0.980544525502509,0.980519900267799,
+        0.98049527503309,0.980470649798381,0.980446024563672,0.980421399328962,
+        0.980396774094253,0.980372148859544,0.980347523624835,0.980322898390125,
+        0.980298273155416,0.980273647920707,0.980249022685997,0.980224397451288,
+        0.980199772216579,0.98017514698187,0.98015052174716,0.980125896512451,
+        0.980101271277742,0.980076646043033,0.980052020808323,0.980027395573614,
+        0.980002770338905,0.979978145104196,0.979953519869486,0.979928894634777,
+        0.979904269400068,0.979879644165358,0.979855018930649,0.97983039369594,
+        0.979805768461231,0.979781143226521,0.979756517991812,0.979731892757103,
+        0.979707267522394,0.979682642287684,0.979658017052975,0.979633391818266,
+        0.979608766583556,0.979584141348847,0.979559516114138,0.979534890879429,
+        0.979510265644719,0.97948564041001,0.979461015175301,0.979436389940592,
+        0.979411764705882,0.979387139471173,0.979362514236464,0.979337889001755,
+        0.979313263767045,0.979288638532336,0.979264013297627,0.979239388062917,
+        0.979214762828208,0.979190137593499,0.97916551235879,0.97914088712408,
+        0.979116261889371,0.979091636654662,0.979067011419953,0.979042386185243,
+        0.979017760950534,0.978993135715825,0.978968510481116,0.978943885246406,
+        0.978919260011697,0.978894634776988,0.978870009542278,0.978845384307569,
+        0.97882075907286,0.978796133838151,0.978771508603441,0.978746883368732,
+        0.978722258134023,0.978697632899314,0.978673007664604,0.978648382429895,
+        0.978623757195186,0.978599131960477,0.978574506725767,0.978549881491058,
+        0.978525256256349,0.978500631021639,0.97847600578693,0.978451380552221,
+        0.978426755317512,0.978402130082802,0.978377504848093,0.978352879613384,
+        0.978328254378675,0.978303629143965,0.978279003909256,0.978254378674547,
+        0.978229753439837,0.978205128205128,0.978180502970419,0.97815587773571,
+        0.978131252501,0.978106627266291,0.978082002031582,0.978057376796873,
+        0.978032751562163,0.978008126327454,0.977983501092745,0.977958875858036,
+        0.977934250623326,0.977909625388617,0.977885000153908,0.977860374919198,
+        0.977835749684489,0.97781112444978,0.977786499215071,0.977761873980361,
+        0.977737248745652,0.977712623510943,0.977687998276234,0.977663373041524,
+        0.977638747806815,0.977614122572106,0.977589497337397,0.977564872102687,
+        0.977540246867978,0.977515621633269,0.977490996398559,0.97746637116385,
+        0.977441745929141,0.977417120694432,0.977392495459722,0.977367870225013,
+        0.977343244990304,0.977318619755595,0.977293994520885,0.977269369286176,
+        0.977244744051467,0.977220118816758,0.977195493582048,0.977170868347339,
+        0.97714624311263,0.97712161787792,0.977096992643211,0.977072367408502,
+        0.977047742173793,0.977023116939083,0.976998491704374,0.976973866469665,
+        0.976949241234956,0.976924616000246,0.976899990765537,0.976875365530828,
+        0.976850740296118,0.976826115061409,0.9768014898267,0.976776864591991,
+        0.976752239357281,0.976727614122572,0.976702988887863,0.976678363653154,
+        0.976653738418444,0.976629113183735,0.976604487949026,0.976579862714317,
+        0.976555237479607,0.976530612244898,0.976505987010189,0.976481361775479,
+        0.97645673654077,0.976432111306061,0.976407486071352,0.976382860836642,
+        0.976358235601933,0.976333610367224,0.976308985132515,0.976284359897805,
+        0.976259734663096,0.976235109428387,0.976210484193678,0.976185858958968,
+        0.976161233724259,0.97613660848955,0.97611198325484,0.976087358020131,
+        0.976062732785422,0.976038107550713,0.976013482316003,0.975988857081294,
+        0.975964231846585,0.975939606611876,0.975914981377166,0.975890356142457,
+        0.975865730907748,0.975841105673039,0.975816480438329,0.97579185520362,
+        0.975767229968911,0.975742604734201,0.975717979499492,0.975693354264783,
+        0.975668729030074,0.975644103795364,0.975619478560655,0.975594853325946,
+        0.975570228091237,0.975545602856527,0.975520977621818,0.975496352387109,
+        0.975471727152399,0.97544710191769,0.975422476682981,0.975397851448272,
+        0.975373226213562,0.975348600978853,0.975323975744144,0.975299350509435,
+        0.975274725274725,0.975250100040016,0.975225474805307,0.975200849570597,
+        0.975176224335888,0.975151599101179,0.97512697386647,0.97510234863176,
+        0.975077723397051,0.975053098162342,0.975028472927633,0.975003847692923,
+        0.974979222458214,0.974954597223505,0.974929971988795,0.974905346754086,
+        0.974880721519377,0.974856096284668,0.974831471049958,0.974806845815249,
+        0.97478222058054,0.974757595345831,0.974732970111121,0.974708344876412,
+        0.974683719641703,0.974659094406994,0.974634469172284,0.974609843937575,
+        0.974585218702866,0.974560593468156,0.974535968233447,0.974511342998738,
+        0.974486717764029,0.974462092529319,0.97443746729461,0.974412842059901,
+        0.974388216825192,0.974363591590482,0.974338966355773,0.974314341121064,
+        0.974289715886354,0.974265090651645,0.974240465416936,0.974215840182227,
+        0.974191214947517,0.974166589712808,0.974141964478099,0.97411733924339,
+        0.97409271400868,0.974068088773971,0.974043463539262,0.974018838304553,
+        0.973994213069843,0.973969587835134,0.973944962600425,0.973920337365715,
+        0.973895712131006,0.973871086896297,0.973846461661588,0.973821836426878,
+        0.973797211192169,0.97377258595746,0.973747960722751,0.973723335488041,
+        0.973698710253332,0.973674085018623,0.973649459783914,0.973624834549204,
+        0.973600209314495,0.973575584079786,0.973550958845076,0.973526333610367,
+        0.973501708375658,0.973477083140949,0.973452457906239,0.97342783267153,
+        0.973403207436821,0.973378582202112,0.973353956967402,0.973329331732693,
+        0.973304706497984,0.973280081263275,0.973255456028565,0.973230830793856,
+        0.973206205559147,0.973181580324437,0.973156955089728,0.973132329855019,
+        0.97310770462031,0.9730830793856,0.973058454150891,0.973033828916182,
+        0.973009203681473,0.972984578446763,0.972959953212054,0.972935327977345,
+        0.972910702742635,0.972886077507926,0.972861452273217,0.972836827038508,
+        0.972812201803798,0.972787576569089,0.97276295133438,0.972738326099671,
+        0.972713700864961,0.972689075630252,0.972664450395543,0.972639825160834,
+        0.972615199926124,0.972590574691415,0.972565949456706,0.972541324221996,
+        0.972516698987287,0.972492073752578,0.972467448517869,0.972442823283159,
+        0.97241819804845,0.972393572813741,0.972368947579032,0.972344322344322,
+        0.972319697109613,0.972295071874904,0.972270446640195,0.972245821405485,
+        0.972221196170776,0.972196570936067,0.972171945701357,0.972147320466648,
+        0.972122695231939,0.97209806999723,0.97207344476252,0.972048819527811,
+        0.972024194293102,0.971999569058393,0.971974943823683,0.971950318588974,
+        0.971925693354265,0.971901068119556,0.971876442884846,0.971851817650137,
+        0.971827192415428,0.971802567180718,0.971777941946009,0.9717533167113,
+        0.971728691476591,0.971704066241881,0.971679441007172,0.971654815772463,
+        0.971630190537754,0.971605565303044,0.971580940068335,0.971556314833626,
+        0.971531689598916,0.971507064364207,0.971482439129498,0.971457813894789,
+        0.971433188660079,0.97140856342537,0.971383938190661,0.971359312955952,
+        0.971334687721242,0.971310062486533,0.971285437251824,0.971230030473728,
+        0.971174623695632,0.971119216917536,0.97106381013944,0.971008403361345,
+        0.970952996583249,0.970897589805153,0.970842183027057,0.970786776248961,
+        0.970731369470865,0.970675962692769,0.970620555914674,0.970565149136578,
+        0.970509742358482,0.970454335580386,0.97039892880229,0.970343522024194,
+        0.970288115246098,0.970232708468003,0.970177301689907,0.970121894911811,
+        0.970066488133715,0.970011081355619,0.969955674577523,0.969900267799428,
+        0.969844861021332,0.969789454243236,0.96973404746514,0.969678640687044,
+        0.969623233908948,0.969567827130852,0.969512420352757,0.969457013574661,
+        0.969401606796565,0.969346200018469,0.969290793240373,0.969235386462277,
+        0.969179979684181,0.969124572906086,0.96906916612799,0.969013759349894,
+        0.968958352571798,0.968902945793702,0.968847539015606,0.96879213223751,
+        0.968736725459415,0.968681318681319,0.968625911903223,0.968570505125127,
+        0.968515098347031,0.968459691568935,0.968404284790839,0.968348878012744,
+        0.968293471234648,0.968238064456552,0.968182657678456,0.96812725090036,
+        0.968071844122264,0.968016437344168,0.967961030566073,0.967905623787977,
+        0.967850217009881,0.967794810231785,0.967739403453689,0.967683996675593,
+        0.967628589897497,0.967573183119402,0.967517776341306,0.96746236956321,
+        0.967406962785114,0.967351556007018,0.967296149228922,0.967240742450826,
+        0.967185335672731,0.967129928894635,0.967074522116539,0.967019115338443,
+        0.966963708560347,0.966908301782251,0.966852895004155,0.96679748822606,
+        0.966742081447964,0.966686674669868,0.966631267891772,0.966575861113676,
+        0.96652045433558,0.966465047557485,0.966409640779389,0.966354234001293,
+        0.966298827223197,0.966243420445101,0.966188013667005,0.966132606888909,
+        0.966077200110814,0.966021793332718,0.965966386554622,0.965910979776526,
+        0.96585557299843,0.965800166220334,0.965744759442238,0.965689352664143,
+        0.965633945886047,0.965578539107951,0.965523132329855,0.965467725551759,
+        0.965412318773663,0.965356911995568,0.965301505217472,0.965246098439376,
+        0.96519069166128,0.965135284883184,0.965079878105088,0.965024471326992,
+        0.964969064548897,0.964913657770801,0.964858250992705,0.964802844214609,
+        0.964747437436513,0.964692030658417,0.964636623880321,0.964581217102226,
+        0.96452581032413,0.964470403546034,0.964414996767938,0.964359589989842,
+        0.964304183211746,0.96424877643365,0.964193369655555,0.964137962877459,
+        0.964082556099363,0.964027149321267,0.963971742543171,0.963916335765075,
+        0.963860928986979,0.963805522208884,0.963750115430788,0.963694708652692,
+        0.963639301874596,0.9635838950965,0.963528488318404,0.963473081540308,
+        0.963417674762213,0.963362267984117,0.963306861206021,0.963251454427925,
+        0.963196047649829,0.963140640871733,0.963085234093637,0.963029827315542,
+        0.962974420537446,0.96291901375935,0.962863606981254,0.962808200203158,
+        0.962752793425062,0.962697386646966,0.962641979868871,0.962586573090775,
+        0.962531166312679,0.962475759534583,0.962420352756487,0.962364945978391,
+        0.962309539200295,0.9622541324222,0.962198725644104,0.962143318866008,
+        0.962087912087912,0.962032505309816,0.96197709853172,0.961921691753625,
+        0.961866284975529,0.961810878197433,0.961755471419337,0.961700064641241,
+        0.961644657863145,0.961589251085049,0.961533844306954,0.961478437528858,
+        0.961423030750762,0.961367623972666,0.96131221719457,0.961256810416474,
+        0.961201403638378,0.961145996860283,0.961090590082187,0.961035183304091,
+        0.960979776525995,0.960924369747899,0.960868962969803,0.960813556191707,
+        0.960758149413612,0.960702742635516,0.96064733585742,0.960591929079324,
+        0.960536522301228,0.960481115523132,0.960425708745037,0.960370301966941,
+        0.960314895188845,0.960259488410749,0.960204081632653,0.960148674854557,
+        0.960093268076461,0.960037861298366,0.95998245452027,0.959927047742174,
+        0.959871640964078,0.959816234185982,0.959760827407886,0.95970542062979,
+        0.959650013851695,0.959594607073599,0.959539200295503,0.959483793517407,
+        0.959428386739311,0.959372979961215,0.959317573183119,0.959262166405024,
+        0.959206759626928,0.959151352848832,0.959095946070736,0.95904053929264,
+        0.958985132514544,0.958929725736448,0.958874318958353,0.958818912180257,
+        0.958763505402161,0.958708098624065,0.958652691845969,0.958597285067873,
+        0.958541878289777,0.958486471511682,0.958431064733586,0.95837565795549,
+        0.958320251177394,0.958264844399298,0.958209437621202,0.958154030843106,
+        0.958098624065011,0.958043217286915,0.957987810508819,0.957932403730723,
+        0.957876996952627,0.957821590174531,0.957766183396435,0.95771077661834,
+        0.957655369840244,0.957599963062148,0.957544556284052,0.957489149505956,
+        0.95743374272786,0.957378335949765,0.957322929171669,0.957267522393573,
+        0.957212115615477,0.957156708837381,0.957101302059285,0.957045895281189,
+        0.956990488503094,0.956935081724998,0.956879674946902,0.956824268168806,
+        0.95676886139071,0.956713454612614,0.956658047834518,0.956602641056423,
+        0.956547234278327,0.956491827500231,0.956436420722135,0.956381013944039,
+        0.956325607165943,0.956270200387847,0.956214793609752,0.956159386831656,
+        0.95610398005356,0.956048573275464,0.955993166497368,0.955937759719272,
+        0.955882352941177,0.955826946163081,0.955771539384985,0.955716132606889,
+        0.955660725828793,0.955605319050697,0.955549912272601,0.955494505494506,
+        0.95543909871641,0.955383691938314,0.955328285160218,0.955272878382122,
+        0.955217471604026,0.95516206482593,0.955106658047835,0.955051251269739,
+        0.954995844491643,0.954940437713547,0.954885030935451,0.954829624157355,
+        0.954774217379259,0.954718810601164,0.954663403823068,0.954607997044972,
+        0.954552590266876,0.95449718348878,0.954441776710684,0.954386369932588,
+        0.954330963154493,0.954275556376397,0.954220149598301,0.954164742820205,
+        0.954109336042109,0.954053929264013,0.953998522485917,0.953943115707822,
+        0.953887708929726,0.95383230215163,0.953776895373534,0.953721488595438,
+        0.953666081817342,0.953610675039246,0.953555268261151,0.953499861483055,
+        0.953444454704959,0.953389047926863,0.953333641148767,0.953278234370671,
+        0.953222827592575,0.95316742081448,0.953112014036384,0.953056607258288,
+        0.953001200480192,0.952945793702096,0.952890386924,0.952834980145905,
+        0.952779573367809,0.952724166589713,0.952668759811617,0.952613353033521,
+        0.952557946255425,0.952502539477329,0.952447132699234,0.952391725921138,
+        0.952336319143042,0.952280912364946,0.95222550558685,0.952170098808754,
+        0.952114692030658,0.952059285252563,0.952003878474467,0.951948471696371,
+        0.951893064918275,0.951837658140179,0.951782251362083,0.951726844583987,
+        0.951671437805892,0.951616031027796,0.9515606242497,0.951505217471604,
+        0.951449810693508,0.951394403915412,0.951338997137317,0.951283590359221,
+        0.951228183581125,0.951172776803029,0.951117370024933,0.951061963246837,
+        0.951006556468741,0.950951149690646,0.95089574291255,0.950840336134454,
+        0.950784929356358,0.950729522578262,0.950674115800166,0.95061870902207,
+        0.950563302243975,0.950507895465879,0.950452488687783,0.950397081909687,
+        0.950341675131591,0.950286268353495,0.950230861575399,0.950175454797304,
+        0.950120048019208,0.950064641241112,0.950009234463016,0.94995382768492,
+        0.949898420906824,0.949843014128728,0.949787607350633,0.949732200572537,
+        0.949676793794441,0.949621387016345,0.949565980238249,0.949510573460153,
+        0.949455166682057,0.949399759903962,0.949344353125866,0.94928894634777,
+        0.949233539569674,0.949178132791578,0.949122726013482,0.949067319235386,
+        0.949011912457291,0.948956505679195,0.948901098901099,0.948845692123003,
+        0.948790285344907,0.948734878566811,0.948679471788715,0.94862406501062,
+        0.948568658232524,0.948513251454428,0.948457844676332,0.948402437898236,
+        0.94834703112014,0.948291624342045,0.948236217563949,0.948180810785853,
+        0.948125404007757,0.948069997229661,0.948014590451565,0.947959183673469,
+        0.947903776895374,0.947848370117278,0.947792963339182,0.947737556561086,
+        0.94768214978299,0.947626743004894,0.947571336226798,0.947515929448703,
+        0.947460522670607,0.947405115892511,0.947349709114415,0.947294302336319,
+        0.947238895558223,0.947183488780127,0.947128082002032,0.947072675223936,
+        0.94701726844584,0.946961861667744,0.946906454889648,0.946851048111552,
+        0.946795641333457,0.946740234555361,0.946684827777265,0.946629420999169,
+        0.946574014221073,0.946518607442977,0.946463200664881,0.946407793886786,
+        0.94635238710869,0.946296980330594,0.946241573552498,0.946186166774402,
+        0.946130759996306,0.94607535321821,0.946019946440115,0.945964539662019,
+        0.945909132883923,0.945853726105827,0.945798319327731,0.945742912549635,
+        0.945687505771539,0.945632098993444,0.945576692215348,0.945521285437252,
+        0.945465878659156,0.94541047188106,0.945355065102964,0.945299658324868,
+        0.945244251546773,0.945188844768677,0.945133437990581,0.945078031212485,
+        0.945022624434389,0.944967217656293,0.944911810878197,0.944856404100102,
+        0.944800997322006,0.94474559054391,0.944690183765814,0.944634776987718,
+        0.944579370209622,0.944523963431526,0.944468556653431,0.944413149875335,
+        0.944357743097239,0.944302336319143,0.944246929541047,0.944191522762951,
+        0.944136115984855,0.94408070920676,0.944025302428664,0.943969895650568,
+        0.943914488872472,0.943859082094376,0.94380367531628,0.943748268538184,
+        0.943692861760089,0.943637454981993,0.943582048203897,0.943526641425801,
+        0.943471234647705,0.943415827869609,0.943360421091514,0.943305014313418,
+        0.943249607535322,0.943194200757226,0.94313879397913,0.943083387201034,
+        0.943027980422938,0.942972573644843,0.942917166866747,0.942861760088651,
+        0.942806353310555,0.942750946532459,0.942695539754363,0.942640132976267,
+        0.942584726198172,0.942529319420076,0.94247391264198,0.942418505863884,
+        0.942363099085788,0.942307692307692,0.942252285529597,0.942196878751501,
+        0.942141471973405,0.942086065195309,0.942030658417213,0.941975251639117,
+        0.941919844861021,0.941864438082926,0.94180903130483,0.941753624526734,
+        0.941698217748638,0.941642810970542,0.941587404192446,0.94153199741435,
+        0.941476590636255,0.941421183858159,0.941365777080063,0.941310370301967,
+        0.941254963523871,0.941199556745775,0.941144149967679,0.941088743189584,
+        0.941033336411488,0.940977929633392,0.940922522855296,0.9408671160772,
+        0.940811709299104,0.940756302521008,0.940700895742913,0.940645488964817,
+        0.940590082186721,0.940534675408625,0.940479268630529,0.940423861852433,
+        0.940368455074337,0.940313048296242,0.940257641518146,0.94020223474005,
+        0.940146827961954,0.940091421183858,0.940036014405762,0.939980607627666,
+        0.939925200849571,0.939869794071475,0.939814387293379,0.939758980515283,
+        0.939703573737187,0.939648166959091,0.939592760180995,0.9395373534029,
+        0.939481946624804,0.939426539846708,0.939371133068612,0.939315726290516,
+        0.93926031951242,0.939204912734324,0.939149505956229,0.939094099178133,
+        0.939038692400037,0.938983285621941,0.938927878843845,0.938872472065749,
+        0.938817065287654,0.938761658509558,0.938706251731462,0.938650844953366,
+        0.93859543817527,0.938540031397174,0.938484624619078,0.938429217840983,
+        0.938373811062887,0.938318404284791,0.938262997506695,0.938207590728599,
+        0.938152183950503,0.938096777172407,0.938041370394312,0.937985963616216,
+        0.93793055683812,0.937875150060024,0.937819743281928,0.937764336503832,
+        0.937708929725736,0.937653522947641,0.937598116169545,0.937542709391449,
+        0.937487302613353,0.937431895835257,0.937376489057161,0.937321082279066,
+        0.93726567550097,0.937210268722874,0.937154861944778,0.937099455166682,
+        0.937044048388586,0.93698864161049,0.936933234832395,0.936877828054299,
+        0.936822421276203,0.936767014498107,0.936711607720011,0.936656200941915,
+        0.936600794163819,0.936545387385724,0.936489980607628,0.936434573829532,
+        0.936379167051436,0.93632376027334,0.936268353495244,0.936212946717148,
+        0.936157539939053,0.936102133160957,0.936046726382861,0.935991319604765,
+        0.935935912826669,0.935880506048573,0.935825099270477,0.935769692492382,
+        0.935714285714286,0.93565887893619,0.935603472158094,0.935548065379998,
+        0.935492658601902,0.935437251823806,0.935381845045711,0.935326438267615,
+        0.935271031489519,0.935215624711423,0.935160217933327,0.935104811155231,
+        0.935049404377135,0.93499399759904,0.934938590820944,0.934883184042848,
+        0.934827777264752,0.934772370486656,0.93471696370856,0.934661556930464,
+        0.934606150152369,0.934550743374273,0.934495336596177,0.934439929818081,
+        0.934384523039985,0.934329116261889,0.934273709483794,0.934218302705698,
+        0.934162895927602,0.934107489149506,0.93405208237141,0.933996675593314,
+        0.933941268815218,0.933885862037123,0.933830455259027,0.933775048480931,
+        0.933719641702835,0.933664234924739,0.933608828146643,0.933553421368547,
+        0.933498014590452,0.933442607812356,0.93338720103426,0.933331794256164,
+        0.933276387478068,0.933220980699972,0.933165573921876,0.933110167143781,
+        0.933054760365685,0.932999353587589,0.932943946809493,0.932888540031397,
+        0.932833133253301,0.932777726475206,0.93272231969711,0.932666912919014,
+        0.932611506140918,0.932556099362822,0.932500692584726,0.93244528580663,
+        0.932389879028535,0.932334472250439,0.932279065472343,0.932223658694247,
+        0.932168251916151,0.932112845138055,0.932057438359959,0.932002031581864,
+        0.931946624803768,0.931891218025672,0.931835811247576,0.93178040446948,
+        0.931724997691384,0.931669590913288,0.931614184135193,0.931558777357097,
+        0.931503370579001,0.931447963800905,0.931392557022809,0.931337150244713,
+        0.931281743466617,0.931226336688522,0.931170929910426,0.93111552313233,
+        0.931060116354234,0.931004709576138,0.930949302798042,0.930893896019946,
+        0.930838489241851,0.930783082463755,0.930727675685659,0.930672268907563,
+        0.930616862129467,0.930561455351371,0.930506048573275,0.93045064179518,
+        0.930395235017084,0.930339828238988,0.930284421460892,0.930229014682796,
+        0.9301736079047,0.930118201126604,0.930062794348509,0.930007387570413,
+        0.929951980792317,0.929896574014221,0.929841167236125,0.929785760458029,
+        0.929730353679934,0.929674946901838,0.929619540123742,0.929564133345646,
+        0.92950872656755,0.929453319789454,0.929397913011358,0.929342506233263,
+        0.929287099455167,0.929231692677071,0.929176285898975,0.929120879120879,
+        0.929065472342783,0.929010065564687,0.928954658786592,0.928899252008496,
+        0.9288438452304,0.928788438452304,0.928733031674208,0.928677624896112,
+        0.928622218118016,0.928566811339921,0.928511404561825,0.928455997783729,
+        0.928400591005633,0.928345184227537,0.928289777449441,0.928234370671346,
+        0.92817896389325,0.928123557115154,0.928068150337058,0.928012743558962,
+        0.927957336780866,0.92790193000277,0.927846523224675,0.927791116446579,
+        0.927735709668483,0.927680302890387,0.927624896112291,0.927569489334195,
+        0.927514082556099,0.927458675778004,0.927403268999908,0.927347862221812,
+        0.927292455443716,0.92723704866562,0.927181641887524,0.927126235109428,
+        0.927070828331333,0.927015421553237,0.926960014775141,0.926904607997045,
+        0.926849201218949,0.926793794440853,0.926738387662757,0.926682980884662,
+        0.926627574106566,0.92657216732847,0.926516760550374,0.926461353772278,
+        0.926405946994182,0.926350540216086,0.926295133437991,0.926239726659895,
+        0.926184319881799,0.926128913103703,0.926073506325607,0.926018099547511,
+        0.925962692769415,0.92590728599132,0.925851879213224,0.925796472435128,
+        0.925741065657032,0.925685658878936,0.92563025210084,0.925574845322744,
+        0.925519438544649,0.925464031766553,0.925408624988457,0.925353218210361,
+        0.925297811432265,0.925242404654169,0.925186997876074,0.925131591097978,
+        0.925076184319882,0.925020777541786,0.92496537076369,0.924909963985594,
+        0.924854557207498,0.924799150429403,0.924743743651307,0.924688336873211,
+        0.924632930095115,0.924577523317019,0.924522116538923,0.924466709760827,
+        0.924411302982732,0.924355896204636,0.92430048942654,0.924245082648444,
+        0.924189675870348,0.924134269092252,0.924078862314156,0.924023455536061,
+        0.923968048757965,0.923912641979869,0.923857235201773,0.923801828423677,
+        0.923746421645581,0.923598670237326,0.92345091882907,0.923303167420815,
+        0.923155416012559,0.923007664604303,0.922859913196048,0.922712161787792,
+        0.922564410379536,0.922416658971281,0.922268907563025,0.92212115615477,
+        0.921973404746514,0.921825653338258,0.921677901930003,0.921530150521747,
+        0.921382399113492,0.921234647705236,0.92108689629698,0.920939144888725,
+        0.920791393480469,0.920643642072213,0.920495890663958,0.920348139255702,
+        0.920200387847447,0.920052636439191,0.919904885030935,0.91975713362268,
+        0.919609382214424,0.919461630806169,0.919313879397913,0.919166127989657,
+        0.919018376581402,0.918870625173146,0.918722873764891,0.918575122356635,
+        0.918427370948379,0.918279619540124,0.918131868131868,0.917984116723613,
+        0.917836365315357,0.917688613907101,0.917540862498846,0.91739311109059,
+        0.917245359682334,0.917097608274079,0.916949856865823,0.916802105457568,
+        0.916654354049312,0.916506602641056,0.916358851232801,0.916211099824545,
+        0.91606334841629,0.915915597008034,0.915767845599778,0.915620094191523,
+        0.915472342783267,0.915324591375012,0.915176839966756,0.9150290885585,
+        0.914881337150245,0.914733585741989,0.914585834333734,0.914438082925478,
+        0.914290331517222,0.914142580108967,0.913994828700711,0.913847077292455,
+        0.9136993258842,0.913551574475944,0.913403823067689,0.913256071659433,
+        0.913108320251177,0.912960568842922,0.912812817434666,0.912665066026411,
+        0.912517314618155,0.912369563209899,0.912221811801644,0.912074060393388,
+        0.911926308985132,0.911778557576877,0.911630806168621,0.911483054760366,
+        0.91133530335211,0.911187551943854,0.911039800535599,0.910892049127343,
+        0.910744297719088,0.910596546310832,0.910448794902576,0.910301043494321,
+        0.910153292086065,0.91000554067781,0.909857789269554,0.909710037861298,
+        0.909562286453043,0.909414535044787,0.909266783636532,0.909119032228276,
+        0.90897128082002,0.908823529411765,0.908675778003509,0.908528026595253,
+        0.908380275186998,0.908232523778742,0.908084772370487,0.907937020962231,
+        0.907789269553975,0.90764151814572,0.907493766737464,0.907346015329209,
+        0.907198263920953,0.907050512512697,0.906902761104442,0.906755009696186,
+        0.906607258287931,0.906459506879675,0.906311755471419,0.906164004063164,
+        0.906016252654908,0.905868501246653,0.905720749838397,0.905572998430141,
+        0.905425247021886,0.90527749561363,0.905129744205375,0.904981992797119,
+        0.904834241388863,0.904686489980608,0.904538738572352,0.904390987164096,
+        0.904243235755841,0.904095484347585,0.90394773293933,0.903799981531074,
+        0.903652230122818,0.903504478714563,0.903356727306307,0.903208975898051,
+        0.903061224489796,0.90291347308154,0.902765721673285,0.902617970265029,
+        0.902470218856773,0.902322467448518,0.902174716040262,0.902026964632007,
+        0.901879213223751,0.901731461815495,0.90158371040724,0.901435958998984,
+        0.901288207590729,0.901140456182473,0.900992704774217,0.900844953365962,
+        0.900697201957706,0.900549450549451,0.900401699141195,0.900253947732939,
+        0.900106196324684,0.899958444916428,0.899810693508173,0.899662942099917,
+        0.899515190691661,0.899367439283406,0.89921968787515,0.899071936466894,
+        0.898924185058639,0.898776433650383,0.898628682242128,0.898480930833872,
+        0.898333179425616,0.898185428017361,0.898037676609105,0.89788992520085,
+        0.897742173792594,0.897594422384338,0.897446670976083,0.897298919567827,
+        0.897151168159572,0.897003416751316,0.89685566534306,0.896707913934805,
+        0.896560162526549,0.896412411118294,0.896264659710038,0.896116908301782,
+        0.895969156893527,0.895821405485271,0.895673654077015,0.89552590266876,
+        0.895378151260504,0.895230399852249,0.895082648443993,0.894934897035737,
+        0.894787145627482,0.894639394219226,0.89449164281097,0.894343891402715,
+        0.894196139994459,0.894048388586204,0.893900637177948,0.893752885769692,
+        0.893605134361437,0.893457382953181,0.893309631544926,0.89316188013667,
+        0.893014128728414,0.892866377320159,0.892718625911903,0.892570874503648,
+        0.892423123095392,0.892275371687136,0.892127620278881,0.891979868870625,
+        0.89183211746237,0.891684366054114,0.891536614645858,0.891388863237603,
+        0.891241111829347,0.891093360421092,0.890945609012836,0.89079785760458,
+        0.890650106196325,0.890502354788069,0.890354603379813,0.890206851971558,
+        0.890059100563302,0.889911349155047,0.889763597746791,0.889615846338535,
+        0.88946809493028,0.889320343522024,0.889172592113769,0.889024840705513,
+        0.888877089297257,0.888729337889002,0.888581586480746,0.888433835072491,
+        0.888286083664235,0.888138332255979,0.887990580847724,0.887842829439468,
+        0.887695078031213,0.887547326622957,0.887399575214701,0.887251823806446,
+        0.88710407239819,0.886956320989934,0.886808569581679,0.886660818173423,
+        0.886513066765168,0.886365315356912,0.886217563948656,0.886069812540401,
+        0.885922061132145,0.88577430972389,0.885626558315634,0.885478806907378,
+        0.885331055499123,0.885183304090867,0.885035552682611,0.884887801274356,
+        0.8847400498661,0.884592298457845,0.884444547049589,0.884296795641333,
+        0.884149044233078,0.884001292824822,0.883853541416567,0.883705790008311,
+        0.883558038600055,0.8834102871918,0.883262535783544,0.883114784375289,
+        0.882967032967033,0.882819281558777,0.882671530150522,0.882523778742266,
+        0.882376027334011,0.882228275925755,0.882080524517499,0.881932773109244,
+        0.881785021700988,0.881637270292732,0.881489518884477,0.881341767476221,
+        0.881194016067966,0.88104626465971,0.880898513251454,0.880750761843199,
+        0.880603010434943,0.880455259026688,0.880307507618432,0.880159756210176,
+        0.880012004801921,0.879864253393665,0.87971650198541,0.879568750577154,
+        0.879420999168898,0.879273247760643,0.879125496352387,0.878977744944132,
+        0.878829993535876,0.87868224212762,0.878534490719365,0.878386739311109,
+        0.878238987902853,0.878091236494598,0.877943485086342,0.877795733678087,
+        0.877647982269831,0.877500230861575,0.87735247945332,0.877204728045064,
+        0.877056976636809,0.876909225228553,0.876761473820297,0.876613722412042,
+        0.876465971003786,0.87631821959553,0.876170468187275,0.876022716779019,
+        0.875874965370764,0.875727213962508,0.875579462554252,0.875431711145997,
+        0.875283959737741,0.875136208329486,0.87498845692123,0.874840705512974,
+        0.874692954104719,0.874545202696463,0.874397451288208,0.874249699879952,
+        0.874101948471696,0.873954197063441,0.873806445655185,0.87365869424693,
+        0.873510942838674,0.873363191430418,0.873215440022163,0.873067688613907,
+        0.872919937205652,0.872772185797396,0.87262443438914,0.872476682980885,
+        0.872328931572629,0.872181180164373,0.872033428756118,0.871885677347862,
+        0.871737925939607,0.871590174531351,0.871442423123095,0.87129467171484,
+        0.871146920306584,0.870999168898329,0.870851417490073,0.870703666081817,
+        0.870555914673562,0.870408163265306,0.87026041185705,0.870112660448795,
+        0.869964909040539,0.869817157632284,0.869669406224028,0.869521654815772,
+        0.869373903407517,0.869226151999261,0.869078400591006,0.86893064918275,
+        0.868782897774494,0.868635146366239,0.868487394957983,0.868339643549728,
+        0.868191892141472,0.868044140733216,0.867896389324961,0.867748637916705,
+        0.86760088650845,0.867453135100194,0.867305383691938,0.867157632283683,
+        0.867009880875427,0.866862129467171,0.866714378058916,0.86656662665066,
+        0.866418875242405,0.866271123834149,0.866123372425893,0.865975621017638,
+        0.865827869609382,0.865680118201127,0.865532366792871,0.865384615384615,
+        0.86523686397636,0.865089112568104,0.864941361159849,0.864793609751593,
+        0.864645858343337,0.864498106935082,0.864350355526826,0.864202604118571,
+        0.864054852710315,0.863907101302059,0.863759349893804,0.863611598485548,
+        0.863463847077292,0.863316095669037,0.863168344260781,0.863020592852526,
+        0.86287284144427,0.862725090036014,0.862577338627759,0.862429587219503,
+        0.862281835811248,0.862134084402992,0.861986332994736,0.861838581586481,
+        0.861690830178225,0.861543078769969,0.861395327361714,0.861247575953458,
+        0.861099824545203,0.860952073136947,0.860804321728691,0.860656570320436,
+        0.86050881891218,0.860361067503925,0.860213316095669,0.860065564687413,
+        0.859917813279158,0.859770061870902,0.859622310462647,0.859474559054391,
+        0.859326807646135,0.85917905623788,0.859031304829624,0.858883553421369,
+        0.858735802013113,0.858588050604857,0.858440299196602,0.858292547788346,
+        0.85814479638009,0.857997044971835,0.857849293563579,0.857701542155324,
+        0.857553790747068,0.857406039338812,0.857258287930557,0.857110536522301,
+        0.856962785114046,0.85681503370579,0.856667282297534,0.856519530889279,
+        0.856371779481023,0.856224028072768,0.856076276664512,0.855928525256256,
+        0.855780773848001,0.855633022439745,0.85548527103149,0.855337519623234,
+        0.855189768214978,0.855042016806723,0.854894265398467,0.854746513990212,
+        0.854598762581956,0.8544510111737,0.854303259765445,0.854155508357189,
+        0.854007756948933,0.853860005540678,0.853712254132422,0.853564502724167,
+        0.853416751315911,0.853268999907655,0.8531212484994,0.852973497091144,
+        0.852825745682888,0.852677994274633,0.852530242866377,0.852382491458122,
+        0.852234740049866,0.85208698864161,0.851939237233355,0.851791485825099,
+        0.851643734416844,0.851495983008588,0.851348231600332,0.851200480192077,
+        0.851052728783821,0.850904977375566,0.85075722596731,0.850609474559054,
+        0.850461723150799,0.850313971742543,0.850166220334288,0.850018468926032,
+        0.849870717517776,0.849722966109521,0.849575214701265,0.84942746329301,
+        0.849279711884754,0.849131960476498,0.848984209068243,0.848836457659987,
+        0.848688706251731,0.848540954843476,0.84839320343522,0.848245452026965,
+        0.848097700618709,0.847949949210453,0.847802197802198,0.847654446393942,
+        0.847506694985687,0.847358943577431,0.847211192169175,0.84706344076092,
+        0.846915689352664,0.846767937944409,0.846620186536153,0.846472435127897,
+        0.846324683719642,0.846176932311386,0.846029180903131,0.845881429494875,
+        0.845733678086619,0.845585926678364,0.845438175270108,0.845290423861852,
+        0.845142672453597,0.844994921045341,0.844847169637086,0.84469941822883,
+        0.844551666820574,0.844403915412319,0.844256164004063,0.844108412595808,
+        0.843960661187552,0.843812909779296,0.843665158371041,0.843517406962785,
+        0.843369655554529,0.843221904146274,0.843074152738018,0.842926401329763,
+        0.842778649921507,0.842630898513251,0.842483147104996,0.84233539569674,
+        0.842187644288485,0.842039892880229,0.841892141471973,0.841744390063718,
+        0.841596638655462,0.841448887247207,0.841301135838951,0.841153384430695,
+        0.84100563302244,0.840857881614184,0.840710130205929,0.840562378797673,
+        0.840414627389417,0.840266875981162,0.840119124572906,0.83997137316465,
+        0.839823621756395,0.839675870348139,0.839528118939884,0.839380367531628,
+        0.839232616123372,0.839084864715117,0.838937113306861,0.838789361898606,
+        0.83864161049035,0.838493859082094,0.838346107673839,0.838198356265583,
+        0.838050604857328,0.837902853449072,0.837755102040816,0.837607350632561,
+        0.837459599224305,0.83731184781605,0.837164096407794,0.837016344999538,
+        0.836868593591283,0.836720842183027,0.836573090774771,0.836425339366516,
+        0.83627758795826,0.836129836550005,0.835982085141749,0.835834333733493,
+        0.835686582325238,0.835538830916982,0.835391079508727,0.835243328100471,
+        0.835095576692215,0.83494782528396,0.834800073875704,0.834652322467448,
+        0.834504571059193,0.834356819650937,0.834209068242682,0.834061316834426,
+        0.83391356542617,0.833765814017915,0.833618062609659,0.833470311201404,
+        0.833322559793148,0.833174808384892,0.833027056976637,0.832879305568381,
+        0.832731554160126,0.83258380275187,0.832436051343614,0.832288299935359,
+        0.832140548527103,0.831992797118848,0.831845045710592,0.831697294302336,
+        0.831549542894081,0.831401791485825,0.83125404007757,0.831106288669314,
+        0.830958537261058,0.830810785852803,0.830663034444547,0.830515283036291,
+        0.830367531628036,0.83021978021978,0.830072028811525,0.829924277403269,
+        0.829776525995013,0.829628774586758,0.829481023178502,0.829333271770247,
+        0.829185520361991,0.829037768953735,0.82889001754548,0.828742266137224,
+        0.828594514728969,0.828446763320713,0.828299011912457,0.828151260504202,
+        0.828003509095946,0.82785575768769,0.827708006279435,0.827560254871179,
+        0.827412503462924,0.827264752054668,0.827117000646412,0.826969249238157,
+        0.826821497829901,0.826673746421646,0.82652599501339,0.826378243605134,
+        0.826230492196879,0.826082740788623,0.825934989380368,0.825787237972112,
+        0.825639486563856,0.825491735155601,0.825343983747345,0.825196232339089,
+        0.825048480930834,0.824900729522578,0.824752978114323,0.824605226706067,
+        0.824457475297811,0.824309723889556,0.8241619724813,0.824014221073045,
+        0.823866469664789,0.823718718256533,0.823570966848278,0.823423215440022,
+        0.823275464031767,0.823127712623511,0.822979961215255,0.822832209807,
+        0.822684458398744,0.822536706990489,0.822388955582233,0.822241204173977,
+        0.822093452765722,0.821945701357466,0.82179794994921,0.821650198540955,
+        0.821502447132699,0.821354695724444,0.821206944316188,0.821059192907932,
+        0.820911441499677,0.820763690091421,0.820615938683166,0.82046818727491,
+        0.820320435866654,0.820172684458399,0.820024933050143,0.819877181641887,
+        0.819729430233632,0.819581678825376,0.819433927417121,0.819286176008865,
+        0.819138424600609,0.818990673192354,0.818842921784098,0.818695170375843,
+        0.818547418967587,0.818399667559331,0.818251916151076,0.81810416474282,
+        0.817956413334565,0.817808661926309,0.817660910518053,0.817513159109798,
+        0.817365407701542,0.817217656293287,0.817069904885031,0.816922153476775,
+        0.81677440206852,0.816626650660264,0.816478899252008,0.816331147843753,
+        0.816183396435497,0.816035645027242,0.815887893618986,0.81574014221073,
+        0.815592390802475,0.815444639394219,0.815296887985964,0.815149136577708,
+        0.815001385169452,0.814853633761197,0.814705882352941,0.814558130944686,
+        0.81441037953643,0.814262628128174,0.814114876719919,0.813967125311663,
+        0.813819373903408,0.813671622495152,0.813523871086896,0.813376119678641,
+        0.813228368270385,0.81308061686213,0.812932865453874,0.812785114045618,
+        0.812637362637363,0.812489611229107,0.812341859820851,0.812194108412596,
+        0.81204635700434,0.811898605596085,0.811750854187829,0.811603102779573,
+        0.811455351371318,0.811307599963062,0.811159848554806,0.811012097146551,
+        0.810864345738295,0.81071659433004,0.810568842921784,0.810421091513528,
+        0.810273340105273,0.810125588697017,0.809977837288762,0.809830085880506,
+        0.80968233447225,0.809534583063995,0.809386831655739,0.809239080247484,
+        0.809091328839228,0.808943577430972,0.808795826022717,0.808648074614461,
+        0.808500323206206,0.80835257179795,0.808204820389694,0.808057068981439,
+        0.807909317573183,0.807761566164928,0.807613814756672,0.807466063348416,
+        0.807318311940161,0.807170560531905,0.807022809123649,0.806875057715394,
+        0.806727306307138,0.806579554898883,0.806431803490627,0.806284052082371,
+        0.806136300674116,0.80598854926586,0.805840797857605,0.805693046449349,
+        0.805545295041093,0.805397543632838,0.805249792224582,0.805102040816327,
+        0.804954289408071,0.804806537999815,0.80465878659156,0.804511035183304,
+        0.804363283775049,0.804215532366793,0.804067780958537,0.803920029550282,
+        0.803772278142026,0.80362452673377,0.803476775325515,0.803329023917259,
+        0.803181272509004,0.803033521100748,0.802885769692492,0.802738018284237,
+        0.802590266875981,0.802442515467726,0.80229476405947,0.802147012651214,
+        0.801999261242959,0.801851509834703,0.801703758426447,0.801556007018192,
+        0.801408255609936,0.801260504201681,0.801112752793425,0.800965001385169,
+        0.800817249976914,0.800669498568658,0.800521747160403,0.800373995752147,
+        0.800226244343891,0.800078492935636,0.79993074152738,0.799782990119125,
+        0.799635238710869,0.799487487302613,0.799339735894358,0.799191984486102,
+        0.799044233077847,0.798896481669591,0.798748730261335,0.79860097885308,
+        0.798453227444824,0.798305476036568,0.798157724628313,0.798009973220057,
+        0.797862221811802,0.797714470403546,0.79756671899529,0.797418967587035,
+        0.797271216178779,0.797123464770524,0.796975713362268,0.796827961954012,
+        0.796680210545757,0.796532459137501,0.796384707729246,0.79623695632099,
+        0.796089204912734,0.795941453504479,0.795793702096223,0.795645950687968,
+        0.795498199279712,0.795350447871456,0.795202696463201,0.795054945054945,
+        0.794907193646689,0.794759442238434,0.794611690830178,0.794463939421923,
+        0.794316188013667,0.794168436605411,0.794020685197156,0.7938729337889,
+        0.793725182380645,0.793577430972389,0.793429679564133,0.793281928155878,
+        0.793134176747622,0.792986425339366,0.792838673931111,0.792690922522855,
+        0.7925431711146,0.792395419706344,0.792247668298088,0.792099916889833,
+        0.791952165481577,0.791804414073322,0.791656662665066,0.79150891125681,
+        0.791361159848555,0.791213408440299,0.791065657032044,0.790917905623788,
+        0.790770154215532,0.790622402807277,0.790474651399021,0.790326899990766,
+        0.79017914858251,0.790031397174254,0.789883645765999,0.789735894357743,
+        0.789588142949488,0.789440391541232,0.789292640132976,0.789144888724721,
+        0.788997137316465,0.788849385908209,0.788701634499954,0.788553883091698,
+        0.788406131683443,0.788258380275187,0.788110628866931,0.787962877458676,
+        0.78781512605042,0.787667374642165,0.787519623233909,0.787371871825653,
+        0.787224120417398,0.787076369009142,0.786928617600887,0.786780866192631,
+        0.786633114784375,0.78648536337612,0.786337611967864,0.786189860559608,
+        0.786042109151353,0.785894357743097,0.785746606334842,0.785598854926586,
+        0.78545110351833,0.785303352110075,0.785155600701819,0.785007849293564,
+        0.784860097885308,0.784712346477052,0.784564595068797,0.784416843660541,
+        0.784269092252286,0.78412134084403,0.783973589435774,0.783825838027519,
+        0.783678086619263,0.783530335211007,0.783382583802752,0.783234832394496,
+        0.783087080986241,0.782939329577985,0.782791578169729,0.782643826761474,
+        0.782496075353218,0.782348323944963,0.782200572536707,0.782052821128451,
+        0.781905069720196,0.78175731831194,0.781609566903685,0.781461815495429,
+        0.781314064087173,0.781166312678918,0.781018561270662,0.780870809862407,
+        0.780723058454151,0.780575307045895,0.78042755563764,0.780279804229384,
+        0.780132052821128,0.779984301412873,0.779836550004617,0.779688798596362,
+        0.779541047188106,0.77939329577985,0.779245544371595,0.779097792963339,
+        0.778950041555084,0.778802290146828,0.778654538738572,0.778506787330317,
+        0.778359035922061,0.778211284513806,0.77806353310555,0.777915781697294,
+        0.777768030289039,0.777620278880783,0.777472527472527,0.777324776064272,
+        0.777177024656016,0.777029273247761,0.776881521839505,0.776733770431249,
+        0.776586019022994,0.776438267614738,0.776290516206483,0.776142764798227,
+        0.775995013389971,0.775847261981716,0.77569951057346,0.775551759165205,
+        0.775404007756949,0.775256256348693,0.775108504940438,0.774960753532182,
+        0.774813002123926,0.774665250715671,0.774517499307415,0.77436974789916,
+        0.774221996490904,0.774074245082648,0.773926493674393,0.773778742266137,
+        0.773630990857882,0.773483239449626,0.77333548804137,0.773187736633115,
+        0.773039985224859,0.772892233816604,0.772744482408348,0.772596731000092,
+        0.772448979591837,0.772301228183581,0.772153476775326,0.77200572536707,
+        0.771857973958814,0.771710222550559,0.771562471142303,0.771414719734048,
+        0.771266968325792,0.771119216917536,0.770971465509281,0.770823714101025,
+        0.770675962692769,0.770528211284514,0.770380459876258,0.770232708468003,
+        0.770084957059747,0.769937205651491,0.769789454243236,0.76964170283498,
+        0.769493951426724,0.769346200018469,0.769198448610213,0.769050697201958,
+        0.768902945793702,0.768755194385446,0.768607442977191,0.768459691568935,
+        0.76831194016068,0.768164188752424,0.768016437344168,0.767868685935913,
+        0.767720934527657,0.767573183119402,0.767425431711146,0.76727768030289,
+        0.767129928894635,0.766982177486379,0.766834426078124,0.766686674669868,
+        0.766538923261612,0.766391171853357,0.766243420445101,0.766095669036846,
+        0.76594791762859,0.765800166220334,0.765652414812079,0.765504663403823,
+        0.765356911995567,0.765209160587312,0.765061409179056,0.764913657770801,
+        0.764765906362545,0.764618154954289,0.764470403546034,0.764322652137778,
+        0.764174900729523,0.764027149321267,0.763879397913011,0.763731646504756,
+        0.7635838950965,0.763436143688245,0.763288392279989,0.763140640871733,
+        0.762992889463478,0.762845138055222,0.762697386646967,0.762549635238711,
+        0.762401883830455,0.7622541324222,0.762106381013944,0.761958629605688,
+        0.761810878197433,0.761663126789177,0.761515375380922,0.761367623972666,
+        0.76121987256441,0.761072121156155,0.760924369747899,0.760776618339643,
+        0.760628866931388,0.760481115523132,0.760333364114877,0.760185612706621,
+        0.760037861298365,0.75989010989011,0.759742358481854,0.759594607073599,
+        0.759446855665343,0.759299104257087,0.759151352848832,0.759003601440576,
+        0.758855850032321,0.758708098624065,0.758560347215809,0.758412595807554,
+        0.758264844399298,0.758117092991043,0.757969341582787,0.757821590174531,
+        0.757673838766276,0.75752608735802,0.757378335949765,0.757230584541509,
+        0.757082833133253,0.756935081724998,0.756787330316742,0.756639578908486,
+        0.756491827500231,0.756344076091975,0.75619632468372,0.756048573275464,
+        0.755900821867208,0.755753070458953,0.755605319050697,0.755457567642442,
+        0.755309816234186,0.75516206482593,0.755014313417675,0.754866562009419,
+        0.754718810601164,0.754571059192908,0.754423307784652,0.754275556376397,
+        0.754127804968141,0.753980053559886,0.75383230215163,0.753684550743374,
+        0.753536799335119,0.753389047926863,0.753241296518607,0.753093545110352,
+        0.752945793702096,0.752798042293841,0.752650290885585,0.752502539477329,
+        0.752354788069074,0.752207036660818,0.752059285252563,0.751911533844307,
+        0.751763782436051,0.751616031027796,0.75146827961954,0.751320528211284,
+        0.751172776803029,0.751025025394773,0.750877273986518,0.750729522578262,
+        0.750581771170006,0.750434019761751,0.750286268353495,0.75013851694524,
+        0.749990765536984,0.749843014128728,0.749695262720473,0.749547511312217,
+        0.749399759903962,0.749252008495706,0.74910425708745,0.748956505679195,
+        0.748808754270939,0.748661002862684,0.748513251454428,0.748365500046172,
+        0.748217748637917,0.748069997229661,0.747922245821406,0.74777449441315,
+        0.747626743004894,0.747478991596639,0.747331240188383,0.747183488780127,
+        0.747035737371872,0.746887985963616,0.746740234555361,0.746592483147105,
+        0.746444731738849,0.746296980330594,0.746149228922338,0.746001477514083,
+        0.745853726105827,0.745705974697571,0.745558223289316,0.74541047188106,
+        0.745262720472805,0.745114969064549,0.744967217656293,0.744819466248038,
+        0.744671714839782,0.744523963431526,0.744376212023271,0.744228460615015,
+        0.74408070920676,0.743932957798504,0.743785206390248,0.743637454981993,
+        0.743489703573737,0.743341952165482,0.743194200757226,0.74304644934897,
+        0.742898697940715,0.742750946532459,0.742603195124203,0.742455443715948,
+        0.742307692307692,0.742159940899437,0.742012189491181,0.741864438082925,
+        0.74171668667467,0.741568935266414,0.741421183858159,0.741273432449903,
+        0.741125681041647,0.740977929633392,0.740830178225136,0.740682426816881,
+        0.740534675408625,0.740386924000369,0.740239172592114,0.740091421183858,
+        0.739943669775603,0.739795918367347,0.739648166959091,0.739500415550836,
+        0.73935266414258,0.739204912734325,0.739057161326069,0.738909409917813,
+        0.738761658509558,0.738613907101302,0.738466155693046,0.738318404284791,
+        0.738170652876535,0.73802290146828,0.737875150060024,0.737727398651768,
+        0.737579647243513,0.737431895835257,0.737284144427002,0.737136393018746,
+        0.73698864161049,0.736840890202235,0.736693138793979,0.736545387385724,
+        0.736397635977468,0.736249884569212,0.736102133160957,0.735954381752701,
+        0.735806630344445,0.73565887893619,0.735511127527934,0.735363376119679,
+        0.735215624711423,0.735067873303167,0.734920121894912,0.734772370486656,
+        0.734624619078401,0.734476867670145,0.734329116261889,0.734181364853634,
+        0.734033613445378,0.733885862037123,0.733738110628867,0.733590359220611,
+        0.733442607812356,0.7332948564041,0.733147104995844,0.732999353587589,
+        0.732851602179333,0.732703850771078,0.732556099362822,0.732408347954566,
+        0.732260596546311,0.732112845138055,0.7319650937298,0.731817342321544,
+        0.731669590913288,0.731521839505033,0.731374088096777,0.731226336688522,
+        0.731078585280266,0.73093083387201,0.730783082463755,0.730635331055499,
+        0.730487579647244,0.730339828238988,0.730192076830732,0.730044325422477,
+        0.729896574014221,0.729748822605965,0.72960107119771,0.729453319789454,
+        0.729305568381199,0.729157816972943,0.729010065564687,0.728862314156432,
+        0.728714562748176,0.728566811339921,0.728419059931665,0.728271308523409,
+        0.728123557115154,0.727975805706898,0.727828054298643,0.727680302890387,
+        0.727532551482131,0.727384800073876,0.72723704866562,0.727089297257364,
+        0.726941545849109,0.726793794440853,0.726646043032598,0.726498291624342,
+        0.726350540216086,0.726202788807831,0.726055037399575,0.72590728599132,
+        0.725759534583064,0.725611783174808,0.725464031766553,0.725316280358297,
+        0.725168528950042,0.725020777541786,0.72487302613353,0.724725274725275,
+        0.724577523317019,0.724429771908763,0.724282020500508,0.724134269092252,
+        0.723986517683997,0.723838766275741,0.723691014867485,0.72354326345923,
+        0.723395512050974,0.723247760642719,0.723100009234463,0.722952257826207,
+        0.722804506417952,0.722656755009696,0.722509003601441,0.722361252193185,
+        0.722213500784929,0.722065749376674,0.721917997968418,0.721770246560163,
+        0.721622495151907,0.721474743743651,0.721326992335396,0.72117924092714,
+        0.721031489518885,0.720883738110629,0.720735986702373,0.720588235294118,
+        0.720440483885862,0.720292732477606,0.720144981069351,0.719997229661095,
+        0.71984947825284,0.719701726844584,0.719553975436328,0.719406224028073,
+        0.719258472619817,0.719110721211561,0.718962969803306,0.71881521839505,
+        0.718667466986795,0.718519715578539,0.718371964170283,0.718224212762028,
+        0.718076461353772,0.717928709945517,0.717780958537261,0.717633207129005,
+        0.71748545572075,0.717337704312494,0.717189952904239,0.717042201495983,
+        0.716894450087727,0.716746698679472,0.716598947271216,0.716451195862961,
+        0.716303444454705,0.716155693046449,0.716007941638194,0.715860190229938,
+        0.715712438821683,0.715564687413427,0.715416936005171,0.715269184596916,
+        0.71512143318866,0.714973681780404,0.714825930372149,0.714678178963893,
+        0.714530427555638,0.714382676147382,0.714234924739126,0.714087173330871,
+        0.713939421922615,0.71379167051436,0.713643919106104,0.713496167697848,
+        0.713348416289593,0.713200664881337,0.713052913473082,0.712905162064826,
+        0.71275741065657,0.712609659248315,0.712461907840059,0.712314156431804,
+        0.712166405023548,0.712018653615292,0.711870902207037,0.711723150798781,
+        0.711575399390525,0.71142764798227,0.711279896574014,0.711132145165759,
+        0.710984393757503,0.710836642349247,0.710688890940992,0.710541139532736,
+        0.710393388124481,0.710245636716225,0.710097885307969,0.709950133899714,
+        0.709802382491458,0.709654631083202,0.709506879674947,0.709359128266691,
+        0.709211376858436,0.70906362545018,0.708915874041924,0.708768122633669,
+        0.708620371225413,0.708472619817158,0.708324868408902,0.708177117000646,
+        0.708029365592391,0.707881614184135,0.70773386277588,0.707586111367624,
+        0.707438359959368,0.707290608551113,0.707142857142857,0.706995105734602,
+        0.706847354326346,0.70669960291809,0.706551851509835,0.706404100101579,
+        0.706256348693323,0.706108597285068,0.705960845876812,0.705813094468557,
+        0.705665343060301,0.705517591652045,0.70536984024379,0.705222088835534,
+        0.705074337427279,0.704926586019023,0.704778834610767,0.704631083202512,
+        0.704483331794256,0.704335580386001,0.704187828977745,0.704040077569489,
+        0.703892326161234,0.703744574752978,0.703596823344723,0.703449071936467,
+        0.703301320528211,0.703153569119956,0.7030058177117,0.702858066303444,
+        0.702710314895189,0.702562563486933,0.702414812078678,0.702267060670422,
+        0.702119309262166,0.701971557853911,0.701823806445655,0.7016760550374,
+        0.701528303629144,0.701380552220888,0.701232800812633,0.701085049404377,
+        0.700937297996121,0.700789546587866,0.70064179517961,0.700494043771355,
+        0.700346292363099,0.700198540954843,0.700050789546588,0.699903038138332,
+        0.699755286730077,0.699607535321821,0.699459783913565,0.69931203250531,
+        0.699164281097054,0.699016529688799,0.698868778280543,0.698721026872287,
+        0.698573275464032,0.698425524055776,0.698277772647521,0.698130021239265,
+        0.697982269831009,0.697834518422754,0.697686767014498,0.697539015606243,
+        0.697391264197987,0.697243512789731,0.697095761381476,0.69694800997322,
+        0.696800258564964,0.696652507156709,0.696504755748453,0.696357004340198,
+        0.696209252931942,0.696061501523686,0.695913750115431,0.695765998707175,
+        0.69561824729892,0.695470495890664,0.695322744482408,0.695174993074153,
+        0.695027241665897,0.694879490257642,0.694731738849386,0.69458398744113,
+        0.694436236032875,0.694288484624619,0.694140733216363,0.693992981808108,
+        0.693845230399852,0.693697478991597,0.693549727583341,0.693401976175085,
+        0.69325422476683,0.693106473358574,0.692958721950319,0.692810970542063,
+        0.692663219133807,0.692515467725552,0.692367716317296,0.692219964909041,
+        0.692072213500785,0.691924462092529,0.691776710684274,0.691628959276018,
+        0.691481207867762,0.691333456459507,0.691185705051251,0.691037953642996,
+        0.69089020223474,0.690742450826484,0.690594699418229,0.690446948009973,
+        0.690299196601718,0.690151445193462,0.690003693785206,0.689855942376951,
+        0.689708190968695,0.68956043956044,0.689412688152184,0.689264936743928,
+        0.689117185335673,0.688969433927417,0.688821682519162,0.688673931110906,
+        0.68852617970265,0.688378428294395,0.688230676886139,0.688082925477883,
+        0.687935174069628,0.687787422661372,0.687639671253117,0.687491919844861,
+        0.687344168436605,0.68719641702835,0.687048665620094,0.686900914211839,
+        0.686753162803583,0.686605411395327,0.686457659987072,0.686309908578816,
+        0.686162157170561,0.686014405762305,0.685866654354049,0.685718902945794,
+        0.685571151537538,0.685423400129282,0.685275648721027,0.685127897312771,
+        0.684980145904516,0.68483239449626,0.684684643088004,0.684536891679749,
+        0.684389140271493,0.684241388863238,0.684093637454982,0.683945886046726,
+        0.683798134638471,0.683650383230215,0.68350263182196,0.683354880413704,
+        0.683207129005448,0.683059377597193,0.682911626188937,0.682763874780681,
+        0.682616123372426,0.68246837196417,0.682320620555915,0.682172869147659,
+        0.682025117739403,0.681877366331148,0.681729614922892,0.681581863514637,
+        0.681434112106381,0.681286360698125,0.68113860928987,0.680990857881614,
+        0.680843106473359,0.680695355065103,0.680547603656847,0.680399852248592,
+        0.680252100840336,0.680104349432081,0.679956598023825,0.679808846615569,
+        0.679661095207314,0.679513343799058,0.679365592390803,0.679217840982547,
+        0.679070089574291,0.678922338166036,0.67877458675778,0.678626835349524,
+        0.678479083941269,0.678331332533013,0.678183581124758,0.678035829716502,
+        0.677888078308246,0.677740326899991,0.677592575491735,0.67744482408348,
+        0.677297072675224,0.677149321266968,0.677001569858713,0.676853818450457,
+        0.676706067042201,0.676558315633946,0.67641056422569,0.676262812817435,
+        0.676115061409179,0.675967310000923,0.675819558592668,0.675671807184412,
+        0.675524055776157,0.675376304367901,0.675228552959645,0.67508080155139,
+        0.674933050143134,0.674785298734879,0.674637547326623,0.674489795918367,
+        0.674342044510112,0.674194293101856,0.674046541693601,0.673898790285345,
+        0.673751038877089,0.673603287468834,0.673455536060578,0.673307784652322,
+        0.673160033244067,0.673012281835811,0.672864530427556,0.6727167790193,
+        0.672569027611044,0.672421276202789,0.672273524794533,0.672125773386278,
+        0.671978021978022,0.671830270569766,0.671682519161511,0.671534767753255,
+        0.671387016345,0.671239264936744,0.671091513528488,0.670943762120233,
+        0.670796010711977,0.670648259303722,0.670500507895466,0.67035275648721,
+        0.670205005078955,0.670057253670699,0.669909502262443,0.669761750854188,
+        0.669613999445932,0.669466248037677,0.669318496629421,0.669170745221165,
+        0.66902299381291,0.668875242404654,0.668727490996399,0.668579739588143,
+        0.668431988179887,0.668284236771632,0.668136485363376,0.66798873395512,
+        0.667840982546865,0.667693231138609,0.667545479730354,0.667397728322098,
+        0.667249976913842,0.667102225505587,0.666954474097331,0.666806722689076,
+        0.66665897128082,0.666511219872564,0.666363468464309,0.666215717056053,
+        0.666067965647798,0.665920214239542,0.665772462831286,0.665624711423031,
+        0.665476960014775,0.66532920860652,0.665181457198264,0.665033705790008,
+        0.664885954381753,0.664738202973497,0.664590451565241,0.664442700156986,
+        0.66429494874873,0.664147197340475,0.663999445932219,0.663851694523963,
+        0.663703943115708,0.663556191707452,0.663408440299197,0.663260688890941,
+        0.663112937482685,0.66296518607443,0.662817434666174,0.662669683257919,
+        0.662521931849663,0.662374180441407,0.662226429033152,0.662078677624896,
+        0.661930926216641,0.661783174808385,0.661635423400129,0.661487671991874,
+        0.661339920583618,0.661192169175362,0.661044417767107,0.660896666358851,
+        0.660748914950596,0.66060116354234,0.660453412134084,0.660305660725829,
+        0.660157909317573,0.660010157909318,0.659862406501062,0.659714655092806,
+        0.659566903684551,0.659419152276295,0.659271400868039,0.659123649459784,
+        0.658975898051528,0.658828146643273,0.658680395235017,0.658532643826761,
+        0.658384892418506,0.65823714101025,0.658089389601995,0.657941638193739,
+        0.657793886785483,0.657646135377228,0.657498383968972,0.657350632560717,
+        0.657202881152461,0.657055129744205,0.65690737833595,0.656759626927694,
+        0.656611875519439,0.656464124111183,0.656316372702927,0.656168621294672,
+        0.656020869886416,0.655873118478161,0.655725367069905,0.655577615661649,
+        0.655429864253394,0.655282112845138,0.655134361436882,0.654986610028627,
+        0.654838858620371,0.654691107212116,0.65454335580386,0.654395604395604,
+        0.654247852987349,0.654100101579093,0.653952350170838,0.653804598762582,
+        0.653656847354326,0.653509095946071,0.653361344537815,0.65321359312956,
+        0.653065841721304,0.652918090313048,0.652770338904793,0.652622587496537,
+        0.652474836088281,0.652327084680026,0.65217933327177,0.652031581863515,
+        0.651883830455259,0.651736079047003,0.651588327638748,0.651440576230492,
+        0.651292824822237,0.651145073413981,0.650997322005725,0.65084957059747,
+        0.650701819189214,0.650554067780959,0.650406316372703,0.650258564964447,
+        0.650110813556192,0.649963062147936,0.64981531073968,0.649667559331425,
+        0.649519807923169,0.649372056514914,0.649224305106658,0.649076553698402,
+        0.648928802290147,0.648781050881891,0.648633299473636,0.64848554806538,
+        0.648337796657124,0.648190045248869,0.648042293840613,0.647894542432358,
+        0.647746791024102,0.647599039615846,0.647451288207591,0.647303536799335,
+        0.64715578539108,0.647008033982824,0.646860282574568,0.646712531166313,
+        0.646564779758057,0.646417028349801,0.646269276941546,0.64612152553329,
+        0.645973774125035,0.645826022716779,0.645678271308523,0.645530519900268,
+        0.645382768492012,0.645235017083757,0.645087265675501,0.644939514267245,
+        0.64479176285899,0.644644011450734,0.644496260042479,0.644348508634223,
+        0.644200757225967,0.644053005817712,0.643905254409456,0.6437575030012,
+        0.643609751592945,0.643462000184689,0.643314248776434,0.643166497368178,
+        0.643018745959922,0.642870994551667,0.642723243143411,0.642575491735156,
+        0.6424277403269,0.642279988918644,0.642132237510389,0.641984486102133,
+        0.641836734693878,0.641688983285622,0.641541231877366,0.641393480469111,
+        0.641245729060855,0.641097977652599,0.640950226244344,0.640802474836088,
+        0.640654723427833,0.640506972019577,0.640359220611321,0.640211469203066,
+        0.64006371779481,0.639915966386555,0.639768214978299,0.639620463570043,
+        0.639472712161788,0.639324960753532,0.639177209345277,0.639029457937021,
+        0.638881706528765,0.63873395512051,0.638586203712254,0.638438452303999,
+        0.638290700895743,0.638142949487487,0.637995198079232,0.637847446670976,
+        0.637699695262721,0.637551943854465,0.637404192446209,0.637256441037954,
+        0.637108689629698,0.636960938221442,0.636813186813187,0.636665435404931,
+        0.636517683996676,0.63636993258842,0.636222181180164,0.636074429771909,
+        0.635926678363653,0.635778926955398,0.635631175547142,0.635483424138886,
+        0.635335672730631,0.635187921322375,0.635040169914119,0.634892418505864,
+        0.634744667097608,0.634596915689353,0.634449164281097,0.634301412872841,
+        0.634153661464586,0.63400591005633,0.633858158648075,0.633710407239819,
+        0.633562655831563,0.633414904423308,0.633267153015052,0.633119401606797,
+        0.632971650198541,0.632823898790285,0.63267614738203,0.632528395973774,
+        0.632380644565519,0.632232893157263,0.632085141749007,0.631937390340752,
+        0.631789638932496,0.63164188752424,0.631494136115985,0.631346384707729,
+        0.631198633299474,0.631050881891218,0.630903130482962,0.630755379074707,
+        0.630607627666451,0.630459876258196,0.63031212484994,0.630164373441684,
+        0.630016622033429,0.629868870625173,0.629721119216918,0.629573367808662,
+        0.629425616400406,0.629277864992151,0.629130113583895,0.62898236217564,
+        0.628834610767384,0.628686859359128,0.628539107950873,0.628391356542617,
+        0.628243605134361,0.628095853726106,0.62794810231785,0.627800350909595,
+        0.627652599501339,0.627504848093083,0.627357096684828,0.627209345276572,
+        0.627061593868317,0.626913842460061,0.626766091051805,0.62661833964355,
+        0.626470588235294,0.626322836827038,0.626175085418783,0.626027334010527,
+        0.625879582602272,0.625731831194016,0.62558407978576,0.625436328377505,
+        0.625288576969249,0.625140825560994,0.624993074152738,0.624845322744482,
+        0.624697571336227,0.624549819927971,0.624402068519716,0.62425431711146,
+        0.624106565703204,0.623958814294949,0.623811062886693,0.623663311478438,
+        0.623515560070182,0.623367808661926,0.623220057253671,0.623072305845415,
+        0.622924554437159,0.622776803028904,0.622629051620648,0.622481300212393,
+        0.622333548804137,0.622185797395881,0.622038045987626,0.62189029457937,
+        0.621742543171115,0.621594791762859,0.621447040354603,0.621299288946348,
+        0.621151537538092,0.621003786129837,0.620856034721581,0.620708283313325,
+        0.62056053190507,0.620412780496814,0.620265029088559,0.620117277680303,
+        0.619969526272047,0.619821774863792,0.619674023455536,0.619526272047281,
+        0.619378520639025,0.619230769230769,0.619083017822514,0.618935266414258,
+        0.618787515006002,0.618639763597747,0.618492012189491,0.618344260781236,
+        0.61819650937298,0.618048757964724,0.617901006556469,0.617753255148213,
+        0.617605503739957,0.617457752331702,0.617310000923446,0.617162249515191,
+        0.617014498106935,0.616866746698679,0.616718995290424,0.616571243882168,
+        0.616423492473913,0.616275741065657,0.616127989657401,0.615980238249146,
+        0.61583248684089,0.615684735432635,0.615536984024379,0.615389232616123,
+        0.615241481207868,0.615093729799612,0.614945978391357,0.614798226983101,
+        0.614650475574845,0.61450272416659,0.614354972758334,0.614207221350079,
+        0.614059469941823,0.613911718533567,0.613763967125312,0.613616215717056,
+        0.6134684643088,0.613320712900545,0.613172961492289,0.613025210084034,
+        0.612877458675778,0.612729707267522,0.612581955859267,0.612434204451011,
+        0.612286453042756,0.6121387016345,0.611990950226244,0.611843198817989,
+        0.611695447409733,0.611547696001478,0.611399944593222,0.611252193184966,
+        0.611104441776711,0.610956690368455,0.610808938960199,0.610661187551944,
+        0.610513436143688,0.610365684735433,0.610217933327177,0.610070181918921,
+        0.609922430510666,0.60977467910241,0.609626927694155,0.609479176285899,
+        0.609331424877643,0.609183673469388,0.609035922061132,0.608888170652876,
+        0.608740419244621,0.608592667836365,0.60844491642811,0.608297165019854,
+        0.608149413611598,0.608001662203343,0.607853910795087,0.607706159386832,
+        0.607558407978576,0.60741065657032,0.607262905162065,0.607115153753809,
+        0.606967402345554,0.606819650937298,0.606671899529042,0.606524148120787,
+        0.606376396712531,0.606228645304276,0.60608089389602,0.605933142487764,
+        0.605785391079509,0.605637639671253,0.605489888262998,0.605342136854742,
+        0.605194385446486,0.605046634038231,0.604898882629975,0.604751131221719,
+        0.604603379813464,0.604455628405208,0.604307876996953,0.604160125588697,
+        0.604012374180441,0.603864622772186,0.60371687136393,0.603569119955675,
+        0.603421368547419,0.603273617139163,0.603125865730908,0.602978114322652,
+        0.602830362914397,0.602682611506141,0.602534860097885,0.60238710868963,
+        0.602239357281374,0.602091605873118,0.601943854464863,0.601796103056607,
+        0.601648351648352,0.601500600240096,0.60135284883184,0.601205097423585,
+        0.601057346015329,0.600909594607074,0.600761843198818,0.600614091790562,
+        0.600466340382307,0.600318588974051,0.600170837565796,0.60002308615754,
+        0.599875334749284,0.599727583341029,0.599579831932773,0.599432080524517,
+        0.599284329116262,0.599136577708006,0.598988826299751,0.598841074891495,
+        0.598693323483239,0.598545572074984,0.598397820666728,0.598250069258473,
+        0.598102317850217,0.597954566441961,0.597806815033706,0.59765906362545,
+        0.597511312217195,0.597363560808939,0.597215809400683,0.597068057992428,
+        0.596920306584172,0.596772555175917,0.596624803767661,0.596477052359405,
+        0.59632930095115,0.596181549542894,0.596033798134639,0.595886046726383,
+        0.595738295318127,0.595590543909872,0.595442792501616,0.59529504109336,
+        0.595147289685105,0.594999538276849,0.594851786868594,0.594704035460338,
+        0.594556284052082,0.594408532643827,0.594260781235571,0.594113029827316,
+        0.59396527841906,0.593817527010804,0.593669775602549,0.593522024194293,
+        0.593374272786037,0.593226521377782,0.593078769969526,0.592931018561271,
+        0.592783267153015,0.592635515744759,0.592487764336504,0.592340012928248,
+        0.592192261519993,0.592044510111737,0.591896758703481,0.591749007295226,
+        0.59160125588697,0.591453504478715,0.591305753070459,0.591158001662203,
+        0.591010250253948,0.590862498845692,0.590714747437436,0.590566996029181,
+        0.590419244620925,0.59027149321267,0.590123741804414,0.589975990396158,
+        0.589828238987903,0.589680487579647,0.589532736171392,0.589384984763136,
+        0.58923723335488,0.589089481946625,0.588941730538369,0.588793979130114,
+        0.588646227721858,0.588498476313602,0.588350724905347,0.588202973497091,
+        0.588055222088836,0.58790747068058,0.587759719272324,0.587611967864069,
+        0.587464216455813,0.587316465047558,0.587168713639302,0.587020962231046,
+        0.586873210822791,0.586725459414535,0.586577708006279,0.586429956598024,
+        0.586282205189768,0.586134453781513,0.585986702373257,0.585838950965001,
+        0.585691199556746,0.58554344814849,0.585395696740235,0.585247945331979,
+        0.585100193923723,0.584952442515468,0.584804691107212,0.584656939698956,
+        0.584509188290701,0.584361436882445,0.58421368547419,0.584065934065934,
+        0.583918182657678,0.583770431249423,0.583622679841167,0.583474928432912,
+        0.583327177024656,0.5831794256164,0.583031674208145,0.582883922799889,
+        0.582736171391634,0.582588419983378,0.582440668575122,0.582292917166867,
+        0.582145165758611,0.581997414350356,0.5818496629421,0.581701911533844,
+        0.581554160125589,0.581406408717333,0.581258657309077,0.581110905900822,
+        0.580963154492566,0.580815403084311,0.580667651676055,0.580519900267799,
+        0.580372148859544,0.580224397451288,0.580076646043033,0.579928894634777,
+        0.579781143226521,0.579633391818266,0.57948564041001,0.579337889001755,
+        0.579190137593499,0.579042386185243,0.578894634776988,0.578746883368732,
+        0.578599131960477,0.578451380552221,0.578303629143965,0.57815587773571,
+        0.578008126327454,0.577860374919198,0.577712623510943,0.577564872102687,
+        0.577417120694432,0.577269369286176,0.57712161787792,0.576973866469665,
+        0.576826115061409,0.576678363653154,0.576530612244898,0.576382860836642,
+        0.576235109428387,0.576087358020131,0.575939606611875,0.57579185520362,
+        0.575644103795364,0.575496352387109,0.575348600978853,0.575200849570597,
+        0.575053098162342,0.574905346754086,0.574757595345831,0.574609843937575,
+        0.574462092529319,0.574314341121064,0.574166589712808,0.574018838304553,
+        0.573871086896297,0.573723335488041,0.573575584079786,0.57342783267153,
+        0.573280081263275,0.573132329855019,0.572984578446763,0.572836827038508,
+        0.572689075630252,0.572541324221996,0.572393572813741,0.572245821405485,
+        0.57209806999723,0.571950318588974,0.571802567180718,0.571654815772463,
+        0.571507064364207,0.571359312955952,0.571211561547696,0.57106381013944,
+        0.570916058731185,0.570768307322929,0.570620555914674,0.570472804506418,
+        0.570325053098162,0.570177301689907,0.570029550281651,0.569881798873396,
+        0.56973404746514,0.569586296056884,0.569438544648629,0.569290793240373,
+        0.569143041832118,0.568995290423862,0.568847539015606,0.568699787607351,
+        0.568552036199095,0.568404284790839,0.568256533382584,0.568108781974328,
+        0.567961030566073,0.567813279157817,0.567665527749561,0.567517776341306,
+        0.56737002493305,0.567222273524794,0.567074522116539,0.566926770708283,
+        0.566779019300028,0.566631267891772,0.566483516483516,0.566335765075261,
+        0.566188013667005,0.56604026225875,0.565892510850494,0.565744759442238,
+        0.565597008033983,0.565449256625727,0.565301505217472,0.565153753809216,
+        0.56500600240096,0.564858250992705,0.564710499584449,0.564562748176194,
+        0.564414996767938,0.564267245359682,0.564119493951427,0.563971742543171,
+        0.563823991134916,0.56367623972666,0.563528488318404,0.563380736910149,
+        0.563232985501893,0.563085234093637,0.562937482685382,0.562789731277126,
+        0.562641979868871,0.562494228460615,0.562346477052359,0.562198725644104,
+        0.562050974235848,0.561903222827593,0.561755471419337,0.561607720011081,
+        0.561459968602826,0.56131221719457,0.561164465786315,0.561016714378059,
+        0.560868962969803,0.560721211561548,0.560573460153292,0.560425708745036,
+        0.560277957336781,0.560130205928525,0.55998245452027,0.559834703112014,
+        0.559686951703758,0.559539200295503,0.559391448887247,0.559243697478992,
+        0.559095946070736,0.55894819466248,0.558800443254225,0.558652691845969,
+        0.558504940437714,0.558357189029458,0.558209437621202,0.558061686212947,
+        0.557913934804691,0.557766183396435,0.55761843198818,0.557470680579924,
+        0.557322929171669,0.557175177763413,0.557027426355157,0.556879674946902,
+        0.556731923538646,0.556584172130391,0.556436420722135,0.556288669313879,
+        0.556140917905624,0.555993166497368,0.555845415089113,0.555697663680857,
+        0.555549912272601,0.555402160864346,0.55525440945609,0.555106658047835,
+        0.554958906639579,0.554811155231323,0.554663403823068,0.554515652414812,
+        0.554367901006556,0.554220149598301,0.554072398190045,0.55392464678179,
+        0.553776895373534,0.553629143965278,0.553481392557023,0.553333641148767,
+        0.553185889740512,0.553038138332256,0.552890386924,0.552742635515745,
+        0.552594884107489,0.552447132699234,0.552299381290978,0.552151629882722,
+        0.552003878474467,0.551856127066211,0.551708375657955,0.5515606242497,
+        0.551412872841444,0.551265121433189,0.551117370024933,0.550969618616677,
+        0.550821867208422,0.550674115800166,0.550526364391911,0.550378612983655,
+        0.550230861575399,0.550083110167144,0.549935358758888,0.549787607350633,
+        0.549639855942377,0.549492104534121,0.549344353125866,0.54919660171761,
+        0.549048850309354,0.548901098901099,0.548753347492843,0.548605596084588,
+        0.548457844676332,0.548310093268076,0.548162341859821,0.548014590451565,
+        0.54786683904331,0.547719087635054,0.547571336226798,0.547423584818543,
+        0.547275833410287,0.547128082002032,0.546980330593776,0.54683257918552,
+        0.546684827777265,0.546537076369009,0.546389324960754,0.546241573552498,
+        0.546093822144242,0.545946070735987,0.545798319327731,0.545650567919476,
+        0.54550281651122,0.545355065102964,0.545207313694709,0.545059562286453,
+        0.544911810878197,0.544764059469942,0.544616308061686,0.544468556653431,
+        0.544320805245175,0.544173053836919,0.544025302428664,0.543877551020408,
+        0.543729799612153,0.543582048203897,0.543434296795641,0.543286545387386,
+        0.54313879397913,0.542991042570874,0.542843291162619,0.542695539754363,
+        0.542547788346108,0.542400036937852,0.542252285529596,0.542104534121341,
+        0.541956782713085,0.54180903130483,0.541661279896574,0.541513528488318,
+        0.541365777080063,0.541218025671807,0.541070274263552,0.540922522855296,
+        0.54077477144704,0.540627020038785,0.540479268630529,0.540331517222274,
+        0.540183765814018,0.540036014405762,0.539888262997507,0.539740511589251,
+        0.539592760180995,0.53944500877274,0.539297257364484,0.539149505956229,
+        0.539001754547973,0.538854003139717,0.538706251731462,0.538558500323206,
+        0.538410748914951,0.538262997506695,0.538115246098439,0.537967494690184,
+        0.537819743281928,0.537671991873673,0.537524240465417,0.537376489057161,
+        0.537228737648906,0.53708098624065,0.536933234832395,0.536785483424139,
+        0.536637732015883,0.536489980607628,0.536342229199372,0.536194477791116,
+        0.536046726382861,0.535898974974605,0.53575122356635,0.535603472158094,
+        0.535455720749838,0.535307969341583,0.535160217933327,0.535012466525072,
+        0.534864715116816,0.53471696370856,0.534569212300305,0.534421460892049,
+        0.534273709483793,0.534125958075538,0.533978206667282,0.533830455259027,
+        0.533682703850771,0.533534952442515,0.53338720103426,0.533239449626004,
+        0.533091698217749,0.532943946809493,0.532796195401237,0.532648443992982,
+        0.532500692584726,0.532352941176471,0.532205189768215,0.532057438359959,
+        0.531909686951704,0.531761935543448,0.531614184135193,0.531466432726937,
+        0.531318681318681,0.531170929910426,0.53102317850217,0.530875427093914,
+        0.530727675685659,0.530579924277403,0.530432172869148,0.530284421460892,
+        0.530136670052636,0.529988918644381,0.529841167236125,0.52969341582787,
+        0.529545664419614,0.529397913011358,0.529250161603103,0.529102410194847,
+        0.528954658786592,0.528806907378336,0.52865915597008,0.528511404561825,
+        0.528363653153569,0.528215901745314,0.528068150337058,0.527920398928802,
+        0.527772647520547,0.527624896112291,0.527477144704036,0.52732939329578,
+        0.527181641887524,0.527033890479269,0.526886139071013,0.526738387662757,
+        0.526590636254502,0.526442884846246,0.526295133437991,0.526147382029735,
+        0.525999630621479,0.525851879213224,0.525704127804968,0.525556376396712,
+        0.525408624988457,0.525260873580201,0.525113122171946,0.52496537076369,
+        0.524817619355434,0.524669867947179,0.524522116538923,0.524374365130668,
+        0.524226613722412,0.524078862314156,0.523931110905901,0.523783359497645,
+        0.52363560808939,0.523487856681134,0.523340105272878,0.523192353864623,
+        0.523044602456367,0.522896851048112,0.522749099639856,0.5226013482316,
+        0.522453596823345,0.522305845415089,0.522158094006834,0.522010342598578,
+        0.521862591190322,0.521714839782067,0.521567088373811,0.521419336965555,
+        0.5212715855573,0.521123834149044,0.520976082740789,0.520828331332533,
+        0.520680579924277,0.520532828516022,0.520385077107766,0.520237325699511,
+        0.520089574291255,0.519941822882999,0.519794071474744,0.519646320066488,
+        0.519498568658233,0.519350817249977,0.519203065841721,0.519055314433466,
+        0.51890756302521,0.518759811616955,0.518612060208699,0.518464308800443,
+        0.518316557392188,0.518168805983932,0.518021054575676,0.517873303167421,
+        0.517725551759165,0.51757780035091,0.517430048942654,0.517282297534398,
+        0.517134546126143,0.516986794717887,0.516839043309632,0.516691291901376,
+        0.51654354049312,0.516395789084865,0.516248037676609,0.516100286268353,
+        0.515952534860098,0.515804783451842,0.515657032043587,0.515509280635331,
+        0.515361529227075,0.51521377781882,0.515066026410564,0.514918275002309,
+        0.514770523594053,0.514622772185797,0.514475020777542,0.514327269369286,
+        0.514179517961031,0.514031766552775,0.513884015144519,0.513736263736264,
+        0.513588512328008,0.513440760919753,0.513293009511497,0.513145258103241,
+        0.512997506694986,0.51284975528673,0.512702003878474,0.512554252470219,
+        0.512406501061963,0.512258749653708,0.512110998245452,0.511963246837196,
+        0.511815495428941,0.511667744020685,0.51151999261243,0.511372241204174,
+        0.511224489795918,0.511076738387663,0.510928986979407,0.510781235571152,
+        0.510633484162896,0.51048573275464,0.510337981346385,0.510190229938129,
+        0.510042478529873,0.509894727121618,0.509746975713362,0.509599224305107,
+        0.509451472896851,0.509303721488595,0.50915597008034,0.509008218672084,
+        0.508860467263829,0.508712715855573,0.508564964447317,0.508417213039062,
+        0.508269461630806,0.508121710222551,0.507973958814295,0.507826207406039,
+        0.507678455997784,0.507530704589528,0.507382953181272,0.507235201773017,
+        0.507087450364761,0.506939698956506,0.50679194754825,0.506644196139994,
+        0.506496444731739,0.506348693323483,0.506200941915228,0.506053190506972,
+        0.505905439098716,0.505757687690461,0.505609936282205,0.50546218487395,
+        0.505314433465694,0.505166682057438,0.505018930649183,0.504871179240927,
+        0.504723427832672,0.504575676424416,0.50442792501616,0.504280173607905,
+        0.504132422199649,0.503984670791394,0.503836919383138,0.503689167974882,
+        0.503541416566627,0.503393665158371,0.503245913750115,0.50309816234186,
+        0.502950410933604,0.502802659525349,0.502654908117093,0.502507156708837,
+        0.502359405300582,0.502211653892326,0.502063902484071,0.501916151075815,
+        0.501768399667559,0.501620648259304,0.501472896851048,0.501325145442792,
+        0.501177394034537,0.500784929356358,0.500392464678179,0.5,
+        0.499607535321821,0.499215070643642,0.498822605965463,0.498430141287284,
+        0.498037676609105,0.497645211930926,0.497252747252747,0.496860282574568,
+        0.496467817896389,0.49607535321821,0.495682888540031,0.495290423861852,
+        0.494897959183673,0.494505494505495,0.494113029827316,0.493720565149137,
+        0.493328100470958,0.492935635792779,0.4925431711146,0.492150706436421,
+        0.491758241758242,0.491365777080063,0.490973312401884,0.490580847723705,
+        0.490188383045526,0.489795918367347,0.489403453689168,0.489010989010989,
+        0.48861852433281,0.488226059654631,0.487833594976452,0.487441130298273,
+        0.487048665620094,0.486656200941915,0.486263736263736,0.485871271585557,
+        0.485478806907378,0.485086342229199,0.48469387755102,0.484301412872841,
+        0.483908948194662,0.483516483516484,0.483124018838305,0.482731554160126,
+        0.482339089481947,0.481946624803768,0.481554160125589,0.48116169544741,
+        0.480769230769231,0.480376766091052,0.479984301412873,0.479591836734694,
+        0.479199372056515,0.478806907378336,0.478414442700157,0.478021978021978,
+        0.477629513343799,0.47723704866562,0.476844583987441,0.476452119309262,
+        0.476059654631083,0.475667189952904,0.475274725274725,0.474882260596546,
+        0.474489795918367,0.474097331240188,0.473704866562009,0.47331240188383,
+        0.472919937205652,0.472527472527473,0.472135007849294,0.471742543171115,
+        0.471350078492936,0.470957613814757,0.470565149136578,0.470172684458399,
+        0.46978021978022,0.469387755102041,0.468995290423862,0.468602825745683,
+        0.468210361067504,0.467817896389325,0.467425431711146,0.467032967032967,
+        0.466640502354788,0.466248037676609,0.46585557299843,0.465463108320251,
+        0.465070643642072,0.464678178963893,0.464285714285714,0.463893249607535,
+        0.463500784929356,0.463108320251177,0.462715855572998,0.462323390894819,
+        0.461930926216641,0.461538461538462,0.461145996860283,0.460753532182104,
+        0.460361067503925,0.459968602825746,0.459576138147567,0.459183673469388,
+        0.458791208791209,0.45839874411303,0.458006279434851,0.457613814756672,
+        0.457221350078493,0.456828885400314,0.456436420722135,0.456043956043956,
+        0.455651491365777,0.455259026687598,0.454866562009419,0.45447409733124,
+        0.454081632653061,0.453689167974882,0.453296703296703,0.452904238618524,
+        0.452511773940345,0.452119309262166,0.451726844583987,0.451334379905808,
+        0.450941915227629,0.450549450549451,0.450156985871272,0.449764521193093,
+        0.449372056514914,0.448979591836735,0.448587127158556,0.448194662480377,
+        0.447802197802198,0.447409733124019,0.44701726844584,0.446624803767661,
+        0.446232339089482,0.445839874411303,0.445447409733124,0.445054945054945,
+        0.444662480376766,0.444270015698587,0.443877551020408,0.443485086342229,
+        0.44309262166405,0.442700156985871,0.442307692307692,0.441915227629513,
+        0.441522762951334,0.441130298273155,0.440737833594976,0.440345368916797,
+        0.439952904238619,0.43956043956044,0.439167974882261,0.438775510204082,
+        0.438383045525903,0.437990580847724,0.437598116169545,0.437205651491366,
+        0.436813186813187,0.436420722135008,0.436028257456829,0.43563579277865,
+        0.435243328100471,0.434850863422292,0.434458398744113,0.434065934065934,
+        0.433673469387755,0.433281004709576,0.432888540031397,0.432496075353218,
+        0.432103610675039,0.43171114599686,0.431318681318681,0.430926216640502,
+        0.430533751962323,0.430141287284144,0.429748822605965,0.429356357927786,
+        0.428963893249608,0.428571428571429,0.42817896389325,0.427786499215071,
+        0.427394034536892,0.427001569858713,0.426609105180534,0.426216640502355,
+        0.425824175824176,0.425431711145997,0.425039246467818,0.424646781789639,
+        0.42425431711146,0.423861852433281,0.423469387755102,0.423076923076923,
+        0.422684458398744,0.422291993720565,0.421899529042386,0.421507064364207,
+        0.421114599686028,0.420722135007849,0.42032967032967,0.419937205651491,
+        0.419544740973312,0.419152276295133,0.418759811616954,0.418367346938776,
+        0.417974882260597,0.417582417582418,0.417189952904239,0.41679748822606,
+        0.416405023547881,0.416012558869702,0.415620094191523,0.415227629513344,
+        0.414835164835165,0.414442700156986,0.414050235478807,0.413657770800628,
+        0.413265306122449,0.41287284144427,0.412480376766091,0.412087912087912,
+        0.411695447409733,0.411302982731554,0.410910518053375,0.410518053375196,
+        0.410125588697017,0.409733124018838,0.409340659340659,0.40894819466248,
+        0.408555729984301,0.408163265306122,0.407770800627943,0.407378335949765,
+        0.406985871271586,0.406593406593407,0.406200941915228,0.405808477237049,
+        0.40541601255887,0.405023547880691,0.404631083202512,0.404238618524333,
+        0.403846153846154,0.403453689167975,0.403061224489796,0.402668759811617,
+        0.402276295133438,0.401883830455259,0.40149136577708,0.401098901098901,
+        0.400706436420722,0.400313971742543,0.399921507064364,0.399529042386185,
+        0.399136577708006,0.398744113029827,0.398351648351648,0.397959183673469,
+        0.39756671899529,0.397174254317111,0.396781789638933,0.396389324960754,
+        0.395996860282575,0.395604395604396,0.395211930926217,0.394819466248038,
+        0.394427001569859,0.39403453689168,0.393642072213501,0.393249607535322,
+        0.392857142857143,0.392464678178964,0.392072213500785,0.391679748822606,
+        0.391287284144427,0.390894819466248,0.390502354788069,0.39010989010989,
+        0.389717425431711,0.389324960753532,0.388932496075353,0.388540031397174,
+        0.388147566718995,0.387755102040816,0.387362637362637,0.386970172684458,
+        0.386577708006279,0.3861852433281,0.385792778649922,0.385400313971743,
+        0.385007849293564,0.384615384615385,0.384222919937206,0.383830455259027,
+        0.383437990580848,0.383045525902669,0.38265306122449,0.382260596546311,
+        0.381868131868132,0.381475667189953,0.381083202511774,0.380690737833595,
+        0.380298273155416,0.379905808477237,0.379513343799058,0.379120879120879,
+        0.3787284144427,0.378335949764521,0.377943485086342,0.377551020408163,
+        0.377158555729984,0.376766091051805,0.376373626373626,0.375981161695447,
+        0.375588697017268,0.375196232339089,0.374803767660911,0.374411302982732,
+        0.374018838304553,0.373626373626374,0.373233908948195,0.372841444270016,
+        0.372448979591837,0.372056514913658,0.371664050235479,0.3712715855573,
+        0.370879120879121,0.370486656200942,0.370094191522763,0.369701726844584,
+        0.369309262166405,0.368916797488226,0.368524332810047,0.368131868131868,
+        0.367739403453689,0.36734693877551,0.366954474097331,0.366562009419152,
+        0.366169544740973,0.365777080062794,0.365384615384615,0.364992150706436,
+        0.364599686028257,0.364207221350078,0.3638147566719,0.363422291993721,
+        0.363029827315542,0.362637362637363,0.362244897959184,0.361852433281005,
+        0.361459968602826,0.361067503924647,0.360675039246468,0.360282574568289,
+        0.35989010989011,0.359497645211931,0.359105180533752,0.358712715855573,
+        0.358320251177394,0.357927786499215,0.357535321821036,0.357142857142857,
+        0.356750392464678,0.356357927786499,0.35596546310832,0.355572998430141,
+        0.355180533751962,0.354788069073783,0.354395604395604,0.354003139717425,
+        0.353610675039246,0.353218210361067,0.352825745682889,0.35243328100471,
+        0.352040816326531,0.351648351648352,0.351255886970173,0.350863422291994,
+        0.350470957613815,0.350078492935636,0.349686028257457,0.349293563579278,
+        0.348901098901099,0.34850863422292,0.348116169544741,0.347723704866562,
+        0.347331240188383,0.346938775510204,0.346546310832025,0.346153846153846,
+        0.345761381475667,0.345368916797488,0.344976452119309,0.34458398744113,
+        0.344191522762951,0.343799058084772,0.343406593406593,0.343014128728414,
+        0.342621664050235,0.342229199372057,0.341836734693878,0.341444270015699,
+        0.34105180533752,0.340659340659341,0.340266875981162,0.339874411302983,
+        0.339481946624804,0.339089481946625,0.338697017268446,0.338304552590267,
+        0.337912087912088,0.337519623233909,0.33712715855573,0.336734693877551,
+        0.336342229199372,0.335949764521193,0.335557299843014,0.335164835164835,
+        0.334772370486656,0.334379905808477,0.333987441130298,0.333594976452119,
+        0.33320251177394,0.332810047095761,0.332417582417582,0.332025117739403,
+        0.331632653061224,0.331240188383046,0.330847723704867,0.330455259026688,
+        0.330062794348509,0.32967032967033,0.329277864992151,0.328885400313972,
+        0.328492935635793,0.328100470957614,0.327708006279435,0.327315541601256,
+        0.326923076923077,0.326530612244898,0.326138147566719,0.32574568288854,
+        0.325353218210361,0.324960753532182,0.324568288854003,0.324175824175824,
+        0.323783359497645,0.323390894819466,0.322998430141287,0.322605965463108,
+        0.322213500784929,0.32182103610675,0.321428571428571,0.321036106750392,
+        0.320643642072214,0.320251177394035,0.319858712715856,0.319466248037677,
+        0.319073783359498,0.318681318681319,0.31828885400314,0.317896389324961,
+        0.317503924646782,0.317111459968603,0.316718995290424,0.316326530612245,
+        0.315934065934066,0.315541601255887,0.315149136577708,0.314756671899529,
+        0.31436420722135,0.313971742543171,0.313579277864992,0.313186813186813,
+        0.312794348508634,0.312401883830455,0.312009419152276,0.311616954474097,
+        0.311224489795918,0.310832025117739,0.31043956043956,0.310047095761381,
+        0.309654631083203,0.309262166405024,0.308869701726845,0.308477237048666,
+        0.308084772370487,0.307692307692308,0.307299843014129,0.30690737833595,
+        0.306514913657771,0.306122448979592,0.305729984301413,0.305337519623234,
+        0.304945054945055,0.304552590266876,0.304160125588697,0.303767660910518,
+        0.303375196232339,0.30298273155416,0.302590266875981,0.302197802197802,
+        0.301805337519623,0.301412872841444,0.301020408163265,0.300627943485086,
+        0.300235478806907,0.299843014128728,0.299450549450549,0.299058084772371,
+        0.298665620094192,0.298273155416013,0.297880690737834,0.297488226059655,
+        0.297095761381476,0.296703296703297,0.296310832025118,0.295918367346939,
+        0.29552590266876,0.295133437990581,0.294740973312402,0.294348508634223,
+        0.293956043956044,0.293563579277865,0.293171114599686,0.292778649921507,
+        0.292386185243328,0.291993720565149,0.29160125588697,0.291208791208791,
+        0.290816326530612,0.290423861852433,0.290031397174254,0.289638932496075,
+        0.289246467817896,0.288854003139717,0.288461538461538,0.288069073783359,
+        0.287676609105181,0.287284144427002,0.286891679748823,0.286499215070644,
+        0.286106750392465,0.285714285714286,0.285321821036107,0.284929356357928,
+        0.284536891679749,0.28414442700157,0.283751962323391,0.283359497645212,
+        0.282967032967033,0.282574568288854,0.282182103610675,0.281789638932496,
+        0.281397174254317,0.281004709576138,0.280612244897959,0.28021978021978,
+        0.279827315541601,0.279434850863422,0.279042386185243,0.278649921507064,
+        0.278257456828885,0.277864992150706,0.277472527472527,0.277080062794348,
+        0.27668759811617,0.276295133437991,0.275902668759812,0.275510204081633,
+        0.275117739403454,0.274725274725275,0.274332810047096,0.273940345368917,
+        0.273547880690738,0.273155416012559,0.27276295133438,0.272370486656201,
+        0.271978021978022,0.271585557299843,0.271193092621664,0.270800627943485,
+        0.270408163265306,0.270015698587127,0.269623233908948,0.269230769230769,
+        0.26883830455259,0.268445839874411,0.268053375196232,0.267660910518053,
+        0.267268445839874,0.266875981161695,0.266483516483516,0.266091051805338,
+        0.265698587127159,0.26530612244898,0.264913657770801,0.264521193092622,
+        0.264128728414443,0.263736263736264,0.263343799058085,0.262951334379906,
+        0.262558869701727,0.262166405023548,0.261773940345369,0.26138147566719,
+        0.260989010989011,0.260596546310832,0.260204081632653,0.259811616954474,
+        0.259419152276295,0.259026687598116,0.258634222919937,0.258241758241758,
+        0.257849293563579,0.2574568288854,0.257064364207221,0.256671899529042,
+        0.256279434850863,0.255886970172684,0.255494505494505,0.255102040816327,
+        0.254709576138148,0.254317111459969,0.25392464678179,0.253532182103611,
+        0.253139717425432,0.252747252747253,0.252354788069074,0.251962323390895,
+        0.251569858712716,0.251177394034537,0.250784929356358,0.250392464678179,
+        0.25,0.249607535321821,0.249215070643642,0.248822605965463,
+        0.248430141287284,0.248037676609105,0.247645211930926,0.247252747252747,
+        0.246860282574568,0.246467817896389,0.24607535321821,0.245682888540031,
+        0.245290423861852,0.244897959183673,0.244505494505494,0.244113029827316,
+        0.243720565149137,0.243328100470958,0.242935635792779,0.2425431711146,
+        0.242150706436421,0.241758241758242,0.241365777080063,0.240973312401884,
+        0.240580847723705,0.240188383045526,0.239795918367347,0.239403453689168,
+        0.239010989010989,0.23861852433281,0.238226059654631,0.237833594976452,
+        0.237441130298273,0.237048665620094,0.236656200941915,0.236263736263736,
+        0.235871271585557,0.235478806907378,0.235086342229199,0.23469387755102,
+        0.234301412872841,0.233908948194662,0.233516483516484,0.233124018838305,
+        0.232731554160126,0.232339089481947,0.231946624803768,0.231554160125589,
+        0.23116169544741,0.230769230769231,0.230376766091052,0.229984301412873,
+        0.229591836734694,0.229199372056515,0.228806907378336,0.228414442700157,
+        0.228021978021978,0.227629513343799,0.22723704866562,0.226844583987441,
+        0.226452119309262,0.226059654631083,0.225667189952904,0.225274725274725,
+        0.224882260596546,0.224489795918367,0.224097331240188,0.223704866562009,
+        0.22331240188383,0.222919937205651,0.222527472527473,0.222135007849294,
+        0.221742543171115,0.221350078492936,0.220957613814757,0.220565149136578,
+        0.220172684458399,0.21978021978022,0.219387755102041,0.218995290423862,
+        0.218602825745683,0.218210361067504,0.217817896389325,0.217425431711146,
+        0.217032967032967,0.216640502354788,0.216248037676609,0.21585557299843,
+        0.215463108320251,0.215070643642072,0.214678178963893,0.214285714285714,
+        0.213893249607535,0.213500784929356,0.213108320251177,0.212715855572998,
+        0.212323390894819,0.211930926216641,0.211538461538462,0.211145996860283,
+        0.210753532182104,0.210361067503925,0.209968602825746,0.209576138147567,
+        0.209183673469388,0.208791208791209,0.20839874411303,0.208006279434851,
+        0.207613814756672,0.207221350078493,0.206828885400314,0.206436420722135,
+        0.206043956043956,0.205651491365777,0.205259026687598,0.204866562009419,
+        0.20447409733124,0.204081632653061,0.203689167974882,0.203296703296703,
+        0.202904238618524,0.202511773940345,0.202119309262166,0.201726844583987,
+        0.201334379905808,0.20094191522763,0.200549450549451,0.200156985871272,
+        0.199764521193093,0.199372056514914,0.198979591836735,0.198587127158556,
+        0.198194662480377,0.197802197802198,0.197409733124019,0.19701726844584,
+        0.196624803767661,0.196232339089482,0.195839874411303,0.195447409733124,
+        0.195054945054945,0.194662480376766,0.194270015698587,0.193877551020408,
+        0.193485086342229,0.19309262166405,0.192700156985871,0.192307692307692,
+        0.191915227629513,0.191522762951334,0.191130298273155,0.190737833594976,
+        0.190345368916797,0.189952904238619,0.18956043956044,0.189167974882261,
+        0.188775510204082,0.188383045525903,0.187990580847724,0.187598116169545,
+        0.187205651491366,0.186813186813187,0.186420722135008,0.186028257456829,
+        0.18563579277865,0.185243328100471,0.184850863422292,0.184458398744113,
+        0.184065934065934,0.183673469387755,0.183281004709576,0.182888540031397,
+        0.182496075353218,0.182103610675039,0.18171114599686,0.181318681318681,
+        0.180926216640502,0.180533751962323,0.180141287284144,0.179748822605965,
+        0.179356357927787,0.178963893249608,0.178571428571429,0.17817896389325,
+        0.177786499215071,0.177394034536892,0.177001569858713,0.176609105180534,
+        0.176216640502355,0.175824175824176,0.175431711145997,0.175039246467818,
+        0.174646781789639,0.17425431711146,0.173861852433281,0.173469387755102,
+        0.173076923076923,0.172684458398744,0.172291993720565,0.171899529042386,
+        0.171507064364207,0.171114599686028,0.170722135007849,0.17032967032967,
+        0.169937205651491,0.169544740973312,0.169152276295133,0.168759811616954,
+        0.168367346938776,0.167974882260597,0.167582417582418,0.167189952904239,
+        0.16679748822606,0.166405023547881,0.166012558869702,0.165620094191523,
+        0.165227629513344,0.164835164835165,0.164442700156986,0.164050235478807,
+        0.163657770800628,0.163265306122449,0.16287284144427,0.162480376766091,
+        0.162087912087912,0.161695447409733,0.161302982731554,0.160910518053375,
+        0.160518053375196,0.160125588697017,0.159733124018838,0.159340659340659,
+        0.15894819466248,0.158555729984301,0.158163265306122,0.157770800627943,
+        0.157378335949765,0.156985871271586,0.156593406593407,0.156200941915228,
+        0.155808477237049,0.15541601255887,0.155023547880691,0.154631083202512,
+        0.154238618524333,0.153846153846154,0.153453689167975,0.153061224489796,
+        0.152668759811617,0.152276295133438,0.151883830455259,0.15149136577708,
+        0.151098901098901,0.150706436420722,0.150313971742543,0.149921507064364,
+        0.149529042386185,0.149136577708006,0.148744113029827,0.148351648351648,
+        0.147959183673469,0.14756671899529,0.147174254317111,0.146781789638932,
+        0.146389324960754,0.145996860282575,0.145604395604396,0.145211930926217,
+        0.144819466248038,0.144427001569859,0.14403453689168,0.143642072213501,
+        0.143249607535322,0.142857142857143,0.142464678178964,0.142072213500785,
+        0.141679748822606,0.141287284144427,0.140894819466248,0.140502354788069,
+        0.14010989010989,0.139717425431711,0.139324960753532,0.138932496075353,
+        0.138540031397174,0.138147566718995,0.137755102040816,0.137362637362637,
+        0.136970172684458,0.136577708006279,0.1361852433281,0.135792778649922,
+        0.135400313971743,0.135007849293564,0.134615384615385,0.134222919937206,
+        0.133830455259027,0.133437990580848,0.133045525902669,0.13265306122449,
+        0.132260596546311,0.131868131868132,0.131475667189953,0.131083202511774,
+        0.130690737833595,0.130298273155416,0.129905808477237,0.129513343799058,
+        0.129120879120879,0.1287284144427,0.128335949764521,0.127943485086342,
+        0.127551020408163,0.127158555729984,0.126766091051805,0.126373626373626,
+        0.125981161695447,0.125588697017268,0.125196232339089,0.124803767660911,
+        0.124411302982732,0.124018838304553,0.123626373626374,0.123233908948195,
+        0.122841444270016,0.122448979591837,0.122056514913658,0.121664050235479,
+        0.1212715855573,0.120879120879121,0.120486656200942,0.120094191522763,
+        0.119701726844584,0.119309262166405,0.118916797488226,0.118524332810047,
+        0.118131868131868,0.117739403453689,0.11734693877551,0.116954474097331,
+        0.116562009419152,0.116169544740973,0.115777080062794,0.115384615384615,
+        0.114992150706436,0.114599686028257,0.114207221350078,0.1138147566719,
+        0.113422291993721,0.113029827315542,0.112637362637363,0.112244897959184,
+        0.111852433281005,0.111459968602826,0.111067503924647,0.110675039246468,
+        0.110282574568289,0.10989010989011,0.109497645211931,0.109105180533752,
+        0.108712715855573,0.108320251177394,0.107927786499215,0.107535321821036,
+        0.107142857142857,0.106750392464678,0.106357927786499,0.10596546310832,
+        0.105572998430141,0.105180533751962,0.104788069073783,0.104395604395604,
+        0.104003139717425,0.103610675039246,0.103218210361068,0.102825745682889,
+        0.10243328100471,0.102040816326531,0.101648351648352,0.101255886970173,
+        0.100863422291994,0.100470957613815,0.100078492935636,0.0996860282574568,
+        0.0992935635792779,0.0989010989010989,0.0985086342229199,0.098116169544741,
+        0.097723704866562,0.097331240188383,0.0969387755102041,0.0965463108320251,
+        0.0961538461538462,0.0957613814756672,0.0953689167974882,0.0949764521193093,
+        0.0945839874411303,0.0941915227629513,0.0937990580847724,0.0934065934065934,
+        0.0930141287284144,0.0926216640502355,0.0922291993720565,0.0918367346938776,
+        0.0914442700156986,0.0910518053375196,0.0906593406593407,0.0902668759811617,
+        0.0898744113029827,0.0894819466248038,0.0890894819466248,0.0886970172684458,
+        0.0883045525902669,0.0879120879120879,0.087519623233909,0.08712715855573,
+        0.086734693877551,0.0863422291993721,0.0859497645211931,0.0855572998430141,
+        0.0851648351648352,0.0847723704866562,0.0843799058084772,0.0839874411302983,
+        0.0835949764521193,0.0832025117739403,0.0828100470957614,0.0824175824175824,
+        0.0820251177394034,0.0816326530612245,0.0812401883830455,0.0808477237048666,
+        0.0804552590266876,0.0800627943485086,0.0796703296703297,0.0792778649921507,
+        0.0788854003139717,0.0784929356357928,0.0781004709576138,0.0777080062794348,
+        0.0773155416012559,0.0769230769230769,0.076530612244898,0.076138147566719,
+        0.07574568288854,0.0753532182103611,0.0749607535321821,0.0745682888540031,
+        0.0741758241758242,0.0737833594976452,0.0733908948194662,0.0729984301412873,
+        0.0726059654631083,0.0722135007849294,0.0718210361067504,0.0714285714285714,
+        0.0710361067503925,0.0706436420722135,0.0702511773940345,0.0698587127158556,
+        0.0694662480376766,0.0690737833594976,0.0686813186813187,0.0682888540031397,
+        0.0678963893249608,0.0675039246467818,0.0671114599686028,0.0667189952904239,
+        0.0663265306122449,0.0659340659340659,0.065541601255887,0.065149136577708,
+        0.064756671899529,0.0643642072213501,0.0639717425431711,0.0635792778649922,
+        0.0631868131868132,0.0627943485086342,0.0624018838304553,0.0620094191522763,
+        0.0616169544740973,0.0612244897959184,0.0608320251177394,0.0604395604395604,
+        0.0600470957613815,0.0596546310832025,0.0592621664050235,0.0588697017268446,
+        0.0584772370486656,0.0580847723704867,0.0576923076923077,0.0572998430141287,
+        0.0569073783359498,0.0565149136577708,0.0561224489795918,0.0557299843014129,
+        0.0553375196232339,0.0549450549450549,0.054552590266876,0.054160125588697,
+        0.0537676609105181,0.0533751962323391,0.0529827315541601,0.0525902668759812,
+        0.0521978021978022,0.0518053375196232,0.0514128728414443,0.0510204081632653,
+        0.0506279434850863,0.0502354788069074,0.0498430141287284,0.0494505494505494,
+        0.0490580847723705,0.0486656200941915,0.0482731554160126,0.0478806907378336,
+        0.0474882260596546,0.0470957613814757,0.0467032967032967,0.0463108320251177,
+        0.0459183673469388,0.0455259026687598,0.0451334379905808,0.0447409733124019,
+        0.0443485086342229,0.043956043956044,0.043563579277865,0.043171114599686,
+        0.0427786499215071,0.0423861852433281,0.0419937205651491,0.0416012558869702,
+        0.0412087912087912,0.0408163265306122,0.0404238618524333,0.0400313971742543,
+        0.0396389324960754,0.0392464678178964,0.0388540031397174,0.0384615384615385,
+        0.0380690737833595,0.0376766091051805,0.0372841444270016,0.0368916797488226,
+        0.0364992150706436,0.0361067503924647,0.0357142857142857,0.0353218210361068,
+        0.0349293563579278,0.0345368916797488,0.0341444270015699,0.0337519623233909,
+        0.0333594976452119,0.032967032967033,0.032574568288854,0.032182103610675,
+        0.0317896389324961,0.0313971742543171,0.0310047095761381,0.0306122448979592,
+        0.0302197802197802,0.0298273155416013,0.0294348508634223,0.0290423861852433,
+        0.0286499215070644,0.0282574568288854,0.0278649921507064,0.0274725274725275,
+        0.0270800627943485,0.0266875981161695,0.0262951334379906,0.0259026687598116,
+        0.0255102040816327,0.0251177394034537,0.0247252747252747,0.0243328100470958,
+        0.0239403453689168,0.0235478806907378,0.0231554160125589,0.0227629513343799,
+        0.0223704866562009,0.021978021978022,0.021585557299843,0.0211930926216641,
+        0.0208006279434851,0.0204081632653061,0.0200156985871272,0.0196232339089482,
+        0.0192307692307692,0.0188383045525903,0.0184458398744113,0.0180533751962323,
+        0.0176609105180534,0.0172684458398744,0.0168759811616954,0.0164835164835165,
+        0.0160910518053375,0.0156985871271586,0.0153061224489796,0.0149136577708006,
+        0.0145211930926217,0.0141287284144427,0.0137362637362637,0.0133437990580848,
+        0.0129513343799058,0.0125588697017268,0.0121664050235479,0.0117739403453689,
+        0.01138147566719,0.010989010989011,0.010596546310832,0.0102040816326531,
+        0.0098116169544741,0.00941915227629513,0.00902668759811617,0.0086342229199372,
+        0.00824175824175824,0.00784929356357928,0.00745682888540031,0.00706436420722135,
+        0.00667189952904239,0.00627943485086342,0.00588697017268446,0.00549450549450549,
+        0.00510204081632653,0.00470957613814757,0.0043171114599686,0.00392464678178964,
+        0.00353218210361068,0.00313971742543171,0.00274725274725275,0.00235478806907378,
+        0.00196232339089482,0.00156985871271586,0.00117739403453689,0.000784929356357928,
+        0.000392464678178964,0.0
+    ]
+    rank_to_percentile_6 = [
+        0.999990765536984,0.999981727551905,0.999972689566825,0.999963651581746,
+        0.999954613596666,0.999945575611587,0.999936537626507,0.999927499641428,
+        0.999918461656348,0.999909423671269,0.999900483925158,0.999892330090792,
+        0.999884962168173,0.9998783801573,0.999872584058173,0.999867573870792,
+        0.999863349595157,0.999859911231268,0.999857258779125,0.999855392238729,
+        0.999854311610078,0.999854016893173,0.999845077147062,0.999836923312697,
+        0.999829555390077,0.999822973379204,0.999817177280077,0.999812167092696,
+        0.999807942817061,0.999804504453172,0.99980185200103,0.999799985460633,
+        0.999798904831982,0.999798610115077,0.999789670368966,0.999781516534601,
+        0.999774148611982,0.999767566601109,0.999761770501981,0.9997567603146,
+        0.999752536038966,0.999749097675077,0.999746445222934,0.999744578682537,
+        0.999743498053886,0.999743203336981,0.99973426359087,0.999726109756505,
+        0.999718741833886,0.999712159823013,0.999706363723886,0.999701353536505,
+        0.99969712926087,0.999693690896981,0.999691038444838,0.999689171904441,
+        0.99968809127579,0.999687796558885,0.999678856812774,0.999670702978409,
+        0.99966333505579,0.999656753044917,0.99965095694579,0.999645946758409,
+        0.999641722482774,0.999638284118885,0.999635631666742,0.999633765126345,
+        0.999632684497694,0.99963238978079,0.999623450034678,0.999615296200313,
+        0.999607928277694,0.999601346266821,0.999595550167694,0.999590539980313,
+        0.999586315704678,0.999582877340789,0.999580224888646,0.999578358348249,
+        0.999577277719598,0.999576983002694,0.999568043256583,0.999559889422217,
+        0.999552521499598,0.999545939488725,0.999540143389598,0.999535133202217,
+        0.999530908926582,0.999527470562693,0.99952481811055,0.999522951570153,
+        0.999521870941503,0.999521576224598,0.999512636478487,0.999504482644122,
+        0.999497114721502,0.999490532710629,0.999484736611502,0.999479726424121,
+        0.999475502148486,0.999472063784597,0.999469411332454,0.999467544792058,
+        0.999466464163407,0.999466169446502,0.999457229700391,0.999449075866026,
+        0.999441707943406,0.999435125932533,0.999429329833406,0.999424319646025,
+        0.99942009537039,0.999416657006502,0.999414004554359,0.999412138013962,
+        0.999411057385311,0.999410762668406,0.999401822922295,0.99939366908793,
+        0.999386301165311,0.999379719154438,0.99937392305531,0.99936891286793,
+        0.999364688592295,0.999361250228406,0.999358597776263,0.999356731235866,
+        0.999355650607215,0.99935535589031,0.999346416144199,0.999338262309834,
+        0.999330894387215,0.999324312376342,0.999318516277215,0.999313506089834,
+        0.999309281814199,0.99930584345031,0.999303190998167,0.99930132445777,
+        0.999300243829119,0.999299949112214,0.999291009366103,0.999282855531738,
+        0.999275487609119,0.999268905598246,0.999263109499119,0.999258099311738,
+        0.999253875036103,0.999250436672214,0.999247784220071,0.999245917679674,
+        0.999244837051023,0.999244542334119,0.999235602588007,0.999227448753642,
+        0.999220080831023,0.99921349882015,0.999207702721023,0.999202692533642,
+        0.999198468258007,0.999195029894118,0.999192377441975,0.999190510901578,
+        0.999189430272928,0.999189135556023,0.999136479469038,0.999083823382053,
+        0.999031167295069,0.998978511208084,0.998925855121099,0.998873199034114,
+        0.99882054294713,0.998767886860145,0.99871523077316,0.998662574686176,
+        0.998609918599191,0.998557262512206,0.998505392336968,0.998452736249983,
+        0.998400080162998,0.998347424076013,0.998294767989029,0.998242111902044,
+        0.998189455815059,0.998136799728075,0.99808414364109,0.998031487554105,
+        0.99797883146712,0.997926175380136,0.997874305204897,0.997822435029658,
+        0.997769778942674,0.997717122855689,0.997664466768704,0.997611810681719,
+        0.997559154594735,0.99750649850775,0.997453842420765,0.997401186333781,
+        0.997348530246796,0.997295874159811,0.997244003984573,0.997192133809334,
+        0.997140263634095,0.99708760754711,0.997034951460126,0.996982295373141,
+        0.996929639286156,0.996876983199172,0.996824327112187,0.996771671025202,
+        0.996719014938217,0.996666358851233,0.996614488675994,0.996562618500755,
+        0.996510748325517,0.996458878150278,0.996406222063293,0.996353565976309,
+        0.996300909889324,0.996248253802339,0.996195597715355,0.99614294162837,
+        0.996090285541385,0.9960376294544,0.995985759279162,0.995933889103923,
+        0.995882018928684,0.995830148753446,0.995778278578207,0.995725622491222,
+        0.995672966404238,0.995620310317253,0.995567654230268,0.995514998143283,
+        0.995462342056299,0.995409685969314,0.995357815794075,0.995305945618837,
+        0.995254075443598,0.995202205268359,0.995150335093121,0.995098464917882,
+        0.995045808830897,0.994993152743913,0.994940496656928,0.994887840569943,
+        0.994835184482958,0.994782528395974,0.994730658220735,0.994678788045496,
+        0.994626917870258,0.994575047695019,0.99452317751978,0.994471307344542,
+        0.994419437169303,0.994366781082318,0.994314124995334,0.994261468908349,
+        0.994208812821364,0.99415615673438,0.994104286559141,0.994052416383902,
+        0.994000546208664,0.993948676033425,0.993896805858186,0.993844935682948,
+        0.993793065507709,0.99374119533247,0.993688539245485,0.993635883158501,
+        0.993583227071516,0.993530570984531,0.993478700809293,0.993426830634054,
+        0.993374960458815,0.993323090283577,0.993271220108338,0.993219349933099,
+        0.993167479757861,0.993115609582622,0.993063739407383,0.993011083320399,
+        0.992958427233414,0.992905771146429,0.99285390097119,0.992802030795952,
+        0.992750160620713,0.992698290445474,0.992646420270236,0.992594550094997,
+        0.992542679919758,0.99249080974452,0.992438939569281,0.992387069394042,
+        0.992334413307058,0.992281757220073,0.992229887044834,0.992178016869596,
+        0.992126146694357,0.992074276519118,0.99202240634388,0.991970536168641,
+        0.991918665993402,0.991866795818164,0.991814925642925,0.991763055467686,
+        0.991711185292448,0.991658529205463,0.991606659030224,0.991554788854985,
+        0.991502918679747,0.991451048504508,0.991399178329269,0.991347308154031,
+        0.991295437978792,0.991243567803553,0.991191697628315,0.991139827453076,
+        0.991087957277837,0.991036087102599,0.991027049117519,0.991018207610376,
+        0.99100956258117,0.9910011140299,0.990992861956567,0.99098480636117,
+        0.990976947243709,0.990969284604185,0.990960246619106,0.990951405111963,
+        0.990942760082757,0.990934311531487,0.990926059458153,0.990918003862756,
+        0.990910144745296,0.990902482105772,0.990893640598629,0.990884995569423,
+        0.990876547018153,0.990868294944819,0.990860239349422,0.990852380231962,
+        0.990844717592438,0.990836072563231,0.990827624011962,0.990819371938628,
+        0.990811316343231,0.990803457225771,0.990795794586247,0.990787346034977,
+        0.990779093961644,0.990771038366247,0.990763179248786,0.990755516609262,
+        0.990747264535929,0.990739208940532,0.990731349823072,0.990723687183548,
+        0.990715631588151,0.99070777247069,0.990700109831167,0.990692250713706,
+        0.990684588074182,0.990676925434658,0.990667887449579,0.990659045942436,
+        0.990650400913229,0.99064195236196,0.990633700288626,0.990625644693229,
+        0.990617785575769,0.990610122936245,0.990601281429102,0.990592636399895,
+        0.990584187848626,0.990575935775292,0.990567880179895,0.990560021062435,
+        0.990552358422911,0.990543713393705,0.990535264842434,0.990527012769101,
+        0.990518957173704,0.990511098056244,0.99050343541672,0.99049498686545,
+        0.990486734792117,0.99047867919672,0.990470820079259,0.990463157439735,
+        0.990454905366402,0.990446849771005,0.990438990653545,0.990431328014021,
+        0.990423272418624,0.990415413301163,0.990407750661639,0.990399891544179,
+        0.990392228904655,0.990384566265131,0.990375724757988,0.990367079728782,
+        0.990358631177512,0.990350379104178,0.990342323508782,0.990334464391321,
+        0.990326801751797,0.990318156722591,0.990309708171321,0.990301456097987,
+        0.990293400502591,0.99028554138513,0.990277878745606,0.990269430194336,
+        0.990261178121003,0.990253122525606,0.990245263408146,0.990237600768622,
+        0.990229348695288,0.990221293099891,0.990213433982431,0.990205771342907,
+        0.99019771574751,0.99018985663005,0.990182193990526,0.990174334873065,
+        0.990166672233541,0.990159009594018,0.990150364564811,0.990141916013541,
+        0.990133663940208,0.990125608344811,0.990117749227351,0.990110086587827,
+        0.990101638036557,0.990093385963223,0.990085330367826,0.990077471250366,
+        0.990069808610842,0.990061556537509,0.990053500942112,0.990045641824651,
+        0.990037979185127,0.990029923589731,0.99002206447227,0.990014401832746,
+        0.990006542715286,0.989998880075762,0.989991217436238,0.989982768884968,
+        0.989974516811635,0.989966461216238,0.989958602098777,0.989950939459253,
+        0.98994268738592,0.989934631790523,0.989926772673063,0.989919110033539,
+        0.989911054438142,0.989903195320681,0.989895532681158,0.989887673563697,
+        0.989880010924173,0.989872348284649,0.989864096211316,0.989856040615919,
+        0.989848181498459,0.989840518858935,0.989832463263538,0.989824604146077,
+        0.989816941506554,0.989809082389093,0.989801419749569,0.989793757110045,
+        0.989785701514648,0.989777842397188,0.989770179757664,0.989762320640204,
+        0.98975465800068,0.989746995361156,0.989739332721632,0.989731670082108,
+        0.989724007442584,0.98971634480306,0.989707503295917,0.989698661788774,
+        0.989690016759568,0.989681568208298,0.989673316134965,0.989665260539568,
+        0.989657401422107,0.989649738782583,0.98964089727544,0.989632252246234,
+        0.989623803694964,0.989615551621631,0.989607496026234,0.989599636908773,
+        0.989591974269249,0.989583329240043,0.989574880688773,0.98956662861544,
+        0.989558573020043,0.989550713902582,0.989543051263058,0.989534602711789,
+        0.989526350638455,0.989518295043058,0.989510435925598,0.989502773286074,
+        0.98949452121274,0.989486465617344,0.989478606499883,0.989470943860359,
+        0.989462888264962,0.989455029147502,0.989447366507978,0.989439507390518,
+        0.989431844750994,0.98942418211147,0.989415340604327,0.98940669557512,
+        0.98939824702385,0.989389994950517,0.98938193935512,0.98937408023766,
+        0.989366417598136,0.989357772568929,0.989349324017659,0.989341071944326,
+        0.989333016348929,0.989325157231469,0.989317494591945,0.989309046040675,
+        0.989300793967341,0.989292738371945,0.989284879254484,0.98927721661496,
+        0.989268964541627,0.98926090894623,0.989253049828769,0.989245387189246,
+        0.989237331593849,0.989229472476388,0.989221809836864,0.989213950719404,
+        0.98920628807988,0.989198625440356,0.98918998041115,0.98918153185988,
+        0.989173279786546,0.989165224191149,0.989157365073689,0.989149702434165,
+        0.989141253882895,0.989133001809562,0.989124946214165,0.989117087096704,
+        0.989109424457181,0.989101172383847,0.98909311678845,0.98908525767099,
+        0.989077595031466,0.989069539436069,0.989061680318609,0.989054017679085,
+        0.989046158561624,0.9890384959221,0.989030833282577,0.989022384731307,
+        0.989014132657973,0.989006077062576,0.988998217945116,0.988990555305592,
+        0.988982303232259,0.988974247636862,0.988966388519401,0.988958725879877,
+        0.98895067028448,0.98894281116702,0.988935148527496,0.988927289410036,
+        0.988919626770512,0.988911964130988,0.988903712057654,0.988895656462258,
+        0.988887797344797,0.988880134705273,0.988872079109876,0.988864219992416,
+        0.988856557352892,0.988848698235432,0.988841035595908,0.988833372956384,
+        0.988825317360987,0.988817458243527,0.988809795604003,0.988801936486542,
+        0.988794273847018,0.988786611207494,0.988778948567971,0.988771285928447,
+        0.988763623288923,0.988755960649399,0.988747315620192,0.988738670590986,
+        0.988730222039716,0.988721969966383,0.988713914370986,0.988706055253525,
+        0.988698392614001,0.988689747584795,0.988681299033525,0.988673046960192,
+        0.988664991364795,0.988657132247334,0.98864946960781,0.988641021056541,
+        0.988632768983207,0.98862471338781,0.98861685427035,0.988609191630826,
+        0.988600939557492,0.988592883962095,0.988585024844635,0.988577362205111,
+        0.988569306609714,0.988561447492254,0.98855378485273,0.98854592573527,
+        0.988538263095746,0.988530600456222,0.988521955427015,0.988513506875745,
+        0.988505254802412,0.988497199207015,0.988489340089555,0.988481677450031,
+        0.988473228898761,0.988464976825427,0.98845692123003,0.98844906211257,
+        0.988441399473046,0.988433147399713,0.988425091804316,0.988417232686855,
+        0.988409570047332,0.988401514451935,0.988393655334474,0.98838599269495,
+        0.98837813357749,0.988370470937966,0.988362808298442,0.988354359747172,
+        0.988346107673839,0.988338052078442,0.988330192960981,0.988322530321458,
+        0.988314278248124,0.988306222652727,0.988298363535267,0.988290700895743,
+        0.988282645300346,0.988274786182886,0.988267123543362,0.988259264425901,
+        0.988251601786377,0.988243939146853,0.98823568707352,0.988227631478123,
+        0.988219772360663,0.988212109721139,0.988204054125742,0.988196195008282,
+        0.988188532368758,0.988180673251297,0.988173010611773,0.988165347972249,
+        0.988157292376853,0.988149433259392,0.988141770619868,0.988133911502408,
+        0.988126248862884,0.98811858622336,0.988110923583836,0.988103260944312,
+        0.988095598304788,0.988087935665264,0.988079487113995,0.988071038562725,
+        0.988062786489391,0.988054730893994,0.988046871776534,0.98803920913701,
+        0.98803076058574,0.988022508512407,0.98801445291701,0.988006593799549,
+        0.987998931160025,0.987990679086692,0.987982623491295,0.987974764373835,
+        0.987967101734311,0.987959046138914,0.987951187021453,0.98794352438193,
+        0.987935665264469,0.987928002624945,0.987920339985421,0.987911891434151,
+        0.987903639360818,0.987895583765421,0.987887724647961,0.987880062008437,
+        0.987871809935103,0.987863754339706,0.987855895222246,0.987848232582722,
+        0.987840176987325,0.987832317869865,0.987824655230341,0.987816796112881,
+        0.987809133473357,0.987801470833833,0.987793218760499,0.987785163165102,
+        0.987777304047642,0.987769641408118,0.987761585812721,0.987753726695261,
+        0.987746064055737,0.987738204938276,0.987730542298753,0.987722879659229,
+        0.987714824063832,0.987706964946371,0.987699302306847,0.987691443189387,
+        0.987683780549863,0.987676117910339,0.987668455270815,0.987660792631291,
+        0.987653129991768,0.987645467352244,0.98763721527891,0.987628963205577,
+        0.98762090761018,0.987613048492719,0.987605385853196,0.987597133779862,
+        0.987589078184465,0.987581219067005,0.987573556427481,0.987565500832084,
+        0.987557641714624,0.9875499790751,0.987542119957639,0.987534457318116,
+        0.987526794678592,0.987518542605258,0.987510487009861,0.987502627892401,
+        0.987494965252877,0.98748690965748,0.98747905054002,0.987471387900496,
+        0.987463528783035,0.987455866143511,0.987448203503988,0.987440147908591,
+        0.98743228879113,0.987424626151606,0.987416767034146,0.987409104394622,
+        0.987401441755098,0.987393779115574,0.98738611647605,0.987378453836526,
+        0.987370791197003,0.987362735601606,0.987354680006209,0.987346820888748,
+        0.987339158249224,0.987331102653828,0.987323243536367,0.987315580896843,
+        0.987307721779383,0.987300059139859,0.987292396500335,0.987284340904938,
+        0.987276481787478,0.987268819147954,0.987260960030493,0.987253297390969,
+        0.987245634751446,0.987237972111922,0.987230309472398,0.987222646832874,
+        0.98721498419335,0.98720712507589,0.987199265958429,0.987191603318905,
+        0.987183744201445,0.987176081561921,0.987168418922397,0.987160756282873,
+        0.987153093643349,0.987145431003825,0.987137768364302,0.987130105724778,
+        0.987122443085254,0.98711478044573,0.987107117806206,0.987098276299063,
+        0.987089631269857,0.987081182718587,0.987072930645253,0.987064875049856,
+        0.987057015932396,0.987049353292872,0.987040511785729,0.987031866756523,
+        0.987023418205253,0.987015166131919,0.987007110536522,0.986999251419062,
+        0.986991588779538,0.986982943750332,0.986974495199062,0.986966243125728,
+        0.986958187530331,0.986950328412871,0.986942665773347,0.986934217222077,
+        0.986925965148744,0.986917909553347,0.986910050435886,0.986902387796362,
+        0.986894135723029,0.986886080127632,0.986878221010172,0.986870558370648,
+        0.986862502775251,0.98685464365779,0.986846981018267,0.986839121900806,
+        0.986831459261282,0.986823796621758,0.986814955114615,0.986806310085409,
+        0.986797861534139,0.986789609460806,0.986781553865409,0.986773694747948,
+        0.986766032108424,0.986757387079218,0.986748938527948,0.986740686454615,
+        0.986732630859218,0.986724771741757,0.986717109102233,0.986708660550963,
+        0.98670040847763,0.986692352882233,0.986684493764773,0.986676831125249,
+        0.986668579051915,0.986660523456518,0.986652664339058,0.986645001699534,
+        0.986636946104137,0.986629086986677,0.986621424347153,0.986613565229693,
+        0.986605902590169,0.986598239950645,0.986589594921438,0.986581146370168,
+        0.986572894296835,0.986564838701438,0.986556979583978,0.986549316944454,
+        0.986540868393184,0.98653261631985,0.986524560724453,0.986516701606993,
+        0.986509038967469,0.986500786894136,0.986492731298739,0.986484872181278,
+        0.986477209541755,0.986469153946358,0.986461294828897,0.986453632189373,
+        0.986445773071913,0.986438110432389,0.986430447792865,0.986421999241595,
+        0.986413747168262,0.986405691572865,0.986397832455404,0.986390169815881,
+        0.986381917742547,0.98637386214715,0.98636600302969,0.986358340390166,
+        0.986350284794769,0.986342425677309,0.986334763037785,0.986326903920324,
+        0.9863192412808,0.986311578641276,0.986303326567943,0.986295270972546,
+        0.986287411855086,0.986279749215562,0.986271693620165,0.986263834502704,
+        0.986256171863181,0.98624831274572,0.986240650106196,0.986232987466672,
+        0.986224931871275,0.986217072753815,0.986209410114291,0.986201550996831,
+        0.986193888357307,0.986186225717783,0.986178366600323,0.986170703960799,
+        0.986163041321275,0.986155378681751,0.986146733652544,0.986138088623338,
+        0.986129640072068,0.986121387998735,0.986113332403338,0.986105473285877,
+        0.986097810646353,0.986089165617147,0.986080717065877,0.986072464992544,
+        0.986064409397147,0.986056550279686,0.986048887640162,0.986040439088892,
+        0.986032187015559,0.986024131420162,0.986016272302702,0.986008609663178,
+        0.986000357589845,0.985992301994448,0.985984442876987,0.985976780237463,
+        0.985968724642066,0.985960865524606,0.985953202885082,0.985945343767622,
+        0.985937681128098,0.985930018488574,0.985921373459367,0.985912924908097,
+        0.985904672834764,0.985896617239367,0.985888758121907,0.985881095482383,
+        0.985872646931113,0.985864394857779,0.985856339262383,0.985848480144922,
+        0.985840817505398,0.985832565432065,0.985824509836668,0.985816650719207,
+        0.985808988079684,0.985800932484287,0.985793073366826,0.985785410727302,
+        0.985777551609842,0.985769888970318,0.985762226330794,0.985753777779524,
+        0.985745525706191,0.985737470110794,0.985729610993333,0.98572194835381,
+        0.985713696280476,0.985705640685079,0.985697781567619,0.985690118928095,
+        0.985682063332698,0.985674204215238,0.985666541575714,0.985658682458253,
+        0.985651019818729,0.985643357179206,0.985635105105872,0.985627049510475,
+        0.985619190393015,0.985611527753491,0.985603472158094,0.985595613040634,
+        0.98558795040111,0.985580091283649,0.985572428644125,0.985564766004602,
+        0.985556710409205,0.985548851291744,0.98554118865222,0.98553332953476,
+        0.985525666895236,0.985518004255712,0.985510145138252,0.985502482498728,
+        0.985494819859204,0.98548715721968,0.98547870866841,0.98547026011714,
+        0.985462008043807,0.98545395244841,0.985446093330949,0.985438430691426,
+        0.985429982140156,0.985421730066822,0.985413674471425,0.985405815353965,
+        0.985398152714441,0.985389900641108,0.985381845045711,0.98537398592825,
+        0.985366323288726,0.985358267693329,0.985350408575869,0.985342745936345,
+        0.985334886818885,0.985327224179361,0.985319561539837,0.985311112988567,
+        0.985302860915234,0.985294805319837,0.985286946202376,0.985279283562852,
+        0.985271031489519,0.985262975894122,0.985255116776662,0.985247454137138,
+        0.985239398541741,0.98523153942428,0.985223876784756,0.985216017667296,
+        0.985208355027772,0.985200692388248,0.985192440314915,0.985184384719518,
+        0.985176525602057,0.985168862962534,0.985160807367137,0.985152948249676,
+        0.985145285610152,0.985137426492692,0.985129763853168,0.985122101213644,
+        0.985114045618247,0.985106186500787,0.985098523861263,0.985090664743803,
+        0.985083002104279,0.985075339464755,0.985067480347294,0.985059817707771,
+        0.985052155068247,0.985044492428723,0.985036240355389,0.985027988282056,
+        0.985019932686659,0.985012073569199,0.985004410929675,0.984996158856341,
+        0.984988103260944,0.984980244143484,0.98497258150396,0.984964525908563,
+        0.984956666791103,0.984949004151579,0.984941145034118,0.984933482394595,
+        0.984925819755071,0.984917567681737,0.98490951208634,0.98490165296888,
+        0.984893990329356,0.984885934733959,0.984878075616499,0.984870412976975,
+        0.984862553859514,0.98485489121999,0.984847228580467,0.98483917298507,
+        0.984831313867609,0.984823651228085,0.984815792110625,0.984808129471101,
+        0.984800466831577,0.984792607714117,0.984784945074593,0.984777282435069,
+        0.984769619795545,0.984761564200148,0.984753508604751,0.984745649487291,
+        0.984737986847767,0.98472993125237,0.98472207213491,0.984714409495386,
+        0.984706550377925,0.984698887738401,0.984691225098878,0.984683169503481,
+        0.98467531038602,0.984667647746496,0.984659788629036,0.984652125989512,
+        0.984644463349988,0.984636604232528,0.984628941593004,0.98462127895348,
+        0.984613616313956,0.984605757196496,0.984597898079035,0.984590235439511,
+        0.984582376322051,0.984574713682527,0.984567051043003,0.984559191925543,
+        0.984551529286019,0.984543866646495,0.984536204006971,0.984528541367447,
+        0.984520878727923,0.984513216088399,0.984505553448875,0.984497890809352,
+        0.984489245780145,0.984480797228875,0.984472545155542,0.984464489560145,
+        0.984456630442684,0.98444896780316,0.984440322773954,0.984431874222684,
+        0.984423622149351,0.984415566553954,0.984407707436493,0.98440004479697,
+        0.9843915962457,0.984383344172366,0.984375288576969,0.984367429459509,
+        0.984359766819985,0.984351514746652,0.984343459151255,0.984335600033794,
+        0.98432793739427,0.984319881798873,0.984312022681413,0.984304360041889,
+        0.984296500924429,0.984288838284905,0.984281175645381,0.984272530616174,
+        0.984264082064905,0.984255829991571,0.984247774396174,0.984239915278714,
+        0.98423225263919,0.98422380408792,0.984215552014587,0.98420749641919,
+        0.984199637301729,0.984191974662205,0.984183722588872,0.984175666993475,
+        0.984167807876015,0.984160145236491,0.984152089641094,0.984144230523633,
+        0.984136567884109,0.984128708766649,0.984121046127125,0.984113383487601,
+        0.984104934936331,0.984096682862998,0.984088627267601,0.984080768150141,
+        0.984073105510617,0.984064853437283,0.984056797841886,0.984048938724426,
+        0.984041276084902,0.984033220489505,0.984025361372045,0.984017698732521,
+        0.98400983961506,0.984002176975536,0.983994514336013,0.983986262262679,
+        0.983978206667282,0.983970347549822,0.983962684910298,0.983954629314901,
+        0.983946770197441,0.983939107557917,0.983931248440456,0.983923585800933,
+        0.983915923161409,0.983907867566012,0.983900008448551,0.983892345809027,
+        0.983884486691567,0.983876824052043,0.983869161412519,0.983861302295059,
+        0.983853639655535,0.983845977016011,0.983838314376487,0.983829865825217,
+        0.983821417273947,0.983813165200614,0.983805109605217,0.983797250487756,
+        0.983789587848233,0.983781139296963,0.983772887223629,0.983764831628232,
+        0.983756972510772,0.983749309871248,0.983741057797915,0.983733002202518,
+        0.983725143085057,0.983717480445533,0.983709424850136,0.983701565732676,
+        0.983693903093152,0.983686043975692,0.983678381336168,0.983670718696644,
+        0.983662270145374,0.983654018072041,0.983645962476644,0.983638103359183,
+        0.983630440719659,0.983622188646326,0.983614133050929,0.983606273933469,
+        0.983598611293945,0.983590555698548,0.983582696581087,0.983575033941564,
+        0.983567174824103,0.983559512184579,0.983551849545055,0.983543597471722,
+        0.983535541876325,0.983527682758865,0.983520020119341,0.983511964523944,
+        0.983504105406483,0.983496442766959,0.983488583649499,0.983480921009975,
+        0.983473258370451,0.983465202775054,0.983457343657594,0.98344968101807,
+        0.98344182190061,0.983434159261086,0.983426496621562,0.983418637504102,
+        0.983410974864578,0.983403312225054,0.98339564958553,0.983387397512196,
+        0.983379145438863,0.983371089843466,0.983363230726006,0.983355568086482,
+        0.983347316013148,0.983339260417751,0.983331401300291,0.983323738660767,
+        0.98331568306537,0.98330782394791,0.983300161308386,0.983292302190925,
+        0.983284639551402,0.983276976911878,0.983268724838544,0.983260669243147,
+        0.983252810125687,0.983245147486163,0.983237091890766,0.983229232773306,
+        0.983221570133782,0.983213711016321,0.983206048376797,0.983198385737274,
+        0.983190330141877,0.983182471024416,0.983174808384892,0.983166949267432,
+        0.983159286627908,0.983151623988384,0.983143764870924,0.9831361022314,
+        0.983128439591876,0.983120776952352,0.983112721356955,0.983104665761558,
+        0.983096806644098,0.983089144004574,0.983081088409177,0.983073229291717,
+        0.983065566652193,0.983057707534732,0.983050044895209,0.983042382255685,
+        0.983034326660288,0.983026467542827,0.983018804903303,0.983010945785843,
+        0.983003283146319,0.982995620506795,0.982987761389335,0.982980098749811,
+        0.982972436110287,0.982964773470763,0.982956914353303,0.982949055235842,
+        0.982941392596318,0.982933533478858,0.982925870839334,0.98291820819981,
+        0.98291034908235,0.982902686442826,0.982895023803302,0.982887361163778,
+        0.982879698524254,0.98287203588473,0.982864373245206,0.982856710605683,
+        0.982849047966159,0.982840599414889,0.982832347341555,0.982824291746158,
+        0.982816432628698,0.982808769989174,0.982800321437904,0.982792069364571,
+        0.982784013769174,0.982776154651713,0.98276849201219,0.982760239938856,
+        0.982752184343459,0.982744325225999,0.982736662586475,0.982728606991078,
+        0.982720747873618,0.982713085234094,0.982705226116633,0.982697563477109,
+        0.982689900837585,0.982681452286316,0.982673200212982,0.982665144617585,
+        0.982657285500125,0.982649622860601,0.982641370787267,0.982633315191871,
+        0.98262545607441,0.982617793434886,0.982609737839489,0.982601878722029,
+        0.982594216082505,0.982586356965045,0.982578694325521,0.982571031685997,
+        0.982562779612663,0.982554724017267,0.982546864899806,0.982539202260282,
+        0.982531146664885,0.982523287547425,0.982515624907901,0.982507765790441,
+        0.982500103150917,0.982492440511393,0.982484384915996,0.982476525798536,
+        0.982468863159012,0.982461004041551,0.982453341402027,0.982445678762503,
+        0.982437819645043,0.982430157005519,0.982422494365995,0.982414831726471,
+        0.982406579653138,0.982398327579804,0.982390271984408,0.982382412866947,
+        0.982374750227423,0.98236649815409,0.982358442558693,0.982350583441232,
+        0.982342920801709,0.982334865206312,0.982327006088851,0.982319343449327,
+        0.982311484331867,0.982303821692343,0.982296159052819,0.982287906979486,
+        0.982279851384089,0.982271992266628,0.982264329627105,0.982256274031708,
+        0.982248414914247,0.982240752274723,0.982232893157263,0.982225230517739,
+        0.982217567878215,0.982209512282818,0.982201653165358,0.982193990525834,
+        0.982186131408374,0.98217846876885,0.982170806129326,0.982162947011865,
+        0.982155284372341,0.982147621732818,0.982139959093294,0.982131903497897,
+        0.9821238479025,0.982115988785039,0.982108326145515,0.982100270550119,
+        0.982092411432658,0.982084748793134,0.982076889675674,0.98206922703615,
+        0.982061564396626,0.982053508801229,0.982045649683769,0.982037987044245,
+        0.982030127926784,0.982022465287261,0.982014802647737,0.982006943530276,
+        0.981999280890752,0.981991618251228,0.981983955611705,0.981976096494244,
+        0.981968237376784,0.98196057473726,0.981952715619799,0.981945052980276,
+        0.981937390340752,0.981929531223291,0.981921868583767,0.981914205944244,
+        0.98190654330472,0.981898880665196,0.981891218025672,0.981883555386148,
+        0.981875892746624,0.9818682301071,0.981859978033767,0.98185192243837,
+        0.981844063320909,0.981836400681385,0.981828148608052,0.981820093012655,
+        0.981812233895195,0.981804571255671,0.981796515660274,0.981788656542814,
+        0.98178099390329,0.981773134785829,0.981765472146305,0.981757809506781,
+        0.981749557433448,0.981741501838051,0.981733642720591,0.981725980081067,
+        0.98171792448567,0.981710065368209,0.981702402728686,0.981694543611225,
+        0.981686880971701,0.981679218332177,0.98167116273678,0.98166330361932,
+        0.981655640979796,0.981647781862336,0.981640119222812,0.981632456583288,
+        0.981624597465828,0.981616934826304,0.98160927218678,0.981601609547256,
+        0.981593553951859,0.981585498356462,0.981577639239002,0.981569976599478,
+        0.981561921004081,0.98155406188662,0.981546399247097,0.981538540129636,
+        0.981530877490112,0.981523214850588,0.981515159255191,0.981507300137731,
+        0.981499637498207,0.981491778380747,0.981484115741223,0.981476453101699,
+        0.981468593984239,0.981460931344715,0.981453268705191,0.981445606065667,
+        0.981437746948206,0.981429887830746,0.981422225191222,0.981414366073762,
+        0.981406703434238,0.981399040794714,0.981391181677254,0.98138351903773,
+        0.981375856398206,0.981368193758682,0.981360531119158,0.981352868479634,
+        0.98134520584011,0.981337543200586,0.981329880561062,0.981321824965665,
+        0.981313965848205,0.981306303208681,0.981298247613284,0.981290388495824,
+        0.9812827258563,0.98127486673884,0.981267204099316,0.981259541459792,
+        0.981251485864395,0.981243626746934,0.981235964107411,0.98122810498995,
+        0.981220442350426,0.981212779710902,0.981204920593442,0.981197257953918,
+        0.981189595314394,0.98118193267487,0.98117407355741,0.981166214439949,
+        0.981158551800426,0.981150692682965,0.981143030043441,0.981135367403917,
+        0.981127508286457,0.981119845646933,0.981112183007409,0.981104520367885,
+        0.981096857728361,0.981089195088838,0.981081532449314,0.98107386980979,
+        0.981066207170266,0.981058348052805,0.981050685413282,0.981042826295821,
+        0.981035163656297,0.981027501016773,0.981019641899313,0.981011979259789,
+        0.981004316620265,0.980996653980741,0.980988991341217,0.980981328701693,
+        0.98097366606217,0.980966003422646,0.980958340783122,0.980950678143598,
+        0.980943015504074,0.98093535286455,0.980927690225026,0.978973717146433,
+        0.977217204394033,0.975460691641632,0.973704178889232,0.971947666136831,
+        0.970191153384431,0.96843464063203,0.96667812787963,0.964921615127229,
+        0.963165102374829,0.963039356495462,0.962926185204033,0.962825588500539,
+        0.962737566384983,0.962662118857363,0.96259924591768,0.962548947565933,
+        0.962511223802123,0.96248607462625,0.962473500038313,0.962473500038313,
+        0.962360328746883,0.96225973204339,0.962171709927834,0.962096262400214,
+        0.962033389460531,0.961983091108784,0.961945367344974,0.961920218169101,
+        0.961907643581164,0.961907643581164,0.961807046877671,0.961719024762114,
+        0.961643577234494,0.961580704294811,0.961530405943065,0.961492682179255,
+        0.961467533003381,0.961454958415445,0.961454958415445,0.961366936299888,
+        0.961291488772268,0.961228615832585,0.961178317480838,0.961140593717029,
+        0.961115444541155,0.961102869953219,0.961102869953219,0.961027422425599,
+        0.960964549485915,0.960914251134169,0.960876527370359,0.960851378194486,
+        0.960838803606549,0.960838803606549,0.960775930666866,0.960725632315119,
+        0.960687908551309,0.960662759375436,0.960650184787499,0.960650184787499,
+        0.960599886435753,0.960562162671943,0.960537013496069,0.960524438908133,
+        0.960524438908133,0.960486715144323,0.96046156596845,0.960448991380513,
+        0.960448991380513,0.96042384220464,0.960411267616703,0.960411267616703,
+        0.960398693028766,0.960398693028766,0.960398693028766,0.9602729471494,
+        0.96015977585797,0.960059179154477,0.95997115703892,0.9598957095113,
+        0.959832836571617,0.959782538219871,0.959744814456061,0.959719665280187,
+        0.959707090692251,0.959707090692251,0.959593919400821,0.959493322697328,
+        0.959405300581771,0.959329853054151,0.959266980114468,0.959216681762721,
+        0.959178957998912,0.959153808823038,0.959141234235102,0.959141234235102,
+        0.959040637531608,0.958952615416052,0.958877167888432,0.958814294948749,
+        0.958763996597002,0.958726272833192,0.958701123657319,0.958688549069382,
+        0.958688549069382,0.958600526953826,0.958525079426206,0.958462206486523,
+        0.958411908134776,0.958374184370966,0.958349035195093,0.958336460607156,
+        0.958336460607156,0.958261013079536,0.958198140139853,0.958147841788106,
+        0.958110118024296,0.958084968848423,0.958072394260487,0.958072394260487,
+        0.958009521320803,0.957959222969057,0.957921499205247,0.957896350029373,
+        0.957883775441437,0.957883775441437,0.95783347708969,0.95779575332588,
+        0.957770604150007,0.95775802956207,0.95775802956207,0.95772030579826,
+        0.957695156622387,0.95768258203445,0.95768258203445,0.957657432858577,
+        0.95764485827064,0.95764485827064,0.957632283682704,0.957632283682704,
+        0.957632283682704,0.957506537803337,0.957393366511908,0.957292769808414,
+        0.957204747692858,0.957129300165238,0.957066427225555,0.957016128873808,
+        0.956978405109998,0.956953255934125,0.956940681346188,0.956940681346188,
+        0.956827510054758,0.956726913351265,0.956638891235709,0.956563443708089,
+        0.956500570768406,0.956450272416659,0.956412548652849,0.956387399476976,
+        0.956374824889039,0.956374824889039,0.956274228185546,0.956186206069989,
+        0.956110758542369,0.956047885602686,0.95599758725094,0.95595986348713,
+        0.955934714311256,0.95592213972332,0.95592213972332,0.955834117607763,
+        0.955758670080143,0.95569579714046,0.955645498788714,0.955607775024904,
+        0.95558262584903,0.955570051261094,0.955570051261094,0.955494603733474,
+        0.955431730793791,0.955381432442044,0.955343708678234,0.955318559502361,
+        0.955305984914424,0.955305984914424,0.955243111974741,0.955192813622994,
+        0.955155089859184,0.955129940683311,0.955117366095374,0.955117366095374,
+        0.955067067743628,0.955029343979818,0.955004194803944,0.954991620216008,
+        0.954991620216008,0.954953896452198,0.954928747276325,0.954916172688388,
+        0.954916172688388,0.954891023512515,0.954878448924578,0.954878448924578,
+        0.954865874336641,0.954865874336641,0.954865874336641,0.954740128457275,
+        0.954626957165845,0.954526360462352,0.954438338346795,0.954362890819175,
+        0.954300017879492,0.954249719527746,0.954211995763936,0.954186846588062,
+        0.954174272000126,0.954174272000126,0.954061100708696,0.953960504005203,
+        0.953872481889646,0.953797034362026,0.953734161422343,0.953683863070596,
+        0.953646139306787,0.953620990130913,0.953608415542977,0.953608415542977,
+        0.953507818839483,0.953419796723927,0.953344349196307,0.953281476256624,
+        0.953231177904877,0.953193454141067,0.953168304965194,0.953155730377257,
+        0.953155730377257,0.953067708261701,0.952992260734081,0.952929387794398,
+        0.952879089442651,0.952841365678841,0.952816216502968,0.952803641915031,
+        0.952803641915031,0.952728194387411,0.952665321447728,0.952615023095981,
+        0.952577299332172,0.952552150156298,0.952539575568362,0.952539575568362,
+        0.952476702628678,0.952426404276932,0.952388680513122,0.952363531337248,
+        0.952350956749312,0.952350956749312,0.952300658397565,0.952262934633755,
+        0.952237785457882,0.952225210869945,0.952225210869945,0.952187487106135,
+        0.952162337930262,0.952149763342325,0.952149763342325,0.952124614166452,
+        0.952112039578516,0.952112039578516,0.952099464990579,0.952099464990579,
+        0.952099464990579,0.951973719111212,0.951860547819783,0.951759951116289,
+        0.951671929000733,0.951596481473113,0.95153360853343,0.951483310181683,
+        0.951445586417873,0.951420437242,0.951407862654063,0.951407862654063,
+        0.951294691362633,0.95119409465914,0.951106072543584,0.951030625015964,
+        0.950967752076281,0.950917453724534,0.950879729960724,0.950854580784851,
+        0.950842006196914,0.950842006196914,0.950741409493421,0.950653387377864,
+        0.950577939850245,0.950515066910561,0.950464768558815,0.950427044795005,
+        0.950401895619131,0.950389321031195,0.950389321031195,0.950301298915638,
+        0.950225851388018,0.950162978448335,0.950112680096589,0.950074956332779,
+        0.950049807156905,0.950037232568969,0.950037232568969,0.949961785041349,
+        0.949898912101666,0.949848613749919,0.949810889986109,0.949785740810236,
+        0.949773166222299,0.949773166222299,0.949710293282616,0.949659994930869,
+        0.949622271167059,0.949597121991186,0.949584547403249,0.949584547403249,
+        0.949534249051503,0.949496525287693,0.94947137611182,0.949458801523883,
+        0.949458801523883,0.949421077760073,0.9493959285842,0.949383353996263,
+        0.949383353996263,0.94935820482039,0.949345630232453,0.949345630232453,
+        0.949333055644516,0.949333055644516,0.949333055644516,0.94920730976515,
+        0.94909413847372,0.948993541770227,0.94890551965467,0.948830072127051,
+        0.948767199187367,0.948716900835621,0.948679177071811,0.948654027895937,
+        0.948641453308001,0.948641453308001,0.948528282016571,0.948427685313078,
+        0.948339663197521,0.948264215669901,0.948201342730218,0.948151044378472,
+        0.948113320614662,0.948088171438788,0.948075596850852,0.948075596850852,
+        0.947975000147358,0.947886978031802,0.947811530504182,0.947748657564499,
+        0.947698359212752,0.947660635448942,0.947635486273069,0.947622911685132,
+        0.947622911685132,0.947534889569576,0.947459442041956,0.947396569102273,
+        0.947346270750526,0.947308546986716,0.947283397810843,0.947270823222906,
+        0.947270823222906,0.947195375695286,0.947132502755603,0.947082204403856,
+        0.947044480640047,0.947019331464173,0.947006756876237,0.947006756876237,
+        0.946943883936553,0.946893585584807,0.946855861820997,0.946830712645124,
+        0.946818138057187,0.946818138057187,0.94676783970544,0.94673011594163,
+        0.946704966765757,0.94669239217782,0.94669239217782,0.94665466841401,
+        0.946629519238137,0.946616944650201,0.946616944650201,0.946591795474327,
+        0.946579220886391,0.946579220886391,0.946566646298454,0.946566646298454,
+        0.946566646298454,0.946440900419087,0.946327729127658,0.946227132424164,
+        0.946139110308608,0.946063662780988,0.946000789841305,0.945950491489558,
+        0.945912767725748,0.945887618549875,0.945875043961938,0.945875043961938,
+        0.945761872670508,0.945661275967015,0.945573253851459,0.945497806323839,
+        0.945434933384156,0.945384635032409,0.945346911268599,0.945321762092726,
+        0.945309187504789,0.945309187504789,0.945208590801296,0.945120568685739,
+        0.94504512115812,0.944982248218436,0.94493194986669,0.94489422610288,
+        0.944869076927007,0.94485650233907,0.94485650233907,0.944768480223513,
+        0.944693032695893,0.94463015975621,0.944579861404464,0.944542137640654,
+        0.94451698846478,0.944504413876844,0.944504413876844,0.944428966349224,
+        0.944366093409541,0.944315795057794,0.944278071293984,0.944252922118111,
+        0.944240347530174,0.944240347530174,0.944177474590491,0.944127176238744,
+        0.944089452474934,0.944064303299061,0.944051728711124,0.944051728711124,
+        0.944001430359378,0.943963706595568,0.943938557419695,0.943925982831758,
+        0.943925982831758,0.943888259067948,0.943863109892075,0.943850535304138,
+        0.943850535304138,0.943825386128265,0.943812811540328,0.943812811540328,
+        0.943800236952391,0.943800236952391,0.943800236952391,0.943674491073025,
+        0.943561319781595,0.943460723078102,0.943372700962545,0.943297253434926,
+        0.943234380495242,0.943184082143496,0.943146358379686,0.943121209203812,
+        0.943108634615876,0.943108634615876,0.942995463324446,0.942894866620953,
+        0.942806844505396,0.942731396977776,0.942668524038093,0.942618225686347,
+        0.942580501922537,0.942555352746663,0.942542778158727,0.942542778158727,
+        0.942442181455234,0.942354159339677,0.942278711812057,0.942215838872374,
+        0.942165540520627,0.942127816756817,0.942102667580944,0.942090092993007,
+        0.942090092993007,0.942002070877451,0.941926623349831,0.941863750410148,
+        0.941813452058401,0.941775728294591,0.941750579118718,0.941738004530781,
+        0.941738004530781,0.941662557003161,0.941599684063478,0.941549385711732,
+        0.941511661947922,0.941486512772048,0.941473938184112,0.941473938184112,
+        0.941411065244428,0.941360766892682,0.941323043128872,0.941297893952999,
+        0.941285319365062,0.941285319365062,0.941235021013315,0.941197297249505,
+        0.941172148073632,0.941159573485695,0.941159573485695,0.941121849721886,
+        0.941096700546012,0.941084125958076,0.941084125958076,0.941058976782202,
+        0.941046402194266,0.941046402194266,0.941033827606329,0.941033827606329,
+        0.941033827606329,0.940908081726962,0.940794910435533,0.940694313732039,
+        0.940606291616483,0.940530844088863,0.94046797114918,0.940417672797433,
+        0.940379949033623,0.94035479985775,0.940342225269813,0.940342225269813,
+        0.940229053978384,0.94012845727489,0.940040435159334,0.939964987631714,
+        0.939902114692031,0.939851816340284,0.939814092576474,0.939788943400601,
+        0.939776368812664,0.939776368812664,0.939675772109171,0.939587749993614,
+        0.939512302465995,0.939449429526311,0.939399131174565,0.939361407410755,
+        0.939336258234882,0.939323683646945,0.939323683646945,0.939235661531388,
+        0.939160214003768,0.939097341064085,0.939047042712339,0.939009318948529,
+        0.938984169772655,0.938971595184719,0.938971595184719,0.938896147657099,
+        0.938833274717416,0.938782976365669,0.938745252601859,0.938720103425986,
+        0.938707528838049,0.938707528838049,0.938644655898366,0.938594357546619,
+        0.938556633782809,0.938531484606936,0.938518910018999,0.938518910018999,
+        0.938468611667253,0.938430887903443,0.93840573872757,0.938393164139633,
+        0.938393164139633,0.938355440375823,0.93833029119995,0.938317716612013,
+        0.938317716612013,0.93829256743614,0.938279992848203,0.938279992848203,
+        0.938267418260266,0.938267418260266,0.938267418260266,0.9381416723809,
+        0.93802850108947,0.937927904385977,0.93783988227042,0.937764434742801,
+        0.937701561803117,0.937651263451371,0.937613539687561,0.937588390511688,
+        0.937575815923751,0.937575815923751,0.937462644632321,0.937362047928828,
+        0.937274025813271,0.937198578285651,0.937135705345968,0.937085406994222,
+        0.937047683230412,0.937022534054538,0.937009959466602,0.937009959466602,
+        0.936909362763109,0.936821340647552,0.936745893119932,0.936683020180249,
+        0.936632721828502,0.936594998064692,0.936569848888819,0.936557274300882,
+        0.936557274300882,0.936469252185326,0.936393804657706,0.936330931718023,
+        0.936280633366276,0.936242909602466,0.936217760426593,0.936205185838656,
+        0.936205185838656,0.936129738311036,0.936066865371353,0.936016567019607,
+        0.935978843255797,0.935953694079923,0.935941119491987,0.935941119491987,
+        0.935878246552303,0.935827948200557,0.935790224436747,0.935765075260874,
+        0.935752500672937,0.935752500672937,0.93570220232119,0.93566447855738,
+        0.935639329381507,0.93562675479357,0.93562675479357,0.935589031029761,
+        0.935563881853887,0.935551307265951,0.935551307265951,0.935526158090077,
+        0.935513583502141,0.935513583502141,0.935501008914204,0.935501008914204,
+        0.935501008914204,0.935375263034838,0.935262091743408,0.935161495039915,
+        0.935073472924358,0.934998025396738,0.934935152457055,0.934884854105308,
+        0.934847130341498,0.934821981165625,0.934809406577688,0.934809406577688,
+        0.934696235286259,0.934595638582765,0.934507616467209,0.934432168939589,
+        0.934369295999906,0.934318997648159,0.934281273884349,0.934256124708476,
+        0.934243550120539,0.934243550120539,0.934142953417046,0.93405493130149,
+        0.93397948377387,0.933916610834186,0.93386631248244,0.93382858871863,
+        0.933803439542757,0.93379086495482,0.93379086495482,0.933702842839263,
+        0.933627395311644,0.93356452237196,0.933514224020214,0.933476500256404,
+        0.93345135108053,0.933438776492594,0.933438776492594,0.933363328964974,
+        0.933300456025291,0.933250157673544,0.933212433909734,0.933187284733861,
+        0.933174710145924,0.933174710145924,0.933111837206241,0.933061538854494,
+        0.933023815090684,0.932998665914811,0.932986091326874,0.932986091326874,
+        0.932935792975128,0.932898069211318,0.932872920035445,0.932860345447508,
+        0.932860345447508,0.932822621683698,0.932797472507825,0.932784897919888,
+        0.932784897919888,0.932759748744015,0.932747174156078,0.932747174156078,
+        0.932734599568142,0.932734599568142,0.932734599568142,0.932608853688775,
+        0.932495682397345,0.932395085693852,0.932307063578296,0.932231616050676,
+        0.932168743110992,0.932118444759246,0.932080720995436,0.932055571819563,
+        0.932042997231626,0.932042997231626,0.931929825940196,0.931829229236703,
+        0.931741207121146,0.931665759593526,0.931602886653843,0.931552588302097,
+        0.931514864538287,0.931489715362413,0.931477140774477,0.931477140774477,
+        0.931376544070984,0.931288521955427,0.931213074427807,0.931150201488124,
+        0.931099903136377,0.931062179372567,0.931037030196694,0.931024455608757,
+        0.931024455608757,0.930936433493201,0.930860985965581,0.930798113025898,
+        0.930747814674151,0.930710090910341,0.930684941734468,0.930672367146531,
+        0.930672367146531,0.930596919618911,0.930534046679228,0.930483748327482,
+        0.930446024563672,0.930420875387798,0.930408300799862,0.930408300799862,
+        0.930345427860178,0.930295129508432,0.930257405744622,0.930232256568749,
+        0.930219681980812,0.930219681980812,0.930169383629065,0.930131659865255,
+        0.930106510689382,0.930093936101446,0.930093936101446,0.930056212337636,
+        0.930031063161762,0.930018488573826,0.930018488573826,0.929993339397952,
+        0.929980764810016,0.929980764810016,0.929968190222079,0.929968190222079,
+        0.929968190222079,0.929842444342713,0.929729273051283,0.92962867634779,
+        0.929540654232233,0.929465206704613,0.92940233376493,0.929352035413183,
+        0.929314311649373,0.9292891624735,0.929276587885563,0.929276587885563,
+        0.929163416594134,0.92906281989064,0.928974797775084,0.928899350247464,
+        0.928836477307781,0.928786178956034,0.928748455192224,0.928723306016351,
+        0.928710731428414,0.928710731428414,0.928610134724921,0.928522112609365,
+        0.928446665081745,0.928383792142061,0.928333493790315,0.928295770026505,
+        0.928270620850632,0.928258046262695,0.928258046262695,0.928170024147138,
+        0.928094576619519,0.928031703679835,0.927981405328089,0.927943681564279,
+        0.927918532388405,0.927905957800469,0.927905957800469,0.927830510272849,
+        0.927767637333166,0.927717338981419,0.927679615217609,0.927654466041736,
+        0.927641891453799,0.927641891453799,0.927579018514116,0.927528720162369,
+        0.927490996398559,0.927465847222686,0.92745327263475,0.92745327263475,
+        0.927402974283003,0.927365250519193,0.92734010134332,0.927327526755383,
+        0.927327526755383,0.927289802991573,0.9272646538157,0.927252079227763,
+        0.927252079227763,0.92722693005189,0.927214355463953,0.927214355463953,
+        0.927201780876017,0.927201780876017,0.927201780876017,0.92690824283887,
+        0.926642997624582,0.926406045233151,0.926197385664577,0.92601701891886,
+        0.925864944996002,0.925741163896,0.925645675618856,0.92557848016457,
+        0.925539577533141,0.925528967724569,0.925246039495995,0.924980794281706,
+        0.924743841890275,0.924535182321701,0.924354815575985,0.924202741653126,
+        0.924078960553125,0.923983472275981,0.923916276821694,0.923877374190265,
+        0.923866764381694,0.923583836153119,0.923329200747402,0.923092248355971,
+        0.922883588787397,0.922703222041681,0.922551148118822,0.922427367018821,
+        0.922331878741677,0.92226468328739,0.922225780655961,0.92221517084739,
+        0.921932242618815,0.921677607213098,0.921451264630238,0.921242605061665,
+        0.921062238315948,0.920910164393089,0.920786383293088,0.920690895015944,
+        0.920623699561658,0.920584796930229,0.920574187121657,0.920291258893083,
+        0.920036623487365,0.919810280904506,0.919612231144504,0.919431864398787,
+        0.919279790475929,0.919156009375927,0.919060521098783,0.918993325644497,
+        0.918954423013068,0.918943813204496,0.918660884975922,0.918406249570205,
+        0.918179906987345,0.917981857227343,0.917812100290198,0.917660026367339,
+        0.917536245267338,0.917440756990194,0.917373561535907,0.917334658904478,
+        0.917324049095907,0.917041120867332,0.916786485461615,0.916560142878755,
+        0.916362093118753,0.916192336181608,0.916050872067321,0.91592709096732,
+        0.915831602690176,0.915764407235889,0.91572550460446,0.915714894795889,
+        0.915431966567314,0.915177331161597,0.914950988578738,0.914752938818735,
+        0.914583181881591,0.914441717767303,0.914328546475873,0.91423305819873,
+        0.914165862744443,0.914126960113014,0.914116350304443,0.913833422075868,
+        0.913578786670151,0.913352444087291,0.913154394327289,0.912984637390144,
+        0.912843173275857,0.912730001984427,0.912645123515855,0.912577928061568,
+        0.912539025430139,0.912528415621568,0.912245487392993,0.911990851987276,
+        0.911764509404416,0.911566459644414,0.911396702707269,0.911255238592982,
+        0.911142067301552,0.91105718883298,0.911000603187265,0.910961700555836,
+        0.910951090747265,0.91066816251869,0.910413527112973,0.910187184530113,
+        0.909989134770111,0.909819377832966,0.909677913718679,0.909564742427249,
+        0.909479863958677,0.909423278312962,0.909394985490104,0.909384375681533,
+        0.909101447452958,0.908846812047241,0.908620469464381,0.908422419704379,
+        0.908252662767235,0.908111198652947,0.907998027361517,0.907913148892945,
+        0.90785656324723,0.907828270424373,0.907828270424373,0.907545342195798,
+        0.907280096981509,0.907043144590078,0.906834485021505,0.906654118275788,
+        0.906502044352929,0.906378263252928,0.906282774975784,0.906215579521498,
+        0.906176676890069,0.906166067081497,0.905883138852922,0.905628503447205,
+        0.905391551055774,0.9051828914872,0.905002524741484,0.904850450818625,
+        0.904726669718624,0.90463118144148,0.904563985987194,0.904525083355765,
+        0.904514473547193,0.904231545318618,0.903976909912901,0.903750567330042,
+        0.903541907761468,0.903361541015752,0.903209467092893,0.903085685992891,
+        0.902990197715748,0.902923002261461,0.902884099630032,0.902873489821461,
+        0.902590561592886,0.902335926187169,0.902109583604309,0.901911533844307,
+        0.901731167098591,0.901579093175732,0.90145531207573,0.901359823798587,
+        0.9012926283443,0.901253725712871,0.9012431159043,0.900960187675725,
+        0.900705552270008,0.900479209687148,0.900281159927146,0.900111402990001,
+        0.899959329067142,0.899835547967141,0.899740059689997,0.899672864235711,
+        0.899633961604282,0.89962335179571,0.899340423567136,0.899085788161418,
+        0.898859445578559,0.898661395818557,0.898491638881412,0.898350174767125,
+        0.898226393667123,0.898130905389979,0.898063709935693,0.898024807304264,
+        0.898014197495692,0.897731269267118,0.897476633861401,0.897250291278541,
+        0.897052241518539,0.896882484581394,0.896741020467107,0.896627849175677,
+        0.896532360898533,0.896465165444246,0.896426262812817,0.896415653004246,
+        0.896132724775671,0.895878089369954,0.895651746787095,0.895453697027092,
+        0.895283940089948,0.89514247597566,0.89502930468423,0.894944426215658,
+        0.894877230761372,0.894838328129943,0.894827718321371,0.894544790092797,
+        0.894290154687079,0.89406381210422,0.893865762344218,0.893696005407073,
+        0.893554541292786,0.893441370001356,0.893356491532783,0.893299905887068,
+        0.893261003255639,0.893250393447068,0.892967465218493,0.892712829812776,
+        0.892486487229917,0.892288437469914,0.89211868053277,0.891977216418482,
+        0.891864045127052,0.89177916665848,0.891722581012765,0.891694288189908,
+        0.891683678381336,0.891400750152762,0.891146114747045,0.890919772164185,
+        0.890721722404183,0.890551965467038,0.890410501352751,0.890297330061321,
+        0.890212451592748,0.890155865947033,0.890127573124176,0.890127573124176,
+        0.889844644895601,0.889590009489884,0.889353057098453,0.889144397529879,
+        0.888964030784163,0.888811956861304,0.888688175761303,0.888592687484159,
+        0.888525492029873,0.888486589398443,0.888475979589872,0.888193051361297,
+        0.88793841595558,0.887712073372721,0.887503413804147,0.887323047058431,
+        0.887170973135572,0.88704719203557,0.886951703758426,0.88688450830414,
+        0.886845605672711,0.886834995864139,0.886552067635565,0.886297432229848,
+        0.886071089646988,0.885873039886986,0.88569267314127,0.885540599218411,
+        0.885416818118409,0.885321329841265,0.885254134386979,0.88521523175555,
+        0.885204621946978,0.884921693718404,0.884667058312687,0.884440715729827,
+        0.884242665969825,0.88407290903268,0.883920835109821,0.88379705400982,
+        0.883701565732676,0.88363437027839,0.883595467646961,0.883584857838389,
+        0.883301929609814,0.883047294204097,0.882820951621238,0.882622901861235,
+        0.882453144924091,0.882311680809803,0.882187899709802,0.882092411432658,
+        0.882025215978372,0.881986313346943,0.881975703538371,0.881692775309797,
+        0.881438139904079,0.88121179732122,0.881013747561218,0.880843990624073,
+        0.880702526509786,0.880589355218356,0.880493866941212,0.880426671486925,
+        0.880387768855496,0.880377159046925,0.88009423081835,0.879839595412633,
+        0.879613252829773,0.879415203069771,0.879245446132627,0.879103982018339,
+        0.878990810726909,0.878905932258337,0.878838736804051,0.878799834172622,
+        0.87878922436405,0.878506296135475,0.878251660729758,0.878025318146899,
+        0.877827268386897,0.877657511449752,0.877516047335465,0.877402876044035,
+        0.877317997575462,0.877261411929747,0.877222509298318,0.877211899489747,
+        0.876928971261172,0.876674335855455,0.876447993272595,0.876249943512593,
+        0.876080186575449,0.875938722461161,0.875825551169731,0.875740672701159,
+        0.875684087055444,0.875655794232587,0.875645184424015,0.875362256195441,
+        0.875107620789723,0.874881278206864,0.874683228446862,0.874513471509717,
+        0.87437200739543,0.874258836104,0.874173957635427,0.874117371989712,
+        0.874089079166855,0.874089079166855,0.87380615093828,0.873551515532563,
+        0.873325172949704,0.87311651338113,0.872936146635414,0.872784072712555,
+        0.872660291612553,0.872564803335409,0.872497607881123,0.872458705249694,
+        0.872448095441122,0.872165167212548,0.871910531806831,0.871684189223971,
+        0.871486139463969,0.871305772718253,0.871153698795394,0.871029917695392,
+        0.870934429418249,0.870867233963962,0.870828331332533,0.870817721523961,
+        0.870534793295387,0.87028015788967,0.87005381530681,0.869855765546808,
+        0.869686008609663,0.869533934686804,0.869410153586803,0.869314665309659,
+        0.869247469855373,0.869208567223944,0.869197957415372,0.868915029186797,
+        0.86866039378108,0.868434051198221,0.868236001438218,0.868066244501074,
+        0.867924780386786,0.867800999286785,0.867705511009641,0.867638315555355,
+        0.867599412923926,0.867588803115354,0.86730587488678,0.867051239481062,
+        0.866824896898203,0.866626847138201,0.866457090201056,0.866315626086769,
+        0.866202454795339,0.866106966518195,0.866039771063908,0.866000868432479,
+        0.865990258623908,0.865707330395333,0.865452694989616,0.865226352406756,
+        0.865028302646754,0.86485854570961,0.864717081595322,0.864603910303892,
+        0.86451903183532,0.864451836381034,0.864412933749605,0.864402323941033,
+        0.864119395712458,0.863864760306741,0.863638417723882,0.863440367963879,
+        0.863270611026735,0.863129146912447,0.863015975621018,0.862931097152445,
+        0.86287451150673,0.862835608875301,0.86282499906673,0.862542070838155,
+        0.862287435432438,0.862061092849578,0.861863043089576,0.861693286152431,
+        0.861551822038144,0.861438650746714,0.861353772278142,0.861297186632427,
+        0.86126889380957,0.861258284000998,0.860975355772424,0.860720720366706,
+        0.860494377783847,0.860296328023845,0.8601265710867,0.859985106972412,
+        0.859871935680983,0.85978705721241,0.859730471566695,0.859702178743838,
+        0.859702178743838,0.859419250515263,0.859164615109546,0.858938272526687,
+        0.858740222766684,0.858559856020968,0.858407782098109,0.858284000998108,
+        0.858188512720964,0.858121317266678,0.858082414635248,0.858071804826677,
+        0.857788876598102,0.857534241192385,0.857307898609526,0.857109848849523,
+        0.856940091912379,0.85678801798952,0.856664236889519,0.856568748612375,
+        0.856501553158088,0.856462650526659,0.856452040718088,0.856169112489513,
+        0.855914477083796,0.855688134500936,0.855490084740934,0.855320327803789,
+        0.855178863689502,0.855055082589501,0.854959594312357,0.85489239885807,
+        0.854853496226641,0.85484288641807,0.854559958189495,0.854305322783778,
+        0.854078980200918,0.853880930440916,0.853711173503771,0.853569709389484,
+        0.853456538098054,0.85336104982091,0.853293854366624,0.853254951735195,
+        0.853244341926623,0.852961413698049,0.852706778292332,0.852480435709472,
+        0.85228238594947,0.852112629012325,0.851971164898038,0.851857993606608,
+        0.851773115138036,0.851705919683749,0.85166701705232,0.851656407243749,
+        0.851373479015174,0.851118843609457,0.850892501026597,0.850694451266595,
+        0.85052469432945,0.850383230215163,0.850270058923733,0.850185180455161,
+        0.850128594809446,0.850089692178017,0.850079082369445,0.849796154140871,
+        0.849541518735154,0.849315176152294,0.849117126392292,0.848947369455147,
+        0.84880590534086,0.84869273404943,0.848607855580857,0.848551269935143,
+        0.848522977112285,0.848512367303714,0.848229439075139,0.847974803669422,
+        0.847748461086562,0.84755041132656,0.847380654389415,0.847239190275128,
+        0.847126018983698,0.847041140515126,0.846984554869411,0.846956262046553,
+        0.846956262046553,0.846673333817979,0.846418698412262,0.846192355829402,
+        0.8459943060694,0.845824549132255,0.845672475209396,0.845548694109395,
+        0.845453205832251,0.845386010377965,0.845347107746536,0.845336497937964,
+        0.845053569709389,0.844798934303672,0.844572591720813,0.844374541960811,
+        0.844204785023666,0.844063320909379,0.843939539809377,0.843844051532233,
+        0.843776856077947,0.843737953446518,0.843727343637946,0.843444415409372,
+        0.843189780003655,0.842963437420795,0.842765387660793,0.842595630723648,
+        0.842454166609361,0.842340995317931,0.842245507040787,0.8421783115865,
+        0.842139408955071,0.8421287991465,0.841845870917925,0.841591235512208,
+        0.841364892929348,0.841166843169346,0.840997086232202,0.840855622117914,
+        0.840742450826484,0.840657572357912,0.840590376903626,0.840551474272197,
+        0.840540864463625,0.840257936235051,0.840003300829333,0.839776958246474,
+        0.839578908486472,0.839409151549327,0.839267687435039,0.83915451614361,
+        0.839069637675037,0.839013052029322,0.838974149397893,0.838963539589322,
+        0.838680611360747,0.83842597595503,0.838199633372171,0.838001583612168,
+        0.837831826675024,0.837690362560736,0.837577191269306,0.837492312800734,
+        0.837435727155019,0.837407434332162,0.83739682452359,0.837113896295016,
+        0.836859260889298,0.836632918306439,0.836434868546437,0.836265111609292,
+        0.836123647495005,0.836010476203575,0.835925597735002,0.835869012089287,
+        0.83584071926643,0.83584071926643,0.835557791037855,0.835303155632138,
+        0.835076813049279,0.834878763289276,0.834709006352132,0.834567542237844,
+        0.834443761137843,0.834348272860699,0.834281077406413,0.834242174774984,
+        0.834231564966412,0.833948636737837,0.83369400133212,0.833467658749261,
+        0.833269608989259,0.833099852052114,0.832958387937827,0.832845216646397,
+        0.832749728369253,0.832682532914966,0.832643630283537,0.832633020474966,
+        0.832350092246391,0.832095456840674,0.831869114257814,0.831671064497812,
+        0.831501307560667,0.83135984344638,0.83124667215495,0.831161793686378,
+        0.831094598232092,0.831055695600663,0.831045085792091,0.830762157563516,
+        0.830507522157799,0.83028117957494,0.830083129814937,0.829913372877793,
+        0.829771908763505,0.829658737472076,0.829573859003503,0.829517273357788,
+        0.829478370726359,0.829467760917788,0.829184832689213,0.828930197283496,
+        0.828703854700636,0.828505804940634,0.828336048003489,0.828194583889202,
+        0.828081412597772,0.8279965341292,0.827939948483485,0.827911655660628,
+        0.827901045852056,0.827618117623481,0.827363482217764,0.827137139634905,
+        0.826939089874902,0.826769332937758,0.826627868823471,0.826514697532041,
+        0.826429819063468,0.826373233417753,0.826344940594896,0.826344940594896,
+        0.826062012366321,0.825807376960604,0.825581034377745,0.825382984617742,
+        0.825213227680598,0.82507176356631,0.82495859227488,0.824863103997737,
+        0.82479590854345,0.824757005912021,0.82474639610345,0.824463467874875,
+        0.824208832469158,0.823982489886298,0.823784440126296,0.823614683189151,
+        0.823473219074864,0.823360047783434,0.823275169314862,0.823207973860575,
+        0.823169071229146,0.823158461420575,0.822875533192,0.822620897786283,
+        0.822394555203423,0.822196505443421,0.822026748506276,0.821885284391989,
+        0.821772113100559,0.821687234631987,0.821630648986272,0.821591746354843,
+        0.821581136546272,0.821298208317697,0.82104357291198,0.82081723032912,
+        0.820619180569118,0.820449423631973,0.820307959517686,0.820194788226256,
+        0.820109909757684,0.820053324111969,0.820025031289111,0.82001442148054,
+        0.819731493251965,0.819476857846248,0.819250515263389,0.819052465503386,
+        0.818882708566242,0.818741244451954,0.818628073160524,0.818543194691952,
+        0.818486609046237,0.81845831622338,0.81845831622338,0.818175387994805,
+        0.817920752589088,0.817694410006228,0.817496360246226,0.817326603309081,
+        0.817185139194794,0.817071967903364,0.816987089434792,0.816919893980505,
+        0.816880991349076,0.816870381540505,0.81658745331193,0.816332817906213,
+        0.816106475323354,0.815908425563351,0.815738668626207,0.815597204511919,
+        0.815484033220489,0.815399154751917,0.815342569106202,0.815303666474773,
+        0.815293056666202,0.815010128437627,0.81475549303191,0.81452915044905,
+        0.814331100689048,0.814161343751903,0.814019879637616,0.813906708346186,
+        0.813821829877614,0.813765244231899,0.813736951409042,0.81372634160047,
+        0.813443413371895,0.813188777966178,0.812962435383319,0.812764385623316,
+        0.812594628686172,0.812453164571884,0.812339993280455,0.812255114811882,
+        0.812198529166167,0.81217023634331,0.81217023634331,0.811887308114735,
+        0.811632672709018,0.811406330126158,0.811208280366156,0.811038523429012,
+        0.810897059314724,0.810783888023294,0.810699009554722,0.810642423909007,
+        0.810603521277578,0.810592911469007,0.810309983240432,0.810055347834715,
+        0.809829005251855,0.809630955491853,0.809461198554708,0.809319734440421,
+        0.809206563148991,0.809121684680419,0.809065099034704,0.809036806211846,
+        0.809026196403275,0.8087432681747,0.808488632768983,0.808262290186123,
+        0.808064240426121,0.807894483488977,0.807753019374689,0.80763984808326,
+        0.807554969614687,0.807498383968972,0.807470091146115,0.807470091146115,
+        0.80718716291754,0.806932527511823,0.806706184928963,0.806508135168961,
+        0.806338378231816,0.806196914117529,0.806083742826099,0.805998864357527,
+        0.805942278711812,0.805913985888955,0.805903376080383,0.805620447851809,
+        0.805365812446091,0.805139469863232,0.80494142010323,0.804771663166085,
+        0.804630199051797,0.804517027760368,0.804432149291795,0.80437556364608,
+        0.804347270823223,0.804347270823223,0.804064342594648,0.803809707188931,
+        0.803583364606072,0.803385314846069,0.803215557908925,0.803074093794637,
+        0.802960922503207,0.802876044034635,0.80281945838892,0.802791165566063,
+        0.802791165566063,0.80219230081558,0.801593436065097,0.801069429408425,
+        0.800620280845562,0.800245990376511,0.799946558001269,0.799721983719838,
+        0.799572267532217,0.799497409438407,0.799497409438407,0.798898544687924,
+        0.798374538031252,0.79792538946839,0.797551098999338,0.797251666624096,
+        0.797027092342665,0.796877376155045,0.796802518061234,0.796802518061234,
+        0.796278511404562,0.7958293628417,0.795455072372648,0.795155639997406,
+        0.794931065715975,0.794781349528355,0.794706491434544,0.794706491434544,
+        0.794257342871682,0.79388305240263,0.793583620027389,0.793359045745958,
+        0.793209329558337,0.793134471464527,0.793134471464527,0.792760180995475,
+        0.792460748620234,0.792236174338803,0.792086458151182,0.792011600057372,
+        0.792011600057372,0.79171216768213,0.791487593400699,0.791337877213078,
+        0.791263019119268,0.791263019119268,0.791038444837837,0.790888728650216,
+        0.790813870556406,0.790813870556406,0.790664154368785,0.790589296274975,
+        0.790589296274975,0.790514438181164,0.790514438181164,0.790514438181164,
+        0.789915573430682,0.789391566774009,0.788942418211147,0.788568127742095,
+        0.788268695366854,0.788044121085423,0.787894404897802,0.787819546803992,
+        0.787819546803992,0.787295540147319,0.786846391584457,0.786472101115405,
+        0.786172668740164,0.785948094458733,0.785798378271112,0.785723520177302,
+        0.785723520177302,0.78527437161444,0.784900081145388,0.784600648770146,
+        0.784376074488715,0.784226358301095,0.784151500207284,0.784151500207284,
+        0.783777209738232,0.783477777362991,0.78325320308156,0.783103486893939,
+        0.783028628800129,0.783028628800129,0.782729196424887,0.782504622143456,
+        0.782354905955836,0.782280047862025,0.782280047862025,0.782055473580594,
+        0.781905757392974,0.781830899299163,0.781830899299163,0.781681183111542,
+        0.781606325017732,0.781606325017732,0.781531466923922,0.781531466923922,
+        0.781531466923922,0.781007460267249,0.780558311704387,0.780184021235335,
+        0.779884588860094,0.779660014578663,0.779510298391042,0.779435440297232,
+        0.779435440297232,0.77898629173437,0.778612001265318,0.778312568890076,
+        0.778087994608645,0.777938278421025,0.777863420327214,0.777863420327214,
+        0.777489129858163,0.777189697482921,0.77696512320149,0.776815407013869,
+        0.776740548920059,0.776740548920059,0.776441116544818,0.776216542263387,
+        0.776066826075766,0.775991967981955,0.775991967981955,0.775767393700524,
+        0.775617677512904,0.775542819419093,0.775542819419093,0.775393103231473,
+        0.775318245137662,0.775318245137662,0.775243387043852,0.775243387043852,
+        0.775243387043852,0.77479423848099,0.774419948011938,0.774120515636697,
+        0.773895941355266,0.773746225167645,0.773671367073834,0.773671367073834,
+        0.773297076604783,0.772997644229541,0.77277306994811,0.77262335376049,
+        0.772548495666679,0.772548495666679,0.772249063291438,0.772024489010007,
+        0.771874772822386,0.771799914728576,0.771799914728576,0.771575340447144,
+        0.771425624259524,0.771350766165713,0.771350766165713,0.771201049978093,
+        0.771126191884282,0.771126191884282,0.771051333790472,0.771051333790472,
+        0.771051333790472,0.77067704332142,0.770377610946179,0.770153036664748,
+        0.770003320477127,0.769928462383317,0.769928462383317,0.769629030008075,
+        0.769404455726644,0.769254739539023,0.769179881445213,0.769179881445213,
+        0.768955307163782,0.768805590976161,0.768730732882351,0.768730732882351,
+        0.76858101669473,0.76850615860092,0.76850615860092,0.76843130050711,
+        0.76843130050711,0.76843130050711,0.768131868131868,0.767907293850437,
+        0.767757577662816,0.767682719569006,0.767682719569006,0.767458145287575,
+        0.767308429099954,0.767233571006144,0.767233571006144,0.767083854818523,
+        0.767008996724713,0.767008996724713,0.766934138630902,0.766934138630902,
+        0.766934138630902,0.766709564349471,0.766559848161851,0.76648499006804,
+        0.76648499006804,0.76633527388042,0.766260415786609,0.766260415786609,
+        0.766185557692799,0.766185557692799,0.766185557692799,0.766035841505178,
+        0.765960983411368,0.765960983411368,0.765886125317558,0.765886125317558,
+        0.765886125317558,0.765886125317558,0.765886125317558,0.765886125317558,
+        0.765886125317558,0.765287260567075,0.764688395816592,0.764164389159919,
+        0.763715240597057,0.763340950128005,0.763041517752764,0.762816943471333,
+        0.762667227283712,0.762592369189902,0.762592369189902,0.761993504439419,
+        0.761469497782747,0.761020349219884,0.760646058750833,0.760346626375591,
+        0.76012205209416,0.759972335906539,0.759897477812729,0.759897477812729,
+        0.759373471156057,0.758924322593194,0.758550032124143,0.758250599748901,
+        0.75802602546747,0.757876309279849,0.757801451186039,0.757801451186039,
+        0.757352302623177,0.756978012154125,0.756678579778884,0.756454005497453,
+        0.756304289309832,0.756229431216022,0.756229431216022,0.75585514074697,
+        0.755555708371728,0.755331134090297,0.755181417902677,0.755106559808866,
+        0.755106559808866,0.754807127433625,0.754582553152194,0.754432836964573,
+        0.754357978870763,0.754357978870763,0.754133404589332,0.753983688401711,
+        0.753908830307901,0.753908830307901,0.75375911412028,0.753684256026469,
+        0.753684256026469,0.753609397932659,0.753609397932659,0.753609397932659,
+        0.753085391275987,0.752561384619314,0.752112236056452,0.7517379455874,
+        0.751438513212159,0.751213938930728,0.751064222743107,0.750989364649297,
+        0.750989364649297,0.750465357992624,0.750016209429762,0.74964191896071,
+        0.749342486585469,0.749117912304038,0.748968196116417,0.748893338022607,
+        0.748893338022607,0.748444189459745,0.748069898990693,0.747770466615451,
+        0.74754589233402,0.7473961761464,0.747321318052589,0.747321318052589,
+        0.746947027583537,0.746647595208296,0.746423020926865,0.746273304739244,
+        0.746198446645434,0.746198446645434,0.745899014270193,0.745674439988761,
+        0.745524723801141,0.74544986570733,0.74544986570733,0.745225291425899,
+        0.745075575238279,0.745000717144468,0.745000717144468,0.744851000956848,
+        0.744776142863037,0.744776142863037,0.744701284769227,0.744701284769227,
+        0.744701284769227,0.744177278112554,0.743728129549692,0.74335383908064,
+        0.743054406705399,0.742829832423968,0.742680116236347,0.742605258142537,
+        0.742605258142537,0.742156109579675,0.741781819110623,0.741482386735382,
+        0.741257812453951,0.74110809626633,0.741033238172519,0.741033238172519,
+        0.740658947703468,0.740359515328226,0.740134941046795,0.739985224859174,
+        0.739910366765364,0.739910366765364,0.739610934390123,0.739386360108692,
+        0.739236643921071,0.739161785827261,0.739161785827261,0.738937211545829,
+        0.738787495358209,0.738712637264398,0.738712637264398,0.738562921076778,
+        0.738488062982967,0.738488062982967,0.738413204889157,0.738413204889157,
+        0.738413204889157,0.737964056326295,0.737589765857243,0.737290333482002,
+        0.737065759200571,0.73691604301295,0.73684118491914,0.73684118491914,
+        0.736466894450088,0.736167462074846,0.735942887793415,0.735793171605794,
+        0.735718313511984,0.735718313511984,0.735418881136743,0.735194306855312,
+        0.735044590667691,0.734969732573881,0.734969732573881,0.73474515829245,
+        0.734595442104829,0.734520584011018,0.734520584011018,0.734370867823398,
+        0.734296009729587,0.734296009729587,0.734221151635777,0.734221151635777,
+        0.734221151635777,0.733846861166725,0.733547428791484,0.733322854510053,
+        0.733173138322432,0.733098280228622,0.733098280228622,0.73279884785338,
+        0.732574273571949,0.732424557384329,0.732349699290518,0.732349699290518,
+        0.732125125009087,0.731975408821466,0.731900550727656,0.731900550727656,
+        0.731750834540035,0.731675976446225,0.731675976446225,0.731601118352415,
+        0.731601118352415,0.731601118352415,0.731301685977173,0.731077111695742,
+        0.730927395508121,0.730852537414311,0.730852537414311,0.73062796313288,
+        0.730478246945259,0.730403388851449,0.730403388851449,0.730253672663828,
+        0.730178814570018,0.730178814570018,0.730103956476208,0.730103956476208,
+        0.730103956476208,0.729879382194776,0.729729666007156,0.729654807913345,
+        0.729654807913345,0.729505091725725,0.729430233631914,0.729430233631914,
+        0.729355375538104,0.729355375538104,0.729355375538104,0.729205659350483,
+        0.729130801256673,0.729130801256673,0.729055943162862,0.729055943162862,
+        0.729055943162862,0.728981085069052,0.728981085069052,0.728981085069052,
+        0.728981085069052,0.728382220318569,0.727783355568086,0.727259348911414,
+        0.726810200348552,0.7264359098795,0.726136477504259,0.725911903222828,
+        0.725762187035207,0.725687328941397,0.725687328941397,0.725088464190914,
+        0.724564457534241,0.724115308971379,0.723741018502327,0.723441586127086,
+        0.723217011845655,0.723067295658034,0.722992437564224,0.722992437564224,
+        0.722468430907551,0.722019282344689,0.721644991875637,0.721345559500396,
+        0.721120985218965,0.720971269031344,0.720896410937534,0.720896410937534,
+        0.720447262374672,0.72007297190562,0.719773539530378,0.719548965248947,
+        0.719399249061327,0.719324390967516,0.719324390967516,0.718950100498465,
+        0.718650668123223,0.718426093841792,0.718276377654171,0.718201519560361,
+        0.718201519560361,0.717902087185119,0.717677512903689,0.717527796716068,
+        0.717452938622257,0.717452938622257,0.717228364340826,0.717078648153206,
+        0.717003790059395,0.717003790059395,0.716854073871775,0.716779215777964,
+        0.716779215777964,0.716704357684154,0.716704357684154,0.716704357684154,
+        0.716180351027481,0.715656344370809,0.715207195807947,0.714832905338895,
+        0.714533472963654,0.714308898682222,0.714159182494602,0.714084324400791,
+        0.714084324400791,0.713560317744119,0.713111169181257,0.712736878712205,
+        0.712437446336964,0.712212872055533,0.712063155867912,0.711988297774101,
+        0.711988297774101,0.711539149211239,0.711164858742188,0.710865426366946,
+        0.710640852085515,0.710491135897894,0.710416277804084,0.710416277804084,
+        0.710041987335032,0.709742554959791,0.70951798067836,0.709368264490739,
+        0.709293406396929,0.709293406396929,0.708993974021687,0.708769399740256,
+        0.708619683552635,0.708544825458825,0.708544825458825,0.708320251177394,
+        0.708170534989773,0.708095676895963,0.708095676895963,0.707945960708342,
+        0.707871102614532,0.707871102614532,0.707796244520722,0.707796244520722,
+        0.707796244520722,0.707347095957859,0.706897947394997,0.706523656925946,
+        0.706224224550704,0.705999650269273,0.705849934081652,0.705775075987842,
+        0.705775075987842,0.70532592742498,0.704951636955928,0.704652204580687,
+        0.704427630299256,0.704277914111635,0.704203056017825,0.704203056017825,
+        0.703828765548773,0.703529333173531,0.7033047588921,0.703155042704479,
+        0.703080184610669,0.703080184610669,0.702780752235428,0.702556177953997,
+        0.702406461766376,0.702331603672566,0.702331603672566,0.702107029391135,
+        0.701957313203514,0.701882455109703,0.701882455109703,0.701732738922083,
+        0.701657880828272,0.701657880828272,0.701583022734462,0.701583022734462,
+        0.701583022734462,0.7011338741716,0.700759583702548,0.700460151327307,
+        0.700235577045876,0.700085860858255,0.700011002764445,0.700011002764445,
+        0.699636712295393,0.699337279920151,0.69911270563872,0.6989629894511,
+        0.698888131357289,0.698888131357289,0.698588698982048,0.698364124700617,
+        0.698214408512996,0.698139550419186,0.698139550419186,0.697914976137755,
+        0.697765259950134,0.697690401856324,0.697690401856324,0.697540685668703,
+        0.697465827574893,0.697465827574893,0.697390969481082,0.697390969481082,
+        0.697390969481082,0.69701667901203,0.696717246636789,0.696492672355358,
+        0.696342956167737,0.696268098073927,0.696268098073927,0.695968665698685,
+        0.695744091417254,0.695594375229634,0.695519517135823,0.695519517135823,
+        0.695294942854392,0.695145226666771,0.695070368572961,0.695070368572961,
+        0.69492065238534,0.69484579429153,0.69484579429153,0.69477093619772,
+        0.69477093619772,0.69477093619772,0.694471503822478,0.694246929541047,
+        0.694097213353426,0.694022355259616,0.694022355259616,0.693797780978185,
+        0.693648064790564,0.693573206696754,0.693573206696754,0.693423490509133,
+        0.693348632415323,0.693348632415323,0.693273774321513,0.693273774321513,
+        0.693273774321513,0.693049200040082,0.692899483852461,0.69282462575865,
+        0.69282462575865,0.69267490957103,0.692600051477219,0.692600051477219,
+        0.692525193383409,0.692525193383409,0.692525193383409,0.692375477195788,
+        0.692300619101978,0.692300619101978,0.692225761008168,0.692225761008168,
+        0.692225761008168,0.692150902914357,0.692150902914357,0.692150902914357,
+        0.692150902914357,0.691552038163874,0.690953173413392,0.690429166756719,
+        0.689980018193857,0.689605727724805,0.689306295349564,0.689081721068133,
+        0.688932004880512,0.688857146786702,0.688857146786702,0.688258282036219,
+        0.687734275379546,0.687285126816684,0.686910836347632,0.686611403972391,
+        0.68638682969096,0.686237113503339,0.686162255409529,0.686162255409529,
+        0.685638248752856,0.685189100189994,0.684814809720942,0.684515377345701,
+        0.68429080306427,0.684141086876649,0.684066228782839,0.684066228782839,
+        0.683617080219977,0.683242789750925,0.682943357375683,0.682718783094252,
+        0.682569066906632,0.682494208812821,0.682494208812821,0.68211991834377,
+        0.681820485968528,0.681595911687097,0.681446195499476,0.681371337405666,
+        0.681371337405666,0.681071905030425,0.680847330748994,0.680697614561373,
+        0.680622756467562,0.680622756467562,0.680398182186131,0.680248465998511,
+        0.6801736079047,0.6801736079047,0.68002389171708,0.679949033623269,
+        0.679949033623269,0.679874175529459,0.679874175529459,0.679874175529459,
+        0.679350168872786,0.678826162216114,0.678377013653252,0.6780027231842,
+        0.677703290808959,0.677478716527528,0.677329000339907,0.677254142246096,
+        0.677254142246096,0.676730135589424,0.676280987026562,0.67590669655751,
+        0.675607264182269,0.675382689900838,0.675232973713217,0.675158115619407,
+        0.675158115619407,0.674708967056544,0.674334676587493,0.674035244212251,
+        0.67381066993082,0.673660953743199,0.673586095649389,0.673586095649389,
+        0.673211805180337,0.672912372805096,0.672687798523665,0.672538082336044,
+        0.672463224242234,0.672463224242234,0.672163791866992,0.671939217585561,
+        0.67178950139794,0.67171464330413,0.67171464330413,0.671490069022699,
+        0.671340352835078,0.671265494741268,0.671265494741268,0.671115778553647,
+        0.671040920459837,0.671040920459837,0.670966062366027,0.670966062366027,
+        0.670966062366027,0.670516913803164,0.670067765240302,0.669693474771251,
+        0.669394042396009,0.669169468114578,0.669019751926957,0.668944893833147,
+        0.668944893833147,0.668495745270285,0.668121454801233,0.667822022425992,
+        0.667597448144561,0.66744773195694,0.667372873863129,0.667372873863129,
+        0.666998583394078,0.666699151018836,0.666474576737405,0.666324860549785,
+        0.666250002455974,0.666250002455974,0.665950570080733,0.665725995799302,
+        0.665576279611681,0.665501421517871,0.665501421517871,0.66527684723644,
+        0.665127131048819,0.665052272955009,0.665052272955009,0.664902556767388,
+        0.664827698673577,0.664827698673577,0.664752840579767,0.664752840579767,
+        0.664752840579767,0.664378550110715,0.664004259641664,0.663704827266422,
+        0.663480252984991,0.66333053679737,0.66325567870356,0.66325567870356,
+        0.662881388234508,0.662581955859267,0.662357381577836,0.662207665390215,
+        0.662132807296405,0.662132807296405,0.661833374921163,0.661608800639732,
+        0.661459084452111,0.661384226358301,0.661384226358301,0.66115965207687,
+        0.661009935889249,0.660935077795439,0.660935077795439,0.660785361607818,
+        0.660710503514008,0.660710503514008,0.660635645420198,0.660635645420198,
+        0.660635645420198,0.660261354951146,0.659961922575904,0.659737348294473,
+        0.659587632106853,0.659512774013042,0.659512774013042,0.659213341637801,
+        0.65898876735637,0.658839051168749,0.658764193074939,0.658764193074939,
+        0.658539618793508,0.658389902605887,0.658315044512077,0.658315044512077,
+        0.658165328324456,0.658090470230645,0.658090470230645,0.658015612136835,
+        0.658015612136835,0.658015612136835,0.657716179761594,0.657491605480163,
+        0.657341889292542,0.657267031198732,0.657267031198732,0.6570424569173,
+        0.65689274072968,0.656817882635869,0.656817882635869,0.656668166448249,
+        0.656593308354438,0.656593308354438,0.656518450260628,0.656518450260628,
+        0.656518450260628,0.656293875979197,0.656144159791576,0.656069301697766,
+        0.656069301697766,0.655919585510145,0.655844727416335,0.655844727416335,
+        0.655769869322524,0.655769869322524,0.655769869322524,0.655620153134904,
+        0.655545295041093,0.655545295041093,0.655470436947283,0.655470436947283,
+        0.655470436947283,0.655395578853473,0.655395578853473,0.655395578853473,
+        0.655395578853473,0.65479671410299,0.654197849352507,0.653673842695835,
+        0.653224694132972,0.652850403663921,0.652550971288679,0.652326397007248,
+        0.652176680819627,0.652101822725817,0.652101822725817,0.651502957975334,
+        0.650978951318662,0.6505298027558,0.650155512286748,0.649856079911506,
+        0.649631505630075,0.649481789442455,0.649406931348644,0.649406931348644,
+        0.648882924691972,0.64843377612911,0.648059485660058,0.647760053284816,
+        0.647535479003385,0.647385762815765,0.647310904721954,0.647310904721954,
+        0.646861756159092,0.64648746569004,0.646188033314799,0.645963459033368,
+        0.645813742845747,0.645738884751937,0.645738884751937,0.645364594282885,
+        0.645065161907644,0.644840587626213,0.644690871438592,0.644616013344781,
+        0.644616013344781,0.64431658096954,0.644092006688109,0.643942290500488,
+        0.643867432406678,0.643867432406678,0.643642858125247,0.643493141937626,
+        0.643418283843816,0.643418283843816,0.643268567656195,0.643193709562385,
+        0.643193709562385,0.643118851468574,0.643118851468574,0.643118851468574,
+        0.642594844811902,0.642070838155229,0.641621689592367,0.641247399123315,
+        0.640947966748074,0.640723392466643,0.640573676279022,0.640498818185212,
+        0.640498818185212,0.639974811528539,0.639525662965677,0.639151372496625,
+        0.638851940121384,0.638627365839953,0.638477649652332,0.638402791558522,
+        0.638402791558522,0.63795364299566,0.637579352526608,0.637279920151367,
+        0.637055345869936,0.636905629682315,0.636830771588504,0.636830771588504,
+        0.636456481119453,0.636157048744211,0.63593247446278,0.63578275827516,
+        0.635707900181349,0.635707900181349,0.635408467806108,0.635183893524677,
+        0.635034177337056,0.634959319243246,0.634959319243246,0.634734744961814,
+        0.634585028774194,0.634510170680383,0.634510170680383,0.634360454492763,
+        0.634285596398952,0.634285596398952,0.634210738305142,0.634210738305142,
+        0.634210738305142,0.63376158974228,0.633312441179418,0.632938150710366,
+        0.632638718335125,0.632414144053693,0.632264427866073,0.632189569772262,
+        0.632189569772262,0.6317404212094,0.631366130740349,0.631066698365107,
+        0.630842124083676,0.630692407896055,0.630617549802245,0.630617549802245,
+        0.630243259333193,0.629943826957952,0.629719252676521,0.6295695364889,
+        0.62949467839509,0.62949467839509,0.629195246019848,0.628970671738417,
+        0.628820955550796,0.628746097456986,0.628746097456986,0.628521523175555,
+        0.628371806987934,0.628296948894124,0.628296948894124,0.628147232706503,
+        0.628072374612693,0.628072374612693,0.627997516518882,0.627997516518882,
+        0.627997516518882,0.627623226049831,0.627248935580779,0.626949503205538,
+        0.626724928924106,0.626575212736486,0.626500354642675,0.626500354642675,
+        0.626126064173624,0.625826631798382,0.625602057516951,0.62545234132933,
+        0.62537748323552,0.62537748323552,0.625078050860279,0.624853476578848,
+        0.624703760391227,0.624628902297417,0.624628902297417,0.624404328015985,
+        0.624254611828365,0.624179753734554,0.624179753734554,0.624030037546934,
+        0.623955179453123,0.623955179453123,0.623880321359313,0.623880321359313,
+        0.623880321359313,0.623580888984071,0.62328145660883,0.623056882327399,
+        0.622907166139778,0.622832308045968,0.622832308045968,0.622532875670727,
+        0.622308301389295,0.622158585201675,0.622083727107864,0.622083727107864,
+        0.621859152826433,0.621709436638813,0.621634578545002,0.621634578545002,
+        0.621484862357382,0.621410004263571,0.621410004263571,0.621335146169761,
+        0.621335146169761,0.621335146169761,0.621035713794519,0.620811139513088,
+        0.620661423325468,0.620586565231657,0.620586565231657,0.620361990950226,
+        0.620212274762606,0.620137416668795,0.620137416668795,0.619987700481174,
+        0.619912842387364,0.619912842387364,0.619837984293554,0.619837984293554,
+        0.619837984293554,0.619613410012123,0.619463693824502,0.619388835730692,
+        0.619388835730692,0.619239119543071,0.619164261449261,0.619164261449261,
+        0.61908940335545,0.61908940335545,0.61908940335545,0.618939687167829,
+        0.618864829074019,0.618864829074019,0.618789970980209,0.618789970980209,
+        0.618789970980209,0.618715112886398,0.618715112886398,0.618715112886398,
+        0.618715112886398,0.618041390042105,0.617442525291622,0.61691851863495,
+        0.616469370072088,0.616095079603036,0.615795647227795,0.615571072946363,
+        0.615421356758743,0.615346498664932,0.615346498664932,0.61474763391445,
+        0.614223627257777,0.613774478694915,0.613400188225863,0.613100755850622,
+        0.612876181569191,0.61272646538157,0.61265160728776,0.61265160728776,
+        0.612127600631087,0.611678452068225,0.611304161599173,0.611004729223932,
+        0.610780154942501,0.61063043875488,0.61055558066107,0.61055558066107,
+        0.610106432098208,0.609732141629156,0.609432709253914,0.609208134972483,
+        0.609058418784863,0.608983560691052,0.608983560691052,0.608609270222,
+        0.608309837846759,0.608085263565328,0.607935547377707,0.607860689283897,
+        0.607860689283897,0.607561256908655,0.607336682627224,0.607186966439604,
+        0.607112108345793,0.607112108345793,0.606887534064362,0.606737817876742,
+        0.606662959782931,0.606662959782931,0.60651324359531,0.6064383855015,
+        0.6064383855015,0.60636352740769,0.60636352740769,0.60636352740769,
+        0.605839520751017,0.605315514094345,0.604866365531483,0.604492075062431,
+        0.604192642687189,0.603968068405758,0.603818352218138,0.603743494124327,
+        0.603743494124327,0.603219487467655,0.602770338904793,0.602396048435741,
+        0.602096616060499,0.601872041779068,0.601722325591448,0.601647467497637,
+        0.601647467497637,0.601198318934775,0.600824028465723,0.600524596090482,
+        0.600300021809051,0.60015030562143,0.60007544752762,0.60007544752762,
+        0.599701157058568,0.599401724683327,0.599177150401896,0.599027434214275,
+        0.598952576120465,0.598952576120465,0.598653143745223,0.598428569463792,
+        0.598278853276171,0.598203995182361,0.598203995182361,0.59797942090093,
+        0.597829704713309,0.597754846619499,0.597754846619499,0.597605130431878,
+        0.597530272338068,0.597530272338068,0.597455414244257,0.597455414244257,
+        0.597455414244257,0.597006265681395,0.596557117118533,0.596182826649481,
+        0.59588339427424,0.595658819992809,0.595509103805188,0.595434245711378,
+        0.595434245711378,0.594985097148516,0.594610806679464,0.594311374304223,
+        0.594086800022791,0.593937083835171,0.59386222574136,0.59386222574136,
+        0.593487935272309,0.593188502897067,0.592963928615636,0.592814212428015,
+        0.592739354334205,0.592739354334205,0.592439921958964,0.592215347677533,
+        0.592065631489912,0.591990773396102,0.591990773396102,0.59176619911467,
+        0.59161648292705,0.591541624833239,0.591541624833239,0.591391908645619,
+        0.591317050551808,0.591317050551808,0.591242192457998,0.591242192457998,
+        0.591242192457998,0.590867901988946,0.590493611519894,0.590194179144653,
+        0.589969604863222,0.589819888675601,0.589745030581791,0.589745030581791,
+        0.589370740112739,0.589071307737498,0.588846733456067,0.588697017268446,
+        0.588622159174635,0.588622159174635,0.588322726799394,0.588098152517963,
+        0.587948436330342,0.587873578236532,0.587873578236532,0.587649003955101,
+        0.58749928776748,0.58742442967367,0.58742442967367,0.587274713486049,
+        0.587199855392239,0.587199855392239,0.587124997298428,0.587124997298428,
+        0.587124997298428,0.586825564923187,0.586526132547946,0.586301558266514,
+        0.586151842078894,0.586076983985083,0.586076983985083,0.585777551609842,
+        0.585552977328411,0.58540326114079,0.58532840304698,0.58532840304698,
+        0.585103828765549,0.584954112577928,0.584879254484118,0.584879254484118,
+        0.584729538296497,0.584654680202687,0.584654680202687,0.584579822108876,
+        0.584579822108876,0.584579822108876,0.584355247827445,0.584130673546014,
+        0.583980957358393,0.583906099264583,0.583906099264583,0.583681524983152,
+        0.583531808795531,0.583456950701721,0.583456950701721,0.5833072345141,
+        0.58323237642029,0.58323237642029,0.58315751832648,0.58315751832648,
+        0.58315751832648,0.582932944045048,0.582783227857428,0.582708369763617,
+        0.582708369763617,0.582558653575997,0.582483795482186,0.582483795482186,
+        0.582408937388376,0.582408937388376,0.582408937388376,0.582259221200755,
+        0.582184363106945,0.582184363106945,0.582109505013135,0.582109505013135,
+        0.582109505013135,0.582034646919324,0.582034646919324,0.582034646919324,
+        0.582034646919324,0.581360924075031,0.580762059324548,0.580238052667876,
+        0.579788904105013,0.579414613635962,0.57911518126072,0.578890606979289,
+        0.578740890791669,0.578666032697858,0.578666032697858,0.578067167947375,
+        0.577543161290703,0.577094012727841,0.576719722258789,0.576420289883548,
+        0.576195715602116,0.576045999414496,0.575971141320685,0.575971141320685,
+        0.575447134664013,0.574997986101151,0.574623695632099,0.574324263256858,
+        0.574099688975427,0.573949972787806,0.573875114693995,0.573875114693995,
+        0.573425966131133,0.573051675662081,0.57275224328684,0.572527669005409,
+        0.572377952817788,0.572303094723978,0.572303094723978,0.571928804254926,
+        0.571629371879685,0.571404797598254,0.571255081410633,0.571180223316823,
+        0.571180223316823,0.570880790941581,0.57065621666015,0.570506500472529,
+        0.570431642378719,0.570431642378719,0.570207068097288,0.570057351909667,
+        0.569982493815857,0.569982493815857,0.569832777628236,0.569757919534426,
+        0.569757919534426,0.569683061440616,0.569683061440616,0.569683061440616,
+        0.569084196690133,0.56856019003346,0.568111041470598,0.567736751001546,
+        0.567437318626305,0.567212744344874,0.567063028157253,0.566988170063443,
+        0.566988170063443,0.56646416340677,0.566015014843908,0.565640724374856,
+        0.565341291999615,0.565116717718184,0.564967001530563,0.564892143436753,
+        0.564892143436753,0.564442994873891,0.564068704404839,0.563769272029597,
+        0.563544697748166,0.563394981560546,0.563320123466735,0.563320123466735,
+        0.562945832997684,0.562646400622442,0.562421826341011,0.56227211015339,
+        0.56219725205958,0.56219725205958,0.561897819684338,0.561673245402908,
+        0.561523529215287,0.561448671121476,0.561448671121476,0.561224096840045,
+        0.561074380652425,0.560999522558614,0.560999522558614,0.560849806370994,
+        0.560774948277183,0.560774948277183,0.560700090183373,0.560700090183373,
+        0.560700090183373,0.560250941620511,0.559801793057649,0.559427502588597,
+        0.559128070213355,0.558903495931924,0.558753779744304,0.558678921650493,
+        0.558678921650493,0.558229773087631,0.557855482618579,0.557556050243338,
+        0.557331475961907,0.557181759774286,0.557106901680476,0.557106901680476,
+        0.556732611211424,0.556433178836183,0.556208604554752,0.556058888367131,
+        0.55598403027332,0.55598403027332,0.555684597898079,0.555460023616648,
+        0.555310307429027,0.555235449335217,0.555235449335217,0.555010875053786,
+        0.554861158866165,0.554786300772355,0.554786300772355,0.554636584584734,
+        0.554561726490924,0.554561726490924,0.554486868397113,0.554486868397113,
+        0.554486868397113,0.554112577928062,0.55373828745901,0.553438855083768,
+        0.553214280802337,0.553064564614717,0.552989706520906,0.552989706520906,
+        0.552615416051854,0.552315983676613,0.552091409395182,0.551941693207561,
+        0.551866835113751,0.551866835113751,0.551567402738509,0.551342828457078,
+        0.551193112269458,0.551118254175647,0.551118254175647,0.550893679894216,
+        0.550743963706596,0.550669105612785,0.550669105612785,0.550519389425165,
+        0.550444531331354,0.550444531331354,0.550369673237544,0.550369673237544,
+        0.550369673237544,0.550070240862302,0.549770808487061,0.54954623420563,
+        0.549396518018009,0.549321659924199,0.549321659924199,0.549022227548957,
+        0.548797653267526,0.548647937079906,0.548573078986095,0.548573078986095,
+        0.548348504704664,0.548198788517044,0.548123930423233,0.548123930423233,
+        0.547974214235612,0.547899356141802,0.547899356141802,0.547824498047992,
+        0.547824498047992,0.547824498047992,0.547599923766561,0.54737534948513,
+        0.547225633297509,0.547150775203698,0.547150775203698,0.546926200922267,
+        0.546776484734647,0.546701626640836,0.546701626640836,0.546551910453216,
+        0.546477052359405,0.546477052359405,0.546402194265595,0.546402194265595,
+        0.546402194265595,0.546252478077974,0.546102761890354,0.546027903796543,
+        0.546027903796543,0.545878187608922,0.545803329515112,0.545803329515112,
+        0.545728471421302,0.545728471421302,0.545728471421302,0.545578755233681,
+        0.545503897139871,0.545503897139871,0.54542903904606,0.54542903904606,
+        0.54542903904606,0.54535418095225,0.54535418095225,0.54535418095225,
+        0.54535418095225,0.544680458107957,0.544081593357474,0.543557586700801,
+        0.543108438137939,0.542734147668888,0.542434715293646,0.542210141012215,
+        0.542060424824594,0.541985566730784,0.541985566730784,0.541386701980301,
+        0.540862695323629,0.540413546760766,0.540039256291715,0.539739823916473,
+        0.539515249635042,0.539365533447422,0.539290675353611,0.539290675353611,
+        0.538766668696939,0.538317520134077,0.537943229665025,0.537643797289783,
+        0.537419223008352,0.537269506820732,0.537194648726921,0.537194648726921,
+        0.536745500164059,0.536371209695007,0.536071777319766,0.535847203038335,
+        0.535697486850714,0.535622628756904,0.535622628756904,0.535248338287852,
+        0.534948905912611,0.534724331631179,0.534574615443559,0.534499757349748,
+        0.534499757349748,0.534200324974507,0.533975750693076,0.533826034505455,
+        0.533751176411645,0.533751176411645,0.533526602130214,0.533376885942593,
+        0.533302027848783,0.533302027848783,0.533152311661162,0.533077453567352,
+        0.533077453567352,0.533002595473541,0.533002595473541,0.533002595473541,
+        0.532403730723058,0.531879724066386,0.531430575503524,0.531056285034472,
+        0.530756852659231,0.5305322783778,0.530382562190179,0.530307704096369,
+        0.530307704096369,0.529783697439696,0.529334548876834,0.528960258407782,
+        0.528660826032541,0.52843625175111,0.528286535563489,0.528211677469679,
+        0.528211677469679,0.527762528906816,0.527388238437765,0.527088806062523,
+        0.526864231781092,0.526714515593471,0.526639657499661,0.526639657499661,
+        0.526265367030609,0.525965934655368,0.525741360373937,0.525591644186316,
+        0.525516786092506,0.525516786092506,0.525217353717264,0.524992779435833,
+        0.524843063248213,0.524768205154402,0.524768205154402,0.524543630872971,
+        0.52439391468535,0.52431905659154,0.52431905659154,0.524169340403919,
+        0.524094482310109,0.524094482310109,0.524019624216299,0.524019624216299,
+        0.524019624216299,0.523495617559626,0.523046468996764,0.522672178527712,
+        0.522372746152471,0.52214817187104,0.521998455683419,0.521923597589609,
+        0.521923597589609,0.521474449026747,0.521100158557695,0.520800726182453,
+        0.520576151901022,0.520426435713402,0.520351577619591,0.520351577619591,
+        0.519977287150539,0.519677854775298,0.519453280493867,0.519303564306246,
+        0.519228706212436,0.519228706212436,0.518929273837194,0.518704699555763,
+        0.518554983368143,0.518480125274332,0.518480125274332,0.518255550992901,
+        0.51810583480528,0.51803097671147,0.51803097671147,0.51788126052385,
+        0.517806402430039,0.517806402430039,0.517731544336229,0.517731544336229,
+        0.517731544336229,0.517357253867177,0.516982963398125,0.516683531022884,
+        0.516458956741453,0.516309240553832,0.516234382460022,0.516234382460022,
+        0.51586009199097,0.515560659615729,0.515336085334297,0.515186369146677,
+        0.515111511052866,0.515111511052866,0.514812078677625,0.514587504396194,
+        0.514437788208573,0.514362930114763,0.514362930114763,0.514138355833332,
+        0.513988639645711,0.513913781551901,0.513913781551901,0.51376406536428,
+        0.51368920727047,0.51368920727047,0.513614349176659,0.513614349176659,
+        0.513614349176659,0.513314916801418,0.513015484426176,0.512790910144745,
+        0.512641193957125,0.512566335863314,0.512566335863314,0.512266903488073,
+        0.512042329206642,0.511892613019021,0.511817754925211,0.511817754925211,
+        0.51159318064378,0.511443464456159,0.511368606362348,0.511368606362348,
+        0.511218890174728,0.511144032080918,0.511144032080918,0.511069173987107,
+        0.511069173987107,0.511069173987107,0.510844599705676,0.510620025424245,
+        0.510470309236624,0.510395451142814,0.510395451142814,0.510170876861383,
+        0.510021160673762,0.509946302579952,0.509946302579952,0.509796586392331,
+        0.509721728298521,0.509721728298521,0.50964687020471,0.50964687020471,
+        0.50964687020471,0.50949715401709,0.509347437829469,0.509272579735659,
+        0.509272579735659,0.509122863548038,0.509048005454228,0.509048005454228,
+        0.508973147360417,0.508973147360417,0.508973147360417,0.508898289266607,
+        0.508823431172796,0.508823431172796,0.508748573078986,0.508748573078986,
+        0.508748573078986,0.508673714985176,0.508673714985176,0.508673714985176,
+        0.508673714985176,0.507999992140883,0.5074011273904,0.506877120733727,
+        0.506427972170865,0.506053681701813,0.505754249326572,0.505529675045141,
+        0.50537995885752,0.50530510076371,0.50530510076371,0.504706236013227,
+        0.504182229356554,0.503733080793692,0.50335879032464,0.503059357949399,
+        0.502834783667968,0.502685067480347,0.502610209386537,0.502610209386537,
+        0.502086202729864,0.501637054167002,0.501262763697951,0.500963331322709,
+        0.500738757041278,0.500589040853657,0.500514182759847,0.500514182759847,
+        0.500065034196985,0.499690743727933,0.499391311352692,0.499166737071261,
+        0.49901702088364,0.49894216278983,0.49894216278983,0.498567872320778,
+        0.498268439945536,0.498043865664105,0.497894149476485,0.497819291382674,
+        0.497819291382674,0.497519859007433,0.497295284726002,0.497145568538381,
+        0.497070710444571,0.497070710444571,0.49684613616314,0.496696419975519,
+        0.496621561881708,0.496621561881708,0.496471845694088,0.496396987600277,
+        0.496396987600277,0.496322129506467,0.496322129506467,0.496322129506467,
+        0.495723264755984,0.495199258099312,0.49475010953645,0.494375819067398,
+        0.494076386692156,0.493851812410725,0.493702096223105,0.493627238129294,
+        0.493627238129294,0.493103231472622,0.49265408290976,0.492279792440708,
+        0.491980360065466,0.491755785784035,0.491606069596415,0.491531211502604,
+        0.491531211502604,0.491082062939742,0.49070777247069,0.490408340095449,
+        0.490183765814018,0.490034049626397,0.489959191532587,0.489959191532587,
+        0.489584901063535,0.489285468688294,0.489060894406863,0.488911178219242,
+        0.488836320125431,0.488836320125431,0.48853688775019,0.488312313468759,
+        0.488162597281138,0.488087739187328,0.488087739187328,0.487863164905897,
+        0.487713448718276,0.487638590624466,0.487638590624466,0.487488874436845,
+        0.487414016343035,0.487414016343035,0.487339158249224,0.487339158249224,
+        0.487339158249224,0.486815151592552,0.48636600302969,0.485991712560638,
+        0.485692280185397,0.485467705903966,0.485317989716345,0.485243131622534,
+        0.485243131622534,0.484793983059672,0.484419692590621,0.484120260215379,
+        0.483895685933948,0.483745969746327,0.483671111652517,0.483671111652517,
+        0.483296821183465,0.482997388808224,0.482772814526793,0.482623098339172,
+        0.482548240245362,0.482548240245362,0.48224880787012,0.482024233588689,
+        0.481874517401068,0.481799659307258,0.481799659307258,0.481575085025827,
+        0.481425368838206,0.481350510744396,0.481350510744396,0.481200794556775,
+        0.481125936462965,0.481125936462965,0.481051078369155,0.481051078369155,
+        0.481051078369155,0.480601929806292,0.480227639337241,0.479928206961999,
+        0.479703632680568,0.479553916492947,0.479479058399137,0.479479058399137,
+        0.479104767930085,0.478805335554844,0.478580761273413,0.478431045085792,
+        0.478356186991982,0.478356186991982,0.47805675461674,0.477832180335309,
+        0.477682464147689,0.477607606053878,0.477607606053878,0.477383031772447,
+        0.477233315584826,0.477158457491016,0.477158457491016,0.477008741303395,
+        0.476933883209585,0.476933883209585,0.476859025115775,0.476859025115775,
+        0.476859025115775,0.476559592740533,0.476260160365292,0.476035586083861,
+        0.47588586989624,0.47581101180243,0.47581101180243,0.475511579427188,
+        0.475287005145757,0.475137288958136,0.475062430864326,0.475062430864326,
+        0.474837856582895,0.474688140395274,0.474613282301464,0.474613282301464,
+        0.474463566113843,0.474388708020033,0.474388708020033,0.474313849926223,
+        0.474313849926223,0.474313849926223,0.474089275644791,0.47386470136336,
+        0.47371498517574,0.473640127081929,0.473640127081929,0.473415552800498,
+        0.473265836612878,0.473190978519067,0.473190978519067,0.473041262331446,
+        0.472966404237636,0.472966404237636,0.472891546143826,0.472891546143826,
+        0.472891546143826,0.472741829956205,0.472592113768584,0.472517255674774,
+        0.472517255674774,0.472367539487153,0.472292681393343,0.472292681393343,
+        0.472217823299533,0.472217823299533,0.472217823299533,0.472142965205722,
+        0.472068107111912,0.472068107111912,0.471993249018102,0.471993249018102,
+        0.471993249018102,0.471993249018102,0.471993249018102,0.471993249018102,
+        0.471993249018102,0.471319526173808,0.470720661423325,0.470196654766653,
+        0.469747506203791,0.469373215734739,0.469073783359498,0.468849209078067,
+        0.468699492890446,0.468624634796636,0.468624634796636,0.468025770046153,
+        0.46750176338948,0.467052614826618,0.466678324357566,0.466378891982325,
+        0.466154317700894,0.466004601513273,0.465929743419463,0.465929743419463,
+        0.46540573676279,0.464956588199928,0.464582297730876,0.464282865355635,
+        0.464058291074204,0.463908574886583,0.463833716792773,0.463833716792773,
+        0.463384568229911,0.463010277760859,0.462710845385617,0.462486271104186,
+        0.462336554916566,0.462261696822755,0.462261696822755,0.461887406353704,
+        0.461587973978462,0.461363399697031,0.46121368350941,0.4611388254156,
+        0.4611388254156,0.460839393040359,0.460614818758927,0.460465102571307,
+        0.460390244477496,0.460390244477496,0.460165670196065,0.460015954008445,
+        0.459941095914634,0.459941095914634,0.459791379727014,0.459716521633203,
+        0.459716521633203,0.459716521633203,0.459716521633203,0.459716521633203,
+        0.45911765688272,0.458593650226048,0.458144501663186,0.457770211194134,
+        0.457470778818893,0.457246204537461,0.457096488349841,0.45702163025603,
+        0.45702163025603,0.456497623599358,0.456048475036496,0.455674184567444,
+        0.455374752192203,0.455150177910772,0.455000461723151,0.45492560362934,
+        0.45492560362934,0.454476455066478,0.454102164597427,0.453802732222185,
+        0.453578157940754,0.453428441753133,0.453353583659323,0.453353583659323,
+        0.452979293190271,0.45267986081503,0.452455286533599,0.452305570345978,
+        0.452230712252168,0.452230712252168,0.451931279876926,0.451706705595495,
+        0.451556989407874,0.451482131314064,0.451482131314064,0.451257557032633,
+        0.451107840845012,0.451032982751202,0.451032982751202,0.450883266563581,
+        0.450808408469771,0.450808408469771,0.450733550375961,0.450733550375961,
+        0.450733550375961,0.450209543719288,0.449760395156426,0.449386104687374,
+        0.449086672312133,0.448862098030702,0.448712381843081,0.448637523749271,
+        0.448637523749271,0.448188375186408,0.447814084717357,0.447514652342115,
+        0.447290078060684,0.447140361873063,0.447065503779253,0.447065503779253,
+        0.446691213310201,0.44639178093496,0.446167206653529,0.446017490465908,
+        0.445942632372098,0.445942632372098,0.445643199996856,0.445418625715425,
+        0.445268909527805,0.445194051433994,0.445194051433994,0.444969477152563,
+        0.444819760964942,0.444744902871132,0.444744902871132,0.444595186683511,
+        0.444520328589701,0.444520328589701,0.444445470495891,0.444445470495891,
+        0.444445470495891,0.443996321933029,0.443622031463977,0.443322599088735,
+        0.443098024807304,0.442948308619684,0.442873450525873,0.442873450525873,
+        0.442499160056821,0.44219972768158,0.441975153400149,0.441825437212528,
+        0.441750579118718,0.441750579118718,0.441451146743476,0.441226572462045,
+        0.441076856274425,0.441001998180614,0.441001998180614,0.440777423899183,
+        0.440627707711563,0.440552849617752,0.440552849617752,0.440403133430131,
+        0.440328275336321,0.440328275336321,0.440253417242511,0.440253417242511,
+        0.440253417242511,0.439879126773459,0.439579694398218,0.439355120116787,
+        0.439205403929166,0.439130545835355,0.439130545835355,0.438831113460114,
+        0.438606539178683,0.438456822991062,0.438381964897252,0.438381964897252,
+        0.438157390615821,0.4380076744282,0.43793281633439,0.43793281633439,
+        0.437783100146769,0.437708242052959,0.437708242052959,0.437633383959148,
+        0.437633383959148,0.437633383959148,0.437408809677717,0.437184235396286,
+        0.437034519208665,0.436959661114855,0.436959661114855,0.436735086833424,
+        0.436585370645803,0.436510512551993,0.436510512551993,0.436360796364372,
+        0.436285938270562,0.436285938270562,0.436211080176752,0.436211080176752,
+        0.436211080176752,0.436061363989131,0.43591164780151,0.4358367897077,
+        0.4358367897077,0.435687073520079,0.435612215426269,0.435612215426269,
+        0.435537357332458,0.435537357332458,0.435537357332458,0.435462499238648,
+        0.435387641144838,0.435387641144838,0.435312783051027,0.435312783051027,
+        0.435312783051027,0.435312783051027,0.435312783051027,0.435312783051027,
+        0.435312783051027,0.434639060206734,0.434040195456251,0.433516188799579,
+        0.433067040236717,0.432692749767665,0.432393317392423,0.432168743110992,
+        0.432019026923372,0.431944168829561,0.431944168829561,0.431345304079078,
+        0.430821297422406,0.430372148859544,0.429997858390492,0.429698426015251,
+        0.42947385173382,0.429324135546199,0.429249277452389,0.429249277452389,
+        0.428725270795716,0.428276122232854,0.427901831763802,0.427602399388561,
+        0.42737782510713,0.427228108919509,0.427153250825699,0.427153250825699,
+        0.426704102262836,0.426329811793785,0.426030379418543,0.425805805137112,
+        0.425656088949491,0.425581230855681,0.425581230855681,0.425206940386629,
+        0.424907508011388,0.424682933729957,0.424533217542336,0.424458359448526,
+        0.424458359448526,0.424158927073284,0.423934352791853,0.423784636604233,
+        0.423709778510422,0.423709778510422,0.423485204228991,0.42333548804137,
+        0.42326062994756,0.42326062994756,0.423110913759939,0.423036055666129,
+        0.423036055666129,0.423036055666129,0.423036055666129,0.423036055666129,
+        0.422437190915646,0.421913184258974,0.421464035696112,0.42108974522706,
+        0.420790312851818,0.420565738570387,0.420416022382767,0.420341164288956,
+        0.420341164288956,0.419817157632284,0.419368009069422,0.41899371860037,
+        0.418694286225128,0.418469711943697,0.418319995756077,0.418245137662266,
+        0.418245137662266,0.417795989099404,0.417421698630352,0.417122266255111,
+        0.41689769197368,0.416747975786059,0.416673117692249,0.416673117692249,
+        0.416298827223197,0.415999394847956,0.415774820566524,0.415625104378904,
+        0.415550246285093,0.415550246285093,0.415250813909852,0.415026239628421,
+        0.4148765234408,0.41480166534699,0.41480166534699,0.414577091065559,
+        0.414427374877938,0.414352516784128,0.414352516784128,0.414202800596507,
+        0.414127942502697,0.414127942502697,0.414053084408886,0.414053084408886,
+        0.414053084408886,0.413529077752214,0.413079929189352,0.4127056387203,
+        0.412406206345058,0.412181632063627,0.412031915876007,0.411957057782196,
+        0.411957057782196,0.411507909219334,0.411133618750282,0.410834186375041,
+        0.41060961209361,0.410459895905989,0.410385037812179,0.410385037812179,
+        0.410010747343127,0.409711314967886,0.409486740686455,0.409337024498834,
+        0.409262166405024,0.409262166405024,0.408962734029782,0.408738159748351,
+        0.40858844356073,0.40851358546692,0.40851358546692,0.408289011185489,
+        0.408139294997868,0.408064436904058,0.408064436904058,0.407914720716437,
+        0.407839862622627,0.407839862622627,0.407765004528816,0.407765004528816,
+        0.407765004528816,0.407315855965954,0.406941565496903,0.406642133121661,
+        0.40641755884023,0.406267842652609,0.406192984558799,0.406192984558799,
+        0.405818694089747,0.405519261714506,0.405294687433075,0.405144971245454,
+        0.405070113151644,0.405070113151644,0.404770680776402,0.404546106494971,
+        0.40439639030735,0.40432153221354,0.40432153221354,0.404096957932109,
+        0.403947241744488,0.403872383650678,0.403872383650678,0.403722667463057,
+        0.403647809369247,0.403647809369247,0.403572951275437,0.403572951275437,
+        0.403572951275437,0.403198660806385,0.402899228431143,0.402674654149712,
+        0.402524937962092,0.402450079868281,0.402450079868281,0.40215064749304,
+        0.401926073211609,0.401776357023988,0.401701498930178,0.401701498930178,
+        0.401476924648747,0.401327208461126,0.401252350367315,0.401252350367315,
+        0.401102634179695,0.401027776085884,0.401027776085884,0.400952917992074,
+        0.400952917992074,0.400952917992074,0.400653485616833,0.400428911335402,
+        0.400279195147781,0.400204337053971,0.400204337053971,0.399979762772539,
+        0.399830046584919,0.399755188491108,0.399755188491108,0.399605472303488,
+        0.399530614209677,0.399530614209677,0.399455756115867,0.399455756115867,
+        0.399455756115867,0.399306039928246,0.399156323740626,0.399081465646815,
+        0.399081465646815,0.398931749459194,0.398856891365384,0.398856891365384,
+        0.398782033271574,0.398782033271574,0.398782033271574,0.398707175177763,
+        0.398632317083953,0.398632317083953,0.398557458990143,0.398557458990143,
+        0.398557458990143,0.398557458990143,0.398557458990143,0.398557458990143,
+        0.398557458990143,0.397883736145849,0.397284871395367,0.396760864738694,
+        0.396311716175832,0.39593742570678,0.395637993331539,0.395413419050108,
+        0.395263702862487,0.395188844768677,0.395188844768677,0.394589980018194,
+        0.394065973361521,0.393616824798659,0.393242534329607,0.392943101954366,
+        0.392718527672935,0.392568811485314,0.392493953391504,0.392493953391504,
+        0.391969946734831,0.391520798171969,0.391146507702917,0.390847075327676,
+        0.390622501046245,0.390472784858624,0.390397926764814,0.390397926764814,
+        0.389948778201952,0.3895744877329,0.389275055357659,0.389050481076228,
+        0.388900764888607,0.388825906794797,0.388825906794797,0.388451616325745,
+        0.388152183950503,0.387927609669072,0.387777893481451,0.387703035387641,
+        0.387703035387641,0.3874036030124,0.387179028730969,0.387029312543348,
+        0.386954454449538,0.386954454449538,0.386729880168106,0.386580163980486,
+        0.386505305886675,0.386505305886675,0.386355589699055,0.386280731605244,
+        0.386280731605244,0.386280731605244,0.386280731605244,0.386280731605244,
+        0.385681866854762,0.385157860198089,0.384708711635227,0.384334421166175,
+        0.384034988790934,0.383810414509503,0.383660698321882,0.383585840228072,
+        0.383585840228072,0.383061833571399,0.382612685008537,0.382238394539485,
+        0.381938962164244,0.381714387882813,0.381564671695192,0.381489813601382,
+        0.381489813601382,0.38104066503852,0.380666374569468,0.380366942194226,
+        0.380142367912795,0.379992651725175,0.379917793631364,0.379917793631364,
+        0.379543503162312,0.379244070787071,0.37901949650564,0.378869780318019,
+        0.378794922224209,0.378794922224209,0.378495489848967,0.378270915567536,
+        0.378121199379916,0.378046341286105,0.378046341286105,0.377821767004674,
+        0.377672050817054,0.377597192723243,0.377597192723243,0.377447476535622,
+        0.377372618441812,0.377372618441812,0.377297760348002,0.377297760348002,
+        0.377297760348002,0.376773753691329,0.376324605128467,0.375950314659415,
+        0.375650882284174,0.375426308002743,0.375276591815122,0.375201733721312,
+        0.375201733721312,0.37475258515845,0.374378294689398,0.374078862314156,
+        0.373854288032725,0.373704571845105,0.373629713751294,0.373629713751294,
+        0.373255423282243,0.372955990907001,0.37273141662557,0.372581700437949,
+        0.372506842344139,0.372506842344139,0.372207409968898,0.371982835687466,
+        0.371833119499846,0.371758261406035,0.371758261406035,0.371533687124604,
+        0.371383970936984,0.371309112843173,0.371309112843173,0.371159396655553,
+        0.371084538561742,0.371084538561742,0.371009680467932,0.371009680467932,
+        0.371009680467932,0.37056053190507,0.370186241436018,0.369886809060777,
+        0.369662234779345,0.369512518591725,0.369437660497914,0.369437660497914,
+        0.369063370028863,0.368763937653621,0.36853936337219,0.368389647184569,
+        0.368314789090759,0.368314789090759,0.368015356715518,0.367790782434087,
+        0.367641066246466,0.367566208152656,0.367566208152656,0.367341633871224,
+        0.367191917683604,0.367117059589793,0.367117059589793,0.366967343402173,
+        0.366892485308362,0.366892485308362,0.366817627214552,0.366817627214552,
+        0.366817627214552,0.3664433367455,0.366143904370259,0.365919330088828,
+        0.365769613901207,0.365694755807397,0.365694755807397,0.365395323432155,
+        0.365170749150724,0.365021032963103,0.364946174869293,0.364946174869293,
+        0.364721600587862,0.364571884400241,0.364497026306431,0.364497026306431,
+        0.36434731011881,0.364272452025,0.364272452025,0.36419759393119,
+        0.36419759393119,0.36419759393119,0.363898161555948,0.363673587274517,
+        0.363523871086896,0.363449012993086,0.363449012993086,0.363224438711655,
+        0.363074722524034,0.362999864430224,0.362999864430224,0.362850148242603,
+        0.362775290148793,0.362775290148793,0.362700432054982,0.362700432054982,
+        0.362700432054982,0.362475857773551,0.362326141585931,0.36225128349212,
+        0.36225128349212,0.3621015673045,0.362026709210689,0.362026709210689,
+        0.361951851116879,0.361951851116879,0.361951851116879,0.361876993023068,
+        0.361802134929258,0.361802134929258,0.361727276835448,0.361727276835448,
+        0.361727276835448,0.361727276835448,0.361727276835448,0.361727276835448,
+        0.361727276835448,0.361053553991155,0.360454689240672,0.359930682583999,
+        0.359481534021137,0.359107243552085,0.358807811176844,0.358583236895413,
+        0.358433520707792,0.358358662613982,0.358358662613982,0.357759797863499,
+        0.357235791206826,0.356786642643964,0.356412352174913,0.356112919799671,
+        0.35588834551824,0.355738629330619,0.355663771236809,0.355663771236809,
+        0.355139764580136,0.354690616017274,0.354316325548223,0.354016893172981,
+        0.35379231889155,0.353642602703929,0.353567744610119,0.353567744610119,
+        0.353118596047257,0.352744305578205,0.352444873202964,0.352220298921533,
+        0.352070582733912,0.351995724640102,0.351995724640102,0.35162143417105,
+        0.351322001795808,0.351097427514377,0.350947711326757,0.350872853232946,
+        0.350872853232946,0.350573420857705,0.350348846576274,0.350199130388653,
+        0.350124272294843,0.350124272294843,0.349899698013412,0.349749981825791,
+        0.349675123731981,0.349675123731981,0.34952540754436,0.349450549450549,
+        0.349450549450549,0.349450549450549,0.349450549450549,0.349450549450549,
+        0.348851684700067,0.348327678043394,0.347878529480532,0.34750423901148,
+        0.347204806636239,0.346980232354808,0.346830516167187,0.346755658073377,
+        0.346755658073377,0.346231651416704,0.345782502853842,0.34540821238479,
+        0.345108780009549,0.344884205728118,0.344734489540497,0.344659631446687,
+        0.344659631446687,0.344210482883825,0.343836192414773,0.343536760039531,
+        0.3433121857581,0.34316246957048,0.343087611476669,0.343087611476669,
+        0.342713321007617,0.342413888632376,0.342189314350945,0.342039598163324,
+        0.341964740069514,0.341964740069514,0.341665307694272,0.341440733412841,
+        0.341291017225221,0.34121615913141,0.34121615913141,0.340991584849979,
+        0.340841868662359,0.340767010568548,0.340767010568548,0.340617294380927,
+        0.340542436287117,0.340542436287117,0.340467578193307,0.340467578193307,
+        0.340467578193307,0.339943571536634,0.339494422973772,0.33912013250472,
+        0.338820700129479,0.338596125848048,0.338446409660427,0.338371551566617,
+        0.338371551566617,0.337922403003755,0.337548112534703,0.337248680159461,
+        0.33702410587803,0.33687438969041,0.336799531596599,0.336799531596599,
+        0.336425241127548,0.336125808752306,0.335901234470875,0.335751518283254,
+        0.335676660189444,0.335676660189444,0.335377227814203,0.335152653532772,
+        0.335002937345151,0.33492807925134,0.33492807925134,0.334703504969909,
+        0.334553788782289,0.334478930688478,0.334478930688478,0.334329214500858,
+        0.334254356407047,0.334254356407047,0.334179498313237,0.334179498313237,
+        0.334179498313237,0.333730349750375,0.333356059281323,0.333056626906082,
+        0.33283205262465,0.33268233643703,0.332607478343219,0.332607478343219,
+        0.332233187874168,0.331933755498926,0.331709181217495,0.331559465029874,
+        0.331484606936064,0.331484606936064,0.331185174560823,0.330960600279392,
+        0.330810884091771,0.330736025997961,0.330736025997961,0.33051145171653,
+        0.330361735528909,0.330286877435098,0.330286877435098,0.330137161247478,
+        0.330062303153667,0.330062303153667,0.329987445059857,0.329987445059857,
+        0.329987445059857,0.329613154590805,0.329313722215564,0.329089147934133,
+        0.328939431746512,0.328864573652702,0.328864573652702,0.32856514127746,
+        0.328340566996029,0.328190850808408,0.328115992714598,0.328115992714598,
+        0.327891418433167,0.327741702245546,0.327666844151736,0.327666844151736,
+        0.327517127964115,0.327442269870305,0.327442269870305,0.327367411776495,
+        0.327367411776495,0.327367411776495,0.327067979401253,0.326843405119822,
+        0.326693688932201,0.326618830838391,0.326618830838391,0.32639425655696,
+        0.326244540369339,0.326169682275529,0.326169682275529,0.326019966087908,
+        0.325945107994098,0.325945107994098,0.325870249900287,0.325870249900287,
+        0.325870249900287,0.325645675618856,0.325495959431236,0.325421101337425,
+        0.325421101337425,0.325271385149805,0.325196527055994,0.325196527055994,
+        0.325121668962184,0.325121668962184,0.325121668962184,0.324971952774563,
+        0.324897094680753,0.324897094680753,0.324822236586942,0.324822236586942,
+        0.324822236586942,0.324822236586942,0.324822236586942,0.324822236586942,
+        0.324822236586942,0.323440014303594,0.322255252346438,0.321267950715474,
+        0.320478109410704,0.319885728432126,0.31949080777974,0.319293347453548,
+        0.319293347453548,0.317911125170199,0.316726363213043,0.31573906158208,
+        0.314949220277309,0.314356839298731,0.313961918646346,0.313764458320153,
+        0.313764458320153,0.312579696362997,0.311592394732034,0.310802553427263,
+        0.310210172448685,0.3098152517963,0.309617791470107,0.309617791470107,
+        0.308630489839144,0.307840648534373,0.307248267555795,0.306853346903409,
+        0.306655886577217,0.306655886577217,0.305866045272446,0.305273664293868,
+        0.304878743641483,0.30468128331529,0.30468128331529,0.304088902336712,
+        0.303693981684327,0.303496521358134,0.303496521358134,0.303101600705749,
+        0.302904140379556,0.302904140379556,0.302706680053363,0.302706680053363,
+        0.302706680053363,0.301324457770015,0.300139695812859,0.299152394181895,
+        0.298362552877125,0.297770171898547,0.297375251246161,0.297177790919969,
+        0.297177790919969,0.295993028962813,0.295005727331849,0.294215886027079,
+        0.293623505048501,0.293228584396115,0.293031124069923,0.293031124069923,
+        0.292043822438959,0.291253981134189,0.290661600155611,0.290266679503225,
+        0.290069219177032,0.290069219177032,0.289279377872262,0.288686996893684,
+        0.288292076241298,0.288094615915106,0.288094615915106,0.287502234936528,
+        0.287107314284142,0.28690985395795,0.28690985395795,0.286514933305564,
+        0.286317472979372,0.286317472979372,0.286120012653179,0.286120012653179,
+        0.286120012653179,0.284935250696023,0.28394794906506,0.283158107760289,
+        0.282565726781711,0.282170806129326,0.281973345803133,0.281973345803133,
+        0.28098604417217,0.280196202867399,0.279603821888821,0.279208901236436,
+        0.279011440910243,0.279011440910243,0.278221599605472,0.277629218626894,
+        0.277234297974509,0.277036837648316,0.277036837648316,0.276444456669738,
+        0.276049536017353,0.27585207569116,0.27585207569116,0.275457155038775,
+        0.275259694712582,0.275259694712582,0.27506223438639,0.27506223438639,
+        0.27506223438639,0.274074932755426,0.273285091450656,0.272692710472078,
+        0.272297789819692,0.2721003294935,0.2721003294935,0.271310488188729,
+        0.270718107210151,0.270323186557765,0.270125726231573,0.270125726231573,
+        0.269533345252995,0.269138424600609,0.268940964274417,0.268940964274417,
+        0.268546043622031,0.268348583295839,0.268348583295839,0.268151122969646,
+        0.268151122969646,0.268151122969646,0.267361281664875,0.266768900686297,
+        0.266373980033912,0.266176519707719,0.266176519707719,0.265584138729141,
+        0.265189218076756,0.264991757750563,0.264991757750563,0.264596837098178,
+        0.264399376771985,0.264399376771985,0.264201916445793,0.264201916445793,
+        0.264201916445793,0.263609535467215,0.263214614814829,0.263017154488637,
+        0.263017154488637,0.262622233836251,0.262424773510059,0.262424773510059,
+        0.262227313183866,0.262227313183866,0.262227313183866,0.261832392531481,
+        0.261634932205288,0.261634932205288,0.261437471879095,0.261437471879095,
+        0.261437471879095,0.261437471879095,0.261437471879095,0.261437471879095,
+        0.261437471879095,0.260252709921939,0.259067947964783,0.25808064633382,
+        0.257290805029049,0.256698424050471,0.256303503398086,0.256106043071893,
+        0.256106043071893,0.254921281114737,0.253933979483774,0.253144138179003,
+        0.252551757200425,0.25215683654804,0.251959376221847,0.251959376221847,
+        0.250972074590884,0.250182233286113,0.249589852307535,0.24919493165515,
+        0.248997471328957,0.248997471328957,0.248207630024186,0.247615249045608,
+        0.247220328393223,0.24702286806703,0.24702286806703,0.246430487088452,
+        0.246035566436067,0.245838106109874,0.245838106109874,0.245443185457489,
+        0.245245725131296,0.245245725131296,0.245048264805104,0.245048264805104,
+        0.245048264805104,0.243863502847948,0.242876201216984,0.242086359912214,
+        0.241493978933636,0.24109905828125,0.240901597955058,0.240901597955058,
+        0.239914296324094,0.239124455019324,0.238532074040746,0.23813715338836,
+        0.237939693062168,0.237939693062168,0.237149851757397,0.236557470778819,
+        0.236162550126434,0.235965089800241,0.235965089800241,0.235372708821663,
+        0.234977788169278,0.234780327843085,0.234780327843085,0.2343854071907,
+        0.234187946864507,0.234187946864507,0.233990486538314,0.233990486538314,
+        0.233990486538314,0.233003184907351,0.23221334360258,0.231620962624002,
+        0.231226041971617,0.231028581645424,0.231028581645424,0.230238740340653,
+        0.229646359362075,0.22925143870969,0.229053978383497,0.229053978383497,
+        0.228461597404919,0.228066676752534,0.227869216426341,0.227869216426341,
+        0.227474295773956,0.227276835447763,0.227276835447763,0.227079375121571,
+        0.227079375121571,0.227079375121571,0.2262895338168,0.225697152838222,
+        0.225302232185837,0.225104771859644,0.225104771859644,0.224512390881066,
+        0.224117470228681,0.223920009902488,0.223920009902488,0.223525089250103,
+        0.22332762892391,0.22332762892391,0.223130168597717,0.223130168597717,
+        0.223130168597717,0.222537787619139,0.222142866966754,0.221945406640561,
+        0.221945406640561,0.221550485988176,0.221353025661983,0.221353025661983,
+        0.221155565335791,0.221155565335791,0.221155565335791,0.220760644683405,
+        0.220563184357213,0.220563184357213,0.22036572403102,0.22036572403102,
+        0.22036572403102,0.22036572403102,0.22036572403102,0.22036572403102,
+        0.22036572403102,0.219378422400057,0.218391120769093,0.217601279464323,
+        0.217008898485745,0.216613977833359,0.216416517507167,0.216416517507167,
+        0.215429215876203,0.214639374571433,0.214046993592854,0.213652072940469,
+        0.213454612614276,0.213454612614276,0.212664771309506,0.212072390330928,
+        0.211677469678542,0.21148000935235,0.21148000935235,0.210887628373772,
+        0.210492707721386,0.210295247395194,0.210295247395194,0.209900326742808,
+        0.209702866416616,0.209702866416616,0.209505406090423,0.209505406090423,
+        0.209505406090423,0.20851810445946,0.207728263154689,0.207135882176111,
+        0.206740961523726,0.206543501197533,0.206543501197533,0.205753659892762,
+        0.205161278914184,0.204766358261799,0.204568897935606,0.204568897935606,
+        0.203976516957028,0.203581596304643,0.20338413597845,0.20338413597845,
+        0.202989215326065,0.202791754999872,0.202791754999872,0.20259429467368,
+        0.20259429467368,0.20259429467368,0.201804453368909,0.201212072390331,
+        0.200817151737946,0.200619691411753,0.200619691411753,0.200027310433175,
+        0.19963238978079,0.199434929454597,0.199434929454597,0.199040008802212,
+        0.198842548476019,0.198842548476019,0.198645088149826,0.198645088149826,
+        0.198645088149826,0.198052707171248,0.197657786518863,0.19746032619267,
+        0.19746032619267,0.197065405540285,0.196867945214092,0.196867945214092,
+        0.1966704848879,0.1966704848879,0.1966704848879,0.196275564235514,
+        0.196078103909322,0.196078103909322,0.195880643583129,0.195880643583129,
+        0.195880643583129,0.195880643583129,0.195880643583129,0.195880643583129,
+        0.195880643583129,0.195090802278358,0.194300960973587,0.193708579995009,
+        0.193313659342624,0.193116199016431,0.193116199016431,0.192326357711661,
+        0.191733976733083,0.191339056080697,0.191141595754505,0.191141595754505,
+        0.190549214775927,0.190154294123541,0.189956833797349,0.189956833797349,
+        0.189561913144963,0.189364452818771,0.189364452818771,0.189166992492578,
+        0.189166992492578,0.189166992492578,0.188377151187807,0.187784770209229,
+        0.187389849556844,0.187192389230651,0.187192389230651,0.186600008252073,
+        0.186205087599688,0.186007627273495,0.186007627273495,0.18561270662111,
+        0.185415246294917,0.185415246294917,0.185217785968725,0.185217785968725,
+        0.185217785968725,0.184625404990147,0.184230484337761,0.184033024011569,
+        0.184033024011569,0.183638103359183,0.183440643032991,0.183440643032991,
+        0.183243182706798,0.183243182706798,0.183243182706798,0.182848262054413,
+        0.18265080172822,0.18265080172822,0.182453341402027,0.182453341402027,
+        0.182453341402027,0.182453341402027,0.182453341402027,0.182453341402027,
+        0.182453341402027,0.181860960423449,0.181268579444871,0.180873658792486,
+        0.180676198466293,0.180676198466293,0.180083817487715,0.17968889683533,
+        0.179491436509137,0.179491436509137,0.179096515856752,0.178899055530559,
+        0.178899055530559,0.178701595204367,0.178701595204367,0.178701595204367,
+        0.178109214225789,0.177714293573403,0.177516833247211,0.177516833247211,
+        0.177121912594825,0.176924452268632,0.176924452268632,0.17672699194244,
+        0.17672699194244,0.17672699194244,0.176332071290054,0.176134610963862,
+        0.176134610963862,0.175937150637669,0.175937150637669,0.175937150637669,
+        0.175937150637669,0.175937150637669,0.175937150637669,0.175937150637669,
+        0.175542229985284,0.175147309332898,0.174949849006706,0.174949849006706,
+        0.17455492835432,0.174357468028128,0.174357468028128,0.174160007701935,
+        0.174160007701935,0.174160007701935,0.17376508704955,0.173567626723357,
+        0.173567626723357,0.173370166397164,0.173370166397164,0.173370166397164,
+        0.173370166397164,0.173370166397164,0.173370166397164,0.173370166397164,
+        0.173172706070972,0.172975245744779,0.172975245744779,0.172777785418586,
+        0.172777785418586,0.172777785418586,0.172777785418586,0.172777785418586,
+        0.172777785418586,0.172777785418586,0.172777785418586,0.172777785418586,
+        0.172777785418586,0.172777785418586,0.17159302346143,0.170605721830467,
+        0.169815880525696,0.169223499547118,0.168828578894733,0.16863111856854,
+        0.16863111856854,0.167446356611384,0.166459054980421,0.16566921367565,
+        0.165076832697072,0.164681912044687,0.164484451718494,0.164484451718494,
+        0.163497150087531,0.16270730878276,0.162114927804182,0.161720007151797,
+        0.161522546825604,0.161522546825604,0.160732705520834,0.160140324542256,
+        0.15974540388987,0.159547943563678,0.159547943563678,0.1589555625851,
+        0.158560641932714,0.158363181606521,0.158363181606521,0.157968260954136,
+        0.157770800627943,0.157770800627943,0.157573340301751,0.157573340301751,
+        0.157573340301751,0.156388578344595,0.155401276713631,0.154611435408861,
+        0.154019054430283,0.153624133777897,0.153426673451705,0.153426673451705,
+        0.152439371820741,0.151649530515971,0.151057149537393,0.150662228885007,
+        0.150464768558815,0.150464768558815,0.149674927254044,0.149082546275466,
+        0.148687625623081,0.148490165296888,0.148490165296888,0.14789778431831,
+        0.147502863665925,0.147305403339732,0.147305403339732,0.146910482687347,
+        0.146713022361154,0.146713022361154,0.146515562034961,0.146515562034961,
+        0.146515562034961,0.145528260403998,0.144738419099227,0.144146038120649,
+        0.143751117468264,0.143553657142071,0.143553657142071,0.142763815837301,
+        0.142171434858723,0.141776514206337,0.141579053880145,0.141579053880145,
+        0.140986672901567,0.140591752249181,0.140394291922988,0.140394291922988,
+        0.139999371270603,0.13980191094441,0.13980191094441,0.139604450618218,
+        0.139604450618218,0.139604450618218,0.138814609313447,0.138222228334869,
+        0.137827307682484,0.137629847356291,0.137629847356291,0.137037466377713,
+        0.136642545725328,0.136445085399135,0.136445085399135,0.13605016474675,
+        0.135852704420557,0.135852704420557,0.135655244094364,0.135655244094364,
+        0.135655244094364,0.135062863115786,0.134667942463401,0.134470482137208,
+        0.134470482137208,0.134075561484823,0.13387810115863,0.13387810115863,
+        0.133680640832438,0.133680640832438,0.133680640832438,0.133285720180052,
+        0.13308825985386,0.13308825985386,0.132890799527667,0.132890799527667,
+        0.132890799527667,0.132693339201474,0.132693339201474,0.132693339201474,
+        0.132693339201474,0.131706037570511,0.130718735939548,0.129928894634777,
+        0.129336513656199,0.128941593003814,0.128744132677621,0.128744132677621,
+        0.127756831046658,0.126966989741887,0.126374608763309,0.125979688110924,
+        0.125782227784731,0.125782227784731,0.12499238647996,0.124400005501382,
+        0.124005084848997,0.123807624522804,0.123807624522804,0.123215243544226,
+        0.122820322891841,0.122622862565648,0.122622862565648,0.122227941913263,
+        0.12203048158707,0.12203048158707,0.121833021260878,0.121833021260878,
+        0.121833021260878,0.120845719629914,0.120055878325143,0.119463497346565,
+        0.11906857669418,0.118871116367987,0.118871116367987,0.118081275063217,
+        0.117488894084639,0.117093973432253,0.116896513106061,0.116896513106061,
+        0.116304132127483,0.115909211475097,0.115711751148905,0.115711751148905,
+        0.115316830496519,0.115119370170327,0.115119370170327,0.114921909844134,
+        0.114921909844134,0.114921909844134,0.114132068539363,0.113539687560785,
+        0.1131447669084,0.112947306582207,0.112947306582207,0.112354925603629,
+        0.111960004951244,0.111762544625051,0.111762544625051,0.111367623972666,
+        0.111170163646473,0.111170163646473,0.110972703320281,0.110972703320281,
+        0.110972703320281,0.110380322341703,0.109985401689317,0.109787941363125,
+        0.109787941363125,0.109393020710739,0.109195560384547,0.109195560384547,
+        0.108998100058354,0.108998100058354,0.108998100058354,0.108603179405969,
+        0.108405719079776,0.108405719079776,0.108208258753583,0.108208258753583,
+        0.108208258753583,0.108010798427391,0.108010798427391,0.108010798427391,
+        0.108010798427391,0.10722095712262,0.106431115817849,0.105838734839271,
+        0.105443814186886,0.105246353860693,0.105246353860693,0.104456512555923,
+        0.103864131577345,0.103469210924959,0.103271750598767,0.103271750598767,
+        0.102679369620189,0.102284448967803,0.10208698864161,0.10208698864161,
+        0.101692067989225,0.101494607663032,0.101494607663032,0.10129714733684,
+        0.10129714733684,0.10129714733684,0.100507306032069,0.0999149250534911,
+        0.0995200044011058,0.0993225440749131,0.0993225440749131,0.0987301630963351,
+        0.0983352424439498,0.0981377821177571,0.0981377821177571,0.0977428614653717,
+        0.0975454011391791,0.0975454011391791,0.0973479408129864,0.0973479408129864,
+        0.0973479408129864,0.0967555598344084,0.0963606391820231,0.0961631788558304,
+        0.0961631788558304,0.095768258203445,0.0955707978772524,0.0955707978772524,
+        0.0953733375510597,0.0953733375510597,0.0953733375510597,0.0949784168986744,
+        0.0947809565724817,0.0947809565724817,0.094583496246289,0.094583496246289,
+        0.094583496246289,0.0943860359200964,0.0943860359200964,0.0943860359200964,
+        0.0943860359200964,0.0937936549415183,0.0932012739629403,0.092806353310555,
+        0.0926088929843623,0.0926088929843623,0.0920165120057843,0.091621591353399,
+        0.0914241310272063,0.0914241310272063,0.091029210374821,0.0908317500486283,
+        0.0908317500486283,0.0906342897224356,0.0906342897224356,0.0906342897224356,
+        0.0900419087438576,0.0896469880914723,0.0894495277652796,0.0894495277652796,
+        0.0890546071128943,0.0888571467867016,0.0888571467867016,0.0886596864605089,
+        0.0886596864605089,0.0886596864605089,0.0882647658081236,0.0880673054819309,
+        0.0880673054819309,0.0878698451557382,0.0878698451557382,0.0878698451557382,
+        0.0876723848295456,0.0876723848295456,0.0876723848295456,0.0876723848295456,
+        0.0872774641771602,0.0868825435247749,0.0866850831985822,0.0866850831985822,
+        0.0862901625461969,0.0860927022200042,0.0860927022200042,0.0858952418938115,
+        0.0858952418938115,0.0858952418938115,0.0855003212414262,0.0853028609152335,
+        0.0853028609152335,0.0851054005890409,0.0851054005890409,0.0851054005890409,
+        0.0849079402628482,0.0849079402628482,0.0849079402628482,0.0849079402628482,
+        0.0847104799366555,0.0845130196104628,0.0845130196104628,0.0843155592842702,
+        0.0843155592842702,0.0843155592842702,0.0841180989580775,0.0841180989580775,
+        0.0841180989580775,0.0841180989580775,0.0841180989580775,0.0841180989580775,
+        0.0841180989580775,0.0841180989580775,0.0841180989580775,0.0831307973271141,
+        0.0823409560223435,0.0817485750437655,0.0813536543913801,0.0811561940651875,
+        0.0811561940651875,0.0801688924342241,0.0793790511294534,0.0787866701508754,
+        0.0783917494984901,0.0781942891722974,0.0781942891722974,0.0774044478675267,
+        0.0768120668889487,0.0764171462365634,0.0762196859103707,0.0762196859103707,
+        0.0756273049317927,0.0752323842794073,0.0750349239532147,0.0750349239532147,
+        0.0746400033008293,0.0744425429746367,0.0744425429746367,0.074245082648444,
+        0.074245082648444,0.074245082648444,0.0732577810174806,0.07246793971271,
+        0.071875558734132,0.0714806380817466,0.0712831777555539,0.0712831777555539,
+        0.0704933364507833,0.0699009554722052,0.0695060348198199,0.0693085744936272,
+        0.0693085744936272,0.0687161935150492,0.0683212728626639,0.0681238125364712,
+        0.0681238125364712,0.0677288918840859,0.0675314315578932,0.0675314315578932,
+        0.0673339712317005,0.0673339712317005,0.0673339712317005,0.0665441299269299,
+        0.0659517489483518,0.0655568282959665,0.0653593679697738,0.0653593679697738,
+        0.0647669869911958,0.0643720663388105,0.0641746060126178,0.0641746060126178,
+        0.0637796853602325,0.0635822250340398,0.0635822250340398,0.0633847647078471,
+        0.0633847647078471,0.0633847647078471,0.0627923837292691,0.0623974630768838,
+        0.0622000027506911,0.0622000027506911,0.0618050820983058,0.0616076217721131,
+        0.0616076217721131,0.0614101614459204,0.0614101614459204,0.0614101614459204,
+        0.0610152407935351,0.0608177804673424,0.0608177804673424,0.0606203201411497,
+        0.0606203201411497,0.0606203201411497,0.0604228598149571,0.0604228598149571,
+        0.0604228598149571,0.0604228598149571,0.0596330185101864,0.0588431772054157,
+        0.0582507962268377,0.0578558755744524,0.0576584152482597,0.0576584152482597,
+        0.056868573943489,0.056276192964911,0.0558812723125257,0.055683811986333,
+        0.055683811986333,0.055091431007755,0.0546965103553696,0.054499050029177,
+        0.054499050029177,0.0541041293767916,0.053906669050599,0.053906669050599,
+        0.0537092087244063,0.0537092087244063,0.0537092087244063,0.0529193674196356,
+        0.0523269864410576,0.0519320657886723,0.0517346054624796,0.0517346054624796,
+        0.0511422244839016,0.0507473038315162,0.0505498435053236,0.0505498435053236,
+        0.0501549228529382,0.0499574625267456,0.0499574625267456,0.0497600022005529,
+        0.0497600022005529,0.0497600022005529,0.0491676212219749,0.0487727005695895,
+        0.0485752402433969,0.0485752402433969,0.0481803195910115,0.0479828592648189,
+        0.0479828592648189,0.0477853989386262,0.0477853989386262,0.0477853989386262,
+        0.0473904782862408,0.0471930179600482,0.0471930179600482,0.0469955576338555,
+        0.0469955576338555,0.0469955576338555,0.0467980973076628,0.0467980973076628,
+        0.0467980973076628,0.0467980973076628,0.0462057163290848,0.0456133353505068,
+        0.0452184146981215,0.0450209543719288,0.0450209543719288,0.0444285733933508,
+        0.0440336527409655,0.0438361924147728,0.0438361924147728,0.0434412717623874,
+        0.0432438114361948,0.0432438114361948,0.0430463511100021,0.0430463511100021,
+        0.0430463511100021,0.0424539701314241,0.0420590494790388,0.0418615891528461,
+        0.0418615891528461,0.0414666685004607,0.0412692081742681,0.0412692081742681,
+        0.0410717478480754,0.0410717478480754,0.0410717478480754,0.0406768271956901,
+        0.0404793668694974,0.0404793668694974,0.0402819065433047,0.0402819065433047,
+        0.0402819065433047,0.040084446217112,0.040084446217112,0.040084446217112,
+        0.040084446217112,0.0396895255647267,0.0392946049123414,0.0390971445861487,
+        0.0390971445861487,0.0387022239337634,0.0385047636075707,0.0385047636075707,
+        0.038307303281378,0.038307303281378,0.038307303281378,0.0379123826289927,
+        0.0377149223028,0.0377149223028,0.0375174619766073,0.0375174619766073,
+        0.0375174619766073,0.0373200016504147,0.0373200016504147,0.0373200016504147,
+        0.0373200016504147,0.037122541324222,0.0369250809980293,0.0369250809980293,
+        0.0367276206718367,0.0367276206718367,0.0367276206718367,0.036530160345644,
+        0.036530160345644,0.036530160345644,0.036530160345644,0.036530160345644,
+        0.036530160345644,0.036530160345644,0.036530160345644,0.036530160345644,
+        0.0357403190408733,0.0351479380622953,0.03475301740991,0.0345555570837173,
+        0.0345555570837173,0.0337657157789466,0.0331733348003686,0.0327784141479832,
+        0.0325809538217906,0.0325809538217906,0.0319885728432126,0.0315936521908272,
+        0.0313961918646346,0.0313961918646346,0.0310012712122492,0.0308038108860566,
+        0.0308038108860566,0.0306063505598639,0.0306063505598639,0.0306063505598639,
+        0.0298165092550932,0.0292241282765152,0.0288292076241298,0.0286317472979372,
+        0.0286317472979372,0.0280393663193592,0.0276444456669738,0.0274469853407812,
+        0.0274469853407812,0.0270520646883958,0.0268546043622031,0.0268546043622031,
+        0.0266571440360105,0.0266571440360105,0.0266571440360105,0.0260647630574325,
+        0.0256698424050471,0.0254723820788545,0.0254723820788545,0.0250774614264691,
+        0.0248800011002764,0.0248800011002764,0.0246825407740838,0.0246825407740838,
+        0.0246825407740838,0.0242876201216984,0.0240901597955058,0.0240901597955058,
+        0.0238926994693131,0.0238926994693131,0.0238926994693131,0.0236952391431204,
+        0.0236952391431204,0.0236952391431204,0.0236952391431204,0.0231028581645424,
+        0.0225104771859644,0.0221155565335791,0.0219180962073864,0.0219180962073864,
+        0.0213257152288084,0.020930794576423,0.0207333342502304,0.0207333342502304,
+        0.020338413597845,0.0201409532716524,0.0201409532716524,0.0199434929454597,
+        0.0199434929454597,0.0199434929454597,0.0193511119668817,0.0189561913144963,
+        0.0187587309883037,0.0187587309883037,0.0183638103359183,0.0181663500097257,
+        0.0181663500097257,0.017968889683533,0.017968889683533,0.017968889683533,
+        0.0175739690311476,0.017376508704955,0.017376508704955,0.0171790483787623,
+        0.0171790483787623,0.0171790483787623,0.0169815880525696,0.0169815880525696,
+        0.0169815880525696,0.0169815880525696,0.0165866674001843,0.016191746747799,
+        0.0159942864216063,0.0159942864216063,0.0155993657692209,0.0154019054430283,
+        0.0154019054430283,0.0152044451168356,0.0152044451168356,0.0152044451168356,
+        0.0148095244644503,0.0146120641382576,0.0146120641382576,0.0144146038120649,
+        0.0144146038120649,0.0144146038120649,0.0142171434858723,0.0142171434858723,
+        0.0142171434858723,0.0142171434858723,0.0140196831596796,0.0138222228334869,
+        0.0138222228334869,0.0136247625072942,0.0136247625072942,0.0136247625072942,
+        0.0134273021811016,0.0134273021811016,0.0134273021811016,0.0134273021811016,
+        0.0134273021811016,0.0134273021811016,0.0134273021811016,0.0134273021811016,
+        0.0134273021811016,0.0128349212025236,0.0124400005501382,0.0122425402239456,
+        0.0122425402239456,0.0116501592453675,0.0112552385929822,0.0110577782667895,
+        0.0110577782667895,0.0106628576144042,0.0104653972882115,0.0104653972882115,
+        0.0102679369620189,0.0102679369620189,0.0102679369620189,0.00967555598344084,
+        0.0092806353310555,0.00908317500486283,0.00908317500486283,0.00868825435247749,
+        0.00849079402628482,0.00849079402628482,0.00829333370009215,0.00829333370009215,
+        0.00829333370009215,0.00789841304770681,0.00770095272151414,0.00770095272151414,
+        0.00750349239532147,0.00750349239532147,0.00750349239532147,0.0073060320691288,
+        0.0073060320691288,0.0073060320691288,0.0073060320691288,0.00691111141674346,
+        0.00651619076435812,0.00631873043816545,0.00631873043816545,0.00592380978578011,
+        0.00572634945958744,0.00572634945958744,0.00552888913339477,0.00552888913339477,
+        0.00552888913339477,0.00513396848100943,0.00493650815481675,0.00493650815481675,
+        0.00473904782862408,0.00473904782862408,0.00473904782862408,0.00454158750243141,
+        0.00454158750243141,0.00454158750243141,0.00454158750243141,0.00434412717623874,
+        0.00414666685004607,0.00414666685004607,0.0039492065238534,0.0039492065238534,
+        0.0039492065238534,0.00375174619766073,0.00375174619766073,0.00375174619766073,
+        0.00375174619766073,0.00375174619766073,0.00375174619766073,0.00375174619766073,
+        0.00375174619766073,0.00375174619766073,0.00335682554527539,0.00315936521908272,
+        0.00315936521908272,0.00276444456669738,0.00256698424050471,0.00256698424050471,
+        0.00236952391431204,0.00236952391431204,0.00236952391431204,0.0019746032619267,
+        0.00177714293573403,0.00177714293573403,0.00157968260954136,0.00157968260954136,
+        0.00157968260954136,0.00138222228334869,0.00138222228334869,0.00138222228334869,
+        0.00138222228334869,0.00118476195715602,0.000987301630963351,0.000987301630963351,
+        0.000789841304770681,0.000789841304770681,0.000789841304770681,0.000592380978578011,
+        0.000592380978578011,0.000592380978578011,0.000592380978578011,0.000592380978578011,
+        0.000592380978578011,0.000592380978578011,0.000592380978578011,0.000592380978578011,
+        0.00039492065238534,0.00039492065238534,0.00019746032619267,0.00019746032619267,
+        0.00019746032619267,0.0,0.0,0.0,
+        0.0,0.0,0.0,0.0,
+        0.0,0.0,0.0,0.0,
+        0.0,0.0
+    ]
+    rank_to_percentile_7 = [
+        0.999967679379444,0.999936734104444,0.999905788829443,0.999874843554443,
+        0.999843898279443,0.999812953004442,0.999782007729442,0.999751062454442,
+        0.999720117179441,0.999689171904441,0.999658884403402,0.999633739498788,
+        0.999613258809537,0.999596963954585,0.99958437655287,0.999575018223329,
+        0.999568410584899,0.999564075256517,0.999561533857121,0.999560308005647,
+        0.999559919321034,0.999559889422217,0.999529601921178,0.999504457016565,
+        0.999483976327313,0.999467681472361,0.999455094070646,0.999445735741105,
+        0.999439128102675,0.999434792774293,0.999432251374897,0.999431025523424,
+        0.99943063683881,0.999430606939994,0.999400319438955,0.999375174534341,
+        0.999354693845089,0.999338398990138,0.999325811588422,0.999316453258881,
+        0.999309845620451,0.99930551029207,0.999302968892673,0.9993017430412,
+        0.999301354356586,0.99930132445777,0.999271036956731,0.999245892052117,
+        0.999225411362866,0.999209116507914,0.999196529106199,0.999187170776658,
+        0.999180563138228,0.999176227809846,0.99917368641045,0.999172460558976,
+        0.999172071874363,0.999172041975546,0.999141754474507,0.999116609569894,
+        0.999096128880642,0.99907983402569,0.999067246623975,0.999057888294434,
+        0.999051280656004,0.999046945327622,0.999044403928226,0.999043178076753,
+        0.999042789392139,0.999042759493323,0.999012471992284,0.99898732708767,
+        0.998966846398418,0.998950551543467,0.998937964141752,0.99892860581221,
+        0.99892199817378,0.998917662845399,0.998915121446002,0.998913895594529,
+        0.998913506909915,0.998913477011099,0.99888318951006,0.998858044605446,
+        0.998837563916195,0.998821269061243,0.998808681659528,0.998799323329987,
+        0.998792715691557,0.998788380363175,0.998785838963779,0.998784613112305,
+        0.998784224427692,0.998784194528875,0.998753907027836,0.998728762123223,
+        0.998708281433971,0.998691986579019,0.998679399177304,0.998670040847763,
+        0.998663433209333,0.998659097880951,0.998656556481555,0.998655330630082,
+        0.998654941945468,0.998654912046652,0.998624624545613,0.998599479640999,
+        0.998578998951748,0.998562704096796,0.998550116695081,0.998540758365539,
+        0.998534150727109,0.998529815398728,0.998527273999331,0.998526048147858,
+        0.998525659463244,0.998525629564428,0.998495342063389,0.998470197158775,
+        0.998449716469524,0.998433421614572,0.998420834212857,0.998411475883316,
+        0.998404868244886,0.998400532916504,0.998397991517108,0.998396765665634,
+        0.998396376981021,0.998396347082204,0.998366059581165,0.998340914676552,
+        0.9983204339873,0.998304139132348,0.998291551730633,0.998282193401092,
+        0.998275585762662,0.99827125043428,0.998268709034884,0.998267483183411,
+        0.998267094498797,0.998267064599981,0.998236777098942,0.998211632194328,
+        0.998191151505077,0.998174856650125,0.99816226924841,0.998152910918868,
+        0.998146303280438,0.998141967952057,0.998139426552661,0.998138200701187,
+        0.998137812016573,0.998137782117757,0.998107494616718,0.998082349712104,
+        0.998061869022853,0.998045574167901,0.998032986766186,0.998023628436645,
+        0.998017020798215,0.998012685469833,0.998010144070437,0.998008918218963,
+        0.99800852953435,0.998008499635533,0.997833531761812,0.997659640245481,
+        0.997486825086542,0.997315086284994,0.997144423840838,0.996974837754073,
+        0.996806328024699,0.996638894652716,0.996472537638125,0.996307256980925,
+        0.996143052681117,0.995979924738699,0.995810219056668,0.995636327540338,
+        0.995463512381399,0.995291773579851,0.995121111135695,0.994951525048929,
+        0.994783015319556,0.994615581947573,0.994449224932982,0.994283944275782,
+        0.994119739975973,0.993956612033556,0.993786906351525,0.993618277026886,
+        0.993445461867946,0.993273723066399,0.993103060622242,0.992933474535477,
+        0.992764964806103,0.992597531434121,0.992431174419529,0.99226589376233,
+        0.992101689462521,0.991938561520104,0.991768855838073,0.991600226513433,
+        0.991432673546185,0.991260934744637,0.991090272300481,0.990920686213716,
+        0.990752176484342,0.990584743112359,0.990418386097768,0.990253105440568,
+        0.990088901140759,0.989925773198342,0.989756067516311,0.989587438191672,
+        0.989419885224423,0.989253408614567,0.98908274617041,0.988913160083645,
+        0.988744650354271,0.988577216982289,0.988410859967697,0.988245579310497,
+        0.988081375010689,0.987918247068272,0.987748541386241,0.987579912061601,
+        0.987412359094353,0.987245882484496,0.98708048223203,0.986910896145265,
+        0.986742386415891,0.986574953043909,0.986408596029318,0.986243315372118,
+        0.986079111072309,0.985915983129892,0.985746277447861,0.985577648123221,
+        0.985410095155973,0.985243618546116,0.985078218293651,0.984913894398576,
+        0.984745384669202,0.98457795129722,0.984411594282629,0.984246313625429,
+        0.98408210932562,0.983918981383203,0.983749275701172,0.983580646376533,
+        0.983413093409284,0.983246616799427,0.983081216546962,0.982916892651888,
+        0.982753645114204,0.982586211742222,0.982419854727631,0.982254574070431,
+        0.982090369770622,0.981927241828205,0.981757536146174,0.981588906821535,
+        0.981421353854286,0.981254877244429,0.981089476991964,0.98092515309689,
+        0.980761905559207,0.980599734378915,0.980433377364324,0.980268096707124,
+        0.980103892407315,0.979940764464898,0.979771058782867,0.979602429458228,
+        0.979434876490979,0.979268399881122,0.979102999628657,0.978938675733582,
+        0.978775428195899,0.978613257015608,0.978452162192707,0.978286881535508,
+        0.978122677235699,0.977959549293282,0.977789843611251,0.977621214286611,
+        0.977453661319363,0.977287184709506,0.97712178445704,0.976957460561966,
+        0.976794213024283,0.976632041843992,0.976470947021091,0.976310928555582,
+        0.976146724255774,0.975983596313356,0.975813890631326,0.975645261306686,
+        0.975477708339438,0.975311231729581,0.975145831477115,0.974981507582041,
+        0.974818260044358,0.974656088864066,0.974494994041166,0.974334975575657,
+        0.974176033467539,0.974012905525122,0.973843199843091,0.973674570518451,
+        0.973507017551203,0.973340540941346,0.973175140688881,0.973010816793806,
+        0.972847569256123,0.972685398075832,0.972524303252931,0.972364284787422,
+        0.972205342679305,0.972047476928578,0.972016531653578,0.971986931825317,
+        0.971958647544978,0.971931648913746,0.971905906032804,0.971881389003335,
+        0.971858067926523,0.971835912903552,0.971804967628552,0.97177536780029,
+        0.971747083519952,0.97172008488872,0.971694342007777,0.971669824978308,
+        0.971646503901497,0.971624348878525,0.971594749050264,0.971566464769926,
+        0.971539466138693,0.971513723257751,0.971489206228282,0.97146588515147,
+        0.971443730128499,0.971415445848161,0.971388447216929,0.971362704335986,
+        0.971338187306517,0.971314866229705,0.971292711206734,0.971265712575502,
+        0.97123996969456,0.971215452665091,0.971192131588279,0.971169976565308,
+        0.971144233684365,0.971119716654896,0.971096395578085,0.971074240555113,
+        0.971049753424461,0.971026432347649,0.971004277324678,0.970980956247866,
+        0.970958801224895,0.970936646201923,0.970905730825739,0.970876130997478,
+        0.97084784671714,0.970820848085908,0.970795105204965,0.970770588175496,
+        0.970747267098685,0.970725112075713,0.970695512247452,0.970667227967114,
+        0.970640229335881,0.970614486454939,0.97058996942547,0.970566648348658,
+        0.970544493325687,0.970516209045349,0.970489210414117,0.970463467533174,
+        0.970438950503705,0.970415629426894,0.970393474403922,0.97036647577269,
+        0.970340732891748,0.970316215862279,0.970292894785467,0.970270739762496,
+        0.970244996881553,0.970220479852085,0.970197158775273,0.970175003752301,
+        0.970150516621649,0.970127195544837,0.970105040521866,0.970081719445054,
+        0.970059564422083,0.970037409399112,0.970007839469667,0.969979555189328,
+        0.969952556558096,0.969926813677154,0.969902296647685,0.969878975570873,
+        0.969856820547902,0.969828536267563,0.969801537636331,0.969775794755389,
+        0.96975127772592,0.969727956649108,0.969705801626137,0.969678802994905,
+        0.969653060113962,0.969628543084493,0.969605222007682,0.96958306698471,
+        0.969557324103768,0.969532807074299,0.969509485997487,0.969487330974516,
+        0.969462843843864,0.969439522767052,0.96941736774408,0.969394046667269,
+        0.969371891644297,0.969349736621326,0.969321482239804,0.969294483608572,
+        0.96926874072763,0.969244223698161,0.969220902621349,0.969198747598378,
+        0.969171748967145,0.969146006086203,0.969121489056734,0.969098167979922,
+        0.969076012956951,0.969050270076009,0.96902575304654,0.969002431969728,
+        0.968980276946757,0.968955789816104,0.968932468739293,0.968910313716321,
+        0.968886992639509,0.968864837616538,0.968842682593567,0.968815713861151,
+        0.968789970980209,0.96876545395074,0.968742132873928,0.968719977850957,
+        0.968694234970015,0.968669717940546,0.968646396863734,0.968624241840762,
+        0.96859975471011,0.968576433633298,0.968554278610327,0.968530957533515,
+        0.968508802510544,0.968486647487573,0.968460934505447,0.968436417475978,
+        0.968413096399166,0.968390941376195,0.968366454245542,0.96834313316873,
+        0.968320978145759,0.968297657068947,0.968275502045976,0.968253347023005,
+        0.968228859892352,0.968205538815541,0.968183383792569,0.968160062715757,
+        0.968137907692786,0.968115752669815,0.968093597646844,0.968071442623872,
+        0.968049287600901,0.96802713257793,0.967997532749669,0.967967932921407,
+        0.967939648641069,0.967912650009837,0.967886907128894,0.967862390099426,
+        0.967839069022614,0.967816913999642,0.967787314171381,0.967759029891043,
+        0.967732031259811,0.967706288378868,0.967681771349399,0.967658450272587,
+        0.967636295249616,0.967608010969278,0.967581012338046,0.967555269457103,
+        0.967530752427634,0.967507431350823,0.967485276327851,0.967458277696619,
+        0.967432534815677,0.967408017786208,0.967384696709396,0.967362541686425,
+        0.967336798805483,0.967312281776014,0.967288960699202,0.96726680567623,
+        0.967242318545578,0.967218997468766,0.967196842445795,0.967173521368983,
+        0.967151366346012,0.967129211323041,0.967099641393596,0.967071357113257,
+        0.967044358482025,0.967018615601083,0.966994098571614,0.966970777494802,
+        0.966948622471831,0.966920338191492,0.96689333956026,0.966867596679318,
+        0.966843079649849,0.966819758573037,0.966797603550066,0.966770604918834,
+        0.966744862037891,0.966720345008423,0.966697023931611,0.966674868908639,
+        0.966649126027697,0.966624608998228,0.966601287921416,0.966579132898445,
+        0.966554645767793,0.966531324690981,0.966509169668009,0.966485848591198,
+        0.966463693568226,0.966441538545255,0.966413284163733,0.966386285532501,
+        0.966360542651559,0.96633602562209,0.966312704545278,0.966290549522307,
+        0.966263550891074,0.966237808010132,0.966213290980663,0.966189969903851,
+        0.96616781488088,0.966142071999938,0.966117554970469,0.966094233893657,
+        0.966072078870686,0.966047591740033,0.966024270663221,0.96600211564025,
+        0.965978794563438,0.965956639540467,0.965934484517496,0.96590751578508,
+        0.965881772904138,0.965857255874669,0.965833934797857,0.965811779774886,
+        0.965786036893943,0.965761519864475,0.965738198787663,0.965716043764692,
+        0.965691556634039,0.965668235557227,0.965646080534256,0.965622759457444,
+        0.965600604434473,0.965578449411502,0.965552736429376,0.965528219399907,
+        0.965504898323095,0.965482743300124,0.965458256169471,0.965434935092659,
+        0.965412780069688,0.965389458992876,0.965367303969905,0.965345148946934,
+        0.965320661816281,0.965297340739469,0.965275185716498,0.965251864639686,
+        0.965229709616715,0.965207554593744,0.965185399570773,0.965163244547801,
+        0.96514108952483,0.965118934501859,0.96509065022152,0.965062365941182,
+        0.96503536730995,0.965009624429007,0.964985107399538,0.964961786322727,
+        0.964939631299755,0.964911347019417,0.964884348388185,0.964858605507242,
+        0.964834088477774,0.964810767400962,0.96478861237799,0.964761613746758,
+        0.964735870865816,0.964711353836347,0.964688032759535,0.964665877736564,
+        0.964640134855622,0.964615617826153,0.964592296749341,0.96457014172637,
+        0.964545654595717,0.964522333518905,0.964500178495934,0.964476857419122,
+        0.964454702396151,0.96443254737318,0.964404292991658,0.964377294360425,
+        0.964351551479483,0.964327034450014,0.964303713373202,0.964281558350231,
+        0.964254559718999,0.964228816838057,0.964204299808588,0.964180978731776,
+        0.964158823708805,0.964133080827862,0.964108563798393,0.964085242721582,
+        0.96406308769861,0.964038600567958,0.964015279491146,0.963993124468175,
+        0.963969803391363,0.963947648368392,0.96392549334542,0.963898524613005,
+        0.963872781732062,0.963848264702593,0.963824943625782,0.96380278860281,
+        0.963777045721868,0.963752528692399,0.963729207615587,0.963707052592616,
+        0.963682565461964,0.963659244385152,0.963637089362181,0.963613768285369,
+        0.963591613262397,0.963569458239426,0.9635437452573,0.963519228227831,
+        0.96349590715102,0.963473752128048,0.963449264997396,0.963425943920584,
+        0.963403788897613,0.963380467820801,0.96335831279783,0.963336157774858,
+        0.963311670644206,0.963288349567394,0.963266194544423,0.963242873467611,
+        0.96322071844464,0.963198563421668,0.963176408398697,0.963154253375726,
+        0.963132098352755,0.963109943329783,0.963082944698551,0.963055946067319,
+        0.963030203186377,0.963005686156908,0.962982365080096,0.962960210057125,
+        0.962933211425892,0.96290746854495,0.962882951515481,0.962859630438669,
+        0.962837475415698,0.962811732534756,0.962787215505287,0.962763894428475,
+        0.962741739405504,0.962717252274851,0.96269393119804,0.962671776175068,
+        0.962648455098256,0.962626300075285,0.962604145052314,0.962577176319898,
+        0.962551433438956,0.962526916409487,0.962503595332675,0.962481440309704,
+        0.962455697428762,0.962431180399293,0.962407859322481,0.96238570429951,
+        0.962361217168857,0.962337896092045,0.962315741069074,0.962292419992262,
+        0.962270264969291,0.96224810994632,0.962222396964194,0.962197879934725,
+        0.962174558857913,0.962152403834942,0.962127916704289,0.962104595627478,
+        0.962082440604506,0.962059119527694,0.962036964504723,0.962014809481752,
+        0.961990322351099,0.961967001274288,0.961944846251316,0.961921525174504,
+        0.961899370151533,0.961877215128562,0.961855060105591,0.961832905082619,
+        0.961810750059648,0.961788595036677,0.961762852155735,0.961737109274792,
+        0.961712592245323,0.961689271168512,0.96166711614554,0.961641373264598,
+        0.961616856235129,0.961593535158317,0.961571380135346,0.961546893004694,
+        0.961523571927882,0.96150141690491,0.961478095828099,0.961455940805127,
+        0.961433785782156,0.96140807280003,0.961383555770561,0.961360234693749,
+        0.961338079670778,0.961313592540126,0.961290271463314,0.961268116440343,
+        0.961244795363531,0.961222640340559,0.961200485317588,0.961175998186936,
+        0.961152677110124,0.961130522087153,0.961107201010341,0.96108504598737,
+        0.961062890964398,0.961040735941427,0.961018580918456,0.960996425895485,
+        0.960974270872513,0.960949753843044,0.960925236813575,0.960901915736764,
+        0.960879760713792,0.96085527358314,0.960831952506328,0.960809797483357,
+        0.960786476406545,0.960764321383574,0.960742166360603,0.96071767922995,
+        0.960694358153138,0.960672203130167,0.960648882053355,0.960626727030384,
+        0.960604572007413,0.960582416984441,0.96056026196147,0.960538106938499,
+        0.960515951915528,0.960492630838716,0.960469309761904,0.960447154738932,
+        0.960423833662121,0.960401678639149,0.960379523616178,0.960357368593207,
+        0.960335213570236,0.960313058547264,0.960290903524293,0.960268748501322,
+        0.960246593478351,0.960224438455379,0.960202283432408,0.960172683604147,
+        0.960144399323808,0.960117400692576,0.960091657811634,0.960067140782165,
+        0.960043819705353,0.960021664682382,0.959992064854121,0.959963780573782,
+        0.95993678194255,0.959911039061608,0.959886522032139,0.959863200955327,
+        0.959841045932356,0.959812761652017,0.959785763020785,0.959760020139843,
+        0.959735503110374,0.959712182033562,0.959690027010591,0.959663028379359,
+        0.959637285498416,0.959612768468947,0.959589447392136,0.959567292369164,
+        0.959541549488222,0.959517032458753,0.959493711381941,0.95947155635897,
+        0.959447039329501,0.959423718252689,0.959401563229718,0.959378242152906,
+        0.959356087129935,0.959333932106964,0.959304362177519,0.95927607789718,
+        0.959249079265948,0.959223336385006,0.959198819355537,0.959175498278725,
+        0.959153343255754,0.959125058975415,0.959098060344183,0.959072317463241,
+        0.959047800433772,0.95902447935696,0.959002324333989,0.958975325702757,
+        0.958949582821814,0.958925065792346,0.958901744715534,0.958879589692562,
+        0.95885384681162,0.958829329782151,0.958806008705339,0.958783853682368,
+        0.958759336652899,0.958736015576087,0.958713860553116,0.958690539476304,
+        0.958668384453333,0.958646229430362,0.95861797504884,0.958590976417607,
+        0.958565233536665,0.958540716507196,0.958517395430385,0.958495240407413,
+        0.958468241776181,0.958442498895239,0.95841798186577,0.958394660788958,
+        0.958372505765987,0.958346762885044,0.958322245855576,0.958298924778764,
+        0.958276769755792,0.958252252726324,0.958228931649512,0.95820677662654,
+        0.958183455549729,0.958161300526757,0.958139145503786,0.95811217677137,
+        0.958086433890428,0.958061916860959,0.958038595784147,0.958016440761176,
+        0.957990697880234,0.957966180850765,0.957942859773953,0.957920704750982,
+        0.957896187721513,0.957872866644701,0.95785071162173,0.957827390544918,
+        0.957805235521947,0.957783080498975,0.957757367516849,0.957732850487381,
+        0.957709529410569,0.957687374387598,0.957662857358129,0.957639536281317,
+        0.957617381258346,0.957594060181534,0.957571905158562,0.957549750135591,
+        0.957525263004939,0.957501941928127,0.957479786905156,0.957456465828344,
+        0.957434310805372,0.957412155782401,0.957388834705589,0.957366679682618,
+        0.957344524659647,0.957322369636676,0.957294085356337,0.957265801075999,
+        0.957238802444766,0.957213059563824,0.957188542534355,0.957165221457543,
+        0.957143066434572,0.957114782154234,0.957087783523002,0.957062040642059,
+        0.95703752361259,0.957014202535778,0.956992047512807,0.956965048881575,
+        0.956939306000633,0.956914788971164,0.956891467894352,0.956869312871381,
+        0.956843569990438,0.956819052960969,0.956795731884158,0.956773576861186,
+        0.956749059831718,0.956725738754906,0.956703583731934,0.956680262655123,
+        0.956658107632151,0.95663595260918,0.956607698227658,0.956580699596426,
+        0.956554956715483,0.956530439686015,0.956507118609203,0.956484963586231,
+        0.956457964954999,0.956432222074057,0.956407705044588,0.956384383967776,
+        0.956362228944805,0.956336486063863,0.956311969034394,0.956288647957582,
+        0.956266492934611,0.956241975905142,0.95621865482833,0.956196499805359,
+        0.956173178728547,0.956151023705576,0.956128868682604,0.956101899950189,
+        0.956076157069246,0.956051640039777,0.956028318962966,0.956006163939994,
+        0.955980421059052,0.955955904029583,0.955932582952771,0.9559104279298,
+        0.955885910900331,0.955862589823519,0.955840434800548,0.955817113723736,
+        0.955794958700765,0.955772803677794,0.955747090695668,0.955722573666199,
+        0.955699252589387,0.955677097566416,0.955652580536947,0.955629259460135,
+        0.955607104437164,0.955583783360352,0.955561628337381,0.955539473314409,
+        0.955514986183757,0.955491665106945,0.955469510083974,0.955446189007162,
+        0.955424033984191,0.955401878961219,0.955378557884408,0.955356402861436,
+        0.955334247838465,0.955312092815494,0.955285094184262,0.955258095553029,
+        0.955232352672087,0.955207835642618,0.955184514565806,0.955162359542835,
+        0.955135360911603,0.955109618030661,0.955085101001192,0.95506177992438,
+        0.955039624901409,0.955013882020466,0.954989364990998,0.954966043914186,
+        0.954943888891214,0.954919371861745,0.954896050784934,0.954873895761962,
+        0.954850574685151,0.954828419662179,0.954806264639208,0.954779295906792,
+        0.95475355302585,0.954729035996381,0.954705714919569,0.954683559896598,
+        0.954657817015656,0.954633299986187,0.954609978909375,0.954587823886404,
+        0.954563306856935,0.954539985780123,0.954517830757152,0.95449450968034,
+        0.954472354657369,0.954450199634397,0.954424486652271,0.954399969622802,
+        0.954376648545991,0.954354493523019,0.954329976493551,0.954306655416739,
+        0.954284500393767,0.954261179316956,0.954239024293984,0.954216869271013,
+        0.954192382140361,0.954169061063549,0.954146906040578,0.954123584963766,
+        0.954101429940794,0.954079274917823,0.954055953841011,0.95403379881804,
+        0.954011643795069,0.953989488772097,0.953963745891155,0.953938003010213,
+        0.953913485980744,0.953890164903932,0.953868009880961,0.953842267000019,
+        0.95381774997055,0.953794428893738,0.953772273870767,0.953747756841298,
+        0.953724435764486,0.953702280741515,0.953678959664703,0.953656804641731,
+        0.95363464961876,0.953608936636634,0.953584419607165,0.953561098530354,
+        0.953538943507382,0.953514426477913,0.953491105401102,0.95346895037813,
+        0.953445629301318,0.953423474278347,0.953401319255376,0.953376832124723,
+        0.953353511047912,0.95333135602494,0.953308034948129,0.953285879925157,
+        0.953263724902186,0.953240403825374,0.953218248802403,0.953196093779432,
+        0.95317393875646,0.953149421726991,0.953124904697523,0.953101583620711,
+        0.95307942859774,0.953054911568271,0.953031590491459,0.953009435468488,
+        0.952986114391676,0.952963959368704,0.952941804345733,0.952917317215081,
+        0.952893996138269,0.952871841115298,0.952848520038486,0.952826365015515,
+        0.952804209992543,0.952780888915731,0.95275873389276,0.952736578869789,
+        0.952714423846818,0.952691102770006,0.952667781693194,0.952645626670223,
+        0.952622305593411,0.95260015057044,0.952577995547468,0.952554674470656,
+        0.952532519447685,0.952510364424714,0.952488209401743,0.952466054378771,
+        0.9524438993558,0.952421744332829,0.952399589309858,0.952377434286886,
+        0.952349150006548,0.952322151375316,0.952296408494373,0.952271891464904,
+        0.952248570388093,0.952226415365121,0.952198131084783,0.952171132453551,
+        0.952145389572608,0.952120872543139,0.952097551466328,0.952075396443356,
+        0.952048397812124,0.952022654931182,0.951998137901713,0.951974816824901,
+        0.95195266180193,0.951926918920988,0.951902401891519,0.951879080814707,
+        0.951856925791736,0.951832408762267,0.951809087685455,0.951786932662484,
+        0.951763611585672,0.9517414565627,0.951719301539729,0.951691047158207,
+        0.951664048526975,0.951638305646033,0.951613788616564,0.951590467539752,
+        0.951568312516781,0.951541313885549,0.951515571004606,0.951491053975137,
+        0.951467732898326,0.951445577875354,0.951419834994412,0.951395317964943,
+        0.951371996888131,0.95134984186516,0.951325324835691,0.951302003758879,
+        0.951279848735908,0.951256527659096,0.951234372636125,0.951212217613154,
+        0.951185248880738,0.951159505999795,0.951134988970327,0.951111667893515,
+        0.951089512870544,0.951063769989601,0.951039252960132,0.95101593188332,
+        0.950993776860349,0.95096925983088,0.950945938754069,0.950923783731097,
+        0.950900462654285,0.950878307631314,0.950856152608343,0.950830439626217,
+        0.950805922596748,0.950782601519936,0.950760446496965,0.950735929467496,
+        0.950712608390684,0.950690453367713,0.950667132290901,0.95064497726793,
+        0.950622822244959,0.950598335114306,0.950575014037494,0.950552859014523,
+        0.950529537937711,0.95050738291474,0.950485227891769,0.950461906814957,
+        0.950439751791986,0.950417596769014,0.950395441746043,0.950368443114811,
+        0.950341444483579,0.950315701602636,0.950291184573168,0.950267863496356,
+        0.950245708473384,0.950218709842152,0.95019296696121,0.950168449931741,
+        0.950145128854929,0.950122973831958,0.950097230951016,0.950072713921547,
+        0.950049392844735,0.950027237821764,0.950002720792295,0.949979399715483,
+        0.949957244692512,0.9499339236157,0.949911768592729,0.949889613569757,
+        0.949862644837342,0.949836901956399,0.94981238492693,0.949789063850118,
+        0.949766908827147,0.949741165946205,0.949716648916736,0.949693327839924,
+        0.949671172816953,0.949646655787484,0.949623334710672,0.949601179687701,
+        0.949577858610889,0.949555703587918,0.949533548564947,0.949507835582821,
+        0.949483318553352,0.94945999747654,0.949437842453569,0.9494133254241,
+        0.949390004347288,0.949367849324317,0.949344528247505,0.949322373224534,
+        0.949300218201562,0.94927573107091,0.949252409994098,0.949230254971127,
+        0.949206933894315,0.949184778871344,0.949162623848372,0.94913930277156,
+        0.949117147748589,0.949094992725618,0.949072837702647,0.949047094821704,
+        0.949021351940762,0.948996834911293,0.948973513834481,0.94895135881151,
+        0.948925615930568,0.948901098901099,0.948877777824287,0.948855622801316,
+        0.948831105771847,0.948807784695035,0.948785629672064,0.948762308595252,
+        0.948740153572281,0.948717998549309,0.948692285567184,0.948667768537715,
+        0.948644447460903,0.948622292437932,0.948597775408463,0.948574454331651,
+        0.94855229930868,0.948528978231868,0.948506823208896,0.948484668185925,
+        0.948460181055273,0.948436859978461,0.94841470495549,0.948391383878678,
+        0.948369228855707,0.948347073832735,0.948323752755923,0.948301597732952,
+        0.948279442709981,0.94825728768701,0.948232770657541,0.948208253628072,
+        0.94818493255126,0.948162777528289,0.94813826049882,0.948114939422008,
+        0.948092784399037,0.948069463322225,0.948047308299254,0.948025153276282,
+        0.94800066614563,0.947977345068818,0.947955190045847,0.947931868969035,
+        0.947909713946064,0.947887558923093,0.947864237846281,0.947842082823309,
+        0.947819927800338,0.947797772777367,0.947774451700555,0.947751130623743,
+        0.947728975600772,0.94770565452396,0.947683499500989,0.947661344478018,
+        0.947638023401206,0.947615868378234,0.947593713355263,0.947571558332292,
+        0.947549403309321,0.947527248286349,0.947505093263378,0.947482938240407,
+        0.947460783217436,0.947433784586203,0.947408041705261,0.947383524675792,
+        0.94736020359898,0.947338048576009,0.947311049944777,0.947285307063835,
+        0.947260790034366,0.947237468957554,0.947215313934583,0.94718957105364,
+        0.947165054024171,0.94714173294736,0.947119577924388,0.947095060894919,
+        0.947071739818108,0.947049584795136,0.947026263718324,0.947004108695353,
+        0.946981953672382,0.946954984939966,0.946929242059024,0.946904725029555,
+        0.946881403952743,0.946859248929772,0.94683350604883,0.946808989019361,
+        0.946785667942549,0.946763512919578,0.946738995890109,0.946715674813297,
+        0.946693519790326,0.946670198713514,0.946648043690542,0.946625888667571,
+        0.946600175685445,0.946575658655976,0.946552337579165,0.946530182556193,
+        0.946505665526724,0.946482344449913,0.946460189426941,0.94643686835013,
+        0.946414713327158,0.946392558304187,0.946368071173534,0.946344750096723,
+        0.946322595073751,0.94629927399694,0.946277118973968,0.946254963950997,
+        0.946231642874185,0.946209487851214,0.946187332828243,0.946165177805271,
+        0.946139434924329,0.946113692043387,0.946089175013918,0.946065853937106,
+        0.946043698914135,0.946017956033192,0.945993439003724,0.945970117926912,
+        0.94594796290394,0.945923445874472,0.94590012479766,0.945877969774689,
+        0.945854648697877,0.945832493674905,0.945810338651934,0.945784625669808,
+        0.945760108640339,0.945736787563528,0.945714632540556,0.945690115511087,
+        0.945666794434275,0.945644639411304,0.945621318334492,0.945599163311521,
+        0.94557700828855,0.945552521157897,0.945529200081086,0.945507045058114,
+        0.945483723981302,0.945461568958331,0.94543941393536,0.945416092858548,
+        0.945393937835577,0.945371782812606,0.945349627789634,0.945325110760165,
+        0.945300593730697,0.945277272653885,0.945255117630913,0.945230600601445,
+        0.945207279524633,0.945185124501661,0.94516180342485,0.945139648401878,
+        0.945117493378907,0.945093006248255,0.945069685171443,0.945047530148472,
+        0.94502420907166,0.945002054048688,0.944979899025717,0.944956577948905,
+        0.944934422925934,0.944912267902963,0.944890112879992,0.94486679180318,
+        0.944843470726368,0.944821315703397,0.944797994626585,0.944775839603613,
+        0.944753684580642,0.94473036350383,0.944708208480859,0.944686053457888,
+        0.944663898434917,0.944641743411945,0.944619588388974,0.944597433366003,
+        0.944575278343032,0.94455312332006,0.944527380439118,0.944502863409649,
+        0.944479542332837,0.944457387309866,0.944431644428924,0.944407127399455,
+        0.944383806322643,0.944361651299672,0.944337134270203,0.944313813193391,
+        0.94429165817042,0.944268337093608,0.944246182070637,0.944224027047665,
+        0.944198314065539,0.944173797036071,0.944150475959259,0.944128320936287,
+        0.944103803906819,0.944080482830007,0.944058327807035,0.944035006730224,
+        0.944012851707252,0.943990696684281,0.943966209553629,0.943942888476817,
+        0.943920733453846,0.943897412377034,0.943875257354062,0.943853102331091,
+        0.943829781254279,0.943807626231308,0.943785471208337,0.943763316185365,
+        0.943738799155897,0.943714282126428,0.943690961049616,0.943668806026645,
+        0.943644288997176,0.943620967920364,0.943598812897393,0.943575491820581,
+        0.94355333679761,0.943531181774638,0.943506694643986,0.943483373567174,
+        0.943461218544203,0.943437897467391,0.94341574244442,0.943393587421448,
+        0.943370266344636,0.943348111321665,0.943325956298694,0.943303801275723,
+        0.943280480198911,0.943257159122099,0.943235004099128,0.943211683022316,
+        0.943189527999345,0.943167372976373,0.943144051899562,0.94312189687659,
+        0.943099741853619,0.943077586830648,0.943055431807676,0.943033276784705,
+        0.943011121761734,0.942988966738763,0.942966811715791,0.942942294686323,
+        0.942918973609511,0.942896818586539,0.942872301557071,0.942848980480259,
+        0.942826825457287,0.942803504380476,0.942781349357504,0.942759194334533,
+        0.942734707203881,0.942711386127069,0.942689231104098,0.942665910027286,
+        0.942643755004314,0.942621599981343,0.942598278904531,0.94257612388156,
+        0.942553968858589,0.942531813835617,0.942508492758806,0.942485171681994,
+        0.942463016659023,0.942439695582211,0.942417540559239,0.942395385536268,
+        0.942372064459456,0.942349909436485,0.942327754413514,0.942305599390542,
+        0.942283444367571,0.9422612893446,0.942239134321629,0.942216979298657,
+        0.942194824275686,0.942171503198874,0.942149348175903,0.942126027099091,
+        0.94210387207612,0.942081717053149,0.942058395976337,0.942036240953366,
+        0.942014085930394,0.941991930907423,0.941969775884452,0.941947620861481,
+        0.941925465838509,0.941903310815538,0.941881155792567,0.941859000769596,
+        0.941836845746624,0.941814690723653,0.941792535700682,0.936201606523204,
+        0.931690174112768,0.927178741702331,0.922667309291894,0.918155876881458,
+        0.913644444471021,0.909133012060585,0.904621579650148,0.900110147239711,
+        0.895598714829275,0.895265881204827,0.894993562784824,0.894781759569266,
+        0.894622907157597,0.894509441149263,0.894433797143706,0.894388410740372,
+        0.894365717538706,0.89435815313815,0.89435815313815,0.89435815313815,
+        0.894085834718147,0.893874031502589,0.89371517909092,0.893601713082586,
+        0.893526069077029,0.893480682673696,0.893457989472029,0.893450425071473,
+        0.893450425071473,0.893450425071473,0.893238621855915,0.893079769444247,
+        0.892966303435912,0.892890659430356,0.892845273027022,0.892822579825355,
+        0.892815015424799,0.892815015424799,0.892815015424799,0.892656163013131,
+        0.892542697004796,0.89246705299924,0.892421666595906,0.892398973394239,
+        0.892391408993684,0.892391408993684,0.892391408993684,0.892277942985349,
+        0.892202298979793,0.892156912576459,0.892134219374792,0.892126654974236,
+        0.892126654974236,0.892126654974236,0.89205101096868,0.892005624565346,
+        0.891982931363679,0.891975366963123,0.891975366963123,0.891975366963123,
+        0.89192998055979,0.891907287358123,0.891899722957567,0.891899722957567,
+        0.891899722957567,0.8918770297559,0.891869465355344,0.891869465355344,
+        0.891869465355344,0.891869465355344,0.891869465355344,0.891869465355344,
+        0.891869465355344,0.891869465355344,0.891869465355344,0.891536631730896,
+        0.891264313310893,0.891052510095335,0.890893657683667,0.890780191675332,
+        0.890704547669776,0.890659161266442,0.890636468064775,0.89062890366422,
+        0.89062890366422,0.89062890366422,0.890364149644772,0.890152346429214,
+        0.889993494017546,0.889880028009211,0.889804384003655,0.889758997600321,
+        0.889736304398654,0.889728739998098,0.889728739998098,0.889728739998098,
+        0.889516936782541,0.889358084370872,0.889244618362538,0.889168974356981,
+        0.889123587953647,0.88910089475198,0.889093330351425,0.889093330351425,
+        0.889093330351425,0.888934477939756,0.888821011931422,0.888745367925865,
+        0.888699981522531,0.888677288320865,0.888669723920309,0.888669723920309,
+        0.888669723920309,0.888556257911974,0.888480613906418,0.888435227503084,
+        0.888412534301417,0.888404969900861,0.888404969900861,0.888404969900861,
+        0.888329325895305,0.888283939491971,0.888261246290304,0.888253681889749,
+        0.888253681889749,0.888253681889749,0.888208295486415,0.888185602284748,
+        0.888178037884192,0.888178037884192,0.888178037884192,0.888155344682525,
+        0.88814778028197,0.88814778028197,0.88814778028197,0.888140215881414,
+        0.888140215881414,0.888140215881414,0.888140215881414,0.888140215881414,
+        0.888140215881414,0.887807382256966,0.887535063836963,0.887323260621405,
+        0.887164408209737,0.887050942201402,0.886975298195846,0.886929911792512,
+        0.886907218590845,0.886899654190289,0.886899654190289,0.886899654190289,
+        0.886634900170842,0.886423096955284,0.886264244543616,0.886150778535281,
+        0.886075134529725,0.886029748126391,0.886007054924724,0.885999490524168,
+        0.885999490524168,0.885999490524168,0.885795251709166,0.885636399297497,
+        0.885522933289163,0.885447289283606,0.885401902880273,0.885379209678606,
+        0.88537164527805,0.88537164527805,0.88537164527805,0.885212792866382,
+        0.885099326858047,0.885023682852491,0.884978296449157,0.88495560324749,
+        0.884948038846934,0.884948038846934,0.884948038846934,0.8848345728386,
+        0.884758928833043,0.884713542429709,0.884690849228042,0.884683284827487,
+        0.884683284827487,0.884683284827487,0.88460764082193,0.884562254418597,
+        0.88453956121693,0.884531996816374,0.884531996816374,0.884531996816374,
+        0.88448661041304,0.884463917211373,0.884456352810818,0.884456352810818,
+        0.884456352810818,0.884433659609151,0.884426095208595,0.884426095208595,
+        0.884426095208595,0.884418530808039,0.884418530808039,0.884418530808039,
+        0.884418530808039,0.884418530808039,0.884418530808039,0.884085697183591,
+        0.883813378763588,0.88360157554803,0.883442723136362,0.883329257128027,
+        0.883253613122471,0.883208226719137,0.88318553351747,0.883177969116914,
+        0.883177969116914,0.883177969116914,0.882913215097467,0.882701411881909,
+        0.882542559470241,0.882429093461906,0.88235344945635,0.882308063053016,
+        0.882285369851349,0.882277805450793,0.882277805450793,0.882277805450793,
+        0.882073566635791,0.881914714224123,0.881801248215788,0.881725604210232,
+        0.881680217806898,0.881657524605231,0.881649960204675,0.881649960204675,
+        0.881649960204675,0.881498672193563,0.881385206185228,0.881309562179672,
+        0.881264175776338,0.881241482574671,0.881233918174115,0.881233918174115,
+        0.881233918174115,0.881120452165781,0.881044808160224,0.88099942175689,
+        0.880976728555223,0.880969164154668,0.880969164154668,0.880969164154668,
+        0.880893520149111,0.880848133745778,0.880825440544111,0.880817876143555,
+        0.880817876143555,0.880817876143555,0.880772489740221,0.880749796538554,
+        0.880742232137999,0.880742232137999,0.880742232137999,0.880719538936332,
+        0.880711974535776,0.880711974535776,0.880711974535776,0.88070441013522,
+        0.88070441013522,0.88070441013522,0.88070441013522,0.88070441013522,
+        0.88070441013522,0.880371576510772,0.880099258090769,0.879887454875211,
+        0.879728602463543,0.879615136455208,0.879539492449652,0.879494106046318,
+        0.879471412844651,0.879463848444096,0.879463848444096,0.879463848444096,
+        0.879199094424648,0.87898729120909,0.878828438797422,0.878714972789087,
+        0.878639328783531,0.878593942380197,0.87857124917853,0.878563684777974,
+        0.878563684777974,0.878563684777974,0.878359445962972,0.878200593551304,
+        0.878087127542969,0.878011483537413,0.877966097134079,0.877943403932412,
+        0.877935839531856,0.877935839531856,0.877935839531856,0.877784551520744,
+        0.877671085512409,0.877595441506853,0.877550055103519,0.877527361901852,
+        0.877519797501296,0.877519797501296,0.877519797501296,0.877413895893517,
+        0.877338251887961,0.877292865484627,0.87727017228296,0.877262607882404,
+        0.877262607882404,0.877262607882404,0.877186963876848,0.877141577473514,
+        0.877118884271847,0.877111319871292,0.877111319871292,0.877111319871292,
+        0.877065933467958,0.877043240266291,0.877035675865735,0.877035675865735,
+        0.877035675865735,0.877012982664068,0.877005418263513,0.877005418263513,
+        0.877005418263513,0.876997853862957,0.876997853862957,0.876997853862957,
+        0.876997853862957,0.876997853862957,0.876997853862957,0.876657455837953,
+        0.87638513741795,0.876173334202392,0.876014481790724,0.875901015782389,
+        0.875825371776833,0.875779985373499,0.875757292171832,0.875749727771276,
+        0.875749727771276,0.875749727771276,0.875484973751829,0.875273170536271,
+        0.875114318124603,0.875000852116268,0.874925208110712,0.874879821707378,
+        0.874857128505711,0.874849564105155,0.874849564105155,0.874849564105155,
+        0.874645325290153,0.874486472878485,0.87437300687015,0.874297362864594,
+        0.87425197646126,0.874229283259593,0.874221718859037,0.874221718859037,
+        0.874221718859037,0.874070430847924,0.87395696483959,0.873881320834033,
+        0.8738359344307,0.873813241229033,0.873805676828477,0.873805676828477,
+        0.873805676828477,0.873699775220698,0.873624131215142,0.873578744811808,
+        0.873556051610141,0.873548487209585,0.873548487209585,0.873548487209585,
+        0.873480407604585,0.873435021201251,0.873412327999584,0.873404763599028,
+        0.873404763599028,0.873404763599028,0.873359377195694,0.873336683994027,
+        0.873329119593472,0.873329119593472,0.873329119593472,0.873306426391805,
+        0.873298861991249,0.873298861991249,0.873298861991249,0.873291297590694,
+        0.873291297590694,0.873291297590694,0.873291297590694,0.873291297590694,
+        0.873291297590694,0.87295089956569,0.872678581145687,0.872466777930129,
+        0.87230792551846,0.872194459510126,0.872118815504569,0.872073429101236,
+        0.872050735899569,0.872043171499013,0.872043171499013,0.872043171499013,
+        0.87177085307901,0.871559049863452,0.871400197451784,0.871286731443449,
+        0.871211087437893,0.871165701034559,0.871143007832892,0.871135443432336,
+        0.871135443432336,0.871135443432336,0.870931204617334,0.870772352205666,
+        0.870658886197331,0.870583242191775,0.870537855788441,0.870515162586774,
+        0.870507598186218,0.870507598186218,0.870507598186218,0.870356310175105,
+        0.870242844166771,0.870167200161214,0.870121813757881,0.870099120556214,
+        0.870091556155658,0.870091556155658,0.870091556155658,0.869985654547879,
+        0.869910010542323,0.869864624138989,0.869841930937322,0.869834366536766,
+        0.869834366536766,0.869834366536766,0.869766286931765,0.869720900528432,
+        0.869698207326765,0.869690642926209,0.869690642926209,0.869690642926209,
+        0.869652820923431,0.869630127721764,0.869622563321208,0.869622563321208,
+        0.869622563321208,0.869599870119541,0.869592305718986,0.869592305718986,
+        0.869592305718986,0.86958474131843,0.86958474131843,0.86958474131843,
+        0.86958474131843,0.86958474131843,0.86958474131843,0.869244343293426,
+        0.868972024873423,0.868760221657865,0.868601369246197,0.868487903237862,
+        0.868412259232306,0.868366872828972,0.868344179627305,0.86833661522675,
+        0.86833661522675,0.86833661522675,0.868064296806747,0.867852493591189,
+        0.86769364117952,0.867580175171186,0.867504531165629,0.867459144762295,
+        0.867436451560629,0.867428887160073,0.867428887160073,0.867428887160073,
+        0.867217083944515,0.867058231532847,0.866944765524512,0.866869121518956,
+        0.866823735115622,0.866801041913955,0.866793477513399,0.866793477513399,
+        0.866793477513399,0.866642189502286,0.866528723493952,0.866453079488395,
+        0.866407693085061,0.866384999883395,0.866377435482839,0.866377435482839,
+        0.866377435482839,0.86627153387506,0.866195889869504,0.86615050346617,
+        0.866127810264503,0.866120245863947,0.866120245863947,0.866120245863947,
+        0.866052166258946,0.866006779855613,0.865984086653946,0.86597652225339,
+        0.86597652225339,0.86597652225339,0.865938700250612,0.865916007048945,
+        0.865908442648389,0.865908442648389,0.865908442648389,0.865893313847278,
+        0.865885749446722,0.865885749446722,0.865885749446722,0.865878185046167,
+        0.865878185046167,0.865878185046167,0.865878185046167,0.865878185046167,
+        0.865878185046167,0.865537787021163,0.86526546860116,0.865053665385602,
+        0.864894812973934,0.864781346965599,0.864705702960043,0.864660316556709,
+        0.864637623355042,0.864630058954486,0.864630058954486,0.864630058954486,
+        0.864357740534483,0.864145937318925,0.863987084907257,0.863873618898922,
+        0.863797974893366,0.863752588490032,0.863729895288365,0.863722330887809,
+        0.863722330887809,0.863722330887809,0.863510527672252,0.863351675260583,
+        0.863238209252249,0.863162565246692,0.863117178843358,0.863094485641691,
+        0.863086921241136,0.863086921241136,0.863086921241136,0.862928068829467,
+        0.862814602821133,0.862738958815576,0.862693572412243,0.862670879210576,
+        0.86266331481002,0.86266331481002,0.86266331481002,0.862557413202241,
+        0.862481769196685,0.862436382793351,0.862413689591684,0.862406125191128,
+        0.862406125191128,0.862406125191128,0.862338045586127,0.862292659182794,
+        0.862269965981127,0.862262401580571,0.862262401580571,0.862262401580571,
+        0.862224579577793,0.862201886376126,0.86219432197557,0.86219432197557,
+        0.86219432197557,0.862179193174459,0.862171628773903,0.862171628773903,
+        0.862171628773903,0.862171628773903,0.862171628773903,0.862171628773903,
+        0.862171628773903,0.862171628773903,0.862171628773903,0.8618312307489,
+        0.861558912328897,0.861347109113339,0.86118825670167,0.861074790693336,
+        0.860999146687779,0.860953760284445,0.860931067082778,0.860931067082778,
+        0.860931067082778,0.860931067082778,0.860658748662775,0.860446945447218,
+        0.860288093035549,0.860174627027214,0.860098983021658,0.860053596618324,
+        0.860030903416657,0.860023339016102,0.860023339016102,0.860023339016102,
+        0.859811535800544,0.859652683388875,0.859539217380541,0.859463573374984,
+        0.859418186971651,0.859395493769984,0.859387929369428,0.859387929369428,
+        0.859387929369428,0.85922907695776,0.859115610949425,0.859039966943869,
+        0.858994580540535,0.858971887338868,0.858964322938312,0.858964322938312,
+        0.858964322938312,0.858850856929978,0.858775212924421,0.858729826521087,
+        0.85870713331942,0.858699568918865,0.858699568918865,0.858699568918865,
+        0.858631489313864,0.85858610291053,0.858563409708863,0.858555845308308,
+        0.858555845308308,0.858555845308308,0.858518023305529,0.858495330103862,
+        0.858487765703307,0.858487765703307,0.858487765703307,0.858472636902196,
+        0.85846507250164,0.85846507250164,0.85846507250164,0.85846507250164,
+        0.85846507250164,0.85846507250164,0.85846507250164,0.85846507250164,
+        0.85846507250164,0.858124674476636,0.857852356056633,0.857640552841075,
+        0.857481700429407,0.857368234421072,0.857292590415516,0.857247204012182,
+        0.857224510810515,0.857224510810515,0.857224510810515,0.857224510810515,
+        0.856952192390512,0.856740389174954,0.856581536763286,0.856468070754951,
+        0.856392426749395,0.856347040346061,0.856324347144394,0.856316782743838,
+        0.856316782743838,0.856316782743838,0.85610497952828,0.855946127116612,
+        0.855832661108277,0.855757017102721,0.855711630699387,0.85568893749772,
+        0.855681373097165,0.855681373097165,0.855681373097165,0.855522520685496,
+        0.855409054677162,0.855333410671605,0.855288024268271,0.855265331066604,
+        0.855257766666049,0.855257766666049,0.855257766666049,0.855144300657714,
+        0.855068656652158,0.855023270248824,0.855000577047157,0.854993012646601,
+        0.854993012646601,0.854993012646601,0.854917368641045,0.854871982237711,
+        0.854849289036044,0.854841724635489,0.854841724635489,0.854841724635489,
+        0.85480390263271,0.854781209431043,0.854773645030488,0.854773645030488,
+        0.854773645030488,0.854758516229377,0.854750951828821,0.854750951828821,
+        0.854750951828821,0.854750951828821,0.854750951828821,0.854750951828821,
+        0.854750951828821,0.854750951828821,0.854750951828821,0.854410553803817,
+        0.854138235383814,0.853926432168256,0.853767579756588,0.853654113748253,
+        0.853578469742697,0.853533083339363,0.853510390137696,0.853510390137696,
+        0.853510390137696,0.853510390137696,0.853238071717693,0.853026268502135,
+        0.852867416090467,0.852753950082132,0.852678306076576,0.852632919673242,
+        0.852610226471575,0.852602662071019,0.852602662071019,0.852602662071019,
+        0.852390858855461,0.852232006443793,0.852118540435458,0.852042896429902,
+        0.851997510026568,0.851974816824901,0.851967252424346,0.851967252424346,
+        0.851967252424346,0.851808400012677,0.851694934004342,0.851619289998786,
+        0.851573903595452,0.851551210393785,0.85154364599323,0.85154364599323,
+        0.85154364599323,0.851430179984895,0.851354535979339,0.851309149576005,
+        0.851286456374338,0.851278891973782,0.851278891973782,0.851278891973782,
+        0.851203247968226,0.851157861564892,0.851135168363225,0.85112760396267,
+        0.85112760396267,0.85112760396267,0.851082217559336,0.851059524357669,
+        0.851051959957113,0.851051959957113,0.851051959957113,0.851036831156002,
+        0.851029266755446,0.851029266755446,0.851029266755446,0.851029266755446,
+        0.851029266755446,0.851029266755446,0.851029266755446,0.851029266755446,
+        0.851029266755446,0.850688868730442,0.850416550310439,0.850204747094881,
+        0.850045894683213,0.849932428674879,0.849856784669322,0.849811398265988,
+        0.849788705064321,0.849788705064321,0.849788705064321,0.849788705064321,
+        0.849516386644318,0.84930458342876,0.849145731017092,0.849032265008757,
+        0.848956621003201,0.848911234599867,0.8488885413982,0.848880976997645,
+        0.848880976997645,0.848880976997645,0.848669173782087,0.848510321370418,
+        0.848396855362084,0.848321211356527,0.848275824953193,0.848253131751527,
+        0.848245567350971,0.848245567350971,0.848245567350971,0.848086714939302,
+        0.847973248930968,0.847897604925411,0.847852218522078,0.847829525320411,
+        0.847821960919855,0.847821960919855,0.847821960919855,0.84770849491152,
+        0.847632850905964,0.84758746450263,0.847564771300963,0.847557206900408,
+        0.847557206900408,0.847557206900408,0.847481562894851,0.847436176491517,
+        0.84741348328985,0.847405918889295,0.847405918889295,0.847405918889295,
+        0.847360532485961,0.847337839284294,0.847330274883738,0.847330274883738,
+        0.847330274883738,0.847307581682072,0.847300017281516,0.847300017281516,
+        0.847300017281516,0.847300017281516,0.847300017281516,0.847300017281516,
+        0.847300017281516,0.847300017281516,0.847300017281516,0.846424938722376,
+        0.845698397483237,0.8451203935641,0.844673974336052,0.844342187170179,
+        0.844108079437567,0.843954698509305,0.843865091756478,0.843822306550173,
+        0.843809390261477,0.843809390261477,0.842998893145816,0.842272351906677,
+        0.841694347987541,0.841247928759492,0.840916141593619,0.840682033861008,
+        0.840528652932745,0.840439046179918,0.840396260973613,0.840383344684917,
+        0.840383344684917,0.839579305713604,0.838910887773597,0.83833288385446,
+        0.837886464626411,0.837554677460538,0.837320569727927,0.837167188799664,
+        0.837077582046837,0.837034796840532,0.837021880551836,0.837021880551836,
+        0.836224299724871,0.835562339929212,0.835036001164858,0.834589581936809,
+        0.834257794770936,0.834023687038325,0.833870306110062,0.833780699357235,
+        0.83373791415093,0.833724997862235,0.833724997862235,0.832916922550704,
+        0.832261420899392,0.831741540279387,0.831340328061773,0.8310085408959,
+        0.830774433163289,0.830621052235026,0.830531445482199,0.830488660275894,
+        0.830475743987198,0.830475743987198,0.829674126820016,0.829025083313052,
+        0.828511660837394,0.828116906764129,0.827823868464343,0.827589760731732,
+        0.827436379803469,0.827346773050642,0.827303987844337,0.827291071555641,
+        0.827291071555641,0.826495912532807,0.825853327170191,0.825346362838881,
+        0.824958066909963,0.824671486754525,0.824469669743654,0.824316288815391,
+        0.824226682062564,0.824183896856259,0.824170980567563,0.824170980567563,
+        0.823382279689076,0.822746152470808,0.822245646283846,0.821863808499277,
+        0.821583686488187,0.821388327621663,0.821260779270792,0.821171172517965,
+        0.82112838731166,0.821115471022964,0.821115471022964,0.820333228288825,
+        0.819703559214905,0.819209511172291,0.818834131532069,0.818560467665327,
+        0.818371566943151,0.818250476736628,0.818180244416845,0.818154411839453,
+        0.818141495550757,0.818141495550757,0.817365710960966,0.816742500031394,
+        0.816254910133127,0.815885988637254,0.81561878291486,0.815436340337031,
+        0.815321708274856,0.815257934099421,0.815245017810725,0.815232101522029,
+        0.815232101522029,0.814462775076586,0.813846022291362,0.813364890537443,
+        0.813002427185917,0.812741679607871,0.812565695174391,0.812457521256564,
+        0.812400205225476,0.812393747081128,0.81238728893678,0.81238728893678,
+        0.811624420635685,0.811014125994808,0.810539452385238,0.81018344717806,
+        0.809929157744362,0.809759631455229,0.80965791568175,0.80960705779501,
+        0.80960705779501,0.80960705779501,0.80960705779501,0.808796560679349,
+        0.808086972069124,0.807508968149987,0.807062548921938,0.806730761756065,
+        0.806496654023454,0.806343273095191,0.806253666342364,0.806210881136059,
+        0.806197964847364,0.806197964847364,0.80539392587605,0.804742460564956,
+        0.804164456645819,0.803718037417771,0.803386250251898,0.803152142519286,
+        0.802998761591024,0.802909154838197,0.802866369631892,0.802853453343196,
+        0.802853453343196,0.802055872516231,0.801410865349484,0.800884526585131,
+        0.800438107357082,0.800106320191209,0.799872212458598,0.799718831530335,
+        0.799629224777508,0.799586439571203,0.799573523282507,0.799573523282507,
+        0.798765447970977,0.798126898948578,0.797607018328572,0.797205806110959,
+        0.796874018945086,0.796639911212475,0.796486530284212,0.796396923531385,
+        0.79635413832508,0.796341222036384,0.796341222036384,0.795539604869202,
+        0.794890561362238,0.79437713888658,0.793982384813315,0.793689346513529,
+        0.793455238780918,0.793301857852655,0.793212251099828,0.793169465893523,
+        0.793156549604827,0.793156549604827,0.792361390581992,0.791718805219377,
+        0.791211840888067,0.790823544959149,0.790536964803711,0.790335147792839,
+        0.790181766864577,0.79009216011175,0.790049374905445,0.790036458616749,
+        0.790036458616749,0.789247757738262,0.788611630519994,0.788111124333032,
+        0.787729286548463,0.787449164537373,0.787253805670849,0.787126257319978,
+        0.787036650567151,0.786993865360846,0.78698094907215,0.78698094907215,
+        0.786198706338011,0.785569037264091,0.785074989221477,0.784699609581255,
+        0.784425945714513,0.784237044992337,0.784115954785814,0.78404572246603,
+        0.784002937259726,0.78399002097103,0.78399002097103,0.783214236381239,
+        0.782591025451666,0.7821034355534,0.781734514057526,0.781467308335132,
+        0.781284865757304,0.781170233695129,0.781106459519693,0.781076590602084,
+        0.781063674313389,0.781063674313389,0.780294347867945,0.779677595082721,
+        0.779196463328803,0.778833999977277,0.77857325239923,0.77839726796575,
+        0.778289094047923,0.778231778016835,0.778208367243574,0.778201909099226,
+        0.778201909099226,0.777439040798131,0.776828746157255,0.776354072547684,
+        0.775998067340506,0.775743777906808,0.775574251617675,0.775472535844196,
+        0.775421677957456,0.775404725328543,0.775404725328543,0.775404725328543,
+        0.77460068635723,0.773949221046136,0.773388169755912,0.772941750527864,
+        0.77260996336199,0.772375855629379,0.772222474701116,0.772132867948289,
+        0.772090082741985,0.772077166453289,0.772077166453289,0.771279585626323,
+        0.770634578459577,0.770125192324137,0.769678773096088,0.769346985930215,
+        0.769112878197604,0.768959497269341,0.768869890516514,0.768827105310209,
+        0.768814189021513,0.768814189021513,0.768006113709983,0.767367564687584,
+        0.766864636696492,0.766463424478879,0.766131637313005,0.765897529580394,
+        0.765744148652131,0.765654541899304,0.765611756693,0.765598840404304,
+        0.765598840404304,0.764797223237121,0.764148179730157,0.763651709883413,
+        0.763256955810147,0.762963917510361,0.76272980977775,0.762576428849488,
+        0.762486822096661,0.762444036890356,0.76243112060166,0.76243112060166,
+        0.761635961578825,0.760993376216209,0.760486411884899,0.760098115955982,
+        0.759811535800544,0.759609718789672,0.759456337861409,0.759366731108582,
+        0.759323945902277,0.759311029613582,0.759311029613582,0.758522328735095,
+        0.757886201516827,0.757385695329865,0.757003857545295,0.756723735534205,
+        0.756528376667681,0.75640082831681,0.756311221563983,0.756268436357678,
+        0.756255520068983,0.756255520068983,0.755473277334843,0.754843608260923,
+        0.754349560218309,0.753974180578088,0.753700516711345,0.753511615989169,
+        0.753390525782646,0.753320293462863,0.753277508256558,0.753264591967862,
+        0.753264591967862,0.752488807378071,0.751865596448499,0.751378006550233,
+        0.751009085054359,0.750741879331965,0.750559436754137,0.750444804691962,
+        0.750381030516526,0.750351161598917,0.750338245310221,0.750338245310221,
+        0.749568918864778,0.748952166079554,0.748471034325635,0.748108570974109,
+        0.747847823396063,0.747671838962583,0.747563665044756,0.747506349013668,
+        0.747482938240407,0.747476480096059,0.747476480096059,0.746713611794964,
+        0.746103317154087,0.745628643544517,0.745272638337339,0.74501834890364,
+        0.744848822614508,0.744747106841029,0.744696248954289,0.744679296325376,
+        0.744679296325376,0.744679296325376,0.74388171549841,0.743236708331664,
+        0.742727322196224,0.742297855597088,0.741966068431215,0.741731960698604,
+        0.741578579770341,0.741488973017514,0.741446187811209,0.741433271522513,
+        0.741433271522513,0.740625196210983,0.739986647188584,0.739483719197492,
+        0.739099459608792,0.738767672442919,0.738533564710307,0.738380183782045,
+        0.738290577029218,0.738247791822913,0.738234875534217,0.738234875534217,
+        0.737433258367034,0.736784214860071,0.736287745013326,0.735909943568974,
+        0.735616905269188,0.735382797536577,0.735229416608314,0.735139809855487,
+        0.735097024649182,0.735084108360486,0.735084108360486,0.734288949337652,
+        0.733646363975036,0.733139399643726,0.732768056343722,0.732481476188284,
+        0.732279659177412,0.732126278249149,0.732036671496322,0.731993886290017,
+        0.731980970001322,0.731980970001322,0.731192269122835,0.730556141904567,
+        0.730055635717604,0.729673797933035,0.729393675921945,0.729198317055421,
+        0.72907076870455,0.728981161951723,0.728938376745418,0.728925460456722,
+        0.728925460456722,0.728143217722583,0.727513548648663,0.727019500606049,
+        0.726644120965827,0.726370457099085,0.726181556376909,0.726060466170386,
+        0.725990233850603,0.725947448644298,0.725934532355602,0.725934532355602,
+        0.725158747765811,0.724535536836239,0.724047946937972,0.723679025442099,
+        0.723411819719705,0.723229377141877,0.723114745079701,0.723050970904266,
+        0.723021101986657,0.723008185697961,0.723008185697961,0.722238859252518,
+        0.721622106467293,0.721140974713375,0.720778511361849,0.720517763783803,
+        0.720341779350323,0.720233605432495,0.720176289401408,0.720152878628147,
+        0.720146420483799,0.720146420483799,0.719383552182703,0.718773257541827,
+        0.718298583932256,0.717942578725079,0.71768828929138,0.717518763002248,
+        0.717417047228768,0.717366189342029,0.717349236713115,0.717349236713115,
+        0.717349236713115,0.716541161401585,0.715902612379186,0.715399684388094,
+        0.715015424799394,0.714700590262434,0.714466482529823,0.71431310160156,
+        0.714223494848733,0.714180709642428,0.714167793353732,0.714167793353732,
+        0.71336617618655,0.712717132679586,0.712220662832841,0.711842861388489,
+        0.711566775717616,0.711332667985005,0.711179287056743,0.711089680303916,
+        0.711046895097611,0.711033978808915,0.711033978808915,0.71023881978608,
+        0.709596234423464,0.709089270092154,0.70871792679215,0.708448299265625,
+        0.708246482254754,0.708093101326491,0.708003494573664,0.707960709367359,
+        0.707947793078663,0.707947793078663,0.707159092200176,0.706522964981908,
+        0.706022458794946,0.705640621010377,0.7053774516282,0.705182092761676,
+        0.705054544410805,0.704964937657978,0.704922152451673,0.704909236162977,
+        0.704909236162977,0.704126993428838,0.703497324354918,0.703003276312304,
+        0.702627896672082,0.70235423280534,0.702165332083164,0.702044241876641,
+        0.701974009556858,0.701931224350553,0.701918308061857,0.701918308061857,
+        0.701142523472066,0.700519312542494,0.700031722644227,0.699662801148354,
+        0.699395595425959,0.699213152848131,0.699098520785956,0.699034746610521,
+        0.699004877692912,0.698991961404216,0.698991961404216,0.698222634958773,
+        0.697605882173548,0.69712475041963,0.696762287068104,0.696501539490058,
+        0.696325555056578,0.69621738113875,0.696160065107663,0.696136654334402,
+        0.696130196190054,0.696130196190054,0.695367327888958,0.694757033248082,
+        0.694282359638511,0.693926354431333,0.693672064997635,0.693502538708503,
+        0.693400822935023,0.693349965048284,0.69333301241937,0.69333301241937,
+        0.69333301241937,0.692531395252188,0.691882351745224,0.691385881898479,
+        0.691008080454127,0.690731994783255,0.690514839679556,0.690361458751294,
+        0.690271851998467,0.690229066792162,0.690216150503466,0.690216150503466,
+        0.689420991480631,0.688778406118015,0.688271441786705,0.687900098486701,
+        0.687630470960177,0.687445606578218,0.687292225649955,0.687202618897128,
+        0.687159833690824,0.687146917402128,0.687146917402128,0.686358216523641,
+        0.685722089305373,0.685221583118411,0.684839745333841,0.684576575951664,
+        0.684398169714054,0.684270621363183,0.684181014610356,0.684138229404051,
+        0.684125313115355,0.684125313115355,0.683343070381216,0.682713401307296,
+        0.682219353264682,0.68184397362446,0.681570309757718,0.681398361664455,
+        0.681277271457932,0.681207039138149,0.681164253931844,0.681151337643148,
+        0.681151337643148,0.680375553053357,0.679752342123785,0.679264752225518,
+        0.678895830729645,0.67862862500725,0.678446182429422,0.678331550367247,
+        0.678267776191812,0.678237907274203,0.678224990985507,0.678224990985507,
+        0.677455664540064,0.676838911754839,0.676357780000921,0.675995316649395,
+        0.675734569071349,0.675558584637869,0.675450410720041,0.675393094688954,
+        0.675369683915693,0.675363225771345,0.675363225771345,0.674600357470249,
+        0.673990062829373,0.673515389219802,0.673159384012624,0.672905094578926,
+        0.672735568289794,0.672633852516314,0.672582994629575,0.672566042000661,
+        0.672566042000661,0.672566042000661,0.671770882977826,0.671128297615211,
+        0.670621333283901,0.670249989983897,0.669980362457372,0.669795498075413,
+        0.669659069776064,0.669569463023237,0.669526677816932,0.669513761528236,
+        0.669513761528236,0.668725060649749,0.668088933431481,0.667588427244519,
+        0.66720658945995,0.666943420077773,0.666765013840162,0.666654418118204,
+        0.666564811365377,0.666522026159072,0.666509109870377,0.666509109870377,
+        0.665726867136238,0.665097198062317,0.664603150019703,0.664227770379482,
+        0.66395410651274,0.663782158419477,0.663678020841867,0.663607788522084,
+        0.663565003315779,0.663552087027083,0.663552087027083,0.662776302437292,
+        0.66215309150772,0.661665501609453,0.66129658011358,0.661029374391185,
+        0.660846931813357,0.660749252380095,0.66068547820466,0.660655609287051,
+        0.660642692998355,0.660642692998355,0.659873366552912,0.659256613767687,
+        0.658775482013769,0.658413018662243,0.658152271084197,0.657976286650717,
+        0.657868112732889,0.657810796701802,0.657787385928541,0.657780927784193,
+        0.657780927784193,0.657018059483097,0.656407764842221,0.65593309123265,
+        0.655577086025473,0.655322796591774,0.655153270302642,0.655051554529162,
+        0.655000696642423,0.654983744013509,0.654983744013509,0.654983744013509,
+        0.654195043135022,0.653558915916755,0.653058409729792,0.652676571945223,
+        0.652413402563046,0.652234996325435,0.652124400603478,0.652051746479564,
+        0.652008961273259,0.651996044984563,0.651996044984563,0.651213802250424,
+        0.650584133176504,0.65009008513389,0.649714705493668,0.649441041626926,
+        0.649269093533663,0.649164955956054,0.649111676265183,0.649068891058879,
+        0.649055974770183,0.649055974770183,0.648280190180392,0.647656979250819,
+        0.647169389352553,0.646800467856679,0.646533262134285,0.646350819556457,
+        0.646253140123195,0.646206318576673,0.646176449659064,0.646163533370368,
+        0.646163533370368,0.645394206924925,0.6447774541397,0.644296322385782,
+        0.643933859034256,0.64367311145621,0.64349712702273,0.643388953104902,
+        0.643348589702728,0.643325178929467,0.643318720785119,0.643318720785119,
+        0.642555852484024,0.641945557843147,0.641470884233577,0.641114879026399,
+        0.6408605895927,0.640691063303568,0.640589347530089,0.640538489643349,
+        0.640521537014436,0.640521537014436,0.640521537014436,0.639739294280297,
+        0.639109625206377,0.638615577163762,0.638240197523541,0.637966533656799,
+        0.637794585563536,0.637690447985926,0.637637168295056,0.637611335717664,
+        0.637598419428968,0.637598419428968,0.636822634839177,0.636199423909605,
+        0.635711834011339,0.635342912515465,0.635075706793071,0.634893264215243,
+        0.634795584781981,0.634748763235459,0.634735846946763,0.634722930658067,
+        0.634722930658067,0.633953604212624,0.633336851427399,0.632855719673481,
+        0.632493256321955,0.632232508743909,0.632056524310429,0.631948350392601,
+        0.631907986990427,0.631901528846079,0.631895070701731,0.631895070701731,
+        0.631132202400636,0.630521907759759,0.630047234150189,0.629691228943011,
+        0.629436939509313,0.62926741322018,0.629165697446701,0.629114839559961,
+        0.629114839559961,0.629114839559961,0.629114839559961,0.628356007599083,
+        0.627732796669511,0.627245206771245,0.626876285275371,0.626609079552977,
+        0.626426636975149,0.626328957541887,0.626282135995365,0.626269219706669,
+        0.626256303417973,0.626256303417973,0.625503929601443,0.624887176816219,
+        0.6244060450623,0.624043581710774,0.623782834132728,0.623606849699248,
+        0.62349867578142,0.623458312379246,0.623451854234898,0.62344539609055,
+        0.62344539609055,0.622699480418368,0.622089185777492,0.621614512167921,
+        0.621258506960743,0.621004217527045,0.620834691237913,0.620732975464433,
+        0.620682117577694,0.620682117577694,0.620682117577694,0.620682117577694,
+        0.619929743761163,0.619312990975939,0.618831859222021,0.618469395870495,
+        0.618208648292449,0.618032663858968,0.617924489941141,0.617884126538967,
+        0.617877668394619,0.617871210250271,0.617871210250271,0.617125294578089,
+        0.616514999937212,0.616040326327642,0.615684321120464,0.615430031686766,
+        0.615260505397633,0.615158789624154,0.615107931737414,0.615107931737414,
+        0.615107931737414,0.615107931737414,0.614362016065232,0.613751721424356,
+        0.613277047814785,0.612921042607607,0.612666753173909,0.612497226884777,
+        0.612395511111297,0.612344653224557,0.612344653224557,0.612344653224557,
+        0.612344653224557,0.611101460437587,0.609858267650617,0.608925873060389,
+        0.608259876924512,0.607815879500594,0.607549481046243,0.607416281819068,
+        0.607371882076676,0.607371882076676,0.607371882076676,0.606128689289706,
+        0.605196294699478,0.604530298563601,0.604086301139683,0.603819902685332,
+        0.603686703458157,0.603642303715765,0.603642303715765,0.603642303715765,
+        0.602709909125537,0.60204391298966,0.601599915565742,0.601333517111392,
+        0.601200317884216,0.601155918141824,0.601155918141824,0.601155918141824,
+        0.600489922005947,0.60004592458203,0.599779526127679,0.599646326900503,
+        0.599601927158112,0.599601927158112,0.599601927158112,0.599157929734194,
+        0.598891531279843,0.598758332052667,0.598713932310276,0.598713932310276,
+        0.598713932310276,0.598447533855925,0.598314334628749,0.598269934886358,
+        0.598269934886358,0.598269934886358,0.598136735659182,0.59809233591679,
+        0.59809233591679,0.59809233591679,0.59809233591679,0.59809233591679,
+        0.59809233591679,0.59809233591679,0.59809233591679,0.59809233591679,
+        0.596893542872212,0.595961148281984,0.595295152146107,0.594851154722189,
+        0.594584756267838,0.594451557040663,0.594407157298271,0.594407157298271,
+        0.594407157298271,0.593474762708043,0.592808766572167,0.592364769148249,
+        0.592098370693898,0.591965171466722,0.591920771724331,0.591920771724331,
+        0.591920771724331,0.591254775588454,0.590810778164536,0.590544379710185,
+        0.590411180483009,0.590366780740618,0.590366780740618,0.590366780740618,
+        0.5899227833167,0.589656384862349,0.589523185635173,0.589478785892782,
+        0.589478785892782,0.589478785892782,0.589212387438431,0.589079188211255,
+        0.589034788468864,0.589034788468864,0.589034788468864,0.588901589241688,
+        0.588857189499296,0.588857189499296,0.588857189499296,0.588857189499296,
+        0.588857189499296,0.588857189499296,0.588857189499296,0.588857189499296,
+        0.588857189499296,0.587969194651461,0.587303198515584,0.586859201091666,
+        0.586592802637315,0.586459603410139,0.586415203667748,0.586415203667748,
+        0.586415203667748,0.585749207531871,0.585305210107953,0.585038811653602,
+        0.584905612426426,0.584861212684035,0.584861212684035,0.584861212684035,
+        0.584417215260117,0.584150816805766,0.58401761757859,0.583973217836199,
+        0.583973217836199,0.583973217836199,0.583706819381848,0.583573620154673,
+        0.583529220412281,0.583529220412281,0.583529220412281,0.583396021185105,
+        0.583351621442714,0.583351621442714,0.583351621442714,0.583351621442714,
+        0.583351621442714,0.583351621442714,0.583351621442714,0.583351621442714,
+        0.583351621442714,0.582730025049228,0.58228602762531,0.58201962917096,
+        0.581886429943784,0.581842030201392,0.581842030201392,0.581842030201392,
+        0.581398032777474,0.581131634323124,0.580998435095948,0.580954035353556,
+        0.580954035353556,0.580954035353556,0.580687636899206,0.58055443767203,
+        0.580510037929639,0.580510037929639,0.580510037929639,0.580376838702463,
+        0.580332438960071,0.580332438960071,0.580332438960071,0.580332438960071,
+        0.580332438960071,0.580332438960071,0.580332438960071,0.580332438960071,
+        0.580332438960071,0.579932841278545,0.579666442824194,0.579533243597019,
+        0.579488843854627,0.579488843854627,0.579488843854627,0.579222445400276,
+        0.579089246173101,0.579044846430709,0.579044846430709,0.579044846430709,
+        0.578911647203534,0.578867247461142,0.578867247461142,0.578867247461142,
+        0.578867247461142,0.578867247461142,0.578867247461142,0.578867247461142,
+        0.578867247461142,0.578867247461142,0.578645248749183,0.578512049522008,
+        0.578467649779616,0.578467649779616,0.578467649779616,0.57833445055244,
+        0.578290050810049,0.578290050810049,0.578290050810049,0.578290050810049,
+        0.578290050810049,0.578290050810049,0.578290050810049,0.578290050810049,
+        0.578290050810049,0.578201251325265,0.578156851582873,0.578156851582873,
+        0.578156851582873,0.578156851582873,0.578156851582873,0.578156851582873,
+        0.578156851582873,0.578156851582873,0.578156851582873,0.578156851582873,
+        0.578156851582873,0.578156851582873,0.578156851582873,0.578156851582873,
+        0.578156851582873,0.578156851582873,0.578156851582873,0.578156851582873,
+        0.578156851582873,0.576913658795903,0.575670466008933,0.574738071418705,
+        0.574072075282828,0.57362807785891,0.573361679404559,0.573228480177384,
+        0.573184080434992,0.573184080434992,0.573184080434992,0.571940887648022,
+        0.571008493057794,0.570342496921917,0.569898499497999,0.569632101043648,
+        0.569498901816473,0.569454502074081,0.569454502074081,0.569454502074081,
+        0.568522107483853,0.567856111347976,0.567412113924058,0.567145715469707,
+        0.567012516242532,0.56696811650014,0.56696811650014,0.56696811650014,
+        0.566302120364263,0.565858122940345,0.565591724485994,0.565458525258819,
+        0.565414125516427,0.565414125516427,0.565414125516427,0.564970128092509,
+        0.564703729638159,0.564570530410983,0.564526130668591,0.564526130668591,
+        0.564526130668591,0.564259732214241,0.564126532987065,0.564082133244673,
+        0.564082133244673,0.564082133244673,0.563948934017498,0.563904534275106,
+        0.563904534275106,0.563904534275106,0.563904534275106,0.563904534275106,
+        0.563904534275106,0.563904534275106,0.563904534275106,0.563904534275106,
+        0.562972139684878,0.562039745094651,0.561373748958774,0.560929751534856,
+        0.560663353080505,0.56053015385333,0.560485754110938,0.560485754110938,
+        0.560485754110938,0.55955335952071,0.558887363384833,0.558443365960915,
+        0.558176967506564,0.558043768279389,0.557999368536997,0.557999368536997,
+        0.557999368536997,0.55733337240112,0.556889374977202,0.556622976522851,
+        0.556489777295676,0.556445377553284,0.556445377553284,0.556445377553284,
+        0.556001380129366,0.555734981675015,0.55560178244784,0.555557382705448,
+        0.555557382705448,0.555557382705448,0.555290984251097,0.555157785023922,
+        0.55511338528153,0.55511338528153,0.55511338528153,0.554980186054355,
+        0.554935786311963,0.554935786311963,0.554935786311963,0.554891386569571,
+        0.554891386569571,0.554891386569571,0.554891386569571,0.554891386569571,
+        0.554891386569571,0.554003391721735,0.553337395585858,0.55289339816194,
+        0.55262699970759,0.552493800480414,0.552449400738022,0.552449400738022,
+        0.552449400738022,0.551783404602145,0.551339407178227,0.551073008723877,
+        0.550939809496701,0.55089540975431,0.55089540975431,0.55089540975431,
+        0.550451412330392,0.550185013876041,0.550051814648865,0.550007414906474,
+        0.550007414906474,0.550007414906474,0.549741016452123,0.549607817224947,
+        0.549563417482556,0.549563417482556,0.549563417482556,0.54943021825538,
+        0.549385818512988,0.549385818512988,0.549385818512988,0.549341418770597,
+        0.549341418770597,0.549341418770597,0.549341418770597,0.549341418770597,
+        0.549341418770597,0.548719822377111,0.548275824953193,0.548009426498843,
+        0.547876227271667,0.547831827529275,0.547831827529275,0.547831827529275,
+        0.547387830105357,0.547121431651007,0.546988232423831,0.546943832681439,
+        0.546943832681439,0.546943832681439,0.546677434227089,0.546544234999913,
+        0.546499835257522,0.546499835257522,0.546499835257522,0.546366636030346,
+        0.546322236287954,0.546322236287954,0.546322236287954,0.546277836545563,
+        0.546277836545563,0.546277836545563,0.546277836545563,0.546277836545563,
+        0.546277836545563,0.545878238864036,0.545611840409686,0.54547864118251,
+        0.545434241440118,0.545434241440118,0.545434241440118,0.545167842985768,
+        0.545034643758592,0.5449902440162,0.5449902440162,0.5449902440162,
+        0.544857044789025,0.544812645046633,0.544812645046633,0.544812645046633,
+        0.544768245304241,0.544768245304241,0.544768245304241,0.544768245304241,
+        0.544768245304241,0.544768245304241,0.544546246592282,0.544413047365107,
+        0.544368647622715,0.544368647622715,0.544368647622715,0.54423544839554,
+        0.544191048653148,0.544191048653148,0.544191048653148,0.544146648910756,
+        0.544146648910756,0.544146648910756,0.544146648910756,0.544146648910756,
+        0.544146648910756,0.544057849425973,0.544013449683581,0.544013449683581,
+        0.544013449683581,0.543969049941189,0.543969049941189,0.543969049941189,
+        0.543969049941189,0.543969049941189,0.543969049941189,0.543969049941189,
+        0.543969049941189,0.543969049941189,0.543969049941189,0.543969049941189,
+        0.543969049941189,0.543969049941189,0.543969049941189,0.543969049941189,
+        0.543969049941189,0.542725857154219,0.541482664367248,0.540550269777021,
+        0.539884273641144,0.539440276217226,0.539173877762875,0.539040678535699,
+        0.538996278793308,0.538996278793308,0.538996278793308,0.537797485748729,
+        0.536865091158501,0.536199095022624,0.535755097598706,0.535488699144356,
+        0.53535549991718,0.535311100174788,0.535311100174788,0.535311100174788,
+        0.534378705584561,0.533712709448684,0.533268712024766,0.533002313570415,
+        0.53286911434324,0.532824714600848,0.532824714600848,0.532824714600848,
+        0.532158718464971,0.531714721041053,0.531448322586702,0.531315123359527,
+        0.531270723617135,0.531270723617135,0.531270723617135,0.530826726193217,
+        0.530560327738866,0.530427128511691,0.530382728769299,0.530382728769299,
+        0.530382728769299,0.530116330314948,0.529983131087773,0.529938731345381,
+        0.529938731345381,0.529938731345381,0.529805532118206,0.529761132375814,
+        0.529761132375814,0.529761132375814,0.529761132375814,0.529761132375814,
+        0.529761132375814,0.529761132375814,0.529761132375814,0.529761132375814,
+        0.528828737785586,0.527896343195358,0.527230347059481,0.526786349635563,
+        0.526519951181213,0.526386751954037,0.526342352211645,0.526342352211645,
+        0.526342352211645,0.525409957621418,0.524743961485541,0.524299964061623,
+        0.524033565607272,0.523900366380097,0.523855966637705,0.523855966637705,
+        0.523855966637705,0.523189970501828,0.52274597307791,0.522479574623559,
+        0.522346375396384,0.522301975653992,0.522301975653992,0.522301975653992,
+        0.521857978230074,0.521591579775723,0.521458380548548,0.521413980806156,
+        0.521413980806156,0.521413980806156,0.521147582351805,0.52101438312463,
+        0.520969983382238,0.520969983382238,0.520969983382238,0.520836784155062,
+        0.520792384412671,0.520792384412671,0.520792384412671,0.520747984670279,
+        0.520747984670279,0.520747984670279,0.520747984670279,0.520747984670279,
+        0.520747984670279,0.520081988534402,0.519415992398525,0.518971994974607,
+        0.518705596520256,0.518572397293081,0.518527997550689,0.518527997550689,
+        0.518527997550689,0.517862001414812,0.517418003990894,0.517151605536543,
+        0.517018406309368,0.516974006566976,0.516974006566976,0.516974006566976,
+        0.516530009143058,0.516263610688707,0.516130411461532,0.51608601171914,
+        0.51608601171914,0.51608601171914,0.515819613264789,0.515686414037614,
+        0.515642014295222,0.515642014295222,0.515642014295222,0.515508815068047,
+        0.515464415325655,0.515464415325655,0.515464415325655,0.515420015583263,
+        0.515420015583263,0.515420015583263,0.515420015583263,0.515420015583263,
+        0.515420015583263,0.514798419189778,0.51435442176586,0.514088023311509,
+        0.513954824084334,0.513910424341942,0.513910424341942,0.513910424341942,
+        0.513466426918024,0.513200028463673,0.513066829236498,0.513022429494106,
+        0.513022429494106,0.513022429494106,0.512756031039755,0.51262283181258,
+        0.512578432070188,0.512578432070188,0.512578432070188,0.512445232843013,
+        0.512400833100621,0.512400833100621,0.512400833100621,0.512356433358229,
+        0.512356433358229,0.512356433358229,0.512356433358229,0.512356433358229,
+        0.512356433358229,0.511956835676703,0.511690437222352,0.511557237995177,
+        0.511512838252785,0.511512838252785,0.511512838252785,0.511246439798434,
+        0.511113240571259,0.511068840828867,0.511068840828867,0.511068840828867,
+        0.510935641601692,0.5108912418593,0.5108912418593,0.5108912418593,
+        0.510846842116908,0.510846842116908,0.510846842116908,0.510846842116908,
+        0.510846842116908,0.510846842116908,0.510624843404949,0.510491644177774,
+        0.510447244435382,0.510447244435382,0.510447244435382,0.510314045208206,
+        0.510269645465815,0.510269645465815,0.510269645465815,0.510225245723423,
+        0.510225245723423,0.510225245723423,0.510225245723423,0.510225245723423,
+        0.510225245723423,0.510136446238639,0.510092046496247,0.510092046496247,
+        0.510092046496247,0.510047646753856,0.510047646753856,0.510047646753856,
+        0.510047646753856,0.510047646753856,0.510047646753856,0.510047646753856,
+        0.510047646753856,0.510047646753856,0.510047646753856,0.510047646753856,
+        0.510047646753856,0.510047646753856,0.510047646753856,0.510047646753856,
+        0.510047646753856,0.508804453966885,0.507561261179915,0.506628866589687,
+        0.50596287045381,0.505518873029892,0.505252474575541,0.505119275348366,
+        0.505074875605974,0.505074875605974,0.505074875605974,0.503876082561396,
+        0.502943687971168,0.502277691835291,0.501833694411373,0.501567295957022,
+        0.501434096729847,0.501389696987455,0.501389696987455,0.501389696987455,
+        0.500501702139619,0.499835706003742,0.499391708579824,0.499125310125473,
+        0.498992110898298,0.498947711155906,0.498947711155906,0.498947711155906,
+        0.498281715020029,0.497837717596111,0.49757131914176,0.497438119914585,
+        0.497393720172193,0.497393720172193,0.497393720172193,0.496949722748275,
+        0.496683324293924,0.496550125066749,0.496505725324357,0.496505725324357,
+        0.496505725324357,0.496239326870007,0.496106127642831,0.496061727900439,
+        0.496061727900439,0.496061727900439,0.495928528673264,0.495884128930872,
+        0.495884128930872,0.495884128930872,0.495884128930872,0.495884128930872,
+        0.495884128930872,0.495884128930872,0.495884128930872,0.495884128930872,
+        0.494951734340644,0.494019339750417,0.49335334361454,0.492909346190622,
+        0.492642947736271,0.492509748509096,0.492465348766704,0.492465348766704,
+        0.492465348766704,0.491577353918868,0.490911357782991,0.490467360359073,
+        0.490200961904722,0.490067762677547,0.490023362935155,0.490023362935155,
+        0.490023362935155,0.489357366799278,0.48891336937536,0.488646970921009,
+        0.488513771693834,0.488469371951442,0.488469371951442,0.488469371951442,
+        0.488025374527524,0.487758976073173,0.487625776845998,0.487581377103606,
+        0.487581377103606,0.487581377103606,0.487314978649255,0.48718177942208,
+        0.487137379679688,0.487137379679688,0.487137379679688,0.487004180452513,
+        0.486959780710121,0.486959780710121,0.486959780710121,0.486915380967729,
+        0.486915380967729,0.486915380967729,0.486915380967729,0.486915380967729,
+        0.486915380967729,0.486249384831852,0.485583388695975,0.485139391272057,
+        0.484872992817706,0.484739793590531,0.484695393848139,0.484695393848139,
+        0.484695393848139,0.484029397712262,0.483585400288344,0.483319001833993,
+        0.483185802606818,0.483141402864426,0.483141402864426,0.483141402864426,
+        0.482697405440508,0.482431006986157,0.482297807758982,0.48225340801659,
+        0.48225340801659,0.48225340801659,0.481987009562239,0.481853810335064,
+        0.481809410592672,0.481809410592672,0.481809410592672,0.481676211365497,
+        0.481631811623105,0.481631811623105,0.481631811623105,0.481587411880713,
+        0.481587411880713,0.481587411880713,0.481587411880713,0.481587411880713,
+        0.481587411880713,0.481143414456795,0.480699417032877,0.480433018578527,
+        0.480299819351351,0.480255419608959,0.480255419608959,0.480255419608959,
+        0.479811422185041,0.479545023730691,0.479411824503515,0.479367424761123,
+        0.479367424761123,0.479367424761123,0.479101026306773,0.478967827079597,
+        0.478923427337205,0.478923427337205,0.478923427337205,0.47879022811003,
+        0.478745828367638,0.478745828367638,0.478745828367638,0.478701428625246,
+        0.478701428625246,0.478701428625246,0.478701428625246,0.478701428625246,
+        0.478701428625246,0.47830183094372,0.478035432489369,0.477902233262194,
+        0.477857833519802,0.477857833519802,0.477857833519802,0.477591435065451,
+        0.477458235838276,0.477413836095884,0.477413836095884,0.477413836095884,
+        0.477280636868709,0.477236237126317,0.477236237126317,0.477236237126317,
+        0.477191837383925,0.477191837383925,0.477191837383925,0.477191837383925,
+        0.477191837383925,0.477191837383925,0.476969838671966,0.476836639444791,
+        0.476792239702399,0.476792239702399,0.476792239702399,0.476659040475224,
+        0.476614640732832,0.476614640732832,0.476614640732832,0.47657024099044,
+        0.47657024099044,0.47657024099044,0.47657024099044,0.47657024099044,
+        0.47657024099044,0.476481441505657,0.476437041763265,0.476437041763265,
+        0.476437041763265,0.476392642020873,0.476392642020873,0.476392642020873,
+        0.476392642020873,0.476392642020873,0.476392642020873,0.476392642020873,
+        0.476392642020873,0.476392642020873,0.476392642020873,0.476392642020873,
+        0.476392642020873,0.476392642020873,0.476392642020873,0.476392642020873,
+        0.476392642020873,0.475149449233903,0.473906256446932,0.472973861856705,
+        0.472307865720828,0.47186386829691,0.471597469842559,0.471464270615383,
+        0.471419870872992,0.471419870872992,0.471419870872992,0.470221077828413,
+        0.469288683238185,0.468622687102308,0.46817868967839,0.46791229122404,
+        0.467779091996864,0.467734692254472,0.467734692254472,0.467734692254472,
+        0.466846697406636,0.46618070127076,0.465736703846842,0.465470305392491,
+        0.465337106165315,0.465292706422924,0.465292706422924,0.465292706422924,
+        0.464671110029438,0.46422711260552,0.46396071415117,0.463827514923994,
+        0.463783115181602,0.463783115181602,0.463783115181602,0.463339117757684,
+        0.463072719303334,0.462939520076158,0.462895120333766,0.462895120333766,
+        0.462895120333766,0.462628721879416,0.46249552265224,0.462451122909848,
+        0.462451122909848,0.462451122909848,0.462317923682673,0.462273523940281,
+        0.462273523940281,0.462273523940281,0.462273523940281,0.462273523940281,
+        0.462273523940281,0.462273523940281,0.462273523940281,0.462273523940281,
+        0.461341129350054,0.460408734759826,0.459742738623949,0.459298741200031,
+        0.45903234274568,0.458899143518505,0.458854743776113,0.458854743776113,
+        0.458854743776113,0.457966748928277,0.4573007527924,0.456856755368482,
+        0.456590356914131,0.456457157686956,0.456412757944564,0.456412757944564,
+        0.456412757944564,0.455791161551079,0.455347164127161,0.45508076567281,
+        0.454947566445635,0.454903166703243,0.454903166703243,0.454903166703243,
+        0.454459169279325,0.454192770824974,0.454059571597799,0.454015171855407,
+        0.454015171855407,0.454015171855407,0.453748773401056,0.453615574173881,
+        0.453571174431489,0.453571174431489,0.453571174431489,0.453437975204314,
+        0.453393575461922,0.453393575461922,0.453393575461922,0.45334917571953,
+        0.45334917571953,0.45334917571953,0.45334917571953,0.45334917571953,
+        0.45334917571953,0.452683179583653,0.452017183447776,0.451573186023858,
+        0.451306787569507,0.451173588342332,0.45112918859994,0.45112918859994,
+        0.45112918859994,0.450507592206455,0.450063594782537,0.449797196328186,
+        0.449663997101011,0.449619597358619,0.449619597358619,0.449619597358619,
+        0.449175599934701,0.44890920148035,0.448776002253175,0.448731602510783,
+        0.448731602510783,0.448731602510783,0.448465204056432,0.448332004829257,
+        0.448287605086865,0.448287605086865,0.448287605086865,0.44815440585969,
+        0.448110006117298,0.448110006117298,0.448110006117298,0.448065606374906,
+        0.448065606374906,0.448065606374906,0.448065606374906,0.448065606374906,
+        0.448065606374906,0.447621608950988,0.44717761152707,0.446911213072719,
+        0.446778013845544,0.446733614103152,0.446733614103152,0.446733614103152,
+        0.446289616679234,0.446023218224883,0.445890018997708,0.445845619255316,
+        0.445845619255316,0.445845619255316,0.445579220800965,0.44544602157379,
+        0.445401621831398,0.445401621831398,0.445401621831398,0.445268422604223,
+        0.445224022861831,0.445224022861831,0.445224022861831,0.445179623119439,
+        0.445179623119439,0.445179623119439,0.445179623119439,0.445179623119439,
+        0.445179623119439,0.444913224665088,0.444646826210738,0.444513626983562,
+        0.44446922724117,0.44446922724117,0.44446922724117,0.44420282878682,
+        0.444069629559644,0.444025229817252,0.444025229817252,0.444025229817252,
+        0.443892030590077,0.443847630847685,0.443847630847685,0.443847630847685,
+        0.443803231105293,0.443803231105293,0.443803231105293,0.443803231105293,
+        0.443803231105293,0.443803231105293,0.443581232393334,0.443448033166159,
+        0.443403633423767,0.443403633423767,0.443403633423767,0.443270434196592,
+        0.4432260344542,0.4432260344542,0.4432260344542,0.443181634711808,
+        0.443181634711808,0.443181634711808,0.443181634711808,0.443181634711808,
+        0.443181634711808,0.443092835227025,0.443048435484633,0.443048435484633,
+        0.443048435484633,0.443004035742241,0.443004035742241,0.443004035742241,
+        0.443004035742241,0.443004035742241,0.443004035742241,0.443004035742241,
+        0.443004035742241,0.443004035742241,0.443004035742241,0.443004035742241,
+        0.443004035742241,0.443004035742241,0.443004035742241,0.443004035742241,
+        0.443004035742241,0.441450044758528,0.440206851971558,0.43927445738133,
+        0.438608461245453,0.438164463821535,0.437898065367184,0.437764866140009,
+        0.437720466397617,0.437720466397617,0.437720466397617,0.436521673353039,
+        0.435589278762811,0.434923282626934,0.434479285203016,0.434212886748665,
+        0.43407968752149,0.434035287779098,0.434035287779098,0.434035287779098,
+        0.433147292931262,0.432481296795385,0.432037299371467,0.431770900917116,
+        0.431637701689941,0.431593301947549,0.431593301947549,0.431593301947549,
+        0.430971705554064,0.430527708130146,0.430261309675795,0.43012811044862,
+        0.430083710706228,0.430083710706228,0.430083710706228,0.429684113024702,
+        0.429417714570351,0.429284515343176,0.429240115600784,0.429240115600784,
+        0.429240115600784,0.428973717146433,0.428840517919258,0.428796118176866,
+        0.428796118176866,0.428796118176866,0.42866291894969,0.428618519207299,
+        0.428618519207299,0.428618519207299,0.428618519207299,0.428618519207299,
+        0.428618519207299,0.428618519207299,0.428618519207299,0.428618519207299,
+        0.427686124617071,0.426753730026843,0.426087733890966,0.425643736467048,
+        0.425377338012697,0.425244138785522,0.42519973904313,0.42519973904313,
+        0.42519973904313,0.424311744195294,0.423645748059417,0.423201750635499,
+        0.422935352181149,0.422802152953973,0.422757753211581,0.422757753211581,
+        0.422757753211581,0.422136156818096,0.421692159394178,0.421425760939827,
+        0.421292561712652,0.42124816197026,0.42124816197026,0.42124816197026,
+        0.420848564288734,0.420582165834383,0.420448966607208,0.420404566864816,
+        0.420404566864816,0.420404566864816,0.420138168410465,0.42000496918329,
+        0.419960569440898,0.419960569440898,0.419960569440898,0.419827370213723,
+        0.419782970471331,0.419782970471331,0.419782970471331,0.419738570728939,
+        0.419738570728939,0.419738570728939,0.419738570728939,0.419738570728939,
+        0.419738570728939,0.419072574593062,0.418406578457185,0.417962581033267,
+        0.417696182578916,0.417562983351741,0.417518583609349,0.417518583609349,
+        0.417518583609349,0.416896987215864,0.416452989791946,0.416186591337595,
+        0.41605339211042,0.416008992368028,0.416008992368028,0.416008992368028,
+        0.415609394686502,0.415342996232151,0.415209797004976,0.415165397262584,
+        0.415165397262584,0.415165397262584,0.414898998808233,0.414765799581058,
+        0.414721399838666,0.414721399838666,0.414721399838666,0.414588200611491,
+        0.414543800869099,0.414543800869099,0.414543800869099,0.414499401126707,
+        0.414499401126707,0.414499401126707,0.414499401126707,0.414499401126707,
+        0.414499401126707,0.414055403702789,0.413611406278871,0.41334500782452,
+        0.413211808597345,0.413167408854953,0.413167408854953,0.413167408854953,
+        0.412767811173427,0.412501412719076,0.412368213491901,0.412323813749509,
+        0.412323813749509,0.412323813749509,0.412057415295158,0.411924216067983,
+        0.411879816325591,0.411879816325591,0.411879816325591,0.411746617098416,
+        0.411702217356024,0.411702217356024,0.411702217356024,0.411657817613632,
+        0.411657817613632,0.411657817613632,0.411657817613632,0.411657817613632,
+        0.411657817613632,0.411391419159281,0.41112502070493,0.410991821477755,
+        0.410947421735363,0.410947421735363,0.410947421735363,0.410681023281012,
+        0.410547824053837,0.410503424311445,0.410503424311445,0.410503424311445,
+        0.41037022508427,0.410325825341878,0.410325825341878,0.410325825341878,
+        0.410281425599486,0.410281425599486,0.410281425599486,0.410281425599486,
+        0.410281425599486,0.410281425599486,0.410148226372311,0.410015027145135,
+        0.409970627402744,0.409970627402744,0.409970627402744,0.409837428175568,
+        0.409793028433176,0.409793028433176,0.409793028433176,0.409748628690785,
+        0.409748628690785,0.409748628690785,0.409748628690785,0.409748628690785,
+        0.409748628690785,0.409659829206001,0.409615429463609,0.409615429463609,
+        0.409615429463609,0.409571029721217,0.409571029721217,0.409571029721217,
+        0.409571029721217,0.409571029721217,0.409571029721217,0.409571029721217,
+        0.409571029721217,0.409571029721217,0.409571029721217,0.409571029721217,
+        0.409571029721217,0.409571029721217,0.409571029721217,0.409571029721217,
+        0.409571029721217,0.408017038737505,0.406773845950534,0.405841451360306,
+        0.405175455224429,0.404731457800512,0.404465059346161,0.404331860118985,
+        0.404287460376594,0.404287460376594,0.404287460376594,0.403088667332015,
+        0.402156272741787,0.40149027660591,0.401046279181992,0.400779880727642,
+        0.400646681500466,0.400602281758074,0.400602281758074,0.400602281758074,
+        0.399714286910238,0.399048290774361,0.398604293350443,0.398337894896093,
+        0.398204695668917,0.398160295926525,0.398160295926525,0.398160295926525,
+        0.39753869953304,0.397094702109122,0.396828303654772,0.396695104427596,
+        0.396650704685204,0.396650704685204,0.396650704685204,0.396251107003678,
+        0.395984708549327,0.395851509322152,0.39580710957976,0.39580710957976,
+        0.39580710957976,0.395585110867801,0.395451911640626,0.395407511898234,
+        0.395407511898234,0.395407511898234,0.395274312671059,0.395229912928667,
+        0.395229912928667,0.395229912928667,0.395229912928667,0.395229912928667,
+        0.395229912928667,0.395229912928667,0.395229912928667,0.395229912928667,
+        0.394031119884088,0.393098725293861,0.392432729157984,0.391988731734066,
+        0.391722333279715,0.391589134052539,0.391544734310148,0.391544734310148,
+        0.391544734310148,0.390656739462312,0.389990743326435,0.389546745902517,
+        0.389280347448166,0.389147148220991,0.389102748478599,0.389102748478599,
+        0.389102748478599,0.388481152085114,0.388037154661196,0.387770756206845,
+        0.387637556979669,0.387593157237278,0.387593157237278,0.387593157237278,
+        0.387193559555751,0.386927161101401,0.386793961874225,0.386749562131833,
+        0.386749562131833,0.386749562131833,0.386527563419874,0.386394364192699,
+        0.386349964450307,0.386349964450307,0.386349964450307,0.386216765223132,
+        0.38617236548074,0.38617236548074,0.38617236548074,0.386127965738348,
+        0.386127965738348,0.386127965738348,0.386127965738348,0.386127965738348,
+        0.386127965738348,0.385461969602471,0.384795973466594,0.384351976042676,
+        0.384085577588326,0.38395237836115,0.383907978618758,0.383907978618758,
+        0.383907978618758,0.383286382225273,0.382842384801355,0.382575986347004,
+        0.382442787119829,0.382398387377437,0.382398387377437,0.382398387377437,
+        0.381998789695911,0.38173239124156,0.381599192014385,0.381554792271993,
+        0.381554792271993,0.381554792271993,0.381332793560034,0.381199594332859,
+        0.381155194590467,0.381155194590467,0.381155194590467,0.381021995363292,
+        0.3809775956209,0.3809775956209,0.3809775956209,0.380933195878508,
+        0.380933195878508,0.380933195878508,0.380933195878508,0.380933195878508,
+        0.380933195878508,0.38048919845459,0.380045201030672,0.379778802576321,
+        0.379645603349146,0.379601203606754,0.379601203606754,0.379601203606754,
+        0.379201605925228,0.378935207470877,0.378802008243702,0.37875760850131,
+        0.37875760850131,0.37875760850131,0.378535609789351,0.378402410562175,
+        0.378358010819784,0.378358010819784,0.378358010819784,0.378224811592608,
+        0.378180411850217,0.378180411850217,0.378180411850217,0.378136012107825,
+        0.378136012107825,0.378136012107825,0.378136012107825,0.378136012107825,
+        0.378136012107825,0.377869613653474,0.377603215199123,0.377470015971948,
+        0.377425616229556,0.377425616229556,0.377425616229556,0.377203617517597,
+        0.377070418290422,0.37702601854803,0.37702601854803,0.37702601854803,
+        0.376892819320854,0.376848419578463,0.376848419578463,0.376848419578463,
+        0.376804019836071,0.376804019836071,0.376804019836071,0.376804019836071,
+        0.376804019836071,0.376804019836071,0.376670820608895,0.37653762138172,
+        0.376493221639328,0.376493221639328,0.376493221639328,0.376360022412153,
+        0.376315622669761,0.376315622669761,0.376315622669761,0.376271222927369,
+        0.376271222927369,0.376271222927369,0.376271222927369,0.376271222927369,
+        0.376271222927369,0.376226823184977,0.376182423442586,0.376182423442586,
+        0.376182423442586,0.376138023700194,0.376138023700194,0.376138023700194,
+        0.376138023700194,0.376138023700194,0.376138023700194,0.376138023700194,
+        0.376138023700194,0.376138023700194,0.376138023700194,0.376138023700194,
+        0.376138023700194,0.376138023700194,0.376138023700194,0.376138023700194,
+        0.376138023700194,0.374584032716481,0.373340839929511,0.372408445339283,
+        0.371742449203406,0.371298451779488,0.371032053325137,0.370898854097962,
+        0.37085445435557,0.37085445435557,0.37085445435557,0.3696112615686,
+        0.368678866978372,0.368012870842495,0.367568873418577,0.367302474964226,
+        0.367169275737051,0.367124875994659,0.367124875994659,0.367124875994659,
+        0.366236881146823,0.365570885010946,0.365126887587028,0.364860489132677,
+        0.364727289905502,0.36468289016311,0.36468289016311,0.36468289016311,
+        0.364061293769625,0.363617296345707,0.363350897891356,0.363217698664181,
+        0.363173298921789,0.363173298921789,0.363173298921789,0.362773701240263,
+        0.362507302785912,0.362374103558737,0.362329703816345,0.362329703816345,
+        0.362329703816345,0.362107705104386,0.36197450587721,0.361930106134819,
+        0.361930106134819,0.361930106134819,0.361841306650035,0.361796906907643,
+        0.361796906907643,0.361796906907643,0.361796906907643,0.361796906907643,
+        0.361796906907643,0.361796906907643,0.361796906907643,0.361796906907643,
+        0.360598113863065,0.359665719272837,0.35899972313696,0.358555725713042,
+        0.358289327258691,0.358156128031516,0.358111728289124,0.358111728289124,
+        0.358111728289124,0.357223733441288,0.356557737305411,0.356113739881493,
+        0.355847341427142,0.355714142199967,0.355669742457575,0.355669742457575,
+        0.355669742457575,0.35504814606409,0.354604148640172,0.354337750185821,
+        0.354204550958646,0.354160151216254,0.354160151216254,0.354160151216254,
+        0.353760553534728,0.353494155080377,0.353360955853202,0.35331655611081,
+        0.35331655611081,0.35331655611081,0.353094557398851,0.352961358171675,
+        0.352916958429284,0.352916958429284,0.352916958429284,0.3528281589445,
+        0.352783759202108,0.352783759202108,0.352783759202108,0.352739359459716,
+        0.352739359459716,0.352739359459716,0.352739359459716,0.352739359459716,
+        0.352739359459716,0.35185136461188,0.351185368476004,0.350741371052086,
+        0.350474972597735,0.350341773370559,0.350297373628168,0.350297373628168,
+        0.350297373628168,0.349675777234682,0.349231779810764,0.348965381356414,
+        0.348832182129238,0.348787782386846,0.348787782386846,0.348787782386846,
+        0.34838818470532,0.348121786250969,0.347988587023794,0.347944187281402,
+        0.347944187281402,0.347944187281402,0.347722188569443,0.347588989342268,
+        0.347544589599876,0.347544589599876,0.347544589599876,0.347455790115092,
+        0.347411390372701,0.347411390372701,0.347411390372701,0.347366990630309,
+        0.347366990630309,0.347366990630309,0.347366990630309,0.347366990630309,
+        0.347366990630309,0.346922993206391,0.346478995782473,0.346212597328122,
+        0.346079398100947,0.346034998358555,0.346034998358555,0.346034998358555,
+        0.345635400677029,0.345369002222678,0.345235802995503,0.345191403253111,
+        0.345191403253111,0.345191403253111,0.344969404541152,0.344836205313976,
+        0.344791805571585,0.344791805571585,0.344791805571585,0.344703006086801,
+        0.344658606344409,0.344658606344409,0.344658606344409,0.344614206602017,
+        0.344614206602017,0.344614206602017,0.344614206602017,0.344614206602017,
+        0.344614206602017,0.344347808147667,0.344081409693316,0.34394821046614,
+        0.343903810723749,0.343903810723749,0.343903810723749,0.34368181201179,
+        0.343548612784614,0.343504213042223,0.343504213042223,0.343504213042223,
+        0.343415413557439,0.343371013815047,0.343371013815047,0.343371013815047,
+        0.343326614072655,0.343326614072655,0.343326614072655,0.343326614072655,
+        0.343326614072655,0.343326614072655,0.34319341484548,0.343060215618305,
+        0.343015815875913,0.343015815875913,0.343015815875913,0.342927016391129,
+        0.342882616648737,0.342882616648737,0.342882616648737,0.342838216906346,
+        0.342838216906346,0.342838216906346,0.342838216906346,0.342838216906346,
+        0.342838216906346,0.342793817163954,0.342749417421562,0.342749417421562,
+        0.342749417421562,0.34270501767917,0.34270501767917,0.34270501767917,
+        0.34270501767917,0.34270501767917,0.34270501767917,0.34270501767917,
+        0.34270501767917,0.34270501767917,0.34270501767917,0.34270501767917,
+        0.34270501767917,0.34270501767917,0.34270501767917,0.34270501767917,
+        0.34270501767917,0.341151026695457,0.339907833908487,0.338975439318259,
+        0.338309443182382,0.337865445758464,0.337599047304113,0.337465848076938,
+        0.337421448334546,0.337421448334546,0.337421448334546,0.336178255547576,
+        0.335245860957348,0.334579864821471,0.334135867397553,0.333869468943202,
+        0.333736269716027,0.333691869973635,0.333691869973635,0.333691869973635,
+        0.332759475383407,0.332093479247531,0.331649481823613,0.331383083369262,
+        0.331249884142086,0.331205484399695,0.331205484399695,0.331205484399695,
+        0.330583888006209,0.330139890582291,0.329873492127941,0.329740292900765,
+        0.329695893158373,0.329695893158373,0.329695893158373,0.329296295476847,
+        0.329029897022496,0.328896697795321,0.328852298052929,0.328852298052929,
+        0.328852298052929,0.32863029934097,0.328497100113795,0.328452700371403,
+        0.328452700371403,0.328452700371403,0.328363900886619,0.328319501144228,
+        0.328319501144228,0.328319501144228,0.328319501144228,0.328319501144228,
+        0.328319501144228,0.328319501144228,0.328319501144228,0.328319501144228,
+        0.327120708099649,0.326188313509421,0.325522317373544,0.325078319949626,
+        0.324811921495276,0.3246787222681,0.324634322525709,0.324634322525709,
+        0.324634322525709,0.323701927935481,0.323035931799604,0.322591934375686,
+        0.322325535921335,0.32219233669416,0.322147936951768,0.322147936951768,
+        0.322147936951768,0.321526340558283,0.321082343134365,0.320815944680014,
+        0.320682745452838,0.320638345710447,0.320638345710447,0.320638345710447,
+        0.320238748028921,0.31997234957457,0.319839150347394,0.319794750605003,
+        0.319794750605003,0.319794750605003,0.319572751893044,0.319439552665868,
+        0.319395152923476,0.319395152923476,0.319395152923476,0.319306353438693,
+        0.319261953696301,0.319261953696301,0.319261953696301,0.319261953696301,
+        0.319261953696301,0.319261953696301,0.319261953696301,0.319261953696301,
+        0.319261953696301,0.318373958848465,0.317707962712588,0.31726396528867,
+        0.316997566834319,0.316864367607144,0.316819967864752,0.316819967864752,
+        0.316819967864752,0.316198371471267,0.315754374047349,0.315487975592998,
+        0.315354776365823,0.315310376623431,0.315310376623431,0.315310376623431,
+        0.314910778941905,0.314644380487554,0.314511181260379,0.314466781517987,
+        0.314466781517987,0.314466781517987,0.314244782806028,0.314111583578852,
+        0.314067183836461,0.314067183836461,0.314067183836461,0.313978384351677,
+        0.313933984609285,0.313933984609285,0.313933984609285,0.313933984609285,
+        0.313933984609285,0.313933984609285,0.313933984609285,0.313933984609285,
+        0.313933984609285,0.3133123882158,0.312868390791882,0.312601992337531,
+        0.312468793110356,0.312424393367964,0.312424393367964,0.312424393367964,
+        0.312024795686438,0.311758397232087,0.311625198004912,0.31158079826252,
+        0.31158079826252,0.31158079826252,0.311358799550561,0.311225600323386,
+        0.311181200580994,0.311181200580994,0.311181200580994,0.31109240109621,
+        0.311048001353818,0.311048001353818,0.311048001353818,0.311048001353818,
+        0.311048001353818,0.311048001353818,0.311048001353818,0.311048001353818,
+        0.311048001353818,0.310781602899468,0.310515204445117,0.310382005217941,
+        0.31033760547555,0.31033760547555,0.31033760547555,0.310115606763591,
+        0.309982407536415,0.309938007794023,0.309938007794023,0.309938007794023,
+        0.30984920830924,0.309804808566848,0.309804808566848,0.309804808566848,
+        0.309804808566848,0.309804808566848,0.309804808566848,0.309804808566848,
+        0.309804808566848,0.309804808566848,0.309671609339673,0.309538410112497,
+        0.309494010370105,0.309494010370105,0.309494010370105,0.309405210885322,
+        0.30936081114293,0.30936081114293,0.30936081114293,0.30936081114293,
+        0.30936081114293,0.30936081114293,0.30936081114293,0.30936081114293,
+        0.30936081114293,0.309316411400538,0.309272011658146,0.309272011658146,
+        0.309272011658146,0.309272011658146,0.309272011658146,0.309272011658146,
+        0.309272011658146,0.309272011658146,0.309272011658146,0.309272011658146,
+        0.309272011658146,0.309272011658146,0.309272011658146,0.309272011658146,
+        0.309272011658146,0.309272011658146,0.309272011658146,0.309272011658146,
+        0.309272011658146,0.307718020674434,0.306474827887463,0.305542433297236,
+        0.304876437161359,0.304432439737441,0.30416604128309,0.304032842055914,
+        0.304032842055914,0.304032842055914,0.304032842055914,0.302789649268944,
+        0.301857254678716,0.301191258542839,0.300747261118921,0.300480862664571,
+        0.300347663437395,0.300347663437395,0.300347663437395,0.300347663437395,
+        0.299415268847167,0.29874927271129,0.298305275287372,0.298038876833022,
+        0.297905677605846,0.297905677605846,0.297905677605846,0.297905677605846,
+        0.297239681469969,0.296795684046051,0.296529285591701,0.296396086364525,
+        0.296396086364525,0.296396086364525,0.296396086364525,0.295996488682999,
+        0.295730090228648,0.295596891001473,0.295596891001473,0.295596891001473,
+        0.295596891001473,0.295374892289514,0.295241693062338,0.295241693062338,
+        0.295241693062338,0.295241693062338,0.295152893577555,0.295152893577555,
+        0.295152893577555,0.295152893577555,0.295152893577555,0.295152893577555,
+        0.295152893577555,0.295152893577555,0.295152893577555,0.295152893577555,
+        0.293954100532976,0.293021705942749,0.292355709806872,0.291911712382954,
+        0.291645313928603,0.291512114701427,0.291467714959036,0.291467714959036,
+        0.291467714959036,0.290535320368808,0.289869324232931,0.289425326809013,
+        0.289158928354662,0.289025729127487,0.288981329385095,0.288981329385095,
+        0.288981329385095,0.288315333249218,0.2878713358253,0.287604937370949,
+        0.287471738143774,0.287427338401382,0.287427338401382,0.287427338401382,
+        0.287027740719856,0.286761342265505,0.28662814303833,0.286583743295938,
+        0.286583743295938,0.286583743295938,0.286361744583979,0.286228545356804,
+        0.286184145614412,0.286184145614412,0.286184145614412,0.286095346129628,
+        0.286050946387236,0.286050946387236,0.286050946387236,0.286050946387236,
+        0.286050946387236,0.286050946387236,0.286050946387236,0.286050946387236,
+        0.286050946387236,0.2851629515394,0.284496955403523,0.284052957979605,
+        0.283786559525255,0.283653360298079,0.283608960555687,0.283608960555687,
+        0.283608960555687,0.28294296441981,0.282498966995892,0.282232568541542,
+        0.282099369314366,0.282054969571975,0.282054969571975,0.282054969571975,
+        0.281655371890448,0.281388973436098,0.281255774208922,0.28121137446653,
+        0.28121137446653,0.28121137446653,0.280989375754571,0.280856176527396,
+        0.280811776785004,0.280811776785004,0.280811776785004,0.280722977300221,
+        0.280678577557829,0.280678577557829,0.280678577557829,0.280678577557829,
+        0.280678577557829,0.280678577557829,0.280678577557829,0.280678577557829,
+        0.280678577557829,0.280056981164344,0.279612983740426,0.279346585286075,
+        0.279213386058899,0.279168986316508,0.279168986316508,0.279168986316508,
+        0.278769388634982,0.278502990180631,0.278369790953455,0.278325391211064,
+        0.278325391211064,0.278325391211064,0.278103392499105,0.277970193271929,
+        0.277925793529537,0.277925793529537,0.277925793529537,0.277836994044754,
+        0.277792594302362,0.277792594302362,0.277792594302362,0.277792594302362,
+        0.277792594302362,0.277792594302362,0.277792594302362,0.277792594302362,
+        0.277792594302362,0.277392996620836,0.277126598166485,0.27699339893931,
+        0.276948999196918,0.276948999196918,0.276948999196918,0.276727000484959,
+        0.276593801257783,0.276549401515392,0.276549401515392,0.276549401515392,
+        0.276460602030608,0.276416202288216,0.276416202288216,0.276416202288216,
+        0.276416202288216,0.276416202288216,0.276416202288216,0.276416202288216,
+        0.276416202288216,0.276416202288216,0.276283003061041,0.276149803833865,
+        0.276105404091474,0.276105404091474,0.276105404091474,0.27601660460669,
+        0.275972204864298,0.275972204864298,0.275972204864298,0.275972204864298,
+        0.275972204864298,0.275972204864298,0.275972204864298,0.275972204864298,
+        0.275972204864298,0.275927805121906,0.275883405379515,0.275883405379515,
+        0.275883405379515,0.275883405379515,0.275883405379515,0.275883405379515,
+        0.275883405379515,0.275883405379515,0.275883405379515,0.275883405379515,
+        0.275883405379515,0.275883405379515,0.275883405379515,0.275883405379515,
+        0.275883405379515,0.275883405379515,0.275883405379515,0.275883405379515,
+        0.275883405379515,0.274329414395802,0.273086221608831,0.272153827018604,
+        0.271487830882727,0.271043833458809,0.270777435004458,0.270644235777283,
+        0.270644235777283,0.270644235777283,0.270644235777283,0.269401042990312,
+        0.268468648400084,0.267802652264207,0.267358654840289,0.267092256385939,
+        0.266959057158763,0.266959057158763,0.266959057158763,0.266959057158763,
+        0.266026662568536,0.265360666432659,0.264916669008741,0.26465027055439,
+        0.264517071327214,0.264517071327214,0.264517071327214,0.264517071327214,
+        0.263851075191337,0.26340707776742,0.263140679313069,0.263007480085893,
+        0.263007480085893,0.263007480085893,0.263007480085893,0.262563482661975,
+        0.262297084207625,0.262163884980449,0.262163884980449,0.262163884980449,
+        0.262163884980449,0.26194188626849,0.261808687041315,0.261808687041315,
+        0.261808687041315,0.261808687041315,0.261719887556531,0.261719887556531,
+        0.261719887556531,0.261719887556531,0.261719887556531,0.261719887556531,
+        0.261719887556531,0.261719887556531,0.261719887556531,0.261719887556531,
+        0.260521094511953,0.259588699921725,0.258922703785848,0.25847870636193,
+        0.258212307907579,0.258079108680404,0.258034708938012,0.258034708938012,
+        0.258034708938012,0.257102314347784,0.256436318211907,0.255992320787989,
+        0.255725922333639,0.255592723106463,0.255548323364071,0.255548323364071,
+        0.255548323364071,0.254882327228194,0.254438329804276,0.254171931349926,
+        0.25403873212275,0.253994332380358,0.253994332380358,0.253994332380358,
+        0.25355033495644,0.25328393650209,0.253150737274914,0.253106337532522,
+        0.253106337532522,0.253106337532522,0.252884338820563,0.252751139593388,
+        0.252706739850996,0.252706739850996,0.252706739850996,0.252617940366213,
+        0.252573540623821,0.252573540623821,0.252573540623821,0.252573540623821,
+        0.252573540623821,0.252573540623821,0.252573540623821,0.252573540623821,
+        0.252573540623821,0.251685545775985,0.251019549640108,0.25057555221619,
+        0.250309153761839,0.250175954534664,0.250131554792272,0.250131554792272,
+        0.250131554792272,0.249465558656395,0.249021561232477,0.248755162778126,
+        0.248621963550951,0.248577563808559,0.248577563808559,0.248577563808559,
+        0.248133566384641,0.24786716793029,0.247733968703115,0.247689568960723,
+        0.247689568960723,0.247689568960723,0.247467570248764,0.247334371021589,
+        0.247289971279197,0.247289971279197,0.247289971279197,0.247201171794413,
+        0.247156772052022,0.247156772052022,0.247156772052022,0.247156772052022,
+        0.247156772052022,0.247156772052022,0.247156772052022,0.247156772052022,
+        0.247156772052022,0.246535175658536,0.246091178234618,0.245824779780268,
+        0.245691580553092,0.2456471808107,0.2456471808107,0.2456471808107,
+        0.245203183386782,0.244936784932432,0.244803585705256,0.244759185962864,
+        0.244759185962864,0.244759185962864,0.244537187250905,0.24440398802373,
+        0.244359588281338,0.244359588281338,0.244359588281338,0.244270788796555,
+        0.244226389054163,0.244226389054163,0.244226389054163,0.244226389054163,
+        0.244226389054163,0.244226389054163,0.244226389054163,0.244226389054163,
+        0.244226389054163,0.243826791372637,0.243560392918286,0.243427193691111,
+        0.243382793948719,0.243382793948719,0.243382793948719,0.24316079523676,
+        0.243027596009584,0.242983196267193,0.242983196267193,0.242983196267193,
+        0.242894396782409,0.242849997040017,0.242849997040017,0.242849997040017,
+        0.242849997040017,0.242849997040017,0.242849997040017,0.242849997040017,
+        0.242849997040017,0.242849997040017,0.242627998328058,0.242494799100883,
+        0.242450399358491,0.242450399358491,0.242450399358491,0.242361599873707,
+        0.242317200131316,0.242317200131316,0.242317200131316,0.242317200131316,
+        0.242317200131316,0.242317200131316,0.242317200131316,0.242317200131316,
+        0.242317200131316,0.242272800388924,0.242228400646532,0.242228400646532,
+        0.242228400646532,0.242228400646532,0.242228400646532,0.242228400646532,
+        0.242228400646532,0.242228400646532,0.242228400646532,0.242228400646532,
+        0.242228400646532,0.242228400646532,0.242228400646532,0.242228400646532,
+        0.242228400646532,0.242228400646532,0.242228400646532,0.242228400646532,
+        0.242228400646532,0.240674409662819,0.239431216875849,0.238498822285621,
+        0.237832826149744,0.237388828725826,0.237122430271475,0.2369892310443,
+        0.2369892310443,0.2369892310443,0.2369892310443,0.23574603825733,
+        0.234813643667102,0.234147647531225,0.233703650107307,0.233437251652956,
+        0.233304052425781,0.233304052425781,0.233304052425781,0.233304052425781,
+        0.232371657835553,0.231705661699676,0.231261664275758,0.230995265821407,
+        0.230862066594232,0.230862066594232,0.230862066594232,0.230862066594232,
+        0.230196070458355,0.229752073034437,0.229485674580086,0.229352475352911,
+        0.229352475352911,0.229352475352911,0.229352475352911,0.228908477928993,
+        0.228642079474642,0.228508880247467,0.228508880247467,0.228508880247467,
+        0.228508880247467,0.228242481793116,0.22810928256594,0.22810928256594,
+        0.22810928256594,0.22810928256594,0.228020483081157,0.228020483081157,
+        0.228020483081157,0.228020483081157,0.228020483081157,0.228020483081157,
+        0.228020483081157,0.228020483081157,0.228020483081157,0.228020483081157,
+        0.226821690036578,0.22588929544635,0.225223299310473,0.224779301886556,
+        0.224512903432205,0.224379704205029,0.224335304462638,0.224335304462638,
+        0.224335304462638,0.22340290987241,0.222736913736533,0.222292916312615,
+        0.222026517858264,0.221893318631089,0.221848918888697,0.221848918888697,
+        0.221848918888697,0.22118292275282,0.220738925328902,0.220472526874551,
+        0.220339327647376,0.220294927904984,0.220294927904984,0.220294927904984,
+        0.219850930481066,0.219584532026715,0.21945133279954,0.219406933057148,
+        0.219406933057148,0.219406933057148,0.219140534602797,0.219007335375622,
+        0.21896293563323,0.21896293563323,0.21896293563323,0.218874136148446,
+        0.218829736406055,0.218829736406055,0.218829736406055,0.218829736406055,
+        0.218829736406055,0.218829736406055,0.218829736406055,0.218829736406055,
+        0.218829736406055,0.217941741558219,0.217275745422342,0.216831747998424,
+        0.216565349544073,0.216432150316898,0.216387750574506,0.216387750574506,
+        0.216387750574506,0.215721754438629,0.215277757014711,0.21501135856036,
+        0.214878159333185,0.214833759590793,0.214833759590793,0.214833759590793,
+        0.214389762166875,0.214123363712524,0.213990164485349,0.213945764742957,
+        0.213945764742957,0.213945764742957,0.213679366288606,0.213546167061431,
+        0.213501767319039,0.213501767319039,0.213501767319039,0.213412967834255,
+        0.213368568091864,0.213368568091864,0.213368568091864,0.213368568091864,
+        0.213368568091864,0.213368568091864,0.213368568091864,0.213368568091864,
+        0.213368568091864,0.212746971698378,0.21230297427446,0.21203657582011,
+        0.211903376592934,0.211858976850542,0.211858976850542,0.211858976850542,
+        0.211414979426624,0.211148580972274,0.211015381745098,0.210970982002706,
+        0.210970982002706,0.210970982002706,0.210704583548356,0.21057138432118,
+        0.210526984578788,0.210526984578788,0.210526984578788,0.210438185094005,
+        0.210393785351613,0.210393785351613,0.210393785351613,0.210393785351613,
+        0.210393785351613,0.210393785351613,0.210393785351613,0.210393785351613,
+        0.210393785351613,0.209994187670087,0.209727789215736,0.209594589988561,
+        0.209550190246169,0.209550190246169,0.209550190246169,0.209283791791818,
+        0.209150592564643,0.209106192822251,0.209106192822251,0.209106192822251,
+        0.209017393337467,0.208972993595076,0.208972993595076,0.208972993595076,
+        0.208972993595076,0.208972993595076,0.208972993595076,0.208972993595076,
+        0.208972993595076,0.208972993595076,0.208750994883117,0.208617795655941,
+        0.208573395913549,0.208573395913549,0.208573395913549,0.208484596428766,
+        0.208440196686374,0.208440196686374,0.208440196686374,0.208440196686374,
+        0.208440196686374,0.208440196686374,0.208440196686374,0.208440196686374,
+        0.208440196686374,0.20835139720159,0.208306997459199,0.208306997459199,
+        0.208306997459199,0.208306997459199,0.208306997459199,0.208306997459199,
+        0.208306997459199,0.208306997459199,0.208306997459199,0.208306997459199,
+        0.208306997459199,0.208306997459199,0.208306997459199,0.208306997459199,
+        0.208306997459199,0.208306997459199,0.208306997459199,0.208306997459199,
+        0.208306997459199,0.206753006475486,0.205509813688515,0.204577419098288,
+        0.203911422962411,0.203467425538493,0.203201027084142,0.203067827856966,
+        0.203067827856966,0.203067827856966,0.203067827856966,0.201824635069996,
+        0.200892240479768,0.200226244343891,0.199782246919973,0.199515848465623,
+        0.199382649238447,0.199382649238447,0.199382649238447,0.199382649238447,
+        0.198450254648219,0.197784258512343,0.197340261088425,0.197073862634074,
+        0.196940663406898,0.196940663406898,0.196940663406898,0.196940663406898,
+        0.196274667271021,0.195830669847103,0.195564271392753,0.195431072165577,
+        0.195431072165577,0.195431072165577,0.195431072165577,0.194987074741659,
+        0.194720676287308,0.194587477060133,0.194587477060133,0.194587477060133,
+        0.194587477060133,0.194321078605782,0.194187879378607,0.194187879378607,
+        0.194187879378607,0.194187879378607,0.194054680151432,0.194054680151432,
+        0.194054680151432,0.194054680151432,0.194054680151432,0.194054680151432,
+        0.194054680151432,0.194054680151432,0.194054680151432,0.194054680151432,
+        0.192855887106853,0.191923492516625,0.191257496380748,0.19081349895683,
+        0.190547100502479,0.190413901275304,0.190369501532912,0.190369501532912,
+        0.190369501532912,0.189437106942685,0.188771110806808,0.18832711338289,
+        0.188060714928539,0.187927515701363,0.187883115958972,0.187883115958972,
+        0.187883115958972,0.187217119823095,0.186773122399177,0.186506723944826,
+        0.186373524717651,0.186329124975259,0.186329124975259,0.186329124975259,
+        0.185885127551341,0.18561872909699,0.185485529869815,0.185441130127423,
+        0.185441130127423,0.185441130127423,0.185174731673072,0.185041532445897,
+        0.184997132703505,0.184997132703505,0.184997132703505,0.184863933476329,
+        0.184819533733938,0.184819533733938,0.184819533733938,0.184819533733938,
+        0.184819533733938,0.184819533733938,0.184819533733938,0.184819533733938,
+        0.184819533733938,0.183931538886102,0.183265542750225,0.182821545326307,
+        0.182555146871956,0.182421947644781,0.182377547902389,0.182377547902389,
+        0.182377547902389,0.181711551766512,0.181267554342594,0.181001155888243,
+        0.180867956661068,0.180823556918676,0.180823556918676,0.180823556918676,
+        0.180379559494758,0.180113161040407,0.179979961813232,0.17993556207084,
+        0.17993556207084,0.17993556207084,0.179669163616489,0.179535964389314,
+        0.179491564646922,0.179491564646922,0.179491564646922,0.179358365419747,
+        0.179313965677355,0.179313965677355,0.179313965677355,0.179313965677355,
+        0.179313965677355,0.179313965677355,0.179313965677355,0.179313965677355,
+        0.179313965677355,0.17869236928387,0.178248371859952,0.177981973405601,
+        0.177848774178425,0.177804374436034,0.177804374436034,0.177804374436034,
+        0.177360377012116,0.177093978557765,0.176960779330589,0.176916379588198,
+        0.176916379588198,0.176916379588198,0.176649981133847,0.176516781906671,
+        0.17647238216428,0.17647238216428,0.17647238216428,0.176339182937104,
+        0.176294783194712,0.176294783194712,0.176294783194712,0.176294783194712,
+        0.176294783194712,0.176294783194712,0.176294783194712,0.176294783194712,
+        0.176294783194712,0.175895185513186,0.175628787058836,0.17549558783166,
+        0.175451188089268,0.175451188089268,0.175451188089268,0.175184789634918,
+        0.175051590407742,0.17500719066535,0.17500719066535,0.17500719066535,
+        0.174873991438175,0.174829591695783,0.174829591695783,0.174829591695783,
+        0.174829591695783,0.174829591695783,0.174829591695783,0.174829591695783,
+        0.174829591695783,0.174829591695783,0.174607592983824,0.174474393756649,
+        0.174429994014257,0.174429994014257,0.174429994014257,0.174296794787082,
+        0.17425239504469,0.17425239504469,0.17425239504469,0.17425239504469,
+        0.17425239504469,0.17425239504469,0.17425239504469,0.17425239504469,
+        0.17425239504469,0.174163595559906,0.174119195817514,0.174119195817514,
+        0.174119195817514,0.174119195817514,0.174119195817514,0.174119195817514,
+        0.174119195817514,0.174119195817514,0.174119195817514,0.174119195817514,
+        0.174119195817514,0.174119195817514,0.174119195817514,0.174119195817514,
+        0.174119195817514,0.174119195817514,0.174119195817514,0.174119195817514,
+        0.174119195817514,0.171679900879444,0.169937547352251,0.168775978334122,
+        0.168079036923244,0.167730566217806,0.167614409315993,0.167614409315993,
+        0.167614409315993,0.165175114377922,0.163432760850729,0.1622711918326,
+        0.161574250421723,0.161225779716284,0.161109622814471,0.161109622814471,
+        0.161109622814471,0.159367269287278,0.158205700269149,0.157508758858272,
+        0.157160288152833,0.15704413125102,0.15704413125102,0.15704413125102,
+        0.155882562232891,0.155185620822014,0.154837150116575,0.154720993214763,
+        0.154720993214763,0.154720993214763,0.154024051803885,0.153675581098447,
+        0.153559424196634,0.153559424196634,0.153559424196634,0.153210953491195,
+        0.153094796589382,0.153094796589382,0.153094796589382,0.153094796589382,
+        0.153094796589382,0.153094796589382,0.153094796589382,0.153094796589382,
+        0.153094796589382,0.150771658553125,0.149029305025931,0.147867736007802,
+        0.147170794596925,0.146822323891486,0.146706166989674,0.146706166989674,
+        0.146706166989674,0.14496381346248,0.143802244444351,0.143105303033474,
+        0.142756832328035,0.142640675426223,0.142640675426223,0.142640675426223,
+        0.141479106408094,0.140782164997216,0.140433694291778,0.140317537389965,
+        0.140317537389965,0.140317537389965,0.139620595979088,0.139272125273649,
+        0.139155968371836,0.139155968371836,0.139155968371836,0.138807497666397,
+        0.138691340764585,0.138691340764585,0.138691340764585,0.138691340764585,
+        0.138691340764585,0.138691340764585,0.138691340764585,0.138691340764585,
+        0.138691340764585,0.137065144139204,0.135903575121075,0.135206633710198,
+        0.134858163004759,0.134742006102946,0.134742006102946,0.134742006102946,
+        0.133580437084818,0.13288349567394,0.132535024968502,0.132418868066689,
+        0.132418868066689,0.132418868066689,0.131721926655811,0.131373455950373,
+        0.13125729904856,0.13125729904856,0.13125729904856,0.130908828343121,
+        0.130792671441308,0.130792671441308,0.130792671441308,0.130792671441308,
+        0.130792671441308,0.130792671441308,0.130792671441308,0.130792671441308,
+        0.130792671441308,0.129747259324992,0.129050317914115,0.128701847208676,
+        0.128585690306864,0.128585690306864,0.128585690306864,0.127888748895986,
+        0.127540278190548,0.127424121288735,0.127424121288735,0.127424121288735,
+        0.127075650583296,0.126959493681483,0.126959493681483,0.126959493681483,
+        0.126959493681483,0.126959493681483,0.126959493681483,0.126959493681483,
+        0.126959493681483,0.126959493681483,0.126378709172419,0.12603023846698,
+        0.125914081565167,0.125914081565167,0.125914081565167,0.125565610859729,
+        0.125449453957916,0.125449453957916,0.125449453957916,0.125449453957916,
+        0.125449453957916,0.125449453957916,0.125449453957916,0.125449453957916,
+        0.125449453957916,0.12521714015429,0.125100983252477,0.125100983252477,
+        0.125100983252477,0.125100983252477,0.125100983252477,0.125100983252477,
+        0.125100983252477,0.125100983252477,0.125100983252477,0.125100983252477,
+        0.125100983252477,0.125100983252477,0.125100983252477,0.125100983252477,
+        0.125100983252477,0.125100983252477,0.125100983252477,0.125100983252477,
+        0.125100983252477,0.123358629725284,0.12161627619809,0.120454707179962,
+        0.119757765769084,0.119409295063646,0.119293138161833,0.119293138161833,
+        0.119293138161833,0.117550784634639,0.116389215616511,0.115692274205633,
+        0.115343803500195,0.115227646598382,0.115227646598382,0.115227646598382,
+        0.114066077580253,0.113369136169376,0.113020665463937,0.112904508562124,
+        0.112904508562124,0.112904508562124,0.112207567151247,0.111859096445808,
+        0.111742939543995,0.111742939543995,0.111742939543995,0.111394468838557,
+        0.111278311936744,0.111278311936744,0.111278311936744,0.111278311936744,
+        0.111278311936744,0.111278311936744,0.111278311936744,0.111278311936744,
+        0.111278311936744,0.109652115311363,0.108490546293234,0.107793604882357,
+        0.107445134176918,0.107328977275106,0.107328977275106,0.107328977275106,
+        0.106167408256977,0.105470466846099,0.105121996140661,0.105005839238848,
+        0.105005839238848,0.105005839238848,0.104308897827971,0.103960427122532,
+        0.103844270220719,0.103844270220719,0.103844270220719,0.10349579951528,
+        0.103379642613468,0.103379642613468,0.103379642613468,0.103379642613468,
+        0.103379642613468,0.103379642613468,0.103379642613468,0.103379642613468,
+        0.103379642613468,0.102334230497152,0.101637289086274,0.101288818380836,
+        0.101172661479023,0.101172661479023,0.101172661479023,0.100475720068145,
+        0.100127249362707,0.100011092460894,0.100011092460894,0.100011092460894,
+        0.0996626217554552,0.0995464648536423,0.0995464648536423,0.0995464648536423,
+        0.0995464648536423,0.0995464648536423,0.0995464648536423,0.0995464648536423,
+        0.0995464648536423,0.0995464648536423,0.0989656803445779,0.0986172096391392,
+        0.0985010527373263,0.0985010527373263,0.0985010527373263,0.0981525820318877,
+        0.0980364251300748,0.0980364251300748,0.0980364251300748,0.0980364251300748,
+        0.0980364251300748,0.0980364251300748,0.0980364251300748,0.0980364251300748,
+        0.0980364251300748,0.097804111326449,0.0976879544246362,0.0976879544246362,
+        0.0976879544246362,0.0976879544246362,0.0976879544246362,0.0976879544246362,
+        0.0976879544246362,0.0976879544246362,0.0976879544246362,0.0976879544246362,
+        0.0976879544246362,0.0976879544246362,0.0976879544246362,0.0976879544246362,
+        0.0976879544246362,0.0976879544246362,0.0976879544246362,0.0976879544246362,
+        0.0976879544246362,0.0965263854065073,0.0953648163883784,0.0946678749775011,
+        0.0943194042720625,0.0942032473702496,0.0942032473702496,0.0942032473702496,
+        0.0930416783521208,0.0923447369412434,0.0919962662358048,0.0918801093339919,
+        0.0918801093339919,0.0918801093339919,0.0911831679231146,0.0908346972176759,
+        0.0907185403158631,0.0907185403158631,0.0907185403158631,0.0903700696104244,
+        0.0902539127086115,0.0902539127086115,0.0902539127086115,0.0902539127086115,
+        0.0902539127086115,0.0902539127086115,0.0902539127086115,0.0902539127086115,
+        0.0902539127086115,0.0892085005922956,0.0885115591814182,0.0881630884759796,
+        0.0880469315741667,0.0880469315741667,0.0880469315741667,0.0873499901632894,
+        0.0870015194578507,0.0868853625560379,0.0868853625560379,0.0868853625560379,
+        0.0865368918505992,0.0864207349487863,0.0864207349487863,0.0864207349487863,
+        0.0864207349487863,0.0864207349487863,0.0864207349487863,0.0864207349487863,
+        0.0864207349487863,0.0864207349487863,0.0858399504397219,0.0854914797342832,
+        0.0853753228324704,0.0853753228324704,0.0853753228324704,0.0850268521270317,
+        0.0849106952252188,0.0849106952252188,0.0849106952252188,0.0849106952252188,
+        0.0849106952252188,0.0849106952252188,0.0849106952252188,0.0849106952252188,
+        0.0849106952252188,0.084678381421593,0.0845622245197802,0.0845622245197802,
+        0.0845622245197802,0.0845622245197802,0.0845622245197802,0.0845622245197802,
+        0.0845622245197802,0.0845622245197802,0.0845622245197802,0.0845622245197802,
+        0.0845622245197802,0.0845622245197802,0.0845622245197802,0.0845622245197802,
+        0.0845622245197802,0.0845622245197802,0.0845622245197802,0.0845622245197802,
+        0.0845622245197802,0.0838652831089029,0.0831683416980255,0.0828198709925869,
+        0.082703714090774,0.082703714090774,0.082703714090774,0.0820067726798967,
+        0.081658301974458,0.0815421450726452,0.0815421450726452,0.0815421450726452,
+        0.0811936743672065,0.0810775174653936,0.0810775174653936,0.0810775174653936,
+        0.0810775174653936,0.0810775174653936,0.0810775174653936,0.0810775174653936,
+        0.0810775174653936,0.0810775174653936,0.0804967329563292,0.0801482622508905,
+        0.0800321053490776,0.0800321053490776,0.0800321053490776,0.079683634643639,
+        0.0795674777418261,0.0795674777418261,0.0795674777418261,0.0795674777418261,
+        0.0795674777418261,0.0795674777418261,0.0795674777418261,0.0795674777418261,
+        0.0795674777418261,0.0793351639382003,0.0792190070363875,0.0792190070363875,
+        0.0792190070363875,0.0792190070363875,0.0792190070363875,0.0792190070363875,
+        0.0792190070363875,0.0792190070363875,0.0792190070363875,0.0792190070363875,
+        0.0792190070363875,0.0792190070363875,0.0792190070363875,0.0792190070363875,
+        0.0792190070363875,0.0792190070363875,0.0792190070363875,0.0792190070363875,
+        0.0792190070363875,0.0788705363309488,0.0785220656255101,0.0784059087236973,
+        0.0784059087236973,0.0784059087236973,0.0780574380182586,0.0779412811164457,
+        0.0779412811164457,0.0779412811164457,0.0779412811164457,0.0779412811164457,
+        0.0779412811164457,0.0779412811164457,0.0779412811164457,0.0779412811164457,
+        0.07770896731282,0.0775928104110071,0.0775928104110071,0.0775928104110071,
+        0.0775928104110071,0.0775928104110071,0.0775928104110071,0.0775928104110071,
+        0.0775928104110071,0.0775928104110071,0.0775928104110071,0.0775928104110071,
+        0.0775928104110071,0.0775928104110071,0.0775928104110071,0.0775928104110071,
+        0.0775928104110071,0.0775928104110071,0.0775928104110071,0.0775928104110071,
+        0.0774766535091942,0.0773604966073813,0.0773604966073813,0.0773604966073813,
+        0.0773604966073813,0.0773604966073813,0.0773604966073813,0.0773604966073813,
+        0.0773604966073813,0.0773604966073813,0.0773604966073813,0.0773604966073813,
+        0.0773604966073813,0.0773604966073813,0.0773604966073813,0.0773604966073813,
+        0.0773604966073813,0.0773604966073813,0.0773604966073813,0.0773604966073813,
+        0.0773604966073813,0.0773604966073813,0.0773604966073813,0.0773604966073813,
+        0.0773604966073813,0.0773604966073813,0.0773604966073813,0.0773604966073813,
+        0.0773604966073813,0.0773604966073813,0.0773604966073813,0.0773604966073813,
+        0.0773604966073813,0.0773604966073813,0.075618143080188,0.0744565740620592,
+        0.0737596326511819,0.0734111619457432,0.0732950050439303,0.0732950050439303,
+        0.0732950050439303,0.0715526515167371,0.0703910824986082,0.0696941410877309,
+        0.0693456703822923,0.0692295134804794,0.0692295134804794,0.0692295134804794,
+        0.0680679444623505,0.0673710030514732,0.0670225323460345,0.0669063754442217,
+        0.0669063754442217,0.0669063754442217,0.0662094340333444,0.0658609633279057,
+        0.0657448064260928,0.0657448064260928,0.0657448064260928,0.0653963357206542,
+        0.0652801788188413,0.0652801788188413,0.0652801788188413,0.0651640219170284,
+        0.0651640219170284,0.0651640219170284,0.0651640219170284,0.0651640219170284,
+        0.0651640219170284,0.063537825291648,0.0623762562735192,0.0616793148626418,
+        0.0613308441572032,0.0612146872553903,0.0612146872553903,0.0612146872553903,
+        0.0600531182372615,0.0593561768263842,0.0590077061209455,0.0588915492191326,
+        0.0588915492191326,0.0588915492191326,0.0581946078082553,0.0578461371028166,
+        0.0577299802010038,0.0577299802010038,0.0577299802010038,0.0573815094955651,
+        0.0572653525937522,0.0572653525937522,0.0572653525937522,0.0571491956919393,
+        0.0571491956919393,0.0571491956919393,0.0571491956919393,0.0571491956919393,
+        0.0571491956919393,0.0561037835756234,0.0554068421647461,0.0550583714593074,
+        0.0549422145574945,0.0549422145574945,0.0549422145574945,0.0542452731466172,
+        0.0538968024411786,0.0537806455393657,0.0537806455393657,0.0537806455393657,
+        0.053432174833927,0.0533160179321141,0.0533160179321141,0.0533160179321141,
+        0.0531998610303013,0.0531998610303013,0.0531998610303013,0.0531998610303013,
+        0.0531998610303013,0.0531998610303013,0.0526190765212368,0.0522706058157982,
+        0.0521544489139853,0.0521544489139853,0.0521544489139853,0.0518059782085466,
+        0.0516898213067338,0.0516898213067338,0.0516898213067338,0.0515736644049209,
+        0.0515736644049209,0.0515736644049209,0.0515736644049209,0.0515736644049209,
+        0.0515736644049209,0.0513413506012951,0.0512251936994822,0.0512251936994822,
+        0.0512251936994822,0.0511090367976693,0.0511090367976693,0.0511090367976693,
+        0.0511090367976693,0.0511090367976693,0.0511090367976693,0.0511090367976693,
+        0.0511090367976693,0.0511090367976693,0.0511090367976693,0.0511090367976693,
+        0.0511090367976693,0.0511090367976693,0.0511090367976693,0.0511090367976693,
+        0.0511090367976693,0.0499474677795405,0.0487858987614116,0.0480889573505343,
+        0.0477404866450957,0.0476243297432828,0.0476243297432828,0.0476243297432828,
+        0.0464627607251539,0.0457658193142766,0.045417348608838,0.0453011917070251,
+        0.0453011917070251,0.0453011917070251,0.0446042502961478,0.0442557795907091,
+        0.0441396226888962,0.0441396226888962,0.0441396226888962,0.0437911519834576,
+        0.0436749950816447,0.0436749950816447,0.0436749950816447,0.0435588381798318,
+        0.0435588381798318,0.0435588381798318,0.0435588381798318,0.0435588381798318,
+        0.0435588381798318,0.0425134260635159,0.0418164846526385,0.0414680139471999,
+        0.041351857045387,0.041351857045387,0.041351857045387,0.0406549156345097,
+        0.040306444929071,0.0401902880272582,0.0401902880272582,0.0401902880272582,
+        0.0398418173218195,0.0397256604200066,0.0397256604200066,0.0397256604200066,
+        0.0396095035181937,0.0396095035181937,0.0396095035181937,0.0396095035181937,
+        0.0396095035181937,0.0396095035181937,0.0390287190091293,0.0386802483036906,
+        0.0385640914018778,0.0385640914018778,0.0385640914018778,0.0382156206964391,
+        0.0380994637946262,0.0380994637946262,0.0380994637946262,0.0379833068928133,
+        0.0379833068928133,0.0379833068928133,0.0379833068928133,0.0379833068928133,
+        0.0379833068928133,0.0377509930891876,0.0376348361873747,0.0376348361873747,
+        0.0376348361873747,0.0375186792855618,0.0375186792855618,0.0375186792855618,
+        0.0375186792855618,0.0375186792855618,0.0375186792855618,0.0375186792855618,
+        0.0375186792855618,0.0375186792855618,0.0375186792855618,0.0375186792855618,
+        0.0375186792855618,0.0375186792855618,0.0375186792855618,0.0375186792855618,
+        0.0375186792855618,0.0368217378746845,0.0361247964638072,0.0357763257583685,
+        0.0356601688565556,0.0356601688565556,0.0356601688565556,0.0349632274456783,
+        0.0346147567402397,0.0344985998384268,0.0344985998384268,0.0344985998384268,
+        0.0341501291329881,0.0340339722311753,0.0340339722311753,0.0340339722311753,
+        0.0339178153293624,0.0339178153293624,0.0339178153293624,0.0339178153293624,
+        0.0339178153293624,0.0339178153293624,0.0333370308202979,0.0329885601148593,
+        0.0328724032130464,0.0328724032130464,0.0328724032130464,0.0325239325076078,
+        0.0324077756057949,0.0324077756057949,0.0324077756057949,0.032291618703982,
+        0.032291618703982,0.032291618703982,0.032291618703982,0.032291618703982,
+        0.032291618703982,0.0320593049003562,0.0319431479985433,0.0319431479985433,
+        0.0319431479985433,0.0318269910967304,0.0318269910967304,0.0318269910967304,
+        0.0318269910967304,0.0318269910967304,0.0318269910967304,0.0318269910967304,
+        0.0318269910967304,0.0318269910967304,0.0318269910967304,0.0318269910967304,
+        0.0318269910967304,0.0318269910967304,0.0318269910967304,0.0318269910967304,
+        0.0318269910967304,0.0314785203912918,0.0311300496858531,0.0310138927840403,
+        0.0310138927840403,0.0310138927840403,0.0306654220786016,0.0305492651767887,
+        0.0305492651767887,0.0305492651767887,0.0304331082749758,0.0304331082749758,
+        0.0304331082749758,0.0304331082749758,0.0304331082749758,0.0304331082749758,
+        0.0302007944713501,0.0300846375695372,0.0300846375695372,0.0300846375695372,
+        0.0299684806677243,0.0299684806677243,0.0299684806677243,0.0299684806677243,
+        0.0299684806677243,0.0299684806677243,0.0299684806677243,0.0299684806677243,
+        0.0299684806677243,0.0299684806677243,0.0299684806677243,0.0299684806677243,
+        0.0299684806677243,0.0299684806677243,0.0299684806677243,0.0299684806677243,
+        0.0298523237659114,0.0297361668640985,0.0297361668640985,0.0297361668640985,
+        0.0296200099622856,0.0296200099622856,0.0296200099622856,0.0296200099622856,
+        0.0296200099622856,0.0296200099622856,0.0296200099622856,0.0296200099622856,
+        0.0296200099622856,0.0296200099622856,0.0296200099622856,0.0296200099622856,
+        0.0296200099622856,0.0296200099622856,0.0296200099622856,0.0296200099622856,
+        0.0296200099622856,0.0296200099622856,0.0296200099622856,0.0296200099622856,
+        0.0296200099622856,0.0296200099622856,0.0296200099622856,0.0296200099622856,
+        0.0296200099622856,0.0296200099622856,0.0296200099622856,0.0296200099622856,
+        0.0296200099622856,0.0296200099622856,0.0296200099622856,0.0284584409441568,
+        0.0277614995332795,0.0274130288278408,0.0272968719260279,0.0272968719260279,
+        0.0272968719260279,0.0261353029078991,0.0254383614970218,0.0250898907915831,
+        0.0249737338897702,0.0249737338897702,0.0249737338897702,0.0242767924788929,
+        0.0239283217734543,0.0238121648716414,0.0238121648716414,0.0238121648716414,
+        0.0234636941662027,0.0233475372643899,0.0233475372643899,0.0233475372643899,
+        0.023231380362577,0.023231380362577,0.023231380362577,0.023231380362577,
+        0.023231380362577,0.023231380362577,0.022185968246261,0.0214890268353837,
+        0.021140556129945,0.0210243992281322,0.0210243992281322,0.0210243992281322,
+        0.0203274578172548,0.0199789871118162,0.0198628302100033,0.0198628302100033,
+        0.0198628302100033,0.0195143595045647,0.0193982026027518,0.0193982026027518,
+        0.0193982026027518,0.0192820457009389,0.0192820457009389,0.0192820457009389,
+        0.0192820457009389,0.0192820457009389,0.0192820457009389,0.0187012611918745,
+        0.0183527904864358,0.0182366335846229,0.0182366335846229,0.0182366335846229,
+        0.0178881628791843,0.0177720059773714,0.0177720059773714,0.0177720059773714,
+        0.0176558490755585,0.0176558490755585,0.0176558490755585,0.0176558490755585,
+        0.0176558490755585,0.0176558490755585,0.0174235352719327,0.0173073783701198,
+        0.0173073783701198,0.0173073783701198,0.017191221468307,0.017191221468307,
+        0.017191221468307,0.017191221468307,0.017191221468307,0.017191221468307,
+        0.017191221468307,0.017191221468307,0.017191221468307,0.017191221468307,
+        0.017191221468307,0.017191221468307,0.017191221468307,0.017191221468307,
+        0.017191221468307,0.017191221468307,0.0164942800574296,0.0157973386465523,
+        0.0154488679411137,0.0153327110393008,0.0153327110393008,0.0153327110393008,
+        0.0146357696284235,0.0142872989229848,0.0141711420211719,0.0141711420211719,
+        0.0141711420211719,0.0138226713157333,0.0137065144139204,0.0137065144139204,
+        0.0137065144139204,0.0135903575121075,0.0135903575121075,0.0135903575121075,
+        0.0135903575121075,0.0135903575121075,0.0135903575121075,0.0130095730030431,
+        0.0126611022976044,0.0125449453957916,0.0125449453957916,0.0125449453957916,
+        0.0121964746903529,0.01208031778854,0.01208031778854,0.01208031778854,
+        0.0119641608867271,0.0119641608867271,0.0119641608867271,0.0119641608867271,
+        0.0119641608867271,0.0119641608867271,0.0117318470831014,0.0116156901812885,
+        0.0116156901812885,0.0116156901812885,0.0114995332794756,0.0114995332794756,
+        0.0114995332794756,0.0114995332794756,0.0114995332794756,0.0114995332794756,
+        0.0114995332794756,0.0114995332794756,0.0114995332794756,0.0114995332794756,
+        0.0114995332794756,0.0114995332794756,0.0114995332794756,0.0114995332794756,
+        0.0114995332794756,0.0114995332794756,0.0111510625740369,0.0108025918685983,
+        0.0106864349667854,0.0106864349667854,0.0106864349667854,0.0103379642613467,
+        0.0102218073595339,0.0102218073595339,0.0102218073595339,0.010105650457721,
+        0.010105650457721,0.010105650457721,0.010105650457721,0.010105650457721,
+        0.010105650457721,0.00987333665409521,0.00975717975228233,0.00975717975228233,
+        0.00975717975228233,0.00964102285046944,0.00964102285046944,0.00964102285046944,
+        0.00964102285046944,0.00964102285046944,0.00964102285046944,0.00964102285046944,
+        0.00964102285046944,0.00964102285046944,0.00964102285046944,0.00964102285046944,
+        0.00964102285046944,0.00964102285046944,0.00964102285046944,0.00964102285046944,
+        0.00964102285046944,0.00952486594865656,0.00940870904684367,0.00940870904684367,
+        0.00940870904684367,0.00929255214503079,0.00929255214503079,0.00929255214503079,
+        0.00929255214503079,0.00929255214503079,0.00929255214503079,0.00929255214503079,
+        0.00929255214503079,0.00929255214503079,0.00929255214503079,0.00929255214503079,
+        0.00929255214503079,0.00929255214503079,0.00929255214503079,0.00929255214503079,
+        0.00929255214503079,0.00929255214503079,0.00929255214503079,0.00929255214503079,
+        0.00929255214503079,0.00929255214503079,0.00929255214503079,0.00929255214503079,
+        0.00929255214503079,0.00929255214503079,0.00929255214503079,0.00929255214503079,
+        0.00929255214503079,0.00929255214503079,0.00929255214503079,0.00929255214503079,
+        0.00859561073415348,0.00824714002871482,0.00813098312690194,0.00813098312690194,
+        0.00813098312690194,0.00743404171602463,0.00708557101058597,0.00696941410877309,
+        0.00696941410877309,0.00696941410877309,0.00662094340333444,0.00650478650152155,
+        0.00650478650152155,0.00650478650152155,0.00638862959970867,0.00638862959970867,
+        0.00638862959970867,0.00638862959970867,0.00638862959970867,0.00638862959970867,
+        0.00580784509064424,0.00545937438520559,0.0053432174833927,0.0053432174833927,
+        0.0053432174833927,0.00499474677795405,0.00487858987614116,0.00487858987614116,
+        0.00487858987614116,0.00476243297432828,0.00476243297432828,0.00476243297432828,
+        0.00476243297432828,0.00476243297432828,0.00476243297432828,0.00453011917070251,
+        0.00441396226888962,0.00441396226888962,0.00441396226888962,0.00429780536707674,
+        0.00429780536707674,0.00429780536707674,0.00429780536707674,0.00429780536707674,
+        0.00429780536707674,0.00429780536707674,0.00429780536707674,0.00429780536707674,
+        0.00429780536707674,0.00429780536707674,0.00429780536707674,0.00429780536707674,
+        0.00429780536707674,0.00429780536707674,0.00429780536707674,0.00394933466163808,
+        0.00360086395619943,0.00348470705438655,0.00348470705438655,0.00348470705438655,
+        0.00313623634894789,0.00302007944713501,0.00302007944713501,0.00302007944713501,
+        0.00290392254532212,0.00290392254532212,0.00290392254532212,0.00290392254532212,
+        0.00290392254532212,0.00290392254532212,0.00267160874169635,0.00255545183988347,
+        0.00255545183988347,0.00255545183988347,0.00243929493807058,0.00243929493807058,
+        0.00243929493807058,0.00243929493807058,0.00243929493807058,0.00243929493807058,
+        0.00243929493807058,0.00243929493807058,0.00243929493807058,0.00243929493807058,
+        0.00243929493807058,0.00243929493807058,0.00243929493807058,0.00243929493807058,
+        0.00243929493807058,0.00243929493807058,0.0023231380362577,0.00220698113444481,
+        0.00220698113444481,0.00220698113444481,0.00209082423263193,0.00209082423263193,
+        0.00209082423263193,0.00209082423263193,0.00209082423263193,0.00209082423263193,
+        0.00209082423263193,0.00209082423263193,0.00209082423263193,0.00209082423263193,
+        0.00209082423263193,0.00209082423263193,0.00209082423263193,0.00209082423263193,
+        0.00209082423263193,0.00209082423263193,0.00209082423263193,0.00209082423263193,
+        0.00209082423263193,0.00209082423263193,0.00209082423263193,0.00209082423263193,
+        0.00209082423263193,0.00209082423263193,0.00209082423263193,0.00209082423263193,
+        0.00209082423263193,0.00209082423263193,0.00209082423263193,0.00209082423263193,
+        0.00209082423263193,0.00174235352719327,0.00162619662538039,0.00162619662538039,
+        0.00162619662538039,0.00127772591994173,0.00116156901812885,0.00116156901812885,
+        0.00116156901812885,0.00104541211631596,0.00104541211631596,0.00104541211631596,
+        0.00104541211631596,0.00104541211631596,0.00104541211631596,0.000813098312690194,
+        0.000696941410877309,0.000696941410877309,0.000696941410877309,0.000580784509064424,
+        0.000580784509064424,0.000580784509064424,0.000580784509064424,0.000580784509064424,
+        0.000580784509064424,0.000580784509064424,0.000580784509064424,0.000580784509064424,
+        0.000580784509064424,0.000580784509064424,0.000580784509064424,0.000580784509064424,
+        0.000580784509064424,0.000580784509064424,0.000580784509064424,0.000464627607251539,
+        0.000348470705438655,0.000348470705438655,0.000348470705438655,0.00023231380362577,
+        0.00023231380362577,0.00023231380362577,0.00023231380362577,0.00023231380362577,
+        0.00023231380362577,0.00023231380362577,0.00023231380362577,0.00023231380362577,
+        0.00023231380362577,0.00023231380362577,0.00023231380362577,0.00023231380362577,
+        0.00023231380362577,0.00023231380362577,0.00023231380362577,0.00023231380362577,
+        0.00023231380362577,0.00023231380362577,0.00023231380362577,0.00023231380362577,
+        0.00023231380362577,0.00023231380362577,0.00023231380362577,0.00023231380362577,
+        0.00023231380362577,0.00023231380362577,0.00023231380362577,0.00023231380362577,
+        0.00023231380362577,0.00023231380362577,0.000116156901812885,0.000116156901812885,
+        0.000116156901812885,0.0,0.0,0.0,
+        0.0,0.0,0.0,0.0,
+        0.0,0.0,0.0,0.0,
+        0.0,0.0,0.0,0.0,
+        0.0,0.0,0.0,0.0,
+        0.0,0.0,0.0,0.0,
+        0.0,0.0,0.0,0.0,
+        0.0,0.0,0.0,0.0,
+        0.0,0.0,0.0,0.0,
+        0.0,0.0,0.0,0.0,
+        0.0,0.0,0.0,0.0,
+        0.0,0.0,0.0,0.0,
+        0.0,0.0
+    ]
+
+# card_to_binary indexed by the integer value of a Card, so the
+# evaluators need one list index per card.
+Five.card_index_to_binary = [
+    Five.card_to_binary[index // 4 + 2][index % 4 + 1] for index in range(52)]
@@ -0,0 +1,453 @@
+"""
+The canonical flops for pokereval.isomorphism, imported by LookupTables on first use.
+"""
+
+class Flops:
+    """
+    canonical_flops holds the 1755 flops up to suit isomorphism as sorted
+    card values, flop_counts how many of the 22100 flops are each one.
+    """
+    canonical_flops = [
+        (0, 1, 2), (0, 1, 4), (0, 1, 8), (0, 1, 12), (0, 1, 16), (0, 1, 20), (0, 1, 24), (0, 1, 28),
+        (0, 1, 32), (0, 1, 36), (0, 1, 40), (0, 1, 44), (0, 1, 48), (0, 4, 5), (0, 4, 8), (0, 4, 9),
+        (0, 4, 12), (0, 4, 13), (0, 4, 16), (0, 4, 17), (0, 4, 20), (0, 4, 21), (0, 4, 24), (0, 4, 25),
+        (0, 4, 28), (0, 4, 29), (0, 4, 32), (0, 4, 33), (0, 4, 36), (0, 4, 37), (0, 4, 40), (0, 4, 41),
+        (0, 4, 44), (0, 4, 45), (0, 4, 48), (0, 4, 49), (0, 5, 8), (0, 5, 12), (0, 5, 16), (0, 5, 20),
+        (0, 5, 24), (0, 5, 28), (0, 5, 32), (0, 5, 36), (0, 5, 40), (0, 5, 44), (0, 5, 48), (0, 8, 9),
+        (0, 8, 12), (0, 8, 13), (0, 8, 16), (0, 8, 17), (0, 8, 20), (0, 8, 21), (0, 8, 24), (0, 8, 25),
+        (0, 8, 28), (0, 8, 29), (0, 8, 32), (0, 8, 33), (0, 8, 36), (0, 8, 37), (0, 8, 40), (0, 8, 41),
+        (0, 8, 44), (0, 8, 45), (0, 8, 48), (0, 8, 49), (0, 9, 12), (0, 9, 16), (0, 9, 20), (0, 9, 24),
+        (0, 9, 28), (0, 9, 32), (0, 9, 36), (0, 9, 40), (0, 9, 44), (0, 9, 48), (0, 12, 13), (0, 12, 16),
+        (0, 12, 17), (0, 12, 20), (0, 12, 21), (0, 12, 24), (0, 12, 25), (0, 12, 28), (0, 12, 29), (0, 12, 32),
+        (0, 12, 33), (0, 12, 36), (0, 12, 37), (0, 12, 40), (0, 12, 41), (0, 12, 44), (0, 12, 45), (0, 12, 48),
+        (0, 12, 49), (0, 13, 16), (0, 13, 20), (0, 13, 24), (0, 13, 28), (0, 13, 32), (0, 13, 36), (0, 13, 40),
+        (0, 13, 44), (0, 13, 48), (0, 16, 17), (0, 16, 20), (0, 16, 21), (0, 16, 24), (0, 16, 25), (0, 16, 28),
+        (0, 16, 29), (0, 16, 32), (0, 16, 33), (0, 16, 36), (0, 16, 37), (0, 16, 40), (0, 16, 41), (0, 16, 44),
+        (0, 16, 45), (0, 16, 48), (0, 16, 49), (0, 17, 20), (0, 17, 24), (0, 17, 28), (0, 17, 32), (0, 17, 36),
+        (0, 17, 40), (0, 17, 44), (0, 17, 48), (0, 20, 21), (0, 20, 24), (0, 20, 25), (0, 20, 28), (0, 20, 29),
+        (0, 20, 32), (0, 20, 33), (0, 20, 36), (0, 20, 37), (0, 20, 40), (0, 20, 41), (0, 20, 44), (0, 20, 45),
+        (0, 20, 48), (0, 20, 49), (0, 21, 24), (0, 21, 28), (0, 21, 32), (0, 21, 36), (0, 21, 40), (0, 21, 44),
+        (0, 21, 48), (0, 24, 25), (0, 24, 28), (0, 24, 29), (0, 24, 32), (0, 24, 33), (0, 24, 36), (0, 24, 37),
+        (0, 24, 40), (0, 24, 41), (0, 24, 44), (0, 24, 45), (0, 24, 48), (0, 24, 49), (0, 25, 28), (0, 25, 32),
+        (0, 25, 36), (0, 25, 40), (0, 25, 44), (0, 25, 48), (0, 28, 29), (0, 28, 32), (0, 28, 33), (0, 28, 36),
+        (0, 28, 37), (0, 28, 40), (0, 28, 41), (0, 28, 44), (0, 28, 45), (0, 28, 48), (0, 28, 49), (0, 29, 32),
+        (0, 29, 36), (0, 29, 40), (0, 29, 44), (0, 29, 48), (0, 32, 33), (0, 32, 36), (0, 32, 37), (0, 32, 40),
+        (0, 32, 41), (0, 32, 44), (0, 32, 45), (0, 32, 48), (0, 32, 49), (0, 33, 36), (0, 33, 40), (0, 33, 44),
+        (0, 33, 48), (0, 36, 37), (0, 36, 40), (0, 36, 41), (0, 36, 44), (0, 36, 45), (0, 36, 48), (0, 36, 49),
+        (0, 37, 40), (0, 37, 44), (0, 37, 48), (0, 40, 41), (0, 40, 44), (0, 40, 45), (0, 40, 48), (0, 40, 49),
+        (0, 41, 44), (0, 41, 48), (0, 44, 45), (0, 44, 48), (0, 44, 49), (0, 45, 48), (0, 48, 49), (1, 2, 4),
+        (1, 2, 8), (1, 2, 12), (1, 2, 16), (1, 2, 20), (1, 2, 24), (1, 2, 28), (1, 2, 32), (1, 2, 36),
+        (1, 2, 40), (1, 2, 44), (1, 2, 48), (1, 4, 8), (1, 4, 12), (1, 4, 16), (1, 4, 20), (1, 4, 24),
+        (1, 4, 28), (1, 4, 32), (1, 4, 36), (1, 4, 40), (1, 4, 44), (1, 4, 48), (1, 8, 12), (1, 8, 16),
+        (1, 8, 20), (1, 8, 24), (1, 8, 28), (1, 8, 32), (1, 8, 36), (1, 8, 40), (1, 8, 44), (1, 8, 48),
+        (1, 12, 16), (1, 12, 20), (1, 12, 24), (1, 12, 28), (1, 12, 32), (1, 12, 36), (1, 12, 40), (1, 12, 44),
+        (1, 12, 48), (1, 16, 20), (1, 16, 24), (1, 16, 28), (1, 16, 32), (1, 16, 36), (1, 16, 40), (1, 16, 44),
+        (1, 16, 48), (1, 20, 24), (1, 20, 28), (1, 20, 32), (1, 20, 36), (1, 20, 40), (1, 20, 44), (1, 20, 48),
+        (1, 24, 28), (1, 24, 32), (1, 24, 36), (1, 24, 40), (1, 24, 44), (1, 24, 48), (1, 28, 32), (1, 28, 36),
+        (1, 28, 40), (1, 28, 44), (1, 28, 48), (1, 32, 36), (1, 32, 40), (1, 32, 44), (1, 32, 48), (1, 36, 40),
+        (1, 36, 44), (1, 36, 48), (1, 40, 44), (1, 40, 48), (1, 44, 48), (2, 4, 5), (2, 5, 8), (2, 5, 12),
+        (2, 5, 16), (2, 5, 20), (2, 5, 24), (2, 5, 28), (2, 5, 32), (2, 5, 36), (2, 5, 40), (2, 5, 44),
+        (2, 5, 48), (2, 8, 9), (2, 9, 12), (2, 9, 16), (2, 9, 20), (2, 9, 24), (2, 9, 28), (2, 9, 32),
+        (2, 9, 36), (2, 9, 40), (2, 9, 44), (2, 9, 48), (2, 12, 13), (2, 13, 16), (2, 13, 20), (2, 13, 24),
+        (2, 13, 28), (2, 13, 32), (2, 13, 36), (2, 13, 40), (2, 13, 44), (2, 13, 48), (2, 16, 17), (2, 17, 20),
+        (2, 17, 24), (2, 17, 28), (2, 17, 32), (2, 17, 36), (2, 17, 40), (2, 17, 44), (2, 17, 48), (2, 20, 21),
+        (2, 21, 24), (2, 21, 28), (2, 21, 32), (2, 21, 36), (2, 21, 40), (2, 21, 44), (2, 21, 48), (2, 24, 25),
+        (2, 25, 28), (2, 25, 32), (2, 25, 36), (2, 25, 40), (2, 25, 44), (2, 25, 48), (2, 28, 29), (2, 29, 32),
+        (2, 29, 36), (2, 29, 40), (2, 29, 44), (2, 29, 48), (2, 32, 33), (2, 33, 36), (2, 33, 40), (2, 33, 44),
+        (2, 33, 48), (2, 36, 37), (2, 37, 40), (2, 37, 44), (2, 37, 48), (2, 40, 41), (2, 41, 44), (2, 41, 48),
+        (2, 44, 45), (2, 45, 48), (2, 48, 49), (4, 5, 6), (4, 5, 8), (4, 5, 12), (4, 5, 16), (4, 5, 20),
+        (4, 5, 24), (4, 5, 28), (4, 5, 32), (4, 5, 36), (4, 5, 40), (4, 5, 44), (4, 5, 48), (4, 8, 9),
+        (4, 8, 12), (4, 8, 13), (4, 8, 16), (4, 8, 17), (4, 8, 20), (4, 8, 21), (4, 8, 24), (4, 8, 25),
+        (4, 8, 28), (4, 8, 29), (4, 8, 32), (4, 8, 33), (4, 8, 36), (4, 8, 37), (4, 8, 40), (4, 8, 41),
+        (4, 8, 44), (4, 8, 45), (4, 8, 48), (4, 8, 49), (4, 9, 12), (4, 9, 16), (4, 9, 20), (4, 9, 24),
+        (4, 9, 28), (4, 9, 32), (4, 9, 36), (4, 9, 40), (4, 9, 44), (4, 9, 48), (4, 12, 13), (4, 12, 16),
+        (4, 12, 17), (4, 12, 20), (4, 12, 21), (4, 12, 24), (4, 12, 25), (4, 12, 28), (4, 12, 29), (4, 12, 32),
+        (4, 12, 33), (4, 12, 36), (4, 12, 37), (4, 12, 40), (4, 12, 41), (4, 12, 44), (4, 12, 45), (4, 12, 48),
+        (4, 12, 49), (4, 13, 16), (4, 13, 20), (4, 13, 24), (4, 13, 28), (4, 13, 32), (4, 13, 36), (4, 13, 40),
+        (4, 13, 44), (4, 13, 48), (4, 16, 17), (4, 16, 20), (4, 16, 21), (4, 16, 24), (4, 16, 25), (4, 16, 28),
+        (4, 16, 29), (4, 16, 32), (4, 16, 33), (4, 16, 36), (4, 16, 37), (4, 16, 40), (4, 16, 41), (4, 16, 44),
+        (4, 16, 45), (4, 16, 48), (4, 16, 49), (4, 17, 20), (4, 17, 24), (4, 17, 28), (4, 17, 32), (4, 17, 36),
+        (4, 17, 40), (4, 17, 44), (4, 17, 48), (4, 20, 21), (4, 20, 24), (4, 20, 25), (4, 20, 28), (4, 20, 29),
+        (4, 20, 32), (4, 20, 33), (4, 20, 36), (4, 20, 37), (4, 20, 40), (4, 20, 41), (4, 20, 44), (4, 20, 45),
+        (4, 20, 48), (4, 20, 49), (4, 21, 24), (4, 21, 28), (4, 21, 32), (4, 21, 36), (4, 21, 40), (4, 21, 44),
+        (4, 21, 48), (4, 24, 25), (4, 24, 28), (4, 24, 29), (4, 24, 32), (4, 24, 33), (4, 24, 36), (4, 24, 37),
+        (4, 24, 40), (4, 24, 41), (4, 24, 44), (4, 24, 45), (4, 24, 48), (4, 24, 49), (4, 25, 28), (4, 25, 32),
+        (4, 25, 36), (4, 25, 40), (4, 25, 44), (4, 25, 48), (4, 28, 29), (4, 28, 32), (4, 28, 33), (4, 28, 36),
+        (4, 28, 37), (4, 28, 40), (4, 28, 41), (4, 28, 44), (4, 28, 45), (4, 28, 48), (4, 28, 49), (4, 29, 32),
+        (4, 29, 36), (4, 29, 40), (4, 29, 44), (4, 29, 48), (4, 32, 33), (4, 32, 36), (4, 32, 37), (4, 32, 40),
+        (4, 32, 41), (4, 32, 44), (4, 32, 45), (4, 32, 48), (4, 32, 49), (4, 33, 36), (4, 33, 40), (4, 33, 44),
+        (4, 33, 48), (4, 36, 37), (4, 36, 40), (4, 36, 41), (4, 36, 44), (4, 36, 45), (4, 36, 48), (4, 36, 49),
+        (4, 37, 40), (4, 37, 44), (4, 37, 48), (4, 40, 41), (4, 40, 44), (4, 40, 45), (4, 40, 48), (4, 40, 49),
+        (4, 41, 44), (4, 41, 48), (4, 44, 45), (4, 44, 48), (4, 44, 49), (4, 45, 48), (4, 48, 49), (5, 6, 8),
+        (5, 6, 12), (5, 6, 16), (5, 6, 20), (5, 6, 24), (5, 6, 28), (5, 6, 32), (5, 6, 36), (5, 6, 40),
+        (5, 6, 44), (5, 6, 48), (5, 8, 12), (5, 8, 16), (5, 8, 20), (5, 8, 24), (5, 8, 28), (5, 8, 32),
+        (5, 8, 36), (5, 8, 40), (5, 8, 44), (5, 8, 48), (5, 12, 16), (5, 12, 20), (5, 12, 24), (5, 12, 28),
+        (5, 12, 32), (5, 12, 36), (5, 12, 40), (5, 12, 44), (5, 12, 48), (5, 16, 20), (5, 16, 24), (5, 16, 28),
+        (5, 16, 32), (5, 16, 36), (5, 16, 40), (5, 16, 44), (5, 16, 48), (5, 20, 24), (5, 20, 28), (5, 20, 32),
+        (5, 20, 36), (5, 20, 40), (5, 20, 44), (5, 20, 48), (5, 24, 28), (5, 24, 32), (5, 24, 36), (5, 24, 40),
+        (5, 24, 44), (5, 24, 48), (5, 28, 32), (5, 28, 36), (5, 28, 40), (5, 28, 44), (5, 28, 48), (5, 32, 36),
+        (5, 32, 40), (5, 32, 44), (5, 32, 48), (5, 36, 40), (5, 36, 44), (5, 36, 48), (5, 40, 44), (5, 40, 48),
+        (5, 44, 48), (6, 8, 9), (6, 9, 12), (6, 9, 16), (6, 9, 20), (6, 9, 24), (6, 9, 28), (6, 9, 32),
+        (6, 9, 36), (6, 9, 40), (6, 9, 44), (6, 9, 48), (6, 12, 13), (6, 13, 16), (6, 13, 20), (6, 13, 24),
+        (6, 13, 28), (6, 13, 32), (6, 13, 36), (6, 13, 40), (6, 13, 44), (6, 13, 48), (6, 16, 17), (6, 17, 20),
+        (6, 17, 24), (6, 17, 28), (6, 17, 32), (6, 17, 36), (6, 17, 40), (6, 17, 44), (6, 17, 48), (6, 20, 21),
+        (6, 21, 24), (6, 21, 28), (6, 21, 32), (6, 21, 36), (6, 21, 40), (6, 21, 44), (6, 21, 48), (6, 24, 25),
+        (6, 25, 28), (6, 25, 32), (6, 25, 36), (6, 25, 40), (6, 25, 44), (6, 25, 48), (6, 28, 29), (6, 29, 32),
+        (6, 29, 36), (6, 29, 40), (6, 29, 44), (6, 29, 48), (6, 32, 33), (6, 33, 36), (6, 33, 40), (6, 33, 44),
+        (6, 33, 48), (6, 36, 37), (6, 37, 40), (6, 37, 44), (6, 37, 48), (6, 40, 41), (6, 41, 44), (6, 41, 48),
+        (6, 44, 45), (6, 45, 48), (6, 48, 49), (8, 9, 10), (8, 9, 12), (8, 9, 16), (8, 9, 20), (8, 9, 24),
+        (8, 9, 28), (8, 9, 32), (8, 9, 36), (8, 9, 40), (8, 9, 44), (8, 9, 48), (8, 12, 13), (8, 12, 16),
+        (8, 12, 17), (8, 12, 20), (8, 12, 21), (8, 12, 24), (8, 12, 25), (8, 12, 28), (8, 12, 29), (8, 12, 32),
+        (8, 12, 33), (8, 12, 36), (8, 12, 37), (8, 12, 40), (8, 12, 41), (8, 12, 44), (8, 12, 45), (8, 12, 48),
+        (8, 12, 49), (8, 13, 16), (8, 13, 20), (8, 13, 24), (8, 13, 28), (8, 13, 32), (8, 13, 36), (8, 13, 40),
+        (8, 13, 44), (8, 13, 48), (8, 16, 17), (8, 16, 20), (8, 16, 21), (8, 16, 24), (8, 16, 25), (8, 16, 28),
+        (8, 16, 29), (8, 16, 32), (8, 16, 33), (8, 16, 36), (8, 16, 37), (8, 16, 40), (8, 16, 41), (8, 16, 44),
+        (8, 16, 45), (8, 16, 48), (8, 16, 49), (8, 17, 20), (8, 17, 24), (8, 17, 28), (8, 17, 32), (8, 17, 36),
+        (8, 17, 40), (8, 17, 44), (8, 17, 48), (8, 20, 21), (8, 20, 24), (8, 20, 25), (8, 20, 28), (8, 20, 29),
+        (8, 20, 32), (8, 20, 33), (8, 20, 36), (8, 20, 37), (8, 20, 40), (8, 20, 41), (8, 20, 44), (8, 20, 45),
+        (8, 20, 48), (8, 20, 49), (8, 21, 24), (8, 21, 28), (8, 21, 32), (8, 21, 36), (8, 21, 40), (8, 21, 44),
+        (8, 21, 48), (8, 24, 25), (8, 24, 28), (8, 24, 29), (8, 24, 32), (8, 24, 33), (8, 24, 36), (8, 24, 37),
+        (8, 24, 40), (8, 24, 41), (8, 24, 44), (8, 24, 45), (8, 24, 48), (8, 24, 49), (8, 25, 28), (8, 25, 32),
+        (8, 25, 36), (8, 25, 40), (8, 25, 44), (8, 25, 48), (8, 28, 29), (8, 28, 32), (8, 28, 33), (8, 28, 36),
+        (8, 28, 37), (8, 28, 40), (8, 28, 41), (8, 28, 44), (8, 28, 45), (8, 28, 48), (8, 28, 49), (8, 29, 32),
+        (8, 29, 36), (8, 29, 40), (8, 29, 44), (8, 29, 48), (8, 32, 33), (8, 32, 36), (8, 32, 37), (8, 32, 40),
+        (8, 32, 41), (8, 32, 44), (8, 32, 45), (8, 32, 48), (8, 32, 49), (8, 33, 36), (8, 33, 40), (8, 33, 44),
+        (8, 33, 48), (8, 36, 37), (8, 36, 40), (8, 36, 41), (8, 36, 44), (8, 36, 45), (8, 36, 48), (8, 36, 49),
+        (8, 37, 40), (8, 37, 44), (8, 37, 48), (8, 40, 41), (8, 40, 44), (8, 40, 45), (8, 40, 48), (8, 40, 49),
+        (8, 41, 44), (8, 41, 48), (8, 44, 45), (8, 44, 48), (8, 44, 49), (8, 45, 48), (8, 48, 49), (9, 10, 12),
+        (9, 10, 16), (9, 10, 20), (9, 10, 24), (9, 10, 28), (9, 10, 32), (9, 10, 36), (9, 10, 40), (9, 10, 44),
+        (9, 10, 48), (9, 12, 16), (9, 12, 20), (9, 12, 24), (9, 12, 28), (9, 12, 32), (9, 12, 36), (9, 12, 40),
+        (9, 12, 44), (9, 12, 48), (9, 16, 20), (9, 16, 24), (9, 16, 28), (9, 16, 32), (9, 16, 36), (9, 16, 40),
+        (9, 16, 44), (9, 16, 48), (9, 20, 24), (9, 20, 28), (9, 20, 32), (9, 20, 36), (9, 20, 40), (9, 20, 44),
+        (9, 20, 48), (9, 24, 28), (9, 24, 32), (9, 24, 36), (9, 24, 40), (9, 24, 44), (9, 24, 48), (9, 28, 32),
+        (9, 28, 36), (9, 28, 40), (9, 28, 44), (9, 28, 48), (9, 32, 36), (9, 32, 40), (9, 32, 44), (9, 32, 48),
+        (9, 36, 40), (9, 36, 44), (9, 36, 48), (9, 40, 44), (9, 40, 48), (9, 44, 48), (10, 12, 13), (10, 13, 16),
+        (10, 13, 20), (10, 13, 24), (10, 13, 28), (10, 13, 32), (10, 13, 36), (10, 13, 40), (10, 13, 44), (10, 13, 48),
+        (10, 16, 17), (10, 17, 20), (10, 17, 24), (10, 17, 28), (10, 17, 32), (10, 17, 36), (10, 17, 40), (10, 17, 44),
+        (10, 17, 48), (10, 20, 21), (10, 21, 24), (10, 21, 28), (10, 21, 32), (10, 21, 36), (10, 21, 40), (10, 21, 44),
+        (10, 21, 48), (10, 24, 25), (10, 25, 28), (10, 25, 32), (10, 25, 36), (10, 25, 40), (10, 25, 44), (10, 25, 48),
+        (10, 28, 29), (10, 29, 32), (10, 29, 36), (10, 29, 40), (10, 29, 44), (10, 29, 48), (10, 32, 33), (10, 33, 36),
+        (10, 33, 40), (10, 33, 44), (10, 33, 48), (10, 36, 37), (10, 37, 40), (10, 37, 44), (10, 37, 48), (10, 40, 41),
+        (10, 41, 44), (10, 41, 48), (10, 44, 45), (10, 45, 48), (10, 48, 49), (12, 13, 14), (12, 13, 16), (12, 13, 20),
+        (12, 13, 24), (12, 13, 28), (12, 13, 32), (12, 13, 36), (12, 13, 40), (12, 13, 44), (12, 13, 48), (12, 16, 17),
+        (12, 16, 20), (12, 16, 21), (12, 16, 24), (12, 16, 25), (12, 16, 28), (12, 16, 29), (12, 16, 32), (12, 16, 33),
+        (12, 16, 36), (12, 16, 37), (12, 16, 40), (12, 16, 41), (12, 16, 44), (12, 16, 45), (12, 16, 48), (12, 16, 49),
+        (12, 17, 20), (12, 17, 24), (12, 17, 28), (12, 17, 32), (12, 17, 36), (12, 17, 40), (12, 17, 44), (12, 17, 48),
+        (12, 20, 21), (12, 20, 24), (12, 20, 25), (12, 20, 28), (12, 20, 29), (12, 20, 32), (12, 20, 33), (12, 20, 36),
+        (12, 20, 37), (12, 20, 40), (12, 20, 41), (12, 20, 44), (12, 20, 45), (12, 20, 48), (12, 20, 49), (12, 21, 24),
+        (12, 21, 28), (12, 21, 32), (12, 21, 36), (12, 21, 40), (12, 21, 44), (12, 21, 48), (12, 24, 25), (12, 24, 28),
+        (12, 24, 29), (12, 24, 32), (12, 24, 33), (12, 24, 36), (12, 24, 37), (12, 24, 40), (12, 24, 41), (12, 24, 44),
+        (12, 24, 45), (12, 24, 48), (12, 24, 49), (12, 25, 28), (12, 25, 32), (12, 25, 36), (12, 25, 40), (12, 25, 44),
+        (12, 25, 48), (12, 28, 29), (12, 28, 32), (12, 28, 33), (12, 28, 36), (12, 28, 37), (12, 28, 40), (12, 28, 41),
+        (12, 28, 44), (12, 28, 45), (12, 28, 48), (12, 28, 49), (12, 29, 32), (12, 29, 36), (12, 29, 40), (12, 29, 44),
+        (12, 29, 48), (12, 32, 33), (12, 32, 36), (12, 32, 37), (12, 32, 40), (12, 32, 41), (12, 32, 44), (12, 32, 45),
+        (12, 32, 48), (12, 32, 49), (12, 33, 36), (12, 33, 40), (12, 33, 44), (12, 33, 48), (12, 36, 37), (12, 36, 40),
+        (12, 36, 41), (12, 36, 44), (12, 36, 45), (12, 36, 48), (12, 36, 49), (12, 37, 40), (12, 37, 44), (12, 37, 48),
+        (12, 40, 41), (12, 40, 44), (12, 40, 45), (12, 40, 48), (12, 40, 49), (12, 41, 44), (12, 41, 48), (12, 44, 45),
+        (12, 44, 48), (12, 44, 49), (12, 45, 48), (12, 48, 49), (13, 14, 16), (13, 14, 20), (13, 14, 24), (13, 14, 28),
+        (13, 14, 32), (13, 14, 36), (13, 14, 40), (13, 14, 44), (13, 14, 48), (13, 16, 20), (13, 16, 24), (13, 16, 28),
+        (13, 16, 32), (13, 16, 36), (13, 16, 40), (13, 16, 44), (13, 16, 48), (13, 20, 24), (13, 20, 28), (13, 20, 32),
+        (13, 20, 36), (13, 20, 40), (13, 20, 44), (13, 20, 48), (13, 24, 28), (13, 24, 32), (13, 24, 36), (13, 24, 40),
+        (13, 24, 44), (13, 24, 48), (13, 28, 32), (13, 28, 36), (13, 28, 40), (13, 28, 44), (13, 28, 48), (13, 32, 36),
+        (13, 32, 40), (13, 32, 44), (13, 32, 48), (13, 36, 40), (13, 36, 44), (13, 36, 48), (13, 40, 44), (13, 40, 48),
+        (13, 44, 48), (14, 16, 17), (14, 17, 20), (14, 17, 24), (14, 17, 28), (14, 17, 32), (14, 17, 36), (14, 17, 40),
+        (14, 17, 44), (14, 17, 48), (14, 20, 21), (14, 21, 24), (14, 21, 28), (14, 21, 32), (14, 21, 36), (14, 21, 40),
+        (14, 21, 44), (14, 21, 48), (14, 24, 25), (14, 25, 28), (14, 25, 32), (14, 25, 36), (14, 25, 40), (14, 25, 44),
+        (14, 25, 48), (14, 28, 29), (14, 29, 32), (14, 29, 36), (14, 29, 40), (14, 29, 44), (14, 29, 48), (14, 32, 33),
+        (14, 33, 36), (14, 33, 40), (14, 33, 44), (14, 33, 48), (14, 36, 37), (14, 37, 40), (14, 37, 44), (14, 37, 48),
+        (14, 40, 41), (14, 41, 44), (14, 41, 48), (14, 44, 45), (14, 45, 48), (14, 48, 49), (16, 17, 18), (16, 17, 20),
+        (16, 17, 24), (16, 17, 28), (16, 17, 32), (16, 17, 36), (16, 17, 40), (16, 17, 44), (16, 17, 48), (16, 20, 21),
+        (16, 20, 24), (16, 20, 25), (16, 20, 28), (16, 20, 29), (16, 20, 32), (16, 20, 33), (16, 20, 36), (16, 20, 37),
+        (16, 20, 40), (16, 20, 41), (16, 20, 44), (16, 20, 45), (16, 20, 48), (16, 20, 49), (16, 21, 24), (16, 21, 28),
+        (16, 21, 32), (16, 21, 36), (16, 21, 40), (16, 21, 44), (16, 21, 48), (16, 24, 25), (16, 24, 28), (16, 24, 29),
+        (16, 24, 32), (16, 24, 33), (16, 24, 36), (16, 24, 37), (16, 24, 40), (16, 24, 41), (16, 24, 44), (16, 24, 45),
+        (16, 24, 48), (16, 24, 49), (16, 25, 28), (16, 25, 32), (16, 25, 36), (16, 25, 40), (16, 25, 44), (16, 25, 48),
+        (16, 28, 29), (16, 28, 32), (16, 28, 33), (16, 28, 36), (16, 28, 37), (16, 28, 40), (16, 28, 41), (16, 28, 44),
+        (16, 28, 45), (16, 28, 48), (16, 28, 49), (16, 29, 32), (16, 29, 36), (16, 29, 40), (16, 29, 44), (16, 29, 48),
+        (16, 32, 33), (16, 32, 36), (16, 32, 37), (16, 32, 40), (16, 32, 41), (16, 32, 44), (16, 32, 45), (16, 32, 48),
+        (16, 32, 49), (16, 33, 36), (16, 33, 40), (16, 33, 44), (16, 33, 48), (16, 36, 37), (16, 36, 40), (16, 36, 41),
+        (16, 36, 44), (16, 36, 45), (16, 36, 48), (16, 36, 49), (16, 37, 40), (16, 37, 44), (16, 37, 48), (16, 40, 41),
+        (16, 40, 44), (16, 40, 45), (16, 40, 48), (16, 40, 49), (16, 41, 44), (16, 41, 48), (16, 44, 45), (16, 44, 48),
+        (16, 44, 49), (16, 45, 48), (16, 48, 49), (17, 18, 20), (17, 18, 24), (17, 18, 28), (17, 18, 32), (17, 18, 36),
+        (17, 18, 40), (17, 18, 44), (17, 18, 48), (17, 20, 24), (17, 20, 28), (17, 20, 32), (17, 20, 36), (17, 20, 40),
+        (17, 20, 44), (17, 20, 48), (17, 24, 28), (17, 24, 32), (17, 24, 36), (17, 24, 40), (17, 24, 44), (17, 24, 48),
+        (17, 28, 32), (17, 28, 36), (17, 28, 40), (17, 28, 44), (17, 28, 48), (17, 32, 36), (17, 32, 40), (17, 32, 44),
+        (17, 32, 48), (17, 36, 40), (17, 36, 44), (17, 36, 48), (17, 40, 44), (17, 40, 48), (17, 44, 48), (18, 20, 21),
+        (18, 21, 24), (18, 21, 28), (18, 21, 32), (18, 21, 36), (18, 21, 40), (18, 21, 44), (18, 21, 48), (18, 24, 25),
+        (18, 25, 28), (18, 25, 32), (18, 25, 36), (18, 25, 40), (18, 25, 44), (18, 25, 48), (18, 28, 29), (18, 29, 32),
+        (18, 29, 36), (18, 29, 40), (18, 29, 44), (18, 29, 48), (18, 32, 33), (18, 33, 36), (18, 33, 40), (18, 33, 44),
+        (18, 33, 48), (18, 36, 37), (18, 37, 40), (18, 37, 44), (18, 37, 48), (18, 40, 41), (18, 41, 44), (18, 41, 48),
+        (18, 44, 45), (18, 45, 48), (18, 48, 49), (20, 21, 22), (20, 21, 24), (20, 21, 28), (20, 21, 32), (20, 21, 36),
+        (20, 21, 40), (20, 21, 44), (20, 21, 48), (20, 24, 25), (20, 24, 28), (20, 24, 29), (20, 24, 32), (20, 24, 33),
+        (20, 24, 36), (20, 24, 37), (20, 24, 40), (20, 24, 41), (20, 24, 44), (20, 24, 45), (20, 24, 48), (20, 24, 49),
+        (20, 25, 28), (20, 25, 32), (20, 25, 36), (20, 25, 40), (20, 25, 44), (20, 25, 48), (20, 28, 29), (20, 28, 32),
+        (20, 28, 33), (20, 28, 36), (20, 28, 37), (20, 28, 40), (20, 28, 41), (20, 28, 44), (20, 28, 45), (20, 28, 48),
+        (20, 28, 49), (20, 29, 32), (20, 29, 36), (20, 29, 40), (20, 29, 44), (20, 29, 48), (20, 32, 33), (20, 32, 36),
+        (20, 32, 37), (20, 32, 40), (20, 32, 41), (20, 32, 44), (20, 32, 45), (20, 32, 48), (20, 32, 49), (20, 33, 36),
+        (20, 33, 40), (20, 33, 44), (20, 33, 48), (20, 36, 37), (20, 36, 40), (20, 36, 41), (20, 36, 44), (20, 36, 45),
+        (20, 36, 48), (20, 36, 49), (20, 37, 40), (20, 37, 44), (20, 37, 48), (20, 40, 41), (20, 40, 44), (20, 40, 45),
+        (20, 40, 48), (20, 40, 49), (20, 41, 44), (20, 41, 48), (20, 44, 45), (20, 44, 48), (20, 44, 49), (20, 45, 48),
+        (20, 48, 49), (21, 22, 24), (21, 22, 28), (21, 22, 32), (21, 22, 36), (21, 22, 40), (21, 22, 44), (21, 22, 48),
+        (21, 24, 28), (21, 24, 32), (21, 24, 36), (21, 24, 40), (21, 24, 44), (21, 24, 48), (21, 28, 32), (21, 28, 36),
+        (21, 28, 40), (21, 28, 44), (21, 28, 48), (21, 32, 36), (21, 32, 40), (21, 32, 44), (21, 32, 48), (21, 36, 40),
+        (21, 36, 44), (21, 36, 48), (21, 40, 44), (21, 40, 48), (21, 44, 48), (22, 24, 25), (22, 25, 28), (22, 25, 32),
+        (22, 25, 36), (22, 25, 40), (22, 25, 44), (22, 25, 48), (22, 28, 29), (22, 29, 32), (22, 29, 36), (22, 29, 40),
+        (22, 29, 44), (22, 29, 48), (22, 32, 33), (22, 33, 36), (22, 33, 40), (22, 33, 44), (22, 33, 48), (22, 36, 37),
+        (22, 37, 40), (22, 37, 44), (22, 37, 48), (22, 40, 41), (22, 41, 44), (22, 41, 48), (22, 44, 45), (22, 45, 48),
+        (22, 48, 49), (24, 25, 26), (24, 25, 28), (24, 25, 32), (24, 25, 36), (24, 25, 40), (24, 25, 44), (24, 25, 48),
+        (24, 28, 29), (24, 28, 32), (24, 28, 33), (24, 28, 36), (24, 28, 37), (24, 28, 40), (24, 28, 41), (24, 28, 44),
+        (24, 28, 45), (24, 28, 48), (24, 28, 49), (24, 29, 32), (24, 29, 36), (24, 29, 40), (24, 29, 44), (24, 29, 48),
+        (24, 32, 33), (24, 32, 36), (24, 32, 37), (24, 32, 40), (24, 32, 41), (24, 32, 44), (24, 32, 45), (24, 32, 48),
+        (24, 32, 49), (24, 33, 36), (24, 33, 40), (24, 33, 44), (24, 33, 48), (24, 36, 37), (24, 36, 40), (24, 36, 41),
+        (24, 36, 44), (24, 36, 45), (24, 36, 48), (24, 36, 49), (24, 37, 40), (24, 37, 44), (24, 37, 48), (24, 40, 41),
+        (24, 40, 44), (24, 40, 45), (24, 40, 48), (24, 40, 49), (24, 41, 44), (24, 41, 48), (24, 44, 45), (24, 44, 48),
+        (24, 44, 49), (24, 45, 48), (24, 48, 49), (25, 26, 28), (25, 26, 32), (25, 26, 36), (25, 26, 40), (25, 26, 44),
+        (25, 26, 48), (25, 28, 32), (25, 28, 36), (25, 28, 40), (25, 28, 44), (25, 28, 48), (25, 32, 36), (25, 32, 40),
+        (25, 32, 44), (25, 32, 48), (25, 36, 40), (25, 36, 44), (25, 36, 48), (25, 40, 44), (25, 40, 48), (25, 44, 48),
+        (26, 28, 29), (26, 29, 32), (26, 29, 36), (26, 29, 40), (26, 29, 44), (26, 29, 48), (26, 32, 33), (26, 33, 36),
+        (26, 33, 40), (26, 33, 44), (26, 33, 48), (26, 36, 37), (26, 37, 40), (26, 37, 44), (26, 37, 48), (26, 40, 41),
+        (26, 41, 44), (26, 41, 48), (26, 44, 45), (26, 45, 48), (26, 48, 49), (28, 29, 30), (28, 29, 32), (28, 29, 36),
+        (28, 29, 40), (28, 29, 44), (28, 29, 48), (28, 32, 33), (28, 32, 36), (28, 32, 37), (28, 32, 40), (28, 32, 41),
+        (28, 32, 44), (28, 32, 45), (28, 32, 48), (28, 32, 49), (28, 33, 36), (28, 33, 40), (28, 33, 44), (28, 33, 48),
+        (28, 36, 37), (28, 36, 40), (28, 36, 41), (28, 36, 44), (28, 36, 45), (28, 36, 48), (28, 36, 49), (28, 37, 40),
+        (28, 37, 44), (28, 37, 48), (28, 40, 41), (28, 40, 44), (28, 40, 45), (28, 40, 48), (28, 40, 49), (28, 41, 44),
+        (28, 41, 48), (28, 44, 45), (28, 44, 48), (28, 44, 49), (28, 45, 48), (28, 48, 49), (29, 30, 32), (29, 30, 36),
+        (29, 30, 40), (29, 30, 44), (29, 30, 48), (29, 32, 36), (29, 32, 40), (29, 32, 44), (29, 32, 48), (29, 36, 40),
+        (29, 36, 44), (29, 36, 48), (29, 40, 44), (29, 40, 48), (29, 44, 48), (30, 32, 33), (30, 33, 36), (30, 33, 40),
+        (30, 33, 44), (30, 33, 48), (30, 36, 37), (30, 37, 40), (30, 37, 44), (30, 37, 48), (30, 40, 41), (30, 41, 44),
+        (30, 41, 48), (30, 44, 45), (30, 45, 48), (30, 48, 49), (32, 33, 34), (32, 33, 36), (32, 33, 40), (32, 33, 44),
+        (32, 33, 48), (32, 36, 37), (32, 36, 40), (32, 36, 41), (32, 36, 44), (32, 36, 45), (32, 36, 48), (32, 36, 49),
+        (32, 37, 40), (32, 37, 44), (32, 37, 48), (32, 40, 41), (32, 40, 44), (32, 40, 45), (32, 40, 48), (32, 40, 49),
+        (32, 41, 44), (32, 41, 48), (32, 44, 45), (32, 44, 48), (32, 44, 49), (32, 45, 48), (32, 48, 49), (33, 34, 36),
+        (33, 34, 40), (33, 34, 44), (33, 34, 48), (33, 36, 40), (33, 36, 44), (33, 36, 48), (33, 40, 44), (33, 40, 48),
+        (33, 44, 48), (34, 36, 37), (34, 37, 40), (34, 37, 44), (34, 37, 48), (34, 40, 41), (34, 41, 44), (34, 41, 48),
+        (34, 44, 45), (34, 45, 48), (34, 48, 49), (36, 37, 38), (36, 37, 40), (36, 37, 44), (36, 37, 48), (36, 40, 41),
+        (36, 40, 44), (36, 40, 45), (36, 40, 48), (36, 40, 49), (36, 41, 44), (36, 41, 48), (36, 44, 45), (36, 44, 48),
+        (36, 44, 49), (36, 45, 48), (36, 48, 49), (37, 38, 40), (37, 38, 44), (37, 38, 48), (37, 40, 44), (37, 40, 48),
+        (37, 44, 48), (38, 40, 41), (38, 41, 44), (38, 41, 48), (38, 44, 45), (38, 45, 48), (38, 48, 49), (40, 41, 42),
+        (40, 41, 44), (40, 41, 48), (40, 44, 45), (40, 44, 48), (40, 44, 49), (40, 45, 48), (40, 48, 49), (41, 42, 44),
+        (41, 42, 48), (41, 44, 48), (42, 44, 45), (42, 45, 48), (42, 48, 49), (44, 45, 46), (44, 45, 48), (44, 48, 49),
+        (45, 46, 48), (46, 48, 49), (48, 49, 50)
+    ]
+    flop_counts = [
+        4, 12, 12, 12, 12, 12, 12, 12,
+        12, 12, 12, 12, 12, 12, 4, 12,
+        4, 12, 4, 12, 4, 12, 4, 12,
+        4, 12, 4, 12, 4, 12, 4, 12,
+        4, 12, 4, 12, 12, 12, 12, 12,
+        12, 12, 12, 12, 12, 12, 12, 12,
+        4, 12, 4, 12, 4, 12, 4, 12,
+        4, 12, 4, 12, 4, 12, 4, 12,
+        4, 12, 4, 12, 12, 12, 12, 12,
+        12, 12, 12, 12, 12, 12, 12, 4,
+        12, 4, 12, 4, 12, 4, 12, 4,
+        12, 4, 12, 4, 12, 4, 12, 4,
+        12, 12, 12, 12, 12, 12, 12, 12,
+        12, 12, 12, 4, 12, 4, 12, 4,
+        12, 4, 12, 4, 12, 4, 12, 4,
+        12, 4, 12, 12, 12, 12, 12, 12,
+        12, 12, 12, 12, 4, 12, 4, 12,
+        4, 12, 4, 12, 4, 12, 4, 12,
+        4, 12, 12, 12, 12, 12, 12, 12,
+        12, 12, 4, 12, 4, 12, 4, 12,
+        4, 12, 4, 12, 4, 12, 12, 12,
+        12, 12, 12, 12, 12, 4, 12, 4,
+        12, 4, 12, 4, 12, 4, 12, 12,
+        12, 12, 12, 12, 12, 4, 12, 4,
+        12, 4, 12, 4, 12, 12, 12, 12,
+        12, 12, 4, 12, 4, 12, 4, 12,
+        12, 12, 12, 12, 4, 12, 4, 12,
+        12, 12, 12, 4, 12, 12, 12, 12,
+        12, 12, 12, 12, 12, 12, 12, 12,
+        12, 12, 12, 12, 12, 12, 12, 12,
+        12, 12, 12, 12, 12, 12, 12, 12,
+        12, 12, 12, 12, 12, 12, 12, 12,
+        12, 12, 12, 12, 12, 12, 12, 12,
+        12, 12, 12, 12, 12, 12, 12, 12,
+        12, 12, 12, 12, 12, 12, 12, 12,
+        12, 12, 12, 12, 12, 12, 12, 12,
+        12, 12, 12, 12, 12, 12, 12, 12,
+        12, 12, 12, 12, 12, 12, 24, 24,
+        24, 24, 24, 24, 24, 24, 24, 24,
+        24, 12, 24, 24, 24, 24, 24, 24,
+        24, 24, 24, 24, 12, 24, 24, 24,
+        24, 24, 24, 24, 24, 24, 12, 24,
+        24, 24, 24, 24, 24, 24, 24, 12,
+        24, 24, 24, 24, 24, 24, 24, 12,
+        24, 24, 24, 24, 24, 24, 12, 24,
+        24, 24, 24, 24, 12, 24, 24, 24,
+        24, 12, 24, 24, 24, 12, 24, 24,
+        12, 24, 12, 4, 12, 12, 12, 12,
+        12, 12, 12, 12, 12, 12, 12, 12,
+        4, 12, 4, 12, 4, 12, 4, 12,
+        4, 12, 4, 12, 4, 12, 4, 12,
+        4, 12, 4, 12, 12, 12, 12, 12,
+        12, 12, 12, 12, 12, 12, 12, 4,
+        12, 4, 12, 4, 12, 4, 12, 4,
+        12, 4, 12, 4, 12, 4, 12, 4,
+        12, 12, 12, 12, 12, 12, 12, 12,
+        12, 12, 12, 4, 12, 4, 12, 4,
+        12, 4, 12, 4, 12, 4, 12, 4,
+        12, 4, 12, 12, 12, 12, 12, 12,
+        12, 12, 12, 12, 4, 12, 4, 12,
+        4, 12, 4, 12, 4, 12, 4, 12,
+        4, 12, 12, 12, 12, 12, 12, 12,
+        12, 12, 4, 12, 4, 12, 4, 12,
+        4, 12, 4, 12, 4, 12, 12, 12,
+        12, 12, 12, 12, 12, 4, 12, 4,
+        12, 4, 12, 4, 12, 4, 12, 12,
+        12, 12, 12, 12, 12, 4, 12, 4,
+        12, 4, 12, 4, 12, 12, 12, 12,
+        12, 12, 4, 12, 4, 12, 4, 12,
+        12, 12, 12, 12, 4, 12, 4, 12,
+        12, 12, 12, 4, 12, 12, 12, 12,
+        12, 12, 12, 12, 12, 12, 12, 12,
+        12, 12, 12, 12, 12, 12, 12, 12,
+        12, 12, 12, 12, 12, 12, 12, 12,
+        12, 12, 12, 12, 12, 12, 12, 12,
+        12, 12, 12, 12, 12, 12, 12, 12,
+        12, 12, 12, 12, 12, 12, 12, 12,
+        12, 12, 12, 12, 12, 12, 12, 12,
+        12, 12, 12, 12, 12, 12, 12, 12,
+        12, 12, 24, 24, 24, 24, 24, 24,
+        24, 24, 24, 24, 12, 24, 24, 24,
+        24, 24, 24, 24, 24, 24, 12, 24,
+        24, 24, 24, 24, 24, 24, 24, 12,
+        24, 24, 24, 24, 24, 24, 24, 12,
+        24, 24, 24, 24, 24, 24, 12, 24,
+        24, 24, 24, 24, 12, 24, 24, 24,
+        24, 12, 24, 24, 24, 12, 24, 24,
+        12, 24, 12, 4, 12, 12, 12, 12,
+        12, 12, 12, 12, 12, 12, 12, 4,
+        12, 4, 12, 4, 12, 4, 12, 4,
+        12, 4, 12, 4, 12, 4, 12, 4,
+        12, 12, 12, 12, 12, 12, 12, 12,
+        12, 12, 12, 4, 12, 4, 12, 4,
+        12, 4, 12, 4, 12, 4, 12, 4,
+        12, 4, 12, 12, 12, 12, 12, 12,
+        12, 12, 12, 12, 4, 12, 4, 12,
+        4, 12, 4, 12, 4, 12, 4, 12,
+        4, 12, 12, 12, 12, 12, 12, 12,
+        12, 12, 4, 12, 4, 12, 4, 12,
+        4, 12, 4, 12, 4, 12, 12, 12,
+        12, 12, 12, 12, 12, 4, 12, 4,
+        12, 4, 12, 4, 12, 4, 12, 12,
+        12, 12, 12, 12, 12, 4, 12, 4,
+        12, 4, 12, 4, 12, 12, 12, 12,
+        12, 12, 4, 12, 4, 12, 4, 12,
+        12, 12, 12, 12, 4, 12, 4, 12,
+        12, 12, 12, 4, 12, 12, 12, 12,
+        12, 12, 12, 12, 12, 12, 12, 12,
+        12, 12, 12, 12, 12, 12, 12, 12,
+        12, 12, 12, 12, 12, 12, 12, 12,
+        12, 12, 12, 12, 12, 12, 12, 12,
+        12, 12, 12, 12, 12, 12, 12, 12,
+        12, 12, 12, 12, 12, 12, 12, 12,
+        12, 12, 12, 12, 12, 12, 12, 24,
+        24, 24, 24, 24, 24, 24, 24, 24,
+        12, 24, 24, 24, 24, 24, 24, 24,
+        24, 12, 24, 24, 24, 24, 24, 24,
+        24, 12, 24, 24, 24, 24, 24, 24,
+        12, 24, 24, 24, 24, 24, 12, 24,
+        24, 24, 24, 12, 24, 24, 24, 12,
+        24, 24, 12, 24, 12, 4, 12, 12,
+        12, 12, 12, 12, 12, 12, 12, 12,
+        4, 12, 4, 12, 4, 12, 4, 12,
+        4, 12, 4, 12, 4, 12, 4, 12,
+        12, 12, 12, 12, 12, 12, 12, 12,
+        12, 4, 12, 4, 12, 4, 12, 4,
+        12, 4, 12, 4, 12, 4, 12, 12,
+        12, 12, 12, 12, 12, 12, 12, 4,
+        12, 4, 12, 4, 12, 4, 12, 4,
+        12, 4, 12, 12, 12, 12, 12, 12,
+        12, 12, 4, 12, 4, 12, 4, 12,
+        4, 12, 4, 12, 12, 12, 12, 12,
+        12, 12, 4, 12, 4, 12, 4, 12,
+        4, 12, 12, 12, 12, 12, 12, 4,
+        12, 4, 12, 4, 12, 12, 12, 12,
+        12, 4, 12, 4, 12, 12, 12, 12,
+        4, 12, 12, 12, 12, 12, 12, 12,
+        12, 12, 12, 12, 12, 12, 12, 12,
+        12, 12, 12, 12, 12, 12, 12, 12,
+        12, 12, 12, 12, 12, 12, 12, 12,
+        12, 12, 12, 12, 12, 12, 12, 12,
+        12, 12, 12, 12, 12, 12, 12, 12,
+        12, 12, 24, 24, 24, 24, 24, 24,
+        24, 24, 12, 24, 24, 24, 24, 24,
+        24, 24, 12, 24, 24, 24, 24, 24,
+        24, 12, 24, 24, 24, 24, 24, 12,
+        24, 24, 24, 24, 12, 24, 24, 24,
+        12, 24, 24, 12, 24, 12, 4, 12,
+        12, 12, 12, 12, 12, 12, 12, 12,
+        4, 12, 4, 12, 4, 12, 4, 12,
+        4, 12, 4, 12, 4, 12, 12, 12,
+        12, 12, 12, 12, 12, 12, 4, 12,
+        4, 12, 4, 12, 4, 12, 4, 12,
+        4, 12, 12, 12, 12, 12, 12, 12,
+        12, 4, 12, 4, 12, 4, 12, 4,
+        12, 4, 12, 12, 12, 12, 12, 12,
+        12, 4, 12, 4, 12, 4, 12, 4,
+        12, 12, 12, 12, 12, 12, 4, 12,
+        4, 12, 4, 12, 12, 12, 12, 12,
+        4, 12, 4, 12, 12, 12, 12, 4,
+        12, 12, 12, 12, 12, 12, 12, 12,
+        12, 12, 12, 12, 12, 12, 12, 12,
+        12, 12, 12, 12, 12, 12, 12, 12,
+        12, 12, 12, 12, 12, 12, 12, 12,
+        12, 12, 12, 12, 12, 12, 12, 12,
+        24, 24, 24, 24, 24, 24, 24, 12,
+        24, 24, 24, 24, 24, 24, 12, 24,
+        24, 24, 24, 24, 12, 24, 24, 24,
+        24, 12, 24, 24, 24, 12, 24, 24,
+        12, 24, 12, 4, 12, 12, 12, 12,
+        12, 12, 12, 12, 4, 12, 4, 12,
+        4, 12, 4, 12, 4, 12, 4, 12,
+        12, 12, 12, 12, 12, 12, 12, 4,
+        12, 4, 12, 4, 12, 4, 12, 4,
+        12, 12, 12, 12, 12, 12, 12, 4,
+        12, 4, 12, 4, 12, 4, 12, 12,
+        12, 12, 12, 12, 4, 12, 4, 12,
+        4, 12, 12, 12, 12, 12, 4, 12,
+        4, 12, 12, 12, 12, 4, 12, 12,
+        12, 12, 12, 12, 12, 12, 12, 12,
+        12, 12, 12, 12, 12, 12, 12, 12,
+        12, 12, 12, 12, 12, 12, 12, 12,
+        12, 12, 12, 12, 12, 12, 24, 24,
+        24, 24, 24, 24, 12, 24, 24, 24,
+        24, 24, 12, 24, 24, 24, 24, 12,
+        24, 24, 24, 12, 24, 24, 12, 24,
+        12, 4, 12, 12, 12, 12, 12, 12,
+        12, 4, 12, 4, 12, 4, 12, 4,
+        12, 4, 12, 12, 12, 12, 12, 12,
+        12, 4, 12, 4, 12, 4, 12, 4,
+        12, 12, 12, 12, 12, 12, 4, 12,
+        4, 12, 4, 12, 12, 12, 12, 12,
+        4, 12, 4, 12, 12, 12, 12, 4,
+        12, 12, 12, 12, 12, 12, 12, 12,
+        12, 12, 12, 12, 12, 12, 12, 12,
+        12, 12, 12, 12, 12, 12, 12, 12,
+        12, 24, 24, 24, 24, 24, 12, 24,
+        24, 24, 24, 12, 24, 24, 24, 12,
+        24, 24, 12, 24, 12, 4, 12, 12,
+        12, 12, 12, 12, 4, 12, 4, 12,
+        4, 12, 4, 12, 12, 12, 12, 12,
+        12, 4, 12, 4, 12, 4, 12, 12,
+        12, 12, 12, 4, 12, 4, 12, 12,
+        12, 12, 4, 12, 12, 12, 12, 12,
+        12, 12, 12, 12, 12, 12, 12, 12,
+        12, 12, 12, 12, 12, 12, 24, 24,
+        24, 24, 12, 24, 24, 24, 12, 24,
+        24, 12, 24, 12, 4, 12, 12, 12,
+        12, 12, 4, 12, 4, 12, 4, 12,
+        12, 12, 12, 12, 4, 12, 4, 12,
+        12, 12, 12, 4, 12, 12, 12, 12,
+        12, 12, 12, 12, 12, 12, 12, 12,
+        12, 12, 24, 24, 24, 12, 24, 24,
+        12, 24, 12, 4, 12, 12, 12, 12,
+        4, 12, 4, 12, 12, 12, 12, 4,
+        12, 12, 12, 12, 12, 12, 12, 12,
+        12, 12, 24, 24, 12, 24, 12, 4,
+        12, 12, 12, 4, 12, 12, 12, 12,
+        12, 12, 12, 24, 12, 4, 12, 12,
+        12, 12, 4
+    ]
@@ -0,0 +1,12427 @@
+"""
+Lookup tables for the 7-card evaluator, imported by LookupTables on first use.
+"""
+from .perfect_hash import PerfectHash
+
+class Seven:
+    card_to_binary = [[], [],
+        [0, 73730, 77826, 86018, 94210],
+        [0, 139523, 143619, 151811, 160003],
+        [0, 270853, 274949, 283141, 291333],
+        [0, 533255, 537351, 545543, 553735],
+        [0, 1057803, 1061899, 1070091, 1078283],
+        [0, 2106637, 2110733, 2118925, 2127117],
+        [0, 4204049, 4208145, 4216337, 4224529],
+        [0, 8398611, 8402707, 8410899, 8419091],
+        [0, 16787479, 16791575, 16799767, 16807959],
+        [0, 33564957, 33569053, 33577245, 33585437],
+        [0, 67119647, 67123743, 67131935, 67140127],
+        [0, 134228773, 134232869, 134241061, 134249253],
+        [0, 268446761, 268450857, 268459049, 268467241]
+    ]
+    prime_products_to_flush = {
+        128: 2, 192: 2, 288: 2, 320: 2, 448: 2, 480: 2, 672: 2, 800: 2, 1120: 2, 1568: 2,
+        972: 3, 1458: 3, 2187: 3, 2430: 3, 3402: 3, 3645: 3, 5103: 3, 6075: 3, 8505: 3, 11907: 3,
+        12500: 5, 18750: 5, 28125: 5, 31250: 5, 43750: 5, 46875: 5, 65625: 5, 78125: 5, 109375: 5, 153125: 5,
+        67228: 7, 100842: 7, 151263: 7, 168070: 7, 235298: 7, 252105: 7, 352947: 7, 420175: 7, 588245: 7, 823543: 7
+    }
+    flush_rank_bits_to_rank = {
+        31: 9, 47: 1599, 55: 1598, 59: 1597,
+        61: 1596, 62: 8, 63: 8, 79: 1595,
+        87: 1594, 91: 1593, 93: 1592, 94: 1591,
+        95: 9, 103: 1590, 107: 1589, 109: 1588,
+        110: 1587, 111: 1587, 115: 1586, 117: 1585,
+        118: 1584, 119: 1584, 121: 1583, 122: 1582,
+        123: 1582, 124: 7, 125: 7, 126: 7,
+        127: 7, 143: 1581, 151: 1580, 155: 1579,
+        157: 1578, 158: 1577, 159: 9, 167: 1576,
+        171: 1575, 173: 1574, 174: 1573, 175: 1573,
+        179: 1572, 181: 1571, 182: 1570, 183: 1570,
+        185: 1569, 186: 1568, 187: 1568, 188: 1567,
+        189: 1567, 190: 8, 191: 8, 199: 1566,
+        203: 1565, 205: 1564, 206: 1563, 207: 1563,
+        211: 1562, 213: 1561, 214: 1560, 215: 1560,
+        217: 1559, 218: 1558, 219: 1558, 220: 1557,
+        221: 1557, 222: 1557, 223: 9, 227: 1556,
+        229: 1555, 230: 1554, 231: 1554, 233: 1553,
+        234: 1552, 235: 1552, 236: 1551, 237: 1551,
+        238: 1551, 239: 1551, 241: 1550, 242: 1549,
+        243: 1549, 244: 1548, 245: 1548, 246: 1548,
+        247: 1548, 248: 6, 249: 6, 250: 6,
+        251: 6, 252: 6, 253: 6, 254: 6,
+        271: 1547, 279: 1546, 283: 1545, 285: 1544,
+        286: 1543, 287: 9, 295: 1542, 299: 1541,
+        301: 1540, 302: 1539, 303: 1539, 307: 1538,
+        309: 1537, 310: 1536, 311: 1536, 313: 1535,
+        314: 1534, 315: 1534, 316: 1533, 317: 1533,
+        318: 8, 319: 8, 327: 1532, 331: 1531,
+        333: 1530, 334: 1529, 335: 1529, 339: 1528,
+        341: 1527, 342: 1526, 343: 1526, 345: 1525,
+        346: 1524, 347: 1524, 348: 1523, 349: 1523,
+        350: 1523, 351: 9, 355: 1522, 357: 1521,
+        358: 1520, 359: 1520, 361: 1519, 362: 1518,
+        363: 1518, 364: 1517, 365: 1517, 366: 1517,
+        367: 1517, 369: 1516, 370: 1515, 371: 1515,
+        372: 1514, 373: 1514, 374: 1514, 375: 1514,
+        376: 1513, 377: 1513, 378: 1513, 379: 1513,
+        380: 7, 381: 7, 382: 7, 391: 1512,
+        395: 1511, 397: 1510, 398: 1509, 399: 1509,
+        403: 1508, 405: 1507, 406: 1506, 407: 1506,
+        409: 1505, 410: 1504, 411: 1504, 412: 1503,
+        413: 1503, 414: 1503, 415: 9, 419: 1502,
+        421: 1501, 422: 1500, 423: 1500, 425: 1499,
+        426: 1498, 427: 1498, 428: 1497, 429: 1497,
+        430: 1497, 431: 1497, 433: 1496, 434: 1495,
+        435: 1495, 436: 1494, 437: 1494, 438: 1494,
+        439: 1494, 440: 1493, 441: 1493, 442: 1493,
+        443: 1493, 444: 1493, 445: 1493, 446: 8,
+        451: 1492, 453: 1491, 454: 1490, 455: 1490,
+        457: 1489, 458: 1488, 459: 1488, 460: 1487,
+        461: 1487, 462: 1487, 463: 1487, 465: 1486,
+        466: 1485, 467: 1485, 468: 1484, 469: 1484,
+        470: 1484, 471: 1484, 472: 1483, 473: 1483,
+        474: 1483, 475: 1483, 476: 1483, 477: 1483,
+        478: 1483, 481: 1482, 482: 1481, 483: 1481,
+        484: 1480, 485: 1480, 486: 1480, 487: 1480,
+        488: 1479, 489: 1479, 490: 1479, 491: 1479,
+        492: 1479, 493: 1479, 494: 1479, 496: 5,
+        497: 5, 498: 5, 499: 5, 500: 5,
+        501: 5, 502: 5, 504: 5, 505: 5,
+        506: 5, 508: 5, 527: 1478, 535: 1477,
+        539: 1476, 541: 1475, 542: 1474, 543: 9,
+        551: 1473, 555: 1472, 557: 1471, 558: 1470,
+        559: 1470, 563: 1469, 565: 1468, 566: 1467,
+        567: 1467, 569: 1466, 570: 1465, 571: 1465,
+        572: 1464, 573: 1464, 574: 8, 575: 8,
+        583: 1463, 587: 1462, 589: 1461, 590: 1460,
+        591: 1460, 595: 1459, 597: 1458, 598: 1457,
+        599: 1457, 601: 1456, 602: 1455, 603: 1455,
+        604: 1454, 605: 1454, 606: 1454, 607: 9,
+        611: 1453, 613: 1452, 614: 1451, 615: 1451,
+        617: 1450, 618: 1449, 619: 1449, 620: 1448,
+        621: 1448, 622: 1448, 623: 1448, 625: 1447,
+        626: 1446, 627: 1446, 628: 1445, 629: 1445,
+        630: 1445, 631: 1445, 632: 1444, 633: 1444,
+        634: 1444, 635: 1444, 636: 7, 637: 7,
+        638: 7, 647: 1443, 651: 1442, 653: 1441,
+        654: 1440, 655: 1440, 659: 1439, 661: 1438,
+        662: 1437, 663: 1437, 665: 1436, 666: 1435,
+        667: 1435, 668: 1434, 669: 1434, 670: 1434,
+        671: 9, 675: 1433, 677: 1432, 678: 1431,
+        679: 1431, 681: 1430, 682: 1429, 683: 1429,
+        684: 1428, 685: 1428, 686: 1428, 687: 1428,
+        689: 1427, 690: 1426, 691: 1426, 692: 1425,
+        693: 1425, 694: 1425, 695: 1425, 696: 1424,
+        697: 1424, 698: 1424, 699: 1424, 700: 1424,
+        701: 1424, 702: 8, 707: 1423, 709: 1422,
+        710: 1421, 711: 1421, 713: 1420, 714: 1419,
+        715: 1419, 716: 1418, 717: 1418, 718: 1418,
+        719: 1418, 721: 1417, 722: 1416, 723: 1416,
+        724: 1415, 725: 1415, 726: 1415, 727: 1415,
+        728: 1414, 729: 1414, 730: 1414, 731: 1414,
+        732: 1414, 733: 1414, 734: 1414, 737: 1413,
+        738: 1412, 739: 1412, 740: 1411, 741: 1411,
+        742: 1411, 743: 1411, 744: 1410, 745: 1410,
+        746: 1410, 747: 1410, 748: 1410, 749: 1410,
+        750: 1410, 752: 1409, 753: 1409, 754: 1409,
+        755: 1409, 756: 1409, 757: 1409, 758: 1409,
+        760: 6, 761: 6, 762: 6, 764: 6,
+        775: 1408, 779: 1407, 781: 1406, 782: 1405,
+        783: 1405, 787: 1404, 789: 1403, 790: 1402,
+        791: 1402, 793: 1401, 794: 1400, 795: 1400,
+        796: 1399, 797: 1399, 798: 1399, 799: 9,
+        803: 1398, 805: 1397, 806: 1396, 807: 1396,
+        809: 1395, 810: 1394, 811: 1394, 812: 1393,
+        813: 1393, 814: 1393, 815: 1393, 817: 1392,
+        818: 1391, 819: 1391, 820: 1390, 821: 1390,
+        822: 1390, 823: 1390, 824: 1389, 825: 1389,
+        826: 1389, 827: 1389, 828: 1389, 829: 1389,
+        830: 8, 835: 1388, 837: 1387, 838: 1386,
+        839: 1386, 841: 1385, 842: 1384, 843: 1384,
+        844: 1383, 845: 1383, 846: 1383, 847: 1383,
+        849: 1382, 850: 1381, 851: 1381, 852: 1380,
+        853: 1380, 854: 1380, 855: 1380, 856: 1379,
+        857: 1379, 858: 1379, 859: 1379, 860: 1379,
+        861: 1379, 862: 1379, 865: 1378, 866: 1377,
+        867: 1377, 868: 1376, 869: 1376, 870: 1376,
+        871: 1376, 872: 1375, 873: 1375, 874: 1375,
+        875: 1375, 876: 1375, 877: 1375, 878: 1375,
+        880: 1374, 881: 1374, 882: 1374, 883: 1374,
+        884: 1374, 885: 1374, 886: 1374, 888: 1374,
+        889: 1374, 890: 1374, 892: 7, 899: 1373,
+        901: 1372, 902: 1371, 903: 1371, 905: 1370,
+        906: 1369, 907: 1369, 908: 1368, 909: 1368,
+        910: 1368, 911: 1368, 913: 1367, 914: 1366,
+        915: 1366, 916: 1365, 917: 1365, 918: 1365,
+        919: 1365, 920: 1364, 921: 1364, 922: 1364,
+        923: 1364, 924: 1364, 925: 1364, 926: 1364,
+        929: 1363, 930: 1362, 931: 1362, 932: 1361,
+        933: 1361, 934: 1361, 935: 1361, 936: 1360,
+        937: 1360, 938: 1360, 939: 1360, 940: 1360,
+        941: 1360, 942: 1360, 944: 1359, 945: 1359,
+        946: 1359, 947: 1359, 948: 1359, 949: 1359,
+        950: 1359, 952: 1359, 953: 1359, 954: 1359,
+        956: 1359, 961: 1358, 962: 1357, 963: 1357,
+        964: 1356, 965: 1356, 966: 1356, 967: 1356,
+        968: 1355, 969: 1355, 970: 1355, 971: 1355,
+        972: 1355, 973: 1355, 974: 1355, 976: 1354,
+        977: 1354, 978: 1354, 979: 1354, 980: 1354,
+        981: 1354, 982: 1354, 984: 1354, 985: 1354,
+        986: 1354, 988: 1354, 992: 4, 993: 4,
+        994: 4, 995: 4, 996: 4, 997: 4,
+        998: 4, 1000: 4, 1001: 4, 1002: 4,
+        1004: 4, 1008: 4, 1009: 4, 1010: 4,
+        1012: 4, 1016: 4, 1039: 1353, 1047: 1352,
+        1051: 1351, 1053: 1350, 1054: 1349, 1055: 9,
+        1063: 1348, 1067: 1347, 1069: 1346, 1070: 1345,
+        1071: 1345, 1075: 1344, 1077: 1343, 1078: 1342,
+        1079: 1342, 1081: 1341, 1082: 1340, 1083: 1340,
+        1084: 1339, 1085: 1339, 1086: 8, 1087: 8,
+        1095: 1338, 1099: 1337, 1101: 1336, 1102: 1335,
+        1103: 1335, 1107: 1334, 1109: 1333, 1110: 1332,
+        1111: 1332, 1113: 1331, 1114: 1330, 1115: 1330,
+        1116: 1329, 1117: 1329, 1118: 1329, 1119: 9,
+        1123: 1328, 1125: 1327, 1126: 1326, 1127: 1326,
+        1129: 1325, 1130: 1324, 1131: 1324, 1132: 1323,
+        1133: 1323, 1134: 1323, 1135: 1323, 1137: 1322,
+        1138: 1321, 1139: 1321, 1140: 1320, 1141: 1320,
+        1142: 1320, 1143: 1320, 1144: 1319, 1145: 1319,
+        1146: 1319, 1147: 1319, 1148: 7, 1149: 7,
+        1150: 7, 1159: 1318, 1163: 1317, 1165: 1316,
+        1166: 1315, 1167: 1315, 1171: 1314, 1173: 1313,
+        1174: 1312, 1175: 1312, 1177: 1311, 1178: 1310,
+        1179: 1310, 1180: 1309, 1181: 1309, 1182: 1309,
+        1183: 9, 1187: 1308, 1189: 1307, 1190: 1306,
+        1191: 1306, 1193: 1305, 1194: 1304, 1195: 1304,
+        1196: 1303, 1197: 1303, 1198: 1303, 1199: 1303,
+        1201: 1302, 1202: 1301, 1203: 1301, 1204: 1300,
+        1205: 1300, 1206: 1300, 1207: 1300, 1208: 1299,
+        1209: 1299, 1210: 1299, 1211: 1299, 1212: 1299,
+        1213: 1299, 1214: 8, 1219: 1298, 1221: 1297,
+        1222: 1296, 1223: 1296, 1225: 1295, 1226: 1294,
+        1227: 1294, 1228: 1293, 1229: 1293, 1230: 1293,
+        1231: 1293, 1233: 1292, 1234: 1291, 1235: 1291,
+        1236: 1290, 1237: 1290, 1238: 1290, 1239: 1290,
+        1240: 1289, 1241: 1289, 1242: 1289, 1243: 1289,
+        1244: 1289, 1245: 1289, 1246: 1289, 1249: 1288,
+        1250: 1287, 1251: 1287, 1252: 1286, 1253: 1286,
+        1254: 1286, 1255: 1286, 1256: 1285, 1257: 1285,
+        1258: 1285, 1259: 1285, 1260: 1285, 1261: 1285,
+        1262: 1285, 1264: 1284, 1265: 1284, 1266: 1284,
+        1267: 1284, 1268: 1284, 1269: 1284, 1270: 1284,
+        1272: 6, 1273: 6, 1274: 6, 1276: 6,
+        1287: 1283, 1291: 1282, 1293: 1281, 1294: 1280,
+        1295: 1280, 1299: 1279, 1301: 1278, 1302: 1277,
+        1303: 1277, 1305: 1276, 1306: 1275, 1307: 1275,
+        1308: 1274, 1309: 1274, 1310: 1274, 1311: 9,
+        1315: 1273, 1317: 1272, 1318: 1271, 1319: 1271,
+        1321: 1270, 1322: 1269, 1323: 1269, 1324: 1268,
+        1325: 1268, 1326: 1268, 1327: 1268, 1329: 1267,
+        1330: 1266, 1331: 1266, 1332: 1265, 1333: 1265,
+        1334: 1265, 1335: 1265, 1336: 1264, 1337: 1264,
+        1338: 1264, 1339: 1264, 1340: 1264, 1341: 1264,
+        1342: 8, 1347: 1263, 1349: 1262, 1350: 1261,
+        1351: 1261, 1353: 1260, 1354: 1259, 1355: 1259,
+        1356: 1258, 1357: 1258, 1358: 1258, 1359: 1258,
+        1361: 1257, 1362: 1256, 1363: 1256, 1364: 1255,
+        1365: 1255, 1366: 1255, 1367: 1255, 1368: 1254,
+        1369: 1254, 1370: 1254, 1371: 1254, 1372: 1254,
+        1373: 1254, 1374: 1254, 1377: 1253, 1378: 1252,
+        1379: 1252, 1380: 1251, 1381: 1251, 1382: 1251,
+        1383: 1251, 1384: 1250, 1385: 1250, 1386: 1250,
+        1387: 1250, 1388: 1250, 1389: 1250, 1390: 1250,
+        1392: 1249, 1393: 1249, 1394: 1249, 1395: 1249,
+        1396: 1249, 1397: 1249, 1398: 1249, 1400: 1249,
+        1401: 1249, 1402: 1249, 1404: 7, 1411: 1248,
+        1413: 1247, 1414: 1246, 1415: 1246, 1417: 1245,
+        1418: 1244, 1419: 1244, 1420: 1243, 1421: 1243,
+        1422: 1243, 1423: 1243, 1425: 1242, 1426: 1241,
+        1427: 1241, 1428: 1240, 1429: 1240, 1430: 1240,
+        1431: 1240, 1432: 1239, 1433: 1239, 1434: 1239,
+        1435: 1239, 1436: 1239, 1437: 1239, 1438: 1239,
+        1441: 1238, 1442: 1237, 1443: 1237, 1444: 1236,
+        1445: 1236, 1446: 1236, 1447: 1236, 1448: 1235,
+        1449: 1235, 1450: 1235, 1451: 1235, 1452: 1235,
+        1453: 1235, 1454: 1235, 1456: 1234, 1457: 1234,
+        1458: 1234, 1459: 1234, 1460: 1234, 1461: 1234,
+        1462: 1234, 1464: 1234, 1465: 1234, 1466: 1234,
+        1468: 1234, 1473: 1233, 1474: 1232, 1475: 1232,
+        1476: 1231, 1477: 1231, 1478: 1231, 1479: 1231,
+        1480: 1230, 1481: 1230, 1482: 1230, 1483: 1230,
+        1484: 1230, 1485: 1230, 1486: 1230, 1488: 1229,
+        1489: 1229, 1490: 1229, 1491: 1229, 1492: 1229,
+        1493: 1229, 1494: 1229, 1496: 1229, 1497: 1229,
+        1498: 1229, 1500: 1229, 1504: 1228, 1505: 1228,
+        1506: 1228, 1507: 1228, 1508: 1228, 1509: 1228,
+        1510: 1228, 1512: 1228, 1513: 1228, 1514: 1228,
+        1516: 1228, 1520: 5, 1521: 5, 1522: 5,
+        1524: 5, 1528: 5, 1543: 1227, 1547: 1226,
+        1549: 1225, 1550: 1224, 1551: 1224, 1555: 1223,
+        1557: 1222, 1558: 1221, 1559: 1221, 1561: 1220,
+        1562: 1219, 1563: 1219, 1564: 1218, 1565: 1218,
+        1566: 1218, 1567: 9, 1571: 1217, 1573: 1216,
+        1574: 1215, 1575: 1215, 1577: 1214, 1578: 1213,
+        1579: 1213, 1580: 1212, 1581: 1212, 1582: 1212,
+        1583: 1212, 1585: 1211, 1586: 1210, 1587: 1210,
+        1588: 1209, 1589: 1209, 1590: 1209, 1591: 1209,
+        1592: 1208, 1593: 1208, 1594: 1208, 1595: 1208,
+        1596: 1208, 1597: 1208, 1598: 8, 1603: 1207,
+        1605: 1206, 1606: 1205, 1607: 1205, 1609: 1204,
+        1610: 1203, 1611: 1203, 1612: 1202, 1613: 1202,
+        1614: 1202, 1615: 1202, 1617: 1201, 1618: 1200,
+        1619: 1200, 1620: 1199, 1621: 1199, 1622: 1199,
+        1623: 1199, 1624: 1198, 1625: 1198, 1626: 1198,
+        1627: 1198, 1628: 1198, 1629: 1198, 1630: 1198,
+        1633: 1197, 1634: 1196, 1635: 1196, 1636: 1195,
+        1637: 1195, 1638: 1195, 1639: 1195, 1640: 1194,
+        1641: 1194, 1642: 1194, 1643: 1194, 1644: 1194,
+        1645: 1194, 1646: 1194, 1648: 1193, 1649: 1193,
+        1650: 1193, 1651: 1193, 1652: 1193, 1653: 1193,
+        1654: 1193, 1656: 1193, 1657: 1193, 1658: 1193,
+        1660: 7, 1667: 1192, 1669: 1191, 1670: 1190,
+        1671: 1190, 1673: 1189, 1674: 1188, 1675: 1188,
+        1676: 1187, 1677: 1187, 1678: 1187, 1679: 1187,
+        1681: 1186, 1682: 1185, 1683: 1185, 1684: 1184,
+        1685: 1184, 1686: 1184, 1687: 1184, 1688: 1183,
+        1689: 1183, 1690: 1183, 1691: 1183, 1692: 1183,
+        1693: 1183, 1694: 1183, 1697: 1182, 1698: 1181,
+        1699: 1181, 1700: 1180, 1701: 1180, 1702: 1180,
+        1703: 1180, 1704: 1179, 1705: 1179, 1706: 1179,
+        1707: 1179, 1708: 1179, 1709: 1179, 1710: 1179,
+        1712: 1178, 1713: 1178, 1714: 1178, 1715: 1178,
+        1716: 1178, 1717: 1178, 1718: 1178, 1720: 1178,
+        1721: 1178, 1722: 1178, 1724: 1178, 1729: 1177,
+        1730: 1176, 1731: 1176, 1732: 1175, 1733: 1175,
+        1734: 1175, 1735: 1175, 1736: 1174, 1737: 1174,
+        1738: 1174, 1739: 1174, 1740: 1174, 1741: 1174,
+        1742: 1174, 1744: 1173, 1745: 1173, 1746: 1173,
+        1747: 1173, 1748: 1173, 1749: 1173, 1750: 1173,
+        1752: 1173, 1753: 1173, 1754: 1173, 1756: 1173,
+        1760: 1172, 1761: 1172, 1762: 1172, 1763: 1172,
+        1764: 1172, 1765: 1172, 1766: 1172, 1768: 1172,
+        1769: 1172, 1770: 1172, 1772: 1172, 1776: 1172,
+        1777: 1172, 1778: 1172, 1780: 1172, 1784: 6,
+        1795: 1171, 1797: 1170, 1798: 1169, 1799: 1169,
+        1801: 1168, 1802: 1167, 1803: 1167, 1804: 1166,
+        1805: 1166, 1806: 1166, 1807: 1166, 1809: 1165,
+        1810: 1164, 1811: 1164, 1812: 1163, 1813: 1163,
+        1814: 1163, 1815: 1163, 1816: 1162, 1817: 1162,
+        1818: 1162, 1819: 1162, 1820: 1162, 1821: 1162,
+        1822: 1162, 1825: 1161, 1826: 1160, 1827: 1160,
+        1828: 1159, 1829: 1159, 1830: 1159, 1831: 1159,
+        1832: 1158, 1833: 1158, 1834: 1158, 1835: 1158,
+        1836: 1158, 1837: 1158, 1838: 1158, 1840: 1157,
+        1841: 1157, 1842: 1157, 1843: 1157, 1844: 1157,
+        1845: 1157, 1846: 1157, 1848: 1157, 1849: 1157,
+        1850: 1157, 1852: 1157, 1857: 1156, 1858: 1155,
+        1859: 1155, 1860: 1154, 1861: 1154, 1862: 1154,
+        1863: 1154, 1864: 1153, 1865: 1153, 1866: 1153,
+        1867: 1153, 1868: 1153, 1869: 1153, 1870: 1153,
+        1872: 1152, 1873: 1152, 1874: 1152, 1875: 1152,
+        1876: 1152, 1877: 1152, 1878: 1152, 1880: 1152,
+        1881: 1152, 1882: 1152, 1884: 1152, 1888: 1151,
+        1889: 1151, 1890: 1151, 1891: 1151, 1892: 1151,
+        1893: 1151, 1894: 1151, 1896: 1151, 1897: 1151,
+        1898: 1151, 1900: 1151, 1904: 1151, 1905: 1151,
+        1906: 1151, 1908: 1151, 1912: 1151, 1921: 1150,
+        1922: 1149, 1923: 1149, 1924: 1148, 1925: 1148,
+        1926: 1148, 1927: 1148, 1928: 1147, 1929: 1147,
+        1930: 1147, 1931: 1147, 1932: 1147, 1933: 1147,
+        1934: 1147, 1936: 1146, 1937: 1146, 1938: 1146,
+        1939: 1146, 1940: 1146, 1941: 1146, 1942: 1146,
+        1944: 1146, 1945: 1146, 1946: 1146, 1948: 1146,
+        1952: 1145, 1953: 1145, 1954: 1145, 1955: 1145,
+        1956: 1145, 1957: 1145, 1958: 1145, 1960: 1145,
+        1961: 1145, 1962: 1145, 1964: 1145, 1968: 1145,
+        1969: 1145, 1970: 1145, 1972: 1145, 1976: 1145,
+        1984: 3, 1985: 3, 1986: 3, 1987: 3,
+        1988: 3, 1989: 3, 1990: 3, 1992: 3,
+        1993: 3, 1994: 3, 1996: 3, 2000: 3,
+        2001: 3, 2002: 3, 2004: 3, 2008: 3,
+        2016: 3, 2017: 3, 2018: 3, 2020: 3,
+        2024: 3, 2032: 3, 2063: 1144, 2071: 1143,
+        2075: 1142, 2077: 1141, 2078: 1140, 2079: 9,
+        2087: 1139, 2091: 1138, 2093: 1137, 2094: 1136,
+        2095: 1136, 2099: 1135, 2101: 1134, 2102: 1133,
+        2103: 1133, 2105: 1132, 2106: 1131, 2107: 1131,
+        2108: 1130, 2109: 1130, 2110: 8, 2111: 8,
+        2119: 1129, 2123: 1128, 2125: 1127, 2126: 1126,
+        2127: 1126, 2131: 1125, 2133: 1124, 2134: 1123,
+        2135: 1123, 2137: 1122, 2138: 1121, 2139: 1121,
+        2140: 1120, 2141: 1120, 2142: 1120, 2143: 9,
+        2147: 1119, 2149: 1118, 2150: 1117, 2151: 1117,
+        2153: 1116, 2154: 1115, 2155: 1115, 2156: 1114,
+        2157: 1114, 2158: 1114, 2159: 1114, 2161: 1113,
+        2162: 1112, 2163: 1112, 2164: 1111, 2165: 1111,
+        2166: 1111, 2167: 1111, 2168: 1110, 2169: 1110,
+        2170: 1110, 2171: 1110, 2172: 7, 2173: 7,
+        2174: 7, 2183: 1109, 2187: 1108, 2189: 1107,
+        2190: 1106, 2191: 1106, 2195: 1105, 2197: 1104,
+        2198: 1103, 2199: 1103, 2201: 1102, 2202: 1101,
+        2203: 1101, 2204: 1100, 2205: 1100, 2206: 1100,
+        2207: 9, 2211: 1099, 2213: 1098, 2214: 1097,
+        2215: 1097, 2217: 1096, 2218: 1095, 2219: 1095,
+        2220: 1094, 2221: 1094, 2222: 1094, 2223: 1094,
+        2225: 1093, 2226: 1092, 2227: 1092, 2228: 1091,
+        2229: 1091, 2230: 1091, 2231: 1091, 2232: 1090,
+        2233: 1090, 2234: 1090, 2235: 1090, 2236: 1090,
+        2237: 1090, 2238: 8, 2243: 1089, 2245: 1088,
+        2246: 1087, 2247: 1087, 2249: 1086, 2250: 1085,
+        2251: 1085, 2252: 1084, 2253: 1084, 2254: 1084,
+        2255: 1084, 2257: 1083, 2258: 1082, 2259: 1082,
+        2260: 1081, 2261: 1081, 2262: 1081, 2263: 1081,
+        2264: 1080, 2265: 1080, 2266: 1080, 2267: 1080,
+        2268: 1080, 2269: 1080, 2270: 1080, 2273: 1079,
+        2274: 1078, 2275: 1078, 2276: 1077, 2277: 1077,
+        2278: 1077, 2279: 1077, 2280: 1076, 2281: 1076,
+        2282: 1076, 2283: 1076, 2284: 1076, 2285: 1076,
+        2286: 1076, 2288: 1075, 2289: 1075, 2290: 1075,
+        2291: 1075, 2292: 1075, 2293: 1075, 2294: 1075,
+        2296: 6, 2297: 6, 2298: 6, 2300: 6,
+        2311: 1074, 2315: 1073, 2317: 1072, 2318: 1071,
+        2319: 1071, 2323: 1070, 2325: 1069, 2326: 1068,
+        2327: 1068, 2329: 1067, 2330: 1066, 2331: 1066,
+        2332: 1065, 2333: 1065, 2334: 1065, 2335: 9,
+        2339: 1064, 2341: 1063, 2342: 1062, 2343: 1062,
+        2345: 1061, 2346: 1060, 2347: 1060, 2348: 1059,
+        2349: 1059, 2350: 1059, 2351: 1059, 2353: 1058,
+        2354: 1057, 2355: 1057, 2356: 1056, 2357: 1056,
+        2358: 1056, 2359: 1056, 2360: 1055, 2361: 1055,
+        2362: 1055, 2363: 1055, 2364: 1055, 2365: 1055,
+        2366: 8, 2371: 1054, 2373: 1053, 2374: 1052,
+        2375: 1052, 2377: 1051, 2378: 1050, 2379: 1050,
+        2380: 1049, 2381: 1049, 2382: 1049, 2383: 1049,
+        2385: 1048, 2386: 1047, 2387: 1047, 2388: 1046,
+        2389: 1046, 2390: 1046, 2391: 1046, 2392: 1045,
+        2393: 1045, 2394: 1045, 2395: 1045, 2396: 1045,
+        2397: 1045, 2398: 1045, 2401: 1044, 2402: 1043,
+        2403: 1043, 2404: 1042, 2405: 1042, 2406: 1042,
+        2407: 1042, 2408: 1041, 2409: 1041, 2410: 1041,
+        2411: 1041, 2412: 1041, 2413: 1041, 2414: 1041,
+        2416: 1040, 2417: 1040, 2418: 1040, 2419: 1040,
+        2420: 1040, 2421: 1040, 2422: 1040, 2424: 1040,
+        2425: 1040, 2426: 1040, 2428: 7, 2435: 1039,
+        2437: 1038, 2438: 1037, 2439: 1037, 2441: 1036,
+        2442: 1035, 2443: 1035, 2444: 1034, 2445: 1034,
+        2446: 1034, 2447: 1034, 2449: 1033, 2450: 1032,
+        2451: 1032, 2452: 1031, 2453: 1031, 2454: 1031,
+        2455: 1031, 2456: 1030, 2457: 1030, 2458: 1030,
+        2459: 1030, 2460: 1030, 2461: 1030, 2462: 1030,
+        2465: 1029, 2466: 1028, 2467: 1028, 2468: 1027,
+        2469: 1027, 2470: 1027, 2471: 1027, 2472: 1026,
+        2473: 1026, 2474: 1026, 2475: 1026, 2476: 1026,
+        2477: 1026, 2478: 1026, 2480: 1025, 2481: 1025,
+        2482: 1025, 2483: 1025, 2484: 1025, 2485: 1025,
+        2486: 1025, 2488: 1025, 2489: 1025, 2490: 1025,
+        2492: 1025, 2497: 1024, 2498: 1023, 2499: 1023,
+        2500: 1022, 2501: 1022, 2502: 1022, 2503: 1022,
+        2504: 1021, 2505: 1021, 2506: 1021, 2507: 1021,
+        2508: 1021, 2509: 1021, 2510: 1021, 2512: 1020,
+        2513: 1020, 2514: 1020, 2515: 1020, 2516: 1020,
+        2517: 1020, 2518: 1020, 2520: 1020, 2521: 1020,
+        2522: 1020, 2524: 1020, 2528: 1019, 2529: 1019,
+        2530: 1019, 2531: 1019, 2532: 1019, 2533: 1019,
+        2534: 1019, 2536: 1019, 2537: 1019, 2538: 1019,
+        2540: 1019, 2544: 5, 2545: 5, 2546: 5,
+        2548: 5, 2552: 5, 2567: 1018, 2571: 1017,
+        2573: 1016, 2574: 1015, 2575: 1015, 2579: 1014,
+        2581: 1013, 2582: 1012, 2583: 1012, 2585: 1011,
+        2586: 1010, 2587: 1010, 2588: 1009, 2589: 1009,
+        2590: 1009, 2591: 9, 2595: 1008, 2597: 1007,
+        2598: 1006, 2599: 1006, 2601: 1005, 2602: 1004,
+        2603: 1004, 2604: 1003, 2605: 1003, 2606: 1003,
+        2607: 1003, 2609: 1002, 2610: 1001, 2611: 1001,
+        2612: 1000, 2613: 1000, 2614: 1000, 2615: 1000,
+        2616: 999, 2617: 999, 2618: 999, 2619: 999,
+        2620: 999, 2621: 999, 2622: 8, 2627: 998,
+        2629: 997, 2630: 996, 2631: 996, 2633: 995,
+        2634: 994, 2635: 994, 2636: 993, 2637: 993,
+        2638: 993, 2639: 993, 2641: 992, 2642: 991,
+        2643: 991, 2644: 990, 2645: 990, 2646: 990,
+        2647: 990, 2648: 989, 2649: 989, 2650: 989,
+        2651: 989, 2652: 989, 2653: 989, 2654: 989,
+        2657: 988, 2658: 987, 2659: 987, 2660: 986,
+        2661: 986, 2662: 986, 2663: 986, 2664: 985,
+        2665: 985, 2666: 985, 2667: 985, 2668: 985,
+        2669: 985, 2670: 985, 2672: 984, 2673: 984,
+        2674: 984, 2675: 984, 2676: 984, 2677: 984,
+        2678: 984, 2680: 984, 2681: 984, 2682: 984,
+        2684: 7, 2691: 983, 2693: 982, 2694: 981,
+        2695: 981, 2697: 980, 2698: 979, 2699: 979,
+        2700: 978, 2701: 978, 2702: 978, 2703: 978,
+        2705: 977, 2706: 976, 2707: 976, 2708: 975,
+        2709: 975, 2710: 975, 2711: 975, 2712: 974,
+        2713: 974, 2714: 974, 2715: 974, 2716: 974,
+        2717: 974, 2718: 974, 2721: 973, 2722: 972,
+        2723: 972, 2724: 971, 2725: 971, 2726: 971,
+        2727: 971, 2728: 970, 2729: 970, 2730: 970,
+        2731: 970, 2732: 970, 2733: 970, 2734: 970,
+        2736: 969, 2737: 969, 2738: 969, 2739: 969,
+        2740: 969, 2741: 969, 2742: 969, 2744: 969,
+        2745: 969, 2746: 969, 2748: 969, 2753: 968,
+        2754: 967, 2755: 967, 2756: 966, 2757: 966,
+        2758: 966, 2759: 966, 2760: 965, 2761: 965,
+        2762: 965, 2763: 965, 2764: 965, 2765: 965,
+        2766: 965, 2768: 964, 2769: 964, 2770: 964,
+        2771: 964, 2772: 964, 2773: 964, 2774: 964,
+        2776: 964, 2777: 964, 2778: 964, 2780: 964,
+        2784: 963, 2785: 963, 2786: 963, 2787: 963,
+        2788: 963, 2789: 963, 2790: 963, 2792: 963,
+        2793: 963, 2794: 963, 2796: 963, 2800: 963,
+        2801: 963, 2802: 963, 2804: 963, 2808: 6,
+        2819: 962, 2821: 961, 2822: 960, 2823: 960,
+        2825: 959, 2826: 958, 2827: 958, 2828: 957,
+        2829: 957, 2830: 957, 2831: 957, 2833: 956,
+        2834: 955, 2835: 955, 2836: 954, 2837: 954,
+        2838: 954, 2839: 954, 2840: 953, 2841: 953,
+        2842: 953, 2843: 953, 2844: 953, 2845: 953,
+        2846: 953, 2849: 952, 2850: 951, 2851: 951,
+        2852: 950, 2853: 950, 2854: 950, 2855: 950,
+        2856: 949, 2857: 949, 2858: 949, 2859: 949,
+        2860: 949, 2861: 949, 2862: 949, 2864: 948,
+        2865: 948, 2866: 948, 2867: 948, 2868: 948,
+        2869: 948, 2870: 948, 2872: 948, 2873: 948,
+        2874: 948, 2876: 948, 2881: 947, 2882: 946,
+        2883: 946, 2884: 945, 2885: 945, 2886: 945,
+        2887: 945, 2888: 944, 2889: 944, 2890: 944,
+        2891: 944, 2892: 944, 2893: 944, 2894: 944,
+        2896: 943, 2897: 943, 2898: 943, 2899: 943,
+        2900: 943, 2901: 943, 2902: 943, 2904: 943,
+        2905: 943, 2906: 943, 2908: 943, 2912: 942,
+        2913: 942, 2914: 942, 2915: 942, 2916: 942,
+        2917: 942, 2918: 942, 2920: 942, 2921: 942,
+        2922: 942, 2924: 942, 2928: 942, 2929: 942,
+        2930: 942, 2932: 942, 2936: 942, 2945: 941,
+        2946: 940, 2947: 940, 2948: 939, 2949: 939,
+        2950: 939, 2951: 939, 2952: 938, 2953: 938,
+        2954: 938, 2955: 938, 2956: 938, 2957: 938,
+        2958: 938, 2960: 937, 2961: 937, 2962: 937,
+        2963: 937, 2964: 937, 2965: 937, 2966: 937,
+        2968: 937, 2969: 937, 2970: 937, 2972: 937,
+        2976: 936, 2977: 936, 2978: 936, 2979: 936,
+        2980: 936, 2981: 936, 2982: 936, 2984: 936,
+        2985: 936, 2986: 936, 2988: 936, 2992: 936,
+        2993: 936, 2994: 936, 2996: 936, 3000: 936,
+        3008: 935, 3009: 935, 3010: 935, 3011: 935,
+        3012: 935, 3013: 935, 3014: 935, 3016: 935,
+        3017: 935, 3018: 935, 3020: 935, 3024: 935,
+        3025: 935, 3026: 935, 3028: 935, 3032: 935,
+        3040: 4, 3041: 4, 3042: 4, 3044: 4,
+        3048: 4, 3056: 4, 3079: 934, 3083: 933,
+        3085: 932, 3086: 931, 3087: 931, 3091: 930,
+        3093: 929, 3094: 928, 3095: 928, 3097: 927,
+        3098: 926, 3099: 926, 3100: 925, 3101: 925,
+        3102: 925, 3103: 9, 3107: 924, 3109: 923,
+        3110: 922, 3111: 922, 3113: 921, 3114: 920,
+        3115: 920, 3116: 919, 3117: 919, 3118: 919,
+        3119: 919, 3121: 918, 3122: 917, 3123: 917,
+        3124: 916, 3125: 916, 3126: 916, 3127: 916,
+        3128: 915, 3129: 915, 3130: 915, 3131: 915,
+        3132: 915, 3133: 915, 3134: 8, 3139: 914,
+        3141: 913, 3142: 912, 3143: 912, 3145: 911,
+        3146: 910, 3147: 910, 3148: 909, 3149: 909,
+        3150: 909, 3151: 909, 3153: 908, 3154: 907,
+        3155: 907, 3156: 906, 3157: 906, 3158: 906,
+        3159: 906, 3160: 905, 3161: 905, 3162: 905,
+        3163: 905, 3164: 905, 3165: 905, 3166: 905,
+        3169: 904, 3170: 903, 3171: 903, 3172: 902,
+        3173: 902, 3174: 902, 3175: 902, 3176: 901,
+        3177: 901, 3178: 901, 3179: 901, 3180: 901,
+        3181: 901, 3182: 901, 3184: 900, 3185: 900,
+        3186: 900, 3187: 900, 3188: 900, 3189: 900,
+        3190: 900, 3192: 900, 3193: 900, 3194: 900,
+        3196: 7, 3203: 899, 3205: 898, 3206: 897,
+        3207: 897, 3209: 896, 3210: 895, 3211: 895,
+        3212: 894, 3213: 894, 3214: 894, 3215: 894,
+        3217: 893, 3218: 892, 3219: 892, 3220: 891,
+        3221: 891, 3222: 891, 3223: 891, 3224: 890,
+        3225: 890, 3226: 890, 3227: 890, 3228: 890,
+        3229: 890, 3230: 890, 3233: 889, 3234: 888,
+        3235: 888, 3236: 887, 3237: 887, 3238: 887,
+        3239: 887, 3240: 886, 3241: 886, 3242: 886,
+        3243: 886, 3244: 886, 3245: 886, 3246: 886,
+        3248: 885, 3249: 885, 3250: 885, 3251: 885,
+        3252: 885, 3253: 885, 3254: 885, 3256: 885,
+        3257: 885, 3258: 885, 3260: 885, 3265: 884,
+        3266: 883, 3267: 883, 3268: 882, 3269: 882,
+        3270: 882, 3271: 882, 3272: 881, 3273: 881,
+        3274: 881, 3275: 881, 3276: 881, 3277: 881,
+        3278: 881, 3280: 880, 3281: 880, 3282: 880,
+        3283: 880, 3284: 880, 3285: 880, 3286: 880,
+        3288: 880, 3289: 880, 3290: 880, 3292: 880,
+        3296: 879, 3297: 879, 3298: 879, 3299: 879,
+        3300: 879, 3301: 879, 3302: 879, 3304: 879,
+        3305: 879, 3306: 879, 3308: 879, 3312: 879,
+        3313: 879, 3314: 879, 3316: 879, 3320: 6,
+        3331: 878, 3333: 877, 3334: 876, 3335: 876,
+        3337: 875, 3338: 874, 3339: 874, 3340: 873,
+        3341: 873, 3342: 873, 3343: 873, 3345: 872,
+        3346: 871, 3347: 871, 3348: 870, 3349: 870,
+        3350: 870, 3351: 870, 3352: 869, 3353: 869,
+        3354: 869, 3355: 869, 3356: 869, 3357: 869,
+        3358: 869, 3361: 868, 3362: 867, 3363: 867,
+        3364: 866, 3365: 866, 3366: 866, 3367: 866,
+        3368: 865, 3369: 865, 3370: 865, 3371: 865,
+        3372: 865, 3373: 865, 3374: 865, 3376: 864,
+        3377: 864, 3378: 864, 3379: 864, 3380: 864,
+        3381: 864, 3382: 864, 3384: 864, 3385: 864,
+        3386: 864, 3388: 864, 3393: 863, 3394: 862,
+        3395: 862, 3396: 861, 3397: 861, 3398: 861,
+        3399: 861, 3400: 860, 3401: 860, 3402: 860,
+        3403: 860, 3404: 860, 3405: 860, 3406: 860,
+        3408: 859, 3409: 859, 3410: 859, 3411: 859,
+        3412: 859, 3413: 859, 3414: 859, 3416: 859,
+        3417: 859, 3418: 859, 3420: 859, 3424: 858,
+        3425: 858, 3426: 858, 3427: 858, 3428: 858,
+        3429: 858, 3430: 858, 3432: 858, 3433: 858,
+        3434: 858, 3436: 858, 3440: 858, 3441: 858,
+        3442: 858, 3444: 858, 3448: 858, 3457: 857,
+        3458: 856, 3459: 856, 3460: 855, 3461: 855,
+        3462: 855, 3463: 855, 3464: 854, 3465: 854,
+        3466: 854, 3467: 854, 3468: 854, 3469: 854,
+        3470: 854, 3472: 853, 3473: 853, 3474: 853,
+        3475: 853, 3476: 853, 3477: 853, 3478: 853,
+        3480: 853, 3481: 853, 3482: 853, 3484: 853,
+        3488: 852, 3489: 852, 3490: 852, 3491: 852,
+        3492: 852, 3493: 852, 3494: 852, 3496: 852,
+        3497: 852, 3498: 852, 3500: 852, 3504: 852,
+        3505: 852, 3506: 852, 3508: 852, 3512: 852,
+        3520: 851, 3521: 851, 3522: 851, 3523: 851,
+        3524: 851, 3525: 851, 3526: 851, 3528: 851,
+        3529: 851, 3530: 851, 3532: 851, 3536: 851,
+        3537: 851, 3538: 851, 3540: 851, 3544: 851,
+        3552: 851, 3553: 851, 3554: 851, 3556: 851,
+        3560: 851, 3568: 5, 3587: 850, 3589: 849,
+        3590: 848, 3591: 848, 3593: 847, 3594: 846,
+        3595: 846, 3596: 845, 3597: 845, 3598: 845,
+        3599: 845, 3601: 844, 3602: 843, 3603: 843,
+        3604: 842, 3605: 842, 3606: 842, 3607: 842,
+        3608: 841, 3609: 841, 3610: 841, 3611: 841,
+        3612: 841, 3613: 841, 3614: 841, 3617: 840,
+        3618: 839, 3619: 839, 3620: 838, 3621: 838,
+        3622: 838, 3623: 838, 3624: 837, 3625: 837,
+        3626: 837, 3627: 837, 3628: 837, 3629: 837,
+        3630: 837, 3632: 836, 3633: 836, 3634: 836,
+        3635: 836, 3636: 836, 3637: 836, 3638: 836,
+        3640: 836, 3641: 836, 3642: 836, 3644: 836,
+        3649: 835, 3650: 834, 3651: 834, 3652: 833,
+        3653: 833, 3654: 833, 3655: 833, 3656: 832,
+        3657: 832, 3658: 832, 3659: 832, 3660: 832,
+        3661: 832, 3662: 832, 3664: 831, 3665: 831,
+        3666: 831, 3667: 831, 3668: 831, 3669: 831,
+        3670: 831, 3672: 831, 3673: 831, 3674: 831,
+        3676: 831, 3680: 830, 3681: 830, 3682: 830,
+        3683: 830, 3684: 830, 3685: 830, 3686: 830,
+        3688: 830, 3689: 830, 3690: 830, 3692: 830,
+        3696: 830, 3697: 830, 3698: 830, 3700: 830,
+        3704: 830, 3713: 829, 3714: 828, 3715: 828,
+        3716: 827, 3717: 827, 3718: 827, 3719: 827,
+        3720: 826, 3721: 826, 3722: 826, 3723: 826,
+        3724: 826, 3725: 826, 3726: 826, 3728: 825,
+        3729: 825, 3730: 825, 3731: 825, 3732: 825,
+        3733: 825, 3734: 825, 3736: 825, 3737: 825,
+        3738: 825, 3740: 825, 3744: 824, 3745: 824,
+        3746: 824, 3747: 824, 3748: 824, 3749: 824,
+        3750: 824, 3752: 824, 3753: 824, 3754: 824,
+        3756: 824, 3760: 824, 3761: 824, 3762: 824,
+        3764: 824, 3768: 824, 3776: 823, 3777: 823,
+        3778: 823, 3779: 823, 3780: 823, 3781: 823,
+        3782: 823, 3784: 823, 3785: 823, 3786: 823,
+        3788: 823, 3792: 823, 3793: 823, 3794: 823,
+        3796: 823, 3800: 823, 3808: 823, 3809: 823,
+        3810: 823, 3812: 823, 3816: 823, 3824: 823,
+        3841: 822, 3842: 821, 3843: 821, 3844: 820,
+        3845: 820, 3846: 820, 3847: 820, 3848: 819,
+        3849: 819, 3850: 819, 3851: 819, 3852: 819,
+        3853: 819, 3854: 819, 3856: 818, 3857: 818,
+        3858: 818, 3859: 818, 3860: 818, 3861: 818,
+        3862: 818, 3864: 818, 3865: 818, 3866: 818,
+        3868: 818, 3872: 817, 3873: 817, 3874: 817,
+        3875: 817, 3876: 817, 3877: 817, 3878: 817,
+        3880: 817, 3881: 817, 3882: 817, 3884: 817,
+        3888: 817, 3889: 817, 3890: 817, 3892: 817,
+        3896: 817, 3904: 816, 3905: 816, 3906: 816,
+        3907: 816, 3908: 816, 3909: 816, 3910: 816,
+        3912: 816, 3913: 816, 3914: 816, 3916: 816,
+        3920: 816, 3921: 816, 3922: 816, 3924: 816,
+        3928: 816, 3936: 816, 3937: 816, 3938: 816,
+        3940: 816, 3944: 816, 3952: 816, 3968: 2,
+        3969: 2, 3970: 2, 3971: 2, 3972: 2,
+        3973: 2, 3974: 2, 3976: 2, 3977: 2,
+        3978: 2, 3980: 2, 3984: 2, 3985: 2,
+        3986: 2, 3988: 2, 3992: 2, 4000: 2,
+        4001: 2, 4002: 2, 4004: 2, 4008: 2,
+        4016: 2, 4032: 2, 4033: 2, 4034: 2,
+        4036: 2, 4040: 2, 4048: 2, 4064: 2,
+        4111: 10, 4119: 815, 4123: 814, 4125: 813,
+        4126: 812, 4127: 9, 4135: 811, 4139: 810,
+        4141: 809, 4142: 808, 4143: 10, 4147: 807,
+        4149: 806, 4150: 805, 4151: 805, 4153: 804,
+        4154: 803, 4155: 803, 4156: 802, 4157: 802,
+        4158: 8, 4159: 8, 4167: 801, 4171: 800,
+        4173: 799, 4174: 798, 4175: 10, 4179: 797,
+        4181: 796, 4182: 795, 4183: 795, 4185: 794,
+        4186: 793, 4187: 793, 4188: 792, 4189: 792,
+        4190: 792, 4191: 9, 4195: 791, 4197: 790,
+        4198: 789, 4199: 789, 4201: 788, 4202: 787,
+        4203: 787, 4204: 786, 4205: 786, 4206: 786,
+        4207: 10, 4209: 785, 4210: 784, 4211: 784,
+        4212: 783, 4213: 783, 4214: 783, 4215: 783,
+        4216: 782, 4217: 782, 4218: 782, 4219: 782,
+        4220: 7, 4221: 7, 4222: 7, 4231: 781,
+        4235: 780, 4237: 779, 4238: 778, 4239: 10,
+        4243: 777, 4245: 776, 4246: 775, 4247: 775,
+        4249: 774, 4250: 773, 4251: 773, 4252: 772,
+        4253: 772, 4254: 772, 4255: 9, 4259: 771,
+        4261: 770, 4262: 769, 4263: 769, 4265: 768,
+        4266: 767, 4267: 767, 4268: 766, 4269: 766,
+        4270: 766, 4271: 10, 4273: 765, 4274: 764,
+        4275: 764, 4276: 763, 4277: 763, 4278: 763,
+        4279: 763, 4280: 762, 4281: 762, 4282: 762,
+        4283: 762, 4284: 762, 4285: 762, 4286: 8,
+        4291: 761, 4293: 760, 4294: 759, 4295: 759,
+        4297: 758, 4298: 757, 4299: 757, 4300: 756,
+        4301: 756, 4302: 756, 4303: 10, 4305: 755,
+        4306: 754, 4307: 754, 4308: 753, 4309: 753,
+        4310: 753, 4311: 753, 4312: 752, 4313: 752,
+        4314: 752, 4315: 752, 4316: 752, 4317: 752,
+        4318: 752, 4321: 751, 4322: 750, 4323: 750,
+        4324: 749, 4325: 749, 4326: 749, 4327: 749,
+        4328: 748, 4329: 748, 4330: 748, 4331: 748,
+        4332: 748, 4333: 748, 4334: 748, 4336: 747,
+        4337: 747, 4338: 747, 4339: 747, 4340: 747,
+        4341: 747, 4342: 747, 4344: 6, 4345: 6,
+        4346: 6, 4348: 6, 4359: 746, 4363: 745,
+        4365: 744, 4366: 743, 4367: 10, 4371: 742,
+        4373: 741, 4374: 740, 4375: 740, 4377: 739,
+        4378: 738, 4379: 738, 4380: 737, 4381: 737,
+        4382: 737, 4383: 9, 4387: 736, 4389: 735,
+        4390: 734, 4391: 734, 4393: 733, 4394: 732,
+        4395: 732, 4396: 731, 4397: 731, 4398: 731,
+        4399: 10, 4401: 730, 4402: 729, 4403: 729,
+        4404: 728, 4405: 728, 4406: 728, 4407: 728,
+        4408: 727, 4409: 727, 4410: 727, 4411: 727,
+        4412: 727, 4413: 727, 4414: 8, 4419: 726,
+        4421: 725, 4422: 724, 4423: 724, 4425: 723,
+        4426: 722, 4427: 722, 4428: 721, 4429: 721,
+        4430: 721, 4431: 10, 4433: 720, 4434: 719,
+        4435: 719, 4436: 718, 4437: 718, 4438: 718,
+        4439: 718, 4440: 717, 4441: 717, 4442: 717,
+        4443: 717, 4444: 717, 4445: 717, 4446: 717,
+        4449: 716, 4450: 715, 4451: 715, 4452: 714,
+        4453: 714, 4454: 714, 4455: 714, 4456: 713,
+        4457: 713, 4458: 713, 4459: 713, 4460: 713,
+        4461: 713, 4462: 713, 4464: 712, 4465: 712,
+        4466: 712, 4467: 712, 4468: 712, 4469: 712,
+        4470: 712, 4472: 712, 4473: 712, 4474: 712,
+        4476: 7, 4483: 711, 4485: 710, 4486: 709,
+        4487: 709, 4489: 708, 4490: 707, 4491: 707,
+        4492: 706, 4493: 706, 4494: 706, 4495: 10,
+        4497: 705, 4498: 704, 4499: 704, 4500: 703,
+        4501: 703, 4502: 703, 4503: 703, 4504: 702,
+        4505: 702, 4506: 702, 4507: 702, 4508: 702,
+        4509: 702, 4510: 702, 4513: 701, 4514: 700,
+        4515: 700, 4516: 699, 4517: 699, 4518: 699,
+        4519: 699, 4520: 698, 4521: 698, 4522: 698,
+        4523: 698, 4524: 698, 4525: 698, 4526: 698,
+        4528: 697, 4529: 697, 4530: 697, 4531: 697,
+        4532: 697, 4533: 697, 4534: 697, 4536: 697,
+        4537: 697, 4538: 697, 4540: 697, 4545: 696,
+        4546: 695, 4547: 695, 4548: 694, 4549: 694,
+        4550: 694, 4551: 694, 4552: 693, 4553: 693,
+        4554: 693, 4555: 693, 4556: 693, 4557: 693,
+        4558: 693, 4560: 692, 4561: 692, 4562: 692,
+        4563: 692, 4564: 692, 4565: 692, 4566: 692,
+        4568: 692, 4569: 692, 4570: 692, 4572: 692,
+        4576: 691, 4577: 691, 4578: 691, 4579: 691,
+        4580: 691, 4581: 691, 4582: 691, 4584: 691,
+        4585: 691, 4586: 691, 4588: 691, 4592: 5,
+        4593: 5, 4594: 5, 4596: 5, 4600: 5,
+        4615: 690, 4619: 689, 4621: 688, 4622: 687,
+        4623: 10, 4627: 686, 4629: 685, 4630: 684,
+        4631: 684, 4633: 683, 4634: 682, 4635: 682,
+        4636: 681, 4637: 681, 4638: 681, 4639: 9,
+        4643: 680, 4645: 679, 4646: 678, 4647: 678,
+        4649: 677, 4650: 676, 4651: 676, 4652: 675,
+        4653: 675, 4654: 675, 4655: 10, 4657: 674,
+        4658: 673, 4659: 673, 4660: 672, 4661: 672,
+        4662: 672, 4663: 672, 4664: 671, 4665: 671,
+        4666: 671, 4667: 671, 4668: 671, 4669: 671,
+        4670: 8, 4675: 670, 4677: 669, 4678: 668,
+        4679: 668, 4681: 667, 4682: 666, 4683: 666,
+        4684: 665, 4685: 665, 4686: 665, 4687: 10,
+        4689: 664, 4690: 663, 4691: 663, 4692: 662,
+        4693: 662, 4694: 662, 4695: 662, 4696: 661,
+        4697: 661, 4698: 661, 4699: 661, 4700: 661,
+        4701: 661, 4702: 661, 4705: 660, 4706: 659,
+        4707: 659, 4708: 658, 4709: 658, 4710: 658,
+        4711: 658, 4712: 657, 4713: 657, 4714: 657,
+        4715: 657, 4716: 657, 4717: 657, 4718: 657,
+        4720: 656, 4721: 656, 4722: 656, 4723: 656,
+        4724: 656, 4725: 656, 4726: 656, 4728: 656,
+        4729: 656, 4730: 656, 4732: 7, 4739: 655,
+        4741: 654, 4742: 653, 4743: 653, 4745: 652,
+        4746: 651, 4747: 651, 4748: 650, 4749: 650,
+        4750: 650, 4751: 10, 4753: 649, 4754: 648,
+        4755: 648, 4756: 647, 4757: 647, 4758: 647,
+        4759: 647, 4760: 646, 4761: 646, 4762: 646,
+        4763: 646, 4764: 646, 4765: 646, 4766: 646,
+        4769: 645, 4770: 644, 4771: 644, 4772: 643,
+        4773: 643, 4774: 643, 4775: 643, 4776: 642,
+        4777: 642, 4778: 642, 4779: 642, 4780: 642,
+        4781: 642, 4782: 642, 4784: 641, 4785: 641,
+        4786: 641, 4787: 641, 4788: 641, 4789: 641,
+        4790: 641, 4792: 641, 4793: 641, 4794: 641,
+        4796: 641, 4801: 640, 4802: 639, 4803: 639,
+        4804: 638, 4805: 638, 4806: 638, 4807: 638,
+        4808: 637, 4809: 637, 4810: 637, 4811: 637,
+        4812: 637, 4813: 637, 4814: 637, 4816: 636,
+        4817: 636, 4818: 636, 4819: 636, 4820: 636,
+        4821: 636, 4822: 636, 4824: 636, 4825: 636,
+        4826: 636, 4828: 636, 4832: 635, 4833: 635,
+        4834: 635, 4835: 635, 4836: 635, 4837: 635,
+        4838: 635, 4840: 635, 4841: 635, 4842: 635,
+        4844: 635, 4848: 635, 4849: 635, 4850: 635,
+        4852: 635, 4856: 6, 4867: 634, 4869: 633,
+        4870: 632, 4871: 632, 4873: 631, 4874: 630,
+        4875: 630, 4876: 629, 4877: 629, 4878: 629,
+        4879: 10, 4881: 628, 4882: 627, 4883: 627,
+        4884: 626, 4885: 626, 4886: 626, 4887: 626,
+        4888: 625, 4889: 625, 4890: 625, 4891: 625,
+        4892: 625, 4893: 625, 4894: 625, 4897: 624,
+        4898: 623, 4899: 623, 4900: 622, 4901: 622,
+        4902: 622, 4903: 622, 4904: 621, 4905: 621,
+        4906: 621, 4907: 621, 4908: 621, 4909: 621,
+        4910: 621, 4912: 620, 4913: 620, 4914: 620,
+        4915: 620, 4916: 620, 4917: 620, 4918: 620,
+        4920: 620, 4921: 620, 4922: 620, 4924: 620,
+        4929: 619, 4930: 618, 4931: 618, 4932: 617,
+        4933: 617, 4934: 617, 4935: 617, 4936: 616,
+        4937: 616, 4938: 616, 4939: 616, 4940: 616,
+        4941: 616, 4942: 616, 4944: 615, 4945: 615,
+        4946: 615, 4947: 615, 4948: 615, 4949: 615,
+        4950: 615, 4952: 615, 4953: 615, 4954: 615,
+        4956: 615, 4960: 614, 4961: 614, 4962: 614,
+        4963: 614, 4964: 614, 4965: 614, 4966: 614,
+        4968: 614, 4969: 614, 4970: 614, 4972: 614,
+        4976: 614, 4977: 614, 4978: 614, 4980: 614,
+        4984: 614, 4993: 613, 4994: 612, 4995: 612,
+        4996: 611, 4997: 611, 4998: 611, 4999: 611,
+        5000: 610, 5001: 610, 5002: 610, 5003: 610,
+        5004: 610, 5005: 610, 5006: 610, 5008: 609,
+        5009: 609, 5010: 609, 5011: 609, 5012: 609,
+        5013: 609, 5014: 609, 5016: 609, 5017: 609,
+        5018: 609, 5020: 609, 5024: 608, 5025: 608,
+        5026: 608, 5027: 608, 5028: 608, 5029: 608,
+        5030: 608, 5032: 608, 5033: 608, 5034: 608,
+        5036: 608, 5040: 608, 5041: 608, 5042: 608,
+        5044: 608, 5048: 608, 5056: 607, 5057: 607,
+        5058: 607, 5059: 607, 5060: 607, 5061: 607,
+        5062: 607, 5064: 607, 5065: 607, 5066: 607,
+        5068: 607, 5072: 607, 5073: 607, 5074: 607,
+        5076: 607, 5080: 607, 5088: 4, 5089: 4,
+        5090: 4, 5092: 4, 5096: 4, 5104: 4,
+        5127: 606, 5131: 605, 5133: 604, 5134: 603,
+        5135: 10, 5139: 602, 5141: 601, 5142: 600,
+        5143: 600, 5145: 599, 5146: 598, 5147: 598,
+        5148: 597, 5149: 597, 5150: 597, 5151: 9,
+        5155: 596, 5157: 595, 5158: 594, 5159: 594,
+        5161: 593, 5162: 592, 5163: 592, 5164: 591,
+        5165: 591, 5166: 591, 5167: 10, 5169: 590,
+        5170: 589, 5171: 589, 5172: 588, 5173: 588,
+        5174: 588, 5175: 588, 5176: 587, 5177: 587,
+        5178: 587, 5179: 587, 5180: 587, 5181: 587,
+        5182: 8, 5187: 586, 5189: 585, 5190: 584,
+        5191: 584, 5193: 583, 5194: 582, 5195: 582,
+        5196: 581, 5197: 581, 5198: 581, 5199: 10,
+        5201: 580, 5202: 579, 5203: 579, 5204: 578,
+        5205: 578, 5206: 578, 5207: 578, 5208: 577,
+        5209: 577, 5210: 577, 5211: 577, 5212: 577,
+        5213: 577, 5214: 577, 5217: 576, 5218: 575,
+        5219: 575, 5220: 574, 5221: 574, 5222: 574,
+        5223: 574, 5224: 573, 5225: 573, 5226: 573,
+        5227: 573, 5228: 573, 5229: 573, 5230: 573,
+        5232: 572, 5233: 572, 5234: 572, 5235: 572,
+        5236: 572, 5237: 572, 5238: 572, 5240: 572,
+        5241: 572, 5242: 572, 5244: 7, 5251: 571,
+        5253: 570, 5254: 569, 5255: 569, 5257: 568,
+        5258: 567, 5259: 567, 5260: 566, 5261: 566,
+        5262: 566, 5263: 10, 5265: 565, 5266: 564,
+        5267: 564, 5268: 563, 5269: 563, 5270: 563,
+        5271: 563, 5272: 562, 5273: 562, 5274: 562,
+        5275: 562, 5276: 562, 5277: 562, 5278: 562,
+        5281: 561, 5282: 560, 5283: 560, 5284: 559,
+        5285: 559, 5286: 559, 5287: 559, 5288: 558,
+        5289: 558, 5290: 558, 5291: 558, 5292: 558,
+        5293: 558, 5294: 558, 5296: 557, 5297: 557,
+        5298: 557, 5299: 557, 5300: 557, 5301: 557,
+        5302: 557, 5304: 557, 5305: 557, 5306: 557,
+        5308: 557, 5313: 556, 5314: 555, 5315: 555,
+        5316: 554, 5317: 554, 5318: 554, 5319: 554,
+        5320: 553, 5321: 553, 5322: 553, 5323: 553,
+        5324: 553, 5325: 553, 5326: 553, 5328: 552,
+        5329: 552, 5330: 552, 5331: 552, 5332: 552,
+        5333: 552, 5334: 552, 5336: 552, 5337: 552,
+        5338: 552, 5340: 552, 5344: 551, 5345: 551,
+        5346: 551, 5347: 551, 5348: 551, 5349: 551,
+        5350: 551, 5352: 551, 5353: 551, 5354: 551,
+        5356: 551, 5360: 551, 5361: 551, 5362: 551,
+        5364: 551, 5368: 6, 5379: 550, 5381: 549,
+        5382: 548, 5383: 548, 5385: 547, 5386: 546,
+        5387: 546, 5388: 545, 5389: 545, 5390: 545,
+        5391: 10, 5393: 544, 5394: 543, 5395: 543,
+        5396: 542, 5397: 542, 5398: 542, 5399: 542,
+        5400: 541, 5401: 541, 5402: 541, 5403: 541,
+        5404: 541, 5405: 541, 5406: 541, 5409: 540,
+        5410: 539, 5411: 539, 5412: 538, 5413: 538,
+        5414: 538, 5415: 538, 5416: 537, 5417: 537,
+        5418: 537, 5419: 537, 5420: 537, 5421: 537,
+        5422: 537, 5424: 536, 5425: 536, 5426: 536,
+        5427: 536, 5428: 536, 5429: 536, 5430: 536,
+        5432: 536, 5433: 536, 5434: 536, 5436: 536,
+        5441: 535, 5442: 534, 5443: 534, 5444: 533,
+        5445: 533, 5446: 533, 5447: 533, 5448: 532,
+        5449: 532, 5450: 532, 5451: 532, 5452: 532,
+        5453: 532, 5454: 532, 5456: 531, 5457: 531,
+        5458: 531, 5459: 531, 5460: 531, 5461: 531,
+        5462: 531, 5464: 531, 5465: 531, 5466: 531,
+        5468: 531, 5472: 530, 5473: 530, 5474: 530,
+        5475: 530, 5476: 530, 5477: 530, 5478: 530,
+        5480: 530, 5481: 530, 5482: 530, 5484: 530,
+        5488: 530, 5489: 530, 5490: 530, 5492: 530,
+        5496: 530, 5505: 529, 5506: 528, 5507: 528,
+        5508: 527, 5509: 527, 5510: 527, 5511: 527,
+        5512: 526, 5513: 526, 5514: 526, 5515: 526,
+        5516: 526, 5517: 526, 5518: 526, 5520: 525,
+        5521: 525, 5522: 525, 5523: 525, 5524: 525,
+        5525: 525, 5526: 525, 5528: 525, 5529: 525,
+        5530: 525, 5532: 525, 5536: 524, 5537: 524,
+        5538: 524, 5539: 524, 5540: 524, 5541: 524,
+        5542: 524, 5544: 524, 5545: 524, 5546: 524,
+        5548: 524, 5552: 524, 5553: 524, 5554: 524,
+        5556: 524, 5560: 524, 5568: 523, 5569: 523,
+        5570: 523, 5571: 523, 5572: 523, 5573: 523,
+        5574: 523, 5576: 523, 5577: 523, 5578: 523,
+        5580: 523, 5584: 523, 5585: 523, 5586: 523,
+        5588: 523, 5592: 523, 5600: 523, 5601: 523,
+        5602: 523, 5604: 523, 5608: 523, 5616: 5,
+        5635: 522, 5637: 521, 5638: 520, 5639: 520,
+        5641: 519, 5642: 518, 5643: 518, 5644: 517,
+        5645: 517, 5646: 517, 5647: 10, 5649: 516,
+        5650: 515, 5651: 515, 5652: 514, 5653: 514,
+        5654: 514, 5655: 514, 5656: 513, 5657: 513,
+        5658: 513, 5659: 513, 5660: 513, 5661: 513,
+        5662: 513, 5665: 512, 5666: 511, 5667: 511,
+        5668: 510, 5669: 510, 5670: 510, 5671: 510,
+        5672: 509, 5673: 509, 5674: 509, 5675: 509,
+        5676: 509, 5677: 509, 5678: 509, 5680: 508,
+        5681: 508, 5682: 508, 5683: 508, 5684: 508,
+        5685: 508, 5686: 508, 5688: 508, 5689: 508,
+        5690: 508, 5692: 508, 5697: 507, 5698: 506,
+        5699: 506, 5700: 505, 5701: 505, 5702: 505,
+        5703: 505, 5704: 504, 5705: 504, 5706: 504,
+        5707: 504, 5708: 504, 5709: 504, 5710: 504,
+        5712: 503, 5713: 503, 5714: 503, 5715: 503,
+        5716: 503, 5717: 503, 5718: 503, 5720: 503,
+        5721: 503, 5722: 503, 5724: 503, 5728: 502,
+        5729: 502, 5730: 502, 5731: 502, 5732: 502,
+        5733: 502, 5734: 502, 5736: 502, 5737: 502,
+        5738: 502, 5740: 502, 5744: 502, 5745: 502,
+        5746: 502, 5748: 502, 5752: 502, 5761: 501,
+        5762: 500, 5763: 500, 5764: 499, 5765: 499,
+        5766: 499, 5767: 499, 5768: 498, 5769: 498,
+        5770: 498, 5771: 498, 5772: 498, 5773: 498,
+        5774: 498, 5776: 497, 5777: 497, 5778: 497,
+        5779: 497, 5780: 497, 5781: 497, 5782: 497,
+        5784: 497, 5785: 497, 5786: 497, 5788: 497,
+        5792: 496, 5793: 496, 5794: 496, 5795: 496,
+        5796: 496, 5797: 496, 5798: 496, 5800: 496,
+        5801: 496, 5802: 496, 5804: 496, 5808: 496,
+        5809: 496, 5810: 496, 5812: 496, 5816: 496,
+        5824: 495, 5825: 495, 5826: 495, 5827: 495,
+        5828: 495, 5829: 495, 5830: 495, 5832: 495,
+        5833: 495, 5834: 495, 5836: 495, 5840: 495,
+        5841: 495, 5842: 495, 5844: 495, 5848: 495,
+        5856: 495, 5857: 495, 5858: 495, 5860: 495,
+        5864: 495, 5872: 495, 5889: 494, 5890: 493,
+        5891: 493, 5892: 492, 5893: 492, 5894: 492,
+        5895: 492, 5896: 491, 5897: 491, 5898: 491,
+        5899: 491, 5900: 491, 5901: 491, 5902: 491,
+        5904: 490, 5905: 490, 5906: 490, 5907: 490,
+        5908: 490, 5909: 490, 5910: 490, 5912: 490,
+        5913: 490, 5914: 490, 5916: 490, 5920: 489,
+        5921: 489, 5922: 489, 5923: 489, 5924: 489,
+        5925: 489, 5926: 489, 5928: 489, 5929: 489,
+        5930: 489, 5932: 489, 5936: 489, 5937: 489,
+        5938: 489, 5940: 489, 5944: 489, 5952: 488,
+        5953: 488, 5954: 488, 5955: 488, 5956: 488,
+        5957: 488, 5958: 488, 5960: 488, 5961: 488,
+        5962: 488, 5964: 488, 5968: 488, 5969: 488,
+        5970: 488, 5972: 488, 5976: 488, 5984: 488,
+        5985: 488, 5986: 488, 5988: 488, 5992: 488,
+        6000: 488, 6016: 487, 6017: 487, 6018: 487,
+        6019: 487, 6020: 487, 6021: 487, 6022: 487,
+        6024: 487, 6025: 487, 6026: 487, 6028: 487,
+        6032: 487, 6033: 487, 6034: 487, 6036: 487,
+        6040: 487, 6048: 487, 6049: 487, 6050: 487,
+        6052: 487, 6056: 487, 6064: 487, 6080: 3,
+        6081: 3, 6082: 3, 6084: 3, 6088: 3,
+        6096: 3, 6112: 3, 6151: 486, 6155: 485,
+        6157: 484, 6158: 483, 6159: 10, 6163: 482,
+        6165: 481, 6166: 480, 6167: 480, 6169: 479,
+        6170: 478, 6171: 478, 6172: 477, 6173: 477,
+        6174: 477, 6175: 9, 6179: 476, 6181: 475,
+        6182: 474, 6183: 474, 6185: 473, 6186: 472,
+        6187: 472, 6188: 471, 6189: 471, 6190: 471,
+        6191: 10, 6193: 470, 6194: 469, 6195: 469,
+        6196: 468, 6197: 468, 6198: 468, 6199: 468,
+        6200: 467, 6201: 467, 6202: 467, 6203: 467,
+        6204: 467, 6205: 467, 6206: 8, 6211: 466,
+        6213: 465, 6214: 464, 6215: 464, 6217: 463,
+        6218: 462, 6219: 462, 6220: 461, 6221: 461,
+        6222: 461, 6223: 10, 6225: 460, 6226: 459,
+        6227: 459, 6228: 458, 6229: 458, 6230: 458,
+        6231: 458, 6232: 457, 6233: 457, 6234: 457,
+        6235: 457, 6236: 457, 6237: 457, 6238: 457,
+        6241: 456, 6242: 455, 6243: 455, 6244: 454,
+        6245: 454, 6246: 454, 6247: 454, 6248: 453,
+        6249: 453, 6250: 453, 6251: 453, 6252: 453,
+        6253: 453, 6254: 453, 6256: 452, 6257: 452,
+        6258: 452, 6259: 452, 6260: 452, 6261: 452,
+        6262: 452, 6264: 452, 6265: 452, 6266: 452,
+        6268: 7, 6275: 451, 6277: 450, 6278: 449,
+        6279: 449, 6281: 448, 6282: 447, 6283: 447,
+        6284: 446, 6285: 446, 6286: 446, 6287: 10,
+        6289: 445, 6290: 444, 6291: 444, 6292: 443,
+        6293: 443, 6294: 443, 6295: 443, 6296: 442,
+        6297: 442, 6298: 442, 6299: 442, 6300: 442,
+        6301: 442, 6302: 442, 6305: 441, 6306: 440,
+        6307: 440, 6308: 439, 6309: 439, 6310: 439,
+        6311: 439, 6312: 438, 6313: 438, 6314: 438,
+        6315: 438, 6316: 438, 6317: 438, 6318: 438,
+        6320: 437, 6321: 437, 6322: 437, 6323: 437,
+        6324: 437, 6325: 437, 6326: 437, 6328: 437,
+        6329: 437, 6330: 437, 6332: 437, 6337: 436,
+        6338: 435, 6339: 435, 6340: 434, 6341: 434,
+        6342: 434, 6343: 434, 6344: 433, 6345: 433,
+        6346: 433, 6347: 433, 6348: 433, 6349: 433,
+        6350: 433, 6352: 432, 6353: 432, 6354: 432,
+        6355: 432, 6356: 432, 6357: 432, 6358: 432,
+        6360: 432, 6361: 432, 6362: 432, 6364: 432,
+        6368: 431, 6369: 431, 6370: 431, 6371: 431,
+        6372: 431, 6373: 431, 6374: 431, 6376: 431,
+        6377: 431, 6378: 431, 6380: 431, 6384: 431,
+        6385: 431, 6386: 431, 6388: 431, 6392: 6,
+        6403: 430, 6405: 429, 6406: 428, 6407: 428,
+        6409: 427, 6410: 426, 6411: 426, 6412: 425,
+        6413: 425, 6414: 425, 6415: 10, 6417: 424,
+        6418: 423, 6419: 423, 6420: 422, 6421: 422,
+        6422: 422, 6423: 422, 6424: 421, 6425: 421,
+        6426: 421, 6427: 421, 6428: 421, 6429: 421,
+        6430: 421, 6433: 420, 6434: 419, 6435: 419,
+        6436: 418, 6437: 418, 6438: 418, 6439: 418,
+        6440: 417, 6441: 417, 6442: 417, 6443: 417,
+        6444: 417, 6445: 417, 6446: 417, 6448: 416,
+        6449: 416, 6450: 416, 6451: 416, 6452: 416,
+        6453: 416, 6454: 416, 6456: 416, 6457: 416,
+        6458: 416, 6460: 416, 6465: 415, 6466: 414,
+        6467: 414, 6468: 413, 6469: 413, 6470: 413,
+        6471: 413, 6472: 412, 6473: 412, 6474: 412,
+        6475: 412, 6476: 412, 6477: 412, 6478: 412,
+        6480: 411, 6481: 411, 6482: 411, 6483: 411,
+        6484: 411, 6485: 411, 6486: 411, 6488: 411,
+        6489: 411, 6490: 411, 6492: 411, 6496: 410,
+        6497: 410, 6498: 410, 6499: 410, 6500: 410,
+        6501: 410, 6502: 410, 6504: 410, 6505: 410,
+        6506: 410, 6508: 410, 6512: 410, 6513: 410,
+        6514: 410, 6516: 410, 6520: 410, 6529: 409,
+        6530: 408, 6531: 408, 6532: 407, 6533: 407,
+        6534: 407, 6535: 407, 6536: 406, 6537: 406,
+        6538: 406, 6539: 406, 6540: 406, 6541: 406,
+        6542: 406, 6544: 405, 6545: 405, 6546: 405,
+        6547: 405, 6548: 405, 6549: 405, 6550: 405,
+        6552: 405, 6553: 405, 6554: 405, 6556: 405,
+        6560: 404, 6561: 404, 6562: 404, 6563: 404,
+        6564: 404, 6565: 404, 6566: 404, 6568: 404,
+        6569: 404, 6570: 404, 6572: 404, 6576: 404,
+        6577: 404, 6578: 404, 6580: 404, 6584: 404,
+        6592: 403, 6593: 403, 6594: 403, 6595: 403,
+        6596: 403, 6597: 403, 6598: 403, 6600: 403,
+        6601: 403, 6602: 403, 6604: 403, 6608: 403,
+        6609: 403, 6610: 403, 6612: 403, 6616: 403,
+        6624: 403, 6625: 403, 6626: 403, 6628: 403,
+        6632: 403, 6640: 5, 6659: 402, 6661: 401,
+        6662: 400, 6663: 400, 6665: 399, 6666: 398,
+        6667: 398, 6668: 397, 6669: 397, 6670: 397,
+        6671: 10, 6673: 396, 6674: 395, 6675: 395,
+        6676: 394, 6677: 394, 6678: 394, 6679: 394,
+        6680: 393, 6681: 393, 6682: 393, 6683: 393,
+        6684: 393, 6685: 393, 6686: 393, 6689: 392,
+        6690: 391, 6691: 391, 6692: 390, 6693: 390,
+        6694: 390, 6695: 390, 6696: 389, 6697: 389,
+        6698: 389, 6699: 389, 6700: 389, 6701: 389,
+        6702: 389, 6704: 388, 6705: 388, 6706: 388,
+        6707: 388, 6708: 388, 6709: 388, 6710: 388,
+        6712: 388, 6713: 388, 6714: 388, 6716: 388,
+        6721: 387, 6722: 386, 6723: 386, 6724: 385,
+        6725: 385, 6726: 385, 6727: 385, 6728: 384,
+        6729: 384, 6730: 384, 6731: 384, 6732: 384,
+        6733: 384, 6734: 384, 6736: 383, 6737: 383,
+        6738: 383, 6739: 383, 6740: 383, 6741: 383,
+        6742: 383, 6744: 383, 6745: 383, 6746: 383,
+        6748: 383, 6752: 382, 6753: 382, 6754: 382,
+        6755: 382, 6756: 382, 6757: 382, 6758: 382,
+        6760: 382, 6761: 382, 6762: 382, 6764: 382,
+        6768: 382, 6769: 382, 6770: 382, 6772: 382,
+        6776: 382, 6785: 381, 6786: 380, 6787: 380,
+        6788: 379, 6789: 379, 6790: 379, 6791: 379,
+        6792: 378, 6793: 378, 6794: 378, 6795: 378,
+        6796: 378, 6797: 378, 6798: 378, 6800: 377,
+        6801: 377, 6802: 377, 6803: 377, 6804: 377,
+        6805: 377, 6806: 377, 6808: 377, 6809: 377,
+        6810: 377, 6812: 377, 6816: 376, 6817: 376,
+        6818: 376, 6819: 376, 6820: 376, 6821: 376,
+        6822: 376, 6824: 376, 6825: 376, 6826: 376,
+        6828: 376, 6832: 376, 6833: 376, 6834: 376,
+        6836: 376, 6840: 376, 6848: 375, 6849: 375,
+        6850: 375, 6851: 375, 6852: 375, 6853: 375,
+        6854: 375, 6856: 375, 6857: 375, 6858: 375,
+        6860: 375, 6864: 375, 6865: 375, 6866: 375,
+        6868: 375, 6872: 375, 6880: 375, 6881: 375,
+        6882: 375, 6884: 375, 6888: 375, 6896: 375,
+        6913: 374, 6914: 373, 6915: 373, 6916: 372,
+        6917: 372, 6918: 372, 6919: 372, 6920: 371,
+        6921: 371, 6922: 371, 6923: 371, 6924: 371,
+        6925: 371, 6926: 371, 6928: 370, 6929: 370,
+        6930: 370, 6931: 370, 6932: 370, 6933: 370,
+        6934: 370, 6936: 370, 6937: 370, 6938: 370,
+        6940: 370, 6944: 369, 6945: 369, 6946: 369,
+        6947: 369, 6948: 369, 6949: 369, 6950: 369,
+        6952: 369, 6953: 369, 6954: 369, 6956: 369,
+        6960: 369, 6961: 369, 6962: 369, 6964: 369,
+        6968: 369, 6976: 368, 6977: 368, 6978: 368,
+        6979: 368, 6980: 368, 6981: 368, 6982: 368,
+        6984: 368, 6985: 368, 6986: 368, 6988: 368,
+        6992: 368, 6993: 368, 6994: 368, 6996: 368,
+        7000: 368, 7008: 368, 7009: 368, 7010: 368,
+        7012: 368, 7016: 368, 7024: 368, 7040: 367,
+        7041: 367, 7042: 367, 7043: 367, 7044: 367,
+        7045: 367, 7046: 367, 7048: 367, 7049: 367,
+        7050: 367, 7052: 367, 7056: 367, 7057: 367,
+        7058: 367, 7060: 367, 7064: 367, 7072: 367,
+        7073: 367, 7074: 367, 7076: 367, 7080: 367,
+        7088: 367, 7104: 367, 7105: 367, 7106: 367,
+        7108: 367, 7112: 367, 7120: 367, 7136: 4,
+        7171: 366, 7173: 365, 7174: 364, 7175: 364,
+        7177: 363, 7178: 362, 7179: 362, 7180: 361,
+        7181: 361, 7182: 361, 7183: 10, 7185: 360,
+        7186: 359, 7187: 359, 7188: 358, 7189: 358,
+        7190: 358, 7191: 358, 7192: 357, 7193: 357,
+        7194: 357, 7195: 357, 7196: 357, 7197: 357,
+        7198: 357, 7201: 356, 7202: 355, 7203: 355,
+        7204: 354, 7205: 354, 7206: 354, 7207: 354,
+        7208: 353, 7209: 353, 7210: 353, 7211: 353,
+        7212: 353, 7213: 353, 7214: 353, 7216: 352,
+        7217: 352, 7218: 352, 7219: 352, 7220: 352,
+        7221: 352, 7222: 352, 7224: 352, 7225: 352,
+        7226: 352, 7228: 352, 7233: 351, 7234: 350,
+        7235: 350, 7236: 349, 7237: 349, 7238: 349,
+        7239: 349, 7240: 348, 7241: 348, 7242: 348,
+        7243: 348, 7244: 348, 7245: 348, 7246: 348,
+        7248: 347, 7249: 347, 7250: 347, 7251: 347,
+        7252: 347, 7253: 347, 7254: 347, 7256: 347,
+        7257: 347, 7258: 347, 7260: 347, 7264: 346,
+        7265: 346, 7266: 346, 7267: 346, 7268: 346,
+        7269: 346, 7270: 346, 7272: 346, 7273: 346,
+        7274: 346, 7276: 346, 7280: 346, 7281: 346,
+        7282: 346, 7284: 346, 7288: 346, 7297: 345,
+        7298: 344, 7299: 344, 7300: 343, 7301: 343,
+        7302: 343, 7303: 343, 7304: 342, 7305: 342,
+        7306: 342, 7307: 342, 7308: 342, 7309: 342,
+        7310: 342, 7312: 341, 7313: 341, 7314: 341,
+        7315: 341, 7316: 341, 7317: 341, 7318: 341,
+        7320: 341, 7321: 341, 7322: 341, 7324: 341,
+        7328: 340, 7329: 340, 7330: 340, 7331: 340,
+        7332: 340, 7333: 340, 7334: 340, 7336: 340,
+        7337: 340, 7338: 340, 7340: 340, 7344: 340,
+        7345: 340, 7346: 340, 7348: 340, 7352: 340,
+        7360: 339, 7361: 339, 7362: 339, 7363: 339,
+        7364: 339, 7365: 339, 7366: 339, 7368: 339,
+        7369: 339, 7370: 339, 7372: 339, 7376: 339,
+        7377: 339, 7378: 339, 7380: 339, 7384: 339,
+        7392: 339, 7393: 339, 7394: 339, 7396: 339,
+        7400: 339, 7408: 339, 7425: 338, 7426: 337,
+        7427: 337, 7428: 336, 7429: 336, 7430: 336,
+        7431: 336, 7432: 335, 7433: 335, 7434: 335,
+        7435: 335, 7436: 335, 7437: 335, 7438: 335,
+        7440: 334, 7441: 334, 7442: 334, 7443: 334,
+        7444: 334, 7445: 334, 7446: 334, 7448: 334,
+        7449: 334, 7450: 334, 7452: 334, 7456: 333,
+        7457: 333, 7458: 333, 7459: 333, 7460: 333,
+        7461: 333, 7462: 333, 7464: 333, 7465: 333,
+        7466: 333, 7468: 333, 7472: 333, 7473: 333,
+        7474: 333, 7476: 333, 7480: 333, 7488: 332,
+        7489: 332, 7490: 332, 7491: 332, 7492: 332,
+        7493: 332, 7494: 332, 7496: 332, 7497: 332,
+        7498: 332, 7500: 332, 7504: 332, 7505: 332,
+        7506: 332, 7508: 332, 7512: 332, 7520: 332,
+        7521: 332, 7522: 332, 7524: 332, 7528: 332,
+        7536: 332, 7552: 331, 7553: 331, 7554: 331,
+        7555: 331, 7556: 331, 7557: 331, 7558: 331,
+        7560: 331, 7561: 331, 7562: 331, 7564: 331,
+        7568: 331, 7569: 331, 7570: 331, 7572: 331,
+        7576: 331, 7584: 331, 7585: 331, 7586: 331,
+        7588: 331, 7592: 331, 7600: 331, 7616: 331,
+        7617: 331, 7618: 331, 7620: 331, 7624: 331,
+        7632: 331, 7648: 331, 7681: 330, 7682: 329,
+        7683: 329, 7684: 328, 7685: 328, 7686: 328,
+        7687: 328, 7688: 327, 7689: 327, 7690: 327,
+        7691: 327, 7692: 327, 7693: 327, 7694: 327,
+        7696: 326, 7697: 326, 7698: 326, 7699: 326,
+        7700: 326, 7701: 326, 7702: 326, 7704: 326,
+        7705: 326, 7706: 326, 7708: 326, 7712: 325,
+        7713: 325, 7714: 325, 7715: 325, 7716: 325,
+        7717: 325, 7718: 325, 7720: 325, 7721: 325,
+        7722: 325, 7724: 325, 7728: 325, 7729: 325,
+        7730: 325, 7732: 325, 7736: 325, 7744: 324,
+        7745: 324, 7746: 324, 7747: 324, 7748: 324,
+        7749: 324, 7750: 324, 7752: 324, 7753: 324,
+        7754: 324, 7756: 324, 7760: 324, 7761: 324,
+        7762: 324, 7764: 324, 7768: 324, 7776: 324,
+        7777: 324, 7778: 324, 7780: 324, 7784: 324,
+        7792: 324, 7808: 323, 7809: 323, 7810: 323,
+        7811: 323, 7812: 323, 7813: 323, 7814: 323,
+        7816: 323, 7817: 323, 7818: 323, 7820: 323,
+        7824: 323, 7825: 323, 7826: 323, 7828: 323,
+        7832: 323, 7840: 323, 7841: 323, 7842: 323,
+        7844: 323, 7848: 323, 7856: 323, 7872: 323,
+        7873: 323, 7874: 323, 7876: 323, 7880: 323,
+        7888: 323, 7904: 323, 7936: 1, 7937: 1,
+        7938: 1, 7939: 1, 7940: 1, 7941: 1,
+        7942: 1, 7944: 1, 7945: 1, 7946: 1,
+        7948: 1, 7952: 1, 7953: 1, 7954: 1,
+        7956: 1, 7960: 1, 7968: 1, 7969: 1,
+        7970: 1, 7972: 1, 7976: 1, 7984: 1,
+        8000: 1, 8001: 1, 8002: 1, 8004: 1,
+        8008: 1, 8016: 1, 8032: 1, 8064: 1,
+        8065: 1, 8066: 1, 8068: 1, 8072: 1,
+        8080: 1, 8096: 1, 8128: 1
+    }
+    odd_xors_to_rank = {
+        127: 1606, 191: 1607, 223: 1608, 239: 7414,
+        247: 7411, 251: 1605, 253: 1605, 254: 1605,
+        319: 1607, 351: 1608, 367: 7380, 375: 7377,
+        379: 7376, 381: 1606, 382: 1606, 415: 1608,
+        431: 7360, 439: 7357, 443: 7356, 445: 7356,
+        446: 1607, 463: 7350, 471: 7347, 475: 7346,
+        477: 7346, 478: 7346, 487: 7343, 491: 7342,
+        493: 7342, 494: 7342, 499: 1604, 501: 1604,
+        502: 1604, 505: 1604, 506: 1604, 508: 1604,
+        575: 1607, 607: 1608, 623: 7311, 631: 7308,
+        635: 7307, 637: 1606, 638: 1606, 671: 1608,
+        687: 7291, 695: 7288, 699: 7287, 701: 7287,
+        702: 1607, 719: 7281, 727: 7278, 731: 7277,
+        733: 7277, 734: 7277, 743: 7274, 747: 7273,
+        749: 7273, 750: 7273, 755: 7272, 757: 7272,
+        758: 7272, 761: 1605, 762: 1605, 764: 1605,
+        799: 1608, 815: 7256, 823: 7253, 827: 7252,
+        829: 7252, 830: 1607, 847: 7246, 855: 7243,
+        859: 7242, 861: 7242, 862: 7242, 871: 7239,
+        875: 7238, 877: 7238, 878: 7238, 883: 7237,
+        885: 7237, 886: 7237, 889: 7237, 890: 7237,
+        892: 1606, 911: 7231, 919: 7228, 923: 7227,
+        925: 7227, 926: 7227, 935: 7224, 939: 7223,
+        941: 7223, 942: 7223, 947: 7222, 949: 7222,
+        950: 7222, 953: 7222, 954: 7222, 956: 7222,
+        967: 7219, 971: 7218, 973: 7218, 974: 7218,
+        979: 7217, 981: 7217, 982: 7217, 985: 7217,
+        986: 7217, 988: 7217, 995: 1603, 997: 1603,
+        998: 1603, 1001: 1603, 1002: 1603, 1004: 1603,
+        1009: 1603, 1010: 1603, 1012: 1603, 1016: 1603,
+        1087: 1607, 1119: 1608, 1135: 7186, 1143: 7183,
+        1147: 7182, 1149: 1606, 1150: 1606, 1183: 1608,
+        1199: 7166, 1207: 7163, 1211: 7162, 1213: 7162,
+        1214: 1607, 1231: 7156, 1239: 7153, 1243: 7152,
+        1245: 7152, 1246: 7152, 1255: 7149, 1259: 7148,
+        1261: 7148, 1262: 7148, 1267: 7147, 1269: 7147,
+        1270: 7147, 1273: 1605, 1274: 1605, 1276: 1605,
+        1311: 1608, 1327: 7131, 1335: 7128, 1339: 7127,
+        1341: 7127, 1342: 1607, 1359: 7121, 1367: 7118,
+        1371: 7117, 1373: 7117, 1374: 7117, 1383: 7114,
+        1387: 7113, 1389: 7113, 1390: 7113, 1395: 7112,
+        1397: 7112, 1398: 7112, 1401: 7112, 1402: 7112,
+        1404: 1606, 1423: 7106, 1431: 7103, 1435: 7102,
+        1437: 7102, 1438: 7102, 1447: 7099, 1451: 7098,
+        1453: 7098, 1454: 7098, 1459: 7097, 1461: 7097,
+        1462: 7097, 1465: 7097, 1466: 7097, 1468: 7097,
+        1479: 7094, 1483: 7093, 1485: 7093, 1486: 7093,
+        1491: 7092, 1493: 7092, 1494: 7092, 1497: 7092,
+        1498: 7092, 1500: 7092, 1507: 7091, 1509: 7091,
+        1510: 7091, 1513: 7091, 1514: 7091, 1516: 7091,
+        1521: 1604, 1522: 1604, 1524: 1604, 1528: 1604,
+        1567: 1608, 1583: 7075, 1591: 7072, 1595: 7071,
+        1597: 7071, 1598: 1607, 1615: 7065, 1623: 7062,
+        1627: 7061, 1629: 7061, 1630: 7061, 1639: 7058,
+        1643: 7057, 1645: 7057, 1646: 7057, 1651: 7056,
+        1653: 7056, 1654: 7056, 1657: 7056, 1658: 7056,
+        1660: 1606, 1679: 7050, 1687: 7047, 1691: 7046,
+        1693: 7046, 1694: 7046, 1703: 7043, 1707: 7042,
+        1709: 7042, 1710: 7042, 1715: 7041, 1717: 7041,
+        1718: 7041, 1721: 7041, 1722: 7041, 1724: 7041,
+        1735: 7038, 1739: 7037, 1741: 7037, 1742: 7037,
+        1747: 7036, 1749: 7036, 1750: 7036, 1753: 7036,
+        1754: 7036, 1756: 7036, 1763: 7035, 1765: 7035,
+        1766: 7035, 1769: 7035, 1770: 7035, 1772: 7035,
+        1777: 7035, 1778: 7035, 1780: 7035, 1784: 1605,
+        1807: 7029, 1815: 7026, 1819: 7025, 1821: 7025,
+        1822: 7025, 1831: 7022, 1835: 7021, 1837: 7021,
+        1838: 7021, 1843: 7020, 1845: 7020, 1846: 7020,
+        1849: 7020, 1850: 7020, 1852: 7020, 1863: 7017,
+        1867: 7016, 1869: 7016, 1870: 7016, 1875: 7015,
+        1877: 7015, 1878: 7015, 1881: 7015, 1882: 7015,
+        1884: 7015, 1891: 7014, 1893: 7014, 1894: 7014,
+        1897: 7014, 1898: 7014, 1900: 7014, 1905: 7014,
+        1906: 7014, 1908: 7014, 1912: 7014, 1927: 7011,
+        1931: 7010, 1933: 7010, 1934: 7010, 1939: 7009,
+        1941: 7009, 1942: 7009, 1945: 7009, 1946: 7009,
+        1948: 7009, 1955: 7008, 1957: 7008, 1958: 7008,
+        1961: 7008, 1962: 7008, 1964: 7008, 1969: 7008,
+        1970: 7008, 1972: 7008, 1976: 7008, 1987: 1602,
+        1989: 1602, 1990: 1602, 1993: 1602, 1994: 1602,
+        1996: 1602, 2001: 1602, 2002: 1602, 2004: 1602,
+        2008: 1602, 2017: 1602, 2018: 1602, 2020: 1602,
+        2024: 1602, 2032: 1602, 2111: 1607, 2143: 1608,
+        2159: 6977, 2167: 6974, 2171: 6973, 2173: 1606,
+        2174: 1606, 2207: 1608, 2223: 6957, 2231: 6954,
+        2235: 6953, 2237: 6953, 2238: 1607, 2255: 6947,
+        2263: 6944, 2267: 6943, 2269: 6943, 2270: 6943,
+        2279: 6940, 2283: 6939, 2285: 6939, 2286: 6939,
+        2291: 6938, 2293: 6938, 2294: 6938, 2297: 1605,
+        2298: 1605, 2300: 1605, 2335: 1608, 2351: 6922,
+        2359: 6919, 2363: 6918, 2365: 6918, 2366: 1607,
+        2383: 6912, 2391: 6909, 2395: 6908, 2397: 6908,
+        2398: 6908, 2407: 6905, 2411: 6904, 2413: 6904,
+        2414: 6904, 2419: 6903, 2421: 6903, 2422: 6903,
+        2425: 6903, 2426: 6903, 2428: 1606, 2447: 6897,
+        2455: 6894, 2459: 6893, 2461: 6893, 2462: 6893,
+        2471: 6890, 2475: 6889, 2477: 6889, 2478: 6889,
+        2483: 6888, 2485: 6888, 2486: 6888, 2489: 6888,
+        2490: 6888, 2492: 6888, 2503: 6885, 2507: 6884,
+        2509: 6884, 2510: 6884, 2515: 6883, 2517: 6883,
+        2518: 6883, 2521: 6883, 2522: 6883, 2524: 6883,
+        2531: 6882, 2533: 6882, 2534: 6882, 2537: 6882,
+        2538: 6882, 2540: 6882, 2545: 1604, 2546: 1604,
+        2548: 1604, 2552: 1604, 2591: 1608, 2607: 6866,
+        2615: 6863, 2619: 6862, 2621: 6862, 2622: 1607,
+        2639: 6856, 2647: 6853, 2651: 6852, 2653: 6852,
+        2654: 6852, 2663: 6849, 2667: 6848, 2669: 6848,
+        2670: 6848, 2675: 6847, 2677: 6847, 2678: 6847,
+        2681: 6847, 2682: 6847, 2684: 1606, 2703: 6841,
+        2711: 6838, 2715: 6837, 2717: 6837, 2718: 6837,
+        2727: 6834, 2731: 6833, 2733: 6833, 2734: 6833,
+        2739: 6832, 2741: 6832, 2742: 6832, 2745: 6832,
+        2746: 6832, 2748: 6832, 2759: 6829, 2763: 6828,
+        2765: 6828, 2766: 6828, 2771: 6827, 2773: 6827,
+        2774: 6827, 2777: 6827, 2778: 6827, 2780: 6827,
+        2787: 6826, 2789: 6826, 2790: 6826, 2793: 6826,
+        2794: 6826, 2796: 6826, 2801: 6826, 2802: 6826,
+        2804: 6826, 2808: 1605, 2831: 6820, 2839: 6817,
+        2843: 6816, 2845: 6816, 2846: 6816, 2855: 6813,
+        2859: 6812, 2861: 6812, 2862: 6812, 2867: 6811,
+        2869: 6811, 2870: 6811, 2873: 6811, 2874: 6811,
+        2876: 6811, 2887: 6808, 2891: 6807, 2893: 6807,
+        2894: 6807, 2899: 6806, 2901: 6806, 2902: 6806,
+        2905: 6806, 2906: 6806, 2908: 6806, 2915: 6805,
+        2917: 6805, 2918: 6805, 2921: 6805, 2922: 6805,
+        2924: 6805, 2929: 6805, 2930: 6805, 2932: 6805,
+        2936: 6805, 2951: 6802, 2955: 6801, 2957: 6801,
+        2958: 6801, 2963: 6800, 2965: 6800, 2966: 6800,
+        2969: 6800, 2970: 6800, 2972: 6800, 2979: 6799,
+        2981: 6799, 2982: 6799, 2985: 6799, 2986: 6799,
+        2988: 6799, 2993: 6799, 2994: 6799, 2996: 6799,
+        3000: 6799, 3011: 6798, 3013: 6798, 3014: 6798,
+        3017: 6798, 3018: 6798, 3020: 6798, 3025: 6798,
+        3026: 6798, 3028: 6798, 3032: 6798, 3041: 1603,
+        3042: 1603, 3044: 1603, 3048: 1603, 3056: 1603,
+        3103: 1608, 3119: 6782, 3127: 6779, 3131: 6778,
+        3133: 6778, 3134: 1607, 3151: 6772, 3159: 6769,
+        3163: 6768, 3165: 6768, 3166: 6768, 3175: 6765,
+        3179: 6764, 3181: 6764, 3182: 6764, 3187: 6763,
+        3189: 6763, 3190: 6763, 3193: 6763, 3194: 6763,
+        3196: 1606, 3215: 6757, 3223: 6754, 3227: 6753,
+        3229: 6753, 3230: 6753, 3239: 6750, 3243: 6749,
+        3245: 6749, 3246: 6749, 3251: 6748, 3253: 6748,
+        3254: 6748, 3257: 6748, 3258: 6748, 3260: 6748,
+        3271: 6745, 3275: 6744, 3277: 6744, 3278: 6744,
+        3283: 6743, 3285: 6743, 3286: 6743, 3289: 6743,
+        3290: 6743, 3292: 6743, 3299: 6742, 3301: 6742,
+        3302: 6742, 3305: 6742, 3306: 6742, 3308: 6742,
+        3313: 6742, 3314: 6742, 3316: 6742, 3320: 1605,
+        3343: 6736, 3351: 6733, 3355: 6732, 3357: 6732,
+        3358: 6732, 3367: 6729, 3371: 6728, 3373: 6728,
+        3374: 6728, 3379: 6727, 3381: 6727, 3382: 6727,
+        3385: 6727, 3386: 6727, 3388: 6727, 3399: 6724,
+        3403: 6723, 3405: 6723, 3406: 6723, 3411: 6722,
+        3413: 6722, 3414: 6722, 3417: 6722, 3418: 6722,
+        3420: 6722, 3427: 6721, 3429: 6721, 3430: 6721,
+        3433: 6721, 3434: 6721, 3436: 6721, 3441: 6721,
+        3442: 6721, 3444: 6721, 3448: 6721, 3463: 6718,
+        3467: 6717, 3469: 6717, 3470: 6717, 3475: 6716,
+        3477: 6716, 3478: 6716, 3481: 6716, 3482: 6716,
+        3484: 6716, 3491: 6715, 3493: 6715, 3494: 6715,
+        3497: 6715, 3498: 6715, 3500: 6715, 3505: 6715,
+        3506: 6715, 3508: 6715, 3512: 6715, 3523: 6714,
+        3525: 6714, 3526: 6714, 3529: 6714, 3530: 6714,
+        3532: 6714, 3537: 6714, 3538: 6714, 3540: 6714,
+        3544: 6714, 3553: 6714, 3554: 6714, 3556: 6714,
+        3560: 6714, 3568: 1604, 3599: 6708, 3607: 6705,
+        3611: 6704, 3613: 6704, 3614: 6704, 3623: 6701,
+        3627: 6700, 3629: 6700, 3630: 6700, 3635: 6699,
+        3637: 6699, 3638: 6699, 3641: 6699, 3642: 6699,
+        3644: 6699, 3655: 6696, 3659: 6695, 3661: 6695,
+        3662: 6695, 3667: 6694, 3669: 6694, 3670: 6694,
+        3673: 6694, 3674: 6694, 3676: 6694, 3683: 6693,
+        3685: 6693, 3686: 6693, 3689: 6693, 3690: 6693,
+        3692: 6693, 3697: 6693, 3698: 6693, 3700: 6693,
+        3704: 6693, 3719: 6690, 3723: 6689, 3725: 6689,
+        3726: 6689, 3731: 6688, 3733: 6688, 3734: 6688,
+        3737: 6688, 3738: 6688, 3740: 6688, 3747: 6687,
+        3749: 6687, 3750: 6687, 3753: 6687, 3754: 6687,
+        3756: 6687, 3761: 6687, 3762: 6687, 3764: 6687,
+        3768: 6687, 3779: 6686, 3781: 6686, 3782: 6686,
+        3785: 6686, 3786: 6686, 3788: 6686, 3793: 6686,
+        3794: 6686, 3796: 6686, 3800: 6686, 3809: 6686,
+        3810: 6686, 3812: 6686, 3816: 6686, 3824: 6686,
+        3847: 6683, 3851: 6682, 3853: 6682, 3854: 6682,
+        3859: 6681, 3861: 6681, 3862: 6681, 3865: 6681,
+        3866: 6681, 3868: 6681, 3875: 6680, 3877: 6680,
+        3878: 6680, 3881: 6680, 3882: 6680, 3884: 6680,
+        3889: 6680, 3890: 6680, 3892: 6680, 3896: 6680,
+        3907: 6679, 3909: 6679, 3910: 6679, 3913: 6679,
+        3914: 6679, 3916: 6679, 3921: 6679, 3922: 6679,
+        3924: 6679, 3928: 6679, 3937: 6679, 3938: 6679,
+        3940: 6679, 3944: 6679, 3952: 6679, 3971: 1601,
+        3973: 1601, 3974: 1601, 3977: 1601, 3978: 1601,
+        3980: 1601, 3985: 1601, 3986: 1601, 3988: 1601,
+        3992: 1601, 4001: 1601, 4002: 1601, 4004: 1601,
+        4008: 1601, 4016: 1601, 4033: 1601, 4034: 1601,
+        4036: 1601, 4040: 1601, 4048: 1601, 4064: 1601,
+        4159: 1607, 4191: 1608, 4207: 1609, 4215: 6646,
+        4219: 6645, 4221: 1606, 4222: 1606, 4255: 1608,
+        4271: 1609, 4279: 6626, 4283: 6625, 4285: 6625,
+        4286: 1607, 4303: 1609, 4311: 6616, 4315: 6615,
+        4317: 6615, 4318: 6615, 4327: 6612, 4331: 6611,
+        4333: 6611, 4334: 6611, 4339: 6610, 4341: 6610,
+        4342: 6610, 4345: 1605, 4346: 1605, 4348: 1605,
+        4383: 1608, 4399: 1609, 4407: 6591, 4411: 6590,
+        4413: 6590, 4414: 1607, 4431: 1609, 4439: 6581,
+        4443: 6580, 4445: 6580, 4446: 6580, 4455: 6577,
+        4459: 6576, 4461: 6576, 4462: 6576, 4467: 6575,
+        4469: 6575, 4470: 6575, 4473: 6575, 4474: 6575,
+        4476: 1606, 4495: 1609, 4503: 6566, 4507: 6565,
+        4509: 6565, 4510: 6565, 4519: 6562, 4523: 6561,
+        4525: 6561, 4526: 6561, 4531: 6560, 4533: 6560,
+        4534: 6560, 4537: 6560, 4538: 6560, 4540: 6560,
+        4551: 6557, 4555: 6556, 4557: 6556, 4558: 6556,
+        4563: 6555, 4565: 6555, 4566: 6555, 4569: 6555,
+        4570: 6555, 4572: 6555, 4579: 6554, 4581: 6554,
+        4582: 6554, 4585: 6554, 4586: 6554, 4588: 6554,
+        4593: 1604, 4594: 1604, 4596: 1604, 4600: 1604,
+        4639: 1608, 4655: 1609, 4663: 6535, 4667: 6534,
+        4669: 6534, 4670: 1607, 4687: 1609, 4695: 6525,
+        4699: 6524, 4701: 6524, 4702: 6524, 4711: 6521,
+        4715: 6520, 4717: 6520, 4718: 6520, 4723: 6519,
+        4725: 6519, 4726: 6519, 4729: 6519, 4730: 6519,
+        4732: 1606, 4751: 1609, 4759: 6510, 4763: 6509,
+        4765: 6509, 4766: 6509, 4775: 6506, 4779: 6505,
+        4781: 6505, 4782: 6505, 4787: 6504, 4789: 6504,
+        4790: 6504, 4793: 6504, 4794: 6504, 4796: 6504,
+        4807: 6501, 4811: 6500, 4813: 6500, 4814: 6500,
+        4819: 6499, 4821: 6499, 4822: 6499, 4825: 6499,
+        4826: 6499, 4828: 6499, 4835: 6498, 4837: 6498,
+        4838: 6498, 4841: 6498, 4842: 6498, 4844: 6498,
+        4849: 6498, 4850: 6498, 4852: 6498, 4856: 1605,
+        4879: 1609, 4887: 6489, 4891: 6488, 4893: 6488,
+        4894: 6488, 4903: 6485, 4907: 6484, 4909: 6484,
+        4910: 6484, 4915: 6483, 4917: 6483, 4918: 6483,
+        4921: 6483, 4922: 6483, 4924: 6483, 4935: 6480,
+        4939: 6479, 4941: 6479, 4942: 6479, 4947: 6478,
+        4949: 6478, 4950: 6478, 4953: 6478, 4954: 6478,
+        4956: 6478, 4963: 6477, 4965: 6477, 4966: 6477,
+        4969: 6477, 4970: 6477, 4972: 6477, 4977: 6477,
+        4978: 6477, 4980: 6477, 4984: 6477, 4999: 6474,
+        5003: 6473, 5005: 6473, 5006: 6473, 5011: 6472,
+        5013: 6472, 5014: 6472, 5017: 6472, 5018: 6472,
+        5020: 6472, 5027: 6471, 5029: 6471, 5030: 6471,
+        5033: 6471, 5034: 6471, 5036: 6471, 5041: 6471,
+        5042: 6471, 5044: 6471, 5048: 6471, 5059: 6470,
+        5061: 6470, 5062: 6470, 5065: 6470, 5066: 6470,
+        5068: 6470, 5073: 6470, 5074: 6470, 5076: 6470,
+        5080: 6470, 5089: 1603, 5090: 1603, 5092: 1603,
+        5096: 1603, 5104: 1603, 5151: 1608, 5167: 1609,
+        5175: 6451, 5179: 6450, 5181: 6450, 5182: 1607,
+        5199: 1609, 5207: 6441, 5211: 6440, 5213: 6440,
+        5214: 6440, 5223: 6437, 5227: 6436, 5229: 6436,
+        5230: 6436, 5235: 6435, 5237: 6435, 5238: 6435,
+        5241: 6435, 5242: 6435, 5244: 1606, 5263: 1609,
+        5271: 6426, 5275: 6425, 5277: 6425, 5278: 6425,
+        5287: 6422, 5291: 6421, 5293: 6421, 5294: 6421,
+        5299: 6420, 5301: 6420, 5302: 6420, 5305: 6420,
+        5306: 6420, 5308: 6420, 5319: 6417, 5323: 6416,
+        5325: 6416, 5326: 6416, 5331: 6415, 5333: 6415,
+        5334: 6415, 5337: 6415, 5338: 6415, 5340: 6415,
+        5347: 6414, 5349: 6414, 5350: 6414, 5353: 6414,
+        5354: 6414, 5356: 6414, 5361: 6414, 5362: 6414,
+        5364: 6414, 5368: 1605, 5391: 1609, 5399: 6405,
+        5403: 6404, 5405: 6404, 5406: 6404, 5415: 6401,
+        5419: 6400, 5421: 6400, 5422: 6400, 5427: 6399,
+        5429: 6399, 5430: 6399, 5433: 6399, 5434: 6399,
+        5436: 6399, 5447: 6396, 5451: 6395, 5453: 6395,
+        5454: 6395, 5459: 6394, 5461: 6394, 5462: 6394,
+        5465: 6394, 5466: 6394, 5468: 6394, 5475: 6393,
+        5477: 6393, 5478: 6393, 5481: 6393, 5482: 6393,
+        5484: 6393, 5489: 6393, 5490: 6393, 5492: 6393,
+        5496: 6393, 5511: 6390, 5515: 6389, 5517: 6389,
+        5518: 6389, 5523: 6388, 5525: 6388, 5526: 6388,
+        5529: 6388, 5530: 6388, 5532: 6388, 5539: 6387,
+        5541: 6387, 5542: 6387, 5545: 6387, 5546: 6387,
+        5548: 6387, 5553: 6387, 5554: 6387, 5556: 6387,
+        5560: 6387, 5571: 6386, 5573: 6386, 5574: 6386,
+        5577: 6386, 5578: 6386, 5580: 6386, 5585: 6386,
+        5586: 6386, 5588: 6386, 5592: 6386, 5601: 6386,
+        5602: 6386, 5604: 6386, 5608: 6386, 5616: 1604,
+        5647: 1609, 5655: 6377, 5659: 6376, 5661: 6376,
+        5662: 6376, 5671: 6373, 5675: 6372, 5677: 6372,
+        5678: 6372, 5683: 6371, 5685: 6371, 5686: 6371,
+        5689: 6371, 5690: 6371, 5692: 6371, 5703: 6368,
+        5707: 6367, 5709: 6367, 5710: 6367, 5715: 6366,
+        5717: 6366, 5718: 6366, 5721: 6366, 5722: 6366,
+        5724: 6366, 5731: 6365, 5733: 6365, 5734: 6365,
+        5737: 6365, 5738: 6365, 5740: 6365, 5745: 6365,
+        5746: 6365, 5748: 6365, 5752: 6365, 5767: 6362,
+        5771: 6361, 5773: 6361, 5774: 6361, 5779: 6360,
+        5781: 6360, 5782: 6360, 5785: 6360, 5786: 6360,
+        5788: 6360, 5795: 6359, 5797: 6359, 5798: 6359,
+        5801: 6359, 5802: 6359, 5804: 6359, 5809: 6359,
+        5810: 6359, 5812: 6359, 5816: 6359, 5827: 6358,
+        5829: 6358, 5830: 6358, 5833: 6358, 5834: 6358,
+        5836: 6358, 5841: 6358, 5842: 6358, 5844: 6358,
+        5848: 6358, 5857: 6358, 5858: 6358, 5860: 6358,
+        5864: 6358, 5872: 6358, 5895: 6355, 5899: 6354,
+        5901: 6354, 5902: 6354, 5907: 6353, 5909: 6353,
+        5910: 6353, 5913: 6353, 5914: 6353, 5916: 6353,
+        5923: 6352, 5925: 6352, 5926: 6352, 5929: 6352,
+        5930: 6352, 5932: 6352, 5937: 6352, 5938: 6352,
+        5940: 6352, 5944: 6352, 5955: 6351, 5957: 6351,
+        5958: 6351, 5961: 6351, 5962: 6351, 5964: 6351,
+        5969: 6351, 5970: 6351, 5972: 6351, 5976: 6351,
+        5985: 6351, 5986: 6351, 5988: 6351, 5992: 6351,
+        6000: 6351, 6019: 6350, 6021: 6350, 6022: 6350,
+        6025: 6350, 6026: 6350, 6028: 6350, 6033: 6350,
+        6034: 6350, 6036: 6350, 6040: 6350, 6049: 6350,
+        6050: 6350, 6052: 6350, 6056: 6350, 6064: 6350,
+        6081: 1602, 6082: 1602, 6084: 1602, 6088: 1602,
+        6096: 1602, 6112: 1602, 6175: 1608, 6191: 1609,
+        6199: 6331, 6203: 6330, 6205: 6330, 6206: 1607,
+        6223: 1609, 6231: 6321, 6235: 6320, 6237: 6320,
+        6238: 6320, 6247: 6317, 6251: 6316, 6253: 6316,
+        6254: 6316, 6259: 6315, 6261: 6315, 6262: 6315,
+        6265: 6315, 6266: 6315, 6268: 1606, 6287: 1609,
+        6295: 6306, 6299: 6305, 6301: 6305, 6302: 6305,
+        6311: 6302, 6315: 6301, 6317: 6301, 6318: 6301,
+        6323: 6300, 6325: 6300, 6326: 6300, 6329: 6300,
+        6330: 6300, 6332: 6300, 6343: 6297, 6347: 6296,
+        6349: 6296, 6350: 6296, 6355: 6295, 6357: 6295,
+        6358: 6295, 6361: 6295, 6362: 6295, 6364: 6295,
+        6371: 6294, 6373: 6294, 6374: 6294, 6377: 6294,
+        6378: 6294, 6380: 6294, 6385: 6294, 6386: 6294,
+        6388: 6294, 6392: 1605, 6415: 1609, 6423: 6285,
+        6427: 6284, 6429: 6284, 6430: 6284, 6439: 6281,
+        6443: 6280, 6445: 6280, 6446: 6280, 6451: 6279,
+        6453: 6279, 6454: 6279, 6457: 6279, 6458: 6279,
+        6460: 6279, 6471: 6276, 6475: 6275, 6477: 6275,
+        6478: 6275, 6483: 6274, 6485: 6274, 6486: 6274,
+        6489: 6274, 6490: 6274, 6492: 6274, 6499: 6273,
+        6501: 6273, 6502: 6273, 6505: 6273, 6506: 6273,
+        6508: 6273, 6513: 6273, 6514: 6273, 6516: 6273,
+        6520: 6273, 6535: 6270, 6539: 6269, 6541: 6269,
+        6542: 6269, 6547: 6268, 6549: 6268, 6550: 6268,
+        6553: 6268, 6554: 6268, 6556: 6268, 6563: 6267,
+        6565: 6267, 6566: 6267, 6569: 6267, 6570: 6267,
+        6572: 6267, 6577: 6267, 6578: 6267, 6580: 6267,
+        6584: 6267, 6595: 6266, 6597: 6266, 6598: 6266,
+        6601: 6266, 6602: 6266, 6604: 6266, 6609: 6266,
+        6610: 6266, 6612: 6266, 6616: 6266, 6625: 6266,
+        6626: 6266, 6628: 6266, 6632: 6266, 6640: 1604,
+        6671: 1609, 6679: 6257, 6683: 6256, 6685: 6256,
+        6686: 6256, 6695: 6253, 6699: 6252, 6701: 6252,
+        6702: 6252, 6707: 6251, 6709: 6251, 6710: 6251,
+        6713: 6251, 6714: 6251, 6716: 6251, 6727: 6248,
+        6731: 6247, 6733: 6247, 6734: 6247, 6739: 6246,
+        6741: 6246, 6742: 6246, 6745: 6246, 6746: 6246,
+        6748: 6246, 6755: 6245, 6757: 6245, 6758: 6245,
+        6761: 6245, 6762: 6245, 6764: 6245, 6769: 6245,
+        6770: 6245, 6772: 6245, 6776: 6245, 6791: 6242,
+        6795: 6241, 6797: 6241, 6798: 6241, 6803: 6240,
+        6805: 6240, 6806: 6240, 6809: 6240, 6810: 6240,
+        6812: 6240, 6819: 6239, 6821: 6239, 6822: 6239,
+        6825: 6239, 6826: 6239, 6828: 6239, 6833: 6239,
+        6834: 6239, 6836: 6239, 6840: 6239, 6851: 6238,
+        6853: 6238, 6854: 6238, 6857: 6238, 6858: 6238,
+        6860: 6238, 6865: 6238, 6866: 6238, 6868: 6238,
+        6872: 6238, 6881: 6238, 6882: 6238, 6884: 6238,
+        6888: 6238, 6896: 6238, 6919: 6235, 6923: 6234,
+        6925: 6234, 6926: 6234, 6931: 6233, 6933: 6233,
+        6934: 6233, 6937: 6233, 6938: 6233, 6940: 6233,
+        6947: 6232, 6949: 6232, 6950: 6232, 6953: 6232,
+        6954: 6232, 6956: 6232, 6961: 6232, 6962: 6232,
+        6964: 6232, 6968: 6232, 6979: 6231, 6981: 6231,
+        6982: 6231, 6985: 6231, 6986: 6231, 6988: 6231,
+        6993: 6231, 6994: 6231, 6996: 6231, 7000: 6231,
+        7009: 6231, 7010: 6231, 7012: 6231, 7016: 6231,
+        7024: 6231, 7043: 6230, 7045: 6230, 7046: 6230,
+        7049: 6230, 7050: 6230, 7052: 6230, 7057: 6230,
+        7058: 6230, 7060: 6230, 7064: 6230, 7073: 6230,
+        7074: 6230, 7076: 6230, 7080: 6230, 7088: 6230,
+        7105: 6230, 7106: 6230, 7108: 6230, 7112: 6230,
+        7120: 6230, 7136: 1603, 7183: 1609, 7191: 6221,
+        7195: 6220, 7197: 6220, 7198: 6220, 7207: 6217,
+        7211: 6216, 7213: 6216, 7214: 6216, 7219: 6215,
+        7221: 6215, 7222: 6215, 7225: 6215, 7226: 6215,
+        7228: 6215, 7239: 6212, 7243: 6211, 7245: 6211,
+        7246: 6211, 7251: 6210, 7253: 6210, 7254: 6210,
+        7257: 6210, 7258: 6210, 7260: 6210, 7267: 6209,
+        7269: 6209, 7270: 6209, 7273: 6209, 7274: 6209,
+        7276: 6209, 7281: 6209, 7282: 6209, 7284: 6209,
+        7288: 6209, 7303: 6206, 7307: 6205, 7309: 6205,
+        7310: 6205, 7315: 6204, 7317: 6204, 7318: 6204,
+        7321: 6204, 7322: 6204, 7324: 6204, 7331: 6203,
+        7333: 6203, 7334: 6203, 7337: 6203, 7338: 6203,
+        7340: 6203, 7345: 6203, 7346: 6203, 7348: 6203,
+        7352: 6203, 7363: 6202, 7365: 6202, 7366: 6202,
+        7369: 6202, 7370: 6202, 7372: 6202, 7377: 6202,
+        7378: 6202, 7380: 6202, 7384: 6202, 7393: 6202,
+        7394: 6202, 7396: 6202, 7400: 6202, 7408: 6202,
+        7431: 6199, 7435: 6198, 7437: 6198, 7438: 6198,
+        7443: 6197, 7445: 6197, 7446: 6197, 7449: 6197,
+        7450: 6197, 7452: 6197, 7459: 6196, 7461: 6196,
+        7462: 6196, 7465: 6196, 7466: 6196, 7468: 6196,
+        7473: 6196, 7474: 6196, 7476: 6196, 7480: 6196,
+        7491: 6195, 7493: 6195, 7494: 6195, 7497: 6195,
+        7498: 6195, 7500: 6195, 7505: 6195, 7506: 6195,
+        7508: 6195, 7512: 6195, 7521: 6195, 7522: 6195,
+        7524: 6195, 7528: 6195, 7536: 6195, 7555: 6194,
+        7557: 6194, 7558: 6194, 7561: 6194, 7562: 6194,
+        7564: 6194, 7569: 6194, 7570: 6194, 7572: 6194,
+        7576: 6194, 7585: 6194, 7586: 6194, 7588: 6194,
+        7592: 6194, 7600: 6194, 7617: 6194, 7618: 6194,
+        7620: 6194, 7624: 6194, 7632: 6194, 7648: 6194,
+        7687: 6191, 7691: 6190, 7693: 6190, 7694: 6190,
+        7699: 6189, 7701: 6189, 7702: 6189, 7705: 6189,
+        7706: 6189, 7708: 6189, 7715: 6188, 7717: 6188,
+        7718: 6188, 7721: 6188, 7722: 6188, 7724: 6188,
+        7729: 6188, 7730: 6188, 7732: 6188, 7736: 6188,
+        7747: 6187, 7749: 6187, 7750: 6187, 7753: 6187,
+        7754: 6187, 7756: 6187, 7761: 6187, 7762: 6187,
+        7764: 6187, 7768: 6187, 7777: 6187, 7778: 6187,
+        7780: 6187, 7784: 6187, 7792: 6187, 7811: 6186,
+        7813: 6186, 7814: 6186, 7817: 6186, 7818: 6186,
+        7820: 6186, 7825: 6186, 7826: 6186, 7828: 6186,
+        7832: 6186, 7841: 6186, 7842: 6186, 7844: 6186,
+        7848: 6186, 7856: 6186, 7873: 6186, 7874: 6186,
+        7876: 6186, 7880: 6186, 7888: 6186, 7904: 6186,
+        7939: 1600, 7941: 1600, 7942: 1600, 7945: 1600,
+        7946: 1600, 7948: 1600, 7953: 1600, 7954: 1600,
+        7956: 1600, 7960: 1600, 7969: 1600, 7970: 1600,
+        7972: 1600, 7976: 1600, 7984: 1600, 8001: 1600,
+        8002: 1600, 8004: 1600, 8008: 1600, 8016: 1600,
+        8032: 1600, 8065: 1600, 8066: 1600, 8068: 1600,
+        8072: 1600, 8080: 1600, 8096: 1600, 8128: 1600
+    }
+    prime_products_to_rank = PerfectHash(5366,
+        [
+            0, 2, 106, 1, 21, 16, 100, 293, 48, 17, 128, 13,
+            120, 80, 136, 8, 16, 170, 67, 15, 38, 3, 34, 5,
+            46, 29, 0, 4, 18, 36, 131, 10, 17, 12, 40, 4,
+            116, 1, 21, 2, 3, 95, 44, 7, 9, 8, 213, 1,
+            5, 6, 12, 12, 7, 25, 69, 107, 0, 5, 6, 38,
+            21, 21, 17, 9, 8, 14, 47, 9, 9, 1, 69, 7,
+            7, 2, 27, 4, 2, 9, 24, 41, 2, 59, 38, 1,
+            30, 6, 26, 6, 28, 5, 0, 119, 120, 73, 7, 5,
+            171, 3, 0, 1, 2, 16, 115, 27, 151, 35, 56, 16,
+            5, 9, 190, 19, 44, 5, 9, 5, 329, 3, 279, 2,
+            108, 5, 47, 7, 76, 127, 278, 4, 81, 3, 109, 14,
+            204, 23, 69, 78, 37, 1, 91, 5, 113, 12, 59, 75,
+            245, 3, 47, 139, 15, 16, 58, 10, 62, 5, 13, 148,
+            85, 3, 35, 2, 66, 9, 141, 37, 166, 2, 10, 36,
+            17, 281, 128, 39, 7, 6, 197, 16, 12, 185, 12, 46,
+            54, 19, 621, 11, 4, 4, 131, 31, 2, 1, 99, 9,
+            5, 35, 41, 4, 28, 2, 194, 160, 20, 15, 0, 1,
+            18, 65, 10, 8, 45, 6, 120, 74, 89, 3, 18, 8,
+            51, 5, 8, 1, 73, 6, 32, 9, 39, 48, 19, 4,
+            32, 2, 49, 11, 0, 48, 83, 257, 136, 1, 168, 8,
+            70, 69, 140, 2, 29, 21, 35, 69, 3, 212, 31, 16,
+            49, 2, 0, 24, 120, 10, 158, 1, 178, 3, 234, 25,
+            62, 27, 11, 4, 48, 3, 71, 43, 16, 86, 34, 6,
+            146, 10, 3, 15, 17, 10, 20, 1, 1, 211, 17, 19,
+            49, 8, 2, 26, 0, 6, 326, 84, 114, 26, 196, 69,
+            10, 57, 75, 8, 12, 18, 8, 37, 93, 4, 17, 36,
+            262, 19, 44, 1, 13, 2, 208, 2, 1, 24, 267, 5,
+            51, 2, 269, 9, 40, 374, 21, 3, 0, 11, 236, 54,
+            4, 24, 79, 157, 27, 166, 46, 180, 284, 24, 196, 3,
+            30, 5, 0, 5, 64, 6, 17, 1, 146, 3, 251, 26,
+            54, 69, 27, 87, 165, 204, 76, 21, 8, 80, 312, 19,
+            140, 5, 41, 15, 15, 63, 74, 3, 42, 59, 69, 23,
+            12, 3, 168, 18, 274, 1, 17, 6, 100, 2, 122, 6,
+            24, 6, 4, 12, 48, 2, 16, 82, 0, 12, 519, 81,
+            429, 7, 395, 8, 64, 318, 152, 55, 135, 31, 33, 79,
+            1, 4, 372, 75, 22, 13, 272, 2, 55, 2, 31, 8,
+            52, 57, 47, 249, 31, 32, 196, 129, 127, 14, 110, 7,
+            182, 5, 118, 4, 26, 5, 20, 15, 122, 2, 83, 22,
+            212, 10, 32, 4, 78, 3, 84, 2, 77, 14, 43, 2,
+            459, 35, 158, 66, 111, 2, 5, 33, 82, 30, 76, 16,
+            1, 10, 152, 104, 31, 564, 0, 68, 172, 5, 101, 37,
+            32, 1, 304, 20, 261, 4, 46, 53, 61, 4, 12, 24,
+            88, 119, 11, 2, 60, 1, 133, 13, 17, 52, 49, 20,
+            94, 33, 57, 62, 289, 2, 0, 1, 106, 75, 4, 14,
+            143, 35, 81, 66, 488, 17, 119, 21, 16, 13, 77, 5,
+            49, 22, 409, 6, 275, 83, 12, 7, 266, 1, 0, 10,
+            192, 1, 98, 10, 15, 31, 0, 56, 17, 1, 41, 3,
+            287, 1, 5, 2, 0, 37, 68, 4, 112, 28, 27, 5,
+            21, 4, 0, 2, 42, 61, 26, 54, 58, 29, 547, 3,
+            97, 7, 12, 2, 42, 2, 23, 144, 142, 6, 15, 55,
+            76, 75, 41, 5, 109, 8, 80, 56, 45, 9, 63, 51,
+            0, 3, 48, 206, 0, 13, 1, 108, 211, 1, 3, 6,
+            2, 1, 7, 79, 0, 7, 33, 3, 149, 1, 85, 20,
+            20, 16, 3, 5, 158, 46, 216, 5, 80, 5, 0, 15,
+            27, 13, 12, 89, 88, 7, 9, 2, 12, 87, 135, 50,
+            5, 5, 22, 1, 6, 29, 0, 6, 103, 8, 607, 54,
+            46, 159, 104, 171, 72, 213, 22, 64, 380, 22, 53, 8,
+            0, 43, 106, 12, 151, 7, 5, 15, 38, 6, 166, 6,
+            157, 6, 126, 77, 20, 223, 874, 8, 26, 14, 0, 74,
+            173, 1, 14, 6, 11, 9, 194, 1, 19, 43, 11, 10,
+            5, 15, 5, 54, 84, 6, 46, 12, 339, 105, 156, 5,
+            10, 2, 1, 23, 269, 7, 32, 25, 212, 1, 261, 18,
+            610, 7, 43, 253, 10, 6, 33, 95, 0, 6, 10, 16,
+            111, 12, 10, 1, 2, 10, 230, 1, 396, 9, 146, 7,
+            0, 4, 4, 47, 0, 36, 34, 2, 50, 9, 33, 6,
+            6, 1, 85, 76, 30, 29, 220, 1, 419, 5, 39, 6,
+            35, 89, 156, 1, 136, 4, 126, 222, 85, 10, 58, 17,
+            165, 19, 98, 219, 39, 41, 63, 46, 96, 2, 156, 9,
+            81, 150, 202, 13, 37, 1, 9, 6, 40, 34, 42, 2,
+            28, 23, 0, 27, 204, 11, 45, 68, 108, 71, 279, 3,
+            157, 73, 64, 5, 32, 4, 10, 55, 430, 3, 32, 3,
+            9, 5, 276, 82, 36, 17, 138, 207, 67, 94, 118, 67,
+            230, 90, 9, 15, 121, 1, 20, 4, 8, 2, 31, 2,
+            39, 1, 8, 27, 20, 42, 366, 255, 28, 19, 17, 2,
+            23, 16, 523, 5, 27, 157, 10, 7, 346, 38, 219, 22,
+            130, 2, 19, 278, 202, 5, 62, 3, 73, 8, 22, 13,
+            32, 6, 16, 31, 33, 10, 1036, 1, 80, 1, 334, 6,
+            400, 9, 0, 11, 375, 2, 0, 2, 3, 73, 145, 4,
+            9, 108, 97, 113, 219, 28, 431, 4, 35, 14, 909, 5,
+            59, 171, 180, 6, 200, 21, 66, 1, 75, 4, 0, 21,
+            27, 0, 41, 40, 232, 7, 343, 36, 141, 24, 232, 28,
+            88, 57, 105, 20, 18, 12, 63, 63, 8, 15, 225, 171,
+            193, 11, 76, 191, 33, 28, 54, 32, 27, 4, 6, 1,
+            241, 4, 396, 19, 323, 37, 69, 0, 223, 85, 42, 21,
+            285, 25, 351, 157, 37, 41, 18, 1, 36, 1, 90, 5,
+            60, 3, 22, 1, 0, 67, 59, 8, 138, 3, 715, 1,
+            132, 21, 207, 25, 283, 26, 190, 4, 465, 9, 114, 19,
+            0, 7, 9, 2, 54, 102, 89, 6, 517, 25, 0, 12,
+            59, 42, 0, 79, 31, 20, 21, 69, 113, 7, 121, 7,
+            179, 2, 0, 13, 0, 2, 50, 1, 11, 7, 0, 30,
+            14, 96, 363, 144, 4, 3, 2, 13, 3, 206, 43, 1,
+            56, 6, 114, 1, 215, 36, 13, 33, 108, 14, 22, 117,
+            151, 14, 11, 91, 3, 38, 472, 346, 46, 19, 29, 11,
+            81, 48, 30, 12, 210, 34, 248, 9, 231, 1, 401, 4,
+            25, 4, 43, 19, 844, 20, 63, 9, 16, 3, 0, 61,
+            256, 44, 51, 7, 0, 16, 817, 4, 40, 97, 142, 922,
+            171, 38, 26, 94, 83, 40, 1, 2, 2125, 4, 222, 5,
+            27, 106, 219, 1, 383, 59, 28, 3, 158, 15, 16, 19,
+            48, 13, 0, 15, 22, 10, 6, 5, 12, 71, 176, 68,
+            278, 5, 39, 18, 3, 6, 274, 3, 176, 42, 2, 10,
+            25, 4, 6, 72, 43, 35, 62, 1, 7, 7, 49, 133,
+            74, 6, 262, 30, 32, 11, 15, 6, 85, 2, 60, 1,
+            2392, 7, 68, 40, 71, 216, 18, 4, 181, 23, 1547, 13,
+            0, 99, 6, 83, 0, 172, 178, 5, 239, 62, 54, 69,
+            20, 127, 86, 21, 44, 2, 234, 139, 4, 114, 0, 2,
+            12, 56, 96, 1, 394, 7, 11, 27, 262, 1, 59, 67,
+            31, 48, 18, 5, 54, 5, 19, 11, 31, 34, 20, 193,
+            6, 3, 11, 6, 95, 10, 118, 1, 46, 4, 45, 290,
+            27, 5, 223, 3, 29, 32, 24, 68, 56, 26, 70, 40,
+            42, 33, 5, 6, 32, 16, 13, 22, 2048, 98, 1, 5,
+            173, 38, 76, 1, 33, 5, 165, 1, 1163, 26, 54, 14,
+            152, 2, 238, 7, 137, 36, 0, 6, 32, 31, 477, 14,
+            0, 1, 1, 3, 269, 12, 146, 4, 25, 13, 14, 8,
+            4, 62, 99, 3, 28, 12, 4, 41, 1561, 86, 3, 234,
+            273, 4, 224, 431, 73, 20, 4, 8, 21, 112, 67, 23,
+            19, 16, 797, 27, 80, 5, 0, 5, 61, 288, 722, 25,
+            13, 3, 222, 0, 13, 10, 93, 2, 31, 4, 44, 21,
+            7, 26, 0, 3, 0, 4, 460, 105, 25, 5, 69, 21,
+            14, 37, 176, 11, 195, 67, 141, 6, 83, 16, 172, 19,
+            30, 1, 1, 17, 6, 191, 16, 10, 41, 256, 449, 20,
+            0, 72, 12, 25, 65, 23, 57, 22, 98, 6, 54, 9,
+            69, 72, 44, 2, 219, 1, 69, 75, 39, 30, 10, 4,
+            99, 12, 11, 19, 20, 4, 1, 79, 18, 5, 22, 23,
+            0, 60, 217, 88, 1045, 336, 39, 456, 148, 2, 21, 9,
+            101, 6, 149, 18, 167, 10, 6, 107, 487, 86, 2177, 11,
+            19, 2, 8, 31, 35, 32, 33, 19, 2246, 101, 267, 3,
+            24, 1, 1, 10, 467, 3, 2, 85, 267, 3, 314, 80,
+            2063, 1, 18, 129, 113, 28, 18, 126, 5, 2, 41, 1,
+            45, 61, 0, 46, 16, 59, 7, 27, 13, 455, 208, 15,
+            154, 7, 0, 130, 1, 24, 58, 17, 48, 23, 2241, 63,
+            271, 172, 11, 1, 109, 3, 67, 5, 837, 1, 32, 50,
+            48, 21, 275, 4, 37, 6, 42, 4, 6, 5, 24, 16,
+            123, 33, 3, 23, 77, 17, 86, 5, 5, 4, 52, 3,
+            2225, 111, 4, 31, 76, 2, 0, 77, 49, 9, 89, 6,
+            0, 1, 129, 18, 203, 77, 69, 3, 57, 53, 55, 45,
+            21, 19, 283, 6, 629, 3, 19, 11, 266, 8, 56, 2,
+            281, 9, 25, 1573, 23, 3, 83, 2, 943, 34, 42, 47,
+            38, 93, 4, 55, 124, 3, 20, 55, 36, 52, 396, 21,
+            89, 166, 108, 6, 439, 5, 19, 23, 150, 221, 17, 15,
+            4, 1, 25, 28, 24, 25, 97, 102, 189, 11, 283, 327,
+            126, 18, 24, 158, 75, 168, 8, 7, 148, 15, 9, 34,
+            287, 2130, 263, 10, 77, 120, 17, 9, 39, 31, 110, 36,
+            35, 20, 7, 1, 165, 4, 237, 264, 138, 2, 176, 472,
+            147, 30, 280, 36, 2433, 124, 420, 65, 43, 8, 67, 8,
+            33, 16, 0, 238, 246, 17, 125, 18, 232, 142, 1, 6,
+            252, 111, 62, 49, 203, 9, 49, 9, 272, 10, 0, 6,
+            251, 130, 129, 4, 42, 31, 450, 6, 80, 3, 22, 535,
+            44, 51, 0, 129, 51, 8, 256, 2, 201, 1, 222, 14,
+            65, 88, 2, 21, 14, 57, 70, 37, 0, 66, 93, 55,
+            22, 23, 1056, 6, 53, 46, 145, 23, 14, 41, 41, 2,
+            283, 19, 164, 11, 4, 10, 526, 5, 230, 11, 49, 1,
+            79, 109, 1111, 19, 43, 13, 341, 317, 13, 22, 0, 64,
+            76, 19, 0, 4, 296, 5, 406, 137, 83, 61, 10, 1,
+            52, 2, 257, 7, 9, 32, 474, 68, 273, 195, 129, 14,
+            180, 7, 100, 118, 319, 89, 140, 19, 450, 259, 31, 1,
+            293, 31, 0, 7, 13, 20, 350, 1, 8, 20, 773, 2,
+            22, 2, 181, 21, 169, 5, 38, 44, 69, 78, 2738, 10,
+            517, 13, 0, 47, 51, 55, 431, 4, 80, 60, 12, 1,
+            16, 1, 516, 7, 39, 177, 367, 11, 175, 2, 0, 8,
+            792, 24, 250, 23, 61, 11, 201, 16, 213, 118, 25, 2,
+            7, 18, 10, 16, 112, 58, 208, 2, 126, 4, 333, 8,
+            2052, 5, 57, 9, 496, 17, 751, 57, 54, 9, 253, 1729,
+            527, 6, 347, 50, 14, 73, 0, 683, 271, 4, 105, 432,
+            23, 37, 238, 53, 686, 2, 0, 34, 0, 6, 35, 26,
+            135, 343, 224, 21, 643, 115, 63, 7, 182, 3, 20, 5,
+            102, 6, 155, 123, 15, 20, 2135, 16, 1283, 1, 13, 57,
+            1972, 100, 10, 1, 664, 19, 6, 7, 34, 151, 229, 70,
+            144, 6, 447, 10, 579, 81, 388, 1, 27, 102, 116, 14,
+            0, 26, 12, 1, 381, 17, 267, 2, 173, 6, 117, 1,
+            25, 158, 78, 26, 0, 4, 380, 11, 231, 3, 265, 7,
+            154, 36, 49, 4, 683, 84, 129, 197, 86, 4, 88, 2,
+            3084, 72, 407, 1, 377, 67, 0, 3, 100, 4, 83, 1,
+            10, 2, 268, 19, 130, 1, 409, 16, 91, 153, 743, 10,
+            30, 106, 385, 5, 0, 46, 291, 133, 353, 29, 115, 32,
+            365, 20, 0, 70, 77, 16, 42, 220, 27, 4, 28, 32,
+            68, 1, 71, 10, 11, 5, 104, 225, 408, 5, 11, 1,
+            205, 32, 24, 2, 529, 45, 1148, 16, 193, 22, 10, 11,
+            14, 2, 0, 3, 117, 17, 650, 235, 3, 15, 77, 17,
+            0, 27, 581, 10, 167, 7, 268, 126, 82, 37, 337, 2,
+            182, 3, 135, 18, 437, 9, 67, 31, 225, 3, 284, 70,
+            94, 2, 11, 36, 43, 146, 171, 46, 43, 97, 603, 3,
+            38, 13, 92, 13, 146, 35, 494, 5, 14, 9, 612, 13,
+            171, 14, 85, 41, 2054, 1, 558, 19, 532, 2, 355, 32,
+            2407, 4, 159, 605, 36, 11, 313, 64, 143, 2, 300, 3,
+            207, 130, 87, 97, 32, 27, 2191, 2, 0, 7, 723, 70,
+            72, 2, 453, 62, 553, 704, 27, 33, 3, 6, 176, 3,
+            21, 45, 16, 101, 200, 15, 253, 12, 111, 568, 60, 2,
+            27, 107, 175, 31, 137, 75, 44, 25, 174, 4, 1472, 20,
+            527, 4, 244, 20, 21, 2, 27, 112, 258, 1, 109, 16,
+            265, 15, 690, 5, 168, 18, 938, 215, 9, 5, 165, 2,
+            689, 23, 0, 3, 7, 44, 149, 4, 224, 1, 1490, 2,
+            2002, 23, 1865, 4, 217, 259, 7, 22, 89, 9, 108, 63,
+            256, 98, 536, 3, 2591, 66, 289, 4, 265, 23, 2188, 5,
+            77, 11, 281, 9, 477, 345, 181, 21, 409, 697, 161, 92,
+            530, 64, 0, 4, 52, 27, 134, 100, 6, 538, 253, 7,
+            18, 2, 25, 16, 598, 38, 688, 10, 385, 1, 254, 307,
+            359, 267, 172, 34, 117, 515, 55, 76, 332, 1, 11, 730,
+            62, 3, 679, 170, 44, 88, 2431, 123, 0, 55, 1024, 6,
+            583, 7, 32, 40, 20, 13, 355, 59, 0, 1, 215, 17,
+            2329, 8, 17, 22, 136, 2, 135, 23, 500, 10, 100, 1,
+            324, 96, 77, 99, 512, 48, 12, 239, 184, 8, 192, 109,
+            239, 261, 273, 117, 34, 5, 183, 21, 1063, 121, 667, 93,
+            183, 47, 2638, 6, 221, 49, 118, 1, 61, 11, 88, 50,
+            53, 37, 139, 2, 441, 57, 106, 1, 2166, 47, 8, 75,
+            816, 2, 175, 4, 261, 4, 38, 18, 766, 7, 57, 3,
+            110, 69, 313, 246, 29, 36, 15, 61, 197, 18, 27, 308,
+            30, 110, 87, 2, 63, 26, 38, 115, 28, 19, 47, 2,
+            627, 158, 225, 26, 47, 195, 119, 2, 152, 26, 816, 261,
+            188, 73, 106, 25, 60, 3, 133, 1, 100, 119, 35, 35,
+            271, 366, 85, 32, 0, 6, 36, 21, 278, 324, 252, 54,
+            67, 38, 71, 38, 305, 5, 250, 4, 218, 161, 19, 35,
+            28, 18, 163, 2, 0, 50, 4167, 17, 0, 82, 92, 28,
+            79, 71, 842, 5, 971, 28, 969, 2, 56, 28, 322, 5,
+            307, 113, 99, 90, 1279, 2, 646, 67, 100, 14, 47, 2,
+            445, 4, 214, 38, 111, 28, 86, 1, 82, 2, 113, 26,
+            253, 301, 59, 95, 8, 85, 279, 3, 3, 1, 331, 94,
+            34, 12, 45, 122, 297, 36, 13, 40, 17, 1, 604, 23,
+            54, 62, 4733, 166, 10, 334, 10, 33, 183, 16, 321, 2,
+            21, 58, 124, 24, 38, 128, 45, 234, 31, 21, 84, 1,
+            288, 9, 138, 29, 1382, 11, 2311, 64, 1, 1, 0, 32,
+            1115, 80, 417, 38, 0, 5, 1792, 12, 526, 36, 4197, 10,
+            326, 5, 1160, 158, 88, 144, 4987, 21, 41, 3, 76, 15,
+            267, 8, 80, 31, 493, 2, 41, 8, 4135, 3, 168, 105,
+            4, 3, 141, 11, 2172, 31, 645, 0, 32, 39, 60, 2,
+            306, 5, 344, 12, 5750, 1, 830, 347, 259, 7, 148, 26,
+            199, 188, 4272, 35, 267, 532, 0, 33, 9, 14, 4, 1,
+            1167, 70, 1502, 185, 393, 1, 2, 2, 0, 13, 538, 21,
+            390, 65, 216, 59, 113, 9, 38, 14, 17, 101, 1592, 27,
+            302, 7, 18, 109, 0, 22, 53, 22, 1049, 1, 57, 11,
+            3, 77, 8370, 16, 1047, 121, 4130, 7, 2069, 37, 9, 9,
+            544, 241, 322, 39, 46, 3, 63, 8, 3, 36, 6, 3,
+            304, 31, 19, 34, 69, 18, 362, 1, 1065, 4, 5204, 500,
+            176, 121, 723, 4, 35, 257, 263, 16, 1767, 3, 8386, 81,
+            0, 2, 183, 892, 8, 2, 451, 778, 7, 188, 87, 25,
+            205, 50, 30, 21, 465, 55, 9, 8, 6, 11, 0, 204,
+            25, 8, 226, 272, 54, 12, 0, 2, 20, 164, 63, 79,
+            12, 143, 122, 269, 57, 3, 170, 25, 19, 29, 105, 5,
+            75, 244, 162, 4, 43, 45, 447, 117, 147, 74, 43, 21,
+            317, 35, 2056, 12, 67, 6, 1023, 6, 26, 296, 8, 2,
+            49, 2, 1322, 82, 2087, 1, 18, 15, 190, 56, 149, 41,
+            98, 610, 34, 12, 178, 160, 55, 40, 85, 18, 18, 7,
+            0, 541, 838, 34, 14, 71, 4139, 96, 79, 46, 24, 34,
+            151, 161, 148, 12, 72, 3, 388, 2, 11, 42, 147, 2,
+            251, 12, 66, 20, 190, 20, 55, 5, 1051, 3, 228, 4,
+            577, 13, 295, 34, 8, 16, 2133, 303, 0, 5, 98, 81,
+            60, 15, 80, 14, 140, 25, 544, 46, 256, 18, 88, 14,
+            53, 43, 984, 20, 20, 69, 63, 5, 40, 9, 626, 14,
+            59, 1, 342, 127, 27, 42, 7, 87, 11, 43, 137, 55,
+            204, 17, 63, 120, 10, 12, 143, 4, 721, 57, 0, 64,
+            469, 17, 76, 34, 17, 404, 411, 27, 225, 52, 85, 15,
+            60, 4, 122, 67, 579, 414, 0, 113, 0, 16, 140, 188,
+            27, 25, 2688, 198, 253, 51, 529, 121, 83, 25, 91, 8,
+            81, 22, 41, 2, 43, 11, 4097, 16, 303, 331, 773, 29,
+            19, 229, 15, 739, 226, 4, 6, 58, 37, 15, 1541, 192,
+            162, 82, 2181, 11, 42, 30, 116, 3, 121, 18, 151, 5,
+            0, 24, 6658, 1, 518, 210, 57, 14, 509, 45, 713, 5,
+            52, 5, 590, 4, 38, 22, 169, 16, 42, 59, 561, 15,
+            253, 150, 33, 104, 30, 93, 114, 265, 8, 22, 1257, 2309,
+            103, 20, 30, 1, 612, 3, 0, 195, 0, 19, 1294, 3,
+            18, 75, 185, 31, 823, 6, 0, 111, 1, 20, 290, 3,
+            2068, 58, 45, 11, 13, 3, 439, 25, 124, 50, 216, 2406,
+            429, 128, 147, 59, 7297, 27, 210, 38, 133, 9, 569, 78,
+            85, 141, 335, 5, 99, 26, 306, 16, 12, 17, 1470, 19,
+            535, 10, 7430, 13, 1112, 2, 103, 1, 188, 19, 127, 19,
+            132, 4, 6594, 16, 21, 21, 0, 115, 0, 4, 49, 18,
+            49, 77, 40, 3, 2738, 263, 875, 5, 38, 6, 0, 45,
+            128, 2, 95, 4, 40, 5, 13, 1, 83, 35, 2098, 57,
+            924, 15, 2565, 3, 61, 44, 147, 7, 209, 11, 212, 70,
+            14, 44, 2643, 14, 44, 4, 1030, 17, 94, 166, 4374, 23,
+            392, 138, 206, 17, 2212, 30, 23, 11, 55, 22, 43, 5,
+            280, 57, 337, 67, 42, 24, 5, 88, 80, 16, 162, 3,
+            0, 42, 1030, 76, 37, 26, 72, 52, 60, 4, 0, 179,
+            721, 400, 0, 4, 711, 330, 832, 30, 50, 19, 61, 49,
+            9, 117, 481, 502, 203, 34, 4731, 15, 48, 50, 432, 12,
+            7192, 1, 83, 1, 111, 77, 32, 67, 9, 2, 49, 127,
+            62, 56, 440, 18, 8289, 88, 16, 50, 8, 2, 9, 99,
+            543, 12, 625, 27, 375, 205, 0, 14, 305, 5, 1, 18,
+            150, 243, 56, 131, 307, 4, 38, 88, 621, 166, 89, 4,
+            110, 2, 10244, 118, 0, 6, 81, 7, 532, 6, 113, 22,
+            301, 4, 65, 1, 4115, 49, 1595, 23, 0, 208, 136, 47,
+            227, 20, 58, 140, 18, 1, 145, 55, 8196, 28, 17, 105,
+            253, 1078, 1371, 12, 5, 14, 152, 51, 5, 9, 0, 3,
+            250, 12, 1053, 386, 0, 49, 143, 7, 513, 116, 47, 158,
+            3856, 67, 72, 10, 109, 152, 105, 5, 232, 5, 666, 12,
+            0, 10, 2070, 286, 64, 127, 183, 19, 696, 223, 97, 4,
+            0, 89, 4, 74, 920, 4, 321, 66, 263, 1, 0, 69,
+            456, 2, 393, 22, 22, 4, 14, 13, 454, 69, 265, 3,
+            106, 503, 550, 10, 18, 5, 309, 17, 25, 87, 0, 8,
+            21, 8, 4, 90, 45, 56, 39, 10, 186, 1, 17, 32,
+            203, 10, 6, 56, 284, 1, 8, 302, 39, 2, 2827, 1,
+            417, 25, 2417, 685, 10, 300, 39, 1, 3352, 24, 1587, 68,
+            280, 288, 153, 82, 200, 7, 30, 239, 15, 66, 39, 18,
+            53, 71, 611, 24, 6, 379, 8776, 14, 0, 6, 851, 530,
+            144, 61, 24, 2, 0, 91, 179, 1, 4147, 30, 262, 90,
+            3163, 1, 89, 60, 139, 3, 1455, 167, 260, 23, 84, 17,
+            21, 213, 128, 21, 312, 30, 8202, 84, 12, 1, 1027, 24,
+            4098, 872, 70, 7, 596, 28, 772, 435, 3302, 22, 0, 20,
+            97, 6, 238, 38, 85, 89, 4771, 52, 585, 488, 112, 138,
+            248, 6, 78, 39, 399, 30, 626, 18, 41, 44, 9871, 7,
+            4, 71, 606, 546, 1496, 518, 191, 63, 937, 934, 692, 93,
+            395, 83, 972, 4, 0, 6, 102, 11, 78, 6, 260, 6,
+            108, 37, 0, 100, 401, 38, 556, 53, 34, 194, 140, 109,
+            0, 40, 449, 34, 6, 7, 0, 27, 26, 2, 586, 32,
+            254, 14, 200, 19, 590, 3, 1072, 72, 29, 9, 14, 6,
+            8224, 52, 227, 4, 0, 79, 1114, 12, 7, 851, 147, 464,
+            556, 35, 4, 21, 266, 101, 232, 60, 8200, 9, 174, 220,
+            22, 6, 140, 1, 0, 1, 8, 11, 74, 54, 717, 80,
+            81, 80, 342, 2, 2, 37, 122, 17, 652, 302, 20, 301,
+            219, 70, 0, 72, 730, 4, 505, 2, 71, 80, 0, 66,
+            66, 117, 0, 38, 8450, 5, 171, 1, 5, 242, 152, 13,
+            71, 20, 16, 1, 793, 8, 168, 299, 217, 13, 556, 26,
+            110, 21, 122, 226, 645, 355, 0, 65, 21, 3, 1557, 1,
+            188, 13, 41, 49, 4225, 19, 8, 507, 261, 2, 0, 91,
+            13, 23, 341, 8, 4123, 4, 2124, 1, 115, 1, 803, 5,
+            5540, 1, 39, 172, 534, 1, 0, 31, 290, 2, 0, 78,
+            3, 5, 324, 291, 2367, 2, 3857, 265, 64, 4, 41, 20,
+            4355, 2, 1856, 3, 106, 1521, 435, 246, 62, 89, 1, 4,
+            695, 33, 207, 899, 395, 83, 0, 59, 6, 14, 841, 2,
+            3381, 9, 551, 17, 90, 6, 28, 23, 170, 168, 435, 7,
+            30, 1, 134, 35, 25, 570, 43, 191, 1049, 19, 792, 574,
+            571, 12, 699, 44, 67, 1027, 841, 227, 0, 127, 44, 2,
+            227, 5, 28, 661, 420, 67, 127, 7, 43, 3, 452, 48,
+            10, 89, 882, 130, 153, 20, 1537, 199, 5, 19, 611, 56,
+            72, 8, 24, 0, 17, 10, 339, 4, 71, 3, 2, 47,
+            26, 2, 22, 498, 644, 10, 446, 87, 52, 55, 867, 89,
+            492, 11, 557, 538, 101, 62, 1257, 52, 0, 180, 246, 21,
+            2657, 1243, 920, 65, 136, 83, 515, 17, 12, 51, 590, 89,
+            361, 165, 250, 437, 29, 5, 44, 117, 4985, 3, 196, 1,
+            583, 108, 251, 27, 64, 17, 21, 8, 363, 45, 8, 13,
+            2067, 59, 0, 4, 62, 645, 24, 21, 0, 180, 965, 44,
+            28, 7, 218, 102, 172, 4, 1121, 7, 21, 13, 223, 7,
+            139, 151, 3298, 511, 275, 23, 0, 132, 132, 1556, 0, 19,
+            157, 2, 74, 596, 0, 30, 0, 4, 25, 147, 1328, 16,
+            201, 16, 371, 276, 341, 274, 2575, 66, 0, 333, 114, 18,
+            11, 1, 84, 163, 232, 158, 3433, 162, 51, 275, 0, 28,
+            6184, 443, 11, 14, 645, 1061, 0, 16, 78, 19, 846, 6,
+            43, 362, 0, 31, 94, 4, 2919, 33, 1119, 51, 108, 4,
+            406, 3, 16, 7, 0, 35, 93, 220, 3634, 177, 1099, 17,
+            10033, 1142, 3266, 18, 229, 68, 14, 1, 672, 50, 296, 68,
+            23, 13, 274, 3, 610, 1, 466, 1, 41, 2, 22, 2116,
+            318, 26, 769, 529, 58, 53, 2678, 44, 5, 1, 246, 2,
+            199, 487, 3163, 5, 287, 558, 61, 366, 16, 6, 41, 132,
+            1241, 194, 651, 158, 165, 152, 0, 20, 165, 47, 309, 187,
+            246, 137, 7, 53, 10007, 22, 754, 43, 707, 171, 1038, 151,
+            0, 35, 299, 368, 6, 13, 263, 54, 285, 43, 8221, 5,
+            66, 9, 583, 600, 215, 13, 556, 2, 0, 33, 160, 5,
+            4368, 8, 98, 44, 312, 11, 104, 125, 212, 2, 902, 9,
+            339, 580, 52, 19, 87, 67, 573, 26, 22, 40, 170, 22,
+            661, 33, 78, 85, 22, 3, 224, 260, 4116, 13, 113, 21,
+            1063, 83, 519, 305, 47, 27, 10762, 1, 338, 17, 136, 43,
+            971, 228, 67, 12, 290, 2, 206, 287, 251, 69, 778, 73,
+            519, 34, 215, 4, 1, 5, 7172, 11, 141, 7, 8, 147,
+            2375, 1, 10242, 19, 125, 83, 5, 55, 315, 7, 5123, 26,
+            0, 9, 520, 459, 27, 127, 249, 898, 159, 86, 3242, 359,
+            8255, 681, 4, 19, 128, 92, 202, 33, 6422, 337, 553, 109,
+            34, 2, 100, 55, 0, 112, 4101, 636, 4171, 12, 870, 630,
+            0, 135, 9, 5, 1204, 10, 0, 10, 271, 7, 3886, 9,
+            946, 47, 867, 21, 139, 5, 184, 396, 23, 176, 357, 21,
+            71, 175, 665, 2, 57, 57, 529, 22, 1270, 413, 8207, 0,
+            126, 1873, 457, 17, 518, 2, 938, 2, 87, 12, 252, 154,
+            801, 388, 826, 2, 2145, 619, 26, 616, 41, 84, 753, 125,
+            455, 6, 695, 1, 10, 10, 213, 21, 51, 161, 47, 3,
+            1425, 13, 353, 13, 201, 6, 5, 4, 3203, 58, 0, 27,
+            1035, 5, 85, 32, 6530, 550, 273, 53, 30, 1021, 244, 18,
+            14, 173, 68, 163, 3, 1502, 349, 298, 54, 58, 35, 94,
+            69, 98, 351, 227, 25, 21, 0, 104, 124, 4, 3439, 11,
+            403, 1556, 104, 28, 275, 10, 30, 223, 323, 33, 0, 62,
+            163, 74, 172, 8, 507, 25, 4315, 184, 181, 2, 0, 32,
+            19, 2, 146, 39, 1204, 49, 871, 8, 1088, 44, 37, 6,
+            2143, 251, 1066, 51, 649, 1, 71, 2, 207, 1036, 120, 8,
+            96, 22, 139, 21, 195, 4, 17, 51, 43, 2, 315, 62,
+            123, 3, 1665, 3, 33, 5, 194, 392, 26, 206, 1104, 1,
+            317, 1, 1048, 2, 183, 1, 640, 1551, 11, 350, 231, 260,
+            889, 424, 1707, 18, 589, 120, 94, 4, 236, 8, 784, 167,
+            433, 110, 644, 165, 31, 7, 4168, 40, 128, 181, 4249, 14,
+            695, 19, 29, 188, 49, 126, 56, 71, 6401, 860, 841, 75,
+            636, 8, 390, 68, 2067, 78, 450, 27, 0, 178, 119, 63,
+            102, 77, 238, 86, 685, 147, 562, 3, 10881, 13, 418, 6,
+            36, 5, 447, 241, 151, 9, 8, 1, 7777, 48, 127, 337,
+            27, 208, 75, 199, 840, 2, 562, 37, 167, 4, 813, 249,
+            98, 346, 63, 11, 532, 2308, 40, 4, 417, 2239, 190, 59,
+            303, 720, 455, 15, 283, 2, 3, 325, 46, 16, 60, 45,
+            103, 45, 13, 40, 486, 124, 1478, 5, 1210, 634, 23, 204,
+            21, 622, 424, 1560, 227, 4, 4102, 103, 39, 481, 0, 4,
+            542, 823, 248, 1576, 89, 17, 153, 98, 574, 53, 392, 75,
+            17, 4, 495, 8, 1879, 16, 6, 205, 9, 1207, 265, 4,
+            576, 3, 58, 10, 0, 118, 844, 10, 0, 144, 14, 151,
+            437, 17, 1974, 102, 55, 28, 0, 5439, 754, 255, 1680, 445,
+            3678, 43, 47, 136, 0, 22, 36, 69, 298, 76, 101, 1546,
+            18, 149, 444, 49, 75, 396, 1186, 651, 863, 1, 165, 23,
+            16, 2, 1485, 36, 52, 76, 12314, 2, 9814, 5, 321, 4,
+            26117, 1, 6382, 9, 57, 27, 583, 1497, 4, 121, 106, 7,
+            25, 86, 4203, 39, 0, 1314, 605, 10, 992, 151, 330, 64,
+            30, 9, 0, 4, 886, 7, 67, 307, 731, 1951, 2712, 7,
+            12385, 1621, 8226, 6, 621, 3171, 0, 2, 31, 303, 22, 149,
+            1294, 50, 8, 36, 1973, 11, 10377, 1, 159, 1, 156, 70,
+            887, 408, 65, 131, 114, 9, 10541, 1, 663, 20, 3093, 688,
+            33, 19, 210, 10, 94, 82, 58, 80, 57, 4, 688, 813,
+            12354, 10, 89, 339, 10244, 154, 274, 171, 25164, 7, 246, 239,
+            22, 2, 1228, 200, 10244, 206, 329, 489, 1865, 4, 5, 83,
+            364, 135, 606, 155, 152, 2, 1100, 43, 298, 1, 689, 143,
+            34, 2, 0, 979, 57, 5952, 14601, 20, 12681, 1, 64, 12,
+            278, 438, 177, 140, 10, 147, 0, 145, 481, 264, 706, 95,
+            83, 341, 13840, 150, 2155, 61, 9066, 241, 1146, 130, 78, 3,
+            353, 15, 11, 46, 97, 21, 292, 16, 59, 169, 963, 6,
+            484, 3, 88, 142, 13317, 3, 3214, 4, 2167, 98, 1934, 73,
+            2421, 20, 0, 5, 181, 3475, 678, 2, 9, 355, 13453, 45,
+            54, 457, 9536, 51, 2415, 63, 1279, 22, 11, 30, 97, 39,
+            561, 78, 17, 511, 101, 5, 847, 152, 945, 436, 653, 13,
+            24, 108, 0, 89, 262, 0, 546, 409, 222, 79, 223, 21,
+            394, 1, 457, 398, 150, 904, 2661, 2, 3, 84, 95, 10,
+            55, 536, 883, 3, 28673, 1, 644, 7, 204, 33, 10451, 152,
+            1615, 261, 46, 25, 16404, 73, 619, 22, 10275, 20, 19460, 131,
+            67, 3163, 291, 133, 134, 1, 126, 11, 31, 889, 143, 55,
+            926, 47, 8, 3, 288, 35, 40, 82, 52, 168, 32, 168,
+            397, 19, 1046, 1, 113, 130, 426, 65, 105, 20, 26348, 4,
+            1630, 3, 63, 46, 969, 18, 0, 10, 2513, 18, 2386, 64,
+            619, 349, 4189, 3, 0, 95, 11289, 393, 0, 1, 0, 50,
+            227, 23, 1333, 267, 76, 2, 74, 57, 325, 81, 260, 19,
+            185, 4, 304, 3, 21, 19, 37, 484, 1888, 9, 3668, 13,
+            7081, 6, 3, 127, 914, 4, 813, 2, 262, 1389, 600, 58,
+            14345, 2910, 2092, 28, 311, 31, 4773, 6, 31, 226, 121, 412,
+            30978, 8, 133, 8, 1841, 1577, 142, 8, 4363, 512, 103, 29,
+            48, 963, 86, 193, 2206, 139, 0, 1293, 9, 5703, 13313, 21,
+            0, 5, 0, 45, 36, 46, 1037, 182, 165, 6, 999, 2,
+            1024, 12, 2343, 8, 4612, 23, 67, 25, 108, 36, 571, 39,
+            111, 46, 72, 11, 16397, 39, 42, 312, 850, 3, 29717, 11,
+            67, 2, 0, 11, 4364, 24, 0, 112, 326, 4, 34, 50,
+            22791, 39, 223, 595, 5721, 20, 200, 37, 4181, 1127, 7, 111,
+            720, 47, 4547, 17, 942, 1714, 27287, 792, 138, 133, 1375, 13,
+            248, 40, 133, 23, 222, 27, 0, 5, 14337, 1375, 1014, 4,
+            5720, 4, 0, 22, 0, 115, 123, 26, 242, 1345, 39, 607,
+            240, 1, 1568, 36, 465, 1, 1031, 31, 1854, 12, 1855, 33,
+            57, 7, 5568, 6, 17, 2, 47, 65, 266, 88, 784, 12,
+            637, 443, 15, 37, 7205, 31, 1881, 15, 581, 2, 1583, 31,
+            21, 13, 9012, 5, 14386, 435, 208, 1899, 438, 9, 98, 361,
+            26, 166, 11306, 72, 442, 527, 0, 1, 98, 110, 13, 25619,
+            0, 251, 24865, 11, 319, 3695, 65, 27, 78, 5, 0, 628,
+            341, 4, 8237, 102, 21, 17, 242, 443, 13, 187, 92, 9,
+            144, 73, 488, 29, 4115, 14, 2161, 7, 84, 12, 390, 27,
+            2288, 9, 0, 722, 166, 99, 13519, 58, 2, 12, 145, 17,
+            6887, 26202, 279, 11, 1, 187, 123, 114, 49, 1156, 795, 250,
+            2093, 16, 479, 369, 12384, 624, 805, 965, 475, 125, 72, 467,
+            375, 49, 17687, 3, 787, 53, 1064, 6, 1898, 492, 277, 110,
+            107, 175, 958, 2, 13868, 686, 10868, 770, 1405, 9, 1548, 11,
+            5419, 14, 471, 17, 10584, 46, 1288, 23, 637, 1, 124, 6871,
+            22, 208, 882, 8, 1419, 57, 788, 8, 0, 48, 9881, 715,
+            684, 138
+        ],
+        [
+            339372935, 8562535079, 13492457407, 63800, 6116096485, 825939169, 242982441, 21574671991, 1201750, 15901850861, 13455412267, 17126937421,
+            22407385, 37919798207, 7211575, 13948288601, 20794728049, 150563714, 5880861, 7597950, 29790442, 35473359613, 30391625, 6044302779,
+            1867345574, 5816470, 3669657891, 3360848269, 141398285, 1827080831, 315935477, 28134043831, 121866965, 1005176705, 19772578, 386384,
+            32065825, 128760, 23241166643, 1866940, 28288275, 78855095, 1052438101, 12684826, 32388554, 84360, 1132624029, 30612172,
+            50151991177, 59347942021, 937181806, 27859150, 2969298761, 21546, 10538385, 6940018183, 150280, 21528, 283461893, 11396925,
+            583278423, 7447750, 256632, 670590109, 141012366, 150282, 45259113989, 226305937, 5773625, 1372686, 364936, 780201587,
+            505818599, 9250625, 3155140, 130752699, 451087945, 183959425, 536648, 116973538, 579576, 815672, 54215623, 558250,
+            789044426, 5151125, 15646631, 48399153, 63750, 307715317, 91217841, 193256, 5050737643, 6555787589, 4511308139, 29876525,
+            57177494, 85766241, 8349363, 429352, 24918982, 144, 64217426, 12663250, 605176, 47196, 364592090, 18908667,
+            21677799, 1545453, 4078270, 7162353181, 375345057, 1631308, 82463084, 923013, 686686, 7232654, 7661875, 11967511361,
+            3734632, 622545, 1183963222, 22042625, 18994875, 322245, 55439098, 965960, 325357747, 128898, 1695694, 298486067,
+            61835018, 109633139, 4213272917, 2296701, 142943735, 137062874, 2468375, 1867450, 114140375, 265347274, 14187129, 2747547,
+            2601487427, 22663361351, 85995, 21609, 2198390853, 3223356409, 3541564, 973905231, 4614722, 8308155713, 73017295, 26592825,
+            16612519, 5065300, 407689835, 2446962, 3563888387, 1026210577, 8842925, 3109495207, 15947175, 1015543477, 51511375, 45115395,
+            16655457, 43470, 52112333, 19572001777, 419558893, 7276064467, 438017073, 313531673, 35521443, 1716825539, 45287125, 5623475,
+            1688279747, 4335998365, 107448, 3455725, 601250, 167883755, 45222738, 22665097, 21560, 21648, 4399507321, 9005424623,
+            579670, 96326139, 189411178, 874381349, 188531161, 11482911, 262213655, 24468021, 736567433, 3042015581, 1232813461, 1352344,
+            4979634, 235406395, 34856109, 2557466899, 3691845, 2179718097, 4901247994, 307801186, 16359571007, 193347, 570765769, 6288867,
+            69282759, 3092002823, 200121229, 925677951, 2880485063, 1079846665, 210208791, 558256, 964516, 173893570, 101477233, 305976727,
+            171912, 205594311, 751374, 331324565, 1138005, 540502918, 5881113, 193336, 7911648353, 2601487543, 82224989, 39814034,
+            64600, 1870758245, 1137750, 128744, 86130, 3991834, 2361177, 214600, 64861426, 3455881, 44321375, 300440,
+            10001134, 2514776, 342732, 5473336, 97120582, 52220764, 13641968909, 474482801, 197803270, 714460565, 1655892199, 1738481795,
+            1007924203, 43152, 1761039413, 343672, 206989443, 3670443, 27923870, 2125112, 2446438594, 175460307, 244613901, 3648988,
+            105684062, 43472, 43055050, 227186166, 443876494, 268502414, 7919756, 1006314529, 207332867, 33568381, 5473482, 7560449353,
+            115299790, 1588545, 43218, 7351871991, 20000253911, 170137495, 623242763, 46854025, 133568898, 115471265, 314476217, 730020,
+            38612275, 70742287, 1803195, 837375, 2489157, 203963195, 7469375, 13193478109, 86250, 325293566, 14144286, 23738385,
+            41788725, 3928041, 1372750, 6202890, 82589941, 437566519, 94008244, 58250950, 35049342, 56319249, 49386675, 160543565,
+            472120, 86345975, 896917637, 1355367299, 4013919, 1059993571, 13822125, 14960085, 1309581, 286338178, 19037875, 150579,
+            113947405, 5055931933, 772616, 15732717, 396314633, 5344625, 101112531, 64728, 227958865, 136826963, 6745091507, 473323877,
+            2962250, 94780930, 3176875, 16723852, 914517329, 7469451, 2511496, 123262006, 327568659, 1095030, 8070447, 16891721,
+            172040, 4400286, 97292139, 2231315303, 494271974, 26721807, 2064104, 3820750, 433048, 1030617, 10132575467, 90552518,
+            532561757, 40956040333, 2613828925, 324, 837384, 63112, 1223768, 123069205, 34341307, 1116465, 25412595, 324349311,
+            5451985, 215016, 2102859295, 158526093, 6176880085, 342657185, 408170, 31551286, 73446850, 558404, 62049925, 212033458,
+            2940136, 1088281753, 153267699, 15539615, 880906323, 1018226606, 213750425, 3528, 2812072, 64582575, 296704905, 2415210335,
+            487940349, 129195, 279496, 901875, 386750, 2915555797, 558552, 2854995, 400, 5709578, 837606, 11882325005,
+            901784, 2183173853, 652990723, 1112664059, 451143, 823213703, 71171815, 402753621, 6267625, 19617609, 43320, 279510,
+            11525898, 7545017615, 329908205, 6847125, 2107924595, 24124851, 69647875, 47669765, 50395961, 3284264, 44177465027, 341820245,
+            5519404145, 2211125, 57778903, 1309689, 429646763, 129765845, 1030750, 161659771, 6117405, 1370734967, 224760991, 73597070,
+            386802, 72180525, 4099875, 29383305, 371653711, 146871767, 260840355, 41767453, 72931747, 479720059, 6954475, 86346,
+            6138311023, 5816907, 5130125, 3670648, 2510355913, 5239698279, 12253119985, 149211902, 292433845, 61857028, 25004875, 1391897117,
+            337785173, 1432097691, 34963705, 2535639301, 76795103, 1116558, 142171395, 751689, 55611125, 7984750, 10646125, 1000948949,
+            18158205, 8288646223, 43500, 107165266, 6792095629, 3748170041, 57736118, 279531, 149103955, 1182525895, 9185263061, 5731125,
+            1677548587, 97442527, 899300207, 46253207, 1386145439, 1091823317, 313918345, 1561176113, 2088650905, 1307226011, 1459976, 14294875,
+            461433475, 1309750, 349353741, 107680391, 1344636005, 2881236565, 82311125, 626526957, 6997445, 4443375, 17170923, 19209830,
+            1395625, 390305193, 1223235, 21924, 43512, 49107875, 451250, 14724125, 21904, 937439993, 1042286781, 309110685,
+            5871418817, 801192931, 1429436177, 430008, 8972194, 6911512, 1395640, 12449085, 28567735, 4142853, 87376425, 61685195,
+            2661928, 2983905, 9100916, 48120350, 67222675, 193725, 1073709, 31722875, 859096, 38698478, 10474516, 5967330,
+            730360, 1879365235, 437674061, 4443416, 1549221373, 43400, 227250815, 12513326, 61492018, 9912687131, 236670, 197331399,
+            25090912897, 1137032, 18136811, 107632, 3563433, 144210475, 107880, 4099750, 88536, 174930, 72138143, 1849746254,
+            543186193, 708939, 64562817, 24962314, 200314684, 794750, 409407383, 129375, 758889131, 93708050, 16950361819, 227744482,
+            22944625, 186878943, 162153565, 14552461, 97507025, 22140, 460747606, 44536345, 155757975, 4198785851, 755498227, 102872802,
+            2898376, 94652734, 33933625, 48700251, 8414133, 126868399, 794745, 8564367, 5146484623, 10560429, 580125, 264210155,
+            1588750, 1021682345, 5534600045, 78512150, 172455837, 6267990661, 119892487, 36144498, 3348796, 123799225, 55099513739, 313832614,
+            88878922, 19553427, 1329569137, 2012393037, 486008699, 8447300873, 4382874023, 2904803067, 562438591, 673702775, 7445880235, 215250,
+            13779843, 2621190926, 26893762, 494508175, 103838650, 2226593755, 9013237259, 365560, 222614830, 235020610, 413807251, 1268764558,
+            79864463, 6911762, 52670943, 1258590981, 1848544477, 99932375, 11376057, 170137877, 257234714, 1953875, 35929738, 18222759,
+            241158933, 494325, 442610662, 533978653, 68939809, 1737752471, 25670425, 107637625, 10539009, 64668695, 803983193, 380282115,
+            50138253, 20562230, 1468177205, 425311491, 21227668, 1067033733, 6868918, 28889861, 317374057, 4293329965, 110170275, 5957957819,
+            1875373241, 1503128, 4795564561, 657541181, 39299410, 226564151, 21851609813, 6660463243, 11798147413, 1211286575, 1825050, 3314617653,
+            671256035, 129500, 3245420969, 108195659, 353195843, 349396814, 10872770197, 2941125, 10367268, 17535925, 1674837, 103774307,
+            215325, 4736004847, 115235575, 76580735, 14702875, 720, 3235612334, 2638640485, 108045, 1953896, 4636684, 2383125,
+            43524, 180096763, 236816, 14910239539, 43659, 2817835085, 279752, 65250, 108054, 14617042, 961950938, 554947915,
+            993437137, 288227622, 17428719, 1332123247, 27162114067, 1008, 117768225, 5955532531, 10195675, 223924329, 9122470, 2407174,
+            2918930, 3370318, 120300875, 9833381567, 10197072017, 3819970, 3864250, 186236309, 538593349, 314691267, 86632, 44235785,
+            44798650, 14896089, 405887495, 193936, 11977125, 151032, 1264300249, 14660001, 153311054, 86625, 40437111, 837837,
+            29802749899, 14121195299, 784, 7920625, 8596447409, 75335942, 5602568, 580203, 23631530, 601749, 5752875, 4055198557,
+            3302963323, 12277587, 673380982, 31623091351, 89115173, 10603502, 17728550, 6396726, 1270030883, 236952325, 28267778, 254036783,
+            2428152861, 497534597, 17154367979, 515944, 1077808589, 10088375, 8380572569, 4254782995, 813233915, 13669034321, 1546125, 1217661193,
+            3582755033, 45020725229, 65205, 49945558, 98365883, 16527332, 2847904813, 67395185, 1159893, 377084279, 988125, 37818625,
+            118948778, 2662335, 325079447, 982791607, 17063919, 1490971055, 319949773, 1292889039, 2055362062, 210509949, 4368880337, 227014991,
+            1622238277, 4786276, 9551875, 417413269, 4747702297, 989681231, 285437285, 2404701, 211518549, 44150262, 101240606977, 3962757461,
+            101070125, 5023194, 22275, 5774405, 753845807, 866955783, 7140698047, 434733925, 789431461, 17686375, 150072, 927245391,
+            203298403, 300225289, 1739375, 134789039, 65208, 26250133, 275821842, 2340250, 62350883, 296404826, 2081324, 665225113,
+            170590189, 95360990, 30843345, 124250181, 140562075, 3931786389, 2364601043, 1396010, 86768, 645221551, 3821301, 5130532,
+            9108447373, 365750, 666250, 150692675, 172949685, 829073663, 3776673301, 1503378, 369894217, 5259562, 1367580347, 6250326935,
+            692311445, 22344, 55826133, 65286, 5175223855, 5326559485, 333922245, 322875, 33955375, 19446385, 34921315, 13458291,
+            43956, 3677964983, 362532445, 10850577635, 145627375, 473304, 1082680495, 92162967, 5238732811, 9573417, 8950995, 3831747491,
+            5415437771, 1320619313, 430122, 1610631, 1701651941, 14244586007, 67029875, 1764967795, 4505986059, 42261626, 2404773, 51362142,
+            2527676977, 9831030, 7240672759, 7405625, 23073676, 1720251, 2871771835, 2276092, 470748921, 730664, 2705144, 1769711167,
+            687820, 949051887, 151250, 7148104, 43875, 337442223, 1508699605, 881144, 92785542, 38752026997, 2566310417, 6718875,
+            29105125, 43489094, 1176731405, 128414198, 64497267, 13651374, 643354459, 2303710613, 286746633, 390756223, 7577415, 1977738,
+            40072417, 80787707, 30263675, 2055448087, 1374491503, 246353289, 1052667, 10463792983, 3746839817, 235514481, 112789033, 329028854,
+            301455, 8146668963, 14932411049, 5048635163, 1244189639, 886251157, 22200, 220490374, 3201980111, 939758449, 17257244, 22440,
+            2102688181, 2769725, 15325659, 1732880703, 1717384217, 86604177, 108486, 154169743, 47326929, 15522622099, 70850373, 890908681,
+            200658601, 90167077, 22966405, 164944149, 1095633, 10839829, 432931191, 23803485, 652669381, 663915993, 666536, 6955026,
+            49602015, 7920872, 6160902, 12497927377, 4015406381, 816174527, 53894607, 13546309103, 626355775, 1801068721, 2034929507, 5597916295,
+            6246747, 10947123, 16463139, 137235605, 5988952, 120945051, 4036081, 966875, 3916354651, 168421225, 1579678111, 12771458,
+            7369150399, 662606494, 4916079, 1885353907, 69090692, 36166242, 2704253277, 14273945, 182307775, 57178429, 9616475, 95146535,
+            29169244, 2019025443, 417005614, 3677965147, 3120, 13866118, 140583729, 140304703, 7040990, 15604225, 17405270677, 6463841059,
+            53400963, 2614859819, 1491486415, 2644865105, 5839036, 4250745, 2554012221, 14708466181, 10367643, 7800685543, 1080, 815480,
+            21270774, 1189265803, 1415292735, 25220125, 19580760361, 259832170, 420762705, 37217422, 773720, 2112690047, 129870, 1644260057,
+            15711774, 4851735, 933620149, 428960609, 43792, 1589432, 109977505, 392602301, 79221292, 3016904779, 303423549, 402841435,
+            545848121, 1673879038, 5624380, 8371990, 412843678, 191794458, 2300169454, 7512136973, 22572, 70485506, 119700238, 2717088155,
+            129143985, 1135801617, 9595089, 64284638, 6912081, 804327209, 7077468299, 2808069869, 1010071473, 229934243, 150040, 20970342,
+            549668559, 194250, 993909741, 1542589822, 258704, 1911390, 23088, 331733255, 15282783, 9187310, 352530915, 181084475,
+            7789975523, 137900917, 1138527481, 1460625, 1057783639, 5238125, 3006008, 17278780, 7491770, 3007074767, 303208954, 302350433,
+            22960, 8693678, 1149902809, 366025, 366288715, 924075, 7835157, 1231977014, 387464, 242532999, 183617125, 1903146837,
+            4229225, 3070375, 5195151, 108500, 2333737567, 967005, 153225325, 580635, 15905253, 15497426, 54216747, 13372625,
+            65712, 3240635189, 6354194, 760327997, 42369145, 292928207, 129981111, 1889930, 673510123, 26143117, 1211115347, 73843817561,
+            178423167, 74735349, 10303377, 10560956, 349848083, 1200, 36664707221, 106600, 3950375, 5989375, 164235526, 56470337,
+            76323591, 6096675, 84221995, 4139312507, 2791395, 215832, 192567109, 5472465242, 280780175, 2555070, 61256613, 27387987,
+            13356318793, 1146125431, 1546520, 438790807, 321259477, 32174125, 29641625, 1660100127, 2094704162, 113003913, 633803525, 13286042,
+            5524362755, 24790998, 21592193, 3343056647, 10002987, 335446306, 752432, 26357793, 610065547, 1847965521, 871484865, 2104375,
+            552265558, 116116029, 196280375, 72846683, 215865, 21170567833, 3070408, 344655, 1954414, 10367875, 2297757, 874017515,
+            34213604, 1554287305, 559240, 7027116239, 1224531, 608627495, 203878325, 2082942545, 59539623, 93751316, 1218005035, 945624,
+            918188411, 44080, 22193990, 1506124367, 598260923, 37196635, 637967462, 87784905, 51491066, 1172138627, 83020156, 17837029,
+            22736, 55161117, 661340701, 71945265, 1052946, 21872081, 65688, 7835548, 54302703, 8240677207, 36273875, 7534791,
+            19961875, 2109878573, 23567661, 17643875, 18437692, 44200, 37132238, 12492766, 645183, 355128183, 640178799, 6483125,
+            3999416709, 48551503, 67184, 171833961, 18737972971, 94353259, 128521757, 2941731, 288249475, 137879618, 10647108641, 1060380854,
+            11865370439, 55397355, 5314003973, 618371787, 2576875, 2941750, 5509982687, 296448295, 1165034429, 76822438, 257170985, 26956863967,
+            2861255315, 481609583, 916235774, 32924450, 356737843, 35630036, 2202577318, 31016398, 8302576547, 855516211, 1205599571, 1847922746,
+            4668761881, 2172464731, 52306734, 1718392, 23436, 36359559, 139553765, 215992, 141979101, 7964125, 80230046, 16828410,
+            3597114295, 123477991, 4562670281, 833302327, 2598375, 192674703, 590555797, 10196277, 87210, 256849073, 102830585, 1181817,
+            901941001, 5194755637, 158548663, 5248005371, 24024, 6569030, 235021199, 20477061, 5796375, 2364472747, 251246723, 580888,
+            108675, 168550291, 268975685, 18760042, 3735875, 16656276643, 1482327, 411103679, 169795145, 108680, 301875, 1107578498,
+            185742095, 584932527, 581262341, 3628625, 214008925, 15046955, 844956905, 79929597, 727039085, 15647905, 152292, 742900171,
+            237336, 115622542, 12587321153, 83471003, 415911783, 745776265, 709688, 3139244171, 3069575267, 6712619069, 13160082707, 14982583,
+            24819514123, 3628664, 1873249246, 881873182, 32152967, 87248, 50675555, 2850159034, 36939243, 7689507499, 32367621, 1031560,
+            280488, 2063303803, 1094163707, 552802549, 88257279, 35909049, 92828756, 2326247209, 2632524271, 16506477, 18566933, 33024668807,
+            41339193, 39622030, 33440785, 98387738, 4758842209, 323408, 362726133, 28032125, 108750, 10260783, 1881662651, 140626974,
+            4172236957, 4234930349, 1654104, 1087917985, 100491209, 452574, 29405733, 3225847405, 23408, 9407234053, 732050, 4439365447,
+            1697025, 2277612145, 26186290, 4316998, 4852089, 1353625, 4172709151, 1317636489, 924375, 27495625, 198147875, 93043555,
+            80874049, 503845391, 3002310289, 11763185, 30521855, 27079267663, 1095623607, 14746545, 430612, 1933250, 97979959, 3156543,
+            22968, 2577302, 2356896439, 1646428223, 645354, 4326019465, 290546157, 117168003, 556537075, 8908625, 1302097303, 591500305,
+            2609687663, 3113625, 104483375, 303123425, 6552977315, 236802775, 2938801333, 807782965, 10432539, 531167819, 2941510, 738500399,
+            22950, 10153486, 8543787, 16399251, 1276642205, 361953553, 291082715, 1053208, 25885866, 75680059, 473715, 1168254065,
+            2223010283, 44558703, 495132, 36724675, 20069434, 12578839, 2663345191, 105728259, 1512, 3229989851, 387855, 9938691,
+            118090947, 3414138, 1096088, 25757125, 460533117, 20799177, 22752290, 40523665, 31858111961, 4694002547, 49173254, 14145620,
+            14918325, 13609062, 5152546, 5281430, 65934, 100748817, 581042, 2093888901, 977748607, 87400, 130340, 34578614,
+            1010344, 538125, 44528, 86003762, 65968, 731276, 6054125, 1800, 333450663, 256248278, 774225, 69327566,
+            6783854, 66352, 3306875, 1167545839, 209652194, 362683343, 23000, 421599269, 784581535, 2512750, 5560692, 171104521,
+            2452278101, 1476763277, 4745176, 1031730, 1719250, 203449421, 6934125, 11665335247, 110032, 1938410997, 2754326905, 2023554605,
+            941324289, 2313884733, 23120, 409590, 183467702, 223817853, 49326139411, 69885894, 198705970, 23166, 188339855, 149791873,
+            59858828179, 41489470, 665461898, 7734107857, 11999388, 1620, 967518, 237699, 39751083, 33204875, 8436570, 784388381,
+            2528600498, 259160, 493543281, 1584, 89824345, 145434626, 164451125, 279750339, 28161146, 144340295, 3058843991, 21121958,
+            3049375, 257063975, 1111248611, 860139, 495292, 4208622, 2834750, 334609691, 115794497, 16227673, 6205170, 2942055,
+            1936, 1611464, 1353807, 8007335, 994275073, 602360, 686946403, 12192621, 237800, 302250, 259578, 14059884,
+            108810, 410588815, 194805, 130152, 24190292, 237762, 259596625, 44982, 279857825, 23718422, 7041519, 3907953,
+            90790154, 695145283, 22430485, 683834162, 571303799, 11802398047, 32260522, 1332375, 280351555, 709117715, 388024, 234356187,
+            3586024, 1285721255, 39643835, 84802003, 1911875, 4444594, 264661925, 944931715, 21636851977, 2748968, 22194425, 716865877,
+            18116462, 9917613, 173394, 713539113, 27882127, 133351309, 43507191, 1106526655, 440830247, 5002569, 154642570, 453235861,
+            27667497, 33827365, 72997354, 227852826, 13008275, 78878215, 887324935, 23417823, 51405575, 24087840751, 272538849, 7105924,
+            470341865, 1042094729, 203664097, 17279405, 20262774, 1095966859, 949997015, 287691687, 382128969, 1884903865, 5560625, 10561485,
+            13780965, 318770179, 817284, 1361400681, 2019241, 17643982763, 9531291, 860250, 1213476803, 55698357, 2169475, 3170172685,
+            739273337, 840127883, 1823305055, 11934653141, 9638643, 122898867, 972082465, 57780125, 44129709, 274792525, 3931722839, 23653966,
+            325466675, 259470, 389748255, 2985147, 3028025, 2774609539, 904409611, 13630771, 109224, 946125, 3586065, 66500,
+            1869021, 4687950209, 194692631, 2584039627, 67996532, 388056, 401230923, 305012407, 19440672053, 16442391, 805958894, 40802913,
+            66120, 1283918537, 2233875, 23246139, 585147531, 521295115, 3886472, 2727455423, 19661826, 5498586301, 1680, 1376552737,
+            6097250, 21550625, 1166215193, 6268988, 2360888855, 3857632519, 731538, 9581535707, 25199590, 39698975249, 9187854, 824073657,
+            96949842, 3817260733, 3000936985, 10475992, 8758554, 1576223051, 39515242, 710073, 10368490, 4745125, 559845, 12020996,
+            369981130, 54775385, 1776408517, 27946625, 11591710, 93666345, 4745130, 452540, 1546930, 15841434, 5818250, 624264,
+            16614184, 517045342, 23256, 655503153, 204994933, 473960, 51320406, 233948539, 2834895, 24570, 114292334, 117404441,
+            366792, 3142056243, 11548884, 538407, 7732605617, 1633023, 12879625, 903640, 13842713929, 8208697863, 446346395, 2348397467,
+            66580085, 12428878, 44616, 1689805078, 2877875, 118992731, 73834563, 1745265691, 90854738, 1021383103, 42326889, 21014125,
+            3607625, 72782885, 298359009, 34771919, 3908125, 558962767, 1789114613, 2634542207, 14699044723, 4723719, 7428057, 538461,
+            289795285, 477553609, 1872, 6573753901, 83321225, 464976285, 5082740767, 130872, 8930418, 4487576, 229162325, 68146897,
+            52929877, 17822555123, 11033185807, 3039956813, 187116293, 125238481, 956951193, 3693525, 33290985, 25285274, 86304631, 13566475,
+            931152677, 198341627, 120237770, 15991815, 488542609, 494981597, 124530234, 956414635, 489165127, 669733337, 17172295, 27345758,
+            24813125, 444607239, 1332555, 26122330, 3285711, 280917, 3414460, 152145, 3295838751, 46126015, 2770625, 465663121,
+            587551525, 195075, 312782275, 6897544759, 41146534, 856461459, 1010620, 26765319, 366795, 109242, 152250, 227423977,
+            1568658, 78727298, 11420235, 216920, 6870123, 66248, 123993676, 373865921, 615432026, 4389829369, 317697233, 1504568,
+            2407892977, 32238778, 3171911395, 203943254, 697978699, 2899449, 26468903287, 28140002, 602888, 352660495, 19340125, 403549265,
+            5380089229, 302211, 1094170, 18739149, 10347194, 26508755, 11462596115, 225256137, 23409, 1298470526, 5508588251, 1349681255,
+            206819427, 4530687, 195500, 1225250, 113111999, 2255656, 124079515, 2606618911, 16292375, 6033027, 449158157, 1656516235,
+            3539379337, 701949274, 6351053917, 924885, 8222316, 41130236, 87856, 409237045, 6269354, 122577189, 8650621207, 13745121793,
+            611053586, 2963848, 645656, 277281934, 320487497, 456219374, 488414114, 1997919, 3079942535, 80123375, 2273641897, 3303865977,
+            195160, 14575375, 279772207, 300483993, 985303969, 953195287, 4015110, 90361245, 11720786, 88815922, 10073618113, 274985975,
+            2556125, 6011625, 218151939, 741012065, 48358167, 120345069, 27109810, 130815, 995370103, 262322797, 2921750, 9174168241,
+            23490, 420569513, 147581607, 120473908, 3436108, 1535872886, 645918, 189541781, 14317849, 269126583, 87935939, 9853545,
+            320380225, 130260977, 283292165, 2025, 13287625, 4669706767, 892047245, 29947218619, 4530724, 2277099, 3049785, 489615997,
+            5215790063, 551322121, 1382734355, 780375245, 54496585, 1190747789, 890222889, 18202665, 41660607949, 151423573, 4874121, 8372619,
+            163120853, 226372289, 327978175, 347208, 88365218, 274449417, 3456510863, 3602137442, 1654712, 715921843, 1005715315, 5158805771,
+            2771884119, 287091155, 59433045, 5453430, 4939352, 28140063, 152152, 216752, 54603934, 1461537, 214138018, 449737771,
+            3590740517, 238280, 252836217, 128543987, 168765695, 688750, 297371945, 16270982, 41318330, 64949125, 475429058, 267452471,
+            272303185, 1376016499, 12214587, 8072162, 616076045, 210940461, 24877593, 93645167, 409859545, 1998135, 2324681103, 2770856,
+            35029690, 5690230, 209974567, 8622204313, 409944, 465813595, 667480, 7900412, 130832, 165288695, 69091519, 216750,
+            1507026586, 4337803151, 4275238551, 66237363, 18266534, 8345031097, 12839877011, 309391262, 74392714, 25242615, 62974834, 18717853,
+            898314527, 33763425, 7728819, 1783340, 206969763, 29663997, 296813965, 5303432, 469634033, 779151905, 89974965, 2352,
+            195873482, 1003998589, 15476967, 1056539783, 13674069, 5303375, 1697560, 2170161, 39279435, 49431445, 173826, 31853206,
+            1626039019, 5861596, 78685555, 20885655, 79672676, 753375, 409948, 53445054, 1075250, 38828799, 1075305, 7599149009,
+            147431505, 13424615243, 14838898063, 3135836, 23625, 2298712, 16271125, 87885, 136979018, 22667125, 2114408179, 753868599,
+            208386442, 23664, 614015666, 152520, 24834875, 1703713655, 968031, 83772292, 5582577, 7879053, 517293, 145671442,
+            417972659, 87880, 48861251431, 50526091, 36660806, 386164493, 731031977, 744145887, 89288277, 29020173, 1204125, 2178110363,
+            32652908933, 5812590377, 3549123877, 578988085, 1098414149, 327012459, 680293471, 7261407295, 152334, 1109145653, 4659655, 2341750,
+            8244005, 195510, 1322809773, 12986061569, 638075841, 483263105, 742064019, 2384613, 268547279, 14532654, 2908882613, 1740725,
+            14124875, 873267303, 562719219, 474375, 202076413, 88088, 65914990, 19249608937, 551193082, 41103875, 1247103, 11334778,
+            25671945, 47306523, 236631835, 60484963, 20585246, 4381096, 1924052879, 4146052871, 1683452455, 109520, 1130308205, 109480,
+            281260, 1219143569, 17080128869, 122706221, 638869855, 627945241, 656361574, 191817065, 2124538779, 3264625, 574824341, 31402679,
+            7418838439, 1681327795, 20413593, 7407849291, 9660625, 54625571, 222316017, 288486447, 1987411673, 594248447, 298058955, 882198,
+            8287084, 151509514, 4314065357, 29035363313, 946647, 33928240501, 4322242673, 796328, 618780569, 11910293155, 616183547, 1365843086,
+            627945269, 214954201, 1547595, 1329141485, 943000685, 19254625, 10926951, 2127125, 3693913367, 45136, 367356, 169238111,
+            81153890, 153827611, 46561855943, 69671195, 140627773, 12987898, 52629577, 732105, 2809873869, 1372067501, 7922145, 901319482,
+            66690, 410761191, 363435275, 451562335, 3714517867, 10365451121, 3792900747, 282262233, 2111854199, 365967925, 6419944, 16398163651,
+            989625, 3758445, 3972460193, 1654965, 30179198, 11506495, 182910013, 18076076533, 7162634687, 5775875, 3942648109, 12557985,
+            19834119, 673017605, 6928559209, 13116026, 474525, 345663941, 322140497, 145285468, 345712, 5004422731, 24942350, 1417053989,
+            5647125, 98925309, 2384732, 23800, 45264, 1096914, 40567375, 19962943, 4991802497, 161318265, 209073238, 21224290871,
+            21594125, 2985579, 18696470, 263331887, 1557701041, 683234045, 545956697, 14597590, 319071313, 122191223, 1891125, 75144335,
+            125754083, 2376321337, 34128435, 110429501, 32046625, 133952945, 43143110, 5217875, 86906057, 173080006, 12923125, 267066481,
+            4938857, 1080793207, 10991435, 14804965151, 581875, 212528994, 22216586, 21422445, 35244625, 925288, 111245095, 92829863,
+            2320395, 378631175, 6720273, 1428686987, 1719550, 3264884, 2921373, 560439, 1188022381, 10411962, 386915867, 16335725,
+            624768865, 152766, 190851562, 2642355, 71967805, 2899875, 2599443, 152685, 63037756, 68898655, 7170366, 24191167,
+            314478291, 797267009, 122899562, 1680812653, 1741703405, 1549137317, 2386932, 57265791, 2282270519, 2124474547, 54110651, 74328777,
+            2813994, 111051985, 341779239, 8888103, 753246, 51878407, 3629626, 24437387891, 81862165, 5110625, 11650612603, 4981782,
+            4377102257, 40224102, 14296797, 6054939, 1496445757, 13010057401, 3104775635, 33441814, 6419875, 2355416453, 49989775, 4252125,
+            2786200346, 2108892441, 57845662, 126999033, 12472509, 1569267, 367353, 38013316, 293873855, 3694084, 529237115, 2520,
+            3232029713, 882441, 1822017901, 2507095519, 9837761687, 141508029, 109807175, 29449706, 13137831, 1440390, 410228, 910591706,
+            24191271, 406361455, 6726656923, 238545, 1332666, 190357827, 74264505, 45276, 451777155, 238576, 681860531, 131274,
+            259962351, 181622273, 109616, 6312933, 8458792, 560142, 561775071, 862988, 517244, 136185231, 388773, 16228394,
+            510886158, 1203153897, 64026625, 219640, 12901779, 222487993, 141486631, 321325075, 558104594, 260091, 4745763, 775568013,
+            1504926, 329652698, 395393914, 9038458, 10175781, 1394367755, 474903, 934952315, 1455022231, 2268, 743824255, 403957675,
+            566325182, 496248, 2170255165, 1494020521, 165568117, 5616762311, 3486902971, 17387565, 1879131065, 1989128981, 534431227, 2672553586,
+            4896099, 42241719, 27174693, 2298882751, 684543457, 511551677, 9231625, 698279777, 20242145, 818125, 2084440, 392496425,
+            665570097, 105149737, 34665295, 57416073, 9795672809, 42799757, 45288, 2967970577, 2500, 854487361, 30394161, 13781781,
+            176213765, 10755549, 453250, 45080, 14897883, 1225926, 813385874, 45240, 408808418, 28548423, 1698125, 155265539,
+            783080402, 100792625, 5163313555, 1536560198, 2127411, 31317099, 6892100, 302808, 6531451085, 618673559, 104677588, 1089292765,
+            409022975, 3674339353, 903992, 59712653, 20181704413, 231116171, 4359530, 4505858959, 214203106, 560625, 20757425, 799070074,
+            1407331519, 1290375, 7690495993, 25500629, 1391405953, 45500, 234378290, 66792, 3215610749, 101994798, 3584903101, 46985042,
+            574373917, 496913973, 35480949, 431288, 239572619, 5629811885, 68877387, 94482725, 1011375, 2808, 103861923, 22388541,
+            30286905, 125990417, 346086, 275501667, 40632074, 946864373, 3865953, 453375, 3994750, 103970307, 818235, 23762151,
+            10755628, 637110326, 268569145, 127557241, 1719652, 2063050, 52050426, 2700, 28677201, 848735489, 5579073379, 684886939,
+            914047462, 10369269, 99977297, 3587045, 3032960633, 603592, 963369407, 17323326, 8836061533, 29492739, 10477015867, 1422720541,
+            6141069, 346060, 67396534, 24041213, 15932674333, 109890, 102896495, 822572135, 35801311, 97553391, 24577575, 2340585737,
+            1316457233, 2170636, 51544706401, 92143315, 19448125, 44817409, 920958974, 2319122729, 174375, 9983173759, 152110959, 1124899985,
+            666471759, 428597351, 17237465, 8738125, 3372375, 93173549, 111996625, 256743003, 39365846, 24921276, 12365375, 516209309,
+            85534010, 835342651, 13030857, 18031494, 51252680867, 6398665, 391638562, 4440675953, 21358375, 50805601, 10090311, 118542853,
+            2550772933, 2513875, 1912911, 442548301, 158786030, 165761453, 9510813, 6162585, 16636529, 1661367747, 4102137, 150973449,
+            53595815, 828775025, 45584, 255584086, 9403482, 42799941, 3856474555, 3886801763, 2448, 5711875, 2728550, 131560,
+            1956069, 551580365, 5656426133, 431816825, 1097307, 281750, 479486145, 13374423, 9145875, 16845946561, 2256254, 24019801,
+            1247589, 22449764171, 47350121, 19941867, 2286069797, 8180145, 6441633, 276574963, 118800451, 3469668397, 55935275, 4767490,
+            1376375, 1741311, 1139816, 14060950, 649580425, 3243592, 11399605, 56364351931, 30662194769, 4379914257, 2063205, 745906399,
+            291191225, 505113005, 684329061, 118199515, 1179115597, 37112257, 816927477, 193126791, 2649116477, 81583645, 186408859, 136915251,
+            65443676, 544819561, 805637905, 410571, 68963375, 263203485, 3071222, 238875, 7497157459, 13395627, 305914881, 13331396,
+            1728911821, 1037416891, 924929291, 250840865, 1783964, 37927911, 989898, 110200, 217464, 5969535, 2764995311, 5273311637,
+            209545985, 323750, 518056, 1550640289, 346840, 308426223, 487770926, 165568414, 366311869, 119100946, 985798363, 708131567,
+            2800, 7214167833, 15946496689, 5613736277, 4311919549, 373029755, 17602475, 2127654, 67280, 389205, 14637510901, 204867187,
+            1226225, 1161875, 45738, 11786005, 416320723, 44924828, 43916125, 249767749, 24304, 12429890, 126505743, 2376,
+            1784133, 2020458, 79523246, 389367, 101587310, 24771175, 12923528, 31026786859, 186795351, 103261329, 811475854, 453560,
+            17838625, 8587924, 240944, 38743565, 678512857, 5154162, 22968275, 2792961, 263675797, 2406536, 3450823999, 93645927,
+            925830829, 9404031, 32476375, 110043661, 1526580213, 196520, 457143325, 754072, 3256970177, 31510588, 1052247911, 15885485,
+            590664633, 103454533, 248158075, 990171, 86155355, 83966135, 309520799, 528121451, 31939817, 4595967, 21980985, 2356833437,
+            1215366713, 622429873, 29342802, 196040, 902994209, 3634375613, 229700793, 271165929, 2535663169, 646760, 6935190, 33978802,
+            119338468, 26402390, 22045340, 24360, 554971695, 71710845, 1223136343, 41018637, 5669125, 5948306, 3309103973, 6414091673,
+            25136069, 3822777803, 3007719, 2265443141, 4745958, 62996787, 1040808167, 2106639286, 530310862, 324675, 94289875, 4252580,
+            925750, 23868, 2642750, 2492625, 319823042, 1999270, 2193125, 1947705789, 813708181, 1813089839, 1478095345, 1628100253,
+            161748098, 2634178373, 2492648, 111589071, 1140475, 11850618, 131769, 1312168, 1998999, 250068351, 4669750723, 216499598,
+            923148039, 560728, 270415277, 1933475663, 6773532581, 31703660, 1647889165, 116482810, 3000, 5689157479, 798147535, 13116843,
+            2728755, 25179125, 17581179, 442634678, 410872, 118993903, 1771752147, 1152609015, 304004662, 645116386, 540441187, 68405519,
+            4724825, 910377489, 275201553, 916580379, 411540, 1690493222, 1698356, 2704, 196144, 148269407, 2736, 1033125,
+            17796092353, 76196631, 81905901, 5647750, 239085, 303468, 2642409, 1591288, 196196, 8094712, 1935206, 171299193,
+            239096, 37906645, 1655036122, 471502157, 1411238163, 432250, 517482, 2433649637, 35459875, 2995400749, 27797754, 23920,
+            69264075, 54991209, 66602158, 31832619, 11807625, 477404525, 557740183, 334568302, 4874750, 1419579, 119509014, 2274737605,
+            45968, 1168598935, 269728613, 5236760405, 502022587, 119530489, 13681163105, 24127454, 2299563, 1598138003, 968877, 24200,
+            24500, 29965375, 428447435, 1812553379, 2011043203, 1696116301, 180356655, 133223883, 210447838, 4231249, 46448974, 3421591573,
+            14363343163, 2441569393, 752602274, 24470875, 430100099, 262688699, 406061458, 2514213, 24406473, 408336617, 168079795, 86799378,
+            634148845, 15520791, 131784, 305368, 900418835, 1054725, 4274310, 205617482, 347116, 8738366, 3489264427, 1505427,
+            24363567, 131820, 1247750, 925965, 5089868, 153328, 893078318, 8674127, 3401802718, 303400, 216693534, 722683753,
+            1443067898, 389500, 708861587, 760909366, 37799385, 207550390, 7591165703, 8094625, 153272, 3050973, 103991349, 12276602981,
+            1704422797, 196818245, 1982862338, 9210632, 3072376, 18418378, 15713988, 7944321, 17667148, 1340109881, 57609838, 20382019097,
+            1921606951, 72655297, 1594918655, 16229125, 196504, 196248, 2621608, 24552, 2634865615, 88044290, 240646263, 303212,
+            1225669195, 67473, 52544535, 732621171, 8395230, 3286969, 12108243, 38808222, 1704422873, 322205675, 92830595, 11249714,
+            46985631, 16508258, 139555490, 1196586845, 205468527, 4746434, 299369035, 174825, 518568, 522176369, 5905647, 55484975,
+            1332640803, 133672, 83773291, 163057557, 840213, 45869590, 87421922, 2535942445, 10605875, 1763125, 72204693, 782222287,
+            107103234, 37134125, 227790574, 1858205305, 114250591, 1530035969, 15842827, 637518658, 6742593, 40747680383, 1612875, 274214437,
+            2492875, 2173144, 2922010, 3390706437, 478992935, 56515220, 131914794, 2373574861, 73814391, 10240857, 16336694, 100686157,
+            10326875, 331284569, 110500, 1486423237, 27840681, 1011933, 22818418, 11893506, 495133075, 224420315, 733007555, 2213865,
+            7257627, 990495, 3009480655, 6753615143, 1098075, 47779809, 4854104, 85254169, 13524875, 905441335, 57866252, 2252545043,
+            732424, 88872, 36297125, 58640127, 36146930, 325125, 515394275, 267839998, 2809788917, 115001965, 625625, 10291018051,
+            49711519, 585792895, 1351979223, 610883117, 19920875, 22024249, 179734373, 510328975, 78171457, 228240753, 494467831, 293810223,
+            258417731, 947625, 25080, 1119250, 91607325, 4209982, 1477172723, 3090288877, 424713055, 9253797, 368115671, 2428569,
+            282285, 119852635, 277562747, 86198585, 401318405, 775866, 36833741, 5536985051, 14416550093, 5173874021, 174928, 174991075,
+            19598975, 23977415, 82893349, 347024, 17688753, 1420250, 4858861579, 4300780649, 1257885295, 184134327, 1915511645, 2686125,
+            390737242, 46128, 453870, 15671194, 1763272, 1827636, 239382, 523160, 1224381565, 37906550, 1606358589, 80167581,
+            867129923, 8877980059, 11056708, 31231915, 50055038, 112185537461, 1651988915, 17906433931, 1358976047, 3087777761, 6914375, 360560473,
+            5403206163, 652178021, 793318799, 62718110, 5326662, 42941435321, 8652875, 344699045, 351910626, 24688784803, 2690540581, 975990281,
+            797368, 9423912935, 845817167, 41424580583, 45118502, 645867893, 2600283, 921023499, 21831147, 282568, 12065515, 1575258707,
+            2965235, 1722424, 1499430106, 125368802, 58189742, 34816298, 368184, 41963362, 11433815591, 138353878, 5261823, 8652968,
+            260876, 6077364, 10326701, 325128, 2761733391, 110864, 89320, 2578875, 399601517, 343368399, 2512483567, 392711858,
+            3909630, 47136089, 797475, 5506443295, 387110009, 217672, 961803271, 562784585, 45268797, 123694626, 303688, 1119364,
+            9490030, 717575817, 72097571, 68816, 1314461845, 31296265, 575726734, 51900875, 363586565, 303831, 170119103, 60400354,
+            26451948721, 134383390, 1076530, 604314, 99055075, 4875453, 497007, 30931563, 1820173153, 625704, 5712652, 12731058,
+            4727636927, 1013400447, 4284511829, 4473622307, 245969345, 23848858, 28141375, 63662654, 16595280827, 26767741, 200575115, 96780047,
+            185186141, 1638016714, 8717345, 2029716363, 239852371, 89250, 16422575, 733125, 806776157, 3576146977, 926289, 7061180159,
+            80596945, 42092323, 2165770321, 32820315, 232597893, 2664662, 8451081089, 218025, 1377272, 46305, 282408, 189972393,
+            139319763, 1033695, 132848, 24750, 52094105, 582273107, 24385375, 143955826, 52716490, 18477049381, 37306101, 2299527763,
+            68310, 1354511873, 230988219, 17860625, 77184327, 3197110423, 521854797, 110704, 6699875, 40494996727, 2541480161, 1912764513,
+            78085777, 174304442, 32991790, 4854044, 8438375, 4409083133, 37048515, 1183875, 168294815, 229807774, 267346534, 1081094806,
+            394149965, 6120392, 604395, 63340781, 2722649403, 48509721, 89180, 74093782, 106502825, 977085218, 4619806865, 2020977,
+            116397281, 7579875, 5468346587, 612793577, 142152742, 1227512, 21638155, 7551631217, 497097, 1726079377, 116719603, 46900105,
+            111078, 264127006, 4891914781, 16486964, 437183305, 66330052847, 690184, 105579981, 67896, 11250057, 175227481, 2042469,
+            526598171, 3564, 540056, 38100374, 561249, 702144079, 2164010453, 2407370, 17002167, 356675605, 285096477, 940490677,
+            588282877, 3437559, 34623303, 596417393, 351567435, 7901868, 5734124, 1251746923, 239250, 4484482707, 1527752, 37477895,
+            17173893, 71068095913, 2428808, 553384025, 2785428709, 62675459, 11436026489, 34408605, 153816, 849487773, 7966322, 2204682955,
+            65465725, 4519081049, 20863262911, 131378533, 31811675, 713734109, 266251909, 955107218, 42071025, 1241251765, 41620412, 37413525,
+            2485612085, 1432036327, 7472673, 390104, 3249609007, 2106891, 46494, 884616, 67932, 380606642, 157520606, 45689729609,
+            82528761, 83365807, 25930814, 227232313, 12153598061, 3287375, 2884137087, 282555, 153750, 7125397585, 10591028201, 16980870,
+            37950125, 1484255851, 15499818, 148312879, 226695755, 246699271, 1441557, 26696756113, 321304659, 20929975, 6099358891, 984811841,
+            12430626, 776223, 613201459, 104828841, 318793491, 5176132, 711880, 46191925, 24342591, 1339552315, 6052548097, 4703754,
+            12881365, 259620009, 401018294, 16014969, 317548649, 169904707, 1090946389, 121527055, 275545543, 6936566231, 749448635, 70187596,
+            683643389, 903295393, 54583991, 51300102, 2288259857, 6034552, 8889062, 6046581403, 19214003143, 258310801, 94462251, 5626881,
+            1477709819, 89461375, 2318157835, 7644441, 4849074797, 8223903, 3029859, 2640, 4038482, 132838069, 13417947, 12441825683,
+            169303805, 48531413, 432344, 862125, 64049342, 1355750, 1055240, 571112575, 90620285, 152455303, 3627679861, 840500,
+            468927303, 1532418899, 1024947725, 3531718803, 128330902, 11207182, 13739913, 733941, 1259366537, 1463202, 3030405, 1055241,
+            49347067, 58747852, 12473625, 1591876, 91114177, 485518187, 968950581, 340213654, 965731291, 632951674, 238328818, 467145913,
+            2020270, 304069959, 493974806, 27841131, 43294625, 89505, 2471931, 46575, 223476407, 110889, 38873125, 701994005,
+            25168, 25110, 1345390359, 614618121, 31682937, 7043505, 723027767, 1591863, 5734287, 15456298, 87272339, 5292,
+            33035012, 60336153, 3672, 89075090, 78622625, 179412934, 2008897541, 5347958, 75969343907, 873955426, 563879615, 5304838,
+            1939250105, 1892457, 3152338802, 717297133, 1665704183, 304152, 4124575, 5247471091, 54176375, 1941782755, 20951574, 96630314,
+            1240243145, 531770902, 7172253, 104592891, 1613385, 6496424539, 4231912, 244703274, 179412926, 68080, 89544, 1026128279,
+            2407509, 1089980695, 4853281601, 1365887559, 67914, 50162721, 26102769, 5213666887, 7708925, 84803990, 2254884995, 817035739,
+            544820505, 497350, 4179300519, 1151600989, 45312111, 862750, 44174559, 32434311, 1005352103, 610561679, 64714665, 17367285,
+            113092265, 2627117845, 2434358641, 3355743769, 316733209, 2836568, 2420150137, 68121, 94162558, 24428620, 68084354, 11400625,
+            3484822265, 25501762, 2293883006, 173532073, 19685330, 129017810, 3587816, 668856, 328129606, 20474568233, 3730809719, 511166557,
+            12108879, 146939572, 67676575, 332294053, 15607306, 8460186, 5390931, 5399064377, 909412595, 241913243, 23248654, 3696,
+            2579325, 14147875, 279387647, 425078479, 13203575, 250476962, 4779964121, 3312452935, 342982507, 2257389, 74804254, 582981805,
+            10542125, 137602738, 49626213, 133804099, 38143545, 54047539, 56880725, 593090871, 22711745, 1978375, 1572919777, 187010635,
+            819375, 1264045615, 4716756707, 3780, 215964595, 496764925, 1701010805, 4960746989, 12409397, 29129177, 4080, 1067530694,
+            95921937, 46648, 136615791, 37370879, 17037741019, 1175016622, 34022655, 5841759, 89262, 3073014, 147733569, 2868147415,
+            1850142, 3287570, 747517166, 147969734, 18676419589, 18848291, 67704, 348326734, 2536424, 671280603, 1270129, 58554868,
+            551023395, 628097041, 402692719, 257302265, 1246317065, 37628667, 3180411, 3312, 1355988, 21767174, 25296, 1828190,
+            325864, 5174539931, 609102325, 5414603623, 4683123115, 304317, 387604119, 282750, 8288625, 26811125, 778359491, 754974,
+            5452721897, 7314787409, 1198605111, 25008237, 286277343, 18097366, 544519898, 7278944251, 352039978, 329696997, 894710465, 568322566,
+            59134218, 164238745, 5944696805, 287028573, 6321501245, 103541170, 1914003, 1141672, 27047241, 10327625, 2536485, 399065433,
+            884120, 1484847, 409882781, 2154931985, 2270252697, 16959635, 138719482, 60980255, 3437973, 4714759535, 519129, 43938625,
+            1638102961, 454545, 985949714, 139212905, 6928646621, 10860088733, 129640401, 2248446299, 1805385595, 248802983, 273700063, 58533482,
+            398979651, 9748089, 1293364267, 325850, 87809029, 2536456, 184349343, 3094575, 474314322, 3740876009, 2428048817, 626373,
+            45848957, 293918219, 196911, 357641978, 1885614313, 203172202, 3480529801, 218120, 669256, 128696035, 46818, 35810869153,
+            5519899, 218500, 2780900353, 176120, 26274625, 1256447665, 7666608983, 1849384, 1463340, 25845375, 59155954, 196840,
+            4790175, 128846315, 25392, 297373762, 261464, 1446996395, 1629388954, 486977942, 3920, 519064, 152992197, 2780900477,
+            68250, 153846, 89775, 5992125, 3960, 205039975, 24643465, 522241657, 11269452577, 13010525, 304425, 3674125,
+            282975, 624298225, 1999776055, 38272270, 3867325, 4297755091, 18826995, 1377585, 22239679, 16294375, 4833125, 2879887601,
+            175959, 25394691, 287243458, 34216017, 29558438, 29193633, 52910326, 21128352839, 19771375, 8896546253, 519090, 36458450869,
+            1852389717, 23935226, 61044739, 26596625, 83945778, 22475761, 411723, 77335225, 3969, 1699677, 275717645, 4050,
+            1699048, 14965410, 54240991, 10585290, 74437706, 24664964, 2200154723, 2472250, 2043210, 678320482, 3705934363, 3242247877,
+            8515427789, 8404571345, 5219505, 2171752, 38787645, 39002810, 154280, 46920, 2129348243, 649925030, 261392, 18782833367,
+            92123229, 123974642, 4296699, 254812745, 10556237159, 5027261041, 358135645, 71046586, 65659364, 32155585, 10618458431, 16766607,
+            3065950685, 173103205, 168080822, 96458117, 26210345, 90964195, 1399125, 524130485, 10372470977, 57460484, 151189325, 2397957529,
+            10126483523, 51794275, 119552942, 5756049, 14105223, 7087096, 1742552, 299005109, 9514337287, 655848865, 4597125, 383376129,
+            569632065, 95278293, 4682979, 41148625, 2429375, 81370289, 519108175, 1914250, 1836399799, 180143015, 1104253943, 7151235,
+            600538786, 16522157327, 2880117, 24364611, 384513701, 3395205, 195188577, 35037299849, 737794713, 2427705449, 38401375, 148141689,
+            25480, 999171107, 140973027, 1193840557, 52438183, 9254625, 104336142, 25500, 101094801, 89333079, 3030250, 2039911991,
+            17925915, 1073239871, 59048769, 347060777, 4854728, 662330810, 1270750, 55573828061, 43616907, 12727434307, 905388, 7001025,
+            276125339, 333195434, 2288603846, 135757587, 68376, 456006993, 15221375, 99935450, 112856523, 9490743, 240312, 2150408,
+            373717834, 1647117641, 712250, 4575272, 2321528, 589206398, 38208027, 332616515, 175692, 12881886, 13697444, 132924475,
+            16637901, 11848395701, 761210879, 515566843, 1617305557, 3893285003, 7086875, 34065875, 2751375, 1523061527, 1981876066, 1217213781,
+            38024198147, 373975537, 3287817, 6614755, 388871005, 238179045, 6982110826, 527500285, 298468677, 379405585, 240500, 917933666,
+            1248885, 47695054, 21896385, 207916225, 208452783, 10928841, 13504375, 2528366885, 8718125, 5369875, 17371598309, 12667902,
+            540702, 1145076667, 991270, 261250, 226975385, 13078332971, 5885022, 46500, 5241112, 37779049, 2729944, 25673893,
+            1340025115, 1557681389, 10456641, 1871625, 6389045621, 719959097, 794542958, 50957335, 2708162645, 4464, 1120164, 35461055,
+            1292613355, 118072143, 1527869305, 3644335717, 699354575, 731656389, 1399236, 392540955, 4382625, 219913258, 111320, 6421646,
+            5814609829, 9319375, 68200, 35181993, 712504, 4425575, 1561115501, 2772632, 3973019966, 6235434953, 38637599, 68445,
+            375284767, 4757879287, 8889250, 1077375, 25650, 2506174323, 363930853, 2987750, 1891838897, 454976795, 617838143, 4400,
+            1893084, 667353275, 68607, 849037594, 955665489, 327164762, 28979275, 15865465, 19153628347, 1067530919, 21853559, 45291155,
+            345515599, 1527988, 42116162311, 433485, 8062666031, 23459277869, 119274125, 882369631, 520224419, 12388437, 669885925, 7129941,
+            626661, 17367805, 22969635, 70402865, 14800245149, 47120, 248352621, 26082, 183684579, 5370597, 2436054729, 31843927601,
+            20565818, 79889511, 7331464567, 319674171, 9557757157, 97017011, 50656935, 36062114, 13525948, 1274820599, 6978205069, 90024,
+            12796234, 905464, 512047055, 674951225, 283272, 1363119538, 376851665, 12689150, 798312, 58319261, 8036395363, 33357764,
+            213003115, 133100, 6471322, 4401915349, 102082497, 217402676, 56559314, 23871125, 626696, 36963346, 203623761, 2429625,
+            9102698671, 45119650, 16917010, 1141998, 360625643, 22326045, 1889607057, 47265882, 1549625, 49154565, 884488, 3846590,
+            1015826619, 264750541, 48746786, 7788004079, 26040, 454818, 11143660, 1378808885, 30052490, 142024981, 20866405, 402070682,
+            6321888031, 1134795781, 1407247387, 3717483, 7645125, 38787882, 2408453395, 6808065, 18490056959, 2579478, 30138446, 31469092,
+            20992578469, 11299458181, 133110, 170613751, 2150625, 160654851, 1630226543, 85148063, 1339617477, 205083359, 593220185, 159474625,
+            44711765, 3216191959, 270652767, 25840, 11444125, 7401219427, 6443255, 1290338962, 1494923755, 47500, 4968, 218755254,
+            2070089542, 169991330, 247086554, 59134915, 114555974, 197957599, 1399489, 56859825, 422954038, 16209466, 27025999, 1043427853,
+            1334487845, 101911022, 285784226, 15007025, 11852802, 6378870, 4425729, 498015, 3159958929, 1555213363, 77678965, 81585278,
+            67870375, 16030182419, 1801200817, 2232886117, 49455125, 20136699, 732836993, 2876969303, 24837085, 129962833, 669735, 14084642,
+            3417600797, 111804, 4368, 133168, 1055832, 79825042, 100730253, 188428075, 17669483533, 4685141197, 394816279, 133654495,
+            5305755, 655935137, 597877709, 560510621, 1259560549, 1112538977, 647907999, 19719994229, 1418708701, 3374085, 471782597, 7709611,
+            404710735, 157328193, 176088, 5584653, 4161787417, 1099384, 6850650599, 697745075, 242622147, 3030687, 35847625, 96180135,
+            2215107, 11422725, 11736616709, 12369431737, 1828845, 299649361, 197505, 1172828657, 32070157, 347802, 1045531570, 1122454947,
+            15158390, 1120470, 1896250, 62654875, 34538390, 167845098, 235346281, 33830125, 29022910, 480754169, 6572125, 755625,
+            691288, 2107477879, 1199936381, 25867478, 198794739, 655055203, 755688, 33465333, 390728, 3674619, 1457127782, 5799573,
+            90673087889, 11221096931, 31404860, 51365415, 290570546, 6358534, 35525721, 8014202801, 25073235, 70188433, 1335015, 2086376,
+            74996175, 20351375, 326192, 39603585, 414347681, 69673461, 8761375, 2888044289, 9941855, 137432015, 457359551, 8219818361,
+            31813562, 2601599019, 4508221789, 1848805825, 15500758, 138462289, 648375, 137067018, 7438307617, 2340523171, 1614088, 18290961,
+            15672470, 541125, 1270815, 1390678115, 152112846, 6775873577, 282906, 4692760657, 959035715, 11315310, 149558570, 129769838,
+            3545656, 3583402603, 669879, 1701913198, 3481515, 17840259, 71433439, 6078537, 71755541, 47320, 191819485, 27943950529,
+            751746094, 232362949, 3706128051, 2837692, 30632294, 467618899, 93104, 2217132463, 5472296855, 41535460, 27069237, 7918735449,
+            14513644, 171257793, 5679908443, 18977875, 4507642327, 10365174043, 4560, 4383015, 23184447, 68952, 1080688045, 1945754261,
+            6938949511, 2843830567, 90900326, 21687893861, 16488125, 579419667, 179263521, 27267973361, 8203364, 8224892, 3530753897, 8439515,
+            321241265, 1364686495, 592147259, 3953672, 8396595, 82508335, 130199067, 47432, 43724681, 24730446, 1186221665, 7731243,
+            530742134, 605947979, 49884549, 90440, 110410235, 26704535, 795466293, 194502275, 509858135, 13633575, 80147415, 74781625,
+            69079700299, 748376465, 991875, 105645463, 681283109, 1721709, 1193755161, 2163110095, 2358487781, 196562692, 145374110, 654218279,
+            131057641, 89462373, 134749225, 3352825, 5520585, 501852453, 329568953, 1046347309, 255328441, 49519690, 8289281, 482578663,
+            24147768401, 1127134034, 209333235, 1571427, 991251793, 1487948501, 594121913, 36191181, 5102704077, 69179874, 21510559, 1000244791,
+            23828662, 3703595401, 111417014, 2768946245, 2816373, 412624, 305122615, 2751875, 308384782, 498232, 2387814, 108222717803,
+            369495, 8937841699, 10607301, 185466411, 325040301, 28915323103, 8590270, 792246895, 19192565, 1140548435, 3143969257, 88541444,
+            2075004547, 483845089, 1084894889, 38058614, 138677105, 15093125, 530097815, 648516, 22206933689, 5563539, 16053148241, 43810377,
+            9362535, 433513090, 4503843463, 285714, 613009407, 4340231054, 229143629, 476847, 2077773295, 10457125, 648675, 181667474,
+            19364150, 433566, 14535125, 28872210, 1807610, 65337987, 605625, 7709020613, 556068079, 1374323485, 146038925, 264654,
+            52727942129, 455202, 63213185, 3320760027, 1141364049, 132066435, 250542310, 58212333, 27627567, 56259203, 901815541, 153486705,
+            2227520537, 201606587, 509021191, 12194379821, 10521555, 2880514, 4467528141, 11186901, 1978641, 6864, 775700042, 3030966,
+            344357083, 3566838, 38144396, 40333605, 4680, 9366522283, 2966607, 22540844, 20211969137, 22991605, 980048215, 369656,
+            1438175901, 305250, 681755503, 262395, 136681108, 3674924, 31512530, 30782510, 7602595, 745865425, 76005215, 1700298,
+            375136118, 86414757, 1508467285, 254791999, 57353875, 17775927, 285548473, 4212, 112056, 1841895039, 142411737, 280805161,
+            2687607, 117300027, 189844967, 436497763, 4125625, 927356573, 23592569, 87874275, 243566814, 2365671, 4426125, 9148006,
+            179671505, 330105601, 17884706, 7345989, 132646087, 120884365, 144407809, 219336, 124447169, 70660935, 2948055253, 369630,
+            35976762, 240905668, 25824629779, 68364395, 14878654, 11273595749, 62075755, 2014371697, 1507142, 1955155147, 777094123, 267068875,
+            50314033, 11702097, 197872191, 863590101, 23506791, 306474959, 22154570, 948325466, 4855370, 26250, 311325585, 112835723,
+            1548259598, 911044858, 3782702, 16874571, 1728741939, 446263475, 2086695, 437377853, 9044577391, 4396529833, 4447625, 767199727,
+            610348115, 262384, 2807601329, 28464766, 1677123614, 691752, 18313113, 49498475, 89033386, 1678875, 848587415, 44068110,
+            20952789, 1356885, 6636875, 90750, 1438798465, 4176, 521663049, 369750, 14621035, 944355542, 497872, 2825050739,
+            584250, 4863971437, 34904023, 8976051, 2816396, 1035045, 6096162121, 2052811985, 9534371, 6467729611, 2801870695, 1120905,
+            26520, 1163799, 1862005871, 2301375, 65660147, 241224, 72034638, 94721110, 9598797, 3903502109, 90168, 326781,
+            29709625, 1762524933, 94077165, 10500259, 4705274, 3659360495, 1342236475, 21253375, 9384165, 182225771, 28575542573, 6314973,
+            112632, 69160, 3080159977, 97275165, 11501726057, 603479842, 833177018, 5091625, 369512, 705987118, 6958416803, 27345605303,
+            18979628447, 54220395, 7408804, 26325, 28821530027, 134096, 154881815, 26318944229, 305235, 167458818, 55400875, 129491061,
+            1815195173, 2258739, 41578719, 1764906, 438150559, 573882617, 3996993, 2836254499, 1035125, 927912, 894582633, 4490505,
+            3246176315, 63921715, 17110899, 75855125, 1593207, 112106137, 990050165, 30934090, 191326075, 185981785, 633506785, 514043705,
+            76756589, 492194409, 461802809, 4500, 48811763, 58899435, 3095575, 435167194, 1443112, 734643, 9224179877, 95622569,
+            95322101, 3331665, 42651895, 91995308, 36492027, 3358749777, 1538580065, 67677753, 93454785, 314072997, 22068865, 1329659233,
+            14782796369, 175529315, 101052735, 44647967, 316348087, 4306942211, 240261749, 5004854543, 6679925, 486227651, 75984458, 5090298797,
+            18506007, 2323016, 527865939, 2816625, 12195953, 861443869, 26448, 1527633965, 9975556619, 5913662455, 25992, 946609025,
+            3202934, 8354262, 114244, 176715, 458669255, 451929470, 301667541, 7510616939, 70575245, 2344375, 434511, 222039805,
+            2904678599, 77486391, 932572383, 337982762, 2752245, 4376976383, 11595766, 1902721379, 924952825, 4683789, 52224447, 501509503,
+            29301965, 4122789727, 11794095173, 1743812, 27756625, 24516052, 648945, 4684004, 3610761, 109917010, 121249370, 520590037,
+            194545615, 1184912827, 155496, 81607565, 2521456765, 75082557, 2537535, 1469104415, 9792125, 2409066, 3846879, 1264754757,
+            2070947905, 484446365, 413146393, 396190509, 422523409, 25867985, 155142, 16595788, 22280122871, 800381743, 13376314, 8808999773,
+            9513625, 260565877, 442357487, 48024, 4804754945, 5185808681, 40634924, 100475583877, 33229737, 165248755, 91652015, 47916,
+            820287, 13505370, 3932412, 5253374731, 168468105, 3240424369, 4633823797, 69192, 906471, 98262034, 524410509, 4200,
+            38209171, 8246969627, 650269635, 5069896, 3086556137, 796518425, 199181690, 41977812649, 412692, 240562325, 2957177183, 2087150,
+            79074735, 208518046, 5864445, 79482388, 424822197, 56817607, 176868, 10126355767, 2666482, 10414625, 242923285, 40677455,
+            11444248, 62998975, 186883411, 318151141, 5966568829, 197730, 3889875, 1892226055, 258634218, 219700, 44412025, 43167159,
+            178405535, 335879557, 2270640229, 1343138147, 4585038446, 68922763, 391314, 772265273, 13333593, 1948566451, 548191553, 207530817,
+            133875, 8418575, 14235045, 514258449, 154302591, 515632238, 262392, 7281066, 2631111329, 15752323205, 329869887, 22101872747,
+            417267265, 95493981, 156556213, 971484839, 88132165, 83732259, 61432514, 291880435, 1614795, 1759026731, 3076103743, 1271403,
+            125112910, 365198029, 504836321, 19945592479, 2924075, 46837375, 1207017, 177868977, 348500, 25267004, 10864511317, 18334525,
+            300594425, 2429165921, 9191421, 7839125, 77357786, 6174287785, 511318175, 402286126, 498771, 161385411, 48020, 1775617597,
+            186325438, 4897326, 949375, 16314653867, 22283668, 3440824509, 44498038, 952060778, 447465759, 401878351, 130349947, 1735653451,
+            24318292403, 67506278, 1206182813, 1636335, 10843924, 412965, 133770, 147992452, 1163864, 1013985, 4422628093, 401019801,
+            133400, 1742007323, 789478657, 44777252, 3532793485, 136509835, 192056095, 36857326, 266897569, 304758303, 2166523271, 7409848,
+            6057723, 174370567, 852858941, 15633031943, 42952625, 3374875, 19751030, 1099791, 262411807, 6336891, 8847927, 3589495,
+            17819451, 1736340403, 47975125, 62827375, 468606853, 1207125, 245949693, 1926631369, 25395875, 420422405, 38896221, 1850888,
+            369319027, 5200, 112455, 13935051, 5042050273, 5742602533, 234939237, 13269298, 5156163, 4626290449, 113415731, 1221035285,
+            174649629, 87702844, 118352045, 87574225, 11938498, 477224, 73322678, 173318915, 144665630, 112504, 118888725, 284229,
+            51989366, 6959524, 59221625, 63750323, 135844555, 38166425, 273293618, 32865231, 369954, 155480, 2915496215, 2457025071,
+            5298597469, 25331579, 8096858, 2541870358, 1305084407, 4298125, 1044502251, 1400355, 2816883, 1095348005, 186325525, 20180405,
+            1014861725, 440189893, 59543539819, 50722305, 6594399, 1372392382, 8463295399, 2601556969, 90536173, 17433195, 1293110, 692055,
+            187634785, 3090183653, 1621642209, 3667301891, 532394961, 125091615, 9164191139, 73776725, 2688125, 16982487, 713336, 812573095,
+            696565441, 327788276, 4967294659, 156513441, 452123282, 6615180923, 104873483, 3611055, 90828, 9277070, 1765233, 2595611679,
+            66626492, 1829625, 198440, 211694846, 5714397, 221353610, 107427658, 5886125, 48195, 154238385, 2826532169, 176985,
+            16599038753, 79633015, 7007910871, 72142662, 16059888221, 1228250, 725798051, 11123125, 606372, 34061378489, 12840417, 21372195337,
+            48216, 348688, 23249727, 432914027, 14848409161, 1378916, 38661028187, 3459498, 76950153, 541875, 241013375, 295357643,
+            695470895, 177008, 2559466, 5328, 8007850591, 162544582, 2065325422, 4254852, 170893723, 67077189, 507819783, 60895835,
+            111140673, 365176497, 62849017, 6606230821, 151577041, 47631717, 844638775, 3944969119, 2838524, 8268579, 1695410615, 1701032,
+            2695350335, 4104, 2774076, 74954125, 26189980, 4254471, 693474863, 370386, 48061013, 2667577219, 2151639, 107213029,
+            3161120437, 3829841587, 9005343605, 1185836071, 5649950, 1125331961, 23786301, 6036471, 3933171, 3827322, 262808, 1700937,
+            74954156, 4948514717, 13333875, 23421475, 1903065289, 2251924754, 39398990549, 489683705, 4448223, 90600531, 6894986, 6556372361,
+            4169165, 83818394, 569998209, 119747614, 6701332, 126164885, 7013469881, 127152142, 168210933, 136789037, 190961810, 137497395,
+            63514412, 8655262, 107792444, 18485005, 755972, 342447545, 799708, 293576315, 105281394, 489683623, 3975688, 93476761,
+            558730205, 477603, 490757003, 230110215, 49992735, 8850101743, 20502625, 54070665, 2142742537, 37652186, 5480603947, 584936,
+            174370130, 48360, 434565, 198259105, 8139885, 173877171, 752004539, 156577993, 6463587017, 347426989, 813946757, 773167057,
+            15394379, 108650685, 536923835, 1465627827, 846956803, 3933125, 327250, 690620359, 175959095, 414541765, 2917084687, 797656353,
+            245542227, 1572899933, 52782925, 5956696193, 2216115, 21425495, 598286559, 816779847, 196198717, 505974194, 155800, 3315867221,
+            99507902, 91287, 4340875, 146726645, 153229765, 203045381, 16810773, 28937570, 220077, 782374731, 6852141, 4624,
+            520536, 16918281, 155682, 992750, 25412068673, 133505386, 2344875, 15673385, 366636473, 843737455, 5650239, 242129559,
+            39948051, 1535039165, 413250, 17948535, 133612635, 456190, 357493227, 45914875, 27500, 5414255, 9835525, 17076826811,
+            8612377631, 327080, 499125, 15200822, 10071650, 928395, 659155666, 97318727, 26896, 627326231, 51001540, 3552818797,
+            177320, 10801375, 776322197, 28787375, 142670242, 928158, 240856, 525591546, 69996430, 53984979, 248804810, 2437171919,
+            200426991, 7839590, 490263357, 286837025, 285484859, 15673398, 1829871, 234317158, 1524092999, 164991585, 392088, 5285401,
+            1143080, 8311689, 61776125, 746574567, 48552, 11776324507, 9297712721, 31427361, 118009095, 1334639247, 520625, 370040,
+            535228347, 155311755, 112840, 613053259, 799533, 4067372815, 28787122, 1184698697, 1396001971, 198968, 1457364695, 6766375,
+            42134922271, 5520, 37909235, 467491143, 2130375, 39948181, 391875, 75447995, 5544, 3853579873, 471934001, 7245313397,
+            69930, 27521754, 9983047811, 76263649, 520695, 192228135, 1443555, 132604004, 169885222, 163381911, 2034311171, 2752893,
+            12518506, 1702815591, 1018682483, 4391163673, 353565509, 10318321387, 155848, 39884383, 1764178315, 520674, 882628525, 5508,
+            2470954913, 69972, 2452472, 1432660827, 2749201247, 11767301, 38252643, 433000139, 229316269, 27048, 1083629521, 149903175,
+            1886903763, 1825541039, 24901313797, 1220885413, 2194803, 313021969, 1186094, 2795793, 102126531, 18007698683, 115090239, 206157710,
+            49112875, 20717543, 3059491853, 15190808689, 3804568, 501531485, 60552725, 885573, 332682077, 542184, 4556085391, 2044250,
+            1379240, 400805665, 41879915, 524926129, 525784738, 162308795, 284625, 12582955, 387670283, 11939049, 2112179447, 109960565,
+            12604383, 4356844377, 1032697861, 227384647, 1315028, 46666191, 1164625, 328496833, 5625, 4791875, 1601296041, 299779454,
+            890226475, 375715443, 121850135, 112914, 18270625, 1739152514, 2377805555, 2233338019, 10608381, 5025524173, 8887018345, 87832302,
+            928557, 7491215069, 2253298705, 94914842, 284648, 178835373, 13441246, 256101703, 885546, 406686575, 7146175893, 13183891,
+            201071585, 48438, 124705126, 797484891, 601527441, 12454455, 2713701619, 9642633, 12039053081, 1078792, 91512, 864234,
+            2193717383, 578798558, 12690279, 31062625, 173254939, 24271246051, 159626005, 11786541031, 1704468359, 47024601623, 5670, 12311160997,
+            1634756533, 178024, 992979, 8762553, 403810563, 599188249, 241758, 3310750, 95301466, 2946125, 109381330, 11831775,
+            310746995, 467662979, 14875924999, 134480, 435006, 27070630, 284715, 27879991841, 34057000427, 9603796745, 902889725, 1121275749,
+            516448405, 275354555, 2817402, 113022, 2868707347, 2114840885, 6960887219, 733782679, 61025019, 27144, 668985889, 2463335719,
+            499793151, 563750, 46000786, 1765665, 7753875, 4402775447, 284752, 6594861, 96074013, 242344487, 242902517, 9921625,
+            1422280, 782632477, 1551046, 413478, 57290493, 65811295, 58749977, 589165073, 36986495, 12089375, 1017480723, 457296389,
+            221954601, 585336, 3548140123, 83861687, 82015990, 90200, 803687781, 3762190627, 23305153703, 864280, 528059967, 714025,
+            9277767, 186626531, 300144325, 4083723, 5638078297, 73902875, 7989993, 667011397, 176324313, 36385678, 1862865381, 268185931,
+            3783234, 7968519, 3789148207, 349125, 36642930, 133205149, 56474935, 306280, 174778955, 198940, 30654939, 412739107,
+            1250625, 15308908, 115283545, 764389105, 97664403871, 177606, 680404322, 1127478639, 5712, 1324981174, 2860494, 286236293,
+            28336945, 2444083431, 10083194411, 619599790, 39411814, 2348830263, 3114158243, 94507375, 4456754858, 17691254, 150375659, 498526826,
+            1226380274, 2195010, 474488666, 2588809091, 1448371882, 13463065, 4955039963, 4994639065, 92070, 27280, 263466, 10575169319,
+            5951043, 3918870651, 9771448, 32650761, 17562545, 4898506261, 377411396, 327750, 235497855, 585945725, 72057206, 305402773,
+            15058231991, 5504299487, 23743489, 86458702, 693130953, 3188742241, 317765539, 59050537, 144945471, 1637048, 239060978, 245413785,
+            3804684, 5880, 1014594, 810062461, 104101503, 155548402, 9084698, 812251615, 1990420069, 45152835019, 154260425, 734898967,
+            9835826, 9177799273, 2087802, 2163154301, 34754325, 1207791, 113160, 1809658697, 23486375, 56689635, 5808, 10898960177,
+            5582596777, 91760, 892952489, 12325625, 102920906, 2416439181, 9857386, 606825, 295808932, 64974425, 535507765, 499554,
+            220409358, 160527362, 98757165, 2664830465, 77551705, 171645481, 12970375789, 971750, 13227204, 3973236379, 3869217, 596097729,
+            62355875, 478040, 456931685, 50290068517, 370760, 157437085, 66176313, 2624375, 2044875, 615242771, 51538526, 2066337,
+            3397598791, 88733931, 32715683, 2215330859, 134750, 799910422, 1250664, 263538, 48750, 2656374097, 53169790, 59717515,
+            181518337, 5242875, 174714735, 52804895, 25117625, 42223643, 48840, 14389960117, 2342992847, 606879, 98564011, 5776,
+            1862522129, 32157489, 91824625, 335000419, 4274619943, 181990718, 63407617, 4893677239, 2152227, 5287008181, 3010722, 531322485,
+            384000393, 13829067571, 609383554, 876898085, 64073009, 432700015, 48708, 5940, 1486888, 9213561, 4684875, 533103935,
+            1358082, 263500, 19022196, 4234116, 118932425, 1079078, 2694921677, 9987641287, 3697551, 212554045, 9041875, 134680,
+            70919709, 28737202957, 8484244021, 7058242285, 349745539, 1486905, 9964773, 14772628, 2228767298, 4586863619, 6766804, 113190,
+            1916070, 2981409833, 778635, 150504519, 12862234, 5350257, 2736860413, 5285709, 266941310, 45593405, 396513491, 144602381,
+            1293705, 108887779, 22155826, 563992, 2011432489, 5904, 714285, 498870593, 279668866, 1615546703, 545874598, 1637130,
+            885969, 9091024505, 321285635, 735735, 34259650, 148894845, 5199417743, 19493278, 4493478283, 1014948235, 113288, 396041554,
+            306680, 113674055, 1456721279, 10029294, 1429076935, 1333931966, 2645902, 1054869519, 47503625, 52074668, 132862079, 762522085,
+            55273375, 360112225, 7004906785, 3139587, 19359288611, 1024542281, 641406311, 1753447205, 1293796, 52826574, 42073486, 2469367147,
+            91875, 2088025, 50379681, 16725709, 290700578, 2989286795, 48944, 724210591, 6182294443, 199206, 21705125, 25096281,
+            68816391, 332983017, 111656559, 1056942, 8188741543, 396020066, 1875271489, 179329413, 5607875, 328185, 886857207, 11853625,
+            10458531, 20546166, 8704239853, 26427005, 9791984695, 5959529949, 3010875, 4147396, 3483032, 1787460, 35784847, 120520803,
+            5135739, 53942581, 179136503, 1637253, 70448, 2006131231, 55445019, 478888521, 41558445, 27324, 307248905, 6243657167,
+            900808179, 3375806, 3161125, 52075289, 91960, 49005, 1032333449, 100560255, 12089752, 446200391, 689719589, 4236051079,
+            2737440079, 701159361, 32350825, 2474329, 106569879, 8462498, 54972806, 250822705, 691565409, 418212628, 22471917329, 7496644,
+            13570713, 624107231, 5518744361, 59823428, 236506907, 795660965, 56126137421, 3976742, 6595250, 27607475, 17627244, 15609685,
+            950456, 69750, 237987862, 257068461, 70211726, 560576751, 6120, 2173875, 419457493, 2902809, 4557159061, 4556277,
+            19322829, 521284, 349648, 128891399, 499720, 9020557, 21903319607, 1376900499, 212039126, 30762615, 83604535, 126058331,
+            12561944, 82788881, 1100750, 9706983, 31084551, 22649627, 3247101, 173405236, 1805688393, 37888444, 2895021562, 155805969,
+            137605435, 9879111, 1015014, 2016948629, 5543615, 14722980319, 69889686, 95967157, 1855353689, 43018204, 950334, 6402110,
+            21340375, 6918647131, 548493121, 242250, 42674522, 671517, 91908, 43318499, 142391711, 6573938, 653575659, 1020099721,
+            1336875, 54093171, 2916119563, 2276479265, 3061424039, 1290984097, 73624265, 349448, 5236334279, 27378, 1560237497, 408897841,
+            19194351, 20013073217, 7840179, 540251301, 1415812955, 883809597, 7656609493, 6156, 820665461, 38725445, 223951195, 3719192,
+            287395761, 118439035, 193323405, 439804533, 1269370943, 25826185, 37630866, 1114923183, 3740758, 414018, 1680318, 106827550,
+            6965500865, 62120125, 1465750, 216825466, 6037250, 21941458, 183600697, 914136835, 18185375, 107857775, 1100898, 6389841799,
+            201930125, 3826625, 468371839, 70683875, 81093425, 414714311, 5998206271, 1573047, 1057875, 8333875, 306197385, 3432905769,
+            381489277, 22907255, 117430526, 986467175, 133677817, 772652771, 12605012, 1927169002, 40399510, 18657585, 14386449, 1680246,
+            2624732, 25375515, 8827533, 83733294, 2253599777, 199272, 27664, 220892, 58085258, 1126942523, 18593211, 6316375,
+            1644715943, 1550744, 634431057, 660894949, 460108579, 10905742859, 11896755, 5109616819, 33352457083, 464594365, 2789101651, 30848727,
+            5654347761, 264108481, 587641766, 42782047, 17348375, 499905, 1149306987, 1444184, 7936873439, 7239309, 4298875, 7971471781,
+            2560383, 310017851, 147177987, 134665115, 19795074, 737110095, 1413344963, 28413648391, 6160, 168147425, 3697928, 1637482,
+            85235843, 63901695, 179007702, 370968, 3762315, 14601125, 25568686, 1523085179, 754731177, 3508821041, 3783010, 8827546,
+            797571379, 34475875, 478485, 2848854701, 333391081, 2431737, 1095499295, 6264, 8162210, 22499477, 286751971, 843304,
+            50530205, 282652531, 6384, 923108483, 46924436, 234403741, 3891105, 9696453137, 6164115529, 388829559, 988484785, 8452715231,
+            306774, 4449250, 6017930971, 897245338, 424372795, 67721522, 1895075, 16382601, 4084250, 31256463, 47224186753, 1671802265,
+            10716375, 263925, 371358, 171109367, 4148625, 841750, 21017814, 3188657003, 1294125, 204527270, 135135, 239190017,
+            747390935, 171924977, 77359051, 147156691, 56733131, 5774776813, 187871981, 2345778, 5065274357, 5694018, 9771957, 2259980,
+            8084538887, 2365464982, 44048498, 50465954, 640655455, 3217031045, 2492225687, 15266570, 1273556391, 1787805, 83175521, 116765089,
+            1166198486, 71542581, 27715155, 1536606931, 1083265058, 118074341, 20610898, 168168962, 10394615, 11338839, 2279935021, 40228035,
+            13763442, 20288922, 6317898037, 266748614, 113750, 713801389, 650349, 339143255, 23590762327, 54372171, 331523885, 50036646,
+            26105387, 1596767809, 383507267, 203604401, 278188358, 341332511, 8076508, 2991240321, 112172086, 744751059, 97169314, 1165384,
+            422140733, 22134775, 78154989, 211932075, 5632155199, 345603635, 477128905, 803731389, 722193422, 3075625, 108630665, 47246485,
+            136017453, 542997, 1325947585, 155956606, 195341185, 14665651, 2919081737, 2082539855, 299737217, 2096362021, 3313076, 1390894701,
+            403274729, 185468195, 45078735, 205600527, 736155, 2372333255, 886446, 1182939667, 6552, 480820571, 58385803, 224123097,
+            72916233, 122560174, 6702975, 278854366, 2367386, 349866, 200322662, 1251315, 328328, 20973735751, 2775213, 19087005,
+            19655070647, 4204801289, 3876524743, 7623878701, 49368, 46817099, 3461931, 5994625, 1997675185, 650312, 5393675, 420917365,
+            11575028, 49400, 199640, 10232234227, 1338074297, 7025018, 6292679057, 190511461, 40421094, 146834831, 14558375, 264040,
+            3934210, 33982431, 199650, 1157463109, 254986995, 1422488199, 8292260, 1080860, 1573250, 17198363, 421196403, 40099787,
+            68557700599, 88498459, 16790565, 5157625, 547999805, 43383175, 800632, 851014541, 450708039, 70383638, 890935617, 2474745,
+            338327769, 199665, 51023885, 736250, 265203235, 2017893385, 2657254717, 225861727, 4835750, 299350586, 20717710, 907268971,
+            92250, 933732865, 38511154, 1576270707, 31621513, 1294299, 188902375, 2818179, 6810265, 156750, 1466294275, 5638358089,
+            490672133, 1508980, 542754, 124298798, 367174075, 138421479, 1444422, 70928, 114075, 15282220567, 264110, 105969625,
+            109124433, 185961963, 1916750, 328132881, 1036750, 37802950, 65661739, 2839626, 113886, 70898823, 4757473745, 1425171215,
+            4771375, 685878193, 4299130, 4165030141, 230433385, 3305244397, 904736395, 349789083, 27972, 14730177, 3676060445, 242440,
+            12548928917, 42631972, 779247, 68087215, 22886127, 224337855, 13508516, 337855510, 414375, 1720888449, 154411397, 24002225,
+            2496285, 10784498743, 8570198, 1011064613, 11145875, 458155789, 9986875, 79891903, 331051903, 3142876607, 1592775815, 521703,
+            4385043, 219873563, 231592361, 178296, 4986009, 383614286, 462577173, 1680705, 6402591, 1315875, 3113644017, 45207669,
+            162674630, 213241574, 1723528, 6285939805, 1292959191, 1943009065, 147393051, 14794598, 32114698, 70680, 16511677, 896000917,
+            98543247, 2431935, 1509327643, 12809725981, 2044679307, 353051410, 267821090, 252282745, 822250, 28152, 31685875, 129578757,
+            83604521, 511727437, 405979294, 223758403, 70686, 90129767, 541689753, 30098558831, 69911582, 242730, 199752, 92500,
+            33261303587, 4835752, 1593405, 204549098, 181454845, 28230098, 96224930, 374578935, 48964539, 14065052, 9879604, 714984,
+            968288431, 14429704, 1232296, 251767647, 247839916, 1595022, 4471801243, 500250, 11296197, 11811198, 3281270113, 10330474,
+            35162630, 20138716, 517973582, 113960, 1422872, 11520872891, 45893924, 133613875, 70794, 95710153, 6750, 1735118515,
+            428000353, 5392499569, 31020682, 13253688199, 203883775, 571630774, 107128436, 5547204883, 12025923, 5941308503, 127432525, 144044890,
+            37882416293, 865215, 6696, 393509319, 6292142695, 370629831, 4728305591, 295938533, 435855819, 32437370, 143916125, 3397875,
+            139859665, 10931375, 908145, 350168, 7041222877, 2088625, 14008219943, 2981453489, 638960215, 2969756197, 112601619, 23251137,
+            7282625, 10673817, 4470830, 204227309, 2217446, 3506352619, 23272587, 2560844, 6465608, 92568, 105175906, 23508705,
+            1294482, 2835977309, 199888, 256768629, 2071078907, 457232, 351205805, 1064979325, 11950390499, 152887647, 876448859, 242903507,
+            7864092863, 47375614, 70840, 170423169, 251188227, 257519852, 1239752465, 1265615858, 183794429, 1208350, 35356321, 124749735,
+            20460979, 254107217, 192014779, 92040142, 29217903, 989043263, 39262587, 2519441021, 4320771, 38489972, 333885410, 565492421,
+            7626125, 210065141, 2946855197, 679697041, 114577086, 11918725, 7454421, 98414615, 316500171, 3046721726, 13871858, 30548609,
+            2410625, 24968229, 17490978143, 227643351, 4334867423, 384709535, 12305046, 6779245561, 142907427, 1273096, 12154833, 4276810003,
+            715122, 120456934, 391964053, 3841518698, 6800, 30143695649, 499928, 4544646841, 5608629, 18605809307, 2432079, 607750,
+            2245079551, 29046225, 719661187, 1597605139, 264368, 1294933955, 80428634, 286672, 25945125089, 173964417, 193087713, 97706455,
+            54801625, 21276633, 482365642, 2154012091, 294844038, 1530650, 1077642575, 194654757, 5723738347, 1702184, 677894205, 9580639289,
+            81523211, 13037727629, 307580, 760011655, 1230250, 28272, 1238207257, 361894558, 2676314155, 4170740, 842236241, 91396175,
+            384580861, 2461362211, 6840, 397544558, 7025590, 5364726385, 16404575, 260374499, 805835173, 378077581, 18658780061, 2560070545,
+            168491335, 6791157631, 28336, 46173765, 14693061227, 4256538, 1573684, 18827822627, 230798491, 114340249, 9600890, 4299453,
+            425467823, 36493975, 13054919531, 242495854, 2539458, 404970735, 3328746458, 1788332, 972774, 1421909151, 14515886, 4664331,
+            160571579, 1317835079, 43018717, 801009, 34655111051, 5050675, 309224305, 32041303979, 199569909, 1888708549, 426863006, 122066945,
+            6512739593, 2028689635, 15460186, 2939342937, 7020, 28600, 11193390689, 78325375, 11227989031, 4084839, 92752, 84528165,
+            23508875, 4127787, 375394799, 396965075, 21469810, 979814329, 1530765, 275248402, 100217645, 53964911, 4558962733, 87019449,
+            1078694353, 21770466, 11210589, 90795419, 758030, 1337625, 500526, 2882946, 3183453, 2138687551, 40570985, 18351429941,
+            88434514, 6668518103, 865674, 12519843, 6960, 243048, 539631014, 863120011, 81202979, 393250, 72981139, 13791272219,
+            28392, 18014375, 11639875, 248162135, 14902251, 2514375922, 14554582367, 80192697, 280528339, 2024451, 672282, 10995985,
+            6853635, 4106375, 1230328, 1085777173, 580731339, 338671619, 1380575, 2322389397, 86654074, 32266102, 2775368, 715208,
+            27071790, 231850244, 33579342637, 1557920542, 145032415, 272501211, 19323657, 4346802083, 41022751, 162588985, 1786501241, 573970726,
+            2367873, 363547261, 186476966, 14623388, 13528606, 9300445, 1473119989, 11078885617, 1219427315, 10026833843, 10471804619, 341097302,
+            7304375, 1024028218, 6681983, 34904833687, 40335955, 7000, 50681125, 1208888989, 530379034, 2496676, 116250589, 1104943645,
+            797915417, 35356473, 199962, 586264, 16190091, 558411733, 176792, 81652636, 642136957, 456610858, 7686465283, 777203626,
+            255352305, 2088909, 47203638, 67679475, 98500655, 23401686, 161988294, 10757734793, 7025375, 8291478, 2368366, 8923764377,
+            128312821, 205021662, 15516253651, 264500, 8935625, 5136669, 192744759, 886977, 930248, 295552543, 51862382, 1831375,
+            115091691, 3312351, 178750, 307496, 71250, 14466262183, 15117236, 2434490729, 3505491, 2728812851, 28500, 2539732,
+            365350221, 457912, 3929581855, 11618490, 114345, 307228233, 29711814, 33811266, 8324259889, 1203158489, 371925, 3564818185,
+            2711415, 73110081, 9922959, 19001853, 972130705, 10523926, 18212757641, 21169652, 142436236, 68624295, 6789186, 144045251,
+            2711384, 865592, 2185691673, 496145765, 324506149, 929741305, 152866533, 3720178, 437895185, 49950, 1294839, 261555195,
+            475348137, 202789489, 413921035, 116701365, 6789393, 232902494, 112988307, 5072375, 908523, 107043321, 234640595, 7647926,
+            16047634561, 446050318, 1058805, 388852282, 4056256535, 1487929729, 1246663977, 131554266, 51260836, 47762253, 36215179, 2260713,
+            23036875, 140482322, 56948437, 7283055, 17613124393, 9064485, 824594091, 1688909105, 3164039645, 221697, 140096099, 36558470,
+            120393065, 35742993, 736950, 3122465905, 310855727, 1869262693, 309911371, 35935669, 2004501083, 88198565, 114018575, 1423784,
+            4643125, 25891510, 329550, 12605901, 3655827, 1441741223, 3312536, 53965143, 414920, 371896522, 33231855, 2475375,
+            359469471, 15525092, 2119285519, 17907274, 157437, 779984, 42267875, 329672, 71632, 125501299, 202531882, 17735575,
+            10910264, 72530619, 448090165, 4257786, 1652915697, 1138426175, 60768897, 37245453, 17167466719, 71500, 65190411, 74934575,
+            25483731, 39011284709, 7331660549, 4428788, 13722009, 790081655, 930069, 4699738787, 137134257, 420832195, 1788584, 1622502614,
+            267758085, 457875, 37953734, 36665972, 117109366, 1252017, 1425708383, 11876172199, 366208869, 560277415, 15784541251, 693889,
+            42396561, 1065945634, 71779435, 292011382, 27651442, 1408001441, 122217515, 43984226, 758337899, 13249863, 103180231, 588028929,
+            8860276997, 51389475, 5630499, 20804861, 335774361, 24110828, 87168466, 67572715, 2515685421, 2232695795, 774156149, 633466418,
+            4428567, 805341885, 10073837965, 65254721, 135202625, 2882852967, 58365099, 68710213, 672543, 19342334045, 191113769, 4029535186,
+            357323239, 2703916007, 543557643, 6294761693, 350625, 2660281679, 2093336531, 310834489, 3609075061, 221778, 108051957, 284391458,
+            1595464, 565250, 87918662, 2797389, 66005975, 1059936059, 25897134671, 148659973, 28812, 500916, 2196423341, 140139194,
+            12026378, 42697149, 94766375, 10609750, 169951397, 541880, 4042250, 652139033, 60318635, 350347985, 638703221, 1509651,
+            25459160207, 25591137, 75557027, 226227287, 122603915, 5995431, 50274, 30098375, 3119375, 393576, 7913651449, 2629825727,
+            17413746, 47268795, 143637663, 13099702, 17521075, 242646481, 470819635, 38490431, 10631450, 177119957, 229747231, 1176007963,
+            9264554135, 11039314, 5266598215, 7497875, 1948182445, 9429524, 236271973, 17563975, 133550079, 724963025, 121874181, 69204023,
+            22162443523, 663600301, 3033845266, 2642789401, 9150505, 7798888829, 2409765611, 45766435, 694089, 29239917, 134752009, 391921747,
+            5566242, 60726125, 4079071919, 758500, 1709449399, 10030527, 436568, 114608, 565326, 69032315, 2239461, 496532345,
+            343415303, 415030, 5609422, 38640745, 80665255, 152029735, 7548158101, 11103638, 2068718509, 122582525, 12114175249, 585153039,
+            280120841, 969877363, 1462925387, 104660534, 1135335633, 3656037, 1246835879, 5961720497, 30076930, 390161781, 362109605, 28317025,
+            931415615, 37546166, 14451866, 1954900295, 1582431487, 600091345, 11082252, 3763375, 179056, 217921165, 505631762, 509152449,
+            136125, 28880, 5051145, 30184418, 436696, 179080, 1316601, 33103301, 758632, 7280, 866769145, 15825590,
+            508809385, 32012544041, 30742375, 9665750, 404370245, 2493492859, 84421337, 799890443, 19105146581, 17091875, 1037575, 12053263301,
+            21126963, 968267689, 357774131, 93993288143, 1960497, 85021618, 781840081, 7390708, 17595761107, 25848823, 3209627345, 1595625,
+            23998023769, 372232, 136161, 1001815034, 93113867, 1090993137, 14473410, 779960, 554096263, 149819125, 222024, 541132559,
+            2647359, 137992962, 60811894, 19774825, 36891963959, 11190429259, 4085375, 29008, 4908037459, 111486221, 1080772, 1946293739,
+            359940218, 2153697, 393976, 90710275, 27029086, 100733269, 1439637551, 373549319, 361358502, 179159075, 2518569, 173127994,
+            1681533, 441265253, 115368, 758625, 1724463, 2411290, 9727017653, 608391, 46339654639, 7500, 28896625, 177313279,
+            586971, 229210813, 43384159, 324227366, 875805133, 26578625, 730028455, 1603100369, 680320443, 75192325, 415233, 479655,
+            8249224, 1177939922, 172398317, 27759095, 141834951, 3484558, 87276007, 158876594, 905080371, 112580871, 115778875, 41302261,
+            10459917, 1810354, 36129665, 758670, 11447282, 951825, 1681576, 1252290, 6145874, 9172163, 31085883, 103287415,
+            7492569079, 179046, 663965357, 2540258, 2733250, 1017246369, 2045430871, 20053838, 17306649, 17735930, 177463561, 84357077,
+            1080625, 3493132186, 29016, 50320, 4536175, 3978220, 298858021, 1921310963, 260203462, 58428260197, 137104, 334465417,
+            6566204519, 372368, 2272445539, 68581868, 23573810, 4926817685, 335238123, 286520, 5129578657, 2376755771, 34251049081, 1454877017,
+            41259374, 7219144, 685557187, 522750, 4041146993, 99939738, 17177875, 1428091167, 921735971, 29733765, 118955463, 531581687,
+            1719923555, 6136687013, 224961482, 328648985, 216998445, 381705511, 17974390037, 50616, 200655, 7714603859, 36537501, 694782,
+            42869125, 1084661683, 88628225, 21942739, 1123605, 142221365, 12607481047, 592858442, 758727, 3999723, 13078406, 7452,
+            479426563, 1194144475, 15267717, 1209465, 23751242353, 136242, 71920, 10163575103, 3684861265, 2815845847, 206073790, 7304984,
+            1115589997, 80794285, 2945996929, 4657542941, 4020952, 1531432, 29626545, 137971779, 11554849697, 87555135, 22801233, 393764,
+            93366, 8795437573, 179800, 32330837, 4343092, 23816683069, 2797750, 386491787, 65233641, 1518922531, 24625625, 1917784,
+            11609666231, 1037799, 292312175, 68646214, 13915605, 4451820131, 13829751, 729813161, 243675, 4554477871, 1777122523, 2149054831,
+            7600, 737528, 61477559, 19498005551, 2570158943, 2282665, 109984017, 98994951, 274261867, 7173285517, 2808612851, 109962766,
+            5624086247, 701271175, 379902638, 2564814655, 155743133, 387951327, 3369741478, 100754927, 346592129, 344982405, 53622219, 12885405,
+            37095669, 29991423, 7305025, 1945778809, 25763211, 4547030011, 866133, 298772535, 337105483, 534135885, 711355822, 796113201,
+            1082944767, 114920, 3084176329, 7584057, 14945875, 39499537, 7026006, 17907747, 300918891, 839060654, 1638819, 187057689,
+            38812730, 3248553, 17243446219, 1716532527, 5086008893, 116122435, 8421237, 303859241, 3548184887, 11511819, 21985758, 343372731,
+            516901099, 60490375, 74806193, 49351085, 1325777155, 836420755, 4220256001, 2261370787, 29106, 348888725, 4516186367, 101871055,
+            544266411, 1626495247, 956527663, 1338363, 7584038, 220110725, 108159695, 53321866, 171625795, 222456, 2159915219, 18667129973,
+            13658125, 780325, 3699297, 5037953189, 39563975, 50184, 19903947, 5332211007, 1216938325, 7154875, 911991883, 728268151,
+            3867854903, 16941730, 2718382082, 1960750, 43534365, 11619146, 1787660809, 9150921, 93288, 25268097091, 8504506795, 39284970,
+            3269750, 804548239, 309869043, 1665128699, 26879190, 116036679, 17737502779, 10567570, 1703295, 32317125821, 95775603, 97385277,
+            1207945349, 89851817, 603718973, 2239750, 715691449, 93865415, 157780, 12284545, 7800, 16856125, 1200948425, 6017375,
+            973544, 221806342, 33425502, 26491616959, 541733835, 1378254319, 327254135, 4338645871, 21771207, 81416881, 9526360363, 252326767,
+            25870647, 28124285, 157976, 143294710, 668644561, 105627193, 61005637, 1902273415, 32846125, 740931961, 1724706, 7728,
+            72036, 93500, 773448357, 6000890503, 115994084, 82833454, 8979246, 183881228, 630750, 46045945, 58472975, 536818945,
+            23960482, 4391401937, 1771284757, 15675874687, 770765567, 1317006, 568906037, 34327097, 64096530, 22565375, 105519722, 39242125,
+            5073057, 165423115, 1222840787, 236465645, 29304, 50467287, 162504139, 79485263, 950024543, 48750247, 6382278, 5090022613,
+            362839789, 327554623, 413191987, 631041455, 35765125, 38877255, 265302, 4772845, 157052545, 5200020529, 21277625, 31901874,
+            141298713, 1080924, 42998178, 288620794, 3613599, 72030, 6397119329, 2220440999, 33292747963, 1166778, 92556255, 13224885913,
+            22157630, 3335046, 15868990, 28339003, 20240926043, 29241, 2705247281, 1606062601, 93480, 4729784, 9189305851, 5431112642,
+            852797197, 72520, 6103342, 92019697, 5845749, 441909611, 1703380, 179685, 3113988622, 46968875, 78776470, 18723341,
+            309954957, 330088, 61070009, 5201875, 1235418067, 8586109259, 8077839, 1145375, 995152, 618163594, 10116873, 293277725,
+            89336907, 66307045, 5674053, 4114185881, 3527755, 1574625, 97020555, 4944345, 265880, 17092408, 1341595358, 13969029691,
+            115192, 160164786, 38984655, 10395908, 10975426, 2058588573, 32696015, 35571024073, 13980228, 562424289, 2129609635, 3763881,
+            630344, 115101, 200258079, 149282886, 50864, 7112105, 76071974, 29433508, 183258946, 2377185361, 184074543, 135675485,
+            161688666, 571288553, 6554020, 1531838, 8368023781, 371060173, 244125, 7881736639, 608872, 5454614703, 1655491999, 3098264,
+            699336781, 390892073, 42354325, 60533073, 9945550, 13615577053, 5849876638, 1467354, 6833125, 37374995, 630315, 86095990,
+            7228638977, 127862972, 781144, 1274260, 4171750, 72200, 323498219, 1130013391, 129000641, 30571255, 10267334, 523032,
+            497777819, 134602713, 884433755, 4128904, 34241428, 1726963717, 3154618187, 2068374, 522953893, 4850302501, 19410495, 49823566,
+            61869144443, 136344, 74420203, 144024595, 382306942, 2240073, 712064482, 286748, 423859249, 1277657498, 17779203, 294952414,
+            49329917, 14452533, 417914519, 3440677073, 802125, 2798125, 125866975, 36774078, 36709673, 351351, 1356469543, 973750,
+            9365811, 1287830869, 158919995, 270055415, 235929239, 518875975, 8732830465, 1939018289, 19432758397, 1896675, 11703781633, 13923142069,
+            15012303299, 1002437359, 348381, 9696712339, 123763625, 9818729479, 150034313, 1074359839, 1145529, 1059399, 5601056781, 1051652091,
+            582256235, 12371667467, 366445706, 3527901, 375996803, 22354475, 580989910, 549783145, 2078849773, 50232, 1939665, 2683483907,
+            866761, 117496719, 796886186, 764326871, 365394055, 3218470685, 5008875, 6979560749, 115994043, 87190675, 416176, 11039875,
+            4107268, 158224, 1382024, 1360216, 29000, 39693082, 18831043, 35652626537, 215818435, 2639399477, 2154087, 55167918,
+            106872283, 265512, 457513251, 501704, 1424574, 412247858, 76547776007, 85388006, 4743889049, 222642, 71874, 79292339,
+            861962101, 157009654, 34906865, 491682414, 15225309, 39177985, 2032018313, 651410006, 9709266, 28618205, 881772463, 19603822,
+            1155253802, 148016841, 3003990706, 9445445087, 13744353, 94315886, 630416, 467858479, 317746269, 27994274, 2937541555, 18078400231,
+            24132451, 146600333, 3855149177, 146407167, 7992, 7938, 11791197, 2764184863, 820324015, 958674431, 24626162, 843503947,
+            1439316835, 513403009, 142372263, 689528411, 854256925, 19110125, 437325, 1811187, 72500, 30614331, 220862213, 5888828,
+            482217307, 1081125, 2562175, 515184475, 21578414, 7772145667, 329786985, 287091, 368720935, 8112, 46089125, 241359547,
+            156795275, 2138581423, 3549447, 80150954, 18266201551, 3356344, 9129861, 1510573766, 475692742, 370996003, 480500, 10524955,
+            351500, 368484879, 293364379, 7498683, 201250, 357624631, 254623677, 24239706, 90367325, 694379075, 29433859, 7970875,
+            158355, 394450, 38341017, 394905847, 122840861, 15418546, 1301159559, 20161869, 379538341, 12821523, 487003583, 94380923,
+            39671723, 1191183149, 282439729, 255653905, 3119290291, 507887081, 6683125, 888125, 7670403, 4652649947, 171454670, 6661655,
+            4011271121, 3358638, 49179845, 92148771, 1681750, 3141710, 179816, 6600, 4146788503, 23510097, 3871384, 144260935,
+            1930218627, 523250, 801415069, 195965198, 142222234, 2728534919, 266449825, 6858466853, 79356823, 34370413, 328885665, 758961291,
+            2516502469, 50512, 1273912, 652190, 448434561, 113976687, 470412721, 1346016962, 90453243, 15976625, 1768125, 5695858,
+            368678109, 3907476095, 1263942757, 6125236, 34735267, 158424, 6468488, 47720343, 43406355, 134838286, 450537997, 4966125,
+            4343704, 24905276, 207362181, 2755038, 4622750, 149261853, 4086159, 51412012, 823768, 87298225, 29004794, 7440,
+            115506, 26691931643, 265734, 3742772, 30184, 1123750, 220304445, 29640, 1489125, 5116364, 50600, 1210736031,
+            222950, 3055941, 4021785, 756815059, 1088482317, 78112002, 64633228, 93808, 963911531, 879776565, 174974591, 3108065239,
+            661455091, 48557542, 530101054, 10524872, 437320, 148210678, 322983451, 1917190691, 439227113, 14860615, 26965978, 68561045,
+            14023555, 67165878, 4472523, 3635620, 8232, 1209992, 1802835518, 1094385149, 8316, 188324521, 10997266, 112431234,
+            9924362, 6161606321, 10439286, 10310521, 1167250, 72059403, 85581001, 1292273998, 18960095, 111100652, 480438, 1299185107,
+            208864701, 178816375, 234255427, 190728213, 9537801, 6168066463, 26676, 95261047, 40852329, 6640353, 3218835831, 11662696,
+            3141855, 110735875, 2691117, 7265169373, 137025, 328799883, 749710871, 2097651635, 2927144, 6489045829, 9214750, 544856,
+            8357349, 79121308, 349383082, 302228839, 244600629, 788387319, 83563755, 17436237, 285981293, 17565015, 56799379, 87040745,
+            61091979, 25172565533, 1382290, 47012251, 151901884, 743851479, 5674515, 100216924, 1489250, 224747361, 3445656851, 337878827,
+            544887, 1041071109, 333582639, 1756411423, 3775285617, 155657975, 692769545, 1778389555, 2390710, 254752646, 6425762, 125137595,
+            6941308, 151880482, 605780021, 8246865583, 76459515, 3353988395, 4901875, 63774865, 1897064, 3098824, 390098354, 201474,
+            416024, 264217811, 3878565589, 10051998, 7029977911, 3341561279, 20140617, 6017935, 131168719, 562704177, 19346782, 5781875,
+            2848298167, 86203689, 888250, 76502310, 2608728771, 51800, 865150, 1092882835, 22737585, 823875, 1461896233, 660317515,
+            201500, 9180, 629797147, 11539633223, 4086502, 308750, 243656342, 94192, 74849841, 17114630, 156237458, 19775998,
+            781011, 228975734, 8932200673, 267330019, 974168, 198906006, 200086315, 180075, 73841523, 180090, 220411919, 5953612,
+            160122347, 246274886, 1446375, 634411714, 158466, 28060487, 652239, 853098233, 16384707, 8572953001, 20462645, 909558,
+            166196459, 384260469, 2574130429, 5031848, 206503913, 730415738, 6447250, 62444230, 981962069, 42655375, 10050487399, 523576825,
+            286410674, 5848414, 1671846955, 72765, 5417170, 888370, 108439526, 8280, 29744, 734322017, 436050867, 1003081359,
+            4046921435, 14152523, 42290526, 231595234, 131791225, 29176609, 2307044831, 185534583, 437552, 9774075, 14167735661, 673785,
+            539652619, 18788511, 1608960745, 2111751, 51336, 73240167, 593481926, 38319875, 547293461, 122261675, 3227875, 58623873,
+            2782858067, 29047865, 502250, 101979141, 146686574, 774758345, 1296351, 995588, 6597591, 1579620841, 10302870853, 791757043,
+            2734263, 583608883, 2462587207, 3358130893, 802575, 417850147, 57379049, 234749275, 5760534, 2691325, 22222655, 8185058,
+            1231659, 148897281, 1446774, 127691837, 345884695, 2802926009, 1510785, 761332, 1611600731, 3705445159, 952824, 23725075,
+            10988205943, 218008306, 8464, 112796255, 456376219, 1038664, 5543450659, 49223042, 179417722, 4690146085, 14281630, 930920,
+            673816, 41217410, 13804881281, 54588875, 23939366, 531024575, 8314677, 13907302739, 502779235, 320043581, 14372578577, 11383827,
+            73926853, 153211383, 131748453, 6898073, 280508470, 159156635, 6777873823, 430148467, 2104112197, 281215207, 88285799, 272974933,
+            223125, 18209125, 33125911, 437668, 896217517, 1681656031, 70020819, 11247650609, 178258717, 37311197, 201720, 716680,
+            10675625, 66930122, 15304114813, 6490341, 7649343, 668366335, 984473386, 223155, 9812012129, 2432002489, 572791557, 24905573,
+            1251966775, 3163420, 459703070, 12135110, 4043578, 7928375, 35250775, 169458927, 38007268427, 746620457, 18444998, 45252529,
+            16449251, 201144, 10632875, 207083635, 5846470, 4629255703, 140784357, 135912212, 262737111, 308792, 9688436, 758241,
+            1586768183, 41174577, 72816, 2172557823, 5734707515, 52136, 2627037, 13229757, 2026120, 522031631, 244528, 126468559,
+            17462799007, 5460125, 115884, 68411145, 252499317, 19754670, 43041878, 53557898897, 1786953553, 268854099, 51678, 845625,
+            5438691, 5179760209, 31537682, 223184, 5862627023, 15826779, 2884630, 10496875063, 8836669115, 168557478, 81718126, 4215354,
+            775853089, 781218, 54052375, 7190564297, 1549787402, 671779055, 10096205, 373207215, 2054446942, 1545408985, 1787146745, 10324934989,
+            13444431, 3721718, 330616, 1083782725, 180233405, 4558770, 1358766725, 95120, 117990, 438154301, 652509, 27116375,
+            117046349, 802750, 8143058, 1982138137, 24519355, 438012, 3227915035, 4022018, 26536881, 129688053, 1538605237, 91612703,
+            483205131, 43621435, 17393649, 899200973, 59525518, 841143718, 58259201, 567112, 53365655, 103073971, 68175107, 507930505,
+            47313057, 91183546, 402396953, 10063687387, 28361277, 539910327, 5674851, 73562349, 374151649, 373527, 59117721, 16320663,
+            29970, 1005249707, 3187070971, 650508655, 36710375, 30850983, 19239495, 5558732481, 3700250, 22585480621, 11126457, 65728355,
+            117862003, 7155837, 128894125, 159528, 9023762131, 2326588, 16749678, 2348125, 257543195, 419116649, 142952199, 205023247,
+            631098, 14316752567, 1274936, 37483220, 7284634, 19904875, 34971937, 201825, 7509976765, 10640, 695750, 8880,
+            244755, 73583770, 15375522383, 1246643827, 1419464189, 27459861, 3292515, 3819671479, 15955695, 12950875, 188174822, 824296,
+            17222020, 51597, 125567338, 30192, 3464643, 51504, 1180838581, 373750, 8624, 4258450, 10723073785, 945325069,
+            14753739, 10074339, 437784, 4095041785, 405916973, 562403705, 37912372, 674163, 78992557, 425383894, 473010358, 1043089077,
+            8722750, 839469571, 599126801, 245754, 137268, 73125, 689808065, 716870, 107495445, 4193256509, 2575997979, 3557908783,
+            8976, 81781798, 3721734, 44608865, 401731635, 22716705481, 721852351, 151000885, 182229625, 362733437, 2482096747, 30160,
+            141685996, 394864, 5830024889, 28017955, 459459, 2702737015, 6685132287, 201872, 4516083, 19840806, 992393479, 36494427631,
+            2469992239, 953127, 1317992, 9472789691, 1971728705, 192896725, 35830509, 434977815, 9828, 7885625, 13294578, 6018425,
+            494709346, 1064079929, 639520297, 625462045, 131963282, 154156025, 1081917, 9495354, 373626, 15032875, 52442875, 40880284387,
+            43814771, 8315006, 64827035, 3202867889, 878424326, 378122459, 739108645, 28468726, 186500226, 209552057, 161002751, 7082004653,
+            436115485, 7626585373, 4234165039, 68368443, 61972449, 521495299, 1172940177, 40937805253, 180500, 244987505, 392524135, 395250,
+            11169548, 10169993789, 7619974681, 417774, 51906338, 84680375, 13577781605, 716486685, 23167365, 330625, 45939625, 178022943,
+            594598277, 820110053, 5267241, 21945776071, 2326569, 3271191, 24819970, 274906915, 164071995, 566865, 374516714, 609752,
+            1275274, 953250, 197189391, 7326768749, 4838015, 8712, 3892581433, 31452125, 7129395003, 9323769, 276860085, 185234455,
+            2841495371, 16127514, 62337385, 463094467, 38749545, 51750, 825282, 631600541, 395199, 128250255, 309320, 15247557,
+            1167572, 14775375, 29250, 75558625, 39672475, 470692562, 721551985, 3507304, 27438565, 3018007046, 2888134505, 3163972,
+            3228309, 17629983, 162354998, 1153087067, 929399685, 10998250, 1925776407, 10268170, 22759625, 34950570, 4108390, 9431125,
+            14925694, 9751701211, 85302837, 3724697603, 11427094, 3099411, 1318125, 1618617, 4623460, 44158242, 3365042405, 65942426,
+            706828397, 4172685, 83371145, 221979166, 38277382, 94338686, 3311642487, 8065933067, 20806555, 8508115, 7370727, 12371645,
+            674250, 134517515, 122326995, 2798978, 4570082589, 100305491, 5417577, 4215277281, 287793, 901690999, 630591863, 136728098,
+            19212227023, 1253190543, 197232385, 8105575237, 183667778, 1383878699, 806781603, 2455695, 7778554, 1790343, 45918258, 51376,
+            20656323, 17694314, 73416, 116235, 802102598, 12011497849, 37011117, 734279623, 931736, 9452612, 19454435, 86526285,
+            175468990, 85603570, 1618768574, 14590792417, 244904, 1425501, 22223125, 4602598, 1127181209, 1449126201, 30360, 524216,
+            561845767, 1940694, 6018782, 17337863411, 215046923, 7263282, 396508, 141879387, 6726874, 140548681, 6340542, 81932578,
+            26816068, 94231527, 1280963717, 99253869, 23360701, 2919942838, 1840246583, 75258235, 160638049, 863207891, 276924578, 1361299745,
+            363635129, 7456625, 11164675519, 20978223, 148876343, 121940273, 419503299, 916114265, 890637502, 180625, 369344261, 55533753,
+            202125, 77984049, 9539196403, 196352481, 1189377, 30294, 2484995123, 223587, 667980467, 3688811861, 3142904, 45553475,
+            6336530479, 3121125, 444314506, 1404081, 67918058, 2090907, 19561868, 142416001, 576870041, 60277070, 1676526859, 25750414957,
+            1002545735, 4183297937, 9366867, 404221665, 484514630, 215239975, 41883325, 29670875, 479864, 244902, 2442713045, 132693302,
+            93179515, 10932834, 33233739, 178409449, 13423375, 63110229, 925835534, 1329427255, 1277765781, 15591125, 131191270, 51450,
+            4628419133, 3979690, 2189964775, 914075331, 223696, 19067906, 4507088795, 2327646749, 116250, 582945878, 404092931, 331398,
+            103932868, 1893002695, 359128025, 1583184291, 4153292735, 2796745259, 3185650, 13316394, 62960051, 29391875, 467301626, 3010538201,
+            380827051, 2928015, 21953567383, 4752375, 105864770, 31739321759, 530660253, 28533294, 1468456, 397654061, 2375662663, 10097046,
+            3347099587, 162033249, 319142411, 48172047, 844155, 6205756661, 606918326, 1597401, 1361768, 2022896827, 596594566, 309488,
+            888427202, 38663989, 405337849, 266409, 662421643, 69141345, 659309519, 22158942, 68840886, 2981026619, 147502795, 1533042,
+            7895538521, 8122059, 47807230, 7252356791, 1144502126, 669182033, 2305625, 51975, 18338495, 481275, 1661750, 5675319,
+            3750196161, 11354665829, 84337162, 171262371, 5222429243, 2048024, 222687725, 16385050, 5525037, 4550572903, 173108221, 1017720142,
+            99640541, 145012978, 7220675, 846153, 8551288, 64011783, 166712234, 40628459353, 4115668139, 84337245, 30293417, 68454625,
+            12693747, 1273773787, 56478279, 1405513681, 2122613965, 1093098253, 46176050, 753467741, 1345868007, 2863707, 10161125, 491189881,
+            499345847, 71652625, 13292742, 11162657909, 127327655, 3016741091, 10967881177, 52314405, 124558915, 258852925, 358591467, 768406010,
+            323113186, 86869895, 280509173, 649608297, 1431119041, 1661816, 14689870, 3408655499, 5759047165, 7929004, 416627445, 1447173,
+            717409, 286389935, 1438845718, 113698669, 9471330583, 2387768045, 4623289601, 30625, 664160029, 20270222, 61071550, 595822045,
+            1063178831, 23918949, 180873, 7936661633, 3195935691, 503750, 266500, 3829595, 5469403973, 774737635, 32912187, 9200,
+            18526033721, 1661835, 128530030, 2944003013, 202312, 9259731, 309690, 1060875, 12114762, 461871487, 705819961, 3698921149,
+            261814889, 91935195, 932750, 5197188905, 26043813, 2520369, 2843749381, 111316877, 1133405845, 9603165, 8305224353, 11749465,
+            3593625, 1452474775, 8910, 109384665, 2112572, 14282091, 1655536253, 52378935, 2229886141, 10563024661, 817105595, 222300442,
+            13981625, 5246185, 13902367043, 675600298, 120051789, 1318492, 3450529865, 161583070, 60599265, 8916369, 4495062, 159250,
+            356981793, 36251896223, 13112013487, 104834529, 9925250, 100391915, 7424618947, 374302489, 54417935, 116620, 82341363, 1146834,
+            439485683, 4806754843, 1576040, 30529625, 383102329, 170210885, 41282631, 65986503, 395577, 415661727, 417978682, 14904575,
+            138040, 33491549, 4520052667, 1630252893, 38170467, 99232705, 18531836, 5203310, 867790, 159500, 723548463, 1744843891,
+            31323754, 1769229, 674622, 159544, 45875709, 5814765263, 39994829, 93394785, 5732175683, 70386654, 388832986, 478548343,
+            3142875, 728914043, 46948825, 524472, 70644025, 729322022, 178538558, 1871175097, 7580290159, 510656882, 6511797721, 2520477,
+            377972686, 9442935131, 154886303, 50533197, 953667, 3679375, 25421487, 1492353137, 29692611, 640379363, 60406073, 592001761,
+            343395835, 25872148, 3550625, 3658005, 140398801, 1211210, 63754405, 66737671, 1030619645, 245456, 2627612, 3937098,
+            2949704, 124602247, 138105, 216635185, 13530946, 8304773737, 1790750, 3724183217, 4130217, 249838625, 2198625, 821784689,
+            2208573445, 131877993, 49631806, 1679617849, 1898052, 2814087651, 131728121, 417136, 1049228089, 46305025, 6680840287, 674696,
+            730803021, 1103895, 2890753503, 522890919, 181818, 507351733, 2260470958, 245480, 631750, 3272058, 61930099, 753961546,
+            153276629, 181672183, 365461395, 464855007, 2735425, 325238199, 5611137, 180264, 809421842, 12888605197, 94668, 160123355,
+            594062331, 140849565, 382565854, 7695760943, 481545, 136136, 492692629, 975560, 935645937, 1211301, 330832, 56793511231,
+            319657430, 1353144242, 9379941337, 52326, 29113154, 4688307, 805129435, 626192405, 5053250, 263639383, 2939216989, 8487372,
+            15677375, 92879842, 3250302, 8856, 16256875, 159030, 894544301, 50490, 9860907, 837173711, 2214454403, 866363333,
+            4845582131, 4342532343, 114836462, 41132234, 237583225, 11320580, 460161, 6534290, 4066952, 7743881293, 9388743, 347903198,
+            44266035, 776927081, 51112831, 12243315, 1104376, 21150465, 25314289, 237025327, 436223451, 14526317993, 181125, 6126375,
+            35706092423, 396198, 41046687, 26172861, 9450, 268511553, 111445257, 13589136187, 2381415127, 66115478, 10268778, 39093418,
+            11084391, 217944725, 2456223, 1018215, 31212, 2144485109, 6091681739, 2305935, 190064318, 51456218, 2735262, 235887869,
+            11449262, 144004705, 14711613, 13896025, 28920125, 319979933, 459360587, 696290, 21880210, 137780461, 34200068, 815260035,
+            7478588, 616577065, 3266763929, 16686215, 23082202, 435837143, 506557727, 227624579, 52743945, 5986233331, 159705, 9565338827,
+            1318707, 3063015659, 55019174, 224250, 296263253, 32461556, 2872853477, 2606420, 757138265, 354900183, 29413769, 64527306,
+            3507882, 331338, 867560, 8487369, 39437013, 2989655138, 1404594, 27868478, 294696479, 1061242, 838762099, 5545919899,
+            30851821, 146515486, 27332085, 1475805373, 193305242, 466421945, 10200, 8548615087, 1808224327, 163943818, 1868792915, 4194801,
+            297529702, 10333212, 4244532307, 3856803293, 147717875, 181994285, 4731375, 7710678079, 524799, 53946035, 1505660425, 181016,
+            141794093, 524552, 5888490889, 61565405, 165317537, 2670921, 26365996, 152160502, 7779250, 241038981, 59462039, 147095465,
+            369924335, 49009555, 1984125, 4559842, 14861825, 30057734, 53581178, 233848953, 4354401515, 115738035, 20030246969, 202554,
+            352408, 1652596143, 4637434109, 783473509, 69313538, 30996, 95312, 92493615, 1454771689, 986771093, 714963535, 94747205,
+            832988585, 377200274, 9520, 35938595, 1064016317, 3117231257, 6405375, 567675, 130161265, 373980926, 63947958, 6169198,
+            568242493, 1367910947, 1268301167, 87127887, 30208074, 868102066, 1695801205, 1147125, 15162620, 19749317839, 258402746, 425470629,
+            1746625543, 7070945, 2354479202, 2196060815, 10536711401, 51091565, 167914695, 5096294, 40648677929, 90948325, 14175161, 1040879281,
+            3224632177, 13316655, 2714950147, 454231415, 417582, 2319322837, 336077287, 771432753, 138375, 429892011, 59848415, 7929441,
+            158943113, 5959361849, 7500185, 4100107957, 115823975, 3165128, 758447643, 466250565, 478634738, 3336375, 3302349715, 279715449,
+            1729283543, 141064198, 282205119, 1902103611, 1243790483, 108140043, 374440, 30916347, 33256366, 31080, 43922870, 3979989,
+            2840165489, 975468, 739375, 452707229, 4073472385, 880099945, 15763475, 54826135, 40402999, 1168804, 825220, 896926906,
+            66072747, 80710509, 1233375, 138424, 248400943, 30894045013, 6279546871, 4516576051, 38643033, 21622874, 195280005, 8220875027,
+            555751105, 3593954, 6105125, 557639811, 747909331, 1800562191, 28383625, 33534875, 15441543, 557747102, 56199807, 1915797037,
+            400122921, 1625724661, 4692701453, 428625769, 23232625, 322255162, 111746041, 233934909, 10784125, 1083290133, 2198984, 34865545,
+            183840261, 328028701, 14239645, 95634, 10216912823, 3067609061, 718250, 3912457021, 245482013, 3551108, 22654954, 91077194,
+            809808753, 3343150947, 10226125, 51478414, 2048676, 241575785, 2762748523, 12930375, 3551079, 22374110, 152633327, 278985771,
+            7378774469, 10777590769, 117045, 168258129, 672531118, 202878, 66909875, 151452470, 4774561363, 53244, 11578190, 1576696,
+            25630823927, 75600287, 1199727035, 26883189863, 31050, 986771137, 52360, 31185, 11320715, 1662375, 87943196, 5267912,
+            88501677, 1409442001, 41991411, 8392579091, 24863875, 2950155, 146387170, 1986195761, 10901303491, 19068875, 191352382, 1125873,
+            288765, 4864405517, 31388643, 709597955, 431780909, 270937401, 6338720443, 2025794953, 54010649, 1383375, 52230992909, 9800,
+            224808, 52728, 266043622, 138750, 12975509317, 763298419, 775060141, 29582891909, 3723102, 2778159023, 9268527281, 35659827,
+            707988281, 468225147, 1289978989, 57766731, 6448695, 566697439, 39266290, 524745, 312618202, 1104375, 1793500969, 45597125,
+            1811486969, 35917375, 55706287, 6013040903, 1707198241, 11556875, 7997016257, 2671970, 52121937, 76396593, 67231918, 9744,
+            706915165, 98761126, 669612307, 10266127555, 287055965, 1555125, 18258068791, 970695427, 61415486, 335154547, 2000897949, 118034825,
+            180384841, 4259439, 829640613, 6417854599, 997101, 298152335, 100220549, 17716797, 5912127, 6706245, 490267678, 9801,
+            284373089, 27675609, 14282703, 34500851, 169975299, 1636413361, 4667350, 520981201, 5761899, 3207789, 680043507, 18081635,
+            147889885, 100648966, 178088379, 95625, 1365357091, 457493647, 10039928833, 31646367, 32697951, 7049679, 9576, 4220987807,
+            4352362831, 2563925, 6695049323, 7113992, 90905633, 379754710, 5100498605, 3486938, 225113834, 28169295, 2799686477, 3143224,
+            369645627, 160083, 15162658, 210497485, 3230684995, 395560, 374680, 214446635, 332120, 546250, 9680, 9240,
+            117208, 3636875, 669075477, 4581587681, 1291588805, 807705371, 179461945, 27224939, 4251443819, 29691623581, 1368426455, 4143871277,
+            2263470, 20851979629, 798111523, 130096813, 95418, 367348930, 6169750, 507545423, 252457623, 180685401, 246568, 2800410,
+            22889439, 109599961, 88458903, 9840, 396165, 489752626, 1376646791, 8917095, 7307307, 1812525, 1920078, 3358092,
+            390593645, 11622130, 579489449, 747308627, 15119754, 25995416017, 26559621, 328114705, 1981409829, 8530753, 3121986, 127349873,
+            84509739, 1846064663, 4710285, 6433844271, 1022228193, 888706885, 1748439, 1979671199, 996632, 32526347, 483077661, 27783015,
+            11630487671, 4130750, 120567587, 12072125, 185020979, 67317926, 11416694729, 1598853179, 25572365, 210969745, 1297725, 932824,
+            1647423967, 4946403, 610929, 1383561, 2478175, 117624, 462087302, 439208, 1234926478, 45017819, 2668826735, 3894506,
+            108269315, 7966045351, 2220625, 369946239, 3100625, 847025765, 2714283, 3496053613, 5430492353, 8745225, 2247701159, 72511985,
+            1189231855, 12587479957, 31416, 63905303, 16729625, 14819406, 598741819, 38401609543, 3401125, 12176120099, 160208, 24520925,
+            2056895093, 6341140, 49117299, 1362140, 46112495, 53259674, 8337615, 95823, 252200221, 1341130, 1133900261, 138736,
+            2413827, 60235149, 10011729, 39029705, 117306, 228912266, 43365125, 31464, 4753294, 14350450777, 1953680053, 142932097,
+            12115103, 4538710, 17843546, 2306332, 14991158, 213116114, 722154238, 4292330959, 51948, 1018875, 160381507, 330754831,
+            8294697, 439230, 78714762, 61952726, 7149721603, 7758153, 782595, 32633458, 5525750, 2609159609, 4152357, 5204210,
+            14884030, 181424, 32569375, 636881615, 75237682, 33771290, 439263, 310365, 272761853, 91378012, 4753287, 143254258,
+            61501517, 18879658967, 94941158, 374861319, 16435903237, 2054212303, 38579035, 69442821, 22868153, 11598701119, 34479434, 6719452895,
+            4614833597, 2074601507, 5096750, 204831445, 31280, 503608, 66631191, 1045022043, 44095051, 1666955405, 306823647, 241704861,
+            51607124, 1377097561, 8903227157, 9754125, 1018536, 4236088, 54568995, 1121687897, 1619750, 29993865, 52440, 956165177,
+            1083208, 53753356, 186094265, 5976775, 16380936517, 426587187, 31000, 475522861, 2986264561, 224664, 2478322, 636967513,
+            55963852, 10032, 776713102, 2392533, 49997450, 32016, 20120925, 13424466, 53431610, 298882355, 16064405, 2387897605,
+            503792, 10192, 804195, 1641255, 2349464, 6792348, 1834250, 374947235, 7500038, 2088080981, 8118411353, 2150151971,
+            63518862, 975245885, 9932549915, 2545650653, 35080625, 222376, 34329295, 1062138, 7543540, 95480, 654472, 114171862,
+            512804201, 132672925, 162077201, 20807787, 4020588043, 25653059891, 89768126, 1501346965, 3036745585, 6792429, 1619541, 498724369,
+            1843016461, 97301897, 229471055, 3723125, 23683814, 35555186593, 23233105, 719836221, 9604, 894909829, 1576875, 524158063,
+            177616465, 33921596, 503685, 64120090, 4367125, 63776713, 55685162, 1439340383, 180964693, 10044, 3125774113, 12437217,
+            1770093, 795836774, 156110575, 13767875, 841188007, 10848981, 2959908055, 51836310209, 176715125, 122756218, 1705496, 42785875,
+            2509206557, 1770125, 2972008, 464426557, 24392102, 274285995, 1233428, 551523554, 74143375, 5247135, 611147722, 52624,
+            167872285, 6159676533, 92408365, 1609499075, 804750, 57877586737, 57981749, 828632427, 39974180, 5301993643, 1259738038, 849451325,
+            16288130639, 10484138, 47293129, 7373237501, 934294585, 4023747, 1898936, 28684338, 360223171, 43322375, 196868823, 8087332979,
+            5279156966, 30966762203, 9331972321, 386279778, 36196825, 259090095, 203320, 482517, 138060213, 126298491, 412872603, 9069952043,
+            16901577, 216764977, 2211729427, 774953283, 2294834165, 3791427703, 111896732, 31485394163, 1577114, 1740959987, 23791313, 1863685435,
+            2474779967, 97130299, 1011346754, 96250, 126706307, 14378267081, 1473015995, 32204715, 74536, 95304, 2816234773, 123057605,
+            1727271, 1770230, 2421680599, 1751627215, 11166452, 497265015, 2220925, 31796443, 6428422, 3680390, 9396, 3809187,
+            4539051, 23190279, 3487250, 2284750, 5154499933, 1826039345, 611320, 194829895, 1877750, 303067803, 46515954557, 782920,
+            7285894, 958783934, 8402275, 136458, 578717009, 2877125407, 589744, 2950486, 8445268, 13188591, 2980169255, 911625,
+            7071603, 527592331, 29822375, 163966462, 1212162, 34243610, 186502393, 73500869371, 7329663, 2133046115, 566118343, 640294509,
+            4064450, 4302909, 546858, 19541625, 241984171, 38472054, 3328277459, 285897469, 53240, 222388426, 387154226, 7295734711,
+            3455767861, 12544675, 10466442239, 55878473, 43558658, 54097043, 8854742653, 4993119687, 847210, 6384807, 14862705, 6062875,
+            3399899767, 14654603309, 30273129, 286824, 102324470, 45554795, 1772403391, 17996319, 399200659, 821055873, 78200018, 1545110215,
+            1224131051, 23984508, 1162188833, 51693213, 449574307, 7476667451, 1252848157, 207643270, 115320, 4324375, 139128, 4452273599,
+            129260495, 555022039, 58582850, 23147421, 1770363, 17804985377, 61737897, 1227930026, 2950750, 1054852469, 596316837, 15611882,
+            12072555, 62596471, 140400533, 1169320, 26044929, 43752532, 9453944, 12458875, 2802047933, 25079131, 372566246, 10296,
+            21773829, 2756840, 8380881, 1749845773, 357884186, 362670707, 9089050, 8027022107, 1822047351, 64850110, 4324419, 589875,
+            21600082, 10260, 2435125, 15313090, 2089175951, 74704, 4314180679, 1792149401, 41818712723, 1070905726, 461032, 7457934,
+            180771788, 5719525, 48023092, 69378785, 2468405615, 20292909, 1280106715, 24328018, 533795138, 1182986531, 289710, 188648915,
+            96200, 32741397, 24607683277, 1775944833, 3122526, 137640, 4017905443, 342838966, 1233765, 148319717, 71482229, 1364842563,
+            597969502, 2716861433, 143962819, 5721509615, 697125, 1635555691, 55470842, 1057385095, 3149169131, 363765038, 14712555, 223568917,
+            156990801, 6922083, 697221, 632835, 12566125, 31944, 27719146, 179484019, 132651771, 32655699, 182040, 10440,
+            432275218, 4020480569, 162377876, 500806655, 362176534, 27739456961, 3280136321, 161884294, 110287058, 231724969, 1118211261, 4023459,
+            544419407, 396750, 4739212451, 42292525, 3968004061, 3366353209, 24600, 3764750, 122049046, 33600125, 11109967541, 10055045,
+            116897937, 61695354, 71868602, 209381998, 441203873, 1427085, 195559837, 2129054177, 1363662157, 24752, 289432, 983251955,
+            8466875, 330948219, 44438875, 22589974, 509670795, 54658695023, 641947319, 500828115, 267894, 4005757441, 34716125, 2063248649,
+            1362739261, 299612495, 9196642, 8917623, 5035960013, 1512875, 5569508, 77556297, 1521565467, 107132311, 529009039, 807942187,
+            92065285, 318714565, 297079845, 556910939, 6860465261, 28577731, 30870, 1405772709, 181548, 49439995, 740259, 24969871537,
+            192404821, 20400616, 489044933, 91550173, 941484973, 684916287, 30080757, 61394682, 2473943173, 40103375, 804958945, 4689416,
+            16521948883, 375375, 846360977, 40683346, 303797823, 19799390, 525625, 9511710, 12480507, 24221090, 455583997, 255547942,
+            72460686743, 37314235, 363743781, 150401669, 71911581, 117912, 1513204, 5481544, 1481043369, 204295315, 443713398, 35102529,
+            237713203, 2497616897, 1877582, 1941723, 421393695, 6353895911, 5204601, 74925, 3959725, 2342954515, 10500, 163687375,
+            1114455355, 172422812, 31432375, 43966804, 193778546, 117800, 268125, 39137329, 15914625, 283214798, 1483704815, 6256110,
+            991193349, 1463744198, 41627271, 11922625, 1942148, 21065737, 30337775, 1237288151, 21086596, 398857706, 160816, 7908550,
+            203500, 2063248741, 98139503, 353648, 13918597, 1534250, 70945777, 53360, 5693908415, 1078140134, 8568, 3948666013,
+            40355382, 2694647317, 3873566963, 26903588, 33814870, 8072416651, 15340217609, 1886822911, 9003580, 23083375, 1342650001, 7243533,
+            156626158, 2071035, 1088506441, 139069007, 15785889, 90896, 6063356, 1792175, 889759498, 768064029, 76418875, 7091420,
+            2469715114, 24929125, 5422723427, 20593625, 8724705, 78844205, 418281549, 7190459009, 2122593985, 1411696507, 5609365649, 315624023,
+            1044829487, 69979987, 23169550, 2156875, 1972611065, 53592, 298346170, 321934151, 153730045, 19692189, 307532493, 1910561093,
+            3028354133, 10608, 439875, 1194512429, 1279827669, 5887891141, 1314361841, 18425875, 11965690, 104342294, 10798561111, 932127251,
+            764072023, 7265125, 245719175, 7587125, 461370, 637869529, 338546522, 1856088017, 696334834, 702322825, 236489979, 24512151719,
+            114107961, 10227035, 11471889, 246500, 84446089, 160875, 162571409, 41477163, 74187278, 300406795, 2034896215, 454425283,
+            2832976447, 18039567, 83394410, 3874468505, 10828252, 17782513973, 74530210, 14090375, 57440235637, 7028198803, 107604695, 4005242563,
+            760144273, 2526871123, 424978325, 2280347111, 923992823, 3614487191, 488444215, 119237635, 1565886842, 10183779, 7394002, 3251625,
+            1130896151, 450068333, 542960195, 3852625, 804232, 84338815, 1067322373, 139400, 2370813665, 90155285, 1417513069, 262309983,
+            56930601, 30402086, 33084142, 1491367251, 2246843389, 38837265, 325776117, 66889405, 125118511, 2075762678, 3745014, 1787299087,
+            26860911, 120546925, 337494982, 166906906, 431417021, 801203039, 3122847, 1170989057, 38493875, 20357645, 22568409, 614968635,
+            32130, 677941033, 3756808393, 525825, 31990585, 1074577273, 14541175, 683821901, 75131225, 214769534, 1047727051, 442878271,
+            35252866, 293066529, 54998958, 36047110, 37807055, 688522307, 7141587893, 448544305, 396981, 3658350, 437598371, 308155015,
+            55256465, 92044086, 4281875, 368981181, 342667545, 805194, 1320457439, 1298511, 10530, 1660710331, 15013453, 11906309513,
+            409159927, 32144, 863553097, 1352930997, 51414545, 4885740769, 32200, 184893009, 47680087, 36090065, 350759234, 4494770755,
+            1083915, 7308250, 347775366, 4797064, 742136941, 3293722751, 31474222, 253402714, 1135210394, 486341049, 1040440, 1269954959,
+            26947396, 44718126, 118638, 3788125, 44567721, 225423, 21130375, 160833043, 16250850031, 4164605929, 32240, 282679111,
+            570068486, 182476, 521583154, 225500, 1255625, 31754478, 535791854, 3384876143, 118104, 76891254, 29871119531, 332750,
+            8774814957, 4625355, 45662617, 713012183, 318607370, 758427369, 5033182, 545020765, 42786575, 40171020139, 16751966, 71804551,
+            2663182781, 399372857, 1817519119, 67855359, 5419375, 847875, 76826893, 48366955, 148813795, 590136001, 3766826, 2006875,
+            653988417, 9304295, 16666375, 912209779, 860956089, 332775, 219276837, 147225547, 5602519169, 6063375, 8531608, 246924,
+            590382, 951122222, 133617994, 78672730, 375705, 2307361, 604795213, 62124702, 271066293, 705671326, 31110794, 2336880813,
+            1105425, 2552627077, 440131105, 310108747, 69401002, 2157165, 38296656527, 4732710, 2027896, 9304335, 175664049, 4118374355,
+            2828855721, 15759111299, 653752, 157763859, 15160207765, 3360794723, 7570418767, 32472, 3081475255, 12046656203, 497716378, 2678378681,
+            1322904401, 525987, 53865, 53872, 135828777, 182655, 1598918451, 90713595, 11794055, 60364843, 1587414367, 3812805537,
+            309936605, 48492032131, 601597315, 2539792073, 37056005, 87279445, 350394364, 1899639, 1257935842, 92752527, 546888135, 2457688,
+            2564586, 1236773365, 7132015559, 46113418, 2471024613, 75400, 2543541, 118164705, 12315415849, 38972826791, 7887850, 96525,
+            418760, 14973522629, 1626949126, 6700265879, 32368, 1020490705, 13939863, 3566818083, 27998572, 4077573123, 1856745, 290004,
+            2801018361, 3616750, 10920, 83394619, 396552, 75276, 39631625, 4550767899, 22246625, 552421618, 3507601591, 112799125,
+            1491875, 5419544, 5042742807, 39502866, 32292, 45469622, 1257742739, 847989, 7403093291, 201312419, 826551, 332920,
+            64464323, 47358311, 370526695, 726426365, 2006991, 75480, 2522156, 654534, 11000, 11171625, 438199718, 311454,
+            1527339909, 5312346, 1577745, 373896425, 18211585, 9175628, 326892303, 891250, 11149775, 28449449, 226381295, 47572970,
+            9607794163, 15507225, 80294274499, 72749622, 1878268, 511645953, 654852, 22675854, 1169976, 2844088, 2801175, 1406152,
+            99599311, 21216429, 59721051, 53046075, 10416, 397398486, 869505, 987223133, 75346115, 3037265, 1127061, 139656,
+            83158647, 770961955, 1395127459, 16558971, 13849054661, 225625, 3407798845, 9668341349, 25389259067, 2814969287, 117757003, 75411,
+            976833, 21791888557, 911480225, 369775549, 665814741, 1360915451, 154587545, 13759532879, 100329082, 2801962714, 268569, 26324518,
+            1063459735, 284116767, 948933302, 470437055, 810754377, 30381125, 1380017483, 81892375, 67834107, 3916793878, 8853910, 4239235,
+            27332877, 268584, 2638865411, 216701441, 3144609, 1556442, 6764612579, 11837151, 723228233, 21710115, 283751897, 2823296914,
+            1449063, 32500, 26067125, 106188511, 78136474, 4904625, 1449064025, 1706625, 398020911, 6046524487, 2832161189, 245655085,
+            1529507357, 12974948, 13060761683, 6913779929, 135142204, 13360578307, 235524573, 1610959454, 676396, 131708031, 201634433, 2007148,
+            75440, 153406810, 1363250, 75460, 1555983, 8682201, 483208, 13640081, 44117542, 43452266, 1586919063, 568912,
+            8102625, 11403560543, 135657302, 1277380, 45276627, 1169630, 590824, 98805343, 624884953, 804015069, 1183566639, 398385845,
+            1277397, 4668625, 676331695, 30574401, 96824, 9411875, 21667311, 5490332345, 9368590, 122478954, 419612745, 19027239,
+            12120381829, 1904036761, 13725963, 20508410, 35704075, 3917375, 14498625, 15077997, 6600429, 13597375, 1276072315, 19649553,
+            783783, 75088, 4196625, 633555, 1427679, 934065, 1686895601, 5765724097, 3574250, 940326595, 6643182, 2822744,
+            10420683, 1277560, 103870646, 56909567, 54120, 65838110, 5934929, 17288847, 52058889, 89490401, 6922071, 301802435,
+            216422563, 633556, 936205487, 2007250, 1878435, 6686196, 1041352, 16981772821, 168366946, 35360715, 393985975, 138597745,
+            185837746, 891135, 542037753, 316933813, 1092220301, 1449175, 9519279, 488487571, 30896411, 9354187597, 950199627, 52574013,
+            346187881, 131643743, 245741041, 34931457, 3552549, 16623378, 889287663, 3616935, 795966509, 259691991, 51758375, 101896039,
+            127801869, 429507267, 701378882, 7201285, 1312323341, 504680, 18898594, 38751895, 355932111, 34115895, 54054, 11160,
+            3402344, 4668363935, 103591625, 9218811, 2632491059, 118503, 16730854, 1109691235, 6188395057, 11536805, 891176, 38365579,
+            1351257295, 4282232, 32560, 39181175, 97092, 238314891, 483340, 12395474, 32670, 1728243, 6149625, 15707343341,
+            1857141, 58690658, 340779249, 11250, 5075660, 46607379, 446227067, 20723034, 92173354, 6385729, 552640517, 3123250,
+            2221832, 2157470, 2015451383, 12438390, 2598922957, 9004215, 113056845, 418647045, 61889061, 663368185, 132609554, 302145809,
+            40962625, 461701779, 1109283495, 26603895, 6106628, 2696472229, 67040170, 54264, 75625, 661307735, 1930135919, 2715531,
+            473527945, 66246141, 219513385, 5591625, 617716385, 590646, 18397086091, 762489, 13849806109, 2844375, 140049, 1445072037,
+            1449250, 3423826, 44997705, 17954335, 133554164, 2015043569, 267954370, 4112558177, 24200163, 3853143, 173711321, 401927617,
+            397575, 247312, 235846715, 394586870, 22719125, 54849179, 2992339813, 6342520871, 8279127437, 834406869, 1018280219, 1385254741,
+            2761655491, 106081294, 5038600823, 970460827, 998514, 9915595349, 6544809787, 40318785, 1766909883, 318264386, 5054612217, 7931170,
+            2629809, 11440, 11879634, 9060423581, 892829171, 3419432071, 757097185, 75768, 97240, 1171976753, 29115125, 13069132489,
+            16752463, 35511125, 1922838533, 247401, 153750779, 1967030879, 14734937, 2056746181, 612260, 20787515, 102969321, 4647396,
+            1129823675, 264864743, 336787255, 2028845, 194036843, 3715600031, 2633220941, 2005256495, 53969305, 2179089, 5226837, 49505001,
+            48088449, 18721907203, 474000215, 126514255, 612306, 1247054549, 29501615, 1388753301, 6536075, 48410375, 18769989, 5355625,
+            676676, 936291785, 318050187, 6793659, 22375791, 340092599, 1599615, 41907125, 324424595, 15786625, 1148453621, 189636887,
+            491406730, 612255, 3283378113, 8210223, 1642545, 1236194321, 16022721, 75735, 11515539, 2329371, 157914757, 75067746,
+            6524419913, 2965961921, 96976, 527250, 104622078, 6514638, 441977458, 88546106, 1991970937, 9326317, 612248, 31712065,
+            6535709509, 60300955, 214727578, 171865629, 87623355, 37378473, 7094230, 291006793, 51988419799, 719576, 741125, 1092371159,
+            1242568743, 569853957, 6876649273, 114130163, 1891760213, 9776625, 161448, 95693455, 3359625, 44872834211, 110395605, 10707773323,
+            16756969493, 52724565, 76956275, 28814745, 2307954, 10356604, 192663295, 912824, 19929063, 1386070231, 1553567729, 4561557,
+            1814470, 3359656, 158279583, 198458306, 1857250, 1191640, 80347202, 58219095, 32886, 26818690, 77256925, 39632125,
+            2694303, 1621386, 160747899, 19671938, 1621158, 381301613, 4123676141, 1571832742, 1256283, 1294680985, 139349119, 183141,
+            32912, 268878533, 11193710, 6138644087, 38193662, 662939123, 14262875, 2270990033, 769502965, 10828716, 3810387, 7008430,
+            34738375, 455370470, 145680873, 27612926, 1583766223, 3631915949, 784125, 2686277627, 459169445, 590964, 928715459, 92238027,
+            300321637, 1084566, 2522625, 1425927274, 10206376, 32978637, 9820118, 285941513, 57617956, 3982125, 33128875, 3449823871,
+            12030772, 140250, 57317884, 63305875, 1231687191, 476597407, 3896318519, 98762741, 565776167, 1681122417, 2693639443, 1132978873,
+            341917081, 493724693, 55836755, 681955391, 3660202, 128381695, 188327854, 814897213, 715845445, 17332133, 274029613, 2780217,
+            35339661, 1994160214, 290521, 11687375, 1964625, 307318739, 105373373, 11400, 10528375, 827080, 41885805, 4040013461,
+            2587059, 419265, 58927455, 449959994, 1299272, 2774619381, 204687, 1330932119, 128725142, 118864, 42553134899, 316032662,
+            44396891, 676875, 333500, 10249375, 56072871, 567965415, 1857345, 307018283, 1959561958, 175278857, 269080, 11592,
+            1406625, 345372629, 573803363, 165212733, 361126502, 9582511267, 13703860, 6836750, 57704374, 11558650, 7064429203, 1084944665,
+            2369848585, 31859774593, 1256409, 588591367, 161500, 311984, 741285, 2453854879, 5913875, 3870648995, 98118658, 1621290,
+            1685625, 1195714718, 26732943, 11022011, 1075715531, 11600, 114795645, 55943866, 8618225, 231404173, 13468869, 370248593,
+            19899689539, 332709513, 3080781, 1238126087, 144843842, 630057857, 591746507, 1512874059, 569625, 967885565, 13619125, 70753625,
+            75924, 202257429, 214942065, 593957078, 1338980489, 4672699849, 99535513, 1170585, 374412233, 500786710, 483786, 121857043,
+            454168685, 101080863, 4339744343, 15561158783, 7909930, 121513645, 355005, 3195444505, 1998410071, 33075, 7115878, 36284110,
+            116727369, 71011227, 2363645695, 53432995, 8425109, 115976278, 913066, 141473829, 203523754, 82429516, 140360, 5805903359,
+            341616723, 566656285, 10616384077, 4081694701, 924444521, 3316904, 1493750531, 905363927, 47444841, 168066913, 175192633, 17418125,
+            1110786265, 6442560337, 14002472807, 2119676091, 414290459, 154309203, 5463250, 5527652, 524095221, 213654354, 9451393923, 49033010,
+            10867071607, 1063348, 71333235, 2436712, 13962746, 1538178763, 10270975, 269192, 8103222, 40340643, 16645486, 3099032765,
+            15851355, 304915039, 1428050, 810583319, 122672697, 79982799, 4132557, 8017282, 3188185, 1750167, 1192125, 312130,
+            110159777, 35940723, 68650318, 894417797, 16817185, 77793573, 16168175381, 10420371, 956043, 40748422, 7690290419, 41435375,
+            99149253, 26175058, 5055477, 4754997, 21559876, 1020425, 438672475, 1192136, 66117709, 133318383, 1640707783, 949427511,
+            1232610313, 1861669381, 247779, 19478602, 799143575, 2265250, 10570802, 11966589, 19178159, 1320200959, 15572375, 6132935185,
+            7717016, 633144, 39373999, 45877594, 973659253, 4670982933, 1077304151, 355224, 11000715, 10894923, 2265860649, 26647215,
+            15649822549, 2177475991, 3332163931, 525597653, 29973830, 48024575, 44182609, 58949115, 676568347, 14413399, 821357669, 254777555,
+            207087023, 1585054211, 2115099, 31283315, 17353270, 33210, 218977187, 15593862, 703246346, 645210995, 9517242823, 56888546,
+            94556634, 15550902, 3467288, 14070001, 657208803, 609196159, 48039602, 795151581, 256000262, 608917035, 33236445, 106468229,
+            5128788769, 360354137, 1921964, 3642819455, 3166813091, 10270400657, 85649125, 870232, 1182494285, 55042174, 300472026, 4969614,
+            25638612, 891750, 3463624855, 1128364567, 11067386291, 13533453, 741608, 769696403, 3036038971, 1002183623, 13683705, 767399885,
+            218311951, 1492728, 50650416697, 2972766049, 2844842, 333592, 9155013, 487543857, 113615446, 9746295689, 398125, 184507715,
+            274888419, 159460357, 119064, 2545566515, 14027125, 69766543, 140712, 2737575, 435925325, 498038849, 176630839, 2501499,
+            81506733, 7299857095, 4519025, 17863666703, 703890929, 102261562, 1578582, 67148081, 99535085, 97539673, 15848812, 7094372,
+            362371762, 307941491, 3466629715, 53069170, 473185141, 12138425, 341702770, 170234870, 31111717, 6686936, 31669755, 248725059,
+            442428621, 2441320717, 29995641, 587432671, 3767855, 2201031, 140600, 4066262963, 1600786759, 18491473, 753384599, 1395729257,
+            484238573, 101360103, 4883931, 56352110, 25380971, 91937859, 763048, 62297455, 1442926407, 1459410007, 21925563, 183992675,
+            4297869977, 416415575, 1041761479, 14349125, 1562990438, 652186249, 32442399, 512355095, 9764024239, 4000886777, 33215105, 352756261,
+            355250, 59571655, 411006841, 9949225, 210842905, 47852811, 55386425, 171179086, 3102561, 860248921, 2123174779, 5399336,
+            19811755931, 762957151, 246342733, 2673250, 10900318363, 13919992, 6060690889, 1195329279, 3737836237, 240247179, 1101943798, 35447295,
+            953462731, 376712, 522786121, 1906892119, 505494, 2050984, 763125, 211057567, 303627485, 312375, 6042990, 6257625,
+            97470, 1256742, 1042173, 1318054727, 956284, 3843047897, 2651864, 3351609547, 107992196, 212409830, 16109093, 2267363219,
+            75325538, 187534123, 640381973, 93440347, 105202069, 239646314, 21024185, 1256684, 5506375, 22870015, 8750691623, 8833242,
+            12137746231, 482929447, 222819289, 3083043093, 11321443939, 2048676725, 205065, 935712869, 225845571, 16989154, 632720501, 859798051,
+            1314835379, 172102215, 530083645, 2973861, 1325631151, 87259029, 8403934, 34481447, 175128261, 5012824, 312417, 977115009,
+            827544, 5740983, 7199260237, 355348, 20122781, 223849574, 45749530, 1579839019, 6450728, 55176, 13769735, 53508,
+            374166, 4635032735, 2090893359, 1268904531, 698775, 3513268967, 81249454, 11856, 229988270, 240483399, 98287670, 333944,
+            1517295815, 234709871, 2075183591, 1299753, 7094763, 95758442, 8028590521, 1993044691, 385852071, 1502722551, 2885197211, 89941905,
+            27999783263, 2486092715, 91422838, 18944522033, 573460413, 1488342271, 934472, 4853418501, 11988, 82451369, 161370875, 242801455,
+            14563899, 4192809035, 69809675, 209941585, 58047717, 704856919, 3377086163, 147376957, 2544300355, 14949998, 182361641, 4286001379,
+            229966581, 24226351789, 97174987, 1068118183, 3274375, 33456, 54810, 2965425931, 3534667646, 15401001, 10614725, 737523621,
+            149909607, 96144795, 204404209, 4154375, 714858698, 727328758, 267913165, 107992375, 20852595, 71161915, 2136861, 3574587665,
+            33320, 97875, 4934849359, 58112375, 82751877, 173991126, 19665850649, 354214990, 37443471, 3459352, 3437998301, 15121180,
+            711102707, 566117094, 14798342807, 97902, 3038357231, 468463475, 413732763, 66225393, 1952114857, 9648940, 5071053811, 1076510227,
+            143041485, 76296, 416780585, 119518075, 5254390549, 3510375, 548625, 1231172657, 324983425, 180086595, 165985589, 5239473763,
+            293947797, 48582831, 31841502, 2996783439, 4624365635, 9927988, 92280986, 1916486247, 1724757281, 250184818, 458633463, 33488,
+            168646851, 6706877621, 999375, 1063750, 21346262, 462726, 741407961, 333963, 34438396, 119364, 439037731, 53734413983,
+            3034328, 1598898279, 3403246, 37357914, 43839859, 164354281, 441558, 1235679935, 487350969, 8149663439, 295643458, 7395375,
+            655960, 183768, 64508353, 2094015, 704084359, 15549250, 505750, 41232195013, 1149642, 86250437, 7695798, 788691482,
+            746345509, 19500481, 505818, 30468125, 505780, 956536, 29995693, 2607579, 5733058499, 449855105, 570152, 634550,
+            226746, 1214055, 1041353957, 6386679, 2630648, 4560250, 31906161, 2185739657, 30103294, 3734037854, 4948658, 78781325,
+            248248, 98913639, 5055976, 3811077, 51781093, 12144, 2500130774, 453546962, 1643356, 290904, 570734801, 55056,
+            334084, 1921015025, 4369986269, 33744, 91363474589, 16336166813, 565540745, 18384457, 19822510, 503169459, 153944791, 892143,
+            1364337, 6472521, 471232333, 142547951, 36434875, 591675, 90650417, 40684553, 120226431, 1922375, 15873325, 4927195,
+            6708625, 211401239, 201141941, 2353858913, 1113963331, 192771381, 23127819, 1248986362, 16753330, 4712565, 40985035, 4811995299,
+            441441, 432341433, 7674546, 3563793121, 17284981679, 43796641, 259970012, 1308933241, 91208455, 19157187, 12804225, 157379033,
+            259219706, 12168, 274159011, 5680710269, 10838998907, 27356043, 7769403427, 307362404, 194982095, 7383434447, 7495922047, 55125,
+            686441861, 15163694, 63392439, 312664, 166650978, 1600312, 569361205, 40512598, 330735561, 1420927529, 7781774, 625508421,
+            269514, 205656, 76734, 31455513, 4176050, 222583465, 226875, 9649197521, 2888270, 3832605, 23886571259, 784875,
+            91981186, 6399077009, 64680370, 502825609, 3783831821, 374949526, 19994282, 18470420, 34610514, 244690537, 139178313, 5614158,
+            35748146, 23235267, 55216, 3398485205, 2341088971, 42401667, 1276395395, 4563604015, 892242, 4648293, 114753465, 3207996866,
+            3245818823, 162750, 721963178, 4971165007, 4540936, 13445315443, 1144355018, 87216437, 435045793, 9241353, 1245381631, 27656538,
+            362844274, 39225137, 2544993, 119784, 398601, 184008, 259328237, 3447463721, 72557275, 1471750, 10437405221, 17247098,
+            46994773, 1986875, 35211605, 228915154, 46501147, 90757849, 1890301621, 11751496, 935415, 3274648, 309895054, 128082009,
+            718035505, 8106694783, 251622415, 16925125, 257589745, 12348, 58370090, 338419289, 935272, 27227375, 742117103, 85520875,
+            28794177, 67234405, 1106875, 484484, 12420, 84447875, 16495899, 15872437379, 162032, 2437358, 378233323, 141288,
+            8425795, 1574859979, 25918170, 5286585305, 355725, 107821021, 266992, 4594274803, 9455875, 720616, 141075, 192621297,
+            55242, 809446521, 33644858, 11194551, 177747427, 3772950199, 222197305, 17740775, 25533921001, 206636638, 4584125, 134370717,
+            3789825, 285985414, 80799069, 8254129, 257182005, 873492035, 2145561143, 2322995753, 38624337, 991431169, 179550357, 2529469813,
+            33880, 5506865, 18469506, 1419446281, 118681277, 4412265, 100888455, 656328, 186568778, 98192, 30318123, 2037623707,
+            3296230, 54249363, 22806175, 49227682, 28665452, 626968023, 8315750, 72836313, 1127893067, 323610023, 291375, 2221068005,
+            623763958, 98248525, 2078875562, 4927419, 137783375, 602264170, 526671431, 2089993433, 1171206, 1750875, 302855306, 78309385,
+            11338421711, 7138053, 33800, 883429378, 6258125, 643086785, 7996625, 454813431, 4271922061, 48733195, 446871997, 828398337,
+            4234876921, 384393273, 15658929, 1901416, 14478453, 398750, 6966351, 463125, 12400, 3897166, 265445323, 896607761,
+            24136821, 6365529, 33858, 837734755, 10228946, 122716362, 184573390, 283839182, 1912172597, 145016443, 24587563, 441693,
+            12474, 7889343, 11452203, 85778654, 5651177395, 227070, 4957257151, 25509946, 1692906523, 2510818557, 127159245, 1197519185,
+            77490, 55350, 147248271, 355880, 8089030835, 14067807037, 7403695745, 1686555, 291550, 2888487, 2180216, 5485509,
+            17569148, 227820723, 13555625, 438216, 32400123, 60580988, 1537900793, 31112375, 673135043, 720657, 3419798263, 2255451829,
+            34314520279, 978285, 132310325, 1609995013, 1493382, 1107890, 48904670, 334425, 71784778, 282766066, 720750, 131666513,
+            4562625, 5642592241, 6065048, 12432, 8984007, 74918337, 1905819643, 1333229677, 119790, 13040517, 15959447, 15428346617,
+            2394875, 22548625, 162729, 1313011511, 34452, 11237655, 2738296, 35319053, 216166379, 3339250, 36778612, 441750,
+            184184, 17739782953, 42339171151, 6236769, 1249523913, 4831333793, 114217103, 5490719959, 375078431, 127867597, 583698791, 97604778,
+            8188297247, 517894069, 849555, 97733545, 3253419, 1576169401, 664700153, 5134777721, 656502, 76912, 77043213, 339922037,
+            361664075, 1322750, 2266472, 9670875, 7288556, 248625, 380401255, 2566616, 8812375, 2223256, 7589218, 237951329,
+            9074010899, 26562263, 6687525, 1380211946, 120505847, 76880, 2653011031, 7824649703, 108572387, 592040, 38002055, 2205636267,
+            2867085, 5571566, 245656586, 3450254181, 245785406, 524074623, 98677894, 152678875, 77004, 570834, 26283257, 365484513,
+            951617571, 13405469, 560239719, 634984, 306890545, 17376125, 701101394, 19479501, 215222063, 88890835, 666782162, 2988069955,
+            108872907, 106340245, 151369647, 55500, 104474027, 4476875, 139243134, 3360910, 1450696, 355482754, 1579375, 6474111889,
+            25081375, 151670141, 270135, 6472844, 36542605, 283131277, 37186497, 4216826693, 160888, 2854484247, 2404877345, 1493505,
+            867439706, 2687781158, 2480776, 2309125, 2677264315, 46164457457, 1128648, 327344809, 34680, 429616011, 219857990, 958442779,
+            40727986, 1579419, 227240, 463188, 1836692, 313038, 20574169, 230825721, 334776, 1403564029, 361556833, 2380151945,
+            251966771, 17330805739, 20924484521, 1192067702, 1167707101, 211830846, 297575663, 318759625, 638987595, 163067086, 591976, 3017416,
+            68093948, 119260934, 497954225, 122330265, 960267253, 484840, 376409285, 9835646989, 1222652431, 955159042, 442170, 5077917,
+            1042840, 23192675, 63435789, 240097759, 1923064, 30475970227, 369412329, 10159437847, 806999843, 616773421, 3747249, 1799406191,
+            1214584, 5172939031, 59078825, 91788422, 16152831, 1042712, 1472156, 1729951909, 8440058419, 1815484, 220029861, 504157115,
+            347305465, 56144, 77500, 4071565229, 8597875, 457861391, 6666205, 2030264, 8640801, 646585545, 406736523, 20490202213,
+            78331146, 637549627, 29846245, 1861198157, 1334582059, 2520799103, 1052729899, 21475675, 343463601, 162659289, 14886543, 53069303,
+            2223364, 999999, 46329590, 1605788493, 761434063, 25940044, 1794056, 2000707709, 7161249953, 9842745, 103636038, 11624158,
+            6516050, 10637130, 6967250, 678810, 549250, 40448967, 871990009, 3809673793, 13427078, 9241749, 592296, 256173646,
+            313168, 4412625, 311762815, 5138405155, 1381628947, 31327219, 312964685, 657018, 3747275, 183306695, 3790184, 2931621,
+            11710010, 77236599, 62341279, 2502444, 483552641, 205902, 1021496, 100395183, 60130587, 77064, 1590571281, 8662329,
+            828414, 4112181, 2642086535, 1326855335, 1476710079, 120050, 10808625, 8125755, 213333351, 203868318, 506385, 9282309571,
+            2287810, 3296728, 12525674, 54270194, 59100393, 3270501767, 23922535, 1068096723, 6744953665, 96746195, 34224, 700650886,
+            49377575, 828345, 112371652, 98600, 4000308169, 1944392, 28193684, 381861038, 14478730, 571701245, 108722735, 1812907537,
+            6945611273, 699608, 24201573, 887808383, 173433813, 334719, 55760, 219257110, 2566875, 112972618, 118831938, 296331077,
+            67986094, 1336513633, 635216, 23907068963, 77175, 572280665, 54700525, 28751503901, 635283, 2352314627, 3039180, 1968363023,
+            61826115, 934683511, 235311713, 26648375, 395404163, 72235839, 390102026, 2810184854, 362394095, 689554605, 25124517, 128640545,
+            8769705, 6129753, 2395197, 12936, 1751358, 393300782, 6065367, 3382860605, 134156561, 110375655, 806949, 52533081,
+            1407834, 1289617153, 98568, 12246741, 30833685, 10599429511, 311312245, 24502173631, 506493, 65474950, 1171827, 834150863,
+            4648852, 2244935, 4980330277, 3131700631, 34300, 23626139833, 4090814, 762185437, 871250, 33770669711, 78460101, 17977375,
+            3971848309, 12826330, 1013345463, 52919139, 415922901, 3105945037, 383277635, 163125, 1192540063, 26755762, 52103326, 869757995,
+            4369833, 62405785, 695392718, 184548, 13353905123, 5850625, 475160795, 306268391, 356265, 48218770, 44892155, 61290130,
+            1333058311, 64895817, 67148914, 163268, 22688035069, 4920749029, 77256, 15422995, 5051823569, 34104, 3081670413, 120176,
+            18615838601, 4970875, 16343443493, 14436026, 785565, 8168823, 2180794, 137182925, 43067661, 9819657317, 15122822, 103035898,
+            31542038, 613640, 1689000745, 14414575, 548521337, 637914683, 80971385, 18750095, 4106614571, 5104579681, 6433568587, 2781625,
+            485112, 3833336, 3168250, 110397133, 31370339, 120162718, 159354338, 797105687, 76185109, 33173245, 94128167, 1023883939,
+            1843706059, 1289080595, 291856, 6323031, 68823293, 1054146695, 2453276749, 6838155, 408196282, 2481156, 13169780, 11605400427,
+            7503489, 2073435, 978236, 3430701769, 93291121, 5550375, 6215783557, 3447290, 25425125, 444168263, 2211388751, 7761061,
+            27399801, 6408909, 238402475, 193394465, 1715936873, 158840, 145424763, 232199605, 73330509, 268107323, 914375, 2202266989,
+            8061625, 420616, 7474137845, 384372417, 1039122635, 4326945, 145875499, 336166449, 36285438, 6064083106, 467777569, 2509660087,
+            691121409, 360054807, 34911778, 15230229, 297919407, 62234205, 420500, 6344504, 34425, 1675221583, 957375, 1222888849,
+            57705505, 36156659, 606578819, 277336423, 3342875263, 21218430, 5357275, 3489882, 311076227, 12633125, 2245160, 721278,
+            15237283501, 16947658, 828495, 28623155, 34440, 43497025, 53176935, 2207761658, 8962954, 113530795, 520061487, 19029188,
+            55709170, 8684046, 3511485, 11753322, 292008, 3747436, 4752930002, 376130638, 15444910, 120720974, 1168909467, 133620179,
+            240055205, 5121207, 129005643, 14457625, 11441144177, 31907061, 1025751243, 1178117083, 1150552, 834923713, 15922618591, 1388497409,
+            30104151, 3490025, 238295239, 39161525, 23300380, 603895981, 11259625, 478294505, 314188441, 10165038, 12880, 349774075,
+            2846151, 17555266087, 900321499, 571095, 9456755, 89256167, 6232095571, 231963855, 157594390, 356454, 604969145, 6215846,
+            45578962, 12852, 871563, 704836495, 25833030, 5656479377, 17662538189, 16990215, 1143947833, 3176601589, 3927742067, 699867,
+            966084134, 5600246333, 12740735, 951940033, 1386693, 13985482, 115677027, 14243031, 2178228547, 163215, 13068, 178220399,
+            73759881, 1962503939, 6709527, 24051625, 197944923, 38459197897, 22463375, 21493104233, 29632005, 7107506989, 9728268071, 173283845,
+            120393, 13620625, 136775319, 36822141, 9006151, 270750, 17999082, 2956090611, 264523094, 204942038, 8983094219, 13041125,
+            1031954133, 8242448981, 835460362, 10770296737, 134714902, 3051493651, 176052442, 308414935, 1267617869, 1261715577, 3769125, 19141360409,
+            998192847, 1515250, 224172697, 2040199442, 24674078, 137547935, 828856, 29438828, 116170769, 292144, 2210916759, 846213355,
+            1538888793, 120678019, 583527703, 77065318, 1687257, 48476571, 37229955, 57469126, 34761727, 1150952, 141512, 6022665,
+            876669367, 142002, 1258136, 175387305, 5562407147, 787898419, 118681962, 635418, 57662759, 7181734, 709515537, 32806396,
+            850408, 223938, 945458278, 21474474101, 12654855, 13084125, 98952, 6387675, 205092147, 269481110, 56056, 4527010569,
+            12230188603, 21089826, 67256761, 346361587, 871624, 46437625, 2975096, 28301450, 135444673, 1714134191, 349623989, 2653105,
+            15852850, 6010661951, 404783885, 46094230, 17140641, 28601859, 31928645, 2534707617, 77859507, 20789375, 188351007, 16754322,
+            51352678, 48390783, 163797335, 8405215, 5886198005, 237630055, 182148188, 42703089, 105654065, 27078025, 73073231, 727630345,
+            1445524769, 551225935, 26541471, 11324643169, 276907345, 755575183, 1816062009, 14822402, 105761383, 11989532, 1042514035, 1148708734,
+            34398, 730162995, 4198467, 4477484, 1159465937, 52425855, 1856326619, 146476187, 56031625, 994437086, 599067007, 18085059,
+            24677741371, 73803086, 826488923, 56240, 371387471, 1055456194, 1729750, 332968749, 913135093, 1142037985, 34632, 313201189,
+            8341038, 5378872, 3554577, 8920550483, 2433874513, 42552875, 321207027, 811186057, 2130623794, 1385449942, 22334702, 7802436161,
+            37466538, 77625, 807601553, 577303493, 914872, 29610651, 35083785, 48605458, 70669445, 114174914, 4842188, 764750,
+            433072198, 13000, 1064934, 1021977, 13230, 1451277, 90415605, 127503850, 803866921, 356643, 1335956253, 4305875,
+            23579646, 1129208, 270532678, 72923110, 33688798, 249375, 109496031, 18299812, 7080635507, 4885375, 43991002, 1429875,
+            2223963, 1043625, 2242317265, 571064, 13284, 1009761571, 742938, 22932842461, 163836, 2116653, 120582, 15402255,
+            28945475, 1183590419, 983641115, 219858541, 781545505, 121450994, 1022028, 2781999, 9521394, 34500, 14756942059, 19719745441,
+            39784227, 1945064, 999309113, 1386651886, 12204283, 81336619, 3366828283, 243532497, 1718277077, 726771945, 2524473, 281500219,
+            553093742, 1571813243, 2616310081, 1057946042, 2503250, 11646297, 378189, 51867921, 819470690, 51159647, 258084398, 120750,
+            2502927, 2395750, 635500, 13320, 3232775, 571220, 81551330, 99176, 2781790, 175966635, 95351997, 317880355,
+            142120, 13800, 5507894, 56088, 18342753, 91209625, 226662514, 1086835262, 292383, 1751841, 313720, 764556,
+            219236433, 617117527, 675947591, 446357899, 859306019, 85865351, 159526367, 6353018429, 6666891, 75520185, 1530797453, 974862811,
+            248952, 1278177802, 8877596, 141347213, 8984885, 838615765, 83976634, 2264123771, 1166184019, 1931082411, 1374353661, 54057185,
+            54894242, 326379775, 56868558, 2996708, 592875, 2128692325, 580179725, 110762938, 57684190, 166566230, 8941790, 2803372,
+            1372464643, 10251241, 2438670, 6880085657, 678776, 720569055, 1193562, 11303044, 18643317, 13720, 348593946, 485576,
+            2095250, 984542361, 172296887, 7353775, 826789623, 1232139923, 43196950, 82710355, 58607381, 415386867, 7117695, 101447489,
+            537854402, 871720, 321035495, 731815915, 7868875, 8727375, 2374121687, 27076510823, 485625, 12166379483, 25854875, 1988008,
+            159869895, 1825441606, 19179875, 1208938341, 11667831, 206584, 614385, 1537305, 217519467, 6259162, 221232561, 1166184071,
+            56224830, 487202014, 742698, 17012125, 3361312471, 16432625, 21755461, 3105001261, 6581115, 34847875, 5121690, 380788525,
+            2417196, 7981545169, 98443197, 41415535, 1101730762, 95631125, 354925571, 3381294469, 16635255007, 13464, 1003108173, 77841,
+            1214906, 1401139553, 1924944055, 15975096049, 526972999, 706038843, 335544, 1268069074, 290815634, 2834288615, 76164179, 5702861339,
+            6656183417, 35577633, 782936, 52469053, 2202746, 299250595, 7837292311, 3447549, 442750, 249018, 161973383, 155899302,
+            39913195, 450629179, 21798634, 29761209, 227692985, 7096310, 335240, 6001625, 171438501, 1837875, 528632, 1266630953,
+            696681362, 421997543, 7632779, 45901386, 1380663895, 1108107, 21369205, 142290, 399750, 12720125, 56430, 918372325,
+            6618472939, 7193767217, 6436209163, 637958269, 15552735, 1215448, 4005625, 678861, 1723063101, 2352987, 136282107, 849175641,
+            132182667, 996411889, 1052923911, 442520, 59272863, 589408963, 1515930, 33603115, 3678063301, 3227254589, 277465721, 41136627,
+            7203625, 78030, 534163201, 79533905, 9736265, 183929977, 507195, 2720212691, 8190875, 915124, 163592, 2048764629,
+            8800315727, 153581285, 2911041, 16476793787, 514288502, 13642551, 2181372, 34960, 894891849, 13552, 3114788501, 8877770,
+            249907546, 506920, 712456349, 13148905, 5358536, 14178918, 1779746983, 13520, 21949268, 448719029, 4184697595, 199039953,
+            39183495, 80263681, 120099005, 3404709, 236600122, 272136, 48949187, 665109055, 3962792, 13970451971, 378488, 35341691,
+            2309762, 5008254383, 2114634122, 786250, 26202644941, 3469125, 15324101903, 1259480, 335093902, 138922186, 1730778, 3174691741,
+            248769755, 3255113615, 275255099, 94751265, 189961145, 1232590102, 13456, 1816552, 1365784, 35556334, 3482836019, 237287105,
+            109968551, 118339431, 1882490407, 142352, 206788153, 2224250, 13492375, 2145540947, 313287271, 655729701, 3557999513, 1473749035,
+            7915181671, 55559933, 478380955, 505896523, 1200374794, 2924111267, 586189615, 679024, 7727165803, 72343925, 10658886, 8276875,
+            54422375, 8620250, 314146095, 758022385, 109023805, 13328, 163863, 1264935485, 13689, 185250, 965376447, 571880,
+            3033379547, 6731364, 86359273, 58972602, 125185874, 9810750947, 21734195, 78064, 829374, 235612741, 33860761, 4177467,
+            8377795229, 6189513587, 48266823641, 124863895, 77922, 6027210371, 356500, 2675010, 338206099, 130186670, 6989125, 357075,
+            292842, 271215, 646006865, 28943856397, 1108250, 54873170, 4103417327, 3321188, 13814375, 3919928, 219773229, 168305082,
+            1344364, 314226, 536588689, 507375, 1716753189, 288819817, 2746462081, 61719801, 14029011, 85500170, 399311341, 341232463,
+            6293952599, 550264, 682751719, 101877087, 18729425, 33238413, 22034805, 128405355, 61698351, 71609209813, 2158268577, 2890392973,
+            201894665, 4340583497, 4778475, 6516909, 19995910, 255595038, 228680498, 246430418, 127954645, 2780974691, 1906164113, 3847535473,
+            3941418, 38947625, 3640923, 700952439, 491688127, 18450406, 45383720369, 121032, 10079836, 15896335, 2481875, 9028173,
+            16833058277, 4646581537, 35154, 6926037955, 99528, 3972063821, 1022504, 30405333, 12333474, 6098574913, 113316866, 34884,
+            196614803, 188136746, 722007, 3168858, 1215672, 170472875, 249413817, 241987658, 207045839, 139909630, 1782043649, 1936749021,
+            6796086, 1043955, 592693049, 42210003, 2718495857, 19287508, 507416, 319468919, 4413656, 12701795695, 271250, 5910838103,
+            22975339699, 2581776565, 154525917, 9244020541, 187385390, 3430980955, 118725586, 12546038551, 1628819365, 1280125, 292820, 2482068,
+            541632529, 13770, 1604888135, 60302162, 32744866, 17956862, 1995643507, 1012509335, 150834299, 180624934, 484669779, 129993370,
+            681485462, 78204, 765985323, 23548529047, 3970797479, 87368099, 1214132763, 7108881331, 1408875, 78200, 283647086, 2260539879,
+            142506, 16497375, 4907331, 93485125, 40664715, 1881080, 1359394082, 185592, 5764396091, 1058461633, 12498605513, 2961478298,
+            132547827, 10173604397, 3727269, 5765830, 10314659419, 1473417, 228375, 464535, 161136574, 1129869, 61977495, 2438900,
+            74296838, 13776, 9457525, 943183885, 3509171263, 485622, 3003567463, 343443265, 35112, 24181157, 615342, 10831210,
+            333763465, 1825184413, 1408888, 313896, 242266739, 9972625, 1130942319, 8963520655, 142828625, 228438, 121095, 138750703,
+            413884839, 30016298359, 113359939, 2914131211, 44420794, 8277093, 9198969853, 4606833, 421525715, 5830150, 3288832261, 67600841,
+            3595109323, 65518934, 566959029, 261669291, 423500311, 3362086, 952584721, 51288965, 1466086999, 10723895, 3694096679, 34547825,
+            32616155, 9073518571, 141691121, 180710862, 19453132691, 158797155, 28430875, 6645925, 62933350283, 3584098763, 973725779, 5750423635,
+            403067433, 5401053, 25148790517, 461296649, 14115049, 2935873259, 24095375, 218507163, 6940203701, 20296419, 3576716, 253659538,
+            15960875, 5422250, 153538715, 2331875, 1172889, 228501, 1025623313, 493898977, 464086893, 2632365, 646801363, 949386775,
+            161329805, 166116051, 7804965, 1128903411, 2503611, 6130863, 10236813211, 1301685, 5658675, 3516189883, 98872485, 3087316195,
+            37402431, 4971956, 4112882747, 1093983033, 3297602, 290708778, 1480638731, 890363617, 2288968, 636363, 3469445, 1259033347,
+            1816815, 9908470, 4017286559, 3040232, 713143587, 99750, 291052138, 220632146, 19674039, 51997348, 146992503, 331510010,
+            188094205, 736559629, 23773218, 2174666527, 583249479, 85372357, 1273177633, 15424375, 12483933, 443156, 143794585, 565800411,
+            5467434167, 152315410, 1378217477, 21519875, 155017577, 267807837, 808108, 4886035, 117096, 2303809329, 57132, 614922,
+            131281735, 50022687, 6830506397, 181692566, 56848, 246902815, 41158598, 56840, 172726730, 11088875, 3736357429, 13900419,
+            313609857, 6452875, 11668375, 37895975, 39120731257, 164835, 3533016959, 674080957, 4800195, 1520839199, 14887875, 232071890,
+            2847078, 1252594651, 4585625, 1034552057, 588550897, 17398810, 23413893373, 66913469, 43669731, 164280, 312579663, 2527539833,
+            2491975641, 616946473, 19974591, 8513375, 4774501127, 287661125, 74447709, 3963388, 464750, 573848781, 646522481, 1313978865,
+            17635125, 13872, 857761333, 87540125, 679250, 2331832, 78416, 25254515, 1602250, 147915691, 227264271, 35496,
+            127074983, 4712923951, 194898067, 56916, 34462142, 3455428299, 12258220139, 1601797717, 890771453, 387421177, 28044705, 837156891,
+            335907, 4564161, 125658438, 180174449, 111943130, 1899682697, 631283783, 21798981, 2404342237, 40750801, 211596297, 19617045799,
+            1302045446, 7354375, 142680, 11003097, 182857330, 4049375, 2332060, 80757866, 1467117377, 24089097863, 15707195489, 123941389,
+            8813922, 121360, 271524, 4938414235, 292726366, 4714402, 1323297, 142600, 130551910, 1924263, 2770415182, 399612199,
+            8750457709, 401166, 128727665, 15413774833, 314500, 86327374, 888732637, 3074567327, 122456386, 74360, 4347881285, 250120,
+            13020623, 30877869, 8792394, 3991101829, 250250, 909895042, 57072, 338485342, 70154922, 24009723, 29203767, 1738667333,
+            137377306, 21412701, 181505155, 17814538, 16175410733, 30727655, 34545893119, 185814, 2417327393, 217928202, 56697875, 739640,
+            636525, 386004703, 3147711, 10488478, 106363271, 4371125, 6263110657, 177792139, 3585408262, 196786905, 60926164, 418435297,
+            5126494633, 69790325, 27679925, 142549935, 11217882, 2650952135, 4134603517, 57040, 8942745, 499951793, 172254693, 3292889047,
+            3539713639, 245915727, 12205375, 228752, 47941054, 2101885751, 1717331986, 20790, 260531971, 399698117, 27551125, 3877615,
+            289056355, 202045202, 769977622, 10546266991, 18214735, 1049683591, 6517750, 261693970, 192696, 164424, 12023350651, 74276111,
+            35728, 1360982987, 1044435, 365654734, 12012003, 15145569, 517872394, 59895875, 2933125, 1459519649, 1344904, 121730835,
+            3512625, 539872502, 849045586, 7457183279, 4008830379, 312150098, 41330471, 142968, 383321913, 1515752693, 4135260, 7633544,
+            14175, 12291062, 421890, 608468749, 14458772, 7998364, 400488, 1645371, 2461025, 863492135, 51181858, 99173217,
+            30148492, 15403167, 324749397, 1795625, 210480347, 100035, 185046719, 8226503077, 158132117, 47211333, 11883235, 133149185,
+            48692334, 484906303, 73396197, 129371711, 289957863, 7762194005, 1151869015, 1936535378, 1626201317, 32251625, 347392851, 216232874,
+            400520, 816187697, 95052022, 1387778, 3405350, 8878437, 38282725, 13128126, 4220991, 5678759149, 31770641741, 234475846,
+            501389903, 2997592, 72602062, 251256, 1301637827, 9999303983, 36694483, 248663051, 207861995, 5066054689, 207368, 70241161,
+            422037, 1709724, 14597321881, 157659986, 1136501509, 532790285, 2377513699, 529375, 1921682477, 100048, 2160585, 130766835,
+            4429655503, 726751445, 306140965, 5744871, 35672, 98937223, 52512694, 174873322, 994244834, 489156021, 41802717, 18536749,
+            40399905017, 660795566, 219580755, 43949007, 52834691, 336200, 22121099, 3920574, 693204835, 2396444083, 293250, 4134088343,
+            22310222, 84428225, 1308012419, 109196571, 622012025, 272358295, 546419423, 115013041, 14280, 899850545, 6903897, 8211715139,
+            117392, 2611305, 12741875, 1173250, 3620929705, 9307755, 214515455, 337391197, 435992278, 5444439, 96790959, 110419675,
+            46524597, 766329237, 80371767, 215476815, 22013875, 1903330, 56848323, 2612640909, 76980609, 21563157, 33324879, 8568978,
+            9801435, 45086601, 1044522, 865244038, 198053230, 35802, 488834071, 422096, 293265, 163991636, 2209745102, 755082686,
+            11346775, 78096759, 55496169, 355742035, 170396692, 3577098, 13203579737, 9320152, 227178705, 8654926151, 18472509, 5602823161,
+            901953998, 228445030, 234669281, 627549526, 3083570, 84963932, 7376215, 121770, 443625, 97456372, 1014376978, 4500111,
+            98529535, 18387001573, 14364, 836620653, 20919327, 2587057043, 15617943, 1087515, 216146755, 1302153099, 336375, 427020737,
+            21688158, 5251559743, 44228135, 65884305, 3210836239, 1568873815, 239369741, 6844650905, 778992487, 2182125, 28989415, 11175125,
+            32895681, 409979090, 828657869, 9458085, 57288, 505618246, 937840295, 1473849, 14369192387, 23472144323, 6946914, 47147125,
+            314847, 2228453279, 153989927, 45236906, 57019974, 1237768, 5380298, 671269753, 94601801, 27916130, 14352, 14103373151,
+            1414790927, 192795045, 2840513663, 3702811147, 6195805, 345396854, 357864, 8441583929, 153968507, 55308620053, 28860597, 293384,
+            446294553, 1442864579, 24589565, 3319756, 1393928906, 1885903814, 1887706715, 175689059, 2188918742, 771716309, 243640930, 255230885,
+            186354, 196164787, 4156744, 86402823, 118683341, 15424856, 4242567, 39548994, 5422923, 242374605, 3451522393, 808520,
+            18858850, 449449693, 4394885407, 41416468, 23645215, 2377878722, 1453145398, 1053946246, 5702125, 129286089, 674939991, 43753866,
+            3212767831, 26191978709, 142271129, 12012275, 22534962517, 1048610779, 606239635, 18172143, 33402473557, 60475730, 208119709, 25383715,
+            57375, 9458086, 2139017027, 494479047, 3361828538, 649270154, 560971389, 78736, 70820895, 103723675, 10338150, 5487525,
+            215009405, 272025, 617118634, 57400, 5165875, 7869933, 293480, 99903237, 172233579, 13905569881, 2407325783, 157016382,
+            201111694, 2715556321, 3427125, 1101774641, 3305080381, 7336625813, 380467633, 21971125, 70477563, 264932324, 149872, 486680,
+            218379106, 142830, 14394875, 1538355, 7333375, 33561165, 3504106793, 625575095, 19223875, 11668875, 151457444, 46310125,
+            35364050, 1174062071, 35880, 561507947, 205200779, 3803923417, 42320, 4908087, 44164094, 18129265, 867785009, 6408673141,
+            9808370, 464968, 10295285, 3883679971, 16669809, 4152954773, 2826171, 15750, 2897583923, 126581847, 13557687, 6539295,
+            168477617, 640620695, 483382743, 1709585405, 186219, 418950833, 2675946, 4908924569, 6839763, 192129847, 679875, 1237923,
+            2904473545, 117910793, 1237830, 112931357, 1742359411, 8535345, 59316803, 536010046, 160300225, 6199237187, 60948111, 1623175385,
+            4457464, 4585768, 48950187, 250712, 854413637, 279741830, 256776317, 17795867837, 67408354, 78936, 118876597, 20382934,
+            50173585, 8385125, 2933524, 305089631, 36080, 58149644, 20597577, 10037775, 143344, 6947122, 986797471, 78075639,
+            250230038, 744310, 508215459, 38280584267, 1302488, 4092529, 500038091, 7216819549, 419594765, 882358499, 3041038, 75371230,
+            59209535, 873126, 2304840297, 1002252, 14520, 6346186, 1452605, 10101806, 85201246, 79002, 1220078811, 2062222393,
+            804678, 122933135, 1480339133, 5401750, 9973390, 11080309819, 379750, 143500, 1932929453, 13815356, 8299390, 57564,
+            23559774, 48005875, 64961589, 1061231339, 102178466, 19588870, 167125521, 8010113461, 102092354, 164616, 35910, 662513137,
+            186340, 1216700, 6418202831, 1640903935, 1860375, 954731794, 24021704731, 4571762417, 45666335, 937750, 1705207049, 9099468127,
+            18765974093, 5858576633, 21048375, 3264150593, 1477913921, 31071586, 1366936, 965699445, 23409308, 7101413077, 5334170971, 9360522589,
+            609092187, 11141887145, 66743105, 22743930, 216876775, 22743987, 1868282983, 224968341, 1930332439, 21434413, 3148281, 395277311,
+            5789143763, 43026507, 207636, 2096005387, 1667224, 2118025, 62457795383, 64531922, 963381358, 658665, 120057730, 33003334,
+            14373415, 71250361, 64446613, 211811347, 828379162, 209729663, 285429655, 122094, 143451, 3663984755, 29998470, 237288074,
+            260038933, 2788702321, 336875, 1840896187, 2092893257, 1753206, 1805611021, 1055307487, 79092, 55775555, 1542796585, 14616,
+            1663654745, 444015, 613212627, 6281875, 3727750, 37210075, 13197892415, 10402785, 14804161879, 83140915, 20537208197, 1141545821,
+            50581531, 22679631, 105269255, 273453325, 551849903, 38862733, 288735161, 7312125, 1088776, 6300929282, 869223277, 10681814,
+            1838889, 100847877, 556271246, 35149710, 167211473, 3149345095, 174809453, 17405434513, 279098030, 114970558, 10145277, 74546400941,
+            551034, 1376265209, 12313004, 3632863495, 2375622, 3384381, 358360, 124585962, 5483489281, 1989591935, 16133442, 3026770015,
+            701592, 51719151, 54787348513, 937629, 380489307, 121992, 32058966, 164920, 212841629, 7677026, 1548999475, 1405712473,
+            1371071193, 9673152757, 7118937, 23366228, 25984989, 7526805, 717952107, 69748052, 566595029, 6002810, 22681770, 8523830711,
+            76530430, 1120748278, 739522330, 50045164, 1238230, 238253665, 8683450889, 1538636, 160772622, 927066129, 57750, 529720,
+            21091425, 272322, 134652189, 1017854719, 490487179, 6196125, 1264571809, 133579025, 18408467, 637362, 2697695, 22722625,
+            12313081, 201058711, 14742, 8060766461, 577970522, 36828, 1047387731, 14800, 58415570, 2654750, 80393731, 12864765283,
+            1802284393, 1022039837, 165048, 5290730159, 594297, 658750, 4224512695, 735401517, 21907067, 30427873, 3019625, 9200975,
+            821124794, 24654321, 543264801, 405407959, 57800, 1903473, 508750, 209794178, 80651305, 4564750, 283540994, 1624399049,
+            100688, 36750, 14760, 164571597, 379701, 577712993, 387958549, 4264484, 734628939, 490315615, 422625, 57720,
+            229400, 247461809, 337670751, 378643610, 3570985847, 1474360, 2482554183, 766536, 48499748, 2547534, 667149109, 3165356623,
+            2971631579, 36176, 17764810, 140339966, 357695767, 10948698947, 37381914, 168520885, 8050593089, 14850, 108896645, 61441978,
+            4092825, 5230407, 3835250, 5080125, 178651419, 14960, 2271079291, 24096332, 894824, 1008582706, 545947765, 4028660,
+            300496869, 861926026, 4528428853, 6689865, 79856, 47963510, 191228739, 55239171, 6114050831, 216512153, 30215862373, 7616804315,
+            694857854, 21628266, 254179739, 386606425, 3882929149, 417684638, 1131350, 236730329, 4528232, 179767497, 405944690, 465608,
+            26221195, 306527969, 13285418723, 1044211595, 535345045, 22229109, 668673213, 67387242, 340739993, 100386, 19481847, 6444044579,
+            2375835, 250965, 13450745, 594405, 14695835, 632701258, 1371500741, 334902227, 330867061, 23871270797, 2247128, 11218940,
+            465850, 273296, 219280919, 370680937, 77818246, 71980363, 2396959835, 7333810, 5439619117, 5402148, 5037138, 166932689,
+            53866046, 1512963263, 66099502, 122360, 658845, 28401723811, 47340818, 7612839, 24611521, 19997094, 1674343573, 699172165,
+            61248875, 100976889, 2418795, 1967512, 401128, 1174620603, 1413117394, 47555490, 2126955323, 129973415, 18644835, 1066648,
+            1860775, 208125, 126217399, 143666809, 57915, 482975367, 182493385, 3191481, 3319139131, 100311625, 124993625, 36456,
+            54337822, 113189349, 108767989, 325029238, 3416345049, 1282300453, 723044, 4758325, 12871375, 1220937729, 50603289, 36784,
+            1388625, 1367145, 191164422, 22486737, 555971065, 192151748, 51826625, 1672025641, 1921901978, 2483224, 182772674, 34707081029,
+            33068010, 828100427, 294462, 241817422, 202282366, 119284869, 1209218945, 2569125, 187278, 86768493, 1702674814, 23302359,
+            15768841, 35600642, 542728417, 255446165, 16670313, 1393714927, 594664, 15048, 4151903581, 33153879, 116752174, 96426957,
+            44786819, 21821427, 105183715, 943528490, 3251809759, 1008796677, 4693955, 165186, 22791574759, 744952, 237352895, 11385492481,
+            4479250, 1045304, 594500, 55389565, 86446535, 93722486, 11411875, 80630034, 50968203, 69104425, 422840, 6026911283,
+            72173647, 619265517, 84364625, 959454067, 73676057, 2182815, 443268917, 195500045, 986454521, 910904761, 208250, 825524947,
+            2633512, 895125, 2696862453, 3970691513, 146457125, 114734810, 47233582, 1710625, 44014203, 19696625, 443784, 1898073983,
+            23323875, 11132875, 562856, 3942785, 3234490, 21113170, 1165069653, 1517481, 540582185, 48972175, 7376875, 40837742,
+            10188522, 1377982705, 360958389, 4629625, 23088025, 15479195063, 427171661, 4415125, 18365875, 165816706, 421870351, 6003261,
+            21585393, 61291906, 3856057667, 2314735249, 131411581, 1667666, 7527141, 11686403963, 18773755, 538972511, 11304491341, 7992299689,
+            110141822, 57500, 701778, 2290589435, 1755924577, 1131928, 2386829485, 658952, 77410686, 27144325, 87047569, 7076433,
+            42504, 1595274043, 59961270, 31629894, 3685311, 143888, 1517577743, 79376, 3069825065, 479734563, 13021928, 551696,
+            2570917657, 13107549, 160322266, 13343643, 2762375, 3319139279, 4463117197, 845936354, 3394152487, 12373636, 80286745, 7179414,
+            23462293583, 152380965, 79576, 15288, 3344379791, 465885, 145836836, 6840375, 6475497, 573426, 391006681, 186760,
+            137142247, 3255954, 13901730, 208104, 315536, 4522375, 229770, 1083231357, 2877645437, 11111485, 461168, 2535739833,
+            255811175, 1603182, 5939055, 873323165, 92198743, 34871156, 2666277806, 680504, 20621042, 272727, 9351639, 236752122,
+            305755642, 2333097, 32188247, 208278, 143910, 14545625, 3964125, 20675945473, 294216, 91833889, 155578969, 1199045683,
+            1523458885, 545647557, 500124581, 536826279, 14180516, 194147947, 3835625, 50882394, 1732250, 21156245, 3020031, 122512,
+            6218073, 2260884689, 17571862, 4930250, 967674579, 10682307, 522682153, 5733211753, 209322377, 106686305, 36588153, 14896,
+            597652445, 8471625, 3320148143, 83527743, 327390349, 869438415, 11755233, 101080, 1023975, 1444024387, 1572373127, 20748475,
+            2676625, 2243113345, 1065932186, 36931570, 53286398, 1155218255, 1065782003, 2014897235, 20469449, 162125275, 2632446, 36201802,
+            6352848607, 58523270, 166632487, 31072195, 183416519, 128449802, 66636515, 658478611, 3294199407, 50560601, 433911247, 324900646,
+            111639212, 165430587, 8971377649, 992764801, 21031480171, 59296055, 12457548167, 1997855626, 942584357, 7806315, 765643389, 3809598,
+            77217621, 11862825, 28426363663, 508326, 766428, 19803868, 1603525, 106407301, 1465593902, 128514254, 438139202, 18237362,
+            19740434, 11086062, 1737144635, 3303299767, 43263878, 20469537, 380133, 34227627, 36855, 9072708, 594762, 13583433127,
+            1710855, 84772830, 251540107, 389955018, 8128414, 94130465, 1395925934, 186992, 15726207, 8020971, 143903249, 7784875,
+            1106733418, 594969655, 380730, 13107884, 2014317851, 757201078, 4438241759, 8922459, 15640275, 6411465, 25329639157, 98165514,
+            1800009757, 1517020131, 1560664, 20706125, 307022078, 1980921437, 311464905, 16069625, 15722843159, 10296125, 1991695843, 1203792262,
+            203484611, 217499875, 69297865, 27559462, 4200615, 455653345, 4007750, 193697438, 216834541, 358750, 5402529, 799254,
+            59446375, 391800955, 85609025, 46590596, 45774421, 2075750, 5359635, 15962337, 16205739335, 2324672857, 1331322343, 530472,
+            2682740093, 3063125, 423016, 2676740, 174724215, 137292727, 122672, 30170875, 4758702, 273840794, 1351111223, 9566375,
+            11042990, 287426395, 6625794, 358904, 1131435, 1818243, 2974293507, 5230875, 16005275, 523454995, 15312, 141220564,
+            285730835, 1752340535, 25762022, 46769948, 100998775, 30664543, 18258658, 5123104693, 1672498199, 437002102, 1152920, 98788105,
+            2164601847, 67258970, 843210797, 227136845, 89580478, 8322622, 3921645, 229992, 2774108129, 105484561, 1217307, 60820045,
+            4201311779, 916721583, 65305825, 1381438461, 256262182, 28294344893, 1079346737, 1754873185, 833015942, 3711332989, 284400129, 3628335551,
+            180218731, 7119651, 1612616621, 131132883, 3059501653, 959769, 454258311, 2655345, 14717703, 32381583, 58344, 81810908,
+            7334361, 15390, 277274522, 2249145159, 886909499, 7466606771, 36180573, 315671757, 1088682, 37000, 15400, 16091214,
+            2200552393, 98165725, 350849915, 4770918383, 1539304, 12225962651, 6103534541, 1125020039, 412984, 2720901403, 676572121, 709496571,
+            3149146, 75908553, 1564153019, 6729653203, 596922887, 6754825, 466088, 573500, 616250, 4841338445, 7634802, 6432965,
+            1392320189, 3213375, 3041750, 680805, 708852485, 315495, 17700969, 1053784457, 1205914105, 1494827569, 14996529, 1024870,
+            10961594, 857097415, 12592845, 1625336, 1486250, 242826441, 79860, 26500722, 41696631, 373493146, 401759997, 165750,
+            343917119, 79866, 827285331, 358875, 68804385, 24933475, 815158729, 4780244, 552123, 1131458987, 401931555, 49487685,
+            409336421, 193890763, 896954253, 3363633, 7999592, 549382438, 2032965, 267487282, 9351895, 3379128743, 1303288, 81553510,
+            58482, 37983525, 34656769, 149415398, 29496337219, 1470424178, 1035496, 6776692, 1389128, 25921225, 59024, 20212082,
+            294500, 404678897, 4157846, 1002915, 956277987, 800692707, 444771, 1559409895, 2870127, 9373256, 401841, 29419806,
+            57708081, 5518796309, 100913098, 2805748, 14281967921, 3471039, 309984190, 100920, 219796655, 4088051671, 1902989498, 3878875,
+            62945043, 15504, 3707128, 587457843, 4694375, 128965239, 46354155, 24762387, 26930125, 4200795, 7463034, 922645529,
+            5742290957, 127999417, 32059797, 75543845, 1513866211, 370745947, 265276765, 2998905, 165880, 12351735883, 910626277, 273105,
+            2011625, 4952038, 299875121, 12442625, 95010773, 2197225834, 6252681097, 40065487, 1889553757, 12266077133, 28217926, 57686629,
+            570974306, 80360, 663952017, 708036995, 425991730, 2061214759, 224110966, 58590, 678224911, 267530887, 140812819, 7871750,
+            1016996911, 1859419659, 464232, 524485445, 5245508389, 4817922505, 3679761111, 2552760409, 1018070027, 7613490, 64662125, 7699256,
+            3020458, 87906575, 16134382, 144375, 6620857441, 1351819733, 874120, 648412827, 12224717971, 1034961521, 11709605969, 57608789507,
+            1668296, 80040, 65950206, 2011672, 1070525662, 542063665, 271157682, 4458350, 101528, 976109927, 1796202, 144500,
+            721258265, 426785866, 6561830, 702351, 657792179, 137979842, 1045772, 15624, 650966799, 431057030, 13512691153, 3599937,
+            570909963, 595125, 5617521, 157918775, 60240830, 9588125, 185990514, 2462350, 8547682, 16854329873, 102866335, 5037957,
+            1341250, 1201085083, 13923770, 39400262, 1051688, 63546125, 16434845, 2339611417, 7205750, 402040, 230175, 1733517659,
+            40087058, 183073569, 331661891, 30734366239, 460439931, 101844, 54252653, 205674119, 213229113, 681352, 9137244017, 1115125795,
+            90525125, 17572589413, 4469170273, 15660, 58838186, 910712117, 978664141, 5252702, 83206263, 81832597, 35279426, 8958543091,
+            552230, 1990386, 244050079, 997832, 72581938, 208845, 141243837, 59983310, 1122723745, 251720, 54853645, 1617231265,
+            584174171, 7828151279, 7237553905, 9414417233, 2376584, 117632879, 150170758, 269913063, 675563642, 8922875, 316250, 3877864679,
+            990103885, 1444926305, 917987983, 447519255, 76295219, 423522, 10081799, 251559, 165968, 10210625, 48157226, 1429835066,
+            1434108949, 337662, 1092525343, 1220273119, 2154815065, 40344689, 13794963, 65069852, 1410728, 1393522453, 64576421, 8772621,
+            37128, 153604945, 16456375, 45603129, 2913222, 192324298, 35451290, 15211625, 864802939, 1711250, 586105863, 182966278,
+            8707812397, 9116046, 22508950, 766935, 11326810, 4093705, 37125, 22367552419, 52750313, 1454024, 359073, 8644002899,
+            4938566194, 2767347649, 1935828097, 202768, 92092023, 2011695, 48414793, 970486769, 166012, 863279079, 669552725, 480379370,
+            2462535, 29699085, 798847153, 24505041, 185541939, 70350005, 8687238, 286568293, 48887006, 284376, 252416582, 396609031,
+            358938, 132819159, 2781019641, 2290869, 451253887, 415689695, 1313293813, 20555790, 135704863, 166250, 5789364, 724275,
+            2195616297, 15376, 10769121, 4582473599, 1110296, 409916155, 6368835, 123039, 20405525, 1271247845, 117311090, 788392,
+            7055631, 57686877, 153883814, 4214125619, 294780, 29055325, 32532237, 166056, 101680, 294294, 214924829, 947939434,
+            862506463, 78999625, 589067787, 58725, 1788806623, 26050375, 116924870, 240036538, 85824891, 9588424, 9978894265, 1325192,
+            1883115, 198612938, 273224, 561981563, 2011875, 114993151, 58520, 582178202, 4007955, 14653990, 19632977, 101898,
+            80262, 3342625, 20732608457, 1260750, 67774525, 9845848, 12614511, 157834748, 638248, 3767566465, 2741454, 779272978,
+            346707658, 846366305, 123032, 188053203, 6797518, 344711661, 12669903763, 78548965, 152789483, 35022054, 2936712289, 1416359186,
+            18280875, 2269806, 340590772, 92929089, 220913045, 1581753145, 21251111579, 28711774, 380104071, 34700284, 25472018, 87929205037,
+            638250, 261456663, 415539551, 2956317, 215740483, 13359853403, 391565395, 103295825, 4305150265, 339324447, 208936, 364178605,
+            9523995, 290667819, 107802903, 619459529, 16711172077, 9095034, 256176791, 4911930749, 214881387, 24591021, 166296, 3839682215,
+            2175269473, 206404107, 252126, 25106125, 1030175497, 454194433, 17872556479, 260855735, 63804147, 1473944506, 1153425, 375146146,
+            1970727074, 26009673439, 101500, 32317714, 250360359, 2526550, 11198125, 1191814437, 208486025, 2827539, 26544133, 5129715779,
+            15490178, 2489745377, 30643613, 725654878, 54725073, 35773287, 1260584, 294975, 952350659, 506220781, 2385199117, 100776,
+            765837237, 58172686, 16016, 430821303, 49552518, 60906461, 94281439, 1405928294, 4802193, 145213145, 116989257, 35537201,
+            681318, 11541607, 80325, 1968559489, 477911055, 380625, 2269432, 3704572671, 327294, 1926296, 197613559, 106579930,
+            4695583753, 12398611541, 1754445, 52879299, 206037501, 6602871815, 37392, 2146232, 535968517, 101790, 743086337, 668738782,
+            301184770, 16178305, 711471483, 153841375, 84666022, 981801, 14274864097, 107545510, 10242331273, 180777286, 13065921, 2682498,
+            187720, 380835, 215933739, 12882194429, 65763935753, 7764198, 1003352, 171162002, 214757836, 1303957885, 38177194, 25085778,
+            173308234, 7736933618, 217371791, 107738785, 39100009, 43557865237, 118083955, 960260, 331275982, 2358821225, 1411102, 575519386,
+            6347596, 2172157507, 230625, 486775330, 6755375, 3664375, 1805483555, 89001605, 84537175, 38480, 11586516073, 15963021,
+            88121778, 901676633, 4136780, 82670025, 111795315, 2505630, 126905218, 773478155, 1867082477, 20191270, 3317788019, 3681113683,
+            20878066, 153133862, 896868973, 30909483317, 79386195, 73569727, 1904943211, 1264079405, 7096864291, 26522818, 4180836707, 32790065,
+            5929770737, 20212713, 64405055, 18110302249, 164787475, 92543031, 2054943, 2393419567, 146157622, 3857895, 50346790, 5918846089,
+            1647243, 11949483, 63567998, 466192415, 1310933139, 1643094557, 5665690009, 1566321407, 18645939, 224003923, 4526176421, 1189280807,
+            57150561, 191423089, 34299242239, 3773490469, 1597056419, 301013167, 5251024867, 172106389, 1287388274, 8520805607, 632187269, 13967019,
+            1212697057, 889614539, 128751194, 51527245, 316602, 114607031, 907600454, 85031023, 14052885, 7957257, 1617210201, 1740837085,
+            9931922, 316080193, 12105470, 810152, 39293375, 63932869, 70243019, 666871535, 110121245, 4256687035, 15912, 1991192,
+            11091003, 101407306, 55822196, 40667011, 3514563, 80600, 90117775, 2033625, 67573402, 1188572645, 2621270647, 718511511,
+            509704, 835227289, 21806875, 147488374, 7667994863, 306400435, 522683095, 26600, 25879007, 8536150, 755470837, 138066129,
+            6562323, 280430215, 137358334, 29591639, 12228502, 10096855093, 232438943, 389891515, 234306215, 5010746719, 30600924, 738965755,
+            1132461, 896103, 1792841973, 506242473, 4728508203, 322154301, 93187053, 37271806, 268711622, 232395964, 997144265, 437153134,
+            2969872919, 8086225, 5571918245, 3414607715, 5918465, 3914717105, 367054911, 37240, 17766125, 230769, 687969422, 123500,
+            82498437, 48136462, 9051939, 769292993, 3374628, 544618318, 383517025, 2293530877, 520966105, 73398159, 434620535, 273714,
+            78892954, 302494269, 33348458, 996521851, 192496353, 87284613, 751693369, 2297265509, 85009639, 505705915, 91276834, 518862773,
+            132700997, 32339814, 37898882, 5716514503, 1881505685, 10962375, 17200743407, 25471305, 16585062, 509733, 153992146, 37400,
+            1025925862, 115336881, 1317393701, 5297256293, 209430730, 788840, 32360931, 4809445222, 37752, 3261941489, 393776422, 19118134,
+            2248365, 874418817, 236280909, 16240, 144462356, 144976, 43307726, 27424418, 88701327, 123385031, 73848929, 5418908593,
+            488072, 46741175, 8601186, 88035987, 378773785, 1058506989, 89152063, 510320481, 874676411, 10661210, 2312750, 22745541,
+            1355039791, 572971009, 10178264473, 1657238843, 1181168098, 32776828891, 853281, 206468825, 217436457, 25127949, 635836159, 9636581291,
+            230888, 36331635, 875985910, 80500, 2248250, 4046972199, 8021937, 1024947, 1454248, 7549773, 2440423689, 112203388,
+            24977692, 193526715, 863512, 1540125, 1856222401, 68054998, 5164529227, 1426683333, 7099065, 150343105, 1346961, 65695498,
+            188232, 24870734, 102120, 1304046, 62430618, 13310038157, 21221746, 9417065, 2205495, 2329116643, 1625780, 659750,
+            940825442, 29914225, 1346972, 617310, 269119389, 746025, 201575085, 80730, 103017278, 522490101, 3334829915, 65628798,
+            3178837871, 51463115, 69985685, 23410959, 71402156, 18308105519, 59248, 199364627, 10473166239, 50797754, 16242378, 8794625,
+            643584298, 1291166014, 1395261485, 155472779, 10984328983, 2347746533, 45646645, 59160, 234607084, 39486777, 269119401, 10747825,
+            15444, 960687, 338250, 16368, 2591875, 273800, 7439263819, 96277885, 60305875, 6076298933, 43929655, 37340523,
+            5694321941, 114199462, 334044985, 29527995, 102094355, 186787347, 4931355, 58564, 2040310573, 939250, 526138851, 122012125,
+            1003618, 467181, 45732533, 2186495069, 68118477, 1181232437, 57408405, 777084275, 174446194, 39422812, 5725528, 18560454,
+            2163572579, 623473581, 14267565, 632488017, 703150, 552916, 2224398745, 33884961, 2059841927, 101871, 146308175, 30044674991,
+            69170127, 9782019, 41997858, 341685861, 196681825, 48930798, 574425, 1858905191, 4411564289, 359775, 15960, 2469849641,
+            3214365, 160430842, 6755775, 80808, 874665, 3321656, 1922758058, 289917089, 127205985, 1793572077, 209560, 930952519,
+            853368, 2592575089, 101622235, 316875, 22705359209, 286976703, 424125, 236882063, 34013781, 556423205, 34142563, 660275,
+            205417303, 1929175787, 2730753883, 498730661, 109992805, 23496915, 123728, 53072929, 563978009, 166617, 1661317094, 59254279,
+            1544386811, 144033123, 10513967471, 1347096, 8543492771, 7678055, 1333727197, 2947015093, 2033982, 531650, 3821718197, 25578875,
+            14353521, 1408955053, 20706725, 3772450, 5914317773, 110744034, 1669074, 59254299, 422901897, 1732962, 71359455, 58631881,
+            9352497167, 8172375, 1153852, 2570060441, 1747748597, 112911827, 3573241061, 84773815, 4234945371, 267359521, 5854375, 6681383965,
+            1175416, 108705038, 185048961, 4609521, 2377375, 274040, 3493688, 97995002, 5425125, 982278, 1244290945, 202884725,
+            119908775, 1475955, 6665694515, 22337973, 301142335, 619846435, 152596927, 165814649, 1815099602, 1776424, 1218424, 68891207,
+            49509670, 2849540, 1052068323, 3206202329, 22939070, 24699010, 5596820, 10141541593, 356688577, 8948220193, 79837373, 16400,
+            11756750, 7592913, 68204433, 193805852, 748303298, 373923517, 4202944071, 2742285, 16500, 166725, 181443227, 9266946,
+            3390290501, 852483849, 242870331, 4523768, 188272, 80688, 1733522, 2303618866, 210525601, 28968906577, 787365187, 225464125,
+            32100680261, 5925757601, 90504505, 4051576, 15856203, 39122083, 359720, 87800223, 188190, 685222791, 62452411, 21050271,
+            3020875, 7335398, 80920, 632338069, 6326635, 69728594, 2548125359, 102375, 2162875, 2206456, 740962209, 20385960263,
+            477396579, 541248995, 2838025985, 77776985, 224712677, 123876, 1116886693, 87177890, 1146849253, 33734898, 92328925, 8992541357,
+            5875190817, 5875948, 150493623, 3881192293, 65414283, 832167, 1055566853, 82563261, 610295455, 590184669, 3922014941, 510136,
+            24484369, 479478395, 37944, 749483063, 5983048, 131756443, 155065262, 2098474, 14582794351, 424359, 1478924571, 974887545,
+            83400317, 44337657, 38821769, 126648262, 321124505, 6623820313, 478383878, 4433456809, 39315068, 15877935, 15062125, 59500,
+            74407333, 16993795, 8752084, 7550125, 18410312, 438097797, 1232400559, 10726625, 246540749, 446060643, 11036999471, 4043388307,
+            549533789, 4330625, 7034985, 328937063, 16629093, 19008894247, 95033290, 10098680063, 75845375, 5961830, 16593147761, 16007014703,
+            645967054, 16564485, 2206327279, 3038318899, 1841155594, 95484155, 1497146705, 5402210567, 789250, 47213930, 2276639983, 3751208,
+            3064750, 183718431, 322798619, 10468466081, 13924625, 92135813, 2291706, 455440013, 24849321, 78751133309, 488775, 52064506,
+            730466913, 133215995, 19719625, 400387427, 102465, 314299349, 32769710, 384869681, 1770091661, 38088, 28047350, 41740699,
+            3328927777, 1585251921, 363213670, 4158999, 27502704839, 1691322503, 15512925, 1227657319, 40195375, 3386313, 278756619, 77540995,
+            2055625, 326104014, 14201654497, 13946218, 445904, 255490739, 274360, 518348117, 102500, 3600975, 1751075579, 548482101,
+            11327661, 2334663, 1277215395, 657299577, 1844954683, 208443851, 5189247, 316209548, 145464, 1275176342, 1068375, 101708365,
+            37662769, 161396963, 488750, 9331641, 5425407, 35838275, 81328, 128301015, 57601882, 4545375, 25255528787, 79064909,
+            1819576, 9074065, 868516961, 55541465, 772212511, 2315938669, 202713306, 32018021, 1240535153, 4459910, 2613716, 38413991,
+            1721520997, 10650944579, 81081, 11177075, 5231172221, 1010172779, 38192, 4367179165, 4631276, 35902839, 59508, 1239613106,
+            102544, 13967716, 9950306437, 6277557877, 163135516, 5779659259, 1741760606, 3784158313, 203485953, 5537985841, 3762394763, 1328018393,
+            28347891, 65178399, 3000074, 316810351, 1160285035, 2828375, 125918667, 16720, 9238099727, 658351309, 117204711, 57923875,
+            43186105363, 209898, 159121941, 1287345995, 4711059367, 38800375, 252824, 703888, 16071055, 4695670, 6305390, 13280865,
+            7743087, 21737807507, 607505601, 536462967, 56850759, 575632937, 9159942, 15456016697, 99132875, 1586905099, 2766833545, 26029905,
+            961038, 1339479635, 566854561, 9579683333, 121025149, 3236205, 5783436737, 6593450357, 467480, 1594460107, 1700573169, 21930454,
+            111280917, 5261241973, 2100235709, 145638, 3708375, 511372745, 73062, 884249421, 21272081921, 424575, 2165397491, 187839491,
+            72797714, 79365489, 2463608, 3442531739, 11113206, 639160, 12937509, 109714398, 3319269733, 286354783, 5640124, 1423399953,
+            46119916, 2420392, 5189375, 596440, 59670, 188500, 5869932649, 2871375, 198914331, 38376, 710978645, 156782483,
+            486389827, 7249784, 5193955481, 252550419, 4237478021, 915928895, 114822386, 725010, 3037460569, 574750, 295750, 1025570,
+            38280, 42616949021, 1840125661, 707158207, 27146049, 16500407, 36997446, 295856, 2916709741, 456470443, 13804310131, 409745414,
+            1884114, 621714922, 27682501, 612056627, 16740, 98489046, 8001125, 188650, 71488625, 1240250, 7421571, 20728695,
+            14375438, 23910142241, 252121233, 7621077417, 90182875, 6862625, 138260031, 231472, 338810306, 14032250, 23947917, 2454826087,
+            1135752949, 2965645415, 962932881, 5099947237, 14764285787, 17616137, 977291619, 767555195, 1605006, 24934954, 16751180129, 15556079,
+            3236168, 6703877597, 24398829, 6691850, 2120248, 252915429, 1513501798, 19462422, 3450951, 208079223, 993496215, 188600,
+            1559475467, 23389190, 8778040321, 682227, 255469357, 7378867561, 82091317, 12492362857, 37743689677, 219797998, 865233343, 77884667,
+            3129016, 226773481, 17230250, 193956553, 1690990, 6498726, 76704199, 484243595, 918344, 648049265, 1154439, 23433140,
+            19569693, 99626681, 30773379, 120617497, 28927591, 2972814099, 34679645, 3206825209, 144055093, 1497771, 2820856129, 166505395,
+            59800, 70952125, 301335965, 3987555, 1626625, 2650203773, 466601057, 2012985, 2291982, 775196071, 565910331, 557561251,
+            13409825, 811053, 34872981, 9881539199, 6434337, 4027398635, 430865187, 12658625, 7056860, 13731718, 83915799, 6309924313,
+            19998980, 3235156457, 38250, 1836369755, 824131745, 22080897, 660968, 274456, 1862728, 149334997, 38500, 5847740087,
+            467852, 1090089, 1282559971, 639375, 2126570953, 2098854, 640000655, 3144839605, 119737563, 9206334709, 1712529, 696426913,
+            1454750, 424760, 16929794, 13261296373, 110293855, 1519375, 11091934, 2512969393, 7562955733, 258731417, 1250107937, 2012936,
+            275923226, 253623799, 3408125, 1873479543, 2377892, 5705118467, 210056, 274482, 2438384767, 25858430, 20363875, 668718205,
+            1605208, 338884, 188848, 66251805, 170991279, 21372644, 2828378, 2443729783, 5017870, 90505058, 467728, 159143677,
+            45902913619, 674942567, 12551330, 22810678, 4185001513, 1670782882, 400945909, 18709914949, 59555386, 81400, 1433565, 230100355,
+            209264, 9806869499, 124146, 149978894, 311616851, 532208, 621349399, 918459, 124244857, 2511359719, 38475, 117462605,
+            93982018, 660920, 86276751, 17000, 130125718, 746776, 351151787, 200331246, 6949611, 677217746, 8176582973, 53674525,
+            11177738, 20321035, 3489814835, 5684127701, 89453371, 885537475, 1837979429, 69428375, 1624036486, 918390, 27704259, 1068788,
+            253134, 491863142, 381915, 30151081, 2438449949, 43501073, 173502505, 662966187, 60016, 5456619659, 591880305, 16243074,
+            30902770, 83014477, 2914353, 855102729, 9632469, 543717769, 6348645, 36461243, 16607955, 265986434, 11262339979, 1133125,
+            7014007, 14225575, 110894927, 61873427, 1667649247, 68226473, 1433750, 23454662, 8115220249, 127485826, 4740850367, 119844998,
+            38650465, 156933117, 3064815, 6971094, 1433187431, 138968522, 13708778573, 36997807, 60025, 2357749113, 4295171179, 5361375,
+            361325239, 58181823, 1092505255, 321983578, 75996124, 447520402, 3184632647, 553569313, 2206413, 1153867979, 3193450, 2033464685,
+            10898825, 73304, 22596145, 643799630, 54618977, 3601432, 174382481, 1779965161, 3923348, 188552, 198979118, 25965875,
+            7615150, 163414977, 15706516, 813958486, 965079445, 4657316403, 12528528301, 4141217119, 2277563366, 25858588, 135749174, 19517245949,
+            1476615, 1103043623, 475122109, 107181748, 1113925351, 1927341, 1626849, 128709273, 111689125, 29789480659, 9160375, 75459566,
+            3841400495, 2978352094, 1549065939, 1583890, 3837483, 489294, 317625, 127442948, 22102586, 2529002467, 213445221, 2785875,
+            303289259, 2470752034, 1758115865, 2370262111, 3386750, 86190726, 25217711453, 14418844, 2963048541, 2710536491, 16972965, 8321866145,
+            33735526, 15534906, 10641345, 84838971, 19803691219, 38610, 124717197, 3922723831, 7808125, 1067157515, 210330, 164595275,
+            57216594, 297687459, 596673, 84044875, 5453894251, 3258025, 683055705, 746808, 2310637901, 17160, 9649288349, 993861395,
+            76384724, 603106023, 15719764, 192647609, 60112, 49296247, 114693985, 132529826, 58353625, 47815229, 1797908302, 1262056,
+            27403985, 474048993, 41204735, 489288, 73120179, 231868, 2138890911, 3321266557, 9035661109, 7014370, 21093875, 210392,
+            41827135, 50605702, 210375, 553784, 2034747, 4106790543, 1584009, 91428155, 1734399346, 44960745, 4824875, 5490303,
+            3537170, 240638926, 1712750, 38896, 688121005, 316854109, 4288375, 104885462, 18046158, 2142075, 87951149, 631523123,
+            373344395, 29206918, 214196515, 9267820, 18216, 754935337, 274725, 2613459433, 282491781, 558849369, 202220161, 400023169,
+            173481209, 138303347, 136307223, 200868005, 66488149, 746980, 138925787, 5018125, 274700569, 1476738, 1648456, 3043521,
+            4417196, 36289715, 41419389, 1373456095, 16715490, 367635541, 7207365, 101580185, 167504, 874827701, 57881593, 39530583,
+            259676615, 83057308, 408672938, 610704061, 2376465001, 317991583, 73549515, 59641582, 183740557, 3550319423, 253422, 490747143,
+            3857583851, 1742684127, 9568305, 268927201, 488901589, 3315836009, 983125, 5984034, 4623812843, 33821515, 8559565, 618280,
+            15782512393, 6177171, 217265763, 25429030, 6241690, 2541129179, 4717622, 38760, 467976, 231880, 10426850, 1279791569,
+            428676339, 5640635, 17388, 17809625, 42492537, 510952, 3923577, 11864895, 1381054045, 579625610, 17328, 12744875,
+            510428926, 8720369827, 13210150441, 103224, 4481625, 11950610, 445782142, 167600425, 10877559, 10512645, 16059685609, 1442867503,
+            17360, 446586, 699045815, 251756859, 17337975, 64728775, 693186305, 33184755767, 101408564, 843169838, 732120521, 5876776,
+            3623125, 10255125, 67153502, 1427435765, 30738317173, 59696, 69557428, 2196132938, 1497769867, 10937905553, 909705199, 81675,
+            296296, 122377917, 89045932, 12186875, 317832, 4975356, 130126065, 221365265, 875875, 897345, 431938666, 55113350,
+            12650931997, 15528133027, 5447547, 10641558, 1937460913, 305285631, 1022021045, 51807585, 2721705, 16909878047, 650432111, 261651335,
+            17400, 123644274, 70544815, 146224, 1817847629, 2142250, 1906125, 51271025, 337930879, 2527414409, 69686281, 26889070,
+            8624049, 639846, 5018247, 6048472, 85332819, 84387898, 63161553, 4919787743, 167793689, 2212573693, 774960475, 725679,
+            4740593143, 360750, 811538, 21587722, 560588039, 12380095, 235037257, 1568297355, 771869813, 65007371, 4900750049, 7872865,
+            1591069597, 221086285, 6070397711, 1712997, 102224213, 27447121, 1533699013, 834713525, 682803, 3705969247, 2979100, 10692454657,
+            302838874, 1661296559, 146205, 11800646, 189600086, 1369599, 367099117, 35152375, 19892125, 2285118655, 646611779, 43308315,
+            2249559, 403750, 18153693, 23570982, 6241671, 5404664, 339416, 18393529429, 523993899, 167706, 449624, 296514,
+            40045863, 102975477, 4395897, 41011481, 2312784481, 54426165, 109135345, 6155875, 317898, 278542535, 8057485189, 180435178,
+            47107290, 3172468, 5168583, 17470577527, 1112072, 3601686, 61122633, 26653025, 596750, 86426934, 6576430949, 1455597,
+            382347, 5597460781, 24120382, 1511785331, 8194875, 25322350, 1066964665, 250082921, 19248140, 320481531, 19613204, 468195,
+            156504213, 245296645, 260127575, 21888295, 1627208, 1141527145, 433977866, 79350746009, 673634247, 294189369, 85976826, 530775955,
+            463854391, 8863052, 189189, 10362627, 1885026, 2249390, 12337338, 10727476, 47279806, 13176625, 19033725, 113994186,
+            468234, 53202877, 306959954, 1175052359, 1127619141, 1024789909, 21373198, 136350489, 596388422, 15410794927, 3580398, 4138376,
+            17500, 124852, 4334084053, 386244221, 77219933, 10521995731, 464133439, 52924130, 13646358, 2213840018, 137862, 2596289371,
+            474800557, 4009912, 506329705, 5493064585, 422731361, 25520, 23326353, 30373210349, 3537496, 661250, 322091367, 232254,
+            21884379227, 511024, 1854013094, 509850047, 191862, 1152494626, 5906291759, 578467483, 2453174074, 1863368, 7216887481, 375426895,
+            60500, 108749179, 704375, 124875, 36826114, 259655473, 378624873, 228169269, 1863456683, 371284529, 275128, 31095975,
+            255877999, 26524375, 238192493, 4137590305, 30988685, 977421133, 152082931, 66145079, 725788, 725531367, 15945631481, 1136676593,
+            13968526, 156075049, 23390793, 38801217, 66123625, 4267263, 19827925, 1691690, 296595, 49209594, 66102165, 53653625,
+            52494625, 275080, 3332212723, 41462655, 20192787, 1140754585, 81405291, 6821375, 62303190, 103664, 82026, 253704,
+            1690701051, 6208533773, 4083224645, 86191567, 232232, 144012869, 1026375, 17550, 39150, 179942042, 75524449, 472997714,
+            1176604, 273477659, 12187250, 243450998, 45948441, 113277875, 418395857, 21542366329, 10019375, 163609190, 36805175, 205933651,
+            862866, 1750454123, 4468650, 42063593, 150602075, 68613377, 1228516825, 7551145, 11264253, 534280, 26309815, 25584,
+            589284311, 2614430, 297752365, 153392343, 60552, 2249752, 618608, 192200, 16790608399, 2829124, 2552869797, 240210103,
+            118579318, 449089498, 75053914, 1606044, 834692287, 29378740, 349607006, 9445325923, 264441749, 318136, 5791203, 112312070,
+            32469745, 22424997, 8817501, 40432, 16286595, 438077471, 91428579, 74279535, 17680, 38988, 256629373, 103769811,
+            5898618, 125048, 253820, 697135915, 78014321, 778051547, 214604753, 189235501, 67368490, 28778106, 191317802, 23348036,
+            768950, 1160500627, 897974, 298310506, 99263230, 20944119, 897736, 152211829, 1861974, 1970878, 3074485141, 29507907,
+            39981909, 146475, 6542488, 457415695, 2593250, 29078905727, 425500, 72433790, 6606875, 235080573, 83787781, 2180400989,
+            510558158, 8647632119, 2471932889, 551809951, 1058980677, 16394014, 57517834, 512554155, 108921274, 116433086, 3338050793, 10040949,
+            6462591421, 6510346581, 596624743, 344949605, 1976030303, 226216298, 551123177, 3105134313, 3166497037, 3319227857, 6799238587, 570804767,
+            905219763, 6128605667, 6349330, 9332687, 3824659949, 962115, 138861899, 248258803, 1857597469, 3559112, 4546449, 69128605,
+            943016113, 19119815, 12208742, 101022601, 1155308, 41784743, 190179935, 149958275, 4151519969, 86556561, 1026513, 4245890,
+            4009875, 7808776, 98490007, 31074725, 1863199337, 354929974, 10749277, 9138533911, 1730407786, 142403305, 9723443601, 4554230759,
+            1262625, 5319135, 102868394, 253750, 17784, 107590274, 1051404321, 273392007, 79259150, 1670420, 2344485657, 60760,
+            1995239701, 24635875, 962104, 581965573, 167960, 1885113, 375813465, 3494799, 8409674, 532875, 77992838, 5769885,
+            661635, 322606739, 14742394441, 3215781, 618772, 302731957, 3479856919, 2486678051, 23154901, 1133715446, 57087921, 1015153645,
+            211640, 64514125, 38457918, 361250, 30065945, 2619061543, 189584, 102825590, 1176822, 36483382, 1219750, 1434926815,
+            3967029, 550329143, 19420375, 13160206583, 3859576, 67046725, 4985400535, 2743624, 824883917, 44768185, 2550447, 479007674,
+            13131755, 339822, 82215, 1434426, 126198, 19935503, 436467941, 891526427, 706278089, 876375, 2314375, 1219779,
+            1477336, 618936, 26379654569, 4224594, 4052895, 9139625, 1957701005, 2951094433, 9955251, 61250, 56272375, 2456822459,
+            5296214, 117549542, 38264919, 115983049, 1133958, 554445, 3286518599, 208745537, 1070004, 45412318, 42536098, 39375,
+            281934598, 232760, 77177375, 112140622, 108943318, 6860837509, 7358229, 15857534, 379998806, 5274593051, 17746317, 22790115,
+            201662846, 4761207, 373538495, 189486, 198808115, 4033731191, 94884335, 855848, 533022, 5512386, 2164185, 12552273,
+            33328490, 163694818, 2636361, 309278263, 10448932, 2996231251, 604543555, 3859779, 12346415485, 3589726127, 10570460879, 2739168877,
+            970338759, 1842392, 2142910, 618044086, 487850441, 287214202, 1303143959, 34809425, 1032109195, 250684291, 659932, 3290810921,
+            2583090159, 977249743, 159166059, 212179669, 27812493, 1248391855, 45326307, 22317981, 916917287, 161419706, 799557605, 55821506,
+            2937033, 1799343, 103788, 3671478661, 651527746, 3482647051, 2011101037, 26632034, 73357005, 1219914, 275500, 404248,
+            21910154, 1056834614, 144614155, 432754959, 38758657, 125307, 1022107603, 404271, 21741736537, 1498910, 14011876, 11994367,
+            146718, 683240, 94111745, 1188939361, 9569014, 1195227982, 7014897, 48095108, 1126503521, 270752251, 2207625, 128152090,
+            1249765527, 1484892695, 597402, 10880213747, 1241910254, 35989986, 530304307, 661986, 17682025, 1544173529, 16460550713, 50863698,
+            1112643, 16179625, 6360578033, 60858, 115918114, 27984275, 91664930, 2664864085, 109994390, 1563250, 10979415631, 5791492,
+            81928, 60648, 356818898, 318614745, 189750, 18032, 751180065, 56637385, 5832094697, 1771531177, 32019393, 5426590,
+            1906996, 187669365, 2170227785, 14891982, 361416, 10105625, 1477410, 5987336559, 84947005, 361456, 259784701, 393456446,
+            902816255, 1455445505, 13196716, 39440, 224499535, 248151761, 1842375, 262939765, 940984, 4803501739, 7748440063, 2904562918,
+            14624691595, 20064471, 1072288047, 2572125, 7057911, 1413125, 275576, 345808441, 225443953, 1430355283, 4246209, 58504215,
+            24893682, 490360, 283200863, 1477521, 5302001469, 1804712833, 21845915, 124524898, 34187153, 277384393, 1935508443, 652750791,
+            144957638, 11543697, 506974143, 181874055, 554625, 3894801355, 55907709, 833776, 1769663861, 195803531, 421658678, 4018063361,
+            619038, 1525972973, 404896115, 676639139, 533169, 10792495, 7745089, 470250935, 531656594, 18991375, 4898904895, 5313462737,
+            189810, 3540897965, 11479325, 297160, 612486251, 260986689, 24314199, 4522958993, 46442543, 8259875, 24550295, 168200,
+            480810745, 54662881, 146853, 15664610, 232713, 1183037223, 1408248439, 176100535, 292773415, 158329171, 269207042, 538417451,
+            937865365, 47129379, 231496531, 1976309675, 6177964, 123881295, 18096, 4878751171, 73829356, 244739209, 123365974, 2697981466,
+            2035592, 142081665, 4226233055, 4396574, 576156, 254200, 4975965, 200353347, 10424232329, 253968275, 1032710626, 5169250,
+            3170511019, 4408067599, 641955254, 443465187, 447304, 104135143, 14033514, 232750, 2336480323, 160711595, 4141926641, 104104,
+            48932106, 5061942, 26141115011, 490490, 125800, 11306232857, 762748707, 40716, 230702465, 4764117262, 684601985, 81826932973,
+            196941175, 100336346, 37793090, 5104869, 4503850, 1649375, 1082869417, 6909623201, 8560431, 1413315, 1542104, 2314737,
+            435717106, 321812855, 353685479, 5448250, 22232375, 1366567287, 5189406695, 156998570, 5813181, 211250, 6354675895, 5375555101,
+            43609522, 2078488, 340119, 21438326, 3961723089, 2410098449, 125736, 18240069709, 64643271, 3156838993, 6600663349, 443379453,
+            4053225, 60952386, 20515586, 14119375, 4568094, 164875515, 16566214, 511784, 9976940, 533368, 3150464641, 18252,
+            1112716, 119223582, 2464965, 7584613165, 6795955205, 32749255, 61074, 1684928089, 3623659417, 3108875, 312777069, 8302970,
+            39672, 61008, 375277227, 12681464, 32174321509, 5862700987, 2230264, 1091502, 292065198, 268863775, 22489932, 51657594,
+            1722060106, 11243375, 810568415, 635923981, 1664924597, 82584, 25087244, 45906091, 51915771, 1970858201, 2833949807, 20043205,
+            546831103, 1612790965, 1026750, 2143071, 96022082, 219069601, 76920151, 3960993101, 32620532, 106667855, 11672661, 15965278,
+            45154941, 7422987, 8431731, 10341950, 26391459617, 9364711477, 275302709, 1664001703, 13239457, 10471236451, 6221094, 451943215,
+            8322575527, 746437003, 294039889, 3495250, 807434849, 8560539, 1416533313, 324646127, 64557493, 2450835311, 4780450801, 731756333,
+            1091420, 1863862, 34359125, 1607528, 101516779, 851476930, 751652426, 18200, 461043606, 5233761, 116476490, 19525939589,
+            13046462, 82587530, 44532719, 8568562981, 415649054, 3151875, 515473673, 1434818, 25129995, 37900506, 456815194, 4804401,
+            41484807, 56508907, 1164321653, 1273568379, 93212119, 6564591, 26821320683, 161913554, 9060537889, 196126246, 54641587, 2958199211,
+            1546921103, 1452698533, 898064, 13819130, 1349019, 17789695, 4595031991, 1756809, 55006237, 65437645, 790875, 891634261,
+            388369835, 82824, 366177273, 4215158381, 10101879749, 30618168257, 589499614, 33586454, 2534111833, 1481587757, 591238138, 12142689119,
+            297297, 27598285, 461751851, 360167534, 5212375, 1065634817, 4803373337, 8818136, 90205863, 65630799, 2087359477, 554931,
+            746115161, 6877557669, 4332405, 2400650, 447615, 729352547, 286764023, 893995201, 603429189, 260772321, 6264075, 1503114899,
+            644101513, 6663099379, 49723951423, 221988678, 6543125, 135707429, 125685, 5663125, 5219133161, 19620591509, 1112553013, 447640,
+            2634107959, 1949960, 467439574, 171378974, 705159, 14870765, 22490167, 53289509, 8861125, 833750, 21173289331, 36183525,
+            10921599, 2239166518, 8367485, 4804625, 6609625, 5080718278, 1462249633, 16265886, 743282122, 2153293883, 29293915, 426195,
+            2958813, 5899402951, 2465034, 512072, 726726, 46593124, 3514820735, 2070317919, 34445043, 12509875, 128882270, 249976467,
+            254475, 405003734, 8174375, 852743255, 27705630, 18347836, 530283299, 583447117, 4053465, 76726826, 1076194691, 3399242473,
+            23993324, 3118313343, 60973341, 11766399883, 3323727, 254610, 427947715, 32086387901, 190125, 1365344239, 41613715, 333853923,
+            429750607, 22812125, 464842581, 4289558, 752961925, 103942267, 14098149, 11731801541, 12424035, 42815673, 44167870, 4332484,
+            65035594, 279488157, 5501414597, 238987463, 10106041, 866243687, 168610286, 56036871, 371907861, 377273554, 12258374791, 12051085111,
+            287687037, 1799875, 48696505, 1975365694, 277212943, 21393285163, 66188875, 65995683, 13242324607, 1242339787, 662337, 426250,
+            50864289, 2658370, 212660, 3769565174, 9097572, 1325144067, 4990745459, 3607669745, 1198881, 1456455013, 101259417, 2765750,
+            20258055, 29658867, 694604071, 262596815, 1702742627, 433270585, 4957155845, 317263045, 249719290, 18600, 131243255, 191597174,
+            3796012, 21502965, 6113975, 46485875, 9590966, 409940427, 3087693, 678184923, 766204658, 95442985, 289940695, 14184422,
+            7971076213, 50134595, 42601130, 24164375, 503154118, 2302397435, 61425, 12531393, 1209522919, 204131590, 8474925, 291207025,
+            13980286969, 61272, 147288, 7659333, 11866085, 218554805, 1953366079, 1392606, 2411000231, 21001392289, 1169623273, 984940,
+            123774175, 772407597, 5436768127, 142296814, 4826206, 1456616, 11071970, 35217716, 67273581337, 7144250, 2165702, 15515058,
+            408030029, 1940381047, 211888, 90871482, 926018203, 898288023, 903396255, 17916086233, 927263134, 72048361, 526119595, 12335469997,
+            218061165, 182261338, 1661061623, 141288050, 12311045113, 540327983, 6500375, 26618645783, 58934525, 11359289821, 125488, 40040,
+            1735448, 35302232173, 128496506, 3795981, 10942800329, 1020562751, 1505369021, 1583666045, 124267871, 454282959, 75461045, 431961409,
+            36248114, 995429611, 496500706, 855625, 28328358, 427905005, 211750, 2620307499, 938230697, 89735142, 7251706, 1649830,
+            24829805, 1220408, 432819985, 7837082813, 43180683, 3109293, 12145287, 383320, 15456211693, 1606792, 6028225, 722441707,
+            984410, 66747057, 534006, 5920915, 12853467, 7874132, 760946329, 20301125, 26353722, 1134675, 48889841, 16438873967,
+            3130725, 1599162341, 69494385, 107677167, 1392237, 1256484073, 1106114317, 172280647, 140880275, 12385586147, 262339546, 52195165,
+            82479475, 1585413, 2269001135, 12660327, 1482146105, 14951101451, 696171021, 714757979, 428978121, 61500, 48610822, 2723226,
+            114673975, 6757880309, 2556455083, 20837642, 1019596975, 15257418, 1783250513, 598125, 254745, 20043529, 280797602, 5846604247,
+            15364685, 3066375, 83025, 58612625, 4886349611, 225551846, 317542269, 828189955, 71340269, 16686148963, 13709145031, 25560678,
+            243816873, 4525885, 18630, 9526761, 79217125, 18240741, 590852119, 340605, 60736445, 1800117, 126500, 50478175,
+            27202847293, 211665055, 297724, 10685775, 962948, 86385838, 2401124, 445032497, 10857730, 18522, 1050847138, 448362,
+            397191485, 3753243, 788677107, 4804910, 451106513, 422002867, 224006637, 350144597, 21605898043, 55285989, 2615718, 549557337,
+            18906125, 1161789418, 276250, 619528, 84823211251, 979096405, 705250, 7166943623, 47795335, 490875, 2165128, 579047667,
+            1265096, 180801579, 1147258966, 425758773, 202715293, 1779387249, 18627125, 125727591, 669599995, 5044596371, 12745155901, 168756,
+            706730783, 104908405, 383496, 3135376673, 293203022, 228192085, 24529505, 1876035161, 7990865321, 103148435, 27319653, 86750710,
+            7509502, 20988075, 235789715, 3097988133, 8196125, 5749366, 1000173243, 791384, 1593796645, 224607581, 26697242, 8045895,
+            44339825, 10778587129, 1470405937, 284038615, 4161114, 5684279647, 37209541841, 42107702, 167837906, 24722841, 101925098, 12432590269,
+            161141487, 11704973273, 383656, 128882593, 23271813077, 4289912, 41270645, 65502367, 9353937551, 17401846, 3409911, 128667981,
+            1253651179, 12810707, 701172043, 3946455, 877250, 659147489, 12616356533, 37922423, 3710421, 178891401, 2551548, 8065857143,
+            3060299163, 2612580434, 5491827, 5805009067, 10342479, 253518265, 4998175, 1778744, 4371452267, 861972794, 4031671737, 14613625,
+            7509149713, 104625, 233415, 1525050637, 2229375, 237141983, 383625, 8749110253, 641410, 3377887131, 598455, 2737860362,
+            1742943169, 41592625, 246392575, 2203367501, 233192722, 96645241, 1101821853, 8547744403, 1070696, 1698085807, 157922091, 1106586695,
+            40014, 425587175, 24314927, 2384321995, 32599625, 18768, 151762234, 15193410, 3989356, 2208234, 61712, 32467914511,
+            1263735, 4118114, 13712209, 490941, 83166490, 7530798, 45091123, 8110375, 3868466809, 641240, 211000114, 757748593,
+            533224131, 949756595, 1303981861, 17425375, 28671066937, 4571101249, 31977275, 535820926, 279853167, 662625, 619875, 15343419,
+            55844173, 5620625, 19185404, 171615535, 506953447, 23928625, 17670442277, 3023511667, 812889, 321877985, 21851885497, 298204361,
+            1346757709, 57046045, 181145107, 852078493, 27641770, 42365375, 831109318, 77329362, 1928619, 349329266, 393092245, 461001167,
+            27684755, 268070297, 191216, 10922067, 405080, 22211651, 791505, 18476770, 2294248, 168138607, 14077063, 269980490,
+            20730650, 2894925, 256523183, 8424353695, 5986164, 8711395, 2944849805, 82280, 951516605, 469336, 73272125, 3581721,
+            984753, 204818822, 1223624521, 63480, 796274743, 419427489, 953126279, 18928, 684250, 409833423, 4493598401, 169904,
+            22589847859, 126225, 448188, 1381871257, 483687578, 2057913, 6844149, 147560, 9934834, 789342127, 3540019067, 4654935,
+            13693155359, 2122302, 4805271, 7745660, 26976447, 61880, 3371834753, 3318628027, 2451801781, 469557, 6994375, 188313845,
+            46979973, 1361545795, 54856893, 1349634, 61875, 1285245, 276507, 47044361, 836882761, 988733499, 1432738563, 1999254461,
+            830508259, 2176002227, 9796204321, 202543627, 2156106073, 1281295661, 33930589, 156720382, 35205305713, 137682633, 215013799, 571471303,
+            1563852, 2572504, 549729394, 53461798, 1117447111, 5384691, 40455275, 23106247697, 984808, 691578283, 19807876, 18837192211,
+            40368, 4569090, 7072678427, 5878334, 43095514, 1199562, 245791777, 13161774449, 6482295734, 18047860, 362440, 9076375,
+            286013441, 701129317, 6307587, 12672353677, 19000, 286442715, 465894877, 8346562, 12023613055, 9848979, 2755932611, 100723371,
+            77800910, 813186, 31526721, 82866125, 48740054, 108750551, 316898758, 111347467, 1788101553, 16867449, 5599375, 3839199,
+            15107475, 15601124, 4890808, 2641148726, 318990, 1192889711, 12703691, 365855963, 79603755, 1770909679, 3544547719, 114373825,
+            126750, 222569282, 105400, 108557393, 700936214, 491300, 147784, 360039379, 415027613, 40848, 1874168179, 1650250,
+            348277657, 155454057, 305802477, 21009835, 14664527933, 133046606, 2143854, 5041365, 104895, 940978413, 28264374, 627962027,
+            108213993, 374999107, 2077186741, 522900653, 265945603, 152020001, 21718095, 2754859495, 13750719257, 1051362637, 178505390, 195375271,
+            318465573, 355381855, 834632, 12526598513, 11179809, 6350645, 65481207, 2701930, 684342, 335893525, 229866325, 101281495,
+            263799305, 136566661, 128517909, 4921807007, 15378301453, 599115785, 1050976329, 24830302, 1328319, 32222571211, 675159199, 11587625,
+            976843105, 2594625, 42472885, 77758051, 981779645, 147852, 156076545, 48353746, 984441055, 119922471079, 26654606, 97031825,
+            69001179, 392019286, 9849125, 12724670, 7326371221, 228557095, 835016, 522256813, 4204375, 1409365529, 13132977, 13173192917,
+            18541662, 36634975, 26590291, 18777759, 254827833, 712333139, 1306875, 3045396, 905929405, 106110706, 30217538, 38910066,
+            104994645, 54964395, 25787684761, 147798, 376565959, 163309601, 1298916931, 233750, 240791043, 646892506, 270452897, 332201947,
+            3753666, 351475737, 332030415, 781057667, 288503306, 2899327067, 33909132, 589951173, 13047125, 3431715, 23392325, 17060758,
+            4476771673, 453103013, 255717, 309236565, 2588328155, 559623935, 1044086771, 40841735, 40600, 110381887, 473020691, 1866892313,
+            39661299, 17919460, 191835, 2347513285, 1693251, 100465937, 307691263, 1929950, 1322161417, 2112235909, 5857137, 85248999,
+            36441867, 178247907, 342590083, 22083105, 90678302, 552455423, 169136, 12102831, 756890422, 469752, 985014, 763029071,
+            17983625, 4526124, 1946949361, 4311765, 2314588835, 62192, 214005363, 67197975, 9009091927, 29231509117, 593299421, 3710828,
+            856251, 2952920245, 31419586, 11609164, 4054465727, 16546725757, 4167275263, 558315163, 29916887, 405594, 22254869, 2449934787,
+            14255550719, 536894590, 807157354, 684452751, 185545393, 6973278, 98212425, 194710132, 4097704, 71362214, 11718430867, 5424255907,
+            1779141, 9527375, 85806182, 2381897089, 3104877602, 11759385, 106776524, 179621421, 2723384, 34889220559, 26418925, 199109911,
+            7661215597, 110296109, 42730597, 363258, 32621404, 18648, 20645163, 277407025, 93834169, 5946021433, 747992, 6629864,
+            168095983, 508499138, 1242621, 61639501, 620217, 173912453, 32643026, 3010827415, 577269, 3991557706, 449025879, 4068395273,
+            53161625, 150646573, 424149099, 3260115, 85441983, 212355, 121564223, 964250, 225488079, 2702133, 1259017463, 6329375,
+            554515855, 115511669, 9420125, 54143548883, 11062435787, 2465991, 6136221, 843751259, 12982893, 9355676, 952203967, 239396105,
+            2702310, 407515801, 3431875, 19679375, 706473911, 180244077, 1435798, 344006845, 154574329, 22448115, 975255065, 3473719973,
+            45043129597, 1156815, 2272875, 112206381, 339434966, 98298343, 313422005, 493110211, 435761105, 7428621121, 449669181, 37386349,
+            126994385, 2352063605, 1543158, 169533, 341145, 79303642, 18817640153, 285498655, 1285625, 337095715, 19121375, 2272712,
+            22963362, 28500703, 126616, 5642663429, 5621154, 142619477, 40133643, 358236775, 72328155, 240276113, 53054365, 83538,
+            260107854, 69215993, 31937371111, 13240535, 663201, 2702150, 362637, 747790239, 678164246, 1342765853, 298410, 899756,
+            24358334, 40920, 5707026, 22684233, 31261393943, 22270156847, 295586302, 19278, 362824, 21654039, 2918216, 598808,
+            126280, 85678606, 1714750, 4912749437, 61918625, 603386914, 223492082, 43460274, 834678, 83250, 749035113, 663255,
+            467268851, 2574270101, 2509045, 4226103, 575549689, 19344, 56467047, 5234823, 200612594, 148016, 3474625, 14335310,
+            3609988657, 1163550063, 9398766, 26547625, 65996634, 3776434415, 62320, 191168847, 83824, 1972542, 293075189, 35111375,
+            2144752599, 148120, 1757875, 6056427251, 334691929, 9888495661, 9875210053, 13820125, 233107553, 3660040439, 744613831, 1285746,
+            60137242, 173848214, 239031507, 427128, 1114047, 1580919369, 264078663, 24122350, 134699721, 6093395, 208339313, 1242254909,
+            3748575265, 1585834613, 43349999501, 1582379185, 1302136671, 22233603, 43997122, 835445195, 132489071, 598858682, 20873645423, 2108802077,
+            663544, 3728614709, 1264450, 64923518, 52367667, 35003969, 13262095, 9096124659, 1543275, 133304665, 1142258815, 1848885153,
+            6887595, 154381359, 40605945, 1153784443, 577422, 899346, 25315992799, 356090590, 2101250, 13026013, 589908517, 612294423,
+            67713737, 4118877, 323853179, 6501249, 59901205, 405769, 3484065299, 10643633, 2809625, 491625, 105660321, 54428157,
+            3625356163, 2916945, 1185785805, 1994031, 129655955, 359889565, 1933943063, 4266350231, 63850402, 330614037, 14657172, 242937669,
+            494612807, 99521924, 8861828, 282150561, 59622145, 36857120191, 3367430, 384104, 3636409802, 83640, 5119245445, 2874105,
+            13843611013, 94199142, 834860, 942344, 4269125, 6286707, 1488843629, 164447647, 206579362, 7123850, 1818321895, 883458037,
+            31827645, 12078731159, 5377960693, 1050289955, 28543782, 1822359, 31806125, 868197837, 3367683, 277160, 27867578681, 13026069,
+            8282690, 166014299, 104500, 55501369, 26869591, 1521891, 534750, 1987471761, 5818703231, 401077105, 226926557, 1478979,
+            40648894, 878004, 64000713, 3554807338, 361155890, 48890875, 2559546743, 1115224, 1731482711, 7784971555, 449442, 123023985,
+            247938574, 13455582023, 77307789, 1426622201, 26354619, 2184888565, 55394075, 856830, 1264375, 83720, 13627047, 1049750,
+            61704170, 19500, 3078500539, 596819657, 1020606483, 204454495, 148304, 2430876019, 873821267, 9162902, 12196583911, 41000,
+            1264545, 28211501851, 405799017, 169785, 283009199, 564195957, 244139246, 33802307, 3260721431, 4956039, 255664, 7442293331,
+            1286812418, 427329, 19536, 271762595, 2724106, 104958, 449500, 4588916267, 574519435, 464114014, 4290741, 5127896,
+            14861150977, 25989770, 13992050, 534681, 3922618973, 6658894033, 59557938, 366371558, 102226375, 236391585, 241950511, 1586375,
+            233021901, 54578517, 3883405805, 5793125, 1186258166, 1908632, 3282125, 189945679, 120341155, 751546523, 19915805, 18885572,
+            5385226, 680804485, 14786079, 21267916, 518737373, 108085809, 46401135, 9956947, 35113962, 17576349, 335958475, 169830,
+            181081461, 749331, 6823375, 1457625, 2400742003, 6222425, 95250935, 1163335667, 1853070601, 31076565, 1144340873, 2037123,
+            31634603, 120534386, 505966903, 10171612, 78745953, 3925875, 6243874, 45156293, 1199865633, 1801048, 305008834, 2873936779,
+            1329995821, 25946921, 1521976, 19602, 396784641, 9291625, 458147365, 26998623, 79754685, 6351174, 15258355, 467462281,
+            20409554, 1242904, 157558089, 7896965611, 5363930, 23779275, 6087033799, 2487880, 8360695195, 23636663713, 5020491, 963976,
+            684500, 42731020, 706552, 149337758, 272986077, 2938552, 33909526, 254856, 1323514093, 14786199, 5020532, 10343372,
+            62920, 41250209, 389959549, 84216, 632985001, 255750, 448532315, 25431849, 169749118, 5977593941, 52324993, 191394,
+            9308351183, 61581809473, 734547902, 96345613, 49556275, 737381035, 9293927929, 1913467589, 332782055, 470680, 3968853, 175565555,
+            3720566339, 1418187417, 105560, 3389375, 58012966, 4162897321, 637771277, 3668385, 339993771, 105625, 2208843, 2846850559,
+            9447152317, 202072353, 684285, 668720906, 2994859439, 400411965, 73670415031, 146869630, 105672, 168933505, 5084955, 253218757,
+            39416540189, 1822689, 8011835663, 19701279, 658611877, 3131703, 11523875, 38073625, 177432871, 7354574323, 1624897587, 76685539,
+            27449718, 16481894, 14974304077, 20366613, 8461056269, 34446519, 267856505, 706266, 386031778, 276484637, 25131483, 3883113,
+            115597977, 19658375, 427720, 56059625, 514938398, 7768981883, 510839131, 26912875, 776808591, 384615, 130836699, 10871372671,
+            7880847005, 97547615, 12361108, 4333805, 43761102167, 9141032, 2024603083, 208146463, 13411282589, 26827059, 470475, 12940330,
+            27792875, 145925225, 157236898, 6858650191, 818811897, 276822, 611758185, 1350008, 3715801639, 22053252487, 392492177, 17984298,
+            19760, 2145890554, 13412685, 5439473711, 105616, 405713399, 185288389, 31634739, 2653275833, 797778023, 553808099, 33502053,
+            8645080081, 298792, 116649715, 77029017, 5889981493, 963193361, 28694351, 298809, 203467625, 41250, 5872554143, 156828451,
+            258005033, 18993065, 406125, 320827255, 145474355, 48011041, 3218358, 1508739935, 1045353749, 80849535, 10429375, 20240,
+            50565125, 1114407, 7842600007, 6261978827, 19293351, 233322603, 95271618, 8969816, 1992215465, 495900986, 2516857078, 4827537,
+            1839570411, 5170935, 42452175, 72908187, 1091520683, 41800, 226110999, 279618326, 4701296807, 586517710, 850534135, 25002835,
+            574970675, 48869611, 8197227, 786917813, 43654138, 82459209, 62775, 213003, 5373968699, 298956374, 105644, 15043941,
+            1917266703, 50973010, 10450875, 1542372481, 149831574, 229952965, 627318942, 536452, 5471375, 49899894, 4639934083, 27234886,
+            30819249, 4602888985, 11416625, 1430593197, 10128940, 3046060, 1297866057, 3113549881, 272363861, 12511557, 66483057467, 4033153661,
+            49985705, 5965113, 46680546, 513513, 575421429, 6716226, 3447020603, 393801515, 1065335909, 2860887545, 1195959695, 301918331,
+            35369469, 8476299, 2544479981, 2851293601, 10075438883, 1633289858, 239632883, 145431715, 2924739961, 1329125, 89370365, 18842916,
+            1930095, 101582283, 1628525015, 1035331262, 142212259, 43990756357, 1804907945, 126984, 19845, 9892875, 247380991, 83144798,
+            1688621429, 21955087, 8755318, 1177759099, 3389970, 1325252635, 235855347, 13369895, 564968971, 179236066, 2205600617, 110704629,
+            19186365, 1307691, 16159804, 26794879817, 907110685, 48826778, 126952111, 2230605, 5063709, 51552605, 572287885, 39361599,
+            123689722, 26440866, 212009975, 79239861, 2679611077, 14850875, 125599941, 15988329, 4611710381, 170457623, 387663155, 4205029441,
+            16443103259, 339607387, 273222282, 3530039471, 1651125, 201965309, 4486173299, 170200, 4870503, 2089464509, 2078174913, 316620655,
+            10214875, 934368721, 357915467, 99264854, 711732999, 22111717667, 9055875, 24230375, 28973516, 147835545, 7896889, 126479875,
+            165692863, 694047406, 68851783, 16610853, 11051937, 790523870, 363375, 1101222083, 955767355, 168332878, 9356375, 410371025,
+            24273165, 814088, 307413057, 3153843, 7677592637, 2079977829, 5364333, 8861641969, 82158875, 61747525, 556605, 621027,
+            175158074, 387126597, 3840356, 1243375, 17061625, 882900491, 4590729, 57347675, 1973125, 212117477, 37644698, 62176835,
+            318058689, 384980365, 3187940855, 21268377, 442801681, 39018265, 384846, 2094658553, 572931863, 160241325, 870816835, 3024819,
+            150325386, 310833710, 69736955719, 6892475551, 1552438801, 5470466533, 377554177, 201536115, 182176491, 25668335, 148770, 1248866143,
+            14035395, 448532335, 489912995, 93856238, 45607430, 104051030, 137919795, 1229206035, 8218925, 1414868, 1430829463, 408632609,
+            29638973, 272020609, 1329669, 401485447, 105339333, 1259790763, 39082582, 2504537585, 4269699, 1814137195, 3561435, 289985210,
+            89284811, 1738179641, 322544525, 51166375, 13241319, 2174693963, 2059029, 191791358, 43117745, 322136754, 1491655629, 10511545813,
+            333555131, 95680675, 2530654, 814131, 256496, 39705292, 51316625, 48419125, 5321349, 1552996893, 706875, 43997756,
+            4945910879, 1614917635, 1408507971, 28537911707, 781960118, 704779141, 2230767, 56446299, 1736955, 4591730, 1091944, 330185401,
+            868091114, 18533578129, 3199166117, 1090812667, 3961553333, 5793608, 127413, 42345147, 4537749005, 56832666, 384744, 8261841,
+            137941349, 3797625, 61919389, 3194143745, 594030099, 324632, 9014866369, 6265844, 44706277, 6115365373, 6330236, 125964951,
+            56961322, 161958446, 281078085, 1522521, 40585181, 1796730767, 5729265, 1802332571, 742296503, 148750, 179536643, 64795425,
+            138241454, 3705821654, 84112145, 516591595, 412796527, 70440214, 166444215, 105570, 277695, 4694257243, 1820726401, 127445898,
+            188100374, 29102521, 477657790, 49213325, 60631641, 55702021121, 231348257, 578151, 6869424991, 105800, 1806496449, 15387625,
+            921272, 7683932, 5092095437, 2080750, 144337395, 2412633047, 38353029, 2059125, 249849345, 5384464553, 381224459, 1801540,
+            71663630, 1887435, 93577375, 45630, 2807359093, 41314966, 23887006, 84500, 193637873, 1651347, 985986, 2657547385,
+            194990055, 878750, 1310808499, 256360, 881462649, 68852079, 771375, 199218249, 728433, 22899855, 2049114353, 3548197473,
+            43396893, 1393821, 5069301587, 6478669571, 106029, 2738162409, 857164, 42667142, 24294578, 4398597, 501267117, 10772601,
+            1471180051, 20196, 1157970, 155347934, 31120364, 190182377, 4205058, 302605457, 192280, 18306574, 17455277065, 1420806415,
+            62799428, 253004323, 3625794, 34425391, 161700925, 1746871666, 8412687, 1797632309, 11309768, 64622945441, 145753971, 127596,
+            10203185749, 562200569, 10150206, 63336, 70118375, 73123141, 234520, 1179256, 9742915, 499356742, 4806895145, 33266596,
+            456903526, 149175, 131459594, 84656, 94586258, 6523517, 4227028, 11717566, 84645, 41496, 10751676, 170478,
+            52108342339, 115233657, 2617250, 4913818, 8541027, 569476435, 2681190, 2137134079, 7682535, 1780161205, 154553847, 1533487207,
+            17536879529, 8240575, 101025125, 306790905, 6893721341, 216774971, 685355289, 3885338365, 365792693, 124333484, 41958, 5792626427,
+            1028850, 2102152, 277875, 311660762, 20495965, 3304119, 3754875, 38546365, 3171951183, 3615763099, 213435, 1471587949,
+            297475997, 105038726, 17040452, 3729903353, 569841445, 2039091123, 10165970213, 1035803197, 1212100279, 62198591, 2273895, 15108769,
+            8019992165, 200377385, 10644465, 2444849147, 62821018, 1437656, 1201095, 7854275, 133970837, 252253443, 1758462407, 3071547267,
+            986125, 105317589, 51552908, 1715912, 98557030, 189173699, 599564, 1599485987, 42436835611, 49041566, 203123635, 502640853,
+            20131111, 1749297729, 52497302, 1017452023, 353773502, 1436875, 30433383, 102140922, 3286606453, 1312976413, 2891816059, 12790910,
+            1133867405, 75054969, 4570475, 19980, 2929655429, 2488970, 119719457, 2166633, 1308125, 6673875, 133112822, 1982557421,
+            5836831, 428792, 149500, 3475875, 164856065, 20328, 87224466, 752641901, 14722070, 664125, 12318625, 256567553,
+            4442217447, 34919290, 14227971823, 2402595, 610170613, 9335094635, 9549925, 707265, 4289229514, 37602125, 19320, 364095,
+            416853311, 1909138, 16674410417, 108022166, 277816, 170500, 8133375, 34876270, 417282537, 2577276109, 24445267, 63342,
+            66169246, 1157912, 1179375, 1860798079, 163847431, 5016417117, 17126375, 44105375, 309903338, 506783265, 4012515, 796641131,
+            171166345, 1234937015, 408482691, 88974736607, 327288199, 60710305109, 374463947, 169513687, 14472735919, 268543891, 1179387, 149240,
+            11739175, 62263190, 19992, 31499484059, 11073902, 1024363535, 170625, 40986, 23544059, 75698931, 65997659, 3733455,
+            599625, 277751630, 2596312, 17899083, 942224647, 53334501, 176145789, 235125, 2316951, 5039296757, 199669233, 12949635611,
+            36571262, 269681555, 235144, 28029617, 5944246, 1667073091, 342056, 4308696139, 1137602333, 851843854, 1301300671, 2403511561,
+            953728798, 4613409, 514098, 105575457, 191255775, 2464874285, 1008051707, 1009167481, 1050625, 664335, 8047611, 1283850938,
+            45736625, 58528569, 96711251, 1265368, 20280, 73896095, 80034526, 11395839, 214521671, 276760, 140259691, 729118559,
+            69989829, 15598642003, 383392557, 1013717939, 52239929, 287066611, 1763077121, 72093362, 277107818, 13971419, 18092375, 1733865991,
+            5253089699, 174321485, 814625, 34220305699, 134357410, 8348125, 905243961, 299475, 3346994, 549644975, 14486987437, 208383279,
+            630173973, 557037, 187778811, 5901315, 45457643, 7253625, 41327305993, 37022502, 160070053, 743434405, 1204330966, 2330043483,
+            407838790, 30583806, 160713903, 160692654, 3776773, 784686331, 18907518, 47603941, 2445590, 59558863, 70805457, 908034175,
+            1876058434, 2274129, 106352, 3154250, 2166868, 16182110, 246694735, 15388009, 5751746, 213712, 41850, 51595570099,
+            2359875, 32000375, 502579066, 3031561951, 4398394, 19804724747, 801685031, 6616376593, 2918125, 529577115, 1114760, 12233125,
+            27493165, 9249625, 4432773917, 17341695257, 1752753485, 2810236, 1801875, 1491591713, 84942, 63240, 1624812575, 608968941,
+            244118182, 343020747, 226262645, 110962810, 1158057, 1566136, 20580, 1042800473, 5833148827, 46659886, 27364458, 1288744369,
+            65976339, 91946530, 93899710, 213528, 2875125, 130901654, 9356930, 1350451049, 17448574, 15001701, 2016546, 42345908,
+            49900669, 17362542, 720833915, 155605879, 580358471, 132812166, 456301834, 3218697907, 7725267, 1217444855, 244011945, 401571835,
+            14100310, 406875, 18500211, 382834655, 12962041391, 43504615, 6886874843, 186448197, 2284048787, 26935293, 121393855, 1555100771,
+            111156125, 1553362322, 1665613807, 5762278047, 213759, 29510690, 2252745, 382448209, 4933097983, 120921669, 246222615, 5944730,
+            5415650617, 7446789, 146333705, 728875, 11589183, 2531750, 2145572, 82309755, 4444922053, 939005314, 213835025, 2596167,
+            286594674, 1178750, 8648745, 118732471, 9811802, 2502005443, 73896263, 63572575, 106392, 85272, 471250, 1963048061,
+            4463459, 22191897, 1044946705, 2338588, 14379365, 341904867, 26291342, 4346685889, 20664, 1377623291, 411423397, 543506690,
+            6646661003, 68358829, 7275125, 5709758119, 60288767, 250279211, 559024453, 56704425, 104867373, 1044646277, 809411837, 1535311939,
+            6059519191, 278331361, 1719400111, 9807742, 74711917, 1780625, 750375, 614141465, 34139948429, 42500, 5771704, 3750808699,
+            1349077535, 6888808, 2630783491, 98557277, 7997091533, 2810632, 621621, 352271381, 10537527, 1759720, 3712003799, 319259014,
+            1118801005, 19032915403, 42228, 6996025, 116994033, 9152122901, 10194129, 130451321, 46681271, 3240125, 7575625, 63612,
+            2168599265, 319626151, 1093880, 1823508, 548142775, 143651210, 77158690, 801878831, 6161940649, 6845852, 59838065, 728973,
+            142578033, 1594528431, 209864445, 71063421, 3519153, 685900, 2740781407, 7167784, 86602437, 453362338, 9485883, 2660823,
+            230619137, 922131, 321160, 1608714, 334178078, 61662410, 9186562, 685848, 18221390, 428636675, 1958498245, 50931062,
+            256564, 342760, 53807006, 10974911119, 1613909609, 104524075, 132662101, 118925807, 12855297, 1930936, 1028456, 2760420187,
+            99866529, 120578375, 4227475, 816644929, 30546269647, 46531023, 1244061, 471339, 2047698178, 42224, 2254236703, 18522010,
+            549494995, 319862361, 614463515, 2331203019, 379701205, 127532427, 12297579, 321030, 132275815, 176210525, 105232383, 170775,
+            1630475, 507728013, 211774717, 84132, 150755405, 894104945, 272321794, 5365074, 3783754495, 371759874, 2317250, 104266547,
+            750519, 219199922, 54000205, 2741897543, 70226222, 771980, 9850250, 20720, 62193827953, 718108645, 17706414, 53899690,
+            25648036, 857446161, 10219799933, 572632165, 6180625, 7597226, 171304, 1072476, 59001118, 3758685737, 166144407, 436578207,
+            16246815, 437007467, 19766747, 1351647, 5043129, 561127931, 1525009871, 706582747, 3344278078, 1444952873, 85698, 428571,
+            5729955, 1943216431, 2701718851, 557375, 471500, 42160, 192510, 971200087, 98278401, 1119380647, 34747958, 3021603409,
+            26463225, 18457569, 46916378843, 216067335, 834008593, 943299, 664734, 1648786997, 4785625, 202459817, 24681668, 149625,
+            3175821, 1063018954, 9144031519, 1103369267, 164148410, 101862761, 212482855, 4270250, 10663526041, 772038, 707625, 89799814,
+            18242972, 130258315, 8364280717, 161808933, 603495974, 3326169, 39019046, 299832, 1560058973, 5796704353, 235480, 4471579339,
+            312887003, 1974159, 11782375, 99887716, 20389204, 19122892, 63680045, 4060091215, 10912732973, 436063167, 4712072261, 171088,
+            127424843, 137083869, 322051774, 37023077, 3593678782, 11675313, 69241282, 288333566, 17642150, 3990776, 857925, 1034752103,
+            31378325, 1096651385, 48827735, 407286, 45243415, 348107835, 120642951, 15495711, 8387203253, 86946041, 26098215, 48656055,
+            3004375, 664966085, 9912149299, 29705802, 12787161139, 77996022, 6502750, 1525009939, 4699786, 20925762, 295180067, 16118125,
+            12371336761, 102699807, 20944, 8670557779, 2295975, 432500349, 62134803, 4528286, 385496377, 284255419, 13928915, 420202055,
+            195827865, 1219934881, 2132842439, 42324485, 6738875, 978841031, 57734958, 609140855, 5258168, 4111344413, 1320939886, 362981487,
+            23358912083, 873457705, 2386878263, 1586029285, 18779530, 21097578, 299943, 5558410, 628607837, 240943101, 12233375, 875646863,
+            143672815, 853153697, 3433832, 85374, 3742223771, 922383, 2828586761, 132168625, 8198386, 127489713, 922374, 2345347421,
+            4813764047, 6145478807, 793611, 23682702941, 1154966433, 3987138067, 898569451, 6674486, 49385853, 1137045, 442266057, 101819965,
+            596799671, 3860721007, 439089549, 217333831, 62714445, 257049, 1243565713, 8627619, 499701059, 19551440359, 66577686, 30584281,
+            578680, 74476105, 450225, 1655827025, 27944345, 7637608043, 3366170561, 278516, 246630826, 7740029501, 813833537, 212310382,
+            514755, 139272925, 2403375, 75034141, 64646075, 3186739907, 6974379907, 351713769, 325314295, 19765233301, 407667715, 2960777239,
+            57026695, 1072683, 7339875, 1223048, 250322501, 3884463, 53742964, 63882, 6992494691, 724934194, 181962781, 80614446,
+            4954690165, 3562020497, 85064, 46295214, 716026685, 72759115, 29275025, 42408, 21321150581, 44385124, 1369660879, 536085,
+            795568551, 4829097, 13950508, 1070144747, 16332875, 3229172423, 36379330, 20089024159, 147257201, 29060395, 106875, 13027750,
+            4325502337, 33567695, 788120905, 1832574887, 2360526, 1647349742, 77545391, 188487657, 3111125797, 2124214141, 355555585, 1051250,
+            1180062, 351177211, 77118018, 479890814, 516635522, 27364883, 776681161, 438660554, 20926087, 4270617, 514250, 5987751,
+            343579299, 234955045, 1953068169, 471750, 12914243779, 3540789, 107142602, 471625, 9979585, 615687215, 1630827, 1554135346,
+            3948669, 686205, 1459161, 52476508, 366716435, 474975775, 5916726277, 3771563883, 47411375, 46188506, 500924567, 229052866,
+            2020419115, 1165805439, 1421215103, 271098815, 8961639247, 7983625, 11267718, 214245, 224996233, 13413950, 922250, 76772787,
+            7287396457, 4106451022, 68466538, 160628734, 657990831, 572439335, 1351755, 199562605, 28931262, 542841837, 3730762651, 149776,
+            148888465, 17255875, 5337311161, 3841266, 6602061367, 1704913045, 191063116, 901098, 128412, 27729835, 67414945, 84198994,
+            1136186491, 2196887953, 155198593, 4155622773, 639704359, 472872543, 5816125, 29296641, 18436593, 346798705, 17320303, 1229657855,
+            14401335, 103043525, 377576749, 26849875, 1990971931, 496097258, 105726315, 105361529, 192618, 853218446, 64646470, 640434115,
+            3519585, 27236209, 600625, 30047875, 1137152261, 1716715, 1008423, 420115982, 224116321, 369657299, 96261235, 35413625,
+            11911361, 13005440137, 2537269679, 8949644, 44685663, 133306375, 15431614, 40607685, 171666, 189990310, 121136799, 2575287,
+            2651431285, 206065959, 41809630, 253521410, 1424799493, 213928, 321651, 12577875737, 11997546, 78769041, 5378112393, 19767125,
+            1986357395, 24810905, 583492819, 9293242, 2573186, 347421305, 50716899, 4206125, 547370582, 347120807, 5921791577, 58636655,
+            286702381, 85608, 13220883, 128440, 1936219879, 43655469, 937373815, 112401443, 284985465, 321678, 20106452347, 1845375,
+            107872622, 6095375, 22846139843, 214434, 2689421035, 6417279, 750789, 169965235, 2681716303, 64125, 117552589, 8048370,
+            84993142, 54837705, 1214698234, 96797883, 17706689, 686504, 18973045, 210723483, 2257907351, 3765189449, 23287638, 21827598,
+            6782056, 654234925, 587270882, 167325305, 315248362, 59323491, 1812335485, 12737152727, 1115829, 1212251469, 5530692919, 58121635,
+            11804276, 745474174, 5246522801, 42640, 944163, 1201250, 987362246, 9357633, 17427735, 3219398, 2354147471, 2081684,
+            1022947827, 14551732, 600831, 776960373, 8092516613, 63960, 1802625, 449799889, 342657, 339780530, 1117406549, 29103646,
+            77931958, 31314185, 166275878, 149360827, 20436626, 40156766, 2069333483, 37559884, 4099221, 1030029, 29618743, 385112,
+            63830767, 2347322263, 10012489337, 7025462135, 1590858771, 20808, 5837416, 4829022, 320568, 57756741, 2461183465, 708092,
+            4994955011, 16054115, 27593347721, 954652595, 2059144, 213470015, 131245882, 257499, 8984196955, 15989672, 131782651, 1463239921,
+            782970071, 7284863807, 566064983, 108903093, 16826823, 293270263, 40929788, 836713423, 13542925, 85560, 2081667, 27751514,
+            8399780987, 28642802563, 1482792649, 1330520, 2287419069, 1175098947, 32902623, 3820257, 497447795, 343128, 227936578, 512042686,
+            161616175, 1060572514, 7511812, 5365580, 1636038509, 4786024, 681965218, 653480, 1210708006, 10216255, 128625, 1244680,
+            783399298, 51704198, 285243101, 7811375, 96969705, 808167646, 8048495, 14616175, 343170, 5390518173, 20976, 87805354,
+            42750, 493506, 3812365115, 6395672, 7869602039, 1087401291, 85750, 41874195, 2971659551, 10108945, 134765729, 5580267,
+            707250, 70677551, 209693393, 18221918, 10983733007, 1613652621, 6817872083, 32923902, 334801271, 38504494, 3498090, 5365647,
+            19531094, 5667648377, 7297325, 23780875, 987160, 49912657121, 21935082, 1588040, 5284576837, 817911905, 127160, 557960,
+            26335244, 1181001679, 3183392069, 85529961, 1075768414, 429165, 280929130, 1149257675, 42849, 91389246, 4176957205, 531466727,
+            1759875, 12791871, 73038501, 2682056, 2167750, 518095281, 211947109, 4378395, 1084632689, 282431545, 1524946046, 729640,
+            290780651, 30863476, 12084742087, 107250, 832957517, 1536042327, 10327736, 1953045, 153138531, 7193410241, 890524547, 23806029733,
+            557844783, 177026759, 83727125, 26958074, 5945082, 63167510, 56339826, 85840, 9680125, 11267893, 38762125, 20819071,
+            8950041, 245987454, 11026015241, 4893250, 728904847, 5108025, 599826409, 140153375, 70484210, 2433753921, 163075934, 228473115,
+            29812084, 3219348, 61362724, 1566783, 1898423787, 1388291201, 73142932, 1473306341, 536500, 19939113, 40543629, 195377686,
+            26120619, 49965839, 3481234207, 4830741811, 8118851857, 15152709, 128464, 63536, 1260586369, 5136117355, 146184558, 217184078,
+            76727794, 3140358683, 326842238, 81924275, 1693044365, 49645477, 150740666
+        ],
+        [
+            210, 1676, 167, 321, 1676, 85, 189, 192, 2308, 1676, 1676, 13,
+            2154, 180, 278, 47, 1676, 195, 249, 188, 268, 1676, 289, 12,
+            1622, 2176, 1676, 71, 73, 243, 265, 1676, 246, 1875, 2204, 155,
+            236, 2414, 183, 250, 224, 269, 1952, 275, 222, 2416, 1763, 226,
+            179, 167, 181, 188, 1746, 148, 2057, 26, 317, 322, 232, 188,
+            1625, 200, 317, 84, 1626, 307, 23, 107, 2315, 2234, 319, 266,
+            2139, 131, 238, 1782, 1656, 200, 312, 63, 2403, 2424, 111, 2304,
+            1745, 290, 283, 2160, 137, 1971, 1964, 320, 171, 49, 185, 211,
+            243, 243, 273, 2407, 108, 166, 1906, 188, 315, 310, 170, 2337,
+            99, 2351, 2206, 241, 1952, 286, 30, 285, 126, 112, 131, 171,
+            312, 283, 1687, 2273, 188, 2362, 2083, 2403, 222, 2362, 271, 108,
+            2027, 263, 48, 307, 243, 2018, 296, 260, 288, 230, 112, 302,
+            1697, 169, 308, 129, 26, 1743, 97, 1699, 121, 24, 257, 188,
+            120, 188, 1773, 2206, 71, 199, 260, 36, 236, 96, 291, 252,
+            256, 2378, 282, 206, 255, 1742, 197, 2084, 300, 41, 289, 270,
+            49, 205, 319, 284, 132, 2093, 1775, 282, 320, 155, 206, 170,
+            282, 1906, 196, 86, 95, 299, 265, 301, 231, 50, 263, 2403,
+            234, 240, 300, 60, 2338, 193, 168, 1635, 168, 145, 199, 2339,
+            1955, 1633, 243, 174, 73, 228, 209, 155, 286, 1829, 100, 247,
+            2433, 2018, 261, 1847, 273, 229, 302, 262, 170, 241, 2215, 95,
+            321, 50, 2270, 319, 2370, 279, 301, 321, 2009, 102, 188, 2414,
+            269, 311, 105, 311, 253, 226, 59, 87, 19, 1691, 219, 215,
+            208, 157, 61, 316, 213, 285, 2073, 2403, 1676, 63, 1773, 79,
+            264, 160, 188, 35, 1886, 231, 250, 210, 277, 119, 79, 195,
+            227, 299, 129, 168, 1610, 234, 2072, 32, 1648, 1955, 243, 226,
+            260, 90, 304, 2304, 305, 244, 132, 13, 135, 185, 2084, 2140,
+            188, 304, 293, 177, 280, 85, 178, 188, 2008, 1978, 188, 1906,
+            2414, 248, 1773, 1877, 261, 1773, 2271, 2040, 306, 215, 248, 150,
+            2075, 251, 2440, 2097, 255, 294, 255, 322, 232, 259, 12, 1603,
+            293, 1877, 135, 250, 1962, 234, 2403, 207, 210, 225, 2226, 271,
+            2441, 2169, 2009, 187, 1680, 247, 2403, 2291, 2416, 308, 179, 1943,
+            221, 23, 11, 154, 2402, 286, 311, 220, 259, 121, 77, 1832,
+            281, 317, 183, 264, 181, 2018, 125, 245, 188, 286, 187, 1708,
+            314, 254, 1912, 2209, 1690, 182, 200, 320, 2423, 188, 19, 216,
+            185, 146, 320, 132, 2321, 35, 312, 114, 165, 119, 2221, 13,
+            318, 195, 1878, 197, 308, 95, 2095, 231, 2301, 246, 316, 1608,
+            87, 180, 1905, 289, 1677, 2336, 188, 2169, 280, 2403, 168, 254,
+            24, 292, 101, 144, 241, 2149, 2293, 235, 2206, 211, 223, 1952,
+            2367, 188, 290, 67, 243, 75, 1829, 2235, 235, 2018, 112, 143,
+            173, 2366, 2276, 316, 253, 181, 168, 1838, 63, 226, 287, 2017,
+            234, 206, 2216, 59, 247, 2357, 1877, 93, 290, 287, 224, 1813,
+            2103, 169, 298, 209, 172, 180, 267, 146, 1793, 230, 25, 2291,
+            209, 275, 96, 2207, 196, 2073, 251, 28, 1632, 1830, 314, 289,
+            224, 294, 186, 2205, 61, 193, 188, 1689, 103, 293, 2204, 87,
+            134, 220, 2341, 310, 320, 2291, 136, 294, 156, 208, 183, 1642,
+            1744, 1940, 1943, 2405, 2206, 202, 2402, 234, 235, 2348, 188, 2160,
+            315, 301, 226, 188, 224, 309, 2374, 236, 315, 1964, 250, 1975,
+            313, 36, 266, 2403, 1772, 321, 242, 2216, 219, 194, 2246, 49,
+            181, 314, 283, 157, 143, 230, 2423, 291, 2426, 2257, 222, 180,
+            243, 307, 2151, 99, 191, 293, 63, 135, 174, 32, 172, 50,
+            295, 201, 2009, 122, 188, 310, 1755, 247, 188, 1811, 267, 1821,
+            313, 265, 2282, 299, 2219, 85, 302, 119, 1753, 301, 2321, 264,
+            131, 195, 179, 188, 232, 242, 258, 1847, 274, 224, 11, 239,
+            73, 300, 233, 1679, 87, 204, 205, 48, 252, 176, 12, 1609,
+            2170, 1742, 87, 19, 188, 205, 192, 2416, 1648, 1626, 2029, 204,
+            120, 102, 225, 218, 221, 2270, 108, 96, 217, 296, 96, 300,
+            182, 260, 173, 254, 75, 185, 248, 188, 95, 254, 64, 1754,
+            201, 221, 1690, 174, 178, 59, 2227, 2227, 209, 1742, 188, 28,
+            194, 2423, 240, 220, 1912, 269, 11, 191, 1678, 176, 224, 14,
+            231, 298, 168, 258, 1906, 51, 171, 2292, 202, 272, 145, 276,
+            309, 27, 188, 1973, 293, 165, 179, 1623, 128, 2402, 233, 131,
+            310, 234, 155, 1808, 151, 1614, 317, 297, 146, 269, 1808, 2008,
+            206, 16, 234, 184, 179, 164, 188, 172, 284, 171, 79, 283,
+            2217, 247, 188, 217, 193, 2145, 2272, 275, 187, 1839, 320, 269,
+            176, 300, 2007, 157, 287, 2423, 36, 299, 2072, 297, 2142, 2361,
+            1610, 182, 164, 134, 1631, 83, 2403, 146, 2021, 147, 291, 72,
+            60, 91, 184, 12, 281, 2206, 188, 2032, 264, 224, 2138, 1955,
+            181, 84, 168, 319, 198, 295, 47, 1808, 185, 35, 2293, 218,
+            193, 35, 147, 87, 278, 242, 71, 2142, 304, 2149, 133, 288,
+            1970, 2336, 2138, 83, 2347, 181, 107, 173, 1610, 251, 239, 247,
+            61, 274, 133, 221, 197, 1831, 1942, 306, 177, 1781, 167, 251,
+            287, 2153, 151, 120, 2018, 208, 15, 212, 61, 2272, 318, 50,
+            223, 233, 135, 2151, 2448, 122, 1631, 2283, 247, 1941, 286, 242,
+            76, 1839, 221, 266, 32, 1742, 1763, 2221, 158, 95, 110, 238,
+            217, 2317, 131, 188, 227, 243, 217, 93, 264, 2209, 187, 25,
+            19, 320, 107, 145, 204, 13, 1648, 297, 290, 2234, 257, 2206,
+            310, 1678, 229, 167, 188, 2402, 216, 245, 209, 189, 237, 182,
+            196, 2027, 2251, 307, 240, 183, 287, 196, 1610, 87, 285, 185,
+            38, 1799, 193, 131, 230, 261, 1697, 262, 239, 316, 312, 1941,
+            250, 1742, 139, 2402, 297, 231, 26, 2425, 1875, 24, 263, 2273,
+            2281, 265, 62, 1953, 225, 1920, 63, 2018, 28, 2085, 300, 277,
+            111, 2168, 260, 1690, 175, 1823, 285, 14, 1874, 242, 278, 1626,
+            2370, 12, 36, 1680, 186, 243, 321, 1878, 228, 231, 238, 2454,
+            229, 284, 303, 172, 63, 267, 308, 77, 245, 218, 2044, 245,
+            256, 95, 2170, 244, 2360, 282, 30, 88, 252, 173, 318, 233,
+            201, 311, 2052, 173, 13, 216, 96, 1809, 193, 24, 251, 180,
+            300, 2337, 2161, 97, 313, 51, 119, 137, 1755, 188, 222, 79,
+            183, 1640, 300, 72, 190, 1723, 13, 119, 212, 268, 269, 266,
+            214, 1743, 240, 241, 162, 2206, 198, 108, 267, 236, 59, 48,
+            1914, 183, 39, 206, 199, 300, 191, 1687, 102, 1612, 310, 2414,
+            1789, 2138, 167, 2270, 191, 1634, 1616, 107, 314, 219, 2352, 72,
+            2011, 2207, 198, 198, 159, 2423, 246, 1954, 190, 1754, 53, 243,
+            1905, 1676, 238, 2153, 197, 1753, 11, 216, 310, 197, 199, 1753,
+            196, 218, 249, 2139, 300, 199, 1819, 198, 184, 2150, 319, 189,
+            216, 2288, 1640, 171, 156, 2107, 156, 1877, 201, 90, 1626, 188,
+            186, 268, 185, 131, 243, 134, 313, 202, 2097, 232, 229, 211,
+            155, 2234, 198, 116, 2017, 300, 2347, 37, 2417, 177, 188, 204,
+            260, 295, 304, 298, 39, 2367, 186, 2375, 2206, 2206, 213, 2291,
+            156, 37, 109, 63, 2103, 2094, 95, 2235, 253, 282, 221, 23,
+            1970, 2102, 2227, 226, 257, 165, 36, 321, 294, 132, 1823, 110,
+            225, 260, 2077, 1706, 2357, 315, 223, 167, 200, 1934, 267, 234,
+            207, 186, 311, 72, 266, 292, 2282, 1610, 1687, 83, 200, 2160,
+            14, 242, 123, 1744, 2347, 206, 155, 2141, 1904, 37, 24, 132,
+            38, 206, 188, 277, 143, 216, 2402, 144, 120, 293, 122, 1699,
+            226, 183, 2403, 1622, 2359, 1829, 188, 49, 2149, 205, 1756, 313,
+            199, 158, 1860, 241, 86, 279, 47, 1889, 266, 243, 214, 123,
+            158, 186, 275, 1776, 2347, 283, 2441, 67, 1972, 1621, 2281, 273,
+            131, 174, 249, 292, 190, 321, 2150, 268, 285, 189, 1764, 131,
+            169, 259, 160, 254, 194, 2142, 2204, 305, 227, 75, 26, 192,
+            15, 251, 2006, 1756, 133, 287, 186, 1853, 84, 1880, 244, 168,
+            171, 211, 172, 188, 2009, 202, 169, 76, 207, 1970, 74, 25,
+            47, 84, 1941, 318, 310, 73, 2044, 320, 265, 260, 253, 1843,
+            35, 259, 185, 254, 294, 2073, 97, 101, 2381, 99, 2085, 306,
+            2073, 83, 277, 183, 2458, 99, 199, 225, 2272, 173, 253, 2405,
+            309, 245, 1962, 2206, 295, 181, 2358, 275, 95, 2448, 135, 181,
+            175, 14, 108, 2303, 185, 2183, 209, 86, 1887, 247, 286, 96,
+            2423, 239, 1677, 269, 1707, 59, 2432, 1875, 1764, 216, 59, 280,
+            23, 2402, 179, 195, 271, 155, 223, 1621, 110, 1601, 234, 2402,
+            2423, 1942, 52, 256, 265, 267, 202, 50, 207, 2336, 120, 12,
+            235, 1783, 2215, 85, 217, 155, 1692, 2282, 134, 2337, 263, 205,
+            179, 207, 178, 18, 235, 305, 275, 1612, 160, 1610, 116, 38,
+            272, 182, 2011, 121, 301, 296, 60, 1697, 134, 131, 176, 107,
+            64, 187, 207, 235, 276, 11, 1744, 201, 259, 2284, 247, 303,
+            322, 281, 232, 207, 2350, 1687, 207, 201, 176, 295, 2018, 195,
+            1885, 292, 2270, 200, 1742, 188, 209, 1765, 233, 1953, 2189, 62,
+            309, 280, 280, 264, 51, 98, 1833, 318, 1954, 259, 307, 38,
+            2072, 55, 274, 248, 78, 121, 194, 197, 310, 186, 306, 237,
+            2075, 2089, 315, 293, 1885, 2206, 1920, 2096, 168, 173, 256, 56,
+            236, 213, 120, 1996, 144, 189, 127, 15, 263, 321, 286, 223,
+            317, 131, 159, 255, 157, 286, 2285, 321, 1747, 173, 309, 1890,
+            2225, 158, 132, 73, 1961, 75, 298, 2009, 239, 291, 214, 223,
+            1641, 231, 2402, 2066, 291, 2204, 287, 1688, 159, 194, 191, 1885,
+            1874, 171, 161, 2336, 174, 1838, 169, 173, 1763, 150, 83, 276,
+            23, 1899, 59, 14, 214, 153, 2339, 127, 249, 2271, 1948, 229,
+            36, 2425, 1626, 163, 96, 244, 288, 18, 98, 267, 1810, 2110,
+            131, 188, 63, 143, 280, 2162, 2300, 245, 247, 283, 1922, 2347,
+            163, 250, 2367, 122, 63, 312, 264, 281, 321, 2295, 2374, 178,
+            2361, 1823, 144, 2434, 202, 2351, 188, 308, 188, 77, 303, 2357,
+            1879, 83, 2206, 18, 268, 47, 2204, 2315, 210, 1961, 318, 253,
+            314, 17, 2151, 258, 135, 2227, 188, 1681, 12, 317, 272, 1846,
+            2095, 305, 306, 1633, 259, 98, 2075, 173, 2084, 261, 1875, 233,
+            270, 2177, 87, 1632, 284, 245, 1754, 2117, 221, 191, 239, 238,
+            51, 233, 2076, 102, 175, 221, 186, 201, 219, 47, 131, 267,
+            90, 2028, 262, 184, 122, 167, 109, 2281, 194, 2150, 284, 215,
+            2139, 211, 1615, 228, 2235, 1889, 218, 289, 225, 188, 227, 278,
+            200, 301, 1634, 303, 272, 230, 223, 112, 322, 290, 2209, 298,
+            2357, 83, 279, 217, 214, 2415, 1951, 275, 23, 278, 1809, 299,
+            2433, 266, 2283, 2206, 59, 1877, 311, 1743, 2036, 171, 164, 199,
+            212, 131, 1942, 250, 1624, 206, 2358, 49, 2083, 47, 2077, 1699,
+            1701, 1690, 184, 178, 199, 2018, 255, 305, 2142, 2302, 2369, 226,
+            1808, 275, 95, 287, 233, 2007, 1927, 274, 2211, 1900, 288, 312,
+            190, 174, 322, 208, 77, 317, 1887, 110, 2235, 2393, 252, 278,
+            2423, 1687, 190, 147, 1808, 279, 2301, 2404, 168, 167, 62, 254,
+            2103, 2168, 318, 14, 2310, 267, 107, 231, 2093, 2074, 234, 2291,
+            296, 276, 177, 259, 132, 265, 185, 239, 24, 270, 259, 308,
+            2083, 17, 162, 1631, 260, 1809, 1810, 2406, 1966, 214, 176, 2225,
+            2176, 192, 25, 230, 221, 73, 47, 272, 1860, 2205, 280, 100,
+            218, 109, 52, 2032, 38, 267, 1820, 1829, 266, 1952, 2227, 246,
+            132, 1941, 120, 2074, 2349, 126, 214, 308, 182, 100, 133, 199,
+            176, 305, 188, 169, 2140, 192, 262, 276, 2382, 305, 2305, 267,
+            2124, 2075, 237, 2434, 303, 318, 214, 2139, 1819, 2006, 275, 2415,
+            175, 2102, 204, 220, 230, 303, 13, 109, 2426, 1897, 289, 227,
+            216, 143, 2238, 268, 270, 2206, 1610, 85, 149, 36, 239, 1746,
+            75, 120, 298, 294, 2045, 315, 199, 1941, 293, 2210, 175, 1640,
+            197, 185, 38, 2360, 202, 190, 160, 217, 2218, 1953, 37, 170,
+            1625, 2413, 319, 1942, 268, 39, 1830, 301, 37, 289, 232, 169,
+            2407, 236, 2151, 2018, 2083, 210, 1931, 1847, 2153, 2074, 192, 212,
+            294, 2273, 244, 1941, 2102, 253, 1794, 148, 1895, 107, 2291, 1742,
+            146, 2074, 85, 178, 262, 204, 259, 258, 259, 1942, 282, 99,
+            188, 107, 2072, 153, 294, 59, 72, 25, 274, 307, 2338, 76,
+            26, 83, 50, 41, 258, 1875, 206, 2051, 168, 84, 2336, 305,
+            279, 2103, 31, 2415, 87, 210, 215, 24, 226, 1951, 183, 172,
+            25, 2027, 1783, 2024, 312, 2206, 2448, 157, 187, 2350, 2017, 74,
+            1679, 2415, 201, 1604, 72, 134, 1970, 255, 242, 2272, 183, 270,
+            54, 1780, 2176, 119, 1877, 205, 237, 267, 72, 304, 192, 312,
+            2028, 2089, 234, 184, 2423, 1896, 2402, 262, 156, 1913, 247, 293,
+            169, 1820, 1621, 237, 245, 1697, 24, 240, 1971, 213, 86, 271,
+            264, 224, 120, 238, 1661, 2176, 1878, 2402, 222, 1648, 1905, 164,
+            175, 264, 299, 232, 201, 2301, 312, 285, 2011, 2204, 144, 1920,
+            51, 262, 98, 1974, 172, 296, 115, 1774, 2309, 237, 2251, 206,
+            1832, 25, 170, 274, 297, 313, 2293, 145, 198, 294, 185, 186,
+            186, 158, 1698, 2403, 2291, 180, 144, 202, 258, 2227, 308, 1940,
+            256, 262, 24, 110, 2011, 254, 255, 1886, 2094, 2087, 294, 173,
+            168, 16, 251, 197, 239, 220, 64, 191, 2361, 174, 2250, 2301,
+            2242, 2252, 195, 23, 1714, 2072, 195, 2347, 210, 86, 1753, 122,
+            248, 228, 1942, 135, 267, 319, 229, 1676, 193, 290, 2381, 2205,
+            2076, 78, 265, 2207, 108, 316, 1876, 229, 184, 156, 1829, 2441,
+            286, 171, 47, 110, 209, 187, 1689, 2138, 1676, 296, 211, 119,
+            1940, 16, 213, 179, 131, 107, 1716, 243, 242, 220, 1763, 301,
+            262, 254, 182, 179, 145, 180, 172, 318, 2140, 23, 2009, 216,
+            241, 234, 249, 1632, 1821, 293, 119, 1606, 218, 157, 274, 247,
+            62, 2215, 168, 268, 255, 2143, 2216, 2368, 179, 227, 1996, 1676,
+            2382, 241, 188, 206, 208, 227, 36, 1887, 1745, 184, 315, 206,
+            2303, 92, 239, 2339, 2204, 2184, 109, 36, 47, 296, 243, 2153,
+            299, 60, 1613, 223, 309, 243, 86, 178, 155, 14, 224, 220,
+            288, 189, 223, 321, 155, 2210, 292, 283, 184, 195, 198, 11,
+            2282, 143, 2085, 2029, 208, 251, 2074, 199, 108, 88, 287, 2044,
+            96, 2072, 1920, 245, 294, 2010, 1954, 260, 244, 1951, 133, 108,
+            125, 1962, 2236, 35, 136, 1743, 88, 2150, 291, 2403, 95, 119,
+            2211, 188, 301, 40, 248, 238, 2338, 144, 1886, 1980, 97, 248,
+            175, 143, 61, 303, 221, 2284, 273, 146, 194, 235, 211, 102,
+            1961, 60, 232, 2083, 182, 173, 238, 234, 231, 2017, 235, 239,
+            299, 107, 177, 2336, 2348, 119, 2220, 167, 1965, 132, 12, 245,
+            195, 1904, 301, 2348, 83, 192, 1678, 275, 2300, 1603, 248, 2300,
+            13, 1808, 242, 199, 2226, 304, 125, 202, 71, 46, 1780, 322,
+            1875, 308, 71, 61, 215, 231, 219, 2151, 199, 2000, 286, 37,
+            177, 232, 205, 145, 2348, 230, 55, 286, 1640, 156, 246, 2387,
+            1846, 277, 157, 273, 311, 2339, 1649, 286, 286, 1879, 307, 233,
+            179, 170, 289, 317, 78, 2085, 270, 212, 1764, 148, 302, 174,
+            301, 61, 71, 258, 2225, 1754, 143, 1812, 196, 152, 231, 188,
+            216, 2423, 204, 230, 97, 1602, 229, 233, 15, 175, 246, 24,
+            306, 98, 2095, 210, 255, 2083, 294, 242, 2216, 137, 311, 40,
+            177, 277, 2206, 222, 169, 258, 322, 1820, 142, 228, 175, 261,
+            197, 211, 296, 320, 2144, 261, 24, 2435, 52, 299, 136, 89,
+            1640, 288, 25, 1742, 2367, 109, 176, 2413, 23, 275, 48, 1707,
+            188, 83, 250, 2170, 35, 268, 2205, 35, 251, 135, 245, 1624,
+            263, 297, 227, 271, 217, 298, 205, 319, 195, 1812, 240, 257,
+            87, 71, 278, 318, 246, 168, 225, 74, 297, 310, 264, 247,
+            2138, 281, 2368, 31, 211, 1940, 281, 297, 290, 55, 2367, 225,
+            226, 196, 242, 279, 274, 272, 61, 309, 277, 2018, 1689, 2036,
+            194, 2338, 279, 115, 72, 238, 1715, 189, 49, 249, 182, 266,
+            2357, 274, 232, 121, 170, 2353, 2103, 1626, 120, 256, 200, 227,
+            1876, 100, 11, 246, 132, 279, 1743, 1640, 133, 204, 1727, 215,
+            217, 253, 279, 131, 291, 278, 176, 54, 257, 190, 291, 1904,
+            1887, 2008, 225, 1913, 23, 119, 1819, 204, 291, 271, 268, 270,
+            72, 294, 282, 245, 1747, 233, 96, 2123, 119, 181, 306, 1970,
+            2077, 176, 156, 240, 2039, 177, 171, 209, 161, 132, 272, 2442,
+            143, 194, 59, 188, 145, 296, 1753, 302, 212, 36, 2244, 98,
+            308, 181, 119, 249, 1895, 249, 303, 276, 276, 40, 263, 2098,
+            295, 307, 250, 236, 176, 2403, 281, 168, 169, 23, 2357, 243,
+            173, 63, 39, 175, 263, 119, 228, 1889, 172, 2141, 2094, 222,
+            190, 264, 1877, 124, 288, 39, 283, 296, 174, 237, 220, 262,
+            1811, 1941, 1943, 210, 262, 2205, 2220, 321, 2407, 2178, 185, 217,
+            264, 132, 314, 186, 2432, 1765, 229, 263, 64, 85, 84, 222,
+            164, 11, 192, 241, 37, 1838, 267, 301, 158, 145, 168, 247,
+            284, 138, 307, 111, 1970, 202, 287, 211, 157, 2046, 1847, 310,
+            306, 111, 1963, 147, 42, 260, 311, 170, 213, 59, 169, 2432,
+            2282, 250, 156, 2206, 231, 2111, 90, 143, 83, 2404, 47, 237,
+            52, 2218, 293, 2216, 37, 250, 183, 319, 2006, 214, 197, 109,
+            185, 253, 212, 306, 2094, 108, 211, 95, 282, 305, 2102, 184,
+            264, 96, 1962, 318, 71, 1829, 1895, 63, 240, 2415, 1916, 2086,
+            190, 1900, 202, 2437, 1808, 1944, 1887, 246, 2293, 2234, 171, 194,
+            122, 252, 2340, 253, 2047, 213, 38, 1621, 1885, 309, 288, 238,
+            291, 310, 289, 293, 1682, 103, 134, 36, 2138, 61, 1829, 73,
+            64, 71, 315, 1971, 124, 2093, 117, 2413, 144, 1897, 184, 1875,
+            1819, 2425, 269, 187, 205, 178, 1754, 1773, 298, 194, 228, 299,
+            2338, 248, 2153, 1772, 2432, 277, 15, 23, 217, 1940, 74, 279,
+            284, 1614, 174, 1625, 238, 23, 110, 162, 155, 107, 160, 134,
+            204, 231, 187, 2272, 2377, 274, 2337, 238, 286, 2402, 121, 219,
+            319, 277, 180, 199, 59, 2316, 300, 242, 2270, 228, 2009, 159,
+            44, 2011, 64, 1985, 288, 188, 186, 207, 2281, 308, 172, 14,
+            161, 204, 2028, 1687, 222, 53, 167, 257, 225, 1820, 259, 319,
+            296, 2281, 229, 172, 240, 62, 52, 2074, 231, 113, 253, 219,
+            14, 83, 1706, 288, 96, 2093, 1874, 306, 255, 98, 233, 1876,
+            227, 270, 317, 320, 219, 284, 2041, 1765, 286, 235, 218, 124,
+            249, 262, 2292, 237, 250, 156, 1623, 271, 1611, 321, 1688, 263,
+            171, 298, 223, 25, 2083, 1820, 1623, 290, 320, 249, 1890, 194,
+            1706, 2075, 26, 312, 2404, 108, 178, 247, 250, 1896, 2011, 191,
+            241, 270, 47, 295, 319, 2417, 202, 322, 1809, 207, 1840, 286,
+            206, 149, 2028, 1830, 68, 120, 119, 1943, 241, 176, 2150, 279,
+            263, 101, 1885, 1940, 198, 2219, 1887, 309, 2403, 2073, 273, 212,
+            36, 320, 119, 2019, 143, 1906, 2007, 1689, 2292, 133, 234, 42,
+            1617, 288, 60, 1697, 2110, 1763, 1605, 1687, 261, 169, 2309, 2204,
+            296, 314, 2119, 170, 84, 20, 1635, 217, 177, 302, 268, 111,
+            131, 265, 298, 84, 237, 145, 2215, 232, 188, 1897, 1755, 303,
+            2357, 2366, 48, 1688, 116, 1920, 315, 223, 2272, 2007, 226, 175,
+            2404, 315, 2291, 2073, 1963, 293, 30, 208, 2006, 256, 138, 27,
+            258, 73, 1676, 233, 294, 77, 97, 188, 99, 221, 263, 175,
+            257, 292, 2449, 295, 200, 280, 255, 183, 251, 279, 1944, 2351,
+            143, 83, 198, 246, 85, 2237, 122, 193, 1742, 72, 158, 212,
+            272, 2205, 271, 155, 302, 2308, 1633, 1810, 61, 241, 60, 2301,
+            1698, 157, 299, 266, 312, 250, 2361, 2404, 1648, 176, 180, 201,
+            222, 216, 238, 268, 222, 11, 1829, 172, 198, 219, 132, 199,
+            24, 2138, 1941, 1662, 2168, 1600, 2291, 75, 1612, 191, 244, 172,
+            2407, 13, 83, 24, 1979, 84, 124, 1698, 299, 318, 271, 198,
+            124, 315, 183, 72, 2076, 107, 315, 75, 1742, 252, 91, 2402,
+            271, 202, 123, 2424, 171, 155, 2436, 291, 187, 1940, 198, 1616,
+            80, 277, 284, 169, 2037, 318, 240, 218, 2204, 30, 2434, 70,
+            2160, 36, 2217, 159, 1875, 2088, 48, 287, 244, 145, 265, 1954,
+            11, 51, 259, 304, 200, 108, 123, 100, 84, 314, 274, 57,
+            209, 1763, 197, 24, 85, 269, 293, 2029, 171, 270, 253, 259,
+            74, 26, 2243, 27, 232, 2323, 99, 135, 232, 252, 306, 1697,
+            2102, 259, 185, 1973, 208, 114, 1742, 309, 2406, 285, 311, 2072,
+            2138, 2359, 159, 297, 235, 96, 289, 187, 2018, 179, 235, 1940,
+            2377, 186, 1814, 131, 234, 1876, 218, 156, 2293, 23, 2006, 169,
+            269, 1904, 1955, 250, 292, 1613, 1908, 2277, 85, 1764, 1700, 1622,
+            1896, 2413, 307, 120, 1678, 213, 286, 211, 200, 38, 25, 305,
+            265, 2272, 198, 86, 84, 2414, 2215, 36, 148, 239, 1605, 2206,
+            307, 41, 1706, 209, 240, 167, 319, 213, 322, 278, 270, 303,
+            264, 151, 316, 98, 143, 199, 60, 247, 2205, 1879, 242, 2008,
+            41, 144, 2168, 2084, 205, 190, 78, 230, 2304, 14, 315, 275,
+            111, 168, 314, 188, 195, 265, 48, 1798, 2434, 216, 259, 195,
+            248, 1632, 35, 89, 248, 107, 263, 17, 212, 185, 238, 224,
+            1742, 243, 245, 319, 229, 144, 143, 2403, 310, 184, 83, 11,
+            1912, 278, 2038, 210, 14, 293, 1611, 2376, 131, 1621, 1743, 1784,
+            290, 253, 189, 256, 209, 197, 144, 171, 251, 272, 227, 95,
+            2075, 144, 231, 173, 201, 262, 312, 254, 233, 194, 196, 2161,
+            120, 1951, 1941, 2336, 107, 278, 2027, 96, 2075, 36, 227, 39,
+            1944, 1823, 2217, 1749, 60, 312, 257, 240, 170, 247, 86, 2339,
+            74, 290, 168, 2242, 170, 2339, 2339, 163, 122, 199, 2337, 11,
+            66, 119, 250, 295, 1970, 2302, 2413, 188, 85, 2030, 1764, 287,
+            52, 264, 203, 1621, 175, 277, 273, 143, 251, 261, 2227, 307,
+            283, 202, 2281, 274, 2205, 263, 1811, 1875, 62, 216, 1649, 233,
+            2227, 189, 1811, 301, 288, 149, 2338, 147, 211, 144, 131, 83,
+            162, 145, 1875, 194, 2110, 276, 228, 125, 301, 246, 2169, 308,
+            239, 225, 310, 1774, 291, 241, 203, 271, 168, 1810, 61, 2218,
+            1689, 2359, 25, 184, 1773, 2432, 284, 1601, 289, 1680, 1881, 219,
+            1886, 215, 2337, 1978, 2350, 15, 314, 192, 1709, 156, 2408, 222,
+            237, 59, 192, 37, 285, 275, 2046, 170, 284, 1878, 203, 255,
+            1624, 284, 13, 175, 197, 2302, 2151, 2086, 2007, 252, 1954, 2096,
+            221, 1678, 173, 217, 29, 190, 219, 146, 240, 202, 245, 132,
+            203, 233, 1808, 245, 1947, 206, 2413, 313, 205, 167, 203, 2140,
+            2347, 17, 248, 2073, 107, 2013, 282, 171, 1634, 107, 96, 163,
+            248, 2283, 231, 61, 236, 73, 61, 1677, 211, 145, 71, 216,
+            295, 1832, 2021, 108, 1914, 2226, 224, 71, 2208, 296, 210, 71,
+            135, 1688, 185, 310, 1841, 200, 48, 203, 283, 246, 161, 1744,
+            213, 286, 2028, 281, 1742, 1742, 213, 112, 146, 213, 201, 13,
+            2225, 2184, 1633, 240, 182, 269, 2427, 171, 2402, 1753, 123, 184,
+            17, 219, 264, 263, 27, 249, 306, 159, 250, 2153, 157, 2210,
+            315, 59, 29, 35, 179, 149, 1874, 2303, 289, 2281, 1887, 2337,
+            203, 71, 1624, 299, 61, 2215, 1755, 60, 60, 40, 50, 1623,
+            1661, 2150, 47, 1952, 36, 60, 2340, 2414, 225, 2282, 2236, 218,
+            313, 285, 2138, 1754, 215, 2225, 263, 277, 273, 203, 146, 2291,
+            264, 2352, 47, 2102, 203, 1622, 177, 52, 173, 221, 96, 2019,
+            1811, 261, 221, 284, 276, 214, 232, 272, 1610, 185, 240, 144,
+            271, 223, 149, 230, 2006, 2027, 48, 2406, 2416, 245, 149, 13,
+            124, 298, 1688, 2417, 2283, 186, 203, 226, 214, 176, 1919, 2416,
+            248, 232, 159, 38, 320, 1648, 1743, 1706, 164, 2424, 213, 196,
+            2327, 2353, 309, 290, 322, 176, 267, 211, 215, 272, 309, 2315,
+            284, 188, 206, 2010, 284, 1688, 2141, 273, 109, 133, 132, 83,
+            285, 2216, 2007, 107, 253, 213, 74, 168, 224, 203, 2195, 169,
+            172, 2204, 280, 290, 1636, 120, 147, 236, 152, 303, 1846, 153,
+            313, 1882, 119, 1909, 63, 238, 197, 2291, 2099, 1613, 59, 182,
+            1687, 169, 299, 2414, 1972, 1732, 2433, 2441, 241, 14, 157, 14,
+            234, 2017, 2349, 2009, 1678, 194, 218, 2085, 202, 90, 203, 2183,
+            12, 264, 41, 235, 2225, 243, 2276, 1961, 203, 214, 200, 59,
+            203, 260, 220, 303, 249, 311, 314, 98, 11, 1756, 2273, 240,
+            1632, 189, 285, 2270, 135, 96, 200, 2293, 2072, 255, 95, 2098,
+            60, 203, 144, 213, 221, 237, 83, 168, 1876, 209, 292, 243,
+            320, 71, 1963, 29, 279, 2282, 1829, 298, 232, 2037, 2292, 239,
+            211, 264, 257, 2204, 311, 168, 2309, 167, 299, 1610, 238, 248,
+            247, 1708, 1677, 43, 2419, 217, 2301, 176, 2029, 2357, 2425, 2423,
+            1690, 83, 2287, 2402, 2413, 37, 2096, 1767, 117, 2044, 83, 63,
+            2217, 203, 2138, 268, 2006, 231, 134, 293, 2300, 73, 36, 169,
+            167, 257, 2367, 122, 1970, 1747, 167, 62, 1888, 1953, 298, 1680,
+            302, 2141, 199, 212, 1824, 2177, 131, 1631, 132, 292, 24, 253,
+            2359, 196, 281, 136, 1879, 47, 1991, 298, 314, 2227, 311, 120,
+            29, 2006, 201, 2292, 15, 197, 1688, 2161, 28, 157, 250, 2225,
+            174, 31, 239, 174, 212, 229, 238, 48, 2291, 1943, 319, 2217,
+            182, 132, 321, 2031, 318, 272, 206, 2414, 11, 183, 110, 150,
+            267, 49, 289, 294, 309, 1622, 252, 2284, 185, 1813, 233, 163,
+            238, 188, 151, 59, 196, 196, 233, 278, 167, 209, 259, 2095,
+            254, 274, 191, 306, 191, 215, 288, 210, 65, 304, 182, 282,
+            122, 2208, 2077, 98, 203, 157, 263, 147, 253, 237, 1678, 35,
+            2045, 2094, 1687, 243, 1753, 247, 175, 2160, 238, 230, 204, 319,
+            111, 2415, 1846, 188, 2414, 1621, 243, 236, 2413, 2206, 171, 174,
+            2036, 272, 113, 172, 234, 25, 73, 291, 316, 223, 210, 2293,
+            180, 212, 2139, 114, 235, 1966, 1613, 1846, 296, 2036, 315, 269,
+            172, 234, 246, 172, 2429, 2255, 190, 240, 1913, 280, 223, 1875,
+            59, 208, 1875, 271, 2282, 43, 1754, 109, 169, 2183, 233, 238,
+            14, 193, 2368, 246, 132, 177, 1941, 2152, 1623, 245, 2007, 290,
+            278, 72, 1656, 160, 2272, 170, 281, 1612, 1810, 136, 310, 170,
+            204, 1812, 1766, 278, 254, 73, 103, 176, 50, 2096, 2235, 85,
+            40, 75, 1691, 107, 189, 1967, 2243, 2360, 1621, 210, 211, 244,
+            287, 203, 209, 47, 288, 263, 175, 173, 2117, 2150, 307, 108,
+            1875, 274, 162, 155, 2402, 231, 2093, 200, 11, 193, 253, 221,
+            2113, 221, 2019, 75, 245, 2138, 228, 203, 219, 270, 233, 124,
+            1781, 265, 2432, 225, 231, 313, 1809, 188, 64, 111, 290, 1897,
+            143, 248, 218, 191, 2358, 269, 2383, 1655, 120, 282, 11, 50,
+            1985, 2125, 131, 2281, 2020, 1819, 62, 287, 1855, 73, 296, 133,
+            317, 208, 2006, 254, 1847, 85, 312, 269, 317, 304, 168, 306,
+            167, 15, 190, 83, 1820, 2226, 2139, 168, 189, 119, 2357, 315,
+            212, 292, 156, 1900, 83, 253, 2293, 217, 2228, 211, 269, 217,
+            2152, 205, 227, 176, 223, 19, 2316, 1682, 1874, 187, 2402, 299,
+            2039, 297, 2250, 184, 1754, 37, 306, 207, 174, 1901, 1627, 263,
+            314, 207, 121, 1808, 2336, 232, 107, 305, 110, 318, 210, 12,
+            36, 275, 181, 274, 1973, 107, 159, 29, 1676, 190, 252, 179,
+            231, 187, 216, 291, 1885, 1676, 160, 2119, 246, 318, 2006, 1940,
+            1744, 207, 242, 203, 132, 189, 172, 167, 238, 221, 60, 120,
+            74, 207, 266, 312, 299, 2084, 225, 319, 268, 209, 1885, 261,
+            185, 253, 265, 2447, 255, 101, 1885, 54, 220, 248, 71, 288,
+            23, 207, 135, 2168, 257, 307, 195, 217, 221, 178, 1683, 1970,
+            258, 1793, 212, 284, 2216, 207, 240, 72, 51, 1890, 259, 75,
+            203, 1614, 1885, 307, 2006, 207, 199, 257, 1611, 227, 121, 187,
+            2104, 184, 86, 181, 123, 155, 1941, 132, 62, 320, 2178, 167,
+            2375, 59, 2357, 177, 189, 1611, 2111, 174, 280, 39, 174, 190,
+            1641, 63, 219, 266, 199, 131, 1942, 250, 23, 305, 14, 257,
+            1992, 1614, 1819, 2352, 195, 167, 2142, 146, 1753, 2284, 301, 71,
+            200, 2347, 289, 1718, 2228, 2030, 136, 169, 2019, 1876, 248, 306,
+            1600, 273, 2205, 179, 25, 207, 193, 237, 108, 2215, 246, 218,
+            207, 76, 244, 192, 2162, 2249, 12, 249, 304, 162, 1689, 300,
+            85, 246, 214, 1919, 322, 47, 277, 250, 47, 99, 227, 320,
+            217, 2287, 265, 285, 36, 90, 1891, 66, 2229, 188, 2087, 300,
+            182, 2011, 1745, 2140, 292, 261, 244, 150, 2432, 1688, 2073, 253,
+            306, 96, 99, 97, 131, 221, 282, 176, 1623, 283, 2282, 247,
+            233, 187, 278, 237, 247, 2020, 88, 2416, 268, 189, 29, 300,
+            177, 190, 11, 246, 279, 205, 244, 71, 259, 186, 220, 176,
+            247, 301, 177, 48, 266, 2204, 76, 26, 101, 140, 1820, 2102,
+            1687, 182, 271, 279, 193, 176, 2338, 234, 193, 229, 2309, 74,
+            228, 157, 228, 269, 170, 2402, 276, 248, 83, 295, 1886, 1703,
+            257, 303, 131, 295, 1706, 158, 169, 2302, 258, 1624, 156, 38,
+            2274, 50, 278, 249, 267, 2341, 35, 1612, 124, 25, 26, 304,
+            2453, 285, 1952, 292, 119, 315, 41, 1722, 2338, 60, 317, 308,
+            2271, 1742, 1662, 271, 235, 11, 15, 2272, 201, 257, 169, 280,
+            316, 2448, 208, 1879, 27, 26, 49, 291, 2447, 196, 1874, 47,
+            23, 1963, 250, 150, 203, 158, 264, 1677, 2381, 1698, 290, 1961,
+            2138, 2350, 2030, 2189, 2138, 2006, 114, 252, 294, 311, 181, 2347,
+            36, 255, 299, 287, 273, 109, 173, 1946, 224, 1971, 83, 1765,
+            259, 205, 96, 297, 270, 1842, 280, 18, 315, 306, 170, 279,
+            120, 2348, 2170, 214, 2152, 180, 1819, 1979, 189, 175, 259, 239,
+            1610, 254, 1717, 2227, 107, 1640, 223, 228, 284, 71, 2020, 194,
+            221, 2423, 177, 2282, 113, 209, 158, 1625, 1621, 192, 316, 35,
+            122, 1974, 106, 2388, 174, 1742, 1830, 47, 89, 133, 307, 2074,
+            242, 196, 183, 209, 2348, 184, 98, 196, 212, 273, 107, 232,
+            2153, 1809, 24, 286, 2291, 186, 2374, 95, 283, 1693, 1758, 108,
+            2139, 1952, 2425, 2110, 49, 222, 1607, 1875, 292, 225, 249, 1677,
+            28, 2006, 265, 41, 222, 270, 306, 226, 1742, 84, 2215, 168,
+            295, 108, 234, 322, 205, 207, 42, 11, 300, 241, 2011, 273,
+            143, 1892, 202, 1744, 1766, 27, 72, 313, 145, 74, 1699, 321,
+            2208, 204, 1614, 311, 195, 28, 172, 179, 250, 200, 218, 260,
+            2018, 1877, 80, 202, 2006, 276, 249, 171, 282, 294, 2027, 255,
+            311, 260, 258, 242, 185, 261, 2273, 172, 26, 260, 236, 201,
+            1848, 255, 197, 95, 1610, 282, 271, 2093, 257, 227, 209, 252,
+            297, 111, 2160, 2006, 244, 205, 314, 2051, 36, 23, 1943, 205,
+            219, 2029, 108, 252, 2142, 2044, 2073, 174, 259, 186, 1951, 301,
+            1715, 247, 107, 205, 284, 2270, 285, 1853, 298, 214, 24, 272,
+            52, 1690, 304, 293, 220, 14, 215, 183, 308, 1962, 128, 253,
+            1896, 1987, 133, 195, 202, 1808, 95, 193, 59, 175, 2205, 199,
+            170, 72, 265, 2358, 202, 2374, 2261, 214, 316, 2348, 48, 1700,
+            321, 184, 2138, 190, 25, 187, 1880, 246, 40, 2027, 264, 311,
+            122, 277, 208, 49, 293, 296, 2093, 303, 2215, 267, 201, 123,
+            249, 1886, 2270, 287, 2036, 297, 2006, 1941, 293, 1943, 2038, 312,
+            199, 162, 308, 300, 185, 196, 209, 278, 303, 183, 100, 1830,
+            1833, 49, 1971, 248, 100, 319, 2072, 1890, 1876, 286, 176, 146,
+            2021, 226, 289, 278, 1907, 272, 251, 275, 2360, 318, 194, 26,
+            1754, 282, 2216, 203, 2007, 135, 37, 2339, 304, 71, 248, 119,
+            176, 65, 168, 1971, 2336, 1688, 191, 230, 254, 255, 2237, 261,
+            2093, 243, 1622, 39, 1754, 174, 205, 210, 135, 303, 238, 219,
+            2072, 13, 228, 2006, 1829, 37, 110, 247, 302, 2143, 144, 1687,
+            216, 2275, 319, 1780, 257, 1706, 242, 289, 149, 1702, 71, 147,
+            180, 1920, 205, 52, 181, 248, 222, 132, 262, 167, 303, 172,
+            320, 156, 189, 64, 1631, 274, 169, 275, 201, 137, 287, 187,
+            1763, 156, 119, 156, 37, 232, 25, 190, 211, 249, 1952, 1925,
+            211, 1829, 235, 215, 235, 213, 188, 1614, 262, 90, 217, 238,
+            205, 310, 226, 290, 178, 2358, 87, 237, 235, 83, 285, 235,
+            220, 37, 24, 242, 248, 95, 2151, 299, 2340, 237, 316, 285,
+            202, 228, 289, 224, 244, 168, 203, 175, 2366, 1954, 279, 179,
+            1606, 264, 186, 1887, 250, 198, 169, 1962, 210, 235, 1700, 1651,
+            202, 2215, 178, 235, 286, 198, 103, 84, 39, 83, 2403, 281,
+            42, 304, 267, 1822, 2072, 36, 2281, 198, 61, 2076, 1677, 317,
+            1643, 2427, 144, 198, 100, 2083, 254, 258, 240, 2074, 2083, 233,
+            102, 1727, 1822, 38, 210, 133, 2322, 251, 2037, 198, 227, 215,
+            217, 263, 253, 1808, 273, 277, 1822, 1755, 2168, 1810, 321, 84,
+            2010, 147, 295, 256, 96, 2149, 277, 2029, 148, 208, 237, 161,
+            315, 2337, 145, 292, 14, 1839, 294, 2218, 278, 1822, 281, 227,
+            2103, 1698, 2301, 2159, 1774, 124, 1649, 293, 139, 119, 284, 35,
+            1677, 2417, 272, 89, 248, 303, 1754, 111, 155, 84, 178, 1811,
+            2427, 293, 72, 2292, 1879, 2211, 2441, 12, 1815, 225, 171, 37,
+            220, 2161, 2017, 59, 108, 2074, 143, 73, 1838, 1814, 313, 112,
+            311, 45, 288, 184, 317, 170, 23, 225, 1951, 48, 137, 314,
+            72, 60, 2427, 187, 120, 1611, 221, 1772, 1822, 2447, 1821, 2284,
+            11, 159, 2104, 1648, 2308, 281, 136, 2204, 322, 1641, 186, 204,
+            2354, 1906, 1678, 2206, 2367, 1709, 305, 178, 251, 54, 244, 2358,
+            2088, 204, 185, 173, 107, 192, 319, 277, 1820, 2245, 188, 149,
+            196, 286, 313, 17, 50, 122, 233, 2075, 96, 320, 221, 176,
+            1808, 208, 1742, 2008, 261, 245, 124, 2250, 245, 1677, 2138, 30,
+            288, 281, 184, 167, 315, 1757, 86, 146, 233, 2404, 28, 2285,
+            314, 1961, 2159, 230, 1875, 210, 297, 2234, 197, 300, 26, 2139,
+            300, 191, 2019, 2204, 274, 2159, 272, 223, 141, 131, 1744, 227,
+            27, 73, 76, 143, 131, 1610, 1819, 222, 300, 208, 11, 184,
+            249, 193, 1676, 1954, 2441, 201, 2110, 268, 303, 50, 23, 124,
+            1945, 147, 1774, 1632, 1941, 245, 228, 2118, 1676, 2405, 322, 237,
+            1822, 1648, 249, 2272, 2161, 1676, 1854, 192, 71, 203, 152, 181,
+            84, 317, 143, 304, 60, 222, 307, 2274, 255, 296, 1895, 236,
+            1944, 220, 1677, 155, 261, 2037, 144, 169, 182, 168, 188, 1633,
+            228, 1951, 276, 2376, 208, 171, 180, 1961, 2159, 322, 263, 251,
+            1708, 131, 256, 2338, 2291, 1808, 156, 2236, 1970, 264, 255, 2300,
+            313, 234, 124, 2359, 245, 109, 101, 52, 96, 134, 1613, 74,
+            240, 214, 1940, 259, 1657, 321, 173, 173, 167, 2403, 60, 104,
+            305, 233, 41, 2337, 206, 290, 273, 254, 71, 243, 1678, 88,
+            2079, 97, 1821, 296, 1750, 266, 246, 2425, 221, 286, 199, 269,
+            134, 250, 244, 242, 23, 2376, 48, 15, 161, 1677, 2098, 247,
+            2205, 1743, 215, 1621, 233, 1677, 48, 212, 23, 2204, 281, 27,
+            12, 213, 1885, 62, 181, 269, 208, 23, 2362, 157, 2341, 1611,
+            300, 23, 202, 2153, 2171, 205, 167, 2308, 40, 205, 255, 96,
+            204, 231, 121, 1912, 2006, 1942, 223, 2208, 219, 2403, 53, 1714,
+            214, 320, 2236, 255, 266, 1970, 2208, 1745, 1951, 13, 212, 220,
+            2057, 216, 299, 1744, 212, 144, 2405, 174, 2291, 74, 163, 13,
+            219, 156, 2007, 131, 263, 1621, 267, 309, 178, 243, 251, 302,
+            17, 85, 1787, 1613, 2012, 247, 191, 294, 202, 204, 273, 168,
+            224, 2416, 1886, 11, 2424, 86, 223, 136, 2274, 265, 232, 302,
+            73, 1919, 2234, 216, 296, 206, 311, 117, 138, 195, 63, 89,
+            2084, 2271, 173, 2110, 294, 280, 2419, 179, 252, 306, 98, 160,
+            2073, 2077, 287, 232, 215, 1813, 259, 48, 115, 24, 2171, 1743,
+            183, 1611, 205, 193, 267, 1951, 310, 310, 314, 299, 289, 1655,
+            237, 298, 178, 226, 64, 283, 228, 1742, 261, 263, 132, 2418,
+            175, 36, 171, 180, 2140, 281, 225, 251, 1612, 1820, 274, 1608,
+            2059, 239, 273, 210, 90, 246, 1810, 300, 1690, 2162, 246, 210,
+            300, 2159, 2140, 2434, 263, 155, 2352, 256, 72, 86, 207, 2146,
+            119, 1610, 2008, 1607, 200, 1824, 206, 235, 1697, 47, 317, 196,
+            2407, 2159, 229, 189, 1634, 47, 122, 1753, 2271, 202, 280, 209,
+            288, 176, 35, 301, 12, 196, 208, 1874, 286, 207, 1913, 239,
+            140, 92, 108, 283, 1746, 25, 159, 86, 1819, 2360, 292, 211,
+            2036, 213, 63, 303, 1754, 173, 173, 220, 2302, 2387, 1829, 2292,
+            304, 83, 172, 112, 179, 11, 2281, 274, 311, 202, 280, 84,
+            121, 278, 235, 143, 156, 252, 223, 228, 44, 310, 232, 204,
+            60, 120, 272, 119, 319, 151, 61, 1904, 311, 221, 95, 251,
+            184, 204, 260, 114, 2085, 113, 211, 1896, 23, 11, 192, 34,
+            299, 2150, 59, 178, 243, 1876, 203, 2228, 2281, 236, 190, 259,
+            318, 297, 1812, 229, 254, 1690, 322, 2294, 185, 121, 191, 303,
+            249, 82, 155, 257, 313, 125, 24, 1680, 1942, 1979, 275, 278,
+            190, 119, 2285, 113, 249, 113, 302, 178, 48, 190, 179, 241,
+            2159, 2347, 2128, 83, 271, 192, 1773, 256, 35, 195, 2190, 2154,
+            212, 1808, 267, 2315, 2141, 2381, 310, 281, 2159, 120, 1707, 15,
+            133, 2160, 49, 37, 219, 83, 2151, 316, 193, 150, 1821, 268,
+            111, 1621, 2357, 219, 216, 37, 1809, 148, 1838, 111, 2084, 2404,
+            84, 264, 1656, 1755, 219, 276, 1662, 1697, 119, 2341, 302, 176,
+            13, 2271, 2276, 174, 2271, 2039, 276, 195, 292, 236, 2348, 36,
+            287, 272, 97, 2281, 212, 267, 208, 308, 2295, 295, 1691, 1677,
+            96, 280, 84, 188, 245, 86, 226, 12, 73, 213, 2205, 249,
+            274, 2139, 237, 1885, 194, 316, 160, 123, 1899, 211, 97, 260,
+            253, 318, 50, 2074, 228, 26, 256, 61, 11, 73, 205, 2045,
+            13, 211, 1875, 2234, 295, 303, 60, 2402, 171, 271, 248, 12,
+            2358, 2141, 2139, 95, 1955, 1622, 232, 181, 163, 240, 313, 121,
+            2206, 1793, 1689, 2404, 301, 2270, 255, 18, 61, 47, 2062, 259,
+            229, 289, 285, 1808, 39, 273, 172, 310, 1987, 259, 2168, 312,
+            90, 230, 160, 2027, 214, 2160, 2336, 1677, 26, 2017, 71, 48,
+            2374, 288, 27, 192, 1758, 66, 284, 303, 289, 235, 168, 1678,
+            287, 309, 303, 109, 2283, 2286, 2028, 182, 2302, 215, 1607, 109,
+            72, 2215, 268, 111, 259, 36, 268, 81, 1743, 2160, 89, 250,
+            208, 192, 77, 198, 1773, 1819, 1755, 2149, 59, 2340, 111, 280,
+            194, 2141, 254, 63, 28, 2168, 222, 1943, 2235, 301, 193, 1978,
+            1798, 1971, 1697, 198, 138, 220, 144, 1961, 169, 85, 1722, 174,
+            283, 39, 1604, 263, 1763, 96, 274, 1612, 1954, 185, 2027, 2406,
+            276, 97, 267, 20, 1640, 63, 61, 194, 38, 132, 2093, 2111,
+            209, 306, 227, 1905, 221, 282, 185, 35, 244, 252, 98, 168,
+            258, 265, 1913, 189, 2340, 1698, 273, 209, 322, 2007, 281, 264,
+            96, 198, 200, 172, 122, 2359, 2018, 2358, 2408, 24, 285, 2023,
+            215, 171, 181, 1875, 319, 120, 269, 2294, 1624, 262, 284, 1888,
+            250, 321, 2424, 48, 229, 2171, 47, 2205, 1717, 246, 293, 2405,
+            2215, 223, 272, 231, 1812, 26, 214, 250, 2291, 122, 83, 279,
+            191, 119, 266, 272, 74, 236, 314, 256, 191, 2037, 1681, 2220,
+            61, 146, 107, 133, 72, 38, 52, 187, 290, 207, 2075, 2017,
+            297, 1830, 2151, 1678, 281, 146, 287, 2347, 280, 2317, 176, 1621,
+            275, 238, 303, 1944, 200, 229, 247, 157, 306, 47, 127, 2271,
+            201, 2017, 2275, 170, 2303, 212, 100, 237, 144, 213, 191, 49,
+            296, 1774, 2183, 2007, 1787, 1624, 1951, 216, 310, 2162, 1753, 2433,
+            167, 214, 308, 276, 225, 1627, 175, 1697, 137, 13, 223, 260,
+            299, 204, 277, 1603, 236, 197, 134, 2207, 65, 251, 196, 282,
+            301, 254, 252, 2440, 2347, 174, 62, 261, 2348, 295, 167, 233,
+            50, 1655, 2432, 1611, 1754, 215, 74, 96, 199, 2425, 123, 183,
+            2150, 249, 244, 169, 1621, 1680, 37, 1906, 2310, 322, 2281, 1841,
+            89, 95, 47, 109, 2388, 2206, 1764, 167, 221, 2357, 2404, 132,
+            47, 313, 2348, 1951, 1955, 89, 1780, 1699, 2110, 220, 226, 202,
+            2009, 311, 317, 213, 178, 258, 1622, 2300, 273, 1947, 39, 276,
+            220, 197, 1808, 2419, 2415, 1687, 59, 290, 147, 246, 297, 1690,
+            107, 218, 2012, 193, 236, 1634, 37, 49, 2225, 194, 212, 1650,
+            23, 2368, 310, 1756, 168, 1766, 184, 107, 1820, 1849, 288, 2275,
+            222, 289, 301, 318, 28, 296, 216, 193, 240, 84, 189, 223,
+            296, 2207, 2058, 108, 271, 1687, 237, 274, 313, 2433, 1944, 2039,
+            2219, 205, 157, 197, 220, 155, 86, 181, 1808, 2009, 186, 266,
+            14, 264, 2443, 62, 189, 190, 1743, 180, 2086, 260, 258, 1833,
+            283, 95, 88, 86, 97, 221, 2085, 232, 2249, 202, 204, 256,
+            292, 245, 173, 49, 1700, 260, 98, 257, 62, 168, 2078, 282,
+            134, 270, 171, 1953, 72, 187, 1979, 182, 201, 2415, 225, 61,
+            2340, 2009, 88, 168, 161, 1600, 2440, 36, 302, 184, 261, 2321,
+            40, 200, 199, 71, 155, 1808, 1945, 155, 180, 2018, 53, 1956,
+            293, 2225, 49, 1819, 1622, 272, 26, 263, 184, 314, 1742, 172,
+            2205, 183, 262, 217, 2284, 157, 1940, 1951, 1874, 202, 1895, 236,
+            275, 1753, 322, 217, 2057, 47, 272, 1971, 2017, 199, 48, 1640,
+            232, 71, 159, 66, 170, 2144, 286, 36, 75, 84, 2110, 305,
+            220, 199, 204, 2018, 2336, 1681, 12, 250, 249, 170, 2142, 2348,
+            247, 263, 119, 145, 23, 284, 64, 13, 1767, 1820, 230, 1859,
+            60, 169, 235, 181, 310, 321, 168, 2271, 167, 109, 157, 2017,
+            2283, 303, 255, 200, 2044, 243, 2366, 1715, 108, 258, 1874, 2149,
+            230, 231, 299, 101, 2255, 297, 2358, 268, 261, 1625, 233, 180,
+            211, 185, 2339, 223, 158, 2406, 1820, 2093, 268, 295, 278, 48,
+            318, 131, 294, 2074, 2117, 1611, 180, 221, 2084, 270, 261, 102,
+            249, 292, 319, 252, 241, 267, 123, 1687, 95, 2160, 313, 315,
+            1826, 169, 23, 203, 2149, 71, 302, 227, 271, 256, 170, 203,
+            143, 241, 252, 238, 2204, 2236, 208, 194, 229, 171, 37, 29,
+            133, 1640, 123, 168, 110, 298, 2271, 40, 227, 238, 278, 1812,
+            241, 177, 303, 316, 302, 2150, 320, 190, 174, 1820, 35, 215,
+            1649, 143, 1951, 212, 268, 1732, 1681, 180, 296, 2087, 259, 48,
+            247, 36, 15, 291, 134, 304, 74, 304, 313, 2159, 2084, 296,
+            210, 285, 138, 317, 136, 1808, 74, 1772, 307, 2007, 298, 257,
+            177, 2417, 36, 1795, 307, 1846, 1890, 2017, 215, 256, 309, 1809,
+            2228, 76, 302, 253, 1625, 279, 35, 214, 27, 1970, 225, 277,
+            314, 2404, 168, 1953, 234, 1895, 75, 2236, 1715, 309, 2360, 1643,
+            174, 278, 263, 54, 302, 186, 76, 2294, 2374, 1848, 1904, 270,
+            1610, 28, 2358, 1625, 48, 1940, 1753, 49, 190, 177, 270, 259,
+            131, 86, 255, 101, 193, 249, 1876, 173, 180, 147, 258, 1945,
+            245, 2104, 248, 16, 2074, 232, 2149, 271, 62, 2083, 212, 316,
+            135, 85, 260, 107, 302, 72, 316, 177, 2405, 1895, 76, 2273,
+            208, 226, 254, 265, 285, 155, 288, 314, 156, 2215, 1876, 272,
+            2402, 2020, 84, 2117, 47, 188, 2029, 244, 181, 298, 189, 75,
+            2051, 168, 230, 226, 247, 1830, 308, 195, 220, 52, 311, 48,
+            1617, 297, 199, 178, 2138, 143, 2017, 60, 228, 229, 227, 125,
+            189, 203, 1979, 197, 2093, 183, 223, 2139, 75, 222, 2206, 227,
+            1621, 200, 201, 110, 196, 190, 1782, 277, 170, 1623, 85, 29,
+            2347, 15, 12, 280, 2270, 205, 225, 112, 147, 11, 187, 12,
+            211, 252, 1838, 171, 137, 174, 184, 277, 239, 144, 41, 1895,
+            315, 2315, 1971, 304, 224, 173, 168, 277, 129, 262, 1874, 209,
+            2111, 269, 176, 288, 2150, 2424, 2283, 1896, 257, 209, 74, 2375,
+            179, 2170, 245, 258, 2028, 2357, 308, 292, 133, 315, 35, 84,
+            1855, 1891, 2083, 2152, 260, 223, 185, 119, 236, 235, 277, 252,
+            191, 110, 1621, 2274, 1743, 262, 72, 248, 83, 47, 251, 119,
+            12, 209, 203, 1763, 259, 61, 71, 267, 143, 235, 2225, 277,
+            2143, 287, 1874, 298, 1830, 299, 274, 158, 304, 107, 305, 83,
+            2139, 283, 2219, 246, 2160, 1964, 1688, 256, 1876, 224, 169, 240,
+            65, 1838, 1811, 64, 172, 2249, 232, 1874, 252, 177, 1787, 272,
+            197, 1978, 99, 1810, 1829, 1821, 45, 2309, 157, 1782, 1941, 1886,
+            295, 160, 111, 2168, 318, 319, 307, 112, 2424, 162, 194, 2140,
+            187, 24, 293, 287, 64, 174, 2143, 244, 182, 131, 283, 204,
+            108, 48, 2159, 11, 2339, 263, 84, 254, 204, 2228, 1697, 132,
+            180, 317, 143, 1687, 2216, 1819, 1609, 2413, 275, 287, 314, 85,
+            273, 1810, 1964, 248, 167, 207, 296, 156, 1763, 223, 274, 251,
+            1714, 123, 274, 231, 277, 2206, 2138, 95, 1677, 224, 69, 253,
+            308, 253, 2440, 293, 249, 2218, 1874, 144, 12, 141, 224, 258,
+            271, 256, 97, 208, 1952, 236, 197, 95, 30, 252, 261, 2381,
+            313, 1809, 275, 256, 194, 113, 279, 2019, 1745, 2093, 287, 109,
+            255, 122, 99, 2186, 2204, 284, 2415, 2120, 281, 283, 300, 210,
+            207, 285, 222, 123, 290, 217, 1895, 2205, 301, 244, 109, 281,
+            136, 181, 322, 156, 279, 238, 222, 198, 220, 12, 155, 234,
+            192, 156, 1699, 214, 2084, 169, 42, 2433, 26, 195, 12, 52,
+            88, 214, 175, 2275, 183, 216, 289, 193, 2084, 232, 198, 2008,
+            1622, 207, 231, 228, 1876, 109, 170, 322, 285, 184, 1925, 273,
+            2281, 71, 200, 120, 2338, 1972, 24, 1641, 146, 282, 246, 147,
+            198, 188, 2347, 305, 25, 146, 157, 25, 172, 71, 1642, 312,
+            84, 2045, 242, 206, 311, 2404, 2093, 2019, 49, 1953, 89, 119,
+            2382, 27, 321, 283, 89, 35, 292, 2159, 265, 211, 131, 2413,
+            216, 305, 217, 1898, 2143, 1885, 301, 1877, 304, 194, 198, 1698,
+            160, 317, 112, 1808, 38, 271, 2072, 213, 269, 195, 51, 244,
+            217, 176, 239, 1679, 95, 26, 24, 221, 233, 1810, 275, 2111,
+            209, 2150, 260, 207, 300, 71, 144, 172, 96, 27, 59, 185,
+            207, 318, 1885, 2337, 2291, 280, 95, 100, 1757, 218, 2366, 1774,
+            1907, 119, 183, 1874, 193, 253, 273, 275, 207, 265, 201, 207,
+            1963, 2270, 271, 247, 1885, 207, 185, 218, 308, 224, 1612, 2038,
+            1885, 1952, 251, 143, 108, 207, 84, 233, 2138, 2424, 174, 35,
+            131, 126, 303, 219, 272, 322, 278, 11, 180, 2285, 198, 257,
+            198, 77, 11, 2292, 1855, 234, 219, 302, 318, 182, 1611, 1652,
+            2272, 265, 228, 242, 1663, 220, 217, 96, 2347, 1611, 1854, 210,
+            73, 112, 2138, 293, 83, 1978, 286, 2235, 321, 2273, 16, 291,
+            2415, 72, 1788, 191, 1688, 233, 197, 170, 300, 277, 26, 2036,
+            109, 279, 320, 1757, 244, 119, 2217, 25, 2272, 1780, 299, 159,
+            310, 298, 205, 196, 47, 266, 225, 178, 290, 108, 236, 239,
+            2076, 1763, 184, 1621, 209, 213, 232, 122, 1628, 2270, 1775, 2271,
+            2357, 252, 241, 65, 322, 97, 277, 99, 96, 278, 189, 173,
+            245, 246, 96, 59, 288, 201, 249, 283, 254, 171, 293, 63,
+            40, 262, 1896, 30, 225, 128, 184, 218, 179, 2337, 1841, 227,
+            2012, 2112, 88, 120, 13, 148, 1876, 197, 2406, 314, 1622, 12,
+            1896, 320, 119, 211, 2242, 84, 226, 273, 13, 289, 1846, 282,
+            2072, 274, 256, 131, 242, 167, 269, 296, 155, 50, 2336, 212,
+            213, 275, 271, 216, 283, 2315, 1943, 277, 317, 178, 1679, 1601,
+            319, 1690, 243, 243, 2161, 1688, 246, 167, 190, 37, 193, 2366,
+            2433, 146, 1839, 171, 161, 2237, 263, 202, 208, 72, 215, 2150,
+            1641, 241, 202, 122, 35, 267, 297, 168, 319, 1610, 187, 202,
+            1962, 2140, 77, 240, 236, 1687, 167, 2226, 134, 2215, 2366, 196,
+            25, 202, 2414, 262, 2270, 316, 266, 74, 246, 258, 2169, 2413,
+            42, 177, 1940, 312, 185, 85, 187, 2155, 264, 195, 2095, 2102,
+            180, 2440, 111, 2011, 229, 113, 1755, 286, 246, 1622, 189, 61,
+            282, 300, 246, 2007, 297, 132, 197, 186, 259, 306, 252, 131,
+            259, 254, 2085, 199, 255, 212, 181, 59, 14, 272, 37, 26,
+            169, 1772, 147, 227, 287, 24, 270, 49, 2367, 143, 1676, 191,
+            186, 227, 216, 303, 242, 260, 24, 1943, 1681, 2442, 2237, 197,
+            124, 225, 205, 210, 2083, 35, 292, 1612, 177, 212, 156, 2281,
+            250, 157, 2414, 2404, 298, 2149, 121, 11, 1961, 1874, 304, 53,
+            279, 2415, 209, 317, 2347, 1756, 179, 222, 196, 2359, 273, 223,
+            1721, 242, 247, 13, 273, 266, 52, 193, 1915, 2204, 1961, 275,
+            172, 208, 1610, 193, 280, 187, 155, 2159, 189, 2022, 1742, 191,
+            123, 109, 28, 50, 310, 152, 300, 186, 205, 1904, 110, 263,
+            48, 232, 1954, 72, 36, 291, 284, 300, 134, 107, 96, 222,
+            265, 289, 115, 176, 234, 25, 1635, 285, 1904, 162, 291, 270,
+            176, 218, 2350, 2084, 1611, 2414, 300, 24, 1633, 2204, 289, 280,
+            298, 39, 264, 301, 135, 1912, 1758, 73, 236, 176, 119, 295,
+            147, 284, 201, 276, 99, 258, 1621, 2110, 2084, 270, 108, 256,
+            119, 208, 97, 252, 221, 221, 132, 134, 299, 171, 1821, 114,
+            174, 299, 258, 2073, 289, 102, 318, 321, 47, 261, 2402, 209,
+            1819, 2310, 251, 1774, 42, 1886, 212, 181, 276, 271, 49, 1810,
+            241, 155, 317, 271, 72, 2020, 59, 1743, 88, 289, 131, 280,
+            71, 1631, 1764, 262, 120, 2405, 311, 2152, 2029, 186, 53, 2274,
+            311, 202, 63, 2118, 287, 2010, 280, 214, 319, 224, 2075, 157,
+            145, 168, 2350, 274, 286, 133, 1765, 2448, 292, 265, 321, 38,
+            284, 2349, 201, 1832, 1698, 1772, 190, 155, 264, 1612, 108, 195,
+            2139, 2150, 35, 312, 314, 1716, 229, 61, 243, 110, 256, 67,
+            2219, 1721, 300, 250, 286, 2403, 13, 1888, 310, 2140, 2207, 1756,
+            2217, 170, 1925, 100, 2300, 98, 54, 194, 108, 178, 2337, 264,
+            201, 287, 235, 1962, 2226, 1698, 310, 277, 276, 305, 47, 313,
+            300, 287, 2341, 167, 309, 74, 251, 218, 2413, 193, 2271, 262,
+            2178, 19, 241, 268, 173, 12, 1788, 245, 97, 95, 233, 107,
+            97, 1676, 2229, 112, 178, 1743, 2062, 193, 2283, 189, 35, 258,
+            145, 1690, 1887, 2072, 168, 200, 1838, 59, 2209, 219, 2235, 222,
+            238, 2008, 1951, 183, 1848, 1679, 133, 264, 2414, 316, 59, 2342,
+            2440, 98, 1951, 2031, 24, 206, 279, 283, 109, 182, 2087, 134,
+            172, 2074, 2315, 1618, 1610, 321, 272, 1763, 1985, 260, 187, 41,
+            298, 310, 211, 195, 120, 136, 1896, 158, 213, 2076, 253, 2176,
+            285, 251, 1678, 109, 2433, 1615, 65, 128, 220, 2366, 86, 238,
+            276, 1721, 2301, 218, 127, 121, 308, 244, 299, 49, 91, 261,
+            99, 242, 173, 315, 1978, 1744, 2270, 2007, 62, 287, 206, 200,
+            1772, 258, 227, 308, 108, 120, 2084, 322, 162, 264, 1746, 1678,
+            181, 271, 208, 197, 248, 283, 1754, 64, 155, 80, 37, 2358,
+            107, 277, 1631, 145, 322, 1859, 206, 289, 2010, 236, 296, 1956,
+            210, 234, 296, 84, 232, 71, 237, 113, 102, 73, 179, 187,
+            2349, 2073, 2017, 197, 309, 2139, 95, 228, 2110, 259, 257, 91,
+            307, 2074, 2218, 256, 252, 254, 304, 114, 209, 49, 312, 272,
+            23, 220, 159, 1979, 98, 319, 229, 107, 1942, 192, 2150, 312,
+            2425, 209, 193, 288, 267, 38, 2336, 36, 1830, 2076, 168, 2217,
+            2110, 177, 184, 125, 1616, 2029, 48, 232, 210, 84, 280, 199,
+            137, 2274, 2242, 286, 75, 242, 54, 1687, 65, 283, 311, 2405,
+            133, 1944, 1621, 299, 2347, 1700, 35, 146, 227, 183, 1765, 119,
+            191, 226, 1631, 2051, 271, 2275, 248, 264, 193, 210, 270, 43,
+            121, 317, 295, 266, 91, 228, 1904, 178, 1715, 274, 86, 144,
+            1642, 237, 155, 181, 1808, 286, 285, 2336, 190, 234, 157, 279,
+            193, 292, 310, 1854, 52, 1729, 2151, 23, 1745, 84, 146, 131,
+            249, 205, 78, 156, 174, 302, 278, 172, 23, 1744, 1953, 2057,
+            222, 2349, 2281, 193, 192, 2008, 122, 171, 193, 50, 227, 1753,
+            2154, 258, 317, 176, 2036, 189, 25, 155, 2374, 98, 261, 2270,
+            119, 294, 2176, 216, 278, 225, 1632, 2210, 2204, 1912, 2073, 259,
+            15, 256, 98, 265, 2094, 183, 270, 2406, 278, 2151, 97, 2027,
+            269, 232, 232, 1687, 225, 1714, 261, 2028, 50, 283, 233, 301,
+            144, 1886, 37, 220, 2272, 301, 1986, 191, 292, 168, 303, 211,
+            281, 2348, 289, 317, 228, 274, 1956, 137, 1781, 223, 255, 269,
+            2357, 169, 318, 32, 119, 293, 2226, 309, 1610, 160, 295, 156,
+            308, 1781, 192, 1941, 210, 267, 213, 1875, 189, 292, 1887, 2433,
+            190, 150, 251, 156, 120, 156, 71, 135, 163, 224, 169, 244,
+            2057, 266, 2414, 26, 2018, 231, 226, 143, 2226, 1714, 230, 215,
+            2270, 87, 197, 143, 310, 138, 62, 2251, 1896, 1940, 1742, 171,
+            161, 2008, 177, 276, 37, 24, 244, 1954, 289, 269, 197, 158,
+            202, 156, 1875, 277, 2387, 1622, 23, 156, 273, 201, 174, 168,
+            186, 143, 2432, 239, 1820, 200, 89, 47, 310, 132, 2012, 247,
+            195, 2138, 85, 1780, 1905, 236, 144, 2140, 2351, 290, 2282, 11,
+            259, 2226, 2038, 253, 1697, 263, 51, 2095, 18, 98, 256, 49,
+            252, 192, 193, 2075, 210, 97, 1810, 180, 292, 211, 242, 2294,
+            262, 1874, 170, 122, 2149, 287, 12, 1678, 2086, 135, 290, 19,
+            251, 73, 301, 215, 124, 281, 187, 244, 1895, 2381, 1649, 318,
+            282, 2271, 228, 196, 121, 319, 194, 292, 13, 2209, 1874, 211,
+            1763, 177, 2169, 246, 189, 297, 2357, 2027, 143, 1749, 2416, 77,
+            286, 289, 297, 289, 88, 62, 30, 317, 2161, 180, 172, 250,
+            2357, 67, 2007, 1961, 1621, 2270, 1697, 2052, 288, 1711, 2123, 236,
+            247, 13, 225, 172, 235, 303, 132, 283, 226, 1952, 1743, 75,
+            246, 112, 1985, 2008, 222, 231, 24, 184, 246, 283, 2235, 114,
+            2291, 2140, 1710, 103, 168, 109, 2348, 1611, 148, 72, 265, 254,
+            181, 1632, 2017, 71, 31, 71, 61, 273, 2234, 145, 1888, 160,
+            2347, 269, 2440, 143, 170, 25, 2160, 1839, 317, 250, 2112, 230,
+            39, 185, 181, 204, 274, 273, 132, 2184, 184, 216, 2443, 2415,
+            85, 2207, 2183, 25, 245, 2103, 281, 65, 268, 96, 96, 1889,
+            226, 254, 186, 252, 259, 23, 1875, 97, 257, 252, 19, 1755,
+            222, 295, 228, 2216, 266, 2206, 72, 216, 205, 137, 2093, 213,
+            296, 2021, 205, 197, 308, 149, 229, 306, 61, 1809, 2423, 264,
+            49, 2272, 217, 2374, 95, 2349, 238, 275, 107, 1723, 239, 180,
+            1941, 1631, 301, 1641, 1613, 196, 248, 289, 2406, 125, 38, 1877,
+            77, 264, 2140, 72, 291, 1913, 27, 215, 193, 2300, 31, 284,
+            1755, 2178, 12, 205, 155, 2169, 13, 85, 133, 1821, 266, 304,
+            178, 218, 212, 1623, 182, 1624, 260, 1860, 283, 131, 38, 171,
+            108, 303, 180, 2300, 1716, 1676, 1940, 177, 319, 62, 228, 213,
+            185, 199, 232, 199, 306, 206, 1614, 143, 317, 208, 39, 158,
+            36, 282, 275, 147, 75, 1728, 266, 251, 59, 243, 1978, 225,
+            1753, 2338, 1944, 227, 171, 2075, 133, 309, 281, 309, 293, 2349,
+            25, 1631, 1847, 1942, 219, 312, 200, 200, 2337, 239, 98, 37,
+            2095, 229, 272, 307, 314, 2141, 1897, 35, 50, 32, 120, 292,
+            113, 197, 2076, 209, 184, 233, 44, 96, 192, 283, 260, 251,
+            1879, 287, 76, 1742, 65, 173, 1612, 1859, 2102, 60, 53, 23,
+            1765, 187, 277, 216, 220, 314, 2045, 1941, 191, 232, 1625, 2359,
+            115, 254, 35, 281, 168, 17, 167, 140, 221, 223, 200, 1649,
+            2072, 299, 146, 239, 13, 133, 298, 122, 48, 1706, 2039, 159,
+            1621, 2249, 1831, 183, 274, 2347, 2347, 297, 2138, 1905, 175, 16,
+            71, 186, 2276, 1742, 249, 249, 174, 280, 1642, 2154, 38, 2228,
+            288, 24, 151, 1840, 238, 88, 230, 1881, 196, 180, 2017, 1747,
+            290, 123, 217, 1763, 65, 277, 1623, 1701, 73, 110, 2097, 296,
+            1812, 25, 171, 201, 288, 96, 239, 234, 2153, 286, 97, 261,
+            251, 1810, 313, 2270, 60, 245, 225, 246, 308, 1838, 1811, 223,
+            2434, 120, 215, 1753, 299, 2149, 250, 2204, 2245, 298, 49, 27,
+            263, 2349, 301, 320, 213, 1941, 235, 1782, 195, 1823, 218, 254,
+            293, 210, 212, 311, 20, 1615, 62, 222, 194, 51, 1687, 144,
+            1681, 170, 98, 2077, 306, 134, 2103, 263, 237, 255, 2226, 245,
+            73, 238, 135, 261, 83, 2194, 233, 2169, 1756, 158, 99, 2170,
+            315, 223, 145, 95, 2177, 173, 2301, 71, 299, 176, 2276, 107,
+            1633, 1971, 199, 1874, 226, 192, 2206, 157, 227, 248, 1753, 319,
+            1756, 2351, 12, 24, 2352, 60, 170, 316, 292, 249, 269, 47,
+            110, 2149, 29, 71, 284, 174, 119, 2414, 1885, 26, 286, 1970,
+            196, 228, 1829, 185, 143, 2453, 2084, 214, 195, 2368, 157, 179,
+            1753, 27, 171, 148, 276, 304, 184, 73, 2272, 76, 240, 57,
+            2273, 2138, 108, 310, 132, 2359, 240, 2388, 120, 267, 199, 83,
+            49, 179, 2027, 2085, 200, 202, 147, 2053, 313, 182, 247, 218,
+            210, 2008, 2226, 1987, 2402, 2013, 112, 66, 1887, 181, 297, 289,
+            35, 2366, 213, 256, 309, 189, 175, 181, 48, 1913, 2076, 2073,
+            2337, 236, 121, 273, 305, 252, 181, 2357, 242, 234, 189, 232,
+            111, 76, 278, 260, 288, 220, 244, 122, 1973, 257, 202, 25,
+            262, 252, 186, 259, 2168, 2036, 75, 256, 220, 197, 306, 174,
+            305, 263, 1912, 2310, 95, 62, 209, 80, 1773, 195, 107, 195,
+            91, 123, 315, 299, 211, 14, 300, 268, 2010, 125, 208, 227,
+            2219, 2017, 264, 175, 2072, 1878, 321, 240, 1763, 72, 1633, 2350,
+            231, 190, 196, 47, 287, 2140, 2281, 215, 145, 234, 188, 274,
+            247, 2433, 239, 110, 2044, 303, 229, 221, 290, 37, 247, 265,
+            240, 275, 2286, 281, 246, 2044, 2010, 177, 35, 1759, 35, 307,
+            320, 191, 1677, 196, 55, 310, 156, 1961, 1895, 186, 1813, 2037,
+            1708, 1821, 161, 2052, 217, 205, 2291, 302, 257, 1812, 1838, 279,
+            2007, 231, 1838, 1899, 197, 204, 1613, 2308, 178, 1742, 1874, 1961,
+            2008, 121, 1621, 1697, 170, 199, 1721, 2242, 23, 65, 281, 253,
+            1886, 2168, 1689, 239, 2350, 72, 95, 17, 297, 189, 267, 2338,
+            211, 191, 271, 49, 248, 312, 1941, 18, 1940, 2271, 167, 252,
+            218, 1897, 51, 215, 233, 2036, 2415, 222, 265, 2420, 219, 2366,
+            169, 262, 138, 257, 1743, 60, 260, 2094, 282, 262, 274, 1875,
+            77, 2140, 2310, 274, 276, 13, 216, 183, 95, 2086, 1772, 227,
+            1747, 282, 293, 177, 256, 184, 292, 212, 2336, 1754, 249, 171,
+            198, 198, 227, 75, 290, 1877, 42, 1905, 295, 38, 2415, 270,
+            198, 198, 280, 2377, 36, 198, 294, 59, 278, 274, 223, 2028,
+            1746, 1612, 2291, 245, 214, 219, 219, 290, 122, 263, 232, 213,
+            1679, 181, 149, 1954, 16, 305, 288, 1708, 204, 310, 2096, 2405,
+            170, 120, 1874, 193, 309, 241, 2454, 151, 119, 2295, 178, 190,
+            1978, 198, 2022, 1632, 236, 299, 184, 198, 170, 2281, 1952, 308,
+            145, 239, 213, 206, 231, 206, 193, 1648, 109, 2294, 24, 320,
+            2433, 262, 218, 132, 216, 84, 232, 13, 225, 84, 1809, 201,
+            53, 41, 1953, 2151, 2183, 1952, 1842, 306, 52, 133, 62, 287,
+            83, 289, 277, 216, 229, 131, 59, 2208, 187, 65, 233, 158,
+            1831, 243, 197, 168, 175, 2303, 205, 219, 234, 2083, 47, 241,
+            232, 237, 50, 173, 285, 221, 98, 237, 99, 2058, 206, 151,
+            251, 100, 302, 267, 2072, 231, 248, 96, 273, 306, 1642, 112,
+            1919, 1970, 1878, 137, 240, 245, 15, 220, 258, 2228, 322, 217,
+            83, 284, 228, 311, 2216, 1632, 15, 2243, 218, 1864, 206, 312,
+            1877, 307, 277, 2010, 194, 2423, 2433, 233, 316, 135, 163, 1608,
+            320, 135, 28, 35, 1763, 263, 253, 122, 1753, 181, 171, 1687,
+            1997, 167, 266, 278, 145, 17, 2282, 229, 177, 2009, 320, 2054,
+            2337, 74, 213, 155, 127, 1648, 2073, 246, 299, 260, 301, 69,
+            253, 255, 263, 232, 2083, 170, 210, 244, 167, 124, 2204, 243,
+            228, 85, 2336, 169, 180, 186, 302, 186, 312, 121, 184, 2038,
+            170, 2271, 2225, 2308, 269, 85, 167, 1746, 2215, 187, 272, 238,
+            62, 2242, 273, 145, 281, 318, 2006, 2424, 172, 90, 1744, 112,
+            1946, 181, 136, 252, 131, 242, 2350, 61, 1632, 236, 195, 2075,
+            1633, 48, 2454, 234, 224, 1908, 257, 167, 294, 179, 157, 236,
+            210, 214, 1965, 262, 270, 2094, 2112, 150, 255, 2243, 96, 158,
+            303, 96, 259, 2117, 285, 1940, 289, 322, 282, 24, 251, 267,
+            282, 109, 276, 275, 275, 243, 173, 12, 310, 2316, 270, 107,
+            304, 116, 31, 264, 183, 301, 2360, 2141, 289, 49, 307, 2177,
+            1966, 158, 131, 219, 2029, 175, 146, 307, 75, 190, 237, 218,
+            271, 191, 2073, 175, 36, 1830, 109, 201, 283, 49, 246, 1610,
+            218, 210, 2282, 1889, 159, 315, 107, 182, 2225, 39, 1951, 243,
+            206, 60, 181, 288, 312, 313, 65, 220, 2293, 2022, 2440, 74,
+            314, 51, 63, 284, 12, 1895, 298, 222, 227, 2415, 271, 211,
+            178, 160, 1680, 258, 212, 158, 212, 263, 71, 220, 2235, 1744,
+            156, 162, 2349, 2238, 2404, 202, 2300, 230, 278, 39, 16, 263,
+            1716, 59, 11, 1819, 131, 316, 1991, 2185, 226, 2428, 2423, 187,
+            2017, 176, 2169, 2078, 230, 180, 1897, 60, 1753, 119, 2340, 2138,
+            174, 2204, 266, 132, 2139, 205, 2226, 1874, 130, 267, 134, 255,
+            2085, 226, 2342, 1897, 296, 98, 2102, 254, 251, 145, 1623, 261,
+            143, 195, 248, 2293, 2149, 112, 1687, 35, 287, 241, 315, 290,
+            39, 293, 311, 223, 277, 183, 286, 240, 2270, 237, 239, 159,
+            199, 168, 223, 188, 2282, 180, 119, 1679, 178, 195, 1613, 176,
+            1676, 2225, 65, 1621, 1690, 249, 313, 1944, 263, 2282, 244, 1753,
+            179, 23, 169, 1676, 224, 1692, 2441, 144, 86, 2010, 1715, 206,
+            213, 233, 220, 1763, 1680, 28, 214, 204, 283, 208, 101, 49,
+            215, 232, 1631, 139, 235, 215, 37, 2044, 274, 316, 239, 107,
+            2350, 2185, 197, 1641, 238, 1615, 120, 119, 2118, 2216, 146, 143,
+            2357, 235, 2282, 2284, 181, 1744, 2423, 75, 2282, 63, 167, 315,
+            2177, 217, 235, 304, 83, 1772, 155, 2243, 253, 261, 179, 2321,
+            111, 243, 291, 2006, 2227, 83, 86, 11, 2348, 227, 64, 230,
+            260, 306, 2340, 287, 2095, 1897, 239, 270, 274, 1887, 241, 61,
+            1632, 272, 191, 120, 2030, 246, 228, 12, 2250, 273, 2078, 294,
+            50, 171, 299, 2416, 218, 98, 1877, 249, 234, 171, 96, 1744,
+            185, 178, 254, 2094, 2073, 49, 60, 1746, 313, 132, 2426, 241,
+            251, 222, 176, 109, 2367, 1687, 2103, 1688, 2282, 234, 217, 2117,
+            213, 121, 276, 2403, 302, 226, 311, 2275, 61, 281, 197, 322,
+            2142, 178, 301, 60, 50, 275, 248, 172, 1753, 1879, 268, 295,
+            276, 310, 295, 2077, 71, 158, 231, 239, 170, 180, 318, 2046,
+            202, 284, 41, 232, 1632, 2204, 239, 2152, 40, 244, 2348, 1853,
+            321, 65, 179, 1687, 2177, 2413, 241, 2006, 2350, 2215, 2207, 14,
+            1810, 1811, 2085, 1677, 294, 38, 199, 50, 241, 1634, 1991, 254,
+            64, 121, 308, 285, 2284, 274, 2030, 107, 211, 231, 2402, 322,
+            2006, 1697, 178, 2018, 2007, 23, 181, 1781, 1846, 277, 49, 2358,
+            1970, 291, 242, 272, 183, 196, 321, 288, 1941, 2291, 60, 2210,
+            75, 1702, 233, 175, 269, 301, 108, 73, 1839, 161, 319, 1744,
+            133, 194, 2272, 246, 1633, 13, 243, 204, 307, 171, 289, 182,
+            1961, 185, 99, 261, 35, 296, 238, 251, 1689, 97, 256, 233,
+            257, 221, 1707, 96, 173, 282, 285, 181, 299, 2176, 144, 168,
+            211, 178, 245, 108, 197, 1820, 2205, 218, 184, 2282, 1810, 314,
+            1610, 1607, 187, 2159, 1876, 2030, 134, 1861, 301, 86, 108, 209,
+            23, 247, 2018, 246, 83, 250, 250, 202, 1632, 1953, 1611, 189,
+            95, 241, 123, 285, 1744, 172, 305, 144, 272, 181, 298, 176,
+            1821, 26, 290, 190, 2006, 321, 138, 283, 288, 2006, 206, 1802,
+            1829, 11, 232, 2300, 101, 271, 248, 231, 250, 1822, 159, 224,
+            298, 241, 276, 157, 121, 292, 223, 158, 12, 205, 322, 219,
+            240, 73, 175, 240, 1971, 185, 47, 83, 226, 2281, 174, 213,
+            209, 303, 265, 2205, 279, 159, 238, 284, 48, 239, 2270, 190,
+            14, 291, 47, 2300, 2176, 78, 172, 171, 59, 241, 229, 2150,
+            255, 271, 212, 134, 1745, 2436, 1689, 2019, 219, 237, 36, 207,
+            217, 161, 297, 241, 227, 1874, 252, 2300, 2159, 2006, 182, 2139,
+            71, 292, 212, 2300, 2132, 246, 1952, 1885, 37, 200, 1896, 23,
+            263, 259, 270, 298, 257, 297, 253, 2093, 265, 2074, 1808, 221,
+            1885, 2111, 174, 192, 250, 12, 2006, 294, 35, 239, 2151, 1874,
+            241, 207, 212, 207, 84, 216, 1885, 2141, 1677, 225, 235, 2300,
+            1765, 264, 241, 296, 2416, 2168, 251, 321, 26, 2160, 207, 240,
+            199, 2087, 2021, 1742, 60, 85, 241, 267, 119, 167, 1992, 51,
+            265, 72, 1822, 219, 207, 207, 2337, 207, 2270, 2176, 2336, 203,
+            2389, 207, 208, 309, 111, 1885, 272, 223, 224, 1822, 207, 267,
+            2142, 1885, 1651, 198, 2176, 107, 36, 1942, 146, 212, 278, 207,
+            268, 1822, 133, 203, 1682, 2347, 175, 143, 150, 1885, 120, 1611,
+            234, 155, 242, 203, 2045, 15, 321, 207, 281, 110, 193, 47,
+            2347, 2271, 169, 314, 1942, 194, 98, 83, 204, 208, 312, 1885,
+            190, 2006, 261, 134, 225, 147, 2271, 2216, 25, 218, 157, 265,
+            49, 124, 208, 298, 131, 1834, 173, 210, 2416, 1709, 12, 272,
+            167, 2225, 270, 256, 28, 1688, 2234, 220, 260, 181, 2159, 259,
+            25, 245, 195, 221, 134, 2315, 257, 2087, 2094, 221, 281, 136,
+            59, 258, 2292, 95, 203, 309, 29, 280, 173, 2283, 312, 237,
+            302, 1819, 220, 1951, 307, 121, 244, 60, 177, 1820, 2159, 203,
+            248, 1615, 2009, 256, 266, 302, 181, 1982, 2413, 177, 2138, 1613,
+            203, 193, 2440, 1944, 11, 174, 205, 322, 182, 215, 184, 186,
+            187, 307, 148, 156, 1943, 143, 203, 1768, 279, 109, 30, 203,
+            2017, 192, 1895, 1698, 2205, 88, 12, 303, 1808, 2027, 170, 316,
+            249, 195, 218, 244, 1613, 321, 271, 1846, 180, 1610, 236, 309,
+            316, 191, 1611, 2006, 161, 40, 2226, 47, 214, 11, 273, 262,
+            1622, 2283, 2459, 277, 2403, 310, 2270, 203, 292, 1679, 209, 212,
+            133, 311, 169, 1787, 310, 2159, 84, 146, 1743, 2139, 273, 2404,
+            108, 2177, 1716, 1820, 308, 2417, 262, 2358, 298, 200, 172, 273,
+            182, 97, 2357, 176, 119, 202, 177, 133, 260, 119, 1943, 64,
+            1631, 176, 167, 1758, 276, 29, 274, 74, 311, 2404, 260, 314,
+            2225, 261, 95, 56, 157, 168, 282, 245, 233, 123, 261, 315,
+            2083, 62, 227, 110, 13, 136, 1621, 37, 24, 216, 97, 148,
+            307, 1808, 170, 233, 1886, 218, 2027, 181, 1896, 35, 285, 109,
+            1714, 196, 1698, 1887, 229, 290, 83, 290, 201, 179, 97, 271,
+            98, 316, 47, 107, 305, 2336, 195, 305, 2072, 177, 267, 180,
+            2341, 138, 200, 268, 221, 2272, 169, 297, 230, 59, 1707, 74,
+            208, 214, 196, 24, 190, 36, 48, 1621, 286, 175, 2011, 274,
+            155, 1822, 2274, 286, 306, 2337, 317, 123, 223, 2093, 206, 156,
+            2271, 184, 1961, 250, 2168, 2230, 318, 89, 62, 29, 1745, 186,
+            307, 260, 1940, 2161, 320, 132, 303, 35, 1930, 1691, 1819, 275,
+            1809, 263, 301, 1979, 272, 295, 287, 249, 273, 295, 170, 2152,
+            2369, 160, 292, 304, 307, 2351, 232, 1613, 290, 1876, 1926, 226,
+            2208, 311, 241, 111, 2409, 1787, 271, 87, 299, 255, 306, 222,
+            247, 274, 1951, 2281, 261, 190, 2425, 23, 1888, 2084, 194, 2083,
+            73, 2339, 189, 235, 74, 282, 278, 2074, 259, 1940, 29, 249,
+            97, 2204, 254, 225, 259, 45, 1641, 2218, 97, 253, 292, 120,
+            2036, 215, 1874, 2249, 37, 2413, 2111, 223, 2007, 177, 2392, 322,
+            311, 1622, 287, 281, 1940, 148, 211, 1886, 193, 121, 2406, 122,
+            229, 312, 156, 248, 310, 2019, 262, 97, 307, 303, 291, 25,
+            306, 256, 35, 141, 238, 211, 2138, 2020, 1787, 79, 263, 289,
+            313, 2219, 216, 1856, 84, 107, 1775, 1698, 88, 230, 1722, 235,
+            200, 1635, 1611, 244, 274, 206, 1904, 2447, 139, 52, 1602, 122,
+            196, 255, 175, 2281, 1766, 119, 48, 285, 1743, 131, 148, 1754,
+            2294, 121, 213, 280, 204, 48, 182, 1742, 225, 2348, 199, 2027,
+            309, 155, 231, 1679, 2271, 266, 60, 240, 192, 184, 2149, 243,
+            1745, 72, 71, 187, 299, 13, 228, 177, 1809, 1876, 24, 256,
+            261, 162, 2030, 1613, 73, 183, 173, 2409, 2453, 75, 2273, 1676,
+            281, 287, 1699, 308, 278, 230, 124, 1875, 274, 2226, 1898, 202,
+            200, 245, 1780, 126, 2083, 173, 251, 170, 245, 307, 113, 2084,
+            71, 169, 209, 1963, 2366, 255, 109, 27, 260, 200, 2216, 131,
+            262, 1649, 1708, 304, 299, 2027, 305, 2270, 263, 293, 205, 246,
+            1622, 125, 1676, 79, 225, 83, 101, 149, 280, 307, 1979, 1715,
+            215, 1951, 158, 2284, 1643, 89, 1812, 2149, 2007, 114, 314, 275,
+            1622, 2143, 239, 189, 2008, 108, 2144, 74, 167, 2417, 295, 83,
+            28, 239, 206, 279, 229, 290, 313, 222, 293, 179, 1952, 1613,
+            168, 177, 66, 87, 269, 85, 2028, 319, 2160, 173, 1886, 2229,
+            279, 313, 1775, 1953, 2308, 202, 84, 1907, 146, 1978, 84, 212,
+            144, 261, 209, 258, 2172, 222, 218, 36, 305, 172, 95, 148,
+            161, 223, 266, 38, 245, 196, 295, 241, 1635, 214, 123, 2105,
+            288, 1687, 253, 107, 1896, 73, 297, 1830, 31, 274, 230, 219,
+            186, 2228, 289, 1809, 314, 201, 2162, 246, 178, 2270, 2282, 185,
+            252, 2322, 202, 200, 1612, 95, 242, 234, 244, 26, 174, 221,
+            18, 1897, 99, 253, 259, 97, 185, 72, 215, 259, 2102, 307,
+            213, 1612, 127, 292, 294, 175, 280, 321, 2293, 2423, 2073, 204,
+            143, 273, 177, 215, 313, 180, 148, 210, 53, 159, 11, 1830,
+            119, 136, 298, 133, 189, 35, 280, 1604, 181, 100, 313, 322,
+            295, 208, 72, 1951, 1764, 204, 202, 2272, 209, 224, 1753, 1809,
+            170, 182, 285, 1943, 298, 156, 305, 191, 295, 1687, 2139, 2063,
+            133, 25, 299, 270, 265, 158, 1888, 222, 272, 1913, 225, 85,
+            1601, 72, 307, 218, 1787, 254, 234, 49, 296, 241, 293, 200,
+            310, 186, 1757, 1681, 1829, 1876, 2215, 2366, 76, 191, 305, 107,
+            71, 201, 1745, 26, 2047, 265, 285, 24, 192, 308, 2207, 231,
+            2139, 1971, 171, 2149, 122, 2018, 271, 187, 187, 178, 319, 239,
+            50, 1941, 16, 194, 41, 214, 1764, 255, 249, 2204, 222, 133,
+            217, 217, 172, 25, 76, 213, 287, 262, 51, 27, 23, 1898,
+            35, 258, 177, 2405, 247, 72, 260, 2440, 225, 87, 270, 170,
+            96, 258, 104, 197, 2008, 233, 261, 2225, 282, 143, 293, 126,
+            98, 2076, 2138, 209, 268, 2084, 1808, 261, 144, 2038, 182, 293,
+            241, 2085, 247, 2358, 214, 125, 39, 2424, 281, 73, 59, 216,
+            229, 1772, 147, 97, 200, 2275, 112, 302, 2243, 1821, 288, 167,
+            314, 2413, 121, 2036, 199, 13, 175, 316, 2169, 261, 24, 1957,
+            171, 85, 227, 85, 75, 87, 87, 1912, 2072, 271, 219, 75,
+            258, 252, 304, 2216, 1980, 143, 95, 243, 1753, 1823, 1687, 1972,
+            194, 201, 313, 109, 71, 197, 98, 35, 183, 1623, 2012, 277,
+            1745, 96, 268, 168, 197, 1622, 200, 319, 1697, 2159, 191, 98,
+            178, 2272, 170, 2139, 191, 2347, 2406, 1943, 175, 215, 79, 49,
+            108, 311, 181, 229, 2237, 320, 119, 219, 62, 183, 138, 2018,
+            208, 2206, 319, 182, 2273, 275, 2408, 224, 176, 1943, 198, 2255,
+            1907, 23, 284, 37, 211, 252, 2337, 276, 95, 268, 202, 244,
+            1838, 264, 192, 1666, 2140, 101, 36, 1649, 257, 2402, 253, 198,
+            61, 1886, 261, 2027, 259, 285, 321, 36, 185, 282, 198, 239,
+            252, 243, 100, 2017, 121, 96, 2432, 108, 1808, 230, 269, 236,
+            1941, 216, 196, 291, 1631, 210, 198, 184, 184, 62, 2160, 2150,
+            296, 2104, 84, 272, 1847, 63, 76, 197, 273, 71, 39, 312,
+            24, 107, 2037, 293, 36, 312, 47, 205, 60, 189, 47, 2021,
+            232, 313, 233, 194, 2349, 318, 132, 88, 61, 296, 2014, 2270,
+            304, 300, 273, 208, 286, 1829, 317, 205, 190, 38, 271, 198,
+            76, 247, 210, 1605, 247, 208, 2207, 102, 296, 247, 230, 222,
+            1622, 175, 2029, 1610, 35, 13, 308, 187, 195, 2051, 63, 39,
+            53, 59, 1708, 2359, 220, 263, 107, 2218, 174, 2403, 146, 193,
+            314, 237, 181, 120, 122, 196, 1970, 2007, 312, 319, 120, 286,
+            306, 193, 203, 171, 272, 229, 251, 160, 1810, 1961, 1832, 262,
+            1614, 107, 228, 303, 2338, 2083, 1808, 1838, 217, 1687, 1886, 177,
+            215, 48, 220, 1612, 229, 95, 2402, 179, 144, 275, 288, 253,
+            225, 170, 260, 1905, 1964, 96, 186, 252, 37, 2215, 267, 198,
+            2072, 1621, 2215, 267, 133, 155, 2371, 39, 23, 2169, 110, 13,
+            216, 177, 52, 135, 227, 1819, 209, 200, 213, 269, 144, 14,
+            320, 297, 192, 2272, 53, 47, 204, 1743, 99, 2413, 72, 214,
+            2027, 167, 206, 308, 204, 200, 177, 201, 1754, 178, 39, 2072,
+            1839, 317, 1897, 236, 50, 2283, 2317, 196, 212, 41, 2204, 240,
+            1774, 222, 1666, 23, 180, 187, 229, 1622, 230, 1780, 242, 159,
+            201, 196, 131, 132, 278, 2340, 1680, 145, 196, 286, 231, 191,
+            314, 1613, 283, 1782, 121, 2205, 2351, 1680, 1745, 217, 51, 2270,
+            315, 2425, 2217, 2221, 266, 287, 293, 167, 249, 278, 1986, 1820,
+            175, 271, 2367, 131, 274, 2423, 121, 2374, 26, 1831, 319, 284,
+            2381, 303, 231, 261, 314, 2282, 201, 242, 97, 1676, 114, 224,
+            2427, 75, 2413, 304, 96, 159, 25, 30, 262, 2424, 173, 156,
+            94, 23, 186, 156, 23, 205, 1701, 121, 232, 206, 2139, 281,
+            261, 2347, 2083, 97, 291, 284, 258, 245, 2084, 260, 257, 282,
+            2275, 235, 2074, 16, 229, 2008, 258, 16, 2031, 102, 95, 167,
+            285, 16, 265, 182, 179, 120, 14, 1812, 256, 79, 212, 280,
+            2017, 318, 1886, 1810, 169, 2162, 194, 23, 1788, 215, 195, 296,
+            230, 2104, 87, 319, 1625, 311, 50, 2029, 1878, 47, 2112, 240,
+            2358, 2406, 308, 189, 92, 83, 139, 59, 2164, 225, 1611, 2310,
+            2019, 35, 1943, 220, 1622, 37, 2150, 44, 230, 221, 225, 2152,
+            275, 111, 158, 49, 219, 2138, 1745, 15, 2337, 2340, 177, 167,
+            196, 2297, 207, 2006, 315, 168, 1874, 108, 1944, 249, 84, 1728,
+            1885, 121, 307, 2424, 144, 2407, 211, 227, 212, 290, 184, 109,
+            120, 137, 108, 207, 271, 247, 1887, 190, 306, 312, 1706, 222,
+            1886, 172, 1970, 290, 1952, 285, 1953, 95, 315, 290, 187, 287,
+            300, 87, 135, 274, 310, 289, 2207, 1622, 155, 2249, 95, 314,
+            247, 215, 1769, 170, 309, 275, 155, 229, 291, 262, 309, 1953,
+            145, 1820, 97, 213, 246, 220, 73, 260, 1610, 2072, 294, 2084,
+            260, 1813, 95, 101, 1821, 51, 240, 251, 299, 26, 199, 252,
+            319, 282, 66, 264, 234, 2189, 240, 2404, 1878, 160, 90, 228,
+            277, 189, 79, 220, 226, 1811, 2281, 2150, 1877, 109, 297, 36,
+            195, 224, 1742, 302, 200, 1677, 2083, 186, 303, 2300, 1773, 263,
+            47, 256, 318, 1633, 133, 217, 2284, 229, 186, 235, 251, 38,
+            228, 1773, 225, 2403, 299, 134, 2337, 136, 157, 2242, 267, 242,
+            237, 57, 148, 1655, 2215, 215, 1874, 206, 231, 269, 271, 143,
+            151, 2209, 249, 233, 170, 302, 1676, 264, 174, 1676, 20, 239,
+            1609, 309, 189, 2403, 179, 180, 1676, 301, 284, 2357, 317, 305,
+            219, 2008, 131, 313, 276, 190, 195, 289, 243, 143, 38, 230,
+            179, 271, 212, 196, 113, 2249, 1962, 284, 253, 1831, 289, 111,
+            224, 1679, 178, 156, 303, 87, 1755, 251, 273, 2234, 123, 1678,
+            296, 291, 143, 1942, 310, 2097, 314, 283, 265, 292, 53, 2293,
+            2442, 171, 23, 2235, 35, 1697, 2141, 208, 209, 96, 245, 50,
+            173, 240, 2357, 2073, 306, 25, 96, 71, 2238, 159, 185, 253,
+            224, 2286, 2413, 2270, 264, 297, 221, 2414, 2302, 312, 2217, 84,
+            1744, 120, 236, 1623, 275, 157, 49, 48, 247, 316, 89, 1753,
+            261, 2178, 39, 11, 71, 241, 208, 200, 310, 301, 271, 1896,
+            218, 283, 1830, 2432, 241, 293, 191, 300, 219, 268, 39, 1631,
+            1955, 266, 1906, 298, 2207, 134, 1745, 235, 318, 186, 136, 180,
+            2282, 276, 146, 226, 269, 245, 242, 1886, 318, 191, 1808, 2349,
+            1621, 1610, 317, 296, 180, 12, 2402, 269, 317, 1772, 1635, 241,
+            97, 144, 2440, 274, 262, 2360, 119, 187, 2414, 1941, 266, 193,
+            275, 169, 169, 179, 83, 1680, 263, 176, 181, 173, 313, 226,
+            178, 221, 172, 1942, 264, 2424, 195, 1611, 1747, 1744, 249, 2349,
+            314, 272, 208, 109, 311, 167, 1721, 1631, 257, 210, 307, 196,
+            315, 195, 248, 266, 300, 317, 286, 187, 36, 109, 232, 1650,
+            71, 158, 133, 83, 294, 95, 282, 238, 261, 26, 201, 25,
+            1886, 2083, 100, 215, 86, 74, 95, 260, 251, 2084, 2217, 121,
+            262, 2352, 2009, 1874, 2084, 226, 2414, 1634, 191, 2170, 1692, 245,
+            80, 1736, 289, 2191, 260, 256, 266, 71, 279, 302, 2414, 242,
+            156, 287, 1774, 1610, 232, 280, 2138, 225, 284, 2072, 313, 120,
+            95, 266, 2205, 202, 1971, 143, 2414, 1944, 108, 318, 192, 2348,
+            303, 249, 16, 185, 35, 128, 2270, 108, 42, 1633, 307, 38,
+            2234, 315, 277, 2150, 268, 61, 2216, 1755, 170, 1964, 157, 1641,
+            260, 123, 202, 321, 1819, 314, 208, 1765, 1921, 84, 265, 211,
+            239, 313, 110, 227, 239, 308, 155, 49, 132, 264, 1707, 199,
+            84, 1765, 156, 194, 284, 1940, 236, 25, 145, 1951, 190, 50,
+            209, 85, 233, 291, 264, 245, 240, 1611, 60, 1631, 237, 234,
+            91, 120, 2366, 320, 2217, 1744, 271, 27, 277, 1781, 307, 237,
+            302, 210, 312, 2336, 201, 12, 2036, 13, 144, 176, 144, 175,
+            255, 125, 60, 61, 284, 193, 259, 253, 131, 11, 237, 294,
+            173, 1986, 173, 2083, 1942, 251, 2072, 134, 174, 267, 267, 218,
+            101, 99, 215, 262, 193, 132, 242, 2102, 2369, 72, 1986, 186,
+            255, 84, 199, 125, 11, 1808, 322, 279, 215, 320, 193, 156,
+            181, 2308, 1611, 110, 303, 300, 281, 224, 1979, 172, 2176, 1952,
+            269, 315, 1763, 275, 187, 199, 222, 278, 2006, 60, 172, 293,
+            2404, 2403, 2300, 269, 271, 2074, 186, 50, 2153, 278, 87, 83,
+            1961, 205, 156, 249, 2216, 1640, 28, 189, 40, 177, 190, 11,
+            300, 2229, 286, 195, 2161, 292, 229, 2155, 287, 230, 1875, 271,
+            245, 301, 212, 220, 206, 316, 189, 2138, 223, 246, 136, 242,
+            295, 320, 14, 173, 1895, 278, 275, 229, 1768, 11, 2204, 1951,
+            1755, 1821, 88, 280, 83, 1899, 290, 314, 149, 1940, 297, 51,
+            2168, 120, 1846, 275, 17, 56, 272, 2176, 73, 131, 312, 304,
+            1677, 2103, 304, 111, 1609, 224, 1789, 24, 2154, 211, 194, 64,
+            1788, 177, 300, 67, 226, 226, 13, 1876, 2086, 222, 1743, 234,
+            95, 261, 255, 2271, 1743, 299, 18, 251, 318, 95, 179, 2083,
+            78, 284, 245, 260, 190, 2085, 260, 197, 223, 77, 159, 176,
+            300, 25, 217, 285, 271, 233, 217, 1875, 194, 2339, 210, 2209,
+            2075, 310, 127, 186, 1724, 240, 204, 2151, 2017, 184, 83, 303,
+            216, 182, 2242, 234, 2366, 2216, 213, 273, 196, 145, 307, 2206,
+            256, 72, 2338, 292, 1905, 192, 289, 36, 189, 194, 171, 55,
+            285, 132, 232, 2336, 121, 292, 213, 169, 52, 184, 16, 292,
+            1622, 215, 1632, 183, 1780, 230, 2009, 231, 2007, 183, 291, 168,
+            59, 2301, 235, 15, 2160, 1912, 316, 238, 258, 157, 172, 1772,
+            1679, 246, 269, 2028, 2374, 2045, 187, 2074, 271, 319, 316, 225,
+            73, 285, 314, 217, 174, 218, 19, 299, 2225, 280, 230, 178,
+            318, 2369, 171, 170, 237, 2270, 2425, 224, 254, 1641, 320, 180,
+            35, 177, 258, 86, 317, 287, 315, 200, 235, 1648, 2085, 125,
+            212, 1742, 1952, 1728, 235, 2169, 79, 14, 2149, 132, 251, 2073,
+            97, 2204, 96, 282, 1621, 233, 190, 2095, 87, 260, 109, 185,
+            221, 1878, 269, 179, 197, 246, 27, 2205, 99, 75, 240, 1697,
+            308, 180, 103, 266, 71, 189, 227, 258, 290, 48, 54, 301,
+            47, 2018, 233, 156, 2073, 1623, 2285, 2008, 86, 1746, 322, 276,
+            213, 315, 306, 1688, 215, 292, 2017, 222, 13, 170, 99, 184,
+            2007, 297, 267, 95, 313, 247, 1965, 265, 2138, 1942, 262, 2308,
+            216, 298, 2336, 144, 308, 143, 1723, 176, 2083, 144, 205, 296,
+            1912, 316, 1940, 1840, 2077, 136, 87, 238, 35, 295, 246, 297,
+            299, 295, 1875, 317, 143, 175, 280, 170, 310, 283, 2370, 2052,
+            260, 263, 60, 277, 52, 61, 226, 2367, 88, 298, 37, 167,
+            275, 313, 239, 192, 123, 2216, 1808, 2007, 264, 1613, 304, 1945,
+            50, 1691, 1633, 206, 2293, 261, 146, 223, 13, 269, 1823, 2312,
+            2340, 288, 298, 322, 284, 104, 1710, 320, 112, 1823, 2085, 1962,
+            2447, 321, 120, 322, 258, 288, 1941, 1753, 308, 2358, 2424, 262,
+            2083, 95, 232, 257, 253, 258, 2075, 71, 2227, 197, 243, 230,
+            2405, 24, 214, 279, 282, 206, 1905, 171, 1708, 35, 172, 2086,
+            97, 224, 1877, 262, 297, 179, 200, 197, 230, 216, 2088, 262,
+            265, 283, 2090, 1885, 2424, 16, 301, 22, 2168, 286, 24, 2432,
+            293, 1689, 220, 272, 193, 60, 200, 2021, 279, 19, 225, 107,
+            61, 2413, 1953, 196, 291, 288, 175, 1621, 132, 206, 224, 2404,
+            1838, 15, 2282, 1809, 2234, 320, 143, 115, 229, 247, 1904, 241,
+            32, 1756, 273, 292, 239, 2284, 119, 2017, 299, 291, 1868, 176,
+            250, 1688, 225, 2205, 191, 2281, 187, 216, 13, 322, 227, 145,
+            123, 219, 228, 191, 195, 62, 2403, 215, 1887, 183, 2225, 1743,
+            1640, 77, 2403, 119, 282, 199, 229, 2348, 2311, 283, 108, 1634,
+            276, 1889, 258, 201, 2028, 2117, 317, 236, 252, 294, 318, 1951,
+            182, 107, 125, 177, 38, 2342, 270, 2360, 2276, 290, 2383, 17,
+            182, 1610, 218, 2093, 2142, 318, 134, 146, 1697, 261, 2093, 167,
+            201, 265, 185, 2415, 255, 209, 2114, 2110, 227, 185, 257, 67,
+            294, 305, 253, 2152, 112, 275, 305, 215, 2283, 286, 318, 216,
+            1611, 2073, 285, 205, 17, 237, 250, 159, 39, 163, 216, 2168,
+            175, 2432, 264, 2209, 313, 2021, 175, 162, 226, 244, 1676, 1877,
+            2074, 85, 98, 249, 195, 2432, 120, 218, 314, 180, 319, 2235,
+            120, 37, 170, 132, 23, 290, 13, 312, 1655, 71, 278, 1830,
+            2010, 191, 279, 1825, 2020, 182, 158, 316, 214, 268, 194, 1954,
+            108, 2017, 61, 155, 2152, 2271, 292, 59, 85, 1763, 240, 182,
+            49, 258, 1952, 246, 184, 1632, 1838, 156, 24, 248, 1957, 131,
+            287, 290, 1755, 229, 232, 161, 149, 1810, 150, 2316, 1631, 314,
+            240, 214, 2160, 1832, 2138, 216, 2234, 155, 2229, 85, 66, 301,
+            195, 207, 12, 87, 144, 168, 298, 1993, 219, 1772, 2309, 303,
+            2368, 308, 1874, 168, 2295, 1880, 72, 245, 133, 2402, 2017, 1616,
+            235, 303, 2072, 297, 171, 2086, 196, 2140, 2338, 1749, 95, 270,
+            1874, 318, 73, 95, 260, 251, 2045, 185, 2085, 179, 35, 252,
+            230, 51, 260, 302, 2022, 181, 84, 1877, 1945, 1941, 228, 207,
+            99, 291, 2339, 38, 86, 100, 167, 311, 262, 2226, 136, 2183,
+            11, 227, 145, 1677, 2435, 38, 313, 223, 201, 60, 2072, 310,
+            275, 51, 307, 1996, 190, 2270, 1962, 210, 1919, 1636, 232, 1632,
+            2151, 2350, 232, 109, 1680, 72, 2407, 222, 312, 12, 133, 215,
+            23, 216, 1781, 181, 1756, 1688, 1878, 217, 207, 296, 116, 226,
+            28, 149, 60, 88, 1965, 1986, 1885, 207, 66, 206, 1765, 1813,
+            180, 286, 51, 1677, 207, 99, 1885, 50, 293, 321, 1961, 169,
+            2369, 2270, 2337, 2270, 1794, 2402, 49, 2416, 217, 86, 1753, 1676,
+            87, 180, 2336, 275, 59, 273, 297, 144, 243, 144, 242, 212,
+            175, 155, 248, 1641, 197, 303, 2006, 2007, 2449, 2236, 2244, 2104,
+            1839, 83, 2424, 2404, 77, 292, 47, 167, 289, 285, 147, 278,
+            62, 48, 222, 83, 107, 301, 206, 283, 221, 236, 1810, 2207,
+            50, 96, 1681, 252, 257, 282, 266, 2102, 61, 282, 1623, 260,
+            270, 15, 95, 1640, 1677, 1716, 2291, 258, 167, 1640, 254, 11,
+            2008, 299, 48, 2150, 89, 40, 293, 1940, 1940, 2177, 262, 227,
+            2282, 291, 234, 131, 81, 145, 252, 2020, 240, 2347, 245, 176,
+            187, 225, 2204, 1706, 112, 304, 196, 2245, 236, 242, 229, 172,
+            2169, 250, 230, 1615, 2242, 1613, 60, 198, 312, 308, 125, 207,
+            1607, 2078, 1744, 2403, 183, 2318, 185, 194, 223, 214, 211, 1615,
+            2029, 95, 1783, 71, 218, 120, 175, 132, 246, 286, 2139, 1821,
+            183, 1655, 185, 2274, 269, 62, 286, 120, 2407, 204, 303, 115,
+            2086, 1985, 1678, 239, 160, 243, 2103, 320, 1692, 2300, 1744, 261,
+            198, 292, 248, 236, 170, 144, 1602, 198, 301, 265, 288, 1745,
+            225, 50, 134, 198, 264, 1925, 24, 121, 276, 312, 186, 173,
+            182, 1954, 213, 260, 186, 287, 199, 262, 294, 1829, 71, 12,
+            2270, 161, 1905, 2271, 2316, 315, 158, 258, 2302, 87, 254, 322,
+            2215, 219, 2102, 310, 2094, 191, 1612, 221, 2073, 2075, 2085, 1764,
+            146, 2337, 1755, 245, 1721, 40, 97, 86, 198, 282, 1897, 180,
+            191, 131, 2404, 281, 183, 133, 238, 230, 198, 182, 59, 270,
+            2045, 155, 274, 24, 196, 111, 145, 321, 1886, 307, 1677, 235,
+            25, 2374, 266, 48, 298, 1961, 96, 230, 253, 318, 1610, 318,
+            122, 108, 2102, 1698, 2326, 14, 155, 1772, 217, 299, 2336, 1951,
+            2007, 302, 95, 247, 191, 2207, 1610, 144, 1895, 1624, 2270, 311,
+            309, 211, 123, 2097, 281, 293, 228, 231, 167, 31, 178, 220,
+            1820, 236, 224, 1767, 2085, 192, 36, 157, 223, 242, 2027, 59,
+            1631, 72, 2282, 158, 83, 60, 1742, 1608, 63, 219, 288, 124,
+            239, 63, 228, 48, 2177, 61, 290, 48, 2413, 2426, 180, 235,
+            158, 175, 122, 195, 302, 213, 172, 2271, 136, 240, 2423, 62,
+            2301, 1746, 184, 13, 24, 41, 282, 2415, 209, 216, 178, 312,
+            152, 2207, 1609, 74, 238, 250, 2402, 285, 119, 40, 1945, 1913,
+            202, 261, 1875, 137, 2140, 148, 97, 180, 270, 98, 282, 2094,
+            62, 275, 189, 223, 2072, 35, 1755, 48, 197, 2271, 197, 1832,
+            2425, 95, 233, 125, 260, 302, 260, 1973, 143, 48, 192, 1838,
+            218, 2402, 95, 316, 1895, 229, 121, 2085, 74, 241, 315, 86,
+            308, 250, 1742, 1896, 2072, 243, 2006, 139, 51, 156, 237, 1941,
+            180, 1746, 253, 302, 286, 271, 2086, 240, 1742, 25, 268, 247,
+            13, 1829, 184, 300, 281, 311, 283, 2053, 1942, 186, 2309, 15,
+            269, 175, 187, 2140, 171, 222, 2139, 269, 2455, 1714, 2184, 216,
+            158, 302, 132, 292, 181, 225, 186, 2149, 59, 2220, 195, 248,
+            76, 179, 2010, 1830, 2292, 114, 2037, 35, 225, 2052, 88, 2150,
+            2053, 2044, 302, 217, 1707, 149, 73, 156, 285, 203, 14, 1763,
+            109, 257, 237, 1943, 181, 223, 37, 190, 1708, 182, 299, 1754,
+            203, 1682, 275, 1874, 2225, 38, 2243, 2343, 294, 29, 1689, 271,
+            233, 215, 310, 1754, 270, 219, 237, 261, 1912, 204, 297, 2150,
+            1963, 242, 2204, 219, 209, 1874, 98, 204, 185, 291, 98, 291,
+            2094, 203, 221, 2079, 2428, 1688, 182, 306, 23, 181, 2096, 224,
+            147, 2006, 2095, 221, 1767, 313, 2226, 1941, 119, 1956, 159, 12,
+            217, 1831, 208, 206, 271, 40, 2413, 228, 246, 11, 302, 318,
+            231, 2008, 1606, 234, 203, 203, 1763, 277, 1676, 1878, 29, 1840,
+            2368, 2204, 2404, 76, 86, 311, 121, 229, 301, 1701, 1874, 2404,
+            224, 1953, 174, 60, 112, 47, 193, 1809, 295, 213, 215, 1840,
+            1680, 12, 254, 268, 181, 231, 2018, 273, 191, 1768, 279, 280,
+            297, 112, 239, 61, 169, 1699, 1812, 156, 241, 224, 176, 212,
+            255, 309, 174, 321, 293, 303, 2432, 64, 175, 11, 83, 48,
+            1830, 12, 2284, 2018, 218, 47, 2019, 290, 257, 168, 158, 226,
+            210, 303, 292, 2244, 293, 263, 196, 1952, 295, 290, 35, 2281,
+            56, 206, 2442, 1840, 276, 1753, 159, 249, 255, 277, 1839, 47,
+            1991, 316, 1606, 51, 249, 1763, 143, 297, 209, 187, 258, 2205,
+            234, 173, 1877, 18, 148, 199, 2106, 230, 281, 97, 296, 145,
+            36, 2077, 2165, 2160, 254, 2089, 259, 29, 224, 1614, 211, 1699,
+            190, 311, 2141, 319, 175, 1819, 277, 179, 255, 2442, 2216, 2161,
+            78, 288, 274, 199, 155, 190, 1991, 224, 157, 2208, 234, 61,
+            1952, 121, 242, 12, 316, 91, 277, 59, 2027, 2138, 2229, 1775,
+            2139, 2349, 1742, 93, 319, 278, 127, 258, 2036, 2383, 24, 37,
+            2243, 256, 50, 2271, 2040, 227, 296, 298, 38, 250, 234, 310,
+            1842, 2272, 1946, 229, 1912, 67, 86, 1677, 1840, 238, 2384, 2009,
+            274, 224, 1602, 1689, 295, 206, 36, 61, 245, 295, 1756, 1874,
+            24, 1676, 288, 206, 2008, 211, 315, 1676, 226, 1632, 220, 1808,
+            1874, 23, 2051, 1667, 61, 277, 40, 230, 240, 2242, 237, 233,
+            205, 237, 274, 194, 2405, 284, 12, 187, 1754, 2341, 41, 2084,
+            281, 278, 2225, 108, 28, 2160, 187, 2381, 147, 26, 1816, 2007,
+            175, 243, 139, 2006, 1810, 2119, 242, 245, 261, 269, 174, 322,
+            59, 2376, 52, 135, 2281, 236, 179, 225, 12, 265, 1676, 2074,
+            99, 261, 252, 224, 210, 256, 107, 2281, 316, 23, 252, 101,
+            261, 233, 184, 1658, 258, 1613, 87, 184, 1698, 232, 301, 11,
+            273, 1952, 66, 193, 2336, 2244, 317, 1746, 1940, 195, 1919, 27,
+            2403, 246, 23, 307, 227, 2441, 71, 2425, 1964, 280, 176, 240,
+            194, 182, 249, 250, 189, 2171, 1940, 178, 1781, 107, 1835, 192,
+            1888, 26, 1611, 190, 280, 255, 194, 269, 182, 1744, 1608, 2406,
+            236, 143, 1897, 1887, 209, 2271, 244, 71, 119, 2348, 283, 248,
+            110, 278, 150, 26, 208, 310, 243, 156, 2008, 2270, 112, 215,
+            1707, 197, 315, 1808, 146, 133, 14, 206, 247, 122, 296, 284,
+            1612, 300, 2007, 2141, 317, 2368, 132, 1839, 2204, 289, 174, 175,
+            157, 296, 322, 183, 285, 73, 267, 250, 1648, 230, 296, 2418,
+            321, 276, 218, 35, 1699, 2403, 180, 311, 202, 110, 2149, 1706,
+            59, 160, 1957, 251, 256, 193, 189, 255, 11, 309, 2030, 245,
+            272, 2243, 291, 2292, 85, 161, 51, 214, 314, 49, 210, 250,
+            204, 173, 182, 2106, 157, 1776, 221, 257, 1631, 257, 11, 168,
+            183, 198, 267, 224, 196, 1689, 272, 108, 202, 185, 1623, 319,
+            2097, 2160, 172, 1689, 2017, 225, 1821, 1766, 108, 306, 2143, 171,
+            2190, 306, 2226, 2351, 2208, 1742, 62, 268, 278, 167, 2403, 214,
+            272, 157, 2168, 232, 2139, 247, 217, 2169, 230, 226, 69, 2141,
+            95, 2006, 241, 2440, 116, 14, 1971, 303, 107, 2072, 36, 72,
+            2270, 85, 2339, 317, 2433, 1640, 25, 1645, 232, 2021, 2046, 2424,
+            121, 132, 2160, 268, 150, 1810, 87, 143, 26, 291, 212, 320,
+            1907, 1853, 111, 219, 12, 48, 286, 114, 295, 1808, 2168, 160,
+            291, 2340, 28, 275, 1887, 16, 212, 217, 205, 313, 1886, 180,
+            1760, 195, 2340, 1692, 53, 1963, 174, 2294, 126, 242, 191, 85,
+            78, 1914, 208, 1912, 300, 83, 320, 322, 215, 268, 174, 2139,
+            111, 301, 1913, 167, 1829, 16, 123, 2374, 36, 318, 2073, 204,
+            2273, 315, 298, 2140, 223, 198, 133, 51, 2086, 236, 313, 218,
+            100, 197, 288, 252, 282, 2349, 2072, 96, 233, 209, 296, 253,
+            2402, 2296, 47, 241, 176, 59, 2044, 135, 237, 2292, 311, 197,
+            287, 294, 315, 283, 2207, 253, 1680, 308, 1832, 67, 132, 267,
+            201, 193, 1895, 2286, 44, 1743, 235, 294, 292, 198, 196, 2338,
+            2336, 96, 191, 219, 235, 2255, 303, 47, 2163, 211, 1610, 193,
+            1951, 135, 2230, 172, 228, 2404, 206, 311, 206, 89, 235, 279,
+            2443, 263, 1637, 2018, 2347, 159, 62, 155, 1688, 1682, 312, 155,
+            204, 235, 1961, 300, 296, 241, 169, 171, 174, 238, 199, 2159,
+            14, 42, 286, 320, 60, 2368, 170, 2282, 121, 2336, 256, 2432,
+            110, 100, 1850, 2432, 155, 295, 2349, 173, 1952, 2227, 155, 23,
+            218, 2208, 2336, 1747, 2225, 238, 169, 319, 100, 144, 300, 1679,
+            242, 305, 99, 2367, 2342, 132, 289, 47, 2405, 31, 2204, 220,
+            205, 1634, 265, 50, 202, 199, 136, 1878, 294, 113, 302, 157,
+            2358, 1811, 2141, 2270, 1940, 300, 219, 71, 110, 2141, 277, 160,
+            53, 2272, 251, 2102, 2094, 169, 299, 316, 309, 251, 254, 234,
+            296, 192, 1613, 251, 86, 2006, 2006, 1809, 258, 224, 299, 1972,
+            1678, 1889, 275, 2168, 234, 2073, 2161, 51, 35, 2234, 2017, 1745,
+            190, 1846, 1623, 1961, 179, 77, 26, 23, 229, 2177, 170, 257,
+            245, 224, 192, 2250, 250, 55, 284, 2087, 26, 2008, 71, 2162,
+            247, 254, 183, 243, 84, 177, 148, 2215, 150, 214, 281, 14,
+            2366, 20, 233, 14, 281, 2076, 15, 157, 2225, 300, 2216, 296,
+            1610, 1812, 2222, 250, 1706, 218, 215, 2234, 200, 249, 169, 1714,
+            17, 1631, 313, 288, 1885, 219, 1746, 2291, 180, 287, 73, 48,
+            267, 288, 2030, 235, 249, 1772, 2273, 207, 264, 131, 107, 304,
+            291, 1721, 83, 173, 246, 292, 300, 244, 11, 230, 209, 313,
+            229, 134, 319, 226, 1773, 99, 155, 290, 256, 241, 39, 290,
+            1981, 232, 1981, 2434, 305, 285, 26, 2282, 272, 175, 158, 190,
+            252, 28, 95, 217, 73, 279, 234, 11, 244, 208, 2402, 255,
+            171, 240, 2072, 2093, 2084, 246, 2124, 312, 197, 233, 126, 2152,
+            184, 239, 260, 1743, 1773, 12, 62, 185, 35, 192, 209, 230,
+            266, 2219, 1755, 2007, 62, 143, 173, 2185, 2105, 245, 2453, 215,
+            302, 148, 1707, 183, 83, 1697, 2143, 231, 279, 298, 321, 1978,
+            1952, 212, 251, 1621, 316, 181, 185, 1951, 316, 195, 27, 1697,
+            270, 1963, 1895, 1611, 2149, 272, 320, 298, 134, 48, 2023, 283,
+            95, 2274, 224, 143, 174, 143, 109, 84, 49, 14, 2337, 115,
+            278, 2006, 68, 317, 131, 1781, 274, 2027, 249, 1830, 208, 2321,
+            74, 146, 240, 297, 1906, 248, 186, 211, 306, 85, 182, 1955,
+            86, 107, 1810, 300, 214, 1699, 300, 1951, 119, 217, 312, 1942,
+            148, 200, 55, 264, 35, 1753, 311, 77, 316, 272, 157, 90,
+            298, 239, 2235, 2374, 1687, 40, 148, 195, 306, 178, 143, 1898,
+            225, 184, 1906, 274, 182, 2357, 1809, 314, 1971, 186, 191, 2295,
+            75, 160, 214, 1819, 132, 201, 84, 101, 2300, 302, 213, 253,
+            173, 259, 2149, 99, 186, 255, 2073, 103, 2435, 193, 107, 305,
+            295, 259, 2083, 294, 269, 182, 209, 119, 1746, 171, 234, 258,
+            192, 320, 1772, 2006, 181, 84, 229, 2363, 2006, 98, 2205, 288,
+            211, 170, 314, 1839, 174, 12, 167, 2008, 209, 1958, 2270, 190,
+            120, 220, 110, 139, 48, 71, 311, 2006, 1601, 222, 182, 11,
+            202, 2432, 1693, 314, 1874, 174, 1742, 236, 286, 85, 2347, 293,
+            1642, 1764, 2170, 146, 264, 1661, 262, 322, 1809, 26, 1742, 2358,
+            184, 291, 237, 212, 1847, 134, 1809, 272, 270, 26, 2140, 143,
+            132, 210, 1974, 268, 2416, 289, 120, 1714, 2270, 315, 309, 220,
+            108, 1941, 88, 24, 49, 310, 223, 278, 84, 226, 182, 28,
+            288, 180, 220, 310, 265, 220, 195, 2227, 199, 279, 2083, 208,
+            123, 2337, 1978, 2432, 1955, 2387, 240, 1905, 1691, 2423, 2039, 171,
+            219, 1743, 179, 181, 312, 2215, 85, 1831, 173, 293, 135, 39,
+            196, 208, 219, 1689, 258, 2358, 124, 273, 155, 133, 245, 14,
+            194, 306, 41, 2073, 173, 281, 99, 50, 2405, 72, 100, 258,
+            2453, 245, 294, 2087, 101, 243, 1789, 2283, 1766, 132, 1698, 210,
+            60, 201, 224, 2374, 2151, 121, 297, 171, 283, 2403, 145, 14,
+            179, 61, 50, 158, 218, 2243, 280, 1942, 283, 1706, 37, 16,
+            2348, 2030, 232, 268, 30, 109, 1921, 108, 223, 317, 59, 2072,
+            305, 2149, 193, 2358, 276, 1962, 63, 1777, 276, 136, 178, 309,
+            11, 157, 273, 49, 319, 2006, 110, 145, 236, 1624, 1823, 317,
+            273, 177, 187, 60, 250, 255, 237, 2417, 155, 2260, 2205, 170,
+            1877, 2281, 1616, 146, 231, 2273, 217, 1821, 213, 311, 180, 312,
+            2348, 83, 320, 1604, 132, 2204, 2449, 228, 2208, 2102, 120, 144,
+            285, 295, 13, 287, 200, 312, 2207, 190, 316, 169, 249, 1743,
+            194, 1952, 262, 72, 101, 1764, 191, 108, 267, 1953, 218, 1676,
+            287, 2062, 179, 264, 87, 1742, 25, 1979, 83, 61, 2096, 11,
+            2283, 1904, 223, 282, 279, 173, 209, 242, 168, 1701, 320, 1940,
+            257, 2006, 233, 95, 193, 1985, 233, 174, 218, 95, 318, 204,
+            251, 1832, 2366, 289, 2084, 263, 182, 2006, 266, 172, 260, 1942,
+            169, 204, 298, 2045, 219, 260, 131, 1688, 174, 102, 108, 1940,
+            111, 59, 111, 1698, 256, 269, 2424, 309, 245, 86, 180, 2447,
+            1745, 263, 162, 1886, 239, 247, 2217, 1808, 2349, 1899, 1788, 119,
+            2347, 123, 309, 197, 28, 134, 2402, 14, 2367, 316, 96, 1838,
+            1679, 205, 2230, 2142, 73, 181, 155, 214, 223, 2369, 83, 227,
+            1640, 113, 177, 288, 199, 145, 35, 195, 205, 63, 2336, 2058,
+            316, 2361, 187, 36, 11, 2095, 2405, 54, 15, 208, 234, 2019,
+            1846, 11, 275, 66, 96, 1610, 2044, 238, 71, 167, 283, 1706,
+            88, 209, 131, 180, 248, 131, 38, 1914, 236, 156, 1621, 302,
+            1765, 263, 226, 200, 2006, 92, 230, 240, 2007, 2138, 170, 216,
+            109, 1895, 173, 1610, 1834, 2215, 229, 1941, 174, 275, 220, 223,
+            205, 301, 95, 13, 229, 189, 307, 18, 2083, 299, 197, 37,
+            304, 259, 2085, 252, 1810, 2072, 181, 199, 261, 97, 37, 210,
+            98, 270, 192, 205, 1951, 255, 206, 256, 35, 1875, 206, 2336,
+            1878, 64, 1889, 222, 2342, 235, 184, 235, 1930, 2218, 205, 37,
+            2144, 258, 2103, 2415, 287, 245, 78, 198, 77, 191, 322, 313,
+            235, 1727, 226, 234, 2359, 321, 198, 2302, 243, 183, 62, 239,
+            262, 74, 131, 1904, 38, 198, 198, 321, 235, 212, 73, 213,
+            302, 1954, 73, 283, 258, 37, 87, 1905, 198, 182, 178, 198,
+            143, 144, 1631, 1822, 25, 1822, 60, 77, 2008, 24, 1822, 1763,
+            51, 284, 1612, 216, 122, 1677, 192, 320, 290, 144, 1622, 298,
+            177, 234, 2336, 40, 238, 228, 212, 240, 186, 237, 74, 124,
+            2017, 1650, 1985, 95, 175, 2076, 211, 1689, 246, 53, 222, 231,
+            257, 1853, 2037, 16, 1706, 2271, 215, 201, 1964, 145, 1814, 321,
+            1679, 189, 254, 215, 1755, 2402, 299, 11, 319, 231, 185, 277,
+            2242, 1821, 83, 158, 190, 155, 1946, 67, 177, 2142, 279, 1687,
+            316, 260, 78, 256, 254, 1820, 2096, 1875, 175, 2032, 290, 2104,
+            241, 255, 185, 252, 15, 170, 306, 239, 60, 2159, 71, 183,
+            320, 86, 12, 298, 291, 170, 271, 2368, 250, 2234, 1611, 178,
+            250, 206, 316, 288, 210, 234, 1688, 1819, 237, 2140, 125, 2150,
+            2424, 235, 2415, 2337, 1940, 1677, 1985, 281, 301, 59, 262, 2303,
+            59, 272, 111, 237, 1709, 284, 51, 2376, 1781, 171, 47, 1895,
+            208, 108, 2022, 107, 178, 12, 159, 85, 167, 231, 2037, 291,
+            1631, 1632, 1764, 107, 194, 230, 234, 2434, 178, 109, 241, 272,
+            310, 2375, 2277, 157, 134, 312, 171, 2151, 176, 227, 2141, 225,
+            1611, 219, 220, 1947, 267, 2036, 2184, 118, 1821, 293, 193, 288,
+            124, 273, 2226, 217, 211, 1822, 2010, 18, 252, 178, 314, 1946,
+            50, 1895, 213, 1640, 284, 286, 48, 246, 174, 285, 224, 23,
+            244, 301, 1815, 60, 236, 1710, 309, 209, 170, 309, 2450, 1820,
+            2179, 1840, 260, 2418, 2359, 311, 1611, 266, 1878, 25, 318, 211,
+            313, 209, 254, 138, 181, 197, 297, 268, 74, 185, 282, 127,
+            256, 193, 185, 209, 2095, 2094, 156, 259, 243, 149, 182, 120,
+            83, 95, 1610, 312, 37, 283, 2018, 194, 249, 284, 183, 2271,
+            2216, 242, 98, 236, 14, 1874, 112, 201, 186, 2164, 64, 271,
+            35, 2281, 278, 71, 196, 119, 1876, 86, 180, 96, 134, 24,
+            316, 2019, 231, 213, 2316, 2426, 312, 211, 2283, 273, 184, 62,
+            200, 302, 169, 187, 2009, 1839, 278, 264, 1678, 2423, 250, 277,
+            55, 250, 1874, 1821, 1798, 1908, 68, 195, 75, 174, 107, 155,
+            2270, 237, 2159, 178, 50, 84, 35, 2210, 298, 309, 278, 2086,
+            208, 1623, 1952, 2413, 155, 155, 124, 191, 222, 23, 231, 287,
+            179, 195, 1972, 202, 112, 1605, 315, 2019, 2341, 1746, 120, 237,
+            260, 281, 317, 232, 121, 1978, 227, 297, 272, 313, 1811, 47,
+            1876, 1875, 204, 2159, 278, 310, 253, 1941, 222, 33, 251, 206,
+            179, 250, 1896, 1820, 232, 308, 266, 2159, 1643, 60, 197, 319,
+            281, 1941, 322, 2017, 2402, 223, 208, 123, 59, 145, 47, 14,
+            2104, 253, 120, 2072, 2073, 1743, 36, 208, 214, 225, 294, 298,
+            2204, 101, 238, 293, 311, 180, 209, 2273, 2075, 38, 36, 172,
+            242, 131, 299, 1963, 254, 12, 1767, 207, 291, 223, 1600, 216,
+            1811, 1981, 221, 1679, 171, 245, 194, 197, 2277, 241, 208, 2414,
+            2273, 189, 256, 47, 2274, 109, 300, 83, 2205, 12, 284, 257,
+            1706, 86, 236, 107, 147, 2020, 2036, 244, 219, 315, 212, 2217,
+            1819, 16, 1624, 305, 179, 220, 224, 193, 2271, 2339, 73, 76,
+            135, 25, 172, 270, 157, 87, 238, 275, 131, 236, 264, 195,
+            2348, 143, 179, 172, 206, 2037, 275, 178, 2433, 169, 2287, 2159,
+            76, 244, 135, 273, 306, 78, 159, 1887, 76, 2292, 35, 246,
+            2423, 2220, 220, 88, 194, 264, 1697, 247, 61, 2106, 250, 271,
+            1876, 48, 150, 248, 1819, 30, 157, 1631, 262, 2204, 310, 170,
+            158, 226, 60, 207, 192, 186, 35, 228, 1961, 207, 196, 253,
+            2111, 2093, 271, 76, 1615, 272, 177, 160, 196, 199, 221, 212,
+            12, 306, 72, 1707, 1743, 289, 318, 155, 2118, 276, 2079, 97,
+            302, 192, 207, 230, 213, 64, 2149, 1611, 290, 228, 1610, 1980,
+            300, 173, 2073, 35, 223, 2219, 48, 1689, 2423, 244, 183, 2094,
+            265, 1885, 1765, 145, 2291, 1951, 143, 182, 180, 309, 219, 280,
+            2140, 74, 2402, 207, 2038, 314, 2337, 183, 51, 257, 250, 1698,
+            227, 312, 135, 2413, 2387, 298, 170, 2293, 1722, 322, 1895, 270,
+            211, 313, 1624, 1888, 27, 48, 175, 2129, 38, 295, 294, 2244,
+            2436, 191, 207, 63, 2215, 111, 1961, 155, 1885, 2149, 184, 194,
+            2336, 183, 283, 240, 310, 1764, 291, 284, 2270, 295, 2349, 2087,
+            2052, 168, 41, 12, 288, 2292, 1787, 156, 242, 288, 276, 1874,
+            220, 215, 60, 168, 182, 122, 207, 1885, 237, 2169, 169, 121,
+            314, 1820, 201, 224, 2414, 221, 215, 1849, 301, 263, 168, 321,
+            174, 1965, 216, 285, 253, 204, 247, 205, 11, 40, 2028, 280,
+            313, 30, 176, 2215, 2236, 2104, 109, 207, 315, 2017, 306, 178,
+            270, 269, 2102, 2094, 283, 36, 2078, 172, 2103, 143, 1809, 64,
+            321, 291, 196, 258, 294, 218, 97, 2347, 2145, 221, 1641, 233,
+            272, 145, 96, 180, 282, 1621, 2007, 2283, 226, 1991, 222, 13,
+            214, 184, 297, 204, 61, 301, 2414, 318, 2413, 119, 298, 1622,
+            286, 273, 216, 133, 196, 237, 183, 1808, 231, 1676, 2341, 1888,
+            291, 2402, 2216, 15, 223, 137, 2217, 51, 48, 276, 243, 316,
+            62, 244, 131, 16, 246, 60, 319, 2375, 182, 1972, 288, 1951,
+            2414, 286, 156, 2027, 213, 71, 121, 217, 2171, 43, 155, 2159,
+            180, 256, 2141, 107, 25, 1622, 254, 1611, 2037, 321, 2336, 86,
+            155, 35, 307, 230, 83, 156, 108, 146, 246, 210, 148, 257,
+            1963, 2403, 2139, 298, 83, 250, 223, 204, 304, 172, 1808, 248,
+            2183, 281, 15, 1678, 279, 200, 1831, 2271, 1678, 2180, 66, 286,
+            285, 1876, 143, 88, 1942, 271, 266, 1812, 157, 60, 1679, 213,
+            84, 77, 304, 49, 2217, 175, 2336, 282, 1926, 1811, 1677, 132,
+            282, 260, 270, 279, 229, 235, 132, 2031, 206, 221, 1754, 185,
+            235, 177, 261, 201, 221, 1824, 179, 112, 128, 36, 1829, 290,
+            108, 43, 208, 1810, 214, 1753, 14, 234, 2374, 210, 248, 24,
+            284, 320, 258, 1676, 281, 226, 2102, 241, 238, 320, 1888, 290,
+            248, 222, 214, 1808, 39, 35, 172, 196, 12, 43, 210, 193,
+            119, 263, 210, 182, 1876, 305, 285, 186, 2270, 193, 292, 1853,
+            1742, 12, 216, 2190, 302, 2341, 295, 28, 268, 231, 1943, 2308,
+            95, 181, 1753, 172, 2292, 1830, 1610, 198, 24, 240, 225, 12,
+            2168, 85, 2144, 73, 168, 2392, 74, 1940, 133, 230, 2340, 200,
+            1839, 1953, 308, 291, 218, 80, 1687, 314, 186, 2458, 204, 217,
+            190, 1875, 226, 2159, 161, 108, 2036, 1847, 288, 2234, 47, 238,
+            278, 1830, 258, 2414, 246, 282, 1809, 1698, 1819, 2162, 291, 317,
+            211, 1963, 297, 2423, 2360, 204, 305, 2074, 205, 75, 272, 259,
+            2113, 1895, 2294, 161, 1715, 246, 294, 265, 252, 104, 270, 175,
+            219, 257, 2083, 214, 322, 257, 309, 221, 185, 197, 270, 252,
+            107, 255, 189, 84, 282, 262, 2149, 132, 87, 2338, 317, 306,
+            238, 2142, 107, 1699, 1733, 73, 268, 211, 158, 263, 279, 219,
+            241, 202, 195, 268, 13, 2093, 1898, 1793, 2138, 1689, 304, 196,
+            1874, 36, 237, 61, 269, 59, 138, 2040, 59, 2204, 121, 2404,
+            182, 2189, 1787, 1914, 1992, 72, 279, 2447, 2413, 2426, 200, 195,
+            1691, 2244, 310, 248, 241, 250, 285, 2047, 1679, 169, 160, 2292,
+            170, 1679, 182, 2441, 2284, 211, 1821, 224, 277, 2105, 23, 1756,
+            157, 121, 195, 2027, 224, 85, 1707, 181, 202, 1677, 2028, 311,
+            133, 2272, 2093, 192, 179, 155, 214, 35, 219, 1819, 256, 307,
+            2418, 244, 178, 132, 2406, 214, 61, 2149, 296, 305, 228, 200,
+            11, 180, 2336, 244, 220, 187, 52, 2020, 279, 194, 73, 64,
+            321, 1642, 234, 156, 72, 2274, 2309, 236, 245, 218, 281, 1919,
+            281, 305, 302, 214, 1972, 187, 252, 172, 83, 183, 212, 145,
+            173, 2286, 126, 245, 246, 259, 2093, 11, 251, 269, 47, 270,
+            252, 211, 205, 114, 257, 97, 172, 204, 273, 240, 200, 208,
+            173, 240, 148, 109, 209, 271, 265, 236, 2283, 194, 263, 189,
+            306, 136, 303, 177, 225, 313, 2433, 192, 1747, 273, 320, 305,
+            2051, 2138, 304, 121, 1829, 231, 267, 272, 302, 86, 170, 1656,
+            1694, 256, 2338, 1610, 317, 107, 2038, 248, 2296, 1650, 25, 306,
+            305, 37, 2143, 228, 287, 200, 1764, 109, 190, 27, 226, 126,
+            213, 2139, 236, 111, 311, 1820, 1809, 167, 1691, 230, 1757, 83,
+            1847, 250, 308, 2336, 102, 270, 221, 238, 175, 288, 236, 1811,
+            2366, 89, 49, 63, 36, 1896, 2149, 242, 181, 35, 237, 2402,
+            140, 126, 39, 108, 281, 181, 187, 1834, 177, 179, 144, 251,
+            1961, 2413, 1876, 182, 95, 158, 201, 181, 312, 135, 239, 2375,
+            191, 155, 193, 235, 2381, 193, 183, 234, 167, 2405, 184, 85,
+            295, 2204, 135, 297, 257, 265, 59, 201, 242, 72, 250, 212,
+            97, 132, 234, 180, 97, 254, 2093, 2111, 279, 174, 167, 240,
+            257, 41, 243, 254, 290, 2237, 256, 2128, 261, 1657, 189, 292,
+            289, 315, 193, 1964, 2336, 1951, 2150, 272, 1684, 157, 308, 313,
+            1614, 1744, 16, 110, 2435, 2140, 2309, 309, 309, 1831, 234, 1697,
+            274, 221, 287, 1829, 1973, 289, 107, 179, 131, 1714, 222, 265,
+            302, 222, 200, 113, 212, 119, 176, 120, 2163, 316, 279, 155,
+            1888, 2124, 85, 252, 314, 238, 155, 313, 24, 58, 1808, 2205,
+            1853, 1691, 2093, 226, 1953, 190, 1699, 1742, 2159, 2440, 2347, 1766,
+            2143, 2215, 2208, 160, 89, 232, 42, 1890, 161, 304, 2072, 227,
+            201, 320, 286, 172, 2225, 199, 244, 276, 1717, 1776, 197, 238,
+            260, 62, 125, 59, 1824, 247, 2405, 265, 302, 282, 1697, 258,
+            2161, 309, 313, 210, 2273, 36, 298, 1727, 133, 1721, 267, 206,
+            1745, 181, 220, 1896, 196, 95, 2139, 36, 54, 1833, 1614, 303,
+            1742, 167, 266, 1661, 217, 1701, 268, 204, 48, 1940, 206, 257,
+            26, 71, 257, 123, 215, 2256, 268, 245, 185, 314, 143, 2093,
+            256, 270, 276, 63, 274, 100, 263, 224, 208, 209, 146, 110,
+            293, 312, 109, 248, 74, 1754, 120, 1808, 1687, 85, 11, 173,
+            2286, 301, 244, 134, 322, 1962, 28, 1772, 176, 92, 1631, 320,
+            49, 2273, 314, 1962, 2447, 144, 193, 299, 2207, 296, 1788, 269,
+            306, 199, 205, 144, 286, 109, 1742, 1829, 280, 183, 266, 1874,
+            2418, 288, 177, 137, 2111, 50, 155, 1702, 2347, 256, 2275, 203,
+            304, 199, 2284, 184, 178, 236, 1612, 2413, 230, 265, 144, 239,
+            2227, 2357, 146, 2209, 143, 123, 199, 265, 234, 297, 135, 144,
+            2413, 2402, 1600, 267, 2172, 293, 1640, 187, 303, 140, 224, 185,
+            247, 71, 264, 276, 2235, 144, 1688, 199, 238, 211, 266, 140,
+            186, 315, 288, 210, 222, 38, 305, 2151, 186, 169, 299, 201,
+            1650, 2339, 264, 307, 1963, 193, 199, 2423, 120, 90, 2339, 2338,
+            2072, 217, 2348, 87, 262, 2072, 1692, 283, 179, 38, 205, 220,
+            171, 2424, 2179, 1744, 97, 1886, 2072, 236, 197, 258, 286, 83,
+            168, 232, 2073, 99, 84, 196, 99, 279, 1897, 227, 1682, 2044,
+            307, 103, 301, 228, 207, 173, 195, 2103, 1962, 2338, 298, 262,
+            275, 16, 242, 1642, 247, 149, 73, 145, 183, 2242, 250, 281,
+            2382, 2423, 1919, 47, 2216, 1631, 305, 52, 1846, 220, 290, 1709,
+            49, 1681, 2349, 185, 1678, 1905, 244, 2339, 56, 71, 48, 21,
+            302, 287, 50, 308, 2083, 266, 1651, 203, 1814, 294, 206, 226,
+            320, 316, 72, 38, 2311, 159, 191, 223, 192, 252, 278, 100,
+            262, 1715, 1679, 187, 312, 132, 2156, 180, 2086, 155, 246, 60,
+            1764, 228, 238, 158, 2020, 234, 248, 1944, 317, 71, 179, 191,
+            167, 2215, 227, 236, 235, 136, 320, 269, 275, 195, 302, 1732,
+            1899, 2405, 110, 144, 23, 205, 235, 2036, 2209, 2141, 1612, 18,
+            60, 237, 209, 1758, 297, 203, 77, 155, 187, 222, 1640, 50,
+            249, 59, 2073, 265, 308, 121, 111, 1748, 1632, 294, 181, 216,
+            2350, 1676, 260, 2440, 255, 47, 2096, 194, 122, 294, 2162, 314,
+            243, 282, 144, 2094, 149, 1820, 253, 2075, 2138, 221, 60, 266,
+            1942, 108, 276, 176, 262, 239, 158, 203, 226, 95, 231, 170,
+            315, 1722, 23, 2236, 238, 321, 2337, 177, 12, 42, 216, 2291,
+            229, 217, 60, 51, 2441, 278, 1965, 296, 243, 2139, 59, 318,
+            1942, 237, 13, 2260, 321, 239, 1624, 310, 229, 23, 241, 179,
+            212, 210, 74, 283, 260, 134, 240, 1819, 2336, 304, 317, 143,
+            1707, 53, 277, 2281, 2283, 182, 167, 40, 303, 138, 203, 204,
+            232, 317, 148, 2077, 181, 172, 318, 47, 66, 203, 203, 198,
+            248, 42, 2102, 131, 237, 1693, 2205, 2416, 226, 319, 23, 306,
+            112, 1763, 301, 203, 11, 2152, 146, 2017, 175, 2315, 1877, 245,
+            322, 155, 1780, 178, 167, 203, 315, 2338, 180, 195, 33, 196,
+            168, 2285, 208, 239, 175, 322, 178, 223, 230, 229, 59, 2225,
+            253, 1940, 288, 2366, 95, 71, 2216, 205, 190, 275, 2112, 276,
+            97, 114, 225, 224, 35, 191, 222, 183, 271, 173, 2142, 63,
+            47, 245, 221, 2271, 254, 213, 1624, 87, 270, 220, 216, 198,
+            274, 2250, 2283, 318, 259, 179, 15, 321, 23, 306, 173, 1610,
+            270, 239, 283, 203, 1895, 131, 198, 115, 2031, 1825, 1746, 122,
+            189, 2234, 198, 184, 2103, 301, 180, 1952, 203, 230, 1605, 61,
+            1812, 41, 155, 2087, 285, 2207, 174, 143, 113, 2085, 297, 219,
+            175, 2434, 1643, 1743, 182, 24, 182, 108, 198, 1603, 1829, 24,
+            307, 110, 265, 219, 296, 72, 1688, 202, 2140, 213, 181, 145,
+            234, 1610, 2164, 236, 285, 186, 223, 232, 183, 74, 92, 251,
+            107, 219, 167, 1808, 134, 109, 308, 131, 1698, 25, 53, 316,
+            1706, 311, 204, 229, 308, 2234, 122, 2218, 2274, 134, 171, 176,
+            249, 180, 119, 293, 295, 12, 231, 1794, 1697, 71, 2225, 2343,
+            273, 184, 2123, 315, 2194, 202, 1808, 1623, 249, 290, 1656, 177,
+            309, 207, 131, 29, 44, 226, 254, 72, 261, 2138, 263, 198,
+            226, 1742, 254, 169, 304, 2339, 197, 204, 294, 59, 270, 185,
+            221, 290, 1706, 282, 176, 258, 261, 172, 98, 64, 2027, 262,
+            256, 1896, 36, 258, 90, 75, 221, 201, 1839, 1641, 203, 193,
+            1941, 295, 97, 24, 277, 168, 289, 2095, 203, 2083, 144, 133,
+            86, 258, 286, 13, 178, 1633, 1809, 171, 143, 2072, 72, 2283,
+            225, 2204, 1953, 73, 84, 1846, 26, 230, 1699, 321, 2138, 84,
+            274, 78, 284, 291, 2205, 251, 301, 1829, 60, 234, 2018, 2225,
+            218, 2205, 1793, 131, 61, 1743, 309, 237, 1943, 1691, 248, 200,
+            203, 322, 316, 2336, 2219, 2007, 1764, 2336, 1602, 181, 1831, 274,
+            55, 1707, 37, 1943, 271, 312, 1926, 207, 167, 287, 119, 1972,
+            109, 265, 155, 1708, 222, 194, 1677, 203, 168, 108, 231, 36,
+            1683, 1772, 209, 20, 59, 257, 2308, 35, 260, 25, 157, 2458,
+            2402, 12, 74, 121, 35, 242, 197, 29, 277, 1773, 2168, 268,
+            85, 2138, 185, 132, 241, 54, 295, 1631, 243, 1627, 277, 2220,
+            2144, 2413, 253, 180, 221, 304, 2216, 312, 47, 313, 284, 254,
+            119, 95, 2357, 259, 273, 238, 252, 289, 219, 299, 257, 183,
+            260, 51, 2009, 253, 285, 95, 1830, 107, 248, 168, 1756, 109,
+            236, 144, 184, 2348, 1641, 11, 1615, 244, 1813, 298, 96, 109,
+            224, 59, 1744, 235, 192, 1914, 208, 134, 144, 108, 83, 1819,
+            281, 2285, 143, 2282, 36, 61, 1780, 71, 2161, 203, 171, 1793,
+            232, 122, 147, 225, 287, 301, 242, 146, 1980, 307, 298, 272,
+            192, 199, 121, 248, 247, 1841, 107, 1962, 89, 285, 1678, 304,
+            2019, 305, 1875, 268, 266, 210, 219, 246, 203, 246, 2205, 48,
+            2271, 36, 137, 2415, 167, 1819, 2295, 1677, 277, 2322, 311, 39,
+            2404, 196, 13, 206, 246, 215, 2292, 264, 208, 206, 183, 286,
+            74, 75, 314, 49, 1755, 222, 2105, 29, 183, 88, 2336, 61,
+            2163, 68, 187, 25, 2301, 281, 39, 315, 1687, 110, 2051, 2163,
+            244, 215, 1700, 62, 225, 227, 179, 252, 2027, 258, 2009, 170,
+            242, 192, 2426, 277, 204, 311, 101, 279, 24, 2046, 305, 233,
+            1904, 259, 221, 2337, 295, 185, 1808, 279, 301, 221, 238, 59,
+            15, 23, 299, 1623, 279, 1727, 103, 2404, 16, 1754, 1610, 291,
+            172, 297, 2382, 1942, 131, 99, 297, 1743, 2256, 168, 2361, 204,
+            174, 291, 176, 84, 216, 107, 204, 182, 226, 266, 39, 1772,
+            148, 176, 119, 1614, 291, 159, 1953, 1790, 250, 2216, 158, 180,
+            2349, 2189, 67, 146, 1833, 2141, 2218, 2292, 11, 2405, 62, 223,
+            186, 239, 197, 2300, 180, 1753, 265, 194, 1878, 297, 297, 2215,
+            280, 135, 202, 1898, 1787, 2272, 1742, 1876, 2375, 1889, 169, 2036,
+            2138, 2215, 268, 211, 1964, 290, 1753, 1656, 273, 1747, 1766, 108,
+            247, 76, 156, 302, 2406, 122, 2342, 254, 314, 98, 119, 1681,
+            212, 272, 2204, 24, 226, 113, 1809, 319, 184, 317, 290, 273,
+            285, 1846, 187, 315, 264, 195, 219, 162, 2309, 189, 71, 155,
+            47, 309, 262, 255, 174, 306, 2347, 2426, 2117, 275, 228, 302,
+            1621, 2113, 304, 202, 75, 2453, 1754, 1745, 1821, 145, 133, 76,
+            300, 228, 2074, 270, 139, 104, 308, 259, 221, 1754, 1744, 74,
+            2007, 183, 193, 257, 227, 86, 279, 1721, 191, 266, 2073, 233,
+            81, 2403, 1876, 221, 2027, 303, 224, 11, 316, 2140, 226, 26,
+            158, 2033, 229, 2208, 66, 103, 2149, 170, 11, 214, 2407, 2273,
+            235, 2018, 261, 47, 298, 1700, 2028, 223, 11, 299, 208, 199,
+            54, 300, 249, 2270, 76, 211, 174, 2152, 179, 33, 133, 119,
+            248, 190, 2402, 181, 2231, 251, 120, 2151, 1666, 1810, 84, 236,
+            294, 185, 321, 76, 28, 248, 320, 244, 1853, 156, 220, 2273,
+            2010, 189, 177, 107, 169, 1767, 300, 235, 144, 11, 189, 1942,
+            52, 223, 206, 2159, 2020, 278, 1921, 47, 25, 64, 1617, 2044,
+            83, 84, 316, 12, 304, 123, 267, 2172, 2366, 200, 53, 2029,
+            1775, 244, 2083, 218, 181, 208, 1641, 244, 145, 35, 241, 2274,
+            1698, 2285, 2051, 88, 1616, 300, 1940, 2020, 185, 11, 2161, 224,
+            256, 227, 2301, 2023, 173, 220, 2413, 84, 133, 173, 111, 192,
+            84, 260, 100, 2088, 251, 187, 131, 238, 1838, 2073, 99, 1879,
+            1815, 201, 203, 2375, 1962, 259, 254, 137, 85, 171, 256, 1954,
+            201, 73, 1706, 95, 1642, 28, 21, 1744, 2281, 2234, 272, 2170,
+            210, 268, 143, 30, 1611, 196, 59, 268, 321, 78, 255, 1886,
+            189, 178, 308, 1688, 305, 245, 222, 272, 232, 1940, 2336, 189,
+            1980, 189, 268, 222, 209, 98, 157, 302, 172, 315, 2348, 220,
+            295, 226, 184, 299, 27, 159, 1879, 176, 26, 203, 222, 274,
+            145, 15, 108, 214, 195, 35, 206, 276, 270, 2348, 121, 16,
+            170, 15, 38, 1951, 110, 255, 176, 180, 313, 1848, 13, 192,
+            124, 294, 186, 216, 35, 2161, 190, 1887, 316, 203, 96, 1972,
+            1676, 2205, 120, 301, 238, 322, 201, 176, 110, 174, 316, 311,
+            269, 1624, 146, 277, 145, 267, 2110, 1743, 285, 180, 207, 1940,
+            287, 2151, 1831, 2337, 85, 307, 111, 2301, 193, 302, 234, 131,
+            72, 259, 2294, 181, 1808, 304, 259, 2074, 2215, 238, 253, 2083,
+            2080, 211, 136, 132, 2073, 2074, 123, 1832, 255, 225, 240, 195,
+            179, 2340, 2301, 71, 1886, 270, 72, 2149, 1904, 1810, 227, 101,
+            231, 59, 299, 147, 304, 198, 179, 219, 137, 186, 287, 311,
+            2010, 271, 320, 204, 1930, 2038, 267, 200, 72, 2138, 1985, 2387,
+            1614, 2176, 169, 247, 307, 248, 144, 27, 217, 228, 2239, 270,
+            1925, 2428, 213, 2176, 11, 48, 198, 149, 2425, 110, 311, 317,
+            2409, 2083, 236, 208, 290, 1745, 42, 1727, 2338, 297, 196, 249,
+            211, 196, 124, 276, 2149, 157, 1919, 273, 1757, 158, 292, 78,
+            186, 1689, 2094, 289, 1814, 24, 155, 38, 157, 2184, 86, 2271,
+            14, 315, 284, 1687, 266, 47, 36, 291, 64, 59, 97, 2179,
+            2140, 74, 186, 312, 273, 1809, 2009, 176, 2020, 2249, 2094, 199,
+            183, 220, 13, 216, 1679, 2205, 2095, 1831, 270, 194, 182, 244,
+            317, 206, 272, 210, 88, 269, 2218, 11, 236, 233, 51, 182,
+            2118, 263, 2037, 61, 305, 2242, 12, 27, 131, 258, 266, 40,
+            259, 2347, 98, 304, 2076, 126, 29, 121, 294, 297, 2075, 201,
+            1754, 2337, 1610, 306, 2084, 187, 231, 1689, 1854, 17, 202, 2073,
+            257, 171, 76, 1748, 269, 47, 111, 238, 1610, 2407, 1677, 249,
+            48, 40, 262, 318, 296, 2347, 1714, 257, 228, 248, 1819, 59,
+            56, 35, 1742, 1700, 64, 123, 291, 1648, 2366, 318, 47, 177,
+            98, 110, 298, 271, 121, 285, 2292, 1677, 206, 1840, 88, 145,
+            254, 213, 275, 11, 1688, 289, 185, 2432, 195, 13, 2338, 1657,
+            1839, 204, 232, 85, 300, 1810, 248, 104, 137, 2442, 2208, 2315,
+            1841, 298, 83, 276, 48, 2008, 157, 1812, 2019, 280, 183, 298,
+            2367, 167, 1940, 285, 234, 1876, 228, 281, 174, 307, 158, 27,
+            1819, 308, 156, 2019, 280, 285, 298, 196, 1764, 1615, 261, 313,
+            194, 243, 68, 143, 26, 27, 1824, 48, 289, 194, 246, 284,
+            175, 243, 37, 133, 215, 315, 295, 2150, 234, 239, 259, 241,
+            269, 219, 267, 63, 187, 255, 1946, 122, 1889, 2225, 51, 2351,
+            222, 146, 294, 294, 263, 113, 98, 253, 220, 2075, 2009, 237,
+            258, 196, 2094, 226, 2138, 292, 259, 282, 206, 317, 209, 175,
+            186, 279, 316, 151, 52, 296, 208, 213, 63, 225, 119, 254,
+            107, 2416, 73, 228, 2163, 212, 1610, 311, 192, 1610, 119, 318,
+            288, 178, 2413, 219, 1813, 317, 86, 2402, 222, 304, 274, 238,
+            319, 278, 86, 319, 267, 2296, 1709, 21, 1758, 1753, 120, 285,
+            60, 11, 204, 2205, 232, 61, 14, 218, 2028, 311, 122, 2149,
+            1819, 171, 2435, 134, 2149, 172, 2139, 2226, 1941, 138, 2357, 24,
+            48, 1780, 124, 1678, 1755, 1690, 12, 1765, 2417, 243, 249, 268,
+            11, 304, 182, 300, 1887, 143, 293, 2273, 2204, 217, 28, 119,
+            1970, 258, 216, 300, 205, 302, 1888, 2338, 39, 266, 261, 306,
+            2028, 290, 317, 2281, 1707, 173, 107, 291, 172, 2353, 189, 1874,
+            25, 244, 84, 124, 180, 313, 243, 275, 194, 278, 309, 2095,
+            2272, 236, 1766, 207, 207, 261, 192, 315, 1763, 23, 210, 75,
+            160, 47, 2088, 182, 155, 2083, 258, 177, 40, 1904, 245, 99,
+            36, 262, 2072, 97, 180, 257, 120, 145, 288, 139, 50, 100,
+            270, 100, 292, 175, 2076, 95, 2163, 1940, 242, 1853, 131, 159,
+            290, 280, 1809, 1754, 90, 1970, 1747, 311, 205, 1743, 168, 273,
+            12, 2155, 200, 265, 1953, 321, 243, 195, 50, 1612, 1875, 269,
+            212, 247, 302, 266, 267, 211, 145, 285, 38, 72, 127, 189,
+            24, 1848, 289, 2007, 1699, 2019, 11, 286, 294, 1833, 207, 276,
+            83, 171, 292, 1614, 202, 250, 217, 239, 2139, 213, 169, 220,
+            2150, 2228, 54, 2382, 174, 266, 1885, 83, 207, 1874, 36, 97,
+            225, 2337, 207, 206, 183, 16, 235, 263, 215, 284, 275, 190,
+            302, 66, 193, 1611, 211, 47, 207, 2418, 152, 2281, 266, 74,
+            222, 279, 111, 2017, 2048, 35, 1766, 271, 227, 84, 1941, 2018,
+            265, 2351, 73, 25, 1885, 1859, 110, 2337, 120, 100, 207, 301,
+            64, 189, 224, 207, 1756, 294, 225, 237, 231, 2205, 208, 195,
+            14, 275, 1687, 49, 2285, 209, 240, 321, 303, 239, 170, 2072,
+            2308, 251, 252, 2074, 1885, 1611, 2271, 294, 190, 1661, 123, 2270,
+            235, 1690, 258, 247, 300, 1610, 297, 2083, 229, 52, 293, 200,
+            1915, 314, 184, 2336, 15, 192, 2357, 239, 287, 224, 2359, 143,
+            1715, 1823, 262, 284, 2281, 85, 2338, 200, 131, 270, 1919, 235,
+            1942, 1814, 169, 249, 276, 107, 2256, 1877, 217, 176, 171, 235,
+            193, 18, 11, 192, 35, 1631, 1898, 1748, 61, 2169, 2367, 72,
+            2152, 241, 1774, 1904, 1854, 1940, 53, 13, 272, 262, 52, 174,
+            281, 278, 273, 87, 2149, 1714, 1956, 1687, 2338, 1698, 2347, 47,
+            264, 210, 206, 288, 259, 207, 285, 1941, 109, 15, 48, 194,
+            255, 248, 121, 147, 155, 214, 2271, 292, 2339, 1611, 134, 214,
+            25, 1811, 1688, 171, 1810, 265, 2348, 177, 273, 2118, 2413, 231,
+            1679, 24, 194, 175, 240, 312, 150, 89, 1678, 1722, 2405, 120,
+            233, 2274, 119, 1622, 173, 2426, 183, 262, 281, 59, 274, 1905,
+            85, 2073, 1756, 261, 98, 253, 300, 1942, 219, 137, 1604, 200,
+            63, 191, 97, 2072, 2093, 2075, 1644, 2375, 307, 38, 251, 38,
+            1748, 121, 1678, 236, 189, 168, 241, 308, 16, 315, 1743, 292,
+            316, 87, 27, 2272, 1780, 206, 255, 293, 216, 28, 54, 262,
+            1896, 2337, 289, 306, 170, 210, 89, 294, 268, 144, 301, 1819,
+            1813, 132, 1649, 2434, 1875, 177, 295, 189, 147, 2149, 197, 192,
+            72, 304, 181, 1809, 149, 15, 274, 275, 1980, 300, 1831, 280,
+            1951, 310, 2173, 175, 54, 223, 2105, 1912, 2440, 267, 167, 1623,
+            40, 256, 249, 247, 236, 1631, 303, 2017, 311, 23, 2027, 286,
+            184, 59, 2139, 2435, 212, 279, 2408, 2432, 2242, 196, 1611, 214,
+            51, 309, 228, 156, 65, 124, 96, 2225, 148, 2448, 178, 2343,
+            169, 1880, 292, 2235, 273, 60, 201, 73, 213, 1755, 1952, 71,
+            170, 277, 289, 215, 183, 2215, 51, 182, 276, 18, 144, 180,
+            236, 2404, 297, 1648, 2218, 282, 2293, 258, 170, 184, 145, 253,
+            254, 73, 202, 217, 1904, 49, 191, 185, 96, 282, 261, 99,
+            167, 2084, 2117, 221, 254, 313, 2337, 102, 222, 1943, 233, 1677,
+            284, 254, 178, 2413, 1661, 266, 286, 1887, 204, 2028, 251, 1655,
+            259, 194, 2138, 199, 1940, 136, 237, 1649, 1941, 182, 1875, 265,
+            30, 174, 284, 310, 62, 113, 108, 247, 135, 288, 2028, 209,
+            125, 2425, 298, 2292, 75, 319, 1683, 2149, 222, 2311, 293, 269,
+            1676, 1881, 1676, 300, 253, 1676, 272, 306, 169, 2272, 2444, 145,
+            85, 283, 23, 199, 319, 298, 291, 1859, 1763, 229, 283, 147,
+            252, 2423, 132, 175, 109, 192, 291, 224, 71, 1697, 237, 198,
+            1962, 1811, 219, 11, 276, 179, 245, 276, 191, 2138, 304, 2408,
+            276, 1782, 320, 191, 247, 194, 138, 147, 268, 198, 280, 113,
+            297, 1625, 316, 2336, 60, 268, 84, 297, 2339, 172, 2028, 1621,
+            2074, 1898, 2447, 2242, 110, 230, 318, 27, 219, 193, 195, 208,
+            1614, 303, 105, 2037, 176, 47, 256, 220, 131, 2350, 261, 1697,
+            2281, 244, 279, 226, 318, 253, 65, 100, 96, 2417, 233, 233,
+            2072, 23, 181, 221, 247, 99, 255, 2036, 1838, 123, 2291, 198,
+            17, 1978, 284, 24, 1748, 132, 1940, 272, 119, 176, 1612, 71,
+            1700, 147, 2138, 2215, 271, 290, 169, 1841, 110, 38, 1743, 37,
+            192, 1848, 1888, 37, 126, 222, 1891, 283, 2226, 280, 237, 176,
+            192, 2359, 159, 2281, 108, 1915, 208, 122, 2123, 156, 309, 12,
+            2291, 288, 186, 193, 102, 216, 187, 230, 134, 1680, 313, 132,
+            2207, 289, 1809, 15, 191, 250, 133, 242, 307, 2426, 14, 47,
+            1643, 84, 43, 1644, 146, 312, 286, 209, 183, 2072, 1854, 73,
+            2139, 53, 228, 2403, 2275, 197, 2152, 84, 256, 269, 235, 190,
+            280, 2029, 220, 267, 198, 1706, 1951, 242, 300, 1706, 50, 59,
+            2013, 133, 201, 1895, 1612, 2046, 194, 1944, 83, 1986, 2150, 217,
+            287, 37, 173, 168, 146, 210, 2336, 265, 1875, 201, 1764, 246,
+            49, 301, 2019, 284, 304, 2274, 274, 1880, 17, 1688, 224, 278,
+            1678, 131, 275, 245, 2105, 227, 2234, 224, 2427, 2447, 134, 2072,
+            126, 96, 1811, 91, 1606, 1904, 211, 1678, 322, 73, 71, 25,
+            208, 110, 295, 185, 278, 276, 96, 212, 221, 232, 1603, 206,
+            191, 1963, 52, 278, 120, 132, 297, 39, 169, 137, 312, 210,
+            1820, 190, 15, 277, 240, 311, 2376, 1970, 2171, 2402, 183, 228,
+            1753, 180, 310, 68, 213, 195, 273, 77, 280, 291, 133, 310,
+            1621, 97, 2404, 189, 49, 1830, 1759, 231, 194, 262, 2204, 308,
+            233, 1819, 1636, 264, 305, 236, 1640, 178, 201, 1642, 299, 305,
+            279, 308, 2413, 201, 1831, 1961, 2170, 311, 264, 212, 27, 65,
+            286, 2406, 2140, 172, 251, 248, 107, 2086, 277, 314, 2423, 1820,
+            177, 290, 284, 16, 169, 2012, 285, 147, 1677, 158, 244, 2038,
+            40, 1655, 71, 182, 2008, 263, 2218, 2338, 74, 208, 217, 309,
+            271, 1772, 276, 310, 88, 230, 219, 2088, 215, 1621, 2292, 268,
+            304, 74, 276, 27, 2149, 274, 289, 156, 169, 2007, 210, 1853,
+            226, 1634, 23, 1714, 133, 100, 320, 201, 1978, 2017, 197, 185,
+            2104, 233, 282, 143, 282, 1961, 1707, 245, 192, 197, 147, 144,
+            2145, 72, 1895, 284, 298, 157, 2358, 264, 96, 187, 187, 186,
+            224, 237, 179, 1650, 2139, 308, 2249, 227, 133, 242, 214, 297,
+            305, 1819, 23, 1757, 1764, 266, 254, 2291, 168, 302, 297, 2020,
+            214, 267, 1819, 1898, 1940, 271, 244, 313, 1961, 1809, 314, 62,
+            234, 305, 295, 190, 214, 238, 2096, 1678, 1697, 177, 194, 156,
+            275, 177, 184, 280, 169, 2347, 264, 220, 224, 226, 309, 51,
+            272, 206, 110, 273, 2215, 1745, 1945, 276, 1612, 2215, 1925, 1849,
+            135, 1811, 173, 55, 195, 1813, 288, 85, 2228, 1859, 211, 131,
+            23, 1962, 161, 47, 272, 220, 299, 119, 235, 275, 2178, 41,
+            1886, 72, 205, 2216, 294, 72, 1780, 1896, 311, 174, 167, 210,
+            169, 241, 1809, 218, 1864, 220, 147, 2112, 252, 59, 2271, 1780,
+            2074, 265, 316, 145, 48, 115, 17, 287, 2218, 254, 2357, 62,
+            216, 171, 2381, 13, 228, 194, 63, 259, 225, 2255, 177, 97,
+            254, 185, 196, 255, 2019, 105, 197, 2123, 2093, 11, 1644, 235,
+            2415, 268, 309, 168, 2183, 197, 172, 122, 252, 37, 240, 83,
+            143, 200, 2302, 259, 236, 206, 215, 1838, 83, 169, 173, 171,
+            107, 143, 291, 315, 2151, 307, 202, 306, 23, 194, 2021, 1748,
+            36, 37, 286, 1759, 1772, 266, 95, 322, 193, 178, 85, 304,
+            227, 280, 214, 242, 291, 83, 65, 170, 223, 245, 136, 287,
+            59, 279, 1757, 186, 2215, 1613, 271, 201, 1940, 175, 42, 134,
+            299, 210, 1831, 1874, 1763, 280, 37, 206, 280, 225, 295, 279,
+            1714, 1963, 191, 2285, 49, 285, 1888, 284, 279, 1721, 305, 182,
+            143, 2375, 249, 31, 232, 212, 23, 1611, 290, 1955, 2028, 1714,
+            17, 215, 1874, 2084, 1743, 248, 1864, 147, 2139, 212, 2294, 1945,
+            186, 168, 1962, 59, 206, 251, 2359, 231, 72, 1951, 1613, 156,
+            2037, 2270, 1612, 2154, 184, 1809, 190, 2336, 310, 2217, 256, 2010,
+            228, 209, 234, 1677, 223, 1757, 293, 110, 2207, 263, 114, 1876,
+            2110, 209, 107, 294, 253, 1886, 208, 97, 143, 227, 43, 242,
+            302, 259, 133, 287, 199, 126, 261, 1700, 246, 265, 276, 2281,
+            119, 218, 194, 263, 268, 288, 109, 213, 305, 1811, 230, 2366,
+            183, 2007, 2019, 1754, 74, 319, 148, 169, 2022, 2086, 167, 2272,
+            1688, 2217, 1897, 2226, 283, 1824, 249, 2308, 171, 267, 182, 2031,
+            2204, 322, 249, 318, 60, 266, 37, 199, 1811, 2349, 192, 2284,
+            1898, 295, 172, 304, 23, 2337, 145, 84, 60, 297, 108, 1865,
+            254, 1945, 1753, 187, 280, 2405, 2217, 86, 1940, 23, 1907, 65,
+            2403, 48, 1690, 1944, 1757, 229, 194, 181, 305, 17, 72, 96,
+            210, 49, 38, 155, 305, 133, 1632, 2348, 201, 280, 2007, 274,
+            1809, 65, 305, 1808, 193, 2408, 2308, 2008, 285, 1633, 228, 266,
+            75, 277, 1962, 2141, 199, 96, 1829, 228, 303, 126, 113, 315,
+            2162, 1764, 1809, 1611, 183, 317, 312, 213, 316, 276, 35, 274,
+            1875, 2217, 191, 1765, 316, 222, 244, 149, 169, 178, 2076, 218,
+            245, 26, 107, 95, 261, 233, 218, 53, 108, 2424, 125, 232,
+            194, 24, 252, 2413, 1612, 27, 237, 2338, 1888, 314, 1904, 239,
+            43, 183, 214, 214, 204, 312, 1809, 313, 27, 120, 284, 314,
+            27, 251, 258, 2308, 43, 17, 280, 91, 2337, 169, 159, 175,
+            297, 2350, 1612, 2402, 27, 194, 284, 1956, 184, 271, 119, 2236,
+            2273, 281, 2204, 98, 14, 23, 170, 1880, 276, 276, 1988, 223,
+            110, 39, 284, 292, 2414, 167, 1945, 312, 183, 196, 317, 2414,
+            202, 239, 1648, 201, 23, 305, 1744, 176, 147, 1655, 1622, 219,
+            292, 301, 62, 2402, 2300, 40, 269, 2217, 187, 264, 1612, 2414,
+            2205, 202, 182, 2326, 211, 1640, 312, 2349, 1840, 218, 234, 204,
+            1895, 276, 289, 2142, 2078, 1825, 228, 156, 2283, 124, 293, 122,
+            305, 203, 59, 291, 268, 260, 229, 287, 208, 48, 1773, 1655,
+            250, 214, 214, 146, 180, 59, 183, 233, 298, 76, 277, 1885,
+            213, 2208, 216, 1623, 196, 258, 156, 160, 219, 193, 29, 241,
+            210, 192, 2017, 248, 172, 121, 243
+        ])
+    even_xors_to_odd_xors_to_rank = {
+        4096: { 2048: 11, 1: 22, 2: 21, 4: 20,
+        8: 19, 2063: 1609, 16: 18, 2071: 3372,
+        2075: 3371, 2077: 3371, 2078: 3371, 31: 1608,
+        32: 17, 2087: 3368, 2091: 3367, 2093: 3367,
+        2094: 3367, 47: 1609, 2099: 3366, 2101: 3366,
+        2102: 3366, 55: 3527, 2105: 3366, 2106: 3366,
+        59: 3526, 2108: 3366, 61: 3526, 62: 1607,
+        64: 16, 2119: 3363, 2123: 3362, 2125: 3362,
+        2126: 3362, 79: 1609, 2131: 3361, 2133: 3361,
+        2134: 3361, 87: 3517, 2137: 3361, 2138: 3361,
+        91: 3516, 2140: 3361, 93: 3516, 94: 3516,
+        2147: 3360, 2149: 3360, 2150: 3360, 103: 3513,
+        2153: 3360, 2154: 3360, 107: 3512, 2156: 3360,
+        109: 3512, 110: 3512, 2161: 3360, 2162: 3360,
+        115: 3511, 2164: 3360, 117: 3511, 118: 3511,
+        2168: 3360, 121: 3511, 122: 3511, 124: 1606,
+        128: 15, 2183: 3357, 2187: 3356, 2189: 3356,
+        2190: 3356, 143: 1609, 2195: 3355, 2197: 3355,
+        2198: 3355, 151: 3502, 2201: 3355, 2202: 3355,
+        155: 3501, 2204: 3355, 157: 3501, 158: 3501,
+        2211: 3354, 2213: 3354, 2214: 3354, 167: 3498,
+        2217: 3354, 2218: 3354, 171: 3497, 2220: 3354,
+        173: 3497, 174: 3497, 2225: 3354, 2226: 3354,
+        179: 3496, 2228: 3354, 181: 3496, 182: 3496,
+        2232: 3354, 185: 3496, 186: 3496, 188: 3496,
+        2243: 3353, 2245: 3353, 2246: 3353, 199: 3493,
+        2249: 3353, 2250: 3353, 203: 3492, 2252: 3353,
+        205: 3492, 206: 3492, 2257: 3353, 2258: 3353,
+        211: 3491, 2260: 3353, 213: 3491, 214: 3491,
+        2264: 3353, 217: 3491, 218: 3491, 220: 3491,
+        2273: 3353, 2274: 3353, 227: 3490, 2276: 3353,
+        229: 3490, 230: 3490, 2280: 3353, 233: 3490,
+        234: 3490, 236: 3490, 2288: 3353, 241: 3490,
+        242: 3490, 244: 3490, 248: 1605, 256: 14,
+        2311: 3350, 2315: 3349, 2317: 3349, 2318: 3349,
+        271: 1609, 2323: 3348, 2325: 3348, 2326: 3348,
+        279: 3481, 2329: 3348, 2330: 3348, 283: 3480,
+        2332: 3348, 285: 3480, 286: 3480, 2339: 3347,
+        2341: 3347, 2342: 3347, 295: 3477, 2345: 3347,
+        2346: 3347, 299: 3476, 2348: 3347, 301: 3476,
+        302: 3476, 2353: 3347, 2354: 3347, 307: 3475,
+        2356: 3347, 309: 3475, 310: 3475, 2360: 3347,
+        313: 3475, 314: 3475, 316: 3475, 2371: 3346,
+        2373: 3346, 2374: 3346, 327: 3472, 2377: 3346,
+        2378: 3346, 331: 3471, 2380: 3346, 333: 3471,
+        334: 3471, 2385: 3346, 2386: 3346, 339: 3470,
+        2388: 3346, 341: 3470, 342: 3470, 2392: 3346,
+        345: 3470, 346: 3470, 348: 3470, 2401: 3346,
+        2402: 3346, 355: 3469, 2404: 3346, 357: 3469,
+        358: 3469, 2408: 3346, 361: 3469, 362: 3469,
+        364: 3469, 2416: 3346, 369: 3469, 370: 3469,
+        372: 3469, 376: 3469, 2435: 3345, 2437: 3345,
+        2438: 3345, 391: 3466, 2441: 3345, 2442: 3345,
+        395: 3465, 2444: 3345, 397: 3465, 398: 3465,
+        2449: 3345, 2450: 3345, 403: 3464, 2452: 3345,
+        405: 3464, 406: 3464, 2456: 3345, 409: 3464,
+        410: 3464, 412: 3464, 2465: 3345, 2466: 3345,
+        419: 3463, 2468: 3345, 421: 3463, 422: 3463,
+        2472: 3345, 425: 3463, 426: 3463, 428: 3463,
+        2480: 3345, 433: 3463, 434: 3463, 436: 3463,
+        440: 3463, 2497: 3345, 2498: 3345, 451: 3462,
+        2500: 3345, 453: 3462, 454: 3462, 2504: 3345,
+        457: 3462, 458: 3462, 460: 3462, 2512: 3345,
+        465: 3462, 466: 3462, 468: 3462, 472: 3462,
+        2528: 3345, 481: 3462, 482: 3462, 484: 3462,
+        488: 3462, 496: 1604, 512: 13, 2567: 3342,
+        2571: 3341, 2573: 3341, 2574: 3341, 527: 1609,
+        2579: 3340, 2581: 3340, 2582: 3340, 535: 3453,
+        2585: 3340, 2586: 3340, 539: 3452, 2588: 3340,
+        541: 3452, 542: 3452, 2595: 3339, 2597: 3339,
+        2598: 3339, 551: 3449, 2601: 3339, 2602: 3339,
+        555: 3448, 2604: 3339, 557: 3448, 558: 3448,
+        2609: 3339, 2610: 3339, 563: 3447, 2612: 3339,
+        565: 3447, 566: 3447, 2616: 3339, 569: 3447,
+        570: 3447, 572: 3447, 2627: 3338, 2629: 3338,
+        2630: 3338, 583: 3444, 2633: 3338, 2634: 3338,
+        587: 3443, 2636: 3338, 589: 3443, 590: 3443,
+        2641: 3338, 2642: 3338, 595: 3442, 2644: 3338,
+        597: 3442, 598: 3442, 2648: 3338, 601: 3442,
+        602: 3442, 604: 3442, 2657: 3338, 2658: 3338,
+        611: 3441, 2660: 3338, 613: 3441, 614: 3441,
+        2664: 3338, 617: 3441, 618: 3441, 620: 3441,
+        2672: 3338, 625: 3441, 626: 3441, 628: 3441,
+        632: 3441, 2691: 3337, 2693: 3337, 2694: 3337,
+        647: 3438, 2697: 3337, 2698: 3337, 651: 3437,
+        2700: 3337, 653: 3437, 654: 3437, 2705: 3337,
+        2706: 3337, 659: 3436, 2708: 3337, 661: 3436,
+        662: 3436, 2712: 3337, 665: 3436, 666: 3436,
+        668: 3436, 2721: 3337, 2722: 3337, 675: 3435,
+        2724: 3337, 677: 3435, 678: 3435, 2728: 3337,
+        681: 3435, 682: 3435, 684: 3435, 2736: 3337,
+        689: 3435, 690: 3435, 692: 3435, 696: 3435,
+        2753: 3337, 2754: 3337, 707: 3434, 2756: 3337,
+        709: 3434, 710: 3434, 2760: 3337, 713: 3434,
+        714: 3434, 716: 3434, 2768: 3337, 721: 3434,
+        722: 3434, 724: 3434, 728: 3434, 2784: 3337,
+        737: 3434, 738: 3434, 740: 3434, 744: 3434,
+        752: 3434, 2819: 3336, 2821: 3336, 2822: 3336,
+        775: 3431, 2825: 3336, 2826: 3336, 779: 3430,
+        2828: 3336, 781: 3430, 782: 3430, 2833: 3336,
+        2834: 3336, 787: 3429, 2836: 3336, 789: 3429,
+        790: 3429, 2840: 3336, 793: 3429, 794: 3429,
+        796: 3429, 2849: 3336, 2850: 3336, 803: 3428,
+        2852: 3336, 805: 3428, 806: 3428, 2856: 3336,
+        809: 3428, 810: 3428, 812: 3428, 2864: 3336,
+        817: 3428, 818: 3428, 820: 3428, 824: 3428,
+        2881: 3336, 2882: 3336, 835: 3427, 2884: 3336,
+        837: 3427, 838: 3427, 2888: 3336, 841: 3427,
+        842: 3427, 844: 3427, 2896: 3336, 849: 3427,
+        850: 3427, 852: 3427, 856: 3427, 2912: 3336,
+        865: 3427, 866: 3427, 868: 3427, 872: 3427,
+        880: 3427, 2945: 3336, 2946: 3336, 899: 3426,
+        2948: 3336, 901: 3426, 902: 3426, 2952: 3336,
+        905: 3426, 906: 3426, 908: 3426, 2960: 3336,
+        913: 3426, 914: 3426, 916: 3426, 920: 3426,
+        2976: 3336, 929: 3426, 930: 3426, 932: 3426,
+        936: 3426, 944: 3426, 3008: 3336, 961: 3426,
+        962: 3426, 964: 3426, 968: 3426, 976: 3426,
+        992: 1603, 1024: 12, 3079: 3333, 3083: 3332,
+        3085: 3332, 3086: 3332, 1039: 1609, 3091: 3331,
+        3093: 3331, 3094: 3331, 1047: 3417, 3097: 3331,
+        3098: 3331, 1051: 3416, 3100: 3331, 1053: 3416,
+        1054: 3416, 3107: 3330, 3109: 3330, 3110: 3330,
+        1063: 3413, 3113: 3330, 3114: 3330, 1067: 3412,
+        3116: 3330, 1069: 3412, 1070: 3412, 3121: 3330,
+        3122: 3330, 1075: 3411, 3124: 3330, 1077: 3411,
+        1078: 3411, 3128: 3330, 1081: 3411, 1082: 3411,
+        1084: 3411, 3139: 3329, 3141: 3329, 3142: 3329,
+        1095: 3408, 3145: 3329, 3146: 3329, 1099: 3407,
+        3148: 3329, 1101: 3407, 1102: 3407, 3153: 3329,
+        3154: 3329, 1107: 3406, 3156: 3329, 1109: 3406,
+        1110: 3406, 3160: 3329, 1113: 3406, 1114: 3406,
+        1116: 3406, 3169: 3329, 3170: 3329, 1123: 3405,
+        3172: 3329, 1125: 3405, 1126: 3405, 3176: 3329,
+        1129: 3405, 1130: 3405, 1132: 3405, 3184: 3329,
+        1137: 3405, 1138: 3405, 1140: 3405, 1144: 3405,
+        3203: 3328, 3205: 3328, 3206: 3328, 1159: 3402,
+        3209: 3328, 3210: 3328, 1163: 3401, 3212: 3328,
+        1165: 3401, 1166: 3401, 3217: 3328, 3218: 3328,
+        1171: 3400, 3220: 3328, 1173: 3400, 1174: 3400,
+        3224: 3328, 1177: 3400, 1178: 3400, 1180: 3400,
+        3233: 3328, 3234: 3328, 1187: 3399, 3236: 3328,
+        1189: 3399, 1190: 3399, 3240: 3328, 1193: 3399,
+        1194: 3399, 1196: 3399, 3248: 3328, 1201: 3399,
+        1202: 3399, 1204: 3399, 1208: 3399, 3265: 3328,
+        3266: 3328, 1219: 3398, 3268: 3328, 1221: 3398,
+        1222: 3398, 3272: 3328, 1225: 3398, 1226: 3398,
+        1228: 3398, 3280: 3328, 1233: 3398, 1234: 3398,
+        1236: 3398, 1240: 3398, 3296: 3328, 1249: 3398,
+        1250: 3398, 1252: 3398, 1256: 3398, 1264: 3398,
+        3331: 3327, 3333: 3327, 3334: 3327, 1287: 3395,
+        3337: 3327, 3338: 3327, 1291: 3394, 3340: 3327,
+        1293: 3394, 1294: 3394, 3345: 3327, 3346: 3327,
+        1299: 3393, 3348: 3327, 1301: 3393, 1302: 3393,
+        3352: 3327, 1305: 3393, 1306: 3393, 1308: 3393,
+        3361: 3327, 3362: 3327, 1315: 3392, 3364: 3327,
+        1317: 3392, 1318: 3392, 3368: 3327, 1321: 3392,
+        1322: 3392, 1324: 3392, 3376: 3327, 1329: 3392,
+        1330: 3392, 1332: 3392, 1336: 3392, 3393: 3327,
+        3394: 3327, 1347: 3391, 3396: 3327, 1349: 3391,
+        1350: 3391, 3400: 3327, 1353: 3391, 1354: 3391,
+        1356: 3391, 3408: 3327, 1361: 3391, 1362: 3391,
+        1364: 3391, 1368: 3391, 3424: 3327, 1377: 3391,
+        1378: 3391, 1380: 3391, 1384: 3391, 1392: 3391,
+        3457: 3327, 3458: 3327, 1411: 3390, 3460: 3327,
+        1413: 3390, 1414: 3390, 3464: 3327, 1417: 3390,
+        1418: 3390, 1420: 3390, 3472: 3327, 1425: 3390,
+        1426: 3390, 1428: 3390, 1432: 3390, 3488: 3327,
+        1441: 3390, 1442: 3390, 1444: 3390, 1448: 3390,
+        1456: 3390, 3520: 3327, 1473: 3390, 1474: 3390,
+        1476: 3390, 1480: 3390, 1488: 3390, 1504: 3390,
+        3587: 3326, 3589: 3326, 3590: 3326, 1543: 3387,
+        3593: 3326, 3594: 3326, 1547: 3386, 3596: 3326,
+        1549: 3386, 1550: 3386, 3601: 3326, 3602: 3326,
+        1555: 3385, 3604: 3326, 1557: 3385, 1558: 3385,
+        3608: 3326, 1561: 3385, 1562: 3385, 1564: 3385,
+        3617: 3326, 3618: 3326, 1571: 3384, 3620: 3326,
+        1573: 3384, 1574: 3384, 3624: 3326, 1577: 3384,
+        1578: 3384, 1580: 3384, 3632: 3326, 1585: 3384,
+        1586: 3384, 1588: 3384, 1592: 3384, 3649: 3326,
+        3650: 3326, 1603: 3383, 3652: 3326, 1605: 3383,
+        1606: 3383, 3656: 3326, 1609: 3383, 1610: 3383,
+        1612: 3383, 3664: 3326, 1617: 3383, 1618: 3383,
+        1620: 3383, 1624: 3383, 3680: 3326, 1633: 3383,
+        1634: 3383, 1636: 3383, 1640: 3383, 1648: 3383,
+        3713: 3326, 3714: 3326, 1667: 3382, 3716: 3326,
+        1669: 3382, 1670: 3382, 3720: 3326, 1673: 3382,
+        1674: 3382, 1676: 3382, 3728: 3326, 1681: 3382,
+        1682: 3382, 1684: 3382, 1688: 3382, 3744: 3326,
+        1697: 3382, 1698: 3382, 1700: 3382, 1704: 3382,
+        1712: 3382, 3776: 3326, 1729: 3382, 1730: 3382,
+        1732: 3382, 1736: 3382, 1744: 3382, 1760: 3382,
+        3841: 1600, 3842: 1600, 1795: 3381, 3844: 1600,
+        1797: 3381, 1798: 3381, 3848: 1600, 1801: 3381,
+        1802: 3381, 1804: 3381, 3856: 1600, 1809: 3381,
+        1810: 3381, 1812: 3381, 1816: 3381, 3872: 1600,
+        1825: 3381, 1826: 3381, 1828: 3381, 1832: 3381,
+        1840: 3381, 3904: 1600, 1857: 3381, 1858: 3381,
+        1860: 3381, 1864: 3381, 1872: 3381, 1888: 3381,
+        3968: 1600, 1921: 3381, 1922: 3381, 1924: 3381,
+        1928: 3381, 1936: 3381, 1952: 3381, 1984: 1602 },
+        1: { 2048: 156, 4096: 155, 2: 166, 4: 165,
+        8: 164, 6158: 1609, 16: 163, 4440: 5994,
+        6166: 5972, 6170: 5972, 6172: 5972, 4126: 1608,
+        32: 162, 4784: 5986, 6182: 5971, 6186: 5971,
+        6188: 5971, 2094: 6057, 6194: 5971, 6196: 5971,
+        2102: 6056, 6200: 5971, 2106: 6056, 4156: 6011,
+        62: 1607, 64: 161, 5472: 5977, 6214: 5970,
+        6218: 5970, 6220: 5970, 2402: 6039, 2126: 6053,
+        6226: 5970, 6228: 5970, 5134: 1609, 4182: 6007,
+        6232: 5970, 4452: 5994, 2138: 6052, 2140: 6052,
+        94: 1608, 6242: 5970, 6244: 5970, 2150: 6051,
+        6248: 5970, 4202: 6006, 2156: 6051, 110: 6167,
+        6256: 5970, 4456: 5994, 2162: 6051, 2164: 6051,
+        118: 6166, 2168: 6051, 122: 6166, 124: 1606,
+        128: 160, 5824: 5976, 3094: 6026, 6278: 5969,
+        6282: 5969, 6284: 5969, 4802: 5986, 2190: 6048,
+        6290: 5969, 6292: 5969, 4246: 6002, 6296: 5969,
+        4804: 5986, 4250: 6002, 2204: 6047, 5146: 5981,
+        158: 1608, 4464: 5994, 6306: 5969, 6308: 5969,
+        2214: 6046, 6312: 5969, 5148: 5981, 2218: 6046,
+        2220: 6046, 174: 6157, 6320: 5969, 4808: 5986,
+        2226: 6046, 2228: 6046, 2078: 1608, 182: 6156,
+        2232: 6046, 186: 6156, 188: 6156, 6338: 5969,
+        6340: 5969, 2246: 6045, 6344: 5969, 4298: 6000,
+        2252: 6045, 206: 6153, 6352: 5969, 2258: 6045,
+        2260: 6045, 214: 6152, 2264: 6045, 218: 6152,
+        220: 6152, 6368: 5969, 4816: 5986, 2274: 6045,
+        2276: 6045, 3110: 6025, 230: 6151, 2280: 6045,
+        234: 6151, 236: 6151, 2288: 6045, 242: 6151,
+        244: 6151, 248: 1605, 5162: 5980, 256: 159,
+        6406: 5968, 5164: 5980, 6410: 5968, 6412: 5968,
+        5506: 5977, 4366: 1609, 6418: 5968, 6420: 5968,
+        4142: 1609, 2326: 6041, 6424: 5968, 5508: 5977,
+        4378: 5996, 2332: 6041, 286: 1608, 6434: 5968,
+        6436: 5968, 4486: 5993, 2342: 6040, 6440: 5968,
+        2346: 6040, 2348: 6040, 5170: 5980, 302: 6142,
+        6448: 5968, 5512: 5977, 4402: 5995, 2356: 6040,
+        310: 6141, 2360: 6040, 5172: 5980, 314: 6141,
+        316: 6141, 4490: 5993, 4832: 5986, 6466: 5968,
+        6468: 5968, 4150: 6011, 2374: 6039, 6472: 5968,
+        4492: 5993, 4426: 5994, 2380: 6039, 334: 6138,
+        6480: 5968, 5176: 5980, 4434: 5994, 2388: 6039,
+        342: 6137, 2392: 6039, 346: 6137, 348: 6137,
+        4154: 6011, 6496: 5968, 5520: 5977, 4450: 5994,
+        2404: 6039, 358: 6136, 2408: 6039, 2108: 6056,
+        362: 6136, 364: 6136, 2450: 6038, 2416: 6039,
+        370: 6136, 372: 6136, 376: 6136, 4500: 5993,
+        6530: 5968, 6532: 5968, 2438: 6038, 6536: 5968,
+        2442: 6038, 2444: 6038, 398: 6133, 6544: 5968,
+        4504: 5993, 4498: 5993, 2452: 6038, 406: 6132,
+        2456: 6038, 410: 6132, 412: 6132, 6560: 5968,
+        2466: 6038, 2468: 6038, 5190: 5979, 422: 6131,
+        2472: 6038, 426: 6131, 428: 6131, 2480: 6038,
+        434: 6131, 436: 6131, 440: 6131, 3146: 6024,
+        6592: 5968, 5536: 5977, 2498: 6038, 2500: 6038,
+        454: 6130, 2504: 6038, 5196: 5979, 458: 6130,
+        460: 6130, 4514: 5993, 2512: 6038, 466: 6130,
+        468: 6130, 4174: 1609, 472: 6130, 4516: 5993,
+        2528: 6038, 482: 6130, 484: 6130, 488: 6130,
+        5202: 5979, 496: 1604, 4520: 5993, 5204: 5979,
+        512: 158, 2134: 6052, 6662: 5967, 6666: 5967,
+        6668: 5967, 5890: 5976, 4622: 1609, 5208: 5979,
+        6674: 5967, 6676: 5967, 2582: 6034, 6680: 5967,
+        5892: 5976, 2586: 6034, 2588: 6034, 4186: 6007,
+        542: 1608, 4528: 5993, 6690: 5967, 6692: 5967,
+        4870: 5985, 2598: 6033, 6696: 5967, 4188: 6007,
+        2602: 6033, 2604: 6033, 558: 6121, 6704: 5967,
+        5896: 5976, 2610: 6033, 2612: 6033, 566: 6120,
+        2616: 6033, 570: 6120, 572: 6120, 2826: 6030,
+        6722: 5967, 6724: 5967, 2630: 6032, 6728: 5967,
+        4876: 5985, 2634: 6032, 2636: 6032, 5218: 5979,
+        590: 6117, 6736: 5967, 4690: 5987, 2644: 6032,
+        598: 6116, 2648: 6032, 5220: 5979, 602: 6116,
+        604: 6116, 6752: 5967, 5904: 5976, 4706: 5987,
+        2660: 6032, 4198: 6006, 614: 6115, 2664: 6032,
+        618: 6115, 620: 6115, 4882: 5985, 2672: 6032,
+        5224: 5979, 626: 6115, 628: 6115, 632: 6115,
+        4884: 5985, 2154: 6051, 5568: 5977, 6786: 5967,
+        6788: 5967, 2694: 6031, 6792: 5967, 4204: 6006,
+        2698: 6031, 2700: 6031, 4546: 5993, 654: 6112,
+        6800: 5967, 4888: 5985, 2706: 6031, 2708: 6031,
+        662: 6111, 2712: 6031, 4548: 5993, 666: 6111,
+        668: 6111, 6816: 5967, 5232: 5979, 2722: 6031,
+        2724: 6031, 678: 6110, 2728: 6031, 682: 6110,
+        684: 6110, 4210: 6006, 2736: 6031, 4552: 5993,
+        690: 6110, 692: 6110, 696: 6110, 4212: 6006,
+        6848: 5967, 5920: 5976, 2754: 6031, 2756: 6031,
+        710: 6109, 2760: 6031, 714: 6109, 716: 6109,
+        4898: 5985, 2768: 6031, 4216: 6006, 722: 6109,
+        724: 6109, 728: 6109, 4900: 5985, 2784: 6031,
+        4560: 5993, 738: 6109, 740: 6109, 744: 6109,
+        752: 6109, 4904: 5985, 6914: 5967, 6916: 5967,
+        2822: 6030, 6920: 5967, 4874: 5985, 2828: 6030,
+        782: 6106, 6928: 5967, 2834: 6030, 2836: 6030,
+        790: 6105, 2840: 6030, 794: 6105, 796: 6105,
+        6944: 5967, 4912: 5985, 2850: 6030, 2852: 6030,
+        5254: 5978, 806: 6104, 2856: 6030, 810: 6104,
+        812: 6104, 2864: 6030, 818: 6104, 820: 6104,
+        824: 6104, 3210: 6023, 6976: 5967, 4576: 5993,
+        2882: 6030, 2884: 6030, 838: 6103, 2888: 6030,
+        5260: 5978, 842: 6103, 844: 6103, 2896: 6030,
+        850: 6103, 852: 6103, 4238: 1609, 856: 6103,
+        2912: 6030, 866: 6103, 868: 6103, 872: 6103,
+        3218: 6023, 880: 6103, 5268: 5978, 7040: 5967,
+        5952: 5976, 4994: 5985, 2948: 6030, 2198: 6047,
+        902: 6102, 2952: 6030, 906: 6102, 908: 6102,
+        4930: 5985, 2960: 6030, 5272: 5978, 914: 6102,
+        916: 6102, 920: 6102, 4932: 5985, 2202: 6047,
+        2976: 6030, 930: 6102, 932: 6102, 936: 6102,
+        4252: 6002, 944: 6102, 4936: 5985, 3008: 6030,
+        962: 6102, 964: 6102, 968: 6102, 5282: 5978,
+        976: 6102, 5284: 5978, 992: 1603, 4944: 5985,
+        4262: 6001, 5288: 5978, 4266: 6001, 1024: 157,
+        7174: 5966, 4268: 6001, 7178: 5966, 7180: 5966,
+        3086: 6027, 7186: 5966, 7188: 5966, 5142: 5981,
+        7192: 5966, 3098: 6026, 3100: 6026, 1054: 1608,
+        5296: 5978, 7202: 5966, 7204: 5966, 3590: 6021,
+        5158: 5980, 7208: 5966, 3114: 6025, 3116: 6025,
+        4274: 6001, 1070: 6093, 7216: 5966, 3122: 6025,
+        3124: 6025, 1078: 6092, 3128: 6025, 4276: 6001,
+        1082: 6092, 1084: 6092, 5642: 5976, 4960: 5985,
+        7234: 5966, 7236: 5966, 3142: 6024, 7240: 5966,
+        5644: 5976, 5194: 5979, 3148: 6024, 1102: 6089,
+        7248: 5966, 4280: 6001, 3154: 6024, 3156: 6024,
+        2574: 6035, 1110: 6088, 3160: 6024, 1114: 6088,
+        1116: 6088, 7264: 5966, 3170: 6024, 3172: 6024,
+        1126: 6087, 3176: 6024, 1130: 6087, 1132: 6087,
+        3602: 6021, 3184: 6024, 1138: 6087, 1140: 6087,
+        1144: 6087, 5652: 5976, 7298: 5966, 7300: 5966,
+        4630: 5989, 3206: 6023, 7304: 5966, 5258: 5978,
+        3212: 6023, 5314: 5978, 1166: 6084, 7312: 5966,
+        5656: 5976, 5266: 5978, 3220: 6023, 1174: 6083,
+        3224: 6023, 5316: 5978, 1178: 6083, 1180: 6083,
+        4634: 5989, 7328: 5966, 3234: 6023, 3236: 6023,
+        4294: 6000, 1190: 6082, 3240: 6023, 4636: 5989,
+        1194: 6082, 1196: 6082, 3248: 6023, 5320: 5978,
+        1202: 6082, 1204: 6082, 1208: 6082, 2250: 6045,
+        7360: 5966, 3266: 6023, 3268: 6023, 1222: 6081,
+        3272: 6023, 4300: 6000, 1226: 6081, 1228: 6081,
+        5666: 5976, 3280: 6023, 1234: 6081, 1236: 6081,
+        1240: 6081, 5668: 5976, 3296: 6023, 5328: 5978,
+        1250: 6081, 1252: 6081, 4646: 5988, 1256: 6081,
+        4306: 6000, 1264: 6081, 5672: 5976, 4308: 6000,
+        4650: 5988, 6016: 5976, 7426: 5966, 7428: 5966,
+        3334: 6022, 7432: 5966, 4652: 5988, 3338: 6022,
+        3340: 6022, 2946: 6030, 1294: 6078, 7440: 5966,
+        4312: 6000, 3346: 6022, 3348: 6022, 1302: 6077,
+        3352: 6022, 4996: 5985, 1306: 6077, 1308: 6077,
+        7456: 5966, 5680: 5976, 3362: 6022, 3364: 6022,
+        1318: 6076, 3368: 6022, 1322: 6076, 1324: 6076,
+        4658: 5988, 3376: 6022, 5000: 5985, 1330: 6076,
+        1332: 6076, 1336: 6076, 4660: 5988, 7488: 5966,
+        5344: 5978, 5442: 5977, 3396: 6022, 1350: 6075,
+        3400: 6022, 1354: 6075, 1356: 6075, 4322: 6000,
+        3408: 6022, 4664: 5988, 1362: 6075, 1364: 6075,
+        1368: 6075, 4324: 6000, 3424: 6022, 5008: 5985,
+        1378: 6075, 1380: 6075, 1384: 6075, 1392: 6075,
+        4328: 6000, 7552: 5966, 3458: 6022, 3460: 6022,
+        1414: 6074, 3464: 6022, 1418: 6074, 1420: 6074,
+        5698: 5976, 3472: 6022, 1426: 6074, 1428: 6074,
+        1432: 6074, 5700: 5976, 3488: 6022, 4336: 6000,
+        1442: 6074, 1444: 6074, 4678: 5987, 1448: 6074,
+        1456: 6074, 5704: 5976, 4682: 5987, 3520: 6022,
+        5024: 5985, 1474: 6074, 1476: 6074, 1480: 6074,
+        4684: 5987, 1488: 6074, 1504: 6074, 5712: 5976,
+        2642: 6032, 4692: 5987, 7682: 5966, 7684: 5966,
+        5638: 5976, 7688: 5966, 3594: 6021, 3596: 6021,
+        1550: 6071, 7696: 5966, 4696: 5987, 5650: 5976,
+        3604: 6021, 1558: 6070, 3608: 6021, 1562: 6070,
+        1564: 6070, 7712: 5966, 3618: 6021, 3620: 6021,
+        5382: 5977, 1574: 6069, 3624: 6021, 1578: 6069,
+        1580: 6069, 3632: 6021, 1586: 6069, 1588: 6069,
+        1592: 6069, 5386: 5977, 7744: 5966, 5728: 5976,
+        3650: 6021, 3652: 6021, 1606: 6068, 3656: 6021,
+        5388: 5977, 1610: 6068, 1612: 6068, 2658: 6032,
+        3664: 6021, 1618: 6068, 1620: 6068, 2318: 6042,
+        1624: 6068, 4708: 5987, 3680: 6021, 1634: 6068,
+        1636: 6068, 1640: 6068, 5394: 5977, 1648: 6068,
+        4712: 5987, 5396: 5977, 7808: 5966, 5056: 5985,
+        3714: 6021, 3716: 6021, 4374: 5996, 1670: 6067,
+        3720: 6021, 1674: 6067, 1676: 6067, 3728: 6021,
+        5400: 5977, 1682: 6067, 1684: 6067, 1688: 6067,
+        2330: 6041, 3744: 6021, 4720: 5987, 1698: 6067,
+        1700: 6067, 1704: 6067, 4380: 5996, 1712: 6067,
+        3776: 6021, 1730: 6067, 1732: 6067, 1736: 6067,
+        5410: 5977, 1744: 6067, 5412: 5977, 1760: 6067,
+        4390: 5995, 5416: 5977, 4394: 5995, 7936: 1600,
+        3842: 6021, 3844: 6021, 1798: 6066, 3848: 6021,
+        4396: 5995, 1802: 6066, 1804: 6066, 5762: 5976,
+        3856: 6021, 1810: 6066, 1812: 6066, 1816: 6066,
+        5764: 5976, 3872: 6021, 5424: 5977, 1826: 6066,
+        1828: 6066, 4742: 5986, 1832: 6066, 2354: 6040,
+        1840: 6066, 5768: 5976, 4404: 5995, 4746: 5986,
+        3904: 6021, 1858: 6066, 1860: 6066, 1864: 6066,
+        4748: 5986, 1872: 6066, 4408: 5995, 1888: 6066,
+        5776: 5976, 4754: 5986, 4756: 5986, 3968: 1601,
+        1922: 6066, 1924: 6066, 1928: 6066, 3394: 6022,
+        1936: 6066, 4760: 5986, 5444: 5977, 1952: 6066,
+        4422: 5994, 5448: 5977, 2378: 6039, 1984: 1602,
+        5792: 5976, 4428: 5994, 4770: 5986, 4772: 5986,
+        5456: 5977, 2386: 6039, 4776: 5986, 4436: 5994 },
+        2: { 2048: 144, 1: 154, 4: 153, 8: 152,
+        6157: 1609, 16: 151, 4440: 5774, 6165: 5752,
+        5388: 5757, 6169: 5752, 6172: 5752, 4125: 1608,
+        32: 150, 4784: 5766, 6181: 5751, 1024: 145,
+        6185: 5751, 6188: 5751, 2093: 5837, 6193: 5751,
+        6196: 5751, 2101: 5836, 6200: 5751, 4153: 5791,
+        2108: 1607, 61: 1607, 4912: 5765, 64: 149,
+        5472: 5757, 5224: 5759, 6213: 5750, 4449: 5774,
+        6217: 5750, 6220: 5750, 4173: 1609, 3085: 5807,
+        6225: 5750, 6228: 5750, 2133: 5832, 6232: 5750,
+        2137: 5832, 2140: 5832, 93: 1608, 6241: 5750,
+        4504: 5773, 6244: 5750, 2149: 5831, 6248: 5750,
+        2153: 5831, 2156: 5831, 109: 5947, 6256: 5750,
+        2161: 5831, 4300: 5780, 117: 5946, 2168: 5831,
+        121: 5946, 124: 1606, 5141: 5761, 128: 148,
+        5920: 5756, 6277: 5749, 4096: 143, 4801: 5766,
+        6281: 5749, 6284: 5749, 4237: 1609, 6289: 5749,
+        5320: 5758, 6292: 5749, 4245: 5782, 5145: 5761,
+        6296: 5749, 2201: 5827, 2204: 5827, 157: 1608,
+        6305: 5749, 6308: 5749, 2213: 5826, 6312: 5749,
+        2217: 5826, 2220: 5826, 173: 5937, 2077: 1608,
+        6320: 5749, 4273: 5781, 2228: 5826, 181: 5936,
+        2232: 5826, 185: 5936, 188: 1607, 6337: 5749,
+        6340: 5749, 2245: 5825, 6344: 5749, 4297: 5780,
+        2252: 5825, 205: 5933, 6352: 5749, 2257: 5825,
+        2260: 5825, 213: 5932, 2264: 5825, 217: 5932,
+        220: 5932, 5157: 5760, 6368: 5749, 2273: 5825,
+        2276: 5825, 229: 5931, 2280: 5825, 233: 5931,
+        236: 5931, 2288: 5825, 241: 5931, 244: 5931,
+        5161: 5760, 248: 1605, 256: 147, 6405: 5748,
+        5505: 5757, 6409: 5748, 6412: 5748, 4365: 1609,
+        4141: 1609, 6417: 5748, 5260: 5758, 6420: 5748,
+        2325: 5821, 6424: 5748, 2329: 5821, 2332: 5821,
+        285: 1608, 2437: 5818, 6433: 5748, 6436: 5748,
+        4389: 5775, 5169: 5760, 6440: 5748, 4393: 5775,
+        2348: 5820, 301: 5922, 6448: 5748, 2353: 5820,
+        2356: 5820, 309: 5921, 2441: 5818, 2360: 5820,
+        313: 5921, 316: 1607, 4149: 5791, 6465: 5748,
+        6468: 5748, 2373: 5819, 6472: 5748, 4425: 5774,
+        2380: 5819, 333: 5918, 6480: 5748, 4433: 5774,
+        2388: 5819, 341: 5917, 2105: 5836, 2392: 5819,
+        345: 5917, 348: 5917, 6496: 5748, 2401: 5819,
+        2404: 5819, 357: 5916, 4497: 5773, 2408: 5819,
+        361: 5916, 364: 5916, 2416: 5819, 369: 5916,
+        5536: 5757, 372: 5916, 376: 5916, 4500: 5773,
+        5400: 5757, 6529: 5748, 6532: 5748, 4485: 5773,
+        6536: 5748, 4489: 5773, 2444: 5818, 397: 5913,
+        5196: 5759, 2449: 5818, 2452: 5818, 405: 5912,
+        2456: 5818, 409: 5912, 412: 5912, 5189: 5759,
+        6560: 5748, 4513: 5773, 2468: 5818, 421: 5911,
+        2472: 5818, 425: 5911, 428: 5911, 2480: 5818,
+        433: 5911, 436: 5911, 3145: 5804, 440: 5911,
+        4720: 5767, 4652: 5768, 6592: 5748, 2497: 5818,
+        6016: 5756, 2500: 5818, 453: 5910, 2465: 5818,
+        2504: 5818, 457: 5910, 460: 5910, 2125: 5833,
+        2512: 5818, 465: 5910, 468: 5910, 472: 5910,
+        4516: 5773, 4312: 5780, 2528: 5818, 481: 5910,
+        484: 5910, 3153: 5804, 488: 5910, 4804: 5766,
+        496: 1604, 4520: 5773, 5204: 5759, 4204: 5786,
+        4181: 5787, 512: 146, 6661: 5747, 3841: 5801,
+        6665: 5747, 5568: 5757, 6668: 5747, 4621: 1609,
+        6673: 5747, 6676: 5747, 4629: 5769, 4185: 5787,
+        6680: 5747, 2585: 5814, 4996: 5765, 2588: 5814,
+        541: 1608, 4869: 5765, 6689: 5747, 6692: 5747,
+        4645: 5768, 6696: 5747, 2601: 5813, 2604: 5813,
+        557: 5901, 6704: 5747, 2609: 5813, 2612: 5813,
+        565: 5900, 4873: 5765, 2616: 5813, 569: 5900,
+        572: 1607, 5952: 5756, 6721: 5747, 6724: 5747,
+        2629: 5812, 3169: 5804, 6728: 5747, 2633: 5812,
+        2636: 5812, 589: 5897, 6736: 5747, 4689: 5767,
+        2644: 5812, 597: 5896, 5680: 5756, 2648: 5812,
+        601: 5896, 604: 5896, 4197: 5786, 6752: 5747,
+        2657: 5812, 2660: 5812, 613: 5895, 4881: 5765,
+        2664: 5812, 617: 5895, 620: 5895, 2672: 5812,
+        625: 5895, 628: 5895, 4201: 5786, 632: 5895,
+        4884: 5765, 5272: 5758, 6785: 5747, 6788: 5747,
+        4741: 5766, 4545: 5773, 6792: 5747, 2697: 5811,
+        2700: 5811, 653: 5892, 6800: 5747, 2705: 5811,
+        5000: 5765, 2708: 5811, 661: 5891, 2712: 5811,
+        665: 5891, 668: 5891, 6816: 5747, 4769: 5766,
+        2724: 5811, 677: 5890, 4209: 5786, 2728: 5811,
+        681: 5890, 684: 5890, 2736: 5811, 689: 5890,
+        692: 5890, 696: 5890, 2164: 5831, 6848: 5747,
+        2753: 5811, 2756: 5811, 709: 5889, 4548: 5773,
+        2849: 5810, 2760: 5811, 713: 5889, 716: 5889,
+        2768: 5811, 721: 5889, 724: 5889, 728: 5889,
+        4900: 5765, 2784: 5811, 737: 5889, 740: 5889,
+        744: 5889, 5344: 5758, 752: 5889, 4904: 5765,
+        5208: 5759, 6913: 5747, 6916: 5747, 2821: 5810,
+        6920: 5747, 2825: 5810, 2828: 5810, 781: 5886,
+        6928: 5747, 2833: 5810, 2836: 5810, 789: 5885,
+        2840: 5810, 793: 5885, 796: 5885, 5253: 5758,
+        6944: 5747, 4897: 5765, 2852: 5810, 805: 5884,
+        4664: 5768, 2856: 5810, 809: 5884, 812: 5884,
+        2864: 5810, 817: 5884, 4528: 5773, 820: 5884,
+        5892: 5756, 5257: 5758, 824: 5884, 5824: 5756,
+        6976: 5747, 4929: 5765, 2884: 5810, 837: 5883,
+        2888: 5810, 841: 5883, 844: 5883, 2189: 5828,
+        4188: 5787, 849: 5883, 852: 5883, 856: 5883,
+        2912: 5810, 865: 5883, 868: 5883, 5265: 5758,
+        872: 5883, 880: 5883, 4452: 5774, 5268: 5758,
+        2197: 5827, 7040: 5747, 2945: 5810, 5008: 5765,
+        2948: 5810, 901: 5882, 2881: 5810, 2952: 5810,
+        905: 5882, 908: 5882, 2960: 5810, 913: 5882,
+        916: 5882, 4249: 5782, 920: 5882, 4932: 5765,
+        2976: 5810, 929: 5882, 932: 5882, 936: 5882,
+        4252: 5782, 5896: 5756, 944: 5882, 4936: 5765,
+        4396: 5775, 3008: 5810, 961: 5882, 964: 5882,
+        5281: 5758, 968: 5882, 976: 5882, 5424: 5757,
+        5284: 5758, 4261: 5781, 992: 1603, 2896: 5810,
+        5148: 5761, 5288: 5758, 4265: 5781, 4944: 5765,
+        7173: 5746, 4876: 5765, 7177: 5746, 7180: 5746,
+        5133: 1609, 7185: 5746, 7188: 5746, 3093: 5806,
+        7192: 5746, 3097: 5806, 3100: 5806, 1053: 1608,
+        5637: 5756, 7201: 5746, 7204: 5746, 3109: 5805,
+        2225: 5826, 7208: 5746, 3113: 5805, 3116: 5805,
+        1069: 5873, 4576: 5773, 7216: 5746, 3121: 5805,
+        3124: 5805, 1077: 5872, 5641: 5756, 3128: 5805,
+        1081: 5872, 1084: 1607, 7233: 5746, 7236: 5746,
+        3141: 5804, 7240: 5746, 5193: 5759, 3148: 5804,
+        1101: 5869, 2573: 5815, 7248: 5746, 5201: 5759,
+        3156: 5804, 1109: 5868, 3160: 5804, 1113: 5868,
+        1116: 5868, 7264: 5746, 5217: 5759, 4464: 5774,
+        3172: 5804, 1125: 5867, 5649: 5756, 3176: 5804,
+        1129: 5867, 1132: 5867, 3184: 5804, 1137: 5867,
+        1140: 5867, 1144: 5867, 5652: 5756, 5176: 5760,
+        2581: 5814, 7297: 5746, 7300: 5746, 3205: 5803,
+        5313: 5758, 7304: 5746, 3209: 5803, 3212: 5803,
+        1165: 5864, 7312: 5746, 3217: 5803, 3220: 5803,
+        1173: 5863, 4633: 5769, 3224: 5803, 1177: 5863,
+        1180: 5863, 5904: 5756, 4293: 5780, 7328: 5746,
+        3233: 5803, 3236: 5803, 1189: 5862, 3240: 5803,
+        1193: 5862, 1196: 5862, 4336: 5780, 3248: 5803,
+        1201: 5862, 4268: 5781, 1204: 5862, 2249: 5825,
+        1208: 5862, 7360: 5746, 3265: 5803, 3268: 5803,
+        1221: 5861, 5665: 5756, 3272: 5803, 1225: 5861,
+        1228: 5861, 3280: 5803, 1233: 5861, 1236: 5861,
+        1240: 5861, 5668: 5756, 2597: 5813, 3296: 5803,
+        1249: 5861, 1252: 5861, 4305: 5780, 1256: 5861,
+        1264: 5861, 5672: 5756, 5232: 5759, 4649: 5768,
+        4308: 5780, 4816: 5766, 7425: 5746, 7428: 5746,
+        3333: 5802, 4993: 5765, 7432: 5746, 5385: 5757,
+        3340: 5802, 1293: 5858, 7440: 5746, 3345: 5802,
+        3348: 5802, 1301: 5857, 3352: 5802, 1305: 5857,
+        1308: 5857, 7456: 5746, 3361: 5802, 3364: 5802,
+        1317: 5856, 4657: 5768, 3368: 5802, 1321: 5856,
+        1324: 5856, 3376: 5802, 1329: 5856, 1332: 5856,
+        1336: 5856, 4660: 5768, 7488: 5746, 3393: 5802,
+        5328: 5758, 3396: 5802, 1349: 5855, 4808: 5766,
+        4321: 5780, 3400: 5802, 1353: 5855, 5296: 5758,
+        1356: 5855, 3408: 5802, 1361: 5855, 1364: 5855,
+        1368: 5855, 4324: 5780, 3424: 5802, 1377: 5855,
+        5024: 5765, 1380: 5855, 1384: 5855, 4960: 5765,
+        4888: 5765, 1392: 5855, 4328: 5780, 7552: 5746,
+        3457: 5802, 3460: 5802, 1413: 5854, 5697: 5756,
+        3464: 5802, 1417: 5854, 1420: 5854, 3472: 5802,
+        1425: 5854, 1428: 5854, 1432: 5854, 5700: 5756,
+        4677: 5767, 3488: 5802, 1441: 5854, 4276: 5781,
+        1444: 5854, 1448: 5854, 1456: 5854, 5704: 5756,
+        4681: 5767, 5056: 5765, 3520: 5802, 1473: 5854,
+        1476: 5854, 1480: 5854, 4684: 5767, 4456: 5774,
+        5164: 5760, 1488: 5854, 1504: 5854, 5712: 5756,
+        2641: 5812, 5220: 5759, 4692: 5767, 7681: 5746,
+        7684: 5746, 3589: 5801, 7688: 5746, 3593: 5801,
+        3596: 5801, 1549: 5851, 7696: 5746, 3601: 5801,
+        3604: 5801, 1557: 5850, 3608: 5801, 1561: 5850,
+        4280: 5781, 1564: 5850, 5644: 5756, 5381: 5757,
+        7712: 5746, 3617: 5801, 3620: 5801, 1573: 5849,
+        3624: 5801, 1577: 5849, 5508: 5757, 1580: 5849,
+        3632: 5801, 1585: 5849, 1588: 5849, 3337: 5802,
+        1592: 5849, 7744: 5746, 3649: 5801, 3652: 5801,
+        1605: 5848, 4705: 5767, 3656: 5801, 1609: 5848,
+        1612: 5848, 2317: 5822, 3664: 5801, 1617: 5848,
+        1620: 5848, 1624: 5848, 4708: 5767, 3680: 5801,
+        1633: 5848, 1636: 5848, 5393: 5757, 1640: 5848,
+        1648: 5848, 4712: 5767, 5396: 5757, 4552: 5773,
+        4373: 5776, 7808: 5746, 3713: 5801, 3716: 5801,
+        1669: 5847, 3720: 5801, 1673: 5847, 1676: 5847,
+        3728: 5801, 1681: 5847, 1684: 5847, 4377: 5776,
+        1688: 5847, 4216: 5786, 3744: 5801, 1697: 5847,
+        5512: 5757, 1700: 5847, 1704: 5847, 4380: 5776,
+        4212: 5786, 1712: 5847, 5172: 5760, 3776: 5801,
+        1729: 5847, 1732: 5847, 5409: 5757, 1736: 5847,
+        1744: 5847, 5412: 5757, 4832: 5766, 2341: 5820,
+        1760: 5847, 4696: 5767, 5416: 5757, 4560: 5773,
+        2345: 5820, 4492: 5773, 7936: 1600, 5889: 5756,
+        3844: 5801, 1797: 5846, 5761: 5756, 3848: 5801,
+        1801: 5846, 1804: 5846, 3856: 5801, 1809: 5846,
+        1812: 5846, 1816: 5846, 5764: 5756, 2693: 5811,
+        3872: 5801, 1825: 5846, 1828: 5846, 4401: 5775,
+        1832: 5846, 1840: 5846, 5768: 5756, 4745: 5766,
+        4404: 5775, 3904: 5801, 1857: 5846, 1860: 5846,
+        1864: 5846, 4748: 5766, 1872: 5846, 4408: 5775,
+        1888: 5846, 5776: 5756, 4753: 5766, 4756: 5766,
+        3968: 1601, 1921: 5846, 1924: 5846, 5656: 5756,
+        5441: 5757, 1928: 5846, 4156: 1607, 1936: 5846,
+        4760: 5766, 5520: 5757, 5444: 5757, 4421: 5774,
+        1952: 5846, 5316: 5758, 5448: 5757, 6544: 5748,
+        2377: 5819, 1984: 1602, 5792: 5756, 2721: 5811,
+        4428: 5774, 4772: 5766, 4636: 5769, 5456: 5757,
+        5728: 5756, 2385: 5819, 4776: 5766, 4436: 5774 },
+        3: { 3584: 3316, 2816: 3316, 5124: 3315, 5184: 3315,
+        4616: 3315, 2060: 3316, 6400: 3315, 2336: 3316,
+        1552: 3317, 2068: 3316, 2592: 3316, 1048: 3317,
+        772: 3318, 28: 1608, 1092: 3317, 4132: 3315,
+        4144: 3315, 2088: 3316, 3328: 3316, 4368: 3315,
+        44: 3322, 2320: 3316, 1072: 3317, 3080: 3316,
+        52: 3322, 2576: 3316, 56: 3322, 2184: 3316,
+        6148: 3315, 2116: 3316, 1120: 3317, 4164: 3315,
+        3088: 3316, 584: 3318, 1036: 3317, 76: 3321,
+        4384: 3315, 592: 3318, 84: 3321, 4416: 3315,
+        4640: 3315, 88: 3321, 1060: 3317, 608: 3318,
+        1296: 3317, 100: 3321, 5152: 3315, 104: 3321,
+        532: 3318, 112: 3321, 4624: 3315, 4116: 3315,
+        4232: 3315, 4256: 3315, 4672: 3315, 1044: 3317,
+        2084: 3316, 1664: 3317, 1216: 3317, 4228: 3315,
+        5136: 3315, 6176: 3315, 648: 3318, 140: 3320,
+        656: 3318, 4120: 3315, 148: 3320, 152: 3320,
+        4864: 3315, 7168: 3315, 672: 3318, 164: 3320,
+        1284: 3317, 168: 3320, 1540: 3317, 176: 3320,
+        5632: 3315, 704: 3318, 1312: 3317, 196: 3320,
+        2308: 3316, 552: 3318, 200: 3320, 2240: 3316,
+        2564: 3316, 208: 3320, 6656: 3315, 1064: 3317,
+        548: 3318, 3076: 3316, 224: 3320, 536: 3318,
+        4136: 3315, 4168: 3315, 1096: 3317, 1792: 3317,
+        1408: 3317, 4356: 3315, 1288: 3317, 2208: 3316,
+        268: 3319, 776: 3318, 784: 3318, 276: 3319,
+        2072: 3316, 280: 3319, 644: 3318, 800: 3318,
+        560: 3318, 292: 3319, 1544: 3317, 296: 3319,
+        2192: 3316, 3200: 3316, 304: 3319, 1160: 3317,
+        2312: 3316, 832: 3318, 4288: 3315, 324: 3319,
+        6160: 3315, 2568: 3316, 328: 3319, 4612: 3315,
+        336: 3319, 2432: 3316, 2688: 3316, 352: 3319,
+        1168: 3317, 4240: 3315, 5376: 3315, 6208: 3315,
+        4360: 3315, 524: 3318, 896: 3318, 1344: 3317,
+        388: 3319, 392: 3319, 2144: 3316, 3136: 3316,
+        400: 3319, 4480: 3315, 5128: 3315, 580: 3318,
+        4736: 3315, 416: 3319, 1156: 3317, 2128: 3316,
+        5248: 3315, 2120: 3316, 6152: 3315, 1600: 3317,
+        448: 3319, 1184: 3317, 2180: 3316, 4192: 3315,
+        6272: 3315, 2368: 3316, 2624: 3316, 1104: 3317,
+        3104: 3316, 2096: 3316, 4176: 3315, 4108: 1609,
+        1568: 3317 },
+        4: { 2048: 132, 1: 142, 2: 141, 8: 140,
+        6155: 1609, 16: 139, 4440: 5554, 6163: 5532,
+        6169: 5532, 6170: 5532, 2075: 1608, 5320: 5538,
+        32: 138, 4784: 5546, 6179: 5531, 6185: 5531,
+        6186: 5531, 4139: 1609, 4434: 5554, 6193: 5531,
+        6194: 5531, 4147: 5571, 6200: 5531, 2105: 5616,
+        4154: 1607, 59: 1607, 4912: 5545, 64: 137,
+        5472: 5537, 6211: 5530, 4449: 5554, 6217: 5530,
+        6218: 5530, 2123: 5613, 4450: 5554, 6225: 5530,
+        6226: 5530, 4179: 5567, 6232: 5530, 2137: 5612,
+        2138: 5612, 91: 1608, 6241: 5530, 6242: 5530,
+        4195: 5566, 6248: 5530, 2153: 5611, 2154: 5611,
+        107: 5727, 6256: 5530, 2161: 5611, 2162: 5611,
+        5139: 5541, 1504: 5634, 2168: 1606, 121: 1606,
+        122: 1606, 128: 136, 5824: 5536, 6275: 5529,
+        4096: 131, 2753: 5591, 6281: 5529, 6282: 5529,
+        2187: 5608, 4802: 5546, 6289: 5529, 6290: 5529,
+        2195: 5607, 5145: 5541, 6296: 5529, 2201: 5607,
+        2202: 5607, 155: 1608, 5146: 5541, 6305: 5529,
+        6306: 5529, 2211: 5606, 6312: 5529, 2217: 5606,
+        2218: 5606, 171: 5717, 6320: 5529, 4273: 5561,
+        2226: 5606, 179: 5716, 2232: 5606, 185: 5716,
+        186: 1607, 6337: 5529, 6338: 5529, 2243: 5605,
+        6344: 5529, 4297: 5560, 2250: 5605, 203: 5713,
+        7440: 5526, 6352: 5529, 2257: 5605, 2258: 5605,
+        5155: 5540, 4576: 5553, 2264: 5605, 217: 5712,
+        218: 5712, 6368: 5529, 4321: 5560, 2274: 5605,
+        227: 5711, 2280: 5605, 233: 5711, 234: 5711,
+        2288: 5605, 241: 5711, 242: 5711, 5161: 5540,
+        248: 1605, 5162: 5540, 256: 135, 6403: 5528,
+        3457: 5582, 6409: 5528, 6410: 5528, 2315: 5602,
+        5328: 5538, 5506: 5537, 6417: 5528, 6418: 5528,
+        2323: 5601, 6424: 5528, 2329: 5601, 2330: 5601,
+        283: 1608, 6433: 5528, 6434: 5528, 2339: 5600,
+        5056: 5545, 5169: 5540, 6440: 5528, 2345: 5600,
+        2346: 5600, 299: 5702, 5170: 5540, 5512: 5537,
+        2353: 5600, 2354: 5600, 2099: 5616, 4489: 5553,
+        2360: 5600, 313: 5701, 314: 1607, 4490: 5553,
+        6465: 5528, 6466: 5528, 2371: 5599, 6472: 5528,
+        2377: 5599, 2378: 5599, 331: 5698, 6480: 5528,
+        4433: 5554, 4171: 1609, 339: 5697, 4153: 5571,
+        2392: 5599, 345: 5697, 346: 5697, 2106: 1607,
+        6496: 5528, 2401: 5599, 2402: 5599, 355: 5696,
+        4497: 5553, 2408: 5599, 361: 5696, 362: 5696,
+        4498: 5553, 2416: 5599, 369: 5696, 370: 5696,
+        403: 5692, 376: 1606, 5400: 5537, 6529: 5528,
+        6530: 5528, 2435: 5598, 6536: 5528, 2441: 5598,
+        2442: 5598, 395: 5693, 5008: 5545, 6544: 5528,
+        2449: 5598, 2450: 5598, 3139: 5584, 2456: 5598,
+        409: 5692, 410: 5692, 6560: 5528, 4513: 5553,
+        2466: 5598, 419: 5691, 2472: 5598, 425: 5691,
+        426: 5691, 2480: 5598, 433: 5691, 434: 5691,
+        5193: 5539, 440: 5691, 4720: 5547, 5194: 5539,
+        6592: 5528, 2497: 5598, 2498: 5598, 451: 5690,
+        2465: 5598, 2504: 5598, 457: 5690, 458: 5690,
+        4514: 5553, 2512: 5598, 465: 5690, 466: 5690,
+        472: 5690, 4312: 5560, 2528: 5598, 481: 5690,
+        482: 5690, 3153: 5584, 488: 5690, 5202: 5539,
+        4504: 5553, 5131: 1609, 4520: 5553, 2131: 5612,
+        512: 134, 6659: 5527, 3841: 5581, 6665: 5527,
+        6666: 5527, 2571: 5595, 5890: 5536, 6673: 5527,
+        6674: 5527, 2579: 5594, 4185: 5567, 6680: 5527,
+        2585: 5594, 2586: 5594, 539: 1608, 4186: 5567,
+        6689: 5527, 6690: 5527, 2595: 5593, 6696: 5527,
+        4649: 5548, 2602: 5593, 555: 5681, 6704: 5527,
+        2609: 5593, 2610: 5593, 563: 5680, 496: 1604,
+        4873: 5545, 2616: 5593, 569: 5680, 570: 1607,
+        4874: 5545, 5952: 5536, 6721: 5527, 6722: 5527,
+        2627: 5592, 3169: 5584, 6728: 5527, 4681: 5547,
+        2634: 5592, 587: 5677, 5218: 5539, 6736: 5527,
+        4689: 5547, 2642: 5592, 2147: 5611, 5680: 5536,
+        2648: 5592, 601: 5676, 602: 5676, 6752: 5527,
+        4705: 5547, 2658: 5592, 611: 5675, 4881: 5545,
+        2664: 5592, 617: 5675, 618: 5675, 4882: 5545,
+        2672: 5592, 625: 5675, 626: 5675, 4201: 5566,
+        632: 1606, 5272: 5538, 4202: 5566, 6785: 5527,
+        6786: 5527, 2691: 5591, 4545: 5553, 6792: 5527,
+        2697: 5591, 2698: 5591, 651: 5672, 4546: 5553,
+        6800: 5527, 2705: 5591, 2706: 5591, 659: 5671,
+        2091: 5617, 665: 5671, 666: 5671, 6816: 5527,
+        2721: 5591, 2722: 5591, 675: 5670, 4209: 5566,
+        2728: 5591, 681: 5670, 682: 5670, 4210: 5566,
+        2736: 5591, 689: 5670, 690: 5670, 115: 5726,
+        696: 5670, 6848: 5527, 4801: 5546, 2754: 5591,
+        707: 5669, 2849: 5590, 2760: 5591, 713: 5669,
+        714: 5669, 4898: 5545, 2768: 5591, 721: 5669,
+        722: 5669, 728: 5669, 2784: 5591, 737: 5669,
+        738: 5669, 744: 5669, 5344: 5538, 752: 5669,
+        4904: 5545, 4867: 5545, 6913: 5527, 6914: 5527,
+        2819: 5590, 6920: 5527, 2825: 5590, 2826: 5590,
+        779: 5666, 6928: 5527, 2833: 5590, 2834: 5590,
+        787: 5665, 2840: 5590, 793: 5665, 794: 5665,
+        6944: 5527, 4897: 5545, 2850: 5590, 803: 5664,
+        4664: 5548, 2856: 5590, 809: 5664, 810: 5664,
+        2864: 5590, 817: 5664, 818: 5664, 4528: 5553,
+        5257: 5538, 824: 5664, 5258: 5538, 6976: 5527,
+        4929: 5545, 2882: 5590, 4235: 1609, 2888: 5590,
+        841: 5663, 842: 5663, 2896: 5590, 849: 5663,
+        850: 5663, 856: 5663, 2912: 5590, 865: 5663,
+        866: 5663, 5265: 5538, 872: 5663, 5266: 5538,
+        880: 5663, 4243: 5562, 7040: 5527, 4993: 5545,
+        2946: 5590, 899: 5662, 2881: 5590, 2952: 5590,
+        905: 5662, 906: 5662, 4930: 5545, 2960: 5590,
+        913: 5662, 914: 5662, 835: 5663, 4249: 5562,
+        920: 5662, 4250: 5562, 2976: 5590, 929: 5662,
+        930: 5662, 936: 5662, 1736: 5627, 5896: 5536,
+        4123: 1608, 4936: 5545, 3008: 5590, 961: 5662,
+        962: 5662, 5281: 5538, 968: 5662, 5282: 5538,
+        976: 5662, 4259: 5561, 992: 1603, 4944: 5545,
+        5288: 5538, 4265: 5561, 4266: 5561, 1024: 133,
+        7171: 5526, 7177: 5526, 7178: 5526, 3083: 5587,
+        4808: 5546, 7185: 5526, 7186: 5526, 3091: 5586,
+        7192: 5526, 3097: 5586, 3098: 5586, 1051: 1608,
+        7201: 5526, 7202: 5526, 3107: 5585, 2225: 5606,
+        7208: 5526, 3113: 5585, 3114: 5585, 1067: 5653,
+        4274: 5561, 7216: 5526, 3121: 5585, 3122: 5585,
+        1075: 5652, 5641: 5536, 3128: 5585, 1081: 5652,
+        1082: 1607, 5642: 5536, 7233: 5526, 7234: 5526,
+        5187: 5539, 7240: 5526, 3145: 5584, 3146: 5584,
+        1099: 5649, 5424: 5537, 7248: 5526, 5201: 5539,
+        3154: 5584, 1107: 5648, 6016: 5536, 3160: 5584,
+        1113: 5648, 1114: 5648, 7264: 5526, 5217: 5539,
+        3170: 5584, 1123: 5647, 5649: 5536, 3176: 5584,
+        1129: 5647, 1130: 5647, 5650: 5536, 6448: 5528,
+        3184: 5584, 1137: 5647, 1138: 5647, 4627: 5549,
+        1144: 1606, 5176: 5540, 7297: 5526, 7298: 5526,
+        5251: 5538, 5313: 5538, 7304: 5526, 3209: 5583,
+        3210: 5583, 1163: 5644, 5314: 5538, 7312: 5526,
+        3217: 5583, 3218: 5583, 1171: 5643, 4633: 5549,
+        3224: 5583, 1177: 5643, 1178: 5643, 4634: 5549,
+        5904: 5536, 7328: 5526, 3233: 5583, 3234: 5583,
+        1187: 5642, 3240: 5583, 1193: 5642, 1194: 5642,
+        4336: 5560, 3248: 5583, 1201: 5642, 1202: 5642,
+        2249: 5605, 1208: 5642, 4298: 5560, 7360: 5526,
+        3265: 5583, 3266: 5583, 1219: 5641, 3617: 5581,
+        3272: 5583, 1225: 5641, 1226: 5641, 5666: 5536,
+        3280: 5583, 1233: 5641, 1234: 5641, 4643: 5548,
+        1240: 5641, 5224: 5539, 5000: 5545, 3296: 5583,
+        1249: 5641, 1250: 5641, 4305: 5560, 1256: 5641,
+        4306: 5560, 1264: 5641, 5672: 5536, 211: 5712,
+        2601: 5593, 4816: 5546, 4650: 5548, 7425: 5526,
+        7426: 5526, 5379: 5537, 2945: 5590, 7432: 5526,
+        5385: 5537, 3338: 5582, 1291: 5638, 4994: 5545,
+        5635: 5536, 3345: 5582, 3346: 5582, 1299: 5637,
+        3352: 5582, 1305: 5637, 1306: 5637, 7456: 5526,
+        5409: 5537, 3362: 5582, 1315: 5636, 4657: 5548,
+        3368: 5582, 1321: 5636, 1322: 5636, 4658: 5548,
+        3376: 5582, 1329: 5636, 1330: 5636, 5568: 5537,
+        1336: 5636, 7488: 5526, 3393: 5582, 3394: 5582,
+        1347: 5635, 2273: 5605, 3400: 5582, 1353: 5635,
+        1354: 5635, 5296: 5538, 4322: 5560, 3408: 5582,
+        1361: 5635, 1362: 5635, 1368: 5635, 3424: 5582,
+        1377: 5635, 1378: 5635, 5024: 5545, 1384: 5635,
+        4960: 5545, 4888: 5545, 1392: 5635, 4328: 5560,
+        7552: 5526, 5505: 5537, 3458: 5582, 1411: 5634,
+        3649: 5581, 3464: 5582, 1417: 5634, 1418: 5634,
+        5698: 5536, 3472: 5582, 1425: 5634, 1426: 5634,
+        4675: 5547, 1432: 5634, 3488: 5582, 1441: 5634,
+        1442: 5634, 1448: 5634, 1456: 5634, 5704: 5536,
+        2633: 5592, 4682: 5547, 3520: 5582, 1473: 5634,
+        1474: 5634, 1480: 5634, 5232: 5539, 4456: 5554,
+        1488: 5634, 4619: 1609, 5712: 5536, 2641: 5592,
+        4483: 5553, 4690: 5547, 4464: 5554, 595: 5676,
+        7681: 5526, 7682: 5526, 3587: 5581, 4552: 5553,
+        7688: 5526, 3593: 5581, 3594: 5581, 1547: 5631,
+        7696: 5526, 3601: 5581, 3602: 5581, 1555: 5630,
+        3608: 5581, 1561: 5630, 1562: 5630, 4280: 5561,
+        7712: 5526, 5665: 5536, 3618: 5581, 1571: 5629,
+        3624: 5581, 1577: 5629, 1578: 5629, 3632: 5581,
+        1585: 5629, 1586: 5629, 3337: 5582, 1592: 5629,
+        5386: 5537, 7744: 5526, 5697: 5536, 3650: 5581,
+        1603: 5628, 2657: 5592, 3656: 5581, 1609: 5628,
+        1610: 5628, 4706: 5547, 3664: 5581, 1617: 5628,
+        1618: 5628, 1624: 5628, 3680: 5581, 1633: 5628,
+        1634: 5628, 5393: 5537, 1640: 5628, 4760: 5546,
+        5394: 5537, 1648: 5628, 4712: 5547, 4371: 5556,
+        5920: 5536, 7808: 5526, 5761: 5536, 3714: 5581,
+        1667: 5627, 3720: 5581, 1673: 5627, 1674: 5627,
+        3728: 5581, 1681: 5627, 1682: 5627, 4377: 5556,
+        1688: 5627, 4216: 1606, 4378: 5556, 3744: 5581,
+        1697: 5627, 1698: 5627, 1704: 5627, 1712: 5627,
+        3776: 5581, 1729: 5627, 1730: 5627, 944: 5662,
+        3361: 5582, 3331: 5582, 5410: 5537, 1744: 5627,
+        4387: 5555, 4832: 5546, 5208: 5539, 1760: 5627,
+        4696: 5547, 5416: 5537, 4560: 5553, 4393: 5555,
+        4394: 5555, 7936: 1600, 5889: 5536, 3842: 5581,
+        1795: 5626, 3713: 5581, 3848: 5581, 1801: 5626,
+        1802: 5626, 5762: 5536, 3856: 5581, 1809: 5626,
+        1810: 5626, 4739: 5546, 1816: 5626, 3872: 5581,
+        1825: 5626, 1826: 5626, 4401: 5555, 1832: 5626,
+        4402: 5555, 1840: 5626, 5768: 5536, 307: 5701,
+        4745: 5546, 4746: 5546, 3904: 5581, 1857: 5626,
+        1858: 5626, 5536: 5537, 1864: 5626, 1872: 5626,
+        4408: 5555, 1888: 5626, 5776: 5536, 4291: 5560,
+        4753: 5546, 4754: 5546, 3968: 1601, 1921: 5626,
+        1922: 5626, 5656: 5536, 5441: 5537, 1928: 5626,
+        5442: 5537, 1936: 5626, 2712: 5591, 5520: 5537,
+        4419: 5554, 1952: 5626, 5448: 5537, 4425: 5554,
+        4426: 5554, 1984: 1602, 5792: 5536, 3203: 5583,
+        4769: 5546, 4770: 5546, 4363: 1609, 5456: 5537,
+        2385: 5599, 2386: 5599, 4776: 5546, 5728: 5536 },
+        5: { 3584: 3305, 2816: 3305, 6146: 3304, 6152: 3304,
+        522: 3307, 4610: 3304, 2336: 3305, 1552: 3306,
+        2066: 3305, 2592: 3305, 2072: 3305, 26: 1608,
+        1568: 3306, 4130: 3304, 1058: 3306, 4144: 3304,
+        4136: 3304, 42: 3311, 2320: 3305, 560: 3307,
+        1288: 3306, 50: 3311, 2576: 3305, 56: 3311,
+        2184: 3305, 1034: 3306, 1600: 3306, 1120: 3306,
+        2114: 3305, 2082: 3305, 3088: 3305, 584: 3307,
+        74: 3310, 4384: 3304, 592: 3307, 82: 3310,
+        4416: 3304, 4640: 3304, 88: 3310, 770: 3307,
+        608: 3307, 1296: 3306, 98: 3310, 5152: 3304,
+        104: 3310, 1282: 3306, 4114: 3304, 4368: 3304,
+        112: 3310, 1538: 3306, 4624: 3304, 6400: 3304,
+        4232: 3304, 4672: 3304, 1664: 3306, 1216: 3306,
+        2178: 3305, 5136: 3304, 6176: 3304, 648: 3307,
+        138: 3309, 656: 3307, 4120: 3304, 146: 3309,
+        152: 3309, 4864: 3304, 7168: 3304, 672: 3307,
+        162: 3309, 6160: 3304, 168: 3309, 5376: 3304,
+        176: 3309, 3080: 3305, 5632: 3304, 704: 3307,
+        1312: 3306, 194: 3309, 3104: 3305, 200: 3309,
+        4354: 3304, 2240: 3305, 546: 3307, 5184: 3304,
+        208: 3309, 3328: 3305, 6656: 3304, 1064: 3306,
+        2562: 3305, 224: 3309, 5122: 3304, 536: 3307,
+        552: 3307, 1048: 3306, 2088: 3305, 4168: 3304,
+        1096: 3306, 530: 3307, 1792: 3306, 1408: 3306,
+        2306: 3305, 776: 3307, 266: 3308, 2208: 3305,
+        4288: 3304, 4226: 3304, 784: 3307, 274: 3308,
+        3200: 3305, 280: 3308, 800: 3307, 1072: 3306,
+        290: 3308, 1544: 3306, 296: 3308, 2192: 3305,
+        3074: 3305, 304: 3308, 1160: 3306, 2312: 3305,
+        832: 3307, 322: 3308, 2568: 3305, 328: 3308,
+        4256: 3304, 1042: 3306, 336: 3308, 2432: 3305,
+        642: 3307, 2688: 3305, 352: 3308, 1168: 3306,
+        1154: 3306, 4240: 3304, 6208: 3304, 2058: 3305,
+        4360: 3304, 896: 3307, 1344: 3306, 386: 3308,
+        4616: 3304, 392: 3308, 2144: 3305, 3136: 3305,
+        4162: 3304, 400: 3308, 4480: 3304, 5128: 3304,
+        4736: 3304, 416: 3308, 2128: 3305, 5248: 3304,
+        2120: 3305, 4106: 1609, 448: 3308, 1184: 3306,
+        4192: 3304, 6272: 3304, 2368: 3305, 578: 3307,
+        2624: 3305, 1104: 3306, 1090: 3306, 2096: 3305,
+        4176: 3304 },
+        6: { 3584: 3294, 4609: 3293, 769: 3296, 4616: 3293,
+        521: 3296, 6400: 3293, 1296: 3295, 2336: 3294,
+        1552: 3295, 4113: 3293, 2592: 3294, 2072: 3294,
+        25: 1608, 1568: 3295, 1057: 3295, 1041: 3295,
+        4144: 3293, 4136: 3293, 41: 3300, 3328: 3294,
+        2320: 3294, 1072: 3295, 6152: 3293, 2576: 3294,
+        4105: 1609, 56: 1607, 2184: 3294, 1600: 3295,
+        4161: 3293, 2065: 3294, 3088: 3294, 584: 3296,
+        73: 3299, 1281: 3295, 4384: 3293, 592: 3296,
+        81: 3299, 1537: 3295, 4416: 3293, 4640: 3293,
+        88: 3299, 2816: 3294, 608: 3296, 97: 3299,
+        4129: 3293, 529: 3296, 104: 3299, 1153: 3295,
+        2305: 3294, 4368: 3293, 112: 3299, 2561: 3294,
+        4624: 3293, 4232: 3293, 4672: 3293, 1664: 3295,
+        4225: 3293, 3073: 3294, 5136: 3293, 6176: 3293,
+        648: 3296, 137: 3298, 656: 3296, 4120: 3293,
+        152: 3298, 4864: 3293, 7168: 3293, 672: 3296,
+        161: 3298, 6160: 3293, 168: 3298, 1216: 3295,
+        5376: 3293, 176: 3298, 5632: 3293, 704: 3296,
+        193: 3298, 5121: 3293, 2081: 3294, 200: 3298,
+        2240: 3294, 5184: 3293, 208: 3298, 6656: 3293,
+        1064: 3295, 224: 3298, 6145: 3293, 536: 3296,
+        5152: 3293, 552: 3296, 1048: 3295, 2088: 3294,
+        4168: 3293, 1096: 3295, 1792: 3295, 4353: 3293,
+        641: 3296, 776: 3296, 265: 3297, 2208: 3294,
+        4288: 3293, 784: 3296, 273: 3297, 3200: 3294,
+        280: 3297, 1288: 3295, 800: 3296, 289: 3297,
+        1544: 3295, 49: 3300, 296: 3297, 2192: 3294,
+        304: 3297, 1160: 3295, 1408: 3295, 1033: 3295,
+        2312: 3294, 832: 3296, 321: 3297, 2568: 3294,
+        328: 3297, 4256: 3293, 336: 3297, 2432: 3294,
+        2057: 3294, 3080: 3294, 2688: 3294, 352: 3297,
+        1168: 3295, 145: 3298, 2177: 3294, 1120: 3295,
+        4240: 3293, 6208: 3293, 4360: 3293, 896: 3296,
+        385: 3297, 577: 3296, 392: 3297, 2144: 3294,
+        3136: 3294, 400: 3297, 4480: 3293, 5128: 3293,
+        4736: 3293, 416: 3297, 2128: 3294, 5248: 3293,
+        1344: 3295, 2120: 3294, 560: 3296, 448: 3297,
+        1184: 3295, 1089: 3295, 4192: 3293, 6272: 3293,
+        2368: 3294, 2624: 3294, 1104: 3295, 3104: 3294,
+        2113: 3294, 2096: 3294, 4176: 3293, 1312: 3295,
+        545: 3296 },
+        7: { 128: 3298, 256: 3297, 4096: 3293, 1024: 3295,
+        32: 3300, 8: 3302, 64: 3299, 16: 3301,
+        512: 3296, 2048: 3294 },
+        8: { 2048: 120, 1: 130, 2: 129, 4: 128,
+        6151: 1609, 16: 127, 6163: 5312, 6165: 5312,
+        6166: 5312, 4119: 1608, 32: 126, 4784: 5326,
+        6179: 5311, 6181: 5311, 6182: 5311, 4135: 1609,
+        5142: 5321, 5127: 1609, 6193: 5311, 6194: 5311,
+        4147: 5351, 6196: 5311, 2101: 5396, 2102: 1607,
+        55: 1607, 4912: 5325, 64: 125, 5472: 5317,
+        6211: 5310, 6213: 5310, 6214: 5310, 2119: 5393,
+        4450: 5334, 6225: 5310, 6226: 5310, 4179: 5347,
+        6228: 5310, 2133: 5392, 2134: 5392, 87: 1608,
+        4452: 5334, 5254: 5318, 6241: 5310, 6242: 5310,
+        4195: 5346, 6244: 5310, 2149: 5391, 2150: 5391,
+        103: 5507, 6256: 5310, 2161: 5391, 2162: 5391,
+        5139: 5321, 2164: 1606, 117: 1606, 118: 1606,
+        5141: 5321, 128: 124, 5920: 5316, 6275: 5309,
+        6277: 5309, 6278: 5309, 2183: 5388, 2071: 1608,
+        4802: 5326, 6289: 5309, 6290: 5309, 2195: 5387,
+        6292: 5309, 4245: 5342, 2198: 5387, 151: 1608,
+        4804: 5326, 6305: 5309, 6306: 5309, 2211: 5386,
+        6308: 5309, 2213: 5386, 2214: 5386, 167: 5497,
+        6320: 5309, 2225: 5386, 2226: 5386, 179: 5496,
+        2228: 5386, 181: 5496, 182: 1607, 6337: 5309,
+        6338: 5309, 2243: 5385, 6340: 5309, 2245: 5385,
+        2246: 5385, 199: 5493, 7440: 5306, 6352: 5309,
+        2257: 5385, 2258: 5385, 3107: 5365, 2260: 5385,
+        213: 5492, 214: 5492, 5190: 5319, 3109: 5365,
+        6368: 5309, 2273: 5385, 2274: 5385, 227: 5491,
+        2276: 5385, 229: 5491, 230: 5491, 2087: 5397,
+        2288: 1605, 241: 1605, 242: 1605, 244: 1605,
+        256: 123, 6403: 5308, 6405: 5308, 6406: 5308,
+        2311: 5382, 5328: 5318, 5506: 5317, 6417: 5308,
+        6418: 5308, 2323: 5381, 6420: 5308, 2325: 5381,
+        2326: 5381, 279: 1608, 5508: 5317, 2437: 5378,
+        6433: 5308, 4374: 5336, 2339: 5380, 6436: 5308,
+        2341: 5380, 2342: 5380, 295: 5482, 5170: 5320,
+        6448: 5308, 2353: 5380, 2354: 5380, 2099: 5396,
+        2356: 5380, 309: 5481, 310: 1607, 5172: 5320,
+        4149: 5351, 6465: 5308, 6466: 5308, 2371: 5379,
+        6468: 5308, 2373: 5379, 2374: 5379, 327: 5478,
+        6480: 5308, 4433: 5334, 2386: 5379, 339: 5477,
+        2388: 5379, 341: 5477, 342: 5477, 6496: 5308,
+        2401: 5379, 2402: 5379, 355: 5476, 2404: 5379,
+        357: 5476, 358: 5476, 4497: 5333, 4498: 5333,
+        2416: 5379, 369: 5476, 370: 5476, 403: 5472,
+        372: 1606, 4500: 5333, 6529: 5308, 6530: 5308,
+        4483: 5333, 6532: 5308, 4485: 5333, 2438: 5378,
+        391: 5473, 5008: 5325, 6544: 5308, 2449: 5378,
+        2450: 5378, 3139: 5364, 2452: 5378, 405: 5472,
+        406: 5472, 5189: 5319, 6560: 5308, 4513: 5333,
+        2466: 5378, 419: 5471, 2468: 5378, 421: 5471,
+        422: 5471, 4167: 1609, 2480: 5378, 433: 5471,
+        434: 5471, 436: 5471, 4720: 5327, 4993: 5325,
+        2497: 5378, 2498: 5378, 451: 5470, 2500: 5378,
+        453: 5470, 454: 5470, 2465: 5378, 4514: 5333,
+        2512: 5378, 465: 5470, 466: 5470, 468: 5470,
+        4516: 5333, 2528: 5378, 481: 5470, 482: 5470,
+        484: 5470, 3153: 5364, 5202: 5319, 4449: 5334,
+        496: 1604, 4096: 119, 2131: 5392, 5204: 5319,
+        4960: 5325, 4181: 5347, 512: 122, 6659: 5307,
+        6661: 5307, 6662: 5307, 3841: 5361, 5568: 5317,
+        5890: 5316, 6673: 5307, 6674: 5307, 2579: 5374,
+        6676: 5307, 2581: 5374, 2582: 5374, 535: 1608,
+        5892: 5316, 4246: 5342, 4869: 5325, 6689: 5307,
+        6690: 5307, 2595: 5373, 6692: 5307, 2597: 5373,
+        2598: 5373, 551: 5461, 6704: 5307, 2609: 5373,
+        2610: 5373, 563: 5460, 2612: 5373, 565: 5460,
+        566: 1607, 5952: 5316, 6721: 5307, 6722: 5307,
+        2627: 5372, 6724: 5307, 2629: 5372, 2630: 5372,
+        583: 5457, 5218: 5319, 6736: 5307, 4689: 5327,
+        2642: 5372, 595: 5456, 2644: 5372, 597: 5456,
+        598: 5456, 5680: 5316, 5220: 5319, 4197: 5346,
+        6752: 5307, 2657: 5372, 2658: 5372, 611: 5455,
+        2660: 5372, 613: 5455, 614: 5455, 4881: 5325,
+        4882: 5325, 2672: 5372, 625: 5455, 626: 5455,
+        628: 1606, 4884: 5325, 6785: 5307, 6786: 5307,
+        2691: 5371, 6788: 5307, 4741: 5326, 2694: 5371,
+        4545: 5333, 4546: 5333, 6800: 5307, 2705: 5371,
+        2706: 5371, 659: 5451, 2708: 5371, 661: 5451,
+        662: 5451, 4548: 5333, 4182: 5347, 6816: 5307,
+        2721: 5371, 2722: 5371, 675: 5450, 2724: 5371,
+        677: 5450, 678: 5450, 4209: 5346, 6592: 5308,
+        4210: 5346, 2736: 5371, 689: 5450, 690: 5450,
+        115: 5506, 692: 5450, 4212: 1606, 6848: 5307,
+        2753: 5371, 2754: 5371, 707: 5449, 2756: 5371,
+        709: 5449, 710: 5449, 4897: 5325, 6434: 5308,
+        4898: 5325, 2768: 5371, 721: 5449, 722: 5449,
+        724: 5449, 4900: 5325, 2784: 5371, 737: 5449,
+        738: 5449, 740: 5449, 5344: 5318, 752: 1605,
+        4867: 5325, 6913: 5307, 6914: 5307, 2819: 5370,
+        6916: 5307, 2821: 5370, 2822: 5370, 775: 5446,
+        6928: 5307, 2833: 5370, 2834: 5370, 787: 5445,
+        2836: 5370, 789: 5445, 790: 5445, 3205: 5363,
+        6944: 5307, 2849: 5370, 2850: 5370, 803: 5444,
+        2852: 5370, 805: 5444, 806: 5444, 4231: 1609,
+        2864: 5370, 817: 5444, 818: 5444, 4528: 5333,
+        820: 5444, 4801: 5326, 5824: 5316, 6976: 5307,
+        4929: 5325, 2882: 5370, 835: 5443, 2884: 5370,
+        837: 5443, 838: 5443, 2896: 5370, 849: 5443,
+        4870: 5325, 852: 5443, 2912: 5370, 865: 5443,
+        866: 5443, 868: 5443, 5265: 5318, 5266: 5318,
+        880: 5443, 4243: 5342, 5268: 5318, 2197: 5387,
+        7040: 5307, 2945: 5370, 2946: 5370, 899: 5442,
+        2948: 5370, 901: 5442, 902: 5442, 2881: 5370,
+        5281: 5318, 4930: 5325, 2960: 5370, 913: 5442,
+        914: 5442, 916: 5442, 4932: 5325, 2976: 5370,
+        929: 5442, 930: 5442, 932: 5442, 944: 5442,
+        4464: 5334, 3008: 5370, 961: 5442, 962: 5442,
+        964: 5442, 3169: 5364, 5282: 5318, 976: 5442,
+        4259: 5341, 1984: 1602, 5284: 5318, 4261: 5341,
+        992: 1603, 4944: 5325, 2147: 5391, 4262: 5341,
+        850: 5443, 1024: 121, 7171: 5306, 7173: 5306,
+        7174: 5306, 3079: 5367, 7185: 5306, 7186: 5306,
+        3091: 5366, 7188: 5306, 3093: 5366, 3094: 5366,
+        1047: 1608, 5637: 5316, 7201: 5306, 7202: 5306,
+        5155: 5320, 7204: 5306, 5157: 5320, 3110: 5365,
+        1063: 5433, 2567: 5375, 4274: 5341, 4576: 5333,
+        7216: 5306, 5169: 5320, 3122: 5365, 1075: 5432,
+        3124: 5365, 1077: 5432, 1078: 1607, 4276: 5341,
+        7233: 5306, 7234: 5306, 5187: 5319, 7236: 5306,
+        3141: 5364, 3142: 5364, 1095: 5429, 5424: 5317,
+        7248: 5306, 5201: 5319, 3154: 5364, 1107: 5428,
+        3156: 5364, 1109: 5428, 1110: 5428, 7264: 5306,
+        5217: 5319, 3170: 5364, 1123: 5427, 3172: 5364,
+        1125: 5427, 1126: 5427, 5649: 5316, 5650: 5316,
+        3184: 5364, 1137: 5427, 1138: 5427, 4627: 5329,
+        1140: 1606, 5652: 5316, 4198: 5346, 4629: 5329,
+        7297: 5306, 7298: 5306, 5251: 5318, 7300: 5306,
+        5253: 5318, 3206: 5363, 5313: 5318, 5314: 5318,
+        7312: 5306, 3217: 5363, 3218: 5363, 1171: 5423,
+        3220: 5363, 1173: 5423, 1174: 5423, 5316: 5318,
+        5904: 5316, 4293: 5340, 7328: 5306, 3233: 5363,
+        3234: 5363, 1187: 5422, 3236: 5363, 1189: 5422,
+        1190: 5422, 4336: 1605, 3248: 5363, 1201: 5422,
+        1202: 5422, 1204: 5422, 7360: 5306, 3265: 5363,
+        3266: 5363, 1219: 5421, 3268: 5363, 1221: 5421,
+        1222: 5421, 3617: 5361, 5666: 5316, 3280: 5363,
+        1233: 5421, 1234: 5421, 4643: 5328, 1236: 5421,
+        5668: 5316, 4645: 5328, 3296: 5363, 1249: 5421,
+        1250: 5421, 1252: 5421, 4646: 5328, 4305: 5340,
+        4306: 5340, 1264: 1605, 211: 5492, 4308: 5340,
+        4816: 5326, 7425: 5306, 7426: 5306, 5379: 5317,
+        7428: 5306, 3333: 5362, 3334: 5362, 1287: 5418,
+        4994: 5325, 5635: 5316, 3345: 5362, 3346: 5362,
+        1299: 5417, 3348: 5362, 1301: 5417, 1302: 5417,
+        4996: 5325, 5158: 5320, 7456: 5306, 5409: 5317,
+        3362: 5362, 1315: 5416, 3364: 5362, 1317: 5416,
+        1318: 5416, 4657: 5328, 4658: 5328, 3376: 5362,
+        1329: 5416, 1330: 5416, 1332: 5416, 4660: 5328,
+        7488: 5306, 3393: 5362, 3394: 5362, 1347: 5415,
+        3396: 5362, 1349: 5415, 1350: 5415, 4321: 5340,
+        4273: 5341, 5296: 5318, 4322: 5340, 3408: 5362,
+        1361: 5415, 1362: 5415, 1364: 5415, 4324: 5340,
+        3424: 5362, 1377: 5415, 1378: 5415, 5024: 5325,
+        1380: 5415, 4615: 1609, 5638: 5316, 1392: 5415,
+        7552: 5306, 5505: 5317, 3458: 5362, 1411: 5414,
+        3460: 5362, 1413: 5414, 1414: 5414, 5697: 5316,
+        5698: 5316, 3457: 5362, 1425: 5414, 1426: 5414,
+        4675: 5327, 1428: 5414, 5700: 5316, 4677: 5327,
+        3488: 5362, 1441: 5414, 1442: 5414, 1444: 5414,
+        4678: 5327, 2435: 5378, 6016: 5316, 1456: 5414,
+        5056: 5325, 3520: 5362, 1473: 5414, 1474: 5414,
+        1476: 5414, 5232: 5319, 1488: 5414, 1504: 5414,
+        5712: 5316, 2641: 5372, 4690: 5327, 4692: 5327,
+        7681: 5306, 7682: 5306, 3587: 5361, 7684: 5306,
+        3589: 5361, 3590: 5361, 1543: 5411, 7696: 5306,
+        3601: 5361, 3602: 5361, 1555: 5410, 3604: 5361,
+        1557: 5410, 1558: 5410, 5381: 5317, 7712: 5306,
+        5665: 5316, 3618: 5361, 1571: 5409, 3620: 5361,
+        1573: 5409, 1574: 5409, 4359: 1609, 3632: 5361,
+        1585: 5409, 1586: 5409, 1588: 5409, 7744: 5306,
+        3649: 5361, 3650: 5361, 1603: 5408, 3652: 5361,
+        1605: 5408, 1606: 5408, 4705: 5327, 4706: 5327,
+        3664: 5361, 1617: 5408, 1618: 5408, 1620: 5408,
+        4708: 5327, 3680: 5361, 1633: 5408, 1634: 5408,
+        1636: 5408, 5393: 5317, 5394: 5317, 1648: 5408,
+        4371: 5336, 5396: 5317, 4373: 5336, 7808: 5306,
+        3713: 5361, 3714: 5361, 1667: 5407, 3716: 5361,
+        1669: 5407, 1670: 5407, 3728: 5361, 1681: 5407,
+        1682: 5407, 1684: 5407, 3744: 5361, 1697: 5407,
+        1698: 5407, 1700: 5407, 1712: 5407, 3121: 5365,
+        3776: 5361, 1729: 5407, 1730: 5407, 1732: 5407,
+        3361: 5362, 3331: 5362, 5410: 5317, 1744: 5407,
+        4387: 5335, 5412: 5317, 4150: 1607, 4832: 5326,
+        4389: 5335, 1760: 5407, 4390: 5335, 4560: 5333,
+        7936: 1600, 5889: 5316, 3842: 5361, 1795: 5406,
+        3844: 5361, 1797: 5406, 1798: 5406, 5761: 5316,
+        5762: 5316, 3856: 5361, 1809: 5406, 1810: 5406,
+        4739: 5326, 1812: 5406, 5764: 5316, 2693: 5371,
+        3872: 5361, 1825: 5406, 1826: 5406, 1828: 5406,
+        4742: 5326, 4401: 5335, 4630: 5329, 647: 5452,
+        4402: 5335, 1840: 5406, 307: 5481, 4404: 5335,
+        3904: 5361, 1857: 5406, 1858: 5406, 1860: 5406,
+        5536: 5317, 1872: 5406, 3472: 5362, 1888: 5406,
+        5776: 5316, 5382: 5317, 4486: 5333, 4291: 5340,
+        4753: 5326, 4754: 5326, 4756: 5326, 3968: 1601,
+        1921: 5406, 1922: 5406, 1924: 5406, 5441: 5317,
+        5442: 5317, 1936: 5406, 5520: 5317, 4419: 5334,
+        5444: 5317, 4421: 5334, 1952: 5406, 4422: 5334,
+        4294: 5340, 5792: 5316, 3203: 5363, 4769: 5326,
+        4770: 5326, 4772: 5326, 5456: 5317, 5728: 5316,
+        2385: 5379, 4434: 5334, 4436: 5334, 1159: 5424 },
+        9: { 3584: 3283, 2816: 3283, 6146: 3282, 4612: 3282,
+        2054: 3283, 4610: 3282, 2336: 3283, 1552: 3284,
+        1042: 3284, 2068: 3283, 22: 1608, 2592: 3283,
+        4672: 3282, 5124: 3282, 1092: 3284, 4130: 3282,
+        1058: 3284, 4132: 3282, 518: 3285, 38: 3289,
+        4144: 3282, 5184: 3282, 3328: 3283, 4368: 3282,
+        2320: 3283, 560: 3285, 50: 3289, 52: 3289,
+        2576: 3283, 2116: 3283, 1120: 3284, 2114: 3283,
+        2082: 3283, 4164: 3282, 70: 3288, 6208: 3282,
+        4384: 3282, 592: 3285, 82: 3288, 84: 3288,
+        4416: 3282, 4640: 3282, 770: 3285, 1060: 3284,
+        608: 3285, 1296: 3284, 98: 3288, 100: 3288,
+        5152: 3282, 1282: 3284, 4114: 3282, 532: 3285,
+        112: 3288, 1538: 3284, 4624: 3282, 6400: 3282,
+        4116: 3282, 1044: 3284, 2084: 3283, 1664: 3284,
+        1216: 3284, 2178: 3283, 4228: 3282, 134: 3287,
+        6176: 3282, 656: 3285, 146: 3287, 148: 3287,
+        772: 3285, 4864: 3282, 672: 3285, 162: 3287,
+        164: 3287, 1284: 3284, 1540: 3284, 176: 3287,
+        5632: 3282, 704: 3285, 1312: 3284, 194: 3287,
+        196: 3287, 2308: 3283, 3104: 3283, 4354: 3282,
+        2240: 3283, 546: 3285, 2564: 3283, 208: 3287,
+        6656: 3282, 548: 3285, 1030: 3284, 2562: 3283,
+        3076: 3283, 224: 3287, 5122: 3282, 7168: 3282,
+        530: 3285, 1792: 3284, 1408: 3284, 2306: 3283,
+        4356: 3282, 262: 3286, 2208: 3283, 4288: 3282,
+        642: 3285, 784: 3285, 274: 3286, 276: 3286,
+        3200: 3283, 1156: 3284, 800: 3285, 1072: 3284,
+        290: 3286, 292: 3286, 2192: 3283, 3074: 3283,
+        304: 3286, 5136: 3282, 4102: 1609, 6148: 3282,
+        832: 3285, 322: 3286, 324: 3286, 6160: 3282,
+        4256: 3282, 336: 3286, 2432: 3283, 2688: 3283,
+        352: 3286, 1168: 3284, 3088: 3283, 1154: 3284,
+        4240: 3282, 5376: 3282, 896: 3285, 1344: 3284,
+        386: 3286, 388: 3286, 2144: 3283, 3136: 3283,
+        4162: 3282, 400: 3286, 644: 3285, 580: 3285,
+        4736: 3282, 416: 3286, 2128: 3283, 5248: 3282,
+        1600: 3284, 448: 3286, 1184: 3284, 2180: 3283,
+        4226: 3282, 4192: 3282, 6272: 3282, 2368: 3283,
+        578: 3285, 2624: 3283, 4480: 3282, 1104: 3284,
+        1090: 3284, 2096: 3283, 4176: 3282, 2066: 3283,
+        1568: 3284 },
+        10: { 3584: 3272, 3073: 3272, 5124: 3271, 4101: 1609,
+        4609: 3271, 5152: 3271, 6400: 3271, 1296: 3273,
+        2336: 3272, 1552: 3273, 4113: 3271, 2068: 3272,
+        21: 1608, 2592: 3272, 4672: 3271, 4612: 3271,
+        517: 3274, 1092: 3273, 1057: 3273, 1041: 3273,
+        37: 3278, 4144: 3271, 5184: 3271, 3328: 3272,
+        4368: 3271, 2320: 3272, 560: 3274, 49: 3278,
+        52: 1607, 2576: 3272, 769: 3274, 2116: 3272,
+        4161: 3271, 4164: 3271, 69: 3277, 3088: 3272,
+        6208: 3271, 548: 3274, 592: 3274, 81: 3277,
+        1537: 3273, 4416: 3271, 4640: 3271, 2816: 3272,
+        1060: 3273, 608: 3274, 97: 3277, 100: 3277,
+        4129: 3271, 529: 3274, 2305: 3272, 532: 3274,
+        112: 3277, 2561: 3272, 4624: 3271, 4116: 3271,
+        1044: 3273, 2084: 3272, 1664: 3273, 4225: 3271,
+        4228: 3271, 133: 3276, 5136: 3271, 6176: 3271,
+        656: 3274, 145: 3276, 148: 3276, 772: 3274,
+        4864: 3271, 672: 3274, 161: 3276, 164: 3276,
+        1284: 3273, 4353: 3271, 1540: 3273, 176: 3276,
+        5632: 3271, 1029: 3273, 704: 3274, 193: 3276,
+        196: 3276, 2308: 3272, 2081: 3272, 2240: 3272,
+        2564: 3272, 208: 3276, 6656: 3271, 4132: 3271,
+        2053: 3272, 3076: 3272, 224: 3276, 6145: 3271,
+        7168: 3271, 1792: 3273, 1281: 3273, 4356: 3271,
+        261: 3275, 641: 3274, 2208: 3272, 4288: 3271,
+        784: 3274, 273: 3275, 276: 3275, 3200: 3272,
+        644: 3274, 800: 3274, 289: 3275, 292: 3275,
+        2192: 3272, 304: 3275, 1408: 3273, 6148: 3271,
+        832: 3274, 321: 3275, 324: 3275, 6160: 3271,
+        1153: 3273, 4256: 3271, 336: 3275, 2432: 3272,
+        2065: 3272, 2688: 3272, 1216: 3273, 352: 3275,
+        1168: 3273, 2177: 3272, 1120: 3273, 4240: 3271,
+        5376: 3271, 896: 3274, 385: 3275, 388: 3275,
+        577: 3274, 2144: 3272, 3136: 3272, 400: 3275,
+        4480: 3271, 580: 3274, 4736: 3271, 416: 3275,
+        1156: 3273, 2128: 3272, 5248: 3271, 1344: 3273,
+        1600: 3273, 448: 3275, 1184: 3273, 2180: 3272,
+        1089: 3273, 1072: 3273, 4192: 3271, 6272: 3271,
+        2368: 3272, 4384: 3271, 2624: 3272, 5121: 3271,
+        1104: 3273, 3104: 3272, 2113: 3272, 2096: 3272,
+        4176: 3271, 1312: 3273, 545: 3274, 1568: 3273,
+        84: 3277 },
+        11: { 32: 3278, 128: 3276, 4096: 3271, 4: 3280,
+        1024: 3273, 64: 3277, 256: 3275, 16: 3279,
+        512: 3274, 2048: 3272 },
+        12: { 3584: 3261, 3073: 3261, 5122: 3260, 1027: 3262,
+        4609: 3260, 5152: 3260, 273: 3264, 4610: 3260,
+        1296: 3262, 2336: 3261, 1552: 3262, 4113: 3260,
+        530: 3263, 19: 1608, 2592: 3261, 4672: 3260,
+        1568: 3262, 1057: 3262, 2082: 3261, 35: 3267,
+        1041: 3262, 4144: 3260, 5184: 3260, 3328: 3261,
+        2320: 3261, 560: 3263, 49: 3267, 50: 1607,
+        2576: 3261, 769: 3263, 1600: 3262, 4161: 3260,
+        2114: 3261, 67: 3266, 2065: 3261, 3088: 3261,
+        6208: 3260, 1281: 3262, 224: 3265, 4384: 3260,
+        592: 3263, 81: 3266, 82: 3266, 1537: 3262,
+        4416: 3260, 4640: 3260, 770: 3263, 2816: 3261,
+        546: 3263, 97: 3266, 98: 3266, 4129: 3260,
+        529: 3263, 1282: 3262, 2305: 3261, 4114: 3260,
+        4368: 3260, 112: 1606, 1538: 3262, 2561: 3261,
+        4624: 3260, 1664: 3262, 4225: 3260, 1154: 3262,
+        131: 3265, 5136: 3260, 6176: 3260, 656: 3263,
+        145: 3265, 146: 3265, 4130: 3260, 4864: 3260,
+        2051: 3261, 161: 3265, 3074: 3261, 6160: 3260,
+        1216: 3262, 5376: 3260, 176: 3265, 5632: 3260,
+        608: 3263, 704: 3263, 193: 3265, 194: 3265,
+        5121: 3260, 2081: 3261, 4354: 3260, 2240: 3261,
+        1058: 3262, 6400: 3260, 208: 3265, 6656: 3260,
+        2562: 3261, 4099: 1609, 4226: 3260, 6145: 3260,
+        7168: 3260, 1184: 3262, 515: 3263, 1792: 3262,
+        4353: 3260, 2306: 3261, 259: 3264, 641: 3263,
+        2208: 3261, 4288: 3260, 2178: 3261, 784: 3263,
+        6146: 3260, 274: 3264, 3200: 3261, 800: 3263,
+        1072: 3262, 290: 3264, 2192: 3261, 304: 3264,
+        1408: 3262, 832: 3263, 321: 3264, 322: 3264,
+        1153: 3262, 4256: 3260, 1042: 3262, 336: 3264,
+        2432: 3261, 642: 3263, 4162: 3260, 2688: 3261,
+        352: 3264, 1168: 3262, 2177: 3261, 1120: 3262,
+        4240: 3260, 3104: 3261, 896: 3263, 385: 3264,
+        386: 3264, 577: 3263, 2144: 3261, 3136: 3261,
+        578: 3263, 400: 3264, 4480: 3260, 4736: 3260,
+        416: 3264, 2066: 3261, 2128: 3261, 5248: 3260,
+        1344: 3262, 448: 3264, 672: 3263, 1089: 3262,
+        4192: 3260, 6272: 3260, 162: 3265, 2368: 3261,
+        2624: 3261, 1104: 3262, 1090: 3262, 2113: 3261,
+        2096: 3261, 4176: 3260, 289: 3264, 1312: 3262,
+        545: 3263 },
+        2050: { 5632: 2699, 4609: 2699, 5124: 2699, 4101: 2699,
+        5121: 2699, 1544: 2700, 4105: 2699, 1036: 2700,
+        13: 2707, 1296: 2700, 1552: 2700, 4113: 2699,
+        532: 2701, 21: 2706, 536: 2701, 772: 2701,
+        28: 2706, 517: 2701, 1092: 2700, 1057: 2700,
+        4132: 2699, 37: 2705, 4144: 2699, 552: 2701,
+        41: 2705, 44: 2705, 5152: 2699, 560: 2701,
+        49: 2705, 52: 2705, 1033: 2700, 56: 2705,
+        1600: 2700, 4161: 2699, 4164: 2699, 69: 2704,
+        4288: 2699, 584: 2701, 73: 2704, 1281: 2700,
+        548: 2701, 592: 2701, 81: 2704, 1537: 2700,
+        4416: 2699, 4640: 2699, 88: 2704, 1060: 2700,
+        608: 2701, 97: 2704, 100: 2704, 529: 2701,
+        1041: 2700, 104: 2704, 4368: 2699, 112: 2704,
+        4624: 2699, 4116: 2699, 4232: 2699, 4672: 2699,
+        1044: 2700, 1664: 2700, 4225: 2699, 4228: 2699,
+        133: 2703, 5136: 2699, 648: 2701, 137: 2703,
+        140: 2703, 656: 2701, 145: 2703, 148: 2703,
+        25: 2706, 152: 2703, 4864: 2699, 672: 2701,
+        161: 2703, 164: 2703, 1284: 2700, 168: 2703,
+        4353: 2699, 1540: 2700, 176: 2703, 1029: 2700,
+        704: 2701, 193: 2703, 196: 2703, 4129: 2699,
+        200: 2703, 5184: 2699, 208: 2703, 292: 2702,
+        224: 2703, 1064: 2700, 4192: 2699, 1048: 2700,
+        4168: 2699, 1096: 2700, 1792: 2700, 769: 2701,
+        4356: 2699, 261: 2702, 641: 2701, 776: 2701,
+        265: 2702, 268: 2702, 4612: 2699, 784: 2701,
+        273: 2702, 276: 2702, 280: 2702, 644: 2701,
+        1288: 2700, 800: 2701, 289: 2702, 521: 2701,
+        296: 2702, 304: 2702, 1160: 2700, 1408: 2700,
+        4136: 2699, 832: 2701, 321: 2702, 324: 2702,
+        1153: 2700, 4256: 2699, 336: 2702, 4120: 2699,
+        1216: 2700, 352: 2702, 1168: 2700, 1120: 2700,
+        4240: 2699, 5376: 2699, 4360: 2699, 524: 2701,
+        896: 2701, 385: 2702, 388: 2702, 4616: 2699,
+        577: 2701, 392: 2702, 400: 2702, 4480: 2699,
+        5128: 2699, 580: 2701, 4736: 2699, 416: 2702,
+        1156: 2700, 5248: 2699, 1344: 2700, 328: 2702,
+        448: 2702, 1184: 2700, 1089: 2700, 1072: 2700,
+        76: 2704, 4384: 2699, 1104: 2700, 4176: 2699,
+        4108: 2699, 1312: 2700, 545: 2701, 1568: 2700,
+        84: 2704 },
+        14: { 128: 3265, 1: 3269, 4096: 3260, 1024: 3262,
+        32: 3267, 64: 3266, 256: 3264, 16: 3268,
+        512: 3263, 2048: 3261 },
+        16: { 2048: 108, 1: 118, 2: 117, 4: 116,
+        6151: 5093, 8: 115, 6155: 5092, 6157: 5092,
+        6158: 5092, 2063: 1608, 5388: 5097, 32: 114,
+        6179: 5091, 6181: 5091, 6182: 5091, 4135: 5132,
+        6185: 5091, 6186: 5091, 4139: 5131, 6188: 5091,
+        2093: 5176, 2094: 1607, 47: 1607, 64: 113,
+        5472: 5097, 6211: 5090, 6213: 5090, 6214: 5090,
+        2119: 5173, 6217: 5090, 6218: 5090, 2123: 5172,
+        6220: 5090, 2125: 5172, 2126: 5172, 5133: 5101,
+        5134: 5101, 4452: 5114, 4111: 1608, 5254: 5098,
+        6241: 5090, 6242: 5090, 4195: 5126, 6244: 5090,
+        2149: 5171, 2150: 5171, 103: 5287, 6248: 5090,
+        2153: 5171, 2154: 5171, 107: 5286, 2156: 1606,
+        109: 1606, 110: 1606, 1384: 5195, 4300: 5120,
+        1504: 1604, 128: 112, 5824: 5096, 6275: 5089,
+        6277: 5089, 6278: 5089, 2183: 5168, 6281: 5089,
+        6282: 5089, 2187: 5167, 6284: 5089, 2189: 5167,
+        2190: 5167, 143: 1608, 4804: 5106, 6305: 5089,
+        6306: 5089, 4259: 5121, 6308: 5089, 2213: 5166,
+        2214: 5166, 167: 5277, 6312: 5089, 2217: 5166,
+        2218: 5166, 171: 5276, 2220: 5166, 173: 5276,
+        174: 1607, 4808: 5106, 6337: 5089, 6338: 5089,
+        2243: 5165, 6340: 5089, 2245: 5165, 2246: 5165,
+        199: 5273, 6344: 5089, 4297: 5120, 2250: 5165,
+        203: 5272, 2252: 5165, 205: 5272, 206: 5272,
+        6016: 5096, 5155: 5100, 4576: 1604, 5190: 5099,
+        5157: 5100, 6368: 5089, 4321: 5120, 2274: 5165,
+        227: 5271, 2276: 5165, 229: 5271, 230: 5271,
+        2280: 1605, 233: 1605, 234: 1605, 2087: 5177,
+        236: 1605, 5161: 5100, 5162: 5100, 256: 111,
+        1067: 5212, 6405: 5088, 6406: 5088, 2311: 5162,
+        6409: 5088, 6410: 5088, 4363: 5116, 6412: 5088,
+        4365: 5116, 2318: 5161, 271: 1608, 5260: 5098,
+        2435: 5158, 4142: 1607, 5508: 5097, 2437: 5158,
+        6433: 5088, 6434: 5088, 2339: 5160, 6436: 5088,
+        4389: 5115, 2342: 5160, 295: 5262, 6440: 5088,
+        4393: 5115, 2346: 5160, 299: 5261, 2348: 5160,
+        301: 5261, 302: 1607, 5512: 5097, 2441: 5158,
+        4490: 5113, 6465: 5088, 6466: 5088, 4419: 5114,
+        6468: 5088, 2373: 5159, 2374: 5159, 327: 5258,
+        6472: 5088, 4425: 5114, 2378: 5159, 331: 5257,
+        2380: 5159, 333: 5257, 334: 5257, 6496: 5088,
+        2401: 5159, 2402: 5159, 355: 5256, 2404: 5159,
+        357: 5256, 358: 5256, 2408: 5159, 361: 5256,
+        362: 5256, 364: 1606, 5536: 5097, 5127: 5102,
+        6529: 5088, 6530: 5088, 4483: 5113, 6532: 5088,
+        4485: 5113, 2438: 5158, 391: 5253, 6536: 5088,
+        4489: 5113, 2442: 5158, 395: 5252, 2444: 5158,
+        397: 5252, 398: 5252, 5196: 5099, 5187: 5099,
+        3141: 5144, 6560: 5088, 4513: 5113, 2466: 5158,
+        419: 5251, 2468: 5158, 421: 5251, 422: 5251,
+        2472: 5158, 425: 5251, 426: 5251, 4167: 5128,
+        428: 5251, 5193: 5099, 5194: 5099, 4652: 5108,
+        4993: 5105, 4545: 5113, 2498: 5158, 4171: 5127,
+        2500: 5158, 453: 5250, 454: 5250, 2465: 5158,
+        2504: 5158, 457: 5250, 458: 5250, 460: 5250,
+        4514: 5113, 4173: 5127, 4174: 5127, 4516: 5113,
+        79: 1608, 4994: 5105, 2528: 1604, 481: 1604,
+        482: 1604, 484: 1604, 488: 1604, 4449: 5114,
+        5131: 5101, 4520: 5113, 512: 110, 6659: 5087,
+        6661: 5087, 6662: 5087, 3841: 5141, 6665: 5087,
+        6666: 5087, 2571: 5154, 6668: 5087, 4621: 5109,
+        2574: 5154, 527: 1608, 4867: 5105, 5892: 5096,
+        4869: 5105, 6689: 5087, 6690: 5087, 2595: 5153,
+        6692: 5087, 4645: 5108, 2598: 5153, 551: 5241,
+        6696: 5087, 4649: 5108, 2602: 5153, 555: 5240,
+        2604: 5153, 557: 5240, 558: 1607, 5896: 5096,
+        4873: 5105, 4874: 5105, 5952: 5096, 6721: 5087,
+        6722: 5087, 2627: 5152, 6724: 5087, 2629: 5152,
+        2630: 5152, 583: 5237, 6728: 5087, 4681: 5107,
+        2634: 5152, 587: 5236, 2636: 5152, 589: 5236,
+        590: 5236, 2147: 5171, 5220: 5099, 4197: 5126,
+        6752: 5087, 4705: 5107, 2658: 5152, 611: 5235,
+        2660: 5152, 613: 5235, 614: 5235, 2664: 5152,
+        617: 5235, 618: 5235, 620: 1606, 5224: 5099,
+        4201: 5126, 4202: 5126, 6785: 5087, 6786: 5087,
+        2691: 5151, 6788: 5087, 4741: 5106, 2694: 5151,
+        2497: 5158, 6792: 5087, 2697: 5151, 2698: 5151,
+        651: 5231, 2700: 5151, 653: 5231, 654: 5231,
+        5000: 5105, 451: 5250, 4548: 5113, 6816: 5087,
+        2721: 5151, 2722: 5151, 675: 5230, 2724: 5151,
+        677: 5230, 678: 5230, 2728: 5151, 681: 5230,
+        682: 5230, 684: 5230, 4552: 5113, 6848: 5087,
+        2753: 5151, 2754: 5151, 707: 5229, 2756: 5151,
+        709: 5229, 710: 5229, 4897: 5105, 2760: 5151,
+        713: 5229, 714: 5229, 716: 5229, 4898: 5105,
+        4900: 5105, 2784: 5151, 737: 5229, 738: 5229,
+        740: 5229, 3169: 5144, 744: 1605, 5344: 5098,
+        1832: 5186, 5890: 5096, 6913: 5087, 6914: 5087,
+        2819: 5150, 6916: 5087, 2821: 5150, 2822: 5150,
+        775: 5226, 6920: 5087, 2825: 5150, 2826: 5150,
+        779: 5225, 2828: 5150, 781: 5225, 782: 5225,
+        3203: 5143, 5253: 5098, 6944: 5087, 2849: 5150,
+        2850: 5150, 803: 5224, 2852: 5150, 805: 5224,
+        806: 5224, 2856: 5150, 809: 5224, 810: 5224,
+        4231: 5123, 812: 5224, 5257: 5098, 4801: 5106,
+        5258: 5098, 6976: 5087, 4929: 5105, 2882: 5150,
+        4235: 5122, 2884: 5150, 837: 5223, 838: 5223,
+        2888: 5150, 841: 5223, 842: 5223, 844: 5223,
+        4237: 5122, 4870: 5105, 4238: 5122, 4802: 5106,
+        4450: 5114, 2912: 5150, 865: 5223, 866: 5223,
+        868: 5223, 872: 5223, 7040: 5087, 2945: 5150,
+        2946: 5150, 899: 5222, 2948: 5150, 901: 5222,
+        902: 5222, 2881: 5150, 2952: 5150, 905: 5222,
+        906: 5222, 908: 5222, 4930: 5105, 835: 5223,
+        4932: 5105, 2976: 5150, 929: 5222, 930: 5222,
+        932: 5222, 936: 5222, 4936: 5105, 4396: 5115,
+        3008: 5150, 961: 5222, 962: 5222, 964: 5222,
+        5281: 5098, 968: 5222, 5282: 5098, 2211: 5166,
+        1984: 1602, 5284: 5098, 4261: 5121, 992: 1603,
+        4262: 5121, 5288: 5098, 4265: 5121, 4266: 5121,
+        1024: 109, 7171: 5086, 7173: 5086, 7174: 5086,
+        3079: 5147, 7177: 5086, 7178: 5086, 3083: 5146,
+        7180: 5086, 3085: 5146, 3086: 5146, 1039: 1608,
+        5635: 5096, 5637: 5096, 7201: 5086, 7202: 5086,
+        3107: 5145, 7204: 5086, 3109: 5145, 3110: 5145,
+        1063: 5213, 7208: 5086, 3113: 5145, 3114: 5145,
+        2567: 5155, 3116: 5145, 1069: 5212, 1070: 1607,
+        5641: 5096, 5642: 5096, 7233: 5086, 7234: 5086,
+        3139: 5144, 7236: 5086, 5189: 5099, 3142: 5144,
+        1095: 5209, 7240: 5086, 3145: 5144, 3146: 5144,
+        1099: 5208, 3148: 5144, 1101: 5208, 1102: 5208,
+        2573: 5154, 4622: 5109, 7264: 5086, 5217: 5099,
+        3170: 5144, 1123: 5207, 3172: 5144, 1125: 5207,
+        1126: 5207, 3176: 5144, 1129: 5207, 1130: 5207,
+        1132: 1606, 4198: 5126, 7297: 5086, 7298: 5086,
+        5251: 5098, 7300: 5086, 3205: 5143, 3206: 5143,
+        5313: 5098, 7304: 5086, 3209: 5143, 3210: 5143,
+        1163: 5203, 3212: 5143, 1165: 5203, 1166: 5203,
+        4291: 5120, 5316: 5098, 4293: 5120, 7328: 5086,
+        3233: 5143, 3234: 5143, 1187: 5202, 3236: 5143,
+        1189: 5202, 1190: 5202, 3240: 5143, 1193: 5202,
+        1194: 5202, 1196: 5202, 4876: 5105, 5320: 5098,
+        4268: 5121, 2249: 5165, 4298: 5120, 5218: 5099,
+        7360: 5086, 3265: 5143, 3266: 5143, 1219: 5201,
+        3268: 5143, 1221: 5201, 1222: 5201, 3617: 5141,
+        3272: 5143, 1225: 5201, 1226: 5201, 1228: 5201,
+        5666: 5096, 4643: 5108, 5668: 5096, 2597: 5153,
+        3296: 5143, 1249: 5201, 1250: 5201, 1252: 5201,
+        4646: 5108, 1256: 1605, 5672: 5096, 2601: 5153,
+        4650: 5108, 7425: 5086, 7426: 5086, 3331: 5142,
+        7428: 5086, 3333: 5142, 3334: 5142, 1287: 5198,
+        7432: 5086, 5385: 5097, 3338: 5142, 1291: 5197,
+        3340: 5142, 1293: 5197, 1294: 5197, 4996: 5105,
+        5158: 5100, 7456: 5086, 5409: 5097, 3362: 5142,
+        1315: 5196, 3364: 5142, 1317: 5196, 1318: 5196,
+        3368: 5142, 1321: 5196, 1322: 5196, 1324: 5196,
+        4096: 107, 4204: 1606, 5568: 5097, 7488: 5086,
+        3393: 5142, 3394: 5142, 1347: 5195, 3396: 5142,
+        1349: 5195, 1350: 5195, 2273: 5165, 3400: 5142,
+        1353: 5195, 1354: 5195, 1356: 5195, 4322: 5120,
+        4546: 5113, 2091: 5176, 6592: 5088, 4324: 5120,
+        3424: 5142, 1377: 5195, 1378: 5195, 5024: 5105,
+        1380: 5195, 4615: 5110, 5638: 5096, 4328: 1605,
+        7552: 5086, 5505: 5097, 3458: 5142, 1411: 5194,
+        3460: 5142, 1413: 5194, 1414: 5194, 5697: 5096,
+        3464: 5142, 1417: 5194, 1418: 5194, 1420: 5194,
+        5698: 5096, 3457: 5142, 4675: 5107, 5700: 5096,
+        4677: 5107, 3488: 5142, 1441: 5194, 1442: 5194,
+        1444: 5194, 4678: 5107, 1448: 5194, 5704: 5096,
+        2633: 5152, 5056: 5105, 4682: 5107, 3520: 5142,
+        1473: 5194, 1474: 5194, 1476: 5194, 1480: 5194,
+        4684: 5107, 4456: 5114, 4141: 5131, 5164: 5100,
+        4619: 5109, 4960: 5105, 5506: 5097, 7681: 5086,
+        7682: 5086, 3587: 5141, 7684: 5086, 3589: 5141,
+        3590: 5141, 1543: 5191, 7688: 5086, 3593: 5141,
+        3594: 5141, 1547: 5190, 3596: 5141, 1549: 5190,
+        1550: 5190, 5379: 5097, 5644: 5096, 5381: 5097,
+        7712: 5086, 5665: 5096, 3618: 5141, 1571: 5189,
+        3620: 5141, 1573: 5189, 1574: 5189, 3624: 5141,
+        1577: 5189, 1578: 5189, 4359: 5117, 1580: 5189,
+        3337: 5142, 5386: 5097, 7744: 5086, 3649: 5141,
+        3650: 5141, 1603: 5188, 3652: 5141, 1605: 5188,
+        1606: 5188, 2657: 5152, 3656: 5141, 1609: 5188,
+        1610: 5188, 1612: 5188, 4706: 5107, 2317: 5161,
+        4366: 5116, 4708: 5107, 3680: 5141, 1633: 5188,
+        1634: 5188, 1636: 5188, 1640: 5188, 4712: 5107,
+        5920: 5096, 7808: 5086, 3713: 5141, 3714: 5141,
+        1667: 5187, 3716: 5141, 1669: 5187, 1670: 5187,
+        3720: 5141, 1673: 5187, 1674: 5187, 1676: 5187,
+        3744: 5141, 1697: 5187, 1698: 5187, 1700: 5187,
+        1704: 5187, 3776: 5141, 1729: 5187, 1730: 5187,
+        1732: 5187, 3361: 5142, 1736: 5187, 5410: 5097,
+        4387: 5115, 5412: 5097, 4832: 5106, 2341: 5160,
+        1760: 5187, 4390: 5115, 5416: 5097, 2345: 5160,
+        4492: 5113, 4394: 5115, 7936: 1600, 5889: 5096,
+        3842: 5141, 1795: 5186, 3844: 5141, 1797: 5186,
+        1798: 5186, 5761: 5096, 3848: 5141, 1801: 5186,
+        1802: 5186, 1804: 5186, 5762: 5096, 4739: 5106,
+        5764: 5096, 2693: 5151, 3872: 5141, 1825: 5186,
+        1826: 5186, 1828: 5186, 4742: 5106, 6403: 5088,
+        647: 5232, 5768: 5096, 4745: 5106, 4746: 5106,
+        3904: 5141, 1857: 5186, 1858: 5186, 1860: 5186,
+        1864: 5186, 4748: 5106, 4904: 5105, 1888: 5186,
+        5382: 5097, 4486: 5113, 5314: 5098, 3968: 1601,
+        1921: 5186, 1922: 5186, 1924: 5186, 5441: 5097,
+        1928: 5186, 5442: 5097, 2371: 5159, 2315: 5161,
+        5444: 5097, 4421: 5114, 1952: 5186, 4422: 5114,
+        5448: 5097, 2377: 5159, 4426: 5114, 4294: 5120,
+        5792: 5096, 4769: 5106, 4428: 5114, 4770: 5106,
+        4772: 5106, 4776: 5106, 5728: 5096, 1159: 5204 },
+        17: { 3584: 3250, 2816: 3250, 6146: 3249, 5124: 3249,
+        2054: 3250, 5184: 3249, 1544: 3251, 522: 3252,
+        1036: 3251, 2562: 3250, 14: 1608, 2336: 3250,
+        4416: 3249, 2592: 3250, 4672: 3249, 4356: 3249,
+        1092: 3251, 4130: 3249, 1058: 3251, 4132: 3249,
+        518: 3252, 38: 3256, 3104: 3250, 1064: 3251,
+        42: 3256, 44: 3256, 1288: 3251, 2312: 3250,
+        2184: 3250, 4106: 3249, 2116: 3250, 1120: 3251,
+        2114: 3250, 2082: 3250, 4164: 3249, 70: 3255,
+        584: 3252, 2060: 3250, 74: 3255, 76: 3255,
+        4384: 3249, 4640: 3249, 770: 3252, 1060: 3251,
+        608: 3252, 98: 3255, 100: 3255, 5152: 3249,
+        104: 3255, 1282: 3251, 3328: 3250, 1538: 3251,
+        6400: 3249, 4232: 3249, 2084: 3250, 1664: 3251,
+        1216: 3251, 2178: 3250, 2180: 3250, 134: 3254,
+        6176: 3249, 648: 3252, 138: 3254, 140: 3254,
+        2432: 3250, 4864: 3249, 672: 3252, 162: 3254,
+        164: 3254, 1284: 3251, 168: 3254, 1540: 3251,
+        5632: 3249, 2120: 3250, 704: 3252, 1312: 3251,
+        194: 3254, 196: 3254, 2308: 3250, 200: 3254,
+        4354: 3249, 2240: 3250, 546: 3252, 2564: 3250,
+        4610: 3249, 6656: 3249, 548: 3252, 1030: 3251,
+        3076: 3250, 224: 3254, 5122: 3249, 7168: 3249,
+        552: 3252, 2088: 3250, 4168: 3249, 1792: 3251,
+        1408: 3251, 2306: 3250, 772: 3252, 262: 3253,
+        776: 3252, 266: 3253, 2208: 3250, 268: 3253,
+        642: 3252, 4612: 3249, 4228: 3249, 800: 3252,
+        290: 3253, 292: 3253, 296: 3253, 3074: 3250,
+        1160: 3251, 4136: 3249, 4102: 3249, 6148: 3249,
+        832: 3252, 4288: 3249, 322: 3253, 324: 3253,
+        2568: 3250, 328: 3253, 4256: 3249, 1034: 3251,
+        3080: 3250, 2688: 3250, 352: 3253, 1154: 3251,
+        3200: 3250, 5376: 3249, 6208: 3249, 2058: 3250,
+        4360: 3249, 524: 3252, 896: 3252, 1344: 3251,
+        386: 3253, 388: 3253, 4616: 3249, 392: 3253,
+        2144: 3250, 4162: 3249, 644: 3252, 5128: 3249,
+        580: 3252, 4736: 3249, 416: 3253, 1156: 3251,
+        5248: 3249, 1096: 3251, 6152: 3249, 1600: 3251,
+        448: 3253, 1184: 3251, 4226: 3249, 4192: 3249,
+        6272: 3249, 2368: 3250, 578: 3252, 2624: 3250,
+        4480: 3249, 1090: 3251, 3136: 3250, 4108: 3249,
+        1568: 3251 },
+        18: { 3584: 3239, 3073: 3239, 5124: 3238, 4101: 3238,
+        4609: 3238, 1544: 3240, 4105: 3238, 1036: 3240,
+        13: 1608, 2336: 3239, 4416: 3238, 2592: 3239,
+        4672: 3238, 772: 3241, 517: 3241, 1092: 3240,
+        1057: 3240, 4132: 3238, 37: 3245, 3104: 3239,
+        1064: 3240, 41: 3245, 44: 1607, 1288: 3240,
+        521: 3241, 2312: 3239, 2184: 3239, 769: 3241,
+        2116: 3239, 4161: 3238, 6400: 3238, 4164: 3238,
+        69: 3244, 4288: 3238, 584: 3241, 73: 3244,
+        76: 3244, 4384: 3238, 1537: 3240, 4640: 3238,
+        2816: 3239, 1060: 3240, 608: 3241, 97: 3244,
+        100: 3244, 4129: 3238, 5152: 3238, 104: 3244,
+        2305: 3239, 3328: 3239, 2561: 3239, 4232: 3238,
+        2084: 3239, 1664: 3240, 4225: 3238, 4228: 3238,
+        133: 3243, 6176: 3238, 648: 3241, 137: 3243,
+        140: 3243, 1096: 3240, 4864: 3238, 672: 3241,
+        161: 3243, 164: 3243, 1284: 3240, 168: 3243,
+        4353: 3238, 1540: 3240, 5184: 3238, 5632: 3238,
+        2120: 3239, 1029: 3240, 704: 3241, 193: 3243,
+        196: 3243, 2308: 3239, 2081: 3239, 200: 3243,
+        2240: 3239, 2564: 3239, 6656: 3238, 548: 3241,
+        2053: 3239, 3076: 3239, 224: 3243, 6145: 3238,
+        7168: 3238, 552: 3241, 2088: 3239, 4168: 3238,
+        1792: 3240, 1281: 3240, 4356: 3238, 261: 3242,
+        641: 3241, 776: 3241, 265: 3242, 2208: 3239,
+        268: 3242, 4612: 3238, 644: 3241, 800: 3241,
+        289: 3242, 292: 3242, 296: 3242, 1160: 3240,
+        1408: 3240, 1033: 3240, 4136: 3238, 6148: 3238,
+        832: 3241, 321: 3242, 324: 3242, 2568: 3239,
+        1153: 3240, 4256: 3238, 2432: 3239, 2057: 3239,
+        3080: 3239, 2688: 3239, 1216: 3240, 352: 3242,
+        2177: 3239, 1120: 3240, 3200: 3239, 5376: 3238,
+        6208: 3238, 4360: 3238, 524: 3241, 896: 3241,
+        385: 3242, 388: 3242, 4616: 3238, 577: 3241,
+        392: 3242, 2144: 3239, 4480: 3238, 5128: 3238,
+        580: 3241, 4736: 3238, 416: 3242, 1156: 3240,
+        5248: 3238, 2060: 3239, 1344: 3240, 328: 3242,
+        6152: 3238, 1600: 3240, 448: 3242, 1184: 3240,
+        2180: 3239, 1089: 3240, 4192: 3238, 6272: 3238,
+        2368: 3239, 2624: 3239, 5121: 3238, 2113: 3239,
+        3136: 3239, 4108: 3238, 1312: 3240, 545: 3241,
+        1568: 3240 },
+        19: { 32: 3245, 128: 3243, 4096: 3238, 4: 3247,
+        1024: 3240, 8: 3246, 64: 3244, 256: 3242,
+        512: 3241, 2048: 3239 },
+        20: { 3584: 3228, 3073: 3228, 6146: 3227, 1027: 3229,
+        4609: 3227, 1544: 3229, 2057: 3228, 4106: 3227,
+        11: 1608, 2562: 3228, 2336: 3228, 4416: 3227,
+        2051: 3228, 2592: 3228, 4672: 3227, 1568: 3229,
+        1057: 3229, 4130: 3227, 35: 3234, 2081: 3228,
+        3104: 3228, 1064: 3229, 41: 3234, 42: 1607,
+        1288: 3229, 521: 3230, 2184: 3228, 769: 3230,
+        522: 3230, 1600: 3229, 4161: 3227, 2114: 3228,
+        67: 3233, 4162: 3227, 584: 3230, 73: 3233,
+        74: 3233, 1281: 3229, 224: 3232, 4384: 3227,
+        1537: 3229, 4640: 3227, 770: 3230, 2816: 3228,
+        546: 3230, 97: 3233, 98: 3233, 4129: 3227,
+        5152: 3227, 104: 1606, 1282: 3229, 2305: 3228,
+        3328: 3228, 515: 3230, 1538: 3229, 2561: 3228,
+        6400: 3227, 4232: 3227, 1664: 3229, 4225: 3227,
+        1154: 3229, 131: 3232, 6176: 3227, 648: 3230,
+        137: 3232, 138: 3232, 1096: 3229, 2432: 3228,
+        4864: 3227, 672: 3230, 161: 3232, 162: 3232,
+        168: 3232, 1216: 3229, 5376: 3227, 1058: 3229,
+        3080: 3228, 5632: 3227, 2120: 3228, 704: 3230,
+        193: 3232, 194: 3232, 5121: 3227, 545: 3230,
+        200: 3232, 4354: 3227, 2240: 3228, 2082: 3228,
+        5184: 3227, 4610: 3227, 6656: 3227, 4099: 3227,
+        5122: 3227, 4226: 3227, 6145: 3227, 7168: 3227,
+        552: 3230, 2088: 3228, 4168: 3227, 1792: 3229,
+        4353: 3227, 2306: 3228, 259: 3231, 641: 3230,
+        776: 3230, 265: 3231, 266: 3231, 2208: 3228,
+        4288: 3227, 2178: 3228, 800: 3230, 289: 3231,
+        290: 3231, 296: 3231, 3074: 3228, 1160: 3229,
+        1408: 3229, 1033: 3229, 4136: 3227, 2312: 3228,
+        832: 3230, 321: 3231, 322: 3231, 2568: 3228,
+        1153: 3229, 4256: 3227, 1034: 3229, 642: 3230,
+        608: 3230, 2688: 3228, 352: 3231, 2177: 3228,
+        1120: 3229, 3200: 3228, 6208: 3227, 2058: 3228,
+        4360: 3227, 896: 3230, 385: 3231, 386: 3231,
+        4616: 3227, 577: 3230, 392: 3231, 2144: 3228,
+        578: 3230, 4480: 3227, 4105: 3227, 5128: 3227,
+        4736: 3227, 416: 3231, 5248: 3227, 1344: 3229,
+        328: 3231, 6152: 3227, 448: 3231, 1184: 3229,
+        1089: 3229, 4192: 3227, 6272: 3227, 2368: 3228,
+        2624: 3228, 1090: 3229, 2113: 3228, 3136: 3228,
+        1312: 3229 },
+        21: { 32: 3234, 128: 3232, 2: 3236, 4096: 3227,
+        1024: 3229, 8: 3235, 64: 3233, 256: 3231,
+        512: 3230, 2048: 3228 },
+        22: { 128: 3232, 1: 3236, 4096: 3227, 1024: 3229,
+        32: 3234, 8: 3235, 64: 3233, 256: 3231,
+        512: 3230, 2048: 3228 },
+        24: { 3584: 3217, 3073: 3217, 6146: 3216, 1027: 3218,
+        1540: 3218, 4101: 3216, 4102: 3216, 7: 1608,
+        2562: 3217, 4228: 3216, 4416: 3216, 2051: 3217,
+        2592: 3217, 4672: 3216, 1284: 3218, 517: 3219,
+        1092: 3218, 1057: 3218, 4130: 3216, 35: 3223,
+        548: 3219, 37: 3223, 38: 1607, 3104: 3217,
+        5184: 3216, 769: 3219, 2116: 3217, 4161: 3216,
+        2114: 3217, 67: 3222, 4162: 3216, 69: 3222,
+        70: 3222, 6208: 3216, 1281: 3218, 224: 1605,
+        2336: 3217, 4384: 3216, 1537: 3218, 4640: 3216,
+        770: 3219, 2816: 3217, 546: 3219, 97: 3222,
+        98: 3222, 100: 1606, 4129: 3216, 5152: 3216,
+        1282: 3218, 2305: 3217, 3328: 3217, 515: 3219,
+        1538: 3218, 2561: 3217, 6400: 3216, 2084: 3217,
+        4164: 3216, 4225: 3216, 1154: 3218, 131: 3221,
+        644: 3219, 133: 3221, 134: 3221, 6176: 3216,
+        196: 3221, 2432: 3217, 4864: 3216, 672: 3219,
+        161: 3221, 162: 3221, 164: 3221, 1216: 3218,
+        5376: 3216, 4609: 3216, 5632: 3216, 1029: 3218,
+        4132: 3216, 704: 3219, 193: 3221, 194: 3221,
+        5121: 3216, 2308: 3217, 2081: 3217, 518: 3219,
+        2240: 3217, 1058: 3218, 2564: 3217, 4610: 3216,
+        6656: 3216, 1060: 3218, 1030: 3218, 2053: 3217,
+        3076: 3217, 4099: 3216, 5122: 3216, 4226: 3216,
+        6145: 3216, 7168: 3216, 2054: 3217, 1792: 3218,
+        4353: 3216, 2306: 3217, 259: 3220, 772: 3219,
+        261: 3220, 262: 3220, 641: 3219, 2208: 3217,
+        4288: 3216, 2178: 3217, 4612: 3216, 1156: 3218,
+        5124: 3216, 800: 3219, 289: 3220, 290: 3220,
+        4356: 3216, 292: 3220, 3074: 3217, 1408: 3218,
+        1664: 3218, 6148: 3216, 832: 3219, 321: 3220,
+        322: 3220, 324: 3220, 1153: 3218, 4256: 3216,
+        2082: 3217, 642: 3219, 608: 3219, 2688: 3217,
+        352: 3220, 2177: 3217, 1120: 3218, 3200: 3217,
+        896: 3219, 385: 3220, 386: 3220, 388: 3220,
+        577: 3219, 2144: 3217, 578: 3219, 4480: 3216,
+        580: 3219, 4736: 3216, 416: 3220, 5248: 3216,
+        1344: 3218, 1600: 3218, 448: 3220, 1184: 3218,
+        2180: 3217, 1089: 3218, 4192: 3216, 6272: 3216,
+        2368: 3217, 1568: 3218, 2624: 3217, 1090: 3218,
+        2113: 3217, 3136: 3217, 1312: 3218, 545: 3219,
+        4354: 3216 },
+        25: { 32: 3223, 64: 3222, 2: 3225, 4096: 3216,
+        4: 3224, 1024: 3218, 128: 3221, 256: 3220,
+        512: 3219, 2048: 3217 },
+        26: { 32: 3223, 1: 3225, 4096: 3216, 4: 3224,
+        1024: 3218, 64: 3222, 128: 3221, 256: 3220,
+        512: 3219, 2048: 3217 },
+        28: { 32: 3223, 1: 3224, 2: 3224, 4096: 3216,
+        1024: 3218, 64: 3222, 128: 3221, 256: 3220,
+        512: 3219, 2048: 3217 },
+        2053: { 128: 2692, 64: 2693, 2: 2697, 4096: 2688,
+        1024: 2689, 32: 2694, 8: 2696, 256: 2691,
+        16: 2695, 512: 2690 },
+        32: { 2048: 96, 1: 106, 2: 105, 4: 104,
+        6151: 4873, 8: 103, 6155: 4872, 6157: 4872,
+        6158: 4872, 2063: 4960, 5456: 4877, 4440: 4894,
+        6163: 4871, 6165: 4871, 6166: 4871, 2071: 4957,
+        6169: 4871, 6170: 4871, 4123: 4911, 6172: 4871,
+        4125: 4911, 4126: 1607, 31: 1607, 5142: 4880,
+        5127: 4882, 64: 101, 6211: 4870, 6213: 4870,
+        6214: 4870, 2119: 4953, 6217: 4870, 6218: 4870,
+        4171: 4907, 6220: 4870, 2125: 4952, 2126: 4952,
+        5133: 4881, 6225: 4870, 6226: 4870, 2131: 4951,
+        6228: 4870, 2133: 4951, 2134: 4951, 87: 5067,
+        6232: 4870, 2137: 4951, 2138: 4951, 4111: 1609,
+        2140: 1606, 93: 1606, 94: 1606, 16: 102,
+        4504: 4893, 5139: 4880, 4300: 4900, 5141: 4880,
+        128: 100, 5824: 4876, 6275: 4869, 6277: 4869,
+        6278: 4869, 2183: 4948, 6281: 4869, 6282: 4869,
+        2187: 4947, 6284: 4869, 2189: 4947, 2190: 4947,
+        143: 5060, 6289: 4869, 6290: 4869, 2195: 4946,
+        6292: 4869, 4245: 4901, 2198: 4946, 151: 5057,
+        6296: 4869, 2201: 4946, 2202: 4946, 155: 5056,
+        2204: 4946, 157: 5056, 158: 1607, 2075: 4956,
+        5148: 4880, 2077: 4956, 1736: 4967, 2078: 1607,
+        6337: 4869, 6338: 4869, 2243: 4945, 6340: 4869,
+        2245: 4945, 2246: 4945, 199: 5053, 6344: 4869,
+        4297: 4900, 2250: 4945, 203: 5052, 2252: 4945,
+        205: 5052, 206: 5052, 6352: 4869, 2257: 4945,
+        2258: 4945, 211: 5051, 2260: 4945, 213: 5051,
+        214: 5051, 2264: 1605, 217: 1605, 218: 1605,
+        220: 1605, 4816: 4886, 6418: 4868, 256: 99,
+        6403: 4868, 6405: 4868, 6406: 4868, 2311: 4942,
+        6409: 4868, 6410: 4868, 4363: 4896, 6412: 4868,
+        4365: 4896, 2318: 4941, 271: 5045, 6417: 4868,
+        2123: 4952, 2323: 4940, 6420: 4868, 2325: 4940,
+        2326: 4940, 279: 5042, 6424: 4868, 2329: 4940,
+        2330: 4940, 283: 5041, 2332: 4940, 285: 5041,
+        286: 1607, 2437: 4938, 4374: 4895, 5056: 1603,
+        4486: 4893, 5512: 4877, 2441: 4938, 4490: 4893,
+        6465: 4868, 6466: 4868, 2371: 4939, 6468: 4868,
+        2373: 4939, 2374: 4939, 327: 5038, 6472: 4868,
+        4425: 4894, 2378: 4939, 331: 5037, 2380: 4939,
+        333: 5037, 334: 5037, 6480: 4868, 4433: 4894,
+        2386: 4939, 339: 5036, 2388: 4939, 341: 5036,
+        342: 5036, 2392: 4939, 345: 5036, 346: 5036,
+        348: 1606, 5520: 4877, 4497: 4893, 4498: 4893,
+        403: 5031, 4500: 4893, 5400: 4877, 2945: 4930,
+        6529: 4868, 6530: 4868, 4483: 4893, 6532: 4868,
+        4485: 4893, 2438: 4938, 391: 5033, 6536: 4868,
+        4489: 4893, 2442: 4938, 395: 5032, 2444: 4938,
+        397: 5032, 398: 5032, 5196: 4879, 2449: 4938,
+        2450: 4938, 5187: 4879, 2452: 4938, 405: 5031,
+        406: 5031, 2456: 4938, 409: 5031, 410: 5031,
+        412: 5031, 5189: 4879, 5190: 4879, 4167: 4908,
+        5193: 4879, 5194: 4879, 6592: 4868, 2497: 4938,
+        2498: 4938, 451: 5030, 2500: 4938, 453: 5030,
+        454: 5030, 2504: 4938, 457: 5030, 458: 5030,
+        460: 5030, 4173: 4907, 2512: 1604, 465: 1604,
+        466: 1604, 468: 1604, 4174: 4907, 472: 1604,
+        79: 5070, 4312: 1605, 4994: 4885, 3153: 4924,
+        4804: 4886, 5202: 4879, 5131: 4881, 4179: 4906,
+        5204: 4879, 4181: 4906, 512: 98, 6659: 4867,
+        6661: 4867, 6662: 4867, 3841: 4921, 6665: 4867,
+        6666: 4867, 2571: 4934, 6668: 4867, 4621: 4889,
+        2574: 4934, 527: 5024, 6673: 4867, 6674: 4867,
+        4627: 4888, 6676: 4867, 2581: 4933, 2582: 4933,
+        535: 5021, 6680: 4867, 2585: 4933, 2586: 4933,
+        539: 5020, 2588: 4933, 541: 5020, 542: 1607,
+        4869: 4885, 91: 5066, 4870: 4885, 4188: 1606,
+        5896: 4876, 4873: 4885, 4874: 4885, 5952: 4876,
+        6721: 4867, 6722: 4867, 2627: 4932, 6724: 4867,
+        2629: 4932, 2630: 4932, 583: 5017, 6728: 4867,
+        4681: 4887, 5134: 4881, 587: 5016, 2636: 4932,
+        589: 5016, 590: 5016, 6736: 4867, 4689: 4887,
+        2642: 4932, 595: 5015, 2644: 4932, 597: 5015,
+        598: 5015, 2648: 4932, 601: 5015, 602: 5015,
+        604: 1606, 4808: 4886, 5904: 4876, 4881: 4885,
+        4882: 4885, 787: 5004, 2836: 4930, 5272: 4878,
+        6785: 4867, 6786: 4867, 2691: 4931, 6788: 4867,
+        4741: 4886, 2694: 4931, 4545: 4893, 6792: 4867,
+        2697: 4931, 2698: 4931, 651: 5011, 2700: 4931,
+        653: 5011, 654: 5011, 6800: 4867, 2705: 4931,
+        2706: 4931, 659: 5010, 2708: 4931, 661: 5010,
+        662: 5010, 2712: 4931, 665: 5010, 666: 5010,
+        4246: 4901, 4182: 4906, 4096: 95, 4552: 4893,
+        6848: 4867, 2753: 4931, 2754: 4931, 707: 5009,
+        2756: 4931, 709: 5009, 710: 5009, 2760: 4931,
+        713: 5009, 714: 5009, 716: 5009, 2768: 4931,
+        721: 5009, 722: 5009, 724: 5009, 728: 1605,
+        1488: 1604, 4185: 4906, 4867: 4885, 5890: 4876,
+        6913: 4867, 6914: 4867, 2819: 4930, 6916: 4867,
+        2821: 4930, 2822: 4930, 775: 5006, 6920: 4867,
+        2825: 4930, 2826: 4930, 779: 5005, 2828: 4930,
+        781: 5005, 782: 5005, 6928: 4867, 2833: 4930,
+        2834: 4930, 3203: 4923, 4186: 4906, 789: 5004,
+        790: 5004, 2840: 4930, 793: 5004, 794: 5004,
+        796: 5004, 3205: 4923, 5254: 4878, 4231: 4903,
+        5892: 4876, 5257: 4878, 4119: 4912, 4801: 4886,
+        5258: 4878, 6976: 4867, 4929: 4885, 2882: 4930,
+        4235: 4902, 2884: 4930, 837: 5003, 838: 5003,
+        2888: 4930, 841: 5003, 842: 5003, 844: 5003,
+        4237: 4902, 2896: 4930, 849: 5003, 850: 5003,
+        852: 5003, 4238: 4902, 4802: 4886, 5388: 4877,
+        5265: 4878, 5266: 4878, 4243: 4901, 5268: 4878,
+        2197: 4946, 7040: 4867, 4993: 4885, 2946: 4930,
+        899: 5002, 2948: 4930, 901: 5002, 902: 5002,
+        2881: 4930, 2952: 4930, 905: 5002, 906: 5002,
+        908: 5002, 4930: 4885, 2960: 4930, 913: 5002,
+        914: 5002, 835: 5003, 5145: 4880, 4249: 4901,
+        920: 5002, 4932: 4885, 4250: 4901, 4252: 4901,
+        4936: 4885, 5146: 4880, 3008: 1603, 961: 1603,
+        962: 1603, 964: 1603, 968: 1603, 976: 1603,
+        4944: 4885, 1024: 97, 7171: 4866, 7173: 4866,
+        7174: 4866, 3079: 4927, 7177: 4866, 7178: 4866,
+        3083: 4926, 7180: 4866, 3085: 4926, 3086: 4926,
+        1039: 4996, 7185: 4866, 7186: 4866, 3091: 4925,
+        7188: 4866, 3093: 4925, 3094: 4925, 1047: 4993,
+        7192: 4866, 3097: 4925, 3098: 4925, 1051: 4992,
+        3100: 4925, 1053: 4992, 1054: 1607, 5637: 4876,
+        4876: 4885, 5638: 4876, 2567: 4935, 5641: 4876,
+        5642: 4876, 7233: 4866, 7234: 4866, 3139: 4924,
+        7236: 4866, 3141: 4924, 3142: 4924, 1095: 4989,
+        7240: 4866, 3145: 4924, 3146: 4924, 1099: 4988,
+        3148: 4924, 1101: 4988, 1102: 4988, 2573: 4934,
+        7248: 4866, 5201: 4879, 3154: 4924, 1107: 4987,
+        3156: 4924, 1109: 4987, 1110: 4987, 3160: 4924,
+        1113: 4987, 1114: 4987, 1116: 1606, 3601: 4921,
+        5650: 4876, 856: 5003, 2579: 4933, 5652: 4876,
+        4629: 4888, 7297: 4866, 7298: 4866, 5251: 4878,
+        7300: 4866, 5253: 4878, 3206: 4923, 3265: 4923,
+        7304: 4866, 3209: 4923, 3210: 4923, 1163: 4983,
+        3212: 4923, 1165: 4983, 1166: 4983, 7312: 4866,
+        3217: 4923, 3218: 4923, 1171: 4982, 3220: 4923,
+        1173: 4982, 1174: 4982, 4633: 4888, 3224: 4923,
+        1177: 4982, 1178: 4982, 1180: 4982, 4634: 4888,
+        4293: 4900, 4996: 4885, 4294: 4900, 4636: 4888,
+        5320: 4878, 2249: 4945, 4298: 4900, 7360: 4866,
+        5313: 4878, 3266: 4923, 1219: 4981, 3268: 4923,
+        1221: 4981, 1222: 4981, 3272: 4923, 1225: 4981,
+        1226: 4981, 1228: 4981, 3280: 4923, 1233: 4981,
+        1234: 4981, 1236: 4981, 1240: 1605, 5328: 4878,
+        4305: 4900, 4306: 4900, 4884: 4885, 4308: 4900,
+        7425: 4866, 7426: 4866, 5379: 4877, 7428: 4866,
+        3333: 4922, 3334: 4922, 1287: 4978, 7432: 4866,
+        3337: 4922, 3338: 4922, 1291: 4977, 3340: 4922,
+        1293: 4977, 1294: 4977, 5635: 4876, 3345: 4922,
+        3346: 4922, 1299: 4976, 3348: 4922, 1301: 4976,
+        1302: 4976, 3352: 4922, 1305: 4976, 1306: 4976,
+        1308: 4976, 5000: 4885, 5568: 4877, 7488: 4866,
+        3393: 4922, 3394: 4922, 1347: 4975, 4682: 4887,
+        1349: 4975, 1350: 4975, 3400: 4922, 1353: 4975,
+        1354: 4975, 1356: 4975, 4546: 4893, 1361: 4975,
+        1362: 4975, 1364: 4975, 1368: 4975, 5260: 4878,
+        5008: 4885, 4615: 4890, 4888: 4885, 916: 5002,
+        7552: 4866, 3457: 4922, 3458: 4922, 1411: 4974,
+        3460: 4922, 1413: 4974, 1414: 4974, 5697: 4876,
+        3464: 4922, 1417: 4974, 1418: 4974, 1420: 4974,
+        5698: 4876, 3472: 4922, 1425: 4974, 1426: 4974,
+        4675: 4887, 1428: 4974, 1432: 4974, 5700: 4876,
+        4677: 4887, 4678: 4887, 2435: 4938, 6016: 4876,
+        5704: 4876, 2633: 4932, 2634: 4932, 3520: 4922,
+        1473: 4974, 1474: 4974, 1476: 4974, 1480: 4974,
+        4684: 4887, 5505: 4877, 4548: 4893, 4619: 4889,
+        5712: 4876, 2641: 4932, 4690: 4887, 5506: 4877,
+        4692: 4887, 7681: 4866, 7682: 4866, 3587: 4921,
+        7684: 4866, 3589: 4921, 3590: 4921, 1543: 4971,
+        7688: 4866, 3593: 4921, 3594: 4921, 1547: 4970,
+        3596: 4921, 1549: 4970, 1550: 4970, 7696: 4866,
+        5649: 4876, 3602: 4921, 1555: 4969, 3604: 4921,
+        1557: 4969, 1558: 4969, 3608: 4921, 1561: 4969,
+        1562: 4969, 1564: 4969, 5644: 4876, 5381: 4877,
+        5382: 4877, 5508: 4877, 4359: 4897, 5385: 4877,
+        4622: 4889, 5386: 4877, 7744: 4866, 3649: 4921,
+        3650: 4921, 1603: 4968, 3652: 4921, 1605: 4968,
+        1606: 4968, 3656: 4921, 1609: 4968, 1610: 4968,
+        1612: 4968, 2317: 4941, 3664: 4921, 1617: 4968,
+        1618: 4968, 1620: 4968, 4366: 4896, 1624: 4968,
+        7440: 4866, 5393: 4877, 5394: 4877, 4371: 4895,
+        5396: 4877, 4373: 4895, 7808: 4866, 3713: 4921,
+        3714: 4921, 1667: 4967, 3716: 4921, 1669: 4967,
+        1670: 4967, 3720: 4921, 1673: 4967, 1674: 4967,
+        1676: 4967, 3728: 4921, 1681: 4967, 1682: 4967,
+        1684: 4967, 4377: 4895, 1688: 4967, 4378: 4895,
+        5444: 4877, 4380: 4895, 3776: 4921, 1729: 4967,
+        1730: 4967, 1732: 4967, 3331: 4922, 1744: 4967,
+        5208: 4879, 4696: 4887, 4560: 1604, 4492: 4893,
+        7936: 1600, 5889: 4876, 3842: 4921, 1795: 4966,
+        3844: 4921, 1797: 4966, 1798: 4966, 5761: 4876,
+        3848: 4921, 1801: 4966, 1802: 4966, 1804: 4966,
+        5762: 4876, 3856: 4921, 1809: 4966, 1810: 4966,
+        4739: 4886, 1812: 4966, 1816: 4966, 5764: 4876,
+        2693: 4931, 4742: 4886, 4630: 4888, 647: 5012,
+        5768: 4876, 4745: 4886, 4746: 4886, 3904: 4921,
+        1857: 4966, 1858: 4966, 1860: 4966, 1864: 4966,
+        4748: 4886, 1872: 4966, 5776: 4876, 4291: 4900,
+        4753: 4886, 5314: 4878, 4754: 4886, 4756: 4886,
+        3968: 1601, 1921: 4966, 1922: 4966, 1924: 4966,
+        5656: 4876, 5441: 4877, 1928: 4966, 5442: 4877,
+        1936: 4966, 4760: 4886, 4419: 4894, 2315: 4941,
+        3396: 4922, 4421: 4894, 5316: 4878, 4422: 4894,
+        668: 5010, 5448: 4877, 6544: 4868, 2377: 4939,
+        4426: 4894, 1984: 1602, 4428: 4894, 3408: 4922,
+        2385: 4939, 4434: 4894, 4436: 4894, 1159: 4984 },
+        33: { 3584: 3206, 2816: 3206, 6146: 3205, 4612: 3205,
+        2054: 3206, 1544: 3207, 522: 3208, 1036: 3207,
+        4610: 3205, 14: 3213, 1552: 3207, 530: 3208,
+        2068: 3206, 22: 3212, 1048: 3207, 4356: 3205,
+        26: 3212, 28: 3212, 1092: 3207, 518: 3208,
+        5184: 3205, 3328: 3206, 2320: 3206, 1288: 3207,
+        2576: 3206, 2312: 3206, 2184: 3206, 1034: 3207,
+        2116: 3206, 2114: 3206, 4164: 3205, 70: 3211,
+        584: 3208, 2060: 3206, 74: 3211, 76: 3211,
+        592: 3208, 82: 3211, 84: 3211, 4416: 3205,
+        88: 3211, 770: 3208, 4116: 3205, 1296: 3207,
+        2066: 3206, 1282: 3207, 4114: 3205, 4368: 3205,
+        1538: 3207, 4624: 3205, 532: 3208, 4232: 3205,
+        4672: 3205, 1044: 3207, 1664: 3207, 1216: 3207,
+        2178: 3206, 4228: 3205, 134: 3210, 648: 3208,
+        138: 3210, 140: 3210, 656: 3208, 536: 3208,
+        2562: 3206, 148: 3210, 772: 3208, 152: 3210,
+        4864: 3205, 3074: 3206, 5136: 3205, 6160: 3205,
+        1540: 3207, 3080: 3206, 5632: 3205, 2120: 3206,
+        704: 3208, 194: 3210, 196: 3210, 2308: 3206,
+        200: 3210, 4354: 3205, 2240: 3206, 2564: 3206,
+        208: 3210, 6656: 3205, 1030: 3207, 3076: 3206,
+        5122: 3205, 7168: 3205, 4168: 3205, 1792: 3207,
+        1408: 3207, 2306: 3206, 1284: 3207, 262: 3209,
+        776: 3208, 266: 3209, 268: 3209, 642: 3208,
+        784: 3208, 274: 3209, 276: 3209, 2072: 3206,
+        280: 3209, 1156: 3207, 5124: 3205, 2192: 3206,
+        3200: 3206, 1160: 3207, 4102: 3205, 6148: 3205,
+        832: 3208, 4288: 3205, 322: 3209, 324: 3209,
+        2568: 3206, 328: 3209, 6400: 3205, 1042: 3207,
+        336: 3209, 2432: 3206, 4120: 3205, 2688: 3206,
+        1168: 3207, 3088: 3206, 1154: 3207, 4240: 3205,
+        5376: 3205, 146: 3210, 6208: 3205, 2058: 3206,
+        4360: 3205, 524: 3208, 896: 3208, 1344: 3207,
+        386: 3209, 388: 3209, 4616: 3205, 392: 3209,
+        3136: 3206, 4162: 3205, 400: 3209, 644: 3208,
+        5128: 3205, 580: 3208, 4736: 3205, 2128: 3206,
+        5248: 3205, 1096: 3207, 4106: 3205, 6152: 3205,
+        1600: 3207, 448: 3209, 2180: 3206, 4226: 3205,
+        6272: 3205, 2368: 3206, 578: 3208, 2624: 3206,
+        4480: 3205, 1104: 3207, 1090: 3207, 4176: 3205,
+        4108: 3205 },
+        34: { 3584: 3195, 4609: 3194, 1540: 3196, 4101: 3194,
+        1281: 3196, 1544: 3196, 4105: 3194, 1036: 3196,
+        13: 3202, 1552: 3196, 4113: 3194, 2068: 3195,
+        21: 3201, 1048: 3196, 772: 3197, 28: 1607,
+        517: 3197, 1092: 3196, 5184: 3194, 3328: 3195,
+        2320: 3195, 1288: 3196, 2576: 3195, 521: 3197,
+        2312: 3195, 2184: 3195, 2116: 3195, 577: 3197,
+        6400: 3194, 4164: 3194, 69: 3200, 3088: 3195,
+        584: 3197, 73: 3200, 76: 3200, 592: 3197,
+        81: 3200, 1537: 3196, 4416: 3194, 88: 3200,
+        4116: 3194, 2816: 3195, 1296: 3196, 529: 3197,
+        1041: 3196, 2305: 3195, 4368: 3194, 2561: 3195,
+        4624: 3194, 532: 3197, 4232: 3194, 4672: 3194,
+        1044: 3196, 1664: 3196, 4225: 3194, 4228: 3194,
+        133: 3199, 5136: 3194, 648: 3197, 137: 3199,
+        140: 3199, 656: 3197, 145: 3199, 148: 3199,
+        25: 3201, 152: 3199, 196: 3199, 4864: 3194,
+        7168: 3194, 1284: 3196, 4353: 3194, 5376: 3194,
+        3080: 3195, 5632: 3194, 2120: 3195, 1029: 3196,
+        704: 3197, 193: 3199, 5121: 3194, 2308: 3195,
+        200: 3199, 2240: 3195, 2564: 3195, 208: 3199,
+        6656: 3194, 2053: 3195, 3076: 3195, 6145: 3194,
+        536: 3197, 4168: 3194, 3073: 3195, 1096: 3196,
+        1792: 3196, 769: 3197, 4356: 3194, 261: 3198,
+        641: 3197, 776: 3197, 265: 3198, 268: 3198,
+        4612: 3194, 784: 3197, 273: 3198, 276: 3198,
+        2072: 3195, 280: 3198, 644: 3197, 5124: 3194,
+        2192: 3195, 3200: 3195, 1160: 3196, 1408: 3196,
+        1033: 3196, 6148: 3194, 832: 3197, 321: 3198,
+        324: 3198, 6160: 3194, 2568: 3195, 1153: 3196,
+        336: 3198, 2432: 3195, 2057: 3195, 4120: 3194,
+        2065: 3195, 2688: 3195, 1216: 3196, 4288: 3194,
+        1168: 3196, 2177: 3195, 4240: 3194, 6208: 3194,
+        4360: 3194, 524: 3197, 896: 3197, 385: 3198,
+        388: 3198, 4616: 3194, 4161: 3194, 392: 3198,
+        3136: 3195, 400: 3198, 4480: 3194, 5128: 3194,
+        580: 3197, 4736: 3194, 1156: 3196, 2128: 3195,
+        5248: 3194, 2060: 3195, 1344: 3196, 328: 3198,
+        6152: 3194, 1600: 3196, 448: 3198, 2180: 3195,
+        1089: 3196, 6272: 3194, 2368: 3195, 2624: 3195,
+        1104: 3196, 2113: 3195, 4176: 3194, 4108: 3194,
+        84: 3200 },
+        35: { 128: 3199, 64: 3200, 4096: 3194, 4: 3203,
+        1024: 3196, 8: 3202, 256: 3198, 16: 3201,
+        512: 3197, 2048: 3195 },
+        36: { 3584: 3184, 4609: 3183, 4610: 3183, 1027: 3185,
+        769: 3186, 1544: 3185, 2057: 3184, 4106: 3183,
+        11: 3191, 1538: 3185, 1552: 3185, 4113: 3183,
+        530: 3186, 2051: 3184, 1048: 3185, 25: 3190,
+        26: 1607, 1041: 3185, 5184: 3183, 3328: 3184,
+        2320: 3184, 1288: 3185, 2576: 3184, 521: 3186,
+        2184: 3184, 522: 3186, 1600: 3185, 577: 3186,
+        2114: 3184, 67: 3189, 2065: 3184, 3088: 3184,
+        584: 3186, 73: 3189, 74: 3189, 1281: 3185,
+        592: 3186, 81: 3189, 82: 3189, 1537: 3185,
+        4416: 3183, 88: 1606, 770: 3186, 2816: 3184,
+        1296: 3185, 2066: 3184, 529: 3186, 1282: 3185,
+        2305: 3184, 4114: 3183, 4368: 3183, 515: 3186,
+        19: 3190, 2561: 3184, 4624: 3183, 4232: 3183,
+        4672: 3183, 1664: 3185, 4225: 3183, 1154: 3185,
+        131: 3188, 3073: 3184, 5136: 3183, 648: 3186,
+        137: 3188, 138: 3188, 656: 3186, 145: 3188,
+        146: 3188, 152: 3188, 2432: 3184, 4864: 3183,
+        7168: 3183, 3074: 3184, 6160: 3183, 1216: 3185,
+        5376: 3183, 3080: 3184, 4120: 3183, 2306: 3184,
+        5632: 3183, 2120: 3184, 704: 3186, 193: 3188,
+        194: 3188, 5121: 3183, 200: 3188, 4354: 3183,
+        2240: 3184, 6400: 3183, 208: 3188, 6656: 3183,
+        2562: 3184, 4099: 3183, 5122: 3183, 4226: 3183,
+        6145: 3183, 536: 3186, 4168: 3183, 1096: 3185,
+        1792: 3185, 4353: 3183, 6146: 3183, 259: 3187,
+        641: 3186, 776: 3186, 265: 3187, 266: 3187,
+        4288: 3183, 2178: 3184, 784: 3186, 273: 3187,
+        274: 3187, 2072: 3184, 280: 3187, 2192: 3184,
+        3200: 3184, 1160: 3185, 1408: 3185, 1033: 3185,
+        2312: 3184, 832: 3186, 321: 3187, 322: 3187,
+        2568: 3184, 1153: 3185, 1042: 3185, 336: 3187,
+        1034: 3185, 642: 3186, 4162: 3183, 2688: 3184,
+        1168: 3185, 2177: 3184, 4240: 3183, 6208: 3183,
+        2058: 3184, 4360: 3183, 896: 3186, 385: 3187,
+        386: 3187, 4616: 3183, 4161: 3183, 392: 3187,
+        3136: 3184, 578: 3186, 400: 3187, 4480: 3183,
+        4105: 3183, 5128: 3183, 4736: 3183, 2128: 3184,
+        5248: 3183, 1344: 3185, 328: 3187, 6152: 3183,
+        448: 3187, 1089: 3185, 6272: 3183, 2368: 3184,
+        2624: 3184, 1104: 3185, 1090: 3185, 2113: 3184,
+        4176: 3183 },
+        37: { 128: 3188, 64: 3189, 2: 3192, 4096: 3183,
+        1024: 3185, 8: 3191, 256: 3187, 16: 3190,
+        512: 3186, 2048: 3184 },
+        1024: { 2048: 36, 1: 46, 2: 45, 4: 44,
+        6151: 3773, 8: 43, 6155: 3772, 6157: 3772,
+        6158: 3772, 2063: 3860, 16: 42, 4440: 3786,
+        6163: 3771, 6165: 3771, 6166: 3771, 2071: 3857,
+        6169: 3771, 6170: 3771, 4123: 3811, 6172: 3771,
+        4125: 3811, 4126: 3811, 31: 1608, 32: 41,
+        4784: 3777, 6179: 3770, 6181: 3770, 6182: 3770,
+        2087: 3853, 6185: 3770, 6186: 3770, 4139: 3807,
+        4434: 3786, 2093: 3852, 2094: 3852, 47: 3970,
+        6193: 3770, 6194: 3770, 4147: 3806, 6196: 3770,
+        4149: 3806, 2102: 3851, 55: 3967, 6200: 3770,
+        4153: 3806, 2106: 3851, 59: 3966, 2108: 3851,
+        61: 3966, 62: 1607, 4912: 3776, 64: 40,
+        6211: 3769, 6213: 3769, 6214: 3769, 2119: 3848,
+        6217: 3769, 6218: 3769, 2123: 3847, 6220: 3769,
+        2125: 3847, 2126: 3847, 79: 3960, 6225: 3769,
+        6226: 3769, 4179: 3801, 6228: 3769, 4181: 3801,
+        2134: 3846, 87: 3957, 6232: 3769, 2137: 3846,
+        2138: 3846, 4111: 1609, 2140: 3846, 93: 3956,
+        94: 3956, 6241: 3769, 6242: 3769, 4195: 3800,
+        6244: 3769, 2149: 3845, 2150: 3845, 103: 3953,
+        6248: 3769, 2153: 3845, 2154: 3845, 107: 3952,
+        2156: 3845, 109: 3952, 110: 3952, 6256: 3769,
+        2161: 3845, 2162: 3845, 115: 3951, 2164: 3845,
+        117: 3951, 118: 3951, 2168: 3845, 121: 3951,
+        122: 3951, 124: 1606, 128: 39, 6275: 3768,
+        6277: 3768, 6278: 3768, 2183: 3842, 6281: 3768,
+        6282: 3768, 2187: 3841, 6284: 3768, 2189: 3841,
+        2190: 3841, 143: 3945, 6289: 3768, 6290: 3768,
+        2195: 3840, 6292: 3768, 4245: 3795, 2198: 3840,
+        151: 3942, 6296: 3768, 4249: 3795, 2202: 3840,
+        155: 3941, 2204: 3840, 157: 3941, 158: 3941,
+        6305: 3768, 6306: 3768, 2075: 3856, 6308: 3768,
+        2213: 3839, 2214: 3839, 167: 3938, 6312: 3768,
+        2217: 3839, 2218: 3839, 171: 3937, 2220: 3839,
+        173: 3937, 174: 3937, 2077: 3856, 6320: 3768,
+        4643: 3779, 2226: 3839, 179: 3936, 2228: 3839,
+        181: 3936, 182: 3936, 2232: 3839, 185: 3936,
+        186: 3936, 188: 3936, 6337: 3768, 6338: 3768,
+        2243: 3838, 6340: 3768, 2245: 3838, 2246: 3838,
+        199: 3933, 6344: 3768, 4297: 3793, 2250: 3838,
+        203: 3932, 2252: 3838, 205: 3932, 206: 3932,
+        6352: 3768, 2257: 3838, 2258: 3838, 211: 3931,
+        2260: 3838, 213: 3931, 214: 3931, 2264: 3838,
+        217: 3931, 218: 3931, 220: 3931, 6368: 3768,
+        4321: 3793, 2274: 3838, 227: 3930, 2276: 3838,
+        229: 3930, 230: 3930, 2280: 3838, 233: 3930,
+        234: 3930, 4135: 3808, 236: 3930, 2288: 3838,
+        241: 3930, 242: 3930, 244: 3930, 248: 1605,
+        256: 38, 5000: 3776, 2091: 3852, 6405: 3767,
+        6406: 3767, 2311: 3835, 6409: 3767, 6410: 3767,
+        4363: 3789, 6412: 3767, 4365: 3789, 2318: 3834,
+        271: 3924, 6417: 3767, 6418: 3767, 4371: 3788,
+        6420: 3767, 2325: 3833, 2326: 3833, 279: 3921,
+        6424: 3767, 2329: 3833, 2330: 3833, 283: 3920,
+        2332: 3833, 285: 3920, 286: 3920, 2437: 3830,
+        6433: 3767, 6434: 3767, 2339: 3832, 6436: 3767,
+        4389: 3787, 2342: 3832, 295: 3917, 6440: 3767,
+        2345: 3832, 2346: 3832, 299: 3916, 2348: 3832,
+        301: 3916, 302: 3916, 6448: 3767, 2353: 3832,
+        2354: 3832, 2099: 3851, 2356: 3832, 309: 3915,
+        310: 3915, 2441: 3830, 2360: 3832, 313: 3915,
+        314: 3915, 316: 3915, 4490: 3785, 2101: 3851,
+        6465: 3767, 6466: 3767, 2371: 3831, 6468: 3767,
+        4421: 3786, 2374: 3831, 327: 3912, 6472: 3767,
+        4425: 3786, 2378: 3831, 331: 3911, 2380: 3831,
+        333: 3911, 334: 3911, 6480: 3767, 4433: 3786,
+        4171: 3802, 339: 3910, 2388: 3831, 341: 3910,
+        342: 3910, 2105: 3851, 2392: 3831, 345: 3910,
+        346: 3910, 348: 3910, 4154: 3806, 6496: 3767,
+        2401: 3831, 2402: 3831, 355: 3909, 2404: 3831,
+        357: 3909, 358: 3909, 4497: 3785, 2408: 3831,
+        361: 3909, 362: 3909, 364: 3909, 4498: 3785,
+        2416: 3831, 369: 3909, 370: 3909, 372: 3909,
+        376: 3909, 4500: 3785, 6529: 3767, 6530: 3767,
+        4483: 3785, 6532: 3767, 4485: 3785, 2438: 3830,
+        391: 3906, 6536: 3767, 4489: 3785, 2442: 3830,
+        395: 3905, 2444: 3830, 397: 3905, 398: 3905,
+        6544: 3767, 2449: 3830, 2450: 3830, 403: 3904,
+        2452: 3830, 405: 3904, 406: 3904, 2456: 3830,
+        409: 3904, 410: 3904, 412: 3904, 6560: 3767,
+        4513: 3785, 2466: 3830, 419: 3903, 2468: 3830,
+        421: 3903, 422: 3903, 2472: 3830, 425: 3903,
+        426: 3903, 4167: 3803, 428: 3903, 2480: 3830,
+        433: 3903, 434: 3903, 436: 3903, 440: 3903,
+        6592: 3767, 2497: 3830, 2498: 3830, 451: 3902,
+        2500: 3830, 453: 3902, 454: 3902, 2465: 3830,
+        2504: 3830, 457: 3902, 458: 3902, 460: 3902,
+        4514: 3785, 4173: 3802, 2512: 3830, 465: 3902,
+        466: 3902, 468: 3902, 4174: 3802, 472: 3902,
+        4516: 3785, 2528: 3830, 481: 3902, 482: 3902,
+        484: 3902, 488: 3902, 4804: 3777, 4449: 3786,
+        496: 1604, 4520: 3785, 2131: 3846, 2133: 3846,
+        512: 37, 6659: 3766, 6661: 3766, 6662: 3766,
+        2567: 3827, 6665: 3766, 6666: 3766, 2571: 3826,
+        6668: 3766, 2573: 3826, 2574: 3826, 527: 3896,
+        6673: 3766, 6674: 3766, 2579: 3825, 6676: 3766,
+        2581: 3825, 2582: 3825, 535: 3893, 6680: 3766,
+        2585: 3825, 2586: 3825, 539: 3892, 2588: 3825,
+        541: 3892, 542: 3892, 4869: 3776, 6689: 3766,
+        6690: 3766, 91: 3956, 6692: 3766, 2597: 3824,
+        2598: 3824, 551: 3889, 6696: 3766, 2601: 3824,
+        2602: 3824, 555: 3888, 2604: 3824, 557: 3888,
+        558: 3888, 6704: 3766, 2609: 3824, 2610: 3824,
+        563: 3887, 2612: 3824, 565: 3887, 566: 3887,
+        2825: 3821, 2616: 3824, 569: 3887, 570: 3887,
+        572: 3887, 4874: 3776, 6721: 3766, 6722: 3766,
+        2627: 3823, 6724: 3766, 2629: 3823, 2630: 3823,
+        583: 3884, 6728: 3766, 2633: 3823, 2634: 3823,
+        587: 3883, 2636: 3823, 589: 3883, 590: 3883,
+        6736: 3766, 4689: 3778, 2642: 3823, 2147: 3845,
+        2644: 3823, 597: 3882, 598: 3882, 2648: 3823,
+        601: 3882, 602: 3882, 604: 3882, 4197: 3800,
+        6752: 3766, 4705: 3778, 2658: 3823, 611: 3881,
+        2660: 3823, 613: 3881, 614: 3881, 2833: 3821,
+        2664: 3823, 617: 3881, 618: 3881, 620: 3881,
+        4882: 3776, 2672: 3823, 625: 3881, 626: 3881,
+        628: 3881, 4201: 3800, 632: 3881, 2836: 3821,
+        4464: 3786, 4202: 3800, 6785: 3766, 6786: 3766,
+        2691: 3822, 6788: 3766, 4741: 3777, 2694: 3822,
+        4545: 3785, 6792: 3766, 2697: 3822, 2698: 3822,
+        651: 3877, 2700: 3822, 653: 3877, 654: 3877,
+        6800: 3766, 2705: 3822, 2706: 3822, 659: 3876,
+        2708: 3822, 661: 3876, 662: 3876, 2712: 3822,
+        665: 3876, 666: 3876, 4246: 3795, 4182: 3801,
+        6816: 3766, 2721: 3822, 2722: 3822, 675: 3875,
+        2724: 3822, 677: 3875, 678: 3875, 4209: 3800,
+        2728: 3822, 681: 3875, 682: 3875, 684: 3875,
+        4210: 3800, 2736: 3822, 689: 3875, 690: 3875,
+        692: 3875, 696: 3875, 4212: 3800, 6848: 3766,
+        2753: 3822, 2754: 3822, 707: 3874, 2756: 3822,
+        709: 3874, 710: 3874, 2849: 3821, 2760: 3822,
+        713: 3874, 714: 3874, 716: 3874, 4898: 3776,
+        2768: 3822, 721: 3874, 722: 3874, 724: 3874,
+        728: 3874, 4900: 3776, 2784: 3822, 737: 3874,
+        738: 3874, 740: 3874, 744: 3874, 752: 3874,
+        4904: 3776, 4185: 3801, 4867: 3776, 6913: 1600,
+        6914: 1600, 2819: 3821, 6916: 1600, 2821: 3821,
+        2822: 3821, 775: 3871, 6920: 1600, 4873: 3776,
+        2826: 3821, 779: 3870, 2828: 3821, 781: 3870,
+        782: 3870, 6928: 1600, 4881: 3776, 2834: 3821,
+        787: 3869, 4186: 3801, 789: 3869, 790: 3869,
+        2840: 3821, 793: 3869, 794: 3869, 796: 3869,
+        6944: 1600, 4897: 3776, 2850: 3821, 803: 3868,
+        2852: 3821, 805: 3868, 806: 3868, 2856: 3821,
+        809: 3868, 810: 3868, 4231: 3797, 812: 3868,
+        2864: 3821, 817: 3868, 818: 3868, 4528: 3785,
+        820: 3868, 4119: 3812, 4801: 3777, 6976: 1600,
+        4929: 3776, 2882: 3821, 4235: 3796, 2884: 3821,
+        837: 3867, 838: 3867, 2888: 3821, 841: 3867,
+        842: 3867, 844: 3867, 4237: 3796, 4188: 3801,
+        849: 3867, 4870: 3776, 852: 3867, 4238: 3796,
+        4802: 3777, 4450: 3786, 2912: 3821, 865: 3867,
+        866: 3867, 868: 3867, 872: 3867, 824: 3868,
+        880: 3867, 4452: 3786, 4243: 3795, 2197: 3840,
+        7040: 1600, 2945: 1601, 2946: 1601, 899: 3866,
+        2948: 1601, 901: 3866, 902: 3866, 2881: 3821,
+        2952: 1601, 905: 3866, 906: 3866, 908: 3866,
+        4930: 3776, 2960: 1601, 913: 3866, 914: 3866,
+        835: 3867, 916: 3866, 2201: 3840, 920: 3866,
+        4932: 3776, 4250: 3795, 2976: 1601, 929: 3866,
+        930: 3866, 932: 3866, 4259: 3794, 936: 3866,
+        4252: 3795, 944: 3866, 4936: 3776, 3008: 1601,
+        961: 1602, 962: 1602, 964: 1602, 968: 1602,
+        2078: 3856, 976: 1602, 2211: 3839, 4261: 3794,
+        992: 1602, 2896: 3821, 4262: 3794, 850: 3867,
+        4265: 3794, 4266: 3794, 4944: 3776, 4876: 3776,
+        4268: 3794, 4808: 3777, 856: 3867, 2225: 3839,
+        4615: 3782, 4274: 3794, 4576: 3785, 4276: 3794,
+        4960: 3776, 4619: 3781, 4621: 3781, 4280: 3794,
+        4622: 3781, 4627: 3780, 4198: 3800, 4629: 3780,
+        4630: 3780, 4291: 3793, 4633: 3780, 4634: 3780,
+        4293: 3793, 4294: 3793, 4636: 3780, 2249: 3838,
+        4298: 3793, 4300: 3793, 2595: 3824, 4645: 3779,
+        4646: 3779, 4305: 3793, 4306: 3793, 4884: 3776,
+        4649: 3779, 4308: 3793, 4816: 3777, 4650: 3779,
+        4993: 3776, 4652: 3779, 4994: 3776, 4312: 3793,
+        4996: 3776, 4657: 3779, 4658: 3779, 4096: 35,
+        4204: 3800, 4660: 3779, 2273: 3838, 4273: 3794,
+        4322: 3793, 4546: 3785, 4664: 3779, 4324: 3793,
+        5008: 3776, 4888: 3776, 4328: 3793, 4504: 3785,
+        4548: 3785, 4675: 3778, 4677: 3778, 4336: 3793,
+        4678: 3778, 2435: 3830, 4681: 3778, 4682: 3778,
+        5024: 3776, 4684: 3778, 4456: 3786, 4141: 3807,
+        2641: 3823, 4142: 3807, 4690: 3778, 6188: 3770,
+        595: 3882, 4692: 3778, 4552: 3785, 4696: 3778,
+        6403: 3767, 4359: 3790, 2315: 3834, 4486: 3785,
+        2657: 3823, 4706: 3778, 2317: 3834, 4366: 3789,
+        4708: 3778, 4712: 3778, 2323: 3833, 4373: 3788,
+        5056: 1602, 4374: 3788, 4377: 3788, 4216: 3800,
+        4378: 3788, 4720: 3778, 4380: 3788, 4387: 3787,
+        4150: 3806, 4832: 3777, 2341: 3832, 4390: 3787,
+        4560: 3785, 4393: 3787, 4492: 3785, 4394: 3787,
+        4396: 3787, 4739: 3777, 2693: 3822, 4742: 3777,
+        4401: 3787, 647: 3878, 4402: 3787, 307: 3915,
+        4745: 3777, 4404: 3787, 4746: 3777, 4748: 3777,
+        4408: 3787, 4753: 3777, 4754: 3777, 4756: 3777,
+        4156: 3806, 4760: 3777, 4419: 3786, 2373: 3831,
+        4422: 3786, 668: 3876, 2377: 3831, 4426: 3786,
+        4769: 3777, 4428: 3786, 4770: 3777, 4772: 3777,
+        2385: 3831, 2386: 3831, 4776: 3777, 4436: 3786 },
+        40: { 3584: 3173, 3073: 3173, 6146: 3172, 1027: 3174,
+        1540: 3174, 4101: 3172, 4102: 3172, 7: 3180,
+        5122: 3172, 4228: 3172, 1552: 3174, 4113: 3172,
+        4114: 3172, 19: 3179, 529: 3175, 21: 3179,
+        22: 1607, 4672: 3172, 1284: 3174, 517: 3175,
+        1092: 3174, 518: 3175, 5184: 3172, 3328: 3173,
+        2320: 3173, 2576: 3173, 2116: 3173, 4161: 3172,
+        2114: 3173, 67: 3178, 2065: 3173, 69: 3178,
+        70: 3178, 6208: 3172, 1281: 3174, 592: 3175,
+        81: 3178, 82: 3178, 1537: 3174, 4416: 3172,
+        770: 3175, 2816: 3173, 1296: 3174, 2066: 3173,
+        1041: 3174, 1282: 3174, 2305: 3173, 530: 3175,
+        4368: 3172, 515: 3175, 1538: 3174, 2561: 3173,
+        4624: 3172, 532: 3175, 1044: 3174, 4164: 3172,
+        4225: 3172, 2178: 3173, 131: 3177, 644: 3175,
+        133: 3177, 134: 3177, 656: 3175, 145: 3177,
+        146: 3177, 148: 3177, 196: 3177, 2068: 3173,
+        2051: 3173, 3074: 3173, 5136: 3172, 6160: 3172,
+        4353: 3172, 5376: 3172, 4609: 3172, 5632: 3172,
+        1029: 3174, 704: 3175, 193: 3177, 194: 3177,
+        5121: 3172, 2308: 3173, 4354: 3172, 2240: 3173,
+        2564: 3173, 208: 1605, 4610: 3172, 6656: 3172,
+        1030: 3174, 2053: 3173, 2562: 3173, 4116: 3172,
+        4099: 3172, 4226: 3172, 6145: 3172, 7168: 3172,
+        2054: 3173, 1792: 3174, 769: 3175, 2306: 3173,
+        259: 3176, 772: 3175, 261: 3176, 262: 3176,
+        641: 3175, 4288: 3172, 1154: 3174, 4612: 3172,
+        784: 3175, 273: 3176, 274: 3176, 276: 3176,
+        3200: 3173, 1156: 3174, 4864: 3172, 5124: 3172,
+        4356: 3172, 2192: 3173, 1408: 3174, 1664: 3174,
+        6148: 3172, 832: 3175, 321: 3176, 322: 3176,
+        324: 3176, 1153: 3174, 6400: 3172, 1042: 3174,
+        336: 3176, 2432: 3173, 642: 3175, 4162: 3172,
+        2688: 3173, 1216: 3174, 1168: 3174, 3088: 3173,
+        2177: 3173, 4240: 3172, 896: 3175, 385: 3176,
+        386: 3176, 388: 3176, 577: 3175, 3136: 3173,
+        578: 3175, 400: 3176, 4480: 3172, 580: 3175,
+        4736: 3172, 2128: 3173, 5248: 3172, 1344: 3174,
+        1600: 3174, 448: 3176, 2180: 3173, 3076: 3173,
+        1089: 3174, 6272: 3172, 2368: 3173, 2624: 3173,
+        1104: 3174, 1090: 3174, 2113: 3173, 4176: 3172,
+        84: 1606 },
+        41: { 64: 3178, 128: 3177, 2: 3181, 4096: 3172,
+        4: 3180, 1024: 3174, 256: 3176, 16: 3179,
+        512: 3175, 2048: 3173 },
+        42: { 128: 3177, 1: 3181, 4096: 3172, 4: 3180,
+        1024: 3174, 64: 3178, 256: 3176, 16: 3179,
+        512: 3175, 2048: 3173 },
+        44: { 128: 3177, 1: 3180, 2: 3180, 4096: 3172,
+        1024: 3174, 64: 3178, 256: 3176, 16: 3179,
+        512: 3175, 2048: 3173 },
+        4144: { 128: 2538, 1: 2540, 2: 2540, 4: 2540,
+        1024: 2535, 8: 2540, 64: 2539, 256: 2537,
+        512: 2536, 2048: 2534 },
+        1032: { 6656: 2787, 4609: 2787, 6146: 2787, 2051: 2788,
+        2564: 2788, 4101: 2787, 4102: 2787, 7: 2795,
+        4610: 2787, 4228: 2787, 2576: 2788, 4113: 2787,
+        4114: 2787, 19: 2794, 529: 2789, 21: 2794,
+        22: 2794, 4672: 2787, 2308: 2788, 517: 2789,
+        2592: 2788, 2081: 2788, 4130: 2787, 35: 2793,
+        548: 2789, 37: 2793, 38: 2793, 4144: 2787,
+        2320: 2788, 560: 2789, 49: 2793, 50: 2793,
+        52: 2793, 2116: 2788, 4161: 2787, 2114: 2788,
+        67: 2792, 4162: 2787, 69: 2792, 70: 2792,
+        6208: 2787, 224: 2791, 2336: 2788, 4384: 2787,
+        592: 2789, 81: 2792, 82: 2792, 84: 2792,
+        4416: 2787, 4640: 2787, 770: 2789, 546: 2789,
+        97: 2792, 98: 2792, 100: 2792, 2065: 2788,
+        2305: 2788, 2066: 2788, 4368: 2787, 515: 2789,
+        2561: 2788, 4624: 2787, 532: 2789, 4164: 2787,
+        4225: 2787, 2178: 2788, 131: 2791, 644: 2789,
+        133: 2791, 134: 2791, 6176: 2787, 656: 2789,
+        145: 2791, 146: 2791, 148: 2791, 2068: 2788,
+        672: 2789, 161: 2791, 162: 2791, 164: 2791,
+        6160: 2787, 4353: 2787, 176: 2791, 4132: 2787,
+        704: 2789, 193: 2791, 194: 2791, 196: 2791,
+        4129: 2787, 518: 2789, 2240: 2788, 2082: 2788,
+        6400: 2787, 208: 2791, 2084: 2788, 2053: 2788,
+        2562: 2788, 4116: 2787, 4099: 2787, 6145: 2787,
+        2054: 2788, 530: 2789, 2816: 2788, 769: 2789,
+        2306: 2788, 259: 2790, 772: 2789, 261: 2790,
+        262: 2790, 641: 2789, 4288: 2787, 642: 2789,
+        4612: 2787, 784: 2789, 273: 2790, 274: 2790,
+        276: 2790, 2180: 2788, 4864: 2787, 800: 2789,
+        289: 2790, 290: 2790, 4356: 2787, 292: 2790,
+        112: 2792, 304: 2790, 6148: 2787, 832: 2789,
+        321: 2790, 322: 2790, 324: 2790, 4256: 2787,
+        336: 2790, 2432: 2788, 608: 2789, 2688: 2788,
+        352: 2790, 2192: 2788, 2177: 2788, 4240: 2787,
+        896: 2789, 385: 2790, 386: 2790, 388: 2790,
+        577: 2789, 2144: 2788, 578: 2789, 400: 2790,
+        4480: 2787, 580: 2789, 4736: 2787, 416: 2790,
+        448: 2790, 2208: 2788, 4226: 2787, 4192: 2787,
+        6272: 2787, 2368: 2788, 2624: 2788, 2128: 2788,
+        2113: 2788, 2096: 2788, 4176: 2787, 545: 2789,
+        4354: 2787 },
+        50: { 128: 3166, 1: 3170, 4096: 3161, 4: 3169,
+        1024: 3163, 8: 3168, 64: 3167, 256: 3165,
+        512: 3164, 2048: 3162 },
+        52: { 128: 3166, 1: 3169, 2: 3169, 4096: 3161,
+        1024: 3163, 8: 3168, 64: 3167, 256: 3165,
+        512: 3164, 2048: 3162 },
+        2057: { 32: 2683, 128: 2681, 2: 2686, 4096: 2677,
+        4: 2685, 1024: 2678, 64: 2682, 256: 2680,
+        16: 2684, 512: 2679 },
+        56: { 64: 3167, 1: 3168, 2: 3168, 4096: 3161,
+        4: 3168, 1024: 3163, 128: 3166, 256: 3165,
+        512: 3164, 2048: 3162 },
+        2058: { 128: 2681, 1: 2686, 4096: 2677, 4: 2685,
+        1024: 2678, 32: 2683, 64: 2682, 256: 2680,
+        16: 2684, 512: 2679 },
+        4160: { 3584: 2523, 3073: 2523, 3074: 2523, 1027: 2524,
+        1540: 2524, 517: 2525, 518: 2525, 7: 2531,
+        1544: 2524, 521: 2525, 522: 2525, 11: 2530,
+        524: 2525, 13: 2530, 14: 2530, 2336: 2523,
+        1552: 2524, 529: 2525, 2066: 2523, 2051: 2523,
+        532: 2525, 21: 2529, 22: 2529, 2592: 2523,
+        536: 2525, 25: 2529, 26: 2529, 28: 2529,
+        1029: 2524, 1568: 2524, 1057: 2524, 2082: 2523,
+        35: 2528, 548: 2525, 37: 2528, 38: 2528,
+        3104: 2523, 552: 2525, 41: 2528, 42: 2528,
+        44: 2528, 2320: 2523, 560: 2525, 49: 2528,
+        50: 2528, 52: 2528, 2576: 2523, 1033: 2524,
+        56: 2528, 2184: 2523, 769: 2525, 1034: 2524,
+        1042: 2524, 2065: 2523, 3088: 2523, 1036: 2524,
+        1537: 2524, 770: 2525, 2816: 2523, 1296: 2524,
+        1041: 2524, 1282: 2524, 2305: 2523, 530: 2525,
+        3328: 2523, 515: 2525, 1538: 2524, 19: 2529,
+        2561: 2523, 1044: 2524, 2084: 2523, 1664: 2524,
+        641: 2525, 2178: 2523, 131: 2527, 644: 2525,
+        133: 2527, 134: 2527, 648: 2525, 137: 2527,
+        138: 2527, 140: 2527, 656: 2525, 145: 2527,
+        146: 2527, 148: 2527, 152: 2527, 2068: 2523,
+        672: 2525, 161: 2527, 162: 2527, 164: 2527,
+        1284: 2524, 168: 2527, 176: 2527, 1058: 2524,
+        1312: 2524, 2308: 2523, 2081: 2523, 546: 2525,
+        2564: 2523, 1060: 2524, 1030: 2524, 2053: 2523,
+        2562: 2523, 3076: 2523, 1064: 2524, 1048: 2524,
+        2088: 2523, 2054: 2523, 1792: 2524, 1281: 2524,
+        2306: 2523, 259: 2526, 772: 2525, 261: 2526,
+        262: 2526, 1153: 2524, 776: 2525, 265: 2526,
+        266: 2526, 2208: 2523, 268: 2526, 642: 2525,
+        784: 2525, 273: 2526, 274: 2526, 276: 2526,
+        2072: 2523, 280: 2526, 1156: 2524, 1288: 2524,
+        800: 2525, 289: 2526, 290: 2526, 292: 2526,
+        296: 2526, 2192: 2523, 304: 2526, 1160: 2524,
+        1408: 2524, 2312: 2523, 2568: 2523, 2432: 2523,
+        2057: 2523, 3080: 2523, 2688: 2523, 1168: 2524,
+        1154: 2524, 2177: 2523, 3200: 2523, 2058: 2523,
+        896: 2525, 385: 2526, 386: 2526, 388: 2526,
+        392: 2526, 400: 2526, 416: 2526, 2060: 2523,
+        1184: 2524, 2180: 2523, 1072: 2524, 2096: 2523,
+        545: 2525 },
+        65: { 3584: 3151, 2816: 3151, 6146: 3150, 5124: 3150,
+        2054: 3151, 1544: 3152, 522: 3153, 1036: 3152,
+        4610: 3150, 14: 3158, 2336: 3151, 1552: 3152,
+        530: 3153, 2068: 3151, 22: 3157, 2592: 3151,
+        1048: 3152, 1284: 3152, 26: 3157, 28: 3157,
+        1568: 3152, 4130: 3150, 1058: 3152, 4132: 3150,
+        4102: 3150, 38: 3156, 4144: 3150, 552: 3153,
+        42: 3156, 44: 3156, 2320: 3151, 560: 3153,
+        1288: 3152, 50: 3156, 52: 3156, 2576: 3151,
+        56: 3156, 2312: 3151, 2184: 3151, 2058: 3151,
+        1042: 3152, 2082: 3151, 3088: 3151, 2060: 3151,
+        4384: 3150, 4640: 3150, 770: 3153, 4116: 3150,
+        1060: 3152, 1296: 3152, 2066: 3151, 5152: 3150,
+        1282: 3152, 4114: 3150, 4368: 3150, 1538: 3152,
+        4624: 3150, 6400: 3150, 532: 3153, 4232: 3150,
+        1044: 3152, 2084: 3151, 1664: 3152, 642: 3153,
+        4228: 3150, 134: 3155, 6176: 3150, 648: 3153,
+        138: 3155, 140: 3155, 656: 3153, 536: 3153,
+        146: 3155, 148: 3155, 772: 3153, 152: 3155,
+        2432: 3151, 4864: 3150, 672: 3153, 3074: 3151,
+        164: 3155, 6160: 3150, 168: 3155, 1540: 3152,
+        176: 3155, 3080: 3151, 5632: 3150, 1312: 3152,
+        2308: 3151, 3104: 3151, 518: 3153, 546: 3153,
+        2564: 3151, 3328: 3151, 6656: 3150, 548: 3153,
+        1030: 3152, 2562: 3151, 3076: 3151, 5122: 3150,
+        7168: 3150, 1064: 3152, 2088: 3151, 1792: 3152,
+        1408: 3152, 2306: 3151, 4356: 3150, 262: 3154,
+        776: 3153, 266: 3154, 2208: 3151, 268: 3154,
+        2178: 3151, 4612: 3150, 784: 3153, 274: 3154,
+        276: 3154, 2072: 3151, 280: 3154, 644: 3153,
+        800: 3153, 1072: 3152, 290: 3154, 292: 3154,
+        296: 3154, 2192: 3151, 304: 3154, 1160: 3152,
+        5136: 3150, 4136: 3150, 6148: 3150, 2568: 3151,
+        4256: 3150, 1034: 3152, 4120: 3150, 2688: 3151,
+        1168: 3152, 1154: 3152, 4240: 3150, 5376: 3150,
+        3200: 3151, 4360: 3150, 524: 3153, 896: 3153,
+        386: 3154, 388: 3154, 4616: 3150, 392: 3154,
+        400: 3154, 4480: 3150, 5128: 3150, 4736: 3150,
+        416: 3154, 1156: 3152, 5248: 3150, 4106: 3150,
+        6152: 3150, 1184: 3152, 2180: 3151, 4226: 3150,
+        6272: 3150, 162: 3155, 2096: 3151, 4108: 3150,
+        4354: 3150 },
+        2114: { 128: 2648, 1: 2653, 4096: 2644, 4: 2652,
+        1024: 2645, 32: 2649, 8: 2651, 256: 2647,
+        16: 2650, 512: 2646 },
+        67: { 128: 3144, 256: 3143, 4096: 3139, 4: 3148,
+        1024: 3141, 32: 3145, 8: 3147, 16: 3146,
+        512: 3142, 2048: 3140 },
+        68: { 3584: 3129, 4609: 3128, 3074: 3129, 1027: 3130,
+        769: 3131, 1544: 3130, 2057: 3129, 4106: 3128,
+        11: 3136, 273: 3132, 4610: 3128, 2336: 3129,
+        1552: 3130, 4113: 3128, 4114: 3128, 2051: 3129,
+        2592: 3129, 1048: 3130, 25: 3135, 26: 3135,
+        1568: 3130, 1057: 3130, 2082: 3129, 35: 3134,
+        1041: 3130, 4144: 3128, 552: 3131, 41: 3134,
+        42: 3134, 2320: 3129, 560: 3131, 49: 3134,
+        50: 3134, 2576: 3129, 1033: 3130, 56: 1606,
+        2184: 3129, 522: 3131, 1042: 3130, 2065: 3129,
+        3088: 3129, 1281: 3130, 4384: 3128, 1537: 3130,
+        4640: 3128, 770: 3131, 2816: 3129, 1296: 3130,
+        4129: 3128, 529: 3131, 1282: 3130, 2305: 3129,
+        2066: 3129, 4368: 3128, 515: 3131, 1538: 3130,
+        19: 3135, 2561: 3129, 4624: 3128, 4232: 3128,
+        1664: 3130, 641: 3131, 2178: 3129, 131: 3133,
+        3073: 3129, 5136: 3128, 6176: 3128, 648: 3131,
+        137: 3133, 138: 3133, 656: 3131, 145: 3133,
+        146: 3133, 4130: 3128, 152: 3133, 2432: 3129,
+        4864: 3128, 7168: 3128, 672: 3131, 161: 3133,
+        162: 3133, 6160: 3128, 168: 3133, 5376: 3128,
+        176: 3133, 1058: 3130, 3080: 3129, 5632: 3128,
+        1312: 3130, 5121: 3128, 2081: 3129, 4354: 3128,
+        546: 3131, 6400: 3128, 3328: 3129, 6656: 3128,
+        2562: 3129, 4099: 3128, 5122: 3128, 6145: 3128,
+        536: 3131, 5152: 3128, 1064: 3130, 2088: 3129,
+        530: 3131, 1792: 3130, 4353: 3128, 2306: 3129,
+        259: 3132, 4225: 3128, 776: 3131, 265: 3132,
+        266: 3132, 2208: 3129, 642: 3131, 784: 3131,
+        6146: 3128, 274: 3132, 2072: 3129, 280: 3132,
+        1288: 3130, 800: 3131, 289: 3132, 290: 3132,
+        521: 3131, 296: 3132, 2192: 3129, 304: 3132,
+        1160: 3130, 1408: 3130, 4136: 3128, 2312: 3129,
+        2568: 3129, 1153: 3130, 4256: 3128, 1034: 3130,
+        4120: 3128, 2688: 3129, 1168: 3130, 1154: 3130,
+        2177: 3129, 4240: 3128, 3200: 3129, 2058: 3129,
+        4360: 3128, 896: 3131, 385: 3132, 386: 3132,
+        4616: 3128, 392: 3132, 400: 3132, 4480: 3128,
+        4105: 3128, 5128: 3128, 4736: 3128, 416: 3132,
+        5248: 3128, 6152: 3128, 1184: 3130, 4226: 3128,
+        1072: 3130, 6272: 3128, 3104: 3129, 2096: 3129,
+        545: 3131 },
+        69: { 128: 3133, 256: 3132, 2: 3137, 4096: 3128,
+        1024: 3130, 32: 3134, 8: 3136, 16: 3135,
+        512: 3131, 2048: 3129 },
+        2048: { 4096: 23, 1: 34, 2: 33, 4: 32,
+        8: 31, 4111: 1609, 16: 30, 4119: 3592,
+        4123: 3591, 4125: 3591, 4126: 3591, 31: 1608,
+        32: 29, 4135: 3588, 4139: 3587, 4141: 3587,
+        4142: 3587, 47: 3750, 4147: 3586, 4149: 3586,
+        4150: 3586, 55: 3747, 4153: 3586, 4154: 3586,
+        59: 3746, 4156: 3586, 61: 3746, 62: 1607,
+        64: 28, 4167: 3583, 4171: 3582, 4173: 3582,
+        4174: 3582, 79: 3740, 4179: 3581, 4181: 3581,
+        4182: 3581, 87: 3737, 4185: 3581, 4186: 3581,
+        91: 3736, 4188: 3581, 93: 3736, 94: 3736,
+        4195: 3580, 4197: 3580, 4198: 3580, 103: 3733,
+        4201: 3580, 4202: 3580, 107: 3732, 4204: 3580,
+        109: 3732, 110: 3732, 4209: 3580, 4210: 3580,
+        115: 3731, 4212: 3580, 117: 3731, 118: 3731,
+        4216: 3580, 121: 3731, 122: 3731, 124: 1606,
+        128: 27, 4231: 3577, 4235: 3576, 4237: 3576,
+        4238: 3576, 143: 3725, 4243: 3575, 4245: 3575,
+        4246: 3575, 151: 3722, 4249: 3575, 4250: 3575,
+        155: 3721, 4252: 3575, 157: 3721, 158: 3721,
+        4259: 3574, 4261: 3574, 4262: 3574, 167: 3718,
+        4265: 3574, 4266: 3574, 171: 3717, 4268: 3574,
+        173: 3717, 174: 3717, 4273: 3574, 4274: 3574,
+        179: 3716, 4276: 3574, 181: 3716, 182: 3716,
+        4280: 3574, 185: 3716, 186: 3716, 188: 3716,
+        4291: 3573, 4293: 3573, 4294: 3573, 199: 3713,
+        4297: 3573, 4298: 3573, 203: 3712, 4300: 3573,
+        205: 3712, 206: 3712, 4305: 3573, 4306: 3573,
+        211: 3711, 4308: 3573, 213: 3711, 214: 3711,
+        4312: 3573, 217: 3711, 218: 3711, 220: 3711,
+        4321: 3573, 4322: 3573, 227: 3710, 4324: 3573,
+        229: 3710, 230: 3710, 4328: 3573, 233: 3710,
+        234: 3710, 236: 3710, 4336: 3573, 241: 3710,
+        242: 3710, 244: 3710, 248: 1605, 256: 26,
+        4359: 3570, 4363: 3569, 4365: 3569, 4366: 3569,
+        271: 3704, 4371: 3568, 4373: 3568, 4374: 3568,
+        279: 3701, 4377: 3568, 4378: 3568, 283: 3700,
+        4380: 3568, 285: 3700, 286: 3700, 4387: 3567,
+        4389: 3567, 4390: 3567, 295: 3697, 4393: 3567,
+        4394: 3567, 299: 3696, 4396: 3567, 301: 3696,
+        302: 3696, 4401: 3567, 4402: 3567, 307: 3695,
+        4404: 3567, 309: 3695, 310: 3695, 4408: 3567,
+        313: 3695, 314: 3695, 316: 3695, 4419: 3566,
+        4421: 3566, 4422: 3566, 327: 3692, 4425: 3566,
+        4426: 3566, 331: 3691, 4428: 3566, 333: 3691,
+        334: 3691, 4433: 3566, 4434: 3566, 339: 3690,
+        4436: 3566, 341: 3690, 342: 3690, 4440: 3566,
+        345: 3690, 346: 3690, 348: 3690, 4449: 3566,
+        4450: 3566, 355: 3689, 4452: 3566, 357: 3689,
+        358: 3689, 4456: 3566, 361: 3689, 362: 3689,
+        364: 3689, 4464: 3566, 369: 3689, 370: 3689,
+        372: 3689, 376: 3689, 4483: 3565, 4485: 3565,
+        4486: 3565, 391: 3686, 4489: 3565, 4490: 3565,
+        395: 3685, 4492: 3565, 397: 3685, 398: 3685,
+        4497: 3565, 4498: 3565, 403: 3684, 4500: 3565,
+        405: 3684, 406: 3684, 4504: 3565, 409: 3684,
+        410: 3684, 412: 3684, 4513: 3565, 4514: 3565,
+        419: 3683, 4516: 3565, 421: 3683, 422: 3683,
+        4520: 3565, 425: 3683, 426: 3683, 428: 3683,
+        4528: 3565, 433: 3683, 434: 3683, 436: 3683,
+        440: 3683, 4545: 3565, 4546: 3565, 451: 3682,
+        4548: 3565, 453: 3682, 454: 3682, 4552: 3565,
+        457: 3682, 458: 3682, 460: 3682, 4560: 3565,
+        465: 3682, 466: 3682, 468: 3682, 472: 3682,
+        4576: 3565, 481: 3682, 482: 3682, 484: 3682,
+        488: 3682, 496: 1604, 512: 25, 4615: 3562,
+        4619: 3561, 4621: 3561, 4622: 3561, 527: 3676,
+        4627: 3560, 4629: 3560, 4630: 3560, 535: 3673,
+        4633: 3560, 4634: 3560, 539: 3672, 4636: 3560,
+        541: 3672, 542: 3672, 4643: 3559, 4645: 3559,
+        4646: 3559, 551: 3669, 4649: 3559, 4650: 3559,
+        555: 3668, 4652: 3559, 557: 3668, 558: 3668,
+        4657: 3559, 4658: 3559, 563: 3667, 4660: 3559,
+        565: 3667, 566: 3667, 4664: 3559, 569: 3667,
+        570: 3667, 572: 3667, 4675: 3558, 4677: 3558,
+        4678: 3558, 583: 3664, 4681: 3558, 4682: 3558,
+        587: 3663, 4684: 3558, 589: 3663, 590: 3663,
+        4689: 3558, 4690: 3558, 595: 3662, 4692: 3558,
+        597: 3662, 598: 3662, 4696: 3558, 601: 3662,
+        602: 3662, 604: 3662, 4705: 3558, 4706: 3558,
+        611: 3661, 4708: 3558, 613: 3661, 614: 3661,
+        4712: 3558, 617: 3661, 618: 3661, 620: 3661,
+        4720: 3558, 625: 3661, 626: 3661, 628: 3661,
+        632: 3661, 4739: 3557, 4741: 3557, 4742: 3557,
+        647: 3658, 4745: 3557, 4746: 3557, 651: 3657,
+        4748: 3557, 653: 3657, 654: 3657, 4753: 3557,
+        4754: 3557, 659: 3656, 4756: 3557, 661: 3656,
+        662: 3656, 4760: 3557, 665: 3656, 666: 3656,
+        668: 3656, 4769: 3557, 4770: 3557, 675: 3655,
+        4772: 3557, 677: 3655, 678: 3655, 4776: 3557,
+        681: 3655, 682: 3655, 684: 3655, 4784: 3557,
+        689: 3655, 690: 3655, 692: 3655, 696: 3655,
+        4801: 3557, 4802: 3557, 707: 3654, 4804: 3557,
+        709: 3654, 710: 3654, 4808: 3557, 713: 3654,
+        714: 3654, 716: 3654, 4816: 3557, 721: 3654,
+        722: 3654, 724: 3654, 728: 3654, 4832: 3557,
+        737: 3654, 738: 3654, 740: 3654, 744: 3654,
+        752: 3654, 4867: 3556, 4869: 3556, 4870: 3556,
+        775: 3651, 4873: 3556, 4874: 3556, 779: 3650,
+        4876: 3556, 781: 3650, 782: 3650, 4881: 3556,
+        4882: 3556, 787: 3649, 4884: 3556, 789: 3649,
+        790: 3649, 4888: 3556, 793: 3649, 794: 3649,
+        796: 3649, 4897: 3556, 4898: 3556, 803: 3648,
+        4900: 3556, 805: 3648, 806: 3648, 4904: 3556,
+        809: 3648, 810: 3648, 812: 3648, 4912: 3556,
+        817: 3648, 818: 3648, 820: 3648, 824: 3648,
+        4929: 3556, 4930: 3556, 835: 3647, 4932: 3556,
+        837: 3647, 838: 3647, 4936: 3556, 841: 3647,
+        842: 3647, 844: 3647, 4944: 3556, 849: 3647,
+        850: 3647, 852: 3647, 856: 3647, 4960: 3556,
+        865: 3647, 866: 3647, 868: 3647, 872: 3647,
+        880: 3647, 4993: 3556, 4994: 3556, 899: 3646,
+        4996: 3556, 901: 3646, 902: 3646, 5000: 3556,
+        905: 3646, 906: 3646, 908: 3646, 5008: 3556,
+        913: 3646, 914: 3646, 916: 3646, 920: 3646,
+        5024: 3556, 929: 3646, 930: 3646, 932: 3646,
+        936: 3646, 944: 3646, 5056: 3556, 961: 3646,
+        962: 3646, 964: 3646, 968: 3646, 976: 3646,
+        992: 1603, 1024: 24, 5127: 3553, 5131: 3552,
+        5133: 3552, 5134: 3552, 1039: 3640, 5139: 3551,
+        5141: 3551, 5142: 3551, 1047: 3637, 5145: 3551,
+        5146: 3551, 1051: 3636, 5148: 3551, 1053: 3636,
+        1054: 3636, 5155: 3550, 5157: 3550, 5158: 3550,
+        1063: 3633, 5161: 3550, 5162: 3550, 1067: 3632,
+        5164: 3550, 1069: 3632, 1070: 3632, 5169: 3550,
+        5170: 3550, 1075: 3631, 5172: 3550, 1077: 3631,
+        1078: 3631, 5176: 3550, 1081: 3631, 1082: 3631,
+        1084: 3631, 5187: 3549, 5189: 3549, 5190: 3549,
+        1095: 3628, 5193: 3549, 5194: 3549, 1099: 3627,
+        5196: 3549, 1101: 3627, 1102: 3627, 5201: 3549,
+        5202: 3549, 1107: 3626, 5204: 3549, 1109: 3626,
+        1110: 3626, 5208: 3549, 1113: 3626, 1114: 3626,
+        1116: 3626, 5217: 3549, 5218: 3549, 1123: 3625,
+        5220: 3549, 1125: 3625, 1126: 3625, 5224: 3549,
+        1129: 3625, 1130: 3625, 1132: 3625, 5232: 3549,
+        1137: 3625, 1138: 3625, 1140: 3625, 1144: 3625,
+        5251: 3548, 5253: 3548, 5254: 3548, 1159: 3622,
+        5257: 3548, 5258: 3548, 1163: 3621, 5260: 3548,
+        1165: 3621, 1166: 3621, 5265: 3548, 5266: 3548,
+        1171: 3620, 5268: 3548, 1173: 3620, 1174: 3620,
+        5272: 3548, 1177: 3620, 1178: 3620, 1180: 3620,
+        5281: 3548, 5282: 3548, 1187: 3619, 5284: 3548,
+        1189: 3619, 1190: 3619, 5288: 3548, 1193: 3619,
+        1194: 3619, 1196: 3619, 5296: 3548, 1201: 3619,
+        1202: 3619, 1204: 3619, 1208: 3619, 5313: 3548,
+        5314: 3548, 1219: 3618, 5316: 3548, 1221: 3618,
+        1222: 3618, 5320: 3548, 1225: 3618, 1226: 3618,
+        1228: 3618, 5328: 3548, 1233: 3618, 1234: 3618,
+        1236: 3618, 1240: 3618, 5344: 3548, 1249: 3618,
+        1250: 3618, 1252: 3618, 1256: 3618, 1264: 3618,
+        5379: 3547, 5381: 3547, 5382: 3547, 1287: 3615,
+        5385: 3547, 5386: 3547, 1291: 3614, 5388: 3547,
+        1293: 3614, 1294: 3614, 5393: 3547, 5394: 3547,
+        1299: 3613, 5396: 3547, 1301: 3613, 1302: 3613,
+        5400: 3547, 1305: 3613, 1306: 3613, 1308: 3613,
+        5409: 3547, 5410: 3547, 1315: 3612, 5412: 3547,
+        1317: 3612, 1318: 3612, 5416: 3547, 1321: 3612,
+        1322: 3612, 1324: 3612, 5424: 3547, 1329: 3612,
+        1330: 3612, 1332: 3612, 1336: 3612, 5441: 3547,
+        5442: 3547, 1347: 3611, 5444: 3547, 1349: 3611,
+        1350: 3611, 5448: 3547, 1353: 3611, 1354: 3611,
+        1356: 3611, 5456: 3547, 1361: 3611, 1362: 3611,
+        1364: 3611, 1368: 3611, 5472: 3547, 1377: 3611,
+        1378: 3611, 1380: 3611, 1384: 3611, 1392: 3611,
+        5505: 3547, 5506: 3547, 1411: 3610, 5508: 3547,
+        1413: 3610, 1414: 3610, 5512: 3547, 1417: 3610,
+        1418: 3610, 1420: 3610, 5520: 3547, 1425: 3610,
+        1426: 3610, 1428: 3610, 1432: 3610, 5536: 3547,
+        1441: 3610, 1442: 3610, 1444: 3610, 1448: 3610,
+        1456: 3610, 5568: 3547, 1473: 3610, 1474: 3610,
+        1476: 3610, 1480: 3610, 1488: 3610, 1504: 3610,
+        5635: 3546, 5637: 3546, 5638: 3546, 1543: 3607,
+        5641: 3546, 5642: 3546, 1547: 3606, 5644: 3546,
+        1549: 3606, 1550: 3606, 5649: 3546, 5650: 3546,
+        1555: 3605, 5652: 3546, 1557: 3605, 1558: 3605,
+        5656: 3546, 1561: 3605, 1562: 3605, 1564: 3605,
+        5665: 3546, 5666: 3546, 1571: 3604, 5668: 3546,
+        1573: 3604, 1574: 3604, 5672: 3546, 1577: 3604,
+        1578: 3604, 1580: 3604, 5680: 3546, 1585: 3604,
+        1586: 3604, 1588: 3604, 1592: 3604, 5697: 3546,
+        5698: 3546, 1603: 3603, 5700: 3546, 1605: 3603,
+        1606: 3603, 5704: 3546, 1609: 3603, 1610: 3603,
+        1612: 3603, 5712: 3546, 1617: 3603, 1618: 3603,
+        1620: 3603, 1624: 3603, 5728: 3546, 1633: 3603,
+        1634: 3603, 1636: 3603, 1640: 3603, 1648: 3603,
+        5761: 3546, 5762: 3546, 1667: 3602, 5764: 3546,
+        1669: 3602, 1670: 3602, 5768: 3546, 1673: 3602,
+        1674: 3602, 1676: 3602, 5776: 3546, 1681: 3602,
+        1682: 3602, 1684: 3602, 1688: 3602, 5792: 3546,
+        1697: 3602, 1698: 3602, 1700: 3602, 1704: 3602,
+        1712: 3602, 5824: 3546, 1729: 3602, 1730: 3602,
+        1732: 3602, 1736: 3602, 1744: 3602, 1760: 3602,
+        5889: 1600, 5890: 1600, 1795: 3601, 5892: 1600,
+        1797: 3601, 1798: 3601, 5896: 1600, 1801: 3601,
+        1802: 3601, 1804: 3601, 5904: 1600, 1809: 3601,
+        1810: 3601, 1812: 3601, 1816: 3601, 5920: 1600,
+        1825: 3601, 1826: 3601, 1828: 3601, 1832: 3601,
+        1840: 3601, 5952: 1600, 1857: 3601, 1858: 3601,
+        1860: 3601, 1864: 3601, 1872: 3601, 1888: 3601,
+        6016: 1600, 1921: 1601, 1922: 1601, 1924: 1601,
+        1928: 1601, 1936: 1601, 1952: 1601, 1984: 1601 },
+        72: { 3584: 3118, 3073: 3118, 3074: 3118, 1027: 3119,
+        1540: 3119, 4101: 3117, 4102: 3117, 7: 3125,
+        5152: 3117, 5122: 3117, 4228: 3117, 1552: 3119,
+        4113: 3117, 530: 3120, 19: 3124, 532: 3120,
+        21: 3124, 22: 3124, 2592: 3118, 1284: 3119,
+        517: 3120, 1568: 3119, 1057: 3119, 2082: 3118,
+        35: 3123, 1041: 3119, 37: 3123, 38: 3123,
+        4144: 3117, 3328: 3118, 2320: 3118, 560: 3120,
+        49: 3123, 50: 3123, 52: 1606, 2576: 3118,
+        769: 3120, 1042: 3119, 2065: 3118, 3088: 3118,
+        2336: 3118, 4384: 3117, 1537: 3119, 4640: 3117,
+        770: 3120, 2816: 3118, 1060: 3119, 546: 3120,
+        1296: 3119, 4129: 3117, 529: 3120, 1282: 3119,
+        2305: 3118, 2066: 3118, 4368: 3117, 515: 3120,
+        1538: 3119, 2561: 3118, 4624: 3117, 6400: 3117,
+        1044: 3119, 2084: 3118, 1664: 3119, 2177: 3118,
+        1154: 3119, 131: 3122, 644: 3120, 133: 3122,
+        134: 3122, 6176: 3117, 656: 3120, 145: 3122,
+        146: 3122, 148: 3122, 2068: 3118, 2051: 3118,
+        161: 3122, 4114: 3117, 164: 3122, 6160: 3117,
+        4353: 3117, 5376: 3117, 176: 1605, 1058: 3119,
+        4609: 3117, 5632: 3117, 1029: 3119, 4132: 3117,
+        1312: 3119, 5121: 3117, 2308: 3118, 2081: 3118,
+        518: 3120, 4130: 3117, 2564: 3118, 4610: 3117,
+        6656: 3117, 548: 3120, 1030: 3119, 2053: 3118,
+        2562: 3118, 4116: 3117, 4099: 3117, 6145: 3117,
+        7168: 3117, 1184: 3119, 2054: 3118, 1792: 3119,
+        1281: 3119, 2306: 3118, 259: 3121, 772: 3120,
+        261: 3121, 262: 3121, 4225: 3117, 2208: 3118,
+        642: 3120, 4612: 3117, 784: 3120, 273: 3121,
+        274: 3121, 276: 3121, 3200: 3118, 1156: 3119,
+        4864: 3117, 5124: 3117, 800: 3120, 289: 3121,
+        290: 3121, 4356: 3117, 292: 3121, 2192: 3118,
+        304: 3121, 1408: 3119, 5136: 3117, 641: 3120,
+        6148: 3117, 1153: 3119, 4256: 3117, 2432: 3118,
+        6146: 3117, 2688: 3118, 1168: 3119, 4240: 3117,
+        896: 3120, 385: 3121, 386: 3121, 388: 3121,
+        2178: 3118, 400: 3121, 4480: 3117, 4736: 3117,
+        416: 3121, 5248: 3117, 672: 3120, 2180: 3118,
+        3076: 3118, 4226: 3117, 1072: 3119, 6272: 3117,
+        162: 3122, 3104: 3118, 2096: 3118, 545: 3120,
+        4354: 3117 },
+        73: { 32: 3123, 128: 3122, 2: 3126, 4096: 3117,
+        4: 3125, 1024: 3119, 256: 3121, 16: 3124,
+        512: 3120, 2048: 3118 },
+        74: { 128: 3122, 1: 3126, 4096: 3117, 4: 3125,
+        1024: 3119, 32: 3123, 256: 3121, 16: 3124,
+        512: 3120, 2048: 3118 },
+        76: { 128: 3122, 1: 3125, 2: 3125, 4096: 3117,
+        1024: 3119, 32: 3123, 256: 3121, 16: 3124,
+        512: 3120, 2048: 3118 },
+        13: { 32: 3267, 128: 3265, 2: 3269, 4096: 3260,
+        1024: 3262, 64: 3266, 256: 3264, 16: 3268,
+        512: 3263, 2048: 3261 },
+        2128: { 128: 2648, 1: 2650, 2: 2650, 4096: 2644,
+        4: 2650, 1024: 2645, 32: 2649, 8: 2650,
+        256: 2647, 512: 2646 },
+        81: { 32: 3112, 128: 3111, 2: 3115, 4096: 3106,
+        4: 3114, 1024: 3108, 8: 3113, 256: 3110,
+        512: 3109, 2048: 3107 },
+        82: { 128: 3111, 1: 3115, 4096: 3106, 4: 3114,
+        1024: 3108, 32: 3112, 8: 3113, 256: 3110,
+        512: 3109, 2048: 3107 },
+        84: { 128: 3111, 1: 3114, 2: 3114, 4096: 3106,
+        1024: 3108, 32: 3112, 8: 3113, 256: 3110,
+        512: 3109, 2048: 3107 },
+        88: { 32: 3112, 1: 3113, 2: 3113, 4096: 3106,
+        4: 3113, 1024: 3108, 128: 3111, 256: 3110,
+        512: 3109, 2048: 3107 },
+        96: { 3584: 3096, 3073: 3096, 6146: 3095, 1027: 3097,
+        1540: 3097, 4101: 3095, 4102: 3095, 7: 3103,
+        1544: 3097, 521: 3098, 4106: 3095, 11: 3102,
+        1036: 3097, 13: 3102, 14: 3102, 4228: 3095,
+        1552: 3097, 4113: 3095, 4114: 3095, 2051: 3096,
+        529: 3098, 21: 3101, 22: 3101, 536: 3098,
+        25: 3101, 26: 3101, 28: 1606, 517: 3098,
+        518: 3098, 3328: 3096, 2320: 3096, 1288: 3097,
+        530: 3098, 2576: 3096, 4105: 3095, 2312: 3096,
+        2184: 3096, 769: 3098, 522: 3098, 1042: 3097,
+        2065: 3096, 3088: 3096, 524: 3098, 1281: 3097,
+        1537: 3097, 770: 3098, 2816: 3096, 1296: 3097,
+        1041: 3097, 1282: 3097, 2305: 3096, 2066: 3096,
+        4368: 3095, 515: 3098, 1538: 3097, 19: 3101,
+        2561: 3096, 4624: 3095, 532: 3098, 4232: 3095,
+        1044: 3097, 1664: 3097, 4225: 3095, 2178: 3096,
+        131: 3100, 644: 3098, 133: 3100, 134: 3100,
+        648: 3098, 137: 3100, 138: 3100, 140: 3100,
+        656: 3098, 145: 3100, 146: 3100, 148: 3100,
+        152: 1605, 2432: 3096, 2068: 3096, 3074: 3096,
+        5136: 3095, 1284: 3097, 5376: 3095, 3080: 3096,
+        4120: 3095, 4609: 3095, 5632: 3095, 1029: 3097,
+        5121: 3095, 2308: 3096, 4354: 3095, 2564: 3096,
+        4610: 3095, 6656: 3095, 1030: 3097, 2053: 3096,
+        2562: 3096, 4116: 3095, 4099: 3095, 5122: 3095,
+        6145: 3095, 7168: 3095, 1048: 3097, 2054: 3096,
+        1792: 3097, 4353: 3095, 2306: 3096, 259: 3099,
+        772: 3098, 261: 3099, 262: 3099, 641: 3098,
+        776: 3098, 265: 3099, 266: 3099, 268: 3099,
+        4226: 3095, 4612: 3095, 784: 3098, 273: 3099,
+        274: 3099, 276: 3099, 2072: 3096, 280: 3099,
+        1156: 3097, 4864: 3095, 5124: 3095, 4356: 3095,
+        2192: 3096, 1160: 3097, 1408: 3097, 1033: 3097,
+        6148: 3095, 6160: 3095, 2568: 3096, 1153: 3097,
+        6400: 3095, 1034: 3097, 2057: 3096, 642: 3098,
+        2688: 3096, 1168: 3097, 1154: 3097, 2177: 3096,
+        4240: 3095, 3200: 3096, 2058: 3096, 4360: 3095,
+        896: 1603, 385: 3099, 386: 3099, 388: 3099,
+        4616: 3095, 392: 3099, 400: 1604, 4480: 3095,
+        5128: 3095, 4736: 3095, 5248: 3095, 2060: 3096,
+        6152: 3095, 2180: 3096, 3076: 3096, 6272: 3095,
+        4108: 3095 },
+        97: { 128: 3100, 256: 3099, 2: 3104, 4096: 3095,
+        4: 3103, 1024: 3097, 8: 3102, 16: 3101,
+        512: 3098, 2048: 3096 },
+        98: { 128: 3100, 1: 3104, 4096: 3095, 4: 3103,
+        1024: 3097, 8: 3102, 256: 3099, 16: 3101,
+        512: 3098, 2048: 3096 },
+        100: { 128: 3100, 1: 3103, 2: 3103, 4096: 3095,
+        1024: 3097, 8: 3102, 256: 3099, 16: 3101,
+        512: 3098, 2048: 3096 },
+        4113: { 32: 2551, 128: 2549, 2: 2554, 4: 2553,
+        1024: 2546, 8: 2552, 64: 2550, 256: 2548,
+        512: 2547, 2048: 2545 },
+        104: { 128: 3100, 1: 3102, 2: 3102, 4096: 3095,
+        4: 3102, 1024: 3097, 256: 3099, 16: 3101,
+        512: 3098, 2048: 3096 },
+        4114: { 128: 2549, 1: 2554, 4: 2553, 1024: 2546,
+        32: 2551, 8: 2552, 64: 2550, 256: 2548,
+        512: 2547, 2048: 2545 },
+        112: { 128: 3100, 1: 3101, 2: 3101, 4096: 3095,
+        4: 3101, 1024: 3097, 8: 3101, 256: 3099,
+        512: 3098, 2048: 3096 },
+        2068: { 128: 2670, 1: 2674, 2: 2674, 4096: 2666,
+        1024: 2667, 32: 2672, 8: 2673, 64: 2671,
+        256: 2669, 512: 2668 },
+        128: { 2048: 72, 1: 82, 2: 81, 4: 80,
+        6151: 4433, 8: 79, 6155: 4432, 6157: 4432,
+        6158: 4432, 2063: 4520, 16: 78, 4440: 4453,
+        6163: 4431, 6165: 4431, 6166: 4431, 2071: 4517,
+        6169: 4431, 6170: 4431, 4123: 4471, 6172: 4431,
+        4125: 4471, 4126: 4471, 31: 1608, 32: 77,
+        6179: 4430, 6181: 4430, 6182: 4430, 2087: 4513,
+        6185: 4430, 6186: 4430, 4139: 4467, 6188: 4430,
+        2093: 4512, 2094: 4512, 47: 4630, 6480: 4428,
+        6193: 4430, 6194: 4430, 4147: 4466, 6196: 4430,
+        2101: 4511, 2102: 4511, 55: 4627, 6200: 4430,
+        4153: 4466, 2106: 4511, 59: 4626, 2108: 4511,
+        61: 4626, 62: 1607, 4912: 4445, 64: 76,
+        5472: 4437, 6211: 4429, 6213: 4429, 6214: 4429,
+        2119: 4508, 6217: 4429, 6218: 4429, 2123: 4507,
+        6220: 4429, 2125: 4507, 2126: 4507, 79: 4620,
+        6225: 4429, 6226: 4429, 2131: 4506, 6228: 4429,
+        2133: 4506, 2134: 4506, 87: 4617, 6232: 4429,
+        2137: 4506, 2138: 4506, 91: 4616, 2140: 4506,
+        93: 4616, 94: 4616, 6241: 4429, 6242: 4429,
+        4195: 4460, 6244: 4429, 2149: 4505, 2150: 4505,
+        103: 4613, 6248: 4429, 2153: 4505, 2154: 4505,
+        107: 4612, 2156: 4505, 109: 4612, 110: 4612,
+        6256: 4429, 4209: 4460, 2162: 4505, 115: 4611,
+        5388: 4437, 117: 4611, 118: 4611, 2168: 1605,
+        121: 1605, 122: 1605, 124: 1605, 5141: 4440,
+        5920: 4436, 5142: 4440, 4096: 71, 4119: 4472,
+        5145: 4440, 5146: 4440, 4464: 1604, 2075: 4516,
+        5148: 4440, 2077: 4516, 2078: 4516, 1024: 73,
+        7440: 4426, 376: 1604, 5155: 4439, 3109: 4484,
+        5158: 4439, 4135: 4468, 5161: 4439, 5162: 4439,
+        256: 75, 1067: 4548, 6405: 4428, 6406: 4428,
+        2311: 4502, 6409: 4428, 6410: 4428, 4363: 4456,
+        6412: 4428, 4365: 4456, 2318: 4501, 271: 4605,
+        6417: 4428, 6418: 4428, 2323: 4500, 6420: 4428,
+        2325: 4500, 2326: 4500, 279: 4602, 6424: 4428,
+        2329: 4500, 2330: 4500, 283: 4601, 2332: 4500,
+        285: 4601, 286: 4601, 6433: 4428, 6434: 4428,
+        2339: 4499, 6436: 4428, 2341: 4499, 2342: 4499,
+        295: 4598, 6440: 4428, 4393: 4454, 2346: 4499,
+        299: 4597, 2348: 4499, 301: 4597, 302: 4597,
+        6448: 4428, 2353: 4499, 2354: 4499, 2099: 4511,
+        2356: 4499, 309: 4596, 310: 4596, 2360: 4499,
+        313: 4596, 314: 4596, 316: 4596, 4149: 4466,
+        6465: 4428, 6466: 4428, 2371: 4498, 6468: 4428,
+        4421: 4453, 2374: 4498, 327: 4593, 6472: 4428,
+        4425: 4453, 2378: 4498, 331: 4592, 2380: 4498,
+        333: 4592, 334: 4592, 5224: 4438, 4433: 4453,
+        2386: 4498, 339: 4591, 2388: 4498, 341: 4591,
+        342: 4591, 2105: 4511, 2392: 4498, 345: 4591,
+        346: 4591, 348: 4591, 4154: 4466, 6496: 4428,
+        2401: 4498, 2402: 4498, 355: 4590, 2404: 4498,
+        357: 4590, 358: 4590, 2408: 4498, 361: 4590,
+        362: 4590, 364: 4590, 2416: 1604, 369: 1604,
+        370: 1604, 372: 1604, 5127: 4442, 5187: 4438,
+        3141: 4483, 5190: 4438, 4167: 4463, 5193: 4438,
+        5194: 4438, 4652: 4447, 4171: 4462, 5196: 4438,
+        4173: 4462, 4174: 4462, 3153: 4483, 3085: 4486,
+        5202: 4438, 4449: 4453, 5131: 4441, 4179: 4461,
+        5204: 4438, 4181: 4461, 512: 74, 6659: 4427,
+        6661: 4427, 6662: 4427, 3841: 1601, 6665: 4427,
+        6666: 4427, 2571: 4494, 6668: 4427, 4621: 4449,
+        2574: 4494, 527: 4584, 6673: 4427, 6674: 4427,
+        4627: 4448, 6676: 4427, 2581: 4493, 2582: 4493,
+        535: 4581, 6680: 4427, 2585: 4493, 2586: 4493,
+        539: 4580, 2588: 4493, 541: 4580, 542: 4580,
+        4869: 4445, 6689: 4427, 6690: 4427, 2595: 4492,
+        6692: 4427, 2597: 4492, 2598: 4492, 551: 4577,
+        6696: 4427, 4649: 4447, 2602: 4492, 555: 4576,
+        2604: 4492, 557: 4576, 558: 4576, 6704: 4427,
+        2609: 4492, 2610: 4492, 563: 4575, 2612: 4492,
+        565: 4575, 566: 4575, 2825: 4490, 2616: 4492,
+        569: 4575, 570: 4575, 572: 4575, 4874: 4445,
+        6721: 4427, 6722: 4427, 2627: 4491, 6724: 4427,
+        2629: 4491, 2630: 4491, 3169: 4483, 4111: 1609,
+        2633: 4491, 5134: 4441, 587: 4571, 2636: 4491,
+        589: 4571, 590: 4571, 6736: 4427, 4689: 4446,
+        2642: 4491, 595: 4570, 2644: 4491, 597: 4570,
+        598: 4570, 5680: 4436, 2648: 4491, 601: 4570,
+        602: 4570, 604: 4570, 4197: 4460, 6752: 4427,
+        2657: 4491, 2658: 4491, 611: 4569, 2660: 4491,
+        613: 4569, 614: 4569, 4881: 4445, 2664: 4491,
+        617: 4569, 618: 4569, 620: 4569, 4882: 4445,
+        6728: 4427, 2672: 4491, 625: 4569, 626: 4569,
+        628: 4569, 4201: 4460, 632: 1605, 2836: 4490,
+        4202: 4460, 4204: 4460, 4888: 4445, 2091: 4512,
+        4182: 4461, 5232: 4438, 2161: 4505, 4210: 4460,
+        2164: 4505, 4456: 4453, 4897: 4445, 4898: 4445,
+        4216: 1605, 4900: 4445, 5139: 4440, 1832: 4526,
+        4185: 4461, 4867: 4445, 5890: 4436, 6913: 4427,
+        6914: 4427, 2819: 4490, 6916: 4427, 2821: 4490,
+        2822: 4490, 775: 4566, 6920: 4427, 4873: 4445,
+        2826: 4490, 779: 4565, 2828: 4490, 781: 4565,
+        782: 4565, 6928: 4427, 2833: 4490, 2834: 4490,
+        787: 4564, 4186: 4461, 789: 4564, 790: 4564,
+        2840: 4490, 793: 4564, 794: 4564, 796: 4564,
+        6944: 4427, 2849: 4490, 2850: 4490, 803: 4563,
+        2852: 4490, 805: 4563, 806: 4563, 4664: 4447,
+        2856: 4490, 809: 4563, 810: 4563, 812: 4563,
+        2864: 4490, 817: 4563, 818: 4563, 820: 4563,
+        5892: 4436, 824: 4563, 6976: 4427, 4929: 4445,
+        2882: 4490, 835: 4562, 2884: 4490, 837: 4562,
+        838: 4562, 2888: 4490, 841: 4562, 842: 4562,
+        844: 4562, 4188: 4461, 849: 4562, 4870: 4445,
+        852: 4562, 856: 4562, 4450: 4453, 2912: 1603,
+        865: 1603, 866: 1603, 868: 1603, 872: 1603,
+        880: 1603, 4452: 4453, 5952: 1602, 2881: 4490,
+        4930: 4445, 4932: 4445, 5896: 4436, 4936: 4445,
+        4396: 4454, 2896: 4490, 2147: 4505, 1384: 4534,
+        850: 4562, 4944: 4445, 7171: 4426, 7173: 4426,
+        7174: 4426, 3079: 4487, 7177: 4426, 7178: 4426,
+        3083: 4486, 7180: 4426, 5133: 4441, 3086: 4486,
+        1039: 4556, 7185: 4426, 7186: 4426, 3091: 4485,
+        7188: 4426, 3093: 4485, 3094: 4485, 1047: 4553,
+        7192: 4426, 3097: 4485, 3098: 4485, 1051: 4552,
+        3100: 4485, 1053: 4552, 1054: 4552, 5637: 4436,
+        7201: 4426, 7202: 4426, 3107: 4484, 7204: 4426,
+        5157: 4439, 3110: 4484, 1063: 4549, 7208: 4426,
+        3113: 4484, 3114: 4484, 2567: 4495, 3116: 4484,
+        1069: 4548, 1070: 4548, 7216: 4426, 3121: 4484,
+        3122: 4484, 1075: 4547, 3124: 4484, 1077: 4547,
+        1078: 4547, 5641: 4436, 3128: 4484, 1081: 4547,
+        1082: 4547, 1084: 4547, 5642: 4436, 7233: 4426,
+        7234: 4426, 3139: 4483, 7236: 4426, 5189: 4438,
+        3142: 4483, 1095: 4544, 7240: 4426, 3145: 4483,
+        3146: 4483, 1099: 4543, 3148: 4483, 1101: 4543,
+        1102: 4543, 2573: 4494, 7248: 4426, 5201: 4438,
+        3154: 4483, 1107: 4542, 3156: 4483, 1109: 4542,
+        1110: 4542, 3160: 4483, 1113: 4542, 1114: 4542,
+        1116: 4542, 7264: 4426, 5217: 4438, 3170: 4483,
+        1123: 4541, 3172: 4483, 1125: 4541, 1126: 4541,
+        5649: 4436, 3176: 4483, 1129: 4541, 1130: 4541,
+        1132: 4541, 5650: 4436, 3184: 4483, 1137: 4541,
+        1138: 4541, 2579: 4493, 1140: 4541, 1144: 1605,
+        5652: 4436, 4198: 4460, 4629: 4448, 4630: 4448,
+        5656: 4436, 4633: 4448, 4634: 4448, 5904: 4436,
+        4636: 4448, 4876: 4445, 5218: 4438, 3617: 4481,
+        5666: 4436, 4643: 4447, 5668: 4436, 4645: 4447,
+        4960: 1603, 4646: 4447, 5672: 4436, 4884: 4445,
+        2601: 4492, 4650: 4447, 7425: 4426, 7426: 4426,
+        5379: 4437, 7428: 4426, 3333: 4482, 3334: 4482,
+        1287: 4538, 7432: 4426, 5385: 4437, 3338: 4482,
+        1291: 4537, 3340: 4482, 1293: 4537, 1294: 4537,
+        5635: 4436, 3345: 4482, 3346: 4482, 1299: 4536,
+        3348: 4482, 1301: 4536, 1302: 4536, 3352: 4482,
+        1305: 4536, 1306: 4536, 1308: 4536, 7456: 4426,
+        5409: 4437, 3362: 4482, 1315: 4535, 3364: 4482,
+        1317: 4535, 1318: 4535, 4657: 4447, 3368: 4482,
+        1321: 4535, 1322: 4535, 1324: 4535, 4658: 4447,
+        3376: 4482, 1329: 4535, 1330: 4535, 1332: 4535,
+        1336: 4535, 4660: 4447, 7488: 4426, 3393: 4482,
+        3394: 4482, 1347: 4534, 4682: 4446, 1349: 4534,
+        1350: 4534, 3400: 4482, 1353: 4534, 1354: 4534,
+        1356: 4534, 3408: 4482, 1361: 4534, 1362: 4534,
+        1364: 4534, 1368: 4534, 3424: 4482, 1377: 4534,
+        1378: 4534, 1380: 4534, 4615: 4450, 5638: 4436,
+        1392: 1604, 3649: 4481, 5698: 4436, 5424: 4437,
+        4675: 4446, 5220: 4438, 5700: 4436, 4677: 4446,
+        4678: 4446, 583: 4572, 5704: 4436, 4681: 4446,
+        2634: 4491, 4684: 4446, 4141: 4467, 5164: 4439,
+        4619: 4449, 5712: 4436, 2641: 4491, 4142: 4467,
+        4690: 4446, 4692: 4446, 7681: 4426, 7682: 4426,
+        3587: 4481, 7684: 4426, 3589: 4481, 3590: 4481,
+        1543: 4531, 7688: 4426, 3593: 4481, 3594: 4481,
+        1547: 4530, 3596: 4481, 1549: 4530, 1550: 4530,
+        7696: 4426, 3601: 4481, 3602: 4481, 1555: 4529,
+        3604: 4481, 1557: 4529, 1558: 4529, 3608: 4481,
+        1561: 4529, 1562: 4529, 1564: 4529, 5644: 4436,
+        5381: 4437, 7712: 4426, 5665: 4436, 3618: 4481,
+        1571: 4528, 3620: 4481, 1573: 4528, 1574: 4528,
+        3624: 4481, 1577: 4528, 1578: 4528, 4359: 4457,
+        1580: 4528, 3632: 4481, 1585: 4528, 1586: 4528,
+        1588: 4528, 3337: 4482, 1592: 4528, 4622: 4449,
+        5386: 4437, 7744: 4426, 5697: 4436, 3650: 4481,
+        1603: 4527, 3652: 4481, 1605: 4527, 1606: 4527,
+        4705: 4446, 3656: 4481, 1609: 4527, 1610: 4527,
+        1612: 4527, 4706: 4446, 2317: 4501, 3664: 4481,
+        1617: 4527, 1618: 4527, 1620: 4527, 4366: 4456,
+        1624: 4527, 4708: 4446, 3680: 4481, 1633: 4527,
+        1634: 4527, 1636: 4527, 5169: 4439, 5393: 4437,
+        1640: 4527, 5394: 4437, 1648: 4527, 4712: 4446,
+        4371: 4455, 5396: 4437, 4373: 4455, 5170: 4439,
+        4374: 4455, 5400: 4437, 4377: 4455, 4378: 4455,
+        4720: 4446, 5444: 4437, 4380: 4455, 4212: 4460,
+        5172: 4439, 3361: 4482, 3331: 4482, 5410: 4437,
+        4387: 4454, 5412: 4437, 4150: 4466, 5208: 4438,
+        4389: 4454, 4390: 4454, 4696: 4446, 5416: 4437,
+        2345: 4499, 4394: 4454, 7936: 1600, 5889: 4436,
+        3842: 1601, 1795: 4526, 3844: 1601, 1797: 4526,
+        1798: 4526, 3848: 1601, 1801: 4526, 1802: 4526,
+        1804: 4526, 3856: 1601, 1809: 4526, 1810: 4526,
+        1812: 4526, 1816: 4526, 3872: 1601, 1825: 4526,
+        1826: 4526, 1828: 4526, 4401: 4454, 6403: 4428,
+        4402: 4454, 1840: 4526, 307: 4596, 5176: 4439,
+        4404: 4454, 3904: 1601, 1857: 1602, 1858: 1602,
+        1860: 1602, 1864: 1602, 4904: 4445, 1872: 1602,
+        4408: 4454, 1888: 1602, 5382: 4437, 5441: 4437,
+        5442: 4437, 4156: 4466, 4419: 4453, 2315: 4501,
+        3396: 4482, 2373: 4498, 4422: 4453, 5448: 4437,
+        2377: 4498, 4426: 4453, 4428: 4453, 5456: 4437,
+        5728: 4436, 2385: 4498, 4434: 4453, 4436: 4453 },
+        129: { 3584: 3085, 2816: 3085, 6146: 3084, 6148: 3084,
+        2054: 3085, 5184: 3084, 1544: 3086, 522: 3087,
+        1036: 3086, 4610: 3084, 14: 3092, 2336: 3085,
+        1552: 3086, 530: 3087, 2068: 3085, 22: 3091,
+        2592: 3085, 536: 3087, 4612: 3084, 26: 3091,
+        28: 3091, 1092: 3086, 4130: 3084, 1058: 3086,
+        2084: 3085, 4102: 3084, 38: 3090, 4144: 3084,
+        552: 3087, 42: 3090, 4368: 3084, 44: 3090,
+        2320: 3085, 560: 3087, 1288: 3086, 50: 3090,
+        52: 3090, 2576: 3085, 56: 3090, 1034: 3086,
+        2116: 3085, 1120: 3086, 2114: 3085, 2082: 3085,
+        4164: 3084, 70: 3089, 584: 3087, 524: 3087,
+        74: 3089, 76: 3089, 548: 3087, 592: 3087,
+        82: 3089, 84: 3089, 4416: 3084, 4640: 3084,
+        88: 3089, 1060: 3086, 608: 3087, 1296: 3086,
+        98: 3089, 100: 3089, 5152: 3084, 104: 3089,
+        1282: 3086, 4114: 3084, 532: 3087, 112: 3089,
+        1538: 3086, 4624: 3084, 4116: 3084, 4672: 3084,
+        1044: 3086, 5136: 3084, 6176: 3084, 2306: 3085,
+        1048: 3086, 2562: 3085, 772: 3087, 4864: 3084,
+        3074: 3085, 6160: 3084, 1540: 3086, 3080: 3085,
+        5632: 3084, 2120: 3085, 1312: 3086, 2308: 3085,
+        3104: 3085, 518: 3087, 546: 3087, 2564: 3085,
+        3328: 3085, 6656: 3084, 4132: 3084, 1030: 3086,
+        3076: 3085, 5122: 3084, 7168: 3084, 1064: 3086,
+        2088: 3085, 4168: 3084, 1792: 3086, 770: 3087,
+        1284: 3086, 262: 3088, 776: 3087, 266: 3088,
+        268: 3088, 784: 3087, 274: 3088, 276: 3088,
+        2072: 3085, 280: 3088, 5124: 3084, 800: 3087,
+        1072: 3086, 290: 3088, 4356: 3084, 292: 3088,
+        296: 3088, 304: 3088, 4136: 3084, 2312: 3085,
+        832: 3087, 322: 3088, 324: 3088, 2568: 3085,
+        328: 3088, 6400: 3084, 1042: 3086, 336: 3088,
+        4120: 3084, 4162: 3084, 352: 3088, 3088: 3085,
+        5376: 3084, 6208: 3084, 2058: 3085, 4360: 3084,
+        1344: 3086, 4616: 3084, 2144: 3085, 3136: 3085,
+        578: 3087, 4384: 3084, 5128: 3084, 580: 3087,
+        2128: 3085, 2060: 3085, 1096: 3086, 4106: 3084,
+        6152: 3084, 1600: 3086, 4192: 3084, 2368: 3085,
+        1568: 3086, 2624: 3085, 1104: 3086, 1090: 3086,
+        2096: 3085, 4176: 3084, 2066: 3085, 4108: 3084,
+        4354: 3084 },
+        130: { 3584: 3074, 3073: 3074, 6148: 3073, 4101: 3073,
+        4609: 3073, 1544: 3075, 4105: 3073, 1036: 3075,
+        13: 3081, 1296: 3075, 2336: 3074, 1552: 3075,
+        4113: 3073, 2068: 3074, 21: 3080, 2592: 3074,
+        536: 3076, 772: 3076, 28: 3080, 2053: 3074,
+        1092: 3075, 1057: 3075, 1041: 3075, 37: 3079,
+        4144: 3073, 552: 3076, 41: 3079, 3328: 3074,
+        44: 3079, 2320: 3074, 560: 3076, 49: 3079,
+        52: 3079, 2576: 3074, 521: 3076, 56: 3079,
+        2116: 3074, 577: 3076, 6400: 3073, 4164: 3073,
+        69: 3078, 3088: 3074, 584: 3076, 73: 3078,
+        1281: 3075, 548: 3076, 592: 3076, 81: 3078,
+        1537: 3075, 4416: 3073, 4640: 3073, 88: 3078,
+        4116: 3073, 2816: 3074, 1060: 3075, 608: 3076,
+        97: 3078, 100: 3078, 4129: 3073, 529: 3076,
+        104: 3078, 2305: 3074, 4368: 3073, 112: 3078,
+        2561: 3074, 4624: 3073, 532: 3076, 4672: 3073,
+        1044: 3075, 2084: 3074, 5136: 3073, 6176: 3073,
+        1048: 3075, 25: 3080, 4864: 3073, 1284: 3075,
+        517: 3076, 1540: 3075, 3080: 3074, 5184: 3073,
+        5632: 3073, 2120: 3074, 1029: 3075, 1312: 3075,
+        5121: 3073, 2308: 3074, 2081: 3074, 2564: 3074,
+        6656: 3073, 4132: 3073, 3076: 3074, 6145: 3073,
+        7168: 3073, 5152: 3073, 1064: 3075, 4192: 3073,
+        2088: 3074, 4168: 3073, 1792: 3075, 769: 3076,
+        4356: 3073, 261: 3077, 776: 3076, 265: 3077,
+        268: 3077, 4612: 3073, 784: 3076, 273: 3077,
+        276: 3077, 2072: 3074, 280: 3077, 5124: 3073,
+        800: 3076, 289: 3077, 292: 3077, 296: 3077,
+        304: 3077, 1033: 3075, 4136: 3073, 2312: 3074,
+        832: 3076, 321: 3077, 324: 3077, 6160: 3073,
+        2568: 3074, 328: 3077, 336: 3077, 2057: 3074,
+        4120: 3073, 2065: 3074, 352: 3077, 4353: 3073,
+        1120: 3075, 5376: 3073, 6208: 3073, 4360: 3073,
+        524: 3076, 1344: 3075, 4616: 3073, 4161: 3073,
+        2144: 3074, 3136: 3074, 4384: 3073, 5128: 3073,
+        1288: 3075, 580: 3076, 2128: 3074, 2060: 3074,
+        1096: 3075, 6152: 3073, 1600: 3075, 1089: 3075,
+        1072: 3075, 76: 3078, 2368: 3074, 2624: 3074,
+        1104: 3075, 3104: 3074, 2113: 3074, 2096: 3074,
+        4176: 3073, 4108: 3073, 545: 3076, 1568: 3075,
+        84: 3078 },
+        131: { 256: 3077, 64: 3078, 4096: 3073, 4: 3082,
+        1024: 3075, 32: 3079, 8: 3081, 16: 3080,
+        512: 3076, 2048: 3074 },
+        4228: { 64: 2516, 1: 2520, 2: 2520, 1024: 2513,
+        32: 2517, 8: 2519, 256: 2515, 16: 2518,
+        512: 2514, 2048: 2512 },
+        133: { 256: 3066, 64: 3067, 2: 3071, 4096: 3062,
+        1024: 3064, 32: 3068, 8: 3070, 16: 3069,
+        512: 3065, 2048: 3063 },
+        134: { 64: 3067, 1: 3071, 4096: 3062, 1024: 3064,
+        32: 3068, 8: 3070, 256: 3066, 16: 3069,
+        512: 3065, 2048: 3063 },
+        2184: { 64: 2637, 1: 2640, 2: 2640, 4096: 2633,
+        4: 2640, 1024: 2634, 32: 2638, 256: 2636,
+        16: 2639, 512: 2635 },
+        137: { 32: 3057, 64: 3056, 2: 3060, 4096: 3051,
+        4: 3059, 1024: 3053, 256: 3055, 16: 3058,
+        512: 3054, 2048: 3052 },
+        138: { 256: 3055, 1: 3060, 4096: 3051, 4: 3059,
+        1024: 3053, 32: 3057, 64: 3056, 16: 3058,
+        512: 3054, 2048: 3052 },
+        140: { 256: 3055, 1: 3059, 2: 3059, 4096: 3051,
+        1024: 3053, 32: 3057, 64: 3056, 16: 3058,
+        512: 3054, 2048: 3052 },
+        144: { 3584: 3041, 3073: 3041, 6146: 3040, 1027: 3042,
+        1540: 3042, 4101: 3040, 4102: 3040, 7: 3048,
+        1544: 3042, 1033: 3042, 4106: 3040, 11: 3047,
+        1036: 3042, 13: 3047, 14: 3047, 2336: 3041,
+        4416: 3040, 2051: 3041, 2592: 3041, 4672: 3040,
+        1284: 3042, 517: 3043, 1092: 3042, 1057: 3042,
+        2082: 3041, 35: 3046, 548: 3043, 37: 3046,
+        38: 3046, 3104: 3041, 552: 3043, 41: 3046,
+        42: 3046, 44: 3046, 1288: 3042, 4105: 3040,
+        2312: 3041, 522: 3043, 2116: 3041, 4161: 3040,
+        2114: 3041, 67: 3045, 4162: 3040, 69: 3045,
+        70: 3045, 584: 3043, 73: 3045, 74: 3045,
+        76: 3045, 4384: 3040, 1537: 3042, 4640: 3040,
+        2816: 3041, 1060: 3042, 546: 3043, 97: 3045,
+        98: 3045, 100: 3045, 4129: 3040, 5152: 3040,
+        104: 1605, 1282: 3042, 2305: 3041, 3328: 3041,
+        515: 3043, 1538: 3042, 2561: 3041, 2084: 3041,
+        4164: 3040, 4130: 3040, 6176: 3040, 2306: 3041,
+        2562: 3041, 4864: 3040, 3074: 3041, 4353: 3040,
+        5376: 3040, 4609: 3040, 5184: 3040, 5632: 3040,
+        2120: 3041, 1029: 3042, 4132: 3040, 1312: 3042,
+        5121: 3040, 2308: 3041, 2081: 3041, 518: 3043,
+        1058: 3042, 2564: 3041, 4610: 3040, 6656: 3040,
+        292: 3044, 1030: 3042, 2053: 3041, 3076: 3041,
+        4099: 3040, 5122: 3040, 6145: 3040, 7168: 3040,
+        1064: 3042, 2088: 3041, 4168: 3040, 2054: 3041,
+        1792: 3042, 769: 3043, 770: 3043, 259: 3044,
+        772: 3043, 261: 3044, 262: 3044, 776: 3043,
+        265: 3044, 266: 3044, 268: 3044, 4612: 3040,
+        5124: 3040, 800: 3043, 289: 3044, 290: 3044,
+        4356: 3040, 521: 3043, 296: 3044, 4136: 3040,
+        6148: 3040, 832: 3043, 321: 3044, 322: 3044,
+        324: 3044, 2568: 3041, 328: 3044, 6400: 3040,
+        1034: 3042, 2057: 3041, 3080: 3041, 608: 3043,
+        352: 1604, 1120: 3042, 6208: 3040, 2058: 3041,
+        524: 3043, 4360: 3040, 1281: 3042, 1344: 3042,
+        4616: 3040, 577: 3043, 2144: 3041, 578: 3043,
+        5128: 3040, 580: 3043, 2060: 3041, 1096: 3042,
+        6152: 3040, 1600: 3042, 1089: 3042, 4192: 3040,
+        2368: 3041, 1568: 3042, 2624: 3041, 1090: 3042,
+        2113: 3041, 3136: 3041, 4108: 3040, 545: 3043,
+        4354: 3040 },
+        145: { 32: 3046, 64: 3045, 2: 3049, 4096: 3040,
+        4: 3048, 1024: 3042, 8: 3047, 256: 3044,
+        512: 3043, 2048: 3041 },
+        146: { 256: 3044, 1: 3049, 4096: 3040, 4: 3048,
+        1024: 3042, 32: 3046, 8: 3047, 64: 3045,
+        512: 3043, 2048: 3041 },
+        148: { 256: 3044, 1: 3048, 2: 3048, 4096: 3040,
+        1024: 3042, 32: 3046, 8: 3047, 64: 3045,
+        512: 3043, 2048: 3041 },
+        152: { 32: 3046, 1: 3047, 2: 3047, 4096: 3040,
+        4: 3047, 1024: 3042, 64: 3045, 256: 3044,
+        512: 3043, 2048: 3041 },
+        160: { 3584: 3030, 3073: 3030, 1538: 3031, 1027: 3031,
+        1540: 3031, 4101: 3029, 4102: 3029, 7: 3037,
+        1544: 3031, 521: 3032, 4106: 3029, 11: 3036,
+        1036: 3031, 13: 3036, 14: 3036, 1552: 3031,
+        4113: 3029, 4114: 3029, 2051: 3030, 529: 3032,
+        21: 3035, 22: 3035, 536: 3032, 25: 3035,
+        26: 3035, 28: 3035, 517: 3032, 1092: 3031,
+        518: 3032, 5184: 3029, 3328: 3030, 2320: 3030,
+        1288: 3031, 530: 3032, 2576: 3030, 4105: 3029,
+        2312: 3030, 522: 3032, 2116: 3030, 4161: 3029,
+        2114: 3030, 67: 3034, 2065: 3030, 69: 3034,
+        70: 3034, 584: 3032, 73: 3034, 74: 3034,
+        1281: 3031, 592: 3032, 81: 3034, 82: 3034,
+        1537: 3031, 4416: 3029, 88: 1605, 3076: 3030,
+        2816: 3030, 1296: 3031, 1041: 3031, 1282: 3031,
+        2305: 3030, 2066: 3030, 4368: 3029, 515: 3032,
+        19: 3035, 2561: 3030, 4624: 3029, 532: 3032,
+        4672: 3029, 1044: 3031, 4164: 3029, 5136: 3029,
+        2306: 3030, 1048: 3031, 2562: 3030, 2068: 3030,
+        3074: 3030, 1284: 3031, 4353: 3029, 5376: 3029,
+        3080: 3030, 4120: 3029, 4609: 3029, 5632: 3029,
+        2120: 3030, 1029: 3031, 5121: 3029, 2308: 3030,
+        4354: 3029, 2564: 3030, 4610: 3029, 6656: 3029,
+        1030: 3031, 2053: 3030, 4116: 3029, 4099: 3029,
+        5122: 3029, 6145: 3029, 7168: 3029, 4168: 3029,
+        2054: 3030, 1792: 3031, 769: 3032, 770: 3032,
+        259: 3033, 772: 3032, 261: 3033, 262: 3033,
+        776: 3032, 265: 3033, 266: 3033, 268: 3033,
+        4612: 3029, 784: 3032, 273: 3033, 274: 3033,
+        276: 3033, 2072: 3030, 280: 3033, 4864: 3029,
+        5124: 3029, 4356: 3029, 1033: 3031, 6148: 3029,
+        832: 1603, 321: 3033, 322: 3033, 324: 3033,
+        6160: 3029, 2568: 3030, 328: 3033, 6400: 3029,
+        1042: 3031, 336: 1604, 1034: 3031, 2057: 3030,
+        6146: 3029, 4162: 3029, 3088: 3030, 6208: 3029,
+        2058: 3030, 4360: 3029, 524: 3032, 1344: 3031,
+        4616: 3029, 577: 3032, 3136: 3030, 578: 3032,
+        5128: 3029, 580: 3032, 2128: 3030, 2060: 3030,
+        1096: 3031, 6152: 3029, 1600: 3031, 1089: 3031,
+        76: 3034, 2368: 3030, 2624: 3030, 1104: 3031,
+        1090: 3031, 2113: 3030, 4176: 3029, 4108: 3029,
+        84: 3034 },
+        161: { 64: 3034, 256: 3033, 2: 3038, 4096: 3029,
+        4: 3037, 1024: 3031, 8: 3036, 16: 3035,
+        512: 3032, 2048: 3030 },
+        3074: { 64: 2604, 1: 2609, 4: 2608, 4096: 2600,
+        32: 2605, 8: 2607, 128: 2603, 256: 2602,
+        16: 2606, 512: 2601 },
+        4097: { 3584: 2589, 2816: 2589, 3074: 2589, 2564: 2589,
+        2054: 2589, 1544: 2590, 522: 2591, 1036: 2590,
+        1538: 2590, 14: 1609, 2336: 2589, 1552: 2590,
+        1042: 2590, 2068: 2589, 22: 2596, 2592: 2589,
+        536: 2591, 3076: 2589, 26: 2596, 28: 2596,
+        1568: 2590, 546: 2591, 548: 2591, 518: 2591,
+        38: 2595, 3104: 2589, 552: 2591, 42: 2595,
+        44: 2595, 2320: 2589, 560: 2591, 1288: 2590,
+        50: 2595, 52: 2595, 2576: 2589, 56: 2595,
+        2184: 2589, 1034: 2590, 2116: 2589, 1120: 2590,
+        2114: 2589, 2082: 2589, 580: 2591, 70: 2594,
+        584: 2591, 2060: 2589, 74: 2594, 76: 2594,
+        592: 2591, 82: 2594, 84: 2594, 88: 2594,
+        770: 2591, 608: 2591, 1296: 2590, 98: 2594,
+        100: 2594, 104: 2594, 1282: 2590, 2066: 2589,
+        3328: 2589, 112: 2594, 532: 2591, 1044: 2590,
+        2084: 2589, 1664: 2590, 1216: 2590, 2178: 2589,
+        1156: 2590, 134: 2593, 648: 2591, 138: 2593,
+        140: 2593, 656: 2591, 1048: 2590, 146: 2593,
+        148: 2593, 772: 2591, 152: 2593, 672: 2591,
+        162: 2593, 164: 2593, 168: 2593, 1540: 2590,
+        176: 2593, 2120: 2589, 704: 2591, 1312: 2590,
+        194: 2593, 196: 2593, 2308: 2589, 200: 2593,
+        2240: 2589, 1058: 2590, 208: 2593, 1060: 2590,
+        1030: 2590, 2562: 2589, 224: 2593, 1064: 2590,
+        2088: 2589, 530: 2591, 1792: 2590, 1408: 2590,
+        2306: 2589, 1284: 2590, 262: 2592, 776: 2591,
+        266: 2592, 2208: 2589, 268: 2592, 642: 2591,
+        784: 2591, 274: 2592, 276: 2592, 2072: 2589,
+        280: 2592, 2180: 2589, 800: 2591, 1072: 2590,
+        290: 2592, 292: 2592, 296: 2592, 2192: 2589,
+        304: 2592, 1160: 2590, 2312: 2589, 832: 2591,
+        322: 2592, 324: 2592, 2568: 2589, 328: 2592,
+        336: 2592, 2432: 2589, 3080: 2589, 2688: 2589,
+        352: 2592, 1168: 2590, 3088: 2589, 1154: 2590,
+        3200: 2589, 2058: 2589, 524: 2591, 896: 2591,
+        1344: 2590, 386: 2592, 388: 2592, 392: 2592,
+        2144: 2589, 578: 2591, 400: 2592, 644: 2591,
+        1092: 2590, 416: 2592, 2128: 2589, 1096: 2590,
+        1600: 2590, 448: 2592, 1184: 2590, 2368: 2589,
+        2624: 2589, 1104: 2590, 1090: 2590, 2096: 2589,
+        3136: 2589 },
+        5120: { 2561: 2479, 2562: 2479, 2051: 2479, 2564: 2479,
+        517: 2480, 518: 2480, 7: 2487, 2568: 2479,
+        521: 2480, 522: 2480, 11: 2486, 524: 2480,
+        13: 2486, 14: 2486, 2336: 2479, 2576: 2479,
+        529: 2480, 2066: 2479, 515: 2480, 532: 2480,
+        21: 2485, 22: 2485, 536: 2480, 25: 2485,
+        26: 2485, 28: 2485, 2053: 2479, 2592: 2479,
+        2081: 2479, 2082: 2479, 35: 2484, 548: 2480,
+        37: 2484, 38: 2484, 552: 2480, 41: 2484,
+        42: 2484, 44: 2484, 2320: 2479, 560: 2480,
+        49: 2484, 50: 2484, 52: 2484, 2057: 2479,
+        56: 2484, 2058: 2479, 2624: 2479, 577: 2480,
+        2114: 2479, 67: 2483, 580: 2480, 69: 2483,
+        70: 2483, 584: 2480, 73: 2483, 74: 2483,
+        76: 2483, 592: 2480, 81: 2483, 82: 2483,
+        84: 2483, 88: 2483, 770: 2480, 608: 2480,
+        97: 2483, 98: 2483, 100: 2483, 2065: 2479,
+        104: 2483, 2305: 2479, 530: 2480, 112: 2483,
+        19: 2485, 2068: 2479, 2688: 2479, 641: 2480,
+        2178: 2479, 131: 2482, 644: 2480, 133: 2482,
+        134: 2482, 648: 2480, 137: 2482, 138: 2482,
+        140: 2482, 656: 2480, 145: 2482, 146: 2482,
+        148: 2482, 152: 2482, 672: 2480, 161: 2482,
+        162: 2482, 164: 2482, 168: 2482, 176: 2482,
+        704: 2480, 193: 2482, 194: 2482, 196: 2482,
+        2308: 2479, 545: 2480, 200: 2482, 2240: 2479,
+        546: 2480, 208: 2482, 2084: 2479, 224: 2482,
+        2088: 2479, 2054: 2479, 2816: 1600, 769: 2480,
+        2306: 2479, 259: 2481, 772: 2480, 261: 2481,
+        262: 2481, 2177: 2479, 776: 2480, 265: 2481,
+        266: 2481, 268: 2481, 642: 2480, 784: 2480,
+        273: 2481, 274: 2481, 276: 2481, 2072: 2479,
+        280: 2481, 2180: 2479, 800: 2480, 289: 2481,
+        290: 2481, 292: 2481, 296: 2481, 304: 2481,
+        2184: 2479, 2312: 2479, 832: 2480, 321: 2481,
+        322: 2481, 324: 2481, 328: 2481, 336: 2481,
+        2432: 2479, 352: 2481, 2192: 2479, 896: 2480,
+        385: 2481, 386: 2481, 388: 2481, 2113: 2479,
+        392: 2481, 2144: 2479, 578: 2480, 400: 2481,
+        2116: 2479, 416: 2481, 2060: 2479, 2120: 2479,
+        448: 2481, 2208: 2479, 2368: 2479, 2128: 2479,
+        2096: 2479 },
+        168: { 64: 3034, 1: 3036, 2: 3036, 4096: 3029,
+        4: 3036, 1024: 3031, 256: 3033, 16: 3035,
+        512: 3032, 2048: 3030 },
+        176: { 64: 3034, 1: 3035, 2: 3035, 4096: 3029,
+        4: 3035, 1024: 3031, 8: 3035, 256: 3033,
+        512: 3032, 2048: 3030 },
+        2052: { 5632: 2688, 4609: 2688, 4610: 2688, 1027: 2689,
+        769: 2690, 1544: 2689, 4105: 2688, 4106: 2688,
+        11: 2696, 5122: 2688, 1296: 2689, 1552: 2689,
+        4113: 2688, 4114: 2688, 4099: 2688, 536: 2690,
+        25: 2695, 26: 2695, 1568: 2689, 1057: 2689,
+        546: 2690, 35: 2694, 1041: 2689, 4144: 2688,
+        552: 2690, 41: 2694, 42: 2694, 5152: 2688,
+        560: 2690, 49: 2694, 50: 2694, 521: 2690,
+        56: 2694, 522: 2690, 1600: 2689, 577: 2690,
+        578: 2690, 67: 2693, 584: 2690, 73: 2693,
+        74: 2693, 1281: 2689, 4384: 2688, 592: 2690,
+        81: 2693, 82: 2693, 1537: 2689, 4416: 2688,
+        4640: 2688, 88: 2693, 608: 2690, 97: 2693,
+        98: 2693, 529: 2690, 104: 2693, 1282: 2689,
+        530: 2690, 4368: 2688, 515: 2690, 1538: 2689,
+        19: 2695, 4624: 2688, 4232: 2688, 4672: 2688,
+        1664: 2689, 4225: 2688, 1154: 2689, 131: 2692,
+        5136: 2688, 648: 2690, 137: 2692, 138: 2692,
+        656: 2690, 145: 2692, 146: 2692, 4130: 2688,
+        152: 2692, 4864: 2688, 672: 2690, 161: 2692,
+        162: 2692, 168: 2692, 1216: 2689, 5376: 2688,
+        176: 2692, 704: 2690, 193: 2692, 194: 2692,
+        5121: 2688, 4129: 2688, 200: 2692, 4354: 2688,
+        1058: 2689, 5184: 2688, 208: 2692, 224: 2692,
+        4226: 2688, 1064: 2689, 1048: 2689, 4168: 2688,
+        1096: 2689, 1792: 2689, 4353: 2688, 770: 2690,
+        259: 2691, 641: 2690, 776: 2690, 265: 2691,
+        266: 2691, 4288: 2688, 642: 2690, 784: 2690,
+        273: 2691, 274: 2691, 280: 2691, 1288: 2689,
+        800: 2690, 289: 2691, 290: 2691, 296: 2691,
+        112: 2693, 304: 2691, 1160: 2689, 1408: 2689,
+        1033: 2689, 4136: 2688, 832: 2690, 321: 2691,
+        322: 2691, 1153: 2689, 4256: 2688, 1042: 2689,
+        336: 2691, 1034: 2689, 4120: 2688, 352: 2691,
+        1168: 2689, 1120: 2689, 4240: 2688, 4360: 2688,
+        896: 2690, 385: 2691, 386: 2691, 4616: 2688,
+        4161: 2688, 392: 2691, 4162: 2688, 400: 2691,
+        4480: 2688, 5128: 2688, 4736: 2688, 416: 2691,
+        5248: 2688, 1344: 2689, 328: 2691, 448: 2691,
+        1184: 2689, 1089: 2689, 1072: 2689, 4192: 2688,
+        1104: 2689, 1090: 2689, 4176: 2688, 1312: 2689,
+        545: 2690 },
+        192: { 3584: 3019, 3073: 3019, 5122: 3018, 1027: 3020,
+        1540: 3020, 4101: 3018, 4102: 3018, 7: 3026,
+        1544: 3020, 521: 3021, 4106: 3018, 11: 3025,
+        1036: 3020, 13: 3025, 14: 3025, 2336: 3019,
+        1552: 3020, 4113: 3018, 4114: 3018, 4099: 3018,
+        529: 3021, 21: 3024, 22: 3024, 2592: 3019,
+        536: 3021, 25: 3024, 26: 3024, 28: 3024,
+        517: 3021, 1568: 3020, 1057: 3020, 2082: 3019,
+        35: 3023, 548: 3021, 37: 3023, 38: 3023,
+        4144: 3018, 552: 3021, 41: 3023, 42: 3023,
+        44: 3023, 2320: 3019, 560: 3021, 49: 3023,
+        50: 3023, 52: 3023, 2576: 3019, 4105: 3018,
+        56: 1605, 2312: 3019, 522: 3021, 1042: 3020,
+        2065: 3019, 3088: 3019, 524: 3021, 1281: 3020,
+        4384: 3018, 1537: 3020, 4640: 3018, 3076: 3019,
+        2816: 3019, 546: 3021, 1296: 3020, 4129: 3018,
+        1041: 3020, 1282: 3020, 2305: 3019, 2066: 3019,
+        4368: 3018, 515: 3021, 1538: 3020, 19: 3024,
+        2561: 3019, 4624: 3018, 532: 3021, 1044: 3020,
+        2084: 3019, 5136: 3018, 6176: 3018, 2306: 3019,
+        1048: 3020, 2562: 3019, 2068: 3019, 2051: 3019,
+        3074: 3019, 1284: 3020, 4353: 3018, 5376: 3018,
+        1058: 3020, 3080: 3019, 4120: 3018, 4609: 3018,
+        5632: 3018, 1029: 3020, 4132: 3018, 1312: 3020,
+        5121: 3018, 2308: 3019, 2081: 3019, 518: 3021,
+        4130: 3018, 2564: 3019, 4610: 3018, 3328: 3019,
+        6656: 3018, 1060: 3020, 1030: 3020, 2053: 3019,
+        4116: 3018, 6145: 3018, 7168: 3018, 5152: 3018,
+        1064: 3020, 2088: 3019, 2054: 3019, 530: 3021,
+        1792: 1602, 769: 3021, 770: 3021, 259: 3022,
+        772: 3021, 261: 3022, 262: 3022, 776: 3021,
+        265: 3022, 266: 3022, 268: 3022, 4612: 3018,
+        784: 3021, 273: 3022, 274: 3022, 276: 3022,
+        2072: 3019, 280: 3022, 4864: 3018, 5124: 3018,
+        800: 1603, 289: 3022, 290: 3022, 4356: 3018,
+        292: 3022, 296: 3022, 304: 1604, 1033: 3020,
+        4136: 3018, 6148: 3018, 6160: 3018, 2568: 3019,
+        6400: 3018, 1034: 3020, 2057: 3019, 6146: 3018,
+        2058: 3019, 4360: 3018, 4616: 3018, 5128: 3018,
+        1288: 3020, 2060: 3019, 6152: 3018, 1072: 3020,
+        3104: 3019, 2096: 3019, 4108: 3018, 545: 3021,
+        4354: 3018 },
+        193: { 256: 3022, 32: 3023, 2: 3027, 4096: 3018,
+        4: 3026, 1024: 3020, 8: 3025, 16: 3024,
+        512: 3021, 2048: 3019 },
+        194: { 256: 3022, 1: 3027, 4096: 3018, 4: 3026,
+        1024: 3020, 32: 3023, 8: 3025, 16: 3024,
+        512: 3021, 2048: 3019 },
+        5121: { 64: 2483, 32: 2484, 2: 2488, 4: 2487,
+        2048: 2479, 8: 2486, 128: 2482, 256: 2481,
+        16: 2485, 512: 2480 },
+        6144: { 1537: 2468, 1538: 2468, 1027: 2468, 1540: 2468,
+        517: 2469, 518: 2469, 7: 2476, 1544: 2468,
+        521: 2469, 522: 2469, 11: 2475, 524: 2469,
+        13: 2475, 14: 2475, 1552: 2468, 529: 2469,
+        530: 2469, 515: 2469, 532: 2469, 21: 2474,
+        22: 2474, 536: 2469, 25: 2474, 26: 2474,
+        28: 2474, 1029: 2468, 1568: 2468, 1057: 2468,
+        546: 2469, 35: 2473, 548: 2469, 37: 2473,
+        38: 2473, 552: 2469, 41: 2473, 42: 2473,
+        44: 2473, 560: 2469, 49: 2473, 50: 2473,
+        52: 2473, 1033: 2468, 56: 2473, 1034: 2468,
+        1600: 2468, 577: 2469, 578: 2469, 67: 2472,
+        580: 2469, 69: 2472, 70: 2472, 584: 2469,
+        73: 2472, 74: 2472, 1281: 2468, 592: 2469,
+        81: 2472, 82: 2472, 84: 2472, 88: 2472,
+        608: 2469, 97: 2472, 98: 2472, 100: 2472,
+        1041: 2468, 104: 2472, 1282: 2468, 1042: 2468,
+        112: 2472, 19: 2474, 1044: 2468, 1664: 2468,
+        641: 2469, 642: 2469, 131: 2471, 644: 2469,
+        133: 2471, 134: 2471, 648: 2469, 137: 2471,
+        138: 2471, 140: 2471, 656: 2469, 145: 2471,
+        146: 2471, 148: 2471, 152: 2471, 672: 2469,
+        161: 2471, 162: 2471, 164: 2471, 1284: 2468,
+        168: 2471, 1216: 2468, 176: 2471, 704: 2469,
+        193: 2471, 194: 2471, 196: 2471, 545: 2469,
+        200: 2471, 1058: 2468, 208: 2471, 1060: 2468,
+        1030: 2468, 224: 2471, 1064: 2468, 1048: 2468,
+        1792: 1600, 769: 2469, 770: 2469, 259: 2470,
+        772: 2469, 261: 2470, 262: 2470, 1153: 2468,
+        776: 2469, 265: 2470, 266: 2470, 268: 2470,
+        1154: 2468, 1120: 2468, 784: 2469, 273: 2470,
+        274: 2470, 276: 2470, 280: 2470, 1156: 2468,
+        1288: 2468, 800: 2469, 289: 2470, 290: 2470,
+        292: 2470, 296: 2470, 304: 2470, 1160: 2468,
+        1408: 2468, 832: 2469, 321: 2470, 322: 2470,
+        324: 2470, 328: 2470, 336: 2470, 352: 2470,
+        1168: 2468, 1296: 2468, 896: 2469, 385: 2470,
+        386: 2470, 388: 2470, 1089: 2468, 392: 2470,
+        1090: 2468, 1036: 2468, 400: 2470, 1092: 2468,
+        416: 2470, 1344: 2468, 1096: 2468, 448: 2470,
+        1184: 2468, 1072: 2468, 76: 2472, 1104: 2468,
+        1312: 2468 },
+        4129: { 128: 2538, 64: 2539, 2: 2543, 4: 2542,
+        1024: 2535, 8: 2541, 256: 2537, 16: 2540,
+        512: 2536, 2048: 2534 },
+        200: { 256: 3022, 1: 3025, 2: 3025, 4096: 3018,
+        4: 3025, 1024: 3020, 32: 3023, 16: 3024,
+        512: 3021, 2048: 3019 },
+        4130: { 128: 2538, 1: 2543, 4: 2542, 1024: 2535,
+        8: 2541, 64: 2539, 256: 2537, 16: 2540,
+        512: 2536, 2048: 2534 },
+        5184: { 32: 2483, 1: 2483, 2: 2483, 4: 2483,
+        2048: 2479, 8: 2483, 128: 2482, 256: 2481,
+        16: 2483, 512: 2480 },
+        208: { 256: 3022, 1: 3024, 2: 3024, 4096: 3018,
+        4: 3024, 1024: 3020, 32: 3023, 8: 3024,
+        512: 3021, 2048: 3019 },
+        2084: { 128: 2659, 1: 2663, 2: 2663, 4096: 2655,
+        1024: 2656, 8: 2662, 64: 2660, 256: 2658,
+        16: 2661, 512: 2657 },
+        3076: { 64: 2604, 1: 2608, 2: 2608, 4096: 2600,
+        32: 2605, 8: 2607, 128: 2603, 256: 2602,
+        16: 2606, 512: 2601 },
+        4099: { 128: 2582, 64: 2583, 4: 2587, 1024: 2579,
+        32: 2584, 8: 2586, 256: 2581, 16: 2585,
+        512: 2580, 2048: 2578 },
+        5122: { 64: 2483, 1: 2488, 4: 2487, 2048: 2479,
+        32: 2484, 8: 2486, 128: 2482, 256: 2481,
+        16: 2485, 512: 2480 },
+        6145: { 64: 2472, 32: 2473, 2: 2477, 4: 2476,
+        1024: 2468, 8: 2475, 128: 2471, 256: 2470,
+        16: 2474, 512: 2469 },
+        38: { 128: 3188, 1: 3192, 4096: 3183, 1024: 3185,
+        8: 3191, 64: 3189, 256: 3187, 16: 3190,
+        512: 3186, 2048: 3184 },
+        7168: { 32: 2468, 1: 2468, 2: 2468, 4: 2468,
+        8: 2468, 64: 2468, 128: 2468, 256: 2468,
+        16: 2468, 512: 2468 },
+        2088: { 128: 2659, 1: 2662, 2: 2662, 4096: 2655,
+        4: 2662, 1024: 2656, 64: 2660, 256: 2658,
+        16: 2661, 512: 2657 },
+        4168: { 128: 2527, 1: 2530, 2: 2530, 4: 2530,
+        1024: 2524, 32: 2528, 256: 2526, 16: 2529,
+        512: 2525, 2048: 2523 },
+        2054: { 128: 2692, 1: 2697, 4096: 2688, 1024: 2689,
+        32: 2694, 8: 2696, 64: 2693, 256: 2691,
+        16: 2695, 512: 2690 },
+        4100: { 3584: 2567, 3073: 2567, 1538: 2568, 1027: 2568,
+        1281: 2568, 1544: 2568, 2057: 2567, 522: 2569,
+        11: 1609, 3074: 2567, 1296: 2568, 2336: 2567,
+        1552: 2568, 529: 2569, 2066: 2567, 2051: 2567,
+        2592: 2567, 536: 2569, 25: 2574, 26: 2574,
+        1568: 2568, 1057: 2568, 2082: 2567, 35: 2573,
+        3104: 2567, 552: 2569, 41: 2573, 42: 2573,
+        2320: 2567, 560: 2569, 49: 2573, 50: 2573,
+        2576: 2567, 521: 2569, 56: 2573, 2184: 2567,
+        1034: 2568, 1600: 2568, 577: 2569, 2114: 2567,
+        67: 2572, 2065: 2567, 3088: 2567, 584: 2569,
+        73: 2572, 74: 2572, 592: 2569, 81: 2572,
+        82: 2572, 1537: 2568, 88: 2572, 770: 2569,
+        2816: 2567, 608: 2569, 97: 2572, 98: 2572,
+        1041: 2568, 104: 2572, 1282: 2568, 2305: 2567,
+        530: 2569, 3328: 2567, 515: 2569, 19: 2574,
+        2561: 2567, 1664: 2568, 641: 2569, 1154: 2568,
+        131: 2571, 648: 2569, 137: 2571, 138: 2571,
+        656: 2569, 145: 2571, 146: 2571, 152: 2571,
+        672: 2569, 161: 2571, 162: 2571, 168: 2571,
+        1216: 2568, 176: 2571, 1058: 2568, 3080: 2567,
+        2120: 2567, 704: 2569, 193: 2571, 194: 2571,
+        2081: 2567, 200: 2571, 2240: 2567, 546: 2569,
+        208: 2571, 2562: 2567, 224: 2571, 1064: 2568,
+        1048: 2568, 2088: 2567, 1792: 2568, 769: 2569,
+        2306: 2567, 259: 2570, 1153: 2568, 776: 2569,
+        265: 2570, 266: 2570, 2208: 2567, 2178: 2567,
+        784: 2569, 273: 2570, 274: 2570, 2072: 2567,
+        280: 2570, 1288: 2568, 800: 2569, 289: 2570,
+        290: 2570, 296: 2570, 112: 2572, 2192: 2567,
+        304: 2570, 1160: 2568, 1408: 2568, 1033: 2568,
+        2312: 2567, 832: 2569, 321: 2570, 322: 2570,
+        2568: 2567, 328: 2570, 1042: 2568, 336: 2570,
+        2432: 2567, 642: 2569, 2688: 2567, 352: 2570,
+        1168: 2568, 2177: 2567, 1120: 2568, 3200: 2567,
+        2058: 2567, 896: 2569, 385: 2570, 386: 2570,
+        1089: 2568, 392: 2570, 2144: 2567, 578: 2569,
+        400: 2570, 416: 2570, 2128: 2567, 1344: 2568,
+        1096: 2568, 448: 2570, 1184: 2568, 1072: 2568,
+        2368: 2567, 2624: 2567, 1104: 2568, 1090: 2568,
+        2113: 2567, 2096: 2567, 3136: 2567, 1312: 2568,
+        545: 2569 },
+        2304: { 5632: 1600, 4609: 2622, 5122: 2622, 1027: 2623,
+        1540: 2623, 4101: 2622, 4102: 2622, 7: 2630,
+        1544: 2623, 521: 2624, 4106: 2622, 11: 2629,
+        524: 2624, 13: 2629, 14: 2629, 4228: 2622,
+        1552: 2623, 4113: 2622, 4114: 2622, 4099: 2622,
+        529: 2624, 21: 2628, 22: 2628, 536: 2624,
+        25: 2628, 26: 2628, 28: 2628, 517: 2624,
+        1568: 2623, 1057: 2623, 546: 2624, 35: 2627,
+        548: 2624, 37: 2627, 38: 2627, 4144: 2622,
+        552: 2624, 41: 2627, 42: 2627, 44: 2627,
+        5152: 2622, 560: 2624, 49: 2627, 50: 2627,
+        52: 2627, 4105: 2622, 56: 2627, 522: 2624,
+        1600: 2623, 4161: 2622, 578: 2624, 67: 2626,
+        580: 2624, 69: 2626, 70: 2626, 584: 2624,
+        73: 2626, 74: 2626, 76: 2626, 592: 2624,
+        81: 2626, 82: 2626, 1537: 2623, 4640: 2622,
+        88: 2626, 608: 2624, 97: 2626, 98: 2626,
+        100: 2626, 4129: 2622, 1041: 2623, 104: 2626,
+        1042: 2623, 515: 2624, 1538: 2623, 19: 2628,
+        4624: 2622, 532: 2624, 4232: 2622, 1044: 2623,
+        4164: 2622, 641: 2624, 1154: 2623, 131: 2625,
+        644: 2624, 133: 2625, 134: 2625, 648: 2624,
+        137: 2625, 138: 2625, 140: 2625, 656: 2624,
+        145: 2625, 146: 2625, 4130: 2622, 152: 2625,
+        196: 2625, 672: 2624, 161: 2625, 162: 2625,
+        164: 2625, 168: 2625, 1216: 2623, 176: 2625,
+        1029: 2623, 4132: 2622, 704: 2624, 193: 2625,
+        194: 2625, 5121: 2622, 545: 2624, 200: 2625,
+        518: 2624, 1058: 2623, 5184: 2622, 208: 2625,
+        4610: 2622, 1060: 2623, 1030: 2623, 4116: 2622,
+        224: 2625, 4226: 2622, 1064: 2623, 1048: 2623,
+        4168: 2622, 530: 2624, 1664: 1601, 4225: 2622,
+        4288: 2622, 642: 2624, 4612: 2622, 1156: 2623,
+        5124: 2622, 1072: 2623, 112: 2626, 1160: 2623,
+        1033: 2623, 5136: 2622, 4136: 2622, 1153: 2623,
+        4256: 2622, 1034: 2623, 4120: 2622, 1168: 2623,
+        1120: 2623, 4240: 2622, 148: 2625, 4672: 2622,
+        4616: 2622, 577: 2624, 4162: 2622, 1036: 2623,
+        5128: 2622, 1092: 2623, 4736: 2622, 5248: 2622,
+        1096: 2623, 1184: 2623, 1089: 2623, 4192: 2622,
+        1104: 2623, 1090: 2623, 4176: 2622, 4108: 2622,
+        84: 2626 },
+        257: { 3584: 3008, 5632: 3007, 6146: 3007, 4612: 3007,
+        2054: 3008, 1544: 3009, 522: 3010, 1036: 3009,
+        4610: 3007, 14: 3015, 1552: 3009, 530: 3010,
+        2068: 3008, 22: 3014, 2592: 3008, 1048: 3009,
+        2564: 3008, 26: 3014, 28: 3014, 1092: 3009,
+        4130: 3007, 1058: 3009, 4132: 3007, 518: 3010,
+        38: 3013, 4144: 3007, 552: 3010, 42: 3013,
+        44: 3013, 560: 3010, 2568: 3008, 50: 3013,
+        52: 3013, 56: 3013, 2184: 3008, 1034: 3009,
+        2116: 3008, 1120: 3009, 2114: 3008, 2082: 3008,
+        4164: 3007, 70: 3012, 584: 3010, 524: 3010,
+        74: 3012, 76: 3012, 592: 3010, 82: 3012,
+        84: 3012, 4640: 3007, 88: 3012, 4116: 3007,
+        1060: 3009, 608: 3010, 2576: 3008, 98: 3012,
+        100: 3012, 5152: 3007, 104: 3012, 4114: 3007,
+        112: 3012, 1538: 3009, 4624: 3007, 532: 3010,
+        4232: 3007, 4672: 3007, 1044: 3009, 2084: 3008,
+        1664: 3009, 1216: 3009, 642: 3010, 2180: 3008,
+        134: 3011, 6176: 3007, 648: 3010, 138: 3011,
+        140: 3011, 656: 3010, 536: 3010, 2562: 3008,
+        148: 3011, 152: 3011, 672: 3010, 162: 3011,
+        164: 3011, 6160: 3007, 168: 3011, 1540: 3009,
+        176: 3011, 3080: 3008, 2120: 3008, 704: 3010,
+        1568: 3009, 194: 3011, 196: 3011, 3104: 3008,
+        200: 3011, 2240: 3008, 546: 3010, 5184: 3007,
+        208: 3011, 6656: 3007, 548: 3010, 1030: 3009,
+        3076: 3008, 224: 3011, 5122: 3007, 7168: 3007,
+        1064: 3009, 2088: 3008, 4168: 3007, 2688: 3008,
+        2208: 3008, 4288: 3007, 2178: 3008, 2072: 3008,
+        4228: 3007, 5124: 3007, 1072: 3009, 2192: 3008,
+        3200: 3008, 3074: 3008, 1160: 3009, 5136: 3007,
+        4136: 3007, 4102: 3007, 6148: 3007, 4256: 3007,
+        1042: 3009, 4120: 3007, 1168: 3009, 3088: 3008,
+        1154: 3009, 4240: 3007, 146: 3011, 6208: 3007,
+        2058: 3008, 1600: 3009, 4616: 3007, 2144: 3008,
+        3136: 3008, 4162: 3007, 644: 3010, 5128: 3007,
+        580: 3010, 4736: 3007, 1156: 3009, 2128: 3008,
+        5248: 3007, 2060: 3008, 1096: 3009, 4106: 3007,
+        6152: 3007, 1184: 3009, 4226: 3007, 4192: 3007,
+        6272: 3007, 578: 3010, 2624: 3008, 1104: 3009,
+        1090: 3009, 2096: 3008, 4176: 3007, 2066: 3008,
+        4108: 3007 },
+        6146: { 64: 2472, 1: 2477, 4: 2476, 1024: 2468,
+        32: 2473, 8: 2475, 128: 2471, 256: 2470,
+        16: 2474, 512: 2469 },
+        259: { 128: 3000, 64: 3001, 4096: 2996, 4: 3005,
+        1024: 2998, 32: 3002, 8: 3004, 16: 3003,
+        512: 2999, 2048: 2997 },
+        260: { 3584: 2986, 4609: 2985, 5122: 2985, 1027: 2987,
+        1537: 2987, 1544: 2987, 2057: 2986, 4106: 2985,
+        11: 2993, 3074: 2986, 1552: 2987, 4113: 2985,
+        4114: 2985, 2051: 2986, 2592: 2986, 1048: 2987,
+        25: 2992, 26: 2992, 1568: 2987, 1057: 2987,
+        2082: 2986, 35: 2991, 1041: 2987, 4144: 2985,
+        552: 2988, 41: 2991, 42: 2991, 5152: 2985,
+        560: 2988, 49: 2991, 50: 2991, 2576: 2986,
+        521: 2988, 56: 2991, 2184: 2986, 522: 2988,
+        1600: 2987, 577: 2988, 2114: 2986, 67: 2990,
+        2065: 2986, 3088: 2986, 584: 2988, 73: 2990,
+        74: 2990, 592: 2988, 81: 2990, 82: 2990,
+        4640: 2985, 88: 2990, 546: 2988, 97: 2990,
+        98: 2990, 4129: 2985, 529: 2988, 104: 2990,
+        1042: 2987, 515: 2988, 1538: 2987, 19: 2992,
+        2561: 2986, 4624: 2985, 4232: 2985, 4672: 2985,
+        1664: 2987, 641: 2988, 1154: 2987, 131: 2989,
+        3073: 2986, 5136: 2985, 6176: 2985, 648: 2988,
+        137: 2989, 138: 2989, 656: 2988, 145: 2989,
+        146: 2989, 4130: 2985, 152: 2989, 7168: 2985,
+        672: 2988, 161: 2989, 162: 2989, 6160: 2985,
+        168: 2989, 1216: 2987, 176: 2989, 3080: 2986,
+        5632: 2985, 2120: 2986, 608: 2988, 704: 2988,
+        193: 2989, 194: 2989, 5121: 2985, 2081: 2986,
+        200: 2989, 2240: 2986, 1058: 2987, 5184: 2985,
+        208: 2989, 4610: 2985, 6656: 2985, 2562: 2986,
+        4099: 2985, 4226: 2985, 6145: 2985, 536: 2988,
+        1064: 2987, 2088: 2986, 4168: 2985, 530: 2988,
+        2688: 2986, 6146: 2985, 4225: 2985, 2208: 2986,
+        4288: 2985, 642: 2988, 2072: 2986, 1072: 2987,
+        112: 2990, 2192: 2986, 3200: 2986, 1160: 2987,
+        1033: 2987, 4136: 2985, 224: 2989, 2568: 2986,
+        1153: 2987, 4256: 2985, 1034: 2987, 4120: 2985,
+        4162: 2985, 1168: 2987, 2177: 2986, 1120: 2987,
+        4240: 2985, 6208: 2985, 2058: 2986, 3104: 2986,
+        2624: 2986, 2178: 2986, 4161: 2985, 2144: 2986,
+        3136: 2986, 578: 2988, 4105: 2985, 5128: 2985,
+        4736: 2985, 4616: 2985, 2128: 2986, 5248: 2985,
+        1096: 2987, 6152: 2985, 1184: 2987, 1089: 2987,
+        4192: 2985, 6272: 2985, 1104: 2987, 1090: 2987,
+        2113: 2986, 2096: 2986, 4176: 2985, 2066: 2986,
+        545: 2988 },
+        261: { 128: 2989, 64: 2990, 2: 2994, 4096: 2985,
+        1024: 2987, 32: 2991, 8: 2993, 16: 2992,
+        512: 2988, 2048: 2986 },
+        262: { 128: 2989, 1: 2994, 4096: 2985, 1024: 2987,
+        32: 2991, 8: 2993, 64: 2990, 16: 2992,
+        512: 2988, 2048: 2986 },
+        2312: { 64: 2626, 1: 2629, 2: 2629, 4096: 2622,
+        4: 2629, 1024: 2623, 32: 2627, 128: 2625,
+        16: 2628, 512: 2624 },
+        265: { 32: 2980, 128: 2978, 2: 2983, 4096: 2974,
+        4: 2982, 1024: 2976, 64: 2979, 16: 2981,
+        512: 2977, 2048: 2975 },
+        266: { 128: 2978, 1: 2983, 4096: 2974, 4: 2982,
+        1024: 2976, 32: 2980, 64: 2979, 16: 2981,
+        512: 2977, 2048: 2975 },
+        268: { 128: 2978, 1: 2982, 2: 2982, 4096: 2974,
+        1024: 2976, 32: 2980, 64: 2979, 16: 2981,
+        512: 2977, 2048: 2975 },
+        4368: { 64: 2505, 1: 2507, 2: 2507, 4: 2507,
+        1024: 2502, 32: 2506, 8: 2507, 128: 2504,
+        512: 2503, 2048: 2501 },
+        273: { 32: 2969, 128: 2967, 2: 2972, 4096: 2963,
+        4: 2971, 1024: 2965, 8: 2970, 64: 2968,
+        512: 2966, 2048: 2964 },
+        274: { 128: 2967, 1: 2972, 4096: 2963, 4: 2971,
+        1024: 2965, 32: 2969, 8: 2970, 64: 2968,
+        512: 2966, 2048: 2964 },
+        276: { 128: 2967, 1: 2971, 2: 2971, 4096: 2963,
+        1024: 2965, 32: 2969, 8: 2970, 64: 2968,
+        512: 2966, 2048: 2964 },
+        280: { 32: 2969, 1: 2970, 2: 2970, 4096: 2963,
+        4: 2970, 1024: 2965, 64: 2968, 128: 2967,
+        512: 2966, 2048: 2964 },
+        4101: { 128: 2571, 64: 2572, 2: 2576, 1024: 2568,
+        32: 2573, 8: 2575, 256: 2570, 16: 2574,
+        512: 2569, 2048: 2567 },
+        5124: { 64: 2483, 1: 2487, 2: 2487, 2048: 2479,
+        32: 2484, 8: 2486, 128: 2482, 256: 2481,
+        16: 2485, 512: 2480 },
+        288: { 3584: 2953, 4609: 2952, 1538: 2954, 1027: 2954,
+        1540: 2954, 4101: 2952, 4102: 2952, 7: 2960,
+        1544: 2954, 521: 2955, 4106: 2952, 11: 2959,
+        1036: 2954, 13: 2959, 14: 2959, 4228: 2952,
+        1552: 2954, 4113: 2952, 4114: 2952, 515: 2955,
+        529: 2955, 21: 2958, 22: 2958, 536: 2955,
+        25: 2958, 26: 2958, 28: 2958, 517: 2955,
+        1092: 2954, 518: 2955, 5184: 2952, 2568: 2953,
+        4105: 2952, 2184: 2953, 522: 2955, 2116: 2953,
+        4161: 2952, 2114: 2953, 67: 2957, 2065: 2953,
+        69: 2957, 70: 2957, 584: 2955, 73: 2957,
+        74: 2957, 76: 2957, 592: 2955, 81: 2957,
+        82: 2957, 1537: 2954, 88: 2957, 3076: 2953,
+        2576: 2953, 2066: 2953, 1041: 2954, 530: 2955,
+        19: 2958, 2561: 2953, 4624: 2952, 532: 2955,
+        4232: 2952, 4672: 2952, 1044: 2954, 4164: 2952,
+        641: 2955, 1154: 2954, 131: 2956, 3073: 2953,
+        133: 2956, 134: 2956, 648: 2955, 137: 2956,
+        138: 2956, 140: 2956, 656: 2955, 145: 2956,
+        146: 2956, 148: 2956, 152: 2956, 196: 2956,
+        2068: 2953, 2051: 2953, 3074: 2953, 5136: 2952,
+        6160: 2952, 1216: 2954, 3080: 2953, 5632: 2952,
+        2120: 2953, 1029: 2954, 704: 1603, 193: 2956,
+        194: 2956, 5121: 2952, 200: 2956, 2240: 2953,
+        2564: 2953, 208: 1604, 4610: 2952, 6656: 2952,
+        1030: 2954, 2053: 2953, 2562: 2953, 4116: 2952,
+        4099: 2952, 5122: 2952, 4226: 2952, 6145: 2952,
+        7168: 2952, 1048: 2954, 4168: 2952, 2054: 2953,
+        1664: 2954, 6146: 2952, 4225: 2952, 4288: 2952,
+        642: 2955, 4612: 2952, 2072: 2953, 644: 2955,
+        5124: 2952, 2192: 2953, 3200: 2953, 1160: 2954,
+        1033: 2954, 6148: 2952, 1153: 2954, 1042: 2954,
+        1034: 2954, 2057: 2953, 4120: 2952, 4162: 2952,
+        2688: 2953, 1168: 2954, 3088: 2953, 2177: 2953,
+        4240: 2952, 6208: 2952, 2058: 2953, 524: 2955,
+        1600: 2954, 2178: 2953, 577: 2955, 3136: 2953,
+        578: 2955, 5128: 2952, 580: 2955, 4736: 2952,
+        1156: 2954, 4616: 2952, 2128: 2953, 5248: 2952,
+        2060: 2953, 1096: 2954, 6152: 2952, 2180: 2953,
+        1089: 2954, 6272: 2952, 2624: 2953, 1104: 2954,
+        1090: 2954, 2113: 2953, 4176: 2952, 4108: 2952,
+        84: 2957 },
+        48: { 3584: 3162, 3073: 3162, 6146: 3161, 1027: 3163,
+        1540: 3163, 4101: 3161, 4102: 3161, 7: 3169,
+        1544: 3163, 521: 3164, 4106: 3161, 11: 3168,
+        1036: 3163, 13: 3168, 14: 1607, 4228: 3161,
+        4416: 3161, 2051: 3162, 4672: 3161, 1284: 3163,
+        517: 3164, 1092: 3163, 518: 3164, 5184: 3161,
+        1288: 3163, 4105: 3161, 2312: 3162, 2184: 3162,
+        769: 3164, 1034: 3163, 2116: 3162, 4161: 3161,
+        2114: 3162, 67: 3167, 4162: 3161, 69: 3167,
+        70: 3167, 584: 3164, 73: 3167, 74: 3167,
+        1281: 3163, 1537: 3163, 770: 3164, 2816: 3162,
+        1282: 3163, 2305: 3162, 3328: 3162, 515: 3164,
+        1538: 3163, 2561: 3162, 4232: 3161, 4164: 3161,
+        4225: 3161, 1154: 3163, 131: 3166, 644: 3164,
+        133: 3166, 134: 3166, 648: 3164, 137: 3166,
+        138: 3166, 140: 3166, 2562: 3162, 1096: 3163,
+        196: 3166, 4864: 3161, 3074: 3162, 1216: 3163,
+        5376: 3161, 3080: 3162, 4609: 3161, 5632: 3161,
+        2120: 3162, 1029: 3163, 704: 3164, 193: 3166,
+        194: 3166, 5121: 3161, 2308: 3162, 200: 1605,
+        4354: 3161, 2240: 3162, 2564: 3162, 4610: 3161,
+        6656: 3161, 1030: 3163, 2053: 3162, 3076: 3162,
+        4099: 3161, 5122: 3161, 4226: 3161, 6145: 3161,
+        7168: 3161, 4168: 3161, 2054: 3162, 1792: 3163,
+        4353: 3161, 2306: 3162, 259: 3165, 772: 3164,
+        261: 3165, 262: 3165, 641: 3164, 776: 3164,
+        265: 3165, 266: 3165, 268: 3165, 2178: 3162,
+        4612: 3161, 1156: 3163, 5124: 3161, 4356: 3161,
+        1160: 3163, 1408: 3163, 1033: 3163, 1664: 3163,
+        6148: 3161, 832: 3164, 321: 3165, 522: 3164,
+        324: 3165, 2568: 3162, 1153: 3163, 6400: 3161,
+        2432: 3162, 2057: 3162, 642: 3164, 2688: 3162,
+        4288: 3161, 2177: 3162, 3200: 3162, 6208: 3161,
+        2058: 3162, 4360: 3161, 524: 3164, 896: 3164,
+        385: 3165, 386: 3165, 388: 3165, 4616: 3161,
+        577: 3164, 392: 3165, 578: 3164, 4480: 3161,
+        5128: 3161, 580: 3164, 4736: 3161, 5248: 3161,
+        2060: 3162, 1344: 3163, 328: 3165, 6152: 3161,
+        1600: 3163, 448: 1604, 2180: 3162, 1089: 3163,
+        76: 1606, 6272: 3161, 322: 3165, 2368: 3162,
+        2624: 3162, 1090: 3163, 2113: 3162, 3136: 3162,
+        4108: 3161 },
+        290: { 128: 2956, 1: 2961, 4096: 2952, 4: 2960,
+        1024: 2954, 8: 2959, 64: 2957, 16: 2958,
+        512: 2955, 2048: 2953 },
+        292: { 128: 2956, 1: 2960, 2: 2960, 4096: 2952,
+        1024: 2954, 8: 2959, 64: 2957, 16: 2958,
+        512: 2955, 2048: 2953 },
+        49: { 64: 3167, 128: 3166, 2: 3170, 4096: 3161,
+        4: 3169, 1024: 3163, 8: 3168, 256: 3165,
+        512: 3164, 2048: 3162 },
+        296: { 128: 2956, 1: 2959, 2: 2959, 4096: 2952,
+        4: 2959, 1024: 2954, 64: 2957, 16: 2958,
+        512: 2955, 2048: 2953 },
+        2192: { 64: 2637, 1: 2639, 2: 2639, 4096: 2633,
+        4: 2639, 1024: 2634, 32: 2638, 8: 2639,
+        256: 2636, 512: 2635 },
+        304: { 128: 2956, 1: 2958, 2: 2958, 4096: 2952,
+        4: 2958, 1024: 2954, 8: 2958, 64: 2957,
+        512: 2955, 2048: 2953 },
+        2056: { 5632: 2677, 4609: 2677, 5122: 2677, 1027: 2678,
+        1540: 2678, 4101: 2677, 4102: 2677, 7: 2685,
+        5152: 2677, 1282: 2678, 1296: 2678, 4228: 2677,
+        1552: 2678, 4113: 2677, 4114: 2677, 19: 2684,
+        529: 2679, 21: 2684, 22: 2684, 4672: 2677,
+        1284: 2678, 517: 2679, 1092: 2678, 1057: 2678,
+        4130: 2677, 35: 2683, 548: 2679, 37: 2683,
+        38: 2683, 4144: 2677, 5184: 2677, 560: 2679,
+        49: 2683, 50: 2683, 52: 2683, 1600: 2678,
+        4161: 2677, 578: 2679, 67: 2682, 4162: 2677,
+        69: 2682, 70: 2682, 1281: 2678, 224: 2681,
+        4384: 2677, 592: 2679, 81: 2682, 82: 2682,
+        1537: 2678, 4416: 2677, 4640: 2677, 546: 2679,
+        97: 2682, 98: 2682, 100: 2682, 1041: 2678,
+        530: 2679, 4368: 2677, 515: 2679, 1538: 2678,
+        4624: 2677, 532: 2679, 1044: 2678, 4164: 2677,
+        4225: 2677, 1154: 2678, 131: 2681, 644: 2679,
+        133: 2681, 134: 2681, 656: 2679, 145: 2681,
+        146: 2681, 148: 2681, 196: 2681, 4864: 2677,
+        672: 2679, 161: 2681, 162: 2681, 164: 2681,
+        4353: 2677, 5376: 2677, 176: 2681, 1029: 2678,
+        4132: 2677, 704: 2679, 193: 2681, 194: 2681,
+        5121: 2677, 4129: 2677, 518: 2679, 1058: 2678,
+        208: 2681, 4610: 2677, 1060: 2678, 1030: 2678,
+        4116: 2677, 4099: 2677, 4226: 2677, 1792: 2678,
+        769: 2679, 770: 2679, 259: 2680, 772: 2679,
+        261: 2680, 262: 2680, 641: 2679, 4288: 2677,
+        642: 2679, 4612: 2677, 784: 2679, 273: 2680,
+        274: 2680, 276: 2680, 1156: 2678, 5124: 2677,
+        800: 2679, 289: 2680, 290: 2680, 4356: 2677,
+        292: 2680, 112: 2682, 304: 2680, 1408: 2678,
+        5136: 2677, 1664: 2678, 832: 2679, 321: 2680,
+        322: 2680, 324: 2680, 1153: 2678, 4256: 2677,
+        1042: 2678, 336: 2680, 608: 2679, 1216: 2678,
+        352: 2680, 1168: 2678, 1120: 2678, 4240: 2677,
+        896: 2679, 385: 2680, 386: 2680, 388: 2680,
+        577: 2679, 1090: 2678, 400: 2680, 4480: 2677,
+        580: 2679, 4736: 2677, 416: 2680, 5248: 2677,
+        1344: 2678, 448: 2680, 1184: 2678, 1089: 2678,
+        1072: 2678, 4192: 2677, 1568: 2678, 1104: 2678,
+        4176: 2677, 1312: 2678, 545: 2679, 4354: 2677,
+        84: 2682 },
+        4102: { 128: 2571, 1: 2576, 1024: 2568, 32: 2573,
+        8: 2575, 64: 2572, 256: 2570, 16: 2574,
+        512: 2569, 2048: 2567 },
+        6148: { 64: 2472, 1: 2476, 2: 2476, 1024: 2468,
+        32: 2473, 8: 2475, 128: 2471, 256: 2470,
+        16: 2474, 512: 2469 },
+        320: { 3584: 2942, 1537: 2943, 5122: 2941, 1027: 2943,
+        1540: 2943, 4101: 2941, 4102: 2941, 7: 2949,
+        1544: 2943, 521: 2944, 4106: 2941, 11: 2948,
+        1036: 2943, 13: 2948, 14: 2948, 4228: 2941,
+        1552: 2943, 4113: 2941, 4114: 2941, 2051: 2942,
+        529: 2944, 21: 2947, 22: 2947, 536: 2944,
+        25: 2947, 26: 2947, 28: 2947, 517: 2944,
+        1568: 2943, 1057: 2943, 2082: 2942, 35: 2946,
+        548: 2944, 37: 2946, 38: 2946, 4144: 2941,
+        552: 2944, 41: 2946, 42: 2946, 44: 2946,
+        5152: 2941, 560: 2944, 49: 2946, 50: 2946,
+        52: 2946, 4105: 2941, 56: 2946, 2184: 2942,
+        522: 2944, 2065: 2942, 3088: 2942, 524: 2944,
+        4640: 2941, 3076: 2942, 546: 2944, 2576: 2942,
+        2066: 2942, 4129: 2941, 1041: 2943, 1042: 2943,
+        515: 2944, 1538: 2943, 19: 2947, 2561: 2942,
+        4624: 2941, 532: 2944, 4232: 2941, 1044: 2943,
+        2084: 2942, 1664: 1602, 641: 2944, 642: 2944,
+        131: 2945, 3073: 2942, 133: 2945, 134: 2945,
+        6176: 2941, 648: 2944, 137: 2945, 138: 2945,
+        140: 2945, 656: 2944, 145: 2945, 146: 2945,
+        148: 2945, 152: 2945, 2068: 2942, 672: 1603,
+        161: 2945, 3074: 2942, 164: 2945, 6160: 2941,
+        168: 2945, 176: 1604, 1058: 2943, 3080: 2942,
+        4609: 2941, 5632: 2941, 1029: 2943, 4132: 2941,
+        2592: 2942, 5121: 2941, 2081: 2942, 518: 2944,
+        4130: 2941, 2564: 2942, 4610: 2941, 6656: 2941,
+        1060: 2943, 1030: 2943, 2053: 2942, 2562: 2942,
+        4116: 2941, 4099: 2941, 6145: 2941, 7168: 2941,
+        1064: 2943, 1048: 2943, 2088: 2942, 2054: 2942,
+        530: 2944, 2688: 2942, 6146: 2941, 4225: 2941,
+        2208: 2942, 2178: 2942, 4612: 2941, 2072: 2942,
+        644: 2944, 5124: 2941, 1072: 2943, 2192: 2942,
+        1160: 2943, 1033: 2943, 5136: 2941, 4136: 2941,
+        6148: 2941, 2568: 2942, 1153: 2943, 4256: 2941,
+        1034: 2943, 2057: 2942, 4120: 2941, 1168: 2943,
+        1154: 2943, 2177: 2942, 4240: 2941, 3200: 2942,
+        2058: 2942, 4616: 2941, 5128: 2941, 4736: 2941,
+        1156: 2943, 5248: 2941, 2060: 2942, 6152: 2941,
+        1184: 2943, 2180: 2942, 4226: 2941, 6272: 2941,
+        162: 2945, 3104: 2942, 2096: 2942, 4108: 2941,
+        545: 2944 },
+        321: { 128: 2945, 32: 2946, 2: 2950, 4096: 2941,
+        4: 2949, 1024: 2943, 8: 2948, 16: 2947,
+        512: 2944, 2048: 2942 },
+        322: { 128: 2945, 1: 2950, 4096: 2941, 4: 2949,
+        1024: 2943, 32: 2946, 8: 2948, 16: 2947,
+        512: 2944, 2048: 2942 },
+        2116: { 128: 2648, 1: 2652, 2: 2652, 4096: 2644,
+        1024: 2645, 32: 2649, 8: 2651, 256: 2647,
+        16: 2650, 512: 2646 },
+        324: { 128: 2945, 1: 2949, 2: 2949, 4096: 2941,
+        1024: 2943, 32: 2946, 8: 2948, 16: 2947,
+        512: 2944, 2048: 2942 },
+        328: { 128: 2945, 1: 2948, 2: 2948, 4096: 2941,
+        4: 2948, 1024: 2943, 32: 2946, 16: 2947,
+        512: 2944, 2048: 2942 },
+        336: { 128: 2945, 1: 2947, 2: 2947, 4096: 2941,
+        4: 2947, 1024: 2943, 32: 2946, 8: 2947,
+        512: 2944, 2048: 2942 },
+        1025: { 6656: 2820, 4864: 2820, 6146: 2820, 4612: 2820,
+        4102: 2820, 2568: 2821, 522: 2822, 2060: 2821,
+        4610: 2820, 14: 2828, 2576: 2821, 4114: 2820,
+        2068: 2821, 22: 2827, 536: 2822, 2564: 2821,
+        26: 2827, 28: 2827, 2592: 2821, 4130: 2820,
+        2084: 2821, 518: 2822, 38: 2826, 4144: 2820,
+        552: 2822, 42: 2826, 44: 2826, 560: 2822,
+        2312: 2821, 50: 2826, 52: 2826, 56: 2826,
+        2058: 2821, 2116: 2821, 2144: 2821, 2114: 2821,
+        2082: 2821, 4164: 2820, 70: 2825, 584: 2822,
+        4108: 2820, 74: 2825, 76: 2825, 548: 2822,
+        592: 2822, 82: 2825, 84: 2825, 4416: 2820,
+        4640: 2820, 88: 2825, 770: 2822, 608: 2822,
+        2320: 2821, 98: 2825, 100: 2825, 104: 2825,
+        2066: 2821, 4368: 2820, 112: 2825, 4624: 2820,
+        532: 2822, 4232: 2820, 4672: 2820, 2688: 2821,
+        2240: 2821, 2178: 2821, 4228: 2820, 134: 2824,
+        6176: 2820, 648: 2822, 138: 2824, 140: 2824,
+        656: 2822, 2072: 2821, 2562: 2821, 148: 2824,
+        772: 2822, 152: 2824, 672: 2822, 162: 2824,
+        164: 2824, 6160: 2820, 168: 2824, 176: 2824,
+        704: 2822, 2336: 2821, 194: 2824, 196: 2824,
+        2308: 2821, 200: 2824, 4354: 2820, 546: 2822,
+        6400: 2820, 208: 2824, 4132: 2820, 4116: 2820,
+        224: 2824, 2088: 2821, 4168: 2820, 2054: 2821,
+        530: 2822, 2816: 2821, 2432: 2821, 2306: 2821,
+        4356: 2820, 262: 2823, 776: 2822, 266: 2823,
+        268: 2823, 642: 2822, 784: 2822, 274: 2823,
+        276: 2823, 280: 2823, 2180: 2821, 800: 2822,
+        2096: 2821, 290: 2823, 292: 2823, 296: 2823,
+        304: 2823, 2184: 2821, 4136: 2820, 6148: 2820,
+        832: 2822, 4288: 2820, 322: 2823, 324: 2823,
+        328: 2823, 4256: 2820, 336: 2823, 4120: 2820,
+        352: 2823, 2192: 2821, 4240: 2820, 146: 2824,
+        6208: 2820, 4360: 2820, 524: 2822, 896: 2822,
+        2368: 2821, 386: 2823, 388: 2823, 4616: 2820,
+        392: 2823, 4162: 2820, 400: 2823, 644: 2822,
+        580: 2822, 4736: 2820, 416: 2823, 2120: 2821,
+        4106: 2820, 6152: 2820, 448: 2823, 2208: 2821,
+        4226: 2820, 4192: 2820, 6272: 2820, 4384: 2820,
+        578: 2822, 2624: 2821, 4480: 2820, 2128: 2821,
+        4176: 2820 },
+        4162: { 128: 2527, 1: 2532, 4: 2531, 1024: 2524,
+        32: 2528, 8: 2530, 256: 2526, 16: 2529,
+        512: 2525, 2048: 2523 },
+        352: { 128: 2945, 1: 2946, 2: 2946, 4096: 2941,
+        4: 2946, 1024: 2943, 8: 2946, 16: 2946,
+        512: 2944, 2048: 2942 },
+        6208: { 32: 2472, 1: 2472, 2: 2472, 4: 2472,
+        1024: 2468, 8: 2472, 128: 2471, 256: 2470,
+        16: 2472, 512: 2469 },
+        4104: { 3584: 2556, 3073: 2556, 1538: 2557, 1027: 2557,
+        1540: 2557, 517: 2558, 518: 2558, 7: 1609,
+        770: 2558, 1296: 2557, 2336: 2556, 1552: 2557,
+        1041: 2557, 2066: 2556, 19: 2563, 529: 2558,
+        21: 2563, 22: 2563, 2592: 2556, 1284: 2557,
+        1029: 2557, 1568: 2557, 1057: 2557, 2082: 2556,
+        35: 2562, 548: 2558, 37: 2562, 38: 2562,
+        3104: 2556, 2320: 2556, 560: 2558, 49: 2562,
+        50: 2562, 52: 2562, 2576: 2556, 769: 2558,
+        2116: 2556, 577: 2558, 2114: 2556, 67: 2561,
+        580: 2558, 69: 2561, 70: 2561, 592: 2558,
+        81: 2561, 82: 2561, 1537: 2557, 2816: 2556,
+        608: 2558, 97: 2561, 98: 2561, 100: 2561,
+        2065: 2556, 1282: 2557, 2305: 2556, 530: 2558,
+        3328: 2556, 515: 2558, 2561: 2556, 532: 2558,
+        1044: 2557, 2084: 2556, 1664: 2557, 641: 2558,
+        1154: 2557, 131: 2560, 644: 2558, 133: 2560,
+        134: 2560, 656: 2558, 145: 2560, 146: 2560,
+        148: 2560, 2068: 2556, 2051: 2556, 161: 2560,
+        162: 2560, 164: 2560, 1216: 2557, 176: 2560,
+        1058: 2557, 704: 2558, 193: 2560, 194: 2560,
+        196: 2560, 2308: 2556, 2081: 2556, 2240: 2556,
+        546: 2558, 2564: 2556, 208: 2560, 1060: 2557,
+        1030: 2557, 2053: 2556, 2562: 2556, 3076: 2556,
+        224: 2560, 1184: 2557, 2054: 2556, 1792: 2557,
+        1281: 2557, 2306: 2556, 259: 2559, 772: 2558,
+        261: 2559, 262: 2559, 1153: 2557, 2208: 2556,
+        2178: 2556, 784: 2558, 273: 2559, 274: 2559,
+        276: 2559, 1156: 2557, 800: 2558, 289: 2559,
+        290: 2559, 292: 2559, 112: 2561, 2192: 2556,
+        3074: 2556, 304: 2559, 1408: 2557, 832: 2558,
+        321: 2559, 322: 2559, 324: 2559, 1042: 2557,
+        336: 2559, 2432: 2556, 642: 2558, 2688: 2556,
+        352: 2559, 1168: 2557, 3088: 2556, 2177: 2556,
+        1120: 2557, 3200: 2556, 896: 2558, 385: 2559,
+        386: 2559, 388: 2559, 1089: 2557, 2144: 2556,
+        578: 2558, 400: 2559, 1092: 2557, 416: 2559,
+        2128: 2556, 1344: 2557, 1600: 2557, 448: 2559,
+        672: 2558, 2180: 2556, 1072: 2557, 2368: 2556,
+        2624: 2556, 1104: 2557, 1090: 2557, 2113: 2556,
+        2096: 2556, 3136: 2556, 1312: 2557, 545: 2558,
+        84: 2561 },
+        384: { 3584: 1601, 1537: 2932, 1538: 2932, 1027: 2932,
+        1540: 2932, 517: 2933, 518: 2933, 7: 2938,
+        1544: 2932, 521: 2933, 522: 2933, 11: 2937,
+        1036: 2932, 13: 2937, 14: 2937, 1552: 2932,
+        4113: 2930, 530: 2933, 4099: 2930, 532: 2933,
+        21: 2936, 22: 2936, 2592: 2931, 536: 2933,
+        25: 2936, 26: 2936, 1057: 2932, 28: 2936,
+        4101: 2930, 1092: 2932, 545: 2933, 2082: 2931,
+        35: 2935, 1041: 2932, 37: 2935, 38: 2935,
+        4144: 2930, 552: 2933, 41: 2935, 42: 2935,
+        44: 2935, 5152: 2930, 560: 2933, 49: 2935,
+        50: 2935, 52: 2935, 2576: 2931, 4105: 2930,
+        56: 2935, 4106: 2930, 2116: 2931, 4161: 2930,
+        1090: 2932, 67: 2934, 2065: 2931, 69: 2934,
+        70: 2934, 584: 2933, 73: 2934, 74: 2934,
+        76: 2934, 592: 2933, 81: 2934, 82: 2934,
+        84: 2934, 4640: 2930, 88: 2934, 3076: 2931,
+        1060: 2932, 546: 2933, 97: 2934, 98: 2934,
+        100: 2934, 4129: 2930, 529: 2933, 104: 2934,
+        2066: 2931, 515: 2933, 19: 2936, 2561: 2931,
+        4624: 2930, 1044: 2932, 4672: 2930, 2084: 2931,
+        4164: 2930, 3073: 2931, 5136: 2930, 6176: 2930,
+        1048: 2932, 2562: 2931, 2068: 2931, 2051: 2931,
+        112: 1604, 3074: 2931, 6160: 2930, 1058: 2932,
+        3080: 2931, 4609: 2930, 5184: 2930, 5632: 2930,
+        2120: 2931, 1029: 2932, 608: 1603, 4132: 2930,
+        1568: 2932, 5121: 2930, 2081: 2931, 4130: 2930,
+        2564: 2931, 4610: 2930, 6656: 2930, 548: 2933,
+        1030: 2932, 2053: 2931, 4116: 2930, 5122: 2930,
+        6145: 2930, 7168: 2930, 1064: 2932, 2088: 2931,
+        4168: 2930, 2054: 2931, 6146: 2930, 4612: 2930,
+        2072: 2931, 5124: 2930, 1072: 2932, 4114: 2930,
+        1033: 2932, 4136: 2930, 4102: 2930, 6148: 2930,
+        2568: 2931, 1042: 2932, 1034: 2932, 2057: 2931,
+        4120: 2930, 4162: 2930, 3088: 2931, 1120: 2932,
+        6208: 2930, 2058: 2931, 524: 2933, 1600: 1602,
+        4616: 2930, 577: 2933, 2144: 2931, 3136: 2931,
+        2114: 2931, 5128: 2930, 580: 2933, 2128: 2931,
+        2060: 2931, 1096: 2932, 6152: 2930, 1089: 2932,
+        4192: 2930, 578: 2933, 2624: 2931, 1104: 2932,
+        3104: 2931, 2113: 2931, 2096: 2931, 4176: 2930,
+        4108: 2930 },
+        385: { 64: 2934, 32: 2935, 2: 2939, 4096: 2930,
+        4: 2938, 1024: 2932, 8: 2937, 16: 2936,
+        512: 2933, 2048: 2931 },
+        386: { 64: 2934, 1: 2939, 4096: 2930, 4: 2938,
+        1024: 2932, 32: 2935, 8: 2937, 16: 2936,
+        512: 2933, 2048: 2931 },
+        388: { 64: 2934, 1: 2938, 2: 2938, 4096: 2930,
+        1024: 2932, 32: 2935, 8: 2937, 16: 2936,
+        512: 2933, 2048: 2931 },
+        4161: { 128: 2527, 32: 2528, 2: 2532, 4: 2531,
+        1024: 2524, 8: 2530, 256: 2526, 16: 2529,
+        512: 2525, 2048: 2523 },
+        392: { 64: 2934, 1: 2937, 2: 2937, 4096: 2930,
+        4: 2937, 1024: 2932, 32: 2935, 16: 2936,
+        512: 2933, 2048: 2931 },
+        66: { 3584: 3140, 4609: 3139, 2564: 3140, 4101: 3139,
+        1537: 3141, 1544: 3141, 4105: 3139, 1036: 3141,
+        13: 3147, 2336: 3140, 1552: 3141, 4113: 3139,
+        2068: 3140, 21: 3146, 2592: 3140, 1048: 3141,
+        772: 3142, 28: 3146, 517: 3142, 1568: 3141,
+        1057: 3141, 1041: 3141, 37: 3145, 4144: 3139,
+        552: 3142, 41: 3145, 3328: 3140, 44: 3145,
+        2320: 3140, 560: 3142, 49: 3145, 52: 3145,
+        2576: 3140, 521: 3142, 56: 3145, 2312: 3140,
+        2184: 3140, 769: 3142, 2065: 3140, 3088: 3140,
+        2060: 3140, 548: 3142, 4640: 3139, 4116: 3139,
+        2816: 3140, 1060: 3141, 1296: 3141, 4129: 3139,
+        529: 3142, 2305: 3140, 4368: 3139, 2561: 3140,
+        4624: 3139, 532: 3142, 4232: 3139, 1044: 3141,
+        2084: 3140, 1664: 3141, 641: 3142, 4228: 3139,
+        133: 3144, 5136: 3139, 6176: 3139, 648: 3142,
+        137: 3144, 140: 3144, 656: 3142, 145: 3144,
+        148: 3144, 25: 3146, 152: 3144, 4864: 3139,
+        7168: 3139, 672: 3142, 161: 3144, 164: 3144,
+        1284: 3141, 168: 3144, 4353: 3139, 1540: 3141,
+        176: 3144, 3080: 3140, 5632: 3139, 1029: 3141,
+        1312: 3141, 5121: 3139, 2308: 3140, 2081: 3140,
+        6400: 3139, 6656: 3139, 4132: 3139, 2053: 3140,
+        3076: 3140, 6145: 3139, 536: 3142, 5152: 3139,
+        1064: 3141, 2088: 3140, 3073: 3140, 1792: 3141,
+        1281: 3141, 4356: 3139, 261: 3143, 4225: 3139,
+        776: 3142, 265: 3143, 2208: 3140, 268: 3143,
+        4612: 3139, 784: 3142, 273: 3143, 276: 3143,
+        2072: 3140, 280: 3143, 644: 3142, 5124: 3139,
+        800: 3142, 289: 3143, 292: 3143, 296: 3143,
+        2192: 3140, 304: 3143, 1160: 3141, 1408: 3141,
+        1033: 3141, 4136: 3139, 6148: 3139, 6160: 3139,
+        2568: 3140, 1153: 3141, 4256: 3139, 2432: 3140,
+        2057: 3140, 4120: 3139, 2688: 3140, 1168: 3141,
+        2177: 3140, 4240: 3139, 5376: 3139, 3200: 3140,
+        4360: 3139, 524: 3142, 896: 3142, 385: 3143,
+        388: 3143, 4616: 3139, 392: 3143, 400: 3143,
+        4480: 3139, 5128: 3139, 1288: 3141, 4736: 3139,
+        416: 3143, 1156: 3141, 5248: 3139, 6152: 3139,
+        1184: 3141, 2180: 3140, 1072: 3141, 6272: 3139,
+        4384: 3139, 3104: 3140, 2096: 3140, 4108: 3139,
+        545: 3142 },
+        400: { 64: 2934, 1: 2936, 2: 2936, 4096: 2930,
+        4: 2936, 1024: 2932, 32: 2935, 8: 2936,
+        512: 2933, 2048: 2931 },
+        4105: { 32: 2562, 128: 2560, 2: 2565, 4: 2564,
+        1024: 2557, 64: 2561, 256: 2559, 16: 2563,
+        512: 2558, 2048: 2556 },
+        5128: { 64: 2483, 1: 2486, 2: 2486, 4: 2486,
+        2048: 2479, 32: 2484, 128: 2482, 256: 2481,
+        16: 2485, 512: 2480 },
+        4164: { 128: 2527, 1: 2531, 2: 2531, 1024: 2524,
+        32: 2528, 8: 2530, 256: 2526, 16: 2529,
+        512: 2525, 2048: 2523 },
+        416: { 64: 2934, 1: 2935, 2: 2935, 4096: 2930,
+        4: 2935, 1024: 2932, 8: 2935, 16: 2935,
+        512: 2933, 2048: 2931 },
+        70: { 128: 3133, 1: 3137, 4096: 3128, 1024: 3130,
+        32: 3134, 8: 3136, 256: 3132, 16: 3135,
+        512: 3131, 2048: 3129 },
+        2060: { 128: 2681, 1: 2685, 2: 2685, 4096: 2677,
+        1024: 2678, 32: 2683, 64: 2682, 256: 2680,
+        16: 2684, 512: 2679 },
+        2120: { 128: 2648, 1: 2651, 2: 2651, 4096: 2644,
+        4: 2651, 1024: 2645, 32: 2649, 256: 2647,
+        16: 2650, 512: 2646 },
+        4106: { 128: 2560, 1: 2565, 4: 2564, 1024: 2557,
+        32: 2562, 64: 2561, 256: 2559, 16: 2563,
+        512: 2558, 2048: 2556 },
+        6152: { 64: 2472, 1: 2475, 2: 2475, 4: 2475,
+        1024: 2468, 32: 2473, 128: 2471, 256: 2470,
+        16: 2474, 512: 2469 },
+        448: { 32: 2934, 1: 2934, 2: 2934, 4096: 2930,
+        4: 2934, 1024: 2932, 8: 2934, 16: 2934,
+        512: 2933, 2048: 2931 },
+        80: { 3584: 3107, 3073: 3107, 6146: 3106, 1027: 3108,
+        1540: 3108, 4101: 3106, 4102: 3106, 7: 3114,
+        1544: 3108, 4105: 3106, 4106: 3106, 11: 3113,
+        1036: 3108, 13: 3113, 14: 3113, 4228: 3106,
+        2051: 3107, 2592: 3107, 1284: 3108, 517: 3109,
+        1568: 3108, 1057: 3108, 1058: 3108, 35: 3112,
+        548: 3109, 37: 3112, 38: 3112, 3104: 3107,
+        552: 3109, 41: 3112, 42: 3112, 44: 1606,
+        1288: 3108, 1033: 3108, 2312: 3107, 2184: 3107,
+        769: 3109, 522: 3109, 6400: 3106, 524: 3109,
+        1281: 3108, 2336: 3107, 4384: 3106, 1537: 3108,
+        4640: 3106, 770: 3109, 2816: 3107, 1060: 3108,
+        546: 3109, 4129: 3106, 5152: 3106, 1282: 3108,
+        2305: 3107, 3328: 3107, 515: 3109, 1538: 3108,
+        2561: 3107, 4232: 3106, 2084: 3107, 1664: 3108,
+        4225: 3106, 2178: 3107, 4130: 3106, 644: 3109,
+        133: 3111, 134: 3111, 6176: 3106, 648: 3109,
+        137: 3111, 138: 3111, 140: 3111, 2562: 3107,
+        2432: 3107, 4864: 3106, 672: 3109, 161: 3111,
+        3074: 3107, 164: 3111, 168: 1605, 5376: 3106,
+        3080: 3107, 4609: 3106, 5632: 3106, 1029: 3108,
+        4132: 3106, 1312: 3108, 5121: 3106, 2308: 3107,
+        2081: 3107, 518: 3109, 2082: 3107, 2564: 3107,
+        4610: 3106, 6656: 3106, 292: 3110, 1030: 3108,
+        2053: 3107, 3076: 3107, 4099: 3106, 5122: 3106,
+        6145: 3106, 7168: 3106, 1064: 3108, 2088: 3107,
+        2054: 3107, 1792: 3108, 4353: 3106, 2306: 3107,
+        259: 3110, 772: 3109, 261: 3110, 262: 3110,
+        641: 3109, 776: 3109, 265: 3110, 266: 3110,
+        2208: 3107, 268: 3110, 4226: 3106, 4612: 3106,
+        131: 3111, 1156: 3108, 5124: 3106, 800: 3109,
+        289: 3110, 290: 3110, 4356: 3106, 521: 3109,
+        296: 3110, 1160: 3108, 1408: 3108, 4136: 3106,
+        6148: 3106, 2568: 3107, 1153: 3108, 4256: 3106,
+        1034: 3108, 2057: 3107, 642: 3109, 2688: 3107,
+        1154: 3108, 2177: 3107, 3200: 3107, 2058: 3107,
+        4360: 3106, 896: 3109, 385: 3110, 386: 3110,
+        388: 3110, 4616: 3106, 392: 3110, 4480: 3106,
+        5128: 3106, 4736: 3106, 416: 1604, 5248: 3106,
+        2060: 3107, 6152: 3106, 1184: 3108, 2180: 3107,
+        6272: 3106, 162: 3111, 4108: 3106, 545: 3109,
+        4354: 3106 },
+        4176: { 128: 2527, 1: 2529, 2: 2529, 4: 2529,
+        1024: 2524, 32: 2528, 8: 2529, 256: 2526,
+        512: 2525, 2048: 2523 },
+        4108: { 128: 2560, 1: 2564, 2: 2564, 1024: 2557,
+        32: 2562, 64: 2561, 256: 2559, 16: 2563,
+        512: 2558, 2048: 2556 },
+        2049: { 5632: 2710, 4864: 2710, 4610: 2710, 5124: 2710,
+        4102: 2710, 1544: 2711, 522: 2712, 1036: 2711,
+        1282: 2711, 14: 2718, 1552: 2711, 4114: 2710,
+        532: 2712, 22: 2717, 536: 2712, 1540: 2711,
+        26: 2717, 28: 2717, 1092: 2711, 4130: 2710,
+        1058: 2711, 4132: 2710, 518: 2712, 38: 2716,
+        4144: 2710, 552: 2712, 42: 2716, 44: 2716,
+        560: 2712, 1288: 2711, 50: 2716, 52: 2716,
+        56: 2716, 1034: 2711, 1600: 2711, 1120: 2711,
+        4162: 2710, 4164: 2710, 70: 2715, 584: 2712,
+        4108: 2710, 74: 2715, 76: 2715, 4384: 2710,
+        592: 2712, 82: 2715, 84: 2715, 4416: 2710,
+        4640: 2710, 88: 2715, 1060: 2711, 608: 2712,
+        1296: 2711, 98: 2715, 100: 2715, 5152: 2710,
+        104: 2715, 1042: 2711, 4368: 2710, 112: 2715,
+        1538: 2711, 4624: 2710, 4116: 2710, 4232: 2710,
+        4672: 2710, 1044: 2711, 1664: 2711, 1216: 2711,
+        642: 2712, 4228: 2710, 134: 2714, 648: 2712,
+        138: 2714, 140: 2714, 656: 2712, 1048: 2711,
+        146: 2714, 148: 2714, 772: 2712, 152: 2714,
+        672: 2712, 162: 2714, 164: 2714, 1284: 2711,
+        168: 2714, 5376: 2710, 176: 2714, 704: 2712,
+        1312: 2711, 194: 2714, 196: 2714, 200: 2714,
+        4354: 2710, 546: 2712, 5184: 2710, 208: 2714,
+        548: 2712, 1030: 2711, 224: 2714, 5122: 2710,
+        1064: 2711, 4168: 2710, 530: 2712, 1792: 2711,
+        1408: 2711, 770: 2712, 4356: 2710, 262: 2713,
+        776: 2712, 266: 2713, 268: 2713, 4226: 2710,
+        4612: 2710, 784: 2712, 274: 2713, 276: 2713,
+        280: 2713, 644: 2712, 800: 2712, 1072: 2711,
+        290: 2713, 292: 2713, 296: 2713, 304: 2713,
+        1160: 2711, 5136: 2710, 4136: 2710, 832: 2712,
+        4288: 2710, 322: 2713, 324: 2713, 328: 2713,
+        4256: 2710, 336: 2713, 4120: 2710, 352: 2713,
+        1168: 2711, 1154: 2711, 4240: 2710, 4360: 2710,
+        524: 2712, 896: 2712, 1344: 2711, 386: 2713,
+        388: 2713, 4616: 2710, 392: 2713, 578: 2712,
+        400: 2713, 4480: 2710, 5128: 2710, 580: 2712,
+        4736: 2710, 416: 2713, 1156: 2711, 5248: 2710,
+        1096: 2711, 4106: 2710, 448: 2713, 1184: 2711,
+        4192: 2710, 1104: 2711, 1090: 2711, 4176: 2710,
+        1568: 2711 },
+        512: { 2048: 48, 1: 58, 2: 57, 4: 56,
+        6151: 3993, 8: 55, 6155: 3992, 6157: 3992,
+        6158: 3992, 2063: 4080, 16: 54, 4440: 4006,
+        6163: 3991, 6165: 3991, 6166: 3991, 2071: 4077,
+        6169: 3991, 6170: 3991, 4123: 4031, 6172: 3991,
+        2077: 4076, 4126: 4031, 31: 1608, 32: 53,
+        6179: 3990, 6181: 3990, 6182: 3990, 2087: 4073,
+        6185: 3990, 6186: 3990, 4139: 4027, 6188: 3990,
+        2093: 4072, 2094: 4072, 47: 4190, 6193: 3990,
+        6194: 3990, 4147: 4026, 6196: 3990, 4149: 4026,
+        2102: 4071, 55: 4187, 6200: 3990, 4153: 4026,
+        2106: 4071, 59: 4186, 2108: 4071, 61: 4186,
+        62: 1607, 64: 52, 5472: 3996, 6211: 3989,
+        6213: 3989, 6214: 3989, 2119: 4068, 6217: 3989,
+        6218: 3989, 4171: 4022, 6220: 3989, 4173: 4022,
+        2126: 4067, 5133: 4001, 6225: 3989, 6226: 3989,
+        2131: 4066, 6228: 3989, 4181: 4021, 2134: 4066,
+        87: 4177, 6232: 3989, 2137: 4066, 2138: 4066,
+        4111: 1609, 2140: 4066, 93: 4176, 94: 4176,
+        6241: 3989, 6242: 3989, 4195: 4020, 6244: 3989,
+        2149: 4065, 2150: 4065, 103: 4173, 6248: 3989,
+        2153: 4065, 2154: 4065, 107: 4172, 2156: 4065,
+        109: 4172, 110: 4172, 6256: 3989, 4209: 4020,
+        2162: 4065, 5139: 4000, 4300: 4013, 117: 4171,
+        118: 4171, 2168: 4065, 121: 4171, 122: 4171,
+        124: 1606, 5141: 4000, 128: 51, 6275: 3988,
+        6277: 3988, 6278: 3988, 2183: 4062, 6281: 3988,
+        6282: 3988, 2187: 4061, 6284: 3988, 2189: 4061,
+        2190: 4061, 143: 4165, 6289: 3988, 6290: 3988,
+        2195: 4060, 6292: 3988, 4245: 4015, 2198: 4060,
+        151: 4162, 6296: 3988, 4249: 4015, 2202: 4060,
+        155: 4161, 2204: 4060, 157: 4161, 158: 4161,
+        6305: 3988, 6306: 3988, 2211: 4059, 6308: 3988,
+        2213: 4059, 2214: 4059, 167: 4158, 6312: 3988,
+        2217: 4059, 2218: 4059, 171: 4157, 2220: 4059,
+        173: 4157, 174: 4157, 4125: 4031, 6320: 3988,
+        4273: 4014, 2226: 4059, 179: 4156, 2228: 4059,
+        181: 4156, 182: 4156, 2232: 4059, 185: 4156,
+        186: 4156, 188: 4156, 6337: 3988, 6338: 3988,
+        2243: 4058, 6340: 3988, 2245: 4058, 2246: 4058,
+        199: 4153, 6344: 3988, 4297: 4013, 2250: 4058,
+        203: 4152, 2252: 4058, 205: 4152, 206: 4152,
+        6352: 3988, 2257: 4058, 2258: 4058, 5155: 3999,
+        2260: 4058, 213: 4151, 214: 4151, 2264: 4058,
+        217: 4151, 218: 4151, 5190: 3998, 5157: 3999,
+        6368: 3988, 4321: 4013, 2274: 4058, 227: 4150,
+        2276: 4058, 229: 4150, 230: 4150, 2280: 4058,
+        233: 4150, 234: 4150, 4135: 4028, 236: 4150,
+        2288: 4058, 241: 4150, 242: 4150, 244: 4150,
+        5161: 3999, 248: 1605, 5162: 3999, 256: 50,
+        6403: 3987, 6405: 3987, 6406: 3987, 2311: 4055,
+        6409: 3987, 6410: 3987, 4363: 4009, 6412: 3987,
+        4365: 4009, 2318: 4054, 271: 4144, 6417: 3987,
+        2123: 4067, 4371: 4008, 6420: 3987, 2325: 4053,
+        2326: 4053, 279: 4141, 6424: 3987, 2329: 4053,
+        2330: 4053, 283: 4140, 2332: 4053, 285: 4140,
+        286: 4140, 2437: 4050, 6433: 3987, 6434: 3987,
+        2339: 4052, 6436: 3987, 4389: 4007, 2342: 4052,
+        295: 4137, 6440: 3987, 2345: 4052, 2346: 4052,
+        299: 4136, 2348: 4052, 301: 4136, 302: 4136,
+        2225: 4059, 2353: 4052, 2354: 4052, 2099: 4071,
+        2356: 4052, 309: 4135, 310: 4135, 2441: 4050,
+        2360: 4052, 313: 4135, 314: 4135, 316: 4135,
+        4490: 4005, 2101: 4071, 6465: 3987, 6466: 3987,
+        2371: 4051, 6468: 3987, 4421: 4006, 2374: 4051,
+        327: 4132, 6472: 3987, 4425: 4006, 2378: 4051,
+        331: 4131, 2380: 4051, 333: 4131, 334: 4131,
+        6480: 3987, 4433: 4006, 2386: 4051, 339: 4130,
+        2388: 4051, 341: 4130, 342: 4130, 2105: 4071,
+        2392: 4051, 345: 4130, 346: 4130, 348: 4130,
+        4154: 4026, 6496: 3987, 2401: 4051, 2402: 4051,
+        355: 4129, 2404: 4051, 357: 4129, 358: 4129,
+        4497: 4005, 2408: 4051, 361: 4129, 362: 4129,
+        364: 4129, 4498: 4005, 2416: 4051, 369: 4129,
+        370: 4129, 403: 4124, 372: 4129, 5127: 4002,
+        4500: 4005, 6529: 3987, 6530: 3987, 2435: 4050,
+        6532: 3987, 4485: 4005, 2438: 4050, 391: 4126,
+        6536: 3987, 4489: 4005, 2442: 4050, 395: 4125,
+        2444: 4050, 397: 4125, 398: 4125, 5196: 3998,
+        2449: 4050, 2450: 4050, 5187: 3998, 2452: 4050,
+        405: 4124, 406: 4124, 2456: 4050, 409: 4124,
+        410: 4124, 412: 4124, 5189: 3998, 6560: 3987,
+        4513: 4005, 2466: 4050, 419: 4123, 2468: 4050,
+        421: 4123, 422: 4123, 2472: 4050, 425: 4123,
+        426: 4123, 4167: 4023, 428: 4123, 3083: 4046,
+        433: 4123, 434: 4123, 436: 4123, 5193: 3998,
+        440: 4123, 5194: 3998, 6592: 3987, 4545: 4005,
+        2498: 4050, 451: 4122, 2500: 4050, 453: 4122,
+        454: 4122, 2465: 4050, 2504: 4050, 457: 4122,
+        458: 4122, 460: 4122, 4514: 4005, 2125: 4067,
+        2512: 4050, 465: 4122, 466: 4122, 220: 4151,
+        4174: 4022, 472: 4122, 4516: 4005, 79: 4180,
+        4312: 4013, 2528: 1603, 481: 1603, 482: 1603,
+        484: 1603, 3153: 4043, 488: 1603, 5202: 3998,
+        4449: 4006, 496: 1603, 4520: 4005, 4179: 4021,
+        5204: 3998, 2133: 4066, 4182: 4021, 4450: 4006,
+        5208: 3998, 4185: 4021, 4186: 4021, 2480: 4050,
+        91: 4176, 4188: 4021, 5217: 3998, 4452: 4006,
+        5134: 4001, 5328: 3997, 5218: 3998, 2147: 4065,
+        5220: 3998, 4197: 4020, 4198: 4020, 5224: 3998,
+        4201: 4020, 4202: 4020, 5568: 1602, 2497: 4050,
+        4204: 4020, 4546: 4005, 4548: 4005, 5232: 3998,
+        4096: 47, 2161: 4065, 4210: 4020, 4552: 4005,
+        115: 4171, 2164: 4065, 4456: 4006, 4216: 4020,
+        5320: 3997, 1488: 1602, 5344: 3997, 468: 4122,
+        3203: 4042, 3205: 4042, 5254: 3997, 4231: 4017,
+        4528: 4005, 5257: 3997, 4119: 4032, 5142: 4000,
+        5258: 3997, 4576: 1603, 4235: 4016, 5260: 3997,
+        4237: 4016, 4238: 4016, 5265: 3997, 5266: 3997,
+        2075: 4076, 4243: 4015, 5268: 3997, 2197: 4060,
+        4246: 4015, 5272: 3997, 5145: 4000, 2201: 4060,
+        4250: 4015, 4252: 4015, 4464: 4006, 5146: 4000,
+        5281: 3997, 2078: 4076, 5282: 3997, 4259: 4014,
+        5284: 3997, 4261: 4014, 4262: 4014, 5148: 4000,
+        5288: 3997, 4265: 4014, 4266: 4014, 1024: 49,
+        7171: 3986, 7173: 3986, 7174: 3986, 3079: 4047,
+        7177: 3986, 7178: 3986, 5131: 4001, 7180: 3986,
+        3085: 4046, 3086: 4046, 1039: 4116, 7185: 3986,
+        7186: 3986, 3091: 4045, 7188: 3986, 3093: 4045,
+        3094: 4045, 1047: 4113, 7192: 3986, 3097: 4045,
+        3098: 4045, 1051: 4112, 3100: 4045, 1053: 4112,
+        1054: 4112, 7201: 3986, 7202: 3986, 3107: 4044,
+        7204: 3986, 3109: 4044, 3110: 4044, 1063: 4109,
+        7208: 3986, 3113: 4044, 3114: 4044, 1067: 4108,
+        3116: 4044, 1069: 4108, 1070: 4108, 7216: 3986,
+        3121: 4044, 3122: 4044, 1075: 4107, 3124: 4044,
+        1077: 4107, 1078: 4107, 3128: 4044, 1081: 4107,
+        1082: 4107, 1084: 4107, 7233: 3986, 7234: 3986,
+        3139: 4043, 7236: 3986, 3141: 4043, 3142: 4043,
+        1095: 4104, 7240: 3986, 3145: 4043, 3146: 4043,
+        1099: 4103, 3148: 4043, 1101: 4103, 1102: 4103,
+        7248: 3986, 5201: 3998, 3154: 4043, 1107: 4102,
+        3156: 4043, 1109: 4102, 1110: 4102, 3160: 4043,
+        1113: 4102, 1114: 4102, 1116: 4102, 7264: 3986,
+        3169: 4043, 3170: 4043, 1123: 4101, 3172: 4043,
+        1125: 4101, 1126: 4101, 3176: 4043, 1129: 4101,
+        1130: 4101, 1132: 4101, 6448: 3987, 3184: 4043,
+        1137: 4101, 1138: 4101, 1140: 4101, 1144: 4101,
+        7297: 3986, 7298: 3986, 5251: 3997, 7300: 3986,
+        5253: 3997, 3206: 4042, 3265: 4042, 7304: 3986,
+        3209: 4042, 3210: 4042, 1163: 4097, 3212: 4042,
+        1165: 4097, 1166: 4097, 7312: 3986, 3217: 4042,
+        3218: 4042, 1171: 4096, 3220: 4042, 1173: 4096,
+        1174: 4096, 3224: 4042, 1177: 4096, 1178: 4096,
+        1180: 4096, 4293: 4013, 7328: 3986, 3233: 4042,
+        3234: 4042, 1187: 4095, 3236: 4042, 1189: 4095,
+        1190: 4095, 3240: 4042, 1193: 4095, 1194: 4095,
+        1196: 4095, 4336: 4013, 3248: 4042, 1201: 4095,
+        1202: 4095, 4268: 4014, 1204: 4095, 2249: 4058,
+        1208: 4095, 4298: 4013, 7360: 3986, 5313: 3997,
+        3266: 4042, 1219: 4094, 3268: 4042, 1221: 4094,
+        1222: 4094, 3272: 4042, 1225: 4094, 1226: 4094,
+        1228: 4094, 3280: 4042, 1233: 4094, 1234: 4094,
+        1236: 4094, 1240: 4094, 3296: 4042, 1249: 4094,
+        1250: 4094, 1252: 4094, 4305: 4013, 1256: 4094,
+        4306: 4013, 1264: 4094, 211: 4151, 4308: 4013,
+        7425: 1600, 7426: 1600, 5379: 3996, 7428: 1600,
+        3333: 4041, 3334: 4041, 1287: 4091, 7432: 1600,
+        3337: 4041, 3338: 4041, 1291: 4090, 3340: 4041,
+        1293: 4090, 1294: 4090, 7440: 1600, 5393: 3996,
+        3346: 4041, 1299: 4089, 3348: 4041, 1301: 4089,
+        1302: 4089, 3352: 4041, 1305: 4089, 1306: 4089,
+        5158: 3999, 1308: 4089, 7456: 1600, 3361: 4041,
+        3362: 4041, 1315: 4088, 3364: 4041, 1317: 4088,
+        1318: 4088, 3368: 4041, 1321: 4088, 1322: 4088,
+        1324: 4088, 3376: 4041, 1329: 4088, 1330: 4088,
+        1332: 4088, 1336: 4088, 7488: 1600, 3393: 4041,
+        3394: 4041, 1347: 4087, 3396: 4041, 1349: 4087,
+        1350: 4087, 2273: 4058, 3400: 4041, 1353: 4087,
+        1354: 4087, 5296: 3997, 1356: 4087, 4322: 4013,
+        3408: 4041, 2091: 4072, 1362: 4087, 1364: 4087,
+        1368: 4087, 4324: 4013, 3424: 4041, 1377: 4087,
+        1378: 4087, 1380: 4087, 4274: 4014, 1384: 4087,
+        1392: 4087, 4328: 4013, 7552: 1600, 3457: 1601,
+        3458: 1601, 1411: 4086, 3460: 1601, 1413: 4086,
+        1414: 4086, 4504: 4005, 1417: 4086, 1418: 4086,
+        1420: 4086, 3472: 1601, 1425: 4086, 1426: 4086,
+        1428: 4086, 1432: 4086, 3488: 1601, 1441: 4086,
+        1442: 4086, 4276: 4014, 1444: 4086, 1448: 4086,
+        1456: 4086, 3520: 1601, 1473: 1602, 1474: 1602,
+        1476: 1602, 1480: 1602, 4141: 4027, 5164: 3999,
+        5505: 3996, 1504: 1602, 4142: 4027, 4483: 4005,
+        5506: 3996, 3331: 4041, 4280: 4014, 5381: 3996,
+        4212: 4020, 5382: 3996, 5508: 3996, 4359: 4010,
+        5385: 3996, 5386: 3996, 2315: 4054, 4486: 4005,
+        5388: 3996, 2317: 4054, 4366: 4009, 3464: 1601,
+        5169: 3999, 3345: 4041, 5394: 3996, 2323: 4053,
+        5396: 3996, 4373: 4008, 5170: 3999, 4374: 4008,
+        5400: 3996, 4377: 4008, 4378: 4008, 5512: 3996,
+        4380: 4008, 5172: 3999, 5409: 3996, 5410: 3996,
+        4387: 4007, 5412: 3996, 4150: 4026, 2341: 4052,
+        4390: 4007, 5416: 3996, 4560: 4005, 4393: 4007,
+        4492: 4005, 4394: 4007, 6418: 3987, 4396: 4007,
+        5424: 3996, 4401: 4007, 4402: 4007, 307: 4135,
+        5176: 3999, 4404: 4007, 376: 4129, 5536: 3996,
+        4408: 4007, 4291: 4013, 5314: 3997, 5441: 3996,
+        5442: 3996, 4156: 4026, 5520: 3996, 4419: 4006,
+        5444: 3996, 2373: 4051, 5316: 3997, 4422: 4006,
+        1361: 4087, 5448: 3996, 6544: 3987, 2377: 4051,
+        4426: 4006, 4294: 4013, 4428: 4006, 5456: 3996,
+        2385: 4051, 4434: 4006, 4436: 4006, 1159: 4098 },
+        513: { 7168: 2919, 5376: 2919, 6146: 2919, 5124: 2919,
+        2054: 2920, 3080: 2920, 1034: 2921, 1036: 2921,
+        3074: 2920, 14: 2927, 3088: 2920, 4114: 2919,
+        2068: 2920, 22: 2926, 1048: 2921, 3076: 2920,
+        26: 2926, 28: 2926, 3104: 2920, 4130: 2919,
+        2084: 2920, 4102: 2919, 38: 2925, 4144: 2919,
+        1064: 2921, 42: 2925, 44: 2925, 1072: 2921,
+        2312: 2920, 50: 2925, 52: 2925, 56: 2925,
+        2058: 2920, 2116: 2920, 2144: 2920, 2114: 2920,
+        2082: 2920, 4164: 2919, 70: 2924, 1096: 2921,
+        2060: 2920, 74: 2924, 76: 2924, 4384: 2919,
+        1104: 2921, 82: 2924, 84: 2924, 4416: 2919,
+        88: 2924, 1060: 2921, 1120: 2921, 2320: 2920,
+        98: 2924, 100: 2924, 5152: 2919, 104: 2924,
+        1282: 2921, 2066: 2920, 4368: 2919, 112: 2924,
+        6400: 2919, 4116: 2919, 4232: 2919, 1044: 2921,
+        3200: 2920, 2240: 2920, 2178: 2920, 4228: 2919,
+        134: 2923, 6176: 2919, 1160: 2921, 138: 2923,
+        140: 2923, 1168: 2921, 2072: 2920, 146: 2923,
+        148: 2923, 152: 2923, 1184: 2921, 162: 2923,
+        164: 2923, 6160: 2919, 168: 2923, 176: 2923,
+        1216: 2921, 2336: 2920, 194: 2923, 196: 2923,
+        2308: 2920, 200: 2923, 4354: 2919, 1058: 2921,
+        5184: 2919, 208: 2923, 4132: 2919, 1030: 2921,
+        224: 2923, 5122: 2919, 2088: 2920, 4168: 2919,
+        3328: 2920, 2432: 2920, 2306: 2920, 1284: 2921,
+        262: 2922, 1288: 2921, 266: 2922, 268: 2922,
+        4226: 2919, 1296: 2921, 274: 2922, 276: 2922,
+        280: 2922, 2180: 2920, 1312: 2921, 2096: 2920,
+        290: 2922, 4356: 2919, 292: 2922, 296: 2922,
+        304: 2922, 2184: 2920, 5136: 2919, 4136: 2919,
+        6148: 2919, 1344: 2921, 4288: 2919, 322: 2922,
+        324: 2922, 328: 2922, 4256: 2919, 1042: 2921,
+        336: 2922, 4120: 2919, 352: 2922, 2192: 2920,
+        1154: 2921, 4240: 2919, 6208: 2919, 4360: 2919,
+        1408: 2921, 2368: 2920, 386: 2922, 388: 2922,
+        392: 2922, 3136: 2920, 4162: 2919, 400: 2922,
+        4480: 2919, 5128: 2919, 1092: 2921, 416: 2922,
+        1156: 2921, 5248: 2919, 2120: 2920, 4106: 2919,
+        6152: 2919, 448: 2922, 2208: 2920, 4192: 2919,
+        6272: 2919, 2128: 2920, 1090: 2921, 4176: 2919,
+        4108: 2919 },
+        514: { 7168: 2908, 5121: 2908, 6148: 2908, 4101: 2908,
+        1281: 2910, 3080: 2909, 4105: 2908, 1036: 2910,
+        13: 2916, 2336: 2909, 3088: 2909, 4113: 2908,
+        2068: 2909, 21: 2915, 1048: 2910, 25: 2915,
+        28: 2915, 1029: 2910, 3104: 2909, 1057: 2910,
+        4132: 2908, 37: 2914, 4144: 2908, 1064: 2910,
+        41: 2914, 44: 2914, 2320: 2909, 1072: 2910,
+        49: 2914, 52: 2914, 1033: 2910, 56: 2914,
+        2116: 2909, 4161: 2908, 6400: 2908, 4164: 2908,
+        69: 2913, 4288: 2908, 1096: 2910, 2060: 2909,
+        76: 2913, 4384: 2908, 1104: 2910, 81: 2913,
+        84: 2913, 4416: 2908, 88: 2913, 1120: 2910,
+        97: 2913, 100: 2913, 4129: 2908, 1041: 2910,
+        104: 2913, 2305: 2909, 4368: 2908, 112: 2913,
+        4116: 2908, 4232: 2908, 1044: 2910, 2084: 2909,
+        3200: 2909, 4225: 2908, 4228: 2908, 133: 2912,
+        5136: 2908, 6176: 2908, 1160: 2910, 137: 2912,
+        140: 2912, 1168: 2910, 145: 2912, 148: 2912,
+        152: 2912, 1184: 2910, 161: 2912, 164: 2912,
+        1284: 2910, 168: 2912, 5376: 2908, 176: 2912,
+        1216: 2910, 193: 2912, 196: 2912, 2308: 2909,
+        2081: 2909, 200: 2912, 2240: 2909, 5184: 2908,
+        208: 2912, 1060: 2910, 2053: 2909, 3076: 2909,
+        224: 2912, 6145: 2908, 5152: 2908, 2088: 2909,
+        4168: 2908, 3073: 2909, 3328: 2909, 4353: 2908,
+        4356: 2908, 261: 2911, 1153: 2910, 1288: 2910,
+        265: 2911, 268: 2911, 1296: 2910, 273: 2911,
+        276: 2911, 2072: 2909, 280: 2911, 1156: 2910,
+        5124: 2908, 1312: 2910, 289: 2911, 292: 2911,
+        296: 2911, 304: 2911, 2184: 2909, 4136: 2908,
+        2312: 2909, 1344: 2910, 321: 2911, 324: 2911,
+        6160: 2908, 328: 2911, 4256: 2908, 336: 2911,
+        2432: 2909, 2057: 2909, 4120: 2908, 2065: 2909,
+        352: 2911, 2192: 2909, 2177: 2909, 4240: 2908,
+        6208: 2908, 4360: 2908, 1408: 2910, 385: 2911,
+        388: 2911, 1089: 2910, 392: 2911, 2144: 2909,
+        3136: 2909, 400: 2911, 4480: 2908, 5128: 2908,
+        1092: 2910, 416: 2911, 5248: 2908, 2120: 2909,
+        6152: 2908, 73: 2913, 448: 2911, 2208: 2909,
+        2180: 2909, 4192: 2908, 6272: 2908, 2368: 2909,
+        2128: 2909, 2113: 2909, 2096: 2909, 4176: 2908,
+        4108: 2908 },
+        515: { 128: 2912, 64: 2913, 4096: 2908, 4: 2917,
+        1024: 2910, 32: 2914, 8: 2916, 256: 2911,
+        16: 2915, 2048: 2909 },
+        516: { 7168: 2897, 5121: 2897, 3074: 2898, 1027: 2899,
+        1281: 2899, 3080: 2898, 2057: 2898, 4106: 2897,
+        11: 2905, 6146: 2897, 2336: 2898, 3088: 2898,
+        4113: 2897, 4114: 2897, 2051: 2898, 1048: 2899,
+        25: 2904, 26: 2904, 3104: 2898, 1057: 2899,
+        4130: 2897, 35: 2903, 4144: 2897, 1064: 2899,
+        41: 2903, 42: 2903, 2320: 2898, 1072: 2899,
+        49: 2903, 50: 2903, 1033: 2899, 56: 2903,
+        1034: 2899, 3136: 2898, 4161: 2897, 2114: 2898,
+        67: 2902, 2065: 2898, 1096: 2899, 73: 2902,
+        74: 2902, 224: 2901, 4384: 2897, 1104: 2899,
+        81: 2902, 82: 2902, 4416: 2897, 88: 2902,
+        1120: 2899, 97: 2902, 98: 2902, 4129: 2897,
+        1041: 2899, 104: 2902, 1282: 2899, 2305: 2898,
+        1042: 2899, 4368: 2897, 112: 2902, 19: 2904,
+        6400: 2897, 4232: 2897, 3200: 2898, 4225: 2897,
+        1154: 2899, 131: 2901, 3073: 2898, 5136: 2897,
+        6176: 2897, 1160: 2899, 137: 2901, 138: 2901,
+        1168: 2899, 145: 2901, 146: 2901, 152: 2901,
+        1184: 2899, 161: 2901, 162: 2901, 6160: 2897,
+        168: 2901, 5376: 2897, 176: 2901, 1058: 2899,
+        2120: 2898, 1216: 2899, 193: 2901, 194: 2901,
+        2081: 2898, 200: 2901, 4354: 2897, 2240: 2898,
+        2082: 2898, 5184: 2897, 208: 2901, 4099: 2897,
+        5122: 2897, 6145: 2897, 5152: 2897, 2088: 2898,
+        4168: 2897, 3328: 2898, 4353: 2897, 2306: 2898,
+        259: 2900, 2177: 2898, 1288: 2899, 265: 2900,
+        266: 2900, 4288: 2897, 2178: 2898, 1296: 2899,
+        273: 2900, 274: 2900, 2072: 2898, 280: 2900,
+        1312: 2899, 289: 2900, 290: 2900, 296: 2900,
+        304: 2900, 2184: 2898, 4136: 2897, 2312: 2898,
+        1344: 2899, 321: 2900, 322: 2900, 1153: 2899,
+        4256: 2897, 336: 2900, 2432: 2898, 4120: 2897,
+        4162: 2897, 352: 2900, 2192: 2898, 4240: 2897,
+        6208: 2897, 2058: 2898, 4360: 2897, 1408: 2899,
+        385: 2900, 386: 2900, 1089: 2899, 392: 2900,
+        2144: 2898, 1090: 2899, 400: 2900, 4480: 2897,
+        4105: 2897, 5128: 2897, 416: 2900, 5248: 2897,
+        328: 2900, 6152: 2897, 448: 2900, 2208: 2898,
+        4226: 2897, 4192: 2897, 6272: 2897, 2368: 2898,
+        2128: 2898, 2113: 2898, 2096: 2898, 4176: 2897,
+        2066: 2898 },
+        517: { 128: 2901, 64: 2902, 2: 2906, 4096: 2897,
+        1024: 2899, 32: 2903, 8: 2905, 256: 2900,
+        16: 2904, 2048: 2898 },
+        518: { 128: 2901, 1: 2906, 4096: 2897, 1024: 2899,
+        32: 2903, 8: 2905, 64: 2902, 256: 2900,
+        16: 2904, 2048: 2898 },
+        520: { 7168: 2886, 3073: 2887, 6146: 2886, 1027: 2888,
+        3076: 2887, 4101: 2886, 4102: 2886, 7: 2894,
+        5152: 2886, 4354: 2886, 4228: 2886, 3088: 2887,
+        4113: 2886, 2066: 2887, 19: 2893, 1044: 2888,
+        21: 2893, 22: 2893, 2308: 2887, 1029: 2888,
+        3104: 2887, 1057: 2888, 2082: 2887, 35: 2892,
+        1060: 2888, 37: 2892, 38: 2892, 4144: 2886,
+        5184: 2886, 2320: 2887, 1072: 2888, 49: 2892,
+        50: 2892, 52: 2892, 2116: 2887, 4161: 2886,
+        2114: 2887, 67: 2891, 2065: 2887, 69: 2891,
+        70: 2891, 6208: 2886, 1281: 2888, 224: 2890,
+        2336: 2887, 4384: 2886, 1104: 2888, 81: 2891,
+        82: 2891, 84: 2891, 4416: 2886, 1120: 2888,
+        97: 2891, 98: 2891, 100: 2891, 4129: 2886,
+        1041: 2888, 1282: 2888, 2305: 2887, 4114: 2886,
+        4368: 2886, 112: 2891, 2068: 2887, 4164: 2886,
+        4225: 2886, 2178: 2887, 131: 2890, 1156: 2888,
+        133: 2890, 134: 2890, 6176: 2886, 1168: 2888,
+        145: 2890, 146: 2890, 148: 2890, 196: 2890,
+        2051: 2887, 161: 2890, 162: 2890, 164: 2890,
+        6160: 2886, 5376: 2886, 176: 2890, 1058: 2888,
+        4132: 2886, 1216: 2888, 193: 2890, 194: 2890,
+        5121: 2886, 2081: 2887, 2240: 2887, 4130: 2886,
+        6400: 2886, 208: 2890, 2084: 2887, 1030: 2888,
+        2053: 2887, 4116: 2886, 4099: 2886, 5122: 2886,
+        6145: 2886, 2054: 2887, 3328: 2887, 4353: 2886,
+        2306: 2887, 259: 2889, 1284: 2888, 261: 2889,
+        262: 2889, 1153: 2888, 2208: 2887, 4288: 2886,
+        1154: 2888, 1296: 2888, 273: 2889, 274: 2889,
+        276: 2889, 3200: 2887, 2180: 2887, 5124: 2886,
+        1312: 2888, 289: 2889, 290: 2889, 4356: 2886,
+        292: 2889, 3074: 2887, 304: 2889, 5136: 2886,
+        6148: 2886, 1344: 2888, 321: 2889, 322: 2889,
+        324: 2889, 4256: 2886, 1042: 2888, 336: 2889,
+        2432: 2887, 4162: 2886, 352: 2889, 2192: 2887,
+        2177: 2887, 4240: 2886, 1408: 2888, 385: 2889,
+        386: 2889, 388: 2889, 1089: 2888, 2144: 2887,
+        3136: 2887, 1090: 2888, 400: 2889, 4480: 2886,
+        1092: 2888, 416: 2889, 5248: 2886, 448: 2889,
+        1184: 2888, 4226: 2886, 4192: 2886, 6272: 2886,
+        2368: 2887, 2128: 2887, 2113: 2887, 2096: 2887,
+        4176: 2886 },
+        521: { 32: 2892, 128: 2890, 2: 2895, 4096: 2886,
+        4: 2894, 1024: 2888, 64: 2891, 256: 2889,
+        16: 2893, 2048: 2887 },
+        522: { 128: 2890, 1: 2895, 4096: 2886, 4: 2894,
+        1024: 2888, 32: 2892, 64: 2891, 256: 2889,
+        16: 2893, 2048: 2887 },
+        524: { 128: 2890, 1: 2894, 2: 2894, 4096: 2886,
+        1024: 2888, 32: 2892, 64: 2891, 256: 2889,
+        16: 2893, 2048: 2887 },
+        528: { 7168: 2875, 3073: 2876, 6146: 2875, 1027: 2877,
+        3076: 2876, 4101: 2875, 4102: 2875, 7: 2883,
+        3080: 2876, 1033: 2877, 4106: 2875, 11: 2882,
+        1036: 2877, 13: 2882, 14: 2882, 4228: 2875,
+        4416: 2875, 2051: 2876, 2308: 2876, 2053: 2876,
+        3104: 2876, 1057: 2877, 2082: 2876, 35: 2881,
+        1060: 2877, 37: 2881, 38: 2881, 1064: 2877,
+        41: 2881, 42: 2881, 44: 2881, 2312: 2876,
+        4105: 2875, 1034: 2877, 3136: 2876, 4161: 2875,
+        2114: 2876, 67: 2880, 1092: 2877, 69: 2880,
+        70: 2880, 1096: 2877, 73: 2880, 74: 2880,
+        76: 2880, 224: 2879, 2336: 2876, 4384: 2875,
+        1120: 2877, 97: 2880, 98: 2880, 100: 2880,
+        4129: 2875, 5152: 2875, 104: 2880, 1282: 2877,
+        2305: 2876, 6400: 2875, 4232: 2875, 4164: 2875,
+        4225: 2875, 1154: 2877, 4130: 2875, 1156: 2877,
+        133: 2879, 134: 2879, 6176: 2875, 1160: 2877,
+        137: 2879, 138: 2879, 140: 2879, 196: 2879,
+        1184: 2877, 161: 2879, 3074: 2876, 164: 2879,
+        168: 2879, 5376: 2875, 1029: 2877, 4132: 2875,
+        1216: 2877, 193: 2879, 194: 2879, 5121: 2875,
+        2081: 2876, 200: 2879, 4354: 2875, 2240: 2876,
+        1058: 2877, 5184: 2875, 2084: 2876, 1030: 2877,
+        4099: 2875, 5122: 2875, 6145: 2875, 2088: 2876,
+        4168: 2875, 2054: 2876, 3328: 2876, 4353: 2875,
+        2306: 2876, 259: 2878, 1284: 2877, 261: 2878,
+        262: 2878, 1153: 2877, 1288: 2877, 265: 2878,
+        266: 2878, 268: 2878, 2178: 2876, 131: 2879,
+        2180: 2876, 5124: 2875, 1312: 2877, 289: 2878,
+        290: 2878, 4356: 2875, 292: 2878, 296: 2878,
+        2184: 2876, 4136: 2875, 6148: 2875, 1344: 2877,
+        321: 2878, 322: 2878, 324: 2878, 328: 2878,
+        4256: 2875, 2432: 2876, 2057: 2876, 4288: 2875,
+        352: 2878, 2177: 2876, 3200: 2876, 6208: 2875,
+        2058: 2876, 4360: 2875, 1281: 2877, 1408: 2877,
+        385: 2878, 386: 2878, 388: 2878, 1089: 2877,
+        392: 2878, 2144: 2876, 4162: 2875, 4480: 2875,
+        5128: 2875, 2116: 2876, 416: 2878, 5248: 2875,
+        2060: 2876, 2120: 2876, 6152: 2875, 448: 2878,
+        2208: 2876, 4226: 2875, 4192: 2875, 6272: 2875,
+        162: 2879, 2368: 2876, 1090: 2877, 2113: 2876,
+        4108: 2875 },
+        529: { 32: 2881, 128: 2879, 2: 2884, 4096: 2875,
+        4: 2883, 1024: 2877, 8: 2882, 64: 2880,
+        256: 2878, 2048: 2876 },
+        530: { 128: 2879, 1: 2884, 4096: 2875, 4: 2883,
+        1024: 2877, 32: 2881, 8: 2882, 64: 2880,
+        256: 2878, 2048: 2876 },
+        532: { 128: 2879, 1: 2883, 2: 2883, 4096: 2875,
+        1024: 2877, 32: 2881, 8: 2882, 64: 2880,
+        256: 2878, 2048: 2876 },
+        536: { 32: 2881, 1: 2882, 2: 2882, 4096: 2875,
+        4: 2882, 1024: 2877, 64: 2880, 128: 2879,
+        256: 2878, 2048: 2876 },
+        4640: { 64: 2494, 1: 2495, 2: 2495, 4: 2495,
+        1024: 2491, 8: 2495, 128: 2493, 256: 2492,
+        16: 2495, 2048: 2490 },
+        545: { 128: 2868, 64: 2869, 2: 2873, 4096: 2864,
+        4: 2872, 1024: 2866, 8: 2871, 256: 2867,
+        16: 2870, 2048: 2865 },
+        546: { 128: 2868, 1: 2873, 4096: 2864, 4: 2872,
+        1024: 2866, 8: 2871, 64: 2869, 256: 2867,
+        16: 2870, 2048: 2865 },
+        548: { 128: 2868, 1: 2872, 2: 2872, 4096: 2864,
+        1024: 2866, 8: 2871, 64: 2869, 256: 2867,
+        16: 2870, 2048: 2865 },
+        2064: { 5632: 2666, 5121: 2666, 4610: 2666, 1027: 2667,
+        1540: 2667, 4101: 2666, 4102: 2666, 7: 2674,
+        1544: 2667, 521: 2668, 4106: 2666, 11: 2673,
+        524: 2668, 13: 2673, 14: 2673, 4228: 2666,
+        4416: 2666, 4099: 2666, 4672: 2666, 1284: 2667,
+        517: 2668, 1568: 2667, 1057: 2667, 1058: 2667,
+        35: 2672, 548: 2668, 37: 2672, 38: 2672,
+        552: 2668, 41: 2672, 42: 2672, 44: 2672,
+        1288: 2667, 4105: 2666, 769: 2668, 1034: 2667,
+        1600: 2667, 4161: 2666, 4162: 2666, 67: 2671,
+        580: 2668, 69: 2671, 70: 2671, 584: 2668,
+        73: 2671, 74: 2671, 76: 2671, 4384: 2666,
+        1537: 2667, 4640: 2666, 608: 2668, 97: 2671,
+        98: 2671, 100: 2671, 5152: 2666, 104: 2671,
+        1282: 2667, 515: 2668, 1538: 2667, 4232: 2666,
+        4164: 2666, 4225: 2666, 1154: 2667, 131: 2670,
+        644: 2668, 133: 2670, 134: 2670, 648: 2668,
+        137: 2670, 138: 2670, 140: 2670, 4130: 2666,
+        1096: 2667, 4864: 2666, 672: 2668, 161: 2670,
+        162: 2670, 164: 2670, 168: 2670, 1216: 2667,
+        5376: 2666, 4609: 2666, 1029: 2667, 4132: 2666,
+        704: 2668, 193: 2670, 194: 2670, 196: 2670,
+        4129: 2666, 200: 2670, 518: 2668, 546: 2668,
+        5184: 2666, 1060: 2667, 1030: 2667, 224: 2670,
+        5122: 2666, 4226: 2666, 1064: 2667, 4168: 2666,
+        1792: 2667, 4353: 2666, 770: 2668, 259: 2669,
+        772: 2668, 261: 2669, 262: 2669, 641: 2668,
+        776: 2668, 265: 2669, 266: 2669, 268: 2669,
+        642: 2668, 4612: 2666, 1156: 2667, 5124: 2666,
+        800: 2668, 289: 2669, 290: 2669, 4356: 2666,
+        292: 2669, 296: 2669, 1160: 2667, 1408: 2667,
+        1033: 2667, 4136: 2666, 1664: 2667, 832: 2668,
+        321: 2669, 522: 2668, 324: 2669, 1153: 2667,
+        4256: 2666, 4288: 2666, 352: 2669, 1120: 2667,
+        4360: 2666, 1281: 2667, 896: 2668, 385: 2669,
+        386: 2669, 388: 2669, 4616: 2666, 577: 2668,
+        392: 2669, 578: 2668, 1036: 2667, 4480: 2666,
+        5128: 2666, 1092: 2667, 4736: 2666, 416: 2669,
+        5248: 2666, 1344: 2667, 328: 2669, 448: 2669,
+        1184: 2667, 1089: 2667, 4192: 2666, 322: 2669,
+        1090: 2667, 4108: 2666, 1312: 2667, 545: 2668,
+        4354: 2666 },
+        552: { 128: 2868, 1: 2871, 2: 2871, 4096: 2864,
+        4: 2871, 1024: 2866, 64: 2869, 256: 2867,
+        16: 2870, 2048: 2865 },
+        560: { 128: 2868, 1: 2870, 2: 2870, 4096: 2864,
+        4: 2870, 1024: 2866, 8: 2870, 64: 2869,
+        256: 2867, 2048: 2865 },
+        576: { 7168: 2853, 5121: 2853, 3074: 2854, 1027: 2855,
+        3076: 2854, 4101: 2853, 4102: 2853, 7: 2861,
+        3080: 2854, 4105: 2853, 4106: 2853, 11: 2860,
+        273: 2856, 13: 2860, 14: 2860, 4228: 2853,
+        3088: 2854, 4113: 2853, 4114: 2853, 2051: 2854,
+        1044: 2855, 21: 2859, 22: 2859, 1048: 2855,
+        25: 2859, 26: 2859, 28: 2859, 1029: 2855,
+        3104: 2854, 1057: 2855, 2082: 2854, 35: 2858,
+        1060: 2855, 37: 2858, 38: 2858, 4144: 2853,
+        1064: 2855, 41: 2858, 42: 2858, 44: 2858,
+        5152: 2853, 1072: 2855, 49: 2858, 50: 2858,
+        52: 2858, 1033: 2855, 56: 2858, 2312: 2854,
+        1034: 2855, 1042: 2855, 2065: 2854, 1036: 2855,
+        1281: 2855, 4384: 2853, 2320: 2854, 4129: 2853,
+        1041: 2855, 1282: 2855, 2305: 2854, 2066: 2854,
+        4368: 2853, 19: 2859, 2068: 2854, 4232: 2853,
+        3200: 2854, 4225: 2853, 2178: 2854, 131: 2857,
+        3073: 2854, 133: 2857, 134: 2857, 6176: 2853,
+        1160: 2855, 137: 2857, 138: 2857, 140: 2857,
+        1168: 2855, 145: 2857, 146: 2857, 148: 2857,
+        152: 2857, 1184: 2855, 161: 2857, 162: 2857,
+        164: 2857, 6160: 2853, 168: 2857, 5376: 2853,
+        176: 2857, 1058: 2855, 4132: 2853, 2336: 2854,
+        2308: 2854, 2081: 2854, 4354: 2853, 4130: 2853,
+        6400: 2853, 2084: 2854, 1030: 2855, 2053: 2854,
+        4116: 2853, 4099: 2853, 5122: 2853, 6145: 2853,
+        2088: 2854, 2054: 2854, 3328: 2854, 4353: 2853,
+        2306: 2854, 259: 2856, 1284: 2855, 261: 2856,
+        262: 2856, 2177: 2854, 1288: 2855, 265: 2856,
+        266: 2856, 268: 2856, 4226: 2853, 1296: 2855,
+        6146: 2853, 274: 2856, 276: 2856, 2072: 2854,
+        280: 2856, 1156: 2855, 5124: 2853, 1312: 2855,
+        289: 2856, 290: 2856, 4356: 2853, 292: 2856,
+        296: 2856, 304: 2856, 2184: 2854, 5136: 2853,
+        4136: 2853, 6148: 2853, 1153: 2855, 4256: 2853,
+        2432: 2854, 2057: 2854, 4120: 2853, 2192: 2854,
+        1154: 2855, 4240: 2853, 2058: 2854, 4360: 2853,
+        1408: 1602, 385: 2856, 386: 2856, 388: 2856,
+        392: 2856, 400: 2856, 4480: 2853, 5128: 2853,
+        416: 1603, 5248: 2853, 2060: 2854, 6152: 2853,
+        2208: 2854, 2180: 2854, 6272: 2853, 2096: 2854,
+        4108: 2853 },
+        4192: { 128: 2527, 1: 2528, 2: 2528, 4: 2528,
+        1024: 2524, 8: 2528, 256: 2526, 16: 2528,
+        512: 2525, 2048: 2523 },
+        578: { 128: 2857, 1: 2862, 4096: 2853, 4: 2861,
+        1024: 2855, 32: 2858, 8: 2860, 256: 2856,
+        16: 2859, 2048: 2854 },
+        2065: { 32: 2672, 128: 2670, 2: 2675, 4096: 2666,
+        4: 2674, 1024: 2667, 8: 2673, 64: 2671,
+        256: 2669, 512: 2668 },
+        3088: { 64: 2604, 1: 2606, 2: 2606, 4: 2606,
+        4096: 2600, 32: 2605, 8: 2606, 128: 2603,
+        256: 2602, 512: 2601 },
+        584: { 128: 2857, 1: 2860, 2: 2860, 4096: 2853,
+        4: 2860, 1024: 2855, 32: 2858, 256: 2856,
+        16: 2859, 2048: 2854 },
+        4384: { 64: 2505, 1: 2506, 2: 2506, 4: 2506,
+        1024: 2502, 8: 2506, 128: 2504, 16: 2506,
+        512: 2503, 2048: 2501 },
+        592: { 128: 2857, 1: 2859, 2: 2859, 4096: 2853,
+        4: 2859, 1024: 2855, 32: 2858, 8: 2859,
+        256: 2856, 2048: 2854 },
+        2816: { 32: 2613, 1: 2613, 2: 2613, 4096: 2611,
+        4: 2613, 1024: 2612, 8: 2613, 64: 2613,
+        128: 2613, 16: 2613 },
+        608: { 128: 2857, 1: 2858, 2: 2858, 4096: 2853,
+        4: 2858, 1024: 2855, 8: 2858, 256: 2856,
+        16: 2858, 2048: 2854 },
+        2066: { 128: 2670, 1: 2675, 4096: 2666, 4: 2674,
+        1024: 2667, 32: 2672, 8: 2673, 64: 2671,
+        256: 2669, 512: 2668 },
+        4112: { 3584: 2545, 3073: 2545, 2562: 2545, 1027: 2546,
+        1540: 2546, 517: 2547, 518: 2547, 7: 2553,
+        1544: 2546, 521: 2547, 522: 2547, 11: 2552,
+        524: 2547, 13: 2552, 14: 2552, 2336: 2545,
+        2051: 2545, 2592: 2545, 1284: 2546, 1029: 2546,
+        1568: 2546, 1057: 2546, 2082: 2545, 35: 2551,
+        548: 2547, 37: 2551, 38: 2551, 3104: 2545,
+        552: 2547, 41: 2551, 42: 2551, 44: 2551,
+        1288: 2546, 1033: 2546, 2184: 2545, 769: 2547,
+        1034: 2546, 2116: 2545, 577: 2547, 2114: 2545,
+        67: 2550, 580: 2547, 69: 2550, 70: 2550,
+        584: 2547, 73: 2550, 74: 2550, 76: 2550,
+        1537: 2546, 770: 2547, 2816: 2545, 546: 2547,
+        97: 2550, 98: 2550, 100: 2550, 104: 2550,
+        1282: 2546, 2305: 2545, 3328: 2545, 515: 2547,
+        1538: 2546, 2561: 2545, 2084: 2545, 1664: 2546,
+        641: 2547, 1154: 2546, 131: 2549, 644: 2547,
+        133: 2549, 134: 2549, 648: 2547, 137: 2549,
+        138: 2549, 140: 2549, 672: 2547, 161: 2549,
+        162: 2549, 164: 2549, 168: 2549, 1216: 2546,
+        3080: 2545, 2120: 2545, 704: 2547, 193: 2549,
+        194: 2549, 196: 2549, 2308: 2545, 2081: 2545,
+        200: 2549, 2240: 2545, 1058: 2546, 2564: 2545,
+        1060: 2546, 1030: 2546, 2053: 2545, 3076: 2545,
+        224: 2549, 1064: 2546, 2088: 2545, 2054: 2545,
+        1792: 2546, 1281: 2546, 2306: 2545, 259: 2548,
+        772: 2547, 261: 2548, 262: 2548, 1153: 2546,
+        776: 2547, 265: 2548, 266: 2548, 2208: 2545,
+        268: 2548, 2178: 2545, 1156: 2546, 800: 2547,
+        289: 2548, 290: 2548, 292: 2548, 296: 2548,
+        3074: 2545, 1160: 2546, 1408: 2546, 2312: 2545,
+        832: 2547, 321: 2548, 322: 2548, 324: 2548,
+        2568: 2545, 328: 2548, 2432: 2545, 2057: 2545,
+        642: 2547, 608: 2547, 2688: 2545, 352: 2548,
+        2177: 2545, 1120: 2546, 3200: 2545, 2058: 2545,
+        896: 2547, 385: 2548, 386: 2548, 388: 2548,
+        1089: 2546, 392: 2548, 2144: 2545, 578: 2547,
+        1036: 2546, 1092: 2546, 416: 2548, 2060: 2545,
+        1344: 2546, 1096: 2546, 1600: 2546, 448: 2548,
+        1184: 2546, 2180: 2545, 2368: 2545, 2624: 2545,
+        1090: 2546, 2113: 2545, 3136: 2545, 1312: 2546,
+        545: 2547 },
+        640: { 7168: 2842, 3073: 2843, 5122: 2842, 1027: 2844,
+        3076: 2843, 4101: 2842, 4102: 2842, 7: 2850,
+        3080: 2843, 1033: 2844, 4106: 2842, 11: 2849,
+        1036: 2844, 13: 2849, 14: 2849, 3088: 2843,
+        4113: 2842, 2066: 2843, 4099: 2842, 1044: 2844,
+        21: 2848, 22: 2848, 1048: 2844, 25: 2848,
+        26: 2848, 28: 2848, 2053: 2843, 3104: 2843,
+        2081: 2843, 2082: 2843, 35: 2847, 1041: 2844,
+        37: 2847, 38: 2847, 4144: 2842, 1064: 2844,
+        41: 2847, 42: 2847, 44: 2847, 2320: 2843,
+        1072: 2844, 49: 2847, 50: 2847, 52: 2847,
+        4105: 2842, 56: 2847, 2312: 2843, 1034: 2844,
+        2116: 2843, 4161: 2842, 2114: 2843, 67: 2846,
+        4162: 2842, 69: 2846, 70: 2846, 1096: 2844,
+        73: 2846, 74: 2846, 76: 2846, 4384: 2842,
+        1104: 2844, 81: 2846, 82: 2846, 84: 2846,
+        4416: 2842, 88: 2846, 1120: 2844, 97: 2846,
+        98: 2846, 100: 2846, 4129: 2842, 2065: 2843,
+        104: 2846, 2305: 2843, 4114: 2842, 4368: 2842,
+        112: 2846, 19: 2848, 2068: 2843, 2084: 2843,
+        4164: 2842, 5136: 2842, 6176: 2842, 2306: 2843,
+        2072: 2843, 2051: 2843, 3074: 2843, 6160: 2842,
+        4353: 2842, 5376: 2842, 1058: 2844, 4120: 2842,
+        1029: 2844, 4132: 2842, 2336: 2843, 5121: 2842,
+        2308: 2843, 1057: 2844, 4354: 2842, 4130: 2842,
+        5184: 2842, 1060: 2844, 1030: 2844, 4116: 2842,
+        6145: 2842, 5152: 2842, 2088: 2843, 4168: 2842,
+        2054: 2843, 3328: 1601, 1281: 2844, 1282: 2844,
+        259: 2845, 1284: 2844, 261: 2845, 262: 2845,
+        1288: 2844, 265: 2845, 266: 2845, 268: 2845,
+        1296: 2844, 273: 2845, 274: 2845, 276: 2845,
+        280: 2845, 5124: 2842, 1312: 2844, 289: 2845,
+        290: 2845, 4356: 2842, 292: 2845, 296: 2845,
+        304: 2845, 4136: 2842, 6148: 2842, 1344: 1602,
+        321: 2845, 322: 2845, 324: 2845, 328: 2845,
+        6400: 2842, 1042: 2844, 336: 2845, 2057: 2843,
+        6146: 2842, 352: 1603, 6208: 2842, 2058: 2843,
+        4360: 2842, 2368: 2843, 1089: 2844, 2144: 2843,
+        3136: 2843, 1090: 2844, 5128: 2842, 1092: 2844,
+        2060: 2843, 2120: 2843, 6152: 2842, 4192: 2842,
+        2128: 2843, 2113: 2843, 2096: 2843, 4176: 2842,
+        4108: 2842 },
+        641: { 64: 2846, 32: 2847, 2: 2851, 4096: 2842,
+        4: 2850, 1024: 2844, 8: 2849, 256: 2845,
+        16: 2848, 2048: 2843 },
+        642: { 64: 2846, 1: 2851, 4096: 2842, 4: 2850,
+        1024: 2844, 32: 2847, 8: 2849, 256: 2845,
+        16: 2848, 2048: 2843 },
+        644: { 64: 2846, 1: 2850, 2: 2850, 4096: 2842,
+        1024: 2844, 32: 2847, 8: 2849, 256: 2845,
+        16: 2848, 2048: 2843 },
+        5136: { 64: 2483, 1: 2485, 2: 2485, 4: 2485,
+        2048: 2479, 32: 2484, 8: 2485, 128: 2482,
+        256: 2481, 512: 2480 },
+        648: { 64: 2846, 1: 2849, 2: 2849, 4096: 2842,
+        4: 2849, 1024: 2844, 32: 2847, 256: 2845,
+        16: 2848, 2048: 2843 },
+        656: { 64: 2846, 1: 2848, 2: 2848, 4096: 2842,
+        4: 2848, 1024: 2844, 32: 2847, 8: 2848,
+        256: 2845, 2048: 2843 },
+        3073: { 64: 2604, 32: 2605, 2: 2609, 4: 2608,
+        4096: 2600, 8: 2607, 128: 2603, 256: 2602,
+        16: 2606, 512: 2601 },
+        4864: { 32: 2492, 1: 2492, 2: 2492, 4: 2492,
+        1024: 2491, 8: 2492, 64: 2492, 128: 2492,
+        16: 2492, 2048: 2490 },
+        672: { 64: 2846, 1: 2847, 2: 2847, 4096: 2842,
+        4: 2847, 1024: 2844, 8: 2847, 256: 2845,
+        16: 2847, 2048: 2843 },
+        6160: { 64: 2472, 1: 2474, 2: 2474, 4: 2474,
+        1024: 2468, 32: 2473, 8: 2474, 128: 2471,
+        256: 2470, 512: 2469 },
+        704: { 32: 2846, 1: 2846, 2: 2846, 4096: 2842,
+        4: 2846, 1024: 2844, 8: 2846, 256: 2845,
+        16: 2846, 2048: 2843 },
+        4116: { 128: 2549, 1: 2553, 2: 2553, 1024: 2546,
+        32: 2551, 8: 2552, 64: 2550, 256: 2548,
+        512: 2547, 2048: 2545 },
+        768: { 7168: 1600, 3073: 2832, 3074: 2832, 1027: 2833,
+        3076: 2832, 4101: 2831, 4102: 2831, 7: 2839,
+        3080: 2832, 1033: 2833, 4106: 2831, 11: 2838,
+        1036: 2833, 13: 2838, 14: 2838, 4228: 2831,
+        3088: 2832, 4113: 2831, 2066: 2832, 2051: 2832,
+        1044: 2833, 21: 2837, 22: 2837, 1048: 2833,
+        25: 2837, 26: 2837, 28: 2837, 2053: 2832,
+        3104: 2832, 2081: 2832, 2082: 2832, 35: 2836,
+        1041: 2833, 37: 2836, 38: 2836, 4144: 2831,
+        1064: 2833, 41: 2836, 42: 2836, 44: 2836,
+        5152: 2831, 1072: 2833, 49: 2836, 50: 2836,
+        52: 2836, 4105: 2831, 56: 2836, 1034: 2833,
+        2116: 2832, 4161: 2831, 2114: 2832, 67: 2835,
+        4162: 2831, 69: 2835, 70: 2835, 1096: 2833,
+        73: 2835, 74: 2835, 76: 2835, 1104: 2833,
+        81: 2835, 82: 2835, 84: 2835, 88: 2835,
+        1120: 2833, 97: 2835, 98: 2835, 100: 2835,
+        4129: 2831, 2065: 2832, 104: 2835, 4114: 2831,
+        112: 2835, 19: 2837, 2068: 2832, 4232: 2831,
+        2084: 2832, 4164: 2831, 1153: 2833, 1154: 2833,
+        131: 2834, 1156: 2833, 133: 2834, 134: 2834,
+        6176: 2831, 1160: 2833, 137: 2834, 138: 2834,
+        140: 2834, 1168: 2833, 145: 2834, 146: 2834,
+        148: 2834, 152: 2834, 196: 2834, 1184: 2833,
+        161: 2834, 162: 2834, 164: 2834, 6160: 2831,
+        168: 2834, 176: 2834, 1058: 2833, 1029: 2833,
+        4132: 2831, 1216: 1602, 193: 2834, 194: 2834,
+        5121: 2831, 1057: 2833, 200: 2834, 2240: 2832,
+        4130: 2831, 5184: 2831, 208: 2834, 1060: 2833,
+        1030: 2833, 4116: 2831, 4099: 2831, 5122: 2831,
+        6145: 2831, 2088: 2832, 4168: 2831, 2054: 2832,
+        3200: 1601, 6146: 2831, 4225: 2831, 4288: 2831,
+        4226: 2831, 2072: 2832, 2180: 2832, 5124: 2831,
+        2096: 2832, 2184: 2832, 5136: 2831, 4136: 2831,
+        6148: 2831, 224: 1603, 4256: 2831, 1042: 2833,
+        2057: 2832, 4120: 2831, 2192: 2832, 2177: 2832,
+        4240: 2831, 6208: 2831, 2058: 2832, 3136: 2832,
+        2178: 2832, 1089: 2833, 2144: 2832, 1090: 2833,
+        5128: 2831, 1092: 2833, 5248: 2831, 2060: 2832,
+        2120: 2832, 6152: 2831, 2208: 2832, 4192: 2831,
+        6272: 2831, 2128: 2832, 2113: 2832, 4176: 2831,
+        4108: 2831 },
+        769: { 64: 2835, 32: 2836, 2: 2840, 4096: 2831,
+        4: 2839, 1024: 2833, 8: 2838, 128: 2834,
+        16: 2837, 2048: 2832 },
+        770: { 64: 2835, 1: 2840, 4096: 2831, 4: 2839,
+        1024: 2833, 32: 2836, 8: 2838, 128: 2834,
+        16: 2837, 2048: 2832 },
+        772: { 64: 2835, 1: 2839, 2: 2839, 4096: 2831,
+        1024: 2833, 32: 2836, 8: 2838, 128: 2834,
+        16: 2837, 2048: 2832 },
+        2177: { 64: 2637, 32: 2638, 2: 2642, 4096: 2633,
+        4: 2641, 1024: 2634, 8: 2640, 256: 2636,
+        16: 2639, 512: 2635 },
+        776: { 64: 2835, 1: 2838, 2: 2838, 4096: 2831,
+        4: 2838, 1024: 2833, 32: 2836, 128: 2834,
+        16: 2837, 2048: 2832 },
+        4226: { 64: 2516, 1: 2521, 4: 2520, 1024: 2513,
+        32: 2517, 8: 2519, 256: 2515, 16: 2518,
+        512: 2514, 2048: 2512 },
+        784: { 64: 2835, 1: 2837, 2: 2837, 4096: 2831,
+        4: 2837, 1024: 2833, 32: 2836, 8: 2837,
+        128: 2834, 2048: 2832 },
+        2072: { 32: 2672, 1: 2673, 2: 2673, 4096: 2666,
+        4: 2673, 1024: 2667, 64: 2671, 128: 2670,
+        256: 2669, 512: 2668 },
+        132: { 3584: 3063, 3073: 3063, 5122: 3062, 1027: 3064,
+        4353: 3062, 1544: 3064, 521: 3065, 4106: 3062,
+        11: 3070, 3074: 3063, 1296: 3064, 2336: 3063,
+        1552: 3064, 4113: 3062, 4114: 3062, 4099: 3062,
+        529: 3065, 2592: 3063, 1048: 3064, 25: 3069,
+        26: 3069, 1568: 3064, 1057: 3064, 2082: 3063,
+        35: 3068, 1041: 3064, 4144: 3062, 552: 3065,
+        41: 3068, 42: 3068, 2320: 3063, 560: 3065,
+        49: 3068, 50: 3068, 2576: 3063, 4105: 3062,
+        56: 3068, 522: 3065, 1600: 3064, 577: 3065,
+        2114: 3063, 67: 3067, 4162: 3062, 3088: 3063,
+        584: 3065, 73: 3067, 74: 3067, 1281: 3064,
+        4384: 3062, 592: 3065, 81: 3067, 82: 3067,
+        1537: 3064, 4416: 3062, 4640: 3062, 88: 3067,
+        2816: 3063, 608: 3065, 97: 3067, 98: 3067,
+        4129: 3062, 2065: 3063, 104: 3067, 1282: 3064,
+        2305: 3063, 1042: 3064, 4368: 3062, 515: 3065,
+        1538: 3064, 19: 3069, 2561: 3063, 4624: 3062,
+        4672: 3062, 4130: 3062, 5136: 3062, 6176: 3062,
+        2306: 3063, 536: 3065, 2562: 3063, 4864: 3062,
+        2051: 3063, 112: 3067, 6160: 3062, 5376: 3062,
+        1058: 3064, 3080: 3063, 4120: 3062, 4609: 3062,
+        5632: 3062, 2120: 3063, 1312: 3064, 5121: 3062,
+        2081: 3063, 4354: 3062, 546: 3065, 5184: 3062,
+        4610: 3062, 3328: 3063, 6656: 3062, 6145: 3062,
+        7168: 3062, 5152: 3062, 1064: 3064, 2088: 3063,
+        4168: 3062, 530: 3065, 1792: 3064, 769: 3065,
+        770: 3065, 259: 3066, 776: 3065, 265: 3066,
+        266: 3066, 784: 3065, 273: 3066, 274: 3066,
+        2072: 3063, 280: 3066, 1288: 3064, 800: 3065,
+        289: 3066, 290: 3066, 296: 3066, 304: 3066,
+        1033: 3064, 4136: 3062, 2312: 3063, 832: 3065,
+        321: 3066, 322: 3066, 2568: 3063, 328: 3066,
+        6400: 3062, 336: 3066, 1034: 3064, 2057: 3063,
+        6146: 3062, 352: 3066, 1120: 3064, 6208: 3062,
+        2058: 3063, 3104: 3063, 4360: 3062, 1344: 3064,
+        4616: 3062, 4161: 3062, 2144: 3063, 3136: 3063,
+        578: 3065, 5128: 3062, 2128: 3063, 1096: 3064,
+        6152: 3062, 1089: 3064, 1072: 3064, 4192: 3062,
+        2368: 3063, 2624: 3063, 1104: 3064, 1090: 3064,
+        2113: 3063, 2096: 3063, 4176: 3062, 2066: 3063,
+        545: 3065 },
+        800: { 64: 2835, 1: 2836, 2: 2836, 4096: 2831,
+        4: 2836, 1024: 2833, 8: 2836, 128: 2834,
+        16: 2836, 2048: 2832 },
+        2051: { 128: 2703, 64: 2704, 4096: 2699, 4: 2708,
+        1024: 2700, 32: 2705, 8: 2707, 256: 2702,
+        16: 2706, 512: 2701 },
+        4232: { 64: 2516, 1: 2519, 2: 2519, 4: 2519,
+        1024: 2513, 32: 2517, 256: 2515, 16: 2518,
+        512: 2514, 2048: 2512 },
+        832: { 32: 2835, 1: 2835, 2: 2835, 4096: 2831,
+        4: 2835, 1024: 2833, 8: 2835, 128: 2834,
+        16: 2835, 2048: 2832 },
+        4256: { 64: 2516, 1: 2517, 2: 2517, 4: 2517,
+        1024: 2513, 8: 2517, 256: 2515, 16: 2517,
+        512: 2514, 2048: 2512 },
+        4120: { 32: 2551, 1: 2552, 2: 2552, 4: 2552,
+        1024: 2546, 64: 2550, 128: 2549, 256: 2548,
+        512: 2547, 2048: 2545 },
+        4240: { 64: 2516, 1: 2518, 2: 2518, 4: 2518,
+        1024: 2513, 32: 2517, 8: 2518, 256: 2515,
+        512: 2514, 2048: 2512 },
+        896: { 32: 2834, 1: 2834, 2: 2834, 4096: 2831,
+        4: 2834, 1024: 2833, 8: 2834, 64: 2834,
+        16: 2834, 2048: 2832 },
+        2144: { 128: 2648, 1: 2649, 2: 2649, 4096: 2644,
+        4: 2649, 1024: 2645, 8: 2649, 256: 2647,
+        16: 2649, 512: 2646 },
+        4736: { 32: 2493, 1: 2493, 2: 2493, 4: 2493,
+        1024: 2491, 8: 2493, 64: 2493, 256: 2492,
+        16: 2493, 2048: 2490 },
+        2208: { 64: 2637, 1: 2638, 2: 2638, 4096: 2633,
+        4: 2638, 1024: 2634, 8: 2638, 256: 2636,
+        16: 2638, 512: 2635 },
+        162: { 256: 3033, 1: 3038, 4096: 3029, 4: 3037,
+        1024: 3031, 8: 3036, 64: 3034, 16: 3035,
+        512: 3032, 2048: 3030 },
+        4098: { 3584: 2578, 3073: 2578, 1540: 2579, 517: 2580,
+        1537: 2579, 1544: 2579, 521: 2580, 1036: 2579,
+        13: 1609, 1296: 2579, 2336: 2578, 1552: 2579,
+        1041: 2579, 2068: 2578, 21: 2585, 2592: 2578,
+        536: 2580, 25: 2585, 28: 2585, 1029: 2579,
+        1568: 2579, 1057: 2579, 548: 2580, 37: 2584,
+        3104: 2578, 552: 2580, 41: 2584, 44: 2584,
+        2320: 2578, 560: 2580, 49: 2584, 52: 2584,
+        2576: 2578, 1033: 2579, 56: 2584, 2184: 2578,
+        769: 2580, 2116: 2578, 577: 2580, 580: 2580,
+        69: 2583, 3088: 2578, 584: 2580, 2060: 2578,
+        76: 2583, 592: 2580, 81: 2583, 84: 2583,
+        88: 2583, 2816: 2578, 608: 2580, 97: 2583,
+        100: 2583, 529: 2580, 2065: 2578, 104: 2583,
+        2305: 2578, 3328: 2578, 112: 2583, 2561: 2578,
+        532: 2580, 1044: 2579, 2084: 2578, 1664: 2579,
+        641: 2580, 644: 2580, 133: 2582, 648: 2580,
+        137: 2582, 140: 2582, 656: 2580, 145: 2582,
+        148: 2582, 152: 2582, 672: 2580, 161: 2582,
+        164: 2582, 1284: 2579, 168: 2582, 1216: 2579,
+        176: 2582, 2120: 2578, 704: 2580, 193: 2582,
+        196: 2582, 2308: 2578, 2081: 2578, 200: 2582,
+        2240: 2578, 2564: 2578, 208: 2582, 1060: 2579,
+        2053: 2578, 3076: 2578, 224: 2582, 1064: 2579,
+        1048: 2579, 2088: 2578, 1792: 2579, 1281: 2579,
+        772: 2580, 261: 2581, 1153: 2579, 776: 2580,
+        265: 2581, 2208: 2578, 268: 2581, 784: 2580,
+        273: 2581, 276: 2581, 2072: 2578, 280: 2581,
+        1156: 2579, 1288: 2579, 800: 2580, 289: 2581,
+        292: 2581, 296: 2581, 2192: 2578, 304: 2581,
+        1160: 2579, 1408: 2579, 2312: 2578, 832: 2580,
+        321: 2581, 324: 2581, 2568: 2578, 328: 2581,
+        336: 2581, 2432: 2578, 2057: 2578, 3080: 2578,
+        2688: 2578, 352: 2581, 1168: 2579, 2177: 2578,
+        1120: 2579, 3200: 2578, 524: 2580, 896: 2580,
+        385: 2581, 388: 2581, 1089: 2579, 392: 2581,
+        2144: 2578, 400: 2581, 1092: 2579, 416: 2581,
+        2128: 2578, 1344: 2579, 1096: 2579, 73: 2583,
+        1600: 2579, 448: 2581, 1184: 2579, 2180: 2578,
+        1072: 2579, 2368: 2578, 2624: 2578, 1104: 2579,
+        2113: 2578, 2096: 2578, 3136: 2578, 1312: 2579,
+        545: 2580 },
+        164: { 256: 3033, 1: 3037, 2: 3037, 4096: 3029,
+        1024: 3031, 8: 3036, 64: 3034, 16: 3035,
+        512: 3032, 2048: 3030 },
+        1056: { 6656: 2765, 4609: 2765, 6146: 2765, 2051: 2766,
+        2564: 2766, 4101: 2765, 4102: 2765, 7: 2773,
+        2568: 2766, 521: 2767, 4106: 2765, 11: 2772,
+        524: 2767, 13: 2772, 14: 2772, 4228: 2765,
+        2576: 2766, 4113: 2765, 4114: 2765, 4099: 2765,
+        529: 2767, 21: 2771, 22: 2771, 536: 2767,
+        25: 2771, 26: 2771, 28: 2771, 517: 2767,
+        518: 2767, 2312: 2766, 530: 2767, 4105: 2765,
+        522: 2767, 2116: 2766, 4161: 2765, 2114: 2766,
+        67: 2770, 4162: 2765, 69: 2770, 70: 2770,
+        584: 2767, 73: 2770, 74: 2770, 76: 2770,
+        592: 2767, 81: 2770, 82: 2770, 84: 2770,
+        4416: 2765, 88: 2770, 770: 2767, 2320: 2766,
+        2065: 2766, 2305: 2766, 2066: 2766, 4368: 2765,
+        515: 2767, 19: 2771, 2561: 2766, 4624: 2765,
+        532: 2767, 4232: 2765, 4672: 2765, 4164: 2765,
+        4225: 2765, 2178: 2766, 131: 2769, 644: 2767,
+        133: 2769, 134: 2769, 648: 2767, 137: 2769,
+        138: 2769, 140: 2769, 656: 2767, 145: 2769,
+        146: 2769, 148: 2769, 152: 2769, 2068: 2766,
+        6160: 2765, 4353: 2765, 704: 2767, 193: 2769,
+        194: 2769, 196: 2769, 2308: 2766, 200: 2769,
+        4354: 2765, 2240: 2766, 6400: 2765, 208: 2769,
+        4610: 2765, 2053: 2766, 2562: 2766, 4116: 2765,
+        6145: 2765, 4168: 2765, 2054: 2766, 2816: 2766,
+        769: 2767, 2306: 2766, 259: 2768, 772: 2767,
+        261: 2768, 262: 2768, 641: 2767, 776: 2767,
+        265: 2768, 266: 2768, 268: 2768, 642: 2767,
+        4612: 2765, 784: 2767, 273: 2768, 274: 2768,
+        276: 2768, 2072: 2766, 280: 2768, 2180: 2766,
+        4864: 2765, 4356: 2765, 2184: 2766, 6148: 2765,
+        832: 2767, 321: 2768, 322: 2768, 324: 2768,
+        328: 2768, 336: 2768, 2432: 2766, 2057: 2766,
+        4120: 2765, 2688: 2766, 4288: 2765, 2192: 2766,
+        2177: 2766, 4240: 2765, 6208: 2765, 2058: 2766,
+        4360: 2765, 896: 2767, 385: 2768, 386: 2768,
+        388: 2768, 4616: 2765, 577: 2767, 392: 2768,
+        578: 2767, 400: 2768, 4480: 2765, 580: 2767,
+        4736: 2765, 2060: 2766, 2120: 2766, 6152: 2765,
+        448: 2768, 4226: 2765, 6272: 2765, 2368: 2766,
+        2624: 2766, 2128: 2766, 2113: 2766, 4176: 2765,
+        4108: 2765 },
+        3072: { 4609: 2600, 4610: 2600, 4099: 2600, 4612: 2600,
+        4101: 2600, 4102: 2600, 7: 2608, 4616: 2600,
+        4105: 2600, 4106: 2600, 11: 2607, 524: 2601,
+        13: 2607, 14: 2607, 4624: 2600, 4113: 2600,
+        4114: 2600, 515: 2601, 532: 2601, 21: 2606,
+        22: 2606, 536: 2601, 25: 2606, 26: 2606,
+        28: 2606, 517: 2601, 4640: 2600, 545: 2601,
+        546: 2601, 35: 2605, 548: 2601, 37: 2605,
+        38: 2605, 4144: 2600, 552: 2601, 41: 2605,
+        42: 2605, 44: 2605, 560: 2601, 49: 2605,
+        50: 2605, 52: 2605, 521: 2601, 56: 2605,
+        522: 2601, 4672: 2600, 4161: 2600, 4162: 2600,
+        67: 2604, 580: 2601, 69: 2604, 70: 2604,
+        584: 2601, 73: 2604, 74: 2604, 76: 2604,
+        4384: 2600, 592: 2601, 81: 2604, 82: 2604,
+        84: 2604, 4416: 2600, 88: 2604, 608: 2601,
+        97: 2604, 98: 2604, 100: 2604, 529: 2601,
+        104: 2604, 530: 2601, 4368: 2600, 112: 2604,
+        19: 2606, 4116: 2600, 4736: 2600, 4225: 2600,
+        642: 2601, 131: 2603, 644: 2601, 133: 2603,
+        134: 2603, 648: 2601, 137: 2603, 138: 2603,
+        140: 2603, 656: 2601, 145: 2603, 146: 2603,
+        148: 2603, 152: 2603, 672: 2601, 161: 2603,
+        162: 2603, 164: 2603, 168: 2603, 4353: 2600,
+        176: 2603, 704: 2601, 193: 2603, 194: 2603,
+        196: 2603, 4129: 2600, 200: 2603, 518: 2601,
+        4130: 2600, 208: 2603, 4132: 2600, 224: 2603,
+        4136: 2600, 4864: 1600, 769: 2601, 770: 2601,
+        259: 2602, 772: 2601, 261: 2602, 262: 2602,
+        641: 2601, 776: 2601, 265: 2602, 266: 2602,
+        268: 2602, 4226: 2600, 784: 2601, 273: 2602,
+        274: 2602, 276: 2602, 280: 2602, 4228: 2600,
+        800: 2601, 289: 2602, 290: 2602, 4356: 2600,
+        292: 2602, 296: 2602, 304: 2602, 4232: 2600,
+        832: 2601, 321: 2602, 322: 2602, 324: 2602,
+        328: 2602, 336: 2602, 4120: 2600, 4288: 2600,
+        352: 2602, 4240: 2600, 4360: 2600, 896: 1601,
+        385: 2602, 386: 2602, 388: 2602, 577: 2601,
+        392: 2602, 578: 2601, 400: 2602, 4480: 2600,
+        4164: 2600, 416: 2602, 4168: 2600, 448: 2602,
+        4256: 2600, 4192: 2600, 4176: 2600, 4108: 2600,
+        4354: 2600 },
+        2560: { 5121: 2611, 5122: 2611, 1027: 2612, 5124: 2611,
+        4101: 2611, 4102: 2611, 7: 2619, 5128: 2611,
+        4105: 2611, 4106: 2611, 11: 2618, 1036: 2612,
+        13: 2618, 14: 2618, 5136: 2611, 4113: 2611,
+        4114: 2611, 4099: 2611, 1044: 2612, 21: 2617,
+        22: 2617, 1048: 2612, 25: 2617, 26: 2617,
+        28: 2617, 1029: 2612, 5152: 2611, 1057: 2612,
+        1058: 2612, 35: 2616, 1060: 2612, 37: 2616,
+        38: 2616, 4144: 2611, 1064: 2612, 41: 2616,
+        42: 2616, 44: 2616, 1072: 2612, 49: 2616,
+        50: 2616, 52: 2616, 1033: 2612, 56: 2616,
+        1034: 2612, 5184: 2611, 4161: 2611, 4162: 2611,
+        67: 2615, 1092: 2612, 69: 2615, 70: 2615,
+        1096: 2612, 73: 2615, 74: 2615, 76: 2615,
+        4384: 2611, 1104: 2612, 81: 2615, 82: 2615,
+        84: 2615, 4416: 2611, 88: 2615, 1120: 2612,
+        97: 2615, 98: 2615, 100: 2615, 1041: 2612,
+        104: 2615, 1042: 2612, 4368: 2611, 112: 2615,
+        19: 2617, 4116: 2611, 5248: 2611, 4225: 2611,
+        1154: 2612, 131: 2614, 1156: 2612, 133: 2614,
+        134: 2614, 1160: 2612, 137: 2614, 138: 2614,
+        140: 2614, 1168: 2612, 145: 2614, 146: 2614,
+        148: 2614, 152: 2614, 1184: 2612, 161: 2614,
+        162: 2614, 164: 2614, 168: 2614, 176: 2614,
+        1216: 2612, 193: 2614, 194: 2614, 196: 2614,
+        4129: 2611, 200: 2614, 4354: 2611, 4130: 2611,
+        208: 2614, 4132: 2611, 1030: 2612, 224: 2614,
+        4136: 2611, 5376: 1600, 4353: 2611, 1282: 2612,
+        259: 2613, 1284: 2612, 261: 2613, 262: 2613,
+        1153: 2612, 1288: 2612, 265: 2613, 266: 2613,
+        268: 2613, 4226: 2611, 1296: 2612, 273: 2613,
+        274: 2613, 276: 2613, 280: 2613, 4228: 2611,
+        1312: 2612, 289: 2613, 290: 2613, 4356: 2611,
+        292: 2613, 296: 2613, 304: 2613, 4232: 2611,
+        1344: 2612, 321: 2613, 322: 2613, 324: 2613,
+        328: 2613, 336: 2613, 4120: 2611, 4288: 2611,
+        352: 2613, 4240: 2611, 4360: 2611, 1281: 2612,
+        1408: 1601, 385: 2613, 386: 2613, 388: 2613,
+        1089: 2612, 392: 2613, 1090: 2612, 400: 2613,
+        4480: 2611, 4164: 2611, 416: 2613, 4168: 2611,
+        448: 2613, 4256: 2611, 4192: 2611, 4176: 2611,
+        4108: 2611 },
+        1026: { 6656: 2809, 4609: 2809, 4612: 2809, 4101: 2809,
+        6145: 2809, 2568: 2810, 4105: 2809, 2060: 2810,
+        13: 2817, 2336: 2810, 2576: 2810, 4113: 2809,
+        2068: 2810, 21: 2816, 536: 2811, 2564: 2810,
+        28: 2816, 517: 2811, 2592: 2810, 2081: 2810,
+        4132: 2809, 37: 2815, 4144: 2809, 552: 2811,
+        41: 2815, 44: 2815, 2320: 2810, 560: 2811,
+        49: 2815, 52: 2815, 521: 2811, 56: 2815,
+        2312: 2810, 2116: 2810, 4161: 2809, 4164: 2809,
+        69: 2814, 4288: 2809, 584: 2811, 73: 2814,
+        76: 2814, 4384: 2809, 592: 2811, 81: 2814,
+        84: 2814, 4416: 2809, 4640: 2809, 88: 2814,
+        608: 2811, 97: 2814, 100: 2814, 529: 2811,
+        2065: 2810, 104: 2814, 2305: 2810, 4368: 2809,
+        112: 2814, 2561: 2810, 4624: 2809, 532: 2811,
+        4232: 2809, 4672: 2809, 2084: 2810, 2688: 2810,
+        4225: 2809, 4228: 2809, 133: 2813, 6176: 2809,
+        648: 2811, 137: 2813, 140: 2813, 656: 2811,
+        145: 2813, 148: 2813, 772: 2811, 25: 2816,
+        152: 2813, 4864: 2809, 672: 2811, 161: 2813,
+        164: 2813, 6160: 2809, 168: 2813, 4353: 2809,
+        176: 2813, 704: 2811, 193: 2813, 196: 2813,
+        2308: 2810, 4129: 2809, 200: 2813, 2240: 2810,
+        6400: 2809, 208: 2813, 548: 2811, 2053: 2810,
+        4116: 2809, 224: 2813, 2088: 2810, 4168: 2809,
+        2816: 2810, 769: 2811, 4356: 2809, 261: 2812,
+        641: 2811, 776: 2811, 265: 2812, 268: 2812,
+        784: 2811, 273: 2812, 276: 2812, 2072: 2810,
+        280: 2812, 644: 2811, 800: 2811, 289: 2812,
+        292: 2812, 296: 2812, 304: 2812, 2184: 2810,
+        4136: 2809, 6148: 2809, 832: 2811, 321: 2812,
+        324: 2812, 328: 2812, 4256: 2809, 336: 2812,
+        2432: 2810, 2057: 2810, 4120: 2809, 352: 2812,
+        2192: 2810, 2177: 2810, 4240: 2809, 6208: 2809,
+        4360: 2809, 524: 2811, 896: 2811, 385: 2812,
+        388: 2812, 4616: 2809, 577: 2811, 392: 2812,
+        2144: 2810, 400: 2812, 4480: 2809, 580: 2811,
+        4736: 2809, 416: 2812, 2120: 2810, 6152: 2809,
+        448: 2812, 2208: 2810, 2180: 2810, 4192: 2809,
+        6272: 2809, 2368: 2810, 2624: 2810, 2128: 2810,
+        2113: 2810, 2096: 2810, 4176: 2809, 4108: 2809,
+        545: 2811 },
+        1027: { 128: 2813, 64: 2814, 4096: 2809, 4: 2818,
+        2048: 2810, 32: 2815, 8: 2817, 256: 2812,
+        16: 2816, 512: 2811 },
+        1028: { 6656: 2798, 4609: 2798, 4610: 2798, 2051: 2799,
+        769: 2800, 2568: 2799, 4105: 2798, 4106: 2798,
+        11: 2806, 6146: 2798, 2336: 2799, 2576: 2799,
+        4113: 2798, 4114: 2798, 4099: 2798, 536: 2800,
+        25: 2805, 26: 2805, 2592: 2799, 2081: 2799,
+        2082: 2799, 35: 2804, 4144: 2798, 552: 2800,
+        41: 2804, 42: 2804, 2320: 2799, 560: 2800,
+        49: 2804, 50: 2804, 521: 2800, 56: 2804,
+        522: 2800, 2624: 2799, 4161: 2798, 2114: 2799,
+        67: 2803, 2065: 2799, 584: 2800, 73: 2803,
+        74: 2803, 4384: 2798, 592: 2800, 81: 2803,
+        82: 2803, 4416: 2798, 4640: 2798, 88: 2803,
+        770: 2800, 546: 2800, 97: 2803, 98: 2803,
+        529: 2800, 104: 2803, 2305: 2799, 2066: 2799,
+        4368: 2798, 515: 2800, 19: 2805, 2561: 2799,
+        4624: 2798, 4232: 2798, 4672: 2798, 2688: 2799,
+        4225: 2798, 2178: 2799, 131: 2802, 6176: 2798,
+        648: 2800, 137: 2802, 138: 2802, 656: 2800,
+        145: 2802, 146: 2802, 152: 2802, 4864: 2798,
+        672: 2800, 161: 2802, 162: 2802, 6160: 2798,
+        168: 2802, 176: 2802, 4120: 2798, 608: 2800,
+        704: 2800, 193: 2802, 194: 2802, 4129: 2798,
+        200: 2802, 4354: 2798, 2240: 2799, 4130: 2798,
+        6400: 2798, 208: 2802, 2562: 2799, 224: 2802,
+        6145: 2798, 2088: 2799, 4168: 2798, 530: 2800,
+        2816: 2799, 4353: 2798, 2306: 2799, 259: 2801,
+        641: 2800, 776: 2800, 265: 2801, 266: 2801,
+        4288: 2798, 4226: 2798, 784: 2800, 273: 2801,
+        274: 2801, 2072: 2799, 280: 2801, 800: 2800,
+        289: 2801, 290: 2801, 296: 2801, 112: 2803,
+        304: 2801, 2184: 2799, 4136: 2798, 2312: 2799,
+        832: 2800, 321: 2801, 322: 2801, 328: 2801,
+        4256: 2798, 336: 2801, 2432: 2799, 2057: 2799,
+        642: 2800, 4162: 2798, 352: 2801, 2192: 2799,
+        2177: 2799, 4240: 2798, 6208: 2798, 2058: 2799,
+        4360: 2798, 896: 2800, 385: 2801, 386: 2801,
+        4616: 2798, 577: 2800, 392: 2801, 2144: 2799,
+        578: 2800, 400: 2801, 4480: 2798, 4736: 2798,
+        416: 2801, 2120: 2799, 6152: 2798, 448: 2801,
+        2208: 2799, 4192: 2798, 6272: 2798, 2368: 2799,
+        2128: 2799, 2113: 2799, 2096: 2799, 4176: 2798,
+        545: 2800 },
+        1029: { 128: 2802, 64: 2803, 2: 2807, 4096: 2798,
+        2048: 2799, 32: 2804, 8: 2806, 256: 2801,
+        16: 2805, 512: 2800 },
+        1030: { 128: 2802, 1: 2807, 4096: 2798, 2048: 2799,
+        32: 2804, 8: 2806, 64: 2803, 256: 2801,
+        16: 2805, 512: 2800 },
+        2561: { 64: 2615, 32: 2616, 2: 2620, 4096: 2611,
+        4: 2619, 1024: 2612, 8: 2618, 128: 2614,
+        256: 2613, 16: 2617 },
+        3080: { 64: 2604, 1: 2607, 2: 2607, 4: 2607,
+        4096: 2600, 32: 2605, 128: 2603, 256: 2602,
+        16: 2606, 512: 2601 },
+        1033: { 32: 2793, 128: 2791, 2: 2796, 4096: 2787,
+        4: 2795, 2048: 2788, 64: 2792, 256: 2790,
+        16: 2794, 512: 2789 },
+        1034: { 128: 2791, 1: 2796, 4096: 2787, 4: 2795,
+        2048: 2788, 32: 2793, 64: 2792, 256: 2790,
+        16: 2794, 512: 2789 },
+        1036: { 128: 2791, 1: 2795, 2: 2795, 4096: 2787,
+        2048: 2788, 32: 2793, 64: 2792, 256: 2790,
+        16: 2794, 512: 2789 },
+        4610: { 64: 2494, 1: 2499, 4: 2498, 1024: 2491,
+        32: 2495, 8: 2497, 128: 2493, 256: 2492,
+        16: 2496, 2048: 2490 },
+        1040: { 6656: 2776, 4609: 2776, 6146: 2776, 2051: 2777,
+        2564: 2777, 4101: 2776, 4102: 2776, 7: 2784,
+        2568: 2777, 521: 2778, 4106: 2776, 11: 2783,
+        524: 2778, 13: 2783, 14: 2783, 4228: 2776,
+        4416: 2776, 4099: 2776, 4672: 2776, 2308: 2777,
+        517: 2778, 2592: 2777, 2081: 2777, 2082: 2777,
+        35: 2782, 548: 2778, 37: 2782, 38: 2782,
+        552: 2778, 41: 2782, 42: 2782, 44: 2782,
+        2312: 2777, 4105: 2776, 769: 2778, 2058: 2777,
+        2624: 2777, 4161: 2776, 2114: 2777, 67: 2781,
+        580: 2778, 69: 2781, 70: 2781, 584: 2778,
+        73: 2781, 74: 2781, 522: 2778, 76: 2781,
+        2336: 2777, 4384: 2776, 4640: 2776, 770: 2778,
+        546: 2778, 97: 2781, 98: 2781, 100: 2781,
+        104: 2781, 2305: 2777, 515: 2778, 2561: 2777,
+        4232: 2776, 4164: 2776, 4225: 2776, 4226: 2776,
+        131: 2780, 644: 2778, 133: 2780, 134: 2780,
+        6176: 2776, 648: 2778, 137: 2780, 138: 2780,
+        140: 2780, 2562: 2777, 4864: 2776, 672: 2778,
+        161: 2780, 162: 2780, 164: 2780, 168: 2780,
+        4132: 2776, 704: 2778, 193: 2780, 194: 2780,
+        196: 2780, 4129: 2776, 200: 2780, 518: 2778,
+        2240: 2777, 4130: 2776, 6400: 2776, 4610: 2776,
+        2084: 2777, 2053: 2777, 224: 2780, 6145: 2776,
+        2088: 2777, 4168: 2776, 2054: 2777, 2816: 2777,
+        4353: 2776, 2306: 2777, 259: 2779, 772: 2778,
+        261: 2779, 262: 2779, 641: 2778, 776: 2778,
+        265: 2779, 266: 2779, 268: 2779, 2178: 2777,
+        4612: 2776, 2180: 2777, 800: 2778, 289: 2779,
+        290: 2779, 4356: 2776, 292: 2779, 296: 2779,
+        2184: 2777, 4136: 2776, 6148: 2776, 832: 2778,
+        321: 2779, 322: 2779, 324: 2779, 328: 2779,
+        4256: 2776, 2432: 2777, 2057: 2777, 642: 2778,
+        608: 2778, 2688: 2777, 4288: 2776, 352: 2779,
+        2177: 2777, 6208: 2776, 4360: 2776, 896: 2778,
+        385: 2779, 386: 2779, 388: 2779, 4616: 2776,
+        577: 2778, 392: 2779, 2144: 2777, 4162: 2776,
+        4480: 2776, 2116: 2777, 4736: 2776, 416: 2779,
+        2060: 2777, 2120: 2777, 6152: 2776, 448: 2779,
+        2208: 2777, 4192: 2776, 6272: 2776, 2368: 2777,
+        578: 2778, 2113: 2777, 4108: 2776, 545: 2778,
+        4354: 2776 },
+        1041: { 32: 2782, 128: 2780, 2: 2785, 4096: 2776,
+        4: 2784, 2048: 2777, 8: 2783, 64: 2781,
+        256: 2779, 512: 2778 },
+        1042: { 128: 2780, 1: 2785, 4096: 2776, 4: 2784,
+        2048: 2777, 32: 2782, 8: 2783, 64: 2781,
+        256: 2779, 512: 2778 },
+        1044: { 128: 2780, 1: 2784, 2: 2784, 4096: 2776,
+        2048: 2777, 32: 2782, 8: 2783, 64: 2781,
+        256: 2779, 512: 2778 },
+        1048: { 32: 2782, 1: 2783, 2: 2783, 4096: 2776,
+        4: 2783, 2048: 2777, 64: 2781, 128: 2780,
+        256: 2779, 512: 2778 },
+        2564: { 64: 2615, 1: 2619, 2: 2619, 4096: 2611,
+        1024: 2612, 32: 2616, 8: 2618, 128: 2614,
+        256: 2613, 16: 2617 },
+        5152: { 64: 2483, 1: 2484, 2: 2484, 4: 2484,
+        2048: 2479, 8: 2484, 128: 2482, 256: 2481,
+        16: 2484, 512: 2480 },
+        1057: { 128: 2769, 64: 2770, 2: 2774, 4096: 2765,
+        4: 2773, 2048: 2766, 8: 2772, 256: 2768,
+        16: 2771, 512: 2767 },
+        1058: { 128: 2769, 1: 2774, 4096: 2765, 4: 2773,
+        2048: 2766, 8: 2772, 64: 2770, 256: 2768,
+        16: 2771, 512: 2767 },
+        1060: { 128: 2769, 1: 2773, 2: 2773, 4096: 2765,
+        2048: 2766, 8: 2772, 64: 2770, 256: 2768,
+        16: 2771, 512: 2767 },
+        2081: { 128: 2659, 64: 2660, 2: 2664, 4096: 2655,
+        4: 2663, 1024: 2656, 8: 2662, 256: 2658,
+        16: 2661, 512: 2657 },
+        2080: { 5632: 2655, 5121: 2655, 5122: 2655, 1027: 2656,
+        1540: 2656, 4101: 2655, 4102: 2655, 7: 2663,
+        1544: 2656, 521: 2657, 4106: 2655, 11: 2662,
+        524: 2657, 13: 2662, 14: 2662, 4228: 2655,
+        1552: 2656, 4113: 2655, 4114: 2655, 4099: 2655,
+        529: 2657, 21: 2661, 22: 2661, 536: 2657,
+        25: 2661, 26: 2661, 28: 2661, 517: 2657,
+        518: 2657, 5184: 2655, 1288: 2656, 4105: 2655,
+        1034: 2656, 1600: 2656, 4161: 2655, 578: 2657,
+        67: 2660, 580: 2657, 69: 2660, 70: 2660,
+        584: 2657, 73: 2660, 74: 2660, 522: 2657,
+        1281: 2656, 592: 2657, 81: 2660, 82: 2660,
+        1537: 2656, 4416: 2655, 88: 2660, 1296: 2656,
+        1041: 2656, 1282: 2656, 530: 2657, 4368: 2655,
+        515: 2657, 1538: 2656, 19: 2661, 4624: 2655,
+        532: 2657, 4232: 2655, 4672: 2655, 1044: 2656,
+        4164: 2655, 4225: 2655, 642: 2657, 131: 2659,
+        644: 2657, 133: 2659, 134: 2659, 648: 2657,
+        137: 2659, 138: 2659, 140: 2659, 656: 2657,
+        145: 2659, 146: 2659, 148: 2659, 152: 2659,
+        4864: 2655, 5136: 2655, 1284: 2656, 4353: 2655,
+        5376: 2655, 4609: 2655, 1029: 2656, 704: 2657,
+        193: 2659, 194: 2659, 196: 2659, 200: 2659,
+        4354: 2655, 208: 2659, 4610: 2655, 1030: 2656,
+        4116: 2655, 1048: 2656, 4168: 2655, 1096: 2656,
+        1792: 2656, 769: 2657, 770: 2657, 259: 2658,
+        772: 2657, 261: 2658, 262: 2658, 641: 2657,
+        776: 2657, 265: 2658, 266: 2658, 268: 2658,
+        4226: 2655, 4612: 2655, 784: 2657, 273: 2658,
+        274: 2658, 276: 2658, 280: 2658, 1156: 2656,
+        5124: 2655, 4356: 2655, 1160: 2656, 1408: 2656,
+        1033: 2656, 1664: 2656, 832: 2657, 321: 2658,
+        322: 2658, 324: 2658, 1153: 2656, 1042: 2656,
+        336: 2658, 4120: 2655, 1216: 2656, 4288: 2655,
+        1168: 2656, 1154: 2656, 4240: 2655, 4360: 2655,
+        896: 2657, 385: 2658, 386: 2658, 388: 2658,
+        4616: 2655, 577: 2657, 392: 2658, 4162: 2655,
+        1036: 2656, 400: 2658, 4480: 2655, 5128: 2655,
+        1092: 2656, 4736: 2655, 5248: 2655, 1344: 2656,
+        328: 2658, 448: 2658, 1089: 2656, 76: 2660,
+        1104: 2656, 1090: 2656, 4176: 2655, 4108: 2655,
+        84: 2660 },
+        3104: { 64: 2604, 1: 2605, 2: 2605, 4: 2605,
+        4096: 2600, 8: 2605, 128: 2603, 256: 2602,
+        16: 2605, 512: 2601 },
+        1064: { 128: 2769, 1: 2772, 2: 2772, 4096: 2765,
+        4: 2772, 2048: 2766, 64: 2770, 256: 2768,
+        16: 2771, 512: 2767 },
+        1072: { 128: 2769, 1: 2771, 2: 2771, 4096: 2765,
+        4: 2771, 2048: 2766, 8: 2771, 64: 2770,
+        256: 2768, 512: 2767 },
+        2568: { 64: 2615, 1: 2618, 2: 2618, 4096: 2611,
+        4: 2618, 1024: 2612, 32: 2616, 128: 2614,
+        256: 2613, 16: 2617 },
+        1088: { 6656: 2754, 4609: 2754, 6146: 2754, 2051: 2755,
+        2564: 2755, 4101: 2754, 4102: 2754, 7: 2762,
+        2568: 2755, 4105: 2754, 4106: 2754, 11: 2761,
+        524: 2756, 13: 2761, 14: 2761, 4228: 2754,
+        2576: 2755, 4113: 2754, 4114: 2754, 4099: 2754,
+        529: 2756, 21: 2760, 22: 2760, 536: 2756,
+        25: 2760, 26: 2760, 28: 2760, 517: 2756,
+        2592: 2755, 2081: 2755, 2082: 2755, 35: 2759,
+        548: 2756, 37: 2759, 38: 2759, 4144: 2754,
+        552: 2756, 41: 2759, 42: 2759, 44: 2759,
+        560: 2756, 49: 2759, 50: 2759, 52: 2759,
+        521: 2756, 56: 2759, 2312: 2755, 522: 2756,
+        2060: 2755, 4384: 2754, 4640: 2754, 770: 2756,
+        2320: 2755, 4129: 2754, 2065: 2755, 2305: 2755,
+        2066: 2755, 4368: 2754, 515: 2756, 19: 2760,
+        2561: 2755, 4624: 2754, 532: 2756, 4232: 2754,
+        2688: 2755, 4225: 2754, 2178: 2755, 131: 2758,
+        644: 2756, 133: 2758, 134: 2758, 6176: 2754,
+        648: 2756, 137: 2758, 138: 2758, 140: 2758,
+        656: 2756, 145: 2758, 146: 2758, 4130: 2754,
+        152: 2758, 2068: 2755, 672: 2756, 161: 2758,
+        162: 2758, 164: 2758, 6160: 2754, 168: 2758,
+        4353: 2754, 176: 2758, 4120: 2754, 4132: 2754,
+        2336: 2755, 2308: 2755, 545: 2756, 518: 2756,
+        546: 2756, 6400: 2754, 4610: 2754, 2084: 2755,
+        2053: 2755, 2562: 2755, 4116: 2754, 6145: 2754,
+        2088: 2755, 2054: 2755, 530: 2756, 2816: 2755,
+        769: 2756, 2306: 2755, 259: 2757, 772: 2756,
+        261: 2757, 262: 2757, 641: 2756, 776: 2756,
+        265: 2757, 266: 2757, 268: 2757, 4226: 2754,
+        4612: 2754, 784: 2756, 273: 2757, 274: 2757,
+        276: 2757, 2072: 2755, 280: 2757, 2180: 2755,
+        4864: 2754, 800: 2756, 289: 2757, 290: 2757,
+        4356: 2754, 292: 2757, 296: 2757, 304: 2757,
+        2184: 2755, 4136: 2754, 6148: 2754, 4256: 2754,
+        2432: 2755, 2057: 2755, 642: 2756, 2192: 2755,
+        2177: 2755, 4240: 2754, 2058: 2755, 148: 2758,
+        4360: 2754, 896: 1602, 385: 2757, 386: 2757,
+        388: 2757, 4616: 2754, 392: 2757, 400: 2757,
+        4480: 2754, 4736: 2754, 416: 2757, 6152: 2754,
+        2208: 2755, 6272: 2754, 2096: 2755, 4108: 2754,
+        4354: 2754 },
+        1089: { 128: 2758, 32: 2759, 2: 2763, 4096: 2754,
+        4: 2762, 2048: 2755, 8: 2761, 256: 2757,
+        16: 2760, 512: 2756 },
+        1090: { 128: 2758, 1: 2763, 4096: 2754, 4: 2762,
+        2048: 2755, 32: 2759, 8: 2761, 256: 2757,
+        16: 2760, 512: 2756 },
+        2082: { 128: 2659, 1: 2664, 4096: 2655, 4: 2663,
+        1024: 2656, 8: 2662, 64: 2660, 256: 2658,
+        16: 2661, 512: 2657 },
+        1092: { 128: 2758, 1: 2762, 2: 2762, 4096: 2754,
+        2048: 2755, 32: 2759, 8: 2761, 256: 2757,
+        16: 2760, 512: 2756 },
+        4128: { 3584: 2534, 3073: 2534, 3074: 2534, 1027: 2535,
+        1540: 2535, 517: 2536, 518: 2536, 7: 2542,
+        1544: 2535, 521: 2536, 522: 2536, 11: 2541,
+        524: 2536, 13: 2541, 14: 2541, 1552: 2535,
+        529: 2536, 530: 2536, 2051: 2534, 532: 2536,
+        21: 2540, 22: 2540, 536: 2536, 25: 2540,
+        26: 2540, 28: 2540, 1029: 2535, 1092: 2535,
+        1030: 2535, 2320: 2534, 1288: 2535, 2576: 2534,
+        1033: 2535, 2184: 2534, 1034: 2535, 2116: 2534,
+        577: 2536, 2114: 2534, 67: 2539, 2065: 2534,
+        69: 2539, 70: 2539, 584: 2536, 73: 2539,
+        74: 2539, 76: 2539, 592: 2536, 81: 2539,
+        82: 2539, 1537: 2535, 88: 2539, 770: 2536,
+        2816: 2534, 1296: 2535, 1041: 2535, 1282: 2535,
+        2305: 2534, 2066: 2534, 3328: 2534, 515: 2536,
+        1538: 2535, 19: 2540, 2561: 2534, 1044: 2535,
+        1664: 2535, 641: 2536, 1154: 2535, 131: 2538,
+        644: 2536, 133: 2538, 134: 2538, 648: 2536,
+        137: 2538, 138: 2538, 140: 2538, 656: 2536,
+        145: 2538, 146: 2538, 148: 2538, 152: 2538,
+        2068: 2534, 1284: 2535, 1216: 2535, 3080: 2534,
+        2120: 2534, 704: 2536, 193: 2538, 194: 2538,
+        196: 2538, 2308: 2534, 200: 2538, 2240: 2534,
+        2564: 2534, 208: 2538, 2053: 2534, 2562: 2534,
+        3076: 2534, 1048: 2535, 2054: 2534, 1792: 2535,
+        769: 2536, 2306: 2534, 259: 2537, 772: 2536,
+        261: 2537, 262: 2537, 1153: 2535, 776: 2536,
+        265: 2537, 266: 2537, 268: 2537, 2178: 2534,
+        784: 2536, 273: 2537, 274: 2537, 276: 2537,
+        2072: 2534, 280: 2537, 1156: 2535, 2192: 2534,
+        1160: 2535, 1408: 2535, 2312: 2534, 832: 2536,
+        321: 2537, 322: 2537, 324: 2537, 2568: 2534,
+        328: 2537, 1042: 2535, 336: 2537, 2432: 2534,
+        2057: 2534, 642: 2536, 2688: 2534, 1168: 2535,
+        3088: 2534, 2177: 2534, 3200: 2534, 2058: 2534,
+        1281: 2535, 896: 2536, 385: 2537, 386: 2537,
+        388: 2537, 1089: 2535, 392: 2537, 578: 2536,
+        1036: 2535, 400: 2537, 580: 2536, 2128: 2534,
+        2060: 2534, 1344: 2535, 1096: 2535, 1600: 2535,
+        448: 2537, 2180: 2534, 2368: 2534, 2624: 2534,
+        1104: 2535, 1090: 2535, 2113: 2534, 3136: 2534,
+        84: 2539 },
+        1096: { 128: 2758, 1: 2761, 2: 2761, 4096: 2754,
+        4: 2761, 2048: 2755, 32: 2759, 256: 2757,
+        16: 2760, 512: 2756 },
+        1104: { 128: 2758, 1: 2760, 2: 2760, 4096: 2754,
+        4: 2760, 2048: 2755, 32: 2759, 8: 2760,
+        256: 2757, 512: 2756 },
+        1120: { 128: 2758, 1: 2759, 2: 2759, 4096: 2754,
+        4: 2759, 2048: 2755, 8: 2759, 256: 2757,
+        16: 2759, 512: 2756 },
+        4624: { 64: 2494, 1: 2496, 2: 2496, 4: 2496,
+        1024: 2491, 32: 2495, 8: 2496, 128: 2493,
+        256: 2492, 2048: 2490 },
+        3584: { 32: 2601, 1: 2601, 2: 2601, 4: 2601,
+        4096: 2600, 8: 2601, 64: 2601, 128: 2601,
+        256: 2601, 16: 2601 },
+        4672: { 32: 2494, 1: 2494, 2: 2494, 4: 2494,
+        1024: 2491, 8: 2494, 128: 2493, 256: 2492,
+        16: 2494, 2048: 2490 },
+        1152: { 6656: 2743, 4609: 2743, 4610: 2743, 2051: 2744,
+        2564: 2744, 4101: 2743, 4102: 2743, 7: 2751,
+        2568: 2744, 521: 2745, 4106: 2743, 11: 2750,
+        524: 2745, 13: 2750, 14: 2750, 2576: 2744,
+        4113: 2743, 4114: 2743, 4099: 2743, 529: 2745,
+        21: 2749, 22: 2749, 536: 2745, 25: 2749,
+        26: 2749, 28: 2749, 517: 2745, 2592: 2744,
+        2081: 2744, 2082: 2744, 35: 2748, 548: 2745,
+        37: 2748, 38: 2748, 4144: 2743, 552: 2745,
+        41: 2748, 42: 2748, 44: 2748, 2320: 2744,
+        560: 2745, 49: 2748, 50: 2748, 52: 2748,
+        4105: 2743, 56: 2748, 2312: 2744, 522: 2745,
+        2116: 2744, 4161: 2743, 2114: 2744, 67: 2747,
+        4162: 2743, 69: 2747, 70: 2747, 584: 2745,
+        73: 2747, 74: 2747, 76: 2747, 4384: 2743,
+        592: 2745, 81: 2747, 82: 2747, 84: 2747,
+        4416: 2743, 4640: 2743, 88: 2747, 608: 2745,
+        97: 2747, 98: 2747, 100: 2747, 4129: 2743,
+        2065: 2744, 104: 2747, 2305: 2744, 2066: 2744,
+        4368: 2743, 515: 2745, 19: 2749, 2561: 2744,
+        4624: 2743, 532: 2745, 4672: 2743, 4164: 2743,
+        4130: 2743, 6176: 2743, 2306: 2744, 2072: 2744,
+        2562: 2744, 2068: 2744, 112: 2747, 6160: 2743,
+        4353: 2743, 4120: 2743, 4132: 2743, 2336: 2744,
+        2308: 2744, 545: 2745, 518: 2745, 546: 2745,
+        6400: 2743, 2084: 2744, 2053: 2744, 4116: 2743,
+        6145: 2743, 2088: 2744, 4168: 2743, 2054: 2744,
+        530: 2745, 2816: 1601, 769: 2745, 770: 2745,
+        259: 2746, 772: 2745, 261: 2746, 262: 2746,
+        776: 2745, 265: 2746, 266: 2746, 268: 2746,
+        4612: 2743, 784: 2745, 273: 2746, 274: 2746,
+        276: 2746, 280: 2746, 4864: 2743, 800: 2745,
+        289: 2746, 290: 2746, 4356: 2743, 292: 2746,
+        296: 2746, 304: 2746, 4136: 2743, 6148: 2743,
+        832: 1602, 321: 2746, 322: 2746, 324: 2746,
+        328: 2746, 336: 2746, 2057: 2744, 6146: 2743,
+        352: 2746, 6208: 2743, 2058: 2744, 4360: 2743,
+        2368: 2744, 4616: 2743, 577: 2745, 2144: 2744,
+        578: 2745, 580: 2745, 2060: 2744, 2120: 2744,
+        6152: 2743, 4192: 2743, 2624: 2744, 2128: 2744,
+        2113: 2744, 2096: 2744, 4176: 2743, 4108: 2743,
+        4354: 2743 },
+        1153: { 64: 2747, 32: 2748, 2: 2752, 4096: 2743,
+        4: 2751, 2048: 2744, 8: 2750, 256: 2746,
+        16: 2749, 512: 2745 },
+        1154: { 64: 2747, 1: 2752, 4096: 2743, 4: 2751,
+        2048: 2744, 32: 2748, 8: 2750, 256: 2746,
+        16: 2749, 512: 2745 },
+        1156: { 64: 2747, 1: 2751, 2: 2751, 4096: 2743,
+        2048: 2744, 32: 2748, 8: 2750, 256: 2746,
+        16: 2749, 512: 2745 },
+        6176: { 64: 2472, 1: 2473, 2: 2473, 4: 2473,
+        1024: 2468, 8: 2473, 128: 2471, 256: 2470,
+        16: 2473, 512: 2469 },
+        1160: { 64: 2747, 1: 2750, 2: 2750, 4096: 2743,
+        4: 2750, 2048: 2744, 32: 2748, 256: 2746,
+        16: 2749, 512: 2745 },
+        1168: { 64: 2747, 1: 2749, 2: 2749, 4096: 2743,
+        4: 2749, 2048: 2744, 32: 2748, 8: 2749,
+        256: 2746, 512: 2745 },
+        2562: { 64: 2615, 1: 2620, 4096: 2611, 4: 2619,
+        1024: 2612, 32: 2616, 8: 2618, 128: 2614,
+        256: 2613, 16: 2617 },
+        4608: { 3073: 2490, 3074: 2490, 1027: 2491, 3076: 2490,
+        1029: 2491, 1030: 2491, 7: 2498, 3080: 2490,
+        1033: 2491, 1034: 2491, 11: 2497, 1036: 2491,
+        13: 2497, 14: 2497, 2336: 2490, 3088: 2490,
+        1041: 2491, 2066: 2490, 2051: 2490, 1044: 2491,
+        21: 2496, 22: 2496, 1048: 2491, 25: 2496,
+        26: 2496, 28: 2496, 2053: 2490, 3104: 2490,
+        1057: 2491, 2082: 2490, 35: 2495, 1060: 2491,
+        37: 2495, 38: 2495, 1064: 2491, 41: 2495,
+        42: 2495, 44: 2495, 2320: 2490, 1072: 2491,
+        49: 2495, 50: 2495, 52: 2495, 2057: 2490,
+        56: 2495, 2058: 2490, 3136: 2490, 1089: 2491,
+        2114: 2490, 67: 2494, 1092: 2491, 69: 2494,
+        70: 2494, 1096: 2491, 73: 2494, 74: 2494,
+        76: 2494, 1104: 2491, 81: 2494, 82: 2494,
+        84: 2494, 88: 2494, 1120: 2491, 97: 2494,
+        98: 2494, 100: 2494, 2065: 2490, 104: 2494,
+        1282: 2491, 2305: 2490, 1042: 2491, 112: 2494,
+        19: 2496, 2068: 2490, 3200: 2490, 2177: 2490,
+        1154: 2491, 131: 2493, 1156: 2491, 133: 2493,
+        134: 2493, 1160: 2491, 137: 2493, 138: 2493,
+        140: 2493, 1168: 2491, 145: 2493, 146: 2493,
+        148: 2493, 152: 2493, 1184: 2491, 161: 2493,
+        162: 2493, 164: 2493, 168: 2493, 176: 2493,
+        1216: 2491, 193: 2493, 194: 2493, 196: 2493,
+        2308: 2490, 2081: 2490, 200: 2493, 2240: 2490,
+        1058: 2491, 208: 2493, 2084: 2490, 224: 2493,
+        2088: 2490, 2054: 2490, 3328: 1600, 1281: 2491,
+        2306: 2490, 259: 2492, 1284: 2491, 261: 2492,
+        262: 2492, 1153: 2491, 1288: 2491, 265: 2492,
+        266: 2492, 268: 2492, 2178: 2490, 1296: 2491,
+        273: 2492, 274: 2492, 276: 2492, 2072: 2490,
+        280: 2492, 2180: 2490, 1312: 2491, 289: 2492,
+        290: 2492, 292: 2492, 296: 2492, 304: 2492,
+        2184: 2490, 2312: 2490, 1344: 2491, 321: 2492,
+        322: 2492, 324: 2492, 328: 2492, 336: 2492,
+        2432: 2490, 352: 2492, 2192: 2490, 1408: 2491,
+        385: 2492, 386: 2492, 388: 2492, 2113: 2490,
+        392: 2492, 2144: 2490, 1090: 2491, 400: 2492,
+        2116: 2490, 416: 2492, 2060: 2490, 2120: 2490,
+        448: 2492, 2208: 2490, 2368: 2490, 2128: 2490,
+        2096: 2490 },
+        196: { 256: 3022, 1: 3026, 2: 3026, 4096: 3018,
+        1024: 3020, 32: 3023, 8: 3025, 16: 3024,
+        512: 3021, 2048: 3019 },
+        1184: { 64: 2747, 1: 2748, 2: 2748, 4096: 2743,
+        4: 2748, 2048: 2744, 8: 2748, 256: 2746,
+        16: 2748, 512: 2745 },
+        4609: { 64: 2494, 32: 2495, 2: 2499, 4: 2498,
+        1024: 2491, 8: 2497, 128: 2493, 256: 2492,
+        16: 2496, 2048: 2490 },
+        5632: { 32: 2480, 1: 2480, 2: 2480, 4: 2480,
+        2048: 2479, 8: 2480, 64: 2480, 128: 2480,
+        256: 2480, 16: 2480 },
+        4132: { 128: 2538, 1: 2542, 2: 2542, 1024: 2535,
+        8: 2541, 64: 2539, 256: 2537, 16: 2540,
+        512: 2536, 2048: 2534 },
+        1216: { 32: 2747, 1: 2747, 2: 2747, 4096: 2743,
+        4: 2747, 2048: 2744, 8: 2747, 256: 2746,
+        16: 2747, 512: 2745 },
+        2592: { 64: 2615, 1: 2616, 2: 2616, 4096: 2611,
+        4: 2616, 1024: 2612, 8: 2616, 128: 2614,
+        256: 2613, 16: 2616 },
+        6656: { 32: 2469, 1: 2469, 2: 2469, 4: 2469,
+        1024: 2468, 8: 2469, 64: 2469, 128: 2469,
+        256: 2469, 16: 2469 },
+        1280: { 6656: 1600, 4609: 2732, 4610: 2732, 2051: 2733,
+        2564: 2733, 4101: 2732, 4102: 2732, 7: 2740,
+        2568: 2733, 521: 2734, 4106: 2732, 11: 2739,
+        524: 2734, 13: 2739, 14: 2739, 4228: 2732,
+        2576: 2733, 4113: 2732, 4114: 2732, 4099: 2732,
+        529: 2734, 21: 2738, 22: 2738, 536: 2734,
+        25: 2738, 26: 2738, 28: 2738, 517: 2734,
+        2592: 2733, 2081: 2733, 2082: 2733, 35: 2737,
+        548: 2734, 37: 2737, 38: 2737, 4144: 2732,
+        552: 2734, 41: 2737, 42: 2737, 44: 2737,
+        560: 2734, 49: 2737, 50: 2737, 52: 2737,
+        4105: 2732, 56: 2737, 522: 2734, 2116: 2733,
+        4161: 2732, 2114: 2733, 67: 2736, 4162: 2732,
+        69: 2736, 70: 2736, 584: 2734, 73: 2736,
+        74: 2736, 76: 2736, 592: 2734, 81: 2736,
+        82: 2736, 84: 2736, 4640: 2732, 88: 2736,
+        546: 2734, 97: 2736, 98: 2736, 100: 2736,
+        4129: 2732, 2065: 2733, 104: 2736, 2066: 2733,
+        515: 2734, 19: 2738, 2561: 2733, 4624: 2732,
+        532: 2734, 4232: 2732, 4672: 2732, 4164: 2732,
+        641: 2734, 642: 2734, 131: 2735, 644: 2734,
+        133: 2735, 134: 2735, 6176: 2732, 648: 2734,
+        137: 2735, 138: 2735, 140: 2735, 656: 2734,
+        145: 2735, 146: 2735, 148: 2735, 152: 2735,
+        2068: 2733, 672: 2734, 161: 2735, 162: 2735,
+        164: 2735, 6160: 2732, 168: 2735, 176: 2735,
+        4132: 2732, 704: 1602, 193: 2735, 194: 2735,
+        196: 2735, 545: 2734, 200: 2735, 518: 2734,
+        2240: 2733, 4130: 2732, 208: 2735, 2084: 2733,
+        2053: 2733, 2562: 2733, 4116: 2732, 224: 2735,
+        6145: 2732, 2088: 2733, 4168: 2732, 2054: 2733,
+        530: 2734, 2688: 1601, 6146: 2732, 4225: 2732,
+        4288: 2732, 2178: 2733, 4612: 2732, 2072: 2733,
+        2180: 2733, 2096: 2733, 112: 2736, 2184: 2733,
+        4136: 2732, 6148: 2732, 4256: 2732, 2057: 2733,
+        4120: 2732, 608: 2734, 2192: 2733, 2177: 2733,
+        4240: 2732, 6208: 2732, 2058: 2733, 2624: 2733,
+        4616: 2732, 577: 2734, 2144: 2733, 578: 2734,
+        580: 2734, 4736: 2732, 2060: 2733, 2120: 2733,
+        6152: 2732, 2208: 2733, 4226: 2732, 4192: 2732,
+        6272: 2732, 2128: 2733, 2113: 2733, 4176: 2732,
+        4108: 2732 },
+        1281: { 64: 2736, 32: 2737, 2: 2741, 4096: 2732,
+        4: 2740, 2048: 2733, 8: 2739, 128: 2735,
+        16: 2738, 512: 2734 },
+        1282: { 64: 2736, 1: 2741, 4096: 2732, 4: 2740,
+        2048: 2733, 32: 2737, 8: 2739, 128: 2735,
+        16: 2738, 512: 2734 },
+        1284: { 64: 2736, 1: 2740, 2: 2740, 4096: 2732,
+        2048: 2733, 32: 2737, 8: 2739, 128: 2735,
+        16: 2738, 512: 2734 },
+        1288: { 64: 2736, 1: 2739, 2: 2739, 4096: 2732,
+        4: 2739, 2048: 2733, 32: 2737, 128: 2735,
+        16: 2738, 512: 2734 },
+        4612: { 64: 2494, 1: 2498, 2: 2498, 1024: 2491,
+        32: 2495, 8: 2497, 128: 2493, 256: 2492,
+        16: 2496, 2048: 2490 },
+        1296: { 64: 2736, 1: 2738, 2: 2738, 4096: 2732,
+        4: 2738, 2048: 2733, 32: 2737, 8: 2738,
+        128: 2735, 512: 2734 },
+        1312: { 64: 2736, 1: 2737, 2: 2737, 4096: 2732,
+        4: 2737, 2048: 2733, 8: 2737, 128: 2735,
+        16: 2737, 512: 2734 },
+        4136: { 128: 2538, 1: 2541, 2: 2541, 4: 2541,
+        1024: 2535, 64: 2539, 256: 2537, 16: 2540,
+        512: 2536, 2048: 2534 },
+        1344: { 32: 2736, 1: 2736, 2: 2736, 4096: 2732,
+        4: 2736, 2048: 2733, 8: 2736, 128: 2735,
+        16: 2736, 512: 2734 },
+        224: { 256: 3022, 1: 3023, 2: 3023, 4096: 3018,
+        4: 3023, 1024: 3020, 8: 3023, 16: 3023,
+        512: 3021, 2048: 3019 },
+        2432: { 32: 2625, 1: 2625, 2: 2625, 4096: 2622,
+        4: 2625, 1024: 2623, 8: 2625, 64: 2625,
+        16: 2625, 512: 2624 },
+        1408: { 32: 2735, 1: 2735, 2: 2735, 4096: 2732,
+        4: 2735, 2048: 2733, 8: 2735, 64: 2735,
+        16: 2735, 512: 2734 },
+        2624: { 32: 2615, 1: 2615, 2: 2615, 4096: 2611,
+        4: 2615, 1024: 2612, 8: 2615, 128: 2614,
+        256: 2613, 16: 2615 },
+        4616: { 64: 2494, 1: 2497, 2: 2497, 4: 2497,
+        1024: 2491, 32: 2495, 128: 2493, 256: 2492,
+        16: 2496, 2048: 2490 },
+        577: { 128: 2857, 32: 2858, 2: 2862, 4096: 2853,
+        4: 2861, 1024: 2855, 8: 2860, 256: 2856,
+        16: 2859, 2048: 2854 },
+        4480: { 32: 2504, 1: 2504, 2: 2504, 4: 2504,
+        1024: 2502, 8: 2504, 64: 2504, 16: 2504,
+        512: 2503, 2048: 2501 },
+        580: { 128: 2857, 1: 2861, 2: 2861, 4096: 2853,
+        1024: 2855, 32: 2858, 8: 2860, 256: 2856,
+        16: 2859, 2048: 2854 },
+        2096: { 128: 2659, 1: 2661, 2: 2661, 4096: 2655,
+        4: 2661, 1024: 2656, 8: 2661, 64: 2660,
+        256: 2658, 512: 2657 },
+        1536: { 6145: 2721, 6146: 2721, 2051: 2722, 6148: 2721,
+        4101: 2721, 4102: 2721, 7: 2729, 6152: 2721,
+        4105: 2721, 4106: 2721, 11: 2728, 2060: 2722,
+        13: 2728, 14: 2728, 6160: 2721, 4113: 2721,
+        4114: 2721, 4099: 2721, 2068: 2722, 21: 2727,
+        22: 2727, 2072: 2722, 25: 2727, 26: 2727,
+        28: 2727, 2053: 2722, 6176: 2721, 2081: 2722,
+        2082: 2722, 35: 2726, 2084: 2722, 37: 2726,
+        38: 2726, 4144: 2721, 2088: 2722, 41: 2726,
+        42: 2726, 44: 2726, 2096: 2722, 49: 2726,
+        50: 2726, 52: 2726, 2057: 2722, 56: 2726,
+        2058: 2722, 6208: 2721, 4161: 2721, 2114: 2722,
+        67: 2725, 2116: 2722, 69: 2725, 70: 2725,
+        2120: 2722, 73: 2725, 74: 2725, 76: 2725,
+        4384: 2721, 2128: 2722, 81: 2725, 82: 2725,
+        84: 2725, 4416: 2721, 88: 2725, 2144: 2722,
+        97: 2725, 98: 2725, 100: 2725, 2065: 2722,
+        104: 2725, 2305: 2722, 2066: 2722, 4368: 2721,
+        112: 2725, 19: 2727, 4116: 2721, 6272: 2721,
+        4225: 2721, 2178: 2722, 131: 2724, 2180: 2722,
+        133: 2724, 134: 2724, 2184: 2722, 137: 2724,
+        138: 2724, 140: 2724, 2192: 2722, 145: 2724,
+        146: 2724, 148: 2724, 152: 2724, 2208: 2722,
+        161: 2724, 162: 2724, 164: 2724, 168: 2724,
+        176: 2724, 2240: 2722, 193: 2724, 194: 2724,
+        196: 2724, 4129: 2721, 200: 2724, 4354: 2721,
+        4130: 2721, 208: 2724, 4132: 2721, 224: 2724,
+        4136: 2721, 2054: 2722, 6400: 1600, 4353: 2721,
+        2306: 2722, 259: 2723, 2308: 2722, 261: 2723,
+        262: 2723, 2177: 2722, 2312: 2722, 265: 2723,
+        266: 2723, 268: 2723, 4226: 2721, 2320: 2722,
+        273: 2723, 274: 2723, 276: 2723, 280: 2723,
+        4228: 2721, 2336: 2722, 289: 2723, 290: 2723,
+        4356: 2721, 292: 2723, 296: 2723, 304: 2723,
+        4232: 2721, 2368: 2722, 321: 2723, 322: 2723,
+        324: 2723, 328: 2723, 336: 2723, 4120: 2721,
+        4288: 2721, 352: 2723, 4240: 2721, 4360: 2721,
+        2432: 1601, 385: 2723, 386: 2723, 388: 2723,
+        2113: 2722, 392: 2723, 4162: 2721, 400: 2723,
+        4480: 2721, 4164: 2721, 416: 2723, 4168: 2721,
+        448: 1602, 4256: 2721, 4192: 2721, 4176: 2721,
+        4108: 2721 },
+        1537: { 64: 2725, 32: 2726, 2: 2730, 4096: 2721,
+        4: 2729, 2048: 2722, 8: 2728, 128: 2724,
+        256: 2723, 16: 2727 },
+        1538: { 64: 2725, 1: 2730, 4096: 2721, 4: 2729,
+        2048: 2722, 32: 2726, 8: 2728, 128: 2724,
+        256: 2723, 16: 2727 },
+        1540: { 64: 2725, 1: 2729, 2: 2729, 4096: 2721,
+        2048: 2722, 32: 2726, 8: 2728, 128: 2724,
+        256: 2723, 16: 2727 },
+        2305: { 64: 2626, 32: 2627, 2: 2631, 4096: 2622,
+        4: 2630, 1024: 2623, 8: 2629, 128: 2625,
+        16: 2628, 512: 2624 },
+        1544: { 64: 2725, 1: 2728, 2: 2728, 4096: 2721,
+        4: 2728, 2048: 2722, 32: 2726, 128: 2724,
+        256: 2723, 16: 2727 },
+        2306: { 64: 2626, 1: 2631, 4096: 2622, 4: 2630,
+        1024: 2623, 32: 2627, 8: 2629, 128: 2625,
+        16: 2628, 512: 2624 },
+        256: { 2048: 60, 1: 70, 2: 69, 4: 68,
+        6151: 4213, 8: 67, 6155: 4212, 6157: 4212,
+        6158: 4212, 2063: 4300, 16: 66, 6163: 4211,
+        6165: 4211, 6166: 4211, 2071: 4297, 6169: 4211,
+        6170: 4211, 4123: 4251, 6172: 4211, 2077: 4296,
+        4126: 4251, 31: 1608, 32: 65, 4784: 4225,
+        6179: 4210, 6181: 4210, 6182: 4210, 2087: 4293,
+        5142: 4220, 6185: 4210, 6186: 4210, 4139: 4247,
+        6188: 4210, 2093: 4292, 2094: 4292, 47: 4410,
+        6193: 4210, 6194: 4210, 4147: 4246, 6196: 4210,
+        2101: 4291, 2102: 4291, 55: 4407, 6200: 4210,
+        2105: 4291, 2106: 4291, 59: 4406, 2108: 4291,
+        61: 4406, 62: 1607, 64: 64, 6211: 4209,
+        6213: 4209, 6214: 4209, 2119: 4288, 6217: 4209,
+        6218: 4209, 2123: 4287, 6220: 4209, 2125: 4287,
+        2126: 4287, 79: 4400, 6225: 4209, 6226: 4209,
+        2131: 4286, 6228: 4209, 2133: 4286, 2134: 4286,
+        87: 4397, 6232: 4209, 2137: 4286, 2138: 4286,
+        4111: 1609, 2140: 4286, 93: 4396, 94: 4396,
+        6241: 4209, 6242: 4209, 4195: 4240, 6244: 4209,
+        2149: 4285, 2150: 4285, 103: 4393, 6248: 4209,
+        2153: 4285, 2154: 4285, 107: 4392, 2156: 4285,
+        109: 4392, 110: 4392, 6256: 4209, 2161: 4285,
+        2162: 4285, 5139: 4220, 4300: 4233, 117: 4391,
+        118: 4391, 2168: 4285, 121: 4391, 122: 4391,
+        124: 1606, 5141: 4220, 128: 63, 5824: 1602,
+        6275: 4208, 6277: 4208, 6278: 4208, 4231: 4237,
+        6281: 4208, 6282: 4208, 2187: 4281, 6284: 4208,
+        2189: 4281, 2190: 4281, 143: 4385, 6289: 4208,
+        6290: 4208, 2195: 4280, 6292: 4208, 4245: 4235,
+        2198: 4280, 151: 4382, 6296: 4208, 2201: 4280,
+        2202: 4280, 155: 4381, 2204: 4280, 157: 4381,
+        158: 4381, 6305: 4208, 6306: 4208, 2211: 4279,
+        6308: 4208, 2213: 4279, 2214: 4279, 167: 4378,
+        6312: 4208, 2217: 4279, 2218: 4279, 171: 4377,
+        2220: 4279, 173: 4377, 174: 4377, 4125: 4251,
+        6320: 4208, 4643: 4227, 2226: 4279, 179: 4376,
+        2228: 4279, 181: 4376, 182: 4376, 2232: 4279,
+        185: 4376, 186: 4376, 188: 4376, 5232: 4218,
+        6337: 4208, 6338: 4208, 2243: 4278, 6340: 4208,
+        2245: 4278, 2246: 4278, 199: 4373, 6344: 4208,
+        4297: 4233, 2250: 4278, 203: 4372, 2252: 4278,
+        205: 4372, 206: 4372, 6352: 4208, 2257: 4278,
+        2258: 4278, 5155: 4219, 2260: 4278, 213: 4371,
+        214: 4371, 2264: 4278, 217: 4371, 218: 4371,
+        220: 4371, 3109: 4264, 6368: 4208, 4321: 4233,
+        2274: 4278, 227: 4370, 2276: 4278, 229: 4370,
+        230: 4370, 2280: 4278, 233: 4370, 234: 4370,
+        4135: 4248, 236: 4370, 2288: 1604, 241: 1604,
+        242: 1604, 244: 1604, 5161: 4219, 248: 1604,
+        5162: 4219, 1067: 4328, 5164: 4219, 5328: 4217,
+        4141: 4247, 4142: 4247, 5169: 4219, 5170: 4219,
+        2099: 4291, 5172: 4219, 4149: 4246, 4832: 1603,
+        4150: 4246, 5224: 4218, 5176: 4219, 4153: 4246,
+        4154: 4246, 4156: 4246, 5127: 4222, 5187: 4218,
+        3141: 4263, 5190: 4218, 4167: 4243, 5193: 4218,
+        4720: 4226, 5194: 4218, 4652: 4227, 4171: 4242,
+        5196: 4218, 4173: 4242, 4174: 4242, 3153: 4263,
+        4804: 4225, 3085: 4266, 5202: 4218, 5131: 4221,
+        4179: 4241, 5204: 4218, 4181: 4241, 512: 62,
+        6659: 4207, 6661: 4207, 6662: 4207, 4615: 4230,
+        6665: 4207, 6666: 4207, 2571: 4274, 6668: 4207,
+        4621: 4229, 2574: 4274, 527: 4364, 6673: 4207,
+        6674: 4207, 2579: 4273, 6676: 4207, 2581: 4273,
+        2582: 4273, 535: 4361, 6680: 4207, 2585: 4273,
+        2586: 4273, 539: 4360, 2588: 4273, 541: 4360,
+        542: 4360, 6689: 4207, 6690: 4207, 91: 4396,
+        6692: 4207, 2597: 4272, 2598: 4272, 551: 4357,
+        6696: 4207, 2601: 4272, 2602: 4272, 555: 4356,
+        2604: 4272, 557: 4356, 558: 4356, 6704: 4207,
+        2609: 4272, 2610: 4272, 563: 4355, 2612: 4272,
+        565: 4355, 566: 4355, 2616: 4272, 569: 4355,
+        570: 4355, 572: 4355, 6721: 4207, 6722: 4207,
+        2627: 4271, 6724: 4207, 4677: 4226, 2630: 4271,
+        5217: 4218, 6728: 4207, 4681: 4226, 5134: 4221,
+        587: 4351, 2636: 4271, 589: 4351, 590: 4351,
+        6736: 4207, 4689: 4226, 2642: 4271, 595: 4350,
+        2644: 4271, 597: 4350, 598: 4350, 2648: 4271,
+        601: 4350, 602: 4350, 604: 4350, 4197: 4240,
+        6752: 4207, 2657: 4271, 2658: 4271, 611: 4349,
+        2660: 4271, 613: 4349, 614: 4349, 2664: 4271,
+        617: 4349, 618: 4349, 620: 4349, 2672: 4271,
+        625: 4349, 626: 4349, 628: 4349, 4201: 4240,
+        632: 4349, 4202: 4240, 6785: 4207, 6786: 4207,
+        2691: 4270, 6788: 4207, 4741: 4225, 2694: 4270,
+        647: 4346, 6792: 4207, 4745: 4225, 2698: 4270,
+        651: 4345, 2700: 4270, 653: 4345, 654: 4345,
+        6800: 4207, 2705: 4270, 2706: 4270, 659: 4344,
+        2708: 4270, 661: 4344, 662: 4344, 2712: 4270,
+        665: 4344, 666: 4344, 4182: 4241, 6816: 4207,
+        2721: 4270, 2722: 4270, 675: 4343, 2724: 4270,
+        677: 4343, 678: 4343, 4209: 4240, 2728: 4270,
+        681: 4343, 682: 4343, 684: 4343, 4210: 4240,
+        2736: 4270, 689: 4343, 690: 4343, 115: 4391,
+        692: 4343, 696: 4343, 2164: 4285, 6848: 4207,
+        2753: 4270, 2754: 4270, 707: 4342, 2756: 4270,
+        709: 4342, 710: 4342, 2760: 4270, 713: 4342,
+        714: 4342, 716: 4342, 2768: 4270, 721: 4342,
+        722: 4342, 724: 4342, 728: 4342, 5320: 4217,
+        2784: 1603, 737: 1603, 738: 1603, 740: 1603,
+        744: 1603, 752: 1603, 4185: 4241, 5208: 4218,
+        3203: 4262, 4186: 4241, 3205: 4262, 5254: 4217,
+        4664: 4227, 2183: 4282, 3209: 4262, 4119: 4252,
+        4801: 4225, 5258: 4217, 4235: 4236, 5260: 4217,
+        4237: 4236, 4188: 4241, 4238: 4236, 4802: 4225,
+        5265: 4217, 5266: 4217, 2075: 4296, 4243: 4235,
+        5268: 4217, 2197: 4280, 4246: 4235, 5272: 4217,
+        5145: 4220, 4249: 4235, 4250: 4235, 4252: 4235,
+        5146: 4220, 5281: 4217, 2078: 4296, 5282: 4217,
+        4259: 4234, 5284: 4217, 4261: 4234, 2147: 4285,
+        4262: 4234, 5148: 4220, 5288: 4217, 4265: 4234,
+        4266: 4234, 1024: 61, 7171: 4206, 7173: 4206,
+        7174: 4206, 3079: 4267, 7177: 4206, 7178: 4206,
+        3083: 4266, 7180: 4206, 5133: 4221, 3086: 4266,
+        1039: 4336, 7185: 4206, 7186: 4206, 3091: 4265,
+        7188: 4206, 3093: 4265, 3094: 4265, 1047: 4333,
+        7192: 4206, 3097: 4265, 3098: 4265, 1051: 4332,
+        3100: 4265, 1053: 4332, 1054: 4332, 5637: 4216,
+        7201: 4206, 7202: 4206, 3107: 4264, 7204: 4206,
+        5157: 4219, 3110: 4264, 1063: 4329, 7208: 4206,
+        3113: 4264, 3114: 4264, 2567: 4275, 3116: 4264,
+        1069: 4328, 1070: 4328, 7216: 4206, 3121: 4264,
+        3122: 4264, 1075: 4327, 3124: 4264, 1077: 4327,
+        1078: 4327, 5641: 4216, 3128: 4264, 1081: 4327,
+        1082: 4327, 1084: 4327, 5642: 4216, 7233: 4206,
+        7234: 4206, 3139: 4263, 7236: 4206, 5189: 4218,
+        3142: 4263, 1095: 4324, 7240: 4206, 3145: 4263,
+        3146: 4263, 1099: 4323, 3148: 4263, 1101: 4323,
+        1102: 4323, 2573: 4274, 7248: 4206, 5201: 4218,
+        3154: 4263, 1107: 4322, 3156: 4263, 1109: 4322,
+        1110: 4322, 3160: 4263, 1113: 4322, 1114: 4322,
+        1116: 4322, 7264: 4206, 3169: 4263, 3170: 4263,
+        1123: 4321, 3172: 4263, 1125: 4321, 1126: 4321,
+        5649: 4216, 3176: 4263, 1129: 4321, 1130: 4321,
+        1132: 4321, 5650: 4216, 3184: 4263, 1137: 4321,
+        1138: 4321, 4627: 4228, 1140: 4321, 1144: 4321,
+        5652: 4216, 4198: 4240, 4629: 4228, 7297: 4206,
+        7298: 4206, 5251: 4217, 7300: 4206, 5253: 4217,
+        3206: 4262, 3265: 4262, 7304: 4206, 5257: 4217,
+        3210: 4262, 1163: 4317, 3212: 4262, 1165: 4317,
+        1166: 4317, 7312: 4206, 3217: 4262, 3218: 4262,
+        1171: 4316, 3220: 4262, 1173: 4316, 1174: 4316,
+        4633: 4228, 3224: 4262, 1177: 4316, 1178: 4316,
+        1180: 4316, 4634: 4228, 4293: 4233, 7328: 4206,
+        3233: 4262, 3234: 4262, 1187: 4315, 3236: 4262,
+        1189: 4315, 1190: 4315, 3240: 4262, 1193: 4315,
+        1194: 4315, 1196: 4315, 3248: 4262, 1201: 4315,
+        1202: 4315, 4268: 4234, 1204: 4315, 2249: 4278,
+        1208: 4315, 4298: 4233, 5218: 4218, 7360: 4206,
+        5313: 4217, 3266: 4262, 1219: 4314, 3268: 4262,
+        1221: 4314, 1222: 4314, 3617: 4261, 3272: 4262,
+        1225: 4314, 1226: 4314, 1228: 4314, 5666: 4216,
+        3280: 4262, 1233: 4314, 1234: 4314, 2595: 4272,
+        1236: 4314, 1240: 4314, 5668: 4216, 4645: 4227,
+        3296: 4262, 1249: 4314, 1250: 4314, 1252: 4314,
+        4646: 4227, 4305: 4233, 1256: 4314, 4306: 4233,
+        1264: 1604, 5672: 4216, 211: 4371, 4649: 4227,
+        4308: 4233, 4816: 4225, 4650: 4227, 2225: 4279,
+        5635: 4216, 4312: 4233, 5158: 4219, 5680: 4216,
+        4657: 4227, 4658: 4227, 4096: 59, 4204: 4240,
+        4660: 4227, 5344: 4217, 4682: 4226, 4808: 4225,
+        2273: 4278, 4273: 4234, 5296: 4217, 4322: 4233,
+        2091: 4292, 4324: 4233, 4274: 4234, 5638: 4216,
+        4328: 4233, 5697: 4216, 5698: 4216, 4675: 4226,
+        5700: 4216, 2629: 4271, 4336: 1604, 4276: 4234,
+        4678: 4226, 583: 4352, 5704: 4216, 2633: 4271,
+        2634: 4271, 4684: 4226, 4619: 4229, 5712: 4216,
+        2641: 4271, 5220: 4218, 4690: 4226, 4692: 4226,
+        7681: 1600, 7682: 1600, 3587: 4261, 7684: 1600,
+        3589: 4261, 3590: 4261, 1543: 4311, 7688: 1600,
+        3593: 4261, 3594: 4261, 1547: 4310, 3596: 4261,
+        1549: 4310, 1550: 4310, 7696: 1600, 3601: 4261,
+        3602: 4261, 1555: 4309, 3604: 4261, 1557: 4309,
+        1558: 4309, 3608: 4261, 1561: 4309, 1562: 4309,
+        4280: 4234, 1564: 4309, 5644: 4216, 7712: 1600,
+        5665: 4216, 3618: 4261, 1571: 4308, 3620: 4261,
+        1573: 4308, 1574: 4308, 3624: 4261, 1577: 4308,
+        1578: 4308, 1580: 4308, 3632: 4261, 1585: 4308,
+        1586: 4308, 1588: 4308, 1592: 4308, 4622: 4229,
+        7744: 1600, 3649: 4261, 3650: 4261, 1603: 4307,
+        3652: 4261, 1605: 4307, 1606: 4307, 4705: 4226,
+        3656: 4261, 1609: 4307, 1610: 4307, 1612: 4307,
+        4706: 4226, 3664: 4261, 1617: 4307, 1618: 4307,
+        1620: 4307, 1624: 4307, 4708: 4226, 3680: 4261,
+        1633: 4307, 1634: 4307, 1636: 4307, 1640: 4307,
+        1648: 4307, 4712: 4226, 7808: 1600, 3713: 1601,
+        3714: 1601, 1667: 4306, 3716: 1601, 1669: 4306,
+        1670: 4306, 3720: 1601, 1673: 4306, 1674: 4306,
+        1676: 4306, 3728: 1601, 1681: 4306, 1682: 4306,
+        1684: 4306, 1688: 4306, 4216: 4240, 3744: 1601,
+        1697: 4306, 1698: 4306, 1700: 4306, 1704: 4306,
+        4212: 4240, 1712: 4306, 3776: 1601, 1729: 1602,
+        1730: 1602, 1732: 1602, 1736: 1602, 1744: 1602,
+        1760: 1602, 4696: 4226, 5761: 4216, 5762: 4216,
+        4739: 4225, 5764: 4216, 2693: 4270, 4742: 4225,
+        4630: 4228, 5768: 4216, 2697: 4270, 4746: 4225,
+        4748: 4225, 5776: 4216, 4291: 4233, 4753: 4225,
+        5314: 4217, 4754: 4225, 4756: 4225, 5656: 4216,
+        4760: 4225, 5316: 4217, 668: 4344, 4294: 4233,
+        5792: 4216, 4769: 4225, 4770: 4225, 4772: 4225,
+        4636: 4228, 4776: 4225, 5728: 4216, 1159: 4318 },
+        1552: { 64: 2725, 1: 2727, 2: 2727, 4096: 2721,
+        4: 2727, 2048: 2722, 32: 2726, 8: 2727,
+        128: 2724, 256: 2723 },
+        4356: { 64: 2505, 1: 2509, 2: 2509, 1024: 2502,
+        32: 2506, 8: 2508, 128: 2504, 16: 2507,
+        512: 2503, 2048: 2501 },
+        1568: { 64: 2725, 1: 2726, 2: 2726, 4096: 2721,
+        4: 2726, 2048: 2722, 8: 2726, 128: 2724,
+        256: 2723, 16: 2726 },
+        264: { 3584: 2975, 3073: 2975, 3074: 2975, 1027: 2976,
+        1540: 2976, 4101: 2974, 4102: 2974, 7: 2982,
+        5152: 2974, 6146: 2974, 4228: 2974, 1552: 2976,
+        4113: 2974, 2066: 2975, 515: 2977, 529: 2977,
+        21: 2981, 22: 2981, 2592: 2975, 4672: 2974,
+        2564: 2975, 517: 2977, 1092: 2976, 1057: 2976,
+        2082: 2975, 35: 2980, 548: 2977, 37: 2980,
+        38: 2980, 4144: 2974, 5184: 2974, 560: 2977,
+        49: 2980, 50: 2980, 52: 2980, 2576: 2975,
+        2116: 2975, 4161: 2974, 2114: 2975, 67: 2979,
+        2065: 2975, 69: 2979, 70: 2979, 6208: 2974,
+        592: 2977, 81: 2979, 82: 2979, 1537: 2976,
+        4640: 2974, 3076: 2975, 546: 2977, 97: 2979,
+        98: 2979, 100: 2979, 4129: 2974, 1041: 2976,
+        4114: 2974, 112: 2979, 1538: 2976, 19: 2981,
+        2561: 2975, 4624: 2974, 532: 2977, 1044: 2976,
+        2084: 2975, 4164: 2974, 641: 2977, 642: 2977,
+        131: 2978, 644: 2977, 133: 2978, 134: 2978,
+        6176: 2974, 656: 2977, 145: 2978, 146: 2978,
+        148: 2978, 196: 2978, 2068: 2975, 2051: 2975,
+        161: 2978, 162: 2978, 164: 2978, 6160: 2974,
+        1216: 2976, 176: 2978, 1058: 2976, 4609: 2974,
+        5632: 2974, 1029: 2976, 608: 2977, 4132: 2974,
+        704: 2977, 193: 2978, 194: 2978, 5121: 2974,
+        2081: 2975, 518: 2977, 2240: 2975, 4130: 2974,
+        208: 2978, 4610: 2974, 6656: 2974, 1060: 2976,
+        1030: 2976, 2053: 2975, 2562: 2975, 4116: 2974,
+        4099: 2974, 5122: 2974, 4226: 2974, 6145: 2974,
+        7168: 2974, 1184: 2976, 2054: 2975, 530: 2977,
+        1664: 2976, 4225: 2974, 2208: 2975, 4288: 2974,
+        2178: 2975, 4612: 2974, 3200: 2975, 1156: 2976,
+        5124: 2974, 1072: 2976, 2192: 2975, 5136: 2974,
+        6148: 2974, 224: 2978, 1153: 2976, 4256: 2974,
+        1042: 2976, 4162: 2974, 2688: 2975, 1168: 2976,
+        3088: 2975, 1154: 2976, 2177: 2975, 1120: 2976,
+        4240: 2974, 3104: 2975, 1600: 2976, 577: 2977,
+        2144: 2975, 3136: 2975, 578: 2977, 580: 2977,
+        4736: 2974, 2128: 2975, 5248: 2974, 672: 2977,
+        2180: 2975, 1089: 2976, 4192: 2974, 6272: 2974,
+        2624: 2975, 1104: 2976, 1090: 2976, 2113: 2975,
+        2096: 2975, 4176: 2974, 545: 2977, 1568: 2976,
+        84: 2979 },
+        2576: { 64: 2615, 1: 2617, 2: 2617, 4096: 2611,
+        4: 2617, 1024: 2612, 32: 2616, 8: 2617,
+        128: 2614, 256: 2613 },
+        1600: { 32: 2725, 1: 2725, 2: 2725, 4096: 2721,
+        4: 2725, 2048: 2722, 8: 2725, 128: 2724,
+        256: 2723, 16: 2725 },
+        258: { 3584: 2997, 4609: 2996, 1540: 2998, 4101: 2996,
+        1537: 2998, 1544: 2998, 521: 2999, 1036: 2998,
+        13: 3004, 1552: 2998, 4113: 2996, 2068: 2997,
+        21: 3003, 2592: 2997, 536: 2999, 25: 3003,
+        28: 3003, 517: 2999, 1092: 2998, 1057: 2998,
+        1041: 2998, 37: 3002, 4144: 2996, 552: 2999,
+        41: 3002, 44: 3002, 5152: 2996, 560: 2999,
+        49: 3002, 52: 3002, 2576: 2997, 4105: 2996,
+        56: 3002, 2184: 2997, 2116: 2997, 577: 2999,
+        4164: 2996, 69: 3001, 3088: 2997, 584: 2999,
+        73: 3001, 76: 3001, 548: 2999, 592: 2999,
+        81: 3001, 84: 3001, 4640: 2996, 88: 3001,
+        4116: 2996, 1060: 2998, 608: 2999, 97: 3001,
+        100: 3001, 4129: 2996, 529: 2999, 104: 3001,
+        112: 3001, 2561: 2997, 4624: 2996, 532: 2999,
+        4232: 2996, 4672: 2996, 1044: 2998, 2084: 2997,
+        1664: 2998, 641: 2999, 4228: 2996, 133: 3000,
+        5136: 2996, 6176: 2996, 648: 2999, 137: 3000,
+        140: 3000, 656: 2999, 145: 3000, 148: 3000,
+        152: 3000, 196: 3000, 672: 2999, 161: 3000,
+        164: 3000, 6160: 2996, 168: 3000, 1216: 2998,
+        176: 3000, 3080: 2997, 5184: 2996, 5632: 2996,
+        2120: 2997, 1029: 2998, 704: 2999, 193: 3000,
+        5121: 2996, 2081: 2997, 200: 3000, 2240: 2997,
+        2564: 2997, 208: 3000, 6656: 2996, 4132: 2996,
+        2053: 2997, 3076: 2997, 224: 3000, 6145: 2996,
+        7168: 2996, 1064: 2998, 1048: 2998, 2088: 2997,
+        4168: 2996, 3073: 2997, 2688: 2997, 4225: 2996,
+        2208: 2997, 4288: 2996, 4612: 2996, 2072: 2997,
+        644: 2999, 5124: 2996, 1072: 2998, 2192: 2997,
+        3200: 2997, 1160: 2998, 1033: 2998, 4136: 2996,
+        6148: 2996, 2568: 2997, 1153: 2998, 4256: 2996,
+        2057: 2997, 4120: 2996, 2065: 2997, 1168: 2998,
+        2177: 2997, 1120: 2998, 4240: 2996, 6208: 2996,
+        524: 2999, 1600: 2998, 4616: 2996, 4161: 2996,
+        2144: 2997, 3136: 2997, 5128: 2996, 580: 2999,
+        4736: 2996, 1156: 2998, 2128: 2997, 5248: 2996,
+        2060: 2997, 1096: 2998, 6152: 2996, 1184: 2998,
+        2180: 2997, 1089: 2998, 4192: 2996, 6272: 2996,
+        2624: 2997, 1104: 2998, 3104: 2997, 2113: 2997,
+        2096: 2997, 4176: 2996, 4108: 2996, 545: 2999,
+        1568: 2998 },
+        4416: { 32: 2505, 1: 2505, 2: 2505, 4: 2505,
+        1024: 2502, 8: 2505, 128: 2504, 16: 2505,
+        512: 2503, 2048: 2501 },
+        2320: { 64: 2626, 1: 2628, 2: 2628, 4096: 2622,
+        4: 2628, 1024: 2623, 32: 2627, 8: 2628,
+        128: 2625, 512: 2624 },
+        3328: { 32: 2602, 1: 2602, 2: 2602, 4: 2602,
+        4096: 2600, 8: 2602, 64: 2602, 128: 2602,
+        16: 2602, 512: 2601 },
+        1664: { 32: 2724, 1: 2724, 2: 2724, 4096: 2721,
+        4: 2724, 2048: 2722, 8: 2724, 64: 2724,
+        256: 2723, 16: 2724 },
+        4352: { 3584: 1600, 3073: 2501, 3074: 2501, 1027: 2502,
+        1540: 2502, 517: 2503, 518: 2503, 7: 2509,
+        1544: 2502, 521: 2503, 522: 2503, 11: 2508,
+        524: 2503, 13: 2508, 14: 2508, 1552: 2502,
+        1041: 2502, 2066: 2501, 2051: 2501, 529: 2503,
+        21: 2507, 22: 2507, 2592: 2501, 536: 2503,
+        25: 2507, 26: 2507, 28: 2507, 1029: 2502,
+        1568: 2502, 1057: 2502, 2082: 2501, 35: 2506,
+        548: 2503, 37: 2506, 38: 2506, 3104: 2501,
+        552: 2503, 41: 2506, 42: 2506, 44: 2506,
+        560: 2503, 49: 2506, 50: 2506, 52: 2506,
+        2576: 2501, 1033: 2502, 56: 2506, 2184: 2501,
+        1034: 2502, 2116: 2501, 577: 2503, 2114: 2501,
+        67: 2505, 580: 2503, 69: 2505, 70: 2505,
+        584: 2503, 73: 2505, 74: 2505, 76: 2505,
+        592: 2503, 81: 2505, 82: 2505, 1537: 2502,
+        88: 2505, 608: 2503, 97: 2505, 98: 2505,
+        100: 2505, 2065: 2501, 104: 2505, 1042: 2502,
+        515: 2503, 1538: 2502, 19: 2507, 2561: 2501,
+        532: 2503, 1044: 2502, 2084: 2501, 1664: 2502,
+        641: 2503, 1154: 2502, 131: 2504, 644: 2503,
+        133: 2504, 134: 2504, 648: 2503, 137: 2504,
+        138: 2504, 140: 2504, 656: 2503, 145: 2504,
+        146: 2504, 148: 2504, 152: 2504, 2068: 2501,
+        672: 2503, 161: 2504, 162: 2504, 164: 2504,
+        168: 2504, 1216: 2502, 176: 2504, 1058: 2502,
+        2120: 2501, 704: 2503, 193: 2504, 194: 2504,
+        196: 2504, 2081: 2501, 200: 2504, 2240: 2501,
+        546: 2503, 2564: 2501, 208: 2504, 1060: 2502,
+        1030: 2502, 2053: 2501, 2562: 2501, 3076: 2501,
+        224: 2504, 1064: 2502, 1048: 2502, 2088: 2501,
+        2054: 2501, 530: 2503, 2688: 2501, 1153: 2502,
+        2208: 2501, 642: 2503, 2072: 2501, 1156: 2502,
+        1072: 2502, 112: 2505, 2192: 2501, 1160: 2502,
+        2568: 2501, 2057: 2501, 3080: 2501, 1168: 2502,
+        3088: 2501, 2177: 2501, 1120: 2502, 3200: 2501,
+        2058: 2501, 1600: 2502, 2178: 2501, 1089: 2502,
+        2144: 2501, 578: 2503, 1036: 2502, 1092: 2502,
+        2128: 2501, 2060: 2501, 1096: 2502, 1184: 2502,
+        2180: 2501, 2624: 2501, 1104: 2502, 1090: 2502,
+        2113: 2501, 2096: 2501, 3136: 2501, 545: 2503,
+        84: 2505 },
+        4353: { 64: 2505, 32: 2506, 2: 2510, 4: 2509,
+        1024: 2502, 8: 2508, 128: 2504, 16: 2507,
+        512: 2503, 2048: 2501 },
+        5376: { 32: 2481, 1: 2481, 2: 2481, 4: 2481,
+        2048: 2479, 8: 2481, 64: 2481, 128: 2481,
+        16: 2481, 512: 2480 },
+        2336: { 64: 2626, 1: 2627, 2: 2627, 4096: 2622,
+        4: 2627, 1024: 2623, 8: 2627, 128: 2625,
+        16: 2627, 512: 2624 },
+        2308: { 64: 2626, 1: 2630, 2: 2630, 4096: 2622,
+        1024: 2623, 32: 2627, 8: 2629, 128: 2625,
+        16: 2628, 512: 2624 },
+        289: { 128: 2956, 64: 2957, 2: 2961, 4096: 2952,
+        4: 2960, 1024: 2954, 8: 2959, 16: 2958,
+        512: 2955, 2048: 2953 },
+        4354: { 64: 2505, 1: 2510, 4: 2509, 1024: 2502,
+        32: 2506, 8: 2508, 128: 2504, 16: 2507,
+        512: 2503, 2048: 2501 },
+        2240: { 32: 2637, 1: 2637, 2: 2637, 4096: 2633,
+        4: 2637, 1024: 2634, 8: 2637, 256: 2636,
+        16: 2637, 512: 2635 },
+        6400: { 32: 2470, 1: 2470, 2: 2470, 4: 2470,
+        1024: 2468, 8: 2470, 64: 2470, 128: 2470,
+        16: 2470, 512: 2469 },
+        1792: { 32: 2723, 1: 2723, 2: 2723, 4096: 2721,
+        4: 2723, 2048: 2722, 8: 2723, 64: 2723,
+        128: 2723, 16: 2723 },
+        2688: { 32: 2614, 1: 2614, 2: 2614, 4096: 2611,
+        4: 2614, 1024: 2612, 8: 2614, 64: 2614,
+        256: 2613, 16: 2614 },
+        4288: { 32: 2516, 1: 2516, 2: 2516, 4: 2516,
+        1024: 2513, 8: 2516, 256: 2515, 16: 2516,
+        512: 2514, 2048: 2512 },
+        2176: { 5632: 2633, 4609: 2633, 5122: 2633, 1027: 2634,
+        1540: 2634, 4101: 2633, 4102: 2633, 7: 2641,
+        1544: 2634, 521: 2635, 4106: 2633, 11: 2640,
+        524: 2635, 13: 2640, 14: 2640, 1552: 2634,
+        4113: 2633, 4114: 2633, 4099: 2633, 529: 2635,
+        21: 2639, 22: 2639, 536: 2635, 25: 2639,
+        26: 2639, 28: 2639, 517: 2635, 1568: 2634,
+        1057: 2634, 546: 2635, 35: 2638, 548: 2635,
+        37: 2638, 38: 2638, 4144: 2633, 552: 2635,
+        41: 2638, 42: 2638, 44: 2638, 5152: 2633,
+        560: 2635, 49: 2638, 50: 2638, 52: 2638,
+        4105: 2633, 56: 2638, 522: 2635, 1600: 2634,
+        4161: 2633, 578: 2635, 67: 2637, 580: 2635,
+        69: 2637, 70: 2637, 584: 2635, 73: 2637,
+        74: 2637, 1281: 2634, 4384: 2633, 592: 2635,
+        81: 2637, 82: 2637, 1537: 2634, 4416: 2633,
+        4640: 2633, 88: 2637, 608: 2635, 97: 2637,
+        98: 2637, 100: 2637, 4129: 2633, 1041: 2634,
+        104: 2637, 1282: 2634, 530: 2635, 4368: 2633,
+        515: 2635, 1538: 2634, 19: 2639, 4624: 2633,
+        532: 2635, 4672: 2633, 1044: 2634, 4164: 2633,
+        4130: 2633, 5136: 2633, 1048: 2634, 4864: 2633,
+        112: 2637, 1284: 2634, 4353: 2633, 5376: 2633,
+        1029: 2634, 4132: 2633, 1312: 2634, 5121: 2633,
+        545: 2635, 518: 2635, 1058: 2634, 5184: 2633,
+        4610: 2633, 1060: 2634, 1030: 2634, 4116: 2633,
+        1064: 2634, 4192: 2633, 4168: 2633, 1792: 1601,
+        769: 2635, 770: 2635, 259: 2636, 772: 2635,
+        261: 2636, 262: 2636, 776: 2635, 265: 2636,
+        266: 2636, 268: 2636, 4612: 2633, 1120: 2634,
+        784: 2635, 273: 2636, 274: 2636, 276: 2636,
+        280: 2636, 5124: 2633, 800: 2635, 289: 2636,
+        290: 2636, 4356: 2633, 292: 2636, 296: 2636,
+        304: 2636, 1033: 2634, 4136: 2633, 832: 2635,
+        321: 2636, 322: 2636, 324: 2636, 328: 2636,
+        1042: 2634, 336: 2636, 1034: 2634, 4120: 2633,
+        352: 2636, 1296: 2634, 4360: 2633, 1344: 2634,
+        4616: 2633, 577: 2635, 4162: 2633, 1036: 2634,
+        5128: 2633, 1288: 2634, 1092: 2634, 1096: 2634,
+        1089: 2634, 1072: 2634, 76: 2637, 1104: 2634,
+        1090: 2634, 4176: 2633, 4108: 2633, 4354: 2633,
+        84: 2637 },
+        3200: { 32: 2603, 1: 2603, 2: 2603, 4: 2603,
+        4096: 2600, 8: 2603, 64: 2603, 256: 2602,
+        16: 2603, 512: 2601 },
+        4360: { 64: 2505, 1: 2508, 2: 2508, 4: 2508,
+        1024: 2502, 32: 2506, 128: 2504, 16: 2507,
+        512: 2503, 2048: 2501 },
+        2368: { 32: 2626, 1: 2626, 2: 2626, 4096: 2622,
+        4: 2626, 1024: 2623, 8: 2626, 128: 2625,
+        16: 2626, 512: 2624 },
+        2178: { 64: 2637, 1: 2642, 4096: 2633, 4: 2641,
+        1024: 2634, 32: 2638, 8: 2640, 256: 2636,
+        16: 2639, 512: 2635 },
+        64: { 2048: 84, 1: 94, 2: 93, 4: 92,
+        6151: 4653, 8: 91, 6155: 4652, 6157: 4652,
+        6158: 4652, 2063: 4740, 16: 90, 6163: 4651,
+        6165: 4651, 6166: 4651, 2071: 4737, 6169: 4651,
+        6170: 4651, 4123: 4691, 6172: 4651, 4125: 4691,
+        4126: 4691, 31: 1608, 32: 89, 4784: 4666,
+        6179: 4650, 6181: 4650, 6182: 4650, 2087: 4733,
+        6185: 4650, 6186: 4650, 4139: 4687, 6188: 4650,
+        2093: 4732, 2094: 4732, 47: 4850, 6193: 4650,
+        6194: 4650, 4147: 4686, 6196: 4650, 2101: 4731,
+        2102: 4731, 55: 4847, 6200: 4650, 4153: 4686,
+        2106: 4731, 59: 4846, 2108: 1606, 61: 1606,
+        62: 1606, 4912: 4665, 5131: 4661, 3085: 4706,
+        5134: 4661, 4111: 1609, 5000: 4665, 5254: 4658,
+        4504: 4673, 5139: 4660, 5141: 4660, 128: 88,
+        6275: 4649, 6277: 4649, 6278: 4649, 4231: 4683,
+        6281: 4649, 6282: 4649, 2187: 4727, 6284: 4649,
+        2189: 4727, 2190: 4727, 143: 4840, 6289: 4649,
+        6290: 4649, 2195: 4726, 6292: 4649, 4245: 4681,
+        2198: 4726, 151: 4837, 6296: 4649, 2201: 4726,
+        2202: 4726, 155: 4836, 2204: 4726, 157: 4836,
+        158: 4836, 6305: 4649, 6306: 4649, 2211: 4725,
+        6308: 4649, 2213: 4725, 2214: 4725, 167: 4833,
+        6312: 4649, 4265: 4680, 2218: 4725, 171: 4832,
+        2220: 4725, 173: 4832, 174: 4832, 2077: 4736,
+        6320: 4649, 4273: 4680, 2226: 4725, 179: 4831,
+        2228: 4725, 181: 4831, 182: 4831, 2232: 1605,
+        185: 1605, 186: 1605, 188: 1605, 5155: 4659,
+        3109: 4704, 5158: 4659, 4135: 4688, 5161: 4659,
+        5162: 4659, 256: 87, 1067: 4768, 6405: 4648,
+        6406: 4648, 2311: 4722, 6409: 4648, 6410: 4648,
+        4363: 4676, 6412: 4648, 4365: 4676, 2318: 4721,
+        271: 4825, 6417: 4648, 6418: 4648, 2323: 4720,
+        6420: 4648, 2325: 4720, 2326: 4720, 279: 4822,
+        6424: 4648, 2329: 4720, 2330: 4720, 283: 4821,
+        2332: 4720, 285: 4821, 286: 4821, 2437: 4718,
+        6433: 4648, 4374: 4675, 2339: 4719, 6436: 4648,
+        2341: 4719, 2342: 4719, 295: 4818, 6440: 4648,
+        4393: 4674, 2346: 4719, 299: 4817, 2348: 4719,
+        301: 4817, 302: 4817, 2225: 4725, 2353: 4719,
+        2354: 4719, 2099: 4731, 2356: 4719, 309: 4816,
+        310: 4816, 2441: 4718, 2360: 4719, 313: 4816,
+        314: 4816, 316: 1606, 4490: 4673, 4149: 4686,
+        4150: 4686, 4492: 4673, 5176: 4659, 2105: 4731,
+        4154: 4686, 5520: 4657, 4497: 4673, 4156: 1606,
+        4498: 4673, 5127: 4662, 4500: 4673, 5400: 4657,
+        6529: 4648, 6530: 4648, 4483: 4673, 6532: 4648,
+        4485: 4673, 2438: 4718, 391: 4813, 6536: 4648,
+        4489: 4673, 2442: 4718, 395: 4812, 2444: 4718,
+        397: 4812, 398: 4812, 6544: 4648, 2449: 4718,
+        2450: 4718, 403: 4811, 2452: 4718, 405: 4811,
+        406: 4811, 2456: 4718, 409: 4811, 410: 4811,
+        412: 4811, 6560: 4648, 4513: 4673, 2466: 4718,
+        419: 4810, 2468: 4718, 421: 4810, 422: 4810,
+        2472: 4718, 425: 4810, 426: 4810, 428: 4810,
+        2480: 1604, 433: 1604, 434: 1604, 436: 1604,
+        4096: 83, 440: 1604, 4652: 4667, 4993: 4665,
+        5536: 4657, 6016: 1602, 2465: 4718, 4514: 4673,
+        4516: 4673, 4994: 4665, 4520: 4673, 512: 86,
+        6659: 4647, 6661: 4647, 6662: 4647, 3841: 4701,
+        6665: 4647, 6666: 4647, 2571: 4714, 6668: 4647,
+        4621: 4669, 2574: 4714, 527: 4804, 6673: 4647,
+        6674: 4647, 4627: 4668, 6676: 4647, 2581: 4713,
+        2582: 4713, 535: 4801, 6680: 4647, 2585: 4713,
+        2586: 4713, 539: 4800, 2588: 4713, 541: 4800,
+        542: 4800, 4869: 4665, 6689: 4647, 6690: 4647,
+        2595: 4712, 6692: 4647, 4645: 4667, 2598: 4712,
+        551: 4797, 6696: 4647, 4649: 4667, 2602: 4712,
+        555: 4796, 2604: 4712, 557: 4796, 558: 4796,
+        6704: 4647, 4657: 4667, 2610: 4712, 563: 4795,
+        2612: 4712, 565: 4795, 566: 4795, 2825: 4710,
+        2616: 4712, 569: 4795, 570: 4795, 572: 1606,
+        4874: 4665, 4876: 4665, 5680: 4656, 5904: 4656,
+        4881: 4665, 4882: 4665, 4884: 4665, 5272: 4658,
+        6785: 4647, 6786: 4647, 2691: 4711, 6788: 4647,
+        4741: 4666, 2694: 4711, 647: 4792, 6792: 4647,
+        2697: 4711, 2698: 4711, 651: 4791, 2700: 4711,
+        653: 4791, 654: 4791, 6800: 4647, 2705: 4711,
+        2706: 4711, 659: 4790, 2708: 4711, 661: 4790,
+        662: 4790, 2712: 4711, 665: 4790, 666: 4790,
+        4246: 4681, 668: 4790, 6816: 4647, 2721: 4711,
+        2722: 4711, 675: 4789, 2724: 4711, 677: 4789,
+        678: 4789, 2728: 4711, 681: 4789, 682: 4789,
+        684: 4789, 2736: 4711, 689: 4789, 690: 4789,
+        692: 4789, 696: 1605, 5920: 4656, 4897: 4665,
+        6434: 4648, 4898: 4665, 4900: 4665, 5170: 4659,
+        1832: 4746, 4867: 4665, 5890: 4656, 6913: 4647,
+        6914: 4647, 2819: 4710, 6916: 4647, 2821: 4710,
+        2822: 4710, 775: 4786, 6920: 4647, 4873: 4665,
+        2826: 4710, 779: 4785, 2828: 4710, 781: 4785,
+        782: 4785, 6928: 4647, 2833: 4710, 2834: 4710,
+        787: 4784, 2836: 4710, 789: 4784, 790: 4784,
+        2840: 4710, 793: 4784, 794: 4784, 796: 4784,
+        3205: 4703, 6944: 4647, 2849: 4710, 2850: 4710,
+        803: 4783, 2852: 4710, 805: 4783, 806: 4783,
+        4664: 4667, 2856: 4710, 809: 4783, 810: 4783,
+        2183: 4728, 812: 4783, 2864: 4710, 817: 4783,
+        818: 4783, 4528: 1604, 820: 4783, 5892: 4656,
+        5257: 4658, 4119: 4692, 5142: 4660, 5258: 4658,
+        4235: 4682, 5260: 4658, 4237: 4682, 824: 4783,
+        4870: 4665, 4238: 4682, 5265: 4658, 5266: 4658,
+        2075: 4736, 4243: 4681, 5268: 4658, 2197: 4726,
+        7040: 4647, 2945: 4710, 2946: 4710, 899: 4782,
+        2948: 4710, 901: 4782, 902: 4782, 2952: 4710,
+        905: 4782, 906: 4782, 908: 4782, 2960: 4710,
+        913: 4782, 914: 4782, 5145: 4660, 4249: 4681,
+        920: 4782, 4250: 4681, 2976: 1603, 929: 1603,
+        930: 1603, 932: 1603, 936: 1603, 4252: 4681,
+        5896: 4656, 944: 1603, 5146: 4660, 4396: 4674,
+        5281: 4658, 2078: 4736, 5282: 4658, 4259: 4680,
+        5424: 4657, 5284: 4658, 4261: 4680, 4262: 4680,
+        5148: 4660, 5288: 4658, 2217: 4725, 4266: 4680,
+        1024: 85, 7171: 4646, 7173: 4646, 7174: 4646,
+        3079: 4707, 7177: 4646, 7178: 4646, 3083: 4706,
+        7180: 4646, 5133: 4661, 3086: 4706, 1039: 4776,
+        7185: 4646, 7186: 4646, 3091: 4705, 7188: 4646,
+        3093: 4705, 3094: 4705, 1047: 4773, 7192: 4646,
+        3097: 4705, 3098: 4705, 1051: 4772, 3100: 4705,
+        1053: 4772, 1054: 4772, 5637: 4656, 7201: 4646,
+        7202: 4646, 3107: 4704, 7204: 4646, 5157: 4659,
+        3110: 4704, 1063: 4769, 7208: 4646, 3113: 4704,
+        3114: 4704, 2567: 4715, 3116: 4704, 1069: 4768,
+        1070: 4768, 7216: 4646, 5169: 4659, 3122: 4704,
+        1075: 4767, 3124: 4704, 1077: 4767, 1078: 4767,
+        5641: 4656, 3128: 4704, 1081: 4767, 1082: 4767,
+        1084: 1606, 5642: 4656, 4619: 4669, 5644: 4656,
+        2573: 4714, 4280: 1605, 4622: 4669, 3601: 4701,
+        5650: 4656, 6448: 4648, 2579: 4713, 5652: 4656,
+        4629: 4668, 7297: 4646, 7298: 4646, 5251: 4658,
+        7300: 4646, 5253: 4658, 3206: 4703, 1159: 4764,
+        7304: 4646, 3209: 4703, 3210: 4703, 1163: 4763,
+        3212: 4703, 1165: 4763, 1166: 4763, 7312: 4646,
+        3217: 4703, 3218: 4703, 1171: 4762, 3220: 4703,
+        1173: 4762, 1174: 4762, 4633: 4668, 3224: 4703,
+        1177: 4762, 1178: 4762, 1180: 4762, 4634: 4668,
+        7328: 4646, 3233: 4703, 3234: 4703, 1187: 4761,
+        3236: 4703, 1189: 4761, 1190: 4761, 3240: 4703,
+        1193: 4761, 1194: 4761, 1196: 4761, 3248: 4703,
+        1201: 4761, 1202: 4761, 4268: 4680, 1204: 4761,
+        1208: 1605, 3617: 4701, 5666: 4656, 4643: 4667,
+        5668: 4656, 2597: 4712, 4646: 4667, 5672: 4656,
+        2601: 4712, 4650: 4667, 7425: 4646, 7426: 4646,
+        5379: 4657, 7428: 4646, 3333: 4702, 3334: 4702,
+        1287: 4758, 7432: 4646, 5385: 4657, 3338: 4702,
+        1291: 4757, 3340: 4702, 1293: 4757, 1294: 4757,
+        5635: 4656, 3345: 4702, 3346: 4702, 1299: 4756,
+        3348: 4702, 1301: 4756, 1302: 4756, 3352: 4702,
+        1305: 4756, 1306: 4756, 1308: 4756, 7456: 4646,
+        3361: 4702, 3362: 4702, 1315: 4755, 3364: 4702,
+        1317: 4755, 1318: 4755, 2609: 4712, 3368: 4702,
+        1321: 4755, 1322: 4755, 1324: 4755, 4658: 4667,
+        3376: 4702, 1329: 4755, 1330: 4755, 1332: 4755,
+        1336: 4755, 4660: 4667, 5296: 4658, 2091: 4732,
+        5008: 4665, 4274: 4680, 4615: 4670, 5638: 4656,
+        4888: 4665, 916: 4782, 7552: 4646, 3457: 4702,
+        3458: 4702, 1411: 4754, 3460: 4702, 1413: 4754,
+        1414: 4754, 3464: 4702, 1417: 4754, 1418: 4754,
+        1420: 4754, 3472: 4702, 1425: 4754, 1426: 4754,
+        1428: 4754, 1432: 4754, 3488: 4702, 1441: 4754,
+        1442: 4754, 4276: 4680, 1444: 4754, 1448: 4754,
+        2435: 4718, 1456: 1604, 5024: 1603, 4141: 4687,
+        5164: 4659, 5505: 4657, 4142: 4687, 5506: 4657,
+        5512: 4657, 7681: 4646, 7682: 4646, 3587: 4701,
+        7684: 4646, 3589: 4701, 3590: 4701, 1543: 4751,
+        7688: 4646, 3593: 4701, 3594: 4701, 1547: 4750,
+        3596: 4701, 1549: 4750, 1550: 4750, 7696: 4646,
+        5649: 4656, 3602: 4701, 1555: 4749, 3604: 4701,
+        1557: 4749, 1558: 4749, 3608: 4701, 1561: 4749,
+        1562: 4749, 1564: 4749, 5381: 4657, 7712: 4646,
+        5665: 4656, 3618: 4701, 1571: 4748, 3620: 4701,
+        1573: 4748, 1574: 4748, 3624: 4701, 1577: 4748,
+        1578: 4748, 4359: 4677, 1580: 4748, 3632: 4701,
+        1585: 4748, 1586: 4748, 1588: 4748, 3337: 4702,
+        1592: 4748, 5386: 4657, 2315: 4721, 4486: 4673,
+        5388: 4657, 2317: 4721, 4366: 4676, 7440: 4646,
+        5393: 4657, 5394: 4657, 4371: 4675, 5396: 4657,
+        4373: 4675, 7808: 4646, 5761: 4656, 3714: 4701,
+        1667: 4747, 3716: 4701, 1669: 4747, 1670: 4747,
+        3720: 4701, 1673: 4747, 1674: 4747, 1676: 4747,
+        3728: 4701, 1681: 4747, 1682: 4747, 1684: 4747,
+        4377: 4675, 1688: 4747, 4378: 4675, 3744: 4701,
+        1697: 4747, 1698: 4747, 1700: 4747, 1704: 4747,
+        4380: 4675, 1712: 4747, 3121: 4704, 5172: 4659,
+        5409: 4657, 3331: 4702, 5410: 4657, 4387: 4674,
+        5508: 4657, 5412: 4657, 4389: 4674, 4390: 4674,
+        5416: 4657, 2345: 4719, 4394: 4674, 7936: 1600,
+        5889: 4656, 3842: 4701, 1795: 4746, 3844: 4701,
+        1797: 4746, 1798: 4746, 3713: 4701, 3848: 4701,
+        1801: 4746, 1802: 4746, 1804: 4746, 5762: 4656,
+        3856: 4701, 1809: 4746, 1810: 4746, 4739: 4666,
+        1812: 4746, 1816: 4746, 5764: 4656, 2693: 4711,
+        3872: 4701, 1825: 4746, 1826: 4746, 1828: 4746,
+        4742: 4666, 4401: 4674, 6403: 4648, 4630: 4668,
+        4402: 4674, 1840: 4746, 5768: 4656, 307: 4816,
+        4996: 4665, 4745: 4666, 4404: 4674, 4746: 4666,
+        4748: 4666, 4904: 4665, 4408: 4674, 5776: 4656,
+        5382: 4657, 4753: 4666, 4754: 4666, 4756: 4666,
+        3968: 1601, 1921: 1602, 1922: 1602, 1924: 1602,
+        5656: 4656, 1928: 1602, 1936: 1602, 4760: 4666,
+        1952: 1602, 5792: 4656, 3203: 4703, 4769: 4666,
+        4770: 4666, 4772: 4666, 4636: 4668, 4776: 4666 },
+        4224: { 3584: 2512, 3073: 2512, 3074: 2512, 1027: 2513,
+        1540: 2513, 517: 2514, 518: 2514, 7: 2520,
+        1544: 2513, 521: 2514, 522: 2514, 11: 2519,
+        524: 2514, 13: 2519, 14: 2519, 2336: 2512,
+        1552: 2513, 1041: 2513, 2066: 2512, 2051: 2512,
+        529: 2514, 21: 2518, 22: 2518, 2592: 2512,
+        536: 2514, 25: 2518, 26: 2518, 28: 2518,
+        1029: 2513, 1568: 2513, 1057: 2513, 2082: 2512,
+        35: 2517, 548: 2514, 37: 2517, 38: 2517,
+        3104: 2512, 552: 2514, 41: 2517, 42: 2517,
+        44: 2517, 2320: 2512, 560: 2514, 49: 2517,
+        50: 2517, 52: 2517, 2576: 2512, 1033: 2513,
+        56: 2517, 1034: 2513, 2116: 2512, 577: 2514,
+        2114: 2512, 67: 2516, 580: 2514, 69: 2516,
+        70: 2516, 584: 2514, 73: 2516, 74: 2516,
+        1281: 2513, 592: 2514, 81: 2516, 82: 2516,
+        1537: 2513, 88: 2516, 2816: 2512, 608: 2514,
+        97: 2516, 98: 2516, 100: 2516, 2065: 2512,
+        104: 2516, 1282: 2513, 2305: 2512, 530: 2514,
+        3328: 2512, 515: 2514, 1538: 2513, 19: 2518,
+        2561: 2512, 532: 2514, 1044: 2513, 2084: 2512,
+        2306: 2512, 1048: 2513, 2562: 2512, 2068: 2512,
+        112: 2516, 1284: 2513, 1058: 2513, 2120: 2512,
+        1312: 2513, 2308: 2512, 2081: 2512, 546: 2514,
+        2564: 2512, 1060: 2513, 1030: 2513, 2053: 2512,
+        3076: 2512, 1064: 2513, 2088: 2512, 2054: 2512,
+        1792: 2513, 769: 2514, 770: 2514, 259: 2515,
+        772: 2514, 261: 2515, 262: 2515, 776: 2514,
+        265: 2515, 266: 2515, 268: 2515, 1120: 2513,
+        784: 2514, 273: 2515, 274: 2515, 276: 2515,
+        2072: 2512, 280: 2515, 1288: 2513, 800: 2514,
+        289: 2515, 290: 2515, 292: 2515, 296: 2515,
+        304: 2515, 2312: 2512, 832: 2514, 321: 2515,
+        322: 2515, 324: 2515, 2568: 2512, 328: 2515,
+        1042: 2513, 336: 2515, 2057: 2512, 3080: 2512,
+        352: 2515, 3088: 2512, 1296: 2513, 2058: 2512,
+        1344: 2513, 1089: 2513, 2144: 2512, 578: 2514,
+        1036: 2513, 1092: 2513, 2128: 2512, 2060: 2512,
+        1096: 2513, 1600: 2513, 1072: 2513, 76: 2516,
+        2368: 2512, 2624: 2512, 1104: 2513, 1090: 2513,
+        2113: 2512, 2096: 2512, 3136: 2512, 545: 2514,
+        84: 2516 },
+        4225: { 64: 2516, 32: 2517, 2: 2521, 4: 2520,
+        1024: 2513, 8: 2519, 256: 2515, 16: 2518,
+        512: 2514, 2048: 2512 },
+        5248: { 32: 2482, 1: 2482, 2: 2482, 4: 2482,
+        2048: 2479, 8: 2482, 64: 2482, 256: 2481,
+        16: 2482, 512: 2480 },
+        2180: { 64: 2637, 1: 2641, 2: 2641, 4096: 2633,
+        1024: 2634, 32: 2638, 8: 2640, 256: 2636,
+        16: 2639, 512: 2635 },
+        2112: { 5632: 2644, 4609: 2644, 5122: 2644, 1027: 2645,
+        1540: 2645, 4101: 2644, 4102: 2644, 7: 2652,
+        1544: 2645, 4105: 2644, 4106: 2644, 11: 2651,
+        524: 2646, 13: 2651, 14: 2651, 4228: 2644,
+        1552: 2645, 4113: 2644, 4114: 2644, 4099: 2644,
+        529: 2646, 21: 2650, 22: 2650, 536: 2646,
+        25: 2650, 26: 2650, 28: 2650, 517: 2646,
+        1568: 2645, 1057: 2645, 546: 2646, 35: 2649,
+        548: 2646, 37: 2649, 38: 2649, 4144: 2644,
+        552: 2646, 41: 2649, 42: 2649, 44: 2649,
+        5152: 2644, 560: 2646, 49: 2649, 50: 2649,
+        52: 2649, 1033: 2645, 56: 2649, 522: 2646,
+        1042: 2645, 1036: 2645, 1281: 2645, 4384: 2644,
+        1537: 2645, 4640: 2644, 770: 2646, 1060: 2645,
+        1296: 2645, 4129: 2644, 1041: 2645, 1282: 2645,
+        530: 2646, 4368: 2644, 515: 2646, 1538: 2645,
+        19: 2650, 4624: 2644, 532: 2646, 4232: 2644,
+        1044: 2645, 1664: 2645, 4225: 2644, 1154: 2645,
+        131: 2648, 644: 2646, 133: 2648, 134: 2648,
+        648: 2646, 137: 2648, 138: 2648, 140: 2648,
+        656: 2646, 145: 2648, 146: 2648, 4130: 2644,
+        152: 2648, 4864: 2644, 672: 2646, 161: 2648,
+        162: 2648, 164: 2648, 1284: 2645, 168: 2648,
+        4353: 2644, 5376: 2644, 176: 2648, 4120: 2644,
+        1029: 2645, 4132: 2644, 1312: 2645, 5121: 2644,
+        545: 2646, 518: 2646, 1058: 2645, 4610: 2644,
+        292: 2647, 1030: 2645, 4116: 2644, 1064: 2645,
+        1048: 2645, 1792: 2645, 769: 2646, 4354: 2644,
+        259: 2647, 772: 2646, 261: 2647, 262: 2647,
+        641: 2646, 776: 2646, 265: 2647, 266: 2647,
+        268: 2647, 4226: 2644, 4612: 2644, 784: 2646,
+        273: 2647, 274: 2647, 276: 2647, 280: 2647,
+        1156: 2645, 5124: 2644, 800: 2646, 289: 2647,
+        290: 2647, 4356: 2644, 521: 2646, 296: 2647,
+        304: 2647, 1160: 2645, 1408: 2645, 5136: 2644,
+        4136: 2644, 1153: 2645, 4256: 2644, 1034: 2645,
+        642: 2646, 1168: 2645, 4240: 2644, 148: 2648,
+        4360: 2644, 896: 2646, 385: 2647, 386: 2647,
+        388: 2647, 4616: 2644, 392: 2647, 400: 2647,
+        4480: 2644, 5128: 2644, 1288: 2645, 4736: 2644,
+        416: 2647, 5248: 2644, 1184: 2645, 1072: 2645,
+        4108: 2644 },
+        6272: { 32: 2471, 1: 2471, 2: 2471, 4: 2471,
+        1024: 2468, 8: 2471, 64: 2471, 256: 2470,
+        16: 2471, 512: 2469 },
+        544: { 7168: 2864, 3073: 2865, 6146: 2864, 1027: 2866,
+        3076: 2865, 4101: 2864, 4102: 2864, 7: 2872,
+        3080: 2865, 1033: 2866, 4106: 2864, 11: 2871,
+        1036: 2866, 13: 2871, 14: 2871, 4228: 2864,
+        3088: 2865, 4113: 2864, 4114: 2864, 2051: 2865,
+        1044: 2866, 21: 2870, 22: 2870, 1048: 2866,
+        25: 2870, 26: 2870, 28: 2870, 1029: 2866,
+        1030: 2866, 5184: 2864, 2312: 2865, 4105: 2864,
+        1034: 2866, 2116: 2865, 4161: 2864, 2114: 2865,
+        67: 2869, 2065: 2865, 69: 2869, 70: 2869,
+        1096: 2866, 73: 2869, 74: 2869, 76: 2869,
+        1104: 2866, 81: 2869, 82: 2869, 84: 2869,
+        4416: 2864, 88: 2869, 2320: 2865, 1041: 2866,
+        1282: 2866, 2305: 2865, 2066: 2865, 4368: 2864,
+        19: 2870, 2068: 2865, 4232: 2864, 4164: 2864,
+        4225: 2864, 1154: 2866, 131: 2868, 1156: 2866,
+        133: 2868, 134: 2868, 1160: 2866, 137: 2868,
+        138: 2868, 140: 2868, 1168: 2866, 145: 2868,
+        146: 2868, 148: 2868, 152: 2868, 196: 2868,
+        3074: 2865, 5136: 2864, 6160: 2864, 5376: 2864,
+        1216: 2866, 193: 2868, 194: 2868, 5121: 2864,
+        2308: 2865, 200: 2868, 4354: 2864, 2240: 2865,
+        6400: 2864, 208: 2868, 2053: 2865, 4116: 2864,
+        4099: 2864, 5122: 2864, 6145: 2864, 4168: 2864,
+        2054: 2865, 3328: 2865, 4353: 2864, 2306: 2865,
+        259: 2867, 1284: 2866, 261: 2867, 262: 2867,
+        1153: 2866, 1288: 2866, 265: 2867, 266: 2867,
+        268: 2867, 2178: 2865, 1296: 2866, 273: 2867,
+        274: 2867, 276: 2867, 2072: 2865, 280: 2867,
+        2180: 2865, 5124: 2864, 4356: 2864, 3200: 2865,
+        2184: 2865, 6148: 2864, 1344: 2866, 321: 2867,
+        322: 2867, 324: 2867, 328: 2867, 1042: 2866,
+        336: 2867, 2432: 2865, 2057: 2865, 4120: 2864,
+        4288: 2864, 2192: 2865, 2177: 2865, 4240: 2864,
+        6208: 2864, 2058: 2865, 4360: 2864, 1281: 2866,
+        1408: 2866, 385: 2867, 386: 2867, 388: 2867,
+        1089: 2866, 392: 2867, 3136: 2865, 4162: 2864,
+        400: 2867, 4480: 2864, 5128: 2864, 1092: 2866,
+        5248: 2864, 2060: 2865, 2120: 2865, 6152: 2864,
+        448: 1603, 4226: 2864, 6272: 2864, 2368: 2865,
+        2128: 2865, 1090: 2866, 2113: 2865, 4176: 2864,
+        4108: 2864 },
+        2113: { 128: 2648, 32: 2649, 2: 2653, 4096: 2644,
+        4: 2652, 1024: 2645, 8: 2651, 256: 2647,
+        16: 2650, 512: 2646 },
+        3136: { 32: 2604, 1: 2604, 2: 2604, 4: 2604,
+        4096: 2600, 8: 2604, 128: 2603, 256: 2602,
+        16: 2604, 512: 2601 },
+        272: { 3584: 2964, 3073: 2964, 6146: 2963, 1027: 2965,
+        1540: 2965, 4101: 2963, 4102: 2963, 7: 2971,
+        1544: 2965, 1033: 2965, 4106: 2963, 11: 2970,
+        1036: 2965, 13: 2970, 14: 2970, 4228: 2963,
+        515: 2966, 2592: 2964, 4672: 2963, 2564: 2964,
+        517: 2966, 1092: 2965, 1057: 2965, 2082: 2964,
+        35: 2969, 548: 2966, 37: 2969, 38: 2969,
+        3104: 2964, 552: 2966, 41: 2969, 42: 2969,
+        44: 2969, 2568: 2964, 4105: 2963, 2184: 2964,
+        522: 2966, 2116: 2964, 4161: 2963, 2114: 2964,
+        67: 2968, 4162: 2963, 69: 2968, 70: 2968,
+        584: 2966, 73: 2968, 74: 2968, 76: 2968,
+        1537: 2965, 4640: 2963, 546: 2966, 97: 2968,
+        98: 2968, 100: 2968, 4129: 2963, 5152: 2963,
+        104: 2968, 1538: 2965, 2561: 2964, 4232: 2963,
+        2084: 2964, 4164: 2963, 641: 2966, 1154: 2965,
+        4130: 2963, 644: 2966, 133: 2967, 134: 2967,
+        6176: 2963, 648: 2966, 137: 2967, 138: 2967,
+        140: 2967, 2562: 2964, 196: 2967, 2051: 2964,
+        161: 2967, 162: 2967, 164: 2967, 168: 2967,
+        1216: 2965, 4609: 2963, 5632: 2963, 2120: 2964,
+        1029: 2965, 4132: 2963, 704: 2966, 193: 2967,
+        194: 2967, 5121: 2963, 2081: 2964, 200: 2967,
+        518: 2966, 2240: 2964, 1058: 2965, 5184: 2963,
+        4610: 2963, 6656: 2963, 1060: 2965, 1030: 2965,
+        2053: 2964, 3076: 2964, 4099: 2963, 5122: 2963,
+        4226: 2963, 6145: 2963, 7168: 2963, 1184: 2965,
+        1064: 2965, 2088: 2964, 4168: 2963, 2054: 2964,
+        1664: 2965, 4225: 2963, 2208: 2964, 4288: 2963,
+        642: 2966, 4612: 2963, 131: 2967, 1156: 2965,
+        5124: 2963, 521: 2966, 3074: 2964, 1160: 2965,
+        4136: 2963, 6148: 2963, 224: 1604, 1153: 2965,
+        4256: 2963, 1034: 2965, 2057: 2964, 3080: 2964,
+        608: 2966, 2688: 2964, 2177: 2964, 1120: 2965,
+        3200: 2964, 6208: 2963, 2058: 2964, 524: 2966,
+        1600: 2965, 2178: 2964, 577: 2966, 2144: 2964,
+        578: 2966, 5128: 2963, 580: 2966, 4736: 2963,
+        4616: 2963, 5248: 2963, 2060: 2964, 1096: 2965,
+        6152: 2963, 672: 2966, 2180: 2964, 1089: 2965,
+        4192: 2963, 6272: 2963, 2624: 2964, 1090: 2965,
+        2113: 2964, 3136: 2964, 4108: 2963, 545: 2966,
+        1568: 2965 },
+        136: { 3584: 3052, 3073: 3052, 3074: 3052, 1027: 3053,
+        1540: 3053, 4101: 3051, 4102: 3051, 7: 3059,
+        5152: 3051, 2306: 3052, 1296: 3053, 2336: 3052,
+        1552: 3053, 4113: 3051, 2066: 3052, 19: 3058,
+        529: 3054, 21: 3058, 22: 3058, 2592: 3052,
+        4672: 3051, 1284: 3053, 517: 3054, 1092: 3053,
+        1057: 3053, 2082: 3052, 35: 3057, 548: 3054,
+        37: 3057, 38: 3057, 4144: 3051, 5184: 3051,
+        3328: 3052, 2320: 3052, 560: 3054, 49: 3057,
+        50: 3057, 52: 3057, 2576: 3052, 2116: 3052,
+        4161: 3051, 2114: 3052, 67: 3056, 2065: 3052,
+        69: 3056, 70: 3056, 6208: 3051, 1281: 3053,
+        4384: 3051, 592: 3054, 81: 3056, 82: 3056,
+        1537: 3053, 4416: 3051, 4640: 3051, 3076: 3052,
+        2816: 3052, 546: 3054, 97: 3056, 98: 3056,
+        100: 3056, 4129: 3051, 1041: 3053, 1282: 3053,
+        2305: 3052, 4114: 3051, 4368: 3051, 515: 3054,
+        1538: 3053, 2561: 3052, 4624: 3051, 532: 3054,
+        1044: 3053, 2084: 3052, 4164: 3051, 5136: 3051,
+        6176: 3051, 2562: 3052, 2068: 3052, 2051: 3052,
+        112: 1605, 6160: 3051, 4353: 3051, 5376: 3051,
+        1058: 3053, 4609: 3051, 5632: 3051, 1029: 3053,
+        608: 3054, 4132: 3051, 1312: 3053, 5121: 3051,
+        2308: 3052, 2081: 3052, 518: 3054, 4130: 3051,
+        2564: 3052, 4610: 3051, 6656: 3051, 1060: 3053,
+        1030: 3053, 2053: 3052, 4116: 3051, 4099: 3051,
+        5122: 3051, 6145: 3051, 7168: 3051, 2054: 3052,
+        530: 3054, 1792: 3053, 769: 3054, 770: 3054,
+        259: 3055, 772: 3054, 261: 3055, 262: 3055,
+        4612: 3051, 784: 3054, 273: 3055, 274: 3055,
+        276: 3055, 4864: 3051, 5124: 3051, 800: 3054,
+        289: 3055, 290: 3055, 4356: 3051, 292: 3055,
+        304: 3055, 6148: 3051, 832: 3054, 321: 3055,
+        322: 3055, 324: 3055, 6400: 3051, 1042: 3053,
+        336: 3055, 6146: 3051, 4162: 3051, 352: 3055,
+        3088: 3052, 1120: 3053, 3104: 3052, 1344: 3053,
+        577: 3054, 2144: 3052, 3136: 3052, 578: 3054,
+        580: 3054, 2128: 3052, 1600: 3053, 1089: 3053,
+        1072: 3053, 4192: 3051, 2368: 3052, 1568: 3053,
+        2624: 3052, 1104: 3053, 1090: 3053, 2113: 3052,
+        2096: 3052, 4176: 3051, 545: 3054, 4354: 3051,
+        84: 3056 }
+    }
+
+# card_to_binary indexed by the integer value of a Card, so the
+# evaluators need one list index per card.
+Seven.card_index_to_binary = [
+    Seven.card_to_binary[index // 4 + 2][index % 4 + 1] for index in range(52)]
@@ -0,0 +1,5086 @@
+"""
+Lookup tables for the 6-card evaluator, imported by LookupTables on first use.
+"""
+from .perfect_hash import PerfectHash
+
+class Six:
+    # Convert to binary representation for six-card evaluator
+    # card_to_binary[rank][suit]
+    card_to_binary = [[], [],
+        [0, 73730, 77826, 86018, 94210],
+        [0, 139523, 143619, 151811, 160003],
+        [0, 270853, 274949, 283141, 291333],
+        [0, 533255, 537351, 545543, 553735],
+        [0, 1057803, 1061899, 1070091, 1078283],
+        [0, 2106637, 2110733, 2118925, 2127117],
+        [0, 4204049, 4208145, 4216337, 4224529],
+        [0, 8398611, 8402707, 8410899, 8419091],
+        [0, 16787479, 16791575, 16799767, 16807959],
+        [0, 33564957, 33569053, 33577245, 33585437],
+        [0, 67119647, 67123743, 67131935, 67140127],
+        [0, 134228773, 134232869, 134241061, 134249253],
+        [0, 268446761, 268450857, 268459049, 268467241]
+    ]
+    
+    # Given the product of prime values of suits (2,3,5,7) corresponding to
+    # (s,h,d,c) in a 6-card hand, if the value is in this set you have a flush.
+    prime_products_to_flush = {
+        # spades
+        64:2, 96:2, 160:2, 224:2,
+        # hearts
+        486:3, 729:3, 1215:3, 1701:3,
+        # diamonds
+        6250:5, 9375:5, 15625:5, 21875:5,
+        # clubs
+        33614:7, 50421:7, 84035:7, 117649:7
+    }
+    
+    flush_rank_bits_to_rank = {
+        31: 9, 47: 1599, 55: 1598, 59: 1597,
+        61: 1596, 62: 8, 63: 8, 79: 1595,
+        87: 1594, 91: 1593, 93: 1592, 94: 1591,
+        95: 9, 103: 1590, 107: 1589, 109: 1588,
+        110: 1587, 111: 1587, 115: 1586, 117: 1585,
+        118: 1584, 119: 1584, 121: 1583, 122: 1582,
+        123: 1582, 124: 7, 125: 7, 126: 7,
+        143: 1581, 151: 1580, 155: 1579, 157: 1578,
+        158: 1577, 159: 9, 167: 1576, 171: 1575,
+        173: 1574, 174: 1573, 175: 1573, 179: 1572,
+        181: 1571, 182: 1570, 183: 1570, 185: 1569,
+        186: 1568, 187: 1568, 188: 1567, 189: 1567,
+        190: 8, 199: 1566, 203: 1565, 205: 1564,
+        206: 1563, 207: 1563, 211: 1562, 213: 1561,
+        214: 1560, 215: 1560, 217: 1559, 218: 1558,
+        219: 1558, 220: 1557, 221: 1557, 222: 1557,
+        227: 1556, 229: 1555, 230: 1554, 231: 1554,
+        233: 1553, 234: 1552, 235: 1552, 236: 1551,
+        237: 1551, 238: 1551, 241: 1550, 242: 1549,
+        243: 1549, 244: 1548, 245: 1548, 246: 1548,
+        248: 6, 249: 6, 250: 6, 252: 6,
+        271: 1547, 279: 1546, 283: 1545, 285: 1544,
+        286: 1543, 287: 9, 295: 1542, 299: 1541,
+        301: 1540, 302: 1539, 303: 1539, 307: 1538,
+        309: 1537, 310: 1536, 311: 1536, 313: 1535,
+        314: 1534, 315: 1534, 316: 1533, 317: 1533,
+        318: 8, 327: 1532, 331: 1531, 333: 1530,
+        334: 1529, 335: 1529, 339: 1528, 341: 1527,
+        342: 1526, 343: 1526, 345: 1525, 346: 1524,
+        347: 1524, 348: 1523, 349: 1523, 350: 1523,
+        355: 1522, 357: 1521, 358: 1520, 359: 1520,
+        361: 1519, 362: 1518, 363: 1518, 364: 1517,
+        365: 1517, 366: 1517, 369: 1516, 370: 1515,
+        371: 1515, 372: 1514, 373: 1514, 374: 1514,
+        376: 1513, 377: 1513, 378: 1513, 380: 7,
+        391: 1512, 395: 1511, 397: 1510, 398: 1509,
+        399: 1509, 403: 1508, 405: 1507, 406: 1506,
+        407: 1506, 409: 1505, 410: 1504, 411: 1504,
+        412: 1503, 413: 1503, 414: 1503, 419: 1502,
+        421: 1501, 422: 1500, 423: 1500, 425: 1499,
+        426: 1498, 427: 1498, 428: 1497, 429: 1497,
+        430: 1497, 433: 1496, 434: 1495, 435: 1495,
+        436: 1494, 437: 1494, 438: 1494, 440: 1493,
+        441: 1493, 442: 1493, 444: 1493, 451: 1492,
+        453: 1491, 454: 1490, 455: 1490, 457: 1489,
+        458: 1488, 459: 1488, 460: 1487, 461: 1487,
+        462: 1487, 465: 1486, 466: 1485, 467: 1485,
+        468: 1484, 469: 1484, 470: 1484, 472: 1483,
+        473: 1483, 474: 1483, 476: 1483, 481: 1482,
+        482: 1481, 483: 1481, 484: 1480, 485: 1480,
+        486: 1480, 488: 1479, 489: 1479, 490: 1479,
+        492: 1479, 496: 5, 497: 5, 498: 5,
+        500: 5, 504: 5, 527: 1478, 535: 1477,
+        539: 1476, 541: 1475, 542: 1474, 543: 9,
+        551: 1473, 555: 1472, 557: 1471, 558: 1470,
+        559: 1470, 563: 1469, 565: 1468, 566: 1467,
+        567: 1467, 569: 1466, 570: 1465, 571: 1465,
+        572: 1464, 573: 1464, 574: 8, 583: 1463,
+        587: 1462, 589: 1461, 590: 1460, 591: 1460,
+        595: 1459, 597: 1458, 598: 1457, 599: 1457,
+        601: 1456, 602: 1455, 603: 1455, 604: 1454,
+        605: 1454, 606: 1454, 611: 1453, 613: 1452,
+        614: 1451, 615: 1451, 617: 1450, 618: 1449,
+        619: 1449, 620: 1448, 621: 1448, 622: 1448,
+        625: 1447, 626: 1446, 627: 1446, 628: 1445,
+        629: 1445, 630: 1445, 632: 1444, 633: 1444,
+        634: 1444, 636: 7, 647: 1443, 651: 1442,
+        653: 1441, 654: 1440, 655: 1440, 659: 1439,
+        661: 1438, 662: 1437, 663: 1437, 665: 1436,
+        666: 1435, 667: 1435, 668: 1434, 669: 1434,
+        670: 1434, 675: 1433, 677: 1432, 678: 1431,
+        679: 1431, 681: 1430, 682: 1429, 683: 1429,
+        684: 1428, 685: 1428, 686: 1428, 689: 1427,
+        690: 1426, 691: 1426, 692: 1425, 693: 1425,
+        694: 1425, 696: 1424, 697: 1424, 698: 1424,
+        700: 1424, 707: 1423, 709: 1422, 710: 1421,
+        711: 1421, 713: 1420, 714: 1419, 715: 1419,
+        716: 1418, 717: 1418, 718: 1418, 721: 1417,
+        722: 1416, 723: 1416, 724: 1415, 725: 1415,
+        726: 1415, 728: 1414, 729: 1414, 730: 1414,
+        732: 1414, 737: 1413, 738: 1412, 739: 1412,
+        740: 1411, 741: 1411, 742: 1411, 744: 1410,
+        745: 1410, 746: 1410, 748: 1410, 752: 1409,
+        753: 1409, 754: 1409, 756: 1409, 760: 6,
+        775: 1408, 779: 1407, 781: 1406, 782: 1405,
+        783: 1405, 787: 1404, 789: 1403, 790: 1402,
+        791: 1402, 793: 1401, 794: 1400, 795: 1400,
+        796: 1399, 797: 1399, 798: 1399, 803: 1398,
+        805: 1397, 806: 1396, 807: 1396, 809: 1395,
+        810: 1394, 811: 1394, 812: 1393, 813: 1393,
+        814: 1393, 817: 1392, 818: 1391, 819: 1391,
+        820: 1390, 821: 1390, 822: 1390, 824: 1389,
+        825: 1389, 826: 1389, 828: 1389, 835: 1388,
+        837: 1387, 838: 1386, 839: 1386, 841: 1385,
+        842: 1384, 843: 1384, 844: 1383, 845: 1383,
+        846: 1383, 849: 1382, 850: 1381, 851: 1381,
+        852: 1380, 853: 1380, 854: 1380, 856: 1379,
+        857: 1379, 858: 1379, 860: 1379, 865: 1378,
+        866: 1377, 867: 1377, 868: 1376, 869: 1376,
+        870: 1376, 872: 1375, 873: 1375, 874: 1375,
+        876: 1375, 880: 1374, 881: 1374, 882: 1374,
+        884: 1374, 888: 1374, 899: 1373, 901: 1372,
+        902: 1371, 903: 1371, 905: 1370, 906: 1369,
+        907: 1369, 908: 1368, 909: 1368, 910: 1368,
+        913: 1367, 914: 1366, 915: 1366, 916: 1365,
+        917: 1365, 918: 1365, 920: 1364, 921: 1364,
+        922: 1364, 924: 1364, 929: 1363, 930: 1362,
+        931: 1362, 932: 1361, 933: 1361, 934: 1361,
+        936: 1360, 937: 1360, 938: 1360, 940: 1360,
+        944: 1359, 945: 1359, 946: 1359, 948: 1359,
+        952: 1359, 961: 1358, 962: 1357, 963: 1357,
+        964: 1356, 965: 1356, 966: 1356, 968: 1355,
+        969: 1355, 970: 1355, 972: 1355, 976: 1354,
+        977: 1354, 978: 1354, 980: 1354, 984: 1354,
+        992: 4, 993: 4, 994: 4, 996: 4,
+        1000: 4, 1008: 4, 1039: 1353, 1047: 1352,
+        1051: 1351, 1053: 1350, 1054: 1349, 1055: 9,
+        1063: 1348, 1067: 1347, 1069: 1346, 1070: 1345,
+        1071: 1345, 1075: 1344, 1077: 1343, 1078: 1342,
+        1079: 1342, 1081: 1341, 1082: 1340, 1083: 1340,
+        1084: 1339, 1085: 1339, 1086: 8, 1095: 1338,
+        1099: 1337, 1101: 1336, 1102: 1335, 1103: 1335,
+        1107: 1334, 1109: 1333, 1110: 1332, 1111: 1332,
+        1113: 1331, 1114: 1330, 1115: 1330, 1116: 1329,
+        1117: 1329, 1118: 1329, 1123: 1328, 1125: 1327,
+        1126: 1326, 1127: 1326, 1129: 1325, 1130: 1324,
+        1131: 1324, 1132: 1323, 1133: 1323, 1134: 1323,
+        1137: 1322, 1138: 1321, 1139: 1321, 1140: 1320,
+        1141: 1320, 1142: 1320, 1144: 1319, 1145: 1319,
+        1146: 1319, 1148: 7, 1159: 1318, 1163: 1317,
+        1165: 1316, 1166: 1315, 1167: 1315, 1171: 1314,
+        1173: 1313, 1174: 1312, 1175: 1312, 1177: 1311,
+        1178: 1310, 1179: 1310, 1180: 1309, 1181: 1309,
+        1182: 1309, 1187: 1308, 1189: 1307, 1190: 1306,
+        1191: 1306, 1193: 1305, 1194: 1304, 1195: 1304,
+        1196: 1303, 1197: 1303, 1198: 1303, 1201: 1302,
+        1202: 1301, 1203: 1301, 1204: 1300, 1205: 1300,
+        1206: 1300, 1208: 1299, 1209: 1299, 1210: 1299,
+        1212: 1299, 1219: 1298, 1221: 1297, 1222: 1296,
+        1223: 1296, 1225: 1295, 1226: 1294, 1227: 1294,
+        1228: 1293, 1229: 1293, 1230: 1293, 1233: 1292,
+        1234: 1291, 1235: 1291, 1236: 1290, 1237: 1290,
+        1238: 1290, 1240: 1289, 1241: 1289, 1242: 1289,
+        1244: 1289, 1249: 1288, 1250: 1287, 1251: 1287,
+        1252: 1286, 1253: 1286, 1254: 1286, 1256: 1285,
+        1257: 1285, 1258: 1285, 1260: 1285, 1264: 1284,
+        1265: 1284, 1266: 1284, 1268: 1284, 1272: 6,
+        1287: 1283, 1291: 1282, 1293: 1281, 1294: 1280,
+        1295: 1280, 1299: 1279, 1301: 1278, 1302: 1277,
+        1303: 1277, 1305: 1276, 1306: 1275, 1307: 1275,
+        1308: 1274, 1309: 1274, 1310: 1274, 1315: 1273,
+        1317: 1272, 1318: 1271, 1319: 1271, 1321: 1270,
+        1322: 1269, 1323: 1269, 1324: 1268, 1325: 1268,
+        1326: 1268, 1329: 1267, 1330: 1266, 1331: 1266,
+        1332: 1265, 1333: 1265, 1334: 1265, 1336: 1264,
+        1337: 1264, 1338: 1264, 1340: 1264, 1347: 1263,
+        1349: 1262, 1350: 1261, 1351: 1261, 1353: 1260,
+        1354: 1259, 1355: 1259, 1356: 1258, 1357: 1258,
+        1358: 1258, 1361: 1257, 1362: 1256, 1363: 1256,
+        1364: 1255, 1365: 1255, 1366: 1255, 1368: 1254,
+        1369: 1254, 1370: 1254, 1372: 1254, 1377: 1253,
+        1378: 1252, 1379: 1252, 1380: 1251, 1381: 1251,
+        1382: 1251, 1384: 1250, 1385: 1250, 1386: 1250,
+        1388: 1250, 1392: 1249, 1393: 1249, 1394: 1249,
+        1396: 1249, 1400: 1249, 1411: 1248, 1413: 1247,
+        1414: 1246, 1415: 1246, 1417: 1245, 1418: 1244,
+        1419: 1244, 1420: 1243, 1421: 1243, 1422: 1243,
+        1425: 1242, 1426: 1241, 1427: 1241, 1428: 1240,
+        1429: 1240, 1430: 1240, 1432: 1239, 1433: 1239,
+        1434: 1239, 1436: 1239, 1441: 1238, 1442: 1237,
+        1443: 1237, 1444: 1236, 1445: 1236, 1446: 1236,
+        1448: 1235, 1449: 1235, 1450: 1235, 1452: 1235,
+        1456: 1234, 1457: 1234, 1458: 1234, 1460: 1234,
+        1464: 1234, 1473: 1233, 1474: 1232, 1475: 1232,
+        1476: 1231, 1477: 1231, 1478: 1231, 1480: 1230,
+        1481: 1230, 1482: 1230, 1484: 1230, 1488: 1229,
+        1489: 1229, 1490: 1229, 1492: 1229, 1496: 1229,
+        1504: 1228, 1505: 1228, 1506: 1228, 1508: 1228,
+        1512: 1228, 1520: 5, 1543: 1227, 1547: 1226,
+        1549: 1225, 1550: 1224, 1551: 1224, 1555: 1223,
+        1557: 1222, 1558: 1221, 1559: 1221, 1561: 1220,
+        1562: 1219, 1563: 1219, 1564: 1218, 1565: 1218,
+        1566: 1218, 1571: 1217, 1573: 1216, 1574: 1215,
+        1575: 1215, 1577: 1214, 1578: 1213, 1579: 1213,
+        1580: 1212, 1581: 1212, 1582: 1212, 1585: 1211,
+        1586: 1210, 1587: 1210, 1588: 1209, 1589: 1209,
+        1590: 1209, 1592: 1208, 1593: 1208, 1594: 1208,
+        1596: 1208, 1603: 1207, 1605: 1206, 1606: 1205,
+        1607: 1205, 1609: 1204, 1610: 1203, 1611: 1203,
+        1612: 1202, 1613: 1202, 1614: 1202, 1617: 1201,
+        1618: 1200, 1619: 1200, 1620: 1199, 1621: 1199,
+        1622: 1199, 1624: 1198, 1625: 1198, 1626: 1198,
+        1628: 1198, 1633: 1197, 1634: 1196, 1635: 1196,
+        1636: 1195, 1637: 1195, 1638: 1195, 1640: 1194,
+        1641: 1194, 1642: 1194, 1644: 1194, 1648: 1193,
+        1649: 1193, 1650: 1193, 1652: 1193, 1656: 1193,
+        1667: 1192, 1669: 1191, 1670: 1190, 1671: 1190,
+        1673: 1189, 1674: 1188, 1675: 1188, 1676: 1187,
+        1677: 1187, 1678: 1187, 1681: 1186, 1682: 1185,
+        1683: 1185, 1684: 1184, 1685: 1184, 1686: 1184,
+        1688: 1183, 1689: 1183, 1690: 1183, 1692: 1183,
+        1697: 1182, 1698: 1181, 1699: 1181, 1700: 1180,
+        1701: 1180, 1702: 1180, 1704: 1179, 1705: 1179,
+        1706: 1179, 1708: 1179, 1712: 1178, 1713: 1178,
+        1714: 1178, 1716: 1178, 1720: 1178, 1729: 1177,
+        1730: 1176, 1731: 1176, 1732: 1175, 1733: 1175,
+        1734: 1175, 1736: 1174, 1737: 1174, 1738: 1174,
+        1740: 1174, 1744: 1173, 1745: 1173, 1746: 1173,
+        1748: 1173, 1752: 1173, 1760: 1172, 1761: 1172,
+        1762: 1172, 1764: 1172, 1768: 1172, 1776: 1172,
+        1795: 1171, 1797: 1170, 1798: 1169, 1799: 1169,
+        1801: 1168, 1802: 1167, 1803: 1167, 1804: 1166,
+        1805: 1166, 1806: 1166, 1809: 1165, 1810: 1164,
+        1811: 1164, 1812: 1163, 1813: 1163, 1814: 1163,
+        1816: 1162, 1817: 1162, 1818: 1162, 1820: 1162,
+        1825: 1161, 1826: 1160, 1827: 1160, 1828: 1159,
+        1829: 1159, 1830: 1159, 1832: 1158, 1833: 1158,
+        1834: 1158, 1836: 1158, 1840: 1157, 1841: 1157,
+        1842: 1157, 1844: 1157, 1848: 1157, 1857: 1156,
+        1858: 1155, 1859: 1155, 1860: 1154, 1861: 1154,
+        1862: 1154, 1864: 1153, 1865: 1153, 1866: 1153,
+        1868: 1153, 1872: 1152, 1873: 1152, 1874: 1152,
+        1876: 1152, 1880: 1152, 1888: 1151, 1889: 1151,
+        1890: 1151, 1892: 1151, 1896: 1151, 1904: 1151,
+        1921: 1150, 1922: 1149, 1923: 1149, 1924: 1148,
+        1925: 1148, 1926: 1148, 1928: 1147, 1929: 1147,
+        1930: 1147, 1932: 1147, 1936: 1146, 1937: 1146,
+        1938: 1146, 1940: 1146, 1944: 1146, 1952: 1145,
+        1953: 1145, 1954: 1145, 1956: 1145, 1960: 1145,
+        1968: 1145, 1984: 3, 1985: 3, 1986: 3,
+        1988: 3, 1992: 3, 2000: 3, 2016: 3,
+        2063: 1144, 2071: 1143, 2075: 1142, 2077: 1141,
+        2078: 1140, 2079: 9, 2087: 1139, 2091: 1138,
+        2093: 1137, 2094: 1136, 2095: 1136, 2099: 1135,
+        2101: 1134, 2102: 1133, 2103: 1133, 2105: 1132,
+        2106: 1131, 2107: 1131, 2108: 1130, 2109: 1130,
+        2110: 8, 2119: 1129, 2123: 1128, 2125: 1127,
+        2126: 1126, 2127: 1126, 2131: 1125, 2133: 1124,
+        2134: 1123, 2135: 1123, 2137: 1122, 2138: 1121,
+        2139: 1121, 2140: 1120, 2141: 1120, 2142: 1120,
+        2147: 1119, 2149: 1118, 2150: 1117, 2151: 1117,
+        2153: 1116, 2154: 1115, 2155: 1115, 2156: 1114,
+        2157: 1114, 2158: 1114, 2161: 1113, 2162: 1112,
+        2163: 1112, 2164: 1111, 2165: 1111, 2166: 1111,
+        2168: 1110, 2169: 1110, 2170: 1110, 2172: 7,
+        2183: 1109, 2187: 1108, 2189: 1107, 2190: 1106,
+        2191: 1106, 2195: 1105, 2197: 1104, 2198: 1103,
+        2199: 1103, 2201: 1102, 2202: 1101, 2203: 1101,
+        2204: 1100, 2205: 1100, 2206: 1100, 2211: 1099,
+        2213: 1098, 2214: 1097, 2215: 1097, 2217: 1096,
+        2218: 1095, 2219: 1095, 2220: 1094, 2221: 1094,
+        2222: 1094, 2225: 1093, 2226: 1092, 2227: 1092,
+        2228: 1091, 2229: 1091, 2230: 1091, 2232: 1090,
+        2233: 1090, 2234: 1090, 2236: 1090, 2243: 1089,
+        2245: 1088, 2246: 1087, 2247: 1087, 2249: 1086,
+        2250: 1085, 2251: 1085, 2252: 1084, 2253: 1084,
+        2254: 1084, 2257: 1083, 2258: 1082, 2259: 1082,
+        2260: 1081, 2261: 1081, 2262: 1081, 2264: 1080,
+        2265: 1080, 2266: 1080, 2268: 1080, 2273: 1079,
+        2274: 1078, 2275: 1078, 2276: 1077, 2277: 1077,
+        2278: 1077, 2280: 1076, 2281: 1076, 2282: 1076,
+        2284: 1076, 2288: 1075, 2289: 1075, 2290: 1075,
+        2292: 1075, 2296: 6, 2311: 1074, 2315: 1073,
+        2317: 1072, 2318: 1071, 2319: 1071, 2323: 1070,
+        2325: 1069, 2326: 1068, 2327: 1068, 2329: 1067,
+        2330: 1066, 2331: 1066, 2332: 1065, 2333: 1065,
+        2334: 1065, 2339: 1064, 2341: 1063, 2342: 1062,
+        2343: 1062, 2345: 1061, 2346: 1060, 2347: 1060,
+        2348: 1059, 2349: 1059, 2350: 1059, 2353: 1058,
+        2354: 1057, 2355: 1057, 2356: 1056, 2357: 1056,
+        2358: 1056, 2360: 1055, 2361: 1055, 2362: 1055,
+        2364: 1055, 2371: 1054, 2373: 1053, 2374: 1052,
+        2375: 1052, 2377: 1051, 2378: 1050, 2379: 1050,
+        2380: 1049, 2381: 1049, 2382: 1049, 2385: 1048,
+        2386: 1047, 2387: 1047, 2388: 1046, 2389: 1046,
+        2390: 1046, 2392: 1045, 2393: 1045, 2394: 1045,
+        2396: 1045, 2401: 1044, 2402: 1043, 2403: 1043,
+        2404: 1042, 2405: 1042, 2406: 1042, 2408: 1041,
+        2409: 1041, 2410: 1041, 2412: 1041, 2416: 1040,
+        2417: 1040, 2418: 1040, 2420: 1040, 2424: 1040,
+        2435: 1039, 2437: 1038, 2438: 1037, 2439: 1037,
+        2441: 1036, 2442: 1035, 2443: 1035, 2444: 1034,
+        2445: 1034, 2446: 1034, 2449: 1033, 2450: 1032,
+        2451: 1032, 2452: 1031, 2453: 1031, 2454: 1031,
+        2456: 1030, 2457: 1030, 2458: 1030, 2460: 1030,
+        2465: 1029, 2466: 1028, 2467: 1028, 2468: 1027,
+        2469: 1027, 2470: 1027, 2472: 1026, 2473: 1026,
+        2474: 1026, 2476: 1026, 2480: 1025, 2481: 1025,
+        2482: 1025, 2484: 1025, 2488: 1025, 2497: 1024,
+        2498: 1023, 2499: 1023, 2500: 1022, 2501: 1022,
+        2502: 1022, 2504: 1021, 2505: 1021, 2506: 1021,
+        2508: 1021, 2512: 1020, 2513: 1020, 2514: 1020,
+        2516: 1020, 2520: 1020, 2528: 1019, 2529: 1019,
+        2530: 1019, 2532: 1019, 2536: 1019, 2544: 5,
+        2567: 1018, 2571: 1017, 2573: 1016, 2574: 1015,
+        2575: 1015, 2579: 1014, 2581: 1013, 2582: 1012,
+        2583: 1012, 2585: 1011, 2586: 1010, 2587: 1010,
+        2588: 1009, 2589: 1009, 2590: 1009, 2595: 1008,
+        2597: 1007, 2598: 1006, 2599: 1006, 2601: 1005,
+        2602: 1004, 2603: 1004, 2604: 1003, 2605: 1003,
+        2606: 1003, 2609: 1002, 2610: 1001, 2611: 1001,
+        2612: 1000, 2613: 1000, 2614: 1000, 2616: 999,
+        2617: 999, 2618: 999, 2620: 999, 2627: 998,
+        2629: 997, 2630: 996, 2631: 996, 2633: 995,
+        2634: 994, 2635: 994, 2636: 993, 2637: 993,
+        2638: 993, 2641: 992, 2642: 991, 2643: 991,
+        2644: 990, 2645: 990, 2646: 990, 2648: 989,
+        2649: 989, 2650: 989, 2652: 989, 2657: 988,
+        2658: 987, 2659: 987, 2660: 986, 2661: 986,
+        2662: 986, 2664: 985, 2665: 985, 2666: 985,
+        2668: 985, 2672: 984, 2673: 984, 2674: 984,
+        2676: 984, 2680: 984, 2691: 983, 2693: 982,
+        2694: 981, 2695: 981, 2697: 980, 2698: 979,
+        2699: 979, 2700: 978, 2701: 978, 2702: 978,
+        2705: 977, 2706: 976, 2707: 976, 2708: 975,
+        2709: 975, 2710: 975, 2712: 974, 2713: 974,
+        2714: 974, 2716: 974, 2721: 973, 2722: 972,
+        2723: 972, 2724: 971, 2725: 971, 2726: 971,
+        2728: 970, 2729: 970, 2730: 970, 2732: 970,
+        2736: 969, 2737: 969, 2738: 969, 2740: 969,
+        2744: 969, 2753: 968, 2754: 967, 2755: 967,
+        2756: 966, 2757: 966, 2758: 966, 2760: 965,
+        2761: 965, 2762: 965, 2764: 965, 2768: 964,
+        2769: 964, 2770: 964, 2772: 964, 2776: 964,
+        2784: 963, 2785: 963, 2786: 963, 2788: 963,
+        2792: 963, 2800: 963, 2819: 962, 2821: 961,
+        2822: 960, 2823: 960, 2825: 959, 2826: 958,
+        2827: 958, 2828: 957, 2829: 957, 2830: 957,
+        2833: 956, 2834: 955, 2835: 955, 2836: 954,
+        2837: 954, 2838: 954, 2840: 953, 2841: 953,
+        2842: 953, 2844: 953, 2849: 952, 2850: 951,
+        2851: 951, 2852: 950, 2853: 950, 2854: 950,
+        2856: 949, 2857: 949, 2858: 949, 2860: 949,
+        2864: 948, 2865: 948, 2866: 948, 2868: 948,
+        2872: 948, 2881: 947, 2882: 946, 2883: 946,
+        2884: 945, 2885: 945, 2886: 945, 2888: 944,
+        2889: 944, 2890: 944, 2892: 944, 2896: 943,
+        2897: 943, 2898: 943, 2900: 943, 2904: 943,
+        2912: 942, 2913: 942, 2914: 942, 2916: 942,
+        2920: 942, 2928: 942, 2945: 941, 2946: 940,
+        2947: 940, 2948: 939, 2949: 939, 2950: 939,
+        2952: 938, 2953: 938, 2954: 938, 2956: 938,
+        2960: 937, 2961: 937, 2962: 937, 2964: 937,
+        2968: 937, 2976: 936, 2977: 936, 2978: 936,
+        2980: 936, 2984: 936, 2992: 936, 3008: 935,
+        3009: 935, 3010: 935, 3012: 935, 3016: 935,
+        3024: 935, 3040: 4, 3079: 934, 3083: 933,
+        3085: 932, 3086: 931, 3087: 931, 3091: 930,
+        3093: 929, 3094: 928, 3095: 928, 3097: 927,
+        3098: 926, 3099: 926, 3100: 925, 3101: 925,
+        3102: 925, 3107: 924, 3109: 923, 3110: 922,
+        3111: 922, 3113: 921, 3114: 920, 3115: 920,
+        3116: 919, 3117: 919, 3118: 919, 3121: 918,
+        3122: 917, 3123: 917, 3124: 916, 3125: 916,
+        3126: 916, 3128: 915, 3129: 915, 3130: 915,
+        3132: 915, 3139: 914, 3141: 913, 3142: 912,
+        3143: 912, 3145: 911, 3146: 910, 3147: 910,
+        3148: 909, 3149: 909, 3150: 909, 3153: 908,
+        3154: 907, 3155: 907, 3156: 906, 3157: 906,
+        3158: 906, 3160: 905, 3161: 905, 3162: 905,
+        3164: 905, 3169: 904, 3170: 903, 3171: 903,
+        3172: 902, 3173: 902, 3174: 902, 3176: 901,
+        3177: 901, 3178: 901, 3180: 901, 3184: 900,
+        3185: 900, 3186: 900, 3188: 900, 3192: 900,
+        3203: 899, 3205: 898, 3206: 897, 3207: 897,
+        3209: 896, 3210: 895, 3211: 895, 3212: 894,
+        3213: 894, 3214: 894, 3217: 893, 3218: 892,
+        3219: 892, 3220: 891, 3221: 891, 3222: 891,
+        3224: 890, 3225: 890, 3226: 890, 3228: 890,
+        3233: 889, 3234: 888, 3235: 888, 3236: 887,
+        3237: 887, 3238: 887, 3240: 886, 3241: 886,
+        3242: 886, 3244: 886, 3248: 885, 3249: 885,
+        3250: 885, 3252: 885, 3256: 885, 3265: 884,
+        3266: 883, 3267: 883, 3268: 882, 3269: 882,
+        3270: 882, 3272: 881, 3273: 881, 3274: 881,
+        3276: 881, 3280: 880, 3281: 880, 3282: 880,
+        3284: 880, 3288: 880, 3296: 879, 3297: 879,
+        3298: 879, 3300: 879, 3304: 879, 3312: 879,
+        3331: 878, 3333: 877, 3334: 876, 3335: 876,
+        3337: 875, 3338: 874, 3339: 874, 3340: 873,
+        3341: 873, 3342: 873, 3345: 872, 3346: 871,
+        3347: 871, 3348: 870, 3349: 870, 3350: 870,
+        3352: 869, 3353: 869, 3354: 869, 3356: 869,
+        3361: 868, 3362: 867, 3363: 867, 3364: 866,
+        3365: 866, 3366: 866, 3368: 865, 3369: 865,
+        3370: 865, 3372: 865, 3376: 864, 3377: 864,
+        3378: 864, 3380: 864, 3384: 864, 3393: 863,
+        3394: 862, 3395: 862, 3396: 861, 3397: 861,
+        3398: 861, 3400: 860, 3401: 860, 3402: 860,
+        3404: 860, 3408: 859, 3409: 859, 3410: 859,
+        3412: 859, 3416: 859, 3424: 858, 3425: 858,
+        3426: 858, 3428: 858, 3432: 858, 3440: 858,
+        3457: 857, 3458: 856, 3459: 856, 3460: 855,
+        3461: 855, 3462: 855, 3464: 854, 3465: 854,
+        3466: 854, 3468: 854, 3472: 853, 3473: 853,
+        3474: 853, 3476: 853, 3480: 853, 3488: 852,
+        3489: 852, 3490: 852, 3492: 852, 3496: 852,
+        3504: 852, 3520: 851, 3521: 851, 3522: 851,
+        3524: 851, 3528: 851, 3536: 851, 3552: 851,
+        3587: 850, 3589: 849, 3590: 848, 3591: 848,
+        3593: 847, 3594: 846, 3595: 846, 3596: 845,
+        3597: 845, 3598: 845, 3601: 844, 3602: 843,
+        3603: 843, 3604: 842, 3605: 842, 3606: 842,
+        3608: 841, 3609: 841, 3610: 841, 3612: 841,
+        3617: 840, 3618: 839, 3619: 839, 3620: 838,
+        3621: 838, 3622: 838, 3624: 837, 3625: 837,
+        3626: 837, 3628: 837, 3632: 836, 3633: 836,
+        3634: 836, 3636: 836, 3640: 836, 3649: 835,
+        3650: 834, 3651: 834, 3652: 833, 3653: 833,
+        3654: 833, 3656: 832, 3657: 832, 3658: 832,
+        3660: 832, 3664: 831, 3665: 831, 3666: 831,
+        3668: 831, 3672: 831, 3680: 830, 3681: 830,
+        3682: 830, 3684: 830, 3688: 830, 3696: 830,
+        3713: 829, 3714: 828, 3715: 828, 3716: 827,
+        3717: 827, 3718: 827, 3720: 826, 3721: 826,
+        3722: 826, 3724: 826, 3728: 825, 3729: 825,
+        3730: 825, 3732: 825, 3736: 825, 3744: 824,
+        3745: 824, 3746: 824, 3748: 824, 3752: 824,
+        3760: 824, 3776: 823, 3777: 823, 3778: 823,
+        3780: 823, 3784: 823, 3792: 823, 3808: 823,
+        3841: 822, 3842: 821, 3843: 821, 3844: 820,
+        3845: 820, 3846: 820, 3848: 819, 3849: 819,
+        3850: 819, 3852: 819, 3856: 818, 3857: 818,
+        3858: 818, 3860: 818, 3864: 818, 3872: 817,
+        3873: 817, 3874: 817, 3876: 817, 3880: 817,
+        3888: 817, 3904: 816, 3905: 816, 3906: 816,
+        3908: 816, 3912: 816, 3920: 816, 3936: 816,
+        3968: 2, 3969: 2, 3970: 2, 3972: 2,
+        3976: 2, 3984: 2, 4000: 2, 4032: 2,
+        4111: 10, 4119: 815, 4123: 814, 4125: 813,
+        4126: 812, 4127: 9, 4135: 811, 4139: 810,
+        4141: 809, 4142: 808, 4143: 10, 4147: 807,
+        4149: 806, 4150: 805, 4151: 805, 4153: 804,
+        4154: 803, 4155: 803, 4156: 802, 4157: 802,
+        4158: 8, 4167: 801, 4171: 800, 4173: 799,
+        4174: 798, 4175: 10, 4179: 797, 4181: 796,
+        4182: 795, 4183: 795, 4185: 794, 4186: 793,
+        4187: 793, 4188: 792, 4189: 792, 4190: 792,
+        4195: 791, 4197: 790, 4198: 789, 4199: 789,
+        4201: 788, 4202: 787, 4203: 787, 4204: 786,
+        4205: 786, 4206: 786, 4209: 785, 4210: 784,
+        4211: 784, 4212: 783, 4213: 783, 4214: 783,
+        4216: 782, 4217: 782, 4218: 782, 4220: 7,
+        4231: 781, 4235: 780, 4237: 779, 4238: 778,
+        4239: 10, 4243: 777, 4245: 776, 4246: 775,
+        4247: 775, 4249: 774, 4250: 773, 4251: 773,
+        4252: 772, 4253: 772, 4254: 772, 4259: 771,
+        4261: 770, 4262: 769, 4263: 769, 4265: 768,
+        4266: 767, 4267: 767, 4268: 766, 4269: 766,
+        4270: 766, 4273: 765, 4274: 764, 4275: 764,
+        4276: 763, 4277: 763, 4278: 763, 4280: 762,
+        4281: 762, 4282: 762, 4284: 762, 4291: 761,
+        4293: 760, 4294: 759, 4295: 759, 4297: 758,
+        4298: 757, 4299: 757, 4300: 756, 4301: 756,
+        4302: 756, 4305: 755, 4306: 754, 4307: 754,
+        4308: 753, 4309: 753, 4310: 753, 4312: 752,
+        4313: 752, 4314: 752, 4316: 752, 4321: 751,
+        4322: 750, 4323: 750, 4324: 749, 4325: 749,
+        4326: 749, 4328: 748, 4329: 748, 4330: 748,
+        4332: 748, 4336: 747, 4337: 747, 4338: 747,
+        4340: 747, 4344: 6, 4359: 746, 4363: 745,
+        4365: 744, 4366: 743, 4367: 10, 4371: 742,
+        4373: 741, 4374: 740, 4375: 740, 4377: 739,
+        4378: 738, 4379: 738, 4380: 737, 4381: 737,
+        4382: 737, 4387: 736, 4389: 735, 4390: 734,
+        4391: 734, 4393: 733, 4394: 732, 4395: 732,
+        4396: 731, 4397: 731, 4398: 731, 4401: 730,
+        4402: 729, 4403: 729, 4404: 728, 4405: 728,
+        4406: 728, 4408: 727, 4409: 727, 4410: 727,
+        4412: 727, 4419: 726, 4421: 725, 4422: 724,
+        4423: 724, 4425: 723, 4426: 722, 4427: 722,
+        4428: 721, 4429: 721, 4430: 721, 4433: 720,
+        4434: 719, 4435: 719, 4436: 718, 4437: 718,
+        4438: 718, 4440: 717, 4441: 717, 4442: 717,
+        4444: 717, 4449: 716, 4450: 715, 4451: 715,
+        4452: 714, 4453: 714, 4454: 714, 4456: 713,
+        4457: 713, 4458: 713, 4460: 713, 4464: 712,
+        4465: 712, 4466: 712, 4468: 712, 4472: 712,
+        4483: 711, 4485: 710, 4486: 709, 4487: 709,
+        4489: 708, 4490: 707, 4491: 707, 4492: 706,
+        4493: 706, 4494: 706, 4497: 705, 4498: 704,
+        4499: 704, 4500: 703, 4501: 703, 4502: 703,
+        4504: 702, 4505: 702, 4506: 702, 4508: 702,
+        4513: 701, 4514: 700, 4515: 700, 4516: 699,
+        4517: 699, 4518: 699, 4520: 698, 4521: 698,
+        4522: 698, 4524: 698, 4528: 697, 4529: 697,
+        4530: 697, 4532: 697, 4536: 697, 4545: 696,
+        4546: 695, 4547: 695, 4548: 694, 4549: 694,
+        4550: 694, 4552: 693, 4553: 693, 4554: 693,
+        4556: 693, 4560: 692, 4561: 692, 4562: 692,
+        4564: 692, 4568: 692, 4576: 691, 4577: 691,
+        4578: 691, 4580: 691, 4584: 691, 4592: 5,
+        4615: 690, 4619: 689, 4621: 688, 4622: 687,
+        4623: 10, 4627: 686, 4629: 685, 4630: 684,
+        4631: 684, 4633: 683, 4634: 682, 4635: 682,
+        4636: 681, 4637: 681, 4638: 681, 4643: 680,
+        4645: 679, 4646: 678, 4647: 678, 4649: 677,
+        4650: 676, 4651: 676, 4652: 675, 4653: 675,
+        4654: 675, 4657: 674, 4658: 673, 4659: 673,
+        4660: 672, 4661: 672, 4662: 672, 4664: 671,
+        4665: 671, 4666: 671, 4668: 671, 4675: 670,
+        4677: 669, 4678: 668, 4679: 668, 4681: 667,
+        4682: 666, 4683: 666, 4684: 665, 4685: 665,
+        4686: 665, 4689: 664, 4690: 663, 4691: 663,
+        4692: 662, 4693: 662, 4694: 662, 4696: 661,
+        4697: 661, 4698: 661, 4700: 661, 4705: 660,
+        4706: 659, 4707: 659, 4708: 658, 4709: 658,
+        4710: 658, 4712: 657, 4713: 657, 4714: 657,
+        4716: 657, 4720: 656, 4721: 656, 4722: 656,
+        4724: 656, 4728: 656, 4739: 655, 4741: 654,
+        4742: 653, 4743: 653, 4745: 652, 4746: 651,
+        4747: 651, 4748: 650, 4749: 650, 4750: 650,
+        4753: 649, 4754: 648, 4755: 648, 4756: 647,
+        4757: 647, 4758: 647, 4760: 646, 4761: 646,
+        4762: 646, 4764: 646, 4769: 645, 4770: 644,
+        4771: 644, 4772: 643, 4773: 643, 4774: 643,
+        4776: 642, 4777: 642, 4778: 642, 4780: 642,
+        4784: 641, 4785: 641, 4786: 641, 4788: 641,
+        4792: 641, 4801: 640, 4802: 639, 4803: 639,
+        4804: 638, 4805: 638, 4806: 638, 4808: 637,
+        4809: 637, 4810: 637, 4812: 637, 4816: 636,
+        4817: 636, 4818: 636, 4820: 636, 4824: 636,
+        4832: 635, 4833: 635, 4834: 635, 4836: 635,
+        4840: 635, 4848: 635, 4867: 634, 4869: 633,
+        4870: 632, 4871: 632, 4873: 631, 4874: 630,
+        4875: 630, 4876: 629, 4877: 629, 4878: 629,
+        4881: 628, 4882: 627, 4883: 627, 4884: 626,
+        4885: 626, 4886: 626, 4888: 625, 4889: 625,
+        4890: 625, 4892: 625, 4897: 624, 4898: 623,
+        4899: 623, 4900: 622, 4901: 622, 4902: 622,
+        4904: 621, 4905: 621, 4906: 621, 4908: 621,
+        4912: 620, 4913: 620, 4914: 620, 4916: 620,
+        4920: 620, 4929: 619, 4930: 618, 4931: 618,
+        4932: 617, 4933: 617, 4934: 617, 4936: 616,
+        4937: 616, 4938: 616, 4940: 616, 4944: 615,
+        4945: 615, 4946: 615, 4948: 615, 4952: 615,
+        4960: 614, 4961: 614, 4962: 614, 4964: 614,
+        4968: 614, 4976: 614, 4993: 613, 4994: 612,
+        4995: 612, 4996: 611, 4997: 611, 4998: 611,
+        5000: 610, 5001: 610, 5002: 610, 5004: 610,
+        5008: 609, 5009: 609, 5010: 609, 5012: 609,
+        5016: 609, 5024: 608, 5025: 608, 5026: 608,
+        5028: 608, 5032: 608, 5040: 608, 5056: 607,
+        5057: 607, 5058: 607, 5060: 607, 5064: 607,
+        5072: 607, 5088: 4, 5127: 606, 5131: 605,
+        5133: 604, 5134: 603, 5135: 10, 5139: 602,
+        5141: 601, 5142: 600, 5143: 600, 5145: 599,
+        5146: 598, 5147: 598, 5148: 597, 5149: 597,
+        5150: 597, 5155: 596, 5157: 595, 5158: 594,
+        5159: 594, 5161: 593, 5162: 592, 5163: 592,
+        5164: 591, 5165: 591, 5166: 591, 5169: 590,
+        5170: 589, 5171: 589, 5172: 588, 5173: 588,
+        5174: 588, 5176: 587, 5177: 587, 5178: 587,
+        5180: 587, 5187: 586, 5189: 585, 5190: 584,
+        5191: 584, 5193: 583, 5194: 582, 5195: 582,
+        5196: 581, 5197: 581, 5198: 581, 5201: 580,
+        5202: 579, 5203: 579, 5204: 578, 5205: 578,
+        5206: 578, 5208: 577, 5209: 577, 5210: 577,
+        5212: 577, 5217: 576, 5218: 575, 5219: 575,
+        5220: 574, 5221: 574, 5222: 574, 5224: 573,
+        5225: 573, 5226: 573, 5228: 573, 5232: 572,
+        5233: 572, 5234: 572, 5236: 572, 5240: 572,
+        5251: 571, 5253: 570, 5254: 569, 5255: 569,
+        5257: 568, 5258: 567, 5259: 567, 5260: 566,
+        5261: 566, 5262: 566, 5265: 565, 5266: 564,
+        5267: 564, 5268: 563, 5269: 563, 5270: 563,
+        5272: 562, 5273: 562, 5274: 562, 5276: 562,
+        5281: 561, 5282: 560, 5283: 560, 5284: 559,
+        5285: 559, 5286: 559, 5288: 558, 5289: 558,
+        5290: 558, 5292: 558, 5296: 557, 5297: 557,
+        5298: 557, 5300: 557, 5304: 557, 5313: 556,
+        5314: 555, 5315: 555, 5316: 554, 5317: 554,
+        5318: 554, 5320: 553, 5321: 553, 5322: 553,
+        5324: 553, 5328: 552, 5329: 552, 5330: 552,
+        5332: 552, 5336: 552, 5344: 551, 5345: 551,
+        5346: 551, 5348: 551, 5352: 551, 5360: 551,
+        5379: 550, 5381: 549, 5382: 548, 5383: 548,
+        5385: 547, 5386: 546, 5387: 546, 5388: 545,
+        5389: 545, 5390: 545, 5393: 544, 5394: 543,
+        5395: 543, 5396: 542, 5397: 542, 5398: 542,
+        5400: 541, 5401: 541, 5402: 541, 5404: 541,
+        5409: 540, 5410: 539, 5411: 539, 5412: 538,
+        5413: 538, 5414: 538, 5416: 537, 5417: 537,
+        5418: 537, 5420: 537, 5424: 536, 5425: 536,
+        5426: 536, 5428: 536, 5432: 536, 5441: 535,
+        5442: 534, 5443: 534, 5444: 533, 5445: 533,
+        5446: 533, 5448: 532, 5449: 532, 5450: 532,
+        5452: 532, 5456: 531, 5457: 531, 5458: 531,
+        5460: 531, 5464: 531, 5472: 530, 5473: 530,
+        5474: 530, 5476: 530, 5480: 530, 5488: 530,
+        5505: 529, 5506: 528, 5507: 528, 5508: 527,
+        5509: 527, 5510: 527, 5512: 526, 5513: 526,
+        5514: 526, 5516: 526, 5520: 525, 5521: 525,
+        5522: 525, 5524: 525, 5528: 525, 5536: 524,
+        5537: 524, 5538: 524, 5540: 524, 5544: 524,
+        5552: 524, 5568: 523, 5569: 523, 5570: 523,
+        5572: 523, 5576: 523, 5584: 523, 5600: 523,
+        5635: 522, 5637: 521, 5638: 520, 5639: 520,
+        5641: 519, 5642: 518, 5643: 518, 5644: 517,
+        5645: 517, 5646: 517, 5649: 516, 5650: 515,
+        5651: 515, 5652: 514, 5653: 514, 5654: 514,
+        5656: 513, 5657: 513, 5658: 513, 5660: 513,
+        5665: 512, 5666: 511, 5667: 511, 5668: 510,
+        5669: 510, 5670: 510, 5672: 509, 5673: 509,
+        5674: 509, 5676: 509, 5680: 508, 5681: 508,
+        5682: 508, 5684: 508, 5688: 508, 5697: 507,
+        5698: 506, 5699: 506, 5700: 505, 5701: 505,
+        5702: 505, 5704: 504, 5705: 504, 5706: 504,
+        5708: 504, 5712: 503, 5713: 503, 5714: 503,
+        5716: 503, 5720: 503, 5728: 502, 5729: 502,
+        5730: 502, 5732: 502, 5736: 502, 5744: 502,
+        5761: 501, 5762: 500, 5763: 500, 5764: 499,
+        5765: 499, 5766: 499, 5768: 498, 5769: 498,
+        5770: 498, 5772: 498, 5776: 497, 5777: 497,
+        5778: 497, 5780: 497, 5784: 497, 5792: 496,
+        5793: 496, 5794: 496, 5796: 496, 5800: 496,
+        5808: 496, 5824: 495, 5825: 495, 5826: 495,
+        5828: 495, 5832: 495, 5840: 495, 5856: 495,
+        5889: 494, 5890: 493, 5891: 493, 5892: 492,
+        5893: 492, 5894: 492, 5896: 491, 5897: 491,
+        5898: 491, 5900: 491, 5904: 490, 5905: 490,
+        5906: 490, 5908: 490, 5912: 490, 5920: 489,
+        5921: 489, 5922: 489, 5924: 489, 5928: 489,
+        5936: 489, 5952: 488, 5953: 488, 5954: 488,
+        5956: 488, 5960: 488, 5968: 488, 5984: 488,
+        6016: 487, 6017: 487, 6018: 487, 6020: 487,
+        6024: 487, 6032: 487, 6048: 487, 6080: 3,
+        6151: 486, 6155: 485, 6157: 484, 6158: 483,
+        6159: 10, 6163: 482, 6165: 481, 6166: 480,
+        6167: 480, 6169: 479, 6170: 478, 6171: 478,
+        6172: 477, 6173: 477, 6174: 477, 6179: 476,
+        6181: 475, 6182: 474, 6183: 474, 6185: 473,
+        6186: 472, 6187: 472, 6188: 471, 6189: 471,
+        6190: 471, 6193: 470, 6194: 469, 6195: 469,
+        6196: 468, 6197: 468, 6198: 468, 6200: 467,
+        6201: 467, 6202: 467, 6204: 467, 6211: 466,
+        6213: 465, 6214: 464, 6215: 464, 6217: 463,
+        6218: 462, 6219: 462, 6220: 461, 6221: 461,
+        6222: 461, 6225: 460, 6226: 459, 6227: 459,
+        6228: 458, 6229: 458, 6230: 458, 6232: 457,
+        6233: 457, 6234: 457, 6236: 457, 6241: 456,
+        6242: 455, 6243: 455, 6244: 454, 6245: 454,
+        6246: 454, 6248: 453, 6249: 453, 6250: 453,
+        6252: 453, 6256: 452, 6257: 452, 6258: 452,
+        6260: 452, 6264: 452, 6275: 451, 6277: 450,
+        6278: 449, 6279: 449, 6281: 448, 6282: 447,
+        6283: 447, 6284: 446, 6285: 446, 6286: 446,
+        6289: 445, 6290: 444, 6291: 444, 6292: 443,
+        6293: 443, 6294: 443, 6296: 442, 6297: 442,
+        6298: 442, 6300: 442, 6305: 441, 6306: 440,
+        6307: 440, 6308: 439, 6309: 439, 6310: 439,
+        6312: 438, 6313: 438, 6314: 438, 6316: 438,
+        6320: 437, 6321: 437, 6322: 437, 6324: 437,
+        6328: 437, 6337: 436, 6338: 435, 6339: 435,
+        6340: 434, 6341: 434, 6342: 434, 6344: 433,
+        6345: 433, 6346: 433, 6348: 433, 6352: 432,
+        6353: 432, 6354: 432, 6356: 432, 6360: 432,
+        6368: 431, 6369: 431, 6370: 431, 6372: 431,
+        6376: 431, 6384: 431, 6403: 430, 6405: 429,
+        6406: 428, 6407: 428, 6409: 427, 6410: 426,
+        6411: 426, 6412: 425, 6413: 425, 6414: 425,
+        6417: 424, 6418: 423, 6419: 423, 6420: 422,
+        6421: 422, 6422: 422, 6424: 421, 6425: 421,
+        6426: 421, 6428: 421, 6433: 420, 6434: 419,
+        6435: 419, 6436: 418, 6437: 418, 6438: 418,
+        6440: 417, 6441: 417, 6442: 417, 6444: 417,
+        6448: 416, 6449: 416, 6450: 416, 6452: 416,
+        6456: 416, 6465: 415, 6466: 414, 6467: 414,
+        6468: 413, 6469: 413, 6470: 413, 6472: 412,
+        6473: 412, 6474: 412, 6476: 412, 6480: 411,
+        6481: 411, 6482: 411, 6484: 411, 6488: 411,
+        6496: 410, 6497: 410, 6498: 410, 6500: 410,
+        6504: 410, 6512: 410, 6529: 409, 6530: 408,
+        6531: 408, 6532: 407, 6533: 407, 6534: 407,
+        6536: 406, 6537: 406, 6538: 406, 6540: 406,
+        6544: 405, 6545: 405, 6546: 405, 6548: 405,
+        6552: 405, 6560: 404, 6561: 404, 6562: 404,
+        6564: 404, 6568: 404, 6576: 404, 6592: 403,
+        6593: 403, 6594: 403, 6596: 403, 6600: 403,
+        6608: 403, 6624: 403, 6659: 402, 6661: 401,
+        6662: 400, 6663: 400, 6665: 399, 6666: 398,
+        6667: 398, 6668: 397, 6669: 397, 6670: 397,
+        6673: 396, 6674: 395, 6675: 395, 6676: 394,
+        6677: 394, 6678: 394, 6680: 393, 6681: 393,
+        6682: 393, 6684: 393, 6689: 392, 6690: 391,
+        6691: 391, 6692: 390, 6693: 390, 6694: 390,
+        6696: 389, 6697: 389, 6698: 389, 6700: 389,
+        6704: 388, 6705: 388, 6706: 388, 6708: 388,
+        6712: 388, 6721: 387, 6722: 386, 6723: 386,
+        6724: 385, 6725: 385, 6726: 385, 6728: 384,
+        6729: 384, 6730: 384, 6732: 384, 6736: 383,
+        6737: 383, 6738: 383, 6740: 383, 6744: 383,
+        6752: 382, 6753: 382, 6754: 382, 6756: 382,
+        6760: 382, 6768: 382, 6785: 381, 6786: 380,
+        6787: 380, 6788: 379, 6789: 379, 6790: 379,
+        6792: 378, 6793: 378, 6794: 378, 6796: 378,
+        6800: 377, 6801: 377, 6802: 377, 6804: 377,
+        6808: 377, 6816: 376, 6817: 376, 6818: 376,
+        6820: 376, 6824: 376, 6832: 376, 6848: 375,
+        6849: 375, 6850: 375, 6852: 375, 6856: 375,
+        6864: 375, 6880: 375, 6913: 374, 6914: 373,
+        6915: 373, 6916: 372, 6917: 372, 6918: 372,
+        6920: 371, 6921: 371, 6922: 371, 6924: 371,
+        6928: 370, 6929: 370, 6930: 370, 6932: 370,
+        6936: 370, 6944: 369, 6945: 369, 6946: 369,
+        6948: 369, 6952: 369, 6960: 369, 6976: 368,
+        6977: 368, 6978: 368, 6980: 368, 6984: 368,
+        6992: 368, 7008: 368, 7040: 367, 7041: 367,
+        7042: 367, 7044: 367, 7048: 367, 7056: 367,
+        7072: 367, 7104: 367, 7171: 366, 7173: 365,
+        7174: 364, 7175: 364, 7177: 363, 7178: 362,
+        7179: 362, 7180: 361, 7181: 361, 7182: 361,
+        7185: 360, 7186: 359, 7187: 359, 7188: 358,
+        7189: 358, 7190: 358, 7192: 357, 7193: 357,
+        7194: 357, 7196: 357, 7201: 356, 7202: 355,
+        7203: 355, 7204: 354, 7205: 354, 7206: 354,
+        7208: 353, 7209: 353, 7210: 353, 7212: 353,
+        7216: 352, 7217: 352, 7218: 352, 7220: 352,
+        7224: 352, 7233: 351, 7234: 350, 7235: 350,
+        7236: 349, 7237: 349, 7238: 349, 7240: 348,
+        7241: 348, 7242: 348, 7244: 348, 7248: 347,
+        7249: 347, 7250: 347, 7252: 347, 7256: 347,
+        7264: 346, 7265: 346, 7266: 346, 7268: 346,
+        7272: 346, 7280: 346, 7297: 345, 7298: 344,
+        7299: 344, 7300: 343, 7301: 343, 7302: 343,
+        7304: 342, 7305: 342, 7306: 342, 7308: 342,
+        7312: 341, 7313: 341, 7314: 341, 7316: 341,
+        7320: 341, 7328: 340, 7329: 340, 7330: 340,
+        7332: 340, 7336: 340, 7344: 340, 7360: 339,
+        7361: 339, 7362: 339, 7364: 339, 7368: 339,
+        7376: 339, 7392: 339, 7425: 338, 7426: 337,
+        7427: 337, 7428: 336, 7429: 336, 7430: 336,
+        7432: 335, 7433: 335, 7434: 335, 7436: 335,
+        7440: 334, 7441: 334, 7442: 334, 7444: 334,
+        7448: 334, 7456: 333, 7457: 333, 7458: 333,
+        7460: 333, 7464: 333, 7472: 333, 7488: 332,
+        7489: 332, 7490: 332, 7492: 332, 7496: 332,
+        7504: 332, 7520: 332, 7552: 331, 7553: 331,
+        7554: 331, 7556: 331, 7560: 331, 7568: 331,
+        7584: 331, 7616: 331, 7681: 330, 7682: 329,
+        7683: 329, 7684: 328, 7685: 328, 7686: 328,
+        7688: 327, 7689: 327, 7690: 327, 7692: 327,
+        7696: 326, 7697: 326, 7698: 326, 7700: 326,
+        7704: 326, 7712: 325, 7713: 325, 7714: 325,
+        7716: 325, 7720: 325, 7728: 325, 7744: 324,
+        7745: 324, 7746: 324, 7748: 324, 7752: 324,
+        7760: 324, 7776: 324, 7808: 323, 7809: 323,
+        7810: 323, 7812: 323, 7816: 323, 7824: 323,
+        7840: 323, 7872: 323, 7936: 1, 7937: 1,
+        7938: 1, 7940: 1, 7944: 1, 7952: 1,
+        7968: 1, 8000: 1, 8064: 1
+    }
+    
+    prime_products_to_rank = PerfectHash(1398,
+        [
+            0, 3, 114, 3, 72, 3, 81, 37, 79, 60, 67, 5,
+            21, 2, 267, 16, 33, 48, 0, 24, 0, 7, 37, 3,
+            0, 3, 159, 10, 49, 6, 25, 139, 103, 3, 141, 2,
+            61, 163, 144, 16, 188, 27, 0, 6, 51, 144, 187, 9,
+            29, 1, 135, 18, 51, 8, 0, 1, 12, 25, 79, 3,
+            370, 163, 5, 0, 165, 38, 184, 88, 44, 43, 3, 57,
+            0, 4, 70, 7, 1, 1, 0, 26, 4, 47, 4, 105,
+            0, 6, 21, 5, 67, 12, 374, 1, 88, 21, 98, 31,
+            96, 15, 61, 89, 24, 79, 13, 80, 7, 76, 95, 22,
+            30, 1, 231, 3, 19, 5, 38, 34, 21, 105, 7, 4,
+            60, 3, 87, 1, 67, 22, 166, 46, 34, 21, 52, 91,
+            24, 5, 0, 14, 121, 1, 13, 62, 45, 2, 294, 3,
+            146, 16, 0, 7, 71, 2, 0, 58, 0, 23, 48, 2,
+            12, 41, 244, 19, 56, 276, 115, 23, 40, 46, 197, 9,
+            268, 2, 47, 90, 0, 154, 76, 19, 124, 5, 13, 3,
+            0, 16, 30, 48, 66, 5, 61, 2, 35, 70, 24, 3,
+            15, 52, 0, 57, 1, 1, 0, 79, 7, 205, 43, 78,
+            35, 3, 42, 13, 199, 3, 73, 87, 119, 13, 53, 21,
+            64, 1, 109, 27, 190, 4, 44, 38, 300, 9, 23, 303,
+            19, 2, 55, 106, 3, 0, 193, 2, 28, 22, 40, 8,
+            9, 3, 5, 42, 26, 2, 72, 9, 21, 1, 128, 189,
+            0, 6, 19, 94, 354, 1, 136, 23, 150, 45, 30, 4,
+            252, 7, 81, 136, 89, 267, 118, 1, 24, 0, 109, 30,
+            367, 1, 19, 14, 230, 1, 33, 1, 85, 2, 31, 3,
+            0, 20, 132, 114, 268, 60, 306, 11, 31, 209, 64, 74,
+            0, 13, 42, 19, 23, 8, 313, 5, 39, 10, 4, 24,
+            8, 119, 28, 25, 84, 3, 0, 49, 140, 11, 50, 2,
+            47, 2, 477, 177, 4, 35, 0, 21, 5, 4, 33, 455,
+            15, 3, 21, 30, 10, 8, 0, 2, 0, 7, 47, 294,
+            0, 2, 68, 47, 206, 17, 0, 14, 52, 7, 43, 39,
+            48, 11, 7, 14, 170, 12, 34, 16, 121, 63, 8, 16,
+            0, 32, 135, 67, 2, 60, 259, 13, 30, 83, 167, 2,
+            321, 1, 48, 71, 35, 2, 0, 54, 75, 2, 173, 17,
+            347, 1, 19, 409, 68, 10, 457, 2, 62, 1, 106, 15,
+            40, 309, 7, 55, 33, 1, 121, 1, 249, 229, 103, 26,
+            0, 40, 40, 3, 68, 3, 16, 22, 47, 123, 153, 2,
+            147, 1, 69, 18, 408, 102, 757, 22, 7, 8, 10, 86,
+            3, 166, 263, 126, 138, 1, 164, 2, 39, 134, 52, 204,
+            0, 28, 44, 51, 12, 9, 0, 125, 83, 17, 0, 85,
+            0, 43, 9, 19, 0, 26, 265, 1, 11, 25, 49, 14,
+            404, 8, 36, 172, 130, 162, 143, 3, 142, 42, 92, 64,
+            21, 34, 261, 313, 17, 79, 99, 19, 13, 8, 3, 93,
+            38, 33, 657, 217, 0, 4, 0, 5, 71, 252, 29, 15,
+            3, 3, 9, 567, 40, 12, 173, 4, 7, 313, 635, 7,
+            334, 2, 60, 270, 253, 9, 263, 115, 307, 159, 697, 37,
+            45, 31, 624, 2, 669, 28, 0, 2, 320, 91, 5, 2,
+            145, 14, 0, 4, 86, 221, 0, 2, 2, 28, 241, 1,
+            0, 201, 283, 54, 229, 22, 104, 24, 54, 2, 354, 21,
+            74, 188, 64, 604, 0, 142, 328, 3, 134, 35, 29, 6,
+            449, 313, 114, 14, 183, 9, 267, 6, 0, 13, 79, 21,
+            497, 12, 155, 38, 186, 143, 95, 3, 136, 8, 591, 1,
+            173, 52, 144, 126, 250, 129, 173, 26, 278, 2, 375, 15,
+            8, 1, 22, 96, 122, 14, 1051, 135, 47, 156, 29, 41,
+            489, 11, 1, 40, 8, 17, 337, 3, 306, 1, 555, 100,
+            394, 26, 82, 1, 115, 8, 3, 10, 330, 193, 655, 4,
+            57, 29, 165, 117, 413, 17, 50, 25, 114, 83, 12, 8,
+            0, 8, 135, 24, 168, 1, 230, 299, 41, 12, 210, 437,
+            254, 3, 32, 1, 280, 25, 144, 4, 18, 249, 7, 27,
+            84, 5, 131, 0, 0, 27, 649, 3, 235, 10, 908, 260,
+            140, 12, 84, 54, 219, 118, 65, 7, 3, 27, 159, 5,
+            60, 2, 88, 1075, 19, 4, 424, 141, 46, 63, 337, 16,
+            148, 12, 0, 21, 513, 28, 21, 114, 70, 86, 53, 16,
+            26, 34, 80, 181, 386, 32, 355, 20, 0, 103, 115, 658,
+            58, 16, 104, 2, 18, 28, 128, 7, 78, 36, 52, 12,
+            3, 68, 183, 129, 57, 4, 0, 42, 486, 408, 81, 2,
+            10, 324, 515, 61, 753, 2, 584, 265, 247, 5, 51, 12,
+            1015, 17, 41, 84, 235, 5, 680, 1, 238, 7, 366, 98,
+            128, 194, 121, 207, 22, 740, 1314, 3, 627, 64, 161, 121,
+            202, 670, 458, 20, 23, 1, 397, 14, 135, 3, 1214, 295,
+            56, 413, 9, 17, 0, 3, 98, 272, 79, 325, 21, 4,
+            374, 24, 283, 12, 291, 132, 0, 21, 86, 76, 203, 107,
+            408, 398, 98, 2444, 33, 209, 0, 343, 1309, 21, 240, 45,
+            0, 87, 1156, 123, 0, 149, 0, 13, 226, 81, 97, 6,
+            330, 7, 40, 2, 16, 13, 13, 2, 534, 32, 106, 2,
+            64, 167, 670, 4, 72, 2, 0, 3, 205, 1, 16, 69,
+            0, 15, 13, 3, 125, 5, 0, 4, 129, 84, 7, 1,
+            830, 2, 174, 35, 77, 8, 167, 18, 606, 316, 102, 16,
+            224, 2, 288, 117, 161, 8, 321, 14, 0, 9, 480, 96,
+            5, 43, 1, 378, 50, 42, 642, 178, 272, 6, 8, 172,
+            0, 74, 101, 44, 226, 137, 321, 52, 144, 430, 0, 2,
+            0, 26, 331, 1487, 417, 61, 117, 222, 98, 52, 464, 1,
+            38, 47, 270, 270, 312, 45, 0, 331, 81, 29, 167, 97,
+            0, 9, 0, 882, 0, 377, 0, 19, 647, 285, 33, 14,
+            204, 451, 149, 62, 261, 96, 133, 5, 51, 5, 245, 19,
+            122, 23, 295, 5, 184, 85, 1421, 11, 0, 1, 148, 4,
+            214, 2, 72, 36, 56, 4, 0, 419, 0, 1, 882, 6,
+            0, 803, 87, 29, 2506, 790, 3, 37, 34, 1, 189, 115,
+            264, 38, 81, 249, 375, 94, 583, 33, 8, 19, 552, 496,
+            294, 876, 36, 8, 878, 55, 313, 8, 221, 43, 411, 210,
+            298, 2846, 738, 13, 68, 560, 0, 10, 389, 618, 910, 362,
+            8, 133, 853, 53, 1013, 4, 31, 3, 289, 7, 76, 7,
+            90, 118, 125, 4, 364, 383, 33, 95, 453, 557, 915, 14,
+            45, 8, 378, 79, 1152, 439, 274, 573, 133, 5, 0, 34,
+            475, 112, 0, 26, 168, 4, 546, 19, 0, 1, 97, 26,
+            0, 263, 291, 690, 0, 10, 151, 4, 710, 25, 129, 263,
+            23, 16, 890, 1005, 99, 38, 62, 66, 89, 2, 359, 112,
+            0, 105, 267, 110, 626, 183, 0, 610, 583, 312, 297, 314,
+            0, 0, 33, 721, 643, 6, 791, 71, 133, 4, 58, 4,
+            111, 71, 175, 32, 938, 219, 74, 36, 403, 26, 46, 40,
+            33, 114, 61, 6, 8, 247, 4, 16, 593, 319, 834, 9,
+            134, 8, 23, 69, 634, 501, 0, 2, 106, 12, 55, 252,
+            0, 224, 939, 337, 56, 3, 132, 5, 1753, 61, 105, 53,
+            219, 253, 152, 4, 2245, 115, 147, 41, 157, 187, 1055, 14,
+            0, 9, 166, 157, 745, 122, 277, 824, 0, 1, 125, 5,
+            52, 106, 58, 19, 166, 8, 0, 124, 752, 726, 334, 146,
+            240, 1, 1107, 1144, 743, 43, 39, 3, 669, 299, 2532, 14,
+            0, 27, 2419, 1970, 996, 18, 0, 961, 65, 56, 128, 15,
+            685, 83, 1348, 250, 4, 24, 1544, 2, 758, 6, 1129, 52,
+            1265, 175, 721, 111, 5, 13, 23, 145, 118, 733, 1009, 8,
+            0, 4, 848, 157, 365, 1, 0, 22, 0, 874, 607, 83,
+            292, 154, 683, 96, 0, 22, 2083, 66, 2137, 1038, 410, 2,
+            0, 273, 300, 9, 688, 15, 0, 5, 116, 215, 827, 21,
+            426, 340, 47, 387, 42, 359, 293, 2055, 2454, 56, 6726, 9,
+            622, 144, 792, 2, 682, 18, 21, 179, 1384, 170, 130, 64,
+            3854, 95, 209, 48, 173, 1255, 0, 7, 1127, 113, 17, 241,
+            1459, 1884, 158, 562, 58, 11, 2218, 1694, 0, 9, 1215, 32,
+            108, 149, 807, 66, 489, 836
+        ],
+        [
+            373758583, 15104037, 144, 50344, 22946962, 363363, 16872, 12784343, 2895746, 8821075, 39368, 161556593,
+            3337243, 24176873, 27910753, 531069, 475167, 486387, 59611791, 123315413, 810579, 469625, 7311694, 57085931,
+            1385207591, 866481, 2347835, 3018625, 1241034, 642873, 137910921, 39610646, 1489176047, 222157253, 12365223, 3398759,
+            5625, 1520519, 60081359, 33640, 1145991, 224544749, 318681, 33629485, 329966, 3024236, 643694137, 39928,
+            3286969, 2577081, 385990, 83853, 40890899, 894166, 45832465, 80082393, 179970109, 1218679, 1034187, 42333011,
+            11409209, 7803653, 19811015, 17524671, 5377814, 89523, 1570855, 596033851, 46928119, 100625, 113108149, 7926425,
+            156519, 5165237, 2085370, 168991381, 17100034, 2736741, 646136999, 123462, 11079471, 927006547, 7328586, 1494827569,
+            89528, 7445991, 6072, 14332726, 6104371, 13220433, 129609853, 39560654, 5064470, 20565118, 10095635, 12750881,
+            99306469, 212995865, 1581986, 2144614757, 4036081, 402597, 75940241, 771579, 16744, 30068621, 2437375, 5556603,
+            12633502, 11303044, 78375, 11286, 307461, 240219, 39015, 448463453, 7982639, 3572125, 162646783, 18944222,
+            125238481, 26256347, 1442315, 101022601, 106330, 10475787, 11368, 156584, 33592, 8921773, 22491, 12147289,
+            1134903, 805479727, 38961, 14986915, 3102585, 116596361, 414207, 45435741, 651022723, 28072, 285034243, 18950253,
+            151427653, 1861551, 1280422, 514425, 72819, 5584774, 81971909, 4963994, 350325443, 5800, 810645, 34233269,
+            522765785, 63742913, 38705343, 134355811, 810693, 34663783, 100737, 225964735, 5720, 1783419, 10257793, 362894,
+            110989583, 3388346, 525625, 138553909, 12164009, 1917625, 912, 22075131, 90312467, 22399325, 28120, 39208,
+            16929, 27911098, 9911255, 5500, 28922831, 2264116, 4343619, 39688, 111969, 9559067, 710125, 493681123,
+            22638, 9682075, 528417307, 7462847, 14389053, 151125, 12409985, 228407597, 17435578, 67240, 68533509, 67048,
+            22388626, 5994, 9592702, 181088267, 334360453, 1101373, 25803562, 169405153, 257049, 5858783, 15702430, 22568,
+            39930, 48728186, 307671, 13617443, 51070461, 4824470, 21337261, 27447121, 100750, 10800041, 615125, 14232383,
+            59550473, 14556577, 22734811, 302157, 1515125, 17250, 4310125, 57649895, 61750, 239945407, 7581329, 792,
+            128759926, 3890887, 173558, 2107677, 204404209, 11475, 24998725, 17150, 285487153, 240, 11583, 108116437,
+            5776, 35077461, 64207099, 207009, 33993047, 123250, 41886146, 660469943, 216137609, 139549015, 173512, 108412733,
+            239503837, 19448, 324258, 386019, 11500, 944965, 917125, 2448663, 46861243, 4064207, 2974153, 218284,
+            1684870739, 11718, 600187397, 15300462, 14584622, 439212163, 5170975, 11480, 492205, 19252247, 1995917, 190365,
+            81983231, 22750, 16954763, 7496644, 4925125, 72687055, 67375, 1182732491, 6825687, 31583755, 47470579, 12110545,
+            262892369, 31410509, 28112415, 6909565, 24305411, 2736232621, 12214310, 14115049, 61864, 933725, 120319463, 7032526,
+            866761, 11694595, 22192562, 28215, 22632, 71647355, 285417, 7239365, 51517949, 165755005, 64508905, 251875,
+            4550458, 2510266, 194426141, 112125, 213392933, 1643785, 8066721, 184815, 148202413, 128000131, 45894211, 44273053,
+            128248, 5928, 1090397, 161025887, 340202161, 17112, 2756193, 286985363, 360, 212750, 15026245, 481690679,
+            16133051, 56252, 96902926, 336, 76080251, 2247531, 855625, 26871482, 44217257, 140398801, 133919999, 15316147,
+            14852901, 1923295, 1632442, 324, 116451247, 788557, 9424, 3695354, 39501, 62166742, 34040, 27486403,
+            179469, 329875, 69120727, 497794, 85689487, 4170519, 10811437, 637637, 11544, 2264143, 11560, 1035044771,
+            117189145, 94163927, 84040411, 73112, 39788, 26933023, 110676805, 5237996, 3583892, 27880, 3343098, 939134,
+            23606965, 4438798, 73469786, 53289965, 50750, 6764303, 3823963, 6881721, 27301967, 998927813, 1498354, 4081105,
+            2829124, 4986695, 5014647, 88026221, 1098066469, 749455, 33288843, 184875, 33957, 492470, 100936, 131169773,
+            303459163, 247950493, 19509523, 68679167, 352625, 1556994311, 17199, 4438885, 2540359139, 353625, 77321285, 21527525,
+            61938, 145775, 26949845, 267895927, 8307092, 294749807, 101934159, 224094, 865203893, 20744735, 56457, 850149,
+            673008481, 3728967, 157113, 604175, 911754, 6032, 10135111, 352835663, 41416727, 16664245, 11996662, 18956186,
+            31757206, 573629483, 13779731, 1114383649, 3175587, 10548789, 41293765, 64257127, 727124, 252987097, 5724631, 33966,
+            400, 4444531, 1364275, 11789823, 6647289, 17168, 22984, 75370333, 6333951, 215528515, 504, 93162719,
+            436563, 784, 32265961, 397375, 11704, 337781821, 17239717, 18100901, 26413287, 11376145, 6395455, 432837,
+            22874765, 179375, 124953773, 37196357, 738369, 20566117, 75085379, 10789207, 22792, 250393355, 39102, 404710921,
+            178942093, 49131017, 12063727, 106204915, 44060889, 6093625, 69484261, 10543298, 593047, 245703365, 77774201, 184977,
+            28536, 22869, 182296045, 5025999, 89708861, 22815, 63452609, 54011083, 632225, 19682923, 144166783, 4416621,
+            11408, 486875, 1124125, 967603, 3477513, 23847527, 81804595, 95697, 553945, 142892113, 2532650, 28458,
+            318759329, 101156, 15920751, 255279079, 319125, 146005691, 3935875, 7859882, 12285, 380666, 2560845, 181882519,
+            3080451, 78797195, 3365682, 285610, 173901, 28424, 134757, 6015386, 123215209, 540, 560, 62073,
+            1090686, 531674, 129985006, 9235210, 66264913, 80161133, 16384855, 198020777, 28520, 87579037, 840, 1515483,
+            38996419, 4444625, 1308625, 32998317, 16456, 23970527, 1470755, 732875, 280071, 34155, 3745885, 34125,
+            408642, 224181, 867199673, 481474, 132673637, 11745, 139834433, 55481405, 12460638, 56511, 12824018, 25681071,
+            15451385, 50840, 308125, 591981611, 492507, 5774442, 14132187, 90045, 5545967, 63324131, 51434197, 21130813,
+            19006658, 41528654, 1336625, 45375, 458117887, 819008357, 6216, 794375, 17226, 22058771, 46140493, 84378,
+            57997042, 3667699, 559625, 50895, 42193949, 548457, 4008641, 1040375, 624, 141919591, 201875, 6860,
+            80994147, 1549132, 353133, 613190137, 7709273, 50949, 1252815, 541632529, 5713547, 180563251, 6237, 90217589,
+            96075874, 13444535, 4092529, 24249874, 228150917, 7016125, 17442, 53055353, 3528430, 10034717, 102409411, 101277,
+            35105863, 12250, 15775643, 5998773, 331303247, 417730181, 23981755, 28566, 928625, 43971598, 504291353, 4701741,
+            1072945277, 358435, 727375, 45448, 265050527, 677875, 82117763, 52932385, 36374811, 14724853, 666965983, 69176939,
+            207515, 4377659, 141383033, 56595, 30645065, 46414378, 36290969, 480975469, 19029307, 13316017, 14271891, 15926603,
+            2102529, 17608858, 76566931, 165637991, 47157943, 78618449, 1470875, 8357745, 609957, 31925201, 184990565, 123656,
+            16960798, 570999, 56185826, 213125, 108592039, 31399714, 28867479, 1368930181, 554125, 1219335, 756, 143205337,
+            45414, 699618, 1532375, 12119853, 164514427, 9173918, 71111117, 7832305, 102471019, 39546, 6200, 33786701,
+            1655375, 66784449, 37218853, 1169294, 3170271, 693889, 1387038, 1236125, 269936251, 13327303, 1180263, 336141,
+            218834, 432622019, 14355887, 105847423, 9023079, 5663405, 187573073, 2007555, 583099243, 115797617, 5048523, 18285631,
+            23064, 146072, 101439, 145407817, 900770, 1577125, 9794435, 1348990733, 2158499, 78890, 106856, 287863367,
+            32517797, 1303210, 21779329, 244876313, 419530327, 1552438801, 23903615, 32048265, 95897229, 31215309, 1163294, 590584049,
+            221856699, 122069623, 556358, 6658197, 3807575, 7072143, 48315157, 147476207, 1124876, 6760, 17994993, 104897089,
+            13852815, 6210, 101384, 67874587, 73359, 18040, 39933, 1040842, 531875, 17480, 2085875, 246753,
+            1269729, 8067191, 5171686, 350689441, 1800716, 24060175, 347391, 5244239, 17577, 18822349, 459195, 107384767,
+            6362335, 49969869, 330625, 73257743, 38532659, 738705, 22249019, 182827367, 12936074, 121247927, 158449379, 6448,
+            68489509, 146004, 1275774, 162925, 330397783, 3455756, 62426, 422968177, 107378918, 34408, 399535037, 19236027,
+            9280227, 11141834, 65062859, 1968549, 654875, 12488846, 50764, 28750, 70842998, 90712, 23601819, 53564218,
+            4489623, 17581315, 766521, 609875, 17682025, 235625, 3198363, 50922, 167723153, 157250, 528, 350974637,
+            880, 16793227, 4243686, 1085318, 1800843, 174296973, 40250, 17864, 47879221, 11980241, 33753139, 1744941,
+            624493181, 30852085, 12152, 31131595, 235750, 6613602, 114456133, 20767730, 72022445, 23247, 73078811, 17408149,
+            10191467, 140630, 8978431, 90250, 1286593, 2807079, 19649705, 145928, 6174, 9453759, 2700875, 44022145,
+            263625, 189999403, 805732, 23250, 2376647, 120018269, 95931, 2656173, 1269866, 47169343, 1144301923, 73744187,
+            1129990, 33574457, 77673967, 71977913, 3321591, 32847749, 9234753, 1040662, 123137443, 850516, 833833, 1219450,
+            2823875, 90385894, 3589707, 420250, 223025159, 4293962, 6426, 1510229, 61228193, 431375, 153681202, 431433,
+            6440, 600, 5551819, 153479977, 11650190, 936, 118335, 151606, 9643754, 112750, 11960, 17475285,
+            36017319, 163894138, 84568, 325156, 6166737, 188065319, 28875, 54352519, 5657655, 12332482, 14266647, 222891071,
+            8458505, 11924429, 146410, 56875, 15814947, 895375, 30746009, 1796839391, 537625, 19700131, 4327631, 172698427,
+            639088901, 776681161, 51250, 43916151, 174250, 5428865, 196625, 79233, 18330403, 7256822, 692724971, 59669234,
+            11700843, 28509987, 19404111, 79112, 24373393, 13377881, 299429341, 11108293, 123919958, 3165118, 193577113, 371641061,
+            18073465, 9218846, 218776, 8374839, 744625, 5797883, 63576071, 22959129, 75728722, 2633956, 351623173, 56943,
+            25776454, 813474563, 106155191, 2812190, 197696957, 297250, 526473, 5926401, 91386337, 196882, 816, 36028603,
+            577626901, 378600539, 61239477, 101750, 55381469, 414687, 682892, 107217, 19907017, 85589543, 11832, 1664373229,
+            291089101, 62262449, 40075477, 44899907, 1320, 23786485, 21992113, 6500, 68121, 719422859, 84952, 1224,
+            260791577, 10610873, 325763873, 6256, 23409, 19711406, 6558013, 1873718, 198010033, 6615, 2421094, 8676635,
+            2427022, 3483625, 14551823, 431494, 84915, 632684, 39388235, 1817810, 252909, 44407961, 99229153, 142992707,
+            7994836, 32971213, 1208598, 19633145, 492993, 2080557, 1040, 32316614, 23324, 11270422, 531509477, 24613841,
+            146421, 29778969, 342125, 565675, 9806602, 25027519, 2779205, 219006, 2516591, 65957397, 3561925, 151734,
+            40344, 63721474, 515375, 560082, 2214394, 32814399, 235875, 317205857, 226681169, 1232, 1124695, 1840195,
+            856375, 11934, 297381, 45973265, 714917533, 25441197, 45954, 3992375, 97982599, 722211, 32534926, 140875,
+            72642734, 2701074, 168831, 1151809433, 224721, 789291, 39032, 1350, 4204837, 4646621, 252747, 64375597,
+            140254235, 1683715, 17901, 76941907, 271753345, 342250, 60624685, 71335121, 18481673, 27436585, 283162591, 10281115,
+            69368, 1103880829, 6664, 73926, 7558618, 10358855, 620955127, 163096, 68229, 1104, 48997501, 23462218,
+            5076743, 17955, 3170570, 666333, 697962967, 1188, 442773, 145285273, 330993, 1313806, 17626433, 8520226,
+            83325489, 16542071, 34027499, 7474999, 634382279, 1270129, 7050155, 219330277, 12819306, 342171, 239191939, 74008,
+            1370727, 15306086, 3053314, 23059958, 40115023, 27509587, 25994683, 187568059, 15535793, 375687, 607349117, 129735,
+            12376, 12375, 1488, 3444404, 23560, 2469283097, 12349505, 45880, 26715805, 2393138, 588302, 95608,
+            301693457, 308655, 778221, 60236954, 5082519, 28782, 40365, 1694985, 1577570, 705551, 104193221, 50456549,
+            24472, 3919795, 146625, 129789, 29980635, 363664379, 4361375, 96255, 18733269, 73984867, 29074822, 29577977,
+            834148, 26643199, 86540003, 27135097, 245133839, 42099497, 22618453, 5809245, 347875, 13439595, 51272, 29241,
+            1718054, 957125, 80346327, 1405092427, 157768, 1418846, 2715556321, 309022043, 6936, 13176861, 560235, 1829175,
+            298194211, 576926, 4607375, 5283785, 5596855, 2019241, 8414205, 85198346, 6440943, 24272, 2544934, 79515,
+            918346, 319923, 3455881, 209106314, 4048429, 6010498, 7016757, 249678371, 597857359, 6564063, 2784754, 1176,
+            15737111, 1134, 7167655, 169125, 18124057, 28800941, 96309, 9442786, 23750, 1627977, 1226587037, 28868059,
+            14999235, 530190427, 2992017, 1119583259, 13724859, 175197182, 1400, 8240947, 46035, 6885, 7748713, 129352,
+            73899, 767125, 830658547, 3277010, 716875, 9604915, 12750, 60725497, 324635077, 686196191, 185879937, 17106802,
+            1392, 99453003, 29991655, 22210397, 101141183, 90774, 118408, 96968, 52519363, 3964502, 5624857, 252875,
+            174163367, 1936, 749715053, 53413775, 23088025, 1404, 6534, 21036743, 265828297, 7218013, 122059091, 100157342,
+            5541126, 19096831, 107625, 397271479, 29295, 128124139, 6865859, 109956629, 1063827, 6720623, 1493875, 1231175,
+            17836, 56997093, 252890, 731872099, 124859645, 12464, 316350629, 68552, 17514845, 4574003, 912525, 61631003,
+            6992, 21315986, 2690149, 46392771, 90995359, 51412795, 79625, 62744, 13087529, 37526957, 15038465, 34875,
+            6512, 951665, 1158625, 13093145, 359125, 208088, 230521803, 2315638, 24776259, 1398875, 13875757, 75281857,
+            8168347, 23598, 42496571, 41697205, 1560993, 1711913, 733677, 85239, 252809123, 92286695, 102510831, 79750,
+            91833889, 9118681, 16989401, 208502807, 46125, 1790199, 6413165, 1013060, 11337927, 2762875, 139427183, 237157161,
+            60267193, 45638417, 2874683, 845495, 22462414, 34965, 26358245, 24278771, 42988413, 47326367, 57304, 6848722,
+            18375, 73996226, 161127581, 424522793, 108346767, 532467, 38192362, 12555, 516355313, 55902, 106558057, 34986,
+            553366709, 12959085, 18023555, 10292623, 968267689, 10974634, 80709853, 8699405, 224750, 4903871, 19705907, 10069358,
+            724185941, 51832, 588411, 375873047, 33301079, 3640533, 18566119, 1520, 869576257, 638690, 2908235, 5982845,
+            29086343, 90909, 12584, 10365325, 2980915, 3383402, 303186, 52759861, 1023849089, 40664, 3394593, 104690999,
+            7072810, 6256663, 10560979, 1656538, 1818204901, 372737087, 45252529, 46991009, 16905633, 135625, 11187055, 1501995353,
+            174824, 25676339, 18498723, 230685, 649235263, 482125, 2880267, 141607399, 6804531, 2450623997, 183185779, 862353,
+            275761777, 1500, 163647, 1170125, 180375, 159629507, 1337505, 69954815, 65275955, 1836, 200509147, 4954235,
+            785916371, 1024338, 10885233, 6642, 186746573, 1904, 16720907, 192052, 27168911, 118881, 58774771, 202124,
+            9023930, 1053319643, 27521087, 487734, 163625, 156309101, 101761877, 6933059, 7229386, 28588747, 9739301, 18241691,
+            124509, 1119364, 30120415, 18387039, 11969683, 71218118, 68634, 2265362, 6513875, 13479037, 15508199, 1456,
+            22082047, 404054, 2198287, 241893, 29567109, 12792, 7089459, 1902342, 810, 74152, 149478187, 63099,
+            185679, 29125475, 135375, 46250, 202797, 132993217, 12696, 96652621, 2930798, 6776, 1929788, 30237865,
+            47650733, 482258, 12780339, 113373, 36498677, 5809573, 1913661, 6598358, 32060045, 318983731, 34955791, 348145,
+            12648, 36571466, 33658963, 6765473, 114903887, 12760, 6754258, 7182, 196355929, 8263666, 195819281, 158125,
+            219615, 208989341, 515865, 18392, 30645953, 19136135, 3249363, 1197875, 194416493, 8833574, 985439, 18352,
+            5876661, 197225, 51770585, 455295853, 15201043, 23958, 258741, 18088, 443223, 7715807, 25173395, 49059329,
+            275517, 85250, 29512, 64884919, 544341, 9901934, 135762, 2366355, 15877239, 7216, 292125, 29762759,
+            141375, 3120845, 286713, 49338947, 420875, 677994, 5166606, 538265, 24949947, 10633958, 17269195, 7176,
+            12970022, 204098141, 58238245, 1250065387, 8045607, 18414, 3841966, 38035987, 235346281, 2427685, 247566, 1560,
+            5094261, 15771019, 47516645, 923961373, 1667523, 1561263, 472177771, 2282375, 365010, 907235, 1505361, 840123,
+            24010, 840159, 12881011, 174933, 672182, 46376, 37477078, 133977185, 96668, 33049751, 7005938, 599781,
+            286750, 45990593, 354046, 12825, 8464897, 152625, 25486505, 13473698, 768280099, 717213, 1777403669, 230584,
+            81995818, 247646, 2511597, 147390, 48802389, 24452335, 105915423, 5205981, 777067673, 159132193, 2740772, 12048166,
+            60228467, 432117, 18901475, 84152541, 2126290, 38678893, 7654454, 169442, 38265215, 174344, 376216, 84874559,
+            74375, 2040, 62592937, 64224901, 23295298, 16844399, 9225203, 2847009, 24759845, 145526069, 86702618, 62352563,
+            7442015, 4832875, 13825721, 40859063, 7855887, 605354003, 4099193, 29624, 5183634, 4143542, 238828895, 91238,
+            337125, 12920, 7371, 47293129, 4177131, 24219, 487780, 388601813, 946542, 7397299, 109928995, 1997375,
+            5535985, 3545710, 1812897, 144251653, 180625, 1203587, 801125, 784329, 80844333, 11371965, 74750, 40131,
+            661375, 9348235, 845845, 80104, 4904185, 2785783, 197625, 11779887, 4579971, 11992254, 197432, 14502397,
+            134251207, 58310, 63250, 34944843, 17800321, 471764245, 3937066, 163875, 12467477, 141453, 374151649, 85544,
+            1656, 35224, 2137155, 24346167, 35934301, 5261963, 113535, 315208, 66808997, 448987, 66304777, 208568,
+            91074094, 499257, 476625, 2919518, 4747677, 34620641, 2724125, 13999286, 350550697, 74385, 1203685, 3467595,
+            180728, 35343, 1460875, 203919395, 24586627, 2042125, 5999694, 46552, 147147, 258936197, 74605951, 111924787,
+            11785491, 18773083, 13041, 616714, 19455033, 7400, 1920759349, 189877355, 10673131, 309304, 6340732, 1576169401,
+            11254475, 34290934, 393125, 436977713, 816644929, 41988317, 30831205, 108376, 33704177, 90833737, 118644037, 42401995,
+            352993559, 7581847, 795644, 57753, 68931, 25022582, 186184, 21730137, 51894, 360981589, 850956599, 35397,
+            15709793, 82074205, 1840, 4501790, 74779285, 7425, 32323235, 233719787, 5787514, 66556411, 83752, 130846985,
+            31831327, 5178302, 119288, 92918873, 326095, 30707743, 454779, 14468785, 41013, 13224, 1097505, 29750,
+            46683, 216536099, 1119875, 83918953, 1617245, 756602, 689458, 885115, 293258855, 1960, 196009643, 147231,
+            605605, 2014330, 7448, 173951599, 4300593, 82784207, 24815903, 717409, 29835, 24413389, 64996685, 57411193,
+            43229351, 17219198, 28169913, 49193869, 63375, 588969961, 1108723, 242242, 572177509, 39741194, 4915515, 13535315,
+            229851535, 337311, 577654, 1890, 1444135, 4149695, 23340273, 56086043, 180083767, 21998561, 32340185, 18465785,
+            44537545, 1723645, 147250, 399955211, 158301, 449032, 44884063, 11405339, 130438, 2025, 65622941, 24354,
+            275848, 111746041, 7480, 203030729, 103036895, 35464, 258522671, 402979447, 1947253, 57959057, 29848, 52250,
+            8091055, 2059057, 10544913, 13125, 1848, 7386314, 59630467, 196988, 21053851, 48584657, 28734563, 342950,
+            96848719, 6385729, 1337973, 23094253, 218576567, 186283123, 2673979, 309386, 99352985, 430963013, 45689006, 6145531,
+            3009391, 37046891, 13859573, 126760705, 46750, 211477019, 17778167, 1782, 13261409, 3512509, 505673377, 91940614,
+            20316037, 851690, 30847677, 186858917, 365207869, 3177097, 1265327, 85833, 1399489, 19751433, 7696, 12736009,
+            134603521, 15391255, 1405118, 3031678, 3792019, 11674018, 6983858, 208791, 5133667, 4295135, 39836338, 3585183,
+            1332331, 136161, 1282293, 4071529, 1968, 20573267, 97125, 589375, 1142375, 3847899, 2824975, 1891351,
+            1561625, 8470865, 3697001, 303875, 1461005, 6262837, 208887, 24375, 4406961, 960950989, 17129825, 225625,
+            11914331, 773465, 583389, 198375, 19846541, 507188489, 337800149, 1776, 231363, 309799895, 4910059, 8135491,
+            45711419, 70313487, 1360, 114222515, 781495219, 924873127, 4965961, 43095363, 69212, 2584625, 57942, 47096,
+            7656, 3590867, 130625, 2052, 5994766, 16403198, 8197007, 4222634, 226061641, 133021811, 10734905, 39165573,
+            1008273, 64232, 52479, 1679046, 3473457, 30405947, 32759467, 18500, 1466762, 309519, 320705, 1523360863,
+            17459645, 94087411, 5860393, 47360555, 130696, 3422926, 12942933, 18696, 13250361, 247135987, 1673497, 6961885,
+            1891505, 170295386, 8375983, 347023703, 530286257, 35625, 258986791, 7695, 16218685, 376623, 54219763, 29754,
+            1958396939, 2349893, 39629575, 31222115, 95032159, 177741377, 23384974, 292668, 30008, 298375, 133910545, 56807723,
+            16822429, 59289659, 10913799, 6888, 35750, 36661339, 6643021, 907549801, 1707069, 7257943, 10254205, 33860761,
+            168747491, 171419483, 1057317061, 305573861, 1321375, 5608941, 21333571, 593129083, 1258428539, 3150464641, 9058231, 7928767,
+            432575, 19305, 162514619, 13898877, 11327477, 2713295, 22803715, 29500559, 958035, 980375, 125125, 1382875,
+            49143835, 1824494, 198254, 11096995, 50703653, 132261547, 40775665, 89269279, 1584125, 907742, 1333138903, 3507185,
+            270351, 3954275, 474162733, 3473561, 13338, 795938, 382278, 1830101, 3210823, 512962931, 118376061, 4558023,
+            38998011, 122892703, 30976363, 5804582, 57288543, 2942511, 1584429, 1768585, 15089599, 37265105, 108375, 12965407,
+            9449297, 188636777, 35681107, 201035341, 80408, 2025788, 45694623, 119625, 2228377429, 7559877, 3965585, 40624727,
+            1891617, 49244523, 3434459, 52808, 113926413, 28852187, 176019989, 3959878, 52168071, 93496, 163582381, 35113111,
+            2132242, 14234363, 835210, 567605197, 44867571, 7749909, 69375, 378445211, 81537967, 276115, 2489817, 9997141,
+            2754, 78508191, 387933, 1125962377, 36901543, 51089233, 58462435, 8867965, 4988470, 505310, 2106, 19349239,
+            2088, 2640715, 844902539, 241670, 169911, 30056, 51508639, 8845627, 576247313, 24972779, 25660203, 74888,
+            107363789, 8120, 1306290217, 156075049, 361077119, 27499479, 21998878, 112556917, 114994135, 382375, 477365897, 53996098,
+            1707230, 1500037, 80386311, 5855005, 1188939361, 26051663, 1701623, 19393941, 52330267, 251289533, 2232, 4038254,
+            10131387, 583625, 628342, 46904, 24078613, 137961613, 11841907, 723387, 106827177, 2280, 2909125, 3512795,
+            7722, 26722527, 7888, 287375, 606081, 3837273, 1884782587, 2243788, 814694477, 1153166, 7752, 812890,
+            3350666, 861030053, 13451794, 61822137, 47081279, 7805941, 2601655, 1047625, 25974, 389636489, 365638, 6665698,
+            901417759, 2128, 66523303, 384203005, 231594, 5329443, 774893701, 84305143, 1146941503, 2053634, 24754835, 153900593,
+            5301751, 7875, 1792704131, 9421458, 119691, 3999182, 5184245, 114457577, 1679319, 87223097, 53571301, 19125,
+            2199197, 19024, 102951, 38411219, 315375, 11886609, 801591, 1672139039, 628371, 1377519, 401051299, 36046681,
+            3868466809, 173353829, 5519657, 61358181, 23670409, 186813, 511014, 712287, 40378933, 6246383, 343343, 2763826,
+            171366, 19240, 376980773, 244207057, 30250, 19250, 64265015, 57087457, 7800562, 6984263, 192423, 186875,
+            827518061, 89503851, 7140815, 64248253, 14133889, 36398857, 4161311, 912720803, 63798, 13456, 840875, 394522213,
+            281875, 528973021, 176886751, 508860071, 119164409, 62783669, 106016729, 717899, 6973109, 4379277, 2250, 59474389,
+            114340249, 4686628, 2372565, 83729409, 566979, 4854633, 203643, 7308521, 28416333, 1886225, 8907269, 7090258,
+            8297894, 2704, 466412, 6067555, 13820885, 136648, 58125, 2383745, 40792639, 7934495, 298701, 371349,
+            5603591, 1863875, 18896545, 33313246, 104826097, 241182821, 682921543, 986271, 728563891, 2993082, 2320, 365769,
+            28444273, 4396197, 782943421, 20579299, 19096, 466375, 114219, 48546, 36015, 21365510, 103775195, 75881117,
+            818565, 14150725, 259545, 32737475, 1729749, 109599961, 13689, 154951669, 198099, 583786, 71627129, 1248338,
+            28176055, 114376, 3132922, 958375, 8611010, 33520085, 924692, 5340907, 20657483, 6553942, 9209189, 11584775,
+            153387, 147928, 75141, 1177239601, 80263681, 313774763, 30429, 457023731, 925071, 1153977, 169273261, 5134085,
+            86211406, 45538597, 13662, 2484, 2104311, 5318565, 9511098, 80979223, 47334, 178820989, 2629781, 52785,
+            12395499, 73343287, 1338370, 3513003, 20981681, 2663331, 987682847, 13616, 360308, 152877821, 10439033, 133374307,
+            13640, 600625, 13182998, 6688157, 185948261, 74936, 18142055, 29042629, 91130669, 61280087, 449673, 4111158,
+            388356551, 19852646, 25302851, 4519229, 141770497, 216988933, 41625, 315549, 1131735, 444125, 13535895, 28730242,
+            53772755, 34325159, 399627, 6950865, 66406083, 128617357, 43375355, 308559317, 1459465, 300269393, 445318751, 6470165,
+            1265875, 1170875, 1898006, 55550326, 30504, 1327375, 147422019, 147875, 276458, 9561446, 124402405, 40826318,
+            80956777, 17511027, 811251307, 72918418, 4284489, 13408034, 2200, 1634875, 31518878, 114244, 1257187961, 463631567,
+            332367, 19757621, 6302506, 80750, 10310521, 5905599, 252815881, 1316223, 130053927, 1522698, 8008, 371469,
+            37667971, 3110547, 7830, 1422421, 438625, 258622, 65595635, 59362793, 210829339, 550375, 37533873, 444185,
+            53795137, 127376323, 543417631, 25160, 6990114, 63722949, 20629687, 9153287, 522261, 1796977, 5480797, 265371067,
+            809384287, 3267145, 2780346, 72717313, 7750379, 29277434, 8184, 21876266, 818741, 77949651, 120908711, 24975,
+            14603459, 37992229, 14709903, 56070311, 360375, 157624181, 331165405, 187083, 254163, 366025, 84942611, 2875873,
+            913818, 56215617, 6431117, 30537, 3882099, 215306, 49082757, 2600, 550449, 198699243, 30697341, 3446050,
+            13201195, 329577833, 1400205, 122993727, 248675, 15950937, 8784574, 1489550, 417430, 129042199, 12060191, 2664,
+            1447510781, 210057991, 288711, 41769, 2333675, 43710961, 1368, 2500, 9801911, 834537, 2856, 35960,
+            2853513, 58564, 679041, 963584501, 5173597, 1333241, 2646, 50955511, 416507971, 2171546, 226270, 2065375,
+            49278515, 8200, 10556585, 1366625, 7722455, 164775, 2288, 525423569, 2054195, 2820062, 21300565, 226287,
+            30625, 9673391, 31759431, 1411372, 2003875, 2847929, 136857, 2915075, 420571859, 24011546, 1523030, 1187811,
+            54471659, 17231071, 61844861, 158949, 33693621, 19774497, 13832, 5609470, 58216543, 2311375, 10779938, 106620787,
+            128131091, 3557939, 2067630, 41912, 136611141, 20210547, 296429221, 1687314, 36018, 43213467, 288078, 1601467,
+            19987090, 175750, 65729797, 36250, 97750, 131192, 46086677, 1232517, 53040647, 142376, 78760303, 8360,
+            11624327, 51966434, 3771770, 97755, 38909123, 25137, 14436105, 16867763, 1567918, 236498857, 8661663, 600875,
+            7581310, 10584826, 117303542, 89252695, 52822, 247354673, 24911783, 36723425, 58653, 2602105, 95798587, 107101553,
+            68340554, 8813622, 3032524, 2576, 2184, 45997654, 38579345, 92274, 1101288659, 18678957, 2652419, 181629,
+            476030389, 942951907, 40966289, 391699649, 851337407, 18511251, 1193466, 572251063, 78313079, 49943858, 7728149, 220779,
+            4714762, 461125, 65416, 15755294, 5134389, 16230778, 9270831, 426609223, 54997195, 2760, 66752693, 26660933,
+            1310804, 8664, 4547517, 242811, 1981694, 2480, 90508, 1920178, 37998062, 1808375, 3021495, 3121937,
+            489118, 8432, 643406209, 4474822, 265885451, 95658901, 19575, 181185881, 8250, 51436401, 461187, 1037881339,
+            6156502, 8694, 70241161, 34420443, 8292531, 58696, 81337315, 448622669, 25828797, 2372979, 158104774, 2835,
+            80314367, 53176, 11859211, 360639, 57367405, 52587953, 254375, 3479762, 221305331, 5285401, 8680, 126208291,
+            196888211, 120250, 166942705, 478142, 3954965, 86563997, 343910, 399854, 2639578483, 42889327, 204085, 30138535,
+            17874073, 57277987, 449878, 16867449, 8376665, 25739207, 2166242, 35242105, 86697, 315875, 5536951, 79677169,
+            220875, 561875, 301739921, 54460637, 383102329, 1986509983, 858665993, 338198, 50704282, 12714515, 33084623, 2484807,
+            19657534, 23329943, 37148419, 37729783, 93238483, 65981641, 5900323, 8464, 942057, 10282909, 3418375, 149155253,
+            7924406, 8639390, 100555847, 1104117, 30750, 8700923, 2904, 13986, 2456909, 47560, 14486758, 362827439,
+            27583959, 522886, 148257, 133743641, 195049177, 8500, 584402, 117510305, 163052007, 42386415, 217996139, 539539,
+            51162235, 2043251, 25245, 433719853, 91483139, 20998929, 20708234, 338338, 50793655, 3602875, 30856, 44522966,
+            4486097, 914095, 270251459, 142195729, 248936, 673486, 134990245, 153790, 187474763, 61682987, 25728109, 190303321,
+            17438135, 52442731, 165044, 46020071, 7560590, 37662769, 6996025, 54857199, 7633285, 1288651, 10992879, 13446881,
+            74707699, 7745089, 35191819, 36531, 19494, 3999796, 23687807, 377487, 2952, 49753951, 16057349, 42168581,
+            14136, 13750, 25431849, 891670, 2088025, 237846371, 75625, 439002, 137180, 64449, 762473023, 15028867,
+            96162149, 7767453, 7409703, 757625, 25256, 16029483, 6168669, 440936591, 1031525, 70610282, 159495, 7912795,
+            269815507, 23553645, 45276259, 355677911, 1020099721, 3485547, 3943925, 8528, 47709, 25432, 9997955, 72231178,
+            8063757, 10204777, 933672787, 2014767593, 255443079, 2992, 18192839, 13061165, 327426, 32425055, 221085, 59754507,
+            2960, 2149565, 1003574, 47656, 6280972, 2976806, 997080107, 2417875, 364661011, 255214463, 3798613, 18321465,
+            424518797, 383214, 4660076, 110316073, 617463239, 528471, 5811065, 76703405, 9533953, 19720, 870880303, 14168,
+            5000567, 3731517, 22938797, 226625, 73092279, 2708585, 2970, 143297337, 189951319, 483759, 11155111, 266897569,
+            70125, 243340, 149675293, 10814133, 6398117, 126063, 24520783, 307716013, 98098, 45427369, 102808741, 475561111,
+            430986397, 58956, 411125, 24302729, 494949, 3547115, 163421119, 25465531, 425921927, 327267, 2373217, 985363537,
+            120472, 350468107, 109628555, 403578677, 328180787, 81375, 23000393, 299782, 55372017, 2032225, 3983161, 137241,
+            29266741, 2222297, 590031, 10305449, 25018323, 20199755, 109250, 191807143, 4268075, 82908353, 9746639, 4273841,
+            114885, 86913, 696303, 42471, 18142719, 6487474, 101265941, 65093335, 219069601, 39256075, 170106827, 891982,
+            265825, 1417375, 42066, 47817, 3345925, 295619069, 470412721, 271377, 1970709, 58995, 1867018927, 2382058631,
+            8114197, 7856994, 16130261, 3078, 4230093, 332730949, 8775, 32430713, 11244966, 9265918, 81016, 6219195,
+            14250, 47004122, 310857461, 3132, 42250, 630375, 57988139, 282625, 59340981, 98072, 3189435, 42839303,
+            83283115, 25650051, 142857, 2311730, 10719163, 1065311897, 3547186, 30200177, 31096, 4536354, 36408, 70532099,
+            2021125, 24604797, 10970729, 802503, 20358, 198772279, 4146130, 35220107, 3344, 416888, 3280, 8750,
+            41972889, 4285099, 632807929, 10965227, 31160, 1003625, 98260, 4726306, 23296562, 3080, 24465399, 3032041553,
+            128086823, 11786905, 14384, 1459971419, 131733, 3284515, 2390122, 9886289, 35816, 8192525, 824915, 41866647,
+            232375, 42694003, 12435367, 70644025, 54958505, 8628622, 121820465, 3396174, 1310595463, 44790239, 92625, 30535775,
+            90846283, 131750, 9835969, 5050903, 2518569, 707434, 3128055, 11294987, 5330605, 3432, 33576751, 953498,
+            131769, 193192, 1138046, 260337, 10635387, 8816, 578985, 33615959, 372155, 1456611, 416875, 145354389,
+            24370027, 5414358, 15560182, 5363738, 356125, 1193907, 62829219, 3248, 3642317, 6823179, 537884207, 460479487,
+            103818, 38445627, 8706873, 1920633, 15906781, 42328, 746691, 25706006, 74668879, 78917374, 4581451, 87846,
+            5939817, 9897537, 14406, 676572121, 14671401, 1361613, 121725499, 2104991, 696964453, 5878375, 64750, 20007,
+            5660290, 40905454, 103289681, 670797679, 14440, 1948583, 112775923, 573417, 4542349, 11943503, 21876933, 304691777,
+            4413773, 323446253, 2200143, 545751, 18779942, 4972775, 110903171, 970347, 16907435, 30463082, 34778714, 14855907,
+            28842095, 24068231, 20424, 1277535, 1015132, 165416, 89706463, 662490587, 226935, 139809163, 59922499, 40776755,
+            595820, 8840, 8254129, 405769, 5414126, 7482705, 5039918, 254852, 14500, 21726133, 287759693, 282663,
+            635375, 57485279, 50324483, 534394, 122351637, 69777745, 26790589, 53625, 7236705, 283058547, 57418231, 1870379,
+            170548651, 193375, 757965, 20184, 193401, 33465061, 40307223, 1702675, 3038682, 276210809, 2284047, 43163687,
+            1261078, 333125, 612625, 394625, 215061, 17639713, 3952, 14504, 212691947, 14906042, 26153367, 25688,
+            8494577, 25725, 18031057, 5543031, 11541101, 105223919, 98063123, 23492521, 1154881, 4844218, 8377161, 1166030,
+            93250113, 6342413, 679697041, 450549, 936624623, 439375, 2490891, 34700501, 42750085, 3798975, 3765399, 753513293,
+            231043651, 117158579, 95676191, 3192, 98281346, 15051647, 176824, 1674398, 127773971, 86654117, 69621567, 2238742,
+            942513, 98901635, 18953275, 14553, 42687, 15074246, 12055414, 81634, 47680495, 20043529, 20177691, 6180554,
+            3472, 138640967, 16633298, 12446841, 1192366, 77978303, 2949309, 81533543, 4369183, 191153471, 84166439, 96889273,
+            48125, 4346839, 20317462, 3500, 3088982, 623875, 16310266, 825125, 35701078, 752463, 137564, 7275866,
+            641925469, 22083935, 6057381, 13162259, 62265117, 87185065, 948125, 4598321, 27735421, 35242753, 16119389, 736972253,
+            3849628, 318555163, 64165451, 29345329, 47635809, 210250, 150592385, 92907, 344375, 221375, 3480, 37685615,
+            8992149, 39446477, 1071125, 45450163, 9016, 110204679, 5789095, 154375, 32721838, 501126, 55819606, 138875815,
+            14625, 236505179, 60028865, 1132625, 18332986, 61996838, 15431738, 5224466, 1680455, 584815, 4905901, 15756265,
+            86363365, 80874049, 83137939, 1516922633, 64076045, 3348, 160515, 143621729, 58715263, 628967921, 433895, 9048,
+            57099731, 14895221, 646555, 23777745, 657514, 87436661, 43851422, 76146, 477579521, 64935, 3536, 428415,
+            771294911, 964975, 132055, 333391081, 104715365, 736078, 19501405, 25839, 120879, 242257315, 1775554, 6152523,
+            53816, 638828749, 13167622, 268927201, 21983402, 104125, 4145739, 4967417, 13682229, 11077285, 1244485, 9780934,
+            266104, 221317339, 2937974, 16628183, 535452863, 25398877, 294872, 272309159, 13514543, 42532, 5375838, 769318,
+            20336, 5280478, 104139, 39100009, 2127426, 76167, 724625, 521284, 44516693, 9768, 232925, 111194213,
+            143336, 3625853, 139870915, 18389306, 28434279, 25875, 63751925, 59432, 30681362, 72421921, 42481966, 702297,
+            67357451, 87464, 168927755, 155830381, 5213425, 10361517, 276132779, 12061175, 545710, 9126, 2474329, 23056709,
+            334369391, 1143905, 204795, 76125, 154695631, 468590903, 248048629, 535262831, 81918, 3173093, 1995778853, 1932125,
+            138462289, 316475837, 691145, 1747625, 27556675, 165669, 3400, 221578, 36461555, 37544, 102065795, 3510,
+            1596725, 9875515, 2798410, 652023, 13145671, 3251375, 22559251, 18690957, 29261635, 25752, 735875, 59850119,
+            47278317, 129317109, 19406365, 126875, 49631615, 26248651, 517665631, 167546951, 97688843, 64206, 21172954, 7600411,
+            43001881, 19255577, 7835597, 16169907, 55948366, 8079902, 144113811, 143169089, 165699, 9998547, 62292981, 83356117,
+            803022, 12916515, 3552962, 53896222, 540430, 4430914, 87465, 26025213, 46439921, 104536619, 53388262, 132184,
+            298984751, 2379351, 23224487, 50168173, 1440257, 612963, 830875, 2239625, 65170, 4431526, 3864, 3950206,
+            4962181, 68531437, 137750, 152504417, 241843789, 89706467, 325705003, 12642637, 3312897, 148862, 4760697, 46875658,
+            9315, 339512, 1138781683, 268005023, 4800445, 84183473, 1814813, 492236693, 20216, 1322951, 540386, 155416855,
+            154192391, 93177, 15147, 38965979, 25745533, 26068, 417339, 34874026, 154396, 132250, 898101, 73193585,
+            7029942, 15291903, 67178705, 42849, 7209422, 2357201, 223760201, 201143063, 162113683, 9903938, 21827069, 406692937,
+            109377627, 812018243, 31671, 21268049, 3720, 15510341, 1636029, 6275665, 72835721, 1362053, 126567, 4151485,
+            9830913, 7762546, 54690665, 495635, 95480905, 298297283, 690105973, 195368621, 13961935, 143374, 216125, 2731625,
+            31556, 76383, 3631641, 267003, 2753947, 109850, 54027, 9238385, 43588945, 450976999, 497122417, 428582,
+            9624070, 5498633, 132327, 1037875, 12994885, 8847157, 9384, 126711, 20256299, 54981383, 797511, 316778,
+            37618841, 14755345, 121125, 607453, 62684401, 1960287, 3609572, 29820791, 1423539, 107069009, 22950693, 93170,
+            1658452, 161068377, 29373926, 512014109, 14872, 154992095, 4587814, 361522, 42767005, 847847, 791945, 68989921,
+            91629473, 512435, 146601511, 1071455, 74641443, 16158857, 1239161, 21804761, 339160241, 26163, 9920403, 10686322,
+            216172, 239317369, 8623549, 32263653, 2228732, 148764851, 566857723, 3654125, 3838513, 266511, 1104872551, 28808978,
+            10277895, 15092, 36914678, 3223625, 1574573, 1150084727, 763994, 12452638, 1401686, 4699383, 21653863, 21145263,
+            178045295, 20904815, 72332815, 321792149, 1909985, 139094179, 2021789, 37352, 2144779, 47099571, 340982609, 56658433,
+            1669625, 1742279, 2301299, 316733209, 14985, 1205645, 903805, 2413103, 90388643, 39357381, 133470655, 16008,
+            227409, 2446625, 55070911, 3800, 526973123, 14716754, 14342169, 597613991, 249777, 33582939, 1043575, 30290494,
+            2323698, 79393015, 693325943, 26455163, 4201967, 16885645, 1603998433, 59682, 2284545, 930987, 98865, 7298795,
+            20625, 183674465, 3363437, 7030475, 1350965, 54250, 56101694, 108964101, 126829769, 2558182, 1954815, 158016331,
+            540462, 2692613, 732796951, 11077913, 712963637, 3754751, 3257319, 164064803, 22034055, 206123929, 44270722, 258317761,
+            149205, 108701338, 3996, 3640, 9870217, 40173601, 34046974, 42920, 476864399, 13094990, 26364, 8724287,
+            1043901, 13760877, 347696359, 151604477, 4056, 875679, 1351075, 8370, 171585, 2854789, 120993829, 4928693,
+            7561411, 4481477, 51046177, 20500, 26622, 4112446, 990938033, 1049237, 255476, 26312, 194977509, 21547757,
+            377541343, 16678882, 12313081, 18741610, 898954151, 84278739, 154947527, 293635441, 43173, 535002, 4939802, 339082123,
+            48488, 47457421, 6214439, 1406997, 17455889, 21961435, 4218285, 8243482, 1988371, 2117058, 5487713, 1787125,
+            2234325, 873435833, 199375, 1320574363, 30720989, 601896131, 112055483, 68939809, 103318319, 1010135, 43065, 5633859,
+            7628709, 149173085, 25852099, 492974857, 154845, 68364049, 33057739, 226773481, 2049875, 167089039, 48735, 31875,
+            1535611, 637588171, 275596541, 6493949, 14023675, 28758917, 31768, 54243, 3548155, 9261005, 4048, 15096,
+            5169075, 138125, 1270935179, 59895, 1351155, 6549851, 121365, 2295865, 5571830, 15080, 751689, 786625,
+            445625, 3969, 248250353, 10485171, 99981, 8942353, 20810206, 10613834, 1082851, 74915787, 126910, 159911521,
+            12340834, 6013189, 244375, 53936311, 188705698, 43125, 10462881, 13934239, 646898, 137624201, 1837462, 15555397,
+            4593281, 190930519, 453800227, 182875, 227601, 50962549, 339405, 86995563, 539070067, 328251, 5902138, 9464,
+            100165623, 618915, 24443503, 82308, 322558193, 23632941, 864875, 20493, 10194602, 31941, 931931, 6197737,
+            37093639, 60118885, 78118729, 205114, 7656545, 60088, 2648107, 1625151, 4593655, 276546871, 3072937, 94050187,
+            509113303, 217583597, 3642947, 9500, 6907678, 5242069, 322677, 1336276793, 174691541, 2128269, 40017263, 17350142,
+            674817, 615988507, 1425079517, 3726, 6259253, 113872241, 180577945, 2485978, 1049427, 2944414, 3447493, 951494749,
+            343984711, 93284389, 95531558, 3486639, 5812079, 518375, 9639, 1480739149, 71145, 221938247, 7092211, 425738465,
+            71176, 714025, 9604, 3750, 474466651, 2882915, 2972365, 19546709, 1010229, 12933739, 54375, 535348,
+            61024523, 67956106, 1289739, 3134494, 272428, 2351877, 267910463, 377986, 47390465, 1200325, 36791885, 11167351,
+            85117435, 1222795, 7326995, 6365529, 11815765, 12179167, 1047352081, 20925, 10026919, 20659165, 49380563, 619806553,
+            147904466, 775523, 10686599, 1700901359, 8785931, 114526433, 87152221, 17120714, 48474921, 31151595, 210945, 202501867,
+            971074, 406593, 2318342, 2804711, 27981926, 22559825, 4144, 48011041, 1746566093, 2112297, 4409068, 76664,
+            703917, 60025, 14719414, 735212089, 445875, 1853564, 126701357, 414189581, 11826983, 607836, 22079121, 4158,
+            306130, 9750, 585603, 1681043, 960039, 8864275, 21509102, 3704402, 5521495, 228109687, 9389765, 54405,
+            3358113, 10200308, 103821635, 4157503, 240189685, 469502657, 1882375, 5499125, 55708507, 527728097, 149396, 75726235,
+            110446, 41510078, 3179267, 154744, 81847409, 317275, 4548786, 8953637, 20374211, 20979, 12196051, 512785,
+            19138691, 1860089, 91428665, 12754973, 211048, 106264497, 58486769, 1234857557, 245841207, 6851930, 4101682, 26620,
+            122452, 49096, 174803503, 81567758, 507297, 7757529, 1183693, 533765347, 296978539, 71253, 13828269, 2983665,
+            2011009, 1966206, 1021605, 10144461, 3889277, 250125, 619115, 395261935, 1876833, 19244986, 30151081, 1753941,
+            170851385, 17964869, 1256375, 6214945, 38664681, 1418284, 574354367, 274691219, 3212881, 51935323, 54621, 199875,
+            48951, 5219643, 21631939, 9801, 20608705, 339625, 24466053, 138411, 19541291, 16712751, 46854025, 9842665,
+            1801068721, 500907517, 63931486, 28608297, 8853207, 31062351, 148686881, 7774625, 389992, 1071927, 71415, 93639,
+            18428663, 257144251, 76923, 6712233, 111150221, 2972541, 2279385, 90355431, 104949, 580894709, 1027681031, 285815387,
+            6186818, 1586234, 15435, 954569, 1617806167, 12481157, 39056001, 1343890579, 444213601, 10955077, 35193327, 17305257,
+            181422137, 340742731, 113593083, 786842, 390980059, 4590, 268447295, 462917767, 49632427, 3173798, 4488, 12095146,
+            306153, 2530971, 3134677, 123543277, 9048683, 501809, 93692695, 4840, 9121486, 1306858, 37268, 45339151,
+            250263, 74105339, 15734546, 216756545, 350889, 70169983, 16321513, 45395077, 191282927, 101356653, 116127, 51818019,
+            2307361, 21598475, 230373803, 204989545, 4962625, 177625, 20418871, 116197982, 72506489, 116035945, 68688653, 4312,
+            132867, 441714689, 322959, 532966093, 8283107, 1223219297, 15661877, 26680, 127305, 43384, 27719549, 6935929,
+            2039135, 140967299, 82593, 434051033, 2292519223, 37720, 6052735, 244647, 113895287, 2402455, 15525, 2681965,
+            37730, 19088597, 596781, 859625, 2229175, 1994678, 423605, 255512, 384475, 62556455, 300625, 5456,
+            160839, 2924938319, 37962, 1329185, 261375, 34656769, 15498, 228305429, 4342023, 94995155, 38251155, 22264,
+            4440, 4917913, 3241147867, 112480741, 3201055, 193015889, 216783, 11340885, 1400981357, 49760962, 4638535, 301132085,
+            17556981, 79438297, 205770, 27842581, 6114251, 1264300249, 949026, 65910, 9880, 115736, 3391927, 1378420,
+            25953169, 2939167, 60291, 2726715, 3520495, 446539159, 21160, 15500, 4116, 274864697, 686375, 10899317,
+            507507, 26754, 18976867, 1312366, 2810577, 15606, 54760, 1989110, 43902677, 21080, 177674, 3950934,
+            434045557, 1188946, 261625, 153511039, 550865381, 405737927, 2783121, 55143529, 24516505, 26534585, 4455, 31806,
+            35523293, 21995501, 26238254, 9990, 18635903, 5085806, 250458, 95582211, 101971627, 1910375, 26584895, 115934,
+            1200562, 117237923, 15640, 11469535, 497576, 71148407, 4051611, 6981373, 1094459371, 496375, 42510809, 568875,
+            1340595, 7411201, 21114, 4465209, 78504827, 29094871, 32957495, 686343, 71001, 10064, 111475, 175955313,
+            129916085, 26903503, 80215421, 5588869, 118300061, 7796931, 14096842, 71672, 76056423, 72478819, 34998215, 4157875,
+            55971565, 1172889, 5583226, 273685291, 39363649, 54808, 99489559, 401375, 4470895, 412641, 28658942, 356668,
+            1770782, 66777082, 21320, 228095, 85581001, 4428, 462875, 9672, 33684245, 61449781, 4600, 51460453,
+            22789481, 5415605, 859775, 88504, 455522429, 313659471, 41909197, 78499285, 3084599, 43624, 60375, 322983527,
+            8121189, 8311689, 295191, 66346651, 10098, 7042321, 181606835, 70069597, 12542889, 2894682, 43399689, 865389,
+            379015, 58655545, 136920397, 373388, 446121, 8959730, 19072198, 2122945, 1128127, 43327037, 1871386, 60680,
+            88434, 50193, 876603, 187258357, 49967725, 31487417, 3872830, 412610, 977207, 647241, 144310397, 99470,
+            175379617, 2324426, 56156035, 13409345, 105165, 80942147, 1130235479, 9015747, 324962515, 44439461, 66302002, 6975254,
+            1390895, 488542609, 18826093, 10120, 14465631, 5208, 61256, 73434815, 859826, 26896, 14689370, 43192919,
+            21112, 7187719, 99603, 483042067, 135578841, 3889625, 6762974, 4592, 180947279, 15851830, 317608, 116375,
+            40576945, 100831423, 560374139, 9222499, 35892389, 3101445, 15108769, 5946753, 2279921, 629869019, 3129581, 767936443,
+            43584233, 26462065, 5875748, 69359741, 272259949, 178409449, 24611521, 9999490, 21375, 7439327, 127792043, 1204533,
+            294603199, 34589937, 681559769, 43605, 227685235, 82875, 104632, 613965013, 781625, 1541785, 37638, 574821,
+            4376042, 262795773, 288985261, 101586101, 4593927, 6706975, 204974, 3794609, 1098612917, 5016, 95425781, 2508935,
+            30928514, 1251222, 43612233, 251577059, 54945, 2626351, 267375, 387850021, 140464565, 5795855, 4677838, 152002331,
+            295323, 194750, 3258025, 9110695, 3235661, 999635, 27027, 23616791, 29486301, 10418821, 8557315, 26629837,
+            243387665, 756750899, 398443093, 317709, 32625, 36071331, 1061151, 379250, 317750, 1648115, 114487867, 5667389,
+            2128893, 75754757, 10290, 166750, 34042177, 4185995, 51130781, 513375, 16310702, 16534005, 2548147, 311881979,
+            5320779, 421584919, 720195, 133250, 9429425, 15376, 681070, 176525705, 20078383, 94136, 721533949, 376301137,
+            1184183, 233864, 237244333, 5969249, 336265559, 71750, 2972123, 8546204, 127797519, 145350289, 1083434, 2867062,
+            218501051, 1852910827, 21250, 11704654, 14164179, 43940, 3917774, 26936, 5292645, 1519590, 29419093, 7730093,
+            3750019, 122728, 836939519, 1195355, 109004153, 22359063, 4141345, 553789249, 1419262, 110889, 89618033, 82984,
+            479391967, 147793151, 550971899, 32643, 4698, 16372433, 7579195, 2263062, 22934795, 28257610, 155727, 1307215,
+            233926, 83006, 31359055, 195051013, 289835, 4624, 362505, 1022125, 10106041, 12258026, 8361926, 357429349,
+            4920, 99825, 341917081, 183678, 94095, 21576, 31973979, 188600137, 608350, 4745015, 291472939, 76875,
+            8490435, 13554905, 2576273, 16517506, 25931191, 609212, 25500770, 66550, 295482, 246987403, 144992605, 2251925,
+            394345741, 368125, 7361035, 1536507, 3470654, 58241405, 26110382, 3084875, 19642485, 13806463, 373490, 336690491,
+            34545346, 16335, 451996, 67571102, 473969717, 11022670, 204872707, 20324447, 30716257, 10395, 15092209, 21609,
+            9133267, 85727335, 4784, 134740555, 15088, 110245187, 31783999, 7836235, 1430247, 10273083, 273125, 42600623,
+            497218543, 4755855, 882453, 122828293, 95895679, 491139, 20112051, 41583245, 8104733, 80791535, 8322743, 5779325,
+            94800043, 38367, 284161283, 5035825, 379335, 9110959, 127875, 125271155, 161704, 1156375, 38363413, 220988729,
+            3191139, 410562397, 44182609, 14779219, 150236013, 835391441, 103078855, 159828715, 289812805, 457562, 21904, 698005,
+            16674229, 1424770, 10472, 4795483, 136646809, 14393561, 177464987, 708179593, 60885, 1441473, 9887999, 26037334,
+            416588509, 8121537, 369761165, 77532631, 380454683, 180679251, 83125, 731601, 5197954, 81272291, 36216895, 28933126,
+            42801785, 245245, 1609179, 122264, 938029217, 18949441, 4914, 293820883, 43928, 94325, 99944, 12945755,
+            16065, 1268228, 1111682, 1223481, 13929575, 406979243, 6215313, 2170115527, 558279, 94743, 133496, 1273767,
+            893730, 16120, 587508311, 16072, 64362571, 4024185, 21896, 59873807, 631028, 3694084, 38559009, 38440,
+            110994339, 162450323, 3398043, 100306297, 7853258, 77571, 809875, 781926, 186990463, 468875, 24047554, 1359191041,
+            2548375, 390609, 375826213, 30917509, 232057007, 224979997, 234117, 166597717, 256021343, 21735, 547085, 2682537,
+            10360, 111307415, 48112465, 14080573, 196728223, 988869, 222952, 938875, 94250, 243885463, 774129799, 173030,
+            94424, 56486309, 88803, 778960271, 265155431, 178227, 211761, 1508708, 38502, 32967, 21736, 979780979,
+            334084, 9149906, 11481681, 5075103, 33250, 4633473, 1749045, 8132943, 127832, 16146, 113968289, 55016,
+            38456, 731670, 480130, 2476019, 7495579, 52025515, 289399279, 125092409, 1860859, 5466417, 1106920009, 10609215,
+            12459491, 8473829, 55250, 16461951, 22040, 206312, 21750, 4725, 2280125, 51919325, 76996073, 21520939,
+            1743469, 43047995, 351575, 4760, 99590845, 66555, 121828171, 18413057, 257469199, 11967613, 1083875, 2235415,
+            524875, 3062618, 960982, 290494955, 3817401, 10773, 200583, 53551617, 1767333823, 16184, 156916307, 25769263,
+            1961674, 11078815, 19228959, 1967105, 146032599, 202972345, 34864297, 329375, 17289307, 37402127, 2078923, 32984,
+            217858553, 245650, 5022, 105625, 87734495, 27405, 46949855, 55352, 21744547, 111592, 108249799, 307007833,
+            15768841, 9731211, 65777133, 70506183, 58554683, 66424, 149889727, 178250, 1452281459, 16501667, 183222853, 3739294,
+            2045407, 11070, 1251625, 4784507, 3755906, 284456, 122451, 15972, 536238, 602165483, 74989447, 10844079,
+            2129225, 1027223471, 71955, 139258, 18083121, 228616, 845246611, 68996481, 2376465001, 5723641, 361096711, 485875,
+            38363897, 57811271, 28480661, 22706159, 32829682, 645583007, 169717483, 116875, 144855, 18815433, 5237258, 174664633,
+            1475243, 273429, 53590874, 404083823, 19050187, 5096, 207824527, 765325, 1788358, 16280, 169890265, 3297625,
+            16250, 16316729, 4872, 309081797, 15467045, 11727331, 1393100173, 14108963, 119530489, 30476193, 11716570, 5104,
+            450659741, 111321, 245931571, 53713829, 823674871, 135266339, 66584, 71076371, 441099, 39336365, 3174665, 3051671,
+            10672, 8999541, 368475, 4197615, 3644278, 55432, 12929215, 409735345, 81177499, 32919055, 76157705, 5130,
+            1072786, 156065, 437992955, 23047115, 3616327, 1408198, 173887683, 356032241, 418803, 75162693, 966625, 217503,
+            32024671, 61847313, 21978, 2229955, 23164795, 172856, 61047, 41572399, 3504215, 49875, 36798535, 78360191,
+            36301031, 7836699, 145002, 530621, 11536838, 2682790, 24019801, 251125, 1883413, 27608, 6634649, 46022043,
+            3666905, 3280915, 706558697, 2414511, 133673267, 65637, 67828651, 905177, 1592825, 1855414, 1743625, 43959331,
+            57146167, 75950942, 26032253, 118993931, 109898999, 18608711, 177107495, 5975305, 255328441, 7266327, 1693375, 27971933,
+            444879749, 130101731, 22024249, 279125, 1016991, 1659878, 254249569, 64441135, 279052297, 80568287, 27854585, 52338794,
+            86924107, 188986343, 755286883, 164826349, 1279733, 542283, 435625, 77841, 278873551, 20363993, 25998674, 38745,
+            16443, 50024, 4231249, 155992, 961379029, 38750, 620125, 5315725, 55539, 1073116, 871906, 228451763,
+            28804919, 115925122, 681625, 849178, 1904799, 10824, 68801369, 2923235, 1039437781, 4678465, 17121805, 38900455,
+            29185045, 5421962, 125115019, 50108462, 141823543, 1032662711, 3001405, 5762949, 6992741, 321899815, 2179765, 702964147,
+            52640697, 20341673, 32975103, 105875, 138637261, 340659, 866125, 4426955, 52171147, 938791, 215969333, 60360487,
+            6523231, 27621, 1609674, 100161331, 121783407, 105944, 129201373, 10488, 5265, 189321805, 223293, 391540201,
+            854862, 2404722611, 33176, 23147607, 547515, 27528, 33959029, 71825605, 41231542, 5320, 367273951, 136160897,
+            13348621, 1341249, 2068390, 10508907, 12543622, 17815018, 1788549, 1475375, 213431503, 143607101, 1112125, 81188938,
+            278135623, 29911714, 25232977, 16462225, 586625, 69461093, 1687903, 24109385, 174698407, 1660594, 58376087, 249263413,
+            94905, 351944, 27675, 7344935, 89971021, 94792, 45591773, 84084481, 12929294, 47526011, 17988381, 39068237,
+            72250, 16728, 415554659, 1989845, 25630418, 1240578, 21571555, 1402874, 41007995, 243488971, 2135125, 13672879,
+            237714529, 132063503, 1995388, 1648801, 173043, 305526793, 2565266, 17725645, 569908, 2073698, 12415151, 10962,
+            133947, 78829993, 18072249, 7775451, 827052, 29777693, 257816119, 27750, 147821729, 52842031, 32108713, 161875,
+            480519, 62149399, 1481125, 120452834, 645169481, 196650391, 815654, 670565, 1581710, 268250, 160991789, 189875,
+            13997137, 384988811, 9877335, 35093798, 7920717, 1609699, 2113514, 4561235, 14511455, 52311039, 357561, 659246,
+            301747987, 72488, 454947521, 4633910, 206739, 16495895, 32142319, 2269355, 18189665, 94705589, 2845115, 9899695,
+            193139889, 33345, 61987321, 71944, 9765547, 109189553, 955695, 219099859, 2224625, 169242671, 41214758, 206625,
+            1872507, 12661175, 1307859, 320977627, 397918387, 29291425, 9514594, 920577797, 2358811, 16605, 301796, 348340681,
+            13958065, 76655527, 995193, 66885, 42903091, 166972, 99026615, 94875, 22611369, 1850125, 1050625, 290521,
+            11152, 59415969, 5168, 28279657, 532972817, 4544525, 8530379, 10940105, 5114473, 97936741, 670625, 357492,
+            1078735, 3236422, 113331257, 7225933, 402339, 50164541, 34942947, 123969287, 2342002, 159303685, 40214317, 199428853,
+            754490, 6646371, 240250, 33998266, 6584890, 10967541, 84995665, 4684295, 5925309, 7596705, 268226, 3107923,
+            122877, 452694, 4729043, 128282, 206346, 83922549, 97355066, 340676, 12471175, 67191695, 458966833, 402375,
+            8882405, 106019563, 10883587, 2487678, 17574855, 1145853, 637130, 21762, 102263635, 34323107, 3258875, 44631,
+            12337039, 206421839, 13482989, 827356, 61378109, 11051293, 477553609, 11248, 16954566, 208842319, 279128, 102274549,
+            743125, 94068373, 1414189, 35831815, 89375, 6344575, 86946785, 39912521, 464079, 50997399, 5304875, 765919,
+            1263275, 132466162, 3152695, 4885724, 18279235, 61336, 92995257, 2465125, 13712209, 12599795, 821678, 40315017,
+            348167417, 2856326, 25590929, 5528354, 3806745, 6713539, 21499089, 32856, 5250, 991431169, 20464894, 2588066,
+            61516, 933470, 5304, 1419813, 3214211, 11643819, 44590, 39761623, 6752685, 279202, 626145, 634034537,
+            272937299, 2526625, 202989647, 104259023, 265189517, 29006483, 197293435, 14070001, 2537830, 29207785, 1335985, 2711125,
+            1296625, 563567017, 105500057, 139755, 243601007, 111848, 1411648457, 540547403, 2208598, 257125, 26876678, 48560291,
+            1408701, 1056286, 233650813, 430125, 8681271, 44625, 251896, 9380021, 195657, 11683114
+        ],
+        [
+            1633, 197, 166, 2423, 59, 2194, 2416, 255, 1921, 224, 2416, 1765,
+            259, 2020, 2044, 2185, 2190, 249, 1763, 252, 2172, 293, 1945, 187,
+            1677, 2164, 276, 2271, 1923, 2179, 1631, 1707, 12, 217, 209, 101,
+            141, 2229, 2074, 314, 2145, 1691, 2348, 240, 2220, 214, 35, 2424,
+            120, 2111, 2173, 273, 2008, 2058, 1651, 1690, 1714, 2249, 2155, 199,
+            2215, 107, 1783, 2008, 1919, 285, 102, 179, 1904, 135, 1701, 212,
+            2360, 276, 1802, 209, 1749, 79, 194, 237, 251, 193, 1751, 14,
+            316, 187, 2443, 1896, 276, 189, 2017, 19, 1790, 1702, 2138, 233,
+            83, 181, 2047, 169, 119, 2347, 2008, 299, 2442, 2140, 2281, 2038,
+            1825, 22, 2317, 2383, 115, 2337, 305, 1875, 276, 287, 185, 1722,
+            73, 2086, 278, 63, 2231, 1881, 320, 315, 2447, 276, 308, 1980,
+            2062, 1621, 144, 75, 1922, 216, 303, 1708, 191, 319, 49, 1825,
+            1773, 225, 2154, 236, 145, 2073, 72, 187, 1641, 321, 2063, 1962,
+            11, 221, 206, 2008, 261, 1890, 2342, 1742, 2458, 246, 2102, 279,
+            2008, 77, 134, 1838, 2152, 291, 160, 1781, 206, 176, 2416, 318,
+            148, 1885, 232, 298, 242, 202, 1921, 319, 2369, 277, 2308, 1632,
+            2265, 200, 16, 247, 1776, 2295, 187, 1746, 1941, 311, 1682, 317,
+            1721, 144, 1776, 2007, 1678, 282, 206, 242, 105, 2225, 1694, 2427,
+            2201, 29, 2244, 276, 1649, 1670, 2141, 97, 2295, 276, 2284, 269,
+            85, 276, 2159, 304, 2292, 2313, 290, 227, 2316, 1874, 277, 322,
+            1676, 2112, 2245, 2057, 52, 309, 212, 284, 192, 165, 150, 1832,
+            160, 217, 1953, 2341, 84, 2302, 1755, 167, 2006, 1698, 315, 174,
+            239, 2453, 2064, 302, 298, 2235, 2300, 1987, 198, 281, 2234, 274,
+            24, 2363, 184, 1619, 1840, 1697, 224, 2410, 119, 276, 279, 2222,
+            2006, 2327, 86, 34, 289, 1683, 296, 192, 1920, 1825, 2073, 86,
+            1875, 254, 32, 2087, 96, 167, 1750, 89, 2416, 260, 1895, 220,
+            124, 1965, 1644, 2383, 2405, 1757, 301, 1921, 1952, 1615, 206, 133,
+            1920, 2141, 1625, 2310, 1764, 2184, 1919, 300, 1941, 183, 266, 2149,
+            2405, 2448, 281, 184, 48, 2424, 90, 203, 322, 2283, 1913, 1754,
+            2160, 286, 1613, 164, 221, 2097, 132, 1748, 211, 83, 208, 1973,
+            55, 269, 1987, 154, 186, 283, 157, 254, 2383, 18, 2415, 211,
+            305, 2303, 63, 113, 229, 213, 2086, 282, 2418, 119, 317, 204,
+            205, 185, 41, 2416, 286, 95, 1706, 178, 178, 2407, 1734, 276,
+            241, 1860, 17, 1838, 2305, 2204, 270, 1798, 187, 23, 2097, 1987,
+            58, 2040, 189, 2009, 35, 2242, 1644, 2302, 285, 2156, 2413, 1756,
+            1614, 1743, 244, 73, 2295, 13, 308, 2168, 12, 2273, 1875, 188,
+            2347, 284, 1853, 173, 190, 182, 1633, 2126, 1687, 1899, 143, 300,
+            1743, 2046, 303, 260, 189, 158, 223, 1820, 266, 2072, 1905, 1877,
+            1747, 13, 235, 1612, 225, 220, 239, 2008, 250, 1810, 111, 2351,
+            165, 257, 272, 1912, 2012, 156, 318, 243, 253, 26, 322, 1896,
+            2349, 164, 187, 293, 2449, 173, 246, 1972, 207, 1920, 265, 2339,
+            1970, 131, 175, 1971, 2338, 2085, 85, 234, 2419, 191, 2253, 1885,
+            50, 74, 257, 38, 1765, 287, 1824, 2018, 124, 1622, 1970, 2360,
+            2404, 307, 170, 2031, 1942, 306, 230, 199, 272, 257, 220, 222,
+            157, 131, 291, 121, 233, 2141, 1714, 285, 2249, 1691, 188, 2360,
+            1687, 274, 1666, 1745, 2283, 197, 288, 1912, 2393, 114, 1868, 1634,
+            2052, 194, 1844, 104, 282, 2447, 2358, 252, 1877, 310, 164, 307,
+            2025, 258, 14, 44, 1847, 1961, 2036, 196, 2424, 1715, 2465, 300,
+            1788, 289, 292, 1814, 319, 83, 2189, 2276, 2339, 2377, 2097, 2327,
+            2100, 304, 205, 247, 230, 146, 72, 1644, 1685, 2376, 1897, 185,
+            84, 2403, 134, 1687, 2348, 1719, 189, 2366, 2217, 2072, 244, 87,
+            1767, 1746, 293, 295, 172, 26, 2420, 131, 2370, 223, 229, 2213,
+            47, 281, 295, 2369, 187, 2210, 2225, 2272, 162, 206, 136, 286,
+            1681, 202, 2338, 12, 258, 144, 92, 28, 235, 1764, 151, 1656,
+            16, 1919, 91, 1758, 1951, 288, 2381, 2073, 1909, 78, 1846, 307,
+            254, 296, 245, 2022, 1640, 1632, 1776, 303, 2308, 1635, 49, 2039,
+            47, 2251, 291, 2440, 35, 2302, 1823, 1716, 1758, 2151, 47, 252,
+            283, 111, 1831, 2264, 186, 1745, 1955, 1808, 266, 2103, 64, 1920,
+            2105, 207, 1895, 71, 187, 1766, 287, 1733, 2338, 1854, 1808, 2404,
+            1878, 114, 1744, 133, 241, 40, 1780, 204, 2295, 2090, 310, 1772,
+            302, 1989, 2273, 73, 1626, 1906, 42, 2094, 184, 261, 321, 243,
+            2274, 1648, 63, 91, 96, 125, 1917, 2291, 1746, 2161, 2215, 261,
+            2238, 217, 1979, 1780, 252, 2151, 1942, 1931, 194, 197, 213, 2074,
+            313, 313, 305, 1887, 2080, 2281, 67, 170, 121, 2246, 316, 48,
+            256, 80, 2030, 1648, 218, 35, 1944, 1628, 1753, 1940, 2176, 15,
+            1611, 228, 112, 1860, 248, 2084, 219, 61, 238, 318, 1905, 1839,
+            44, 2379, 2432, 210, 2382, 2409, 146, 2177, 132, 2440, 2270, 2350,
+            2336, 110, 1972, 1874, 226, 188, 273, 2097, 145, 1919, 2180, 1822,
+            2023, 216, 135, 2017, 2028, 2156, 95, 195, 1943, 2018, 174, 157,
+            198, 226, 1968, 284, 1829, 202, 126, 171, 15, 2441, 1624, 1897,
+            1946, 1788, 83, 2170, 294, 2007, 286, 135, 1743, 2432, 1951, 37,
+            225, 220, 225, 2275, 56, 134, 2032, 2339, 206, 2285, 163, 185,
+            163, 108, 57, 100, 107, 24, 2312, 2436, 2083, 2076, 72, 2176,
+            16, 1841, 320, 1782, 2273, 1761, 1940, 1684, 1650, 143, 2083, 107,
+            2161, 2212, 1986, 292, 283, 2152, 1912, 2414, 285, 1891, 2271, 207,
+            2284, 186, 250, 2298, 282, 1821, 2381, 97, 257, 231, 1677, 1904,
+            2048, 199, 175, 187, 1926, 2150, 66, 2204, 1721, 238, 2255, 212,
+            2272, 1742, 2159, 287, 28, 2044, 2389, 120, 253, 2302, 23, 302,
+            2444, 321, 256, 49, 1711, 322, 2246, 2255, 72, 2277, 2442, 1711,
+            41, 13, 313, 262, 201, 1876, 2330, 2019, 1901, 1961, 177, 1821,
+            2139, 269, 116, 138, 2018, 2301, 219, 169, 2309, 268, 2215, 40,
+            24, 37, 131, 184, 2275, 89, 295, 127, 2011, 231, 170, 1689,
+            1732, 1767, 1943, 2423, 246, 267, 194, 88, 1621, 2140, 241, 1697,
+            1963, 1728, 2404, 1956, 2283, 98, 1962, 1888, 35, 190, 1753, 144,
+            1656, 1611, 83, 1948, 71, 2272, 2347, 189, 1886, 119, 161, 255,
+            172, 218, 1691, 2287, 197, 2229, 214, 304, 95, 197, 2434, 12,
+            228, 2036, 2084, 2020, 2463, 64, 2139, 298, 146, 35, 2402, 322,
+            208, 1985, 207, 159, 149, 1661, 223, 1930, 173, 308, 2103, 1980,
+            2051, 289, 266, 2219, 2351, 226, 1846, 2024, 2367, 2074, 1953, 1813,
+            178, 75, 2015, 1842, 301, 225, 162, 1701, 286, 2017, 1819, 220,
+            2368, 1824, 2309, 272, 1898, 222, 2112, 225, 2234, 1635, 248, 2187,
+            311, 28, 2293, 2055, 1926, 1895, 2285, 218, 1642, 163, 270, 2216,
+            2294, 2387, 281, 53, 14, 1878, 2349, 287, 1774, 247, 50, 296,
+            1624, 1893, 306, 191, 2338, 2337, 2407, 309, 2207, 2226, 2349, 1889,
+            1616, 111, 149, 187, 25, 288, 1758, 1879, 223, 1880, 216, 221,
+            2432, 24, 320, 300, 74, 2075, 1678, 2414, 304, 159, 211, 1823,
+            280, 2384, 1861, 2348, 15, 310, 303, 1820, 2339, 99, 2142, 1793,
+            1625, 2021, 234, 2215, 204, 123, 2013, 206, 1629, 2366, 36, 314,
+            249, 1888, 2149, 227, 253, 1912, 2021, 182, 211, 261, 1753, 301,
+            2453, 297, 157, 190, 2425, 179, 1908, 2413, 71, 2159, 2189, 2416,
+            1745, 237, 2336, 1640, 77, 2342, 2376, 2048, 1982, 283, 186, 1906,
+            2440, 2161, 2309, 2374, 1637, 1819, 2270, 2358, 2007, 240, 1683, 1919,
+            202, 86, 1951, 2150, 206, 2010, 221, 1795, 295, 1663, 2434, 148,
+            2111, 2293, 37, 1611, 2402, 2144, 12, 1744, 317, 219, 2125, 212,
+            181, 278, 2271, 96, 266, 122, 1843, 181, 2044, 155, 2023, 2359,
+            2118, 305, 102, 11, 2216, 1913, 1965, 196, 25, 1973, 1974, 320,
+            98, 152, 78, 2277, 85, 76, 143, 241, 136, 100, 167, 267,
+            1816, 192, 2040, 180, 1970, 12, 321, 258, 2362, 149, 2206, 2415,
+            2375, 292, 182, 1799, 132, 87, 2324, 61, 1699, 1688, 1621, 1887,
+            158, 1615, 1905, 107, 53, 299, 316, 2424, 73, 232, 279, 293,
+            171, 163, 183, 176, 44, 310, 307, 1913, 1632, 110, 1643, 191,
+            45, 245, 2278, 1688, 2363, 173, 1991, 1943, 301, 2110, 2284, 272,
+            286, 1811, 2186, 11, 1699, 155, 1742, 2406, 2028, 247, 224, 207,
+            159, 1838, 2226, 1875, 1813, 1702, 296, 2424, 2085, 2093, 252, 297,
+            156, 114, 2292, 2011, 294, 312, 23, 2096, 239, 292, 232, 195,
+            268, 2374, 254, 174, 2204, 121, 2226, 2343, 1688, 1874, 36, 2304,
+            31, 2162, 2086, 240, 297, 237, 1986, 190, 74, 289, 172, 1610,
+            196, 222, 281, 2236, 1766, 2354, 2018, 2150, 1757, 265, 2433, 83,
+            296, 1808, 1877, 184, 1688, 2336, 1700, 145, 216, 2199, 243, 2258,
+            1610, 1769, 198, 108, 48, 1880, 227, 1925, 2291, 278, 233, 197,
+            181, 2425, 2347, 36, 64, 2051, 2150, 160, 1610, 2059, 2176, 2159,
+            263, 2352, 319, 212, 223, 2139, 2115, 1775, 1677, 2441, 225, 175,
+            56, 2216, 2110, 98, 1610, 49, 43, 1963, 2017, 133, 263, 1610,
+            311, 97, 1961, 2132, 36, 2301, 2110, 2006, 213, 168, 48, 299,
+            240, 298, 2367, 2283, 2286, 228, 1993, 1636, 1886, 310, 1941, 2078,
+            36, 1869, 231, 143, 1830, 161, 275, 238, 1907, 2351, 71, 262,
+            1826, 1621, 2159, 2091, 2322, 52, 187, 2206, 1963, 243, 97, 256,
+            283, 70, 1847, 186, 267, 27, 2337, 2151, 287, 2142, 76, 162,
+            255, 2227, 2236, 305, 1661, 2408, 2021, 1862, 153, 2424, 72, 143,
+            303, 188, 292, 132, 2348, 1811, 315, 2072, 2102, 319, 178, 1768,
+            255, 2218, 1793, 2381, 87, 234, 237, 1955, 1897, 47, 221, 122,
+            2426, 183, 85, 2177, 1764, 2436, 175, 2384, 1616, 242, 1819, 135,
+            116, 1811, 2066, 319, 96, 2010, 2104, 288, 218, 2027, 282, 156,
+            67, 284, 60, 37, 2087, 273, 300, 2447, 273, 109, 197, 2139,
+            273, 2296, 2426, 263, 279, 55, 2192, 1982, 1834, 155, 2274, 2094,
+            2303, 1992, 2336, 208, 2286, 2049, 1725, 259, 1833, 63, 2020, 2442,
+            1879, 40, 173, 25, 1978, 2362, 87, 263, 62, 101, 2166, 2460,
+            201, 269, 1767, 25, 2112, 2177, 1624, 289, 1937, 279, 2171, 249,
+            128, 302, 95, 2359, 235, 2426, 1756, 182, 262, 241, 2028, 103,
+            2281, 2019, 2185, 309, 2216, 2287, 1848, 1717, 1742, 2209, 11, 2402,
+            203, 280, 2153, 2069, 50, 1962, 1680, 1980, 182, 1876, 202, 1847,
+            2009, 237, 212, 1616, 1967, 220, 2010, 2250, 1888, 2413, 2402, 1758,
+            137, 2456, 2138, 2073, 173, 2077, 100, 2160, 1890, 185, 1614, 1774,
+            1966, 287, 2093, 1953, 2011, 27, 2218, 315, 1770, 2075, 1678, 124,
+            2291, 2447, 150, 65, 1974, 147, 214, 215, 1983, 96, 1635, 290,
+            1926, 1736, 249, 1642, 137, 283, 2302, 2124, 1641, 1667, 2310, 285,
+            2286, 2085, 2128, 2425, 1991, 2178, 2294, 1842, 2149, 1638, 2414, 2075,
+            231, 2257, 2311, 1773, 1914, 167, 1947, 2308, 2169, 306, 50, 317,
+            322, 2417, 2041, 62, 233, 279, 302, 313, 220, 125, 1722, 314,
+            1687, 299, 2271, 199, 2140, 264, 2281, 1815, 191, 2367, 247, 1916,
+            2404, 2388, 2291, 192, 256, 289, 1817, 315, 2260, 172, 1838, 196,
+            177, 1978, 147, 2225, 1879, 321, 168, 1632, 278, 311, 178, 25,
+            224, 1821, 132, 1810, 16, 1905, 1961, 2424, 255, 71, 2007, 1878,
+            196, 2104, 238, 145, 144, 1715, 312, 1727, 301, 207, 1808, 147,
+            108, 1764, 159, 1892, 1627, 309, 43, 204, 2029, 2028, 316, 48,
+            2029, 85, 2413, 73, 271, 234, 261, 2029, 308, 2433, 213, 2323,
+            2382, 216, 293, 2027, 2207, 2062, 2155, 2185, 1612, 320, 227, 2340,
+            2194, 2014, 320, 218, 78, 263, 199, 115, 2387, 1859, 1813, 175,
+            1912, 196, 228, 85, 294, 1809, 271, 2194, 1874, 1763, 1799, 2037,
+            1631, 301, 2164, 2399, 2164, 234, 54, 1954, 219, 2095, 1943, 251,
+            1774, 2155, 2293, 206, 2342, 312, 1897, 107, 271, 153, 244, 2343,
+            314, 42, 2454, 1874, 1642, 2427, 174, 1809, 112, 2083, 2408, 2317,
+            1915, 2189, 177, 140, 2462, 251, 221, 274, 252, 2027, 2074, 236,
+            207, 79, 2106, 1955, 1763, 197, 271, 2211, 1763, 173, 1682, 2207,
+            2183, 211, 2030, 1754, 2322, 50, 268, 151, 275, 2171, 1631, 1631,
+            211, 1934, 1702, 1690, 1744, 109, 121, 305, 103, 1787, 156, 2096,
+            60, 66, 2057, 1985, 108, 1953, 1881, 2350, 2169, 2111, 172, 211,
+            114, 143, 249, 2176, 155, 2140, 2288, 131, 2284, 1986, 248, 271,
+            289, 77, 235, 2321, 2119, 277, 122, 138, 2045, 205, 200, 136,
+            2104, 2211, 2337, 291, 2149, 1689, 1763, 156, 2340, 1621, 2162, 255,
+            220, 205, 161, 1682, 1631, 180, 2144, 1830, 274, 2291, 2348, 314,
+            2436, 280, 136, 310, 75, 1657, 95, 253, 1829, 218, 2044, 1886,
+            235, 2413, 285, 69, 2096, 1964, 96, 298, 2169, 249, 2256, 168,
+            1881, 1887, 2153, 1722, 313, 2076, 1954, 2406, 2027, 1680, 119, 1974,
+            2062, 179, 2159, 1690, 183, 136, 1808, 148, 1849, 2348, 2084, 2367,
+            179, 2228, 176, 2007, 242, 186, 217, 214, 319, 2296, 37, 62,
+            97, 1853, 65, 2410, 2326, 2072, 2160, 1678, 2089, 2142, 1979, 66,
+            1822, 2006, 170, 239, 289, 2085, 275, 215, 168, 23, 2095, 2151,
+            272, 2392, 219, 2009, 223, 100, 1854, 1978, 2059, 2292, 2326, 2283,
+            1832, 79, 281, 1860, 1727, 52, 1710, 62, 2300, 109, 169, 2162,
+            2359, 224, 26, 2208, 2382, 2178, 2108, 259, 2217, 1679, 1679, 201,
+            1813, 71, 264, 1855, 1700, 1991, 1996, 2113, 2204, 2006, 293, 2038,
+            2111, 1641, 1848, 1875, 315, 202, 1655, 2304, 23, 2083, 256, 251,
+            2079, 1764, 2227, 2405, 1632, 209, 60, 2030, 1829, 2423, 196, 2149,
+            2032, 2095, 92, 204, 1627, 189, 132, 172, 1773, 123, 234, 2150,
+            149, 48, 2237, 168, 2018, 1912, 217, 244, 1882, 2114, 150, 1964,
+            322, 1996, 14, 2129, 2357, 317, 1781, 2204, 193, 87, 1887, 2415,
+            239, 2437, 23, 41, 173, 1651, 1814, 218, 1810, 2308, 206, 1681,
+            1868, 271, 182, 95, 47, 267, 283, 43, 64, 186, 322, 2138,
+            175, 2300, 102, 2408, 245, 62, 2139, 2218, 27, 2451, 288, 2057,
+            2392, 1774, 158, 295, 2227, 265, 13, 214, 1743, 275, 2447, 2090,
+            2031, 168, 240, 1642, 240, 2117, 2204, 293, 2352, 1743, 2210, 2072,
+            13, 160, 1767, 23, 2174, 1957, 192, 221, 1808, 2052, 55, 1635,
+            2206, 297, 167, 1695, 2361, 2022, 2142, 207, 299, 252, 1888, 297,
+            102, 155, 143, 1880, 290, 1783, 2208, 192, 300, 2118, 170, 2036,
+            11, 194, 110, 215, 1971, 2351, 1935, 2347, 230, 268, 126, 2087,
+            105, 2418, 47, 1830, 295, 2330, 1831, 1942, 1732, 257, 2256, 135,
+            180, 1689, 2150, 74, 2138, 2140, 246, 15, 2232, 158, 289, 1745,
+            131, 206, 1940, 37, 1649, 251, 1708, 123, 270, 199, 297, 1970,
+            84, 178, 1927, 1698, 2235, 1915, 273, 269, 1722, 236, 247, 1789,
+            1899, 162, 238, 2051, 1964, 2423, 133, 2098, 244, 88, 2349, 273,
+            277, 2281, 74, 216, 1961, 49, 216, 2184, 168, 1883, 158, 2358,
+            1972, 2102, 1677, 2103, 2428, 2276, 285, 2357, 128, 1628, 1820, 1953,
+            2146, 200, 2195, 176, 275, 74, 150, 71, 2366, 2217, 218, 1992,
+            2017, 314, 2094, 2275, 1724, 1904, 226, 101, 210, 2036, 108, 212,
+            2374, 311, 307, 1621, 85, 1874, 308, 194, 2225, 269, 1952, 2052,
+            26, 2028, 2377, 310, 2162, 1736, 1646, 2073, 2247, 230, 2209, 2375,
+            242, 232, 1931, 95, 75, 2168, 24, 156, 262, 242, 109, 198,
+            2428, 133, 229, 2215, 1895, 2433, 231, 1899, 1772, 198, 2242, 1778,
+            1680, 1824, 1963, 258, 174, 1809, 297, 2357, 1997, 2315, 1826, 1830,
+            195, 2138, 304, 1850, 1706, 217, 61, 174, 2217, 60, 205, 2095,
+            2274, 2301, 2160, 1625, 2403, 2270, 1622, 294, 2229, 1944, 171, 1691,
+            1952, 1953, 48, 170, 2150, 1904, 321, 2272, 194, 106, 1611, 168,
+            2249, 255, 1891, 2315, 100, 1947, 1941, 299, 1614, 1959, 2458, 280,
+            83, 2142, 2372, 2237, 295, 2237, 31, 1878, 1640, 2285, 1715, 120,
+            1962, 219, 1753, 2417, 1712, 38, 88, 267, 302, 282, 278, 185,
+            181, 2053, 1851, 244, 223, 184, 2428, 1895, 121, 1634, 1692, 309,
+            257, 2020, 1898, 210, 289, 1757, 168, 306, 2250, 116, 251, 2123,
+            2034, 1756, 90, 146, 2095, 259, 1714, 321, 2348, 168, 218, 176,
+            1900, 1754, 2054, 203, 284, 63, 219, 200, 2120, 1823, 2143, 322,
+            179, 1700, 305, 2387, 248, 2007, 322, 142, 275, 112, 2455, 2423,
+            213, 118, 237, 12, 270, 282, 308, 75, 35, 89, 2191, 2271,
+            1661, 321, 253, 290, 2086, 260, 162, 1678, 2123, 2013, 1793, 305,
+            140, 2087, 1716, 226, 2273, 280, 124, 236, 183, 41, 2033, 2336,
+            222, 2094, 64, 302, 1766, 229, 2448, 1843, 1833, 287, 1853, 1655,
+            1773, 2207, 1673, 318, 1687, 1717, 1641, 1949, 2366, 1650, 2001, 122,
+            1637, 2284, 228, 134, 2309, 315, 1787, 2123, 72, 312, 83, 2449,
+            96, 1634, 1901, 2252, 2139, 308, 1718, 2168, 2161, 1697, 189, 2308,
+            1667, 1834, 1612, 1617, 127, 195, 2102, 188, 285, 2177, 84, 251,
+            36, 1704, 178, 159, 2459, 1810, 1759, 2133, 169, 1782, 2218, 301,
+            193, 203, 1889, 27, 191, 1841, 1976, 171, 209, 1699, 246, 2351,
+            2084, 2294, 2417, 1846, 2076, 62, 84, 227, 1814, 2445, 1839, 233,
+            202, 316, 1985, 303, 2078, 157, 274, 2110, 1811, 2283, 2014, 259,
+            2226, 157, 1819, 263, 215, 197, 309, 1838, 2331, 1821, 2357, 167,
+            66, 2378, 86, 59, 1964, 2432, 50, 192, 196, 2047, 1610, 152,
+            59, 317, 77, 304, 59, 1944, 132, 1925, 173, 112, 2429, 59,
+            185, 2286, 204, 2209, 2047, 253, 2066, 103, 179, 233, 125, 1723,
+            275, 254, 270, 33, 2031, 245, 2104, 208, 306, 292, 247, 186,
+            2293, 133, 26, 54, 60, 11, 1742, 2236, 1754, 1914, 252, 98,
+            1832, 2072, 175, 1853, 252, 1905, 109, 159, 2336, 2045, 2272, 59,
+            1783, 1769, 1830, 2216, 2279, 2046, 319, 2354, 2235, 2404, 1727, 1698,
+            53, 2124, 305, 1951, 59, 298, 2119, 1626, 25, 20, 59, 283,
+            218, 120, 2388, 1621, 210, 1815, 60, 2128, 42, 2270, 2433, 1648,
+            2206, 2210, 229, 1895, 314, 111, 1681, 2132, 37, 231, 234, 184,
+            1859, 265, 274, 86, 1835, 76, 68, 183, 2149, 281, 201, 87,
+            264, 111, 2037, 143, 304, 214, 264, 2337, 322, 2010, 199, 1847,
+            2425, 139, 21, 1993, 92, 1633, 139, 213, 238, 2362, 1612, 2044,
+            243, 85, 1908, 2301, 2409, 71, 221, 195, 272, 1680, 2231, 2140,
+            1820, 1694, 1943, 59, 15, 201, 236, 155, 145, 317, 2022, 1688,
+            177, 107, 1622, 12, 179, 161, 243, 2074, 2147, 1879, 249, 172,
+            156, 2183, 2171, 2415, 190, 1966, 1612, 290, 1615, 170, 100, 1750,
+            59, 2060, 190, 194, 172, 303, 255, 1822, 2169, 2434, 35, 2443,
+            269, 213, 2036, 296, 29, 108, 2397, 1678, 239, 2339, 269, 40,
+            2322, 226, 207, 198, 111, 2366, 2028, 1819, 2260, 2093, 1765, 1819,
+            1754, 250, 2310, 265, 2220, 2144, 2017, 65, 193, 2358, 2219, 169,
+            312, 28, 49, 38, 1689, 2297, 256, 2242, 1874, 260, 259, 2375,
+            2019, 2227, 299, 222, 174, 73, 2308, 174, 212, 198, 235, 270,
+            2349, 144, 2336, 307, 1768, 1849, 1876, 1772, 71, 188, 1875, 2106,
+            284, 2300, 2340, 2377, 224, 1829, 59, 303, 99, 2374, 1676, 23,
+            233, 1653, 2204, 148, 2013, 59, 309, 2009, 33, 2009, 2406, 1856,
+            2319, 1626, 183, 310, 294, 287, 2018, 2315, 19, 2405, 1967, 2083,
+            216, 1749, 2352, 1916, 2077, 13, 244, 1954, 318, 1836, 2402, 1897,
+            2283, 1657, 2039, 237, 2369, 217, 1856, 2075, 160, 311, 155, 140,
+            1636, 277, 180, 2094, 2406, 2281, 250, 2021, 1773, 2462, 1710, 11,
+            242, 2084, 157, 23, 2341, 99, 211, 2204, 319, 200, 2220, 1885,
+            294, 222, 235, 20, 1693, 1954, 29, 1785, 1742, 2084, 2316, 200,
+            239, 2294, 258, 258, 69, 2113, 1802, 246, 2032, 2458, 2093, 2098,
+            117, 2403, 2089, 2245, 1789, 158, 2173, 233, 121, 101, 134, 1613,
+            76, 1827, 54, 1978, 2287, 2178, 1755, 158, 119, 177, 23, 1743,
+            2196, 1709, 1855, 2154, 2152, 2418, 113, 1831, 219, 1679, 280, 117,
+            2030, 1955, 129, 27, 1962, 109, 1829, 280, 203, 2270, 2288, 148,
+            1784, 215, 228, 1679, 316, 2242, 61, 261, 2208, 89, 1840, 205,
+            259, 171, 2169, 2338, 228, 236, 72, 2207, 1971, 1655, 1829, 1890,
+            230, 234, 2415, 1934, 238, 2423, 1709, 1677, 299, 195, 185, 1942,
+            202, 2453, 101, 126, 2037, 1882, 2083, 262, 298, 2093, 1706, 304,
+            2309, 232, 1970, 2208, 192, 1885, 2010, 2326, 1670, 167, 2027, 119,
+            29, 2321, 2114, 314, 2367, 1944, 1748, 260, 1791, 1679, 237, 1961,
+            2079, 131, 294, 2277, 2251, 2083, 160, 320, 1714, 2006, 1941, 318,
+            2051, 284, 2160, 254, 2168, 231, 230, 257, 120, 86, 2073, 1988,
+            18, 275, 49, 2336, 179, 132, 245, 266, 1749, 188, 2141, 169,
+            2006, 73, 1952, 2450, 1622, 97, 313, 2153, 209, 1846, 1745, 266,
+            102, 19, 176, 308, 145, 1775, 1723, 125, 1839, 108, 240, 84,
+            157, 1942, 1833, 1899, 223, 1905, 201, 173, 235, 229, 52, 2006,
+            139, 2234, 42, 298, 2086, 2292, 1710, 2273, 1617, 301, 250, 65,
+            1697, 2027, 2138, 109, 1820, 1643, 131, 99, 199, 197, 2102, 172,
+            190, 196, 175, 256, 1747, 290, 1640, 144, 134, 2311, 2438, 1775,
+            75, 2017, 2274, 242, 320, 17, 2096, 136, 1714, 93, 1698, 1625,
+            297, 230, 41, 2275, 1651, 1809, 1759, 2074, 235, 2230, 2105, 1891,
+            1692, 64, 1962, 203, 1709, 310, 2338, 2007, 84, 1808, 2245, 2435,
+            219, 268, 2237, 1645, 2184, 240, 49, 2223, 1744, 2352, 161, 104,
+            171, 272, 127, 39, 1755, 2216, 1732, 146, 307, 1613, 2168, 1979,
+            313, 1622, 1787, 61, 1693, 296, 2087, 2117, 1854, 76, 113, 1962,
+            2413, 1772, 2045, 265, 180, 231, 2403, 228, 277, 286, 1664, 269,
+            155, 1900, 2367, 96, 1737, 2361, 2294, 82, 83, 2419, 272, 1887,
+            2405, 277, 1819, 53, 1877, 297, 176, 2440, 1822, 1787, 38, 300,
+            1780, 314, 1697, 1648, 200, 2020, 38, 176, 2146, 306, 114, 244,
+            227, 2234, 2336, 2305, 240, 181, 1886, 1874, 2336, 278, 180, 2272,
+            19, 216, 2229, 2271, 200, 123, 321, 2249, 1840, 316, 1691, 2394,
+            248, 2093, 68, 2337, 211, 288, 1979, 189, 1889, 2414, 290, 199,
+            194, 26, 1907, 134, 1824, 2138, 1611, 1655, 1885, 2338, 1716, 89,
+            255, 2151, 266, 1853, 1819, 73, 16, 215, 304, 2072, 1746, 1897,
+            1932, 1724, 1957, 1641, 2063, 76, 2257, 61, 2138, 198, 1690, 2403,
+            1810, 256, 253, 210, 2249, 261, 293, 2273, 2252, 2012, 2444, 2093,
+            2217, 2018, 2301, 209, 174, 241, 193, 2205, 1981, 121, 88, 205,
+            147, 312, 12, 29, 2110, 1888, 2220, 35, 316, 122, 2172, 18,
+            62, 2368, 149, 75, 266, 286, 2338, 1643, 274, 291, 2347, 184,
+            1659, 1848, 1748, 147, 198, 111, 1753, 183, 208, 1890, 267, 24,
+            170, 1678, 147, 266, 2430, 2012, 249, 2141, 1940, 280, 285, 245,
+            2036, 1907, 1895, 281, 1700, 39, 1623, 1698, 2073, 2251, 2316, 287,
+            286, 143, 2103, 2357, 120, 260, 146, 254, 1941, 203, 1742, 2179,
+            1718, 2207, 306, 292, 243, 269, 2441, 304, 2029, 244, 258, 2190,
+            2029, 210, 2315, 123, 72, 2053, 214, 1793, 225, 2017, 177, 2198,
+            214, 15, 1765, 1640, 318, 1809, 1798, 2228, 1887, 271, 2190, 1661,
+            208, 115, 1755, 2179, 171, 2045, 271, 232, 1613, 148, 201, 71,
+            250, 1940, 109, 195, 190, 231, 183, 2271, 280, 120, 14, 1650,
+            1777, 286, 1874, 2270, 270, 11, 2145, 1782, 2105, 2094, 1946, 208,
+            27, 2019, 1876, 1631, 2145, 1763, 271, 2432, 282, 40, 1809, 2072,
+            292, 113, 2184, 29, 144, 2218, 2228, 271, 63, 31, 1690, 2432,
+            2255, 291, 1951, 321, 1809, 1781, 1944, 1631, 302, 1721, 260, 1708,
+            1796, 1747, 192, 74, 107, 175, 167, 2240, 2033, 302, 261, 199,
+            139, 17, 268, 236, 2172, 2297, 1616, 1624, 227, 265, 80, 1830,
+            2081, 269, 26, 2140, 1809, 2163, 89, 205, 1703, 1756, 1706, 1763,
+            2239, 25, 310, 2459, 247, 84, 1649, 2414, 1614, 1652, 262, 256,
+            299, 1906, 215, 229, 318, 2217, 248, 2364, 2337, 119, 210, 267,
+            2176, 2154, 1840, 298, 2368, 221, 36, 123, 250, 2442, 14, 66,
+            1763, 174, 110, 32, 47, 1744, 1706, 1690, 143, 1994, 1908, 217,
+            2433, 1954, 2168, 299, 88, 219, 1948, 209, 2228, 1910, 2161, 290,
+            200, 1631, 134, 181, 245, 48, 229, 75, 2072, 2227, 2370, 1864,
+            1914, 1689, 251, 47, 2347, 254, 1913, 30, 291, 1831, 304, 137,
+            283, 169, 193, 2143, 212, 2139, 316, 308, 2117, 2038, 159, 2417,
+            176, 137, 203, 273, 2080, 2152, 2357, 2118, 1733, 2435, 93, 2291,
+            133, 152, 185, 189, 303, 278, 1940, 1666, 119, 1699, 2222, 1682,
+            1841, 2111, 135, 1898, 167, 135, 1859, 268, 2207, 1715, 90, 2159,
+            2170, 1765, 184, 2317, 273, 2009, 2191, 47, 205, 2238, 210, 318,
+            204, 2165, 223, 238, 1940, 1846, 2285, 147, 1848, 306, 2250, 97,
+            265, 52, 253, 2244, 2077, 2414, 247, 108, 90, 50, 281, 1748,
+            182, 18, 2177, 298, 2020, 2225, 2350, 24, 241, 2144, 65, 61,
+            270, 37, 1621, 147, 2088, 50, 1688, 2046, 237, 222, 279, 191,
+            1622, 1878, 1678, 255, 245, 2303, 149, 1676, 2360, 1886, 2225, 179,
+            2403, 104, 130, 141, 1698, 275, 246, 2073, 111, 254, 134, 226,
+            1941, 1633, 2183, 2039, 262, 2161, 194, 2235, 1877, 236, 1781, 99,
+            1649, 2226, 2102, 57, 2021, 1925, 1687, 309, 2205, 242, 243, 170,
+            1611, 124, 2149, 1611, 2141, 1714, 1904, 185, 1701, 1684, 2212, 207,
+            101, 300, 233, 2219, 1636, 212, 156, 95, 181, 267, 202, 312,
+            302, 128, 1952, 1753, 2272, 214, 83, 28, 278, 190, 1952, 2396,
+            2180, 2328, 303, 282, 301, 188, 195, 2038, 1981, 39, 1864, 2361,
+            266, 178, 1746, 2226, 16, 1688, 288, 2270, 86, 1623, 262, 1708,
+            123, 1820, 2226, 314, 217, 284, 1668, 265, 2038, 144, 277, 2244,
+            222, 2236, 183, 264, 2413, 1743, 63, 14, 13, 1777, 1979, 274,
+            274, 316, 1699, 192, 2236, 1972, 122, 1744, 1681, 2369, 1728, 1975,
+            2210, 1800, 2099, 1971, 2234, 2300, 280, 1610, 201, 1780, 88, 91,
+            36, 96, 291, 2046, 1656, 190, 1697, 1699, 2235, 241, 305, 2276,
+            308, 1925, 84, 151, 209, 2316, 1942, 261, 1956, 1788, 32, 1947,
+            24, 1687, 1753, 1839, 210, 60, 38, 287, 311, 300, 303, 126,
+            246, 17, 2353, 263, 1747, 2078, 189, 1640, 306, 36, 1610, 1634,
+            1946, 256, 285, 283, 179, 99, 1772, 1610, 36, 275, 1823, 230,
+            1885, 180, 35, 2215, 1810, 2390, 15, 27, 2074, 88, 2454, 1768,
+            2366, 237, 2218, 1766, 2215, 124, 1756, 319, 1854, 2053, 274, 209,
+            2358, 1716, 1951, 1614, 2230, 251, 2110, 1879, 1829, 1697, 2375, 1692,
+            121, 200, 1755, 203, 288, 296, 267, 24, 229, 1745, 2007, 320,
+            2350, 1633, 259, 1613, 2205, 1676, 263, 2432, 2339, 2434, 2083, 2078,
+            2206, 186, 2374, 204, 1610, 2405, 2103, 2341, 60, 268, 309, 2163,
+            2264, 234, 301, 291, 236, 2040, 2250, 311, 260, 1715, 132, 157,
+            2349, 167, 2350, 258, 2275, 55, 2344, 1820, 177, 1811, 1618, 319,
+            2421, 2057, 11, 231, 2154, 39, 2347, 1835, 35, 171, 2143, 1677,
+            1889, 2019, 2003, 2102, 258, 36, 1928, 2135, 2448, 2415, 2225, 178,
+            2149, 2208, 2370, 2024, 267, 1623, 315, 298, 286, 1876, 293, 258,
+            2128, 2262, 199, 2170, 1930, 305, 312, 1975, 175, 2426, 120, 1730,
+            1679, 246, 2310, 1885, 191, 169, 2143, 1846, 1898, 1666, 151, 2359,
+            2085, 246, 31, 2355, 77, 1914, 2121, 28, 220, 2291, 63, 282,
+            107, 1838, 2441, 1798, 311, 1943, 225, 247, 1676, 292, 263, 2270,
+            201, 2205, 2375, 1966, 242, 2076, 229, 2234, 285, 156, 284, 1612,
+            1634, 2140, 1840, 2183, 195, 243, 208, 317, 1754, 60, 1815, 2281,
+            1721, 81, 1956, 171, 2075, 2426, 1888, 294, 2088, 2357, 1757, 238,
+            97, 204, 2408, 124, 54, 310, 291, 2427, 1717, 232, 321, 263,
+            2075, 2104, 248, 2415, 182, 11, 264, 40, 279, 2406, 2312, 1811,
+            2037, 45, 302, 1877, 2388, 108, 1624, 209, 2019, 1671, 1876, 278,
+            2255, 1823, 241, 250, 2337, 1663, 1839, 110, 2244, 95, 2152, 2402,
+            249, 306, 2119, 1649, 176, 86, 1795, 2165, 120, 2219, 30, 2239,
+            193, 255, 1766, 1978, 2340, 1781, 170, 1913, 14, 73, 1615, 1859,
+            112, 38, 2076, 2443, 72, 2429, 2425, 1765, 2183, 155, 1703, 1841,
+            2435, 2052, 2360, 216, 1742, 290, 1971, 155, 1951, 1645, 312, 296,
+            62, 1650, 26, 270, 253, 177, 99, 232, 281, 1613, 247, 204,
+            1782, 1834, 190, 263, 1755, 72, 107, 1816, 297, 279, 240, 225,
+            37, 227, 1621, 2381, 1687, 2321, 2404, 1688, 294, 2225, 2341, 249,
+            1973, 12, 208, 2027, 2077, 212, 115, 2217, 182, 2449, 61, 2171,
+            1875, 1803, 1683, 61, 2353, 2227, 2292, 1689, 1744, 233, 1965, 217,
+            119, 2274, 80, 264, 113, 103, 2392, 2044, 1832, 235, 2076, 2094,
+            180, 215, 205, 299, 297, 52, 2113, 2270, 2271, 277, 251, 2205,
+            2117, 254, 2267, 2300, 245, 2153, 252, 288, 1942, 1760, 2242, 195,
+            244, 1677, 2000, 2276, 224, 157, 2099, 1680, 96, 311, 171, 1706,
+            259, 2403, 1885, 100, 16, 2278, 110, 178, 181, 1746, 108, 78,
+            208, 191, 137, 1889, 241, 262, 67, 2418, 1909, 1739, 265, 235,
+            278, 315, 1676, 2209, 220, 2006, 98, 181, 2117, 144, 84, 2405,
+            217, 198, 47, 145, 146, 1965, 1985, 1902, 1906, 20, 273, 2124,
+            2230, 283, 1662, 240, 282, 161, 2129, 2285, 90, 186, 2019, 227,
+            2411, 272, 18, 2181, 2341, 2423, 1838, 1821, 224, 2160, 1821, 131,
+            1784, 1794, 120, 239, 2084, 250, 1618, 272, 2157, 1811, 47, 260,
+            1820, 133, 222, 213, 1980, 1773, 1886, 2282, 1652, 107, 2125, 184,
+            1692, 307, 250, 1697, 170, 1760, 194, 254, 2073, 2396, 2168, 129,
+            245, 1821, 159, 1641, 155, 1878, 2085, 2039, 2098, 83, 135, 2036,
+            48, 1861, 2189, 39, 1941, 273, 1904, 1833, 2096, 1701, 270, 224,
+            209, 308, 1623, 248, 2186, 98, 2296, 193, 2404, 290, 2138, 1812,
+            189, 1612, 87, 253, 191, 1622, 30, 1753, 169, 2234, 156, 2221,
+            1985, 2041, 2454, 2205, 251, 221, 1754, 1676, 2343, 268, 2176, 1772,
+            49, 213, 1611, 208, 25, 1677, 136, 261, 243, 232, 1727, 1876,
+            185, 2260, 2163, 2423, 192, 2037, 2393, 1875, 317, 284, 313, 85,
+            2389, 214, 2112, 2206, 188, 1808, 2075, 167, 2357, 307, 2402, 110,
+            1805, 2427, 1742, 320, 53, 1865, 2441, 1887, 238, 46, 1831, 313,
+            1808, 1745, 2151, 1757, 1842, 306, 2293, 81, 1812, 295, 52, 11,
+            2282, 2349, 15, 2027, 1615, 215, 2366, 1708, 239, 2378, 2238, 2088,
+            2420, 1648, 1780, 98, 60, 277, 313, 2282, 2303, 229, 1687, 2195,
+            2414, 264, 2376, 203, 1885, 2339, 2358, 226, 2358, 144, 2448, 181,
+            94, 1970, 2010, 2139, 2318, 2086, 1988, 1794, 314, 2376, 1904, 315,
+            2440, 1871, 2000, 259, 275, 1940, 1648, 1780, 258, 264, 179, 56,
+            108, 2103, 2321, 1880, 2433, 2402, 2306, 309, 2282, 188, 1814, 2151,
+            2243, 196, 284, 2455, 172, 2368, 1896, 257, 1707, 2204, 2300, 2058,
+            2315, 2077, 268, 24, 2023, 148, 2374, 1617, 23, 317, 239, 232,
+            1991, 2012, 177, 2215, 180, 1623, 1978, 133, 223, 71, 2235, 2425,
+            1707, 248, 145, 138, 39, 2371, 228, 2417, 265, 2414, 1875, 1698,
+            78, 1849, 49, 1626, 2138, 316, 227, 2292, 191, 2084, 216, 2085,
+            259, 2345, 2293, 2216, 1864, 313, 125, 274, 201, 1743, 230, 1963,
+            224, 193, 2342, 122, 1723, 311, 23, 1810, 13, 2204, 38, 294,
+            210, 239, 85, 211, 1764, 1632, 1886, 137, 2348, 1662, 2011, 1747,
+            2243, 2340, 182, 17, 98, 320, 1895, 272, 2088, 2419, 1633, 2281,
+            138, 2141, 2437, 50, 1946, 2031, 13, 234, 53, 42, 1658, 158,
+            1676, 2359, 1876, 242, 1613, 1940, 2404, 84, 301, 1951, 257, 119,
+            158, 213, 248, 68, 264, 318, 1972, 13, 2007, 1787, 1655, 2385,
+            2163, 126, 12, 1728, 112, 267, 169, 1755, 2221, 193, 2284, 261,
+            1970, 30, 2353, 2106, 2009, 2403, 2381, 74, 2105, 2318, 1952, 1721,
+            95, 2074, 2130, 125, 230, 1865, 98, 296, 281, 2434, 278, 1822,
+            2169, 2170, 25, 213, 1700, 2387, 1961, 122, 260, 2143, 2282, 1971,
+            252, 1632, 257, 1812, 40, 107, 1743, 211, 51, 86, 2292, 222,
+            48, 220, 77, 2304, 249, 234, 1624, 1656, 1764, 243, 1788, 48,
+            74, 1681, 24, 61, 119, 2228, 131, 145, 1754, 97, 1813, 2344,
+            146, 318, 113, 2413, 1611, 133, 295, 236, 307, 214, 2205, 51,
+            2011, 169, 2274, 110, 257, 2409, 1832, 91, 1742, 2152, 83, 54,
+            1953, 1794, 1952, 193, 1961, 25, 107, 87, 2216, 1676, 2205, 1808,
+            39, 2159, 1693, 295, 1707, 2347, 294, 97, 2006, 123, 228, 222,
+            270, 145, 1866, 2018, 1623, 2406, 1874, 2440, 150, 35, 121, 1640,
+            2042, 11, 2435, 1759, 225, 2413, 95, 1830, 30, 2450, 204, 219,
+            2051, 2058, 1922, 2028, 1662, 1774, 223, 2282, 230, 1886, 2271, 1623,
+            184, 1627, 198, 188, 292, 71, 120, 72, 51, 245, 174, 27,
+            2350, 2402, 309, 2045, 1831, 317, 232, 1943, 43, 233, 177, 221,
+            293, 2407, 1753, 2178, 1709, 177, 1954, 2162, 1657, 1706, 2291, 246,
+            183, 41, 226, 2242, 2368, 1625, 1986, 1789, 250, 2142, 244, 2371,
+            307, 1896, 1847, 201, 178, 2037, 205, 2289, 51, 264, 1906, 132,
+            300, 1944, 293, 1677, 1612, 1744, 2206, 2243, 1927, 2282, 1810, 296,
+            2022, 228, 1729, 39, 1900, 280, 96, 79, 1855, 1643, 2340, 277,
+            1940, 2407, 14, 1850, 2359, 1955, 2139, 109, 65, 196, 2089, 2030,
+            1676, 2382, 2017, 315, 110, 210, 2107, 172, 288, 1772, 1642, 2301,
+            1992, 200, 2205, 60, 195, 176, 64, 171, 279, 143, 238, 182,
+            1956, 2072, 2337, 2261, 186, 262, 1707, 2311, 1775, 292, 131, 127,
+            155, 1707, 160, 73, 203, 248, 2170, 1973, 2215, 175, 132, 202,
+            2219, 1915, 1941, 99, 2243, 1896, 173, 1839, 95, 28, 1945, 1822,
+            1997, 76, 289, 1812, 1729, 1945, 1812, 1930, 2093, 1790, 2243, 2209,
+            143, 1998, 112, 2256, 2067, 1819, 180, 226, 224, 51, 1680, 2282,
+            1957, 1942, 2153, 1857, 1658, 300, 2107, 2361, 215, 1898, 290, 146,
+            2160, 197, 256, 226, 241, 268, 17, 156, 21, 1689, 2402, 1951,
+            131, 51, 121, 1896, 138, 236, 1829, 231, 2211, 1812, 288, 122,
+            260, 168, 2079, 202, 1945, 2407, 1809, 2270, 67, 2083, 2123, 51,
+            37, 2150, 1945, 1964, 1958, 279, 1896, 312, 2333, 26, 218, 2095,
+            262, 2054, 2453, 237, 2118, 1907, 2261, 1963, 1892, 2221, 2120, 215,
+            207, 2272, 47, 1877, 227, 2149, 1679, 109, 1958, 2008, 2208, 291,
+            2273, 1614, 62, 2198, 1756, 2403, 180, 1622, 1981, 295, 51, 253,
+            276, 1996, 38, 2281, 2029, 2323, 312, 2206, 271, 2008
+        ])
+    
+    odd_xors_to_rank = {
+        3: 310, 5: 298, 6: 297, 9: 286,
+        10: 285, 12: 284, 17: 274, 18: 273,
+        20: 272, 24: 271, 33: 262, 34: 261,
+        36: 260, 40: 259, 48: 258, 63: 1607,
+        65: 250, 66: 249, 68: 248, 72: 247,
+        80: 246, 95: 1608, 96: 245, 111: 7450,
+        119: 7447, 123: 7445, 125: 1606, 126: 1606,
+        129: 238, 130: 237, 132: 236, 136: 235,
+        144: 234, 159: 1608, 160: 233, 175: 7436,
+        183: 7433, 187: 7431, 189: 7430, 190: 1607,
+        192: 232, 207: 7426, 215: 7423, 219: 7421,
+        221: 7420, 222: 7420, 231: 7417, 235: 7415,
+        237: 7414, 238: 7414, 243: 7412, 245: 7411,
+        246: 7411, 249: 1605, 250: 1605, 252: 1605,
+        257: 226, 258: 225, 260: 224, 264: 223,
+        272: 222, 287: 1608, 288: 221, 303: 7402,
+        311: 7399, 315: 7397, 317: 7396, 318: 1607,
+        320: 220, 335: 7392, 343: 7389, 347: 7387,
+        349: 7386, 350: 7386, 359: 7383, 363: 7381,
+        365: 7380, 366: 7380, 371: 7378, 373: 7377,
+        374: 7377, 377: 7376, 378: 7376, 380: 1606,
+        384: 219, 399: 7372, 407: 7369, 411: 7367,
+        413: 7366, 414: 7366, 423: 7363, 427: 7361,
+        429: 7360, 430: 7360, 435: 7358, 437: 7357,
+        438: 7357, 441: 7356, 442: 7356, 444: 7356,
+        455: 7353, 459: 7351, 461: 7350, 462: 7350,
+        467: 7348, 469: 7347, 470: 7347, 473: 7346,
+        474: 7346, 476: 7346, 483: 7344, 485: 7343,
+        486: 7343, 489: 7342, 490: 7342, 492: 7342,
+        497: 1604, 498: 1604, 500: 1604, 504: 1604,
+        513: 214, 514: 213, 516: 212, 520: 211,
+        528: 210, 543: 1608, 544: 209, 559: 7333,
+        567: 7330, 571: 7328, 573: 7327, 574: 1607,
+        576: 208, 591: 7323, 599: 7320, 603: 7318,
+        605: 7317, 606: 7317, 615: 7314, 619: 7312,
+        621: 7311, 622: 7311, 627: 7309, 629: 7308,
+        630: 7308, 633: 7307, 634: 7307, 636: 1606,
+        640: 207, 655: 7303, 663: 7300, 667: 7298,
+        669: 7297, 670: 7297, 679: 7294, 683: 7292,
+        685: 7291, 686: 7291, 691: 7289, 693: 7288,
+        694: 7288, 697: 7287, 698: 7287, 700: 7287,
+        711: 7284, 715: 7282, 717: 7281, 718: 7281,
+        723: 7279, 725: 7278, 726: 7278, 729: 7277,
+        730: 7277, 732: 7277, 739: 7275, 741: 7274,
+        742: 7274, 745: 7273, 746: 7273, 748: 7273,
+        753: 7272, 754: 7272, 756: 7272, 760: 1605,
+        768: 206, 783: 7268, 791: 7265, 795: 7263,
+        797: 7262, 798: 7262, 807: 7259, 811: 7257,
+        813: 7256, 814: 7256, 819: 7254, 821: 7253,
+        822: 7253, 825: 7252, 826: 7252, 828: 7252,
+        839: 7249, 843: 7247, 845: 7246, 846: 7246,
+        851: 7244, 853: 7243, 854: 7243, 857: 7242,
+        858: 7242, 860: 7242, 867: 7240, 869: 7239,
+        870: 7239, 873: 7238, 874: 7238, 876: 7238,
+        881: 7237, 882: 7237, 884: 7237, 888: 7237,
+        903: 7234, 907: 7232, 909: 7231, 910: 7231,
+        915: 7229, 917: 7228, 918: 7228, 921: 7227,
+        922: 7227, 924: 7227, 931: 7225, 933: 7224,
+        934: 7224, 937: 7223, 938: 7223, 940: 7223,
+        945: 7222, 946: 7222, 948: 7222, 952: 7222,
+        963: 7220, 965: 7219, 966: 7219, 969: 7218,
+        970: 7218, 972: 7218, 977: 7217, 978: 7217,
+        980: 7217, 984: 7217, 993: 1603, 994: 1603,
+        996: 1603, 1000: 1603, 1008: 1603, 1025: 202,
+        1026: 201, 1028: 200, 1032: 199, 1040: 198,
+        1055: 1608, 1056: 197, 1071: 7208, 1079: 7205,
+        1083: 7203, 1085: 7202, 1086: 1607, 1088: 196,
+        1103: 7198, 1111: 7195, 1115: 7193, 1117: 7192,
+        1118: 7192, 1127: 7189, 1131: 7187, 1133: 7186,
+        1134: 7186, 1139: 7184, 1141: 7183, 1142: 7183,
+        1145: 7182, 1146: 7182, 1148: 1606, 1152: 195,
+        1167: 7178, 1175: 7175, 1179: 7173, 1181: 7172,
+        1182: 7172, 1191: 7169, 1195: 7167, 1197: 7166,
+        1198: 7166, 1203: 7164, 1205: 7163, 1206: 7163,
+        1209: 7162, 1210: 7162, 1212: 7162, 1223: 7159,
+        1227: 7157, 1229: 7156, 1230: 7156, 1235: 7154,
+        1237: 7153, 1238: 7153, 1241: 7152, 1242: 7152,
+        1244: 7152, 1251: 7150, 1253: 7149, 1254: 7149,
+        1257: 7148, 1258: 7148, 1260: 7148, 1265: 7147,
+        1266: 7147, 1268: 7147, 1272: 1605, 1280: 194,
+        1295: 7143, 1303: 7140, 1307: 7138, 1309: 7137,
+        1310: 7137, 1319: 7134, 1323: 7132, 1325: 7131,
+        1326: 7131, 1331: 7129, 1333: 7128, 1334: 7128,
+        1337: 7127, 1338: 7127, 1340: 7127, 1351: 7124,
+        1355: 7122, 1357: 7121, 1358: 7121, 1363: 7119,
+        1365: 7118, 1366: 7118, 1369: 7117, 1370: 7117,
+        1372: 7117, 1379: 7115, 1381: 7114, 1382: 7114,
+        1385: 7113, 1386: 7113, 1388: 7113, 1393: 7112,
+        1394: 7112, 1396: 7112, 1400: 7112, 1415: 7109,
+        1419: 7107, 1421: 7106, 1422: 7106, 1427: 7104,
+        1429: 7103, 1430: 7103, 1433: 7102, 1434: 7102,
+        1436: 7102, 1443: 7100, 1445: 7099, 1446: 7099,
+        1449: 7098, 1450: 7098, 1452: 7098, 1457: 7097,
+        1458: 7097, 1460: 7097, 1464: 7097, 1475: 7095,
+        1477: 7094, 1478: 7094, 1481: 7093, 1482: 7093,
+        1484: 7093, 1489: 7092, 1490: 7092, 1492: 7092,
+        1496: 7092, 1505: 7091, 1506: 7091, 1508: 7091,
+        1512: 7091, 1520: 1604, 1536: 193, 1551: 7087,
+        1559: 7084, 1563: 7082, 1565: 7081, 1566: 7081,
+        1575: 7078, 1579: 7076, 1581: 7075, 1582: 7075,
+        1587: 7073, 1589: 7072, 1590: 7072, 1593: 7071,
+        1594: 7071, 1596: 7071, 1607: 7068, 1611: 7066,
+        1613: 7065, 1614: 7065, 1619: 7063, 1621: 7062,
+        1622: 7062, 1625: 7061, 1626: 7061, 1628: 7061,
+        1635: 7059, 1637: 7058, 1638: 7058, 1641: 7057,
+        1642: 7057, 1644: 7057, 1649: 7056, 1650: 7056,
+        1652: 7056, 1656: 7056, 1671: 7053, 1675: 7051,
+        1677: 7050, 1678: 7050, 1683: 7048, 1685: 7047,
+        1686: 7047, 1689: 7046, 1690: 7046, 1692: 7046,
+        1699: 7044, 1701: 7043, 1702: 7043, 1705: 7042,
+        1706: 7042, 1708: 7042, 1713: 7041, 1714: 7041,
+        1716: 7041, 1720: 7041, 1731: 7039, 1733: 7038,
+        1734: 7038, 1737: 7037, 1738: 7037, 1740: 7037,
+        1745: 7036, 1746: 7036, 1748: 7036, 1752: 7036,
+        1761: 7035, 1762: 7035, 1764: 7035, 1768: 7035,
+        1776: 7035, 1799: 7032, 1803: 7030, 1805: 7029,
+        1806: 7029, 1811: 7027, 1813: 7026, 1814: 7026,
+        1817: 7025, 1818: 7025, 1820: 7025, 1827: 7023,
+        1829: 7022, 1830: 7022, 1833: 7021, 1834: 7021,
+        1836: 7021, 1841: 7020, 1842: 7020, 1844: 7020,
+        1848: 7020, 1859: 7018, 1861: 7017, 1862: 7017,
+        1865: 7016, 1866: 7016, 1868: 7016, 1873: 7015,
+        1874: 7015, 1876: 7015, 1880: 7015, 1889: 7014,
+        1890: 7014, 1892: 7014, 1896: 7014, 1904: 7014,
+        1923: 7012, 1925: 7011, 1926: 7011, 1929: 7010,
+        1930: 7010, 1932: 7010, 1937: 7009, 1938: 7009,
+        1940: 7009, 1944: 7009, 1953: 7008, 1954: 7008,
+        1956: 7008, 1960: 7008, 1968: 7008, 1985: 1602,
+        1986: 1602, 1988: 1602, 1992: 1602, 2000: 1602,
+        2016: 1602, 2049: 190, 2050: 189, 2052: 188,
+        2056: 187, 2064: 186, 2079: 1608, 2080: 185,
+        2095: 6999, 2103: 6996, 2107: 6994, 2109: 6993,
+        2110: 1607, 2112: 184, 2127: 6989, 2135: 6986,
+        2139: 6984, 2141: 6983, 2142: 6983, 2151: 6980,
+        2155: 6978, 2157: 6977, 2158: 6977, 2163: 6975,
+        2165: 6974, 2166: 6974, 2169: 6973, 2170: 6973,
+        2172: 1606, 2176: 183, 2191: 6969, 2199: 6966,
+        2203: 6964, 2205: 6963, 2206: 6963, 2215: 6960,
+        2219: 6958, 2221: 6957, 2222: 6957, 2227: 6955,
+        2229: 6954, 2230: 6954, 2233: 6953, 2234: 6953,
+        2236: 6953, 2247: 6950, 2251: 6948, 2253: 6947,
+        2254: 6947, 2259: 6945, 2261: 6944, 2262: 6944,
+        2265: 6943, 2266: 6943, 2268: 6943, 2275: 6941,
+        2277: 6940, 2278: 6940, 2281: 6939, 2282: 6939,
+        2284: 6939, 2289: 6938, 2290: 6938, 2292: 6938,
+        2296: 1605, 2304: 182, 2319: 6934, 2327: 6931,
+        2331: 6929, 2333: 6928, 2334: 6928, 2343: 6925,
+        2347: 6923, 2349: 6922, 2350: 6922, 2355: 6920,
+        2357: 6919, 2358: 6919, 2361: 6918, 2362: 6918,
+        2364: 6918, 2375: 6915, 2379: 6913, 2381: 6912,
+        2382: 6912, 2387: 6910, 2389: 6909, 2390: 6909,
+        2393: 6908, 2394: 6908, 2396: 6908, 2403: 6906,
+        2405: 6905, 2406: 6905, 2409: 6904, 2410: 6904,
+        2412: 6904, 2417: 6903, 2418: 6903, 2420: 6903,
+        2424: 6903, 2439: 6900, 2443: 6898, 2445: 6897,
+        2446: 6897, 2451: 6895, 2453: 6894, 2454: 6894,
+        2457: 6893, 2458: 6893, 2460: 6893, 2467: 6891,
+        2469: 6890, 2470: 6890, 2473: 6889, 2474: 6889,
+        2476: 6889, 2481: 6888, 2482: 6888, 2484: 6888,
+        2488: 6888, 2499: 6886, 2501: 6885, 2502: 6885,
+        2505: 6884, 2506: 6884, 2508: 6884, 2513: 6883,
+        2514: 6883, 2516: 6883, 2520: 6883, 2529: 6882,
+        2530: 6882, 2532: 6882, 2536: 6882, 2544: 1604,
+        2560: 181, 2575: 6878, 2583: 6875, 2587: 6873,
+        2589: 6872, 2590: 6872, 2599: 6869, 2603: 6867,
+        2605: 6866, 2606: 6866, 2611: 6864, 2613: 6863,
+        2614: 6863, 2617: 6862, 2618: 6862, 2620: 6862,
+        2631: 6859, 2635: 6857, 2637: 6856, 2638: 6856,
+        2643: 6854, 2645: 6853, 2646: 6853, 2649: 6852,
+        2650: 6852, 2652: 6852, 2659: 6850, 2661: 6849,
+        2662: 6849, 2665: 6848, 2666: 6848, 2668: 6848,
+        2673: 6847, 2674: 6847, 2676: 6847, 2680: 6847,
+        2695: 6844, 2699: 6842, 2701: 6841, 2702: 6841,
+        2707: 6839, 2709: 6838, 2710: 6838, 2713: 6837,
+        2714: 6837, 2716: 6837, 2723: 6835, 2725: 6834,
+        2726: 6834, 2729: 6833, 2730: 6833, 2732: 6833,
+        2737: 6832, 2738: 6832, 2740: 6832, 2744: 6832,
+        2755: 6830, 2757: 6829, 2758: 6829, 2761: 6828,
+        2762: 6828, 2764: 6828, 2769: 6827, 2770: 6827,
+        2772: 6827, 2776: 6827, 2785: 6826, 2786: 6826,
+        2788: 6826, 2792: 6826, 2800: 6826, 2823: 6823,
+        2827: 6821, 2829: 6820, 2830: 6820, 2835: 6818,
+        2837: 6817, 2838: 6817, 2841: 6816, 2842: 6816,
+        2844: 6816, 2851: 6814, 2853: 6813, 2854: 6813,
+        2857: 6812, 2858: 6812, 2860: 6812, 2865: 6811,
+        2866: 6811, 2868: 6811, 2872: 6811, 2883: 6809,
+        2885: 6808, 2886: 6808, 2889: 6807, 2890: 6807,
+        2892: 6807, 2897: 6806, 2898: 6806, 2900: 6806,
+        2904: 6806, 2913: 6805, 2914: 6805, 2916: 6805,
+        2920: 6805, 2928: 6805, 2947: 6803, 2949: 6802,
+        2950: 6802, 2953: 6801, 2954: 6801, 2956: 6801,
+        2961: 6800, 2962: 6800, 2964: 6800, 2968: 6800,
+        2977: 6799, 2978: 6799, 2980: 6799, 2984: 6799,
+        2992: 6799, 3009: 6798, 3010: 6798, 3012: 6798,
+        3016: 6798, 3024: 6798, 3040: 1603, 3072: 180,
+        3087: 6794, 3095: 6791, 3099: 6789, 3101: 6788,
+        3102: 6788, 3111: 6785, 3115: 6783, 3117: 6782,
+        3118: 6782, 3123: 6780, 3125: 6779, 3126: 6779,
+        3129: 6778, 3130: 6778, 3132: 6778, 3143: 6775,
+        3147: 6773, 3149: 6772, 3150: 6772, 3155: 6770,
+        3157: 6769, 3158: 6769, 3161: 6768, 3162: 6768,
+        3164: 6768, 3171: 6766, 3173: 6765, 3174: 6765,
+        3177: 6764, 3178: 6764, 3180: 6764, 3185: 6763,
+        3186: 6763, 3188: 6763, 3192: 6763, 3207: 6760,
+        3211: 6758, 3213: 6757, 3214: 6757, 3219: 6755,
+        3221: 6754, 3222: 6754, 3225: 6753, 3226: 6753,
+        3228: 6753, 3235: 6751, 3237: 6750, 3238: 6750,
+        3241: 6749, 3242: 6749, 3244: 6749, 3249: 6748,
+        3250: 6748, 3252: 6748, 3256: 6748, 3267: 6746,
+        3269: 6745, 3270: 6745, 3273: 6744, 3274: 6744,
+        3276: 6744, 3281: 6743, 3282: 6743, 3284: 6743,
+        3288: 6743, 3297: 6742, 3298: 6742, 3300: 6742,
+        3304: 6742, 3312: 6742, 3335: 6739, 3339: 6737,
+        3341: 6736, 3342: 6736, 3347: 6734, 3349: 6733,
+        3350: 6733, 3353: 6732, 3354: 6732, 3356: 6732,
+        3363: 6730, 3365: 6729, 3366: 6729, 3369: 6728,
+        3370: 6728, 3372: 6728, 3377: 6727, 3378: 6727,
+        3380: 6727, 3384: 6727, 3395: 6725, 3397: 6724,
+        3398: 6724, 3401: 6723, 3402: 6723, 3404: 6723,
+        3409: 6722, 3410: 6722, 3412: 6722, 3416: 6722,
+        3425: 6721, 3426: 6721, 3428: 6721, 3432: 6721,
+        3440: 6721, 3459: 6719, 3461: 6718, 3462: 6718,
+        3465: 6717, 3466: 6717, 3468: 6717, 3473: 6716,
+        3474: 6716, 3476: 6716, 3480: 6716, 3489: 6715,
+        3490: 6715, 3492: 6715, 3496: 6715, 3504: 6715,
+        3521: 6714, 3522: 6714, 3524: 6714, 3528: 6714,
+        3536: 6714, 3552: 6714, 3591: 6711, 3595: 6709,
+        3597: 6708, 3598: 6708, 3603: 6706, 3605: 6705,
+        3606: 6705, 3609: 6704, 3610: 6704, 3612: 6704,
+        3619: 6702, 3621: 6701, 3622: 6701, 3625: 6700,
+        3626: 6700, 3628: 6700, 3633: 6699, 3634: 6699,
+        3636: 6699, 3640: 6699, 3651: 6697, 3653: 6696,
+        3654: 6696, 3657: 6695, 3658: 6695, 3660: 6695,
+        3665: 6694, 3666: 6694, 3668: 6694, 3672: 6694,
+        3681: 6693, 3682: 6693, 3684: 6693, 3688: 6693,
+        3696: 6693, 3715: 6691, 3717: 6690, 3718: 6690,
+        3721: 6689, 3722: 6689, 3724: 6689, 3729: 6688,
+        3730: 6688, 3732: 6688, 3736: 6688, 3745: 6687,
+        3746: 6687, 3748: 6687, 3752: 6687, 3760: 6687,
+        3777: 6686, 3778: 6686, 3780: 6686, 3784: 6686,
+        3792: 6686, 3808: 6686, 3843: 6684, 3845: 6683,
+        3846: 6683, 3849: 6682, 3850: 6682, 3852: 6682,
+        3857: 6681, 3858: 6681, 3860: 6681, 3864: 6681,
+        3873: 6680, 3874: 6680, 3876: 6680, 3880: 6680,
+        3888: 6680, 3905: 6679, 3906: 6679, 3908: 6679,
+        3912: 6679, 3920: 6679, 3936: 6679, 3969: 1601,
+        3970: 1601, 3972: 1601, 3976: 1601, 3984: 1601,
+        4000: 1601, 4032: 1601, 4097: 178, 4098: 177,
+        4100: 176, 4104: 175, 4112: 174, 4127: 1608,
+        4128: 173, 4143: 1609, 4151: 6668, 4155: 6666,
+        4157: 6665, 4158: 1607, 4160: 172, 4175: 1609,
+        4183: 6658, 4187: 6656, 4189: 6655, 4190: 6655,
+        4199: 6652, 4203: 6650, 4205: 6649, 4206: 6649,
+        4211: 6647, 4213: 6646, 4214: 6646, 4217: 6645,
+        4218: 6645, 4220: 1606, 4224: 171, 4239: 1609,
+        4247: 6638, 4251: 6636, 4253: 6635, 4254: 6635,
+        4263: 6632, 4267: 6630, 4269: 6629, 4270: 6629,
+        4275: 6627, 4277: 6626, 4278: 6626, 4281: 6625,
+        4282: 6625, 4284: 6625, 4295: 6622, 4299: 6620,
+        4301: 6619, 4302: 6619, 4307: 6617, 4309: 6616,
+        4310: 6616, 4313: 6615, 4314: 6615, 4316: 6615,
+        4323: 6613, 4325: 6612, 4326: 6612, 4329: 6611,
+        4330: 6611, 4332: 6611, 4337: 6610, 4338: 6610,
+        4340: 6610, 4344: 1605, 4352: 170, 4367: 1609,
+        4375: 6603, 4379: 6601, 4381: 6600, 4382: 6600,
+        4391: 6597, 4395: 6595, 4397: 6594, 4398: 6594,
+        4403: 6592, 4405: 6591, 4406: 6591, 4409: 6590,
+        4410: 6590, 4412: 6590, 4423: 6587, 4427: 6585,
+        4429: 6584, 4430: 6584, 4435: 6582, 4437: 6581,
+        4438: 6581, 4441: 6580, 4442: 6580, 4444: 6580,
+        4451: 6578, 4453: 6577, 4454: 6577, 4457: 6576,
+        4458: 6576, 4460: 6576, 4465: 6575, 4466: 6575,
+        4468: 6575, 4472: 6575, 4487: 6572, 4491: 6570,
+        4493: 6569, 4494: 6569, 4499: 6567, 4501: 6566,
+        4502: 6566, 4505: 6565, 4506: 6565, 4508: 6565,
+        4515: 6563, 4517: 6562, 4518: 6562, 4521: 6561,
+        4522: 6561, 4524: 6561, 4529: 6560, 4530: 6560,
+        4532: 6560, 4536: 6560, 4547: 6558, 4549: 6557,
+        4550: 6557, 4553: 6556, 4554: 6556, 4556: 6556,
+        4561: 6555, 4562: 6555, 4564: 6555, 4568: 6555,
+        4577: 6554, 4578: 6554, 4580: 6554, 4584: 6554,
+        4592: 1604, 4608: 169, 4623: 1609, 4631: 6547,
+        4635: 6545, 4637: 6544, 4638: 6544, 4647: 6541,
+        4651: 6539, 4653: 6538, 4654: 6538, 4659: 6536,
+        4661: 6535, 4662: 6535, 4665: 6534, 4666: 6534,
+        4668: 6534, 4679: 6531, 4683: 6529, 4685: 6528,
+        4686: 6528, 4691: 6526, 4693: 6525, 4694: 6525,
+        4697: 6524, 4698: 6524, 4700: 6524, 4707: 6522,
+        4709: 6521, 4710: 6521, 4713: 6520, 4714: 6520,
+        4716: 6520, 4721: 6519, 4722: 6519, 4724: 6519,
+        4728: 6519, 4743: 6516, 4747: 6514, 4749: 6513,
+        4750: 6513, 4755: 6511, 4757: 6510, 4758: 6510,
+        4761: 6509, 4762: 6509, 4764: 6509, 4771: 6507,
+        4773: 6506, 4774: 6506, 4777: 6505, 4778: 6505,
+        4780: 6505, 4785: 6504, 4786: 6504, 4788: 6504,
+        4792: 6504, 4803: 6502, 4805: 6501, 4806: 6501,
+        4809: 6500, 4810: 6500, 4812: 6500, 4817: 6499,
+        4818: 6499, 4820: 6499, 4824: 6499, 4833: 6498,
+        4834: 6498, 4836: 6498, 4840: 6498, 4848: 6498,
+        4871: 6495, 4875: 6493, 4877: 6492, 4878: 6492,
+        4883: 6490, 4885: 6489, 4886: 6489, 4889: 6488,
+        4890: 6488, 4892: 6488, 4899: 6486, 4901: 6485,
+        4902: 6485, 4905: 6484, 4906: 6484, 4908: 6484,
+        4913: 6483, 4914: 6483, 4916: 6483, 4920: 6483,
+        4931: 6481, 4933: 6480, 4934: 6480, 4937: 6479,
+        4938: 6479, 4940: 6479, 4945: 6478, 4946: 6478,
+        4948: 6478, 4952: 6478, 4961: 6477, 4962: 6477,
+        4964: 6477, 4968: 6477, 4976: 6477, 4995: 6475,
+        4997: 6474, 4998: 6474, 5001: 6473, 5002: 6473,
+        5004: 6473, 5009: 6472, 5010: 6472, 5012: 6472,
+        5016: 6472, 5025: 6471, 5026: 6471, 5028: 6471,
+        5032: 6471, 5040: 6471, 5057: 6470, 5058: 6470,
+        5060: 6470, 5064: 6470, 5072: 6470, 5088: 1603,
+        5120: 168, 5135: 1609, 5143: 6463, 5147: 6461,
+        5149: 6460, 5150: 6460, 5159: 6457, 5163: 6455,
+        5165: 6454, 5166: 6454, 5171: 6452, 5173: 6451,
+        5174: 6451, 5177: 6450, 5178: 6450, 5180: 6450,
+        5191: 6447, 5195: 6445, 5197: 6444, 5198: 6444,
+        5203: 6442, 5205: 6441, 5206: 6441, 5209: 6440,
+        5210: 6440, 5212: 6440, 5219: 6438, 5221: 6437,
+        5222: 6437, 5225: 6436, 5226: 6436, 5228: 6436,
+        5233: 6435, 5234: 6435, 5236: 6435, 5240: 6435,
+        5255: 6432, 5259: 6430, 5261: 6429, 5262: 6429,
+        5267: 6427, 5269: 6426, 5270: 6426, 5273: 6425,
+        5274: 6425, 5276: 6425, 5283: 6423, 5285: 6422,
+        5286: 6422, 5289: 6421, 5290: 6421, 5292: 6421,
+        5297: 6420, 5298: 6420, 5300: 6420, 5304: 6420,
+        5315: 6418, 5317: 6417, 5318: 6417, 5321: 6416,
+        5322: 6416, 5324: 6416, 5329: 6415, 5330: 6415,
+        5332: 6415, 5336: 6415, 5345: 6414, 5346: 6414,
+        5348: 6414, 5352: 6414, 5360: 6414, 5383: 6411,
+        5387: 6409, 5389: 6408, 5390: 6408, 5395: 6406,
+        5397: 6405, 5398: 6405, 5401: 6404, 5402: 6404,
+        5404: 6404, 5411: 6402, 5413: 6401, 5414: 6401,
+        5417: 6400, 5418: 6400, 5420: 6400, 5425: 6399,
+        5426: 6399, 5428: 6399, 5432: 6399, 5443: 6397,
+        5445: 6396, 5446: 6396, 5449: 6395, 5450: 6395,
+        5452: 6395, 5457: 6394, 5458: 6394, 5460: 6394,
+        5464: 6394, 5473: 6393, 5474: 6393, 5476: 6393,
+        5480: 6393, 5488: 6393, 5507: 6391, 5509: 6390,
+        5510: 6390, 5513: 6389, 5514: 6389, 5516: 6389,
+        5521: 6388, 5522: 6388, 5524: 6388, 5528: 6388,
+        5537: 6387, 5538: 6387, 5540: 6387, 5544: 6387,
+        5552: 6387, 5569: 6386, 5570: 6386, 5572: 6386,
+        5576: 6386, 5584: 6386, 5600: 6386, 5639: 6383,
+        5643: 6381, 5645: 6380, 5646: 6380, 5651: 6378,
+        5653: 6377, 5654: 6377, 5657: 6376, 5658: 6376,
+        5660: 6376, 5667: 6374, 5669: 6373, 5670: 6373,
+        5673: 6372, 5674: 6372, 5676: 6372, 5681: 6371,
+        5682: 6371, 5684: 6371, 5688: 6371, 5699: 6369,
+        5701: 6368, 5702: 6368, 5705: 6367, 5706: 6367,
+        5708: 6367, 5713: 6366, 5714: 6366, 5716: 6366,
+        5720: 6366, 5729: 6365, 5730: 6365, 5732: 6365,
+        5736: 6365, 5744: 6365, 5763: 6363, 5765: 6362,
+        5766: 6362, 5769: 6361, 5770: 6361, 5772: 6361,
+        5777: 6360, 5778: 6360, 5780: 6360, 5784: 6360,
+        5793: 6359, 5794: 6359, 5796: 6359, 5800: 6359,
+        5808: 6359, 5825: 6358, 5826: 6358, 5828: 6358,
+        5832: 6358, 5840: 6358, 5856: 6358, 5891: 6356,
+        5893: 6355, 5894: 6355, 5897: 6354, 5898: 6354,
+        5900: 6354, 5905: 6353, 5906: 6353, 5908: 6353,
+        5912: 6353, 5921: 6352, 5922: 6352, 5924: 6352,
+        5928: 6352, 5936: 6352, 5953: 6351, 5954: 6351,
+        5956: 6351, 5960: 6351, 5968: 6351, 5984: 6351,
+        6017: 6350, 6018: 6350, 6020: 6350, 6024: 6350,
+        6032: 6350, 6048: 6350, 6080: 1602, 6144: 167,
+        6159: 1609, 6167: 6343, 6171: 6341, 6173: 6340,
+        6174: 6340, 6183: 6337, 6187: 6335, 6189: 6334,
+        6190: 6334, 6195: 6332, 6197: 6331, 6198: 6331,
+        6201: 6330, 6202: 6330, 6204: 6330, 6215: 6327,
+        6219: 6325, 6221: 6324, 6222: 6324, 6227: 6322,
+        6229: 6321, 6230: 6321, 6233: 6320, 6234: 6320,
+        6236: 6320, 6243: 6318, 6245: 6317, 6246: 6317,
+        6249: 6316, 6250: 6316, 6252: 6316, 6257: 6315,
+        6258: 6315, 6260: 6315, 6264: 6315, 6279: 6312,
+        6283: 6310, 6285: 6309, 6286: 6309, 6291: 6307,
+        6293: 6306, 6294: 6306, 6297: 6305, 6298: 6305,
+        6300: 6305, 6307: 6303, 6309: 6302, 6310: 6302,
+        6313: 6301, 6314: 6301, 6316: 6301, 6321: 6300,
+        6322: 6300, 6324: 6300, 6328: 6300, 6339: 6298,
+        6341: 6297, 6342: 6297, 6345: 6296, 6346: 6296,
+        6348: 6296, 6353: 6295, 6354: 6295, 6356: 6295,
+        6360: 6295, 6369: 6294, 6370: 6294, 6372: 6294,
+        6376: 6294, 6384: 6294, 6407: 6291, 6411: 6289,
+        6413: 6288, 6414: 6288, 6419: 6286, 6421: 6285,
+        6422: 6285, 6425: 6284, 6426: 6284, 6428: 6284,
+        6435: 6282, 6437: 6281, 6438: 6281, 6441: 6280,
+        6442: 6280, 6444: 6280, 6449: 6279, 6450: 6279,
+        6452: 6279, 6456: 6279, 6467: 6277, 6469: 6276,
+        6470: 6276, 6473: 6275, 6474: 6275, 6476: 6275,
+        6481: 6274, 6482: 6274, 6484: 6274, 6488: 6274,
+        6497: 6273, 6498: 6273, 6500: 6273, 6504: 6273,
+        6512: 6273, 6531: 6271, 6533: 6270, 6534: 6270,
+        6537: 6269, 6538: 6269, 6540: 6269, 6545: 6268,
+        6546: 6268, 6548: 6268, 6552: 6268, 6561: 6267,
+        6562: 6267, 6564: 6267, 6568: 6267, 6576: 6267,
+        6593: 6266, 6594: 6266, 6596: 6266, 6600: 6266,
+        6608: 6266, 6624: 6266, 6663: 6263, 6667: 6261,
+        6669: 6260, 6670: 6260, 6675: 6258, 6677: 6257,
+        6678: 6257, 6681: 6256, 6682: 6256, 6684: 6256,
+        6691: 6254, 6693: 6253, 6694: 6253, 6697: 6252,
+        6698: 6252, 6700: 6252, 6705: 6251, 6706: 6251,
+        6708: 6251, 6712: 6251, 6723: 6249, 6725: 6248,
+        6726: 6248, 6729: 6247, 6730: 6247, 6732: 6247,
+        6737: 6246, 6738: 6246, 6740: 6246, 6744: 6246,
+        6753: 6245, 6754: 6245, 6756: 6245, 6760: 6245,
+        6768: 6245, 6787: 6243, 6789: 6242, 6790: 6242,
+        6793: 6241, 6794: 6241, 6796: 6241, 6801: 6240,
+        6802: 6240, 6804: 6240, 6808: 6240, 6817: 6239,
+        6818: 6239, 6820: 6239, 6824: 6239, 6832: 6239,
+        6849: 6238, 6850: 6238, 6852: 6238, 6856: 6238,
+        6864: 6238, 6880: 6238, 6915: 6236, 6917: 6235,
+        6918: 6235, 6921: 6234, 6922: 6234, 6924: 6234,
+        6929: 6233, 6930: 6233, 6932: 6233, 6936: 6233,
+        6945: 6232, 6946: 6232, 6948: 6232, 6952: 6232,
+        6960: 6232, 6977: 6231, 6978: 6231, 6980: 6231,
+        6984: 6231, 6992: 6231, 7008: 6231, 7041: 6230,
+        7042: 6230, 7044: 6230, 7048: 6230, 7056: 6230,
+        7072: 6230, 7104: 6230, 7175: 6227, 7179: 6225,
+        7181: 6224, 7182: 6224, 7187: 6222, 7189: 6221,
+        7190: 6221, 7193: 6220, 7194: 6220, 7196: 6220,
+        7203: 6218, 7205: 6217, 7206: 6217, 7209: 6216,
+        7210: 6216, 7212: 6216, 7217: 6215, 7218: 6215,
+        7220: 6215, 7224: 6215, 7235: 6213, 7237: 6212,
+        7238: 6212, 7241: 6211, 7242: 6211, 7244: 6211,
+        7249: 6210, 7250: 6210, 7252: 6210, 7256: 6210,
+        7265: 6209, 7266: 6209, 7268: 6209, 7272: 6209,
+        7280: 6209, 7299: 6207, 7301: 6206, 7302: 6206,
+        7305: 6205, 7306: 6205, 7308: 6205, 7313: 6204,
+        7314: 6204, 7316: 6204, 7320: 6204, 7329: 6203,
+        7330: 6203, 7332: 6203, 7336: 6203, 7344: 6203,
+        7361: 6202, 7362: 6202, 7364: 6202, 7368: 6202,
+        7376: 6202, 7392: 6202, 7427: 6200, 7429: 6199,
+        7430: 6199, 7433: 6198, 7434: 6198, 7436: 6198,
+        7441: 6197, 7442: 6197, 7444: 6197, 7448: 6197,
+        7457: 6196, 7458: 6196, 7460: 6196, 7464: 6196,
+        7472: 6196, 7489: 6195, 7490: 6195, 7492: 6195,
+        7496: 6195, 7504: 6195, 7520: 6195, 7553: 6194,
+        7554: 6194, 7556: 6194, 7560: 6194, 7568: 6194,
+        7584: 6194, 7616: 6194, 7683: 6192, 7685: 6191,
+        7686: 6191, 7689: 6190, 7690: 6190, 7692: 6190,
+        7697: 6189, 7698: 6189, 7700: 6189, 7704: 6189,
+        7713: 6188, 7714: 6188, 7716: 6188, 7720: 6188,
+        7728: 6188, 7745: 6187, 7746: 6187, 7748: 6187,
+        7752: 6187, 7760: 6187, 7776: 6187, 7809: 6186,
+        7810: 6186, 7812: 6186, 7816: 6186, 7824: 6186,
+        7840: 6186, 7872: 6186, 7937: 1600, 7938: 1600,
+        7940: 1600, 7944: 1600, 7952: 1600, 7968: 1600,
+        8000: 1600, 8064: 1600
+    }
+    
+    even_xors_to_rank = {
+        3584: 2601, 3073: 2610, 1538: 2730, 1027: 2819,
+        2114: 2653, 4101: 2577, 4102: 2576, 7: 3303,
+        1544: 2728, 4105: 2566, 4106: 2565, 11: 3281,
+        524: 2894, 13: 3270, 14: 3269, 4228: 2520,
+        1552: 2727, 4113: 2555, 530: 2884, 2051: 2709,
+        529: 2885, 21: 3237, 22: 3236, 2592: 2616,
+        536: 2882, 25: 3226, 26: 3225, 28: 3224,
+        517: 2907, 1092: 2762, 1057: 2775, 546: 2873,
+        35: 3204, 548: 2872, 37: 3193, 38: 3192,
+        4144: 2540, 552: 2871, 41: 3182, 42: 3181,
+        44: 3180, 2320: 2628, 560: 2870, 49: 3171,
+        50: 3170, 52: 3169, 2576: 2617, 521: 2896,
+        56: 3168, 2312: 2629, 2184: 2640, 769: 2841,
+        522: 2895, 2116: 2652, 577: 2863, 578: 2862,
+        67: 3149, 2065: 2676, 69: 3138, 70: 3137,
+        584: 2860, 73: 3127, 74: 3126, 76: 3125,
+        98: 3104, 2336: 2627, 4384: 2506, 592: 2859,
+        81: 3116, 82: 3115, 1537: 2731, 4416: 2505,
+        4640: 2495, 88: 3113, 3076: 2608, 2816: 2613,
+        608: 2858, 97: 3105, 2066: 2675, 100: 3103,
+        4129: 2544, 1041: 2786, 104: 3102, 1282: 2741,
+        2305: 2632, 1042: 2785, 4368: 2507, 515: 2918,
+        19: 3248, 2561: 2621, 4624: 2496, 6400: 2470,
+        532: 2883, 4232: 2519, 4672: 2494, 1044: 2784,
+        2084: 2663, 4164: 2531, 4225: 2522, 642: 2851,
+        131: 3083, 644: 2850, 133: 3072, 134: 3071,
+        6176: 2473, 648: 2849, 137: 3061, 138: 3060,
+        140: 3059, 656: 2848, 145: 3050, 146: 3049,
+        4130: 2543, 152: 3047, 196: 3026, 2082: 2664,
+        2432: 2625, 2068: 2674, 672: 2847, 161: 3039,
+        4114: 2554, 164: 3037, 1284: 2740, 168: 3036,
+        4353: 2511, 1540: 2729, 176: 3035, 3080: 2607,
+        4120: 2552, 4609: 2500, 2306: 2631, 5632: 2480,
+        2120: 2651, 1029: 2808, 4132: 2542, 704: 2846,
+        193: 3028, 194: 3027, 5121: 2489, 2308: 2630,
+        2081: 2665, 200: 3025, 518: 2906, 2240: 2637,
+        1058: 2774, 2564: 2619, 1096: 2761, 208: 3024,
+        4610: 2499, 3328: 2602, 6656: 2469, 1060: 2773,
+        1030: 2807, 2053: 2698, 2562: 2620, 4116: 2553,
+        4099: 2588, 5122: 2488, 4226: 2521, 6145: 2478,
+        7168: 2468, 5152: 2484, 1064: 2772, 1048: 2783,
+        2088: 2662, 4168: 2530, 2054: 2697, 1792: 2723,
+        1281: 2742, 770: 2840, 259: 3006, 772: 2839,
+        261: 2995, 262: 2994, 641: 2852, 776: 2838,
+        265: 2984, 266: 2983, 2208: 2638, 268: 2982,
+        1154: 2752, 4612: 2498, 1120: 2759, 784: 2837,
+        273: 2973, 274: 2972, 276: 2971, 2072: 2673,
+        280: 2970, 1156: 2751, 4864: 2492, 5124: 2487,
+        800: 2836, 289: 2962, 290: 2961, 4356: 2509,
+        292: 2960, 296: 2959, 112: 3101, 2192: 2639,
+        3200: 2603, 3074: 2609, 304: 2958, 1160: 2750,
+        1408: 2735, 1033: 2797, 5136: 2485, 4136: 2541,
+        1664: 2724, 6148: 2476, 832: 2835, 321: 2951,
+        322: 2950, 324: 2949, 6160: 2474, 2568: 2618,
+        1153: 2753, 4256: 2517, 336: 2947, 1034: 2796,
+        2057: 2687, 6146: 2477, 4162: 2532, 2688: 2614,
+        1216: 2747, 4288: 2516, 352: 2946, 1168: 2749,
+        3088: 2606, 2177: 2643, 1296: 2738, 4240: 2518,
+        5376: 2481, 6208: 2472, 2058: 2686, 148: 3048,
+        4360: 2508, 896: 2834, 385: 2940, 386: 2939,
+        388: 2938, 2178: 2642, 4161: 2533, 392: 2937,
+        2144: 2649, 5184: 2483, 224: 3023, 3136: 2604,
+        1090: 2763, 1036: 2795, 400: 2936, 4480: 2504,
+        5128: 2486, 1288: 2739, 580: 2861, 4736: 2493,
+        416: 2935, 4616: 2497, 2128: 2650, 5248: 2482,
+        2060: 2685, 1344: 2736, 328: 2948, 6152: 2475,
+        1600: 2725, 448: 2934, 1184: 2748, 2180: 2641,
+        1089: 2764, 1072: 2771, 4192: 2528, 6272: 2471,
+        162: 3038, 2368: 2626, 1568: 2726, 2624: 2615,
+        1104: 2760, 3104: 2605, 2113: 2654, 2096: 2661,
+        4176: 2529, 4108: 2564, 1312: 2737, 545: 2874,
+        4354: 2510, 84: 3114            
+    }
+    
+    even_xors_to_odd_xors_to_rank = {
+        4096: { 2055: 3378, 2059: 3376, 2061: 3375, 2062: 3375,
+        15: 1609, 2067: 3373, 2069: 3372, 2070: 3372,
+        23: 3539, 2073: 3371, 2074: 3371, 27: 3537,
+        2076: 3371, 29: 3536, 30: 3536, 2083: 3369,
+        2085: 3368, 2086: 3368, 39: 3533, 2089: 3367,
+        2090: 3367, 43: 3531, 2092: 3367, 45: 3530,
+        46: 3530, 2097: 3366, 2098: 3366, 51: 3528,
+        2100: 3366, 53: 3527, 54: 3527, 2104: 3366,
+        57: 3526, 58: 3526, 60: 3526, 2115: 3364,
+        2117: 3363, 2118: 3363, 71: 3523, 2121: 3362,
+        2122: 3362, 75: 3521, 2124: 3362, 77: 3520,
+        78: 3520, 2129: 3361, 2130: 3361, 83: 3518,
+        2132: 3361, 85: 3517, 86: 3517, 2136: 3361,
+        89: 3516, 90: 3516, 92: 3516, 2145: 3360,
+        2146: 3360, 99: 3514, 2148: 3360, 101: 3513,
+        102: 3513, 2152: 3360, 105: 3512, 106: 3512,
+        108: 3512, 2160: 3360, 113: 3511, 114: 3511,
+        116: 3511, 120: 3511, 2179: 3358, 2181: 3357,
+        2182: 3357, 135: 3508, 2185: 3356, 2186: 3356,
+        139: 3506, 2188: 3356, 141: 3505, 142: 3505,
+        2193: 3355, 2194: 3355, 147: 3503, 2196: 3355,
+        149: 3502, 150: 3502, 2200: 3355, 153: 3501,
+        154: 3501, 156: 3501, 2209: 3354, 2210: 3354,
+        163: 3499, 2212: 3354, 165: 3498, 166: 3498,
+        2216: 3354, 169: 3497, 170: 3497, 172: 3497,
+        2224: 3354, 177: 3496, 178: 3496, 180: 3496,
+        184: 3496, 2241: 3353, 2242: 3353, 195: 3494,
+        2244: 3353, 197: 3493, 198: 3493, 2248: 3353,
+        201: 3492, 202: 3492, 204: 3492, 2256: 3353,
+        209: 3491, 210: 3491, 212: 3491, 216: 3491,
+        2272: 3353, 225: 3490, 226: 3490, 228: 3490,
+        232: 3490, 240: 3490, 2307: 3351, 2309: 3350,
+        2310: 3350, 263: 3487, 2313: 3349, 2314: 3349,
+        267: 3485, 2316: 3349, 269: 3484, 270: 3484,
+        2321: 3348, 2322: 3348, 275: 3482, 2324: 3348,
+        277: 3481, 278: 3481, 2328: 3348, 281: 3480,
+        282: 3480, 284: 3480, 2337: 3347, 2338: 3347,
+        291: 3478, 2340: 3347, 293: 3477, 294: 3477,
+        2344: 3347, 297: 3476, 298: 3476, 300: 3476,
+        2352: 3347, 305: 3475, 306: 3475, 308: 3475,
+        312: 3475, 2369: 3346, 2370: 3346, 323: 3473,
+        2372: 3346, 325: 3472, 326: 3472, 2376: 3346,
+        329: 3471, 330: 3471, 332: 3471, 2384: 3346,
+        337: 3470, 338: 3470, 340: 3470, 344: 3470,
+        2400: 3346, 353: 3469, 354: 3469, 356: 3469,
+        360: 3469, 368: 3469, 2433: 3345, 2434: 3345,
+        387: 3467, 2436: 3345, 389: 3466, 390: 3466,
+        2440: 3345, 393: 3465, 394: 3465, 396: 3465,
+        2448: 3345, 401: 3464, 402: 3464, 404: 3464,
+        408: 3464, 2464: 3345, 417: 3463, 418: 3463,
+        420: 3463, 424: 3463, 432: 3463, 2496: 3345,
+        449: 3462, 450: 3462, 452: 3462, 456: 3462,
+        464: 3462, 480: 3462, 2563: 3343, 2565: 3342,
+        2566: 3342, 519: 3459, 2569: 3341, 2570: 3341,
+        523: 3457, 2572: 3341, 525: 3456, 526: 3456,
+        2577: 3340, 2578: 3340, 531: 3454, 2580: 3340,
+        533: 3453, 534: 3453, 2584: 3340, 537: 3452,
+        538: 3452, 540: 3452, 2593: 3339, 2594: 3339,
+        547: 3450, 2596: 3339, 549: 3449, 550: 3449,
+        2600: 3339, 553: 3448, 554: 3448, 556: 3448,
+        2608: 3339, 561: 3447, 562: 3447, 564: 3447,
+        568: 3447, 2625: 3338, 2626: 3338, 579: 3445,
+        2628: 3338, 581: 3444, 582: 3444, 2632: 3338,
+        585: 3443, 586: 3443, 588: 3443, 2640: 3338,
+        593: 3442, 594: 3442, 596: 3442, 600: 3442,
+        2656: 3338, 609: 3441, 610: 3441, 612: 3441,
+        616: 3441, 624: 3441, 2689: 3337, 2690: 3337,
+        643: 3439, 2692: 3337, 645: 3438, 646: 3438,
+        2696: 3337, 649: 3437, 650: 3437, 652: 3437,
+        2704: 3337, 657: 3436, 658: 3436, 660: 3436,
+        664: 3436, 2720: 3337, 673: 3435, 674: 3435,
+        676: 3435, 680: 3435, 688: 3435, 2752: 3337,
+        705: 3434, 706: 3434, 708: 3434, 712: 3434,
+        720: 3434, 736: 3434, 2817: 3336, 2818: 3336,
+        771: 3432, 2820: 3336, 773: 3431, 774: 3431,
+        2824: 3336, 777: 3430, 778: 3430, 780: 3430,
+        2832: 3336, 785: 3429, 786: 3429, 788: 3429,
+        792: 3429, 2848: 3336, 801: 3428, 802: 3428,
+        804: 3428, 808: 3428, 816: 3428, 2880: 3336,
+        833: 3427, 834: 3427, 836: 3427, 840: 3427,
+        848: 3427, 864: 3427, 2944: 3336, 897: 3426,
+        898: 3426, 900: 3426, 904: 3426, 912: 3426,
+        928: 3426, 960: 3426, 3075: 3334, 3077: 3333,
+        3078: 3333, 1031: 3423, 3081: 3332, 3082: 3332,
+        1035: 3421, 3084: 3332, 1037: 3420, 1038: 3420,
+        3089: 3331, 3090: 3331, 1043: 3418, 3092: 3331,
+        1045: 3417, 1046: 3417, 3096: 3331, 1049: 3416,
+        1050: 3416, 1052: 3416, 3105: 3330, 3106: 3330,
+        1059: 3414, 3108: 3330, 1061: 3413, 1062: 3413,
+        3112: 3330, 1065: 3412, 1066: 3412, 1068: 3412,
+        3120: 3330, 1073: 3411, 1074: 3411, 1076: 3411,
+        1080: 3411, 3137: 3329, 3138: 3329, 1091: 3409,
+        3140: 3329, 1093: 3408, 1094: 3408, 3144: 3329,
+        1097: 3407, 1098: 3407, 1100: 3407, 3152: 3329,
+        1105: 3406, 1106: 3406, 1108: 3406, 1112: 3406,
+        3168: 3329, 1121: 3405, 1122: 3405, 1124: 3405,
+        1128: 3405, 1136: 3405, 3201: 3328, 3202: 3328,
+        1155: 3403, 3204: 3328, 1157: 3402, 1158: 3402,
+        3208: 3328, 1161: 3401, 1162: 3401, 1164: 3401,
+        3216: 3328, 1169: 3400, 1170: 3400, 1172: 3400,
+        1176: 3400, 3232: 3328, 1185: 3399, 1186: 3399,
+        1188: 3399, 1192: 3399, 1200: 3399, 3264: 3328,
+        1217: 3398, 1218: 3398, 1220: 3398, 1224: 3398,
+        1232: 3398, 1248: 3398, 3329: 3327, 3330: 3327,
+        1283: 3396, 3332: 3327, 1285: 3395, 1286: 3395,
+        3336: 3327, 1289: 3394, 1290: 3394, 1292: 3394,
+        3344: 3327, 1297: 3393, 1298: 3393, 1300: 3393,
+        1304: 3393, 3360: 3327, 1313: 3392, 1314: 3392,
+        1316: 3392, 1320: 3392, 1328: 3392, 3392: 3327,
+        1345: 3391, 1346: 3391, 1348: 3391, 1352: 3391,
+        1360: 3391, 1376: 3391, 3456: 3327, 1409: 3390,
+        1410: 3390, 1412: 3390, 1416: 3390, 1424: 3390,
+        1440: 3390, 1472: 3390, 3585: 3326, 3586: 3326,
+        1539: 3388, 3588: 3326, 1541: 3387, 1542: 3387,
+        3592: 3326, 1545: 3386, 1546: 3386, 1548: 3386,
+        3600: 3326, 1553: 3385, 1554: 3385, 1556: 3385,
+        1560: 3385, 3616: 3326, 1569: 3384, 1570: 3384,
+        1572: 3384, 1576: 3384, 1584: 3384, 3648: 3326,
+        1601: 3383, 1602: 3383, 1604: 3383, 1608: 3383,
+        1616: 3383, 1632: 3383, 3712: 3326, 1665: 3382,
+        1666: 3382, 1668: 3382, 1672: 3382, 1680: 3382,
+        1696: 3382, 1728: 3382, 3840: 1600, 1793: 3381,
+        1794: 3381, 1796: 3381, 1800: 3381, 1808: 3381,
+        1824: 3381, 1856: 3381, 1920: 3381 },
+        1: { 6150: 5974, 6154: 5973, 6156: 5973, 4110: 1609,
+        6162: 5972, 6164: 5972, 4118: 6016, 6168: 5972,
+        2074: 6060, 4124: 6015, 30: 1608, 6178: 5971,
+        6180: 5971, 3078: 6028, 2086: 6058, 6184: 5971,
+        2090: 6057, 2092: 6057, 46: 6179, 6192: 5971,
+        2098: 6056, 2100: 6056, 54: 6177, 2104: 6056,
+        58: 6176, 60: 6176, 3082: 6027, 4448: 5994,
+        6210: 5970, 6212: 5970, 4166: 6009, 6216: 5970,
+        5132: 5982, 4170: 6008, 2124: 6053, 78: 6173,
+        6224: 5970, 4178: 6007, 2132: 6052, 2062: 6063,
+        86: 6171, 2136: 6052, 90: 6170, 92: 6170,
+        6240: 5970, 4194: 6006, 2148: 6051, 102: 6168,
+        4200: 6006, 106: 6167, 108: 6167, 5138: 5981,
+        2160: 6051, 114: 6166, 116: 6166, 120: 6166,
+        5140: 5981, 4800: 5986, 6274: 5969, 6276: 5969,
+        2070: 6061, 4230: 6004, 6280: 5969, 2186: 6048,
+        4236: 6003, 142: 6163, 6288: 5969, 3096: 6026,
+        2194: 6047, 2196: 6047, 150: 6161, 2200: 6047,
+        154: 6160, 156: 6160, 4122: 6015, 6304: 5969,
+        2210: 6046, 2212: 6046, 166: 6158, 2216: 6046,
+        2076: 6060, 170: 6157, 172: 6157, 2224: 6046,
+        178: 6156, 180: 6156, 184: 6156, 6336: 5969,
+        2242: 6045, 2244: 6045, 198: 6154, 4296: 6000,
+        202: 6153, 204: 6153, 3106: 6025, 2256: 6045,
+        210: 6152, 212: 6152, 216: 6152, 3108: 6025,
+        2272: 6045, 226: 6151, 228: 6151, 4134: 6013,
+        232: 6151, 240: 6151, 3112: 6025, 4138: 6012,
+        5504: 5977, 6402: 5968, 6404: 5968, 2310: 6043,
+        6408: 5968, 4140: 6012, 4362: 5997, 2316: 6042,
+        4482: 5993, 270: 6148, 6416: 5968, 2322: 6041,
+        4372: 5996, 278: 6146, 4376: 5996, 2436: 6038,
+        282: 6145, 284: 6145, 6432: 5968, 5168: 5980,
+        2338: 6040, 2340: 6040, 294: 6143, 2344: 6040,
+        298: 6142, 300: 6142, 4146: 6011, 2352: 6040,
+        4488: 5993, 306: 6141, 308: 6141, 312: 6141,
+        4148: 6011, 6464: 5968, 2370: 6039, 2372: 6039,
+        326: 6139, 2376: 6039, 330: 6138, 332: 6138,
+        2384: 6039, 4152: 6011, 338: 6137, 340: 6137,
+        344: 6137, 2400: 6039, 4496: 5993, 354: 6136,
+        356: 6136, 360: 6136, 368: 6136, 6528: 5968,
+        2434: 6038, 4484: 5993, 390: 6134, 2440: 6038,
+        394: 6133, 396: 6133, 3138: 6024, 2448: 6038,
+        402: 6132, 404: 6132, 408: 6132, 3140: 6024,
+        2464: 6038, 418: 6131, 420: 6131, 2118: 6054,
+        424: 6131, 432: 6131, 5192: 5979, 2122: 6053,
+        2496: 6038, 4512: 5993, 450: 6130, 452: 6130,
+        456: 6130, 4172: 6008, 464: 6130, 480: 6130,
+        5200: 5979, 2130: 6052, 4180: 6007, 5888: 5976,
+        6658: 5967, 6660: 5967, 2566: 6036, 6664: 5967,
+        2570: 6035, 2572: 6035, 4866: 5985, 526: 6127,
+        6672: 5967, 4184: 6007, 4626: 5989, 2580: 6034,
+        534: 6125, 4632: 5989, 4868: 5985, 538: 6124,
+        540: 6124, 6688: 5967, 2594: 6033, 2596: 6033,
+        550: 6122, 4648: 5988, 554: 6121, 556: 6121,
+        2608: 6033, 4872: 5985, 562: 6120, 564: 6120,
+        568: 6120, 6720: 5967, 5216: 5979, 2626: 6032,
+        2628: 6032, 582: 6118, 2632: 6032, 586: 6117,
+        588: 6117, 2146: 6051, 2640: 6032, 594: 6116,
+        596: 6116, 600: 6116, 4196: 6006, 2656: 6032,
+        4880: 5985, 610: 6115, 612: 6115, 616: 6115,
+        624: 6115, 2152: 6051, 6784: 5967, 4544: 5993,
+        2690: 6031, 2692: 6031, 646: 6113, 2696: 6031,
+        650: 6112, 652: 6112, 2704: 6031, 658: 6111,
+        660: 6111, 664: 6111, 2720: 6031, 4208: 6006,
+        674: 6110, 676: 6110, 680: 6110, 688: 6110,
+        2752: 6031, 4896: 5985, 706: 6109, 708: 6109,
+        712: 6109, 720: 6109, 736: 6109, 6912: 5967,
+        2818: 6030, 2820: 6030, 774: 6107, 2824: 6030,
+        778: 6106, 780: 6106, 5250: 5978, 2832: 6030,
+        786: 6105, 788: 6105, 792: 6105, 3204: 6023,
+        2848: 6030, 802: 6104, 804: 6104, 2182: 6049,
+        808: 6104, 816: 6104, 5256: 5978, 4234: 6003,
+        2880: 6030, 834: 6103, 836: 6103, 840: 6103,
+        2188: 6048, 848: 6103, 864: 6103, 5264: 5978,
+        4242: 6002, 4244: 6002, 2944: 6030, 4928: 5985,
+        898: 6102, 900: 6102, 904: 6102, 912: 6102,
+        4248: 6002, 928: 6102, 960: 6102, 5280: 5978,
+        4258: 6001, 4260: 6001, 4264: 6001, 7170: 5966,
+        7172: 5966, 5126: 5983, 7176: 5966, 5130: 5982,
+        3084: 6027, 5634: 5976, 1038: 6099, 7184: 5966,
+        3090: 6026, 3092: 6026, 1046: 6097, 5144: 5981,
+        5636: 5976, 1050: 6096, 1052: 6096, 7200: 5966,
+        4272: 6001, 5154: 5980, 5156: 5980, 4614: 5991,
+        1062: 6094, 5160: 5980, 1066: 6093, 1068: 6093,
+        3120: 6025, 5640: 5976, 1074: 6092, 1076: 6092,
+        1080: 6092, 4618: 5990, 7232: 5966, 5186: 5979,
+        5188: 5979, 1094: 6090, 3144: 6024, 4620: 5990,
+        1098: 6089, 1100: 6089, 3152: 6024, 1106: 6088,
+        1108: 6088, 1112: 6088, 3168: 6024, 5648: 5976,
+        1122: 6087, 1124: 6087, 1128: 6087, 2578: 6034,
+        1136: 6087, 4628: 5989, 7296: 5966, 5312: 5978,
+        3202: 6023, 5252: 5978, 1158: 6085, 3208: 6023,
+        1162: 6084, 1164: 6084, 4290: 6000, 3216: 6023,
+        2584: 6034, 1170: 6083, 1172: 6083, 1176: 6083,
+        4292: 6000, 3232: 6023, 1186: 6082, 1188: 6082,
+        1192: 6082, 1200: 6082, 2248: 6045, 3264: 6023,
+        5664: 5976, 1218: 6081, 1220: 6081, 1224: 6081,
+        4642: 5988, 1232: 6081, 4644: 5988, 1248: 6081,
+        4304: 6000, 2600: 6033, 7424: 5966, 4992: 5985,
+        5378: 5977, 5380: 5977, 1286: 6079, 3336: 6022,
+        1290: 6078, 1292: 6078, 3344: 6022, 1298: 6077,
+        1300: 6077, 1304: 6077, 3360: 6022, 4656: 5988,
+        1314: 6076, 1316: 6076, 1320: 6076, 1328: 6076,
+        3392: 6022, 4320: 6000, 1346: 6075, 1348: 6075,
+        1352: 6075, 1360: 6075, 1376: 6075, 3456: 6022,
+        5696: 5976, 1410: 6074, 1412: 6074, 1416: 6074,
+        4674: 5987, 1424: 6074, 4676: 5987, 1440: 6074,
+        4680: 5987, 1472: 6074, 4688: 5987, 7680: 5966,
+        3586: 6021, 3588: 6021, 1542: 6072, 3592: 6021,
+        1546: 6071, 1548: 6071, 3330: 6022, 3600: 6021,
+        1554: 6070, 1556: 6070, 1560: 6070, 3332: 6022,
+        3616: 6021, 1570: 6069, 1572: 6069, 4358: 5998,
+        1576: 6069, 1584: 6069, 5384: 5977, 2314: 6042,
+        3648: 6021, 4704: 5987, 1602: 6068, 1604: 6068,
+        1608: 6068, 4364: 5997, 1616: 6068, 1632: 6068,
+        5392: 5977, 4370: 5996, 2324: 6041, 3712: 6021,
+        1666: 6067, 1668: 6067, 1672: 6067, 1680: 6067,
+        2328: 6041, 1696: 6067, 1728: 6067, 5408: 5977,
+        4386: 5995, 4388: 5995, 4392: 5995, 3840: 6021,
+        5760: 5976, 1794: 6066, 1796: 6066, 1800: 6066,
+        4738: 5986, 1808: 6066, 4740: 5986, 1824: 6066,
+        4400: 5995, 4744: 5986, 1856: 6066, 4752: 5986,
+        1920: 6066, 5440: 5977, 4418: 5994, 4420: 5994,
+        4424: 5994, 4768: 5986, 4432: 5994 },
+        2: { 6149: 5754, 6153: 5753, 6156: 5753, 4109: 1609,
+        6161: 5752, 6164: 5752, 2069: 5841, 6168: 5752,
+        4121: 5795, 2076: 5840, 29: 1608, 3077: 5808,
+        6177: 5751, 6180: 5751, 4133: 5793, 6184: 5751,
+        2089: 5837, 2092: 5837, 45: 5959, 6192: 5751,
+        2097: 5836, 2100: 5836, 53: 5957, 3081: 5807,
+        2104: 5836, 57: 5956, 60: 1607, 6209: 5750,
+        6212: 5750, 4165: 5789, 6216: 5750, 4169: 5788,
+        2124: 5833, 77: 5953, 2061: 5843, 6224: 5750,
+        4177: 5787, 2132: 5832, 85: 5951, 4184: 5787,
+        89: 5950, 92: 5950, 6240: 5750, 2145: 5831,
+        2148: 5831, 101: 5948, 5137: 5761, 2152: 5831,
+        105: 5947, 108: 5947, 2160: 5831, 113: 5946,
+        116: 5946, 5664: 5756, 120: 5946, 5140: 5761,
+        4117: 5796, 6273: 5749, 6276: 5749, 4229: 5784,
+        6280: 5749, 2185: 5828, 2188: 5828, 141: 5943,
+        6288: 5749, 2193: 5827, 2196: 5827, 149: 5941,
+        2073: 5840, 2200: 5827, 153: 5940, 156: 5940,
+        6304: 5749, 4257: 5781, 2212: 5826, 165: 5938,
+        4264: 5781, 169: 5937, 172: 5937, 2224: 5826,
+        177: 5936, 180: 5936, 184: 5936, 6336: 5749,
+        2241: 5825, 2244: 5825, 197: 5934, 3105: 5805,
+        2248: 5825, 201: 5933, 204: 5933, 2256: 5825,
+        209: 5932, 212: 5932, 216: 5932, 5156: 5760,
+        2085: 5838, 2272: 5825, 225: 5931, 228: 5931,
+        232: 5931, 240: 5931, 3112: 5805, 4137: 5792,
+        6401: 5748, 6404: 5748, 2309: 5823, 4481: 5773,
+        6408: 5748, 4361: 5777, 2316: 5822, 269: 5928,
+        6416: 5748, 2321: 5821, 2324: 5821, 277: 5926,
+        4376: 5776, 281: 5925, 284: 5925, 6432: 5748,
+        4385: 5775, 2340: 5820, 293: 5923, 4145: 5791,
+        4392: 5775, 297: 5922, 300: 5922, 2352: 5820,
+        305: 5921, 308: 5921, 312: 5921, 4148: 5791,
+        6464: 5748, 4417: 5774, 2372: 5819, 325: 5919,
+        2376: 5819, 329: 5918, 332: 5918, 2384: 5819,
+        4152: 5791, 4512: 5773, 340: 5917, 344: 5917,
+        2400: 5819, 353: 5916, 356: 5916, 360: 5916,
+        4544: 5773, 368: 5916, 6528: 5748, 2433: 5818,
+        4484: 5773, 389: 5914, 5185: 5759, 4241: 5782,
+        393: 5913, 396: 5913, 2448: 5818, 401: 5912,
+        404: 5912, 408: 5912, 3140: 5804, 2117: 5834,
+        2464: 5818, 417: 5911, 4992: 5765, 420: 5911,
+        424: 5911, 432: 5911, 5192: 5759, 2121: 5833,
+        2496: 5818, 449: 5910, 452: 5910, 456: 5910,
+        4172: 5788, 3084: 5807, 464: 5910, 4448: 5774,
+        480: 5910, 5200: 5759, 2129: 5832, 4180: 5787,
+        6657: 5747, 6660: 5747, 4613: 5771, 4865: 5765,
+        6664: 5747, 2569: 5815, 2572: 5815, 525: 5907,
+        6672: 5747, 2577: 5814, 2580: 5814, 533: 5905,
+        2584: 5814, 537: 5904, 540: 5904, 6688: 5747,
+        4641: 5768, 2596: 5813, 549: 5902, 4648: 5768,
+        553: 5901, 556: 5901, 2608: 5813, 561: 5900,
+        564: 5900, 4656: 5768, 568: 5900, 6720: 5747,
+        4673: 5767, 2628: 5812, 581: 5898, 4193: 5786,
+        2632: 5812, 585: 5897, 588: 5897, 2640: 5812,
+        593: 5896, 596: 5896, 600: 5896, 4196: 5786,
+        2656: 5812, 609: 5895, 612: 5895, 616: 5895,
+        624: 5895, 4200: 5786, 6784: 5747, 2689: 5811,
+        4740: 5766, 645: 5893, 2696: 5811, 649: 5892,
+        652: 5892, 2704: 5811, 657: 5891, 660: 5891,
+        2136: 5832, 2720: 5811, 673: 5890, 676: 5890,
+        4928: 5765, 680: 5890, 688: 5890, 5888: 5756,
+        2752: 5811, 705: 5889, 708: 5889, 712: 5889,
+        4320: 5780, 720: 5889, 736: 5889, 6912: 5747,
+        2817: 5810, 2820: 5810, 773: 5887, 5249: 5758,
+        2824: 5810, 777: 5886, 780: 5886, 2832: 5810,
+        785: 5885, 788: 5885, 4868: 5765, 792: 5885,
+        3204: 5803, 4800: 5766, 2181: 5829, 2848: 5810,
+        801: 5884, 804: 5884, 808: 5884, 816: 5884,
+        5256: 5758, 4233: 5783, 2880: 5810, 833: 5883,
+        836: 5883, 840: 5883, 4236: 5783, 848: 5883,
+        864: 5883, 5264: 5758, 1169: 5863, 5144: 5761,
+        4244: 5782, 2944: 5810, 897: 5882, 900: 5882,
+        904: 5882, 4872: 5765, 912: 5882, 4248: 5782,
+        928: 5882, 5760: 5756, 960: 5882, 5280: 5758,
+        2209: 5826, 4124: 5795, 4260: 5781, 5216: 5759,
+        2216: 5826, 7169: 5746, 7172: 5746, 5125: 5763,
+        5633: 5756, 7176: 5746, 5129: 5762, 5132: 5762,
+        1037: 5879, 7184: 5746, 3089: 5806, 3092: 5806,
+        1045: 5877, 3096: 5806, 1049: 5876, 1052: 5876,
+        2565: 5816, 7200: 5746, 5153: 5760, 3108: 5805,
+        1061: 5874, 5160: 5760, 1065: 5873, 1068: 5873,
+        3120: 5805, 1073: 5872, 1076: 5872, 4617: 5770,
+        1080: 5872, 7232: 5746, 3137: 5804, 5188: 5759,
+        1093: 5870, 3144: 5804, 1097: 5869, 1100: 5869,
+        3152: 5804, 1105: 5868, 1108: 5868, 1112: 5868,
+        3168: 5804, 1121: 5867, 1124: 5867, 4625: 5769,
+        1128: 5867, 1136: 5867, 4628: 5769, 4880: 5765,
+        7296: 5746, 3201: 5803, 5252: 5758, 1157: 5865,
+        4289: 5780, 3208: 5803, 1161: 5864, 1164: 5864,
+        3216: 5803, 4632: 5769, 1172: 5863, 1176: 5863,
+        4292: 5780, 3232: 5803, 1185: 5862, 1188: 5862,
+        1192: 5862, 1200: 5862, 4296: 5780, 3264: 5803,
+        1217: 5861, 1220: 5861, 2593: 5813, 1224: 5861,
+        1232: 5861, 4644: 5768, 1248: 5861, 4304: 5780,
+        2600: 5813, 7424: 5746, 5377: 5757, 3332: 5802,
+        1285: 5859, 3336: 5802, 1289: 5858, 1292: 5858,
+        3344: 5802, 1297: 5857, 1300: 5857, 1304: 5857,
+        5696: 5756, 3360: 5802, 1313: 5856, 1316: 5856,
+        1320: 5856, 4272: 5781, 5636: 5756, 1328: 5856,
+        3392: 5802, 1345: 5855, 1348: 5855, 1352: 5855,
+        1360: 5855, 1376: 5855, 3456: 5802, 1409: 5854,
+        1412: 5854, 2625: 5812, 1416: 5854, 1424: 5854,
+        4676: 5767, 1440: 5854, 5640: 5756, 4208: 5786,
+        4140: 5792, 4680: 5767, 5504: 5757, 1472: 5854,
+        2436: 5818, 4688: 5767, 4620: 5770, 7680: 5746,
+        3585: 5801, 3588: 5801, 1541: 5852, 3329: 5802,
+        3592: 5801, 1545: 5851, 1548: 5851, 3600: 5801,
+        1553: 5850, 1556: 5850, 1560: 5850, 5380: 5757,
+        4357: 5778, 3616: 5801, 1569: 5849, 1572: 5849,
+        1576: 5849, 1584: 5849, 5384: 5757, 2313: 5822,
+        3648: 5801, 1601: 5848, 2440: 5818, 1604: 5848,
+        5168: 5760, 1608: 5848, 4364: 5777, 1616: 5848,
+        4896: 5765, 1632: 5848, 5392: 5757, 4369: 5776,
+        4372: 5776, 3712: 5801, 1665: 5847, 4488: 5773,
+        1668: 5847, 1672: 5847, 1680: 5847, 2328: 5821,
+        5648: 5756, 1696: 5847, 1728: 5847, 5408: 5757,
+        2337: 5820, 4388: 5775, 2344: 5820, 3840: 5801,
+        1793: 5846, 1796: 5846, 4737: 5766, 1800: 5846,
+        1808: 5846, 2692: 5811, 1824: 5846, 4400: 5775,
+        5312: 5758, 4744: 5766, 1856: 5846, 4752: 5766,
+        4496: 5773, 1920: 5846, 5440: 5757, 2369: 5819,
+        664: 5891, 4420: 5774, 4424: 5774, 4768: 5766,
+        4704: 5767, 4432: 5774, 337: 5917 },
+        3: { 384: 3319, 320: 3319, 132: 3320, 260: 3319,
+        520: 3318, 2080: 3316, 264: 3319, 4224: 3315,
+        3072: 3316, 12: 3324, 4352: 3315, 144: 3320,
+        20: 3323, 1032: 3317, 768: 3318, 24: 3323,
+        516: 3318, 640: 3318, 1028: 3317, 1040: 3317,
+        36: 3322, 2064: 3316, 40: 3322, 1152: 3317,
+        4160: 3315, 1280: 3317, 48: 3322, 2056: 3316,
+        1536: 3317, 288: 3319, 2052: 3316, 192: 3320,
+        160: 3320, 68: 3321, 6144: 3315, 4128: 3315,
+        72: 3321, 1088: 3317, 2304: 3316, 528: 3318,
+        80: 3321, 5120: 3315, 2560: 3316, 544: 3318,
+        96: 3321, 272: 3319, 4112: 3315, 1056: 3317,
+        2112: 3316, 4608: 3315, 2176: 3316, 4104: 3315,
+        576: 3318, 136: 3320, 4100: 3315 },
+        4: { 6147: 5534, 6153: 5533, 6154: 5533, 2059: 5623,
+        6161: 5532, 6162: 5532, 2067: 5621, 6168: 5532,
+        2073: 5620, 2074: 5620, 27: 1608, 6177: 5531,
+        6178: 5531, 4131: 5573, 6184: 5531, 4137: 5572,
+        2090: 5617, 43: 5739, 4992: 5545, 6192: 5531,
+        2097: 5616, 2098: 5616, 51: 5737, 3081: 5587,
+        2104: 5616, 57: 5736, 58: 1607, 3082: 5587,
+        6209: 5530, 6210: 5530, 4163: 5569, 6216: 5530,
+        4169: 5568, 4170: 5568, 75: 5733, 6224: 5530,
+        4177: 5567, 4178: 5567, 83: 5731, 2136: 5612,
+        89: 5730, 90: 5730, 6240: 5530, 2145: 5611,
+        4194: 5566, 99: 5728, 5137: 5541, 2152: 5611,
+        105: 5727, 106: 5727, 5138: 5541, 2160: 5611,
+        113: 5726, 114: 5726, 4115: 5576, 5664: 5536,
+        120: 1606, 6273: 5529, 6274: 5529, 2179: 5609,
+        6280: 5529, 2185: 5608, 2186: 5608, 139: 5723,
+        4488: 5553, 6288: 5529, 5144: 5541, 2194: 5607,
+        147: 5721, 4121: 5575, 2200: 5607, 153: 5720,
+        154: 5720, 4122: 5575, 6304: 5529, 2209: 5606,
+        2210: 5606, 163: 5718, 4264: 5561, 169: 5717,
+        170: 5717, 2224: 5606, 177: 5716, 178: 5716,
+        184: 5716, 3075: 5588, 2241: 5605, 4290: 5560,
+        195: 5714, 3105: 5585, 2248: 5605, 201: 5713,
+        202: 5713, 3106: 5585, 2256: 5605, 209: 5712,
+        210: 5712, 2083: 5618, 216: 5712, 2272: 5605,
+        225: 5711, 226: 5711, 232: 5711, 240: 5711,
+        5160: 5540, 2089: 5617, 4138: 5572, 6401: 5528,
+        6402: 5528, 2307: 5603, 4481: 5553, 6408: 5528,
+        4361: 5557, 2314: 5602, 267: 5708, 2434: 5598,
+        6416: 5528, 2321: 5601, 2322: 5601, 275: 5706,
+        4376: 5556, 281: 5705, 282: 5705, 6432: 5528,
+        2337: 5600, 2338: 5600, 291: 5703, 4145: 5571,
+        2344: 5600, 297: 5702, 298: 5702, 4146: 5571,
+        2352: 5600, 305: 5701, 306: 5701, 312: 5701,
+        6464: 5528, 4417: 5554, 2370: 5599, 323: 5699,
+        2376: 5599, 329: 5698, 330: 5698, 2384: 5599,
+        4152: 5571, 338: 5697, 4512: 5553, 344: 5697,
+        2400: 5599, 353: 5696, 354: 5696, 360: 5696,
+        368: 5696, 6528: 5528, 2433: 5598, 4482: 5553,
+        387: 5694, 5185: 5539, 4241: 5562, 393: 5693,
+        394: 5693, 5186: 5539, 2448: 5598, 401: 5692,
+        402: 5692, 2115: 5614, 408: 5692, 2464: 5598,
+        417: 5691, 418: 5691, 424: 5691, 432: 5691,
+        5192: 5539, 2121: 5613, 2122: 5613, 2496: 5598,
+        449: 5690, 450: 5690, 456: 5690, 4107: 1609,
+        4448: 5554, 480: 5690, 5200: 5539, 2129: 5612,
+        2130: 5612, 6657: 5527, 6658: 5527, 2563: 5596,
+        4865: 5545, 6664: 5527, 2569: 5595, 2570: 5595,
+        523: 5687, 4866: 5545, 6672: 5527, 2577: 5594,
+        4626: 5549, 531: 5685, 4632: 5549, 537: 5684,
+        538: 5684, 6688: 5527, 2593: 5593, 2594: 5593,
+        547: 5682, 4648: 5548, 553: 5681, 554: 5681,
+        2608: 5593, 561: 5680, 562: 5680, 4656: 5548,
+        568: 5680, 6720: 5527, 4673: 5547, 2626: 5592,
+        579: 5678, 4193: 5566, 2632: 5592, 585: 5677,
+        586: 5677, 2146: 5611, 2640: 5592, 593: 5676,
+        594: 5676, 600: 5676, 2656: 5592, 609: 5675,
+        610: 5675, 616: 5675, 624: 5675, 4200: 5566,
+        6784: 5527, 2689: 5591, 4738: 5546, 643: 5673,
+        2696: 5591, 649: 5672, 650: 5672, 2704: 5591,
+        657: 5671, 658: 5671, 664: 5671, 2720: 5591,
+        673: 5670, 674: 5670, 4928: 5545, 680: 5670,
+        688: 5670, 5888: 5536, 2752: 5591, 705: 5669,
+        706: 5669, 712: 5669, 4320: 5560, 720: 5669,
+        4184: 5567, 736: 5669, 464: 5690, 6912: 5527,
+        2817: 5590, 2818: 5590, 771: 5667, 5249: 5538,
+        2824: 5590, 777: 5666, 778: 5666, 5250: 5538,
+        2832: 5590, 785: 5665, 786: 5665, 4227: 5564,
+        792: 5665, 4800: 5546, 2848: 5590, 801: 5664,
+        802: 5664, 808: 5664, 816: 5664, 5256: 5538,
+        4233: 5563, 4234: 5563, 2880: 5590, 833: 5663,
+        834: 5663, 840: 5663, 848: 5663, 864: 5663,
+        5264: 5538, 2193: 5607, 4242: 5562, 2944: 5590,
+        897: 5662, 898: 5662, 904: 5662, 4872: 5545,
+        912: 5662, 4248: 5562, 928: 5662, 5760: 5536,
+        960: 5662, 5280: 5538, 4257: 5561, 4258: 5561,
+        5216: 5539, 2216: 5606, 7169: 5526, 7170: 5526,
+        5123: 5543, 5633: 5536, 7176: 5526, 5129: 5542,
+        5130: 5542, 1035: 5659, 3586: 5581, 7184: 5526,
+        3089: 5586, 3090: 5586, 1043: 5657, 3096: 5586,
+        1049: 5656, 1050: 5656, 7200: 5526, 5153: 5540,
+        5154: 5540, 1059: 5654, 3112: 5585, 1065: 5653,
+        1066: 5653, 3120: 5585, 1073: 5652, 1074: 5652,
+        4617: 5550, 1080: 5652, 4618: 5550, 7232: 5526,
+        3137: 5584, 3138: 5584, 1091: 5650, 3144: 5584,
+        1097: 5649, 1098: 5649, 3152: 5584, 1105: 5648,
+        1106: 5648, 1112: 5648, 3168: 5584, 1121: 5647,
+        1122: 5647, 4625: 5549, 1128: 5647, 2578: 5594,
+        1136: 5647, 4880: 5545, 7296: 5526, 3201: 5583,
+        3202: 5583, 1155: 5645, 4289: 5560, 3208: 5583,
+        1161: 5644, 1162: 5644, 2242: 5605, 3216: 5583,
+        2584: 5594, 1170: 5643, 1176: 5643, 3232: 5583,
+        1185: 5642, 1186: 5642, 1192: 5642, 1200: 5642,
+        4296: 5560, 3264: 5583, 1217: 5641, 1218: 5641,
+        4641: 5548, 1224: 5641, 4642: 5548, 1232: 5641,
+        1248: 5641, 4304: 5560, 4611: 5551, 2600: 5593,
+        7424: 5526, 3329: 5582, 5378: 5537, 1283: 5639,
+        3336: 5582, 1289: 5638, 1290: 5638, 3344: 5582,
+        1297: 5637, 1298: 5637, 4544: 5553, 1304: 5637,
+        5696: 5536, 3360: 5582, 1313: 5636, 1314: 5636,
+        1320: 5636, 4272: 5561, 1328: 5636, 3392: 5582,
+        1345: 5635, 1346: 5635, 1352: 5635, 1360: 5635,
+        1376: 5635, 3456: 5582, 1409: 5634, 1410: 5634,
+        2625: 5592, 1416: 5634, 4674: 5547, 1424: 5634,
+        1440: 5634, 5640: 5536, 4208: 5566, 4680: 5547,
+        5504: 5537, 1472: 5634, 1169: 5643, 4688: 5547,
+        7680: 5526, 3585: 5581, 5634: 5536, 1539: 5632,
+        5377: 5537, 3592: 5581, 1545: 5631, 1546: 5631,
+        3330: 5582, 3600: 5581, 1553: 5630, 1554: 5630,
+        4355: 5558, 1560: 5630, 3616: 5581, 1569: 5629,
+        1570: 5629, 1576: 5629, 1584: 5629, 5384: 5537,
+        2313: 5602, 4362: 5557, 3648: 5581, 1601: 5628,
+        1602: 5628, 5168: 5540, 1608: 5628, 1616: 5628,
+        4896: 5545, 1632: 5628, 5392: 5537, 4369: 5556,
+        4370: 5556, 3712: 5581, 1665: 5627, 1666: 5627,
+        1672: 5627, 1680: 5627, 2328: 5601, 5648: 5536,
+        1696: 5627, 1728: 5627, 5408: 5537, 4385: 5555,
+        4386: 5555, 4392: 5555, 3840: 5581, 1793: 5626,
+        1794: 5626, 4737: 5546, 1800: 5626, 2690: 5591,
+        1808: 5626, 1824: 5626, 4400: 5555, 5312: 5538,
+        4744: 5546, 1856: 5626, 6336: 5529, 2440: 5598,
+        4752: 5546, 4496: 5553, 1920: 5626, 5440: 5537,
+        2369: 5599, 4418: 5554, 4424: 5554, 4768: 5546,
+        4704: 5547, 4432: 5554, 337: 5697 },
+        5: { 384: 3308, 320: 3308, 258: 3308, 520: 3307,
+        2080: 3305, 4104: 3304, 10: 3313, 3072: 3305,
+        288: 3308, 130: 3309, 4352: 3304, 144: 3309,
+        18: 3312, 4608: 3304, 24: 3312, 640: 3307,
+        768: 3307, 1040: 3306, 34: 3311, 2064: 3305,
+        40: 3311, 1152: 3306, 4160: 3304, 1280: 3306,
+        48: 3311, 1032: 3306, 2056: 3305, 4224: 3304,
+        192: 3309, 160: 3309, 66: 3310, 5120: 3304,
+        6144: 3304, 4128: 3304, 72: 3310, 1088: 3306,
+        2050: 3305, 2304: 3305, 4098: 3304, 80: 3310,
+        1536: 3306, 514: 3307, 2560: 3305, 544: 3307,
+        96: 3310, 272: 3308, 1026: 3306, 4112: 3304,
+        1056: 3306, 2112: 3305, 2176: 3305, 528: 3307,
+        576: 3307, 136: 3309, 264: 3308 },
+        6: { 384: 3297, 129: 3298, 3072: 3294, 520: 3296,
+        1025: 3295, 264: 3297, 9: 3302, 4224: 3293,
+        288: 3297, 4352: 3293, 144: 3298, 17: 3301,
+        1032: 3295, 24: 3301, 640: 3296, 768: 3296,
+        1040: 3295, 33: 3300, 4097: 3293, 2064: 3294,
+        40: 3300, 1152: 3295, 257: 3297, 4160: 3293,
+        1280: 3295, 48: 3300, 2056: 3294, 513: 3296,
+        1536: 3295, 2080: 3294, 192: 3298, 65: 3299,
+        5120: 3293, 6144: 3293, 4128: 3293, 72: 3299,
+        1088: 3295, 160: 3298, 2304: 3294, 528: 3296,
+        80: 3299, 320: 3297, 2560: 3294, 544: 3296,
+        96: 3299, 272: 3297, 2049: 3294, 4112: 3293,
+        1056: 3295, 2112: 3294, 4608: 3293, 2176: 3294,
+        4104: 3293, 576: 3296, 136: 3298 },
+        257: { 640: 3010, 576: 3010, 2050: 3008, 4100: 3007,
+        6: 3016, 2080: 3008, 136: 3011, 10: 3015,
+        132: 3011, 12: 3015, 1026: 3009, 144: 3011,
+        18: 3014, 20: 3014, 1032: 3009, 24: 3014,
+        516: 3010, 1028: 3009, 1040: 3009, 34: 3013,
+        36: 3013, 2064: 3008, 40: 3013, 1152: 3009,
+        4160: 3007, 48: 3013, 520: 3010, 2056: 3008,
+        4224: 3007, 3072: 3008, 2052: 3008, 192: 3011,
+        160: 3011, 66: 3012, 68: 3012, 130: 3011,
+        4128: 3007, 72: 3012, 1088: 3009, 4098: 3007,
+        80: 3012, 1536: 3009, 514: 3010, 5120: 3007,
+        2560: 3008, 544: 3010, 96: 3012, 528: 3010,
+        6144: 3007, 4112: 3007, 1056: 3009, 2112: 3008,
+        4608: 3007, 2176: 3008, 4104: 3007 },
+        8: { 6147: 5314, 6149: 5313, 6150: 5313, 2055: 5403,
+        6161: 5312, 6162: 5312, 2067: 5401, 6164: 5312,
+        2069: 5400, 2070: 5400, 23: 1608, 5125: 5322,
+        6177: 5311, 6178: 5311, 4131: 5353, 6180: 5311,
+        2085: 5397, 2086: 5397, 39: 5519, 1031: 5439,
+        4992: 5325, 6192: 5311, 2097: 5396, 2098: 5396,
+        51: 5517, 2100: 5396, 53: 5516, 54: 1607,
+        6209: 5310, 6210: 5310, 4163: 5349, 6212: 5310,
+        4165: 5348, 2118: 5393, 71: 5513, 6224: 5310,
+        4177: 5347, 4178: 5347, 83: 5511, 2132: 5392,
+        85: 5510, 86: 5510, 6240: 5310, 2145: 5391,
+        4194: 5346, 99: 5508, 2148: 5391, 101: 5507,
+        102: 5507, 5137: 5321, 5138: 5321, 2160: 5391,
+        113: 5506, 114: 5506, 4115: 5356, 116: 1606,
+        5664: 5316, 5140: 5321, 4117: 5355, 6273: 5309,
+        6274: 5309, 2179: 5389, 6276: 5309, 4229: 5343,
+        4230: 5343, 135: 5503, 6288: 5309, 2193: 5387,
+        2194: 5387, 147: 5501, 2196: 5387, 149: 5500,
+        150: 5500, 6304: 5309, 2209: 5386, 2210: 5386,
+        163: 5498, 2212: 5386, 165: 5497, 166: 5497,
+        2224: 5386, 177: 5496, 178: 5496, 180: 5496,
+        3075: 5368, 2241: 5385, 4290: 5340, 195: 5494,
+        2244: 5385, 197: 5493, 198: 5493, 3105: 5365,
+        3106: 5365, 2256: 5385, 209: 5492, 210: 5492,
+        2083: 5398, 212: 5492, 3108: 5365, 4133: 5352,
+        2272: 5385, 225: 5491, 226: 5491, 228: 5491,
+        4134: 5352, 240: 1605, 6401: 5308, 6402: 5308,
+        2307: 5383, 6404: 5308, 2309: 5382, 2310: 5382,
+        263: 5488, 2434: 5378, 6416: 5308, 2321: 5381,
+        2322: 5381, 275: 5486, 4372: 5336, 277: 5485,
+        278: 5485, 4484: 5333, 6432: 5308, 4385: 5335,
+        2338: 5380, 291: 5483, 2340: 5380, 293: 5482,
+        294: 5482, 4145: 5351, 4146: 5351, 2352: 5380,
+        305: 5481, 306: 5481, 308: 5481, 4148: 5351,
+        6464: 5308, 4417: 5334, 2370: 5379, 323: 5479,
+        2372: 5379, 325: 5478, 326: 5478, 2384: 5379,
+        337: 5477, 338: 5477, 4512: 5333, 340: 5477,
+        4103: 1609, 5126: 5322, 2400: 5379, 353: 5476,
+        354: 5476, 356: 5476, 4544: 5333, 368: 5476,
+        6528: 5308, 4481: 5333, 4482: 5333, 387: 5474,
+        2436: 5378, 389: 5473, 390: 5473, 5185: 5319,
+        5186: 5319, 2448: 5378, 401: 5472, 402: 5472,
+        2115: 5394, 404: 5472, 5188: 5319, 2117: 5393,
+        2464: 5378, 417: 5471, 418: 5471, 420: 5471,
+        4166: 5348, 432: 5471, 2496: 5378, 449: 5470,
+        450: 5470, 452: 5470, 464: 5470, 4448: 5334,
+        480: 5470, 5200: 5319, 2129: 5392, 2130: 5392,
+        4180: 5347, 6657: 5307, 6658: 5307, 2563: 5376,
+        6660: 5307, 4613: 5330, 2566: 5375, 519: 5467,
+        4866: 5325, 6672: 5307, 2577: 5374, 2578: 5374,
+        531: 5465, 2580: 5374, 533: 5464, 534: 5464,
+        4868: 5325, 6688: 5307, 4641: 5328, 2594: 5373,
+        547: 5462, 2596: 5373, 549: 5461, 550: 5461,
+        2608: 5373, 561: 5460, 562: 5460, 564: 5460,
+        4656: 5328, 6720: 5307, 4673: 5327, 2626: 5372,
+        579: 5458, 2628: 5372, 581: 5457, 582: 5457,
+        4193: 5346, 2146: 5391, 2640: 5372, 593: 5456,
+        594: 5456, 596: 5456, 4196: 5346, 2656: 5372,
+        609: 5455, 610: 5455, 612: 5455, 624: 5455,
+        6784: 5307, 2689: 5371, 4738: 5326, 643: 5453,
+        2692: 5371, 645: 5452, 646: 5452, 2704: 5371,
+        657: 5451, 658: 5451, 660: 5451, 2720: 5371,
+        673: 5450, 674: 5450, 676: 5450, 4928: 5325,
+        688: 5450, 4865: 5325, 5888: 5316, 2752: 5371,
+        705: 5449, 706: 5449, 708: 5449, 4320: 5340,
+        720: 5449, 736: 5449, 6912: 5307, 2817: 5370,
+        2818: 5370, 771: 5447, 2820: 5370, 773: 5446,
+        774: 5446, 5249: 5318, 5250: 5318, 2832: 5370,
+        785: 5445, 786: 5445, 4227: 5344, 788: 5445,
+        5252: 5318, 4118: 5355, 4800: 5326, 2181: 5388,
+        2848: 5370, 801: 5444, 802: 5444, 804: 5444,
+        2182: 5388, 816: 5444, 2880: 5370, 833: 5443,
+        834: 5443, 836: 5443, 848: 5443, 864: 5443,
+        5264: 5318, 4241: 5342, 4242: 5342, 4244: 5342,
+        2944: 5370, 897: 5442, 898: 5442, 900: 5442,
+        912: 5442, 928: 5442, 5760: 5316, 960: 5442,
+        5280: 5318, 4257: 5341, 4258: 5341, 4260: 5341,
+        5216: 5319, 7169: 5306, 7170: 5306, 5123: 5323,
+        7172: 5306, 3077: 5367, 3078: 5367, 5633: 5316,
+        3586: 5361, 7184: 5306, 3089: 5366, 3090: 5366,
+        1043: 5437, 3092: 5366, 1045: 5436, 1046: 5436,
+        5636: 5316, 2565: 5375, 7200: 5306, 5153: 5320,
+        5154: 5320, 1059: 5434, 5156: 5320, 1061: 5433,
+        1062: 5433, 3120: 5365, 1073: 5432, 1074: 5432,
+        1076: 5432, 5696: 5316, 7232: 5306, 3137: 5364,
+        3138: 5364, 1091: 5430, 3140: 5364, 1093: 5429,
+        1094: 5429, 3152: 5364, 1105: 5428, 1106: 5428,
+        1108: 5428, 3168: 5364, 1121: 5427, 1122: 5427,
+        1124: 5427, 4625: 5329, 4626: 5329, 1136: 5427,
+        4628: 5329, 4880: 5325, 7296: 5306, 3201: 5363,
+        3202: 5363, 1155: 5425, 3204: 5363, 1157: 5424,
+        1158: 5424, 4289: 5340, 2242: 5385, 3216: 5363,
+        1169: 5423, 1170: 5423, 1172: 5423, 4292: 5340,
+        3232: 5363, 1185: 5422, 1186: 5422, 1188: 5422,
+        1200: 5422, 3264: 5363, 1217: 5421, 1218: 5421,
+        1220: 5421, 2593: 5373, 4642: 5328, 1232: 5421,
+        4644: 5328, 1248: 5421, 4304: 5340, 4611: 5331,
+        7424: 5306, 5377: 5317, 5378: 5317, 1283: 5419,
+        3332: 5362, 1285: 5418, 1286: 5418, 3344: 5362,
+        1297: 5417, 1298: 5417, 1300: 5417, 3360: 5362,
+        1313: 5416, 1314: 5416, 1316: 5416, 4272: 5341,
+        1328: 5416, 3392: 5362, 1345: 5415, 1346: 5415,
+        1348: 5415, 4614: 5330, 1360: 5415, 1376: 5415,
+        2433: 5378, 3456: 5362, 1409: 5414, 1410: 5414,
+        1412: 5414, 2625: 5372, 4674: 5327, 1424: 5414,
+        4676: 5327, 1440: 5414, 4208: 5346, 5504: 5317,
+        1472: 5414, 4688: 5327, 7680: 5306, 3585: 5361,
+        5634: 5316, 1539: 5412, 3588: 5361, 1541: 5411,
+        1542: 5411, 3329: 5362, 3330: 5362, 3600: 5361,
+        1553: 5410, 1554: 5410, 4355: 5338, 1556: 5410,
+        5380: 5317, 4357: 5337, 3616: 5361, 1569: 5409,
+        1570: 5409, 1572: 5409, 4358: 5337, 1584: 5409,
+        3648: 5361, 1601: 5408, 1602: 5408, 1604: 5408,
+        5168: 5320, 1616: 5408, 4896: 5325, 1632: 5408,
+        5392: 5317, 4369: 5336, 4370: 5336, 2324: 5381,
+        3712: 5361, 1665: 5407, 1666: 5407, 1668: 5407,
+        1680: 5407, 5648: 5316, 1696: 5407, 1728: 5407,
+        5408: 5317, 2337: 5380, 4386: 5335, 4388: 5335,
+        3840: 5361, 1793: 5406, 1794: 5406, 1796: 5406,
+        4737: 5326, 2690: 5371, 1808: 5406, 4740: 5326,
+        1824: 5406, 4400: 5335, 5312: 5318, 1856: 5406,
+        6336: 5309, 4752: 5326, 4496: 5333, 1920: 5406,
+        5440: 5317, 2369: 5379, 4418: 5334, 4420: 5334,
+        4768: 5326, 4704: 5327, 4432: 5334 },
+        9: { 384: 3286, 320: 3286, 258: 3286, 4100: 3282,
+        6: 3291, 2080: 3283, 4160: 3282, 4224: 3282,
+        132: 3287, 288: 3286, 2050: 3283, 4352: 3282,
+        144: 3287, 18: 3290, 20: 3290, 4608: 3282,
+        768: 3285, 576: 3285, 516: 3285, 640: 3285,
+        1028: 3284, 260: 3286, 1040: 3284, 34: 3289,
+        36: 3289, 2064: 3283, 1088: 3284, 1152: 3284,
+        1280: 3284, 48: 3289, 1536: 3284, 3072: 3283,
+        2052: 3283, 192: 3287, 160: 3287, 66: 3288,
+        68: 3288, 130: 3287, 4128: 3282, 2112: 3283,
+        2176: 3283, 2304: 3283, 4098: 3282, 80: 3288,
+        514: 3285, 5120: 3282, 2560: 3283, 544: 3285,
+        96: 3288, 272: 3286, 1026: 3284, 6144: 3282,
+        4112: 3282, 1056: 3284, 528: 3285 },
+        10: { 384: 3275, 129: 3276, 3072: 3272, 132: 3276,
+        5: 3280, 260: 3275, 1025: 3273, 4160: 3271,
+        4224: 3271, 516: 3274, 144: 3276, 17: 3279,
+        20: 3279, 4608: 3271, 768: 3274, 576: 3274,
+        2052: 3272, 640: 3274, 1028: 3273, 1040: 3273,
+        33: 3278, 4097: 3271, 2064: 3272, 1088: 3273,
+        1152: 3273, 257: 3275, 1280: 3273, 48: 3278,
+        513: 3274, 1536: 3273, 2080: 3272, 192: 3276,
+        65: 3277, 68: 3277, 6144: 3271, 4128: 3271,
+        2112: 3272, 2176: 3272, 160: 3276, 2304: 3272,
+        288: 3275, 80: 3277, 320: 3275, 5120: 3271,
+        2560: 3272, 544: 3274, 36: 3278, 96: 3277,
+        272: 3275, 2049: 3272, 4112: 3271, 1056: 3273,
+        528: 3274, 4352: 3271, 4100: 3271 },
+        3072: { 384: 2602, 4097: 2600, 4098: 2600, 3: 2609,
+        132: 2603, 5: 2608, 6: 2608, 129: 2603,
+        136: 2603, 9: 2607, 10: 2607, 12: 2607,
+        258: 2602, 516: 2601, 144: 2603, 17: 2606,
+        18: 2606, 20: 2606, 4608: 2600, 24: 2606,
+        260: 2602, 640: 2601, 768: 2601, 520: 2601,
+        160: 2603, 33: 2605, 34: 2605, 36: 2605,
+        40: 2605, 257: 2602, 4160: 2600, 48: 2605,
+        264: 2602, 513: 2601, 4224: 2600, 288: 2602,
+        192: 2603, 65: 2604, 66: 2604, 68: 2604,
+        130: 2603, 4128: 2600, 72: 2604, 4352: 2600,
+        528: 2601, 80: 2604, 320: 2602, 514: 2601,
+        544: 2601, 96: 2604, 272: 2602, 4112: 2600,
+        4104: 2600, 576: 2601, 4100: 2600 },
+        12: { 384: 3264, 129: 3265, 258: 3264, 3: 3269,
+        1040: 3262, 1025: 3262, 4160: 3260, 4224: 3260,
+        3072: 3261, 288: 3264, 2050: 3261, 4352: 3260,
+        144: 3265, 17: 3268, 18: 3268, 4608: 3260,
+        576: 3263, 640: 3263, 768: 3263, 160: 3265,
+        33: 3267, 34: 3267, 4097: 3260, 2064: 3261,
+        1088: 3262, 1152: 3262, 257: 3264, 1280: 3262,
+        48: 3267, 513: 3263, 1536: 3262, 2080: 3261,
+        192: 3265, 65: 3266, 66: 3266, 5120: 3260,
+        130: 3265, 4128: 3260, 2112: 3261, 2176: 3261,
+        2304: 3261, 4098: 3260, 80: 3266, 320: 3264,
+        514: 3263, 2560: 3261, 544: 3263, 96: 3266,
+        272: 3264, 1026: 3262, 2049: 3261, 6144: 3260,
+        4112: 3260, 1056: 3262, 528: 3263 },
+        2050: { 384: 2702, 129: 2703, 132: 2703, 5: 2708,
+        260: 2702, 1025: 2700, 136: 2703, 9: 2707,
+        4224: 2699, 12: 2707, 4352: 2699, 144: 2703,
+        17: 2706, 20: 2706, 1032: 2700, 768: 2701,
+        24: 2706, 516: 2701, 640: 2701, 1028: 2700,
+        520: 2701, 1040: 2700, 33: 2705, 4097: 2699,
+        5120: 2699, 40: 2705, 1152: 2700, 257: 2702,
+        4160: 2699, 1280: 2700, 48: 2705, 264: 2702,
+        513: 2701, 1536: 2700, 288: 2702, 192: 2703,
+        65: 2704, 68: 2704, 4128: 2699, 72: 2704,
+        1088: 2700, 160: 2703, 528: 2701, 80: 2704,
+        320: 2702, 544: 2701, 36: 2705, 96: 2704,
+        272: 2702, 4112: 2699, 1056: 2700, 4608: 2699,
+        4104: 2699, 576: 2701, 4100: 2699 },
+        16: { 6147: 5094, 6149: 5093, 6150: 5093, 2055: 5183,
+        6153: 5092, 6154: 5092, 2059: 5181, 6156: 5092,
+        4109: 5135, 4110: 5135, 15: 1608, 3075: 5148,
+        5125: 5102, 6177: 5091, 6178: 5091, 4131: 5133,
+        6180: 5091, 2085: 5177, 2086: 5177, 39: 5299,
+        6184: 5091, 2089: 5176, 2090: 5176, 43: 5297,
+        2092: 5176, 45: 5296, 46: 1607, 4992: 5105,
+        5129: 5101, 5130: 5101, 6209: 5090, 6210: 5090,
+        4163: 5129, 6212: 5090, 4165: 5128, 2118: 5173,
+        71: 5293, 6216: 5090, 2121: 5172, 4170: 5127,
+        75: 5291, 4172: 5127, 77: 5290, 78: 5290,
+        1037: 5216, 2062: 5180, 6240: 5090, 2145: 5171,
+        4194: 5126, 99: 5288, 2148: 5171, 101: 5287,
+        102: 5287, 2152: 5171, 105: 5286, 106: 5286,
+        108: 1606, 5664: 5096, 6273: 5089, 6274: 5089,
+        2179: 5169, 6276: 5089, 4229: 5123, 4230: 5123,
+        135: 5283, 6280: 5089, 2185: 5167, 2186: 5167,
+        139: 5281, 4236: 5122, 141: 5280, 142: 5280,
+        6304: 5089, 2209: 5166, 2210: 5166, 163: 5278,
+        4260: 5121, 165: 5277, 166: 5277, 2216: 5166,
+        169: 5276, 170: 5276, 172: 5276, 6336: 5089,
+        2241: 5165, 4290: 5120, 195: 5274, 2244: 5165,
+        197: 5273, 198: 5273, 3105: 5145, 2248: 5165,
+        201: 5272, 202: 5272, 204: 5272, 3106: 5145,
+        2083: 5178, 5156: 5100, 4133: 5132, 2272: 5165,
+        225: 5271, 226: 5271, 228: 5271, 4134: 5132,
+        232: 1605, 5160: 5100, 4137: 5131, 1031: 5219,
+        4138: 5131, 6401: 5088, 6402: 5088, 4355: 5118,
+        6404: 5088, 2309: 5162, 2310: 5162, 263: 5268,
+        6408: 5088, 2313: 5161, 2314: 5161, 267: 5266,
+        4364: 5116, 269: 5265, 270: 5265, 4484: 5113,
+        6432: 5088, 4385: 5115, 2338: 5160, 291: 5263,
+        2340: 5160, 293: 5262, 294: 5262, 2344: 5160,
+        297: 5261, 298: 5261, 300: 5261, 4488: 5113,
+        6464: 5088, 4417: 5114, 2370: 5159, 323: 5259,
+        2372: 5159, 325: 5258, 326: 5258, 2376: 5159,
+        329: 5257, 330: 5257, 332: 5257, 4512: 5113,
+        4103: 5138, 5126: 5102, 2400: 5159, 353: 5256,
+        354: 5256, 356: 5256, 360: 5256, 6528: 5088,
+        4481: 5113, 4482: 5113, 387: 5254, 2436: 5158,
+        389: 5253, 390: 5253, 5185: 5099, 2440: 5158,
+        393: 5252, 394: 5252, 396: 5252, 5186: 5099,
+        2115: 5174, 5188: 5099, 2117: 5173, 2464: 5158,
+        417: 5251, 418: 5251, 420: 5251, 4166: 5128,
+        424: 5251, 5192: 5099, 4169: 5127, 2122: 5172,
+        2496: 5158, 449: 5250, 450: 5250, 452: 5250,
+        456: 5250, 2124: 5172, 2061: 5180, 4107: 5136,
+        4448: 5114, 480: 1604, 6657: 5087, 6658: 5087,
+        2563: 5156, 6660: 5087, 2565: 5155, 2566: 5155,
+        4865: 5105, 6664: 5087, 2569: 5154, 2570: 5154,
+        523: 5245, 2572: 5154, 525: 5244, 526: 5244,
+        4868: 5105, 6688: 5087, 2593: 5153, 2594: 5153,
+        547: 5242, 2596: 5153, 549: 5241, 550: 5241,
+        2600: 5153, 553: 5240, 554: 5240, 556: 5240,
+        4872: 5105, 6720: 5087, 4673: 5107, 2626: 5152,
+        579: 5238, 2628: 5152, 581: 5237, 582: 5237,
+        4193: 5126, 2632: 5152, 585: 5236, 586: 5236,
+        5132: 5101, 2146: 5171, 4196: 5126, 2656: 5152,
+        609: 5235, 610: 5235, 612: 5235, 616: 5235,
+        4200: 5126, 6784: 5087, 2689: 5151, 4738: 5106,
+        643: 5233, 2692: 5151, 645: 5232, 646: 5232,
+        2696: 5151, 649: 5231, 650: 5231, 652: 5231,
+        2720: 5151, 673: 5230, 674: 5230, 676: 5230,
+        4928: 5105, 680: 5230, 5888: 5096, 2752: 5151,
+        705: 5229, 706: 5229, 708: 5229, 712: 5229,
+        4320: 5120, 4866: 5105, 736: 5229, 6912: 5087,
+        2817: 5150, 2818: 5150, 771: 5227, 2820: 5150,
+        773: 5226, 774: 5226, 5249: 5098, 2824: 5150,
+        777: 5225, 778: 5225, 780: 5225, 5250: 5098,
+        4227: 5124, 5252: 5098, 4800: 5106, 2181: 5168,
+        2848: 5150, 801: 5224, 802: 5224, 804: 5224,
+        2182: 5168, 808: 5224, 5256: 5098, 4233: 5122,
+        4234: 5122, 2880: 5150, 833: 5223, 834: 5223,
+        836: 5223, 840: 5223, 2188: 5167, 864: 5223,
+        2944: 5150, 897: 5222, 898: 5222, 900: 5222,
+        904: 5222, 928: 5222, 5760: 5096, 960: 5222,
+        5280: 5098, 4257: 5121, 4258: 5121, 2212: 5166,
+        5216: 5099, 4264: 5121, 7169: 5086, 7170: 5086,
+        5123: 5103, 7172: 5086, 3077: 5147, 3078: 5147,
+        5633: 5096, 7176: 5086, 3081: 5146, 3082: 5146,
+        1035: 5217, 3084: 5146, 5634: 5096, 1038: 5216,
+        4611: 5111, 5636: 5096, 4613: 5110, 7200: 5086,
+        5153: 5100, 5154: 5100, 1059: 5214, 3108: 5145,
+        1061: 5213, 1062: 5213, 3112: 5145, 1065: 5212,
+        1066: 5212, 519: 5247, 1068: 5212, 5640: 5096,
+        4617: 5109, 5696: 5096, 4618: 5109, 7232: 5086,
+        3137: 5144, 3138: 5144, 1091: 5210, 3140: 5144,
+        1093: 5209, 1094: 5209, 3144: 5144, 1097: 5208,
+        1098: 5208, 1100: 5208, 3168: 5144, 1121: 5207,
+        1122: 5207, 1124: 5207, 1128: 5207, 7296: 5086,
+        3201: 5143, 3202: 5143, 1155: 5205, 3204: 5143,
+        1157: 5204, 1158: 5204, 4289: 5120, 3208: 5143,
+        1161: 5203, 1162: 5203, 1164: 5203, 2242: 5165,
+        4292: 5120, 3232: 5143, 1185: 5202, 1186: 5202,
+        1188: 5202, 1192: 5202, 4296: 5120, 3264: 5143,
+        1217: 5201, 1218: 5201, 1220: 5201, 4641: 5108,
+        1224: 5201, 4642: 5108, 4644: 5108, 1248: 5201,
+        4648: 5108, 7424: 5086, 5377: 5097, 5378: 5097,
+        1283: 5199, 3332: 5142, 1285: 5198, 1286: 5198,
+        3336: 5142, 1289: 5197, 1290: 5197, 1292: 5197,
+        4544: 5113, 3360: 5142, 1313: 5196, 1314: 5196,
+        1316: 5196, 1320: 5196, 3392: 5142, 1345: 5195,
+        1346: 5195, 1348: 5195, 1352: 5195, 4614: 5110,
+        1376: 5195, 2433: 5158, 3456: 5142, 1409: 5194,
+        1410: 5194, 1412: 5194, 2625: 5152, 1416: 5194,
+        4674: 5107, 2434: 5158, 4676: 5107, 1440: 5194,
+        4140: 5131, 4680: 5107, 5504: 5097, 1472: 5194,
+        588: 5236, 4620: 5109, 7680: 5086, 3585: 5141,
+        3586: 5141, 1539: 5192, 3588: 5141, 1541: 5191,
+        1542: 5191, 3329: 5142, 3592: 5141, 1545: 5190,
+        1546: 5190, 1548: 5190, 3330: 5142, 2307: 5163,
+        5380: 5097, 4357: 5117, 3616: 5141, 1569: 5189,
+        1570: 5189, 1572: 5189, 4358: 5117, 1576: 5189,
+        5384: 5097, 4361: 5116, 4362: 5116, 3648: 5141,
+        1601: 5188, 1602: 5188, 1604: 5188, 1608: 5188,
+        2316: 5161, 4896: 5105, 1632: 5188, 3712: 5141,
+        1665: 5187, 1666: 5187, 1668: 5187, 1672: 5187,
+        1696: 5187, 1728: 5187, 5408: 5097, 2337: 5160,
+        4386: 5115, 4388: 5115, 4392: 5115, 3840: 5141,
+        1793: 5186, 1794: 5186, 1796: 5186, 4737: 5106,
+        1800: 5186, 2690: 5151, 4740: 5106, 1824: 5186,
+        5312: 5098, 4744: 5106, 1856: 5186, 1920: 5186,
+        5440: 5097, 2369: 5159, 4418: 5114, 4420: 5114,
+        4424: 5114, 4768: 5106, 4704: 5107 },
+        17: { 384: 3253, 320: 3253, 258: 3253, 516: 3252,
+        6: 3258, 2080: 3250, 136: 3254, 10: 3257,
+        132: 3254, 12: 3257, 2050: 3250, 4352: 3249,
+        1536: 3251, 1032: 3251, 768: 3252, 576: 3252,
+        2052: 3250, 640: 3252, 520: 3252, 1028: 3251,
+        260: 3253, 160: 3254, 34: 3256, 36: 3256,
+        5120: 3249, 40: 3256, 1152: 3251, 4160: 3249,
+        1280: 3251, 264: 3253, 2056: 3250, 4224: 3249,
+        192: 3254, 288: 3253, 66: 3255, 68: 3255,
+        130: 3254, 4128: 3249, 72: 3255, 1088: 3251,
+        2304: 3250, 4098: 3249, 514: 3252, 2560: 3250,
+        544: 3252, 96: 3255, 1026: 3251, 6144: 3249,
+        3072: 3250, 1056: 3251, 2112: 3250, 4608: 3249,
+        2176: 3250, 4104: 3249, 4100: 3249 },
+        18: { 384: 3242, 129: 3243, 132: 3243, 5: 3247,
+        260: 3242, 1025: 3240, 136: 3243, 9: 3246,
+        4224: 3238, 12: 3246, 516: 3241, 320: 3242,
+        1032: 3240, 768: 3241, 576: 3241, 2052: 3239,
+        640: 3241, 1028: 3240, 520: 3241, 160: 3243,
+        33: 3245, 4097: 3238, 2080: 3239, 40: 3245,
+        1152: 3240, 257: 3242, 4160: 3238, 1280: 3240,
+        264: 3242, 513: 3241, 2056: 3239, 192: 3243,
+        65: 3244, 68: 3244, 6144: 3238, 4128: 3238,
+        72: 3244, 1088: 3240, 4352: 3238, 2304: 3239,
+        288: 3242, 1536: 3240, 5120: 3238, 2560: 3239,
+        544: 3241, 36: 3245, 96: 3244, 2049: 3239,
+        3072: 3239, 1056: 3240, 2112: 3239, 4608: 3238,
+        2176: 3239, 4104: 3238, 4100: 3238 },
+        20: { 384: 3231, 129: 3232, 2050: 3228, 3: 3236,
+        520: 3230, 1025: 3229, 136: 3232, 9: 3235,
+        10: 3235, 288: 3231, 1026: 3229, 4352: 3227,
+        320: 3231, 1032: 3229, 576: 3230, 640: 3230,
+        768: 3230, 160: 3232, 33: 3234, 34: 3234,
+        4097: 3227, 2080: 3228, 40: 3234, 1152: 3229,
+        257: 3231, 4160: 3227, 1280: 3229, 264: 3231,
+        513: 3230, 2056: 3228, 4224: 3227, 192: 3232,
+        65: 3233, 66: 3233, 5120: 3227, 130: 3232,
+        4128: 3227, 72: 3233, 258: 3231, 2304: 3228,
+        4098: 3227, 1536: 3229, 514: 3230, 2560: 3228,
+        544: 3230, 4608: 3227, 96: 3233, 2049: 3228,
+        6144: 3227, 3072: 3228, 1056: 3229, 2112: 3228,
+        1088: 3229, 2176: 3228, 4104: 3227 },
+        512: { 6147: 3994, 6149: 3993, 6150: 3993, 2055: 4083,
+        6153: 3992, 6154: 3992, 2059: 4081, 6156: 3992,
+        4109: 4035, 4110: 4035, 15: 4202, 6161: 3991,
+        6162: 3991, 2067: 4078, 6164: 3991, 2069: 4077,
+        2070: 4077, 23: 4199, 6168: 3991, 2073: 4076,
+        2074: 4076, 27: 4197, 4124: 4031, 29: 4196,
+        30: 4196, 3077: 4047, 6177: 3990, 6178: 3990,
+        4131: 4029, 6180: 3990, 2085: 4073, 2086: 4073,
+        39: 4193, 6184: 3990, 2089: 4072, 2090: 4072,
+        43: 4191, 2092: 4072, 45: 4190, 46: 4190,
+        6192: 3990, 2097: 4071, 2098: 4071, 51: 4188,
+        2100: 4071, 53: 4187, 54: 4187, 5129: 4001,
+        2104: 4071, 57: 4186, 58: 4186, 60: 4186,
+        5130: 4001, 6209: 3989, 6210: 3989, 4163: 4024,
+        6212: 3989, 4165: 4023, 2118: 4068, 71: 4183,
+        6216: 3989, 4169: 4022, 4170: 4022, 75: 4181,
+        4172: 4022, 77: 4180, 78: 4180, 2061: 4080,
+        6224: 3989, 4177: 4021, 4178: 4021, 83: 4178,
+        4180: 4021, 85: 4177, 86: 4177, 2136: 4066,
+        89: 4176, 90: 4176, 92: 4176, 344: 4130,
+        2145: 4065, 4194: 4020, 99: 4174, 2148: 4065,
+        101: 4173, 102: 4173, 5137: 4000, 2152: 4065,
+        105: 4172, 106: 4172, 108: 4172, 5138: 4000,
+        2160: 4065, 113: 4171, 114: 4171, 4115: 4033,
+        116: 4171, 120: 4171, 5140: 4000, 4117: 4032,
+        6273: 3988, 6274: 3988, 2179: 4063, 6276: 3988,
+        4229: 4017, 4230: 4017, 135: 4168, 6280: 3988,
+        4233: 4016, 4234: 4016, 139: 4166, 4236: 4016,
+        141: 4165, 142: 4165, 6288: 3988, 2193: 4060,
+        2194: 4060, 147: 4163, 2196: 4060, 149: 4162,
+        150: 4162, 4121: 4031, 2200: 4060, 153: 4161,
+        154: 4161, 156: 4161, 4122: 4031, 6304: 3988,
+        4257: 4014, 2210: 4059, 163: 4159, 2212: 4059,
+        165: 4158, 166: 4158, 2216: 4059, 169: 4157,
+        170: 4157, 172: 4157, 2224: 4059, 177: 4156,
+        178: 4156, 180: 4156, 184: 4156, 3075: 4048,
+        2241: 4058, 2242: 4058, 195: 4154, 2244: 4058,
+        197: 4153, 198: 4153, 5153: 3999, 2248: 4058,
+        201: 4152, 202: 4152, 204: 4152, 5154: 3999,
+        2256: 4058, 209: 4151, 210: 4151, 2083: 4074,
+        212: 4151, 216: 4151, 5156: 3999, 4133: 4028,
+        2272: 4058, 225: 4150, 226: 4150, 228: 4150,
+        4134: 4028, 232: 4150, 240: 4150, 5160: 3999,
+        4137: 4027, 4138: 4027, 6401: 3987, 6402: 3987,
+        2307: 4056, 6404: 3987, 2309: 4055, 2310: 4055,
+        263: 4147, 6408: 3987, 2313: 4054, 2314: 4054,
+        267: 4145, 2316: 4054, 269: 4144, 270: 4144,
+        6416: 3987, 2321: 4053, 2322: 4053, 275: 4142,
+        2324: 4053, 277: 4141, 278: 4141, 2328: 4053,
+        281: 4140, 282: 4140, 284: 4140, 6432: 3987,
+        4385: 4007, 2338: 4052, 291: 4138, 2340: 4052,
+        293: 4137, 294: 4137, 4145: 4026, 2344: 4052,
+        297: 4136, 298: 4136, 300: 4136, 4146: 4026,
+        2352: 4052, 305: 4135, 306: 4135, 308: 4135,
+        312: 4135, 4148: 4026, 6464: 3987, 4417: 4006,
+        2370: 4051, 323: 4133, 2372: 4051, 325: 4132,
+        326: 4132, 2376: 4051, 329: 4131, 330: 4131,
+        332: 4131, 2384: 4051, 337: 4130, 338: 4130,
+        4512: 4005, 340: 4130, 4103: 4038, 5126: 4002,
+        2400: 4051, 353: 4129, 354: 4129, 356: 4129,
+        360: 4129, 368: 4129, 6528: 3987, 2433: 4050,
+        2434: 4050, 387: 4127, 2436: 4050, 389: 4126,
+        390: 4126, 5185: 3998, 2440: 4050, 393: 4125,
+        394: 4125, 396: 4125, 5186: 3998, 2448: 4050,
+        401: 4124, 402: 4124, 2115: 4069, 404: 4124,
+        408: 4124, 5188: 3998, 2117: 4068, 2464: 4050,
+        417: 4123, 418: 4123, 420: 4123, 4166: 4023,
+        424: 4123, 432: 4123, 5192: 3998, 2121: 4067,
+        2122: 4067, 2496: 4050, 449: 4122, 450: 4122,
+        452: 4122, 456: 4122, 2124: 4067, 4107: 4036,
+        4448: 4006, 480: 1603, 5200: 3998, 2129: 4066,
+        2062: 4080, 2130: 4066, 2132: 4066, 5132: 4001,
+        4184: 4021, 5216: 3998, 4193: 4020, 2146: 4065,
+        4196: 4020, 4200: 4020, 4544: 4005, 4208: 4020,
+        4320: 4013, 464: 4122, 5249: 3997, 5250: 3997,
+        4227: 4018, 5252: 3997, 4118: 4032, 2181: 4062,
+        2182: 4062, 5256: 3997, 2185: 4061, 2186: 4061,
+        2188: 4061, 5264: 3997, 4241: 4015, 4242: 4015,
+        5144: 4000, 4244: 4015, 2076: 4076, 4248: 4015,
+        5280: 3997, 2209: 4059, 4258: 4014, 4260: 4014,
+        4264: 4014, 7169: 3986, 7170: 3986, 5123: 4003,
+        7172: 3986, 5125: 4002, 3078: 4047, 1031: 4119,
+        7176: 3986, 3081: 4046, 3082: 4046, 1035: 4117,
+        3084: 4046, 1037: 4116, 1038: 4116, 7184: 3986,
+        3089: 4045, 3090: 4045, 1043: 4114, 3092: 4045,
+        1045: 4113, 1046: 4113, 3096: 4045, 1049: 4112,
+        1050: 4112, 1052: 4112, 7200: 3986, 3105: 4044,
+        3106: 4044, 1059: 4110, 3108: 4044, 1061: 4109,
+        1062: 4109, 3112: 4044, 1065: 4108, 1066: 4108,
+        1068: 4108, 3120: 4044, 1073: 4107, 1074: 4107,
+        1076: 4107, 1080: 4107, 7232: 3986, 3137: 4043,
+        3138: 4043, 1091: 4105, 3140: 4043, 1093: 4104,
+        1094: 4104, 3144: 4043, 1097: 4103, 1098: 4103,
+        1100: 4103, 3152: 4043, 1105: 4102, 1106: 4102,
+        1108: 4102, 1112: 4102, 3168: 4043, 1121: 4101,
+        1122: 4101, 1124: 4101, 1128: 4101, 1136: 4101,
+        7296: 3986, 3201: 4042, 3202: 4042, 1155: 4099,
+        3204: 4042, 1157: 4098, 1158: 4098, 4289: 4013,
+        3208: 4042, 1161: 4097, 1162: 4097, 1164: 4097,
+        4290: 4013, 3216: 4042, 1169: 4096, 1170: 4096,
+        1172: 4096, 1176: 4096, 4292: 4013, 3232: 4042,
+        1185: 4095, 1186: 4095, 1188: 4095, 1192: 4095,
+        1200: 4095, 4296: 4013, 3264: 4042, 1217: 4094,
+        1218: 4094, 1220: 4094, 1224: 4094, 1232: 4094,
+        1248: 4094, 4304: 4013, 7424: 1600, 5377: 3996,
+        5378: 3996, 1283: 4092, 3332: 4041, 1285: 4091,
+        1286: 4091, 3336: 4041, 1289: 4090, 1290: 4090,
+        1292: 4090, 3344: 4041, 1297: 4089, 1298: 4089,
+        1300: 4089, 1304: 4089, 3360: 4041, 1313: 4088,
+        1314: 4088, 1316: 4088, 1320: 4088, 4272: 4014,
+        1328: 4088, 3392: 4041, 1345: 4087, 1346: 4087,
+        1348: 4087, 1352: 4087, 1360: 4087, 1376: 4087,
+        3456: 1601, 1409: 4086, 1410: 4086, 6240: 3989,
+        1412: 4086, 1416: 4086, 1424: 4086, 1440: 4086,
+        4140: 4027, 4481: 4005, 5504: 3996, 1472: 1602,
+        4482: 4005, 3329: 4041, 4484: 4005, 3330: 4041,
+        4355: 4011, 5380: 3996, 4357: 4010, 4358: 4010,
+        5384: 3996, 4361: 4009, 4362: 4009, 5168: 3999,
+        4364: 4009, 5392: 3996, 4369: 4008, 4370: 4008,
+        4372: 4008, 4488: 4005, 4376: 4008, 5408: 3996,
+        2337: 4052, 4386: 4007, 4388: 4007, 4392: 4007,
+        4152: 4026, 4400: 4007, 5312: 3997, 6336: 3988,
+        4496: 4005, 5440: 3996, 2369: 4051, 4418: 4006,
+        4420: 4006, 4424: 4006, 4432: 4006 },
+        24: { 384: 3220, 129: 3221, 258: 3220, 3: 3225,
+        132: 3221, 5: 3224, 6: 3224, 1025: 3218,
+        4160: 3216, 4224: 3216, 288: 3220, 2050: 3217,
+        516: 3219, 320: 3220, 4608: 3216, 768: 3219,
+        576: 3219, 260: 3220, 640: 3219, 1028: 3218,
+        160: 3221, 33: 3223, 34: 3223, 4097: 3216,
+        2080: 3217, 1088: 3218, 1152: 3218, 257: 3220,
+        1280: 3218, 513: 3219, 1536: 3218, 2052: 3217,
+        192: 3221, 65: 3222, 66: 3222, 68: 3222,
+        130: 3221, 4128: 3216, 2112: 3217, 2176: 3217,
+        4352: 3216, 2304: 3217, 4098: 3216, 514: 3219,
+        5120: 3216, 2560: 3217, 544: 3219, 36: 3223,
+        96: 3222, 1026: 3218, 2049: 3217, 6144: 3216,
+        3072: 3217, 1056: 3218, 4100: 3216 },
+        1028: { 384: 2801, 129: 2802, 2050: 2799, 3: 2807,
+        520: 2800, 2049: 2799, 136: 2802, 9: 2806,
+        10: 2806, 288: 2801, 4098: 2798, 4352: 2798,
+        144: 2802, 17: 2805, 18: 2805, 4608: 2798,
+        24: 2805, 640: 2800, 768: 2800, 160: 2802,
+        33: 2804, 34: 2804, 4097: 2798, 2064: 2799,
+        40: 2804, 257: 2801, 4160: 2798, 48: 2804,
+        264: 2801, 513: 2800, 2056: 2799, 4224: 2798,
+        2080: 2799, 192: 2802, 65: 2803, 66: 2803,
+        130: 2802, 4128: 2798, 72: 2803, 258: 2801,
+        2304: 2799, 528: 2800, 80: 2803, 320: 2801,
+        514: 2800, 2560: 2799, 544: 2800, 96: 2803,
+        272: 2801, 6144: 2798, 4112: 2798, 2112: 2799,
+        2176: 2799, 4104: 2798, 576: 2800 },
+        768: { 1152: 2833, 1025: 2833, 2050: 2832, 3: 2840,
+        132: 2834, 5: 2839, 6: 2839, 129: 2834,
+        136: 2834, 9: 2838, 10: 2838, 3072: 2832,
+        12: 2838, 1026: 2833, 144: 2834, 17: 2837,
+        18: 2837, 20: 2837, 24: 2837, 1028: 2833,
+        160: 2834, 33: 2836, 34: 2836, 4097: 2831,
+        2064: 2832, 40: 2836, 4160: 2831, 48: 2836,
+        1032: 2833, 2056: 2832, 4224: 2831, 2052: 2832,
+        2080: 2832, 192: 2834, 65: 2835, 66: 2835,
+        68: 2835, 130: 2834, 4128: 2831, 72: 2835,
+        1088: 2833, 4098: 2831, 80: 2835, 5120: 2831,
+        36: 2836, 96: 2835, 1040: 2833, 2049: 2832,
+        6144: 2831, 4112: 2831, 1056: 2833, 2112: 2832,
+        2176: 2832, 4104: 2831, 4100: 2831 },
+        32: { 6147: 4874, 6149: 4873, 6150: 4873, 2055: 4963,
+        6153: 4872, 6154: 4872, 2059: 4961, 6156: 4872,
+        4109: 4915, 4110: 4915, 15: 5082, 6161: 4871,
+        6162: 4871, 2067: 4958, 6164: 4871, 2069: 4957,
+        2070: 4957, 23: 5079, 6168: 4871, 2073: 4956,
+        2074: 4956, 27: 5077, 4124: 4911, 29: 5076,
+        30: 1607, 5125: 4882, 5126: 4882, 1031: 4999,
+        5129: 4881, 3082: 4926, 6209: 4870, 6210: 4870,
+        4163: 4909, 6212: 4870, 4165: 4908, 2118: 4953,
+        71: 5073, 6216: 4870, 2121: 4952, 2122: 4952,
+        75: 5071, 2124: 4952, 77: 5070, 78: 5070,
+        1037: 4996, 6224: 4870, 4177: 4906, 4178: 4906,
+        83: 5068, 2132: 4951, 85: 5067, 86: 5067,
+        2136: 4951, 89: 5066, 90: 5066, 92: 1606,
+        344: 5036, 5137: 4880, 5138: 4880, 4115: 4913,
+        5140: 4880, 4117: 4912, 6273: 4869, 6274: 4869,
+        2179: 4949, 6276: 4869, 4229: 4903, 4230: 4903,
+        135: 5063, 6280: 4869, 2185: 4947, 4234: 4902,
+        139: 5061, 4236: 4902, 141: 5060, 142: 5060,
+        6288: 4869, 2193: 4946, 2194: 4946, 147: 5058,
+        2196: 4946, 149: 5057, 150: 5057, 4121: 4911,
+        2200: 4946, 153: 5056, 154: 5056, 156: 5056,
+        4122: 4911, 2076: 4956, 3075: 4928, 2241: 4945,
+        4290: 4900, 195: 5054, 2244: 4945, 197: 5053,
+        198: 5053, 2248: 4945, 201: 5052, 202: 5052,
+        204: 5052, 2256: 4945, 209: 5051, 210: 5051,
+        212: 5051, 216: 1605, 6401: 4868, 6402: 4868,
+        2307: 4943, 6404: 4868, 2309: 4942, 2310: 4942,
+        263: 5048, 6408: 4868, 2313: 4941, 2314: 4941,
+        267: 5046, 2316: 4941, 269: 5045, 270: 5045,
+        6416: 4868, 2321: 4940, 2322: 4940, 275: 5043,
+        4372: 4895, 277: 5042, 278: 5042, 2328: 4940,
+        281: 5041, 282: 5041, 284: 5041, 4488: 4893,
+        6464: 4868, 4417: 4894, 2370: 4939, 323: 5039,
+        2372: 4939, 325: 5038, 326: 5038, 2376: 4939,
+        329: 5037, 330: 5037, 332: 5037, 2384: 4939,
+        337: 5036, 338: 5036, 340: 5036, 4103: 4918,
+        4496: 4893, 4544: 4893, 6528: 4868, 4481: 4893,
+        2434: 4938, 387: 5034, 2436: 4938, 389: 5033,
+        390: 5033, 5185: 4879, 2440: 4938, 393: 5032,
+        394: 5032, 396: 5032, 5186: 4879, 2448: 4938,
+        401: 5031, 402: 5031, 2115: 4954, 404: 5031,
+        408: 5031, 5188: 4879, 2117: 4953, 4992: 4885,
+        4166: 4908, 5192: 4879, 4169: 4907, 4170: 4907,
+        2496: 4938, 449: 5030, 450: 5030, 452: 5030,
+        456: 5030, 4172: 4907, 2061: 4960, 4107: 4916,
+        5200: 4879, 2129: 4951, 2062: 4960, 2130: 4951,
+        4180: 4906, 6657: 4867, 6658: 4867, 2563: 4936,
+        6660: 4867, 2565: 4935, 2566: 4935, 519: 5027,
+        6664: 4867, 2569: 4934, 2570: 4934, 523: 5025,
+        2572: 4934, 525: 5024, 526: 5024, 6672: 4867,
+        2577: 4933, 2578: 4933, 531: 5022, 2580: 4933,
+        533: 5021, 534: 5021, 2584: 4933, 537: 5020,
+        538: 5020, 540: 5020, 4928: 4885, 4872: 4885,
+        6720: 4867, 4673: 4887, 2626: 4932, 579: 5018,
+        2628: 4932, 581: 5017, 582: 5017, 2632: 4932,
+        585: 5016, 586: 5016, 588: 5016, 2640: 4932,
+        593: 5015, 594: 5015, 596: 5015, 600: 5015,
+        4880: 4885, 6784: 4867, 2689: 4931, 4738: 4886,
+        643: 5013, 2692: 4931, 645: 5012, 646: 5012,
+        2696: 4931, 649: 5011, 650: 5011, 652: 5011,
+        2704: 4931, 657: 5010, 658: 5010, 660: 5010,
+        664: 5010, 2818: 4930, 4865: 4885, 5888: 4876,
+        2752: 4931, 705: 5009, 706: 5009, 708: 5009,
+        712: 5009, 720: 5009, 4184: 4906, 464: 1604,
+        6912: 4867, 2817: 4930, 4866: 4885, 771: 5007,
+        2820: 4930, 773: 5006, 774: 5006, 5249: 4878,
+        2824: 4930, 777: 5005, 778: 5005, 780: 5005,
+        5250: 4878, 2832: 4930, 785: 5004, 786: 5004,
+        4227: 4904, 788: 5004, 4868: 4885, 792: 5004,
+        5252: 4878, 4118: 4912, 4800: 4886, 2181: 4948,
+        2182: 4948, 5256: 4878, 4233: 4902, 2186: 4947,
+        2880: 4930, 833: 5003, 834: 5003, 836: 5003,
+        840: 5003, 2188: 4947, 848: 5003, 5264: 4878,
+        4241: 4901, 4242: 4901, 5144: 4880, 4244: 4901,
+        5132: 4881, 2944: 4930, 897: 5002, 898: 5002,
+        900: 5002, 904: 5002, 912: 5002, 4248: 4901,
+        5760: 4876, 960: 1603, 7169: 4866, 7170: 4866,
+        5123: 4883, 7172: 4866, 3077: 4927, 3078: 4927,
+        5633: 4876, 7176: 4866, 3081: 4926, 5130: 4881,
+        1035: 4997, 3084: 4926, 3586: 4921, 1038: 4996,
+        7184: 4866, 3089: 4925, 3090: 4925, 1043: 4994,
+        3092: 4925, 1045: 4993, 1046: 4993, 3096: 4925,
+        1049: 4992, 1050: 4992, 1052: 4992, 4613: 4890,
+        4614: 4890, 5640: 4876, 4617: 4889, 5696: 4876,
+        4618: 4889, 7232: 4866, 3137: 4924, 3138: 4924,
+        1091: 4990, 3140: 4924, 1093: 4989, 1094: 4989,
+        3144: 4924, 1097: 4988, 1098: 4988, 1100: 4988,
+        3152: 4924, 1105: 4987, 1106: 4987, 1108: 4987,
+        1112: 4987, 5648: 4876, 4625: 4888, 4626: 4888,
+        4628: 4888, 7296: 4866, 3201: 4923, 3202: 4923,
+        1155: 4985, 3204: 4923, 1157: 4984, 1158: 4984,
+        4289: 4900, 3208: 4923, 1161: 4983, 1162: 4983,
+        1164: 4983, 2242: 4945, 3216: 4923, 1169: 4982,
+        1170: 4982, 1172: 4982, 1176: 4982, 4292: 4900,
+        4296: 4900, 3264: 4923, 1217: 4981, 1218: 4981,
+        1220: 4981, 1224: 4981, 1232: 4981, 4304: 4900,
+        4611: 4891, 7424: 4866, 5377: 4877, 5378: 4877,
+        1283: 4979, 3332: 4922, 1285: 4978, 1286: 4978,
+        3336: 4922, 1289: 4977, 1290: 4977, 1292: 4977,
+        3344: 4922, 1297: 4976, 1298: 4976, 1300: 4976,
+        1304: 4976, 5636: 4876, 3392: 4922, 1345: 4975,
+        1346: 4975, 1348: 4975, 1352: 4975, 1360: 4975,
+        2433: 4938, 3456: 4922, 1409: 4974, 1410: 4974,
+        1412: 4974, 2625: 4932, 1416: 4974, 4674: 4887,
+        1424: 4974, 4676: 4887, 4680: 4887, 5504: 4877,
+        1472: 4974, 4482: 4893, 4688: 4887, 4620: 4889,
+        7680: 4866, 3585: 4921, 5634: 4876, 1539: 4972,
+        3588: 4921, 1541: 4971, 1542: 4971, 3329: 4922,
+        3592: 4921, 1545: 4970, 1546: 4970, 1548: 4970,
+        3330: 4922, 3600: 4921, 1553: 4969, 1554: 4969,
+        4355: 4898, 1556: 4969, 1560: 4969, 5380: 4877,
+        4357: 4897, 4358: 4897, 5384: 4877, 4361: 4896,
+        4362: 4896, 3648: 4921, 1601: 4968, 1602: 4968,
+        1604: 4968, 1608: 4968, 4364: 4896, 1616: 4968,
+        5392: 4877, 4369: 4895, 4370: 4895, 2324: 4940,
+        3712: 4921, 1665: 4967, 1666: 4967, 1668: 4967,
+        1672: 4967, 1680: 4967, 4376: 4895, 1728: 4967,
+        3840: 4921, 1793: 4966, 1794: 4966, 1796: 4966,
+        4737: 4886, 1800: 4966, 2690: 4931, 1808: 4966,
+        4484: 4893, 4740: 4886, 5312: 4878, 4744: 4886,
+        1856: 4966, 6336: 4869, 4752: 4886, 4632: 4888,
+        1920: 4966, 5440: 4877, 2369: 4939, 4418: 4894,
+        4420: 4894, 4424: 4894, 4432: 4894 },
+        33: { 384: 3209, 320: 3209, 258: 3209, 4100: 3205,
+        6: 3214, 136: 3210, 10: 3213, 132: 3210,
+        12: 3213, 2050: 3206, 4352: 3205, 144: 3210,
+        18: 3212, 20: 3212, 1032: 3207, 768: 3208,
+        24: 3212, 516: 3208, 640: 3208, 520: 3208,
+        1028: 3207, 260: 3209, 1040: 3207, 2064: 3206,
+        1088: 3207, 1152: 3207, 4160: 3205, 1280: 3207,
+        264: 3209, 2056: 3206, 4224: 3205, 3072: 3206,
+        528: 3208, 2052: 3206, 192: 3210, 66: 3211,
+        68: 3211, 130: 3210, 72: 3211, 2176: 3206,
+        2304: 3206, 4098: 3205, 80: 3211, 1536: 3207,
+        514: 3208, 5120: 3205, 2560: 3206, 272: 3209,
+        1026: 3207, 6144: 3205, 4112: 3205, 2112: 3206,
+        4608: 3205, 4104: 3205, 576: 3208 },
+        34: { 384: 3198, 129: 3199, 3072: 3195, 132: 3199,
+        5: 3203, 260: 3198, 1025: 3196, 136: 3199,
+        9: 3202, 4224: 3194, 12: 3202, 4352: 3194,
+        144: 3199, 17: 3201, 20: 3201, 1032: 3196,
+        768: 3197, 24: 3201, 516: 3197, 640: 3197,
+        1028: 3196, 520: 3197, 1040: 3196, 4097: 3194,
+        2064: 3195, 1088: 3196, 1152: 3196, 257: 3198,
+        4160: 3194, 1280: 3196, 264: 3198, 513: 3197,
+        2056: 3195, 2052: 3195, 192: 3199, 65: 3200,
+        68: 3200, 6144: 3194, 72: 3200, 2176: 3195,
+        2304: 3195, 528: 3197, 80: 3200, 320: 3198,
+        5120: 3194, 2560: 3195, 272: 3198, 2049: 3195,
+        4112: 3194, 2112: 3195, 1536: 3196, 4608: 3194,
+        4104: 3194, 576: 3197, 4100: 3194 },
+        36: { 384: 3187, 129: 3188, 2050: 3184, 3: 3192,
+        520: 3186, 1025: 3185, 136: 3188, 9: 3191,
+        10: 3191, 3072: 3184, 528: 3186, 1026: 3185,
+        4352: 3183, 144: 3188, 17: 3190, 18: 3190,
+        1032: 3185, 24: 3190, 640: 3186, 768: 3186,
+        1040: 3185, 4097: 3183, 2064: 3184, 1088: 3185,
+        1152: 3185, 257: 3187, 4160: 3183, 1280: 3185,
+        264: 3187, 513: 3186, 2056: 3184, 4224: 3183,
+        192: 3188, 65: 3189, 66: 3189, 5120: 3183,
+        130: 3188, 72: 3189, 258: 3187, 2304: 3184,
+        4098: 3183, 80: 3189, 320: 3187, 514: 3186,
+        2560: 3184, 272: 3187, 2049: 3184, 6144: 3183,
+        4112: 3183, 2112: 3184, 1536: 3185, 4608: 3183,
+        2176: 3184, 4104: 3183, 576: 3186 },
+        1024: { 6147: 3774, 6149: 3773, 6150: 3773, 2055: 3863,
+        6153: 3772, 6154: 3772, 4107: 3816, 6156: 3772,
+        4109: 3815, 4110: 3815, 15: 3982, 6161: 3771,
+        6162: 3771, 2067: 3858, 6164: 3771, 2069: 3857,
+        2070: 3857, 23: 3979, 6168: 3771, 2073: 3856,
+        2074: 3856, 27: 3977, 4124: 3811, 29: 3976,
+        30: 3976, 6177: 3770, 6178: 3770, 4131: 3809,
+        6180: 3770, 4133: 3808, 2086: 3853, 39: 3973,
+        6184: 3770, 2089: 3852, 2090: 3852, 43: 3971,
+        2092: 3852, 45: 3970, 46: 3970, 6192: 3770,
+        2097: 3851, 2098: 3851, 51: 3968, 4148: 3806,
+        53: 3967, 54: 3967, 2104: 3851, 57: 3966,
+        58: 3966, 60: 3966, 6209: 3769, 6210: 3769,
+        4163: 3804, 6212: 3769, 4165: 3803, 2118: 3848,
+        71: 3963, 6216: 3769, 2121: 3847, 2122: 3847,
+        75: 3961, 4172: 3802, 77: 3960, 78: 3960,
+        2061: 3860, 6224: 3769, 4177: 3801, 4178: 3801,
+        83: 3958, 2132: 3846, 85: 3957, 86: 3957,
+        2136: 3846, 89: 3956, 90: 3956, 92: 3956,
+        344: 3910, 2145: 3845, 2146: 3845, 99: 3954,
+        2148: 3845, 101: 3953, 102: 3953, 2152: 3845,
+        105: 3952, 106: 3952, 108: 3952, 2160: 3845,
+        113: 3951, 114: 3951, 4115: 3813, 116: 3951,
+        120: 3951, 4117: 3812, 6273: 3768, 6274: 3768,
+        2179: 3843, 6276: 3768, 4229: 3797, 4230: 3797,
+        135: 3948, 6280: 3768, 4233: 3796, 4234: 3796,
+        139: 3946, 4236: 3796, 141: 3945, 142: 3945,
+        6288: 3768, 2193: 3840, 2194: 3840, 147: 3943,
+        2196: 3840, 149: 3942, 150: 3942, 4121: 3811,
+        2200: 3840, 153: 3941, 154: 3941, 156: 3941,
+        4122: 3811, 6304: 3768, 4257: 3794, 2210: 3839,
+        163: 3939, 2212: 3839, 165: 3938, 166: 3938,
+        2216: 3839, 169: 3937, 170: 3937, 172: 3937,
+        2224: 3839, 177: 3936, 178: 3936, 180: 3936,
+        184: 3936, 6336: 3768, 2241: 3838, 2242: 3838,
+        195: 3934, 2244: 3838, 197: 3933, 198: 3933,
+        2248: 3838, 201: 3932, 202: 3932, 204: 3932,
+        2256: 3838, 209: 3931, 210: 3931, 2083: 3854,
+        212: 3931, 216: 3931, 2085: 3853, 2272: 3838,
+        225: 3930, 226: 3930, 228: 3930, 4134: 3808,
+        232: 3930, 240: 3930, 4137: 3807, 4138: 3807,
+        6401: 3767, 6402: 3767, 2307: 3836, 6404: 3767,
+        2309: 3835, 2310: 3835, 263: 3927, 6408: 3767,
+        2313: 3834, 2314: 3834, 267: 3925, 2316: 3834,
+        269: 3924, 270: 3924, 6416: 3767, 2321: 3833,
+        2322: 3833, 275: 3922, 2324: 3833, 277: 3921,
+        278: 3921, 2328: 3833, 281: 3920, 282: 3920,
+        284: 3920, 6432: 3767, 4385: 3787, 2338: 3832,
+        291: 3918, 2340: 3832, 293: 3917, 294: 3917,
+        4145: 3806, 2344: 3832, 297: 3916, 298: 3916,
+        300: 3916, 4146: 3806, 2352: 3832, 305: 3915,
+        306: 3915, 308: 3915, 312: 3915, 2100: 3851,
+        6464: 3767, 4417: 3786, 2370: 3831, 323: 3913,
+        2372: 3831, 325: 3912, 326: 3912, 2376: 3831,
+        329: 3911, 330: 3911, 332: 3911, 2384: 3831,
+        337: 3910, 338: 3910, 4512: 3785, 340: 3910,
+        4103: 3818, 2400: 3831, 353: 3909, 354: 3909,
+        356: 3909, 360: 3909, 368: 3909, 6528: 3767,
+        4481: 3785, 2434: 3830, 387: 3907, 2436: 3830,
+        389: 3906, 390: 3906, 2440: 3830, 393: 3905,
+        394: 3905, 396: 3905, 2059: 3861, 401: 3904,
+        402: 3904, 2115: 3849, 404: 3904, 408: 3904,
+        2117: 3848, 2464: 3830, 417: 3903, 418: 3903,
+        420: 3903, 4166: 3803, 424: 3903, 432: 3903,
+        4169: 3802, 4170: 3802, 2496: 3830, 449: 3902,
+        450: 3902, 452: 3902, 456: 3902, 2124: 3847,
+        4872: 3776, 464: 3902, 4448: 3786, 480: 3902,
+        2129: 3846, 2062: 3860, 2130: 3846, 4180: 3801,
+        6657: 3766, 6658: 3766, 2563: 3828, 6660: 3766,
+        4613: 3782, 2566: 3827, 519: 3899, 6664: 3766,
+        2569: 3826, 2570: 3826, 523: 3897, 2572: 3826,
+        525: 3896, 526: 3896, 6672: 3766, 2577: 3825,
+        2578: 3825, 531: 3894, 2580: 3825, 533: 3893,
+        534: 3893, 2584: 3825, 537: 3892, 538: 3892,
+        540: 3892, 6688: 3766, 2593: 3824, 2594: 3824,
+        547: 3890, 2596: 3824, 549: 3889, 550: 3889,
+        2600: 3824, 553: 3888, 554: 3888, 556: 3888,
+        2608: 3824, 561: 3887, 562: 3887, 564: 3887,
+        568: 3887, 6720: 3766, 4673: 3778, 2626: 3823,
+        579: 3885, 2628: 3823, 581: 3884, 582: 3884,
+        4193: 3800, 2632: 3823, 585: 3883, 586: 3883,
+        588: 3883, 4194: 3800, 2640: 3823, 593: 3882,
+        594: 3882, 596: 3882, 600: 3882, 4196: 3800,
+        2656: 3823, 609: 3881, 610: 3881, 612: 3881,
+        616: 3881, 624: 3881, 4200: 3800, 2817: 3821,
+        6784: 3766, 2689: 3822, 4738: 3777, 643: 3879,
+        2692: 3822, 645: 3878, 646: 3878, 2696: 3822,
+        649: 3877, 650: 3877, 652: 3877, 2704: 3822,
+        657: 3876, 658: 3876, 660: 3876, 664: 3876,
+        2818: 3821, 2720: 3822, 673: 3875, 674: 3875,
+        676: 3875, 4928: 3776, 680: 3875, 688: 3875,
+        2752: 3822, 705: 3874, 706: 3874, 708: 3874,
+        712: 3874, 720: 3874, 4184: 3801, 736: 3874,
+        6912: 1600, 4865: 3776, 4866: 3776, 771: 3872,
+        2820: 3821, 773: 3871, 774: 3871, 2824: 3821,
+        777: 3870, 778: 3870, 780: 3870, 2832: 3821,
+        785: 3869, 786: 3869, 4227: 3798, 788: 3869,
+        4868: 3776, 792: 3869, 4118: 3812, 4800: 3777,
+        2181: 3842, 2848: 3821, 801: 3868, 802: 3868,
+        804: 3868, 2182: 3842, 808: 3868, 816: 3868,
+        2185: 3841, 2186: 3841, 2880: 3821, 833: 3867,
+        834: 3867, 836: 3867, 840: 3867, 2188: 3841,
+        848: 3867, 864: 3867, 4241: 3795, 4242: 3795,
+        4244: 3795, 2944: 1601, 897: 3866, 898: 3866,
+        900: 3866, 904: 3866, 2076: 3856, 912: 3866,
+        4248: 3795, 928: 3866, 960: 1602, 2209: 3839,
+        4258: 3794, 4260: 3794, 4264: 3794, 6240: 3769,
+        4611: 3783, 2565: 3827, 4272: 3794, 4614: 3782,
+        4617: 3781, 4618: 3781, 4620: 3781, 4625: 3780,
+        4626: 3780, 4628: 3780, 4880: 3776, 4289: 3793,
+        4290: 3793, 4632: 3780, 4292: 3793, 4296: 3793,
+        4641: 3779, 4642: 3779, 4644: 3779, 4304: 3793,
+        4648: 3779, 4992: 3776, 4544: 3785, 4656: 3779,
+        4320: 3793, 2433: 3830, 2625: 3823, 4674: 3778,
+        4676: 3778, 4208: 3800, 4140: 3807, 4680: 3778,
+        4482: 3785, 4688: 3778, 4484: 3785, 4355: 3791,
+        4357: 3790, 4358: 3790, 4361: 3789, 4362: 3789,
+        4704: 3778, 4364: 3789, 4896: 3776, 4369: 3788,
+        4370: 3788, 4372: 3788, 4488: 3785, 4376: 3788,
+        2337: 3832, 4386: 3787, 4388: 3787, 4392: 3787,
+        4737: 3777, 2690: 3822, 4152: 3806, 4740: 3777,
+        4400: 3787, 4744: 3777, 2448: 3830, 4752: 3777,
+        4496: 3785, 2369: 3831, 4418: 3786, 4420: 3786,
+        4424: 3786, 4768: 3777, 4432: 3786 },
+        40: { 384: 3176, 129: 3177, 258: 3176, 3: 3181,
+        132: 3177, 5: 3180, 6: 3180, 1025: 3174,
+        4160: 3172, 4224: 3172, 3072: 3173, 2050: 3173,
+        516: 3175, 144: 3177, 17: 3179, 18: 3179,
+        20: 3179, 4608: 3172, 768: 3175, 576: 3175,
+        260: 3176, 640: 3175, 1028: 3174, 1040: 3174,
+        4097: 3172, 2064: 3173, 1088: 3174, 1152: 3174,
+        257: 3176, 1280: 3174, 513: 3175, 1536: 3174,
+        2052: 3173, 192: 3177, 65: 3178, 66: 3178,
+        68: 3178, 130: 3177, 2112: 3173, 2176: 3173,
+        4352: 3172, 2304: 3173, 4098: 3172, 80: 3178,
+        320: 3176, 514: 3175, 5120: 3172, 2560: 3173,
+        272: 3176, 1026: 3174, 2049: 3173, 6144: 3172,
+        4112: 3172, 528: 3175, 4100: 3172 },
+        1280: { 640: 2734, 2049: 2733, 2050: 2733, 3: 2741,
+        132: 2735, 5: 2740, 6: 2740, 129: 2735,
+        136: 2735, 9: 2739, 10: 2739, 12: 2739,
+        4098: 2732, 144: 2735, 17: 2738, 18: 2738,
+        20: 2738, 4608: 2732, 24: 2738, 516: 2734,
+        160: 2735, 33: 2737, 34: 2737, 4097: 2732,
+        2064: 2733, 40: 2737, 4160: 2732, 48: 2737,
+        520: 2734, 513: 2734, 2056: 2733, 4224: 2732,
+        2052: 2733, 2080: 2733, 192: 2735, 65: 2736,
+        66: 2736, 68: 2736, 130: 2735, 4128: 2732,
+        72: 2736, 2176: 2733, 80: 2736, 514: 2734,
+        2560: 2733, 544: 2734, 36: 2737, 96: 2736,
+        528: 2734, 6144: 2732, 4112: 2732, 2112: 2733,
+        4104: 2732, 576: 2734, 4100: 2732 },
+        48: { 384: 3165, 129: 3166, 2050: 3162, 3: 3170,
+        132: 3166, 5: 3169, 6: 3169, 1025: 3163,
+        136: 3166, 9: 3168, 10: 3168, 12: 3168,
+        1026: 3163, 516: 3164, 320: 3165, 1032: 3163,
+        768: 3164, 576: 3164, 260: 3165, 640: 3164,
+        1028: 3163, 520: 3164, 4097: 3161, 5120: 3161,
+        1088: 3163, 1152: 3163, 257: 3165, 4160: 3161,
+        1280: 3163, 264: 3165, 513: 3164, 2056: 3162,
+        4224: 3161, 2052: 3162, 192: 3166, 65: 3167,
+        66: 3167, 68: 3167, 130: 3166, 72: 3167,
+        258: 3165, 4352: 3161, 2304: 3162, 4098: 3161,
+        1536: 3163, 514: 3164, 2560: 3162, 2049: 3162,
+        6144: 3161, 3072: 3162, 2112: 3162, 4608: 3161,
+        2176: 3162, 4104: 3161, 4100: 3161 },
+        520: { 384: 2889, 129: 2890, 258: 2889, 3: 2895,
+        132: 2890, 5: 2894, 6: 2894, 1025: 2888,
+        4160: 2886, 4224: 2886, 3072: 2887, 288: 2889,
+        2050: 2887, 4352: 2886, 144: 2890, 17: 2893,
+        18: 2893, 20: 2893, 260: 2889, 1028: 2888,
+        1040: 2888, 33: 2892, 34: 2892, 4097: 2886,
+        2064: 2887, 1088: 2888, 1152: 2888, 257: 2889,
+        1280: 2888, 48: 2892, 2052: 2887, 2080: 2887,
+        192: 2890, 65: 2891, 66: 2891, 68: 2891,
+        130: 2890, 4128: 2886, 2112: 2887, 2176: 2887,
+        160: 2890, 2304: 2887, 4098: 2886, 80: 2891,
+        320: 2889, 5120: 2886, 36: 2892, 96: 2891,
+        272: 2889, 1026: 2888, 2049: 2887, 6144: 2886,
+        4112: 2886, 1056: 2888, 4100: 2886 },
+        513: { 384: 2922, 320: 2922, 2050: 2920, 2052: 2920,
+        6: 2928, 2080: 2920, 136: 2923, 10: 2927,
+        3072: 2920, 12: 2927, 1026: 2921, 4352: 2919,
+        144: 2923, 18: 2926, 20: 2926, 1032: 2921,
+        24: 2926, 132: 2923, 1028: 2921, 260: 2922,
+        1040: 2921, 34: 2925, 36: 2925, 2064: 2920,
+        40: 2925, 1152: 2921, 4160: 2919, 1280: 2921,
+        48: 2925, 264: 2922, 2056: 2920, 4224: 2919,
+        288: 2922, 192: 2923, 160: 2923, 66: 2924,
+        68: 2924, 130: 2923, 4128: 2919, 72: 2924,
+        258: 2922, 2304: 2920, 4098: 2919, 80: 2924,
+        5120: 2919, 96: 2924, 272: 2922, 6144: 2919,
+        4112: 2919, 1056: 2921, 2112: 2920, 1088: 2921,
+        2176: 2920, 4104: 2919, 4100: 2919 },
+        1536: { 384: 2723, 2049: 2722, 2050: 2722, 3: 2730,
+        132: 2724, 5: 2729, 6: 2729, 129: 2724,
+        136: 2724, 9: 2728, 10: 2728, 12: 2728,
+        4098: 2721, 4352: 2721, 144: 2724, 17: 2727,
+        18: 2727, 20: 2727, 24: 2727, 260: 2723,
+        160: 2724, 33: 2726, 34: 2726, 4097: 2721,
+        2064: 2722, 40: 2726, 257: 2723, 4160: 2721,
+        48: 2726, 264: 2723, 2056: 2722, 4224: 2721,
+        2052: 2722, 2080: 2722, 192: 2724, 65: 2725,
+        66: 2725, 68: 2725, 130: 2724, 4128: 2721,
+        72: 2725, 258: 2723, 2304: 2722, 288: 2723,
+        80: 2725, 320: 2723, 36: 2726, 96: 2725,
+        272: 2723, 6144: 2721, 4112: 2721, 2112: 2722,
+        2176: 2722, 4104: 2721, 4100: 2721 },
+        4160: { 384: 2526, 129: 2527, 2050: 2523, 3: 2532,
+        132: 2527, 5: 2531, 6: 2531, 1025: 2524,
+        136: 2527, 9: 2530, 10: 2530, 12: 2530,
+        130: 2527, 516: 2525, 144: 2527, 17: 2529,
+        18: 2529, 20: 2529, 1032: 2524, 768: 2525,
+        24: 2529, 260: 2526, 640: 2525, 1028: 2524,
+        520: 2525, 1040: 2524, 33: 2528, 34: 2528,
+        36: 2528, 2064: 2523, 40: 2528, 1152: 2524,
+        257: 2526, 1280: 2524, 48: 2528, 264: 2526,
+        513: 2525, 2056: 2523, 2052: 2523, 2080: 2523,
+        160: 2527, 258: 2526, 2304: 2523, 288: 2526,
+        1536: 2524, 514: 2525, 2560: 2523, 544: 2525,
+        272: 2526, 1026: 2524, 2049: 2523, 3072: 2523,
+        1056: 2524, 2176: 2523, 528: 2525 },
+        65: { 384: 3154, 640: 3153, 258: 3154, 4100: 3150,
+        6: 3159, 2080: 3151, 136: 3155, 10: 3158,
+        132: 3155, 12: 3158, 2050: 3151, 4352: 3150,
+        144: 3155, 18: 3157, 20: 3157, 1032: 3152,
+        768: 3153, 24: 3157, 516: 3153, 520: 3153,
+        1028: 3152, 260: 3154, 1040: 3152, 34: 3156,
+        36: 3156, 2064: 3151, 40: 3156, 1152: 3152,
+        1280: 3152, 48: 3156, 264: 3154, 2056: 3151,
+        4224: 3150, 3072: 3151, 288: 3154, 2052: 3151,
+        160: 3155, 4098: 3150, 5120: 3150, 130: 3155,
+        4128: 3150, 2176: 3151, 2304: 3151, 528: 3153,
+        1536: 3152, 514: 3153, 2560: 3151, 544: 3153,
+        272: 3154, 1026: 3152, 6144: 3150, 4112: 3150,
+        1056: 3152, 4608: 3150, 4104: 3150 },
+        66: { 384: 3143, 129: 3144, 3072: 3140, 132: 3144,
+        5: 3148, 520: 3142, 1025: 3141, 136: 3144,
+        9: 3147, 4224: 3139, 12: 3147, 516: 3142,
+        144: 3144, 17: 3146, 20: 3146, 1032: 3141,
+        768: 3142, 24: 3146, 260: 3143, 640: 3142,
+        1028: 3141, 1040: 3141, 33: 3145, 4097: 3139,
+        2064: 3140, 40: 3145, 1152: 3141, 257: 3143,
+        1280: 3141, 48: 3145, 264: 3143, 513: 3142,
+        2056: 3140, 288: 3143, 2052: 3140, 2080: 3140,
+        160: 3144, 5120: 3139, 6144: 3139, 4128: 3139,
+        2176: 3140, 4352: 3139, 2304: 3140, 528: 3142,
+        1536: 3141, 2560: 3140, 544: 3142, 36: 3145,
+        272: 3143, 2049: 3140, 4112: 3139, 1056: 3141,
+        4608: 3139, 4104: 3139, 4100: 3139 },
+        68: { 384: 3132, 129: 3133, 2050: 3129, 3: 3137,
+        520: 3131, 1025: 3130, 136: 3133, 9: 3136,
+        10: 3136, 3072: 3129, 288: 3132, 1026: 3130,
+        4352: 3128, 144: 3133, 17: 3135, 18: 3135,
+        1032: 3130, 24: 3135, 640: 3131, 768: 3131,
+        1040: 3130, 33: 3134, 34: 3134, 4097: 3128,
+        2064: 3129, 40: 3134, 1152: 3130, 257: 3132,
+        1280: 3130, 48: 3134, 264: 3132, 513: 3131,
+        2056: 3129, 4224: 3128, 2080: 3129, 160: 3133,
+        4098: 3128, 5120: 3128, 130: 3133, 4128: 3128,
+        258: 3132, 2304: 3129, 528: 3131, 1536: 3130,
+        514: 3131, 2560: 3129, 544: 3131, 272: 3132,
+        2049: 3129, 6144: 3128, 4112: 3128, 1056: 3130,
+        4608: 3128, 2176: 3129, 4104: 3128 },
+        2048: { 4103: 3598, 4107: 3596, 4109: 3595, 4110: 3595,
+        15: 3762, 4115: 3593, 4117: 3592, 4118: 3592,
+        23: 3759, 4121: 3591, 4122: 3591, 27: 3757,
+        4124: 3591, 29: 3756, 30: 3756, 4131: 3589,
+        4133: 3588, 4134: 3588, 39: 3753, 4137: 3587,
+        4138: 3587, 43: 3751, 4140: 3587, 45: 3750,
+        46: 3750, 4145: 3586, 4146: 3586, 51: 3748,
+        4148: 3586, 53: 3747, 54: 3747, 4152: 3586,
+        57: 3746, 58: 3746, 60: 3746, 4163: 3584,
+        4165: 3583, 4166: 3583, 71: 3743, 4169: 3582,
+        4170: 3582, 75: 3741, 4172: 3582, 77: 3740,
+        78: 3740, 4177: 3581, 4178: 3581, 83: 3738,
+        4180: 3581, 85: 3737, 86: 3737, 4184: 3581,
+        89: 3736, 90: 3736, 92: 3736, 4193: 3580,
+        4194: 3580, 99: 3734, 4196: 3580, 101: 3733,
+        102: 3733, 4200: 3580, 105: 3732, 106: 3732,
+        108: 3732, 4208: 3580, 113: 3731, 114: 3731,
+        116: 3731, 120: 3731, 4227: 3578, 4229: 3577,
+        4230: 3577, 135: 3728, 4233: 3576, 4234: 3576,
+        139: 3726, 4236: 3576, 141: 3725, 142: 3725,
+        4241: 3575, 4242: 3575, 147: 3723, 4244: 3575,
+        149: 3722, 150: 3722, 4248: 3575, 153: 3721,
+        154: 3721, 156: 3721, 4257: 3574, 4258: 3574,
+        163: 3719, 4260: 3574, 165: 3718, 166: 3718,
+        4264: 3574, 169: 3717, 170: 3717, 172: 3717,
+        4272: 3574, 177: 3716, 178: 3716, 180: 3716,
+        184: 3716, 4289: 3573, 4290: 3573, 195: 3714,
+        4292: 3573, 197: 3713, 198: 3713, 4296: 3573,
+        201: 3712, 202: 3712, 204: 3712, 4304: 3573,
+        209: 3711, 210: 3711, 212: 3711, 216: 3711,
+        4320: 3573, 225: 3710, 226: 3710, 228: 3710,
+        232: 3710, 240: 3710, 4355: 3571, 4357: 3570,
+        4358: 3570, 263: 3707, 4361: 3569, 4362: 3569,
+        267: 3705, 4364: 3569, 269: 3704, 270: 3704,
+        4369: 3568, 4370: 3568, 275: 3702, 4372: 3568,
+        277: 3701, 278: 3701, 4376: 3568, 281: 3700,
+        282: 3700, 284: 3700, 4385: 3567, 4386: 3567,
+        291: 3698, 4388: 3567, 293: 3697, 294: 3697,
+        4392: 3567, 297: 3696, 298: 3696, 300: 3696,
+        4400: 3567, 305: 3695, 306: 3695, 308: 3695,
+        312: 3695, 4417: 3566, 4418: 3566, 323: 3693,
+        4420: 3566, 325: 3692, 326: 3692, 4424: 3566,
+        329: 3691, 330: 3691, 332: 3691, 4432: 3566,
+        337: 3690, 338: 3690, 340: 3690, 344: 3690,
+        4448: 3566, 353: 3689, 354: 3689, 356: 3689,
+        360: 3689, 368: 3689, 4481: 3565, 4482: 3565,
+        387: 3687, 4484: 3565, 389: 3686, 390: 3686,
+        4488: 3565, 393: 3685, 394: 3685, 396: 3685,
+        4496: 3565, 401: 3684, 402: 3684, 404: 3684,
+        408: 3684, 4512: 3565, 417: 3683, 418: 3683,
+        420: 3683, 424: 3683, 432: 3683, 4544: 3565,
+        449: 3682, 450: 3682, 452: 3682, 456: 3682,
+        464: 3682, 480: 3682, 4611: 3563, 4613: 3562,
+        4614: 3562, 519: 3679, 4617: 3561, 4618: 3561,
+        523: 3677, 4620: 3561, 525: 3676, 526: 3676,
+        4625: 3560, 4626: 3560, 531: 3674, 4628: 3560,
+        533: 3673, 534: 3673, 4632: 3560, 537: 3672,
+        538: 3672, 540: 3672, 4641: 3559, 4642: 3559,
+        547: 3670, 4644: 3559, 549: 3669, 550: 3669,
+        4648: 3559, 553: 3668, 554: 3668, 556: 3668,
+        4656: 3559, 561: 3667, 562: 3667, 564: 3667,
+        568: 3667, 4673: 3558, 4674: 3558, 579: 3665,
+        4676: 3558, 581: 3664, 582: 3664, 4680: 3558,
+        585: 3663, 586: 3663, 588: 3663, 4688: 3558,
+        593: 3662, 594: 3662, 596: 3662, 600: 3662,
+        4704: 3558, 609: 3661, 610: 3661, 612: 3661,
+        616: 3661, 624: 3661, 4737: 3557, 4738: 3557,
+        643: 3659, 4740: 3557, 645: 3658, 646: 3658,
+        4744: 3557, 649: 3657, 650: 3657, 652: 3657,
+        4752: 3557, 657: 3656, 658: 3656, 660: 3656,
+        664: 3656, 4768: 3557, 673: 3655, 674: 3655,
+        676: 3655, 680: 3655, 688: 3655, 4800: 3557,
+        705: 3654, 706: 3654, 708: 3654, 712: 3654,
+        720: 3654, 736: 3654, 4865: 3556, 4866: 3556,
+        771: 3652, 4868: 3556, 773: 3651, 774: 3651,
+        4872: 3556, 777: 3650, 778: 3650, 780: 3650,
+        4880: 3556, 785: 3649, 786: 3649, 788: 3649,
+        792: 3649, 4896: 3556, 801: 3648, 802: 3648,
+        804: 3648, 808: 3648, 816: 3648, 4928: 3556,
+        833: 3647, 834: 3647, 836: 3647, 840: 3647,
+        848: 3647, 864: 3647, 4992: 3556, 897: 3646,
+        898: 3646, 900: 3646, 904: 3646, 912: 3646,
+        928: 3646, 960: 3646, 5123: 3554, 5125: 3553,
+        5126: 3553, 1031: 3643, 5129: 3552, 5130: 3552,
+        1035: 3641, 5132: 3552, 1037: 3640, 1038: 3640,
+        5137: 3551, 5138: 3551, 1043: 3638, 5140: 3551,
+        1045: 3637, 1046: 3637, 5144: 3551, 1049: 3636,
+        1050: 3636, 1052: 3636, 5153: 3550, 5154: 3550,
+        1059: 3634, 5156: 3550, 1061: 3633, 1062: 3633,
+        5160: 3550, 1065: 3632, 1066: 3632, 1068: 3632,
+        5168: 3550, 1073: 3631, 1074: 3631, 1076: 3631,
+        1080: 3631, 5185: 3549, 5186: 3549, 1091: 3629,
+        5188: 3549, 1093: 3628, 1094: 3628, 5192: 3549,
+        1097: 3627, 1098: 3627, 1100: 3627, 5200: 3549,
+        1105: 3626, 1106: 3626, 1108: 3626, 1112: 3626,
+        5216: 3549, 1121: 3625, 1122: 3625, 1124: 3625,
+        1128: 3625, 1136: 3625, 5249: 3548, 5250: 3548,
+        1155: 3623, 5252: 3548, 1157: 3622, 1158: 3622,
+        5256: 3548, 1161: 3621, 1162: 3621, 1164: 3621,
+        5264: 3548, 1169: 3620, 1170: 3620, 1172: 3620,
+        1176: 3620, 5280: 3548, 1185: 3619, 1186: 3619,
+        1188: 3619, 1192: 3619, 1200: 3619, 5312: 3548,
+        1217: 3618, 1218: 3618, 1220: 3618, 1224: 3618,
+        1232: 3618, 1248: 3618, 5377: 3547, 5378: 3547,
+        1283: 3616, 5380: 3547, 1285: 3615, 1286: 3615,
+        5384: 3547, 1289: 3614, 1290: 3614, 1292: 3614,
+        5392: 3547, 1297: 3613, 1298: 3613, 1300: 3613,
+        1304: 3613, 5408: 3547, 1313: 3612, 1314: 3612,
+        1316: 3612, 1320: 3612, 1328: 3612, 5440: 3547,
+        1345: 3611, 1346: 3611, 1348: 3611, 1352: 3611,
+        1360: 3611, 1376: 3611, 5504: 3547, 1409: 3610,
+        1410: 3610, 1412: 3610, 1416: 3610, 1424: 3610,
+        1440: 3610, 1472: 3610, 5633: 3546, 5634: 3546,
+        1539: 3608, 5636: 3546, 1541: 3607, 1542: 3607,
+        5640: 3546, 1545: 3606, 1546: 3606, 1548: 3606,
+        5648: 3546, 1553: 3605, 1554: 3605, 1556: 3605,
+        1560: 3605, 5664: 3546, 1569: 3604, 1570: 3604,
+        1572: 3604, 1576: 3604, 1584: 3604, 5696: 3546,
+        1601: 3603, 1602: 3603, 1604: 3603, 1608: 3603,
+        1616: 3603, 1632: 3603, 5760: 3546, 1665: 3602,
+        1666: 3602, 1668: 3602, 1672: 3602, 1680: 3602,
+        1696: 3602, 1728: 3602, 5888: 1600, 1793: 3601,
+        1794: 3601, 1796: 3601, 1800: 3601, 1808: 3601,
+        1824: 3601, 1856: 3601, 1920: 1601 },
+        4128: { 384: 2537, 129: 2538, 2050: 2534, 3: 2543,
+        132: 2538, 5: 2542, 6: 2542, 1025: 2535,
+        136: 2538, 9: 2541, 10: 2541, 12: 2541,
+        130: 2538, 516: 2536, 144: 2538, 17: 2540,
+        18: 2540, 20: 2540, 1032: 2535, 768: 2536,
+        24: 2540, 260: 2537, 640: 2536, 1028: 2535,
+        520: 2536, 1040: 2535, 2064: 2534, 1088: 2535,
+        1152: 2535, 257: 2537, 1280: 2535, 264: 2537,
+        513: 2536, 2056: 2534, 2052: 2534, 192: 2538,
+        65: 2539, 66: 2539, 68: 2539, 72: 2539,
+        258: 2537, 2304: 2534, 80: 2539, 320: 2537,
+        514: 2536, 2560: 2534, 272: 2537, 1026: 2535,
+        2049: 2534, 3072: 2534, 2112: 2534, 1536: 2535,
+        2176: 2534, 528: 2536, 576: 2536 },
+        72: { 384: 3121, 129: 3122, 258: 3121, 3: 3126,
+        132: 3122, 5: 3125, 6: 3125, 1025: 3119,
+        4224: 3117, 3072: 3118, 2050: 3118, 516: 3120,
+        144: 3122, 17: 3124, 18: 3124, 20: 3124,
+        4608: 3117, 768: 3120, 260: 3121, 640: 3120,
+        1028: 3119, 1040: 3119, 33: 3123, 34: 3123,
+        4097: 3117, 2064: 3118, 1152: 3119, 257: 3121,
+        1280: 3119, 48: 3123, 513: 3120, 1536: 3119,
+        2052: 3118, 2080: 3118, 160: 3122, 4098: 3117,
+        5120: 3117, 130: 3122, 4128: 3117, 2176: 3118,
+        4352: 3117, 2304: 3118, 288: 3121, 514: 3120,
+        2560: 3118, 544: 3120, 36: 3123, 272: 3121,
+        1026: 3119, 2049: 3118, 6144: 3117, 4112: 3117,
+        1056: 3119, 528: 3120, 4100: 3117 },
+        2304: { 640: 2624, 1025: 2623, 1026: 2623, 3: 2631,
+        132: 2625, 5: 2630, 6: 2630, 129: 2625,
+        136: 2625, 9: 2629, 10: 2629, 12: 2629,
+        4098: 2622, 144: 2625, 17: 2628, 18: 2628,
+        20: 2628, 1032: 2623, 24: 2628, 516: 2624,
+        1028: 2623, 1040: 2623, 33: 2627, 34: 2627,
+        4097: 2622, 5120: 2622, 40: 2627, 1152: 2623,
+        4160: 2622, 48: 2627, 520: 2624, 513: 2624,
+        1536: 2623, 4224: 2622, 192: 2625, 65: 2626,
+        66: 2626, 68: 2626, 130: 2625, 4128: 2622,
+        72: 2626, 1088: 2623, 160: 2625, 80: 2626,
+        514: 2624, 544: 2624, 36: 2627, 96: 2626,
+        528: 2624, 4112: 2622, 1056: 2623, 4608: 2622,
+        4104: 2622, 576: 2624, 4100: 2622 },
+        80: { 384: 3110, 129: 3111, 2050: 3107, 3: 3115,
+        132: 3111, 5: 3114, 6: 3114, 1025: 3108,
+        136: 3111, 9: 3113, 10: 3113, 12: 3113,
+        1026: 3108, 516: 3109, 1536: 3108, 1032: 3108,
+        768: 3109, 260: 3110, 640: 3109, 1028: 3108,
+        520: 3109, 160: 3111, 33: 3112, 34: 3112,
+        4097: 3106, 2080: 3107, 40: 3112, 1152: 3108,
+        257: 3110, 1280: 3108, 264: 3110, 513: 3109,
+        2056: 3107, 4224: 3106, 2052: 3107, 288: 3110,
+        4098: 3106, 5120: 3106, 130: 3111, 4128: 3106,
+        258: 3110, 4352: 3106, 2304: 3107, 514: 3109,
+        2560: 3107, 544: 3109, 36: 3112, 2049: 3107,
+        6144: 3106, 3072: 3107, 1056: 3108, 4608: 3106,
+        2176: 3107, 4104: 3106, 4100: 3106 },
+        514: { 384: 2911, 129: 2912, 3072: 2909, 132: 2912,
+        5: 2917, 260: 2911, 1025: 2910, 136: 2912,
+        9: 2916, 4224: 2908, 12: 2916, 4352: 2908,
+        144: 2912, 17: 2915, 20: 2915, 1032: 2910,
+        24: 2915, 2052: 2909, 1028: 2910, 1040: 2910,
+        33: 2914, 4097: 2908, 2064: 2909, 40: 2914,
+        1152: 2910, 257: 2911, 4160: 2908, 1280: 2910,
+        48: 2914, 264: 2911, 2056: 2909, 2080: 2909,
+        192: 2912, 65: 2913, 68: 2913, 6144: 2908,
+        4128: 2908, 72: 2913, 1088: 2910, 160: 2912,
+        2304: 2909, 288: 2911, 80: 2913, 320: 2911,
+        5120: 2908, 36: 2914, 96: 2913, 272: 2911,
+        2049: 2909, 4112: 2908, 1056: 2910, 2112: 2909,
+        2176: 2909, 4104: 2908, 4100: 2908 },
+        2560: { 384: 2613, 1025: 2612, 4098: 2611, 3: 2620,
+        132: 2614, 5: 2619, 6: 2619, 129: 2614,
+        136: 2614, 9: 2618, 10: 2618, 12: 2618,
+        258: 2613, 4352: 2611, 144: 2614, 17: 2617,
+        18: 2617, 20: 2617, 1032: 2612, 24: 2617,
+        260: 2613, 1028: 2612, 1040: 2612, 33: 2616,
+        34: 2616, 4097: 2611, 5120: 2611, 40: 2616,
+        1152: 2612, 257: 2613, 4160: 2611, 1280: 2612,
+        48: 2616, 264: 2613, 4224: 2611, 192: 2614,
+        65: 2615, 66: 2615, 68: 2615, 130: 2614,
+        4128: 2611, 72: 2615, 1088: 2612, 160: 2614,
+        288: 2613, 80: 2615, 320: 2613, 36: 2616,
+        96: 2615, 272: 2613, 1026: 2612, 4112: 2611,
+        1056: 2612, 4104: 2611, 4100: 2611 },
+        96: { 384: 3099, 129: 3100, 130: 3100, 3: 3104,
+        132: 3100, 5: 3103, 6: 3103, 1025: 3097,
+        136: 3100, 9: 3102, 10: 3102, 3072: 3096,
+        12: 3102, 2050: 3096, 516: 3098, 144: 3100,
+        17: 3101, 18: 3101, 20: 3101, 1032: 3097,
+        768: 3098, 24: 3101, 260: 3099, 640: 3098,
+        1028: 3097, 520: 3098, 1040: 3097, 4097: 3095,
+        2064: 3096, 1152: 3097, 257: 3099, 1280: 3097,
+        264: 3099, 513: 3098, 2056: 3096, 4224: 3095,
+        2052: 3096, 4098: 3095, 5120: 3095, 6144: 3095,
+        258: 3099, 4352: 3095, 2304: 3096, 528: 3098,
+        1536: 3097, 514: 3098, 2560: 3096, 272: 3099,
+        1026: 3097, 2049: 3096, 4112: 3095, 4608: 3095,
+        2176: 3096, 4104: 3095, 4100: 3095 },
+        528: { 384: 2878, 129: 2879, 2050: 2876, 3: 2884,
+        132: 2879, 5: 2883, 6: 2883, 1025: 2877,
+        136: 2879, 9: 2882, 10: 2882, 12: 2882,
+        4098: 2875, 4352: 2875, 320: 2878, 1032: 2877,
+        260: 2878, 1028: 2877, 160: 2879, 33: 2881,
+        34: 2881, 4097: 2875, 2080: 2876, 40: 2881,
+        1152: 2877, 257: 2878, 4160: 2875, 1280: 2877,
+        264: 2878, 2056: 2876, 4224: 2875, 2052: 2876,
+        192: 2879, 65: 2880, 66: 2880, 68: 2880,
+        130: 2879, 4128: 2875, 72: 2880, 258: 2878,
+        2304: 2876, 288: 2878, 5120: 2875, 36: 2881,
+        96: 2880, 1026: 2877, 2049: 2876, 6144: 2875,
+        3072: 2876, 1056: 2877, 2112: 2876, 1088: 2877,
+        2176: 2876, 4104: 2875, 4100: 2875 },
+        1026: { 384: 2812, 129: 2813, 132: 2813, 5: 2818,
+        260: 2812, 2049: 2810, 136: 2813, 9: 2817,
+        4224: 2809, 12: 2817, 4352: 2809, 144: 2813,
+        17: 2816, 20: 2816, 4608: 2809, 24: 2816,
+        516: 2811, 640: 2811, 768: 2811, 520: 2811,
+        160: 2813, 33: 2815, 4097: 2809, 2064: 2810,
+        40: 2815, 257: 2812, 4160: 2809, 48: 2815,
+        264: 2812, 513: 2811, 2056: 2810, 288: 2812,
+        2052: 2810, 2080: 2810, 192: 2813, 65: 2814,
+        68: 2814, 6144: 2809, 4128: 2809, 72: 2814,
+        2176: 2810, 2304: 2810, 528: 2811, 80: 2814,
+        320: 2812, 2560: 2810, 544: 2811, 36: 2815,
+        96: 2814, 272: 2812, 4112: 2809, 2112: 2810,
+        4104: 2809, 576: 2811, 4100: 2809 },
+        2049: { 384: 2713, 320: 2713, 1026: 2711, 4100: 2710,
+        6: 2719, 136: 2714, 10: 2718, 12: 2718,
+        4098: 2710, 516: 2712, 144: 2714, 18: 2717,
+        20: 2717, 1032: 2711, 768: 2712, 24: 2717,
+        132: 2714, 640: 2712, 520: 2712, 1028: 2711,
+        260: 2713, 1040: 2711, 34: 2716, 36: 2716,
+        5120: 2710, 40: 2716, 1152: 2711, 4160: 2710,
+        1280: 2711, 48: 2716, 264: 2713, 1536: 2711,
+        4224: 2710, 288: 2713, 192: 2714, 160: 2714,
+        66: 2715, 68: 2715, 130: 2714, 4128: 2710,
+        72: 2715, 258: 2713, 4352: 2710, 528: 2712,
+        80: 2715, 514: 2712, 544: 2712, 4608: 2710,
+        96: 2715, 272: 2713, 4112: 2710, 1056: 2711,
+        1088: 2711, 4104: 2710, 576: 2712 },
+        4112: { 384: 2548, 129: 2549, 2050: 2545, 3: 2554,
+        132: 2549, 5: 2553, 6: 2553, 1025: 2546,
+        136: 2549, 9: 2552, 10: 2552, 12: 2552,
+        514: 2547, 516: 2547, 320: 2548, 1032: 2546,
+        768: 2547, 576: 2547, 260: 2548, 640: 2547,
+        1028: 2546, 520: 2547, 160: 2549, 33: 2551,
+        34: 2551, 36: 2551, 2080: 2545, 40: 2551,
+        1152: 2546, 257: 2548, 1280: 2546, 264: 2548,
+        513: 2547, 2056: 2545, 2052: 2545, 192: 2549,
+        65: 2550, 66: 2550, 68: 2550, 130: 2549,
+        72: 2550, 258: 2548, 2304: 2545, 288: 2548,
+        1536: 2546, 2560: 2545, 544: 2547, 96: 2550,
+        1026: 2546, 2049: 2545, 3072: 2545, 1056: 2546,
+        2112: 2545, 1088: 2546, 2176: 2545 },
+        128: { 6147: 4434, 6149: 4433, 6150: 4433, 2055: 4523,
+        6153: 4432, 6154: 4432, 2059: 4521, 6156: 4432,
+        4109: 4475, 4110: 4475, 15: 4642, 6161: 4431,
+        6162: 4431, 2067: 4518, 6164: 4431, 2069: 4517,
+        2070: 4517, 23: 4639, 6168: 4431, 2073: 4516,
+        2074: 4516, 27: 4637, 4124: 4471, 29: 4636,
+        30: 4636, 3077: 4487, 6177: 4430, 6178: 4430,
+        4131: 4469, 6180: 4430, 2085: 4513, 2086: 4513,
+        39: 4633, 6184: 4430, 4137: 4467, 2090: 4512,
+        43: 4631, 4140: 4467, 45: 4630, 46: 4630,
+        6192: 4430, 2097: 4511, 2098: 4511, 51: 4628,
+        2100: 4511, 53: 4627, 54: 4627, 5129: 4441,
+        2104: 4511, 57: 4626, 58: 4626, 60: 4626,
+        3082: 4486, 6209: 4429, 6210: 4429, 4163: 4464,
+        6212: 4429, 4165: 4463, 2118: 4508, 71: 4623,
+        6216: 4429, 2121: 4507, 4170: 4462, 75: 4621,
+        4172: 4462, 77: 4620, 78: 4620, 2061: 4520,
+        6224: 4429, 4177: 4461, 4178: 4461, 83: 4618,
+        2132: 4506, 85: 4617, 86: 4617, 2136: 4506,
+        89: 4616, 90: 4616, 92: 4616, 344: 4591,
+        4193: 4460, 4194: 4460, 99: 4614, 2148: 4505,
+        101: 4613, 102: 4613, 5137: 4440, 2152: 4505,
+        105: 4612, 106: 4612, 108: 4612, 5138: 4440,
+        2160: 4505, 113: 4611, 114: 4611, 4115: 4473,
+        116: 4611, 120: 1605, 5140: 4440, 4117: 4472,
+        4118: 4472, 5144: 4440, 4121: 4471, 4122: 4471,
+        2076: 4516, 3075: 4488, 3105: 4484, 3106: 4484,
+        2083: 4514, 5156: 4439, 4133: 4468, 4134: 4468,
+        5160: 4439, 2089: 4512, 1031: 4559, 4138: 4467,
+        6401: 4428, 6402: 4428, 4355: 4458, 6404: 4428,
+        4357: 4457, 2310: 4502, 263: 4608, 6408: 4428,
+        4361: 4456, 2314: 4501, 267: 4606, 4364: 4456,
+        269: 4605, 270: 4605, 6416: 4428, 2321: 4500,
+        4370: 4455, 275: 4603, 4372: 4455, 277: 4602,
+        278: 4602, 2328: 4500, 281: 4601, 282: 4601,
+        284: 4601, 6432: 4428, 4385: 4454, 4386: 4454,
+        291: 4599, 2340: 4499, 293: 4598, 294: 4598,
+        4145: 4466, 2344: 4499, 297: 4597, 298: 4597,
+        300: 4597, 4146: 4466, 2352: 4499, 305: 4596,
+        306: 4596, 308: 4596, 312: 4596, 4148: 4466,
+        6464: 4428, 4417: 4453, 2370: 4498, 323: 4594,
+        2372: 4498, 325: 4593, 326: 4593, 2376: 4498,
+        329: 4592, 330: 4592, 332: 4592, 2384: 4498,
+        337: 4591, 338: 4591, 340: 4591, 4103: 4478,
+        2400: 4498, 353: 4590, 354: 4590, 356: 4590,
+        360: 4590, 368: 1604, 5185: 4438, 5186: 4438,
+        2115: 4509, 5188: 4438, 2117: 4508, 4166: 4463,
+        5192: 4438, 4169: 4462, 2122: 4507, 2124: 4507,
+        4107: 4476, 4448: 4453, 5200: 4438, 2129: 4506,
+        2062: 4520, 2130: 4506, 4180: 4461, 6657: 4427,
+        6658: 4427, 2563: 4496, 6660: 4427, 2565: 4495,
+        2566: 4495, 4865: 4445, 6664: 4427, 2569: 4494,
+        2570: 4494, 523: 4585, 2572: 4494, 4866: 4445,
+        526: 4584, 6672: 4427, 2577: 4493, 4626: 4448,
+        531: 4582, 2580: 4493, 533: 4581, 534: 4581,
+        2584: 4493, 537: 4580, 538: 4580, 540: 4580,
+        6688: 4427, 4641: 4447, 4642: 4447, 547: 4578,
+        2596: 4492, 549: 4577, 550: 4577, 2600: 4492,
+        553: 4576, 554: 4576, 556: 4576, 2608: 4492,
+        561: 4575, 562: 4575, 564: 4575, 4656: 4447,
+        568: 4575, 6720: 4427, 4673: 4446, 2626: 4491,
+        579: 4573, 2628: 4491, 581: 4572, 582: 4572,
+        2145: 4505, 2632: 4491, 585: 4571, 586: 4571,
+        5132: 4441, 2146: 4505, 2640: 4491, 593: 4570,
+        594: 4570, 596: 4570, 600: 4570, 4196: 4460,
+        2656: 4491, 609: 4569, 610: 4569, 612: 4569,
+        616: 4569, 624: 4569, 4200: 4460, 4208: 4460,
+        5888: 4436, 4896: 4445, 4184: 4461, 6912: 4427,
+        2817: 4490, 2818: 4490, 771: 4567, 2820: 4490,
+        773: 4566, 774: 4566, 2824: 4490, 777: 4565,
+        778: 4565, 780: 4565, 2832: 4490, 785: 4564,
+        786: 4564, 788: 4564, 4868: 4445, 792: 4564,
+        2848: 4490, 801: 4563, 802: 4563, 804: 4563,
+        808: 4563, 816: 4563, 2880: 4490, 833: 4562,
+        834: 4562, 836: 4562, 840: 4562, 848: 4562,
+        864: 1603, 4928: 4445, 4872: 4445, 5216: 4438,
+        7169: 4426, 7170: 4426, 5123: 4443, 7172: 4426,
+        5125: 4442, 5126: 4442, 5633: 4436, 7176: 4426,
+        3081: 4486, 5130: 4441, 1035: 4557, 3084: 4486,
+        1037: 4556, 1038: 4556, 7184: 4426, 3089: 4485,
+        3090: 4485, 1043: 4554, 3092: 4485, 1045: 4553,
+        1046: 4553, 3096: 4485, 1049: 4552, 1050: 4552,
+        1052: 4552, 4613: 4450, 7200: 4426, 5153: 4439,
+        5154: 4439, 1059: 4550, 3108: 4484, 1061: 4549,
+        1062: 4549, 3112: 4484, 1065: 4548, 1066: 4548,
+        519: 4587, 1068: 4548, 3120: 4484, 1073: 4547,
+        1074: 4547, 1076: 4547, 4617: 4449, 1080: 4547,
+        4618: 4449, 7232: 4426, 3137: 4483, 3138: 4483,
+        1091: 4545, 3140: 4483, 1093: 4544, 1094: 4544,
+        3144: 4483, 1097: 4543, 1098: 4543, 1100: 4543,
+        525: 4584, 3152: 4483, 1105: 4542, 1106: 4542,
+        1108: 4542, 1112: 4542, 3168: 4483, 1121: 4541,
+        1122: 4541, 1124: 4541, 4625: 4448, 1128: 4541,
+        2578: 4493, 1136: 4541, 4628: 4448, 4880: 4445,
+        4632: 4448, 3586: 4481, 5664: 4436, 2593: 4492,
+        2594: 4492, 4644: 4447, 4611: 4451, 4648: 4447,
+        7424: 4426, 5377: 4437, 5378: 4437, 1283: 4539,
+        3332: 4482, 1285: 4538, 1286: 4538, 3336: 4482,
+        1289: 4537, 1290: 4537, 1292: 4537, 3344: 4482,
+        1297: 4536, 1298: 4536, 1300: 4536, 1304: 4536,
+        3360: 4482, 1313: 4535, 1314: 4535, 1316: 4535,
+        1320: 4535, 5636: 4436, 1328: 4535, 3392: 4482,
+        1345: 4534, 1346: 4534, 1348: 4534, 1352: 4534,
+        4614: 4450, 1360: 4534, 1376: 4534, 2092: 4512,
+        5696: 4436, 6240: 4429, 3078: 4487, 2625: 4491,
+        4674: 4446, 4676: 4446, 5640: 4436, 4680: 4446,
+        588: 4571, 4688: 4446, 4620: 4449, 7680: 4426,
+        3585: 4481, 5634: 4436, 1539: 4532, 3588: 4481,
+        1541: 4531, 1542: 4531, 3329: 4482, 3592: 4481,
+        1545: 4530, 1546: 4530, 1548: 4530, 3330: 4482,
+        3600: 4481, 1553: 4529, 1554: 4529, 2307: 4503,
+        1556: 4529, 1560: 4529, 5380: 4437, 2309: 4502,
+        3616: 4481, 1569: 4528, 1570: 4528, 1572: 4528,
+        4358: 4457, 1576: 4528, 1584: 4528, 5384: 4437,
+        2313: 4501, 4362: 4456, 3648: 4481, 1601: 4527,
+        1602: 4527, 1604: 4527, 5168: 4439, 1608: 4527,
+        2316: 4501, 1616: 4527, 1632: 4527, 5392: 4437,
+        4369: 4455, 2322: 4500, 2324: 4500, 4376: 4455,
+        5648: 4436, 5408: 4437, 2337: 4499, 2338: 4499,
+        4388: 4454, 4392: 4454, 3840: 1601, 1793: 4526,
+        1794: 4526, 1796: 4526, 1800: 4526, 1808: 4526,
+        4152: 4466, 1824: 4526, 4400: 4454, 1856: 1602,
+        5440: 4437, 2369: 4498, 4418: 4453, 4420: 4453,
+        4424: 4453, 4704: 4446, 4432: 4453 },
+        129: { 768: 3087, 576: 3087, 258: 3088, 4100: 3084,
+        6: 3093, 2080: 3085, 264: 3088, 10: 3092,
+        3072: 3085, 12: 3092, 2050: 3085, 4352: 3084,
+        272: 3088, 18: 3091, 20: 3091, 1032: 3086,
+        24: 3091, 516: 3087, 1028: 3086, 260: 3088,
+        1040: 3086, 34: 3090, 36: 3090, 2064: 3085,
+        40: 3090, 4160: 3084, 1280: 3086, 48: 3090,
+        520: 3087, 2056: 3085, 2052: 3085, 320: 3088,
+        288: 3088, 66: 3089, 68: 3089, 6144: 3084,
+        4128: 3084, 72: 3089, 1088: 3086, 2304: 3085,
+        4098: 3084, 80: 3089, 1536: 3086, 514: 3087,
+        5120: 3084, 2560: 3085, 544: 3087, 96: 3089,
+        528: 3087, 1026: 3086, 4112: 3084, 1056: 3086,
+        2112: 3085, 4608: 3084, 4104: 3084 },
+        130: { 768: 3076, 1025: 3075, 3072: 3074, 516: 3076,
+        5: 3082, 260: 3077, 257: 3077, 264: 3077,
+        9: 3081, 12: 3081, 4352: 3073, 272: 3077,
+        17: 3080, 20: 3080, 1032: 3075, 24: 3080,
+        1028: 3075, 1040: 3075, 33: 3079, 4097: 3073,
+        2064: 3074, 40: 3079, 4160: 3073, 1280: 3075,
+        48: 3079, 520: 3076, 513: 3076, 2056: 3074,
+        2052: 3074, 2080: 3074, 320: 3077, 65: 3078,
+        68: 3078, 6144: 3073, 4128: 3073, 72: 3078,
+        1088: 3075, 2304: 3074, 288: 3077, 80: 3078,
+        1536: 3075, 5120: 3073, 2560: 3074, 544: 3076,
+        36: 3079, 96: 3078, 528: 3076, 2049: 3074,
+        4112: 3073, 1056: 3075, 2112: 3074, 4608: 3073,
+        4104: 3073, 576: 3076, 4100: 3073 },
+        132: { 768: 3065, 257: 3066, 2050: 3063, 3: 3071,
+        1040: 3064, 1025: 3064, 264: 3066, 9: 3070,
+        10: 3070, 3072: 3063, 1026: 3064, 4352: 3062,
+        272: 3066, 17: 3069, 18: 3069, 1032: 3064,
+        24: 3069, 288: 3066, 33: 3068, 34: 3068,
+        4097: 3062, 2064: 3063, 40: 3068, 4160: 3062,
+        1280: 3064, 48: 3068, 520: 3065, 513: 3065,
+        2056: 3063, 2080: 3063, 320: 3066, 65: 3067,
+        66: 3067, 5120: 3062, 4608: 3062, 4128: 3062,
+        72: 3067, 258: 3066, 2304: 3063, 4098: 3062,
+        80: 3067, 1536: 3064, 514: 3065, 2560: 3063,
+        544: 3065, 96: 3067, 528: 3065, 2049: 3063,
+        6144: 3062, 4112: 3062, 1056: 3064, 2112: 3063,
+        1088: 3064, 4104: 3062, 576: 3065 },
+        136: { 768: 3054, 257: 3055, 258: 3055, 3: 3060,
+        260: 3055, 5: 3059, 6: 3059, 1025: 3053,
+        4160: 3051, 3072: 3052, 288: 3055, 2050: 3052,
+        4352: 3051, 272: 3055, 17: 3058, 18: 3058,
+        20: 3058, 4608: 3051, 576: 3054, 516: 3054,
+        1028: 3053, 1040: 3053, 33: 3057, 34: 3057,
+        4097: 3051, 2064: 3052, 1088: 3053, 1280: 3053,
+        48: 3057, 513: 3054, 1536: 3053, 2052: 3052,
+        2080: 3052, 320: 3055, 65: 3056, 66: 3056,
+        68: 3056, 6144: 3051, 4128: 3051, 2112: 3052,
+        2304: 3052, 4098: 3051, 80: 3056, 514: 3054,
+        5120: 3051, 2560: 3052, 544: 3054, 36: 3057,
+        96: 3056, 528: 3054, 1026: 3053, 2049: 3052,
+        4112: 3051, 1056: 3053, 4100: 3051 },
+        516: { 384: 2900, 129: 2901, 2050: 2898, 3: 2906,
+        1040: 2899, 1025: 2899, 136: 2901, 9: 2905,
+        10: 2905, 3072: 2898, 4098: 2897, 4352: 2897,
+        144: 2901, 17: 2904, 18: 2904, 1032: 2899,
+        24: 2904, 160: 2901, 33: 2903, 34: 2903,
+        4097: 2897, 2064: 2898, 40: 2903, 1152: 2899,
+        257: 2900, 4160: 2897, 1280: 2899, 48: 2903,
+        264: 2900, 2056: 2898, 4224: 2897, 2080: 2898,
+        192: 2901, 65: 2902, 66: 2902, 5120: 2897,
+        130: 2901, 4128: 2897, 72: 2902, 258: 2900,
+        2304: 2898, 288: 2900, 80: 2902, 320: 2900,
+        96: 2902, 272: 2900, 1026: 2899, 2049: 2898,
+        6144: 2897, 4112: 2897, 1056: 2899, 2112: 2898,
+        1088: 2899, 2176: 2898, 4104: 2897 },
+        144: { 768: 3043, 257: 3044, 2050: 3041, 3: 3049,
+        260: 3044, 5: 3048, 6: 3048, 1025: 3042,
+        264: 3044, 9: 3047, 10: 3047, 12: 3047,
+        1026: 3042, 4352: 3040, 1536: 3042, 1032: 3042,
+        576: 3043, 516: 3043, 1028: 3042, 288: 3044,
+        33: 3046, 34: 3046, 4097: 3040, 2080: 3041,
+        40: 3046, 4160: 3040, 1280: 3042, 520: 3043,
+        513: 3043, 2056: 3041, 2052: 3041, 320: 3044,
+        65: 3045, 66: 3045, 68: 3045, 4608: 3040,
+        4128: 3040, 72: 3045, 258: 3044, 2304: 3041,
+        4098: 3040, 514: 3043, 5120: 3040, 2560: 3041,
+        544: 3043, 36: 3046, 96: 3045, 2049: 3041,
+        6144: 3040, 3072: 3041, 1056: 3042, 2112: 3041,
+        1088: 3042, 4104: 3040, 4100: 3040 },
+        4608: { 384: 2492, 1025: 2491, 2050: 2490, 3: 2499,
+        132: 2493, 5: 2498, 6: 2498, 129: 2493,
+        136: 2493, 9: 2497, 10: 2497, 12: 2497,
+        258: 2492, 144: 2493, 17: 2496, 18: 2496,
+        20: 2496, 1032: 2491, 24: 2496, 260: 2492,
+        1028: 2491, 1040: 2491, 33: 2495, 34: 2495,
+        36: 2495, 2064: 2490, 40: 2495, 1152: 2491,
+        257: 2492, 1280: 2491, 48: 2495, 264: 2492,
+        2056: 2490, 2052: 2490, 2080: 2490, 192: 2493,
+        65: 2494, 66: 2494, 68: 2494, 130: 2493,
+        72: 2494, 1088: 2491, 160: 2493, 2304: 2490,
+        288: 2492, 80: 2494, 320: 2492, 96: 2494,
+        272: 2492, 1026: 2491, 2049: 2490, 3072: 2490,
+        1056: 2491, 2112: 2490, 2176: 2490 },
+        160: { 768: 3032, 257: 3033, 2050: 3030, 3: 3038,
+        260: 3033, 5: 3037, 6: 3037, 1025: 3031,
+        264: 3033, 9: 3036, 10: 3036, 3072: 3030,
+        12: 3036, 1026: 3031, 4352: 3029, 272: 3033,
+        17: 3035, 18: 3035, 20: 3035, 1032: 3031,
+        24: 3035, 516: 3032, 1028: 3031, 1040: 3031,
+        4097: 3029, 2064: 3030, 1088: 3031, 4160: 3029,
+        1280: 3031, 520: 3032, 513: 3032, 2056: 3030,
+        2052: 3030, 320: 3033, 65: 3034, 66: 3034,
+        68: 3034, 6144: 3029, 72: 3034, 258: 3033,
+        2304: 3030, 4098: 3029, 80: 3034, 1536: 3031,
+        514: 3032, 5120: 3029, 2560: 3030, 528: 3032,
+        2049: 3030, 4112: 3029, 2112: 3030, 4608: 3029,
+        4104: 3029, 576: 3032, 4100: 3029 },
+        1040: { 384: 2779, 129: 2780, 2050: 2777, 3: 2785,
+        132: 2780, 5: 2784, 6: 2784, 2049: 2777,
+        136: 2780, 9: 2783, 10: 2783, 12: 2783,
+        4098: 2776, 516: 2778, 320: 2779, 4608: 2776,
+        576: 2778, 260: 2779, 640: 2778, 768: 2778,
+        520: 2778, 160: 2780, 33: 2782, 34: 2782,
+        4097: 2776, 2080: 2777, 40: 2782, 257: 2779,
+        4160: 2776, 264: 2779, 513: 2778, 2056: 2777,
+        4224: 2776, 2052: 2777, 192: 2780, 65: 2781,
+        66: 2781, 68: 2781, 130: 2780, 4128: 2776,
+        72: 2781, 258: 2779, 4352: 2776, 2304: 2777,
+        288: 2779, 514: 2778, 2560: 2777, 544: 2778,
+        36: 2782, 96: 2781, 6144: 2776, 2112: 2777,
+        2176: 2777, 4104: 2776, 4100: 2776 },
+        4097: { 384: 2592, 320: 2592, 2050: 2589, 516: 2591,
+        6: 2598, 2080: 2589, 136: 2593, 10: 2597,
+        132: 2593, 12: 2597, 1026: 2590, 144: 2593,
+        18: 2596, 20: 2596, 1032: 2590, 768: 2591,
+        24: 2596, 2052: 2589, 640: 2591, 520: 2591,
+        1028: 2590, 260: 2592, 1040: 2590, 34: 2595,
+        36: 2595, 2064: 2589, 40: 2595, 1152: 2590,
+        1280: 2590, 48: 2595, 264: 2592, 2056: 2589,
+        192: 2593, 160: 2593, 66: 2594, 68: 2594,
+        130: 2593, 72: 2594, 258: 2592, 2304: 2589,
+        288: 2592, 80: 2594, 1536: 2590, 514: 2591,
+        2560: 2589, 544: 2591, 96: 2594, 272: 2592,
+        3072: 2589, 1056: 2590, 2112: 2589, 1088: 2590,
+        2176: 2589, 528: 2591, 576: 2591 },
+        5120: { 384: 2481, 2049: 2479, 2050: 2479, 3: 2488,
+        132: 2482, 5: 2487, 6: 2487, 129: 2482,
+        136: 2482, 9: 2486, 10: 2486, 12: 2486,
+        258: 2481, 516: 2480, 144: 2482, 17: 2485,
+        18: 2485, 20: 2485, 24: 2485, 260: 2481,
+        640: 2480, 768: 2480, 520: 2480, 160: 2482,
+        33: 2484, 34: 2484, 36: 2484, 2064: 2479,
+        40: 2484, 257: 2481, 48: 2484, 264: 2481,
+        513: 2480, 2056: 2479, 2052: 2479, 2080: 2479,
+        192: 2482, 65: 2483, 66: 2483, 68: 2483,
+        130: 2482, 72: 2483, 2176: 2479, 2304: 2479,
+        288: 2481, 80: 2483, 320: 2481, 514: 2480,
+        2560: 2479, 544: 2480, 96: 2483, 272: 2481,
+        2112: 2479, 528: 2480, 576: 2480 },
+        2052: { 384: 2691, 129: 2692, 4098: 2688, 3: 2697,
+        520: 2690, 1025: 2689, 136: 2692, 9: 2696,
+        10: 2696, 288: 2691, 258: 2691, 4352: 2688,
+        144: 2692, 17: 2695, 18: 2695, 1032: 2689,
+        24: 2695, 640: 2690, 768: 2690, 1040: 2689,
+        33: 2694, 34: 2694, 4097: 2688, 5120: 2688,
+        40: 2694, 1152: 2689, 257: 2691, 4160: 2688,
+        1280: 2689, 48: 2694, 264: 2691, 513: 2690,
+        1536: 2689, 4224: 2688, 192: 2692, 65: 2693,
+        66: 2693, 130: 2692, 4128: 2688, 72: 2693,
+        1088: 2689, 160: 2692, 528: 2690, 80: 2693,
+        320: 2691, 514: 2690, 544: 2690, 96: 2693,
+        272: 2691, 1026: 2689, 4112: 2688, 1056: 2689,
+        4608: 2688, 4104: 2688, 576: 2690 },
+        192: { 768: 3021, 1025: 3020, 2050: 3019, 3: 3027,
+        260: 3022, 5: 3026, 6: 3026, 257: 3022,
+        264: 3022, 9: 3025, 10: 3025, 3072: 3019,
+        12: 3025, 1026: 3020, 4352: 3018, 272: 3022,
+        17: 3024, 18: 3024, 20: 3024, 1032: 3020,
+        24: 3024, 516: 3021, 1028: 3020, 1040: 3020,
+        33: 3023, 34: 3023, 4097: 3018, 2064: 3019,
+        40: 3023, 1280: 3020, 48: 3023, 520: 3021,
+        513: 3021, 2056: 3019, 2052: 3019, 2080: 3019,
+        288: 3022, 4098: 3018, 5120: 3018, 6144: 3018,
+        4128: 3018, 258: 3022, 2304: 3019, 1536: 3020,
+        514: 3021, 2560: 3019, 544: 3021, 36: 3023,
+        528: 3021, 2049: 3019, 4112: 3018, 1056: 3020,
+        4608: 3018, 4104: 3018, 4100: 3018 },
+        2080: { 384: 2658, 129: 2659, 130: 2659, 3: 2664,
+        132: 2659, 5: 2663, 6: 2663, 1025: 2656,
+        136: 2659, 9: 2662, 10: 2662, 12: 2662,
+        4098: 2655, 516: 2657, 144: 2659, 17: 2661,
+        18: 2661, 20: 2661, 1032: 2656, 768: 2657,
+        24: 2661, 260: 2658, 640: 2657, 1028: 2656,
+        520: 2657, 1040: 2656, 4097: 2655, 5120: 2655,
+        1088: 2656, 1152: 2656, 257: 2658, 4160: 2655,
+        1280: 2656, 264: 2658, 513: 2657, 1536: 2656,
+        4224: 2655, 192: 2659, 65: 2660, 66: 2660,
+        68: 2660, 72: 2660, 258: 2658, 4352: 2655,
+        528: 2657, 80: 2660, 320: 2658, 514: 2657,
+        272: 2658, 1026: 2656, 4112: 2655, 4608: 2655,
+        4104: 2655, 576: 2657, 4100: 2655 },
+        4098: { 384: 2581, 129: 2582, 132: 2582, 5: 2587,
+        260: 2581, 1025: 2579, 136: 2582, 9: 2586,
+        12: 2586, 144: 2582, 17: 2585, 20: 2585,
+        1032: 2579, 768: 2580, 24: 2585, 516: 2580,
+        640: 2580, 1028: 2579, 520: 2580, 1040: 2579,
+        33: 2584, 36: 2584, 2064: 2578, 40: 2584,
+        1152: 2579, 257: 2581, 1280: 2579, 48: 2584,
+        264: 2581, 513: 2580, 2056: 2578, 2052: 2578,
+        2080: 2578, 192: 2582, 65: 2583, 68: 2583,
+        72: 2583, 1088: 2579, 160: 2582, 2304: 2578,
+        288: 2581, 80: 2583, 320: 2581, 2560: 2578,
+        544: 2580, 96: 2583, 272: 2581, 2049: 2578,
+        3072: 2578, 1056: 2579, 2112: 2578, 1536: 2579,
+        2176: 2578, 528: 2580, 576: 2580 },
+        6144: { 384: 2470, 1025: 2468, 258: 2470, 3: 2477,
+        132: 2471, 5: 2476, 6: 2476, 129: 2471,
+        136: 2471, 9: 2475, 10: 2475, 12: 2475,
+        514: 2469, 516: 2469, 144: 2471, 17: 2474,
+        18: 2474, 20: 2474, 1032: 2468, 768: 2469,
+        24: 2474, 260: 2470, 640: 2469, 1028: 2468,
+        520: 2469, 1040: 2468, 33: 2473, 34: 2473,
+        36: 2473, 40: 2473, 1152: 2468, 257: 2470,
+        1280: 2468, 48: 2473, 264: 2470, 513: 2469,
+        1536: 2468, 192: 2471, 65: 2472, 66: 2472,
+        68: 2472, 130: 2471, 72: 2472, 1088: 2468,
+        160: 2471, 288: 2470, 80: 2472, 320: 2470,
+        544: 2469, 96: 2472, 272: 2470, 1026: 2468,
+        1056: 2468, 528: 2469, 576: 2469 },
+        4352: { 640: 2503, 1025: 2502, 2050: 2501, 3: 2510,
+        132: 2504, 5: 2509, 6: 2509, 129: 2504,
+        136: 2504, 9: 2508, 10: 2508, 12: 2508,
+        1026: 2502, 144: 2504, 17: 2507, 18: 2507,
+        20: 2507, 1032: 2502, 24: 2507, 516: 2503,
+        1028: 2502, 1040: 2502, 33: 2506, 34: 2506,
+        36: 2506, 2064: 2501, 40: 2506, 1152: 2502,
+        48: 2506, 520: 2503, 513: 2503, 2056: 2501,
+        2052: 2501, 2080: 2501, 192: 2504, 65: 2505,
+        66: 2505, 68: 2505, 130: 2504, 72: 2505,
+        1088: 2502, 160: 2504, 80: 2505, 1536: 2502,
+        514: 2503, 2560: 2501, 544: 2503, 96: 2505,
+        528: 2503, 2049: 2501, 3072: 2501, 1056: 2502,
+        2112: 2501, 2176: 2501, 576: 2503 },
+        4100: { 384: 2570, 129: 2571, 2050: 2567, 3: 2576,
+        520: 2569, 1025: 2568, 136: 2571, 9: 2575,
+        10: 2575, 258: 2570, 144: 2571, 17: 2574,
+        18: 2574, 1032: 2568, 24: 2574, 640: 2569,
+        768: 2569, 1040: 2568, 33: 2573, 34: 2573,
+        2064: 2567, 40: 2573, 1152: 2568, 257: 2570,
+        1280: 2568, 48: 2573, 264: 2570, 513: 2569,
+        2056: 2567, 2080: 2567, 192: 2571, 65: 2572,
+        66: 2572, 130: 2571, 72: 2572, 1088: 2568,
+        160: 2571, 2304: 2567, 288: 2570, 80: 2572,
+        320: 2570, 514: 2569, 2560: 2567, 544: 2569,
+        96: 2572, 272: 2570, 1026: 2568, 2049: 2567,
+        3072: 2567, 1056: 2568, 2112: 2567, 1536: 2568,
+        2176: 2567, 528: 2569, 576: 2569 },
+        256: { 6147: 4214, 6149: 4213, 6150: 4213, 2055: 4303,
+        6153: 4212, 6154: 4212, 2059: 4301, 6156: 4212,
+        4109: 4255, 4110: 4255, 15: 4422, 6161: 4211,
+        6162: 4211, 2067: 4298, 6164: 4211, 2069: 4297,
+        2070: 4297, 23: 4419, 6168: 4211, 2073: 4296,
+        2074: 4296, 27: 4417, 2076: 4296, 29: 4416,
+        30: 4416, 3077: 4267, 6177: 4210, 6178: 4210,
+        4131: 4249, 6180: 4210, 2085: 4293, 2086: 4293,
+        39: 4413, 6184: 4210, 2089: 4292, 2090: 4292,
+        1031: 4339, 2092: 4292, 45: 4410, 46: 4410,
+        6192: 4210, 2097: 4291, 2098: 4291, 51: 4408,
+        2100: 4291, 53: 4407, 54: 4407, 5129: 4221,
+        2104: 4291, 57: 4406, 58: 4406, 60: 4406,
+        3082: 4266, 6209: 4209, 6210: 4209, 4163: 4244,
+        6212: 4209, 4165: 4243, 2118: 4288, 71: 4403,
+        6216: 4209, 2121: 4287, 4170: 4242, 75: 4401,
+        4172: 4242, 77: 4400, 78: 4400, 2061: 4300,
+        6224: 4209, 4177: 4241, 4178: 4241, 83: 4398,
+        2132: 4286, 85: 4397, 86: 4397, 2136: 4286,
+        89: 4396, 90: 4396, 92: 4396, 6240: 4209,
+        2145: 4285, 2146: 4285, 99: 4394, 2148: 4285,
+        101: 4393, 102: 4393, 5137: 4220, 2152: 4285,
+        105: 4392, 106: 4392, 108: 4392, 5138: 4220,
+        2160: 4285, 113: 4391, 114: 4391, 4115: 4253,
+        116: 4391, 5664: 4216, 120: 4391, 5140: 4220,
+        4117: 4252, 6273: 4208, 6274: 4208, 2179: 4283,
+        6276: 4208, 4118: 4252, 4230: 4237, 135: 4388,
+        6280: 4208, 2185: 4281, 2186: 4281, 139: 4386,
+        4236: 4236, 141: 4385, 142: 4385, 6288: 4208,
+        2193: 4280, 2194: 4280, 147: 4383, 2196: 4280,
+        149: 4382, 150: 4382, 4121: 4251, 2200: 4280,
+        153: 4381, 154: 4381, 156: 4381, 4122: 4251,
+        6304: 4208, 2209: 4279, 2210: 4279, 163: 4379,
+        2212: 4279, 165: 4378, 166: 4378, 2216: 4279,
+        169: 4377, 170: 4377, 172: 4377, 2224: 4279,
+        177: 4376, 178: 4376, 180: 4376, 184: 4376,
+        3075: 4268, 2241: 4278, 4290: 4233, 195: 4374,
+        2244: 4278, 197: 4373, 198: 4373, 3105: 4264,
+        2248: 4278, 201: 4372, 202: 4372, 204: 4372,
+        3106: 4264, 2256: 4278, 209: 4371, 210: 4371,
+        2083: 4294, 212: 4371, 216: 4371, 5156: 4219,
+        4133: 4248, 2272: 4278, 225: 4370, 226: 4370,
+        228: 4370, 4134: 4248, 232: 4370, 240: 1604,
+        5160: 4219, 4137: 4247, 4138: 4247, 43: 4411,
+        4140: 4247, 3078: 4267, 5168: 4219, 4145: 4246,
+        4146: 4246, 4148: 4246, 4152: 4246, 4103: 4258,
+        5185: 4218, 5186: 4218, 2115: 4289, 5188: 4218,
+        2117: 4288, 4166: 4243, 5192: 4218, 4169: 4242,
+        2122: 4287, 2124: 4287, 4107: 4256, 5200: 4218,
+        2129: 4286, 2062: 4300, 2130: 4286, 4180: 4241,
+        6657: 4207, 6658: 4207, 2563: 4276, 6660: 4207,
+        2565: 4275, 2566: 4275, 519: 4367, 6664: 4207,
+        2569: 4274, 2570: 4274, 523: 4365, 2572: 4274,
+        525: 4364, 526: 4364, 6672: 4207, 2577: 4273,
+        2578: 4273, 531: 4362, 2580: 4273, 533: 4361,
+        534: 4361, 2584: 4273, 537: 4360, 538: 4360,
+        540: 4360, 6688: 4207, 4641: 4227, 4642: 4227,
+        547: 4358, 2596: 4272, 549: 4357, 550: 4357,
+        2600: 4272, 553: 4356, 554: 4356, 556: 4356,
+        2608: 4272, 561: 4355, 562: 4355, 564: 4355,
+        568: 4355, 6720: 4207, 4673: 4226, 4674: 4226,
+        579: 4353, 2628: 4271, 581: 4352, 582: 4352,
+        4193: 4240, 2632: 4271, 585: 4351, 586: 4351,
+        588: 4351, 4194: 4240, 2640: 4271, 593: 4350,
+        594: 4350, 596: 4350, 600: 4350, 4196: 4240,
+        2656: 4271, 609: 4349, 610: 4349, 612: 4349,
+        616: 4349, 624: 4349, 4200: 4240, 6784: 4207,
+        2689: 4270, 4738: 4225, 643: 4347, 2692: 4270,
+        645: 4346, 646: 4346, 2696: 4270, 649: 4345,
+        650: 4345, 652: 4345, 2704: 4270, 657: 4344,
+        658: 4344, 660: 4344, 664: 4344, 2720: 4270,
+        673: 4343, 674: 4343, 676: 4343, 680: 4343,
+        688: 4343, 2752: 4270, 705: 4342, 706: 4342,
+        708: 4342, 712: 4342, 720: 4342, 4184: 4241,
+        736: 1603, 5249: 4217, 5250: 4217, 4227: 4238,
+        5252: 4217, 4800: 4225, 4229: 4237, 2182: 4282,
+        5256: 4217, 4233: 4236, 4234: 4236, 2188: 4281,
+        5264: 4217, 4241: 4235, 4242: 4235, 5144: 4220,
+        4244: 4235, 5132: 4221, 4248: 4235, 5280: 4217,
+        4257: 4234, 4258: 4234, 4124: 4251, 4260: 4234,
+        5216: 4218, 4264: 4234, 7169: 4206, 7170: 4206,
+        5123: 4223, 7172: 4206, 5125: 4222, 5126: 4222,
+        5633: 4216, 7176: 4206, 3081: 4266, 5130: 4221,
+        1035: 4337, 3084: 4266, 1037: 4336, 1038: 4336,
+        7184: 4206, 3089: 4265, 3090: 4265, 1043: 4334,
+        3092: 4265, 1045: 4333, 1046: 4333, 3096: 4265,
+        1049: 4332, 1050: 4332, 1052: 4332, 4613: 4230,
+        7200: 4206, 5153: 4219, 5154: 4219, 1059: 4330,
+        3108: 4264, 1061: 4329, 1062: 4329, 3112: 4264,
+        1065: 4328, 1066: 4328, 1068: 4328, 3120: 4264,
+        1073: 4327, 1074: 4327, 1076: 4327, 4617: 4229,
+        1080: 4327, 4618: 4229, 7232: 4206, 3137: 4263,
+        3138: 4263, 1091: 4325, 3140: 4263, 1093: 4324,
+        1094: 4324, 3144: 4263, 1097: 4323, 1098: 4323,
+        1100: 4323, 3152: 4263, 1105: 4322, 1106: 4322,
+        1108: 4322, 1112: 4322, 3168: 4263, 1121: 4321,
+        1122: 4321, 1124: 4321, 4625: 4228, 1128: 4321,
+        4626: 4228, 1136: 4321, 4628: 4228, 7296: 4206,
+        3201: 4262, 3202: 4262, 1155: 4319, 3204: 4262,
+        1157: 4318, 1158: 4318, 4289: 4233, 3208: 4262,
+        1161: 4317, 1162: 4317, 1164: 4317, 2242: 4278,
+        3216: 4262, 1169: 4316, 1170: 4316, 1172: 4316,
+        1176: 4316, 4292: 4233, 3232: 4262, 1185: 4315,
+        1186: 4315, 1188: 4315, 1192: 4315, 1200: 4315,
+        4296: 4233, 3264: 4262, 1217: 4314, 1218: 4314,
+        1220: 4314, 2593: 4272, 1224: 4314, 2594: 4272,
+        1232: 4314, 4644: 4227, 1248: 4314, 4304: 4233,
+        4611: 4231, 4648: 4227, 5634: 4216, 4656: 4227,
+        4272: 4234, 5636: 4216, 4320: 4233, 4614: 4230,
+        5696: 4216, 2625: 4271, 2626: 4271, 4676: 4226,
+        5640: 4216, 4208: 4240, 4680: 4226, 4688: 4226,
+        4620: 4229, 7680: 1600, 3585: 4261, 3586: 4261,
+        1539: 4312, 3588: 4261, 1541: 4311, 1542: 4311,
+        3592: 4261, 1545: 4310, 1546: 4310, 1548: 4310,
+        3600: 4261, 1553: 4309, 1554: 4309, 1556: 4309,
+        1560: 4309, 3616: 4261, 1569: 4308, 1570: 4308,
+        1572: 4308, 1576: 4308, 1584: 4308, 3648: 4261,
+        1601: 4307, 1602: 4307, 1604: 4307, 1608: 4307,
+        1616: 4307, 1632: 4307, 3712: 1601, 1665: 4306,
+        1666: 4306, 1668: 4306, 1672: 4306, 1680: 4306,
+        5648: 4216, 1696: 4306, 1728: 1602, 5760: 4216,
+        4737: 4225, 2690: 4270, 4740: 4225, 5312: 4217,
+        4744: 4225, 6336: 4208, 4752: 4225, 4632: 4228,
+        4768: 4225, 4704: 4226, 2181: 4282 },
+        640: { 1280: 2844, 1025: 2844, 2050: 2843, 3: 2851,
+        260: 2845, 5: 2850, 6: 2850, 257: 2845,
+        264: 2845, 9: 2849, 10: 2849, 3072: 2843,
+        12: 2849, 4098: 2842, 4352: 2842, 272: 2845,
+        17: 2848, 18: 2848, 20: 2848, 24: 2848,
+        1028: 2844, 288: 2845, 33: 2847, 34: 2847,
+        4097: 2842, 2064: 2843, 40: 2847, 4160: 2842,
+        48: 2847, 1032: 2844, 2056: 2843, 2052: 2843,
+        2080: 2843, 320: 2845, 65: 2846, 66: 2846,
+        68: 2846, 6144: 2842, 4128: 2842, 72: 2846,
+        258: 2845, 2304: 2843, 80: 2846, 5120: 2842,
+        36: 2847, 96: 2846, 1040: 2844, 1026: 2844,
+        2049: 2843, 4112: 2842, 1056: 2844, 2112: 2843,
+        1088: 2844, 4104: 2842, 4100: 2842 },
+        258: { 640: 2999, 129: 3000, 3072: 2997, 132: 3000,
+        5: 3005, 1040: 2998, 1025: 2998, 136: 3000,
+        9: 3004, 4224: 2996, 12: 3004, 144: 3000,
+        17: 3003, 20: 3003, 1032: 2998, 24: 3003,
+        516: 2999, 1028: 2998, 160: 3000, 33: 3002,
+        4097: 2996, 2064: 2997, 40: 3002, 1152: 2998,
+        4160: 2996, 48: 3002, 520: 2999, 513: 2999,
+        2056: 2997, 2052: 2997, 2080: 2997, 192: 3000,
+        65: 3001, 68: 3001, 6144: 2996, 4128: 2996,
+        72: 3001, 1088: 2998, 80: 3001, 1536: 2998,
+        5120: 2996, 2560: 2997, 544: 2999, 36: 3002,
+        96: 3001, 528: 2999, 2049: 2997, 4112: 2996,
+        1056: 2998, 2112: 2997, 4608: 2996, 2176: 2997,
+        4104: 2996, 576: 2999, 4100: 2996 },
+        260: { 640: 2988, 129: 2989, 2050: 2986, 3: 2994,
+        1040: 2987, 1025: 2987, 136: 2989, 9: 2993,
+        10: 2993, 3072: 2986, 1026: 2987, 144: 2989,
+        17: 2992, 18: 2992, 1032: 2987, 24: 2992,
+        160: 2989, 33: 2991, 34: 2991, 4097: 2985,
+        2064: 2986, 40: 2991, 1152: 2987, 4160: 2985,
+        48: 2991, 520: 2988, 513: 2988, 2056: 2986,
+        4224: 2985, 2080: 2986, 192: 2989, 65: 2990,
+        66: 2990, 5120: 2985, 130: 2989, 4128: 2985,
+        72: 2990, 1088: 2987, 4098: 2985, 80: 2990,
+        1536: 2987, 514: 2988, 2560: 2986, 544: 2988,
+        96: 2990, 528: 2988, 2049: 2986, 6144: 2985,
+        4112: 2985, 1056: 2987, 2112: 2986, 4608: 2985,
+        2176: 2986, 4104: 2985, 576: 2988 },
+        264: { 640: 2977, 129: 2978, 2050: 2975, 3: 2983,
+        132: 2978, 5: 2982, 6: 2982, 1025: 2976,
+        4160: 2974, 4224: 2974, 3072: 2975, 1026: 2976,
+        144: 2978, 17: 2981, 18: 2981, 20: 2981,
+        4608: 2974, 576: 2977, 516: 2977, 1028: 2976,
+        1040: 2976, 33: 2980, 34: 2980, 4097: 2974,
+        2064: 2975, 1088: 2976, 1152: 2976, 48: 2980,
+        513: 2977, 1536: 2976, 2052: 2975, 2080: 2975,
+        192: 2978, 65: 2979, 66: 2979, 68: 2979,
+        130: 2978, 4128: 2974, 2112: 2975, 2176: 2975,
+        160: 2978, 4098: 2974, 80: 2979, 514: 2977,
+        5120: 2974, 2560: 2975, 544: 2977, 36: 2980,
+        96: 2979, 528: 2977, 2049: 2975, 6144: 2974,
+        4112: 2974, 1056: 2976, 4100: 2974 },
+        272: { 640: 2966, 129: 2967, 2050: 2964, 3: 2972,
+        132: 2967, 5: 2971, 6: 2971, 1025: 2965,
+        136: 2967, 9: 2970, 10: 2970, 12: 2970,
+        1026: 2965, 1536: 2965, 1032: 2965, 576: 2966,
+        516: 2966, 1028: 2965, 160: 2967, 33: 2969,
+        34: 2969, 4097: 2963, 2080: 2964, 40: 2969,
+        1152: 2965, 4160: 2963, 520: 2966, 513: 2966,
+        2056: 2964, 4224: 2963, 2052: 2964, 192: 2967,
+        65: 2968, 66: 2968, 68: 2968, 130: 2967,
+        4128: 2963, 72: 2968, 1088: 2965, 4098: 2963,
+        514: 2966, 5120: 2963, 2560: 2964, 544: 2966,
+        36: 2969, 96: 2968, 2049: 2964, 6144: 2963,
+        3072: 2964, 1056: 2965, 2112: 2964, 4608: 2963,
+        2176: 2964, 4104: 2963, 4100: 2963 },
+        1032: { 384: 2790, 129: 2791, 258: 2790, 3: 2796,
+        132: 2791, 5: 2795, 6: 2795, 2049: 2788,
+        4160: 2787, 4224: 2787, 288: 2790, 2050: 2788,
+        516: 2789, 144: 2791, 17: 2794, 18: 2794,
+        20: 2794, 4608: 2787, 576: 2789, 260: 2790,
+        640: 2789, 768: 2789, 160: 2791, 33: 2793,
+        34: 2793, 4097: 2787, 2064: 2788, 257: 2790,
+        48: 2793, 513: 2789, 2052: 2788, 2080: 2788,
+        192: 2791, 65: 2792, 66: 2792, 68: 2792,
+        130: 2791, 4128: 2787, 2112: 2788, 2176: 2788,
+        4352: 2787, 2304: 2788, 4098: 2787, 80: 2792,
+        320: 2790, 514: 2789, 2560: 2788, 544: 2789,
+        36: 2793, 96: 2792, 272: 2790, 6144: 2787,
+        4112: 2787, 528: 2789, 4100: 2787 },
+        288: { 640: 2955, 129: 2956, 2050: 2953, 3: 2961,
+        132: 2956, 5: 2960, 6: 2960, 1025: 2954,
+        136: 2956, 9: 2959, 10: 2959, 3072: 2953,
+        12: 2959, 1026: 2954, 144: 2956, 17: 2958,
+        18: 2958, 20: 2958, 1032: 2954, 24: 2958,
+        516: 2955, 1028: 2954, 1040: 2954, 4097: 2952,
+        2064: 2953, 1088: 2954, 1152: 2954, 4160: 2952,
+        520: 2955, 513: 2955, 2056: 2953, 4224: 2952,
+        2052: 2953, 192: 2956, 65: 2957, 66: 2957,
+        68: 2957, 130: 2956, 72: 2957, 2176: 2953,
+        4098: 2952, 80: 2957, 1536: 2954, 514: 2955,
+        5120: 2952, 2560: 2953, 528: 2955, 2049: 2953,
+        6144: 2952, 4112: 2952, 2112: 2953, 4608: 2952,
+        4104: 2952, 576: 2955, 4100: 2952 },
+        1152: { 768: 2745, 2049: 2744, 2050: 2744, 3: 2752,
+        260: 2746, 5: 2751, 6: 2751, 257: 2746,
+        264: 2746, 9: 2750, 10: 2750, 12: 2750,
+        4098: 2743, 4352: 2743, 272: 2746, 17: 2749,
+        18: 2749, 20: 2749, 4608: 2743, 24: 2749,
+        516: 2745, 288: 2746, 33: 2748, 34: 2748,
+        4097: 2743, 2064: 2744, 40: 2748, 4160: 2743,
+        48: 2748, 520: 2745, 513: 2745, 2056: 2744,
+        2052: 2744, 2080: 2744, 320: 2746, 65: 2747,
+        66: 2747, 68: 2747, 6144: 2743, 4128: 2743,
+        72: 2747, 258: 2746, 2304: 2744, 80: 2747,
+        514: 2745, 2560: 2744, 544: 2745, 36: 2748,
+        96: 2747, 528: 2745, 4112: 2743, 2112: 2744,
+        4104: 2743, 576: 2745, 4100: 2743 },
+        2056: { 384: 2680, 129: 2681, 258: 2680, 3: 2686,
+        132: 2681, 5: 2685, 6: 2685, 1025: 2678,
+        4160: 2677, 4224: 2677, 4098: 2677, 516: 2679,
+        144: 2681, 17: 2684, 18: 2684, 20: 2684,
+        4608: 2677, 768: 2679, 576: 2679, 260: 2680,
+        640: 2679, 1028: 2678, 1040: 2678, 33: 2683,
+        34: 2683, 4097: 2677, 5120: 2677, 1088: 2678,
+        1152: 2678, 257: 2680, 1280: 2678, 48: 2683,
+        513: 2679, 1536: 2678, 192: 2681, 65: 2682,
+        66: 2682, 68: 2682, 130: 2681, 4128: 2677,
+        160: 2681, 288: 2680, 80: 2682, 320: 2680,
+        514: 2679, 544: 2679, 36: 2683, 96: 2682,
+        272: 2680, 1026: 2678, 4112: 2677, 1056: 2678,
+        528: 2679, 4352: 2677, 4100: 2677 },
+        320: { 640: 2944, 129: 2945, 2050: 2942, 3: 2950,
+        132: 2945, 5: 2949, 6: 2949, 1025: 2943,
+        136: 2945, 9: 2948, 10: 2948, 3072: 2942,
+        12: 2948, 1026: 2943, 144: 2945, 17: 2947,
+        18: 2947, 20: 2947, 1032: 2943, 24: 2947,
+        516: 2944, 1028: 2943, 1040: 2943, 33: 2946,
+        34: 2946, 4097: 2941, 2064: 2942, 40: 2946,
+        1152: 2943, 48: 2946, 520: 2944, 513: 2944,
+        2056: 2942, 4224: 2941, 2052: 2942, 2080: 2942,
+        160: 2945, 4098: 2941, 5120: 2941, 130: 2945,
+        4128: 2941, 2176: 2942, 1536: 2943, 514: 2944,
+        2560: 2942, 544: 2944, 36: 2946, 528: 2944,
+        2049: 2942, 6144: 2941, 4112: 2941, 1056: 2943,
+        4608: 2941, 4104: 2941, 4100: 2941 },
+        2176: { 768: 2635, 1025: 2634, 4098: 2633, 3: 2642,
+        260: 2636, 5: 2641, 6: 2641, 257: 2636,
+        264: 2636, 9: 2640, 10: 2640, 12: 2640,
+        258: 2636, 4352: 2633, 272: 2636, 17: 2639,
+        18: 2639, 20: 2639, 1032: 2634, 24: 2639,
+        516: 2635, 1028: 2634, 1040: 2634, 33: 2638,
+        34: 2638, 4097: 2633, 5120: 2633, 40: 2638,
+        4160: 2633, 1280: 2634, 48: 2638, 520: 2635,
+        513: 2635, 1536: 2634, 320: 2636, 65: 2637,
+        66: 2637, 68: 2637, 4128: 2633, 72: 2637,
+        1088: 2634, 288: 2636, 80: 2637, 514: 2635,
+        544: 2635, 36: 2638, 96: 2637, 528: 2635,
+        1026: 2634, 4112: 2633, 1056: 2634, 4608: 2633,
+        4104: 2633, 576: 2635, 4100: 2633 },
+        1025: { 384: 2823, 320: 2823, 2050: 2821, 4100: 2820,
+        6: 2829, 2080: 2821, 136: 2824, 10: 2828,
+        132: 2824, 12: 2828, 4098: 2820, 4352: 2820,
+        144: 2824, 18: 2827, 20: 2827, 4608: 2820,
+        24: 2827, 516: 2822, 640: 2822, 520: 2822,
+        768: 2822, 260: 2823, 160: 2824, 34: 2826,
+        36: 2826, 2064: 2821, 40: 2826, 4160: 2820,
+        48: 2826, 264: 2823, 2056: 2821, 4224: 2820,
+        2052: 2821, 192: 2824, 288: 2823, 66: 2825,
+        68: 2825, 130: 2824, 4128: 2820, 72: 2825,
+        258: 2823, 2304: 2821, 528: 2822, 80: 2825,
+        514: 2822, 2560: 2821, 544: 2822, 96: 2825,
+        272: 2823, 6144: 2820, 4112: 2820, 2112: 2821,
+        2176: 2821, 4104: 2820, 576: 2822 },
+        4104: { 384: 2559, 129: 2560, 258: 2559, 3: 2565,
+        132: 2560, 5: 2564, 6: 2564, 1025: 2557,
+        2050: 2556, 516: 2558, 144: 2560, 17: 2563,
+        18: 2563, 20: 2563, 768: 2558, 576: 2558,
+        260: 2559, 640: 2558, 1028: 2557, 1040: 2557,
+        33: 2562, 34: 2562, 36: 2562, 2064: 2556,
+        1088: 2557, 1152: 2557, 257: 2559, 1280: 2557,
+        48: 2562, 513: 2558, 1536: 2557, 2052: 2556,
+        2080: 2556, 192: 2560, 65: 2561, 66: 2561,
+        68: 2561, 130: 2560, 2112: 2556, 2176: 2556,
+        160: 2560, 2304: 2556, 288: 2559, 80: 2561,
+        320: 2559, 514: 2558, 2560: 2556, 544: 2558,
+        96: 2561, 272: 2559, 1026: 2557, 2049: 2556,
+        3072: 2556, 1056: 2557, 528: 2558 },
+        384: { 1536: 2932, 1025: 2932, 2050: 2931, 3: 2939,
+        516: 2933, 5: 2938, 6: 2938, 513: 2933,
+        520: 2933, 9: 2937, 10: 2937, 3072: 2931,
+        12: 2937, 1026: 2932, 528: 2933, 17: 2936,
+        18: 2936, 20: 2936, 4608: 2930, 24: 2936,
+        1028: 2932, 544: 2933, 33: 2935, 34: 2935,
+        4097: 2930, 2064: 2931, 40: 2935, 4160: 2930,
+        48: 2935, 1032: 2932, 2056: 2931, 2052: 2931,
+        2080: 2931, 576: 2933, 65: 2934, 66: 2934,
+        68: 2934, 6144: 2930, 4128: 2930, 72: 2934,
+        1088: 2932, 4098: 2930, 80: 2934, 514: 2933,
+        5120: 2930, 2560: 2931, 36: 2935, 96: 2934,
+        1040: 2932, 2049: 2931, 4112: 2930, 1056: 2932,
+        2112: 2931, 4104: 2930, 4100: 2930 },
+        64: { 6147: 4654, 6149: 4653, 6150: 4653, 2055: 4743,
+        6153: 4652, 6154: 4652, 2059: 4741, 6156: 4652,
+        4109: 4695, 4110: 4695, 15: 4862, 6161: 4651,
+        6162: 4651, 2067: 4738, 6164: 4651, 2069: 4737,
+        2070: 4737, 23: 4859, 6168: 4651, 2073: 4736,
+        2074: 4736, 27: 4857, 4124: 4691, 29: 4856,
+        30: 4856, 5125: 4662, 6177: 4650, 6178: 4650,
+        4131: 4689, 6180: 4650, 2085: 4733, 2086: 4733,
+        39: 4853, 6184: 4650, 4137: 4687, 2090: 4732,
+        43: 4851, 2092: 4732, 45: 4850, 46: 4850,
+        4992: 4665, 6192: 4650, 2097: 4731, 4146: 4686,
+        51: 4848, 2100: 4731, 53: 4847, 54: 4847,
+        5129: 4661, 2104: 4731, 57: 4846, 58: 4846,
+        60: 1606, 5130: 4661, 4107: 4696, 5132: 4661,
+        1037: 4776, 2062: 4740, 5137: 4660, 5138: 4660,
+        4115: 4693, 5140: 4660, 4117: 4692, 6273: 4649,
+        6274: 4649, 2179: 4729, 6276: 4649, 4118: 4692,
+        4230: 4683, 135: 4843, 6280: 4649, 2185: 4727,
+        2186: 4727, 139: 4841, 4236: 4682, 141: 4840,
+        142: 4840, 4488: 4673, 6288: 4649, 2193: 4726,
+        2194: 4726, 147: 4838, 2196: 4726, 149: 4837,
+        150: 4837, 4121: 4691, 2200: 4726, 153: 4836,
+        154: 4836, 156: 4836, 4122: 4691, 6304: 4649,
+        2209: 4725, 2210: 4725, 163: 4834, 2212: 4725,
+        165: 4833, 166: 4833, 2216: 4725, 169: 4832,
+        170: 4832, 172: 4832, 2224: 4725, 177: 4831,
+        178: 4831, 180: 4831, 184: 1605, 3075: 4708,
+        3105: 4704, 3106: 4704, 2083: 4734, 5156: 4659,
+        4133: 4688, 4134: 4688, 5160: 4659, 2089: 4732,
+        1031: 4779, 4138: 4687, 6401: 4648, 6402: 4648,
+        2307: 4723, 6404: 4648, 4357: 4677, 2310: 4722,
+        263: 4828, 6408: 4648, 2313: 4721, 2314: 4721,
+        267: 4826, 2316: 4721, 269: 4825, 270: 4825,
+        6416: 4648, 2321: 4720, 2322: 4720, 275: 4823,
+        4372: 4675, 277: 4822, 278: 4822, 2328: 4720,
+        281: 4821, 282: 4821, 284: 4821, 6432: 4648,
+        4385: 4674, 2338: 4719, 291: 4819, 2340: 4719,
+        293: 4818, 294: 4818, 4145: 4686, 2344: 4719,
+        297: 4817, 298: 4817, 300: 4817, 2098: 4731,
+        2352: 4719, 305: 4816, 306: 4816, 308: 4816,
+        312: 4816, 4148: 4686, 4152: 4686, 4103: 4698,
+        4496: 4673, 6528: 4648, 2433: 4718, 2434: 4718,
+        387: 4814, 2436: 4718, 389: 4813, 390: 4813,
+        2440: 4718, 393: 4812, 394: 4812, 396: 4812,
+        2448: 4718, 401: 4811, 402: 4811, 404: 4811,
+        408: 4811, 2464: 4718, 417: 4810, 418: 4810,
+        420: 4810, 424: 4810, 432: 1604, 4512: 4673,
+        4872: 4665, 2061: 4740, 6657: 4647, 6658: 4647,
+        2563: 4716, 6660: 4647, 2565: 4715, 2566: 4715,
+        519: 4807, 6664: 4647, 2569: 4714, 2570: 4714,
+        523: 4805, 2572: 4714, 525: 4804, 526: 4804,
+        6672: 4647, 2577: 4713, 2578: 4713, 531: 4802,
+        2580: 4713, 533: 4801, 534: 4801, 2584: 4713,
+        537: 4800, 538: 4800, 540: 4800, 6688: 4647,
+        4641: 4667, 2594: 4712, 547: 4798, 2596: 4712,
+        549: 4797, 550: 4797, 2600: 4712, 553: 4796,
+        554: 4796, 556: 4796, 2608: 4712, 561: 4795,
+        562: 4795, 564: 4795, 4656: 4667, 568: 4795,
+        4880: 4665, 6784: 4647, 2689: 4711, 2690: 4711,
+        643: 4793, 2692: 4711, 645: 4792, 646: 4792,
+        2696: 4711, 649: 4791, 650: 4791, 652: 4791,
+        2704: 4711, 657: 4790, 658: 4790, 660: 4790,
+        664: 4790, 2818: 4710, 2720: 4711, 673: 4789,
+        674: 4789, 676: 4789, 680: 4789, 688: 4789,
+        4865: 4665, 5888: 4656, 4896: 4665, 6912: 4647,
+        2817: 4710, 4866: 4665, 771: 4787, 2820: 4710,
+        773: 4786, 774: 4786, 5249: 4658, 2824: 4710,
+        777: 4785, 778: 4785, 780: 4785, 5250: 4658,
+        2832: 4710, 785: 4784, 786: 4784, 4227: 4684,
+        788: 4784, 4868: 4665, 792: 4784, 5252: 4658,
+        4229: 4683, 2848: 4710, 801: 4783, 802: 4783,
+        804: 4783, 2182: 4728, 808: 4783, 816: 4783,
+        5256: 4658, 4233: 4682, 4234: 4682, 2188: 4727,
+        5264: 4658, 4241: 4681, 4242: 4681, 5144: 4660,
+        4244: 4681, 2944: 4710, 897: 4782, 898: 4782,
+        900: 4782, 904: 4782, 2076: 4736, 912: 4782,
+        4248: 4681, 928: 1603, 5760: 4656, 5280: 4658,
+        4257: 4680, 4258: 4680, 4260: 4680, 4264: 4680,
+        7169: 4646, 7170: 4646, 5123: 4663, 7172: 4646,
+        3077: 4707, 5126: 4662, 5633: 4656, 7176: 4646,
+        3081: 4706, 3082: 4706, 1035: 4777, 3084: 4706,
+        3586: 4701, 1038: 4776, 7184: 4646, 3089: 4705,
+        3090: 4705, 1043: 4774, 3092: 4705, 1045: 4773,
+        1046: 4773, 3096: 4705, 1049: 4772, 1050: 4772,
+        1052: 4772, 4613: 4670, 7200: 4646, 5153: 4659,
+        5154: 4659, 1059: 4770, 3108: 4704, 1061: 4769,
+        1062: 4769, 3112: 4704, 1065: 4768, 1066: 4768,
+        1068: 4768, 3120: 4704, 1073: 4767, 1074: 4767,
+        1076: 4767, 4617: 4669, 1080: 4767, 4618: 4669,
+        4620: 4669, 5648: 4656, 4625: 4668, 4626: 4668,
+        4628: 4668, 7296: 4646, 3201: 4703, 3202: 4703,
+        1155: 4765, 3204: 4703, 1157: 4764, 1158: 4764,
+        3208: 4703, 1161: 4763, 1162: 4763, 1164: 4763,
+        3216: 4703, 1169: 4762, 1170: 4762, 1172: 4762,
+        1176: 4762, 3232: 4703, 1185: 4761, 1186: 4761,
+        1188: 4761, 1192: 4761, 1200: 4761, 5664: 4656,
+        2593: 4712, 4642: 4667, 4644: 4667, 4611: 4671,
+        4648: 4667, 7424: 4646, 5377: 4657, 5378: 4657,
+        1283: 4759, 3332: 4702, 1285: 4758, 1286: 4758,
+        3336: 4702, 1289: 4757, 1290: 4757, 1292: 4757,
+        3344: 4702, 1297: 4756, 1298: 4756, 1300: 4756,
+        1304: 4756, 3360: 4702, 1313: 4755, 1314: 4755,
+        1316: 4755, 1320: 4755, 4272: 4680, 5636: 4656,
+        1328: 4755, 4614: 4670, 3456: 4702, 1409: 4754,
+        1410: 4754, 1412: 4754, 3078: 4707, 1416: 4754,
+        1424: 4754, 1440: 4754, 5640: 4656, 4140: 4687,
+        4481: 4673, 5504: 4657, 4482: 4673, 7680: 4646,
+        3585: 4701, 5634: 4656, 1539: 4752, 3588: 4701,
+        1541: 4751, 1542: 4751, 3329: 4702, 3592: 4701,
+        1545: 4750, 1546: 4750, 1548: 4750, 3330: 4702,
+        3600: 4701, 1553: 4749, 1554: 4749, 4355: 4678,
+        1556: 4749, 1560: 4749, 5380: 4657, 2309: 4722,
+        3616: 4701, 1569: 4748, 1570: 4748, 1572: 4748,
+        4358: 4677, 1576: 4748, 1584: 4748, 5384: 4657,
+        4361: 4676, 4362: 4676, 5168: 4659, 4364: 4676,
+        5392: 4657, 4369: 4675, 4370: 4675, 2324: 4720,
+        3712: 4701, 1665: 4747, 1666: 4747, 1668: 4747,
+        1672: 4747, 1680: 4747, 4376: 4675, 1696: 4747,
+        5408: 4657, 2337: 4719, 4386: 4674, 4388: 4674,
+        4392: 4674, 3840: 4701, 1793: 4746, 1794: 4746,
+        1796: 4746, 4737: 4666, 1800: 4746, 4738: 4666,
+        1808: 4746, 4484: 4673, 4740: 4666, 1824: 4746,
+        4400: 4674, 4744: 4666, 4752: 4666, 4632: 4668,
+        1920: 1602, 4768: 4666, 2181: 4728 },
+        4224: { 768: 2514, 1025: 2513, 2050: 2512, 3: 2521,
+        260: 2515, 5: 2520, 6: 2520, 257: 2515,
+        264: 2515, 9: 2519, 10: 2519, 12: 2519,
+        258: 2515, 272: 2515, 17: 2518, 18: 2518,
+        20: 2518, 1032: 2513, 24: 2518, 516: 2514,
+        1028: 2513, 1040: 2513, 33: 2517, 34: 2517,
+        36: 2517, 2064: 2512, 40: 2517, 1280: 2513,
+        48: 2517, 520: 2514, 513: 2514, 2056: 2512,
+        2052: 2512, 2080: 2512, 320: 2515, 65: 2516,
+        66: 2516, 68: 2516, 72: 2516, 1088: 2513,
+        2304: 2512, 288: 2515, 80: 2516, 1536: 2513,
+        514: 2514, 2560: 2512, 544: 2514, 96: 2516,
+        528: 2514, 1026: 2513, 2049: 2512, 3072: 2512,
+        1056: 2513, 2112: 2512, 576: 2514 },
+        576: { 384: 2856, 129: 2857, 2050: 2854, 3: 2862,
+        132: 2857, 5: 2861, 6: 2861, 1025: 2855,
+        136: 2857, 9: 2860, 10: 2860, 3072: 2854,
+        12: 2860, 130: 2857, 4352: 2853, 144: 2857,
+        17: 2859, 18: 2859, 20: 2859, 1032: 2855,
+        24: 2859, 260: 2856, 1028: 2855, 1040: 2855,
+        33: 2858, 34: 2858, 4097: 2853, 2064: 2854,
+        40: 2858, 1152: 2855, 257: 2856, 1280: 2855,
+        48: 2858, 264: 2856, 2056: 2854, 4224: 2853,
+        2052: 2854, 2080: 2854, 160: 2857, 4098: 2853,
+        5120: 2853, 6144: 2853, 4128: 2853, 258: 2856,
+        2304: 2854, 288: 2856, 36: 2858, 272: 2856,
+        1026: 2855, 2049: 2854, 4112: 2853, 1056: 2855,
+        2176: 2854, 4104: 2853, 4100: 2853 },
+        1088: { 384: 2757, 129: 2758, 2050: 2755, 3: 2763,
+        132: 2758, 5: 2762, 6: 2762, 2049: 2755,
+        136: 2758, 9: 2761, 10: 2761, 12: 2761,
+        130: 2758, 516: 2756, 144: 2758, 17: 2760,
+        18: 2760, 20: 2760, 4608: 2754, 24: 2760,
+        260: 2757, 640: 2756, 768: 2756, 520: 2756,
+        160: 2758, 33: 2759, 34: 2759, 4097: 2754,
+        2064: 2755, 40: 2759, 257: 2757, 48: 2759,
+        264: 2757, 513: 2756, 2056: 2755, 4224: 2754,
+        2052: 2755, 2080: 2755, 288: 2757, 4098: 2754,
+        6144: 2754, 4128: 2754, 258: 2757, 4352: 2754,
+        2304: 2755, 528: 2756, 514: 2756, 2560: 2755,
+        544: 2756, 36: 2759, 272: 2757, 4112: 2754,
+        2176: 2755, 4104: 2754, 4100: 2754 },
+        2064: { 384: 2669, 129: 2670, 4098: 2666, 3: 2675,
+        132: 2670, 5: 2674, 6: 2674, 1025: 2667,
+        136: 2670, 9: 2673, 10: 2673, 12: 2673,
+        514: 2668, 516: 2668, 320: 2669, 1032: 2667,
+        768: 2668, 576: 2668, 260: 2669, 640: 2668,
+        1028: 2667, 520: 2668, 160: 2670, 33: 2672,
+        34: 2672, 4097: 2666, 5120: 2666, 40: 2672,
+        1152: 2667, 257: 2669, 4160: 2666, 1280: 2667,
+        264: 2669, 513: 2668, 1536: 2667, 4224: 2666,
+        192: 2670, 65: 2671, 66: 2671, 68: 2671,
+        130: 2670, 4128: 2666, 72: 2671, 258: 2669,
+        4352: 2666, 288: 2669, 544: 2668, 36: 2672,
+        4608: 2666, 96: 2671, 1026: 2667, 1056: 2667,
+        1088: 2667, 4104: 2666, 4100: 2666 },
+        2112: { 384: 2647, 129: 2648, 130: 2648, 3: 2653,
+        132: 2648, 5: 2652, 6: 2652, 1025: 2645,
+        136: 2648, 9: 2651, 10: 2651, 12: 2651,
+        4098: 2644, 516: 2646, 144: 2648, 17: 2650,
+        18: 2650, 20: 2650, 1032: 2645, 768: 2646,
+        24: 2650, 260: 2647, 640: 2646, 1028: 2645,
+        520: 2646, 1040: 2645, 33: 2649, 34: 2649,
+        4097: 2644, 5120: 2644, 40: 2649, 1152: 2645,
+        257: 2647, 1280: 2645, 48: 2649, 264: 2647,
+        513: 2646, 1536: 2645, 4224: 2644, 288: 2647,
+        160: 2648, 4128: 2644, 258: 2647, 4352: 2644,
+        528: 2646, 514: 2646, 544: 2646, 36: 2649,
+        272: 2647, 1026: 2645, 4112: 2644, 1056: 2645,
+        4608: 2644, 4104: 2644, 4100: 2644 },
+        544: { 384: 2867, 129: 2868, 2050: 2865, 3: 2873,
+        132: 2868, 5: 2872, 6: 2872, 1025: 2866,
+        136: 2868, 9: 2871, 10: 2871, 3072: 2865,
+        12: 2871, 130: 2868, 4352: 2864, 144: 2868,
+        17: 2870, 18: 2870, 20: 2870, 1032: 2866,
+        24: 2870, 260: 2867, 1028: 2866, 1040: 2866,
+        4097: 2864, 2064: 2865, 1088: 2866, 1152: 2866,
+        257: 2867, 4160: 2864, 1280: 2866, 264: 2867,
+        2056: 2865, 4224: 2864, 2052: 2865, 192: 2868,
+        65: 2869, 66: 2869, 68: 2869, 6144: 2864,
+        72: 2869, 258: 2867, 2304: 2865, 4098: 2864,
+        80: 2869, 320: 2867, 5120: 2864, 272: 2867,
+        1026: 2866, 2049: 2865, 4112: 2864, 2112: 2865,
+        2176: 2865, 4104: 2864, 4100: 2864 },
+        1056: { 384: 2768, 129: 2769, 2050: 2766, 3: 2774,
+        132: 2769, 5: 2773, 6: 2773, 2049: 2766,
+        136: 2769, 9: 2772, 10: 2772, 12: 2772,
+        130: 2769, 516: 2767, 144: 2769, 17: 2771,
+        18: 2771, 20: 2771, 4608: 2765, 24: 2771,
+        260: 2768, 640: 2767, 768: 2767, 520: 2767,
+        4097: 2765, 2064: 2766, 257: 2768, 4160: 2765,
+        264: 2768, 513: 2767, 2056: 2766, 4224: 2765,
+        528: 2767, 2052: 2766, 192: 2769, 65: 2770,
+        66: 2770, 68: 2770, 6144: 2765, 72: 2770,
+        258: 2768, 4352: 2765, 2304: 2766, 4098: 2765,
+        80: 2770, 320: 2768, 514: 2767, 2560: 2766,
+        272: 2768, 4112: 2765, 2112: 2766, 2176: 2766,
+        4104: 2765, 576: 2767, 4100: 2765 }
+    }
+
+# card_to_binary indexed by the integer value of a Card, so the
+# evaluators need one list index per card.
+Six.card_index_to_binary = [
+    Six.card_to_binary[index // 4 + 2][index % 4 + 1] for index in range(52)]
@@ -0,0 +1,115 @@
+"""
+Minimal perfect hash tables for the prime product lookups.
+
+The prime product dicts (Five.pairs, Six and Seven.prime_products_to_rank)
+hold 5k-21k big int keys. As dicts every key and rank is a separate int
+object in a hash table sized for inserts. A PerfectHash keeps them in
+three flat arrays: keys are split into buckets by key % buckets, and
+each bucket has a displacement chosen when the table is built so that
+(key ^ displacement) % size sends every key to its own slot.
+
+LookupTables expands them back to dicts when it imports a table
+module: a PerfectHash lookup is about three times slower than a dict
+lookup and the evaluators do one per hand. The compact form keeps the
+generated modules small.
+
+Building takes seconds, so the lookup table modules hold the built
+arrays as literals. They were generated with:
+    print(PerfectHash.build(table).to_source("prime_products_to_rank", "    "))
+"""
+from array import array
+
+# 64-bit keys, the Seven prime products don't fit in 32 bits. "q" is
+# 64 bits everywhere but only exists on Python 3, "l" is 64 bits on the
+# 64-bit Linux and macOS builds Python 2 runs on.
+try:
+    array("q")
+    KEY_TYPECODE = "q"
+except ValueError:
+    KEY_TYPECODE = "l"
+
+
+class PerfectHash(object):
+    """
+    A read-only dict of int keys to ranks, see the module docstring.
+    """
+    __slots__ = ("buckets", "size", "displacements", "keys", "values")
+
+    def __init__(self, buckets, displacements, keys, values):
+        self.buckets = buckets
+        self.size = len(keys)
+        self.displacements = array("I", displacements)
+        self.keys = array(KEY_TYPECODE, keys)
+        self.values = array("H", values)
+
+    def slot(self, key):
+        return (key ^ self.displacements[key % self.buckets]) % self.size
+
+    def __getitem__(self, key):
+        slot = (key ^ self.displacements[key % self.buckets]) % self.size
+        if self.keys[slot] != key:
+            raise KeyError(key)
+        return self.values[slot]
+
+    def get(self, key, default=None):
+        slot = (key ^ self.displacements[key % self.buckets]) % self.size
+        if self.keys[slot] != key:
+            return default
+        return self.values[slot]
+
+    def __contains__(self, key):
+        return self.keys[self.slot(key)] == key
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __iter__(self):
+        return iter(self.keys)
+
+    def items(self):
+        return zip(self.keys, self.values)
+
+    def build(table):
+        """
+        Return a PerfectHash with the same items as the dict table.
+        Buckets are placed largest first, each with the smallest
+        displacement that puts all its keys in free slots.
+        """
+        size = len(table)
+        buckets = size // 4 + 1
+        bucket_keys = [[] for _ in range(buckets)]
+        for key in sorted(table):
+            bucket_keys[key % buckets].append(key)
+
+        displacements = [0] * buckets
+        slots = [None] * size
+        for bucket in sorted(range(buckets), key=lambda bucket: -len(bucket_keys[bucket])):
+            keys = bucket_keys[bucket]
+            if not keys:
+                continue
+            displacement = 1
+            while True:
+                candidate = [(key ^ displacement) % size for key in keys]
+                if len(set(candidate)) == len(keys) and all(slots[slot] is None for slot in candidate):
+                    break
+                displacement += 1
+            displacements[bucket] = displacement
+            for key, slot in zip(keys, candidate):
+                slots[slot] = key
+        return PerfectHash(buckets, displacements, slots, [table[key] for key in slots])
+
+    build = staticmethod(build)
+
+    def to_source(self, name, indent):
+        """
+        Return Python source assigning this table to name.
+        """
+        def rows(values):
+            values = [str(value) for value in values]
+            return ",\n".join(indent + "        " + ", ".join(values[start:start + 12])
+                              for start in range(0, len(values), 12))
+        return "%s%s = PerfectHash(%d,\n%s    [\n%s\n%s    ],\n%s    [\n%s\n%s    ],\n%s    [\n%s\n%s    ])" % (
+            indent, name, self.buckets,
+            indent, rows(self.displacements), indent,
+            indent, rows(self.keys), indent,
+            indent, rows(self.values), indent)
@@ -1,14 +1,38 @@
 class PopCount:
-    # Generate table of popcounts for 16 bits
-    # Then just use it twice.
-    # Reference is some stanford paper. 
+    """
+    popcount(v) is the number of bits set in v, picked when the class is
+    created: int.bit_count on Python 3.10+, otherwise two lookups into a
+    16 bit table that is only built when it's needed.
+    """
+    # Table of popcounts for 16 bits, then just use it twice.
+    # Reference is some stanford paper.
     # See http://www.valuedlessons.com/2009/01/popcount-in-python-with-benchmarks.html
-    POPCOUNT_TABLE16 = [0] * 2**16
-    for index in xrange(len(POPCOUNT_TABLE16)):
-        POPCOUNT_TABLE16[index] = (index & 1) + POPCOUNT_TABLE16[index >> 1]
+    POPCOUNT_TABLE16 = None
+
+    def load_table16():
+        if PopCount.POPCOUNT_TABLE16 is None:
+            table = [0] * 2**16
+            for index in range(len(table)):
+                table[index] = (index & 1) + table[index >> 1]
+            PopCount.POPCOUNT_TABLE16 = table
+        return PopCount.POPCOUNT_TABLE16
 
     def popcount32_table16(v):
-        return (PopCount.POPCOUNT_TABLE16[v & 0xffff] + \
-            PopCount.POPCOUNT_TABLE16[(v >> 16) & 0xffff])
-    
-    popcount = staticmethod(popcount32_table16)
\ No newline at end of file
+        table = PopCount.POPCOUNT_TABLE16
+        if table is None:
+            table = PopCount.load_table16()
+        return table[v & 0xffff] + table[(v >> 16) & 0xffff]
+
+    def popcount_bin(v):
+        return bin(v).count("1")
+
+    load_table16 = staticmethod(load_table16)
+    popcount32_table16 = staticmethod(popcount32_table16)
+    popcount_bin = staticmethod(popcount_bin)
+
+    if hasattr(int, "bit_count"):
+        # A C method, so no Python frame per call
+        popcount = staticmethod(int.bit_count)
+    else:
+        popcount = popcount32_table16
+
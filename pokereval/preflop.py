@@ -0,0 +1,253 @@
+"""
+Heads-up preflop all-in equity of every starting hand against every
+other one, and of each of the 169 starting hand classes against each
+other, from a table file built once by enumerating every board.
+
+Hands are numbered 0-1325 by their cards a < b as b * (b - 1) / 2 + a.
+Classes are numbered row * 13 + col in the usual 13x13 chart, aces
+first: pairs on the diagonal, suited hands above it (row is the high
+card) and offsuit hands below it (row is the low card).
+
+The file holds MAGIC and three arrays of equities scaled to 0-65535:
+hand against random hand [1326], class against class [169 * 169],
+and hand against hand for hands i < j at j * (j - 1) / 2 + i (0 when
+the hands share a card). Build it with all cores (about 10 minutes on
+one core, needs numpy):
+    python -m pokereval.preflop [path] [--processes N]
+"""
+import mmap
+import multiprocessing
+import os
+import struct
+import sys
+from itertools import combinations, permutations
+
+from .hand_evaluator import HandLengthException
+from .isomorphism import canonical_board
+
+MAGIC = b"PKEVPRE1"
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "preflop_equity.bin")
+SCALE = 65535
+HAND_COUNT = 1326
+CLASS_COUNT = 169
+PAIR_COUNT = HAND_COUNT * (HAND_COUNT - 1) // 2
+EQUITY = struct.Struct("<H")
+
+VS_RANDOM_OFFSET = len(MAGIC)
+CLASSES_OFFSET = VS_RANDOM_OFFSET + 2 * HAND_COUNT
+PAIRS_OFFSET = CLASSES_OFFSET + 2 * CLASS_COUNT * CLASS_COUNT
+FILE_SIZE = PAIRS_OFFSET + 2 * PAIR_COUNT
+
+# Boards each pair of hands without shared cards is dealt, C(48,5)
+BOARDS_PER_MATCHUP = 1712304
+# Boards without the cards of one hand, C(50,5), and boards holding a
+# card of each of two hands, C(52,5) - 2 * C(50,5) + C(48,5)
+BOARDS_WITHOUT_HAND = 2118760
+BOARDS_HITTING_BOTH = 2598960 - 2 * BOARDS_WITHOUT_HAND + BOARDS_PER_MATCHUP
+
+# Ranks go up to 7462
+BLOCKED_RANK = 7463
+
+
+def hand_index(hole_cards):
+    """
+    Return the index 0-1325 of two hole cards.
+    """
+    if len(hole_cards) != 2:
+        raise HandLengthException("Only 2 hole cards are supported")
+    a, b = sorted(int(card) for card in hole_cards)
+    if a == b:
+        raise ValueError("The same card is dealt twice: %s" % list(hole_cards))
+    return b * (b - 1) // 2 + a
+
+
+def hand_class(hole_cards):
+    """
+    Return the class index 0-168 of two hole cards.
+    """
+    if len(hole_cards) != 2:
+        raise HandLengthException("Only 2 hole cards are supported")
+    high, low = sorted((int(card) for card in hole_cards), reverse=True)
+    # Aces in row 0
+    high_row, low_row = 12 - high // 4, 12 - low // 4
+    if high % 4 == low % 4:
+        return high_row * 13 + low_row
+    return low_row * 13 + high_row
+
+
+def hands():
+    """
+    Return the cards of every hand in index order.
+    """
+    return [(a, b) for b in range(52) for a in range(b)]
+
+
+class PreflopEquity(object):
+    """
+    A preflop equity table file mapped read-only into memory.
+    """
+    def __init__(self, path=DEFAULT_PATH):
+        self.path = path
+        with open(path, "rb") as table_file:
+            self.mmap = mmap.mmap(table_file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.mmap[:len(MAGIC)] != MAGIC or len(self.mmap) != FILE_SIZE:
+            raise ValueError("%s is not a preflop equity table file" % path)
+
+    def read(self, offset, index):
+        return float(EQUITY.unpack_from(self.mmap, offset + 2 * index)[0]) / SCALE
+
+    def equity(self, hole_cards, opponent_cards=None):
+        """
+        Return the all-in equity of hole_cards against opponent_cards,
+        or against a random hand if opponent_cards is None.
+        """
+        hand = hand_index(hole_cards)
+        if opponent_cards is None:
+            return self.read(VS_RANDOM_OFFSET, hand)
+        opponent = hand_index(opponent_cards)
+        if set(int(card) for card in hole_cards) & set(int(card) for card in opponent_cards):
+            raise ValueError("The same card is dealt twice: %s" % (list(hole_cards) + list(opponent_cards)))
+        if hand < opponent:
+            return self.read(PAIRS_OFFSET, opponent * (opponent - 1) // 2 + hand)
+        return 1.0 - self.read(PAIRS_OFFSET, hand * (hand - 1) // 2 + opponent)
+
+    def class_equity(self, hole_cards, opponent_cards):
+        """
+        Return the equity of the class of hole_cards against the class
+        of opponent_cards, averaged over every deal of the two classes
+        without shared cards.
+        """
+        return self.read(CLASSES_OFFSET, hand_class(hole_cards) * CLASS_COUNT + hand_class(opponent_cards))
+
+    def numpy(self):
+        """
+        Return (vs random [1326], classes [169, 169], hands [1326, 1326])
+        as float arrays of equities. Requires numpy.
+        """
+        import numpy as np
+        def read(offset, count):
+            return np.frombuffer(self.mmap, dtype="<u2", count=count, offset=offset) / float(SCALE)
+        pairs = np.zeros((HAND_COUNT, HAND_COUNT))
+        # (j, i) for i < j, in pair order
+        later, earlier = np.tril_indices(HAND_COUNT, -1)
+        pairs[earlier, later] = read(PAIRS_OFFSET, PAIR_COUNT)
+        pairs[later, earlier] = 1.0 - pairs[earlier, later]
+        return (read(VS_RANDOM_OFFSET, HAND_COUNT),
+                read(CLASSES_OFFSET, CLASS_COUNT * CLASS_COUNT).reshape(CLASS_COUNT, CLASS_COUNT),
+                pairs)
+
+
+def canonical_boards():
+    """
+    Return [(board, count)] for every 5-card board up to suit
+    isomorphism, with the number of boards isomorphic to it.
+    """
+    counts = {}
+    for board in combinations(range(52), 5):
+        key = tuple(int(card) for card in canonical_board(board)[0])
+        counts[key] = counts.get(key, 0) + 1
+    return sorted(counts.items())
+
+
+def board_wins(boards):
+    """
+    Return the [1326, 1326] sum over (board, count) of count times
+    twice the wins plus the ties of hand i against hand j on the board.
+    Hands holding a board card rank below every other hand, which
+    preflop_equities takes back out.
+    """
+    import numpy as np
+    from .batch import evaluate_seven
+    all_hands = np.array(hands(), dtype=np.intp)
+    # Boards of each count are summed apart, in int32 and without multiplying
+    by_count = {}
+    for board, count in boards:
+        valid = np.flatnonzero(~np.isin(all_hands, board).reshape(-1, 2).any(axis=1))
+        ranks = np.empty(HAND_COUNT, dtype=np.int16)
+        ranks.fill(BLOCKED_RANK)
+        ranks[valid] = evaluate_seven(np.hstack([all_hands[valid], np.tile(np.array(board, dtype=np.intp), (len(valid), 1))]))
+        # Lower rank wins: 2 for a win, 1 for a tie
+        ours = ranks[:, np.newaxis]
+        if count not in by_count:
+            by_count[count] = np.zeros((HAND_COUNT, HAND_COUNT), dtype=np.int32)
+        by_count[count] += (ours < ranks).view(np.int8) + (ours <= ranks).view(np.int8)
+    totals = np.zeros((HAND_COUNT, HAND_COUNT), dtype=np.int64)
+    for count, wins in by_count.items():
+        totals += count * wins.astype(np.int64)
+    return totals
+
+
+def suit_permutations():
+    """
+    Return the hand index each hand is renamed to by every one of the
+    24 suit permutations.
+    """
+    index = dict((hand, position) for position, hand in enumerate(hands()))
+    renamed = []
+    for permutation in permutations(range(4)):
+        renamed.append([index[tuple(sorted(card - card % 4 + permutation[card % 4] for card in hand))]
+                        for hand in hands()])
+    return renamed
+
+
+def preflop_equities(processes=None, shards=64):
+    """
+    Return the [1326, 1326] equities of every hand against every other
+    hand, exactly, enumerating every board up to suit isomorphism.
+    """
+    import numpy as np
+    boards = canonical_boards()
+    pool = multiprocessing.Pool(processes)
+    totals = sum(pool.imap_unordered(board_wins, [boards[shard::shards] for shard in range(shards)]))
+    pool.close()
+    pool.join()
+
+    # Each canonical board stands for count boards: summed over every
+    # suit permutation, count * wins gives 24 times the wins over all
+    # the boards
+    wins = np.zeros((HAND_COUNT, HAND_COUNT), dtype=np.int64)
+    for renamed in suit_permutations():
+        renamed = np.array(renamed, dtype=np.intp)
+        wins += totals[np.ix_(renamed, renamed)]
+    # For hands i and j without shared cards, the boards holding a card
+    # of j but not of i gave i a win, and those holding a card of both
+    # a tie
+    wins = wins // 24 - 2 * (BOARDS_WITHOUT_HAND - BOARDS_PER_MATCHUP) - BOARDS_HITTING_BOTH
+    return wins / (2.0 * BOARDS_PER_MATCHUP)
+
+
+def write_preflop_table(path=DEFAULT_PATH, processes=None):
+    import numpy as np
+    equities = preflop_equities(processes)
+    all_hands = hands()
+    disjoint = np.array([[not set(hand) & set(opponent) for opponent in all_hands] for hand in all_hands])
+
+    vs_random = (equities * disjoint).sum(axis=1) / disjoint.sum(axis=1)
+    classes = np.array([hand_class(hand) for hand in all_hands])
+    class_sums = np.zeros((CLASS_COUNT, CLASS_COUNT))
+    class_deals = np.zeros((CLASS_COUNT, CLASS_COUNT))
+    np.add.at(class_sums, (classes[:, np.newaxis], classes), equities * disjoint)
+    np.add.at(class_deals, (classes[:, np.newaxis], classes), disjoint)
+    later, earlier = np.tril_indices(HAND_COUNT, -1)
+    pairs = np.where(disjoint[earlier, later], equities[earlier, later], 0.0)
+
+    def scaled(values):
+        return np.round(np.asarray(values) * SCALE).astype("<u2").tobytes()
+
+    with open(path, "wb") as out:
+        out.write(MAGIC)
+        out.write(scaled(vs_random))
+        out.write(scaled(class_sums / class_deals))
+        out.write(scaled(pairs))
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    processes = None
+    if "--processes" in args:
+        position = args.index("--processes")
+        processes = int(args[position + 1])
+        del args[position:position + 2]
+    path = args[0] if args else DEFAULT_PATH
+    write_preflop_table(path, processes)
+    print("wrote %s (%d bytes)" % (path, os.path.getsize(path)))
@@ -0,0 +1,128 @@
+"""
+An alternate 7-card evaluator: the rank of every 7-card hand, built
+once into a file and read through mmap.
+
+Each set of 7 cards c0 < c1 < ... < c6 has its own index in the
+combinatorial number system, C(c0,1) + C(c1,2) + ... + C(c6,7), which
+numbers the C(52,7) hands from 0 without gaps. The file holds one
+16-bit rank per index, so a rank is seven indexings into the binomial
+tables and one read from the mapping. The file is 268MB; processes
+that map it share its pages and only the pages read are loaded.
+
+Build the file (takes about a minute, needs numpy):
+    python -m pokereval.rank_table [path]
+Then select it with HandEvaluator.use_seven_card_table.
+"""
+import mmap
+import os
+import struct
+import sys
+from itertools import combinations
+
+from .hand_evaluator import HandLengthException, batch_hands
+
+MAGIC = b"PKEVRNK1"
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "seven_card_ranks.bin")
+RANK = struct.Struct("<H")
+
+# C(52,7)
+HAND_COUNT = 133784560
+
+
+def choose(n, k):
+    if k > n:
+        return 0
+    result = 1
+    for i in range(k):
+        result = result * (n - i) // (i + 1)
+    return result
+
+
+# CHOOSE[k][card] = C(card, k + 1)
+CHOOSE = [[choose(card, k + 1) for card in range(52)] for k in range(7)]
+
+
+def hand_index(hand):
+    """
+    Return the index of a 7-card hand in the rank table.
+    """
+    c0, c1, c2, c3, c4, c5, c6 = sorted(hand)
+    return (CHOOSE[0][c0] + CHOOSE[1][c1] + CHOOSE[2][c2] + CHOOSE[3][c3] +
+            CHOOSE[4][c4] + CHOOSE[5][c5] + CHOOSE[6][c6])
+
+
+def colex_combinations(n, k):
+    """
+    Return every k-subset of range(n) as a numpy array of shape
+    [C(n,k), k], in the order of their index.
+    """
+    import numpy as np
+    subsets = np.array(list(combinations(range(n), k)), dtype=np.intp)
+    index = sum(np.array(CHOOSE[position])[subsets[:, position]] for position in range(k))
+    ordered = np.empty_like(subsets)
+    ordered[index] = subsets
+    return ordered
+
+
+def write_rank_table(path=DEFAULT_PATH):
+    """
+    Rank every 7-card hand with the batch evaluator and write the
+    ranks in index order. Hands are ranked in blocks sharing their two
+    highest cards c5 < c6: their indexes are the C(c5,5) consecutive
+    ones after C(c5,6) + C(c6,7), with the first C(c5,5) 5-card sets as
+    the low cards.
+    """
+    import numpy as np
+    from .batch import evaluate_seven
+
+    low_cards = colex_combinations(50, 5)
+    written = 0
+    with open(path, "wb") as out:
+        out.write(MAGIC)
+        for c6 in range(6, 52):
+            for c5 in range(5, c6):
+                low = low_cards[:choose(c5, 5)]
+                high = np.tile(np.array([c5, c6], dtype=np.intp), (len(low), 1))
+                assert written == choose(c5, 6) + choose(c6, 7)
+                ranks = evaluate_seven(np.hstack([low, high]))
+                out.write(ranks.astype("<u2").tobytes())
+                written += len(low)
+    assert written == HAND_COUNT
+
+
+class SevenCardRankTable(object):
+    """
+    A rank table file mapped read-only into memory. Has the same
+    evaluate_rank and evaluate_batch as HandEvaluator.Seven.
+    """
+    def __init__(self, path=DEFAULT_PATH):
+        self.path = path
+        with open(path, "rb") as table_file:
+            self.mmap = mmap.mmap(table_file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.mmap[:len(MAGIC)] != MAGIC or len(self.mmap) != len(MAGIC) + 2 * HAND_COUNT:
+            raise ValueError("%s is not a 7-card rank table file" % path)
+
+    def evaluate_rank(self, hand):
+        """
+        Return the rank of a 7-card hand, same as Seven.evaluate_rank.
+        """
+        if len(hand) != 7:
+            raise HandLengthException("Only 7-card hands are supported by the Seven evaluator")
+        return RANK.unpack_from(self.mmap, len(MAGIC) + 2 * hand_index(hand))[0]
+
+    def evaluate_batch(self, hands):
+        """
+        Return an array with the rank of every hand in an int array
+        of shape [N, 7] holding card values. Requires numpy.
+        """
+        import numpy as np
+        hands = np.sort(batch_hands(hands, 7), axis=1)
+        index = sum(np.array(CHOOSE[k], dtype=np.int64)[hands[:, k]] for k in range(7))
+        ranks = np.frombuffer(self.mmap, dtype="<u2", count=HAND_COUNT, offset=len(MAGIC))
+        return ranks[index].astype(np.int32)
+
+
+if __name__ == "__main__":
+    path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_PATH
+    write_rank_table(path)
+    print("wrote %s (%d bytes)" % (path, os.path.getsize(path)))
@@ -0,0 +1,216 @@
+"""
+A compact binary copy of LookupTables, read through mmap.
+
+Every table is stored as little-endian packed arrays:
+lists as their values (lists of lists flattened, with the row lengths
+kept in the index), dicts as sorted keys and matching values, and the
+nested even_xors_to_odd_xors_to_rank dicts as one dict keyed on
+even_xor * 8192 + odd_xor. The file starts with MAGIC, the length of a
+JSON index, and the index, which gives the type, offset and count of
+each array. Arrays are 8-byte aligned so they can be viewed with numpy
+without copying, and processes that map the same file share its pages.
+
+Build the file after changing lookup_tables.py:
+    python -m pokereval.table_file [path]
+"""
+import json
+import mmap
+import os
+import struct
+import sys
+
+from .perfect_hash import PerfectHash
+
+MAGIC = b"PKEVTBL1"
+HEADER = struct.Struct("<8sI")
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "lookup_tables.bin")
+
+# Key scale for flattening {even_xor: {odd_xor: rank}}, one bit per rank
+RANK_BITS = 1 << 13
+
+NUMPY_TYPES = {"i": "<i4", "q": "<i8", "d": "<f8"}
+
+GROUPS = ("Two", "Five", "Six", "Seven")
+
+
+def typecode(values):
+    if any(isinstance(value, float) for value in values):
+        return "d"
+    if values and (max(values) >= 2 ** 31 or min(values) < -2 ** 31):
+        return "q"
+    return "i"
+
+
+def pack_table(value):
+    """
+    Return (kind, {part: values}, extra index fields) for one table.
+    """
+    if isinstance(value, PerfectHash):
+        value = dict(value.items())
+    if isinstance(value, dict):
+        if value and isinstance(next(iter(value.values())), dict):
+            flat = {}
+            for even_xor, odd_xors_to_rank in value.items():
+                for odd_xor, rank in odd_xors_to_rank.items():
+                    flat[even_xor * RANK_BITS + odd_xor] = rank
+            kind, value = "nested_dict", flat
+        else:
+            kind = "dict"
+        keys = sorted(value)
+        return kind, {"keys": keys, "values": [value[key] for key in keys]}, {}
+    elif isinstance(value, list):
+        if value and isinstance(value[0], list):
+            flat = [item for row in value for item in row]
+            return "list", {"values": flat}, {"lengths": [len(row) for row in value]}
+        return "list", {"values": value}, {}
+    else:
+        return "scalar", {}, {"value": value}
+
+
+def packed_tables(lookup_tables=None):
+    """
+    Yield (name, kind, {part: values}, extra) for every table, named
+    like "Seven.prime_products_to_rank" or "primes".
+    """
+    if lookup_tables is None:
+        from .lookup_tables import LookupTables
+        lookup_tables = LookupTables
+    yield ("primes",) + pack_table(list(lookup_tables.primes))
+    for group in GROUPS:
+        namespace = getattr(lookup_tables, group)
+        for attribute, value in sorted(vars(namespace).items()):
+            if attribute.startswith("__"):
+                continue
+            yield ("%s.%s" % (group, attribute),) + pack_table(value)
+
+
+def write_table_file(path=DEFAULT_PATH, lookup_tables=None):
+    """
+    Serialize the lookup tables into a table file at path.
+    """
+    index = {}
+    blobs = []
+    offset = 0
+    for name, kind, parts, extra in packed_tables(lookup_tables):
+        entry = dict(extra, kind=kind, parts={})
+        for part, values in sorted(parts.items()):
+            code = typecode(values)
+            blob = struct.pack("<%d%s" % (len(values), code), *values)
+            entry["parts"][part] = {"typecode": code, "offset": offset, "count": len(values)}
+            # keep every array 8-byte aligned
+            blob += b"\0" * (-len(blob) % 8)
+            blobs.append(blob)
+            offset += len(blob)
+        index[name] = entry
+
+    index_json = json.dumps(index, sort_keys=True).encode("ascii")
+    index_json += b" " * (-(HEADER.size + len(index_json)) % 8)
+    with open(path, "wb") as out:
+        out.write(HEADER.pack(MAGIC, len(index_json)))
+        out.write(index_json)
+        for blob in blobs:
+            out.write(blob)
+
+
+class Tables:
+    """
+    Tables as packed arrays. Subclasses provide index, values() and numpy().
+    """
+    def names(self):
+        return sorted(self.index)
+
+    def table(self, name):
+        """
+        Return a table as the same Python object LookupTables has.
+        """
+        entry = self.index[name]
+        kind = entry["kind"]
+        if kind == "scalar":
+            return entry["value"]
+        values = self.values(name)
+        if kind == "list":
+            if "lengths" not in entry:
+                return list(values)
+            rows = []
+            start = 0
+            for length in entry["lengths"]:
+                rows.append(list(values[start:start + length]))
+                start += length
+            return rows
+        keys = self.values(name, "keys")
+        if kind == "dict":
+            return dict(zip(keys, values))
+        nested = {}
+        for key, rank in zip(keys, values):
+            nested.setdefault(key // RANK_BITS, {})[key % RANK_BITS] = rank
+        return nested
+
+
+class TableFile(Tables):
+    """
+    A table file mapped read-only into memory. numpy() returns arrays
+    backed by the mapping itself; table() rebuilds the original Python
+    list, dict or value.
+    """
+    def __init__(self, path=DEFAULT_PATH):
+        with open(path, "rb") as table_file:
+            self.mmap = mmap.mmap(table_file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, index_length = HEADER.unpack_from(self.mmap, 0)
+        if magic != MAGIC:
+            raise ValueError("%s is not a lookup table file" % path)
+        self.index = json.loads(self.mmap[HEADER.size:HEADER.size + index_length].decode("ascii"))
+        self.data_offset = HEADER.size + index_length
+
+    def values(self, name, part="values"):
+        """
+        Return one array of a table as a tuple of Python numbers.
+        """
+        spec = self.index[name]["parts"][part]
+        return struct.unpack_from("<%d%s" % (spec["count"], spec["typecode"]),
+                                  self.mmap, self.data_offset + spec["offset"])
+
+    def numpy(self, name, part="values"):
+        """
+        Return one array of a table as a read-only numpy array that
+        shares memory with the mapping.
+        """
+        import numpy as np
+        spec = self.index[name]["parts"][part]
+        return np.frombuffer(self.mmap, dtype=NUMPY_TYPES[spec["typecode"]],
+                             count=spec["count"], offset=self.data_offset + spec["offset"])
+
+
+class PackedTables(Tables):
+    """
+    The same interface as TableFile, built from LookupTables in memory,
+    for when no table file has been built.
+    """
+    def __init__(self, lookup_tables=None):
+        self.index = {}
+        self.parts = {}
+        for name, kind, parts, extra in packed_tables(lookup_tables):
+            self.index[name] = dict(extra, kind=kind)
+            self.parts[name] = dict((part, (typecode(values), values)) for part, values in parts.items())
+
+    def values(self, name, part="values"):
+        return tuple(self.parts[name][part][1])
+
+    def numpy(self, name, part="values"):
+        import numpy as np
+        code, values = self.parts[name][part]
+        return np.array(values, dtype=NUMPY_TYPES[code])
+
+
+def open_tables(path=DEFAULT_PATH):
+    """
+    Return the TableFile at path, or PackedTables if it hasn't been built.
+    """
+    if os.path.exists(path):
+        return TableFile(path)
+    return PackedTables()
+
+
+if __name__ == "__main__":
+    path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_PATH
+    write_table_file(path)
+    print("wrote %s (%d bytes)" % (path, os.path.getsize(path)))